@@ -1,31 +1,105 @@
 # -*- coding: utf-8 -*-
-from flask import Flask, render_template, request, jsonify, send_file, make_response
-from services.pdf_generator import generate_proposal, generate_estimate
-from services.email_sender import send_email
-from services.kakao_sender import send_kakao_alimtalk
+from flask import (
+    Flask, render_template, request, jsonify, send_file, make_response, Response, stream_with_context, url_for, g
+)
+from services.pdf_generator import generate_proposal, generate_estimate, generate_estimate_bytes
+from services.email_sender import send_email_async
+from services.kakao_sender import send_kakao_alimtalk_async, AlimtalkBatch
+from services.pdf_cache import pdf_cache
+from services.batch_sender import send_parallel, iter_batch, BATCH_MAX_ITEMS
+from services.async_runtime import run_sync
+from services.outbox import outbox, OUTBOX_ENABLED
+from services.doc_codec import encode_packed, decode_packed, is_packed, check_doc_data, DocCodecError, DATE_FORMAT
+from services.pdf_combiner import get_proposal_template
+from services.artifact_store import artifact_store
+from services.batch_renderer import stream_estimate_zip, BATCH_RENDER_MAX_ITEMS
+from services.prerender import prerenderer
+from services.apartment_inventory import apartment_inventory, UnknownApartmentError, APARTMENT_SEARCH_LIMIT
+from services.metrics import (
+    stage, begin_request, end_request, register_stats, registry as metrics_registry,
+    METRICS_SERVER_TIMING, METRICS_TOKEN
+)
+from services.pricing import (
+    DISCOUNT_OPTIONS, CONTRACT_MONTHS, MATRIX_MAX_MONTHS_OPTIONS, quote_from_request, quote_matrix
+)
 import os
+import re
 import json
+import asyncio
 import base64
 import hashlib
 import zlib
 from datetime import datetime
+from functools import lru_cache
 from io import BytesIO
 
 app = Flask(__name__)
 
-# 기간 할인율
-DISCOUNT_OPTIONS = {
-    "none": {"label": "할인 없음", "rate": 0},
-    "5": {"label": "5% 할인", "rate": 0.05},
-    "10": {"label": "10% 할인", "rate": 0.10},
-    "15": {"label": "15% 할인", "rate": 0.15},
-}
+# 버전(v) 파라미터가 붙은 정적 파일의 브라우저 캐시 시간 (초)
+STATIC_VERSIONED_MAX_AGE = int(os.getenv("STATIC_VERSIONED_MAX_AGE", str(365 * 24 * 3600)))
+
+
+def issue_date():
+    """오늘 발행일 문자열 (문서 데이터 date 필드)"""
+    return datetime.now().strftime(DATE_FORMAT)
+
+
+@lru_cache(maxsize=64)
+def _static_version(path, mtime_ns, size):
+    with open(path, 'rb') as f:
+        return hashlib.sha256(f.read()).hexdigest()[:12]
+
+
+@app.template_global()
+def versioned_static(filename):
+    """정적 파일 URL + 내용 해시 버전 (파일이 바뀌면 URL도 바뀌므로 오래 캐시 가능)"""
+    path = os.path.join(app.static_folder, filename)
+    try:
+        st = os.stat(path)
+    except OSError:
+        return url_for("static", filename=filename)
+    return url_for("static", filename=filename, v=_static_version(path, st.st_mtime_ns, st.st_size))
+
+
+@app.before_request
+def start_request_timer():
+    """요청 단계별 시간 측정 시작"""
+    g.request_started_at = begin_request()
+
+
+@app.after_request
+def record_request_metrics(response):
+    """요청 지표 기록 (METRICS_SERVER_TIMING=true면 Server-Timing 헤더 추가)"""
+    started_at = g.pop("request_started_at", None)
+    if started_at is not None:
+        endpoint = request.url_rule.rule if request.url_rule else "unmatched"
+        server_timing = end_request(started_at, endpoint, request.method, response.status_code)
+        if METRICS_SERVER_TIMING:
+            response.headers["Server-Timing"] = server_timing
+    return response
+
+
+@app.after_request
+def cache_versioned_static(response):
+    """버전이 붙은 정적 파일은 내용이 바뀌지 않으므로 오래 캐시"""
+    if request.endpoint == "static" and request.args.get("v") and response.status_code == 200:
+        response.cache_control.public = True
+        response.cache_control.max_age = STATIC_VERSIONED_MAX_AGE
+        response.cache_control.immutable = True
+        response.cache_control.no_cache = None
+    return response
+
+
+@app.errorhandler(UnknownApartmentError)
+def unknown_apartment(e):
+    """견적 요청이 인벤토리에 없는 apartment_id를 참조한 경우"""
+    return jsonify({"success": False, "error": str(e)}), 400
 
 
 @app.route("/")
 def index():
     """메인 페이지 - 입력 폼"""
-    return render_template("index.html", discount_options=DISCOUNT_OPTIONS)
+    return render_template("index.html", discount_options=DISCOUNT_OPTIONS, contract_months=CONTRACT_MONTHS)
 
 
 @app.route("/preview", methods=["POST"])
@@ -33,102 +107,122 @@ def preview():
     """미리보기 생성"""
     data = request.json
 
-    # 아파트 목록
-    apartments = data.get("apartments", [])
-    discount_key = data.get("discount", "none")
-    months = int(data.get("months", 3))
-
-    # 총 월 견적 계산
-    total_monthly = sum(apt.get("monthly_total", 0) for apt in apartments)
-
-    # 할인 적용
-    discount_rate = DISCOUNT_OPTIONS.get(discount_key, {}).get("rate", 0)
-    discount_amount = int(total_monthly * discount_rate)
-    monthly_final = total_monthly - discount_amount
-
-    # 총 계약 금액
-    final_total = monthly_final * months
+    # 견적 계산 (아파트별 월 금액, 할인, 총 계약 금액)
+    pricing = quote_from_request(data)
 
     return jsonify({
         "customer": data.get("customer", {}),
-        "apartments": apartments,
-        "total_monthly": total_monthly,
-        "discount_label": DISCOUNT_OPTIONS.get(discount_key, {}).get("label", "할인 없음"),
-        "discount_rate": discount_rate,
-        "discount_amount": discount_amount,
-        "monthly_final": monthly_final,
-        "months": months,
-        "final_total": final_total,
+        **pricing,
         "manager": data.get("manager", {}),
         "doc_types": data.get("doc_types", ["proposal"])
     })
 
 
+def _build_estimate_data(data, date=None):
+    """요청 데이터(customer, apartments, discount, months, manager)로 견적서 문서 데이터 생성"""
+    return {
+        "customer": data.get("customer", {}),
+        **quote_from_request(data),
+        "manager": data.get("manager", {}),
+        "date": date or issue_date()
+    }
+
+
 @app.route("/generate", methods=["POST"])
 def generate():
     """PDF 생성"""
     data = request.json
     doc_types = data.get("doc_types", ["proposal"])
 
-    # 아파트 목록
-    apartments = data.get("apartments", [])
-    discount_key = data.get("discount", "none")
-    months = int(data.get("months", 3))
+    doc_data = _build_estimate_data(data)
 
-    # 총 월 견적 계산
-    total_monthly = sum(apt.get("monthly_total", 0) for apt in apartments)
+    # PDF 생성 (선택된 문서 유형별로, 같은 내용이면 저장소의 기존 파일 재사용)
+    artifacts = []
 
-    # 할인 적용
-    discount_rate = DISCOUNT_OPTIONS.get(discount_key, {}).get("rate", 0)
-    discount_amount = int(total_monthly * discount_rate)
-    monthly_final = total_monthly - discount_amount
+    if "estimate" in doc_types:
+        artifact = artifact_store.describe(generate_estimate(doc_data))
+        artifact["download_url"] = f"/download/{artifact['id']}"
+        artifacts.append(artifact)
 
-    # 총 계약 금액
-    final_total = monthly_final * months
+    return jsonify({"artifacts": artifacts, "success": True})
 
-    doc_data = {
-        "customer": data.get("customer", {}),
-        "apartments": apartments,
-        "total_monthly": total_monthly,
-        "discount_label": DISCOUNT_OPTIONS.get(discount_key, {}).get("label", "할인 없음"),
-        "discount_rate": discount_rate,
-        "discount_amount": discount_amount,
-        "monthly_final": monthly_final,
-        "months": months,
-        "final_total": final_total,
-        "manager": data.get("manager", {}),
-        "date": datetime.now().strftime("%Y년 %m월 %d일")
-    }
 
-    # PDF 생성 (선택된 문서 유형별로)
-    pdf_paths = []
+@app.route("/generate/batch", methods=["POST"])
+def generate_batch():
+    """
+    견적서 대량 생성 (ZIP 다운로드)
 
-    if "estimate" in doc_types:
-        pdf_path = generate_estimate(doc_data)
-        pdf_paths.append(pdf_path)
+    요청: {"defaults": {공통 값}, "items": [{customer, apartments, discount, months, manager}, ...]}
+    응답: 견적서 PDF들과 manifest.json이 담긴 ZIP (생성이 끝나는 순서대로 스트리밍)
+    """
+    data = request.json or {}
+    defaults = data.get("defaults", {})
+    items = data.get("items", [])
 
-    return jsonify({"pdf_paths": pdf_paths, "success": True})
+    if not isinstance(items, list) or not items:
+        return jsonify({"success": False, "error": "items가 비어 있습니다."}), 400
+    if len(items) > BATCH_RENDER_MAX_ITEMS:
+        return jsonify({"success": False, "error": f"한 번에 최대 {BATCH_RENDER_MAX_ITEMS}건까지 생성할 수 있습니다."}), 400
+
+    date = issue_date()
+    doc_data_list = [_build_estimate_data({**defaults, **item}, date) for item in items]
+
+    filename = f"estimates_{datetime.now().strftime('%Y%m%d_%H%M%S')}.zip"
+    return Response(
+        stream_with_context(stream_estimate_zip(doc_data_list)),
+        mimetype="application/zip",
+        headers={"Content-Disposition": f"attachment; filename={filename}"}
+    )
 
 
 # 포커스미디어 제안서 PDF 경로 (고정)
 BASE_DIR = os.path.dirname(os.path.abspath(__file__))
 PROPOSAL_PDF_PATH = os.path.join(BASE_DIR, "포커스미디어_동네상권정보_위즈더플래닝.pdf")
 
+# 제안서 브라우저 캐시 시간 (초)
+PROPOSAL_MAX_AGE = int(os.getenv("PROPOSAL_MAX_AGE", "86400"))
 
-@app.route("/send", methods=["POST"])
-def send():
-    """이메일 및 카카오톡 발송"""
-    data = request.json
-    pdf_paths = data.get("pdf_paths", [])
+# 제안서 ETag (파일 내용 해시, 파일이 바뀔 때만 다시 계산)
+_proposal_etag = {"key": None, "etag": None}
+
+
+def get_proposal_etag():
+    """제안서 PDF의 강한 ETag (SHA-256 기반)"""
+    st = os.stat(PROPOSAL_PDF_PATH)
+    key = (st.st_mtime_ns, st.st_size)
+    if _proposal_etag["key"] != key:
+        digest = hashlib.sha256()
+        with open(PROPOSAL_PDF_PATH, 'rb') as f:
+            for chunk in iter(lambda: f.read(1024 * 1024), b''):
+                digest.update(chunk)
+        _proposal_etag.update(key=key, etag=digest.hexdigest()[:32])
+    return _proposal_etag["etag"]
+
+
+def _build_send_tasks(data, render_estimate=False, kakao_batch=None):
+    """
+    발송 요청 하나(/send 형식)를 채널별 작업으로 변환
+
+    Args:
+        data: /send 요청 데이터 (첨부는 artifact_ids, 이전 형식의 pdf_paths는 저장소 안 경로만 허용)
+        render_estimate: True면 첨부 산출물이 없을 때 이메일 작업 안에서 견적서 생성
+        kakao_batch: AlimtalkBatch를 주면 알림톡을 개별 발송 대신 묶음 발송에 등록
+
+    Returns:
+        tuple: ({채널: 인자 없는 async 함수}, 응답에 추가할 값)
+    """
+    artifact_refs = list(data.get("artifact_ids", [])) + list(data.get("pdf_paths", []))
     customer = data.get("customer", {})
     send_methods = data.get("send_methods", [])
     doc_types = data.get("doc_types", [])
 
-    results = {"email": None, "kakao": None}
+    tasks = {}
+    extra = {}
 
     # 제안서 선택 시 포커스미디어 제안서 PDF 추가
+    pdf_paths = []
     if "proposal" in doc_types and os.path.exists(PROPOSAL_PDF_PATH):
-        pdf_paths.insert(0, PROPOSAL_PDF_PATH)
+        pdf_paths.append(PROPOSAL_PDF_PATH)
 
     # 문서 유형 텍스트 생성
     doc_type_names = []
@@ -138,18 +232,11 @@ def send():
         doc_type_names.append("견적서")
     doc_type_text = " 및 ".join(doc_type_names) if doc_type_names else "문서"
 
-    if "email" in send_methods and customer.get("email"):
-        results["email"] = send_email(
-            to_email=customer["email"],
-            to_name=customer.get("name", "고객"),
-            subject=f"[{customer.get('company', '')}] {doc_type_text} 송부드립니다",
-            pdf_paths=pdf_paths
-        )
-
-    if "kakao" in send_methods and customer.get("phone"):
-        # 알림톡용 문서 데이터 생성 (프론트에서 계산된 값 그대로 사용)
-        doc_data = {
-            "customer": customer,
+    # 문서 데이터 (할인 키(discount)가 있으면 서버에서 계산, 없으면 기존 방식대로 보낸 금액 사용)
+    if "discount" in data:
+        pricing = quote_from_request(data)
+    else:
+        pricing = {
             "apartments": data.get("apartments", []),
             "total_monthly": data.get("total_monthly", 0),
             "discount_label": data.get("discount_label", "할인 없음"),
@@ -158,28 +245,269 @@ def send():
             "monthly_final": data.get("monthly_final", 0),
             "months": data.get("months", 3),
             "final_total": data.get("final_total", 0),
-            "manager": data.get("manager", {})
         }
+    doc_data = {
+        "customer": customer,
+        **pricing,
+        "manager": data.get("manager", {}),
+        # 발행일도 문서 토큰에 넣어 /view, /pdf가 항상 같은 날짜로 표시되도록 함
+        "date": data.get("date") or issue_date()
+    }
+
+    if "email" in send_methods and customer.get("email"):
+        def resolve_estimates():
+            # 발송 시점에 산출물 조회 (아웃박스 재시도 사이에 만료됐으면 같은 데이터로 다시 생성)
+            estimates = [path for path in map(artifact_store.resolve, artifact_refs) if path]
+            if not estimates and "estimate" in doc_types and (render_estimate or artifact_refs):
+                estimates = [generate_estimate(doc_data)]
+            return estimates
+
+        async def send_email_task():
+            # 파일 조회/PDF 생성은 발송 루프를 막지 않도록 스레드에서
+            attachments = pdf_paths + await asyncio.to_thread(resolve_estimates)
+            return await send_email_async(
+                to_email=customer["email"],
+                to_name=customer.get("name", "고객"),
+                subject=f"[{customer.get('company', '')}] {doc_type_text} 송부드립니다",
+                pdf_paths=attachments
+            )
+
+        tasks["email"] = send_email_task
 
+    if "kakao" in send_methods and customer.get("phone"):
         # 문서 다운로드 URL 생성
         doc_id = encode_doc_data(doc_data, doc_types)
         download_url = f"{SERVICE_URL}/view/{doc_id}"
 
-        results["kakao"] = send_kakao_alimtalk(
-            phone=customer["phone"],
-            customer_name=customer.get("name", "고객"),
-            doc_type=doc_type_text,
-            download_url=download_url
-        )
-        results["download_url"] = download_url
+        if kakao_batch is not None:
+            batch_index = kakao_batch.add(
+                phone=customer["phone"],
+                customer_name=customer.get("name", "고객"),
+                doc_type=doc_type_text,
+                download_url=download_url
+            )
+
+            def send_kakao():
+                return kakao_batch.result_async(batch_index)
+        else:
+            def send_kakao():
+                return send_kakao_alimtalk_async(
+                    phone=customer["phone"],
+                    customer_name=customer.get("name", "고객"),
+                    doc_type=doc_type_text,
+                    download_url=download_url
+                )
+
+        async def send_kakao_task():
+            result = await send_kakao()
+            # 고객이 링크를 열기 전에 견적서 PDF를 미리 생성해 캐시에 넣어 둠
+            if result.get("success") and "estimate" in doc_types:
+                schedule_estimate_prerender(doc_id)
+            return result
+
+        tasks["kakao"] = send_kakao_task
+        extra["download_url"] = download_url
+
+    return tasks, extra
+
+
+def _deliver_send_job(payload, previous):
+    """
+    아웃박스 작업 발송 (이전 시도에서 성공한 채널은 건너뜀)
+
+    Returns:
+        tuple: (/send 응답 형식의 결과, 모든 채널 성공 여부)
+    """
+    tasks, extra = _build_send_tasks(payload)
+
+    results = {"email": None, "kakao": None}
+    if previous:
+        results.update(previous)
+    pending = {
+        channel: task for channel, task in tasks.items()
+        if not (results.get(channel) or {}).get("success")
+    }
+    results.update(send_parallel(pending))
+    results.update(extra)
+
+    succeeded = all(results[channel] and results[channel].get("success") for channel in tasks)
+    return results, succeeded
+
+
+@app.route("/quote/matrix", methods=["POST"])
+def quote_matrix_view():
+    """
+    할인 × 계약 개월수 전체 조합 견적
+
+    요청: {"apartments": [...], "discounts": [할인 키, ...](선택), "months_options": [개월수, ...](선택)}
+    응답: {"apartments", "total_monthly", "discounts", "months_options", "scenarios": [...]}
+    """
+    data = request.json or {}
+    discounts = data.get("discounts")
+    months_options = data.get("months_options")
+
+    if discounts is not None and not (
+        isinstance(discounts, list) and all(isinstance(key, str) for key in discounts)
+    ):
+        return jsonify({"success": False, "error": "discounts는 할인 키 목록이어야 합니다."}), 400
+    if months_options is not None and not (
+        isinstance(months_options, list) and len(months_options) <= MATRIX_MAX_MONTHS_OPTIONS
+    ):
+        return jsonify({
+            "success": False,
+            "error": f"months_options는 최대 {MATRIX_MAX_MONTHS_OPTIONS}개의 개월수 목록이어야 합니다."
+        }), 400
+
+    apartments = apartment_inventory.resolve_apartments(data.get("apartments", []))
+    return jsonify(quote_matrix(apartments, discounts, months_options))
+
+
+@app.route("/apartments/search")
+def search_apartments():
+    """
+    아파트 인벤토리 검색 (견적 입력 자동완성용)
+
+    요청: ?q=검색어(이름 일부 또는 초성)&limit=개수(선택)
+    응답: {"items": [{id, apartment_name, monitor_count, unit_price, monthly_total, address}, ...], "total"}
+    """
+    query = request.args.get("q", "")
+    try:
+        limit = int(request.args.get("limit", APARTMENT_SEARCH_LIMIT))
+    except ValueError:
+        return jsonify({"success": False, "error": "limit은 숫자여야 합니다."}), 400
+
+    with stage("inventory_search"):
+        items, total = apartment_inventory.search(query, limit)
+    return jsonify({"items": items, "total": total})
+
+
+@app.route("/apartments/<apartment_id>")
+def get_apartment(apartment_id):
+    """아파트 인벤토리 항목 조회"""
+    record = apartment_inventory.get(apartment_id)
+    if record is None:
+        return jsonify({"success": False, "error": "아파트를 찾을 수 없습니다."}), 404
+    return jsonify(record)
+
+
+@app.route("/send", methods=["POST"])
+def send():
+    """
+    이메일 및 카카오톡 발송
+
+    아웃박스가 켜져 있으면(OUTBOX_ENABLED) 작업만 저장하고 바로 job_id를 반환합니다.
+    발송 결과는 /send/status/<job_id>로 확인합니다.
+    꺼져 있으면 요청 안에서 발송합니다 (parallel=true면 두 채널 동시 발송).
+    """
+    data = request.json
+    # 발행일은 요청 시점으로 고정 (아웃박스 작업이 늦게 또는 재시도로 발송돼도 같은 날짜)
+    data["date"] = data.get("date") or issue_date()
+
+    if OUTBOX_ENABLED:
+        outbox.start(_deliver_send_job)
+        job_id = outbox.enqueue(data)
+        return jsonify({
+            "job_id": job_id,
+            "status": "queued",
+            "status_url": f"/send/status/{job_id}"
+        }), 202
+
+    tasks, extra = _build_send_tasks(data)
+
+    results = {"email": None, "kakao": None}
+    if data.get("parallel"):
+        results.update(send_parallel(tasks))
+    else:
+        for channel, task in tasks.items():
+            results[channel] = run_sync(task())
+    results.update(extra)
 
     return jsonify(results)
 
 
-@app.route("/download/<path:filename>")
-def download(filename):
-    """PDF 다운로드"""
-    return send_file(filename, as_attachment=True)
+@app.route("/send/status/<job_id>")
+def send_status(job_id):
+    """아웃박스 발송 작업 상태 조회"""
+    if not OUTBOX_ENABLED:
+        return jsonify({"success": False, "error": "아웃박스가 비활성화되어 있습니다."}), 404
+
+    # 재시작 후 남아 있는 작업도 처리되도록 워커 시작
+    outbox.start(_deliver_send_job)
+    job = outbox.get(job_id)
+    if job is None:
+        return jsonify({"success": False, "error": "발송 작업을 찾을 수 없습니다."}), 404
+
+    result = job.pop("result") or {"email": None, "kakao": None}
+    return jsonify({**job, **result})
+
+
+@app.route("/send/batch", methods=["POST"])
+def send_batch():
+    """
+    대량 발송
+
+    요청: {"defaults": {/send 공통 값}, "items": [{/send 형식}, ...], "stream": bool}
+    응답: 수신자별 결과 (stream=true면 완료되는 순서대로 NDJSON 한 줄씩)
+    """
+    data = request.json or {}
+    defaults = data.get("defaults", {})
+    items = data.get("items", [])
+
+    if not isinstance(items, list) or not items:
+        return jsonify({"success": False, "error": "items가 비어 있습니다."}), 400
+    if len(items) > BATCH_MAX_ITEMS:
+        return jsonify({"success": False, "error": f"한 번에 최대 {BATCH_MAX_ITEMS}건까지 발송할 수 있습니다."}), 400
+
+    # 알림톡은 솔라피 send-many로 묶어서 발송
+    kakao_batch = AlimtalkBatch()
+    jobs = []
+    extras = []
+    for item in items:
+        tasks, extra = _build_send_tasks({**defaults, **item}, render_estimate=True, kakao_batch=kakao_batch)
+        jobs.append((len(jobs), tasks))
+        extras.append(extra)
+
+    def iter_results():
+        for index, channel_results in iter_batch(jobs):
+            item = {**defaults, **items[index]}
+            result = {
+                "index": index,
+                "customer": item.get("customer", {}),
+                "email": None,
+                "kakao": None,
+            }
+            result.update(channel_results)
+            result.update(extras[index])
+            yield result
+
+    def summarize(results):
+        failed = sum(
+            1 for r in results
+            if any(r[ch] is not None and not r[ch].get("success") for ch in ("email", "kakao"))
+        )
+        return {"total": len(results), "succeeded": len(results) - failed, "failed": failed}
+
+    if data.get("stream"):
+        def generate_lines():
+            done = []
+            for result in iter_results():
+                done.append(result)
+                yield json.dumps(result, ensure_ascii=False) + "\n"
+            yield json.dumps({"summary": summarize(done)}, ensure_ascii=False) + "\n"
+
+        return Response(stream_with_context(generate_lines()), mimetype="application/x-ndjson")
+
+    results = sorted(iter_results(), key=lambda r: r["index"])
+    return jsonify({"results": results, "summary": summarize(results)})
+
+
+@app.route("/download/<path:ref>")
+def download(ref):
+    """PDF 다운로드 (산출물 ID, 저장소 밖 파일은 제공하지 않음)"""
+    path = artifact_store.resolve(ref)
+    if path is None:
+        return "파일을 찾을 수 없습니다.", 404
+    return send_file(path, as_attachment=True, download_name=os.path.basename(path))
 
 
 # 서비스 URL (환경변수에서 가져오기)
@@ -187,30 +515,88 @@ SERVICE_URL = os.getenv("SERVICE_URL", "http://localhost:5000")
 
 
 def encode_doc_data(doc_data, doc_types):
-    """문서 데이터를 압축 후 URL-safe Base64로 인코딩"""
-    payload = {
-        "d": doc_data,  # 키 이름 축약
-        "t": doc_types
-    }
-    json_str = json.dumps(payload, ensure_ascii=False, separators=(',', ':'))
-    # zlib으로 압축
-    compressed = zlib.compress(json_str.encode('utf-8'), level=9)
-    encoded = base64.urlsafe_b64encode(compressed).decode('utf-8')
+    """
+    문서 데이터를 URL-safe Base64 토큰으로 인코딩
+
+    스키마에 맞는 데이터는 바이너리 팩(doc_codec)으로, 그 외에는 기존 zlib(JSON) 형식으로 인코딩
+    """
+    raw = encode_packed(doc_data, doc_types)
+    if raw is None:
+        payload = {
+            "d": doc_data,  # 키 이름 축약
+            "t": doc_types
+        }
+        json_str = json.dumps(payload, ensure_ascii=False, separators=(',', ':'))
+        # zlib으로 압축
+        raw = zlib.compress(json_str.encode('utf-8'), level=9)
+    encoded = base64.urlsafe_b64encode(raw).decode('utf-8')
     return encoded.rstrip('=')
 
 
+# 토큰 디코딩 제한
+DOC_TOKEN_MAX_LENGTH = int(os.getenv("DOC_TOKEN_MAX_LENGTH", "16384"))
+DOC_DECODED_MAX_BYTES = int(os.getenv("DOC_DECODED_MAX_BYTES", str(256 * 1024)))
+DOC_DECODE_CACHE_SIZE = int(os.getenv("DOC_DECODE_CACHE_SIZE", "1024"))
+DOC_TOKEN_PATTERN = re.compile(r"^[A-Za-z0-9_-]+$")
+
+
 def decode_doc_data(encoded):
-    """압축된 Base64 데이터 디코딩"""
+    """
+    토큰 디코딩 (바이너리 팩 / 기존 zlib(JSON) 형식 모두 지원)
+
+    같은 토큰은 LRU 캐시에서 바로 반환합니다 (/view와 PDF 다운로드가 같은 토큰 사용).
+    반환값은 요청 간에 공유되므로 수정하지 말고 복사해서 사용하세요.
+
+    Raises:
+        DocCodecError: 형식이 잘못되었거나 크기 제한을 넘은 토큰
+    """
+    # 디코딩 전에 길이/문자 검사로 잘못된 토큰을 바로 거절
+    if len(encoded) > DOC_TOKEN_MAX_LENGTH or not DOC_TOKEN_PATTERN.match(encoded):
+        raise DocCodecError("잘못된 문서 토큰입니다.")
+    with stage("token_decode"):
+        return _decode_token(encoded)
+
+
+@lru_cache(maxsize=DOC_DECODE_CACHE_SIZE)
+def _decode_token(encoded):
     # 패딩 복원
     padding = 4 - len(encoded) % 4
     if padding != 4:
         encoded += '=' * padding
-    # Base64 디코딩 후 압축 해제
-    compressed = base64.urlsafe_b64decode(encoded.encode('utf-8'))
-    json_str = zlib.decompress(compressed).decode('utf-8')
-    payload = json.loads(json_str)
-    # 키 이름 복원
-    return {"data": payload.get("d", {}), "types": payload.get("t", [])}
+    # Base64 디코딩
+    try:
+        raw = base64.urlsafe_b64decode(encoded.encode('utf-8'))
+    except ValueError as e:
+        raise DocCodecError(f"잘못된 문서 토큰입니다: {e}")
+    if is_packed(raw):
+        doc_data, doc_types = decode_packed(raw, max_size=DOC_DECODED_MAX_BYTES)
+        return {"data": doc_data, "types": doc_types}
+    # 기존 형식: 압축 해제(크기 제한) 후 JSON
+    try:
+        decompressor = zlib.decompressobj()
+        json_bytes = decompressor.decompress(raw, DOC_DECODED_MAX_BYTES)
+        if decompressor.unconsumed_tail:
+            raise DocCodecError("토큰 크기 제한을 넘었습니다.")
+        payload = json.loads(json_bytes.decode('utf-8'))
+    except (zlib.error, UnicodeDecodeError, json.JSONDecodeError) as e:
+        raise DocCodecError(f"잘못된 문서 토큰입니다: {e}")
+    if not isinstance(payload, dict):
+        raise DocCodecError("잘못된 문서 토큰입니다.")
+    # 키 이름 복원 (d는 dict, t는 문자열 목록이어야 함)
+    doc_data, doc_types = payload.get("d", {}), payload.get("t", [])
+    check_doc_data(doc_data, doc_types)
+    return {"data": doc_data, "types": doc_types}
+
+
+def doc_decode_cache_stats():
+    """토큰 디코딩 캐시 적중/미적중 통계"""
+    info = _decode_token.cache_info()
+    return {
+        "hits": info.hits,
+        "misses": info.misses,
+        "entries": info.currsize,
+        "max_entries": info.maxsize,
+    }
 
 
 def generate_doc_id(doc_data):
@@ -219,81 +605,202 @@ def generate_doc_id(doc_data):
     return hashlib.sha256(json_str.encode()).hexdigest()[:12]
 
 
+# 렌더링된 /view 페이지 캐시 크기 (항목 수)
+VIEW_CACHE_SIZE = int(os.getenv("VIEW_CACHE_SIZE", "512"))
+
+
+@lru_cache(maxsize=VIEW_CACHE_SIZE)
+def _render_view_page(doc_id, fallback_date):
+    """
+    /view 페이지 렌더링 (doc_id별 캐시)
+
+    Args:
+        fallback_date: 발행일이 없는 기존 토큰에 표시할 날짜 (발행일이 있는 토큰이면 None)
+
+    Returns:
+        tuple: (HTML, ETag, 렌더링 시각)
+    """
+    payload = decode_doc_data(doc_id)
+    doc_data = payload.get("data", {})
+    doc_types = payload.get("types", [])
+
+    # 견적서가 포함되어 있으면 웹에서 바로 보여주기
+    if "estimate" in doc_types:
+        html = render_template(
+            "view_estimate.html",
+            customer=doc_data.get("customer", {}),
+            apartments=doc_data.get("apartments", []),
+            total_monthly=doc_data.get("total_monthly", 0),
+            discount_label=doc_data.get("discount_label", "할인 없음"),
+            discount_rate=doc_data.get("discount_rate", 0),
+            discount_amount=doc_data.get("discount_amount", 0),
+            monthly_final=doc_data.get("monthly_final", 0),
+            months=doc_data.get("months", 3),
+            final_total=doc_data.get("final_total", 0),
+            date=doc_data.get("date") or fallback_date,
+            doc_types=doc_types,
+            doc_id=doc_id
+        )
+    else:
+        # 제안서만 있으면 다운로드 페이지
+        html = render_template(
+            "view_document.html",
+            customer=doc_data.get("customer", {}),
+            doc_types=doc_types,
+            doc_id=doc_id
+        )
+
+    etag = hashlib.sha256(html.encode("utf-8")).hexdigest()[:32]
+    return html, etag, datetime.now().replace(microsecond=0).astimezone()
+
+
+def view_cache_stats():
+    """/view 렌더링 캐시 적중/미적중 통계"""
+    info = _render_view_page.cache_info()
+    return {
+        "hits": info.hits,
+        "misses": info.misses,
+        "entries": info.currsize,
+        "max_entries": info.maxsize,
+    }
+
+
 @app.route("/view/<doc_id>")
 def view_document(doc_id):
-    """문서 보기 페이지 - 견적서는 웹에서 바로 표시"""
+    """
+    문서 보기 페이지 - 견적서는 웹에서 바로 표시
+
+    같은 doc_id는 캐시된 HTML을 사용하고, ETag/Last-Modified로 재방문 시 304를 반환합니다.
+    """
     try:
         payload = decode_doc_data(doc_id)
-        doc_data = payload.get("data", {})
-        doc_types = payload.get("types", [])
-
-        # 견적서가 포함되어 있으면 웹에서 바로 보여주기
-        if "estimate" in doc_types:
-            return render_template(
-                "view_estimate.html",
-                customer=doc_data.get("customer", {}),
-                apartments=doc_data.get("apartments", []),
-                total_monthly=doc_data.get("total_monthly", 0),
-                discount_label=doc_data.get("discount_label", "할인 없음"),
-                discount_rate=doc_data.get("discount_rate", 0),
-                discount_amount=doc_data.get("discount_amount", 0),
-                monthly_final=doc_data.get("monthly_final", 0),
-                months=doc_data.get("months", 3),
-                final_total=doc_data.get("final_total", 0),
-                date=datetime.now().strftime("%Y년 %m월 %d일"),
-                doc_types=doc_types,
-                doc_id=doc_id
-            )
-        else:
-            # 제안서만 있으면 다운로드 페이지
-            return render_template(
-                "view_document.html",
-                customer=doc_data.get("customer", {}),
-                doc_types=doc_types,
-                doc_id=doc_id
-            )
+        # 발행일이 없는 기존 토큰은 날짜별로 따로 캐시
+        fallback_date = None if payload.get("data", {}).get("date") else issue_date()
+        with stage("view_render"):
+            html, etag, rendered_at = _render_view_page(doc_id, fallback_date)
     except Exception as e:
         return f"문서를 찾을 수 없습니다: {str(e)}", 404
 
+    response = make_response(html)
+    response.set_etag(etag)
+    response.last_modified = rendered_at
+    # 매번 재검증 (템플릿이 바뀌면 ETag도 바뀜)
+    response.cache_control.no_cache = True
+    return response.make_conditional(request)
+
+
+def _load_doc_data(doc_id):
+    """문서 토큰에서 문서 데이터 복원 (발행일이 없는 기존 토큰은 오늘 날짜 사용)"""
+    payload = decode_doc_data(doc_id)
+    # 캐시된 디코딩 결과는 공유되므로 복사본에 추가
+    doc_data = dict(payload.get("data", {}))
+    doc_data.setdefault("date", issue_date())
+    return doc_data
+
+
+def _estimate_cache_key(doc_data):
+    return f"estimate_{generate_doc_id(doc_data)}"
+
+
+def schedule_estimate_prerender(doc_id):
+    """
+    /pdf/<doc_id>/estimate가 열리기 전에 백그라운드에서 PDF 캐시 채우기
+
+    대기 작업이 한도를 넘으면 등록하지 않음 (발송 요청은 기다리지 않음)
+    """
+    def prerender():
+        doc_data = _load_doc_data(doc_id)
+        cache_key = _estimate_cache_key(doc_data)
+        if pdf_cache.contains(cache_key):
+            return
+        # 프리렌더 작업 스레드에서 직접 렌더링 (대량 생성용 프로세스 풀은 띄우지 않음)
+        with stage("prerender"):
+            pdf_cache.get_or_render(cache_key, lambda: generate_estimate_bytes(doc_data))
+
+    return prerenderer.submit(doc_id, prerender)
+
 
 @app.route("/pdf/<doc_id>/<doc_type>")
 def generate_pdf_realtime(doc_id, doc_type):
     """실시간 PDF 생성 및 다운로드"""
     try:
-        payload = decode_doc_data(doc_id)
-        doc_data = payload.get("data", {})
+        doc_data = _load_doc_data(doc_id)
 
-        # 날짜 추가
-        doc_data["date"] = datetime.now().strftime("%Y년 %m월 %d일")
+        if doc_type in ("estimate", "combined"):
+            # 같은 문서 데이터면 캐시된 PDF 재사용, 없으면 메모리에서 생성
+            pdf_bytes = pdf_cache.get_or_render(
+                _estimate_cache_key(doc_data),
+                lambda: generate_estimate_bytes(doc_data)
+            )
+            company = doc_data.get('customer', {}).get('company', 'document')
+
+            if doc_type == "combined":
+                # 제안서 원본 bytes 뒤에 견적서 페이지를 증분 업데이트로 붙여서 전송
+                # (템플릿은 첫 합본 요청 때 잠금 안에서 한 번만 파싱, 콜드 스타트에는 포함하지 않음)
+                template = get_proposal_template(PROPOSAL_PDF_PATH)
+                if template is None:
+                    return "제안서 파일을 찾을 수 없습니다.", 404
+                with stage("pdf_combine"):
+                    update = template.append_pages(pdf_bytes)
+                response = Response([template.data, update], mimetype='application/pdf')
+                response.headers["Content-Length"] = str(len(template.data) + len(update))
+                response.headers.set(
+                    "Content-Disposition", "attachment", filename=f"제안서_견적서_{company}.pdf"
+                )
+                return response
 
-        if doc_type == "estimate":
-            pdf_path = generate_estimate(doc_data)
-            filename = f"견적서_{doc_data.get('customer', {}).get('company', 'document')}.pdf"
+            filename = f"견적서_{company}.pdf"
         elif doc_type == "proposal":
             # 제안서는 고정 PDF 파일 반환 (브라우저에서 바로 보기)
+            # 강한 ETag + Cache-Control, If-None-Match → 304, Range → 206 부분 응답
             if os.path.exists(PROPOSAL_PDF_PATH):
                 return send_file(
                     PROPOSAL_PDF_PATH,
                     mimetype='application/pdf',
-                    as_attachment=False  # False면 브라우저에서 바로 보기
+                    as_attachment=False,  # False면 브라우저에서 바로 보기
+                    conditional=True,
+                    etag=get_proposal_etag(),
+                    max_age=PROPOSAL_MAX_AGE
                 )
             else:
                 return "제안서 파일을 찾을 수 없습니다.", 404
         else:
             return "잘못된 문서 유형입니다.", 400
 
-        # 생성된 PDF 파일 전송
+        # 생성된 PDF 메모리 버퍼 전송
         return send_file(
-            pdf_path,
+            BytesIO(pdf_bytes),
             mimetype='application/pdf',
             as_attachment=True,
             download_name=filename
         )
 
+    except DocCodecError as e:
+        return f"문서를 찾을 수 없습니다: {str(e)}", 404
     except Exception as e:
         return f"PDF 생성 실패: {str(e)}", 500
 
 
+register_stats("pdf_cache", "렌더링된 PDF 캐시 상태", pdf_cache.stats)
+register_stats("doc_decode_cache", "문서 토큰 디코딩 캐시 상태", doc_decode_cache_stats)
+register_stats("view_cache", "렌더링된 /view 페이지 캐시 상태", view_cache_stats)
+register_stats("artifact_store", "생성된 PDF 파일 저장소 상태", artifact_store.stats)
+register_stats("prerender", "견적서 PDF 미리 생성 큐 상태", prerenderer.stats)
+register_stats("apartment_inventory", "아파트 인벤토리 색인 상태", apartment_inventory.stats)
+
+
+@app.route("/metrics")
+def metrics():
+    """
+    Prometheus 텍스트 형식 지표
+
+    METRICS_TOKEN이 설정되어 있으면 Authorization: Bearer <토큰> 헤더가 필요합니다.
+    """
+    if METRICS_TOKEN and request.headers.get("Authorization") != f"Bearer {METRICS_TOKEN}":
+        return "인증이 필요합니다.", 401
+    return Response(metrics_registry.render(), mimetype="text/plain; version=0.0.4; charset=utf-8")
+
+
 def get_document_url(doc_data, doc_types):
     """알림톡용 문서 URL 생성"""
     doc_id = encode_doc_data(doc_data, doc_types)
@@ -301,5 +808,4 @@ def get_document_url(doc_data, doc_types):
 
 
 if __name__ == "__main__":
-    os.makedirs("output", exist_ok=True)
     app.run(debug=True, port=5000)
@@ -0,0 +1,428 @@
+# -*- coding: utf-8 -*-
+"""
+성능 벤치마크
+
+실행 (프로젝트 루트에서):
+    python -m benchmarks.run                       # 전체
+    python -m benchmarks.run --cases pdf,codec     # 일부만
+    python -m benchmarks.run --quick               # 반복 횟수 축소
+    python -m benchmarks.run --compare 이전결과.json
+
+측정 항목:
+- pdf: _build_document(견적서 파일 렌더링) 아파트 1/10/100/1000개 - 시간, 최대 RSS, 파일 크기
+  (항목마다 새 프로세스에서 실행해 최대 RSS가 섞이지 않도록 함)
+- codec: encode_doc_data / decode_doc_data 처리량과 토큰 길이
+- flask: /view, /pdf (Flask 테스트 클라이언트)
+- send: send_email / send_kakao_alimtalk, 발송 루프에서 동시 발송 (로컬 SMTP/HTTP 대역 서버)
+
+결과는 benchmarks/results/ 아래 JSON으로 저장합니다 (커밋, 환경 정보 포함).
+외부 서비스로는 아무것도 발송하지 않습니다.
+"""
+import argparse
+import asyncio
+import base64
+import json
+import multiprocessing
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import zlib
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT_DIR not in sys.path:
+    sys.path.insert(0, ROOT_DIR)
+
+from benchmarks.standins import SmtpStandIn, SolapiStandIn  # noqa: E402
+
+RESULTS_DIR = os.path.join(ROOT_DIR, "benchmarks", "results")
+ALL_CASES = ("pdf", "codec", "flask", "send")
+PDF_SIZES = (1, 10, 100, 1000)
+CODEC_SIZES = (1, 10, 100)
+CONCURRENT_SENDS = 200
+
+
+# ===== 공통 =====
+
+def summarize(times):
+    """초 단위 측정값 목록 → 통계 (ms)"""
+    ordered = sorted(times)
+    return {
+        "runs": len(ordered),
+        "mean_ms": round(statistics.fmean(ordered) * 1000, 3),
+        "p50_ms": round(ordered[len(ordered) // 2] * 1000, 3),
+        "p95_ms": round(ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))] * 1000, 3),
+        "min_ms": round(ordered[0] * 1000, 3),
+    }
+
+
+def timed(func, runs):
+    """func를 runs번 실행한 시간 목록"""
+    times = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - start)
+    return times
+
+
+def peak_rss_kb():
+    """현재 프로세스 최대 RSS (KB, 지원하지 않는 OS면 None)"""
+    try:
+        import resource
+    except ImportError:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # macOS는 바이트, Linux는 KB 단위
+    return peak // 1024 if sys.platform == "darwin" else peak
+
+
+def make_doc_data(apartment_count, date="2026년 01월 02일"):
+    """벤치마크용 문서 데이터 (항상 같은 값)"""
+    from services.pricing import quote
+
+    apartments = [
+        {
+            "apartment_name": f"벤치마크 {i + 1}단지 아파트",
+            "monitor_count": i % 20 + 1,
+            "unit_price": 30000 + (i % 7) * 5000,
+        }
+        for i in range(apartment_count)
+    ]
+    return {
+        "customer": {
+            "company": "벤치마크 주식회사",
+            "name": "홍길동",
+            "email": "bench@example.com",
+            "phone": "010-0000-0000",
+        },
+        **quote(apartments, "10", 6),
+        "manager": {"name": "김담당", "position": "과장", "phone": "010-1111-2222", "email": "sales@example.com"},
+        "date": date,
+    }
+
+
+def log(message):
+    print(f"[Benchmark] {message}", flush=True)
+
+
+# ===== PDF 렌더링 =====
+
+def _pdf_case(apartment_count, runs, output_dir):
+    """새 프로세스에서 견적서 생성 측정 (폰트 로드/첫 렌더는 따로 기록)"""
+    import services.pdf_generator as pdf_generator
+
+    # 산출물 저장소를 거치면 두 번째부터 기존 파일을 재사용하므로 렌더링만 측정
+    data = make_doc_data(apartment_count)
+    path = os.path.join(output_dir, f"estimate_{apartment_count}.pdf")
+
+    start = time.perf_counter()
+    pdf_generator.load_korean_font()
+    font_load = time.perf_counter() - start
+
+    start = time.perf_counter()
+    pdf_generator._build_document(data, "estimate", path)
+    first = time.perf_counter() - start
+    baseline_rss = peak_rss_kb()
+
+    times = []
+    size = 0
+    for _ in range(runs):
+        start = time.perf_counter()
+        pdf_generator._build_document(data, "estimate", path)
+        times.append(time.perf_counter() - start)
+        size = os.path.getsize(path)
+
+    return {
+        "apartments": apartment_count,
+        **summarize(times),
+        "font_load_ms": round(font_load * 1000, 3),
+        "first_render_ms": round(first * 1000, 3),
+        "output_bytes": size,
+        "baseline_rss_kb": baseline_rss,
+        "peak_rss_kb": peak_rss_kb(),
+    }
+
+
+def bench_pdf(quick):
+    results = []
+    context = multiprocessing.get_context("spawn")
+    with tempfile.TemporaryDirectory() as output_dir:
+        for count in PDF_SIZES:
+            runs = 1 if quick or count >= 1000 else (3 if count >= 100 else 10)
+            with ProcessPoolExecutor(max_workers=1, mp_context=context) as executor:
+                result = executor.submit(_pdf_case, count, runs, output_dir).result()
+            log(f"pdf apartments={count}: {result['mean_ms']}ms, "
+                f"{result['output_bytes']} bytes, peak RSS {result['peak_rss_kb']} KB")
+            results.append(result)
+    return results
+
+
+# ===== 토큰 코덱 =====
+
+def bench_codec(quick):
+    import app
+
+    results = []
+    for count in CODEC_SIZES:
+        runs = 200 if quick else (2000 if count <= 10 else 300)
+        doc_data = make_doc_data(count)
+        doc_types = ["proposal", "estimate"]
+        token = app.encode_doc_data(doc_data, doc_types)
+
+        # 기존 zlib(JSON) 형식 토큰 길이 (비교용)
+        legacy_json = json.dumps({"d": doc_data, "t": doc_types}, ensure_ascii=False, separators=(",", ":"))
+        legacy_token = base64.urlsafe_b64encode(zlib.compress(legacy_json.encode("utf-8"), 9)).rstrip(b"=")
+
+        encode_times = timed(lambda: app.encode_doc_data(doc_data, doc_types), runs)
+
+        def decode_cold():
+            app._decode_token.cache_clear()
+            app.decode_doc_data(token)
+
+        decode_cold_times = timed(decode_cold, runs)
+        decode_warm_times = timed(lambda: app.decode_doc_data(token), runs)
+
+        result = {
+            "apartments": count,
+            "token_length": len(token),
+            "legacy_token_length": len(legacy_token),
+            "encode": {**summarize(encode_times), "ops_per_sec": round(runs / sum(encode_times))},
+            "decode_cold": {**summarize(decode_cold_times), "ops_per_sec": round(runs / sum(decode_cold_times))},
+            "decode_warm": {**summarize(decode_warm_times), "ops_per_sec": round(runs / sum(decode_warm_times))},
+        }
+        log(f"codec apartments={count}: token {len(token)} chars (legacy {len(legacy_token)}), "
+            f"encode {result['encode']['ops_per_sec']}/s, decode {result['decode_cold']['ops_per_sec']}/s")
+        results.append(result)
+    return results
+
+
+# ===== Flask 라우트 =====
+
+def bench_flask(quick):
+    import app
+    from services.pdf_cache import pdf_cache
+
+    client = app.app.test_client()
+    runs = 20 if quick else 200
+    pdf_runs = 5 if quick else 30
+    token = app.encode_doc_data(make_doc_data(10), ["proposal", "estimate"])
+
+    def get(path, headers=None, expected=200):
+        response = client.get(path, headers=headers)
+        if response.status_code != expected:
+            raise RuntimeError(f"{path}: {response.status_code}")
+        response.close()
+        return response
+
+    etag = get(f"/view/{token}").headers["ETag"]
+
+    def view_cold():
+        app._render_view_page.cache_clear()
+        app._decode_token.cache_clear()
+        get(f"/view/{token}")
+
+    def pdf_cold():
+        pdf_cache.clear()
+        get(f"/pdf/{token}/estimate")
+
+    cases = {
+        "view_cold": timed(view_cold, runs),
+        "view_warm": timed(lambda: get(f"/view/{token}"), runs),
+        "view_304": timed(lambda: get(f"/view/{token}", {"If-None-Match": etag}, 304), runs),
+        "pdf_estimate_cold": timed(pdf_cold, pdf_runs),
+        "pdf_estimate_warm": timed(lambda: get(f"/pdf/{token}/estimate"), runs),
+        "pdf_combined_warm": timed(lambda: get(f"/pdf/{token}/combined"), pdf_runs),
+        "pdf_proposal": timed(lambda: get(f"/pdf/{token}/proposal"), pdf_runs),
+    }
+    results = {name: summarize(times) for name, times in cases.items()}
+    for name, result in results.items():
+        log(f"flask {name}: {result['mean_ms']}ms")
+    return results
+
+
+# ===== 발송 =====
+
+def bench_send(quick, standins):
+    import app
+    from services import email_sender, kakao_sender
+    from services.kakao_sender import send_kakao_alimtalk
+    from services.async_runtime import run_sync
+
+    smtp, solapi = standins
+    runs = 10 if quick else 50
+    doc_data = make_doc_data(10)
+
+    with tempfile.TemporaryDirectory() as output_dir:
+        attachment = os.path.join(output_dir, "estimate.pdf")
+        with open(attachment, "wb") as f:
+            f.write(app.generate_estimate_bytes(doc_data))
+
+        def send_mail():
+            result = email_sender.send_email("customer@example.com", "홍길동", "벤치마크", pdf_paths=[attachment])
+            if not result["success"]:
+                raise RuntimeError(result["error"])
+
+        def send_kakao():
+            result = send_kakao_alimtalk("010-0000-0000", "홍길동", "견적서", "http://localhost/view/x")
+            if not result["success"]:
+                raise RuntimeError(result["error"])
+
+        # 발송 이벤트 루프에서 동시에 진행 (요청 스레드 하나로 N건)
+        async def kakao_burst():
+            results = await asyncio.gather(*(
+                kakao_sender.send_kakao_alimtalk_async("010-0000-0000", "홍길동", "견적서", f"http://localhost/view/{i}")
+                for i in range(CONCURRENT_SENDS)
+            ))
+            if not all(result["success"] for result in results):
+                raise RuntimeError("kakao burst failed")
+
+        async def mail_burst():
+            results = await asyncio.gather(*(
+                email_sender.send_email_async(f"customer{i}@example.com", "홍길동", "벤치마크", pdf_paths=[attachment])
+                for i in range(CONCURRENT_SENDS // 4)
+            ))
+            if not all(result["success"] for result in results):
+                raise RuntimeError("email burst failed")
+
+        concurrent_runs = 1 if quick else 5
+        results = {
+            "email": {**summarize(timed(send_mail, runs)), "attachment_bytes": os.path.getsize(attachment)},
+            "kakao": summarize(timed(send_kakao, runs)),
+            f"kakao_concurrent_{CONCURRENT_SENDS}": summarize(timed(lambda: run_sync(kakao_burst()), concurrent_runs)),
+            f"email_concurrent_{CONCURRENT_SENDS // 4}": summarize(timed(lambda: run_sync(mail_burst()), concurrent_runs)),
+            "smtp_messages_received": smtp.messages,
+            "solapi_calls_received": solapi.calls,
+            "smtp_pool": email_sender.smtp_pool.stats(),
+            "solapi_http_pool": kakao_sender._http.stats(),
+        }
+    log(f"send email: {results['email']['mean_ms']}ms, kakao: {results['kakao']['mean_ms']}ms, "
+        f"{CONCURRENT_SENDS} concurrent kakao: {results[f'kakao_concurrent_{CONCURRENT_SENDS}']['mean_ms']}ms")
+    return results
+
+
+# ===== 실행 =====
+
+def start_standins():
+    """대역 서버 시작 후 서비스 설정을 대역 서버로 지정 (서비스 모듈 import 전에 호출)"""
+    smtp = SmtpStandIn().start()
+    solapi = SolapiStandIn().start()
+    os.environ.update({
+        "OUTBOX_ENABLED": "false",
+        "BATCH_RENDER_WORKERS": "0",
+        "PDF_CACHE_SPILL_DIR": "",
+        "SMTP_SERVER": smtp.host,
+        "SMTP_PORT": str(smtp.port),
+        "SMTP_USE_SSL": "false",
+        "SMTP_USE_STARTTLS": "false",
+        "SMTP_USERNAME": "bench",
+        "SMTP_PASSWORD": "bench",
+        "SENDER_EMAIL": "bench@example.com",
+        "SOLAPI_API_BASE": solapi.base_url,
+        "SOLAPI_API_KEY": "bench",
+        "SOLAPI_API_SECRET": "bench",
+        "SOLAPI_PF_ID": "bench",
+        "SOLAPI_TEMPLATE_ID_PROPOSAL": "bench",
+        "SOLAPI_TEMPLATE_ID_ESTIMATE": "bench",
+        "SOLAPI_SENDER_PHONE": "01000000000",
+    })
+    return smtp, solapi
+
+
+def environment_info():
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=ROOT_DIR,
+            capture_output=True, text=True, timeout=10
+        ).stdout.strip() or None
+    except (OSError, subprocess.SubprocessError):
+        commit = None
+    return {
+        "commit": commit,
+        "timestamp": datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+    }
+
+
+def _flatten(value, prefix=""):
+    """결과 JSON → {"경로": 값} (비교용)"""
+    if isinstance(value, dict):
+        items = {}
+        for key, child in value.items():
+            items.update(_flatten(child, f"{prefix}.{key}" if prefix else key))
+        return items
+    if isinstance(value, list):
+        items = {}
+        for child in value:
+            label = child.get("apartments", "") if isinstance(child, dict) else ""
+            items.update(_flatten(child, f"{prefix}[{label}]"))
+        return items
+    return {prefix: value}
+
+
+def compare(previous, current):
+    """이전 결과와 평균 시간(mean_ms) 비교 출력"""
+    before = _flatten(previous.get("results", {}))
+    after = _flatten(current.get("results", {}))
+    log(f"compare {previous.get('environment', {}).get('commit')} → {current['environment']['commit']}")
+    for key in sorted(after):
+        if not key.endswith("mean_ms") or key not in before or not before[key]:
+            continue
+        change = (after[key] - before[key]) / before[key] * 100
+        print(f"  {key}: {before[key]} → {after[key]} ms ({change:+.1f}%)")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="포커스미디어 견적 서비스 벤치마크")
+    parser.add_argument("--cases", default=",".join(ALL_CASES),
+                        help=f"실행할 항목 (쉼표 구분, 기본: {','.join(ALL_CASES)})")
+    parser.add_argument("--quick", action="store_true", help="반복 횟수를 줄여 빠르게 실행")
+    parser.add_argument("--output", help="결과 JSON 경로 (기본: benchmarks/results/bench_<시각>_<커밋>.json)")
+    parser.add_argument("--compare", help="비교할 이전 결과 JSON 경로")
+    args = parser.parse_args(argv)
+
+    cases = [case.strip() for case in args.cases.split(",") if case.strip()]
+    unknown = set(cases) - set(ALL_CASES)
+    if unknown:
+        parser.error(f"알 수 없는 항목: {', '.join(sorted(unknown))}")
+
+    standins = start_standins()
+    report = {"environment": environment_info(), "quick": args.quick, "results": {}}
+
+    for case in cases:
+        log(f"running {case}")
+        if case == "pdf":
+            report["results"]["pdf"] = bench_pdf(args.quick)
+        elif case == "codec":
+            report["results"]["codec"] = bench_codec(args.quick)
+        elif case == "flask":
+            report["results"]["flask"] = bench_flask(args.quick)
+        elif case == "send":
+            report["results"]["send"] = bench_send(args.quick, standins)
+
+    output = args.output
+    if not output:
+        os.makedirs(RESULTS_DIR, exist_ok=True)
+        stamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        output = os.path.join(RESULTS_DIR, f"bench_{stamp}_{report['environment']['commit'] or 'local'}.json")
+    with open(output, "w", encoding="utf-8") as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
+    log(f"results written to {output}")
+
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            compare(json.load(f), report)
+
+    for smtp_or_solapi in standins:
+        smtp_or_solapi.stop()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,150 @@
+# -*- coding: utf-8 -*-
+"""
+벤치마크용 로컬 대역 서버
+
+실제 SMTP 서버/솔라피 API 대신 127.0.0.1에서 응답만 돌려주는 최소 구현입니다.
+- SmtpStandIn: EHLO, AUTH PLAIN, MAIL/RCPT/DATA, NOOP, RSET, QUIT
+- SolapiStandIn: /messages/v4/send, /messages/v4/send-many/detail (항상 성공)
+"""
+import json
+import socketserver
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+
+# ===== SMTP =====
+
+class _SmtpHandler(socketserver.StreamRequestHandler):
+    disable_nagle_algorithm = True
+
+    def _reply(self, line):
+        self.wfile.write(f"{line}\r\n".encode())
+
+    def handle(self):
+        self._reply("220 standin ESMTP")
+        while True:
+            line = self.rfile.readline()
+            if not line:
+                return
+            command = line.decode("utf-8", "replace").strip().upper()
+
+            if command.startswith(("EHLO", "HELO")):
+                self.wfile.write(b"250-standin\r\n250-AUTH PLAIN\r\n250 SIZE 52428800\r\n")
+            elif command.startswith("AUTH"):
+                self._reply("235 2.7.0 Authentication successful")
+            elif command.startswith(("MAIL", "RCPT", "RSET", "NOOP")):
+                self._reply("250 OK")
+            elif command.startswith("DATA"):
+                self._reply("354 End data with <CR><LF>.<CR><LF>")
+                size = 0
+                while True:
+                    data_line = self.rfile.readline()
+                    if not data_line or data_line == b".\r\n":
+                        break
+                    size += len(data_line)
+                self.server.messages += 1
+                self.server.bytes_received += size
+                self._reply("250 OK queued")
+            elif command.startswith("QUIT"):
+                self._reply("221 Bye")
+                return
+            else:
+                self._reply("502 Command not implemented")
+
+
+class _SmtpServer(socketserver.ThreadingTCPServer):
+    daemon_threads = True
+    allow_reuse_address = True
+    # 동시 발송 측정 시 기본 backlog(5)를 넘는 연결이 SYN 재전송(1초)으로 늦어지지 않도록
+    request_queue_size = 128
+
+    def __init__(self, address):
+        super().__init__(address, _SmtpHandler)
+        self.messages = 0
+        self.bytes_received = 0
+
+
+class SmtpStandIn:
+    """로컬 SMTP 대역 서버 (TLS 없음, 인증은 항상 성공)"""
+
+    def __init__(self, host="127.0.0.1", port=0):
+        self.server = _SmtpServer((host, port))
+        self.host, self.port = self.server.server_address
+
+    def start(self):
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        return self
+
+    def stop(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+    @property
+    def messages(self):
+        return self.server.messages
+
+
+# ===== 솔라피 =====
+
+class _SolapiHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    # 헤더와 본문을 따로 쓰므로 Nagle을 끄지 않으면 지연 ACK(약 40ms)가 측정에 섞임
+    disable_nagle_algorithm = True
+
+    def log_message(self, *args):
+        pass
+
+    def do_POST(self):
+        length = int(self.headers.get("Content-Length", 0))
+        body = json.loads(self.rfile.read(length) or b"{}")
+        self.server.calls += 1
+
+        if self.path.endswith("/send-many/detail"):
+            messages = body.get("messages", [])
+            result = {
+                "groupInfo": {"groupId": "G-standin", "count": {"total": len(messages)}},
+                "failedMessageList": [],
+                "messageList": [
+                    {"to": m.get("to"), "messageId": f"M{i}", "statusCode": "2000"}
+                    for i, m in enumerate(messages)
+                ],
+            }
+        else:
+            result = {"groupId": "G-standin", "messageId": "M0", "statusCode": "2000"}
+
+        raw = json.dumps(result).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(raw)))
+        self.end_headers()
+        self.wfile.write(raw)
+
+
+class _SolapiServer(ThreadingHTTPServer):
+    daemon_threads = True
+    request_queue_size = 128
+
+
+class SolapiStandIn:
+    """로컬 솔라피 API 대역 서버"""
+
+    def __init__(self, host="127.0.0.1", port=0):
+        self.server = _SolapiServer((host, port), _SolapiHandler)
+        self.server.calls = 0
+        self.host, self.port = self.server.server_address
+
+    @property
+    def base_url(self):
+        return f"http://{self.host}:{self.port}"
+
+    def start(self):
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        return self
+
+    def stop(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+    @property
+    def calls(self):
+        return self.server.calls
@@ -0,0 +1,330 @@
+# -*- coding: utf-8 -*-
+"""
+아파트 인벤토리 (모니터 보유 현황)
+
+아파트별 모니터 대수와 대당 정가를 로컬 CSV 또는 SQLite 파일에서 읽어
+메모리 색인으로 검색합니다.
+- 원본: APARTMENT_INVENTORY_PATH (.csv 또는 .db/.sqlite/.sqlite3)
+  비어 있으면(기본값) 인벤토리 없음 → 검색 결과 없음, apartment_id 참조는 UnknownApartmentError
+  형식 예시: data/apartments.example.csv (가상의 값이므로 실제 견적에 쓰지 말 것)
+  열 (CSV는 첫 줄 헤더, SQLite는 APARTMENT_INVENTORY_TABLE 테이블의 열 이름):
+    id             - 아파트 ID (필수, 중복이면 처음 행만 사용, 견적 요청의 apartment_id)
+    apartment_name - 아파트명 (필수)
+    monitor_count  - 설치된 모니터 대수 (정수, 비어 있으면 0)
+    unit_price     - 모니터 대당 월 정가 (원, 정수, 비어 있으면 0)
+    address        - 주소 (선택, 검색 결과 표시용)
+  id나 apartment_name이 빈 행은 건너뜀 (stats의 skipped)
+- 파일이 바뀌면(mtime/크기) 다음 조회 때 다시 읽음
+- 이름은 공백/기호를 빼고 소문자로 정규화한 뒤 1·2글자 n-gram 역색인으로 후보를 찾고 부분 문자열로 확인
+- 초성 검색: 검색어에 자음(ㄱ~ㅎ)이 있으면 초성 문자열 색인으로 검색 ("ㄹㅁㅇ", "래미ㅇ" 모두 가능)
+- 정렬: 완전 일치 → 앞부분 일치 → 일치 위치 → 이름 길이 순
+- 견적 요청의 아파트 항목은 apartment_id로 인벤토리 값을 참조할 수 있음 (resolve_apartments)
+"""
+import csv
+import heapq
+import os
+import sqlite3
+import threading
+import time
+import unicodedata
+from array import array
+
+APARTMENT_INVENTORY_PATH = os.getenv("APARTMENT_INVENTORY_PATH", "")
+APARTMENT_INVENTORY_TABLE = os.getenv("APARTMENT_INVENTORY_TABLE", "apartments")
+APARTMENT_SEARCH_LIMIT = int(os.getenv("APARTMENT_SEARCH_LIMIT", "20"))
+APARTMENT_SEARCH_MAX_LIMIT = 100
+
+SQLITE_SUFFIXES = (".db", ".sqlite", ".sqlite3")
+
+# 한글 음절 → 초성 (호환용 자모)
+HANGUL_BASE = 0xAC00
+HANGUL_LAST = 0xD7A3
+JUNGSUNG_JONGSUNG_COUNT = 21 * 28
+CHOSUNG = "ㄱㄲㄴㄷㄸㄹㅁㅂㅃㅅㅆㅇㅈㅉㅊㅋㅌㅍㅎ"
+CHOSUNG_SET = frozenset(CHOSUNG)
+
+
+class UnknownApartmentError(ValueError):
+    """인벤토리에 없는 apartment_id 참조"""
+
+
+def normalize(text):
+    """검색용 정규화 (NFC, 소문자, 글자/숫자만)"""
+    text = unicodedata.normalize("NFC", str(text or "")).lower()
+    return "".join(ch for ch in text if ch.isalnum())
+
+
+def to_chosung(text):
+    """정규화된 문자열의 한글 음절을 초성으로 변환 (다른 글자는 그대로)"""
+    chars = []
+    for ch in text:
+        code = ord(ch)
+        if HANGUL_BASE <= code <= HANGUL_LAST:
+            chars.append(CHOSUNG[(code - HANGUL_BASE) // JUNGSUNG_JONGSUNG_COUNT])
+        else:
+            chars.append(ch)
+    return "".join(chars)
+
+
+def _to_int(value):
+    try:
+        return int(float(value))
+    except (TypeError, ValueError, OverflowError):
+        return 0
+
+
+def _grams(text):
+    """색인용 1·2글자 n-gram"""
+    grams = set(text)
+    grams.update(text[i:i + 2] for i in range(len(text) - 1))
+    return grams
+
+
+def _query_grams(text):
+    """검색어 후보 조회용 n-gram (2글자 이상이면 2-gram만)"""
+    if len(text) < 2:
+        return {text}
+    return {text[i:i + 2] for i in range(len(text) - 1)}
+
+
+def _build_postings(keys):
+    postings = {}
+    for index, key in enumerate(keys):
+        for gram in _grams(key):
+            postings.setdefault(gram, array("I")).append(index)
+    return postings
+
+
+def _lookup(postings, query):
+    """n-gram 교집합으로 후보 번호 집합 (가장 짧은 목록부터)"""
+    lists = []
+    for gram in _query_grams(query):
+        found = postings.get(gram)
+        if found is None:
+            return set()
+        lists.append(found)
+    lists.sort(key=len)
+    candidates = set(lists[0])
+    for found in lists[1:]:
+        candidates.intersection_update(found)
+        if not candidates:
+            break
+    return candidates
+
+
+def _chosung_position(key, initials, query, query_initials):
+    """초성이 섞인 검색어 일치 위치 (자음은 초성으로, 나머지 글자는 그대로 비교, 없으면 -1)"""
+    start = initials.find(query_initials)
+    while start != -1:
+        if all(
+            q in CHOSUNG_SET or key[start + i] == q
+            for i, q in enumerate(query)
+        ):
+            return start
+        start = initials.find(query_initials, start + 1)
+    return -1
+
+
+class _InventoryIndex:
+    """한 번 읽은 인벤토리와 검색 색인 (만든 뒤에는 바꾸지 않음)"""
+
+    def __init__(self, records):
+        self.records = records
+        self.by_id = {record["id"]: record for record in records}
+        self.keys = [normalize(record["apartment_name"]) for record in records]
+        self.initials = [to_chosung(key) for key in self.keys]
+        self.name_postings = _build_postings(self.keys)
+        self.chosung_postings = _build_postings(self.initials)
+
+    def search(self, query, limit):
+        """→ (정렬된 레코드 목록(최대 limit개), 전체 일치 수)"""
+        query = normalize(query)
+        if not query:
+            return [], 0
+
+        matches = []
+        if CHOSUNG_SET.intersection(query):
+            query_initials = to_chosung(query)
+            for index in _lookup(self.chosung_postings, query_initials):
+                key = self.keys[index]
+                position = _chosung_position(key, self.initials[index], query, query_initials)
+                if position != -1:
+                    exact = position == 0 and len(key) == len(query)
+                    matches.append((0 if exact else 1 if position == 0 else 2, position, len(key), key, index))
+        else:
+            for index in _lookup(self.name_postings, query):
+                key = self.keys[index]
+                position = key.find(query)
+                if position != -1:
+                    exact = key == query
+                    matches.append((0 if exact else 1 if position == 0 else 2, position, len(key), key, index))
+
+        best = heapq.nsmallest(limit, matches)
+        return [self.records[match[-1]] for match in best], len(matches)
+
+
+def _read_csv(path):
+    with open(path, newline="", encoding="utf-8-sig") as f:
+        return list(csv.DictReader(f))
+
+
+def _read_sqlite(path, table):
+    conn = sqlite3.connect(f"file:{path}?mode=ro", uri=True)
+    try:
+        conn.row_factory = sqlite3.Row
+        # 테이블 이름은 환경변수 값이므로 따옴표로 감싸서 사용
+        quoted = '"' + table.replace('"', '""') + '"'
+        return [dict(row) for row in conn.execute(f"SELECT * FROM {quoted}")]
+    finally:
+        conn.close()
+
+
+def _to_record(row):
+    """원본 행 → 인벤토리 레코드 (id나 이름이 없으면 None)"""
+    apartment_id = str(row.get("id") or "").strip()
+    name = str(row.get("apartment_name") or "").strip()
+    if not apartment_id or not name:
+        return None
+    monitor_count = max(_to_int(row.get("monitor_count")), 0)
+    unit_price = max(_to_int(row.get("unit_price")), 0)
+    return {
+        "id": apartment_id,
+        "apartment_name": name,
+        "monitor_count": monitor_count,
+        "unit_price": unit_price,
+        "monthly_total": monitor_count * unit_price,
+        "address": str(row.get("address") or "").strip(),
+    }
+
+
+class ApartmentInventory:
+    """파일 기반 아파트 인벤토리 (스레드 안전, 파일이 바뀌면 자동으로 다시 읽음)"""
+
+    def __init__(self, path=APARTMENT_INVENTORY_PATH, table=APARTMENT_INVENTORY_TABLE):
+        self.path = path
+        self.table = table
+        self._index = _InventoryIndex([])
+        self._signature = None
+        self._lock = threading.Lock()
+        self.loaded_at = None
+        self.load_ms = 0.0
+        self.skipped = 0
+        self.searches = 0
+
+    def _current(self):
+        """현재 색인 (파일이 바뀌었으면 다시 읽어서 교체)"""
+        if not self.path:
+            return self._index
+        try:
+            st = os.stat(self.path)
+            signature = (st.st_mtime_ns, st.st_size)
+        except OSError:
+            signature = None
+        if signature == self._signature:
+            return self._index
+
+        with self._lock:
+            if signature != self._signature:
+                self._load(signature)
+            return self._index
+
+    def _load(self, signature):
+        if signature is None:
+            if self._signature is not None:
+                print(f"[Inventory] Source missing, inventory cleared: {self.path}")
+            self._index = _InventoryIndex([])
+            self._signature = None
+            return
+
+        started = time.perf_counter()
+        try:
+            if self.path.lower().endswith(SQLITE_SUFFIXES):
+                rows = _read_sqlite(self.path, self.table)
+            else:
+                rows = _read_csv(self.path)
+        except (OSError, csv.Error, sqlite3.Error, UnicodeDecodeError) as e:
+            # 읽기 실패 시 기존 색인 유지 (파일이 다시 바뀌면 재시도)
+            print(f"[Inventory] Load failed: {self.path}: {e}")
+            self._signature = signature
+            return
+
+        records = []
+        seen = set()
+        for row in rows:
+            record = _to_record(row)
+            if record is None or record["id"] in seen:
+                continue
+            seen.add(record["id"])
+            records.append(record)
+
+        self._index = _InventoryIndex(records)
+        self._signature = signature
+        self.loaded_at = time.time()
+        self.load_ms = (time.perf_counter() - started) * 1000
+        self.skipped = len(rows) - len(records)
+        print(f"[Inventory] Loaded {len(records)} apartments from {self.path} ({self.load_ms:.1f}ms)")
+
+    def search(self, query, limit=APARTMENT_SEARCH_LIMIT):
+        """
+        이름/초성 검색
+
+        Returns:
+            tuple: ([레코드, ...], 전체 일치 수)
+        """
+        limit = min(max(int(limit), 1), APARTMENT_SEARCH_MAX_LIMIT)
+        self.searches += 1
+        return self._current().search(query, limit)
+
+    def get(self, apartment_id):
+        """id로 레코드 조회 (없으면 None)"""
+        return self._current().by_id.get(str(apartment_id).strip())
+
+    def resolve_apartments(self, apartments):
+        """
+        apartment_id가 있는 아파트 항목에 인벤토리 값 채우기
+
+        요청에 직접 넣은 apartment_name/monitor_count/unit_price가 있으면 그 값이 우선합니다.
+
+        Raises:
+            UnknownApartmentError: 인벤토리에 없는 apartment_id
+        """
+        if not isinstance(apartments, list) or not any(
+            isinstance(apt, dict) and apt.get("apartment_id") not in (None, "") for apt in apartments
+        ):
+            return apartments
+
+        index = self._current()
+        resolved = []
+        missing = []
+        for apt in apartments:
+            if not isinstance(apt, dict) or apt.get("apartment_id") in (None, ""):
+                resolved.append(apt)
+                continue
+            record = index.by_id.get(str(apt["apartment_id"]).strip())
+            if record is None:
+                missing.append(str(apt["apartment_id"]))
+                continue
+            filled = dict(apt)
+            for field in ("apartment_name", "monitor_count", "unit_price"):
+                if filled.get(field) in (None, ""):
+                    filled[field] = record[field]
+            resolved.append(filled)
+
+        if missing:
+            raise UnknownApartmentError(f"인벤토리에 없는 아파트입니다: {', '.join(missing)}")
+        return resolved
+
+    def stats(self):
+        index = self._current()
+        return {
+            "source": self.path,
+            "apartments": len(index.records),
+            "skipped": self.skipped,
+            "loaded_at": self.loaded_at,
+            "load_ms": round(self.load_ms, 1),
+            "searches": self.searches,
+        }
+
+
+# 전역 인벤토리
+apartment_inventory = ApartmentInventory()
@@ -0,0 +1,259 @@
+# -*- coding: utf-8 -*-
+"""
+생성된 PDF 파일 저장소
+
+- 문서 내용(문서 유형 + 문서 데이터) 해시가 산출물 ID이자 디렉토리 이름
+  (<ARTIFACT_DIR>/<ID>/견적서_회사.pdf) → 같은 견적은 한 번만 렌더링/저장
+- 임시 파일에 쓴 뒤 os.replace로 교체 (읽는 쪽이 덜 쓴 파일을 보지 않음)
+- 마지막 사용 후 ARTIFACT_TTL_SECONDS가 지나면 삭제, 전체 용량이 ARTIFACT_MAX_BYTES를 넘으면
+  오래 안 쓴 것부터 삭제 (백그라운드 스레드가 ARTIFACT_SWEEP_INTERVAL마다 정리)
+- /generate, /send, /download는 경로 대신 산출물 ID로 파일을 찾음
+"""
+import hashlib
+import json
+import os
+import re
+import shutil
+import threading
+import time
+
+# 저장소 설정 (Vercel에서는 /tmp 사용)
+ARTIFACT_DIR = os.getenv("ARTIFACT_DIR", "/tmp/artifacts" if os.environ.get("VERCEL") else "output")
+ARTIFACT_TTL_SECONDS = int(os.getenv("ARTIFACT_TTL_SECONDS", str(24 * 3600)))
+ARTIFACT_MAX_BYTES = int(os.getenv("ARTIFACT_MAX_BYTES", str(512 * 1024 * 1024)))
+ARTIFACT_SWEEP_INTERVAL = int(os.getenv("ARTIFACT_SWEEP_INTERVAL", "300"))
+
+# 산출물 ID 형식 (SHA-256 앞 32자리)
+_ID_PATTERN = re.compile(r"^[0-9a-f]{32}$")
+_TMP_PREFIX = ".tmp-"
+
+
+def artifact_id(doc_type, data):
+    """문서 유형 + 문서 데이터로 산출물 ID 생성 (같은 내용이면 같은 ID)"""
+    json_str = json.dumps({"type": doc_type, "data": data}, sort_keys=True, ensure_ascii=False)
+    return hashlib.sha256(json_str.encode()).hexdigest()[:32]
+
+
+def safe_filename(name):
+    """파일 이름에 쓸 수 없는 문자 제거"""
+    return "".join(c for c in name if c.isalnum() or c in (' ', '_', '.', '-')).strip() or "document"
+
+
+class ArtifactStore:
+    """내용 주소 기반 PDF 파일 저장소 (스레드 안전)"""
+
+    def __init__(self, root=ARTIFACT_DIR, ttl_seconds=ARTIFACT_TTL_SECONDS, max_bytes=ARTIFACT_MAX_BYTES,
+                 sweep_interval=ARTIFACT_SWEEP_INTERVAL):
+        self.root = os.path.abspath(root)
+        self.ttl_seconds = ttl_seconds
+        self.max_bytes = max_bytes
+        self.sweep_interval = sweep_interval
+        self._lock = threading.Lock()
+        self._rendering = {}  # ID → 렌더링 중인 스레드가 끝나면 set되는 Event
+        self._started = False
+        self._bytes = None    # 마지막 정리 이후 추정 용량 (None이면 아직 모름)
+        self.hits = 0
+        self.misses = 0
+        self.evicted = 0
+
+    # ===== 조회 =====
+
+    def path(self, artifact_id):
+        """산출물 파일 경로 (없거나 만료됐으면 None), 조회하면 마지막 사용 시각 갱신"""
+        if not isinstance(artifact_id, str) or not _ID_PATTERN.match(artifact_id):
+            return None
+        directory = os.path.join(self.root, artifact_id)
+        try:
+            names = [name for name in os.listdir(directory) if not name.startswith(_TMP_PREFIX)]
+        except OSError:
+            return None
+        if not names:
+            return None
+
+        path = os.path.join(directory, names[0])
+        try:
+            if self._expired(os.stat(path).st_mtime, time.time()):
+                return None
+            os.utime(path)
+        except OSError:
+            return None
+        return path
+
+    def resolve(self, ref):
+        """
+        산출물 ID 또는 (이전 응답의) 저장소 안 파일 경로를 파일 경로로 변환
+
+        저장소 밖 경로는 받지 않음 (없으면 None)
+        """
+        if not isinstance(ref, str):
+            return None
+        if _ID_PATTERN.match(ref):
+            return self.path(ref)
+
+        full = os.path.realpath(ref)
+        if os.path.dirname(os.path.dirname(full)) != os.path.realpath(self.root):
+            return None
+        found = self.path(os.path.basename(os.path.dirname(full)))
+        return found if found and os.path.realpath(found) == full else None
+
+    def owns(self, path):
+        """저장소 안의 파일 경로인지 확인"""
+        root = os.path.realpath(self.root)
+        return os.path.realpath(path).startswith(root + os.sep)
+
+    def describe(self, path):
+        """응답용 산출물 정보 {"id", "filename", "size"}"""
+        return {
+            "id": os.path.basename(os.path.dirname(path)),
+            "filename": os.path.basename(path),
+            "size": os.path.getsize(path),
+        }
+
+    # ===== 저장 =====
+
+    def put(self, artifact_id, filename, pdf_bytes):
+        """파일 저장 (임시 파일에 쓴 뒤 교체), 저장된 경로 반환"""
+        self.start()
+        directory = os.path.join(self.root, artifact_id)
+        os.makedirs(directory, exist_ok=True)
+        path = os.path.join(directory, safe_filename(filename))
+
+        tmp_path = os.path.join(directory, f"{_TMP_PREFIX}{threading.get_ident()}")
+        with open(tmp_path, 'wb') as f:
+            f.write(pdf_bytes)
+        os.replace(tmp_path, path)
+
+        with self._lock:
+            over_quota = False
+            if self._bytes is not None:
+                self._bytes += len(pdf_bytes)
+                over_quota = self._bytes > self.max_bytes
+        if over_quota:
+            self.sweep()
+        return path
+
+    def get_or_create(self, doc_type, data, filename, render):
+        """
+        같은 내용의 산출물이 있으면 그 경로, 없으면 render()로 만들어 저장한 경로 반환
+
+        같은 ID를 여러 스레드가 동시에 요청하면 한 번만 렌더링함
+        """
+        key = artifact_id(doc_type, data)
+        while True:
+            path = self.path(key)
+            if path is not None:
+                with self._lock:
+                    self.hits += 1
+                return path
+
+            with self._lock:
+                waiting = self._rendering.get(key)
+                if waiting is None:
+                    done = self._rendering[key] = threading.Event()
+                    self.misses += 1
+            if waiting is None:
+                break
+            waiting.wait()
+
+        try:
+            return self.put(key, filename, render())
+        finally:
+            with self._lock:
+                self._rendering.pop(key, None)
+            done.set()
+
+    # ===== 정리 =====
+
+    def sweep(self):
+        """만료된 산출물 삭제 후 용량 한도까지 오래 안 쓴 것부터 삭제, 삭제한 개수 반환"""
+        now = time.time()
+        entries = []
+        removed = 0
+        try:
+            names = os.listdir(self.root)
+        except OSError:
+            return 0
+
+        for name in names:
+            directory = os.path.join(self.root, name)
+            if not _ID_PATTERN.match(name) or not os.path.isdir(directory):
+                continue
+            size = 0
+            last_used = 0
+            try:
+                for file_name in os.listdir(directory):
+                    st = os.stat(os.path.join(directory, file_name))
+                    # 임시 파일은 만료 판단에서 제외
+                    if not file_name.startswith(_TMP_PREFIX):
+                        last_used = max(last_used, st.st_mtime)
+                    size += st.st_size
+                if not last_used:
+                    # 아직 쓰는 중 (중단된 쓰기가 남긴 오래된 임시 파일만 있으면 삭제)
+                    last_used = os.stat(directory).st_mtime
+                    if not self._expired(last_used, now):
+                        continue
+            except OSError:
+                continue
+            if self._expired(last_used, now) and self._remove(name):
+                removed += 1
+                continue
+            entries.append((last_used, size, name))
+
+        total = sum(size for _, size, _ in entries)
+        for _, size, name in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            if self._remove(name):
+                removed += 1
+                total -= size
+
+        with self._lock:
+            self._bytes = total
+            self.evicted += removed
+        if removed:
+            print(f"[Artifact Store] Evicted {removed} artifact(s), {total} bytes kept")
+        return removed
+
+    def start(self):
+        """기존 파일 정리(용량 파악) 후 백그라운드 정리 스레드 시작 (이미 시작했으면 무시)"""
+        with self._lock:
+            if self._started:
+                return
+            self._started = True
+        os.makedirs(self.root, exist_ok=True)
+        self.sweep()
+        if self.sweep_interval > 0:
+            threading.Thread(target=self._sweep_loop, name="artifact-sweeper", daemon=True).start()
+
+    def stats(self):
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evicted": self.evicted,
+                "bytes": self._bytes if self._bytes is not None else 0,
+                "max_bytes": self.max_bytes,
+            }
+
+    def _sweep_loop(self):
+        while True:
+            time.sleep(self.sweep_interval)
+            try:
+                self.sweep()
+            except Exception as e:
+                print(f"[Artifact Store] Sweep failed: {e}")
+
+    def _expired(self, last_used, now):
+        return self.ttl_seconds > 0 and now - last_used > self.ttl_seconds
+
+    def _remove(self, name):
+        try:
+            shutil.rmtree(os.path.join(self.root, name))
+            return True
+        except OSError as e:
+            print(f"[Artifact Store] Remove failed: {name}: {e}")
+            return False
+
+
+# 프로세스 전역 저장소
+artifact_store = ArtifactStore()
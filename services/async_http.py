@@ -0,0 +1,123 @@
+# -*- coding: utf-8 -*-
+"""
+HTTP 클라이언트 (httpx)
+
+솔라피 API 호출용 비동기 HTTP 클라이언트입니다. 연결 관리는 httpx 연결 풀이 맡습니다.
+- keep-alive 연결 재사용 (동시 연결 수 제한, 오래 쉰 연결은 닫음)
+- 요청을 끝까지 보낸 뒤의 실패는 다시 보내지 않음 (재시도 여부는 호출하는 쪽이 오류 종류로 판단)
+- 오류 구분:
+  HttpConnectError - 연결 실패/연결 타임아웃/요청 전송 실패 (요청이 서버에 전달되지 않음, 재시도 안전)
+  HttpTimeout - 응답 대기 시간 초과 (요청은 이미 접수되었을 수 있음)
+  HttpError - 그 밖의 실패 (응답 없이 연결이 끊긴 경우 포함, 이미 접수되었을 수 있음)
+"""
+import json
+
+import httpx
+
+
+class HttpError(Exception):
+    """HTTP 호출 실패"""
+
+
+class HttpConnectError(HttpError):
+    """연결 또는 요청 전송 실패 (요청이 서버에 전달되지 않음)"""
+
+
+class HttpTimeout(HttpError):
+    """응답 대기 시간 초과 (요청은 이미 접수되었을 수 있음)"""
+
+
+# 요청이 서버에 다 전달되기 전에 난 실패 (연결, 풀 대기, 요청 쓰기)
+_NOT_SENT_ERRORS = (
+    httpx.ConnectError, httpx.ConnectTimeout, httpx.PoolTimeout, httpx.WriteError, httpx.WriteTimeout,
+)
+
+
+class AsyncHttpPool:
+    """keep-alive 연결 풀 (발송 이벤트 루프 전용)"""
+
+    def __init__(self, max_connections=10, max_idle=60, connect_timeout=3, read_timeout=10):
+        """
+        Args:
+            max_connections: 동시 연결(=동시 요청) 수
+            max_idle: 이 시간(초) 이상 쉰 연결은 닫고 새로 연결
+            connect_timeout, read_timeout: 기본 타임아웃(초)
+        """
+        self.max_connections = max_connections
+        self.max_idle = max_idle
+        self.connect_timeout = connect_timeout
+        self.read_timeout = read_timeout
+        self._client = None
+        self.requests = 0
+        self.created = 0
+
+    def _get_client(self):
+        # 발송 루프 안에서 처음 쓸 때 생성
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                limits=httpx.Limits(
+                    max_connections=self.max_connections,
+                    max_keepalive_connections=self.max_connections,
+                    keepalive_expiry=self.max_idle,
+                ),
+                timeout=self._timeout(None, None),
+            )
+        return self._client
+
+    def _timeout(self, connect_timeout, read_timeout):
+        # 연결 슬롯 대기(pool)는 제한 없음 (동시 요청 수 제한 역할)
+        return httpx.Timeout(
+            self.read_timeout if read_timeout is None else read_timeout,
+            connect=self.connect_timeout if connect_timeout is None else connect_timeout,
+            pool=None,
+        )
+
+    async def _trace(self, event_name, info):
+        """새 TCP 연결 수 집계 (httpx trace 확장)"""
+        if event_name == "connection.connect_tcp.complete":
+            self.created += 1
+
+    async def post_json(self, url, payload, headers=None, connect_timeout=None, read_timeout=None):
+        body = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+        headers = {"Content-Type": "application/json", **(headers or {})}
+        return await self.request("POST", url, headers, body, connect_timeout, read_timeout)
+
+    async def request(self, method, url, headers=None, body=b"", connect_timeout=None, read_timeout=None):
+        """
+        요청 보내고 응답 전체 읽기
+
+        Returns:
+            httpx.Response
+
+        Raises:
+            HttpConnectError, HttpTimeout, HttpError
+        """
+        self.requests += 1
+        try:
+            return await self._get_client().request(
+                method, url,
+                headers=headers,
+                content=body,
+                timeout=self._timeout(connect_timeout, read_timeout),
+                extensions={"trace": self._trace},
+            )
+        except _NOT_SENT_ERRORS as e:
+            raise HttpConnectError(f"요청 전달 실패: {str(e) or type(e).__name__}")
+        except httpx.TimeoutException:
+            raise HttpTimeout("응답 대기 시간 초과")
+        except httpx.HTTPError as e:
+            raise HttpError(f"HTTP 호출 실패: {str(e) or type(e).__name__}")
+
+    async def close_all(self):
+        """연결 모두 닫기"""
+        if self._client is not None:
+            client, self._client = self._client, None
+            await client.aclose()
+
+    def stats(self):
+        return {
+            "requests": self.requests,
+            "created": self.created,
+            "reused": max(self.requests - self.created, 0),
+            "max_connections": self.max_connections,
+        }
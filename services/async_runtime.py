@@ -0,0 +1,92 @@
+# -*- coding: utf-8 -*-
+"""
+발송용 asyncio 이벤트 루프
+
+Flask 워커는 동기 방식이므로 발송 I/O(SMTP, 솔라피 HTTP)는 백그라운드 스레드 하나에서 도는
+이벤트 루프에 코루틴으로 넘깁니다. 워커 스레드 수와 관계없이 한 프로세스에서 여러 발송을 동시에 진행합니다.
+- submit(coro): 루프에서 실행하고 concurrent.futures.Future 반환
+- run_sync(coro): 끝날 때까지 기다려 결과 반환 (기존 동기 함수의 래퍼용)
+- 호출한 스레드의 contextvars(요청 단계 측정 등)를 그대로 넘김
+"""
+import asyncio
+import contextvars
+import threading
+from concurrent.futures import Future, InvalidStateError
+
+_loop = None
+_loop_lock = threading.Lock()
+
+
+def get_loop():
+    """발송 이벤트 루프 (처음 호출할 때 백그라운드 스레드에서 시작)"""
+    global _loop
+    with _loop_lock:
+        if _loop is None:
+            loop = asyncio.new_event_loop()
+            ready = threading.Event()
+
+            def run():
+                asyncio.set_event_loop(loop)
+                loop.call_soon(ready.set)
+                loop.run_forever()
+
+            threading.Thread(target=run, name="async-send", daemon=True).start()
+            ready.wait()
+            _loop = loop
+        return _loop
+
+
+def in_loop_thread():
+    """현재 스레드가 발송 이벤트 루프 스레드인지"""
+    try:
+        return asyncio.get_running_loop() is _loop
+    except RuntimeError:
+        return False
+
+
+def submit(coro):
+    """
+    코루틴을 발송 루프에서 실행
+
+    Returns:
+        concurrent.futures.Future: 취소하면 루프의 작업도 취소됨
+    """
+    loop = get_loop()
+    context = contextvars.copy_context()
+    future = Future()
+
+    # future는 PENDING 상태로 두어야 실행 중에도 cancel()이 됨
+    def start():
+        if future.cancelled():
+            coro.close()
+            return
+        task = loop.create_task(coro, context=context)
+
+        def on_task_done(t):
+            try:
+                if t.cancelled():
+                    future.cancel()
+                elif t.exception() is not None:
+                    future.set_exception(t.exception())
+                else:
+                    future.set_result(t.result())
+            except InvalidStateError:
+                pass  # 이미 취소됨
+
+        def on_future_done(f):
+            if f.cancelled():
+                loop.call_soon_threadsafe(task.cancel)
+
+        task.add_done_callback(on_task_done)
+        future.add_done_callback(on_future_done)
+
+    loop.call_soon_threadsafe(start)
+    return future
+
+
+def run_sync(coro, timeout=None):
+    """코루틴을 발송 루프에서 실행하고 결과를 기다림 (루프 스레드 안에서는 호출 불가)"""
+    if in_loop_thread():
+        coro.close()
+        raise RuntimeError("발송 루프 안에서는 run_sync를 쓸 수 없습니다. await를 사용하세요.")
+    return submit(coro).result(timeout)
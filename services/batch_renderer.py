@@ -0,0 +1,194 @@
+# -*- coding: utf-8 -*-
+"""
+견적서 대량 생성 (프로세스 풀)
+
+ReportLab 빌드는 CPU 작업이라 요청 스레드에서는 GIL 때문에 한 번에 하나씩만 진행됩니다.
+여러 견적서를 프로세스 풀에 나눠 생성하고, 끝나는 순서대로 ZIP 항목으로 내보냅니다.
+- 워커 프로세스 수: BATCH_RENDER_WORKERS (0이면 요청 스레드에서 순서대로 생성)
+- 워커는 시작할 때 한국어 폰트와 스타일을 미리 로드
+- ZIP은 메모리에 모으지 않고 항목 하나가 끝날 때마다 바로 전송 (마지막에 manifest.json 추가)
+"""
+import json
+import multiprocessing
+import os
+import re
+import threading
+import time
+import zipfile
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
+
+from services.pdf_generator import generate_estimate_bytes, load_korean_font, get_styles, get_table_styles
+
+# Vercel 같은 서버리스 환경은 프로세스 풀(공유 메모리 세마포어)을 쓸 수 없으므로 기본 0
+BATCH_RENDER_WORKERS = int(os.getenv(
+    "BATCH_RENDER_WORKERS",
+    "0" if os.environ.get("VERCEL") else str(os.cpu_count() or 1)
+))
+BATCH_RENDER_MAX_ITEMS = int(os.getenv("BATCH_RENDER_MAX_ITEMS", "500"))
+
+_executor = None
+_executor_lock = threading.Lock()
+
+
+# ===== 워커 =====
+
+def _init_worker():
+    """워커 프로세스 초기화 - 폰트/스타일을 한 번만 로드"""
+    load_korean_font()
+    get_styles()
+    get_table_styles()
+
+
+def _warm_up():
+    return os.getpid()
+
+
+def _render(index, doc_data):
+    """워커에서 견적서 PDF 생성"""
+    return index, generate_estimate_bytes(doc_data)
+
+
+def get_executor():
+    """
+    프로세스 풀 (처음 호출할 때 생성하고 모든 워커를 미리 띄움, 사용할 수 없으면 None)
+
+    요청 처리 스레드가 여러 개인 상태에서 fork하면 잠긴 락이 복사될 수 있어 spawn 방식을 사용합니다.
+    """
+    global _executor
+    if BATCH_RENDER_WORKERS <= 0:
+        return None
+    with _executor_lock:
+        if _executor is None:
+            executor = ProcessPoolExecutor(
+                max_workers=BATCH_RENDER_WORKERS,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_init_worker
+            )
+            try:
+                # 워커 수만큼 빈 작업을 보내 프로세스 시작과 폰트 로드를 미리 끝냄
+                for future in [executor.submit(_warm_up) for _ in range(BATCH_RENDER_WORKERS)]:
+                    future.result()
+            except (OSError, RuntimeError, BrokenProcessPool) as e:
+                # 프로세스를 띄울 수 없는 환경이면 요청 스레드에서 생성
+                print(f"[Batch Renderer] Process pool unavailable, rendering inline: {e}")
+                executor.shutdown(wait=False, cancel_futures=True)
+                return None
+            print(f"[Batch Renderer] {BATCH_RENDER_WORKERS} workers ready")
+            _executor = executor
+        return _executor
+
+
+def shutdown():
+    """프로세스 풀 종료"""
+    global _executor
+    with _executor_lock:
+        if _executor is not None:
+            _executor.shutdown(wait=False, cancel_futures=True)
+            _executor = None
+
+
+def iter_rendered(doc_data_list):
+    """
+    견적서를 생성하고 끝난 순서대로 반환
+
+    Yields:
+        (index, pdf_bytes 또는 None, 오류 메시지 또는 None)
+    """
+    executor = get_executor()
+    if executor is None:
+        for index, doc_data in enumerate(doc_data_list):
+            try:
+                yield index, generate_estimate_bytes(doc_data), None
+            except Exception as e:
+                yield index, None, f"PDF 생성 실패: {str(e)}"
+        return
+
+    futures = {
+        executor.submit(_render, index, doc_data): index
+        for index, doc_data in enumerate(doc_data_list)
+    }
+    try:
+        for future in as_completed(futures):
+            index = futures[future]
+            try:
+                _, pdf_bytes = future.result()
+                yield index, pdf_bytes, None
+            except BrokenProcessPool as e:
+                # 워커가 비정상 종료되면 다음 요청에서 풀을 새로 만들도록 정리
+                shutdown()
+                yield index, None, f"PDF 생성 실패: {str(e)}"
+            except Exception as e:
+                yield index, None, f"PDF 생성 실패: {str(e)}"
+    finally:
+        # 클라이언트가 다운로드를 중단하면 남은 작업 취소
+        for future in futures:
+            future.cancel()
+
+
+# ===== ZIP 스트리밍 =====
+
+class _ChunkWriter:
+    """ZipFile이 쓰는 내용을 모았다가 꺼내는 쓰기 전용 스트림 (seek 불가)"""
+
+    def __init__(self):
+        self._chunks = []
+
+    def write(self, data):
+        self._chunks.append(bytes(data))
+        return len(data)
+
+    def flush(self):
+        pass
+
+    def take(self):
+        data = b"".join(self._chunks)
+        self._chunks = []
+        return data
+
+
+def _safe_name(text):
+    return re.sub(r'[\\/:*?"<>|\s]+', "_", str(text or "")).strip("_") or "document"
+
+
+def estimate_filename(index, doc_data):
+    """ZIP 안의 견적서 파일명 (순번_견적서_회사명.pdf)"""
+    company = doc_data.get("customer", {}).get("company", "")
+    return f"{index + 1:04d}_견적서_{_safe_name(company)}.pdf"
+
+
+def stream_estimate_zip(doc_data_list):
+    """
+    견적서 ZIP 스트림 생성기
+
+    PDF는 이미 압축되어 있으므로 ZIP 항목은 압축 없이(STORED) 저장합니다.
+    manifest.json에 순번별 파일명/오류를 기록합니다.
+
+    Yields:
+        bytes: ZIP 데이터 조각
+    """
+    writer = _ChunkWriter()
+    manifest = []
+    date_time = time.localtime()[:6]
+
+    with zipfile.ZipFile(writer, mode="w", compression=zipfile.ZIP_STORED) as zf:
+        for index, pdf_bytes, error in iter_rendered(doc_data_list):
+            doc_data = doc_data_list[index]
+            entry = {
+                "index": index,
+                "company": doc_data.get("customer", {}).get("company", ""),
+            }
+            if error is None:
+                info = zipfile.ZipInfo(estimate_filename(index, doc_data), date_time=date_time)
+                zf.writestr(info, pdf_bytes)
+                entry.update(success=True, filename=info.filename)
+            else:
+                entry.update(success=False, error=error)
+            manifest.append(entry)
+            yield writer.take()
+
+        manifest.sort(key=lambda e: e["index"])
+        info = zipfile.ZipInfo("manifest.json", date_time=date_time)
+        zf.writestr(info, json.dumps(manifest, ensure_ascii=False, indent=2))
+
+    yield writer.take()
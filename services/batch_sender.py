@@ -0,0 +1,90 @@
+# -*- coding: utf-8 -*-
+"""
+대량 발송 실행기
+
+수신자별 채널 작업(이메일/알림톡)을 발송 이벤트 루프(async_runtime)에서 코루틴으로 실행합니다.
+작업마다 스레드를 잡지 않으므로 수백 건을 동시에 진행할 수 있습니다.
+- 채널별 동시 실행 수: BATCH_EMAIL_CONCURRENCY, BATCH_KAKAO_CONCURRENCY
+  (실제 연결 수는 SMTP_POOL_SIZE, SOLAPI_POOL_SIZE로 한 번 더 제한)
+- 한 수신자의 이메일과 알림톡도 서로 병렬로 실행
+- 채널 작업은 인자 없는 async 함수
+"""
+import asyncio
+import os
+import queue
+
+from services.async_runtime import submit, run_sync
+
+BATCH_MAX_ITEMS = int(os.getenv("BATCH_MAX_ITEMS", "500"))
+CHANNEL_CONCURRENCY = {
+    "email": int(os.getenv("BATCH_EMAIL_CONCURRENCY", "16")),
+    "kakao": int(os.getenv("BATCH_KAKAO_CONCURRENCY", "64")),
+}
+
+# 발송 루프에서만 사용 (루프는 첫 대기 시점에 연결됨)
+_channel_slots = {
+    channel: asyncio.Semaphore(limit)
+    for channel, limit in CHANNEL_CONCURRENCY.items()
+}
+
+
+async def _run_channel(channel, task):
+    """채널 동시 실행 수 제한 안에서 작업 실행 (예외는 실패 결과로 변환)"""
+    slot = _channel_slots.get(channel)
+    try:
+        if slot:
+            async with slot:
+                return await task()
+        return await task()
+    except Exception as e:
+        return {"success": False, "error": f"발송 실패: {str(e)}"}
+
+
+async def send_parallel_async(tasks):
+    """
+    한 수신자의 채널 작업을 병렬 실행
+
+    Args:
+        tasks: {채널: 인자 없는 async 함수}
+
+    Returns:
+        dict: {채널: 결과}
+    """
+    channels = list(tasks)
+    results = await asyncio.gather(*(_run_channel(channel, tasks[channel]) for channel in channels))
+    return dict(zip(channels, results))
+
+
+def send_parallel(tasks):
+    """send_parallel_async 동기 래퍼 (요청 컨텍스트를 넘겨 단계 측정도 요청 Server-Timing에 포함)"""
+    return run_sync(send_parallel_async(tasks))
+
+
+def iter_batch(jobs):
+    """
+    여러 수신자의 작업을 실행하고 끝난 수신자부터 결과 반환
+
+    Args:
+        jobs: [(키, {채널: 인자 없는 async 함수}), ...]
+
+    Yields:
+        (키, {채널: 결과}) - 수신자의 모든 채널이 끝난 순서대로
+    """
+    jobs = list(jobs)
+    done = queue.Queue()
+
+    async def run_job(key, tasks):
+        done.put((key, await send_parallel_async(tasks)))
+
+    async def run_all():
+        await asyncio.gather(*(run_job(key, tasks) for key, tasks in jobs))
+
+    future = submit(run_all())
+    try:
+        for _ in range(len(jobs)):
+            item = done.get()
+            yield item
+        future.result()
+    finally:
+        # 클라이언트가 스트림을 끊으면 남은 발송 취소
+        future.cancel()
@@ -0,0 +1,339 @@
+# -*- coding: utf-8 -*-
+"""
+문서 토큰(doc_id) 바이너리 인코딩
+
+/view/<doc_id>, /pdf/<doc_id> URL에 들어가는 문서 데이터를 짧게 만들기 위한 형식입니다.
+
+형식 (base64url 디코딩 후 첫 바이트로 구분):
+- 0x78 등 (zlib 헤더): 기존 형식 - zlib(JSON)
+- 0x01: 바이너리 팩 (압축 없음)
+- 0x02: 바이너리 팩 + raw deflate (한국어 프리셋 사전 사용)
+- 0x03, 0x04: 0x01, 0x02와 같고 끝에 발행일 추가 (2000-01-01부터의 일수)
+
+바이너리 팩은 필드를 정해진 순서로 나열하고 정수는 varint로 저장합니다.
+합계(total_monthly, discount_amount, monthly_final, final_total)와 아파트별 monthly_total은
+저장하지 않고 디코딩할 때 다시 계산합니다.
+"""
+import zlib
+from datetime import date, datetime
+
+from services.pricing import compute_totals
+
+FORMAT_PACKED = 0x01
+FORMAT_PACKED_DEFLATE = 0x02
+FORMAT_DATED = 0x03
+FORMAT_DATED_DEFLATE = 0x04
+
+# 발행일 (문서 데이터의 date 필드 형식, 저장은 기준일부터의 일수)
+DATE_FORMAT = "%Y년 %m월 %d일"
+DATE_EPOCH = date(2000, 1, 1).toordinal()
+
+# 문서 유형 비트
+DOC_TYPE_BITS = {"proposal": 1, "estimate": 2}
+
+# 고객/담당자 필드 순서 (존재 여부는 비트마스크로 저장)
+CUSTOMER_FIELDS = ("company", "name", "email", "phone")
+MANAGER_FIELDS = ("name", "position", "phone", "email")
+
+# 할인율 저장 단위 (0.05 → 500)
+RATE_SCALE = 10000
+
+# 기존 JSON 형식 토큰의 필드 타입 (check_doc_data)
+NUMBER_FIELDS = ("total_monthly", "discount_rate", "discount_amount", "monthly_final", "months", "final_total")
+TEXT_FIELDS = ("discount_label", "date")
+APARTMENT_NUMBER_FIELDS = ("monitor_count", "unit_price", "monthly_total")
+
+# 압축용 프리셋 사전 (자주 나오는 문자열일수록 뒤쪽에 배치)
+PRESET_DICTIONARY = "".join([
+    "@hanmail.net@daum.net@kakao.com@gmail.com@naver.com",
+    "주식회사(주)대표이사부장차장과장대리사원실장본부장",
+    "힐스테이트푸르지오아이파크롯데캐슬e편한세상더샵자이래미안",
+    "마을단지타운빌리지오피스텔주상복합",
+    "할인 없음5% 할인10% 할인15% 할인",
+    "010-01012아파트",
+]).encode("utf-8")
+
+
+class DocCodecError(ValueError):
+    """잘못된 문서 토큰"""
+
+
+# ===== varint =====
+
+def _write_uvarint(out, value):
+    while True:
+        byte = value & 0x7F
+        value >>= 7
+        if value:
+            out.append(byte | 0x80)
+        else:
+            out.append(byte)
+            return
+
+
+def _write_varint(out, value):
+    # zigzag: 음수도 짧게 저장 (0, -1, 1, -2, ... → 0, 1, 2, 3, ...)
+    _write_uvarint(out, -2 * value - 1 if value < 0 else 2 * value)
+
+
+def _write_str(out, text):
+    raw = text.encode("utf-8")
+    _write_uvarint(out, len(raw))
+    out.extend(raw)
+
+
+class _Reader:
+    def __init__(self, data):
+        self.data = data
+        self.pos = 0
+
+    def uvarint(self):
+        result = 0
+        shift = 0
+        while True:
+            if self.pos >= len(self.data):
+                raise DocCodecError("토큰이 잘렸습니다.")
+            byte = self.data[self.pos]
+            self.pos += 1
+            result |= (byte & 0x7F) << shift
+            if not byte & 0x80:
+                return result
+            shift += 7
+            if shift > 63:
+                raise DocCodecError("정수 값이 너무 큽니다.")
+
+    def varint(self):
+        value = self.uvarint()
+        return (value >> 1) ^ -(value & 1)
+
+    def str(self):
+        length = self.uvarint()
+        end = self.pos + length
+        if end > len(self.data):
+            raise DocCodecError("토큰이 잘렸습니다.")
+        raw = self.data[self.pos:end]
+        self.pos = end
+        try:
+            return raw.decode("utf-8")
+        except UnicodeDecodeError:
+            raise DocCodecError("문자열이 올바른 UTF-8이 아닙니다.")
+
+
+# ===== 기존 JSON 형식 검사 =====
+
+def _is_number(value):
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+def _is_scalar(value):
+    return value is None or isinstance(value, str) or _is_number(value)
+
+
+def check_doc_data(doc_data, doc_types):
+    """
+    기존 JSON 형식 토큰의 문서 데이터/문서 유형 타입 검사
+
+    Raises:
+        DocCodecError: 필드 타입이 맞지 않는 경우
+    """
+    if not isinstance(doc_data, dict):
+        raise DocCodecError("문서 데이터 형식이 잘못되었습니다.")
+    if not isinstance(doc_types, list) or not all(isinstance(t, str) for t in doc_types):
+        raise DocCodecError("문서 유형 형식이 잘못되었습니다.")
+
+    for field in ("customer", "manager"):
+        values = doc_data.get(field, {})
+        if not isinstance(values, dict) or not all(_is_scalar(v) for v in values.values()):
+            raise DocCodecError(f"{field} 형식이 잘못되었습니다.")
+    for field in NUMBER_FIELDS:
+        if field in doc_data and not _is_number(doc_data[field]):
+            raise DocCodecError(f"{field} 값이 숫자가 아닙니다.")
+    for field in TEXT_FIELDS:
+        if field in doc_data and not isinstance(doc_data[field], str):
+            raise DocCodecError(f"{field} 값이 문자열이 아닙니다.")
+
+    apartments = doc_data.get("apartments", [])
+    if not isinstance(apartments, list):
+        raise DocCodecError("apartments 형식이 잘못되었습니다.")
+    for apt in apartments:
+        if (
+            not isinstance(apt, dict)
+            or not isinstance(apt.get("apartment_name", ""), str)
+            or not all(_is_number(apt[f]) for f in APARTMENT_NUMBER_FIELDS if f in apt)
+        ):
+            raise DocCodecError("apartments 항목 형식이 잘못되었습니다.")
+
+
+# ===== 팩/언팩 =====
+
+def _pack_fields(out, values, fields):
+    mask = 0
+    for bit, field in enumerate(fields):
+        if field in values:
+            mask |= 1 << bit
+    _write_uvarint(out, mask)
+    for field in fields:
+        if field in values:
+            _write_str(out, values[field])
+
+
+def _unpack_fields(reader, fields):
+    mask = reader.uvarint()
+    values = {}
+    for bit, field in enumerate(fields):
+        if mask & (1 << bit):
+            values[field] = reader.str()
+    return values
+
+
+def pack(doc_data, doc_types):
+    """문서 데이터를 바이너리 팩으로 변환 (형식에 맞지 않으면 예외)"""
+    out = bytearray()
+
+    type_mask = 0
+    for doc_type in doc_types:
+        type_mask |= DOC_TYPE_BITS[doc_type]
+    _write_uvarint(out, type_mask)
+
+    _pack_fields(out, doc_data.get("customer", {}), CUSTOMER_FIELDS)
+    _pack_fields(out, doc_data.get("manager", {}), MANAGER_FIELDS)
+
+    _write_str(out, doc_data.get("discount_label", "할인 없음"))
+    _write_varint(out, round(doc_data.get("discount_rate", 0) * RATE_SCALE))
+    _write_varint(out, doc_data.get("months", 3))
+
+    apartments = doc_data.get("apartments", [])
+    _write_uvarint(out, len(apartments))
+    for apt in apartments:
+        _write_str(out, apt.get("apartment_name", ""))
+        _write_varint(out, apt.get("monitor_count", 0))
+        _write_varint(out, apt.get("unit_price", 0))
+
+    # 발행일 (있을 때만, 형식 바이트로 구분)
+    if "date" in doc_data:
+        days = datetime.strptime(doc_data["date"], DATE_FORMAT).date().toordinal() - DATE_EPOCH
+        if days < 0:
+            raise ValueError("기준일 이전 발행일은 저장할 수 없습니다.")
+        _write_uvarint(out, days)
+
+    return bytes(out)
+
+
+def unpack(data, dated=False):
+    """
+    바이너리 팩을 문서 데이터로 복원
+
+    Args:
+        data: 바이너리 팩
+        dated: 끝에 발행일이 있는 형식(0x03, 0x04) 여부
+
+    Returns:
+        tuple: (doc_data, doc_types)
+    """
+    reader = _Reader(data)
+
+    type_mask = reader.uvarint()
+    doc_types = [name for name, bit in DOC_TYPE_BITS.items() if type_mask & bit]
+
+    customer = _unpack_fields(reader, CUSTOMER_FIELDS)
+    manager = _unpack_fields(reader, MANAGER_FIELDS)
+
+    discount_label = reader.str()
+    rate_units = reader.varint()
+    discount_rate = rate_units / RATE_SCALE if rate_units else 0
+    months = reader.varint()
+
+    apartments = []
+    for _ in range(reader.uvarint()):
+        name = reader.str()
+        monitor_count = reader.varint()
+        unit_price = reader.varint()
+        apartments.append({
+            "apartment_name": name,
+            "monitor_count": monitor_count,
+            "unit_price": unit_price,
+            "monthly_total": monitor_count * unit_price,
+        })
+
+    issued = None
+    if dated:
+        try:
+            issued = date.fromordinal(reader.uvarint() + DATE_EPOCH).strftime(DATE_FORMAT)
+        except (ValueError, OverflowError):
+            raise DocCodecError("잘못된 발행일입니다.")
+
+    if reader.pos != len(data):
+        raise DocCodecError("토큰 뒤에 알 수 없는 데이터가 있습니다.")
+
+    totals = compute_totals(sum(apt["monthly_total"] for apt in apartments), discount_rate, months)
+    doc_data = {
+        "customer": customer,
+        "apartments": apartments,
+        "total_monthly": totals["total_monthly"],
+        "discount_label": discount_label,
+        "discount_rate": discount_rate,
+        "discount_amount": totals["discount_amount"],
+        "monthly_final": totals["monthly_final"],
+        "months": months,
+        "final_total": totals["final_total"],
+        "manager": manager,
+    }
+    if issued is not None:
+        doc_data["date"] = issued
+    return doc_data, doc_types
+
+
+def encode_packed(doc_data, doc_types):
+    """
+    바이너리 토큰 bytes 생성 (형식 바이트 포함)
+
+    팩 → 언팩 결과가 원본과 같을 때만 사용하고, 아니면 None을 반환합니다.
+    (알 수 없는 필드, 정수가 아닌 값, 계산 필드 불일치 등은 기존 JSON 형식으로 처리)
+    문서 유형은 포함 여부만 쓰이므로 순서는 비교하지 않습니다.
+    """
+    try:
+        dated = "date" in doc_data
+        packed = pack(doc_data, doc_types)
+        decoded_data, decoded_types = unpack(packed, dated)
+        if decoded_data != doc_data or sorted(decoded_types) != sorted(doc_types):
+            return None
+    except (KeyError, TypeError, ValueError, AttributeError, OverflowError):
+        return None
+
+    compressor = zlib.compressobj(9, zlib.DEFLATED, -15, zdict=PRESET_DICTIONARY)
+    deflated = compressor.compress(packed) + compressor.flush()
+    if len(deflated) < len(packed):
+        return bytes([FORMAT_DATED_DEFLATE if dated else FORMAT_PACKED_DEFLATE]) + deflated
+    return bytes([FORMAT_DATED if dated else FORMAT_PACKED]) + packed
+
+
+def decode_packed(raw, max_size=None):
+    """
+    바이너리 토큰 bytes 해석
+
+    Args:
+        raw: 형식 바이트로 시작하는 토큰 bytes
+        max_size: 압축 해제 크기 제한 (바이트)
+
+    Returns:
+        tuple: (doc_data, doc_types)
+    """
+    fmt, body = raw[0], raw[1:]
+    dated = fmt in (FORMAT_DATED, FORMAT_DATED_DEFLATE)
+    if fmt in (FORMAT_PACKED, FORMAT_DATED):
+        return unpack(body, dated)
+    if fmt in (FORMAT_PACKED_DEFLATE, FORMAT_DATED_DEFLATE):
+        decompressor = zlib.decompressobj(-15, zdict=PRESET_DICTIONARY)
+        try:
+            packed = decompressor.decompress(body, max_size or 0)
+        except zlib.error as e:
+            raise DocCodecError(f"압축 해제 실패: {e}")
+        if decompressor.unconsumed_tail:
+            raise DocCodecError("토큰 크기 제한을 넘었습니다.")
+        return unpack(packed, dated)
+    raise DocCodecError(f"알 수 없는 토큰 형식: {fmt}")
+
+
+def is_packed(raw):
+    """바이너리 토큰 여부 (기존 zlib 토큰은 0x?8 헤더로 시작)"""
+    return bool(raw) and raw[0] in (FORMAT_PACKED, FORMAT_PACKED_DEFLATE, FORMAT_DATED, FORMAT_DATED_DEFLATE)
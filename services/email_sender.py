@@ -1,10 +1,18 @@
 # -*- coding: utf-8 -*-
-import smtplib
+import asyncio
 from email.mime.multipart import MIMEMultipart
 from email.mime.text import MIMEText
 from email.mime.application import MIMEApplication
 import os
+import copy
+import threading
+from collections import OrderedDict
+import aiosmtplib
 from dotenv import load_dotenv
+from services.smtp_pool import SmtpConnectionPool
+from services.artifact_store import artifact_store
+from services.async_runtime import run_sync
+from services.metrics import stage, register_stats
 
 load_dotenv()
 
@@ -12,15 +20,106 @@ load_dotenv()
 SMTP_SERVER = os.getenv("SMTP_SERVER", "smtp.gmail.com")
 SMTP_PORT = int(os.getenv("SMTP_PORT", "587"))
 SMTP_USE_SSL = os.getenv("SMTP_USE_SSL", "false").lower() == "true"
+SMTP_USE_STARTTLS = os.getenv("SMTP_USE_STARTTLS", "true").lower() == "true"
 SMTP_USERNAME = os.getenv("SMTP_USERNAME", "")
 SMTP_PASSWORD = os.getenv("SMTP_PASSWORD", "")
 SENDER_NAME = os.getenv("SENDER_NAME", "위플")
 SENDER_EMAIL = os.getenv("SENDER_EMAIL", "")
+SMTP_POOL_SIZE = int(os.getenv("SMTP_POOL_SIZE", "4"))
+SMTP_POOL_MAX_IDLE = int(os.getenv("SMTP_POOL_MAX_IDLE", "60"))
+SMTP_LOCAL_HOSTNAME = os.getenv("SMTP_LOCAL_HOSTNAME", "")  # EHLO 호스트 이름 (비어 있으면 FQDN)
+ATTACHMENT_CACHE_MAX_BYTES = int(os.getenv("ATTACHMENT_CACHE_MAX_BYTES", str(32 * 1024 * 1024)))
+
+# SMTP 연결 풀 (send_email 및 대량 발송에서 공유)
+smtp_pool = SmtpConnectionPool(
+    SMTP_SERVER,
+    SMTP_PORT,
+    username=SMTP_USERNAME,
+    password=SMTP_PASSWORD,
+    use_ssl=SMTP_USE_SSL,
+    use_starttls=SMTP_USE_STARTTLS,
+    max_size=SMTP_POOL_SIZE,
+    max_idle=SMTP_POOL_MAX_IDLE,
+    local_hostname=SMTP_LOCAL_HOSTNAME,
+)
+
+
+class AttachmentCache:
+    """
+    MIME 인코딩된 첨부파일 캐시
 
+    제안서 PDF처럼 매번 같은 파일을 첨부할 때 파일 읽기와 base64 인코딩을 한 번만 하도록
+    (경로, 수정시각, 크기) 기준으로 인코딩된 MIME 파트를 보관합니다. 파일이 바뀌면 다시 인코딩합니다.
+    총 크기는 인코딩된 바이트 기준 LRU로 제한합니다.
+    수신자별 견적서(산출물 저장소 파일)는 한 번 쓰고 끝나므로 넣지 않습니다 (_build_message).
+    """
 
-def send_email(to_email, to_name, subject, pdf_paths=None, body=None):
+    def __init__(self, max_bytes=ATTACHMENT_CACHE_MAX_BYTES):
+        self.max_bytes = max_bytes
+        self._items = OrderedDict()  # key → (MIME 파트, 크기)
+        self._size = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get_part(self, path):
+        """첨부용 MIME 파트 반환 (메시지마다 붙일 수 있는 복사본)"""
+        st = os.stat(path)
+        key = (os.path.abspath(path), st.st_mtime_ns, st.st_size)
+
+        with self._lock:
+            cached = self._items.get(key)
+            if cached is not None:
+                self._items.move_to_end(key)
+                self.hits += 1
+                # 인코딩된 payload 문자열은 공유하고 헤더만 복사
+                return copy.deepcopy(cached[0])
+            self.misses += 1
+
+        part = _encode_attachment(path)
+        size = len(part.get_payload())
+        if size <= self.max_bytes:
+            with self._lock:
+                self._items[key] = (part, size)
+                self._size += size
+                while self._size > self.max_bytes:
+                    _, (_, old_size) = self._items.popitem(last=False)
+                    self._size -= old_size
+        return copy.deepcopy(part)
+
+    def stats(self):
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "entries": len(self._items),
+                "bytes": self._size,
+            }
+
+
+def _encode_attachment(path):
+    """파일을 읽어 base64 인코딩된 PDF 첨부 파트 생성"""
+    with open(path, 'rb') as f:
+        pdf_attachment = MIMEApplication(f.read(), _subtype='pdf')
+    pdf_filename = os.path.basename(path)
+    pdf_attachment.add_header(
+        'Content-Disposition',
+        'attachment',
+        filename=('utf-8', '', pdf_filename)
+    )
+    return pdf_attachment
+
+
+# 첨부파일 캐시 (send_email 및 대량 발송에서 공유)
+attachment_cache = AttachmentCache()
+
+register_stats("smtp_pool", "SMTP 연결 풀 상태", lambda: smtp_pool.stats())
+register_stats("attachment_cache", "첨부파일 MIME 캐시 상태", attachment_cache.stats)
+
+
+async def send_email_async(to_email, to_name, subject, pdf_paths=None, body=None):
     """
-    이메일 발송
+    이메일 발송 (발송 이벤트 루프에서 실행)
 
     Args:
         to_email: 수신자 이메일
@@ -45,15 +144,41 @@ def send_email(to_email, to_name, subject, pdf_paths=None, body=None):
         pdf_paths = []
 
     try:
-        # 메시지 생성
-        msg = MIMEMultipart()
-        msg['From'] = f"{SENDER_NAME} <{SENDER_EMAIL or SMTP_USERNAME}>"
-        msg['To'] = to_email
-        msg['Subject'] = subject
-
-        # 본문
-        if body is None:
-            body = f"""
+        # 메시지 생성 (파일 읽기/인코딩은 루프를 막지 않도록 스레드에서)
+        msg = await asyncio.to_thread(_build_message, to_email, to_name, subject, pdf_paths, body)
+
+        # 발송 (풀에서 로그인된 SSL/TLS 연결 재사용)
+        with stage("smtp_send"):
+            await smtp_pool.send_message(msg)
+
+        return {"success": True, "error": None}
+
+    except aiosmtplib.SMTPAuthenticationError as e:
+        return {
+            "success": False,
+            "error": f"이메일 인증 실패: {str(e)}. 사용자: {SMTP_USERNAME}"
+        }
+    except aiosmtplib.SMTPException as e:
+        return {"success": False, "error": f"SMTP 오류: {str(e)}"}
+    except Exception as e:
+        return {"success": False, "error": f"발송 실패: {str(e) or type(e).__name__}"}
+
+
+def send_email(to_email, to_name, subject, pdf_paths=None, body=None):
+    """이메일 발송 (기존 동기 호출용 래퍼, 결과 형식은 send_email_async와 같음)"""
+    return run_sync(send_email_async(to_email, to_name, subject, pdf_paths, body))
+
+
+def _build_message(to_email, to_name, subject, pdf_paths, body):
+    """본문과 PDF 첨부가 들어간 MIME 메시지 생성"""
+    msg = MIMEMultipart()
+    msg['From'] = f"{SENDER_NAME} <{SENDER_EMAIL or SMTP_USERNAME}>"
+    msg['To'] = to_email
+    msg['Subject'] = subject
+
+    # 본문
+    if body is None:
+        body = f"""
 안녕하세요, {to_name}님.
 
 요청하신 문서를 첨부파일로 보내드립니다.
@@ -63,44 +188,18 @@ def send_email(to_email, to_name, subject, pdf_paths=None, body=None):
 
 ---
 {SENDER_NAME}
-            """.strip()
+        """.strip()
 
-        msg.attach(MIMEText(body, 'plain', 'utf-8'))
+    msg.attach(MIMEText(body, 'plain', 'utf-8'))
 
-        # PDF 첨부 (여러 개 가능)
+    # PDF 첨부 (여러 개 가능)
+    with stage("email_attach"):
         for pdf_path in pdf_paths:
-            if pdf_path and os.path.exists(pdf_path):
-                with open(pdf_path, 'rb') as f:
-                    pdf_attachment = MIMEApplication(f.read(), _subtype='pdf')
-                    pdf_filename = os.path.basename(pdf_path)
-                    pdf_attachment.add_header(
-                        'Content-Disposition',
-                        'attachment',
-                        filename=('utf-8', '', pdf_filename)
-                    )
-                    msg.attach(pdf_attachment)
-
-        # 발송 (SSL 또는 TLS 사용)
-        if SMTP_USE_SSL:
-            # SSL 연결 (포트 465)
-            with smtplib.SMTP_SSL(SMTP_SERVER, SMTP_PORT) as server:
-                server.login(SMTP_USERNAME, SMTP_PASSWORD)
-                server.send_message(msg)
-        else:
-            # TLS 연결 (포트 587)
-            with smtplib.SMTP(SMTP_SERVER, SMTP_PORT) as server:
-                server.starttls()
-                server.login(SMTP_USERNAME, SMTP_PASSWORD)
-                server.send_message(msg)
-
-        return {"success": True, "error": None}
-
-    except smtplib.SMTPAuthenticationError as e:
-        return {
-            "success": False,
-            "error": f"이메일 인증 실패: {str(e)}. 사용자: {SMTP_USERNAME}"
-        }
-    except smtplib.SMTPException as e:
-        return {"success": False, "error": f"SMTP 오류: {str(e)}"}
-    except Exception as e:
-        return {"success": False, "error": f"발송 실패: {str(e)}"}
+            if not pdf_path or not os.path.exists(pdf_path):
+                continue
+            if artifact_store.owns(pdf_path):
+                # 수신자별 견적서는 재사용되지 않고, 조회할 때마다 수정시각이 바뀌어 캐시 키도 매번 달라짐
+                msg.attach(_encode_attachment(pdf_path))
+            else:
+                msg.attach(attachment_cache.get_part(pdf_path))
+    return msg
@@ -1,3 +0,0 @@
-# -*- coding: utf-8 -*-
-# Spoqa Han Sans Neo Regular 폰트 Base64 인코딩 데이터
-KOREAN_FONT_BASE64 = """AAEAAAAMAIAAAwBARFNJRwAAAAEAB85kAAAACEdTVUIAAQAAAAfOWAAAAApPUy8y19IseAAAAUgAAABgY21hcHPMFm8AADFEAABEUGdseWY66MJrAAB1lAAGmVRoZWFkHDlbjgAAAMwAAAA2aGhlYQeJDpUAAAEEAAAAJGhtdHhOlA6UAAABqAAAL5xsb2NhJO+6KAAHDugAAC+obWF4cAwTAQ8AAAEoAAAAIG5hbWWqAzJqAAc+kAAAHKZwb3N0ZiOvgwAHWzgAAHMgAAEAAAABGZmlshhgXw889QADA+gAAAAA3Ir1wAAAAADc2giO/9T/AwPoA78AAQAHAAIAAQAAAAAAAQAAA8r+5gAAA+j/1P/hA+gAAQAAAAAAAAAAAAAAAAAAC+UAAQAAC+kBDwApAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAEA44BkAAFAAACigJYAAAASwKKAlgAAAFeADIBRQAAAgsFAAAAAAAAAIAAACMR0XT6AAAAEAAAAABHT09HACAAIP/mA8r+5gAABEwBNkAoAAEAAAAAAh8C3QAAACAAAAPoAZIA4AAAASUAZAHbAFoCKwAoAlcAJwOZACYCkgAfARYAWgFSAFwBUgArAdMAQAIrACYAvQAUAa4AMgDmACoBiAALAlQAHwJUAHACVAA1AlQAMAJUABYCVAA9AlQANAJUAEUCVAAsAlQANQDtAEkA7QAlAfcAJgIrACYB+AA/AdgAKAOyADgCXwADApEAZAJ+ADoCrwBkAkwAZAIoAGQCsQA6AtgAZAElAGQCGAAjAoYAZAIeAGQDLABkAtIAZALmADoCeABkAuYAOgJ7AGQCVQAvAlcAHwLRAGECPwABA24AGQI9ABECE///AlsAMgFSAGkBiAAPAVIAIgHSACwCLwANAl4AkAI0ADoCagBcAf0AMwJsADUCKgAzAUUAIQIzADICXwBcAPEASwEC/9QCKABcAREAXAOeAFwCYwBcAl4AMwJsAFwCbAA1AYQAXAHUAB8BeQAbAl8AVQIJAA0DIgAbAfIADwIJAA4B2gAjAVIAJgENAGcBUgAiAisAKAFDAHICKwAeAlgACAPoAQsCXgCMAd8AMgFyAC0D6ACJAZoALAGaACgCXgDwA+gA8gIIANICXgDNAZoAYgHfACcDaABHA4cARwN5ACYB2gA5A+gAsgPoAIkD6ADqA+gBlQDxAD8A8QBGAZIAPwGSAEYD6AEFA+gBBQPoAOED6ACOA+gAIgEWAFsB2wBbAS4AMQEuACYDnQBzA3gAIAPoAC8D6ABTA+UAQgPoABoCxwADA+gAxwPoAcQD6AExA+gAnQPoAKQD6ADVA+gAQQPoAAgD6AAEA+gApQPoAOUD6AG0A+gBKgPoAKAD6ACvA+gA/APoAHID6AANA+gABgPoALoD6AEJA+gAIwPoAQsD6AAoA+gBCwPoACMD6AELA+gAqwPoAJYD6ACWA+gAqwPoACgD6AAYA+gAcQPoANkD6ADDA+gAlwPoAHwD6ACAA+gA0APoAMkD6AAiA+gAIgPoACID6ABmA+gAcQPoAHED6ACyA+gAsgPoATwD6AB6A+gBPAPoAKMD6ACjA+gBrAPoACID6ACJA+gAiQPoAIkD6ABmA+gAfgPoADYD6AA3A+gAfAPoAIAD6AB8A+gAgAPoAIID6ABpA+gAGAPoACID6AAiA+gAIgPoACID6AAiA+gAIgPoACID6AAiA+gAIgPoACID6AAiA+gAIgPoACID6AAiA+gAIgPoACAD6AAgA+gAIAPoACAD6AAgA+gAIAPoACAD6AAgA+gAIAPoACAD6AAgA+gAIAPoACAD6AAgA+gAIAPoACAD6AAgA+gAIAPoACAD6AAgA+gAIAPoACAD6AAgA+gAIAPoACAD6AAgA+gAIAPoACAD6AAgA+gAIAPoACAD6AAgA+gAIAPoACAD6AAgA+gAIAPoACAD6AAgA+gAIAPoACAD6AAgA+gAIgPoACID6AAiA+gAIgPoACID6AAiA+gAIgPoACID6AAiA+gAIgPoACID6AAiA+gAIgPoACID6AAiA+gAIgPoACID6AAiA+gAIgPoACID6AAiA+gAIgPoACID6AAiA+gAIgPoACID6AAAA+gAZAPoAGQD6ABkA+gAZAPoAGQD6ABkA+gAZAPoAGQD6ABkA+gAHgPoAB4D6AB6A+gAegPoAB4D6AAeA+gAQAPoAEAD6AAMA+gADAPoAAwD6AAyA+gAMgPoADID6AA8A+gAPAPoACYD6AAlA+gAKAPoABoD6AAcA+gAIQPoALQD6AB0A+gAUwPoAE4D6ABAA+gAUAPoAE8D6AA9A+gATQPoARoD6AD6A+gAGAPoAVwD6AAAA+gANAPoACoD6ADkAeAAPAHgADwB4AAXAeAAFwHgAIYB4AAeAeAAUwHgAB8D6AKaA+gAIgPoAGQD6ALJA+gAJwOYALYDmACNA5gAhwOYALoDmACgA5gAnwOYALwDmACfA5gAsgOYAJcDmACVA5gAlQOYAJQDmACWA5gAlgOYAJgDmAC4A5gAugOYAKIDmACiA5gAkwOYAGYDmAC0A5gApgOYAF4DmACgA5gArAOYALsDmACiA5gAqAOYAYkDmAE4A5gBbQOYATkDmAErA5gA6gOYASwDmADmA5gAOAOYADwDmABCA5gAZQOYAD4DmAA9A5gATwOYAEkDmABgA5gAOAOYADgDmABPA5gBqAOYAccDmAE/A+gAIAPoACAD6AAgA+gAIAPoACAD6AAgA+gAIAPoACAD6AAgA+gAIAPoACAD6AAgA+gAIAPoACAD6AAgA+gAIAPoACAD6AAgA+gAIAPoACAD6AAgA+gAIAPoACAD6AAgA+gAIAPoACAD6AAgA+gAIAPoACAD6AAiA+gAIgPoACID6AAiA+gAIgPoACID6AAiA+gAIgPoACID6AAiA+gAIgPoACID6AAiA+gAIgPoACID6AAiA+gAIgPoACID6AAiA+gAIgPoACID6AAiA+gAIgPoACID6AAiA+gAIgPoACID6AAiA+gAIgPoADkD6AAyA+gARQOYADsDmAAzA5gANwOYADUDmAA2A5gANwOYADYDmAA2A5gANAOYADYDmAA3A5gANwOYADYDmAA3A5gANwOYADgDmAA4A5gANgOYADgDmAA1A5gAOgOYADsDmAA9A5gAPQOYAD0DmAA9A5gAOwOYADsDmAA5A5gAOwOYADMDmAA3A5gANgOYADcDmAA3A5gANQOYADsDmAA9A5gAPQOYADQDmABBA5gAQwOYAD8DmABCA5gAQgOYAD8DmABAA5gARAOYAD8DmABAA5gAQwOYAEEDmABBA5gAQQOYADYDmAA6A5gAPwOYAEADmAA+A5gAPAOYAD0DmAA7A5gANQOYAEIDmABCA5gARAOYAEEDmABDA5gAQwOYAEADmABAA5gARAOYAEADmABBA5gAQAOYADQDmAA5A5gAPwOYAD0DmAA7A5gANgOYADcDmAA2A5gANgOYADcDmAA3A5gANwOYADcDmAA3A5gANgOYADcDmAA3A5gANwOYACwDmAAvA5gALwOYADADmAAwA5gALwOYAC8DmAAvA5gALwOYAC8DmAAqA5gALAOYACwDmAAsA5gAKwOYACwDmAAsA5gAOAOYADcDmAA1A5gANgOYADcDmAA3A5gANwOYADcDmAA1A5gANgOYADcDmAA3A5gANgOYADYDmAA3A5gANgOYADUDmAA0A5gANAOYADUDmAA1A5gANQOYADUDmAA0A5gANAOYADUDmAA1A5gANQOYAC0DmAAtA5gALgOYADADmAAtA5gAMAOYACoDmAAsA5gALAOYADADmAAvA5gAMwOYADYDmAAwA5gAMAOYADYDmAA2A5gANgOYADUDmAA1A5gANAOYADYDmAA1A5gANAOYADQDmAA1A5gANQOYADUDmAA1A5gANAOYADQDmAA2A5gANQOYADUDmAA4A5gAQQOYAEADmABEA5gAPwOYAEQDmABEA5gAPwOYAEIDmABFA5gAPwOYAD4DmABCA5gARgOYADIDmAA6A5gAOgOYADkDmAA5A5gAOgOYADoDmAA6A5gAOwOYAD0DmAA6A5gAOQOYADcDmAA2A5gANwOYADkDmAA6A5gAOQOYADoDmAA7A5gAOwOYADoDmAAyA5gAOgOYADADmAA5A5gANAOYADIDmAA4A5gAOAOYAD4DmAA9A5gAOAOYADsDmAA6A5gAOAOYADgDmAA6A5gAMwOYADcDmAA8A5gAOQOYADsDmAA6A5gAOwOYAC0DmAA+A5gAPQOYADoDmAA4A5gAOAOYADsDmAA3A5gANQOYADcDmAA2A5gANwOYADYDmAA2A5gANgOYADYDmAA3A5gANwOYADcDmAA3A5gANgOYAC4DmAAvA5gALwOYAC8DmAAvA5gALAOYAC4DmAAuA5gALgOYADcDmAA4A5gANAOYADgDmAA4A5gAOAOYADUDmAA0A5gANQOYADQDmAA1A5gAMwOYADQDmAA0A5gANQOYADUDmAA1A5gAKAOYAC4DmAAwA5gAMAOYADADmAAiA5gAKwOYACsDmAArA5gAKwOYACsDmAArA5gALQOYADMDmAA0A5gANAOYADQDmAA0A5gALQOYAC4DmAA0A5gANQOYADQDmAA1A5gANQOYADUDmAA0A5gANAOYADQDmAA1A5gANQOYADQDmAA1A5gAPwOYAEMDmAA+A5gAPwOYAEIDmABAA5gAQQOYAFkDmABhA5gAYQOYAGEDmABhA5gAYQOYAGEDmABhA5gAYQOYAGEDmABhA5gAWgOYAGEDmABhA5gAYQOYAGEDmABhA5gAYQOYAGEDmABhA5gAYQOYAGIDmABhA5gAYgOYAGEDmABiA5gAYgOYAFkDmABhA5gAYQOYAFkDmABhA5gAYQOYAFoDmABhA5gAYQOYAF4DmABmA5gAaQOYAGkDmABpA5gAXQOYAGkDmABpA5gAaQOYAGkDmABpA5gAaQOYAGcDmABpA5gAXQOYAGgDmABhA5gAZQOYAGUDmABhA5gAZQOYAGUDmABlA5gAZQOYAGUDmABlA5gAZgOYAGkDmABpA5gAXQOYAGkDmABrA5gAawOYAGcDmABrA5gAawOYAGEDmABlA5gAZQOYADQDmAA1A5gANgOYADUDmAAtA5gANQOYADYDmAA2A5gANgOYADYDmAAtA5gANgOYADUDmAApA5gALwOYADEDmAAyA5gAKwOYACsDmAA5A5gANwOYADYDmAA2A5gANQOYADYDmAA2A5gANQOYADUDmAA2A5gANQOYAC0DmAA2A5gANgOYADYDmAA0A5gANQOYADUDmAA2A5gANQOYAC0DmAA1A5gANgOYADUDmAA2A5gALQOYAC0DmAAwA5gAKgOYADEDmAA2A5gANwOYADYDmAA4A5gANQOYADYDmAAtA5gANAOYADUDmAA1A5gANgOYADQDmAA1A5gANAOYAC4DmAA0A5gANQOYADUDmAA1A5gANgOYADYDmAA2A5gANgOYADYDmAA2A5gAOAOYADYDmAA3A5gAOgOYADYDmABtA5gAbAOYAGwDmABiA5gAbAOYAGwDmABsA5gAbAOYAGwDmABsA5gAbAOYAFsDmABeA5gAXgOYAF4DmABeA5gAXQOYAF0DmABdA5gAXQOYAF0DmABeA5gAXgOYAF0DmABaA5gAXQOYAF4DmABdA5gAVQOYAF0DmABVA5gAXQOYAF0DmABdA5gAXQOYAF0DmABdA5gAXQOYAF0DmABbA5gAVQOYAGIDmABmA5gAZgOYAGgDmABoA5gAZgOYAGcDmABoA5gAZgOYAGYDmABmA5gAZgOYAGYDmABoA5gAVgOYAGADmABgA5gAYAOYAGADmABgA5gAYAOYAGADmABgA5gAZQOYAGcDmABmA5gAZgOYAGgDmABWA5gAYAOYADQDmAA1A5gANQOYADUDmAA0A5gANQOYADUDmAA1A5gANQOYADUDmAA1A5gANgOYADUDmAArA5gAMAOYADEDmAAqA5gAMAOYADsDmAA5A5gAOgOYADsDmAA4A5gAOQOYADkDmAA0A5gANQOYADUDmAA1A5gALgOYADQDmAAuA5gANgOYADUDmAA0A5gANQOYAC8DmAAwA5gAKQOYADgDmAAwA5gAMAOYADcDmAA5A5gAOAOYADkDmAA5A5gANQOYADUDmAA0A5gANgOYADYDmAA0A5gANQOYADUDmAA1A5gANQOYADYDmAA2A5gANQOYADUDmAA1A5gAOAOYAG8DmABrA5gAawOYAGsDmABrA5gAawOYAGsDmABrA5gAYQOYAGsDmABrA5gAXwOYAFADmABWA5gAVgOYAEoDmABWA5gAVgOYAFYDmABWA5gAVgOYAFYDmABWA5gAUAOYAFEDmABRA5gAUQOYAFEDmABRA5gAUQOYAFEDmABRA5gAUAOYAE0DmABNA5gATQOYAE0DmABNA5gATQOYAE0DmABNA5gATQOYAE0DmABNA5gAUAOYAFEDmABRA5gAUQOYAFEDmABRA5gAUQOYAFEDmABRA5gAUgOYAE0DmAA1A5gANAOYADQDmAA0A5gALgOYAC4DmAAuA5gANQOYACsDmAAyA5gAMQOYACsDmAArA5gALAOYADQDmAA4A5gANQOYADQDmAA0A5gANAOYADQDmAAuA5gANQOYADYDmAA0A5gAKAOYAC4DmAA1A5gAOQOYADoDmAA5A5gAOgOYADUDmAA0A5gANAOYADUDmAA0A5gALgOYADUDmAA1A5gANAOYAC8DmAA1A5gAOAOYADQDmAA2A5gAOQOYADkDmABbA5gAVwOYAFcDmABXA5gAVwOYAFcDmABXA5gAVwOYAFoDmABaA5gAUgOYAFoDmABaA5gAWgOYAFoDmABYA5gAWgOYAFoDmABaA5gAWgOYAFADmABcA5gAXAOYAFoDmABcA5gAXAOYAFwDmABcA5gAXAOYAFwDmABaA5gAVwOYAFoDmABaA5gAWgOYAFoDmABaA5gAVAOYAFgDmABYA5gATwOYAE8DmABYA5gAWAOYAFgDmABYA5gAWAOYAFgDmABYA5gAUAOYAFwDmABcA5gAXAOYAFwDmABcA5gAXAOYAFsDmABcA5gAVAOYAFgDmABYA5gATwOYAFgDmABYA5gAWAOYAFgDmABYA5gAWAOYAFADmABcA5gAXAOYAFwDmAA0A5gANAOYADQDmAAuA5gANAOYADQDmAA0A5gANAOYADQDmAArA5gAMgOYADADmAAxA5gALAOYACwDmAA7A5gAOAOYADoDmAA5A5gAOQOYADkDmAA5A5gANAOYADQDmAA0A5gANAOYADQDmAA0A5gANAOYADQDmAA1A5gANAOYADUDmAA0A5gANAOYADUDmAAyA5gAMgOYACUDmAA4A5gAMAOYADEDmAAyA5gANgOYADEDmAAxA5gAMQOYADQDmAA0A5gANQOYADQDmAA1A5gANAOYADQDmAA1A5gANAOYADQDmAA0A5gANQOYADUDmAA0A5gANAOYADUDmAA0A5gANAOYADQDmABmA5gAYQOYAGEDmABgA5gAYQOYAGEDmABhA5gAYQOYAFkDmABaA5gAWgOYAFoDmABaA5gAWgOYAFoDmABaA5gAWgOYAFoDmABaA5gAVQOYAFoDmABaA5gAVQOYAFoDmABaA5gAVQOYAF0DmABdA5gAXwOYAFwDmABdA5gAXQOYAF0DmABdA5gAXQOYAF0DmABZA5gAWgOYAFMDmABaA5gAWgOYAFkDmABeA5gAXgOYAF8DmABfA5gAXgOYAGADmABeA5gAXgOYAF4DmABfA5gAVQOYAF0DmABdA5gAXAOYAF0DmABdA5gAXQOYAF0DmABdA5gAWQOYAF4DmABeA5gAXwOYAF4DmABeA5gAXgOYAF8DmABVA5gANQOYADQDmAA0A5gANAOYADQDmAAtA5gANAOYADQDmAA0A5gANAOYADQDmAArA5gANAOYADQDmAA0A5gAJgOYADYDmAA7A5gAOQOYADoDmAA6A5gAOwOYADsDmAA1A5gANAOYADQDmAA0A5gANAOYADQDmAA0A5gANAOYADMDmAA0A5gANAOYADQDmAA1A5gANQOYADQDmAA0A5gANQOYADQDmAA1A5gAMgOYADADmAAyA5gAMAOYADADmAAuA5gAKQOYADIDmAAzA5gANwOYADkDmAA0A5gANgOYADQDmAA1A5gANAOYAC8DmAA1A5gALgOYADQDmAA0A5gANAOYADQDmAAuA5gAKgOYAGkDmABkA5gAZAOYAGQDmABkA5gAZAOYAGQDmABkA5gAZAOYAGEDmABkA5gAZAOYAGQDmABZA5gAWgOYAFoDmABaA5gAWgOYAFoDmABaA5gAWgOYAFoDmABaA5gAWgOYAFoDmABaA5gAWgOYAFoDmABVA5gAXQOYAF0DmABdA5gAXQOYAF0DmABdA5gAXQOYAF0DmABdA5gAXQOYAFkDmABaA5gAWgOYAFkDmABaA5gAWQOYAFkDmABiA5gAYgOYAGIDmABiA5gAYgOYAGIDmABiA5gAYgOYAGIDmABiA5gAVQOYAF0DmABdA5gAXQOYAF0DmABdA5gAXQOYAF0DmABdA5gAXQOYAFkDmABiA5gAYgOYAGIDmABiA5gAYgOYAGIDmABiA5gAYgOYAGIDmABVA5gAXQOYADUDmAA0A5gANAOYADQDmAAtA5gANAOYAC0DmAA0A5gANAOYADQDmAA0A5gAKwOYADQDmAA0A5gAMgOYACoDmAAwA5gAOwOYADsDmAA5A5gAOgOYADsDmAA7A5gANQOYADQDmAAuA5gANAOYADQDmAAzA5gANAOYADQDmAA0A5gANQOYADUDmAA0A5gANAOYADUDmAA0A5gANAOYADEDmAAxA5gAMgOYADMDmAAtA5gAKQOYADIDmAAyA5gANAOYADYDmAA5A5gAOQOYADQDmAAzA5gANAOYADUDmAA0A5gANQOYADUDmAA0A5gANAOYADQDmAA0A5gANAOYADQDmAAtA5gAKgOYAGgDmABkA5gAZAOYAGIDmABkA5gAZAOYAGQDmABkA5gAZAOYAGQDmABkA5gAZAOYAEYDmABNA5gATQOYAEADmABNA5gATQOYAE0DmABNA5gATQOYAE0DmABNA5gATQOYAEYDmABHA5gARwOYAEcDmABHA5gARwOYAEcDmABHA5gARwOYAEYDmABNA5gAQAOYAE0DmABKA5gATQOYAE0DmABNA5gATQOYAE0DmABMA5gATQOYAE0DmABGA5gARwOYAEoDmABNA5gATQOYAE0DmABMA5gATQOYAE0DmAA1A5gANQOYADQDmAA1A5gANQOYADUDmAAuA5gANQOYADUDmAA1A5gALgOYADUDmAA1A5gANQOYADMDmAA1A5gALgOYADUDmAAuA5gANQOYADUDmAAqA5gANQOYADUDmAA1A5gAMwOYADQDmAA1A5gANAOYAC4DmABRA5gAWAOYAFgDmABYA5gAWAOYAFgDmABYA5gAWAOYACoDmAAzA5gAMwOYADEDmAAxA5gAMAOYAC8DmAAvA5gAMgOYADIDmAAyA5gAMAOYADEDmAAxA5gAKwOYADYDmAA3A5gANAOYADYDmAA2A5gANgOYADYDmAA2A5gANgOYACkDmAAzA5gAMQOYADADmAAyA5gAMgOYADIDmAAxA5gAKwOYACsDmAA0A5gANwOYADUDmAA2A5gANQOYADUDmAA2A5gANQOYADUDmAA2A5gANQOYADQDmAA1A5gANQOYADUDmAA1A5gANgOYADUDmAA0A5gANQOYACsDmAA3A5gANwOYADQDmAA2A5gANgOYADYDmAA2A5gANgOYADYDmAA1A5gANwOYADYDmAA1A5gANQOYADUDmAA4A5gANgOYADYDmAApA5gANAOYADgDmAA2A5gANAOYADcDmAA3A5gANQOYADUDmAA1A5gANAOYAC4DmAA0A5gANQOYADUDmAA0A5gANQOYADUDmAA0A5gAKwOYADQDmAAzA5gANAOYADQDmAAqA5gAMAOYAC0DmAAwA5gAMAOYADADmAA6A5gAOQOYADsDmAA7A5gAOwOYADoDmAA0A5gANAOYADQDmAA0A5gANAOYADUDmAA0A5gANAOYADUDmAAuA5gANgOYADUDmAAzA5gANAOYADQDmAA1A5gANAOYADUDmAA1A5gANgOYADQDmAA0A5gAMQOYADADmAApA5gAMAOYADADmAAwA5gAMAOYADADmAAyA5gANwOYADYDmAA3A5gANwOYADcDmAA5A5gANwOYADUDmAA1A5gALgOYADQDmAA1A5gANAOYADUDmAA1A5gANQOYADQDmAA0A5gANQOYADUDmAA0A5gANQOYADUDmAAxA5gAPQOYAD4DmAA7A5gAOwOYADADmAA7A5gAOwOYADoDmAA8A5gAPQOYADgDmAA6A5gAKAOYAC4DmAAuA5gALgOYAC4DmAAuA5gALgOYAC4DmAAuA5gALgOYAC4DmAAjA5gAJgOYACYDmAAmA5gAJgOYACYDmAAmA5gAJgOYAC4DmAAoA5gALgOYAC4DmAAuA5gALgOYAC4DmAAuA5gALgOYAC4DmAAjA5gAJgOYACYDmAAmA5gAKAOYACgDmAAoA5gAHwOYACUDmAA1A5gANQOYADQDmAA0A5gANQOYADYDmAA1A5gANAOYADUDmAAmA5gAMQOYADEDmAAxA5gAMQOYACMDmAAtA5gAMwOYADIDmAAyA5gAMgOYADIDmAA1A5gANAOYADUDmAA1A5gANAOYADQDmAA1A5gANAOYADUDmAAvA5gAMAOYADADmAAoA5gALAOYAC8DmAAxA5gANQOYADUDmAA1A5gANAOYADQDmAA1A5gANQOYADUDmAA0A5gANQOYADMDmAAyA5gAMgOYADIDmAApA5gALgOYAC4DmAAuA5gALgOYAC4DmAAuA5gALgOYACoDmABCA5gARgOYAEYDmABGA5gARgOYAEYDmABGA5gARgOYAEYDmABGA5gARgOYAEcDmABGA5gARgOYAEYDmABGA5gARwOYAEYDmABAA5gAPgOYAD4DmAA+A5gAPgOYAD4DmAA+A5gAPgOYAD4DmABCA5gARgOYAEYDmABGA5gARgOYAEYDmABHA5gARgOYAEYDmABHA5gARgOYAEADmAA+A5gAPgOYAD4DmAA/A5gAPwOYAEUDmABDA5gAQwOYAEMDmABDA5gAQwOYAEMDmABDA5gAQwOYAEMDmABDA5gAQwOYAEQDmABDA5gAQwOYAEMDmABDA5gAQAOYAD4DmAA+A5gAPgOYAD4DmAA+A5gAPgOYAD4DmABFA5gAQwOYAEMDmABDA5gAQwOYAEMDmABDA5gAQwOYAEMDmABDA5gAQwOYAEQDmABDA5gAOgOYAEMDmABDA5gAQAOYAD4DmAA8A5gAPgOYAD4DmAA+A5gAPgOYAD4DmAA8A5gANAOYADUDmAAvA5gANQOYAC8DmAA1A5gANQOYADUDmAA2A5gANQOYADUDmAA1A5gANQOYADUDmAA3A5gAKwOYADQDmAA0A5gANAOYADQDmAA0A5gANAOYADQDmAA0A5gAMgOYACoDmAAwA5gAMAOYADADmAA1A5gAMAOYADUDmAAwA5gAOwOYADkDmAA5A5gAOQOYADkDmAA6A5gAOwOYADsDmAA0A5gANAOYADQDmAA0A5gANQOYADQDmAA0A5gANAOYADUDmAA1A5gANAOYAC8DmAA1A5gANQOYADUDmAA1A5gANAOYADUDmAA1A5gALwOYADIDmAAwA5gAMAOYADIDmAAwA5gAMAOYAC4DmAAwA5gAMAOYACkDmAAwA5gALwOYAC8DmAAvA5gALwOYADcDmAAwA5gAMwOYADcDmAA3A5gAOQOYADkDmAA5A5gAOQOYADkDmAA1A5gANQOYADUDmAA1A5gANQOYADQDmAA1A5gANQOYADUDmAA0A5gANQOYAC8DmAA0A5gANAOYADQDmAA1A5gANAOYADUDmAA1A5gANQOYADcDmAA1A5gANAOYADUDmAA0A5gAOwOYADkDmAA5A5gAOgOYADUDmAA7A5gAOgOYAFYDmABKA5gASgOYAEoDmABKA5gASgOYAEoDmABKA5gASgOYAEoDmABKA5gASgOYAEoDmABKA5gASgOYAEoDmABKA5gAJgOYADEDmAAyA5gALwOYADEDmAAtA5gALwOYADEDmAAwA5gAMQOYADADmAAxA5gAMQOYACwDmAA4A5gANwOYADgDmAA4A5gAOAOYADgDmAA4A5gAOAOYACYDmAAxA5gAMgOYAC8DmAAtA5gAMQOYADEDmAAsA5gANwOYADgDmAA3A5gALgOYADgDmAA4A5gALAOYADgDmAAsA5gAOAOYADgDmAA4A5gAOAOYADgDmAA4A5gAKgOYADkDmAA5A5gAOQOYADkDmAA5A5gAOQOYADkDmAAuA5gAOAOYADgDmAAsA5gAOAOYADkDmAA5A5gAKgOYADUDmAA1A5gANAOYADQDmAA1A5gANQOYADQDmAA1A5gANQOYADUDmAA3A5gANQOYACsDmAA0A5gANAOYADMDmAA0A5gANAOYACoDmAA4A5gAMAOYADADmAA6A5gAOQOYADsDmAA7A5gAOwOYADoDmAA7A5gANAOYADQDmAA0A5gANQOYADYDmAA1A5gAMwOYADQDmAA1A5gANQOYADUDmAA0A5gANQOYADUDmAAxA5gAMAOYACkDmAAzA5gANwOYADYDmAA3A5gANwOYADcDmAA2A5gANgOYADYDmAA0A5gANQOYADUDmAA1A5gANAOYADQDmAAuA5gANQOYADQDmAA1A5gANQOYACoDmAA1A5gAQQOYAEEDmABBA5gAQQOYAEEDmABBA5gAQAOYAEIDmABCA5gAQQOYAEADmABBA5gAKQOYAC0DmAAtA5gALQOYAC0DmAAtA5gALQOYAC0DmAAtA5gALQOYAC0DmAAtA5gALQOYACMDmAAkA5gAJAOYACUDmAAkA5gAJAOYACQDmAAkA5gAJAOYACkDmAAtA5gALQOYAC4DmAAtA5gALQOYAC0DmAAtA5gALQOYAC0DmAAtA5gALQOYACMDmAAkA5gALgOYAC0DmAA1A5gANQOYADQDmAA1A5gANQOYADUDmAA0A5gANQOYADUDmAA1A5gANQOYACYDmAAxA5gAMQOYADEDmAAiA5gAKgOYADQDmAA1A5gANAOYADQDmAA0A5gANAOYADUDmAA1A5gANAOYADQDmAA1A5gANQOYADQDmAA1A5gALwOYADADmAAwA5gAKAOYAC8DmAA2A5gANQOYADUDmAA1A5gANQOYADADmAAwA5gAMAOYAC8DmAAxA5gAMAOYADADmAAvA5gAMAOYADADmAAxA5gALQOYADYDmAA2A5gANAOYADIDmAA1A5gANAOYADYDmAA1A5gANgOYADUDmAAtA5gAPAOYAD0DmAA6A5gAPAOYADoDmAA8A5gAPAOYADwDmAAtA5gANgOYADQDmAAyA5gANQOYADYDmAA2A5gANwOYADcDmAAyA5gANQOYADQDmAA3A5gANQOYADcDmAAuA5gAPAOYAD0DmAA6A5gAPAOYADsDmAA8A5gAPAOYADYDmAA3A5gANgOYAC0DmAA5A5gAPAOYADUDmAA1A5gANAOYADYDmAA1A5gANAOYADUDmAA1A5gAKwOYADMDmAA0A5gANAOYACsDmAA6A5gAOQOYADsDmAA7A5gAOwOYADoDmAA7A5gANAOYADUDmAA2A5gANQOYADMDmAA2A5gANQOYADQDmAA1A5gANQOYADEDmAAvA5gAJwOYADADmAAsA5gAMwOYADYDmAA3A5gANwOYADcDmAA2A5gANwOYADYDmAA2A5gANgOYADUDmAA1A5gANQOYADUDmAAzA5gANgOYADUDmAA0A5gANQOYADUDmABGA5gARwOYAEgDmABGA5gARQOYAEUDmABFA5gARgOYAEUDmABHA5gARwOYAEYDmABFA5gAPQOYAEADmAA/A5gAOgOYAD8DmAA/A5gAPwOYAEADmABAA5gAPAOYAD0DmAA9A5gAPQOYAD0DmAA9A5gAPQOYAD0DmAA8A5gAPQOYAD0DmABAA5gAOgOYAEADmAA6A5gANQOYAEgDmABHA5gASAOYAEwDmABIA5gASAOYAEgDmABIA5gARwOYADoDmAA9A5gAPAOYAD0DmAA9A5gAPAOYAD0DmAA8A5gAPwOYADUDmABIA5gATAOYAEgDmABIA5gASAOYAEgDmABHA5gAOgOYADUDmAA3A5gANgOYAC4DmAA2A5gANgOYADYDmAA3A5gANwOYACwDmAAvA5gALwOYADADmAAvA5gAMgOYAC8DmAAqA5gALQOYADgDmAA2A5gANQOYAC4DmAA2A5gANQOYADQDmAA3A5gANAOYADIDmAA1A5gANQOYAC0DmAAuA5gAMAOYADIDmAAtA5gAMgOYACoDmAA3A5gAOAOYACwDmAAwA5gALwOYADMDmAA2A5gAMAOYADcDmAA5A5gAOQOYADYDmAA1A5gANwOYADQDmAA2A5gANQOYADQDmAAuA5gANwOYADQDmAAyA5gANQOYAC4DmABHA5gASAOYAEgDmABJA5gASAOYAEgDmABIA5gASAOYAFwDmABeA5gAXgOYAFgDmABeA5gAXgOYAF4DmABeA5gAXgOYAFoDmABeA5gAWAOYAFwDmABcA5gAXAOYAFwDmABcA5gAXAOYAFwDmABcA5gAXAOYAF4DmABeA5gAYgOYAGIDmABiA5gAYgOYAFYDmABiA5gAYgOYAGIDmABiA5gAYgOYAFYDmABeA5gAXgOYAF4DmABeA5gAXgOYAF4DmABeA5gAXgOYAGIDmABiA5gAVgOYAF4DmAA0A5gANAOYADQDmAAuA5gANgOYADQDmAA0A5gANAOYADQDmAA0A5gAKwOYADQDmAAqA5gAOwOYADkDmAA1A5gAOgOYADkDmAA0A5gANAOYADQDmAA0A5gANgOYAC4DmAA1A5gANAOYADMDmAA0A5gAMgOYADADmAAmA5gANAOYADADmAAxA5gAMgOYADYDmAAxA5gAMQOYADEDmAA0A5gANAOYADYDmAA1A5gANQOYADQDmAA0A5gANAOYADQDmAA2A5gANwOYADUDmAA0A5gANAOYADsDmAA5A5gAMwOYADEDmAAxA5gAbgOYAGgDmABoA5gAaAOYAGgDmABoA5gAaAOYAGgDmAAqA5gAOAOYADgDmAA4A5gAMwOYADgDmAA4A5gAOAOYADgDmAA4A5gAOAOYADgDmAAyA5gAOAOYACwDmAAxA5gAMQOYADMDmAAxA5gAMQOYADEDmAAxA5gAMQOYADEDmAAqA5gAOAOYAC4DmAA4A5gAOAOYADgDmAA4A5gAOAOYADgDmAA4A5gAOAOYACwDmAAxA5gAMQOYADEDmAAxA5gAMQOYADEDmAAxA5gALgOYAC8DmAA4A5gAOAOYADgDmAA4A5gAOAOYADgDmAAsA5gAMQOYADEDmAAxA5gANQOYADUDmAA0A5gANAOYADUDmAA0A5gANQOYADUDmAArA5gAMwOYADQDmAA7A5gAOQOYADQDmAA0A5gANAOYADQDmAA0A5gANAOYADUDmAAzA5gANAOYADQDmAA1A5gANQOYADQDmAA1A5gANQOYADIDmAAwA5gAMwOYADEDmAA2A5gAMQOYADEDmAA0A5gAMwOYADQDmAA1A5gANQOYADUDmAA1A5gANAOYADQDmAA1A5gANAOYADUDmAA1A5gARQOYAEUDmABFA5gARQOYAEUDmABFA5gARQOYADADmAA4A5gAOAOYADgDmAA4A5gAOAOYADgDmAA4A5gAOAOYADgDmAA4A5gANAOYADADmAAwA5gAMAOYADADmAAwA5gAMAOYADADmAAwA5gAMAOYADADmAAwA5gAOAOYADgDmAA4A5gANAOYADYDmAA2A5gANgOYADYDmAA2A5gANgOYADYDmAA2A5gANgOYADYDmAA2A5gANgOYADQDmAAwA5gAMAOYADADmAAwA5gAMAOYADADmAAwA5gAMAOYADQDmAA3A5gANwOYADcDmAA3A5gANwOYADcDmAA3A5gANwOYADQDmAAwA5gAMAOYADADmAA1A5gANQOYADUDmAA1A5gANQOYADUDmAA1A5gANQOYADUDmAA1A5gAKwOYADEDmAAxA5gAMQOYADEDmAAxA5gAMQOYADEDmAAsA5gAMAOYADADmAAwA5gAMAOYADoDmAA5A5gAOQOYADkDmAA5A5gAOQOYADkDmAA1A5gANAOYADQDmAA1A5gANQOYADUDmAA1A5gANQOYADQDmAA1A5gANQOYADUDmAA0A5gANQOYADUDmAAxA5gALwOYADADmAAvA5gAMAOYACYDmAApA5gAKQOYACwDmAApA5gANQOYADEDmAAwA5gAOQOYADEDmAAxA5gAMQOYADEDmAA1A5gANQOYADQDmAA0A5gANQOYADUDmAA1A5gANQOYADUDmAA0A5gANQOYADQDmAA0A5gANQOYADUDmAA1A5gANAOYADUDmAA1A5gANAOYADoDmAA5A5gAOQOYADkDmAA5A5gAOQOYAEkDmABCA5gAQgOYAEIDmABCA5gAQgOYAEIDmABCA5gAQgIKACcCCwBNA+gA7ADpAHYAugBbAAAAAwAAAAMAAAHmAAEAAAAAABwAAwABAAAB5gAGAcoAAAAgAOAAAQACAAMABAAFAAYABwAIAAkACgALAAwADQAOAA8AEAARABIAEwAUABUAFgAXABgAGQAaABsAHAAdAB4AHwAgACEAIgAjACQAJQAmACcAKAApACoAKwAsAC0ALgAvADAAMQAyADMANAA1ADYANwA4ADkAOgA7ADwAPQA+AD8AQABBAEIAQwBEAEUARgBHAEgASQBKAEsATABNAE4ATwBQAFEAUgBTAFQAVQBWAFcAWABZAFoAWwBcAF0AXgBfAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAHwAZgAAAAAAYwAAAGsAAAAAAAAAiwBqAGQAxQAAAAAAtwBnAMcAyABiAAAArgC0ALMAAAC9AAAAAAAAAAAAAABzAGAAAAC1AAAAAAAAAGUAbwB/AAAAAAAAAAAAAAAAAAAAAAB6AHsAeAB5AHUAAAAAAAAAAAAAAIMAhAAAAAAAfQBsAAAAAACAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAHcAAABtAAAAAAB2AARCagAADSAIAAAKBSAAfgChAKgAqwC/ANcA9wLHAtkgJiAwIDMgOyCpIQMhCSEWISIhKyFpIXkhmSHSIdQiACIIIgsiDyIRIhoiHiIgIiwiLiI2Ij0iUiJlImsihyKZIqUjEiRuJIIktSTpJZIlqSW3JcElyCXLJdEmBiYPJhwmHiZAJkImbTADMBEwFTFjMY4yHDJ7Mn8zwjPHM9isAawErAusHawgrCSsMaw5rDysQKxLrE2sVKxYrFysZaxxrHSseKx6rIyskKyUrKGsqqysrLCsvazBrMSsyKzMrNWs16zhrOSs6KzqrOys8azzrPas/a0ArQStBq0RrRitHK0grSKtKa0trTWtOK08rUWtR61JrVCtVK1YrWGtY61lrW2tcK12rX2tf62CrYmtjK2QrZ2tpK24rcGtxK3IrdGt063Vrdyt4K3kreyt+a38rgKuCa4Lrg2uFK4xrjSuOK46rkauSq5OrlCuVK5WrmGuZa5prmyucK59roauja6+rsCuxK7RrtOu1a7Zrtyu6K7rru2u9K74rvyvCa8NrxCvLa8wrzSvPa8/r0OvRa9Jr1CvXa9lr3mvgK+Er4ivka+Vr5yvua+8r8Cvya/Lr86v1K/Yr9yv6a/xr/Sv+LABsASwDLAQsBSwHbAosDCwPLBFsEiwSrBMsE6wVbBXsFmwXbB9sICwhLCNsI+wkbCasJyworCvsLGwtbC4sLywybDRsNSw2LDhsOOw5bDssROxHbElsSixLLE5sUGxRLFIsVWxWLFcsWCxcbF5sXyxgrGJsYuxjbGUsZixnLGosbCxxLHMsdCx1LHdsd+x4bHpseyx8LH5sfux/bIFsgiyDbIVsheyGbIdsiCyNLI8sliyXLJgsmmydbJ8soWyibKRspSymrKhsqOyp7KqsqyysLK0sryywbLJssyy0LLSstmy27LdsuKy5rLosvuy/bMBswSzCLMVsxyzILNWs1izX7Nls2ezabNrs26zcbN0s3izhbOMs5CzlLOhs6izrLPFs8izzLPOs9Cz1bPXs9mz27Pds+Cz5LPos/y0ELQYtBy0ILQptCu0LbQ0tFG0VLRYtFq0YbRjtGW0bLSAtIi0mbSdtKS0qLSstLW0t7S5tMC0xLTItNC01bTdtOC05LTmtO2077TxtPi1FbUYtRy1KrUutTG1NLU4tUW1TbVQtVS1YbWhtaS1qLWrtbW1vbXAtcS10bXYtey2EbYUthi2IbYjtiW2LbYwtjS2SLZctmS2aLadtqC2pLantqy2sbbUtvC29Lb4twG3Bbcptyy3MLcztzm3O7c+t0S3SLdMt1W3YLdkt2i3cbdzt3W3fbeAt4S3mbect6C3rbeyt7W3uLfHt8m31Lftt/C39LgBuAm4DLgQuB24JbgouCy4ObhAuES4UbhTuF24YLhkuG24b7hxuHm4fLiNuJS4qLiwuLS4uLjBuMO4xbjMuNC41LjduN+44bjpuOy48Lj5uPu4/bkEuRi5ILkkuT25QLlEuUy5T7lRuVm5XLlguWm5a7ltuXW5eLl8uYW5h7mOua25sLm0ub25v7nBucm5zLnSud+54bnluei57Ln6ugG6BLoIuhW6Obo8ukC6QrpJuku6TrpVuli6XLppunG6dLp4uoW6h7qMurK6ubq7ur26xLrIutm64Lr0uvy7ALsEuw27D7sRuxi7HLsguym7K7s2uzi7PrtFu0e7SbtNu1C7VLtYu2G7Y7tlu2y7iLuKu4y7kLuku6i7rLu0u7e7ubvBu8S7yLvQu9O71bvcu/m7/LwAvAK8DbwPvBG8H7wlvCe8KbwtvDG8NLw4vEW8SbxNvFC8XbxhvIW8iLyMvI68lbyXvJq8obykvKi8tby9vMC8xLzRvNW82LzcvPa8+Lz8vP+9Bb0HvQm9EL0UvSW9LL1AvUm9TL1QvVm9ZL1ovXS9gb2EvYq9kb2TvZW9mr2cvaC9pL2wvbS9uL3BvdW92L3cvem98L30vfi+AL4DvgW+Db4QvhS+Hb4fviG+KL5Fvki+TL5OvlW+V75bvmG+ZL5ovmq+db59voC+hL6Rvpm+nL6ovtG+1L7YvuC+5b7svwG/Cb8dv0G/RL9Iv1G/U79Vv5S/sb/Fv82/0L/Vv92/37/hwCDAPMBRwFjAXMBgwGnAbcCRwJTAmMChwKPApcC2wMHAxcDJwMzA0MDdwOXA6MDswPXA98D5wP7BAcEEwQjBEMEVwSfBMcE2wTnBPMFAwU3BVcFYwVzBacFxwXTBeMGBwYXBjsGQwZTBlsGdwZ/BocGlwanBrMGwwb3BxMHIwczB1MHYweDB5MHowfHB88H1wf3CAMIEwg3CD8IRwhbCGcIcwiDCKcIrwi3CL8IywjTCSMJRwlTCWMJgwmXCbcJwwnTCfcJ/woHCicKMwpDCmMKbwp3CpcKowq3CtcK3wrnC3cLgwuXC7cLvwvHC88L2wwDDDcMVwxjDHMMpw0XDacNsw3DDcsN9w4TDiMOMw5TDoMOkw7XDvMPAw9nD3MPgw+LD6cPtw/XD+MP8xAjEEMQkxCzEMMQ0xD3ESMRdxGXEaMRsxHXEecSAxJDElMScxKzEuMS8xOnE8cT0xPjE+sUBxQPFDMUQxRTFHMUpxSzFMMU5xTvFPcU/xU7FYcVkxWjFdcV9xYDFhMWHxY3Fj8WRxZXFmMWcxaDFqcWtxb7FysXMxc7F0cXUxdjF4cXjxeXF7sXwxfTF98YIxgzGEMYdxibGKMYuxjDGNcY3xjnGO8ZBxkTGSMZVxljGXcZgxnHGecZ8xoDGicaLxo3GlcaYxpzGpcanxqnGsca0xrrGwcbDxsXGx8bNxtDG1MbhxunG7MbwxvnG+8b9xwXHCMcMxxXHF8cZxyHHJMcoxzHHM8c1xzfHPsdAx0THSsdNx0/HWMdcx2DHacdrx23Hdcd4x37HkceUx5jHmsemx63HsMe0x8HHycfMx87H0MfYx93H5Mfox+zH9cgByATICsgRyBPIFsgdyCDIJMgtyC/IMcg4yDzIQMhNyFTIcch0yHjIesiByIPIjciUyJ3In8ihyKjIrMi9yMTIyMjMyNXI18jZyOHI5Mj1yP3JAMkGyQ3JD8kRyRjJLMk0yVHJVMlYyWHJY8lsyXDJdMl8yYnJjMmQyZLJmcmbyZ3JpMnBycTJyMnKydHJ08ndyeDJ5MnnyfLJ+cn8ygDKDcoUyhjKKcpNylDKVMphymjKfcqEypjKvcrAysTKzcrPytPK2crgyuzK9MsIyxDLFMsYyyHLMstBy0nLTMtQy1nLXctky3nLk8ucy7jL1Mvky+fL6cwNzBDMFMwdzB/MIswpzCzMLswwzD7MRcxIzEzMWcxgzGTMZsxozHDMdcyZzJzMoMytzLXMuMy8zMXMx8zJzNDM1MzkzOzM8M0BzQnNDM0QzRnNG80dzSTNKM0szTnNQM1czWDNZM1tzW/Ncc14zYjNlc2YzZzNpc2nzanNsM3Ezc3N0M3ozezN8M35zfvN/c4EzgjODM4UzhnOIc4kzijOMc4zzjXOWc5czmLOac5rzm7OcM51znjOfM6FzofOic6RzpTOmM6lzqjOrc6wzsHOxM7lzujO7M75zwHPBM8IzxHPE88VzxjPHM8gzyTPMc84z1XPWM9cz2XPZ89pz3HPdM94z4DPg8+Fz4zPoc+oz7DPxM/Iz+HP5M/oz/HP88/1z/3QANAE0AzQEdAY0BzQINAt0DXQONA80EXQR9BJ0FDQVNBY0GDQbdBw0HLQdNB90IHQhNCl0KjQrNC10LfQudDB0MTQydDV0N3Q4NDk0PHQ+NEN0THRNNE40TvRRdFN0VDRVNFd0V/RYdFo0WzRfNGE0YjRodGk0ajRsdGz0bXRutG80cDR2NH00fjR+9IH0gnSENIt0jDSNNI20j3SP9JB0kjSXNJk0nfSgdKE0ojSkdKV0pzSoNKk0qzSsdK50rzSwNLC0snSy9LU0tjS3NLl0vHS9NL40wHTA9MF0w7TENMU0xbTKdMs0zDTPdNF033TgNOE05HTmdOc06DTqdOr063TtdO407zTydPQ09jT4dPj0+3T8NP00/3T/9QB1AnUHdRA1ETUXNRg1GTUbdRv1HnUfNSA1ILUidSL1I3UlNSp1MzU0NTU1NzU39To1OzU8NT41PvU/dUE1QjVDNUV1RfVPdVA1UTVTdVP1VHVWdVc1WDVZdVp1WvVbdVw1XXVeNV81YnVkNWU1aPVpdXJ1czV0NXS1dnV29Xd1eXV6NXs1fXV99X51gHWBNYI1hXWHNYg1iTWLdY51jzWQNZF1knWS9ZN1lHWVdZY1lzWZdZp1nHWdNaD1oXWjdaQ1pTWndaf1qHWqNas1rDWuda71r3WxdbI1szW0dbV1tfW2dbg1uTW6Nbw1vXW/dcA1wTXEdcZ1xzXINcp1yvXLdc11zjXPNdE10fXSddR11TXWddd12HXY9dl12nXbNdw13TXfdeB14nXjNeQ15nXm9ed16PgAf/m//8AAAAgAKEApACrALAA1wD3AscC2SAYIDAgMiA5IKkhAyEJIRYhISErIWAhcCGQIdIh1CIAIgIiCyIPIhEiGiIdIiAiJyIuIjQiPSJSImAiaiKCIpkipSMSJGAkdCScJNAlkiWgJbIlvCXGJcslziYFJg4mHCYeJkAmQiZgMAAwCDATMTExjTIAMmAyfzPCM8cz2KwArASsB6wQrCCsI6wsrDisPKxArEusTaxUrFisXKxlrHCsdKx3rHqsgKyQrJSsnKyorKysr6y3rMGsxKzIrMys1azXrOCs5KznrOqs7KzvrPOs9az8rQCtBK0GrQytGK0crSCtIq0prSytNK04rTytRK1HrUmtUK1UrVitYK1jrWWtbK1wrXOte61/rYGtiK2MrZCtnK2krbetwK3Ercit0K3TrdWt3K3greSt7K34rfyt/64HrguuDa4TrjCuNK43rjquQK5KrkyuUK5UrlauXK5lrmiubK5vrniuhK6MrryuwK7Ersyu067Vrtiu3K7oruuu7a70rviu/K8Hrw2vEK8srzCvMq88rz+vQa9Fr0ivUK9cr2SveK+Ar4SviK+Qr5WvnK+4r7yvwK/Hr8uvza/Ur9iv3K/or/Cv9K/4sACwBLAMsBCwFLAcsCiwMLA8sESwSLBKsEywTrBTsFewWbBdsHywgLCEsIywj7CRsJiwnLCfsKiwsbCzsLiwu7DEsNCw1LDXsOCw47DlsOyxCLEYsSKxKLErsTSxQLFEsUexULFYsVyxYLFxsXixfLGAsYixi7GNsZGxmLGcsaixsLHEscyx0LHUsdyx37Hhseix7LHwsfix+7H9sgSyCLILshSyF7IZsh2yILI0sjyyWLJcsmCyaLJ0snuyhLKJspCylLKXsqCyo7KlsqqyrLKwsrSyvLLBssiyzLLPstKy2LLbst2y4rLksuiy67L9sv+zBLMIsxCzHLMgs1SzWLNbs2SzZ7Nps2uzbrNws3SzeLOAs4yzkLOUs6CzqLOss8SzyLPLs86z0LPUs9ez2bPbs92z4LPks+iz/LQQtBi0HLQgtCi0K7QttDS0ULRUtFe0WrRgtGO0ZbRstIC0iLSZtJ20pLSotKy0tbS3tLm0wLTEtMi00LTVtNy04LTjtOa07LTvtPG0+LUUtRi1G7UktS61MLU0tTe1QLVLtVC1VLVctaC1pLWotaq1sLW7tcC1xLXMtdi17LYQthS2GLYgtiO2JbYstjC2NLZHtly2ZLZotpy2oLaktqe2q7axttS28Lb0tvi3ALcFtyi3LLcvtzO3OLc7tz23RLdIt0y3VLdgt2S3aLdwt3O3dbd8t4C3g7eMt5y3n7eot7K3tLe4t8e3ybfUt+y38Lfyt/y4B7gMuBC4GLgkuCi4K7g0uEC4RLhRuFO4XLhguGO4bLhvuHG4eLh8uI24lLiouLC4tLi4uMC4w7jFuMy40LjUuN2437jhuOi47LjwuPi4+7j9uQS5GLkguSS5PLlAuUS5TLlPuVG5WLlcuWC5aLlruW25dLl4uXy5hLmHuYm5rLmwubS5vLm/ucG5yLnMuc652LnhueO56LnrufS6ALoEugi6Fbo4ujy6QLpCuki6S7pNulO6WLpcumS6cLp0uni6g7qHuoy6qLq4uru6vbrEusi62LrguvS6/LsAuwS7DbsPuxG7GLscuyC7KbsruzS7OLs7u0S7R7tJu027T7tUu1i7Ybtju2W7bLuIu4q7jLuQu6S7qLusu7S7t7u5u8C7xLvIu9C707vVu9y7+Lv8u/+8ArwIvA+8EbwUvCS8J7wpvC28MLw0vDe8QLxJvEy8ULxcvGG8hLyIvIu8jryUvJe8mbygvKS8p7ywvLy8wLzEvMy81bzYvNy89Lz4vPu8/70EvQe9Cb0QvRS9JL0svUC9SL1MvVC9WL1kvWi9dL2AvYS9h72QvZO9lb2ZvZy9oL2kvbC9tL24vcG91L3Yvdy96b3wvfS9+L4AvgO+Bb4MvhC+FL4cvh++Ib4ovkS+SL5Lvk6+VL5Xvlm+YL5kvme+ar5wvnu+gL6Evoy+mL6cvqi+0L7Uvte+4L7jvuy/Ab8Ivxi/QL9Ev0i/UL9Tv1W/lL+wv8W/zL/Qv9S/3L/fv+HAIMA8wFHAWMBcwGDAaMBtwJDAlMCYwKDAo8ClwKzAvMDFwMjAzMDPwNjA5MDowOzA9MD3wPnA/sEAwQTBCMEQwRXBHMEswTbBOME8wT/BSMFUwVjBXMFkwXDBdMF4wYDBhcGMwZDBk8GWwZzBn8GhwaXBqMGswbDBvcHEwcjBzMHUwdfB4MHkwejB8MHzwfXB/MIAwgTCDMIPwhHCFsIYwhzCH8IowivCLcIvwjHCNMJIwlDCVMJYwmDCZcJswnDCdMJ8wn/CgcKIwozCkMKYwpvCncKkwqjCrMK0wrfCucLcwuDC48Lrwu/C8cLzwvbC+MMIwxPDGMMcwyTDRcNow2zDcMNyw3jDhMOIw4zDlMOgw6TDtcO8w8DD2MPcw9/D4sPow+3D9MP4w/zECMQQxCTELMQwxDTEPMRIxF3EZMRoxGzEdMR5xIDEkMSUxJzErMS4xLzE6cTwxPTE+MT6xP/FA8UMxRDFFMUcxSjFLMUwxTjFO8U9xT/FRMVTxWTFaMVwxXzFgMWExYfFjMWPxZHFlcWXxZzFoMWpxazFtMXExczFzsXQxdTF2MXgxePF5cXsxfDF9MX2xfzGDMYPxhjGJMYoxivGMMYzxjfGOcY7xkDGRMZIxlDGWMZcxmDGbMZ4xnzGgMaIxovGjcaUxpjGnMakxqfGqcawxrTGt8bAxsPGxcbHxszG0MbUxtzG6MbsxvDG+Mb7xv3HBMcIxwzHFMcXxxnHIMckxyjHMMczxzXHN8c8x0DHRMdKx0zHT8dRx1zHYMdox2vHbcd0x3jHe8eDx5THlseax6DHrMewx7THvMfIx8zHzsfQx9jH3cfkx+jH7Mf1yADIBMgHyBDIE8gVyBzIIMgkyCzIL8gxyDjIPMhAyEjIVMhwyHTIeMh6yIDIg8iFyJTIncifyKHIqMisyLzIxMjIyMzI1MjXyNnI4MjkyPXI/MkAyQTJDMkPyRHJGMksyTTJUMlUyVjJYMljyWzJcMl0yXzJiMmMyZDJksmYyZvJncmkycDJxMnHycrJ0MnTydXJ4MniyefJ7Mn4yfzKAMoIyhTKGMopykzKUMpUylzKaMp9yoTKmMq8ysDKw8rMys/K0crYyuDK7Mr0ywjLEMsUyxjLIMsyy0HLSMtMy1DLWMtdy2TLeMuTy5zLuMvUy+TL58vpzAzMEMwTzBzMH8whzCfMLMwuzDDMOMxEzEjMTMxUzGDMZMxmzGjMcMx1zJjMnMygzKjMtMy4zLzMxMzHzMnM0MzUzOTM7MzwzQHNCM0MzRDNGM0bzR3NJM0ozSzNOc1AzVzNYM1kzWzNb81xzXjNiM2UzZjNnM2kzafNqc2wzcTNzM3QzejN7M3wzfjN+839zgTOCM4MzhTOGc4gziTOKM4wzjPONc5YzlzOX85ozmvObc5wznTOeM57zoTOh86JzpDOlM6YzqDOqM6szrDOwc7EzuTO6M7rzvTPAM8EzwjPEM8TzxXPGM8czyDPJM8szzjPVM9Yz1vPZM9nz2nPcM90z3jPgM+Dz4XPjM+hz6jPsM/Ez8jP4M/kz+jP8M/zz/XP/NAA0ATQDNAR0BjQHNAg0C3QNNA40DzQRNBH0EnQUNBU0FjQYNBs0HDQctB00HzQgdCE0KTQqNCs0LTQt9C50MDQxNDH0NDQ3NDg0OTQ7ND40Q3RMNE00TjROtFA0UzRUNFU0VzRX9Fh0WjRbNF80YTRiNGg0aTRp9Gw0bPRtdG60bzRwNHY0fTR+NH70gfSCdIQ0izSMNI00jbSPNI/0kHSSNJc0mTSd9KA0oTSiNKQ0pXSnNKg0qTSrNKx0rjSvNK/0sLSyNLL0tTS2NLc0uTS8NL00vjTANMD0wXTDNMQ0xPTFtMc0yzTL9M400TTfNOA04TTjNOY05zToNOo06vTrdO007jTvNPE09DT2NPh0+PT7NPw0/TT/NP/1AHUCNQd1EDURNRc1GDUZNRt1G/UeNR81H/UgtSI1IvUjdSU1KnUzNTQ1NTU3NTf1OjU7NTw1PjU+9T91QTVCNUM1RTVF9U81UDVRNVM1U/VUdVY1VzVYNVl1WjVa9Vt1XDVc9V41XvVhNWP1ZTVo9Wl1cjVzNXQ1dLV19Xb1d3V4NXo1ezV9NX31fnV/9YE1gjWENYc1iDWJNYt1jjWPNZA1kXWSNZL1k3WUdZU1ljWXNZl1mfWcNZ01oPWhdaM1pDWlNad1p/Wodao1qzWsNa51rvWvdbE1sjWzNbR1tTW19bZ1uDW5Nbo1vDW9db81wDXBNcR1xjXHNcg1yjXK9ct1zTXONc810TXR9dJ11DXVNdW113XYNdj12XXadds13DXdNd814HXiNeM15DXmNeb153Xo+AA/+D////h/78AAP+6AAD/nf9+/a/9ngAA4FAAAAAA393fhN9/33MAAN9h3y3fJ98R3tne2N6tAADep96k3qPemwAA3pgAAN6RAADeht5yAAAAAAAA3jbeK92/3HLcbdxU3DrbkgAAAAAAAAAA224AAAAAAADbJtsl2wTbAwAAAADRTQAA0DEAAM+Xz1TPUc4PzgvN+wAAVdIAAAAAVckAAAAAAABVt1W0VapVqVWjVaBVnVWVAABViQAAVYYAAFV7VXgAAAAAVWkAAAAAVV1VW1VYVVVVTVVMAABVQgAAVT9VPgAAVTsAAAAAVTNVMFUvAABVI1UgVR1VHFUWAAAAAFUMVQkAAFUBVQBU+lT3VPQAAFTsVOsAAFTjAAAAAFTcAAAAAFTUVNEAAFTAAAAAAFSlVKIAAFSaVJlUk1SQVI1UhgAAVHkAAAAAVHJUcQAAAABUTwAAVEwAAFRDAABUQVQ+VD0AAFQ0AABUMAAAAAAAAAAAAABT7FPpAABT4FPfAABT21PQU85TzVPHU8RTwQAAU7RTsgAAU5UAAAAAU4wAAFOKAABTggAAAAAAAFNZU1ZTUwAAU0lTQwAAUyZTIwAAUxwAAFMWUxNTEAAAAABS/VL6AABS8VLqUudS5AAAUtNSzFLBAABSuFK3UrZStQAAUrBSr1KsAABSjFKJAABSgVKAAABSeQAAAABScAAAUm0AAAAAAABSWwAAAABSUVJQUkoAAAAAAABSIAAAAAAAAFIOAAAAAFIBUf5R+1HrAABR4wAAAABR2lHZAABR01HQUcVRvlGrUaRRoVGeAABRllGVAABRjVGKAABRglGBAABReQAAAABRcFFvUWxRalFXUVBRNVEyUS8AAAAAAAAAAFEPAABRBwAAAABQ/wAAUPxQ+1D4UPVQ7lDqAABQ4gAAUN8AAFDZUNhQ1AAAUNIAAFDLAABQyFDFAABQt1C0AABQgAAAAABQeFB3UHZQdAAAUHFQbgAAUGBQXVBaAABQSVBGAABQLQAAUCpQKQAAUCVQJFAjUCJQIFAdUBpQB0/0T+1P6k/nAABP30/eT9gAAE+7AABPuAAAT7JPsU+rT5hPkU+BT35PeE91T3JPak9pT2hPYk9fT1xPVU9RAABPSQAAT0YAAE9ATz9POQAATxwAAAAATw8AAE8MAAAAAAAATvtO+AAAAABOsE6tAAAAAAAATqBOnQAATo9OfAAATldOVAAATkxOSwAATkNOQAAAThtOFE4RAABN3E3ZTdcAAE3QTa5Nk02QTY0AAE2DAABNXwAATVsAAE1WAABNUE1NTUoAAE05TTZNMwAATStNKgAATSIAAAAATRMAAAAATQUAAE0CTPRM80zpAABM0AAAAAAAAEzATL0AAAAATK0AAAAATJ1MmkyOTI0AAEyDAAAAAEx5THgAAExwTGBMWkxHTEBMPUw6AABMMkwxTCtMKEwlTB1MHEwbAABME0wQAABMCEwHTAFL7kvnS+QAAEvLS8hLwUu/S74AAEu2S7MAAEurS6oAAEuiS58AAEuXAAAAAEt1S3IAAEtqS2kAAEthAAAAAEtZAABLVgAAAAAAAEtFS0JLNgAASxJLD0sOAABLCAAAAABLAUr+AAAAAEruSusAAErgStwAAAAASrdKtkqwSq0AAEqYSoVKfkp7SnhKcEpvSm5KaEplSmJKWkpZAABKUAAAAABKSEpHSkQAAEpASj1KNUo0SjNKLUoSShFKEEoNSfpJ90n0Se1J60nqAABJ4knfSdhJ1knVSc8AAEmyAABJrwAASahJpwAAAABJnkmdSZoAAEmWAAAAAEmJAABJhQAASXcAAElTAABJUAAASUoAAAAASUIAAAAAAABJMEktAABJIkkgSR0AAEkFAABJAQAASPxI+0j1SPIAAEjdSMoAAEjBSL4AAEitSKpInwAASJIAAAAASIpIiQAASIVIgkh/SHRIcUhuSGYAAEhSSE9IQ0g9SDpIN0gwSC5ILQAASCVIIgAASBpIGUgTAABH9gAAR/MAAEftAAAAAEfmAABH4wAAAABH1kfTAAAAAEfDR7gAAEePAABHhgAAR35HagAAAAAAAEcxRy4AAEcmRyVG5wAARrkAAEaxAAAAAEanRqZGaEZNRjlGM0YwRi0AAEYjAABF/0X8AABF9EXzAAAAAEXhAABF3QAAAAAAAEXLRcgAAEXARb9FuwAARbhFtUWuRaoAAAAARZgAAEWVAAAAAAAARYNFgAAAAABFcEVtAABFYwAARVwAAEVZAABFU0VSRU8AAEVLRUhFPEU2RTNFMEUpAABFIEUdRRoAAEUSRREAAEUJRQYAAET+RP1E+QAARPYAAAAAROxE60TqAABE6ETVAABEzETJRMJEvgAARLZEswAARKtEqgAARKJEn0SYRJZElQAARI0AAAAARINEggAARF4AAAAARFZEVURURFIAAAAAAABEPkQ7AABEFwAAQ/ND8EPvAABD4kPfQ9xD1UPKQ8dDt0OxQ64AAEOVAABDkgAAQ4oAAEOCQ39DdENtQ1pDU0NQQ00AAEM8QygAAEMgQx0AAEMTQw1C/kL7QvRC5ULaQtdCqwAAQqNCoEKfAABCmkKSQo9CjEKFAABCeEJ1AABCbUJsQmsAAAAAQltCWAAAAABCSEJFQkMAAEI+Qj1COgAAQjZCM0IrAAAAAAAAQhpCGQAAQhZCEwAAQgtCCgAAQgNCAAAAAABB9QAAAAAAAEHkAABB4QAAQd5B3UHcAABB1kHTAABByQAAQcQAAAAAQbBBrQAAQaVBpAAAQZxBmQAAQZFBkAAAQYgAAAAAQYBBf0F+AABBeEF1AAAAAEFlQWIAAEFaQVkAAEFRQU4AAEFGQUUAAEE9QToAAEEyQTFBMAAAQStBKEEjAABBIQAAQR1BGgAAQRJBEQAAQQkAAAAAQP4AAED8AAAAAEDvQOwAAAAAQNxA20DaQNNAz0DJQMZAw0C7AABArwAAAABApwAAAABAn0CcAABAlECTQI1AikCHAABAeAAAQFtAWEBXAABAUQAAQEdAP0A+QD1AN0A0AABAH0AcQBkAAEARQBAAAEAIP/gAAD/wAAAAAD/nP+Y/4D/NP8YAAD+pP6YAAD+eP5Y/kz+QP4kAAD98P3k/eAAAP3I/cT9rAAA/TgAAP0sAAD9FAAA/PwAAPzwAAAAAPzA/LQAAPx8/HD8MAAA+6D7lAAA+1z7DPr0+qgAAPoUAAAAAPnsAAAAAPnA+ZT5ePks+RD5BPj4AAD4nPhkAAD4RPg4AAD4EPf4AAD3SPco9rz2UPYU9gz2CAAA9XgAAAAA9VAAAAAA9TT1MPUsAAAAAPTw9OQAAPSs9KD0nPSY9Hz0bAAA89zz0AAAAADzkPOEAADzZPNg80jzPPMA8uTy2PKYAADyePJsAADyTPJI8jDyJPIY8ejx0PFk8VjxTAAA8SzxKPEQ8NQAAPCg8JQAAPB08HDwWPAMAADv6O+M74DvdAAA71TvUO847yzvIO8E7vQAAO7U7sgAAO6o7qQAAO4UAAAAAO30AADt7AAA7dgAAAAA7bDtrAAA7YztgAAA7VgAAO1E7QTs/AAA7HgAAAAAAADsMOwkAADsBOwA6/jr7Ovg69QAAOucAADrKAAAAADrAOr8AADq3OrQ6rTqrOqo6pDqQOoo6gzpwOm0AADpUOlEAADpJOkgAADpAOj06NjoyOiw6KTomOhoAADoSOg8AADoHOgY6ADn9Ofo58wAAOeY55TnkAAA52jnYAAA5tzm0AAA5rDmrAAA5owAAAAAAADmSOY8AADmBOW0AADlJOUYAAAAAAAA5ODk1AAA5LTksOSY5IzkUOQ05CgAAOPEAAAAAOOc45jjiOOE43jjHOKw4qTinOJw4mziVAAA4eDh1OHQAADhuOG04ZzhUOE04OwAAODE4LgAAOCQ4HjgbOBg4ETgNAAA4BQAAOAIAADf8N/Q38TfuAAAAADfbN9gAADfQN88AADfIAAA3xQAAN7kAAAAAAAAAADdxN24AAAAAN143WwAAN1M3UgAAN0o3RwAANzg3MTcpNygAADceNxsAADcTNxIAADb5Ntc21Da9Nro2tzavNq4AADakAAA2oQAANps2mjaUNoA2XjZbNlg2UTZPNkc2RDZBNjo2ODY3NjE2LjYrAAA2IwAANf01+gAANfI18QAANek15jXiAAA13zXeNdwAADXYAAAAAAAANcY1uDW3AAA1kzWQNY8AADWKNYkAADWENYEAADV5NXgAADVxNW4AADVgNV01WjVSAAA1RjVDNT8AADU8NTs1OAAANTQ1MTUpAAAAADUgNRI1EQAANQk1BjT+NP00/DT2NPM08DToNOc05gAANN402zTXAAA01DTTNM00yjTHNMA0vAAANLQ0sTSlAAA0nTSaAAA0kjSRAAA0iTSGNH80fTR8AAA0dAAANHAAADRtNGw0aTRnNGQ0YQAANFcAADRPNEwAADRENEM0PgAAAAAAAQAAAAANHAAADSIAAAAAAAAAAA04AAANUg1UAAAAAAAAAAANUAAAAAAAAAAAAAAAAAAADUQAAAAAAAAAAA1IAAANSAAADVAAAAAADVANWg1cAAAAAAAAAAAAAAAAAAAAAA1WDWgNcg18AAANfg2EDYYAAAAAAAAAAA2ADZoAAA2eAAANoAAAAAAAAAAAAAAAAA2WAAANlg2eAAANtg24DcIAAAAAAAAAAAAAAAAAAAAADbQAAA20AAANtAAAAAANyA3SAAAN1A3WAAAAAAAAAAAAAAAADdYAAA3WAAAAAA3UAAAN1g3YAAAAAAAADdQAAAAAAAAAAAAADdQN1gAAAAAN1AAAAAAAAAAAAAANzAAAAAANygAADcoN0AAADdIN1AAAAAAN0gAADdIN1AAAAAAN0gAAAAAAAAAAAAAAAA3IAAANyA3OAAAAAA3ODdAAAA3QAAAN0AAADdoAAAAAAAAN2AAADeAAAA3gDeIN7A3wDfIAAAAADfIAAAAADfgAAAAAAAAAAAAAAAAAAA3sAAAAAA3sAAAN7A3wAAAN8AAADfIAAA3yDfQN9gAAAAAAAA3yAAAAAA3wAAAAAA3uAAAN8AAAAAAAAA3sDe4AAAAADewAAAAAAAAAAA3mAAAAAAAADeIAAAAAAAAAAA3cAAAAAAAADdoAAAAADdgAAAAADdYAAA3YDd4AAA3qAAAN7A3uDfgAAA34DfoAAAAAAAAN9g4MDhYAAA4aDhwOJgAADiYOKAAAAAAAAAAADioAAA4qDi4AAAAADiwAAAAAAAAAAAAAAAAAAAAADiIAAAAADiAAAAAADh4AAAAADhwAAA4cDiAAAAAAAAAAAAAAAAAAAAAAAAAOEA4SDhQOFgAADhYAAA4WDhwAAA4cAAAAAAAAAAAAAAAADhQAAA4UAAAOFAAAAAAAAA4QAAAOEgAADjAAAAAADjAAAAAADjYAAA44DkAAAAAAAAAAAA46AAAAAA44AAAAAAAADjwAAAAADjoAAA46AAAAAA44AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAADiIAAAAAAAAOHgAADh4AAA4eAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAADfwAAA38AAAN/AAAAAAAAA34AAAN+A36AAAOBAAADgQOBg4QAAAAAA4QDhoAAAAADhgOGg4kAAAAAA4kAAAAAA4qAAAAAA4oAAAAAA4mAAAAAA4kAAAAAAAADiAAAAAAAAAOHAAAAAAAAAAAAAAOFAAADhQAAA4UAAAOFAAADhQAAAAAAAAOEAAAAAAAAA4MAAAAAA4KAAAOCg4MAAAOJA4mAAAOLgAAAAAAAAAADigAAA4oDiwONgAAAAAONg5AAAAOQA5CAAAAAAAAAAAORAAADkQORgAAAAAORAAAAAAAAAAAAAAAAAAADjgAAAAAAAAAAAAAAAAAAAAADioAAAAADigAAAAAAAAAAAAAAAAOHgAAAAAAAAAAAAAOFgAAAAAOFAAAAAAOEgAAAAAOEAAADhAOGgAAAAAOGAAAAAAOFgAADhYOHgAADioAAA4sDi4OOgAAAAAAAA42AAAAAAAADjIAAA4yDjQAAAAADjQOPgAAAAAOPAAAAAAOPA5QAAAAAAAAAAAOSgAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAADjIAAA40DjoAAAAAAAAONgAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAADhgAAAAAAAAAAAAAAAAODgAADg4AAA4OAAAAAA4UDioAAAAAAAAOJgAADiYOKAAADjAAAA4wAAAOMAAADjAAAA4wAAAOMA4yAAAOMg40Dj4AAAAADjwAAAAAAAAOQAAADkIAAA5CAAAAAAAAAAAOPAAAAAAOOgAAAAAOOAAAAAAAAA40AAAONA46AAAAAA44AAAAAAAAAAAAAAAAAAAOLAAAAAAAAAAAAAAAAAAAAAAAAA4cAAAAAA4aAAAAAAAADhYAAA4WAAAOFgAADhYOGgAADhoAAA4aDiQAAAAADiQOLgAAAAAOLAAADiwAAA4sAAAAAA4sDi4OOAAAAAAONgAAAAAAAA4yAAAOMgAADjIONAAAAAAAAAAAAAAAAAAAAAAOJgAADiYAAAAADiQAAAAADiIONgAADj4AAA4+DkAOSgAAAAAOSAAAAAAAAA5EAAAAAAAAAAAOPg5UAAAOXAAADlwOXg5oAAAAAA5mDnAAAAAADm4AAA5uAAAOcAAADnAAAAAAAAAObAAAAAAAAAAAAAAAAAAADmAAAAAAAAAOXAAAAAAOWgAAAAAOWAAAAAAAAA5UAAAOVA5WAAAAAAAADlIAAAAADlAAAAAAAAAAAA5KAAAAAA5IAAAAAA5GAAAAAAAAAAAAAA4+AAAOPg5AAAAAAA4+AAAOPg5CAAAAAAAAAAAOPg5ODlgAAAAADlgAAA5gAAAAAAAADlwAAAAAAAAAAAAAAAAAAAAAAAAOVAAADlQAAA5UAAAOVAAAAAAAAAAAAAAAAAAAAAAORgAAAAAORAAAAAAOQgAAAAAAAAAAAAAAAAAAAAAAAA4yAAAAAAAADi4AAAAAAAAAAAAADigAAAAADiYAAAAAAAAOIg42AAAAAA5ODlgAAAAAAAAOVAAAAAAAAA5QAAAAAAAADkwOTg5iAAAAAA5qAAAAAA5oAAAAAA5mAAAAAA5mDmgAAA5+DoAOigAADowAAA6QAAAAAAAADo4AAAAADowAAA6UAAAOlA6eAAAAAA6cAAAAAA6aAAAAAA6YAAAAAA6WAAAOlg6cAAAAAAAADpgAAAAADpYOoAAAAAAOngAAAAAOnAAAAAAOmgAAAAAOmAAAAAAOlgAAAAAAAA6SAAAAAAAADpAAAA6QAAAAAA6aAAAAAA6YAAAOmA6eAAAOuAAADroOxgAAAAAOxA7OAAAAAAAAAAAAAAAAAAAAAAAADr4AAA6+DsQAAA7EDsYAAAAADsQAAAAAAAAAAAAADrwAAA7EAAAAAAAADsAAAA7AAAAAAAAAAAAAAAAADsQAAAAAAAAOwAAAAAAOvgAAAAAOvAAADrwOwAAAAAAAAAAAAAAOuAAAAAAOtgAAAAAAAAAAAAAOrgAAAAAAAA6qAAAAAAAADqYAAA6mAAAOpgAADqYAAA60AAAOtg7CAAAAAA7AAAAAAAAADsQAAAAADsIAAAAAAAAAAA7EAAAOxA7GAAAOxg7KAAAAAAAAAAAAAAAAAAAOvgAAAAAOvAAAAAAOugAAAAAOuAAAAAAAAAAAAAAAAAAADqwAAA6sDq4AAA6uDrAAAAAAAAAOrg66AAAAAA64AAAAAAAAAAAAAAAADrYAAAAADrQOvgAAAAAOvAAAAAAAAAAAAAAAAAAAAAAOrgAAAAAOrAAAAAAAAAAAAAAAAAAAAAAAAAAADpoAAAAAAAAAAA6UAAAAAA6SAAAAAAAAAAAOjAAAAAAAAAAADoYAAAAAAAAAAAAAAAAAAA56AAAAAA54AAAAAA52AAAOdg58AAAOfAAADnwAAA58Dn4AAAAADnwAAAAADnoAAA6CAAAAAAAADn4AAA5+DoAOigAAAAAOiAAAAAAAAAAAAAAAAA5+AAAOhgAADoYOiAAAAAAOhgAAAAAAAAAAAAAAAAAAAAAAAAAAAAAOcgAAAAAOcAAAAAAObgAAAAAAAAAAAAAAAAAAAAAOYAAAAAAOXgAAAAAAAAAAAAAAAA5UAAAAAAAADlAAAAAADk4AAAAADkwAAAAADkoAAA5KDk4OWAAAAAAOVgAAAAAOXAAAAAAOWg5cDmYAAAAADmQAAAAAAAAAAAAAAAAAAA5YAAAOWA5aAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAADkQAAAAAAAAOQAAAAAAAAAAAAAAAAA42AAAAAA40AAAAAAAAAAAAAAAADioAAA4qAAAOKgAAAAAAAAAADiQOJgAAAAAOJAAAAAAOIgAADiQAAA4kAAAOPA4+DkgOSgAAAAAOSA5SAAAAAA5QAAAAAA5OAAAAAA5MAAAAAAAAAAAOTgAAAAAOTAAAAAAOSgAAAAAAAAAAAAAAAAAAAAAOPAAADjwAAA48AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAADhoAAA4aAAAAAA4YAAAAAA4WAAAAAAAADhIAAAAAAAAODgAADhAOEg4cAAAAAAAADhgAAAAAAAAOFAAAAAAOFAAAAAAOGgAAAAAOGAAAAAAOGAAAAAAAAAAADhoAAAAAAAAOFgAAAAAAAA4SAAAAAAAADg4OEgAAAAAAAA4OAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA36AAAAAAAADfYAAAAAAAAAAAAAAAAAAA3qAAAAAAAADeYAAAAADeQAAAAADeIAAAAAAAAAAAAADdoAAA3aAAAN3gAAAAAAAAAAAAAAAA3UAAAN1AAAAAAN0gAAAAAAAA3ODdAAAABhAGIAAABjAGQAZgBnAGgAaQBqAAAAawBsAG0AbgAAAG8AcABxAHIAcwB4AHkAAAAAAHoAewAAAAAAfAB9AAAAAAAAAH4AfwCBAIIAgwCEAIUAigCLAK4ArwAAAAAAAACwALEAtgC3ALkAugC7ALwAvQC+AMAAwQDCAMUAxgAAAAAAxwDIAMkAygDLAMwAAAAAAM0AzgElASYAAAEnASgBKQEqASsBLAEtAS4BLwAAAAABMAExATIBMwAAAAABNAE1ATYBNwE4AToBOwE8AT0BPgE/AUABQQFGAUcAAAFIAUkBSgAAAUsBTAFNAU4AAAFPAVABUQFSAVMBVAFfAWABYQGVAZYB1AHVAdcB2AHZAdoB2wHcAd0B3gHfAeAB4QHiAeMAAAHkAeUB5gHnAegB6gHrAewB7QAAAe4B7wHwAfEB8gH7AfwB/gH/AgECAgAAAgMCBAIFAgYAAAAAAgcCCAIJAgoCDQIOAAACDwIQAhECEgITAhQCFgIXAhgCGQIaAAACGwIcAh0CJAIlAicCKAIrAiwCLQIvAjACMQIyAjYCNwAAAjgCOQI6AkACQQJCAkMCRgJHAk0CTgJRAlICVAJVAlYCVwJYAlkCWgJcAl0CXgJfAmICYwJlAmYCZwJoAmsCbAJzAnQCdgJ3AngCeQJ6AnsCfAJ/AoACgQKCAoQChQKHAogAAAKJAooCiwKMAo4CjwKQApQClQAAApYClwKYApoCmwKdAp4CnwKgAAACoQKiAqMCpAKlAqYCpwKoAqkCqgKrAq4CrwAAArACsQKyArUCtgK+Ar8CwALDAsQCxgLHAsgCyQLKAswCzQLOAtAC0QLTAtQC1QLWAtcC2ALcAt0C4ALhAuQC5QLmAugC6QLtAu4C7wLwAvMC9AL5AvoC/gL/AwQDBQMGAwoDCwMOAw8DEgMTAxQDFgMXAxgDGQMaAxsAAAMcAx0DHgMfAyADIgMjAyQDJgMnAygDKQAAAyoDKwMsAy0DLgMwAzEDMgMzAzcDOAAAAzkDOgAAAAADOwM8AAADPQM+Az8DQAAAA0EDQgNDA0QDRQNGA0cDSQNKA0sDTAAAA00DTgNPA1ADUQNTA1QDVQNWAAAAAANXA1gDXQNeA2ADYQNiA2MDZANnA2gDaQNqA3MDdAN3A3gDewN8A38DgAOCA4MDhAOFA4YDkAORA5IDkwOUA5UDlgOXA5kDmgOcA50DngOfA6ADoQOjA6QDpQOsA60DrwOwA7IDswO3A7gDuQO7A7wDvQO+A78AAAAAAAADwAPBA8IAAAPDA8QDxQPGA8cDyQPKA8sDzgPPAAAD0APRA9ID1QPWA9cD2QPaAAAD2wPcA90D3gPjA+QD5wPoAAAD6QPqA+sD7wPwA/MD9AP2A/cD+gP7BAgECQQNBA4EEAQRBBMEFAQnBCgEKgQrBC0ELgQyBDMENQQ2BDcEOAAABDkEOgQ7BDwEPgQ/BEEEQgRDBEQAAARFBEYERwRIBEkESgRNBE4AAARPBFAEUQRSBFMEVgRXBFgEWQAABFoEWwRcBF0EXgRfBGIEYwAABGQEZQRmBGkEagRtBG4EcQRyBHUEdgR6BHsEfwSABIYEhwSJBIoEjASNBI8EkASSBJMElwSYBJwEnQSgBKEEowSkBKUEpgAABKcEqASpBKoAAAAAAAAEqwSsBK0ErgSwBLEEsgSzAAAEtAS1BLYEuAS5BL4EvwTBBMIEwwTEBMUAAATGBMcEyATJBMoEywTOBM8AAATQBNEE0gTTBNQE1gTXBNgE2QAABNoE2wTcBOEE4gTkBOUE5gTnBOoE6wTzBPQE/QT+BQEFAgUJBQoFEAURBRQFFQUYBRkFHAUdBR8FIAAAAAAFIQUiBSMFJAUnBSgFKwUsBS4FLwUwBTEFMgUzBTQAAAU1BTYFNwU4BTkFOwU8BT0FPwVABUEFQgAABUMFRAVFBUYFRwVIBUwFTQVRBVIFVAVVBVYFVwVYBVsFXAAABV0FXgVfBWAFYQVkBWUFZgVpBWoAAAVrBWwAAAAAAAAFbQVuBW8FcAVxBXYFdwWFBYYFhwWJBYoFiwWMBY0FjgWSBZMFpAWlBawFrQWvBbAFsgWzAAAFtAW1BbYFuQW6BbsFvAW9AAAAAAW+Bb8FwAXBBcIFwwXEBcgFyQXLBcwFzQXOAAAFzwXQBdEF0wXUBdYF1wXZBdoF3AXdBd8F4AXiBeMF5AXlBecF6AXpBeoAAAXrBewF7QXuBe8F8gXzAAAF9AX1BfYF+gX7BfwF/gX/BgEGAgYHBggGCwYMBg8GEAYUBhUGFwYYBhkGGgYbBhwGHwYgBigGKQYzBjQGNwY4BjwGPQY/BkAGQgZDBkUGRgZHBkgGSQZLBkwGTgZPAAAGUAZRBlIGUwZUBlUGWAZZAAAGWgZbBlwGXQZeBmEGYgZkBmUGZwZoBmkGbAZtBm4GbwAABnAGcQZyBnMGdAZ3BngGfAZ9Bn8GgAaCBoMGhAaFBo4GjwaRBpIGlQaWBpkGmgAABpsGnAAAAAAGnQaeBp8GoAahBqIAAAajBqQGpQanBqgGqgarBqwGrQAABq4GrwawBrEGsga1BrYGuga7BsAGwQbCBsMGxAAAAAAGxQbGAAAGxwbIBskGygAABssGzAbNBs8G0AbSBtMG1AbVAAAG1gbXBtgG2QbaBt0G3gAABt8G4AbhBuIG4wbmBucG6QbqBusG7QbuBvAG8Qb1BvYG/gb/BwMHBAcHBwgHCwcMBxAHEQcTBxQHFQcWBxoHGwceBx8HJAclBygHKQcsBy0HMwc0BzYHNwc4BzkHPAc9Bz8HQAdBB0IHQwdEB0kHSgAAB0sHTAAAAAAHTQdOB08HUAAAAAAHUQdSB1MHVAdVB1gHWQAAAAAHWgdbB10HXgdiB2MAAAAAB2QHZQdvB3AHcgdzB3UHdgd4B3kHggeDB4YHhweKB4sHlQeWB5oHmwecB6IHowemB6cHqwesAAAAAAetB64HrwewB7EHsgezB7QHtQe2AAAHtwe4B7kAAAAAB7oHuwe8AAAHvQe+B8EHwgAAB8MHxAfFB8YHxwfLB8wH0AfRB9UH1gfXB9gAAAAAB9kH2gAAB9sH3AfdB94H3wfgB+EH4gfjB+QH5QfoB+kH7AftB/AH8QfyB/UH9gf3B/gH+Qf6B/sH/AAAAAAAAAf9B/4H/wgACAIIAwgECAUAAAgGCAcICAgJCAoICwgNCA4IDwgQCBIIEwgUCBgIGQgcCB0AAAgeCB8IIAgiCCMIJQgmAAAIJwgoCCkIKggrCC4ILwgyCDMINgg3CDoIOwg9CD4IPwhACEEIQghGCEcISghLAAAITAhNCE4ITwhQCFMIVAhXCFgIWwhcCF8IYAhjCGQIaAhpCGoIbghvCHEIcghzCHQIdQh2CHcIeAh7CHwIfwiACIIIgwiECIUIhgiHCIgAAAiJCIoIiwiMAAAIjQiOCI8AAAiQCJEIkwiUCJUIlwiYAAAImQiaCJsInAidCJ4IoQiiAAAIowikCKUIpginCLEIsgi0CLUItgi3CLgIuQi7CLwIvQi+CMEIwgjICMkAAAAACMoIywjNCM4I0gjTCNUI1gjXAAAAAAAACNgI2QjaCOEI4gjmCOcI6gjrCO4I7wjxCPII8wj0CPUI+wj8CP8JAAkGCQcJCwkMCRAJEQkTCRQJFgkXCRkJGgAAAAAJGwkcAAAJHQkeCSAJIQkiCSQJJQAACSYJJwkoCSkJKgkrCS4JLwAACTAJMQkyCTYJNwk6CTsAAAk8CT0JPglDCUQJRglHCUgJSQlLCUwJTQlOCU8JVwlYCVsJXAlfCWAJYwlkCWwJbQlvCXAJcQlyCXQJdQl2CXcJeAl8CX0AAAl+CX8JgAmBCYIJgwmGCYcAAAmICYkJigmRCZIJlQmWAAAJlwmYCZkJmgmbCZ4JnwmoCakJrAmtCbgJuQm+Cb8JwgnDCcgJyQnOCc8J1wnYCdsJ3AnfCeAJ4gnjCeQJ5QnmCecJ6QnqCewJ7QnvCfAJ8QnyCfUJ9gn5CfoAAAn7CfwJ/Qn/CgAKBAoFCgcKCAoJCgoAAAoLCgwKDQoOCg8KEgoTChoKGwAAChwKHQoeCiAKIQojCiQKJQomCikKKgo2CjcKOgo7Cj4KPwpICkkKTApNClQKVQpZCloKXQpeCmEKYgplCmYKaAppCmoKawpsAAAKbQpuCm8KcApxCnQKdQAACnYKdwp4CnsKfAp/CoAKgQqCAAAKgwqECoUKhgqHCooKiwqTCpQKlgqXCpgKmQqmCqcKqwqsCrMKtAq3CrgKvwrACsIKwwrFCsYKywrMCs0KzgrRCtIK1QrWCtcK2QraCtwK3QAACt4K3wrgAAAAAArhCuIAAAAACuMK5ArmCucK6ArpAAAK6grrCuwK7QruCu8K8ArzCvQAAAr1CvYK9wr4CvkK/Ar9CwALAQsECwUAAAAACwYLBwsMCw0LEAsRCxQLFQseCx8LIQsiCyQLJQs4CzkLOws8Cz8LQAtDC0QLSAtJC00LTgtPC1ELUgtTC1QAAAtVC1YLVwtYC1kLXQteC2ILYwtkC2cLaAAAC2kLagtrC24LbwtyC3MLdAt3C3gAAAt5C3oLewuAC4ELhQuGC4oLiwuPC5ALkQuSC5MLlwuYC6QLpQupC6oLsguzC7cLuAu7C7wLvwvAC8YLxwvJC8oLywvMC84LzwvWC9cL2QvaC90L3gviC+ML5AvlC+YAAAAAC+cL6AABAZIBAgJuAd4AAwAAASM1MwJu3NwBAtwAAAAAAgBk//MAwQLtAAMABwAAEzMDIxcVIzVkXQ8/TVsC7f3GYl5eAAAAAAIAWgHjAX8DAwAFAAsAABMvATMPATMvATMPAW4SAmACEo0SA2ECEwHjuWdnublnZ7kAAAACACgAAAIJAtYAGwAfAAAzNyM1MzcjNTM3MwczNzMHMxUjBzMVIwcjNyMHEzM3I2UbWGAVX2cZQBiKGj8YWGAVX2cbQRuKHCSKFYvgRKZEyMjIyESmRODg4AEkpgAAAAADACf/qgIbAy8AMwBCAE0AACUOAwcVIzUuASc3HgMXEScuAScuAzc+Azc1MxUeARcHLgEnFRceAxUUBgEXNQ4DFRQWFx4DFxU+ATc1NCYnLgECGQYmN0UlPkB6LTEPKzIzFzcUJxMTHRMJAQIlOUknPjZLJykaQSQuHzotGwH+4BQWLicZDhIGCxAaZzZGBQMJE0GoJzspGAVWVAMwMD8SHhYNAQEPFQkTDAsjKSkRKUEvGgFSUgYlJzMYIwL9EQ0iLjomCBEBAAbrAQ8aJhkXKg8GCQoLc/kCNDkKCxYTICEAAAAFACb/9ANxAuwACwAPABsAJwAzAAATIiY1NDYzMhYVFAYDATMBAzI2NTQmIyIGFRQWASImNTQ2MzIWFRQGJzI2NTQmIyIGFRQWzUxbW0xOW1tBAZVP/mxdKjQ0KiozMwImTF1dTExcXEwqMzMqKjQ0AS9wcHBtbXBwcP7FAvj9CAF5SlhWSUpVV0v+iW9wcG1tcHBvPklYV0lJV1dKAAAAAwAfAAACjgLXACUANQBDAAAlFyMnDgEHIiYnNTQ2NycuASc0NzMyHgIXFA4CBxc+ATczDgEBIw4BFRQWHwE+AzUuARMnDgMVFB4CMz4BAgeHY08rb0ZnbwdOSAYbLgKhBSE4KhkBFiUyHbsQIQ1NETT+7AUrMhkhDxMnHxQCLXrHGCwhExYnNiA3U5CJVSovA2VVDUJoIQgfSy2gBhQmNiMiOTAmD8MTTUJRYwHoBC8rFzMrEAwdIikZJjD9+s0NICkwHhkqHxECJwAAAQBaAeMAugMDAAUAABMvATMPAW4SAmACEgHjuWdnuQABAFz/cQEoA2gADQAABQcuATU0NjcXDgEVFBYBKDlFTk5FOUI+PnQbcPeVlPdwGm3whITwAAAAAAEAK/93APcDbgANAAAXJz4BNTQmJzceARUUBmM4Qj4+QjhGTk6JG23whITwbRpw95SV9wABAEAB1wGRAxwADgAAEyc3JzcXNzMXNxcHFwcnmiw/bRJyCjYKchFtQCxPAdcgaC0zHHl4GzMtaCBfAAABACYAdAIFAm0ACwAANzUjNTM1MxUzFSMV8cvLScvLdNtE2tpE2wAAAQAU/7UAkwB/AAMAABc3MwcUJFs9S8rKAAAAAAEAMgFNAXwBkwADAAATNSEVMgFKAU1GRgAAAAABACr/8gCFAFAAAwAAFzUzFSpbDl5eAAABAAv/fwF5A0sAAwAAFwEzAQsBLEL+1YEDzPw0AAAAAAIAH//yAjkC6QATACcAAAEUDgIjIi4CNTQ+AjMyHgIHNC4CIyIOAhUUHgIzMj4CAjkqSGI5OWJJKSlJYjk5YkgqXB0xQCMjQDAdHTBAIyNAMR0BbWGPXi0tXo9hYo9eLS1ej2JWdUcfH0d1VlV1SB8fSHUAAQBwAAACDgLhAAwAACUzFSE1MxE0NwcnNzMBfpD+dKMBhTHFSUpKSgIeBgV3O6oAAQA1AAACIQLqACUAACUhFSE1Nz4DNS4BIyIOAhUnPgMzMh4CFRQOAg8BPgEBAAEh/hT9HTEjFAJMOR82JxZaByo/Ui8vUTwiGCo4H80VK1FRQPMfNzg5IEI/FSc0IA8zTTUbHDVMMSlGQT0fywYGAAEAMP/zAiIC6QA3AAATJz4DMzIeAhUUBgcWFRQOAiMiLgInNxYXHgEzMj4CNTQuAiM1PgM1NCYjIg4ColsHKj9SLzBPOiBFPJInQ1szO1M6JQ1SAwwXSDknOycTDypKOzBDKhJJOh82JhYCCQ8yTjUcHDJGKkhPFCSNMlI5Hx40RygiEB0wNxkoMhgeMiQVQgEUIzAcPz4WJzQAAAIAFgAAAkQC5QAKABAAAAEzFSMVIzUhNQEzASERNDY3AdVvb1H+kgFpVv6lAQoCAgELSMPDRAHe/iYBMg0hEAABAD3/9wIWAuAAIwAAEwc2MzIeAhUUDgIjIiYnNx4BMzI+AjU0JiMiBgcnEyEV4CExODpZPB8pSGE4QmsiMSFULSZALhpYTx07IDs8AV8CjMANIjxSMDpgQyUvIEMcJBcsQChIUA0LEQFbVAACADT/8wIoAuEAGgAsAAABAw4BBz4BMzIeAhUUDgIjIi4CNTQ2NxMDMj4CNTQuAiMiDgIVFBYBzt0NEQUbPiUtUDwjJUNeODhbQCMrMMwzJD0rGBgqOiIlOyoXUALh/usSGAYSFB05UjUzWEIlJEJdOTFvPwET/V8YKjoiJDsoFhkrOB9IWAAAAQBFAAACJwLdAAcAABMhFQEjATchRQHi/rVlASsi/oEC3Tv9XgJXOAAAAAADACz/7wImAu8AHgAuAD4AAAEeARUUDgIjIi4CNTQ2Ny4BNTQ+AjMyHgIVFCciBhUUHgIzMj4CNTQmAzI2NTQuAiMiDgIVFBYBlUZLJUNcODheQyVMRTk9IDtUNDJUPCHjRUMOIDQmJTMgDkJES1AZKzgfHzksGVIBfhNeSDFPOB4eOE8xSF4TFlc/KUc2Hx82RymA/Eo1GTAmFxcmMBk1Sv2UTT8nNyMRESM3Jz9NAAIANQAAAh0C7wAZACkAADMTPgE3BiMiLgI1ND4CMzIeAhUUBgcLARQWMzI+AjU0LgIjIgaJ5BATBTtSK005IiVCWzc2WD8iLirJak9FJjopFRcoOCBGVQEjFRwHLxw3UDQxVkAlJEBZNkJrOv7rAgpJTRgpNR0kOScVUwACAEkAOQCkAkEAAwAHAAATNTMVAzUzFUlbW1sB415e/lZeXgACACX/zQCkAkEAAwAHAAATMxUjAzczB0lbWyQkWz0CQV796srKAAAAAQAmADUBuQKhAAYAACUBNQEVDQEBuf5tAZP+vAFENQEQQwEZW+HUAAIAJgDXAgUCCgADAAcAABM1IRUFNSEVJgHf/iEB3wHGRETvREQAAAABAD8ANQHSAqEABgAACQE1LQE1AQHS/m0BRP68AZMBRf7wXNThW/7nAAAAAAIAKP/zAa8C+QAjACcAACUjJj4ENTQuAiMiDgIHIz4DMzIeAhUUDgQXFSM1ARNLBhIhKiYZDx0pGxMoIxgDTQQrPEYfKkQwGRsmLCMSDFuuP1I5KSw2KhouIhUNITcqQ1UxEx82SCkxQjMsNUiTXl4AAAAAAgA4/1MDeQLSAEoAWQAABSIuAjU0PgIzMh4CFRQOAiMiJicjDgEjIiY1ND4CMzIXMzczBw4BFRQXFjMyPgI1NC4CIyIOAhUUHgIzMjY3Fw4BAzI2PwEuASMiDgIVFBYBwlKQaj5MgKldVIhgMylBTyYuQAUDG0glOU0eOFAxOx4CDTwsBAQMCy4bNSwbKE50TEuMbkIyWXpHM10mGDFpThczHSAQIRchNSQULa00ZZZhcLeBRzZhiFNJb0smKisgLVFOLFxLMDcu3xYeCBgXGB87VjZEc1MvPXGfYlJ/Vy4cFjYdHAErHyOyGhUkN0MgNi8AAAIAAwAAAlwC3QAHABEAACEnIQcjEzMTATMnLgEnIw4BBwH6Rv70R175Z/n+Y94jFCQSBBEkFODgAt39IwEqcD95QEJ3PwAAAAMAZAAAAmQC3QATABwAJQAAMxEzMh4CFRQGBxUeARUUDgIjAzMyNjU0JisBETMyNjU0JisBZNo4XUIlODRCVClJZj6NbV9SVVhxgGFnZ2GAAt0UK0QwN1cRBQ1XSzZRNRsBpUE4QjT9tkVLRT8AAAABADr/8wJaAusAIQAABSIuAjU0PgIzMhYXBy4BIyIOAhUUHgIzMjY3Fw4BAXlEdVUxMVd3RkNmIDIdSTA0VT0hIDtVNDZRIzMtbA00YY1ZWY1jNDgjPB8nKU1uRUVwTiosJjozNgAAAAIAZAAAAnYC3QAKABMAADMRMzIWFRQOAiMnMzI2NTQmKwFkuK6sLVd/U19Tg398hlMC3bi0V4lfMkyZjI+SAAABAGQAAAIWAt0ACwAAMxEhFSEVIRUhESEVZAGn/rYBFv7qAVUC3U7mT/71TwAAAAABAGQAAAILAt0ACQAAMxEhFSEVIRUhEWQBp/62ARj+6ALdTvhO/rcAAQA6//MCZwLrACcAAAUiLgI1ND4CMzIeAhcHLgEjIg4CFRQeAjMyNjc1IzUzEQ4BAYRIelcxMlp7SSZANCkQMhxKOTdaPyMgPls7KEcWm/AjdQ00YY1ZWY1jNBAZIRE8HSkpTW5FRXBOKhcUwE3+zCUwAAABAGQAAAJzAt0ACwAAMxEzESERMxEjESERZF0BVlxc/qoC3f7NATP9IwFa/qYAAAABAGQAAADBAt0AAwAAMxEzEWRdAt39IwABACP/8wG2At0AEQAAFyImJzceATMyNjURMxEUDgLtRmQgQhk+KDw6XBcwTA07OS8tJUdVAf39+i9TPiQAAAAAAQBkAAACggLdAAwAADMRMxEzATMDASMDBxVkXQMBMmjlAQlo234C3f6QAXD+6f46AX6W6AAAAAABAGQAAAIBAt0ABQAAMxEzESEVZF0BQALd/XJPAAAAAAEAZAAAAsgC3QAfAAAzETMTHgEXMz4BNxMzESMRNDY3IwcDIwMnIx4DFRFkcI0NGQ4FDRgNjHBXCAQEOos+izoEAQQDAwLd/ngmTSYmTSYBiP0jAZYwdzGn/oMBfacYODk3GP5qAAAAAQBkAAACbgLdABMAADMRMwEXMy4BNREzESMBJyMeARURZGABC04FBAhYX/71TwQDCALd/jKXOXY5AX39IwHPlzlyOv5/AAAAAgA6//MCrALrABMAJwAABSIuAjU0PgIzMh4CFRQOAicyPgI1NC4CIyIOAhUUHgIBc0VzUy4uU3NFRXNTLi5Tc0UyUDkfHzlQMjFROR8fOVENNWOOWFiMYjQ0YoxYWI5jNVErTm9FRW5NKSlNbkVFb04rAAACAGQAAAJIAt0ADgAXAAAzETMyHgIVFA4CKwEZATMyNjU0JisBZNE+ZUgoJ0hjPHltYV1hYWkC3RYzUjw6Vjgb/t0BbklPTz0AAAAAAgA6/38CrQLrABYAKgAABScGIyIuAjU0PgIzMh4CFRQGBxclMj4CNTQuAiMiDgIVFB4CAjRoIzZFc1MuLlNzRUVzUy5NQpD+xjJQOR8fOVAyMVE5Hx85UYGBDTVjjlhYjGI0NGKMWHOoMKfFK05vRUVuTSkpTW5FRW9OKwAAAAACAGQAAAJgAt0ADwAYAAAhIwMjESMRMzIeAhUUBgcDETMyNjU0JiMCYGmyhF3mOF5EJltL43tYWlpYATf+yQLdFTFPOVhkEgFR/vBFSEk6AAEAL//zAikC6wAzAAAFIiYnNx4BMzI2NTQuAi8BLgM1ND4CMzIWFwcuASMiBhUUHgIfAR4DFRQOAgEwToMwNyhqOUhSEyEsGmoZNSscIz1VMkJvJzEiUjM/ShYiLBVpIDcpFyNAXQ06Mz8qMUI2HCccFwwuCx8tPSgqSDQdMSo7ICU5MxsmHBQJLQ4iLj0pK0w5IAABAB8AAAI4At0ABwAAMxEjNSEVIxH93gIZ3gKPTk79cQAAAAABAGH/8wJwAt0AGQAABSIuAjURMxEUHgIzMj4CNREzERQOAgFoOGBHKF0aLj4kJUAvG1koR2ENIEt5WAGu/k9CWTYXFzZZQgGx/lJYeUsgAAEAAQAAAj8C3QANAAAzAzMTHgEXMz4BNxMzA+vqYXcUHRYEFB8Udl7pAt3+c0BxQUFwQQGN/SMAAQAZAAADUwLdACAAADMDMxMeARczPgE3EzMTHgEXMzY3EzMDIwMuAScjDgEHA7WcYE0LFQsEDRoOZVRnDhkNBRUVTVmYb28KEQkECRMJbQLd/nE8dTw8dTwBj/5xPHU8eHUBj/0jAbotUCoqUC3+RgAAAAABABEAAAIsAt0AGQAAMxMDMxceARczPgE/ATMDEyMnLgEnIw4BDwER1shmZA4aEgQPFw5iYcjWZmwOHxIEEB0OagF7AWK7GjEgIDEau/6Z/orGGzohIDwaxgAAAAH//wAAAhQC3QAPAAAzEQMzFx4BFzM+AT8BMwMR29xjXhIiFAQUJBFfYNwBHQHAzypMKipMKs/+QP7jAAEAMgAAAisC3QAJAAAzNQEhNSEVASEVMgGD/qAB0v59AYc3AlhONv2oTwAAAQBp/40BMANOAAcAABcRMxUjETMVaceCgnMDwTP8pjQAAAAAAQAP/38BfANLAAMAAAUBMwEBOv7VQgErgQPM/DQAAAABACL/iwDpA0wABwAAFzUzESM1MxEigoLHdTQDWjP8PwAAAAABACwBxQGmAt4ABgAAGwEzEyMnByyePp5TamoBxQEZ/ue7uwABAA3/ygIhAAcAAwAAFzUhFQ0CFDY9PQABAJACgQFuA2gAAwAAASc3FwE/r0CeAoGqPboAAgA6//MB4wItAB8AKwAAFyIuAjU0Njc0LgIjIgYHJz4BMzIeAhURIycjDgEnMjY3NQ4DFRQW2CI6KhitoQoZLCEwWCAkJnNCMkctFksIAydbGShGKEhfOBY1DRYpOyVpWwIaMiYXHxZBGCggO1Iy/rI6ICdJHCOhBRMfLSAwLAACAFz/8wI3AxwAFgAlAAAFIiYnIwcjETMVBz4BMzIeAhUUDgInMjY1NC4CIyIGBxEeAQFLJlEkAwhJWwMlWC01UTccJ0FVPkVXECI2JyNIJyRGDSQhOAMc2mIgLShIZj5GbksnTHJmLUo1HSYl/uMgGQAAAAEAM//zAeECLQAhAAAFIi4CNTQ+AjMyFhcHLgEjIg4CFRQeAjMyNjcXDgEBMjZdRScrSF80NkwdLxg0ISU+LRoYLT4lJkAaJyRaDSZJakNEakomJho9FhseOE0vL002Hh8XPSEkAAAAAgA1//MCDwMcABYAJQAABSIuAjU0PgIzMhYXJzUzESMnIw4BJzI2NxEuASMiDgIVFBYBFTNTOiAnQFYuMEUkBVtKCQIgVB0mQyIjPyIhOSsYTg0mSGpEQmpKKCIeXtH85EAgLUwlJgEdHxoeN0wvZG0AAAACADP/8wIAAi0AHAAlAAAFIi4CNTQ+AjMyHgIVFAYHIR4BMzI2NxcOAQMhNCYjIg4CATc2X0YpKURZLzRQNx0CAv6SBWFOKEIeISRX4wEjR0AdNSocDSZJakNCakooJENeOg8bClhmFxQ8FyEBSFVUFys/AAEAIQAAAWQDKQAVAAABByYjIh0BMxUjESMRIzU3NTQ2MzIWAWQUJRhNc3NbSkpNURkuAxdFDmtWSv4rAdVFBVdVXgoAAwAy/wYCJQItADYARgBYAAAFIi4CNTQ2NzUuATU0Njc1LgE1ND4CMzIWFzMVIx4BFRQOAiMiJw4BFRQWOwEyFhUUDgIDMj4CNTQmIyIGFRQeAhMyPgI1NCYrASImJw4BFRQWARMyUzshKyYWHCgVGywhOEopFycOvW8UGB82SCksJQ8UKDdqYVwmSGU/FyofE0MwMEQTHyolJ0AtGTk2Xg8lEh0bU/oTJTcjIz8ZBA0sICI0DwQWSzEtRzMbCQVGEzojK0YyGhMNHRcaIT5DJkQ0HgHkEiIvHjxDQzweLyIS/loTHykVJh0EBRUvGC0zAAAAAAEAXAAAAg4DHAAUAAAzETMVBz4BMzIWFREjETQmIyIGBxFcWwMmVTlYTlsxNipBKgMc2nAmNWtq/qgBTE5DKSr+dgAAAgBLAAAApwLtAAMABwAAExUjNRMjETOnW1pbWwLtXl79EwIfAAAAAAL/1P8NALkC7QADABMAABMVIzUDIiYnNx4BMzI2NREzERQGuVs6GSkOEgsaDioaW0QC7V5e/CAJBUYEBjgzAl39o1NiAAAAAAEAXAAAAh4DHAAMAAAzETMRMxMzBxMjAwcVXFoC6WW2zmOfZgMc/eQBH9r+uwEGd48AAAABAFwAAAC3AxwAAwAAMyMRM7dbWwMcAAABAFwAAANJAi0AIQAAMxEzFzM+ATMyFhc+ATMyFhURIxE0JiMiBxEjETQmIyIHEVxLCAMjVTE/RhEqVjNVUFsxNDxNWzE0P0oCH08nNjgwLjprav6oAUxOQ1P+dgFMTkNT/nYAAQBcAAACDgItABQAADMRMxczPgEzMhYVESMRNCYjIgYHEVxLCAMnVjlYTlsxNipBKgIfTiY2a2r+qAFMTkMpKv52AAACADP/8wIrAi0AEwAnAAAFIi4CNTQ+AjMyHgIVFA4CJzI+AjU0LgIjIg4CFRQeAgEvMltGKSlGWzIyW0YpKUZbMiM6KhcXKjojIzopFxcpOg0mSWpDRGpKJiZKakRDakkmTB42TS8vTTgeHjhNLy9NNh4AAAIAXP8bAjcCLQAWACUAABcRMxczPgEzMh4CFRQOAiMiJicXFRMyNjU0LgIjIgYHER4BXEsIAyVYMDVQNxwnQVUvJUwlAoVFVxAiNicjRyglReUDBD4eLihIZj9GbUsnIR5fuAEkcmYtSjUdJiX+4yAZAAAAAgA1/xsCDwItABYAJQAABTU3DgEjIi4CNTQ+AjMyFhczNzMRAzI2NxEuASMiDgIVFBYBtAUhUzAzUzogJ0BWLjBIIwMJSOYmQyIjPyIhOSsYTuXBYyAsJkhqREJqSigiIDT8/AEkJSYBHR8aHjdML2RtAAABAFwAAAGGAi0AFAAAMxEzFzM+ATMyFhcHLgEjIg4CBxFcSwgDHU8uEhsNEQ4WERAmJCINAh9jND0FB1AFBA0dMCP+owAAAAABAB//8wGwAi0AMQAAFyImJzceATMyNjU0LgInLgM1ND4CMzIWFwcuASMiBhUUHgIXHgMVFA4C6jpqJy0jTTE2NRYjLBccOi8dGTBGLDNWICwdOyUzMBQiKxceOy8eGjJKDSsgPB0jMiMVHhgTCQoaJTIiIDgqGCQZOxUbLiATHBURCQsZJjUmITsrGgAAAAABABv/8wFrArcAGQAABSIuAjURIzU/ATMVMxUjERQWMzI2NxcOAQEHKzwkEFFVC0yTkyQwDiIOEhc0DRovQykBLUUFmJhK/tEzNgkFRAgMAAEAVf/zAgQCHwAUAAAXIiY1ETMRFBYzMjY3ETMRIycjDgH6WE1bMDYqQidbTAcDJlUNamoBWP6zTEQrMQGB/eFVLTUAAQANAAAB/AIfAA0AADMDMxMeARczPgE3EzMD0cRfZg0ZDQQMGgxnWsECH/7LKFImJlIoATX94QABABsAAAMHAh8AIQAAMwMzEx4BFzM+ATcTMxMeARczPgE3EzMDIwMuAScjDgEHA7KXXVEIEAgFCRELVFlVChIKBAkQCVBWkm5PCxAKBQkRC0wCH/7GJ0smJkwmATr+xidLJiZLJwE6/eEBJSZMKipNJ/7dAAEADwAAAeMCHwAZAAAzEwMzFx4BFzM+AT8BMwMTIycuAScjDgEPAQ+zpWJJDRsOBA0YDENfpbNkUA4dDwUOHA5JARsBBHgXLBcXLBd4/vP+7n8ZMRcXMRl/AAAAAQAO/xYB/QIfAA4AABcjNwMzEx4BFzM+ATcTM+hVVdpfbwwbDQULGAthWervAhr+2CNQJSVPJAEoAAAAAQAjAAABvgIfAAkAADM1ASM1IRUBIRUjAR7/AXL+4gEoMQGkSjH+XEoAAAABACb/iwEwA0wAMwAABSMiLgI1NDY1NC4CIzUyPgI1NCY1ND4COwEVIyIGFRQWFRQGBxUeARUUBhUUFjsBATAxITIgEAoJFSUdHSUVCQoQIDIhMR0tHwYeJSUeBh8tHXUOIjksPWI4ER8ZDzkPGR8QOWM8LDkiDjMxNjNeOjY5CgQLOTY5XzM2MAAAAAEAZ/95AKcDTwADAAAXETMRZ0CHA9b8KgAAAAABACL/iwEsA0wANwAAFzUzMjY1NCY1NDY3NS4BNTQ2NTQmKwE1MzIeAhUUBg8BDgEVFB4CMxUiDgIVFBYVFA4CIyIdLh4FHiQkHgUeLh0yITEgEAMBAwEBCBYlHBwlFggJECAxIXU0MDYzXzk2OQsECjk2Ol4zNjEzDiI5LB42GjQNGw4QHxkPOQ8YIBE4Yj0sOSIOAAAAAAEAKAEfAgMBwgAXAAABIi4CIyIGByc+ATMyHgIzMjY3Fw4BAXghNS4rGBgqFDMfSCUhNC4rGBgqEzQfSAEfHiMeICQkNi4dJB0gJCU2LgAAAgBy/yIAzwIcAAMABwAAEzUzFRMjEzNzWwFdDz8Bvl5e/WQCOgAAAAIAHgBzAg0CbgAbAC8AADcnNyY1NDcnNxc2MzIXNxcHFhUUBxcHJwYjIic3Mj4CNTQuAiMiDgIVFB4CTjBHKChHMEw1R0U2TDBIKSlIMEw2RUY2fBswJBUVJDAbGzEkFRUkMXMySTRNTzRKMk4qKk4ySjVOTDVJMk0qKhoWJzchITgoFhYoOCEhNycWAAAAAAEACAAAAkwC0QAfAAAzNSM1MzUjNTMDMx4DFzM+AzczAzMVIxUzFSMV/b6+vqfeYDVCKBgLBQoYKUE0Xd2ov7+/rTlFOAFuXndLLBMTLUx2Xf6SOEU5rQACAQv/wALcAwgAPABPAAABBy4BIyIOAhUUHgIXHgEVFAYHHgEVFA4CIyInNx4BMzI2NTQuAicuAzU0NjcuATU0PgIzMhYBDgEVFB4CFx4BFz4BNTQuAgK2GRVTORwuIREXKjkhWmclHQ8bIz1RL3pBHBVQPEJKDiQ8LzFMMxojKhMVJj1NJjpZ/u4aFwkdNS09QA8TFDtUWwLbPg4eDxkfEBcgGBMJGE5EK0oYDDUiJ0AtGTI9ESA7KxQfGxoODyAoNCMdSB4OMxYsPygTHP8AFS0WDxoaGw8UGQkRMBkoLx8ZAAACAIwCkAHRAv8ACwAXAAATIiY1NDYzMhYVFAYzIiY1NDYzMhYVFAbEGCAgGBgfH74YHx8YGB8fApAgFxggIBgXICAXGCAgGBcgAAAAAgAyAEoBuAHqAAgAEQAANyc1NxcHHgEfASc1NxcHHgEX2qioLZAjTSGCqKgtkCNNIUq/IcAnqyhYKiS/IcAnqyhYKgACAC0B4AFFAv0AEwAfAAATIi4CNTQ+AjMyHgIVFA4CJzI2NTQmIyIGFRQWuRwyJxcXJzIcHDMmFxcmMxwmLi4mJi4uAeAUJTUgITQmFBQmNCEgNSUUMzMoKjIyKigzAAACAIkAEgNjAyQACwAPAAABFSERIxEhNSERMxEBIRUhA1/+t0T+twFJRP5zAtr9JgISRf7tARNFARL+7v5FRQAAAQAsAbkBZQN6ABoAABM1PgM1NCYjIgYHJz4BMzIWFRQOAgczFTozTTUaLiYcLxMrGkwtQk4YLDsjuAG5KS5JPTQZKzElGycmLkdGHzo8PiQ9AAAAAQAoAawBZAN6ACoAABMiJic3HgEzMjY1NCYjNTI2NTQmIyIGByc+ATMyHgIVFAYHHgEVFA4CyjZTGS8UOCIkNEZCOT4rJBguEyobRS0dMicWKyImOBkqOAGsMCUkHiMpJSYpLS0iHyYeFyYgJxAeLBsnNBAKNS0eMCISAAEA8AKBAc4DaAADAAABJzcXAR8vnkACgS26PQABAPL/xwKyAvwAFAAABREjIi4CNTQ+AjMyFhcRIxEjEQHdCSJQQy0zV3M/Mz0UQFU5AV8aNlI4R2A7GgQF/NQC9v0KAAEA0gE9AS0BmwADAAABFSM1AS1bAZteXgAAAAABAM3/AwGNAAMADwAAFyc+ATU0Jic3MwceARUUBtYJRjMmMDA8ICYrX/0tBRoZFRkIZUsJIyIxMQAAAAABAGIBuQEIA20ACAAAExEjNT4BNzMRwF4kMBc7AbkBWS4HFRH+TAAAAgAnAEYBrQHmAAgAEQAAARcVByc3LgEvARcVByc3LgEnAQWoqC2QI00hgqioLZAjTSEB5r8hwCerKFgqJL8hwCerKFgqAAAABABH//MDRQLrAAMADAAXABwAAAEzASMTIxEjNT4BNzMBFSMVIzUjNRMzESMzNTcjAl4+/ms9IkdeJDAXOgJZQUHGt1C9fAYFAuv9CAE3AVgvBxQR/coydXUkARv+81B5AAAAAAMAR//zA1IC6wADAAwAJwAAFwEzAQMRIzU+ATczEQE1PgM1NCYjIgYHJz4BMzIWFRQOAgczFbMBlD7+a0teJDAXOgE7M000Gi0nHC8SKxlLLUJPGCw7I7kNAvj9CAE3AVgvBxQR/k3+1ikuST00GSoyJRsnJi5IRSA6Oz4kPQAABAAm//MDVQLrACoALgA5AD4AABMnPgEzMh4CFRQGBx4BFRQOAiMiJic3HgEzMjY1NCYjNTI2NTQmIyIGJTMBIyUVIxUjNSM1EzMRIzM1NyNjKxxELh0yJhYrISU4GCo4IDZTGS8UOSIkM0VCOT4sIxkuAhQ9/ms9AmFBQMa3T7x8BgUCfSYhJxAeLBsnNQ8KNS0eMCMSMCUlHiMoJiYoLS0iHycfV/0ItDJ1dSQBG/7zUHkAAgA5/yQBwAIqAAMAJwAAEzUzFQczFg4EFRQeAjMyPgI3Mw4DIyIuAjU0PgTPW1VLBhIhKiUaDx0pGxMoIxgDTQQrPEYfKkQwGRsnLCITAcxeXl0+UzkpLDYqGi4iFQ0hNypDVTETHzZIKTFCMyw1SAAAAAABALIANgM2AroACwAAJQcJAScJATcJARcBAzYw/u7+7zEBEv7uMQERARIw/u9mMAES/u4wARIBETH+7gESMP7uAAAAAAMAiQAwA18CvwALAA8AGwAAATQ2MzIWFRQGIyImBSEVIQU0NjMyFhUUBiMiJgGsKh4eKioeHir+3QLW/SoBIyoeHioqHh4qAnYeKyseHSsrv0XcHSsrHR4rKwAAAQDqAIoC/AIeAAUAAAEzCQEzEwKYZP74/vZfqwIe/mwBlP7zAAAAAAEBlQEiAlAB3wANAAABIiYnND4CMzIWFRQGAfMqMwENGCMWLDEwASI4JBIjGxE7JiY2AAABAD8CagCrA2cADgAAExUjNT4BNzYzFSIOAhWrbAEhFBobEhYNBALYbm45Ow0OMBMdIQ4AAQBGAnMAsgNwAA4AABM1MxUUDgIjNTI+AjVGbAsZKR4SFwwEAwJubhozKRkwEx0hDgAAAAIAPwJvAUsDbAAOAB0AAAEVIzU+ATc2MxUiDgIVIxUjNT4BNzYzFSIOAhUBS2wBIRQaGxIWDQRmbAEhFBobEhYNBALdbm45Ow0OMBMdIQ5ubjk7DQ4wEx0hDgAAAgBGAnEBUgNuAA4AHQAAEzUzFRQOAiM1Fjc+ASczNTMVFA4CIzUWNz4BJ0ZsCxkpHhAMCxIBZ2wLGSkeEAwLEgEDAG5uGjMpGTEBCggnJm5uGjMpGTEBCggnJgABAQX/yALjAvwACwAAAQc3FScTIxMHNRcnAh8Hy8sHVgfLywcC/PIFTAb9/wIBBkwF8gAAAQEF/8gC4wL8ABMAAAEHNxUnFTcVJxcjNwc1FzUHNRcnAh8Hy8vLywdWB8vLy8sHAvzmBkwG6AZNBuXlBk0G6AZMBuYAAAAAAgDhAU0DBwGrAAMABwAAATUzFSE1MxUCrFv92lsBTV5eXl4AAwCOAU0DWgGrAAMABwALAAABNTMVMzUzFSE1MxUBxlveW/00WwFNXl5eXl5eAAAABwAi//ADxgLuAAMAFQApAD0ATwBjAHcAABcBMwEDNDYzMh4CFRQOAiMiLgI3NC4CIyIOAhUUHgIzMj4CEzQ+AjMyHgIVFA4CIyIuAiU0NjMyHgIVFA4CIyIuAic0LgIjIg4CFRQeAjMyPgIlNC4CIyIOAhUUHgIzMj4CfQGCM/5/j0w3HS8hEhYkLhgdMCITyAYPHBcVGw8GBg8bFhYcDwaiFCQwGx0vIRIWJC4YHTAiEwE4SzcdMCESFiQuGRwwIhNwBg8cFxUbDwYGDxsWFhwPBgE3BRAbFxUbEAYFEBwWFxsPBRAC/v0CAhpscyA7UjI6UzYaHzpSMh09MyEhMz0cHj0yICEyPf7mNVQ5HiA7UjI6VDYaHzpSMm1zIDtSMjpUNhofOlIyHT00ISEzPR0ePTIgITM8HBs+NCIhMz0dHT0zICEzPAAAAAABAFsB9wDNAwMABAAAGwEXDwFbGVkPJwH4AQsBZaYAAAIAWwH3AZIDAwAEAAkAABsBFw8BNxMXDwFbGVkPJ4kYWhAmAfgBCwFlpgEBCwFlpgAAAAABADEASgEHAeoACAAANyc1NxcHHgEX2aioLZAjTSFKvyHAJ6soWCoAAQAmAEcA/AHnAAgAABMXFQcnNy4BJ1SoqC2QI00hAee/IcAnqipXKgAAAAAFAHMAFgMyAtIADwAbACcAMwA/AAAJAQcBDgEHJwEuASc3CQEXBSImNTQ2MzIWFRQGASImNTQ2MzIWFRQGISImNTQ2MzIWFRQGASImNTQ2MzIWFRQGAgEBJjT+2kaWRjQBJkaYSDQBJgEmMP6fHSoqHR4sLP7WHCsoHxwuKwISHC4rHB8rKv7BHConHxwrKAF4/t44ASlImEk0ASZGlkY4/tYBKjRdKhwfKCgfHCr+8CscHycnHxwrJxwiKCgiHCf+5SscHygoHxwrAAAEACAAAANQAs0AFwAaAB0AIgAAARUjAyMDIwMjAyM1MwMzEzMTMxMzEzMDITMnAzcjBTcjHwEDUHZJWE1mS1JPenFNVEJ2PFw/ez5NRv6qUieoMWIBnxVlGBkBiTb+rQFT/q0BUzYBRP68ARn+5wFE/rzU/fj+cXFxjQAAAwAv//MDvgL7ABMANQBBAAATIi4CNTQ+AjMyHgIVFA4CASIuAjU0PgIzMhYXBy4BIyIOAhUUHgIzMjY3Fw4BATI2NTQmIyIGFRQWvBw0JhcXJjQcHDMmFxcmMwIHRXZWMTFYeEZCZiE2HUcuNFQ8IR87UzQ2TSM3LWz9lyUvLyUmLi4B3RUlNSAhNSUUFCU1ISA1JRX+FjNhjVlZjWI0NyM8HyMpTG1ERG5NKSknOzM2Ah4zKCoxMSooMwADAFMAAAOkAvsAEwAdACkAABMiLgI1ND4CMzIeAhUUDgIBESEVIRUhFSERATI2NTQmIyIGFRQW4Bw0JhcXJjQcHDMmFxcmMwEAAaj+twEX/un+hSUvLyUmLi4B3RUlNSAhNSUUFCU1ISA1JRX+IwLcUfRR/roCETMoKjExKigzAAQAQv/zA9YC1gAtAEEATQBRAAAXIiYvATI2NREzHgEfATMuAz0BNDYzMhYfASIGFREjLgEvASMeAx0BFAYBIi4CNTQ+AjMyHgIVFA4CJzI2NTQmIyIGFRQWBzUhFWYKCggIFBJmM2QwPwQEBQIBKC0LCggHFBJmM2MwQAQEBQIBKAKXIz4vGxsvPiMjPy8bGy8/Iy00NC0tNDRgARoNAQJJExsCXHPlc5I1V01JKLM3NgICSBMb/aRz43aRNVdNSSizNzYBQhguQissQy0YGC1DLCtCLhg8Pjk5Pz85OT7JNzcAAAMAGgAAA8oC3AAHABMAGQAAMxEjNSEVIxEzETMVIxUzFSMVMxUzETMRMxWVewFFe6z6rIODt0JPpAKUSEj9bAJCQ7I/y0MCQv4ERgACAAMBmQKoAvQABwAbAAATESM1IRUjETMRMx8BMz8BMxEjNTcjByMnIxcVc3ABIXCnUTQgBB8zUj4HBFI0UQUIAZkBHj09/uIBW4JYWIL+pZp12tp1mgAAAwDHAAADIQO/ABQAIAAqAAAhJyEHIxMuATU0NjMyHgIVFAYHEwEiBhUUFjMyNjU0JgMzJy4BJyMOAQcCvEX+90Zh7SUsUD8eNCcWLCTw/tEjMDAjITAwjtoiFCMSBREjE93dAsIPPi08RxMiMB4rPw/9PQONLycqLS0qJy/9nG4/eEA/ez0AAAEBxAAAAiQC3AADAAAhETMRAcRgAtz9JAAAAAACATEAAAK3AtwAAwAHAAAhETMRMxEzEQExYMdfAtz9JALc/SQAAAAAAwCdAAADSwLcAAMABwALAAAzETMRMxEzETMRMxGdYMdgx2AC3P0kAtz9JALc/SQAAgCkAAADpwLcAAMAEQAAMxEzESEDMxMeARczPgE3EzMDpGABTOlldhIfFAUUHhR0YegC3P0kAtz+dkJvQEFvQQGK/SQAAAAAAQDVAAADFALcAA0AACEDMxMeARczPgE3EzMDAb3oZHYSHxQFFB4UdGHoAtz+dkJvQEFvQQGK/SQAAAAAAgBBAAADQwLcAA0AEQAAIQMzEx4BFzM+ATcTMwMhETMRASrpZHYTHhQFFB8UdGDnAUpgAtz+dkJvQEBwQQGK/SQC3P0kAAAAAwAIAAADmgLcAA0AEQAVAAAzAzMTHgEXMz4BNxMzAyERMxEzETMRysJlWxAaEgQSHA5cYcIBEmCJYALc/nZBb0FBbkIBiv0kAtz9JALc/SQAAAAABAAEAAADoALcAA0AEQAVABkAADMDMxMeARczPgE3EzMDMxEzETMRMxEzETMRk49YQAsTCwQMEwo+VIndU2hTZ1MC3P52Qm9AQG9CAYr9JALc/SQC3P0kAtz9JAACAKUAAAOVAtwAAwAdAAAzETMRMxMDMxceARczPgE/ATMDEyMnLgEnIw4BDwGlYHTUx2piDhoSBAcNBnllyNVpag8eEQQRHA5oAtz9JAF6AWK6GjAgEBwM7P6Z/ovEGzkhITkbxAAAAAEA5QAAAwIC3AAZAAAzEwMzFx4BFzM+AT8BMwMTIycuAScjDgEPAeXUx2pjDhkSBA8XDWFkyNZqag4fEQQQHA5pAXoBYroaMCAgMBq6/pn+i8QbOSEhORvEAAAAAgG0AAACNQMFAAsADwAAASImNTQ2MzIWFRQGAxEzEQH1HCUlHBomJktfAo0iGhshIRsaIv1zAh794gAABAEqAAACvwMFAAsAFwAbAB8AAAEiJjU0NjMyFhUUBjMiJjU0NjMyFhUUBgERMxEzETMRAWscJSUcGyUl+RwlJRwbJSX+oV62XgKNIhobISEbGiIiGhshIRsaIv1zAh794gIe/eIAAAAGAKAAAANIAwUACwAXACMAJwArAC8AABMiJjU0NjMyFhUUBjMiJjU0NjMyFhUUBjMiJjU0NjMyFhUUBgERMxEzETMRMxEzEeEbJiYbGyUl+RwlJRwaJib5HCUlHBslJf2OX7RftV8CjSIaGyEhGxoiIhobISEbGiIiGhshIRsaIv1zAh794gIe/eICHv3iAAADAK8AAAN2AwUACwAPAB0AABMiJjU0NjMyFhUUBgMRMxEhAzMTHgEXMz4BNxMzA/AcJSUcGyQkTF8BK8NhZQwaDAQMGgtmXb8CjSIaGyEhGxoi/XMCHv3iAh7+zihSJiZSKAEy/eIAAAEA/AAAAuwCHgANAAAhAzMTHgEXMz4BNxMzAwG/w2FlDRkNBAwaC2ZcvwIe/s4oUiYmUigBMv3iAAAAAAMAcgAAAzkDBQALABkAHQAAASImNTQ2MzIWFRQGAQMzEx4BFzM+ATcTMwMhETMRAvocJSUcGyQk/iHEYWYLGgwEDRoLZly/ASdeAo0iGhshIRsaIv1zAh7+zihSJiZSKAEy/eICHv3iAAAAAAUADQAAA6UDBQALABcAJQApAC0AAAEiJjU0NjMyFhUUBjMiJjU0NjMyFhUUBgEDMxMeARczPgE3EzMDIREzETMRMxECahwlJRwbJSXgHCUlHBslJf1Et2FdCxcNBAwXC11cswEIX5xeAo0iGhshIRsaIiIaGyEhGxoi/XMCHv7OKFImJlIoATL94gIe/eICHv3iAAAHAAYAAAO7AwUACwAXACMAMQA1ADkAPQAAASImNTQ2MzIWFRQGMyImNTQ2MzIWFRQGMyImNTQ2MzIWFRQGAQMzEx4BFzM+ATcTMwMzETMRMxEzETMRMxEB9xohIRoYISGtGSIiGRgiIq4ZIiIZGCEh/POHWzwKDgoECRAIPFaC2VJzUnNTAo0iGhshIRsaIiIaGyEhGxoiIhobISEbGiL9cwIe/s4oUiYmUigBMv3iAh794gIe/eICHv3iAAMAugAAA2gDBQALAA8AKQAAEyImNTQ2MzIWFRQGAxEzETMTAzMXHgEXMz4BPwEzAxMjJy4BJyMOAQ8B+xwlJRwaJSVKXmqypWZIDBsOBA0XDEJipLFmTw4dDwUOGw5IAo0iGhshIRsaIv1zAh794gEbAQN2Fi0XFy0Wdv7z/u99GDIXFzEZfQABAQkAAALeAh4AFwAAIRMDMxcWFzM2PwEzAxMjJy4BJyMOAQ8BAQmypWZIGhwEGBhBY6SwZVAOHBAFDhoOSQEbAQN2Ky8vK3b+8/7vfRgyFxcxGX0AAAAAAQAjAJMDwAJlABQAAAEhHgEXBy4DJz4DNxcOAQchA8D8/SZaIjwZPUNGISFGQz0ZPCNZJgMDAVoeVjAjIUE8NhUVNjxBISMvVx4AAAEBC/+wAt0DTQAUAAAFEQ4BByc+AzceAxcHLgEnEQHSHlcvIyFBPDYVFTY8QSEjL1ceUAMDJlkjPBk9Q0YhIUZDPRk8I1km/P0AAAABACgAkwPFAmUAFAAAEzUhLgEnNx4DFw4DByc+ATcoAwMmWSM8GT1DRiEhRkM9GTwjWSYBWkQeVy8jIUE8NhUVNjxBISMvVx4AAAAAAQEL/6sC3QNIABQAAAERPgE3Fw4DBy4DJzceARcRAhYeVy8jIUE8NhUVNjxBISMwVh4DSPz9JlkjPBk9Q0YhIUZDPRk8IlomAwMAAAEAIwCPA8UCYQAlAAABIR4BFwcuAyc+AzcXDgEHIS4BJzceAxcOAwcnPgEDK/2SJloiPBk9Q0YhIUZDPRk8I1kmAm4mWSM8GT1DRiEhRkM9GTwjWQFWHlYwIyFBPDYVFTY8QSEjL1ceHlcvIyFBPDYVFTY8QSEjL1cAAAABAQv/qwLdA00AJQAAARE+ATcXDgMHLgMnNx4BFxEOAQcnPgM3HgMXBy4BAhYeVy8jIUE8NhUVNjxBISMwVh4eVy8jIUE8NhUVNjxBISMvVwKz/ZImWSM8GT1DRiEhRkM9GTwiWiYCbiZZIzwZPUNGISFGQz0ZPCNZAAAAAQCrAB4DUgLFABkAACUBFhQHJz4BNTQmJx4BMzI2NxcOASMiJicBAyH93ggIQwQDBxFOex4eOhwRHT0eHjkYAiIeAiIwfjkRHDoeHntOEQcDBEMEBAQE/d4AAAABAJYAHgM9AsUAGQAANwEOASMiJic3HgEzMjY3DgEVFBYXByY0NwGWAiIYOR4ePR0RHDoeHntOEQcDBEMICP3eTwIiBAQEBEMEAwcRTnseHjocETl+MP3eAAAAAAEAlgAzAz0C2gAZAAATASY0NxcOARUUFhcuASMiBgcnPgEzMhYXAccCIggIQwQDBxFOex4eOhwRHT0eHjkY/d4C2v3eMH45ERw6Hh57ThEHAwRDBQMDBQIiAAAAAQCrADMDUgLaABkAAAkBPgEzMhYXBy4BIyIGBz4BNTQmJzcWFAcBA1L93hg5Hh49HREcOh4ee04RBwMEQwgIAiICqf3eBQMDBUMEAwcRTnseHjocETl+MAIiAAABACgALAPQAsMAGwAAEyE+ATcuASchNSEmJzceAxcOAwcnNjchKAK/HjwcHTof/UECgzglOx1MVlstLVtWTB07JTj9fQEPHzYUFTQfRUA8Ii5eV0wcHUxXXi4iPEAAAAACABgALAPQAsMAJQAzAAABFw4BByEuASc3HgMXDgMHJz4BNyEeARcHLgMnPgMFIQ4BBx4BFyE+ATcuAQFJOhEtGgGSGi0ROhtHUFUqKlVQRxs6ES0a/m4aLRE6G0dQVSoqVVBHAcb+AB05Gxs5HQIAHTkbGzkCwyIdQB8fQB0iLl5XTBwdTFdeLiIdQB8fQB0iLl5XTB0cTFdetR81FBQ2Hx82FBQ1AAACAHH/8QN3AvwABwALAAABFwEjATcTIQUTMxMDOj3+fwT+fz2EAYT+oJ0CnQL8H/0UAuwf/v1E/swBNAACANn/9AMRAvsAKgA6AAABNCYjIg4CByc+AzMyHgIVFA4CIyIuAjU0PgIzMh4CFzM+AQUUFjM+ATcuAyMiDgICwllLHDIqIQsxEy83PyQzVz8jLliDVDVSNx0sR1svKkM1Jw4CCQr+ZE5DRW4jBR8vPCEiQjQfAehnaREZHw82EyQdESRFZkJYs5BbIjxRLzliSCgVJDAcI0z1RVIBYF4kPCsXHzZKAAABAMMADAMfAuMACwAAEyERITUhESE1IREhwwJc/aQCF/3pAhf96QLj/SlFAQVEAQQAAAAAAgCX//ADTwLNAAUACwAABQE1IRUBGwEhExczAb/+2AK4/torkP4dj2AFEAKlODj9WwE+AVD+sOwAAAAAAQB8ADUDaAK6ABwAAAEhIg4CByEVIR4DMyEVISIuAjU0PgIzIQNo/mQ0W0YsBgKj/V0GLEZbNAGc/mRHe1o0NFp7RwGcAnUhO1AvRS9QOyFFMld2RER1VzIAAAABAIAANQNsAroAHAAAASE1ITIeAhUUDgIjITUhMj4CNyE1IS4DAhz+ZAGcR3taNDRae0f+ZAGcNVpGLAb9XQKjBixGWgJ1RTJXdUREdlcyRSE7UC9FL1A7IQAAAAEA0P96AxkCyQAHAAAXESERIxEhEdACSV7+cYYDT/yxAv79AgAAAAABAMkAAAMfAtYADQAAJRUhFSE1CQE1IRUhFRMBRgHZ/aoBH/7xAiH+XPlPBEs1ATUBNDhKBP7kAAEAIv+qA+gDcAAKAAABIRUhASMDByc3EwIwAbj+Zf6/HmxGGoljA3Ap/GMBGGMTwf78AAACACIAsANUAj8ALQA9AAABHgEzMjcXBiMiLgInDgMjIi4CNTQ+AjMyHgIXPgMzMhcHJiMiBgUUHgIzMjY3LgEjIg4CAiAra0UkHBkhOitLQDcYGDZBSywkSTskJDtJJCxLQTYYGDdASys6IRkcJEVr/hwWJTEaRWsrK2tFGjElFgF4OkkJQQ0XKDQeHjQoFxkySzIySjIZFyg0Hh40KBcNQAlKOR8xIhFJOjlKEiExAAMAIgCwA8UCPwAnADcARwAAAT4DMzIeAhUUDgIjIi4CJw4DIyIuAjU0PgIzMh4CBRQeAjMyNjcuASMiDgIFHgEzMj4CNTQuAiMiBgH0GDdASyskSTskJDtJJCtLQDcYGDdBSyskSTskJDtJJCtLQTf+ixYlMRpFaS0taUUaMSUWAbkra0UaMCUWFiUwGkVrAa4eNCgXGTJKMjJLMhkXKDQeHjQoFxkySzIySjIZFyg0VB8xIhFJOjlKEiExHzpJESIxHx8xIRJKAAAAAAEAZgAbA28CtwAHAAAlFSEVITUBFwEIAmf89wKXMGMDRQQCmDEAAAABAHH/9wN3AwIABwAANwEzAQcBIwFxAYEEAYE9/rsC/rsXAuv9FSACe/2FAAEAcf/tA3cC+AAHAAAJASMBNwEzAQN3/n8E/n89AUUCAUUC2P0VAusg/YUCewAAAAEAsgAEAzYC7wAZAAA3ETQ+AjMyHgIVESMRNC4CIyIOAhURsjFXdkREdlcxRSdEXDY2XEQnBAGbSHtaMzNae0j+ZQGbOWJIKChIYjn+ZQAAAQCyAAADNgLrABkAAAERFA4CIyIuAjURMxEUHgIzMj4CNREDNjFXdkREdlcxRSdEXDY2XEQnAuv+ZUh7WjMzWntIAZv+ZTliSCgoSGI5AZsAAAAAAQE8/6oCrANOACEAACURND4CMzIWFwcmIyIOAhURFA4CIyImJzcWMzI+AgHMITM/HwsWDQcJGBMlHhIgMz8gCxYNBwkYEyUeEqYBt0tfNBMDAkkECyZGO/5JS180EwMCSQQLJkYAAAACAHr/qgNuA04AIQBDAAAlETQ+AjMyFhcHJiMiDgIVERQOAiMiJic3FjMyPgIlETQ+AjMyFhcHJiMiDgIVERQOAiMiJic3FjMyPgIBCiEzPx8LFg0HCRgTJR4SIDM/IAsWDQcJGBMlHhIBhCAzQB8LFg0HCRgTJR4SITM/HwsWDQcJGBMlHhKmAbdLXzQTAwJJBAsmRjv+SUtfNBMDAkkECyZGOwG3S180EwMCSQQLJkY7/klLXzQTAwJJBAsmRgADATz/qgKsA04ANwA+AEUAACU1LgM1ND4CNzU0PgIzMhYXByYjIg4CHQEeAxUUDgIHFRQOAiMiJic3FjMyPgI9AQ4BFRQWNxU+ATU0JgHMGy8jExMjLxshMz8fCxYNBwkYEiUeExsvIxMTIy8bIDM/IAsWDQcJGBIlHhMmMjJ2JjIynzwGHio1Hh41Kh4GQEtfNBMDAkkECyNEOTwGHio1Hh41Kh4GQEtfNBMDAkkECyNEn+4LQioqQuPuC0IqKkIAAAAAAwCjAEMDRQKsAAsAFwAjAAABNDYzMhYVFAYjIiYBNDYzMhYVFAYjIiYlNDYzMhYVFAYjIiYBrCoeHioqHh4q/vcrHh4qKh4eKwIRKx4eKioeHisCZB0rKx0eKyv+RR4rKx4dKysdHisrHh0rKwAAAAMAowBDA0UCrAALABcAIwAAEzQ2MzIWFRQGIyImJTQ2MzIWFRQGIyImATQ2MzIWFRQGIyImoyseHioqHh4rAhErHh4qKh4eK/74Kh4eKioeHioCZB0rKx0eKyseHSsrHR4rK/5FHisrHh0rKwAAAAACAawAQwI8AqwACwAXAAABNDYzMhYVFAYjIiYRNDYzMhYVFAYjIiYBrCoeHioqHh4qKh4eKioeHioCZB0rKx0eKyv+RR4rKx4dKysAAQAiALADxQI/AEUAAAE+AzMyHgIVFA4CIyInNxYzMj4CNTQuAiMiDgIHDgMjIi4CNTQ+AjMyFwcmIyIOAhUUHgIzMj4CAdwZO0ZTMCRJOyQkO0kmMygaHSYbMCYWFiUwGidDOzMXGTtHUjEkSTskJTpKJTgjGR4lGzEmFhYlMRonQjszAZAjPzAdGTJKMjJLMhkNQQkRIjEfHzEhEhgrOSEjPzAcGTJLMjJLMRkNQAkSITEfHzEiERgqOAAEAIkACwNfAuQACwAPABMAHwAAEzQ2MzIWFRQGIyImByEVIRUhFSEFNDYzMhYVFAYjIib2Kh4eKyseHiptAtb9KgLW/SoB2CseHioqHh4rApseKyseHioqgz2LPaEeKioeHisrAAAAAAEAiQAWA18C2QATAAABIQchFSEHJzchNSE3ITUhNxcHIQNf/tM0AWH+hk1AQ/7uASs1/qABeU5ARQEUAb6RRdIYukWRRdYYvgAAAAADAIkAfwNfAnAAAwAHAAsAABMhFSEVIRUhFSEVIYkC1v0qAtb9KgLW/SoCcEGXQZdBAAAAAgBmABIDagMNAAcACwAAARUFBwE1ARcBIRUhAR0CTRr9FgLqGv0WAuj9GAHfBO4/AS0EAS5A/YZBAAAAAgB+ABIDggMNAAcACwAANyU1JTcBFQEHNSEVfgJN/bMaAur9FhgC6O3uBO5A/tIE/tOcQUEAAAACADb/9AOxAvsABwAPAAABFwEVAQcBNQEXARUBBwE1Al8j/h4B4iP91wNYI/4dAeMj/dcC+zL+sQT+sDIBggQBgTL+sQT+sDIBggQAAgA3//QDsgL7AAcADwAAEwEVAScBNQElARUBJwE1AVoCKf3XIwHj/h0BUgIp/dcjAeL+HgL7/n8E/n4yAVAEAU8y/n8E/n4yAVAEAU8AAAABAHwANQNoAroAGQAAJSEiLgI1ND4CMyEVISIOAhUUHgIzIQNo/mRHe1o0NFp7RwGc/mQ5YkcpKUdiOQGcNTJXdkREdVcyRSdEXDY2XUQnAAEAgAA1A2wCugAZAAATITIeAhUUDgIjITUhMj4CNTQuAiMhgAGcR3taNDRae0f+ZAGcOWJHKSlHYjn+ZAK6Mld1RER2VzJFJ0RdNjZcRCcAAgB8//QDaAL7ABkAHQAAASEiDgIVFB4CMyEVISIuAjU0PgIzIQEhFSEDaP4xNFE3HBw3UTQBz/4xQ2pJJydJakMBz/0YAuj9GAK2IDZGJiZHNiBFK0lgNDRfSSv9PkUAAgCA//QDbAL7ABkAHQAAEyEyPgI1NC4CIyE1ITIeAhUUDgIjIRUhFSGAAc81UDccHDdQNf4xAc9DakknJ0lqQ/4xAuj9GAExIDZHJiZGNiBFK0lfNDRgSSuzRQADAIIACgNmAu4AEwAnADMAACUiLgI1ND4CMzIeAhUUDgIBFB4CMzI+AjU0LgIjIg4CBRQGIyImNTQ2MzIWAfRMh2U6OmWHTE2GZTo6ZYb+hi9Sbj4+blIvL1JuPj5uUi8BZyIYGCIiGBgiCjplh0xNhmU6OmWGTUyHZToBcj5uUi8vUm4+Pm5SLy9Sbj4YIiIYFyMjAAAAAAEAaQAkA38C4wAHAAAlIRUhNSERMwIWAWn86gFpRGlFRQJ6AAEAGAJKA9ADTQANAAATJz4BMzIWFwcuASMiBjcfW+6Tku5cH1vZiYnZAko8W2xtWjxYYmIAAAAAAwAi/6oDxgNOABMAJwAwAAAFIi4CNTQ+AjMyHgIVFA4CJzI+AjU0LgIjIg4CFRQeAjcRIzU+ATczEQH0YKp/SUl/qmBgqn9JSn+pYFqedkREdp5aW551RER2nkZqKDsaP1ZJf6pgYKp/SUl/qmBhqn5JIER2nlpannZERXaeWVqedkS1Aag1BxQO/foAAAAAAwAi/6oDxgNOABMAJwBFAAAFIi4CNTQ+AjMyHgIVFA4CJzI+AjU0LgIjIg4CFRQeAic1PgM1NCYjIgYHJz4BMzIWFRQOAgc+ATsBFQH0YKp/SUl/qmBgqn9JSn+pYFqedkREdp5aW551RER2nlM/YkQjMjQlPRgvJlU2UV0iPVIwFzUak1ZJf6pgYKp/SUl/qmBhqn5JIER2nlpannZERXaeWVqedkS1MDdbTkIfLTIkFywoKVVGJElNUCsCAkYAAwAi/6oDxgNOABMAJwBTAAAFIi4CNTQ+AjMyHgIVFA4CJzI+AjU0LgIjIg4CFRQeAjciJic3HgEzMjY1NC4CIzUyNjU0JiMiBgcnPgEzMhYVFAYHFR4BFRQOAgH0YKp/SUl/qmBgqn9JSn+pYFqedkREdp5aW551RER2nlVDXx0oGkc0MT4SKkUzWUgyLSM9GishUzNNYzktM0ceNUZWSX+qYGCqf0lJf6pgYap+SSBEdp5aWp52REV2nllannZEqSsfNRkkMCgWIxkOPTInJCkbGTMeJEdCLToRAw1BNiI4JxUABAAi/6oDxgNOABMAJwAyADwAAAEyHgIVFA4CIyIuAjU0PgITMj4CNTQuAiMiDgIVFB4CExEzFSMVIzUhNRMDMzU0NjcjDgEHAfRgqn9JSn+pYGCqf0lJf6pgWp52RER2nlpbnnVERHaexE1NTv8A8JurAQIECxQOA05Jf6pgYap+SUl/qmBgqn9J/HxEdp5aWp52REV2nllannZEArv+wz+KijcBRf7DhBY7FxUdFQADACL/qgPGA04AEwAnAEoAAAUiLgI1ND4CMzIeAhUUDgInMj4CNTQuAiMiDgIVFB4CNyImJzceATMyNjU0JiMiBgcnNyEVIwc+ATMyHgIVFA4CAfRgqn9JSX+qYGCqf0lKf6lgWp52RER2nlpbnnVERHaeWEVYHicZRDMzQkAzHisZKhIBJN4NEyoYJUEwHCE2R1ZJf6pgYKp/SUl/qmBhqn5JIER2nlpannZERXaeWVqedkSpKxw2FiU7MzE6EhAa/0aMCA0UKD0qKkMtGAAABAAi/6oDxgNOABMAJwBIAFQAAAEyHgIVFA4CIyIuAjU0PgITMj4CNTQuAiMiDgIVFB4CEwcuASMiDgIHPgEzMhYVFA4CIyIuAjU0PgIzMhYDMjY1NCYjIgYHHgEB9GCqf0lKf6lgYKp/SUl/qmBannZERHaeWluedUREdp7/LRE0HB01KRkBG0omS1kcMEAkK0s4HyU+UiwxRoooOTU0Gj8dCEADTkl/qmBhqn5JSX+qYGCqf0n8fER2nlpannZERXaeWVqedkQCjjMSFhUxTzodI1FRJz4sGB8+YEBNbUYhIf5DOS4wNx0jSUUAAAAAAwAi/6oDxgNOABMAJwA2AAAFIi4CNTQ+AjMyHgIVFA4CJzI+AjU0LgIjIg4CFRQeAjcjPgM3ITUhFQ4DAfRgqn9JSX+qYGCqf0lKf6lgWp52RER2nlpbnnVERHaeZ1UEFCU6Kv7yAWwyPyQRVkl/qmBgqn9JSX+qYGGqfkkgRHaeWlqedkRFdp5ZWp52RLVHdmpkNUYyOmhsegAABQAi/6oDxgNOABMAJwBNAFsAaQAABSIuAjU0PgIzMh4CFRQOAicyPgI1NC4CIyIOAhUUHgI3Ii4CNTQ+Ajc1LgE1ND4CMzIWFRQOAgcVHgMVFA4CAz4BNTQmIyIGFRQeAgcyNjU0LgInDgEVFBYB9GCqf0lJf6pgYKp/SUp/qWBannZERHaeWluedUREdp5aKkYzHRMeJxQhMRotPSNPWQ4XHA4TJB0RHDJGBRwgMzAoMxUkLwkzPBgoNx8hMUZWSX+qYGCqf0lJf6pgYap+SSBEdp5aWp52REV2nllannZEqRUmNB4aKiIbCgQUOyogMiQTTjwVJh8aCQMLGCAoGx40JhYBKhYzGiUxKiQWIBkT9y0nGCEaFQsTNSMoNAAABAAi/6oDxgNOABMAJwBIAFIAAAEyHgIVFA4CIyIuAjU0PgITMj4CNTQuAiMiDgIVFB4CJzceATMyPgI3DgEjIiY1ND4CMzIeAhUUDgIjIiY3MjY3JiMiBhUUAfRgqn9JSn+pYGCqf0lJf6pgWp52RER2nlpbnnVERHaeTC0RNB0dNCcYAhpIJUlcHC8/JCxKNx8lPVAsMUiSGz4cEGwnOANOSX+qYGGqfklJf6pgYKp/Sfx8RHaeWlqedkRFdp5ZWp52ROEyERYWMU85HSJQUiY/LBgfPl9BTm1GICDuHiOQOTBoAAAAAAUAIv+qA8YDTgATACcANwBAAEwAAAUiLgI1ND4CMzIeAhUUDgInMj4CNTQuAiMiDgIVFB4CNyIuAjU0NjMyFhUUDgIlESM1PgE3MxElMjY1NCYjIgYVFBYB9GCqf0lJf6pgYKp/SUp/qWBannZERHaeWluedUREdp7ZJTwqF1dLS1YXKjv+jFUiMBU8AQElLi4lJS4uVkl/qmBgqn9JSX+qYGGqfkkgRHaeWlqedkRFdp5ZWp52RKkmRmY/hImJhD9mRiYMAag1BxQO/fo3ZGpqYWFqamQAAAQAIv+qA8YDTgATACcAMAA5AAAFIi4CNTQ+AjMyHgIVFA4CJzI+AjU0LgIjIg4CFRQeAicRIzU+ATczETMRIzU+ATczEQH0YKp/SUl/qmBgqn9JSn+pYFqedkREdp5aW551RER2nkhVIjAWO8NVITEVO1ZJf6pgYKp/SUl/qmBhqn5JIER2nlpannZERXaeWVqedkS1Aag1BxQO/foBqDUHFA79+gAAAAQAIv+qA8YDTgATACcARQBOAAAFIi4CNTQ+AjMyHgIVFA4CJzI+AjU0LgIjIg4CFRQeAjc1PgM1NCYjIgYHJz4BMzIWFRQOAgc+ATsBFSERIzU+ATczEQH0YKp/SUl/qmBgqn9JSn+pYFqedkREdp5aW551RER2nkAvSzQcJiYaLBEsHkUqQkobLj4jEioUbP4kVSExFDxWSX+qYGCqf0lJf6pgYap+SSBEdp5aWp52REV2nllannZEtTA3W05CHy0yHxcrJidVRiRJTFErAgJGAag1BxQO/foAAAAEACL/qgPGA04AEwAnAFIAWwAABSIuAjU0PgIzMh4CFRQOAicyPgI1NC4CIyIOAhUUHgI3IiYnNx4BMzI2NTQuAiM1MjY1NCYjIgcnPgEzMhYVFAYHFR4BFRQOAiURIzU+ATczEQH0YKp/SUl/qmBgqn9JSn+pYFqedkREdp5aW551RER2nsgzTBcoFTQkIy4NHzUnQzYmIDAnKxxBKj9PLCQqNxkrOv6jViIwFTxWSX+qYGCqf0lJf6pgYap+SSBEdp5aWp52REV2nllannZEqSkdMhcfMCgWIxkOPTInJCktMB0hR0ItOhEDDUE2IjgnFQwBqDUHFA79+gAFACL/qgPGA04AEwAnADAAOwBFAAABMh4CFRQOAiMiLgI1ND4CEzI+AjU0LgIjIg4CFRQeAgM1PgE3MxEjESURMxUjFSM1IzUTAzM1NDY3Iw4BBwH0YKp/SUp/qWBgqn9JSX+qYFqedkREdp5aW551RER2nsshMRQ8TQGxOjpIyLZsfgECBAoOCgNOSX+qYGGqfklJf6pgYKp/Sfx8RHaeWlqedkRFdp5ZWp52RAJdNQcUDv36Aahe/sM/ioo3AUX+w4QWOxcVHRUAAAAEACL/qgPGA04AEwAnADAAUwAABSIuAjU0PgIzMh4CFRQOAicyPgI1NC4CIyIOAhUUHgInESM1PgE3MxEXIiYnNx4BMzI2NTQmIyIGByc3MxUjBz4BMzIeAhUUDgIB9GCqf0lJf6pgYKp/SUp/qWBannZERHaeWluedUREdp52VSExFDz1NkgZJBQ0JiUyLiYXIRMlDe+uCA4gER0zJxYbLDpWSX+qYGCqf0lJf6pgYap+SSBEdp5aWp52REV2nllannZEtQGoNQcUDv36DCobNRUjOzMxOhIQGv9GjAgNFCg9KipDLRgAAwAg/7UDyANDAA0AGwAoAAAXBy4BNTQ2NxcOARUeAQUnPgE3NCYnNx4BFRQGBTUzESM1PgE3MxEzFcotQzo6Qy0/MAEvAsAtPy8BMD8tQzo6/babfDBFHUWNPQ5m24aF3GYOYd95e91vDmHde3nfYQ5m3IWG2w9MAg87CBoS/YJMAAAAAwAg/7UDyANDAA0AGwA5AAAXBy4BNTQ2NxcOARUeAQUnPgE3NCYnNx4BFRQGBTU+AzU0JiMiBgcnPgEzMhYVFA4CBz4BOwEVyi1DOjpDLT8wAS8CwC0/LwEwPy1DOjr9l0x4Uiw+Qi1MGzYqZkVkaypLZzwdPBvFPQ5m24aF3GYOYd95e91vDmHde3nfYQ5m3IWG2w81T4NvXyw9Ti8lNDM4cWEzZ251QAIETgAAAAADACD/tQPIA0MADQAbAE0AABcHLgE1NDY3Fw4BFR4BBSc+ATc0Jic3HgEVFAYFIiYnNx4BMzI+AjU0LgIjNTI+AjU0JiMiBgcnPgEzMh4CFRQGBxUeARUUDgLKLUM6OkMtPzABLwLALT8vATA/LUM6Ov5hUXMgLx1XOR80JxYXNVQ8NksvFUE2KkodMiZlPC5MNx5FP0VXJD5TPQ5m24aF3GYOYd95e91vDmHde3nfYQ5m3IWG2xw7KjojLxIhMR4hNCQURhUlMRs2OyYhOSgxGC5DK0JSFgQRW0swSzQcAAQAIP+1A8gDQwANABsAJgAwAAATFw4BFR4BFwcuATU0NiU3HgEVFAYHJz4BNzQmJxEzFSMVIzUhNQEDMzU0NjcjDgEHnS0/MAEvPy1DOjoCxC1DOjpDLT8vATDbYGBX/swBJMfXAgIEEBkQA0MOYd95e91hDmbbhoXcWA5m3IWG22YOYd17ed8C/kVJxsY9Acf+Rd0dQCMcMhsAAAMAIP+1A8gDQwANABsAQgAAFwcuATU0NjcXDgEVHgEFJz4BNzQmJzceARUUBgUiLgInNx4BMzI+AjU0JiMiBgcnEyEVIQc+ATMyHgIVFA4Cyi1DOjpDLT8wAS8CwC0/LwEwPy1DOjr+VylDNywSLh1RPCA4KhhQQiQzHjAXAVv+9RQaMSMrTTkiKEJWPQ5m24aF3GYOYd95e91vDmHde3nfYQ5m3IWG2x0QGyQTOyAwFyo9JUtTFhYeAVhP1RAOGjdUOjpbPiAABAAg/7UDyANDAA0AGwA8AEgAABMXDgEVHgEXBy4BNTQ2JTceARUUBgcnPgE3NCYPAS4BIyIOAgc+ATMyFhUUDgIjIi4CNTQ+AjMyFgMyNjU0JiMiBgceAZ0tPzABLz8tQzo6AsQtQzo6Qy0/LwEwkDQVQSMiQDAeASBaK1hsITlMKzJXQCUrR10zPFipNkZCPCFPIwlNA0MOYd95e91hDmbbhoXcWA5m3IWG22YOYd17ed88ORscH0d0Visvb24zVDwhK1aAVWyYXysq/Y9VRktMJzZqawAAAwAg/7UDyANDAA0AGwAqAAAXBy4BNTQ2NxcOARUeAQUnPgE3NCYnNx4BFRQGBSM+AzchNSEVDgPKLUM6OkMtPzABLwLALT8vATA/LUM6Ov5tXQQaMEYw/rcBrTlKLhY9DmbbhoXcZg5h33l73W8OYd17ed9hDmbchYbbD2Wolo5MTThSk5mrAAUAIP+1A8gDQwANABsAQwBRAGEAABcHLgE1NDY3Fw4BFR4BBSc+ATc0Jic3HgEVFAYFIi4CNTQ+Ajc1LgE1ND4CMzIeAhUUDgIHFR4DFRQOAgM+ATU0JiMiBhUUHgIDMjY1NC4CJw4BFRQeAsotQzo6Qy0/MAEvAsAtPy8BMD8tQzo6/mkzVT0iFyUvGS04HjZJKy9KNBwRHSQTGy8hEx86VAcjKEE6MEIYKzsIQEgcM0UpKDkWKDc9DmbbhoXcZg5h33l73W8OYd17ed9hDmbchYbbHB00SCslOy8kDgQgTzkpQi4aGzFDKRsxLSgRBBAiKzgmKEQyHQGSJUYqM0c8NB4uJR/+o0I3IzInHxEeSDceMiQUAAAEACD/tQPIA0MADQAbADwASAAAExcOARUeARcHLgE1NDYlNx4BFRQGByc+ATc0JgE3HgEzMj4CNw4BIyImNTQ+AjMyHgIVFA4CIyImEzI2Ny4BIyIGFRQWnS0/MAEvPy1DOjoCxC1DOjpDLT8vATD9vjQVQSMjPzAdAiBaK1hsITlMKjJXQSUqSF0zPFirIU8jCU0/NkVBA0MOYd95e91hDmbbhoXcWA5m3IWG22YOYd17ed/9dzkcHB9IdVUrL29tM1Q8IStVgFZsl2ArKgE/JzZqbFRIS0wAAAAABQAg/7UDyANDAA0AGwAvADgATAAABSc+ATc0Jic3HgEVFAYFBy4BNTQ2NxcOARUeAQUiLgI1ND4CMzIeAhUUDgIlESM1PgE3MxElMj4CNTQuAiMiDgIVFB4CA0stPy8BMD8tQzo6/TwtQzo6Qy0/MAEvAfcnQi8bGy9CJydBMBoaMEH+fGkqPhsuARUYJhwPDxwmGBcnHA8PHCdLDmHde3nfYQ5m3IWG21gOZtuGhdxmDmHfeXvdJStajmNji1goKFiLY2OOWisNAmMzCBsR/TY5IUh0U1NyRh4eRnJTU3RIIQAABAAg/7UDyANDAA0AGwAkAC0AAAUnPgE3NCYnNx4BFRQGBQcuATU0NjcXDgEVHgEFESM1PgE3MxEhESM1PgE3MxEDSy0/LwEwPy1DOjr9PC1DOjpDLT8wAS8B+mgqPhsu/odpKz4bLUsOYd17ed9hDmbchYbbWA5m24aF3GYOYd95e90YAmMzCBsR/TYCYzMIGxH9NgAAAAAEACD/tQPIA0MADQAbADUAPgAABSc+ATc0Jic3HgEVFAYFBy4BNTQ2NxcOARUeAQU1PgE1NCYjIgYHJz4BMzIWFRQGBz4BOwEVIREjNT4BNzMRA0stPy8BMD8tQzo6/TwtQzo6Qy0/MAEvAUaBfTA0ITsXLiRMNk5XeGobOBmN/flpKj4bLksOYd17ed9hDmbchYbbWA5m24aF3GYOYd95e90YNaHkVT1ILCArKzlrW2TiiwIERgJjMwgbEf02AAAEACD/tQPIA0MADQAbAEkAUgAABSc+ATc0Jic3HgEVFAYFBy4BNTQ2NxcOARUeAQEVHgMVFA4CIyImJzceATMyNjU0JiM1Mj4CNTQmIyIGByc+ATMyFhUUBgERIzU+ATczEQNLLT8vATA/LUM6Ov08LUM6OkMtPzABLwIhGzEkFR4zRSdCWRsqGEEwMUZWYSw+KBI3LSA3Fi4gTDBOXj/+RmkqPhsuSw5h3Xt532EOZtyFhttYDmbbhoXcZg5h33l73QFhBAgfLjwmMEs0HDYiNB0pRT9FUEEWJzMeNj0gGzIiKlxYQlT+cwJjMwgbEf02AAAABQAg/7UDyANDAA0AGwAkAC8AOQAAExcOARUeARcHLgE1NDYlNx4BFRQGByc+ATc0JgU1PgE3MxEjEQEjFSM1IzUTMxEzITM1NDY3Iw4BB50tPzABLz8tQzo6AsQtQzo6Qy0/LwEw/V8qPhsuSAIOS0Tv6EtL/sqnAgIECxUNA0MOYd95e91hDmbbhoXcWA5m3IWG22YOYd17ed9lMwgbEf02AmP+a87ONQHH/kXPHVMeHTIdAAAAAAQAIP+1A8gDQwANABsAQABJAAAFJz4BNzQmJzceARUUBgUHLgE1NDY3Fw4BFR4BAQc+ATMyHgIVFA4CIyIuAic3HgEzMjY1NCYjIgYHJxMhFQERIzU+ATczEQNLLT8vATA/LUM6Ov08LUM6OkMtPzABLwGoERUnGyI9LhsfNEMkITUrIw4qFzotNEc+MRsnFi8VARH+HWkqPhsuSw5h3Xt532EOZtyFhttYDmbbhoXcZg5h33l73QJr4Q4QGjZSOTpbPiAPGB8QNBsqXE9LVxcUGwFWR/19AmMzCBsR/TYABAAg/7UDyANDAA0AGwA5AEUAABcHLgE1NDY3Fw4BFR4BBSc+ATc0Jic3HgEVFAYlIi4CNTQ2NzQuAiMiBgcnPgEzMhYVESMnIw4BJzI2NzUOAxUUFsotQzo6Qy0/MAEvAsAtPy8BMD8tQzo6/ikhOSoYnKoKGCogLlEgJCVsQmBZTAgEJlYYJkMmQlk3GDQ9DmbbhoXcZg5h33l73W8OYd17ed9hDmbchYbbQRUoOSVYXxMaMSYXJRZBGS15Z/61QCAuTCQjlAgYISoaLigAAAQAIP+1A8gDQwANABsAMgBAAAAXBy4BNTQ2NxcOARUeAQUnPgE3NCYnNx4BFRQGBSImJyMHIxEzFQc+ATMyHgIVFA4CJzI+AjU0JiMiBxEeAcotQzo6Qy0/MAEvAsAtPy8BMD8tQzo6/oIjTiMCCUteAyRSLTNONhsmP1M9IDYoFj9JQEkiQT0OZtuGhdxmDmHfeXvdbw5h3Xt532EOZtyFhtsbIyA1AxrYYiArJ0hlP0ZtSyhPHTdPMlpsSf7mHxkAAAADACD/tQPIA0MADQAbAD0AABcHLgE1NDY3Fw4BFR4BBSc+ATc0Jic3HgEVFAYlIi4CNTQ+AjMyFhcHLgEjIg4CFRQeAjMyNjcXDgHKLUM6OkMtPzABLwLALT8vATA/LUM6Ov6KNl1EJytIXjQ2ThsvGDMgJT4tGhksPSUmQBkpJVs9DmbbhoXcZg5h33l73W8OYd17ed9hDmbchYbbQSZKakNEaUkmJxo8FRseN0wuLk02HiAXPiEmAAAAAAQAIP+1A8gDQwANABsAMgBAAAAXBy4BNTQ2NxcOARUeAQUnPgE3NCYnNx4BFRQGBSIuAjU0PgIzMhYXJzUzESMnIw4BJzI3ES4BIyIOAhUUFsotQzo6Qy0/MAEvAsAtPy8BMD8tQzo6/j4xUDkfJj9SLS1DIgRfTgkCHlEbREAhPCAfNicXRz0OZtuGhdxmDmHfeXvdbw5h3Xt532EOZtyFhtsbJklqQ0JqSSggHVvR/OY/IC1PSQEbHhkdNksvZGoAAAAEACD/tQPIA0MADQAbADgAQQAAFwcuATU0NjcXDgEVHgEFJz4BNzQmJzceARUUBiUiLgI1ND4CMzIeAhUUBgchHgEzMjY3Fw4BAyE0JiMiDgLKLUM6OkMtPzABLwLALT8vATA/LUM6Ov6JNF1FKChCVi4yTjYcAQL+oAVcSyY9HSIjVNkBE0I9GzIoGz0OZtuGhdxmDmHfeXvdbw5h3Xt532EOZtyFhttBJ0lqQ0JpSickQl46DhsKWGUXFD0YIQFGVVQXKz8AAAMAIP+1A8gDQwANABsAMQAAExcOARUeARcHLgE1NDYlNx4BFRQGByc+ATc0JgU1NDYzMhYXByYjIh0BMxUjESMRIzWdLT8wAS8/LUM6OgLELUM6OkMtPy8BMP4xTFQZLxMUJRhMc3NeSgNDDmHfeXvdYQ5m24aF3FgOZtyFhttmDmHde3nfqFRUYQsIRw5pVEz+LgHSRwAABQAg/7UDyANDAA0AGwBSAF8AcQAAFwcuATU0NjcXDgEVHgEFJz4BNzQmJzceARUUBgUiLgI1NDY3NS4BNTQ2NzUuATU0PgIzMhczFSMeARUUDgIjIiYnDgEVFBY7ATIWFRQOAgMVMjY1NCYjIgYVFBYTMj4CNTQmKwEiJicOARUUFsotQzo6Qy0/MAEvAsAtPy8BMD8tQzo6/l8tSzUeJSEUHCcUGiweNEUmKBm0ZxEZHDJDJwwlEQ0UIzBRW1kiP1k7LTk5LSo7OzogMiQTMzBECyAQGBRGPQ5m24aF3GYOYd95e91vDmHde3nfYQ5m3IWG2zoSIjQhIDwWBA4pHiAxDwQVSDAsRTAaDUgRNyArRDAZCAgLGRQXHjtAJEExHQHKAUM5OT8/OTlC/nYRHCMTIxoDBRIsFScuAAMAIP+1A8gDQwANABsAMAAAFwcuATU0NjcXDgEVHgEFJz4BNzQmJzceARUUBgURMxUHPgEzMhYVESMRNCYjIgYHEcotQzo6Qy0/MAEvAsAtPy8BMD8tQzo6/ZdeBCdTOFVMXS40Kj4oPQ5m24aF3GYOYd95e91vDmHde3nfYQ5m3IWG2w0DGthwJTRqav6pAUtLRSso/ngABAAg/7UDyANDAA0AGwAnACsAABcHLgE1NDY3Fw4BFR4BBSc+ATc0Jic3HgEVFAYBIiY1NDYzMhYVFAYDETMRyi1DOjpDLT8wAS8CwC0/LwEwPy1DOjr+ZxwlJRwaJiZLXz0OZtuGhdxmDmHfeXvdbw5h3Xt532EOZtyFhtsCfyMaGyEhGxoj/XQCHv3iAAAABAAg/2wDyANkAAsAGQAnADcAAAEiJjU0NjMyFhUUBgEHLgE1NDY3Fw4BFR4BBSc+ATc0Jic3HgEVFAYFIiYnNx4BMzI2NREzERQGAggcJCQcGyUl/qctQzo6Qy0/MAEvAsAtPy8BMD8tQzo6/hIZKQ4SCxsOKhldRALrIhocISEcGiL82A5m24aF3GYOYd95e91vDmHde3nfYQ5m3IWG268JBUgEBTkxAln9p1RjAAADACD/tQPIA0MADQAbACgAABcHLgE1NDY3Fw4BFR4BBSc+ATc0Jic3HgEVFAYFETMRMxMzBxMjAwcVyi1DOjpDLT8wAS8CwC0/LwEwPy1DOjr9n1wE2WisxGeTYz0OZtuGhdxmDmHfeXvdbw5h3Xt532EOZtyFhtsNAxr96QEb2v68AQN1jgAAAwAg/7UDyANDAA0AGwArAAAXBy4BNTQ2NxcOARUeAQUnPgE3NCYnNx4BFRQGBSImNREzERQWMzoBNxcOAcotQzo6Qy0/MAEvAsAtPy8BMD8tQzo6/pU2LV8PCgQICA0LGD0OZtuGhdxmDmHfeXvdbw5h3Xt532EOZtyFhtsbQTwCq/1OFhICRwMGAAADACD/tQPIA0MADQAbAD4AABcHLgE1NDY3Fw4BFR4BBSc+ATc0Jic3HgEVFAYlETMXMz4BMzIWFz4BMzIVESMRNCYjIgYHESMRNCYjIgYHEcotQzo6Qy0/MAEvAsAtPy8BMD8tQzo6/UxECAMaPiUtMQ0fQCp6Ux4gGi4aUSAgHCsaPQ5m24aF3GYOYd95e91vDmHde3nfYQ5m3IWG208CHjoeKSwmJS26/o8BZT83HyD+ZAFlPzcfIP5kAAMAIP+1A8gDQwANABsAMAAAFwcuATU0NjcXDgEVHgEFJz4BNzQmJzceARUUBiURMxczPgEzMhYVESMRNCYjIgYHEcotQzo6Qy0/MAEvAsAtPy8BMD8tQzo6/ZNNCQMmVDlVTV4uNCo+Jz0OZtuGhdxmDmHfeXvdbw5h3Xt532EOZtyFhttPAh5MJjNrZ/6nAU1LQyko/nYABAAg/7UDyANDAA0AGwAvAEMAABcHLgE1NDY3Fw4BFR4BBSc+ATc0Jic3HgEVFAYlIi4CNTQ+AjMyHgIVFA4CJzI+AjU0LgIjIg4CFRQeAsotQzo6Qy0/MAEvAsAtPy8BMD8tQzo6/mYxWkUpKUVaMTFaRCkpRFoxIjgoFhYoOCIiOCkWFik4PQ5m24aF3GYOYd95e91vDmHde3nfYQ5m3IWG20EmSmpDRGlJJiZJaURDakomTh42TS4uTDceHjdMLi5NNh4AAAAEACD/tQPIA0MADQAbADIAQwAAFwcuATU0NjcXDgEVHgEFJz4BNzQmJzceARUUBgURMxczPgEzMh4CFRQOAiMiJicXFTcyPgI1NC4CIyIGBxEeAcotQzo6Qy0/MAEvAsAtPy8BMD8tQzo6/ZVNCQIlVi41TzYbJkFULiNKJQOAIDcoFw8hNCYhRCcjQj0OZtuGhdxmDmHfeXvdbw5h3Xt532EOZtyFhtsiAts+HywnSGU/Rm1LJyAeXpD+HTdPMi1JNB0mI/7lHhoAAAAEACD/tQPIA0MADQAbADIAQQAAFwcuATU0NjcXDgEVHgEFJz4BNzQmJzceARUUBgU1Nw4BIyIuAjU0PgIzMhYXMzczEScyNjcRLgEjIg4CFRQWyi1DOjpDLT8wAS8CwC0/LwEwPy1DOjr+2QUgUi4xUjogJkBULi5GJAMITOUkQSEiPiAfNykXSj0OZtuGhdxmDmHfeXvdbw5h3Xt532EOZtyFhtsimWAeKyZIakRCaUonICAz/SX+JCYBGx0aHjZMLmRqAAAAAAMAIP+1A8gDQwANABsALgAAFwcuATU0NjcXDgEVHgEFJz4BNzQmJzceARUUBiURMxczPgEzMhYXBy4BIyIGBxHKLUM6OkMtPzABLwLALT8vATA/LUM6Ov3mTggEHFAuEhoOEw0WESJLGz0OZtuGhdxmDmHfeXvdbw5h3Xt532EOZtyFhttPAh5iNDsEB1IFBDdF/qUAAAAAAwAg/7UDyANDAA0AGwBNAAAXBy4BNTQ2NxcOARUeAQUnPgE3NCYnNx4BFRQGJSImJzceATMyNjU0LgInLgM1ND4CMzIWFwcuASMiBhUUHgIXHgMVFA4Cyi1DOjpDLT8wAS8CwC0/LwEwPy1DOjr+ZjpqJi0kSTM2MxUjLBcdOi4dGjBGLDNXHy0cOyMzMBQhLBcdOy8eGjNKPQ5m24aF3GYOYd95e91vDmHde3nfYQ5m3IWG20EsIT0dIzAiFR8YEwgKGiQyIiE4KRgjGTwUHC8eExwVEQgLGSY1JyE7KxoAAAAAAwAg/7UDyANDAA0AGwA1AAAXBy4BNTQ2NxcOARUeAQUnPgE3NCYnNx4BFRQGJSIuAjURIzU/ATMVMxUjERQWMzI2NxcOAcotQzo6Qy0/MAEvAsAtPy8BMD8tQzo6/q8rPCUQUFULTpOTJS4OIw0SFzQ9DmbbhoXcZg5h33l73W8OYd17ed9hDmbchYbbFhowQykBKUcFmJhM/tUzNQkGRwgMAAADACD/tQPIA0MADQAbADAAABcHLgE1NDY3Fw4BFR4BBSc+ATc0Jic3HgEVFAYlIiY1ETMRFBYzMjY3ETMRIycjDgHKLUM6OkMtPzABLwLALT8vATA/LUM6Ov4xVU9eLzQoPiZeTQkDJVM9DmbbhoXcZg5h33l73W8OYd17ed9hDmbchYbbQWtnAVr+s0tCKTABgf3iUy00AAMAIP+1A8gDQwANABsAKQAAFwcuATU0NjcXDgEVHgEFJz4BNzQmJzceARUUBiUDMxMeARczPgE3EzMDyi1DOjpDLT8wAS8CwC0/LwEwPy1DOjr+McNhZQ0ZDQQMGgtmXL89DmbbhoXcZg5h33l73W8OYd17ed9hDmbchYbbTwIe/s4oUiYmUigBMv3iAAAAAAMAIP+1A8gDQwANABsAPQAAFwcuATU0NjcXDgEVHgEFJz4BNzQmJzceARUUBiUDMxMeARczPgE3EzMTHgEXMz4BNxMzAyMDLgEnIw4BBwPKLUM6OkMtPzABLwLALT8vATA/LUM6Ov2VfVpBCAwIBAkNCUlcSAkOCQQIDgg/VHlxQwkOCAUIDQpAPQ5m24aF3GYOYd95e91vDmHde3nfYQ5m3IWG208CHv7JJ0smJksnATf+ySZMJiZLJwE3/eIBISdMKipOJv7gAAAAAAMAIP+1A8gDQwANABsANQAAFwcuATU0NjcXDgEVHgEFJz4BNzQmJzceARUUBiUTAzMXHgEXMz4BPwEzAxMjJy4BJyMOAQ8Byi1DOjpDLT8wAS8CwC0/LwEwPy1DOjr9fLGkZkgMGw4EDRcNQWOksGZPDh0PBQ4aDkk9DmbbhoXcZg5h33l73W8OYd17ed9hDmbchYbbTwEbAQN2Fi0XFy0Wdv7z/u99GDIXFzEZfQAAAwAg/7UDyANDAA0AGwA3AAAXBy4BNTQ2NxcOARUeAQUnPgE3NCYnNx4BFRQGBSInNx4BMzI2PwEDMxMeARczPgE3EzMDDgPKLUM6OkMtPzABLwLALT8vATA/LUM6Ov3TIiQSChoLLTYLCthhbA4ZDgQMFwteXMoMIC09PQ5m24aF3GYOYd95e91vDmHde3nfYQ5m3IWG2yYLSwMFKSUkAh/+1yRQJiVQJQEp/boiOCgXAAAAAwAg/7UDyANDAA0AGwAlAAAXBy4BNTQ2NxcOARUeAQUnPgE3NCYnNx4BFRQGJTUBIzUhFQEhFcotQzo6Qy0/MAEvAsAtPy8BMD8tQzo6/ZwBG/sBcv7kASU9DmbbhoXcZg5h33l73W8OYd17ed9hDmbchYbbTzIBoEwy/mBMAAAEACL/qgPGA04AEwAnAEEASgAABSIuAjU0PgIzMh4CFRQOAicyPgI1NC4CIyIOAhUUHgI3IiY1NDY3LgEjIgYHJz4BMzIWHQEjJyMOAScyNzUOARUUFgH0YKp/SUl/qmBgqn9JSn+pYFqedkREdp5aW551RER2njIxPGlzARsnHT0XGRtNLUI+OQgFFjgNKi9UQyFWSX+qYGCqf0lJf6pgYap+SSBEdp5aWp52REV2nllannZE7zowPD4LIy4YDjERHk5I2yoUHzksXQgsHh0aAAAAAAQAIv+qA8YDTgATACcAPABIAAAFIi4CNTQ+AjMyHgIVFA4CJzI+AjU0LgIjIg4CFRQeAjciJicjByMRMxUHPgEzMhYVFA4CJzI2NTQmIyIHFR4BAfRgqn9JSX+qYGCqf0lKf6lgWp52RER2nlpbnnVERHaefRg1FwUINUYDGTYgRkoZKzgqKDYrLi0uFi1WSX+qYGCqf0lJf6pgYap+SSBEdp5aWp52REV2nllannZEwxcWJAILjEAVHWFVL0kyGjtFQjxBLrQSEAAAAAMAIv+qA8YDTgATACcARQAABSIuAjU0PgIzMh4CFRQOAicyPgI1NC4CIyIOAhUUHgI3Ii4CNTQ+AjMyFhcHLgEjIgYVFBYzMjY3Fw4BAfRgqn9JSX+qYGCqf0lKf6lgWp52RER2nlpbnnVERHaebCVALhodMEAjJzYRIhEgGC48OzAcJw8dEzlWSX+qYGCqf0lJf6pgYap+SSBEdp5aWp52REV2nllannZE7xkxRy0sRjAaGQ4uDg1JOTxHEQ0uEBsAAAAEACL/qgPGA04AEwAnADwASQAABSIuAjU0PgIzMh4CFRQOAicyPgI1NC4CIyIOAhUUHgI3IiY1ND4CMzIWFyc1MxEjJyMOAScyNjc1LgEjIgYVFBYB9GCqf0lJf6pgYKp/SUp/qWBannZERHaeWluedUREdp5ESFEaLDgeHjAXBEY5BwMWMg8WKBYXKhQnNy5WSX+qYGCqf0lJf6pgYap+SSBEdp5aWp52REV2nllannZEw2ZeKkMwGRYTP4T99ScTHTsXFrQUEEM5QkcAAAAABAAi/6oDxgNOABMAJwBEAE0AAAUiLgI1ND4CMzIeAhUUDgInMj4CNTQuAiMiDgIVFB4CNyIuAjU0PgIzMh4CFRQGByMeATMyNjcXDgEnMzQuAiMiBgH0YKp/SUl/qmBgqn9JSn+pYFqedkREdp5aW551RER2nm4kQTAcGy49Iio5Ig8CAvIDPTMaLhMbGj6RuAkUIBgqM1ZJf6pgYKp/SUl/qmBhqn5JIER2nlpannZERXaeWVqedkTvGTFHLSxFMRogMDsbCw8NNz0QDC0QGNoTJR0SNAAAAwAi/6oDxgNOABMAJwA/AAABMh4CFRQOAiMiLgI1ND4CEzI+AjU0LgIjIg4CFRQeAhM1NDYzMhYXBy4BIyIGHQEzFSMRIxEjNQH0YKp/SUp/qWBgqn9JSX+qYFqedkREdp5aW551RER2nh8zPBQeDw8IFA0aGExMRjMDTkl/qmBhqn5JSX+qYGCqf0n8fER2nlpannZERXaeWVqedkQCNC04SwYGNQMFJSAyOP7QATA1AAAABQAi/6oDxgNOABMAJwBbAGcAdgAABSIuAjU0PgIzMh4CFRQOAicyPgI1NC4CIyIOAhUUHgI3IiY1NDc1LgE1NDY3NS4BNTQ+AjMyFzMVIx4BFRQOAiMiJicOARUUFjsBMhYVFA4CAzI2NTQmIyIGFRQWEzI2NTQmKwEiJicGFRQWAfRgqn9JSX+qYGCqf0lKf6lgWp52RER2nlpbnnVERHaeUkNSMw4SGBAUGxYmMxwaH3xGDA4WJTIcDBsOCA0bI0ZCPhoxRSofKysfICkpKTE8IyM6CRsLIjRWSX+qYGCqf0lJf6pgYap+SSBEdp5aWp52REV2nllannZEjjAwMRwECR0WFSELBQ0xIB8wIRILNgokFB4uIBEEBwgRDRESKDAZLiIUAUIrJCYpKSYkK/7vKBoXEAEEGB0cHQAAAAADACL/qgPGA04AEwAnADwAAAUiLgI1ND4CMzIeAhUUDgInMj4CNTQuAiMiDgIVFB4CJxEzFQc+ATMyFh0BIzU0JiMiBgcRAfRgqn9JSX+qYGCqf0lKf6lgWp52RER2nlpbnnVERHaeNEUDFz0lPjNGGioVLBxWSX+qYGCqf0lJf6pgYap+SSBEdp5aWp52REV2nllannZEzAILi0oXJE8/49kqMhob/wAAAAAABAAi/6oDxgNOABMAJwAzADcAAAUiLgI1ND4CMzIeAhUUDgInMj4CNTQuAiMiDgIVFB4CEyImNTQ2MzIWFRQGAxEzEQH0YKp/SUl/qmBgqn9JSn+pYFqedkREdp5aW551RER2nlsUGhoUFhoaOkdWSX+qYGCqf0lJf6pgYap+SSBEdp5aWp52REV2nllannZEAnkYExQZGRQTGP5TAWj+mAAAAAAEACL/qgPGA04AEwAnADMAQwAABSIuAjU0PgIzMh4CFRQOAicyPgI1NC4CIyIOAhUUHgITIiY1NDYzMhYVFAYDIiYnNx4BMzI2NREzERQGAfRgqn9JSX+qYGCqf0lKf6lgWp52RER2nlpbnnVERHaeZRQaGhQWGxtcEhgMDQgOCxoQRi9WSX+qYGCqf0lJf6pgYap+SSBEdp5aWp52REV2nllannZEAqEYExQZGRQTGP2zBAU3AwMiIAGM/ng8RAADACL/qgPGA04AEwAnADQAAAUiLgI1ND4CMzIeAhUUDgInMj4CNTQuAiMiDgIVFB4CJxEzETM3MwcXIycHFQH0YKp/SUl/qmBgqn9JSn+pYFqedkREdp5aW551RER2niVFBZBQfYtNaD5WSX+qYGCqf0lJf6pgYap+SSBEdp5aWp52REV2nllannZEzAIL/quyk9WlSlsAAAMAIv+qA8YDTgATACcANwAABSIuAjU0PgIzMh4CFRQOAicyPgI1NC4CIyIOAhUUHgI3IiY1ETMRFBYzOgE3Fw4BAfRgqn9JSX+qYGCqf0lKf6lgWp52RER2nlpbnnVERHaeeCogRgsIBAYFCggSVkl/qmBgqn9JSX+qYGGqfkkgRHaeWlqedkRFdp5ZWp52RMMwLQG3/kMQDAI2AgUAAAADACL/qgPGA04AEwAnAEsAAAUiLgI1ND4CMzIeAhUUDgInMj4CNTQuAiMiDgIVFB4CJxEzFzM+ATMyFhc+ATMyFh0BIzU0JiMiBgcRIzU0JiMiBgcRAfRgqn9JSX+qYGCqf0lKf6lgWp52RER2nlpbnnVERHaepDkHAhc2JSQ0DBo7JDw0RhsnEygaRxsmFCgaVkl/qmBgqn9JSX+qYGGqfkkgRHaeWlqedkRFdp5ZWp52RPgBaDMZIyIiGylPP+PZKjIZG/7/2SoyGRv+/wAAAwAi/6oDxgNOABMAJwA8AAAFIi4CNTQ+AjMyHgIVFA4CJzI+AjU0LgIjIg4CFRQeAicRMxczPgEzMhYdASM1NCYjIgYHEQH0YKp/SUl/qmBgqn9JSn+pYFqedkREdp5aW551RER2njo5BwIZPSQ+M0YZKhYsG1ZJf6pgYKp/SUl/qmBhqn5JIER2nlpannZERXaeWVqedkT4AWgzGSNPP+PZKjIaG/8AAAAAAAQAIv+qA8YDTgATACcAOwBHAAAFIi4CNTQ+AjMyHgIVFA4CJzI+AjU0LgIjIg4CFRQeAjciLgI1ND4CMzIeAhUUDgInMjY1NCYjIgYVFBYB9GCqf0lJf6pgYKp/SUp/qWBannZERHaeWluedUREdp5ZIj4uHBwuPiIjPi4cHC4+Iy40NC4tNDRWSX+qYGCqf0lJf6pgYap+SSBEdp5aWp52REV2nllannZE7xoxRiwtRjAaGjBGLSxGMRo7SDo8R0c8OkgAAAAABAAi/6oDxgNOABMAJwA8AEgAAAUiLgI1ND4CMzIeAhUUDgInMj4CNTQuAiMiDgIVFB4CJxEzFzM+ATMyFhUUDgIjIiYnFxU3MjY1NCYjIgcVHgEB9GCqf0lJf6pgYKp/SUp/qWBannZERHaeWluedUREdp4yNwgEFTkgSEkZKzgfGDcWA1YqNCouLi4XLFZJf6pgYKp/SUl/qmBhqn5JIER2nlpannZERXaeWVqedkSgAfgpFB5hVS9JMhoWFEVswkVCPEEutBIQAAAABAAi/6oDxgNOABMAJwA7AEkAAAUiLgI1ND4CMzIeAhUUDgInMj4CNTQuAiMiDgIVFB4CNzU3DgEjIiY1ND4CMzIXMzczEScyNzUuASMiDgIVFBYB9GCqf0lJf6pgYKp/SUp/qWBannZERHaeWluedUREdp6pBBQ1HUhSGiw5HjgtAwc2miwoFSwUEiMaEC9WSX+qYGCqf0lJf6pgYap+SSBEdp5aWp52REV2nllannZEoHNBFBljWyxGMBotJP4Iwyi3FBASITAePUUAAwAi/6oDxgNOABMAJwA4AAAFIi4CNTQ+AjMyHgIVFA4CJzI+AjU0LgIjIg4CFRQeAjcRMxczNjMyFwcuASMiBgcVAfRgqn9JSX+qYGCqf0lKf6lgWp52RER2nlpbnnVERHaeAzgHBCk+HA0NBxQJGDESVkl/qmBgqn9JSX+qYGGqfkkgRHaeWlqedkRFdp5ZWp52RPgBaD9IB0ACBCEt4gAAAAADACL/qgPGA04AEwAnAFAAAAUiLgI1ND4CMzIeAhUUDgInMj4CNTQuAiMiDgIVFB4CNyImJzceATMyNjU0JicuAzU0NjMyFhcHLgEjIgYVFBYfAR4BFRQGAfRgqn9JSX+qYGCqf0lKf6lgWp52RER2nlpbnnVERHaeXCdJGyIZNB0gITIeEyYfE0I6JzoXIxQmGB4dMCAmHChGVkl/qmBgqn9JSX+qYGGqfkkgRHaeWlqedkRFdp5ZWp52RO8dFC8SFx0WGBoMBxIZIhcqPRgRLQ4RHBEYGAwQDColMD8AAAMAIv+qA8YDTgATACcAPQAABSIuAjU0PgIzMh4CFRQOAicyPgI1NC4CIyIOAhUUHgI3IiY9ASM1PwEzFTMVIxUUMzI3Fw4BAfRgqn9JSX+qYGCqf0lKf6lgWp52RER2nlpbnnVERHaegzwvNjcJO2JiOA0bDg4mVkl/qmBgqn9JSX+qYGGqfkkgRHaeWlqedkRFdp5ZWp52RORFObk2A2RkObpECDQFCAAAAAADACL/qgPGA04AEwAnADwAAAUiLgI1ND4CMzIeAhUUDgInMj4CNTQuAiMiDgIVFB4CNyImPQEzFRQWMzI2NxEzESMnIw4BAfRgqn9JSX+qYGCqf0lKf6lgWp52RER2nlpbnnVERHaeNT8zRxkqFi0bRjkIAxc8Vkl/qmBgqn9JSX+qYGGqfkkgRHaeWlqedkRFdp5ZWp52RO9PPuTZLS0YGwEA/pgyFyQAAAAAAwAi/6oDxgNOABMAJwAwAAAFIi4CNTQ+AjMyHgIVFA4CJzI+AjU0LgIjIg4CFRQeAjcDMx8BMxMzAwH0YKp/SUl/qmBgqn9JSn+pYFqedkREdp5aW551RER2njGBRkEiBGNGglZJf6pgYKp/SUl/qmBhqn5JIER2nlpannZERXaeWVqedkT4AWjEbAEw/pgAAwAi/6oDxgNOABMAJwA9AAAFIi4CNTQ+AjMyHgIVFA4CJzI+AjU0LgIjIg4CFRQeAicDMx8BMz8BMx8BMz8BMwMjLwEjDwEB9GCqf0lJf6pgYKp/SUp/qWBannZERHaeWluedUREdp5BY0kwFQUXNUA3GgMXL0RhVTAXAxYwVkl/qmBgqn9JSX+qYGGqfkkgRHaeWlqedkRFdp5ZWp52RPgBaMdnZ8fHZ2fH/pi2Zma2AAAAAwAi/6oDxgNOABMAJwA3AAAFIi4CNTQ+AjMyHgIVFA4CJzI+AjU0LgIjIg4CFRQeAic3JzMXMz8BMwcXIycjDwEB9GCqf0lJf6pgYKp/SUp/qWBannZERHaeWluedUREdp5JeG9OUQQeKUptdU1XBCYsVkl/qmBgqn9JSX+qYGGqfkkgRHaeWlqedkRFdp5ZWp52RPi8rIM5SrO1ij1NAAMAIv+qA8YDTgATACcAQAAABSIuAjU0PgIzMh4CFRQOAicyPgI1NC4CIyIOAhUUHgInIic3FjMyNj8BAzMXHgEXMz4BPwEzAw4BAfRgqn9JSX+qYGCqf0lKf6lgWp52RER2nlpbnnVERHaeBCAODhEKHSgKB5FHRggSCQQIDwg6RYQVQFZJf6pgYKp/SUl/qmBhqn5JIER2nlpannZERXaeWVqedkScBzgGKCAWAWW8GTMbGjMavP6FOUgAAwAi/6oDxgNOABMAJwAxAAAFIi4CNTQ+AjMyHgIVFA4CJzI+AjU0LgIjIg4CFRQeAic1EyM1MxUDMxUB9GCqf0lJf6pgYKp/SUp/qWBannZERHaeWluedUREdp4wuqT+ur9WSX+qYGCqf0lJf6pgYap+SSBEdp5aWp52REV2nllannZE+CcBCDko/vk5AAAACAAA/4gD6ANwAAMABwALAA8AEwAXABsAHgAAASczFxEBMwERATMBEQEzAQcBNQEhATUBISc1ASE1FwPo+jLI/gwyAcL9EjICvPwYMgO2+v0SAyD+1P4MAib+1PoBLP7UMgJ2+sj+1AH0/j7+1ALu/UT+1APo/EoyAu4y/OAB9DL92voy/tQyMgAAAAABAGT/7AOEAwwAAwAAEyERIWQDIPzgAwz84AAAAgBk/+wDhAMMAAMABwAAEyERIRMRIRFkAyD84CUC1gMM/OAC+/0qAtYAAAADAGT/7AOEAwwAAwAHAAsAABMhESETESERAREhEWQDIPzgJQLW/e8BTAMM/OAC+/0qAtb97wFM/rQAAAAFAGT/7AOEAwwAAwAHAAsADwATAAATIREhASEVIQUhNSEFIRUhBSE1IWQDIPzgAvv9KgLW/SoC1v0qAtb9KgLW/SoC1v0qAwz84AL7mb+awJq+mQAFAGT/7AOEAwwAAwAHAAsADwATAAATIREhJREjEQERMxETESMRExEzEWQDIPzgAvuZ/cOZv5rAmgMM/OAlAtb9KgLW/SoC1v0qAtb9KgLW/SoC1gARAGT/7AOEAwwAAwAHAAsADwATABcAGwAfACMAJwArAC8AMwA3ADsAPwBDAAATIREhEyMVOwE1IxU7ATUjBTUjHQEzNSMFNSMVJSMVMzcjFTMXFTM1BTM1KwEVMzUrARUzBTM1IyEVMzUzFTM1KwEVM2QDIPzgvpmZv5rAmpoBWJmZmf5cmQFYmprAmpolmf6omprAmr+ZmQGkmZn9w5nlmsCamgMM/OAC+5mZmZmZmZm/mpqampqampommpqampqamr6ZmZmZmZkAAAAJAGT/7AOEAwwAAwAGAAoADgASABYAGgAeACEAABMhESEBNSMTASMBPQEnIyEBNQEHATMBEQEzAR0BFzMlFTNkAyD84AL7g4P+jIoB/riH/oMCvP3PpQIwjP1EAXKL/gO2if7BgwMM/OACeIP+jAF0/gK/h7j9Q4wCMab90AK8/rf+jQH9voi3g4MAAAkAZP/sA4QDDAADAAYACgAOABIAFgAaAB4AIQAAEyERIRMjFSUBFQkCIwclARUJAjUBIQE1CQIzNwczNWQDIPzgqoUCNP3MAr/9QQFBiLkBdf6LAf/+qgIt/UYBSQFx/gYB+v7Fh7R/fwMM/OAC+4WF/c2MAr/+vwFBubn+i4oB//0qAi6M/UYBcYr+BQE8/sS1tYAAAAAAKQBk/+wDhAMMAAMABgAJAAwADwATABcAGwAeACEAJQApAC0AMQA1ADkAPQBAAEMARwBLAE8AUwBXAFsAXwBiAGUAaQBtAHEAdQB5AH0AgQCEAIcAigCNAJAAkwAAEyERIQEXNwc3Iwc3Iwc3IwU3Jw8BNycHBTcnBwUnFSUXNQUnBxcvAQcXITcnBwU3JwcFFzcnHwE3Jxc3JwchJxUlFzUFFzcnBScHFzcXNycFFzcnBQcXPwEHFz8BBxc3IScVJRc1BRc3JyMHFzcfATcnHwE3JwUHFz8BBxc/AQcXNyEnFSUXNQUHMyUHMyUHMzcHM2QDIPzgAng2NvQ0aIo0aYk2awFSRUVFekZERgHCREZE/lE2AqMz/nxFRkV4REZEAX5FRkUBBUNGQ/4jRUZFeUVGRr9FRkX+TzQCpDL+sEZGRv7HRUVFeUZGRgE4RUVF/iNFRkV5RkZGeUZFRv3ENAKkMv3xR0VGv0RGRPJFRkV5Q0ZD/iNFR0R4RUVFekZERv3HNgKjM/16NGcCBjJl/lExY40xYgMM/OAC+zY2NDQ0NDY2k0VFRUZGREZEREVDATVrNjRnkUVGRUZERkRFRUVGREZDYEVGRUZGRkaMRUZFNGg0MmSRR0ZHRkVFRURFRkVGREVEXkVGRUZGRkZGRkVGNGgzMmSRRkVHREZEAURGREZDRkNeRUZERkZERUVGREY2bDUzZ0w0MzMyMjExAAEAHgAMA8oDOgACAAAJASEB9AHW/FQDOvzSAAACAB4ADAPKAzoAAgAFAAAJASEJASEB9AHW/FQB1v5qAywDOvzSAuT9QQAAAAEAev+jA6gDTwACAAAJAREDqPzSAXn+KgOsAAACAHr/owOoA08AAgAFAAAJAREJAREDqPzSAuT9QQF5/ioDrP4qAZb81AAAAAEAHv++A8oC7AACAAATIQEeA6z+KgLs/NIAAAACAB7/vgPKAuwAAgAFAAATIQkBIQEeA6z+KgGW/NQBlgLs/NIDCf1BAAAAAAEAQP+jA24DTwACAAABEQEDbvzSA0/8VAHWAAACAED/owNuA08AAgAFAAABEQkBEQEDbvzSAwn9QQNP/FQB1v5qAyz+agAAAAEADP+UA9wDZAADAAAJAwH0Aej+GP4YA2T+GP4YAegAAgAM/5QD3ANkAAMABwAACQcB9AHo/hj+GAHo/k0BswGzA2T+GP4YAegBs/5N/k0BswAAAAMADP+UA9wDZAADAAcACwAACQchCQIB9AHo/hj+GAHo/k0BswGz/PsBUgFS/q4DZP4Y/hgB6AGz/k3+TQGzAVL+rv6uAAAAAAIAMv+6A7YDPgATACcAAAUiLgI1ND4CMzIeAhUUDgIBFB4CMzI+AjU0LgIjIg4CAfRdpHpHR3qkXV2kekdHeqT+BkFwl1VWlnBBQXCWVlWXcEFGR3qkXV2kekdHeqRdXaR6RwHCVZdwQUFwl1VWlnBBQXCWAAAAAAQAMv+6A7YDPgATACcAOwBPAAATND4CMzIeAhUUDgIjIi4CJTQuAiMiDgIVFB4CMzI+AiU0PgIzMh4CFRQOAiMiLgIlNC4CIyIOAhUUHgIzMj4CMkd6pF1dpHpHR3qkXV2kekcDX0FwllZVl3BBQXCXVVaWcEH9Oy5RbD0+a1EuLlFrPj1sUS4CMSpIYDc3YEgqKkhgNzdgSCoBfF2kekdHeqRdXaR6R0d6pF1WlnBBQXCWVlWXcEFBcJdVPmtRLi5Raz49bFEuLlFsPTdgSCoqSGA3N2BIKipIYAABADL/ugO2Az4AEwAABSIuAjU0PgIzMh4CFRQOAgH0XaR6R0d6pF1dpHpHR3qkRkd6pF1dpHpHR3qkXV2kekcAAgA8/8QDrAM0ABMAHgAAARQOAiMiLgI1ND4CMzIeAgERMj4CNTQuAgOsRXigW1ugeEVFeKBbW6B4Rf5IVpVvQEBvlQF8W6B4RUV4oFtboHhFRXigAT/8zEBvllVWlW9AAAAAAAIAPP/EA6wDNAATAB4AAAEUDgIjIi4CNTQ+AjMyHgIBESIOAhUUHgIDrEV4oFtboHhFRXigW1ugeEX+SFWWb0BAb5YBfFugeEVFeKBbW6B4RUV4oP4LAzRAb5VWVZZvQAAAAAABACb/wQPCAzUADgAAASEVBRMHJQUnEyU1IRMzAmQBXv7lbwP+4f7hA2/+5QFebgQB5QTN/q4B0NABAVLNBAFQAAAAAAIAJf+/A8MDNQAOACcAAAETMxMhFwUTByUFJxMlNwUjJxUfAQ8BFz8BHwE3LwE/ATUHIy8BIwcBhGwIbAFeAf7kcQf+4/7jB3H+5AEBebxjV5Y4KQJajIxaAik4lldkuzoaAhsB5QFQ/rAJyP6xBtLSBgFPyAklBQI3aqZqAUdnZ0cBaqZqNwIFs2FhAAAAAAMAKAAbA8ACvQA+AEIAVgAAASMXFhUUBg8BIiY1ND4CNz4DMzIeAhceAxUUBiMnLgE1ND8BIxUUFhceARUUBiMhIiY1NDY3PgE1JSMVMwcUHgIzMj4CNTQuAiMiDgIBSWspBAIPtg8NAwwVEiBLYHtQUHtgSyASFQwDDQ+2DwIEKWs+OTQoFBr9YBoUKDQ5PgEAqqr9Gi49IyM9LhoaLj0jIz0uGgI6agcLAg4DHwwQETEzLg4YJRoNDRolGA4uMzEREAwfAw4CCwdqQDRYNjN5QhgXFxhCeTM2WDRAYOAjPS4aGi49IyM9LhoaLj0AAAYAGgANA84CywBCAIEAhQCJAJ0AsQAAASMXNR4BFRQGDwEiJjU0PgI3PgMzMh4CFx4DFRQGIycuATU0NjcVNyMVFBYXHgEVFAYjISImNTQ2Nz4BNQcnMxUUBgcOARUUFjMhMjY1NCYnLgE9ATMHFQYVFB8BMjY1NC4CJy4DIyIOAgcOAxUUFjM3NjU0Jzc1MxUnIxUzFxQOAiMiLgI1ND4CMzIeAgUUHgIzMj4CNTQuAiMiDgIBO0kiAwEJE7YUGAQNFxMgTmN+UFB+Y04gFBcMBBgUtxMIAQMiSTs4NiodH/1gHx0qNjg7QTCNQjkzJQ0TAqATDSUzOEONMAMFtggEAwsTEB9IX3hPT3hfSB8QEwsDBAi1BgOXxhyOjm8dMkIlJUIyHR0yQiUlQjId/rAYKjggIDgqGBgqOCAgOCoYAixXAQcMAwgWBR8VFREzNzIPGScaDQ0aJxkPMjc0EBUVHwUWCAMMBwFXMjFRNjZ9RRwhIRxFfTY2UTEvfU45XTYwckITDg4TQnIwNl44Tn0BBwQEAh8FCRAvMCsMGCQYDQ0YJBgMKzAvEAkFHwIEBAcCfHxgRO4lQjIdHTJCJSVCMh0dMkIlIDgqGBgqOCAgOCoYGCo4AAAGABwAcgPFAlEASQCVALQA2AD1AQ0AACUnIgYHDgEjIi4CJyMHIiYnNCMmIycjJic0JyYnJjU0Nj8BNjU0IyIGKwEiJy4BNTQ+Ajc+BTMyFhcWMzcyFRE0BgcGAwcqAScuAyMiBg8BDgMVFBceATMyPgI3NjMyFhceARceATMyFhUUDgIjIiciFRQOAgciFRQzFxY7ATI2NzYyMxcyPQE0BTI2Nz4BNzU2FTQnNCMOAwcOAxUUFhcWMj4BFxYyNz4DNTQnJiMiBw4BBw4BIyImJy4BIyIHDgMVFBYXMj4CNTQnLgEjIgcOAQcOASsBIiYnIhUeAxcyPgI1NCYjIgYHDgMjIiYnIhUeAQO2TwULBUidTgwcGxUGCAkrPgMCAgIEAicDBBgJCQQPAwIEEiYRLwYFMiMQGR4OEkFPV1FFFj2pZwEISg8BAQQfNgMHAyxYTkEWJi8aEQccHBYBBxkFDDI3MAkBBQEHAggoICBEHgUMFh0cBhgeOg0YJBcCAQEICRNOl0gDBwM/DP1jEy4NDyoPAgEDKVlTQxMYGQwCFScLJSssMxQlCA0yMyYBAggEAQ4mERIUBRcfCwIHAQUBBxQSDRtyDzg2KQkEBwEEBQ4fDhxDJhAECAUFBBAYHzYQMi8iCAgBCgkQJyglDgkTCAQGKrcJAQIhKgIDBAIBKi4DAgIYOAYBDBMREAUcDwICAQMBAQQlFhIYDwkDAwgHCAUELisBCQ7+0wIEBQcBKwcCEyAWDQ0RDAYVGRoLBAEOAw0REQQBAQQLHxEREgYFCQoFAQM5GycdFgsBAQEBLiACCAr7CBwIEBAgDgEKAQcBAwMHCAgEBQsMCgQMFQMBAQGCBAICCREZEggBCAEECgUEAhAXBQEBAwoNEAoaFWEOGSETDwoDAQMHEAYMDgEBBRUXDANRDRcfEgcTAQYLEg4HAQEDHBkABgAhAHIDygJRAEoAlQC0ANgA9QEOAAABMh4EFx4DFRQGBwYrASIjJyIjIhUUHwEeARUUBwYHBhUGByMHIgciFQ4BIycjDgMjIiYnJiMHIicuARURNDMXMjc+AQMeATsBMj8BNCMuAzU0IwYjIi4CNTQ2MzI2Nz4BNz4BMzIXHgMzMjY3NjU0JicuAS8BLgEjIg4CBwYiIyciHQEUMzc6ASUyHgEyNz4BNTQuAicuAyciFQYVNBcVHgEXHgEHPgE1NC4CJyYjIgYHDgEjIiYnLgEnJiMiBwYVFB4CFxYyBzI+Ajc0Iw4BKwEiJicuAScmIyIGBwYVFB4CBzI2NzQjDgEjIi4CJy4BIyIGFRQWFx4BAdAWRVFXT0ESDh4ZECMyBQYuDQ8SDg4EAgMPBAkJGAQDJwIEAgICAz4rCQgGFRscDE6dSAoLTwkEAQEPSggBZ6n/SJdOEwkJAQIXJBgNOh4YBhwdFgwFHkQgICgIAgcBBQEJMDcyDAUZBwEFDg4kDxIaLyYWQU5YLAMHAzYKDD8DBwJIEywrJQsnFQIMGRgTQ1NZKQMBAg8qDw0uDRcbDRIUBwEFAQcCCx8XBRQSESYOAQQIAgEmMzINCCVHEx8YEAQFBQgEECZDHA4fDgQFAQcECSk2OBQbKgYECBMJDiUoJxAJCgEICAELGUsCUQQFCAcIAwMJDxgSFiUEAQEDAQICDxwFEBETDAEGOBgCAgMwKAECBAMCKiEDCQcFBAIBLQ4JASsu/oogLgIBAQsWHScbOQMBBQoJBQYSEREfCwQBAQQREQ0DDgEEBA4PDx0MDBENDRYgEwIHCPsKCOkBAQEDFQwECgwLBQQICAcDAwEHAQoBDiAQEAiCBRUaChANCgMBAQUXEAIEBQoEAQgBCBIZEQkCAlgDDBcVBQEBDgwGEAcDAQMKDxMhGQ5RGRwDAQEHDhILBgETBwINCxkiAAAAAAIAtP/EAzQDNAAeADIAAAE0PgIzMh4CFRQOAgcVIRUhESMRITUhNS4DJTQuAiMiDgIVFB4CMzI+AgEcIjpPLS1POiIcMEMnAR7+4kT+4gEeJ0MwHAFrFyg2Hh42KBcXKDYeHjYoFwJcLU87ISE7Ty0oRzkmBmxE/uwBFERsBiY5RygfNSgXFyg1Hx42JxcXJzYAAAACAHT//ANfAucAGwAvAAAlFA4CIyIuAjU0PgIzMhcBITUhESMRAR4BBRQeAjMyPgI1NC4CIyIOAgIkIjtOLS1OOyIiO04tRDgBIP7/AXhF/t8UF/6VFyg2Hh42KBcXKDYeHjYoF9QtTjsiIjtOLS1OOyIpAR9F/ogBBP7gGkIjHjYoFxcoNh4eNigXFyg2AAABAFP/xQOVA1YARgAAAR4DFRQOAiMiJi8BJiMiBhUeAxcWFRQGIyEiJjU0Nz4DNzQmIyIPAQ4BIyIuAjU0PgI3PgM/ARceAwLXG0M5Jx00Si05WRMHAwYFAQMQGSIVBgMD/v4DBAcVIhkQAwEFBgIIE1k5LUk1HSc5QxshRD0xDgICDTE9RQJXGkFOXDYsTzwjNisRBRACJz0xJxIGBQIHBwIFBhInMT0nAhAFESs2IzxPLDZcTkEaIEdEPRUCAhU9REcAAgBO/9cDnAMeAC4AWQAAAT4DMzIeAhUUDgIHDgMPAScuAycuAzU0PgIzMh4CFxYVFzIFNC4CIyIGBwYjIicuASMiDgIVFB4CFx4DHwE3PgM/AT4DAfcRMDg9HSxMOSEnO0QdIkU8MQ4CAg4xPEUiHUQ7JyE5TSsdPDgwEgEBAQGBHC8/I0JYIAsQEAsgWEIjPy8cJjdAGyE8NCkOAgINKjQ9IToXLSMWAokqOSMPJUFZMzdhUUQbIUtIQRYCAhZBSEshG0RSYDczWUElDyM5KgEBAVosSzgfR0saGktHHzhLLDBXTUEZHkA9NhUCAhU3PT8eOhc4PkQAAAAAAQBA/8UDqAMmAGEAACUiBgcOASMiLgI1ND4CMzIWFxYzMjc2NTQnLgE1ND4CMzIeAhUUBgcOARUUFxYzMjc+ATMyHgIVFA4CIyImJy4BIyIGFR4DFxYVFAYjISImNTQ3PgM3NCYB0AYDBxxfPCpKNh8eNkosFy4RAQIDAQEBHyIgOEsrK0s4ICQaAgIBAgICAREvFS1KNh4fNkoqOV8fBwMGBQEDEBkiFQcEA/7/BAMGFSIZEAMBuQsLLTseNkotK0o3IA4JAQMBAgIBH0ctK0s5ISE4SystSxkBBAECAQMBCQ4gN0orLUo2HjgwCwsQAic9MScSBgUCBwcCBQYSJzE9JwIQAAAAAgBQ/8MDmANaAE4AkAAABSEiJjU0Nz4BNz4BNTQjBxUUDwEUBw4BIyIuAjU0PgI3PgM/ARceAxceAxUUDgIjIiYvATQvATQvASIVFBYXHgEXFhUUBiczNy4DNTQ2MzIWFx4BMzI+AjU0LgInLgMvAQcOAwcOAxUUHgIzMjY3PgEzMhYVFAYHBgcGBxQCgv7kAwMGJisIAgEBBAEFAhhUMC1KNR0nOkMbIkU9MQ4CAg0xPUYiG0M6Jx01Si0wVBgBAQUCAwEBAggrJgcE2I4BDxYOBgoOCxAOGUQuJjwqFyU2PRkePjYsDQICDCw3Ph4ZPjYlFys9JS5EGQ4QCw4KGxMEBAIBPQgCBQYjTDcMDQMEBwEBAQYCAiMoJDxQLDZdT0IaIEdFPRYCAhY9RUcgGkJPXTYsUDwkKCMBAgEGAgIGBAMNDDdMIwYFAgglARcoKi8cFyMVEyMoHTNDJTBVSDwXHT87NRMCAhM1Oz8dFzxIVTAlQzMdKCMTFSMXPEscBwYCAgEAAAABAE//2QOZAxwAKwAAAT4BMzIeAhUUDgIHDgMPAScuAycuAzU0PgIzMh4CFxYzMgH5FnJHK0w5ISg6RBwiRDwxDgICDjE8RCIcRDooITlMKyNBNykLAQQEAnxTTSVBWDM3YFFDGyFLSEAWAgIWQEhLIRtDUWA3M1hBJRMnPCoHAAIAPf/DA6sDKQBVAK8AABM0PgIzMhYXFjMuATU0PgIzMh4CFRQGBxcyNz4BMzIeAhUUDgIjIiYnLgEnJiciFBceARcWFRQGIyEiJjU0Nz4BNzY0IwYHBg8BDgEjIi4CJS4BIyIOAhUUHgIzMjc+ATMyFhUUBg8BBhUXMzI1NC8BLgE1NDYzMhYXHgEzMj4CNTQuAiMiBgcGIyImNTQ2Nz4BNTQuAiMiDgIVFBYXHgEVFCMiPR41Sy0XLw0BARseIThMKytMOCEdHQEBAQ0vFy1LNR4fN0oqN1scAwMCAQIBAgcvIwYDA/7kAwQHIy8HAgECAQICBB1aNypKNx8BHBAoGiQ9LBgaLTwiZD0IDwsODRoWCQEBkAICCRYaDQ4LEQ4bSzMiPC0aGCw9JBooEBkCCw8KDREcGy4+IyM+LhscEQ0KGAwBByxLOCAMBwEdVCYrSzkhITlLKyhRHQEBBwwgOEssLUw2Hy8lBAgCAwIXCzlKIwYFAggIAgUGI0o5CxcCAwIECCYuHzZMxgYLGi4+JCQ+LRpaDBQhGjpLIAwBAgEBAQIMIEs6GiEYEiUrGi0+JCQ+LhoMBgULCwYUEBRAKyM+LhwcLj4jK0AUEBQGFgAAAAQATf/xA5sDHQAZADMATQBvAAABLgE1NDY3Fw4BFRQWFx4BFRQGByc+ATU0JicuATU0NjcXDgEVFBYXHgEVFAYHJz4BNTQmJS4BNTQ2NxcOARUUFhceARUUBgcnPgE1NCYFFA4CIyIuAjU0NjcXDgEVFB4CMzI+AjU0Jic3HgEBzxUWKzkfIyIXFhUWKzkfIyIXwxUUJTcdIhwZFBUUJTcdIxsYAUkUFSU4HCIcGRQVFCQ4HCIbGAEGQHGbW1ubcUBRQxMuNjZggkxMgmA2Ni4TQ1EByShOHTlhJxAgSCIhSyooTh45YCcQIEgiIUssI0YaMFUkER08HRxFJCNFGjNTJBEdPRwcRiMjRhovViQRHD0dHEUkI0UaMlQkER09HBxGwDRbQiYmQls0P1UQGg45LSdEMRwcMUQnLTkOGhBVAAAAAAEBGv+wAi4DSAAUAAABMxEUDgIjIi4CNTQ+AjMyFhcCBigeM0IkESIaEB8xPh8RIwsDSP0SJz8sGAkTHBIbMScXBwYAAQD6/7AC9ANIACwAAAEzFB4CFx4DFRQGByM+AzU0LgInERQOAiMiLgI1ND4CMzIWFwHmGRMgKhcXLiUXMCQaCBYUDRwxQyceM0IkESIaEB8xPh8RIwsDSCQ/Ni8UFDE5QCM/ezoRMDc8HixMPCoJ/gonPywYCRMcEhsxJxcHBgACABj/oQNNA1cAKQAtAAABJREUDgIjIi4CNTQ+AjMyFhcRBREUDgIjIi4CNTQ+AjMyFhcBNQUVAQQCSR4zQiQRIhoQHzE+HxEjC/4HHjNCJBEiGhAfMT4fESMLAiH+BwLXgP10Jz8sGAkTHBIbMScXBwYBVm7+eyc/LBgJExwSGzEnFwcGAjpIbkgAAAIBXP/IAuUDMAAUACAAAAEyHgIVFA4EByMRMxE+AwcRPgM1NCYjIgYCWSE0JBMnP1FVUyEJJxEvNz61KVpLMS4iJ14B2hQiLhozTUA3OD4nA2j+HB40JhbE/vstRkVONC4pQwABADT/yAFVAOAACQAAJQcuASc3HgMBVUQwdzZBGzs7OAI6PHcsORY2OzwAAAIAKv/DAVsA9AATACUAADcyHgIVFA4CIyIuAjU0PgIXMjY1NC4CIyIOAhUUHgLCIDgpGBgpOCAfNyoYGCo3Hys6EBslFRUkHBAQHCT0GCk3IB84KhgYKjgfIDcpGP47KxUkHBAQHCQVFSYbEAAAAAACAOQAgAMEAm4AAwAHAAABFwMnARcDJwGFXs4xAcJezjECbij+OhQB2ij+OhQAAAABADz/qgGkA04ABQAAEwEHCQEXjAEYP/7XASk/AXz+Sx0B0gHSHQAAAQA8/6oBpANOAAUAABcnCQE3AXs/ARj+6D8BKVYdAbUBtR3+LgAAAAIAF/+qAckDTgAFAAsAABsBBwMTFwMTBwMTF1TXNt7eNjnXNt7eNgF8/kASAdIB0hL+QP5AEgHSAdISAAIAF/+qAckDTgAFAAsAABcnEwM3EwEnEwM3E+s219c23v6ENtfXNt5WEgHAAcAS/i7+LhIBwAHAEv4uAAEAhgDHAcIDTgAFAAA3ESEVIxGGATzyxwKHRf2+AAAAAQAe/6oBWgIxAAUAAAERITUzEQFa/sTyAjH9eUUCQgACAFMAtwHCA04ABQALAAABIxEjESEHIREzETMBwsSrAW8s/vBGygKs/gsClzL9yQH5AAAAAgAf/6oBjgJBAAUACwAANzMRMxEhNyERIxEjH8Sr/pEsARBGykwB9f1pMgI3/gcAAQKa/6oDxgNOAA4AAAEhFQ4DFRQeAhcVIQKaASwpSDYfHzZIKf7UA04FI2B1iUxMiXZgIgUAAAABACL/qgFOA04ADgAAAREhNT4DNTQuAic1AU7+1ClINh8fNkgpA078XAUiYHaJTEyJdWAjBQAAAAIAZP/sA4QDDAADAAcAAAERIREBESERA4T84AMg/OADDP7UASz+DP7UASwAAQLJ/54DwQNaAAcAAAUnETcXBxEXA6DX1yGysmKMAqSMNHL9kHIAAAEAJ/+eASADWgAHAAAlByc3ESc3FwEg2CGysiHYKow0cgJwcjSMAAABALYAkwLjAmYABQAAEyERIxEhtgItUf4kAmb+LQGRAAIAjQCSAygCZgAFAAsAAAEhESMRIyUhESMRIwH3ATFR4P6WATdR5gJm/i0BkUH+LQGRAAACAIcAiwNEAm4AFAAaAAABFRQeAhcHLgEnDgEHJz4DPQEFNSERIxECoxMoPCorPE4UFE48Kyo9KBP+MwEcUQJupyZNRTgROxpbOTlbGjsROEVNJqdMQ/4tAZAAAAEAugCWAvMCYwAFAAAlIRUhETMBDAHn/cdS2UMBzQAAAQCgAIoDJAJvACQAAAEVFB4CFwcuAScOAQcnFw4BKwERMxE+ATcXPgM9ASM1IRUChRInPCouOksUFEc5GwE8bTwqUi1YLQUmNSIQggFWAihOKVJJPBM9HVw8PFsdIgQRCAHf/mMCCg4eFDxHTidOQkIAAAAEAJ8AgAMJAngABwASACYAMgAAATMVITUzNTMFET4BNxcOASsBEQUyHgIVFA4CIyIuAjU0PgIXMjY1NCYjIgYVFBYChoP+n45Q/motWi0LPG48KgG8IDYpFxcpNiAhNykXFyk3ISMtLSMlLi4CHkNDWh3+egEKDkMRCAHJohcqOSMiOikXFyk6IiM5Khf6MyoqMzMqKjMAAAEAvACRAugCaAAHAAAlIRUhESEVIQEOAdr91AIk/i7UQwHXQwAAAAACAJ8AkQMCAmMADAAUAAATET4BNxcOASsBESEVEzMVIREhFSPwM2M3CEN2Py4BHXjO/uIBG8sCIP62AQkNRBAHAdFD/rRDAdJDAAAAAQCyAIQC9AJtAAsAACUhFSERITUhNSERIQECAfL9wAHi/hwCMv4eyEQBF5BC/u0AAgCXAIkDCQJnABAAFgAAExU+ATcXDgErAREzNSM1IRETIREjESPqQH1GCVKMSzTW2AEpIAEpUdgBWo4BCQ5CEAkBE4hD/vMBDf4mAZcAAAADAJUAigMUAmYAAwAUABgAAAEhESEnFT4BNxcOASsBETM1IzUhEQURIxEB5AEw/tD8NmtACE18QTDR0wEkARKdAmb+Jc6MAQcLQw0GARKHQv70jAFX/qkAAwCVAIkDFgJnAAcAGAAcAAABMxEhETMVMwUVPgE3Fw4BKwERMzUjNSERBTUjFQLITv7OTZf+IDltPwlLgEMx0dMBJAEPlwJn/iMB3aRqjQEIDUIPCAETh0L+9IyysgAAAQCUAIsDSAJuACUAAAEVFB4CFwcuAScOAQcnDgErAREzNSM1IREjFT4BNxc+Az0BAqoSJzwpLTpLFBRLOhZIf0Ux0dMBJNE5bTwEJTUjEQJuqCZNQzgRPBpYOTlYGh4RCQESh0L+9IwBCg4dEzdCSCSoAAACAJYAiwMdAmYACwAcAAAlMxUhESEVIxUzFSMFFT4BNxcOASsBETM1IzUhEQI+3/7QASnYzs7+qzltPAhGf0Ux0dMBJM5DAdtDhkMBiwEKD0MRCQERh0L+9AAAAAMAlgCPAyUCagAQABwAIAAAExU+ATcXDgErAREzNSM1IREFMxUhNTMRIzUhFSsBETMR6TdrOgpIe0UvxsgBGQE+OP6yNjMBRjOXTgFejAEKDkMRCAESh0L+9IxDQwFVQ0P+qwFVAAAABACYAIIDHwJ8AAcAGAAsADgAAAEzFSE1MzUzARU+ATcXDgErAREzNSM1IRE3Mh4CFRQOAiMiLgI1ND4CFzI2NTQmIyIGFRQWAp6B/qeIUP5NNmU5CkV5Qi+5uwEMzyA2KRcXKTYgITcpFxcpNyEjLi4jJS4uAhtDQ2H+4ZABCA5DDwgBE4hA/vhZFyg5IiI5KBcXKDkiIjkoF/QyKCgyMigoMgACALgAkwLoAmYAAwAHAAATIREhASERIbgCMP3QAd/+cwGNAmb+LQGR/rEAAAIAugCKAuYCbAAHAAsAABMzFSE1MxEhNxUhNbpRAYlS/dRRAYkCbKSk/h71rq4AAAQAogCPAwgCagAHAA8AEwAXAAATMxUzNTMRIQEzFTM1MxEhJxUzNTMVMzWiTIlL/uABRkyITP7g+om9iAJqo6P+JQHbo6P+JvSxsbGxAAAAAgCiAIsDUQJuAB0AIQAAARUUHgIXBy4BJw4BBycVIREzFTM1MxE+Az0BAzUjFQKvEyg9Kiw8ThQUTjwn/uBMiUspOycT6YkCbqcmTUQ4ETwaWzk5Wxo1LgHbo6P+XBI3REsmp/5osbEAAAAAAQCTAH8DDgJ0ABQAAAEVFB4CFwcuAScOAQcnPgM9AQH6KkplOyhekiUlkGEoPGVKKgJ0kThfSTQOQhpqUVFqGkIONElfOJEAAQBmAJUDQQJkACcAAAEVFB4CFwcuAScOAQcuAScOAQcnPgM9ATMVFB4CFz4DPQECoBInPSsuPE0UFE8/P1AUFEs8MCw9JxJSDh4uICAuHg4CZHQnUEk9Ez0dZDw/bR8gcD88Zx88FUFLTyJ0eB5FREAZGT9DRSB4AAAAAAIAtACDAuUCcAATACcAAAEyHgIVFA4CIyIuAjU0PgIXIg4CFRQeAjMyPgI1NC4CAcw7Z0wrK0xnOztmTCsrTGY7Kko2Hx82SiorSjYfHzZKAnAlQVo2NltBJSVBWzY2WkElRhsvQCYnQS8aGi9BJyZALxsAAQCmAIQDAQJsABgAAAEVFB4CFwcuAScOAQcnPgM9ASM1IRUB/CdFYDkoW4khIopbJzlgRSfsAioCKj04X0w2D0Ecb1JSbxxBDzZMXzg9QkIAAAAAAQBeAIMDRAJyACsAAAEVFB4CFwcuAScOAQcuAScOAQcnPgM9ASM1IRUjFRQWFz4BPQEjNSEVAqQRJj0sMjZIFRVRRUVTFRVJOTItPigSfAE6bTpGRTptATkCLzYrWFBCFUAcWDlCXRoaX0I5WhxAFUFQWCw2Q0M2Y5UmJpRkNkNDAAAAAQCgAGUC/QKSABwAAAEVFB4CFwcuAScOAQcnPgM9ASM1MzUzFTMVAf4lRF05J16KIB+LXiY5XUQl6O5S7QHMGjJXRTINQBhqUVFqGEANMkVXMhpDg4NDAAEArACCAugCbgAJAAATIREjNQUnJTUhvwIpUv4hCwHq/ikCbv4U0h5KFpUAAQC7AIsC8AJlAAsAACUhFSERIRUhFSEVIQENAeP9ywIt/iUB1P4szUIB2kOFQgAAAgCiAI4DAAJrAAsADwAAJTMVITUzESM1IRUjIREzEQJ+gv2ignQCQnT++LfQQkIBWEND/qgBWAADAKgAXQL6AqEABwAbAC8AAAEhFSE1ITUzBzIeAhUUDgIjIi4CNTQ+AhMyPgI1NC4CIyIOAhUUHgIB+gEA/a4BAFIpMFE7ISE7UTAwUDshITtQMB0yJRUVJTIdHTIkFRUkMgIoRER5/BgrPSQkPSsYGCs9JCQ9Kxj+/Q4ZIxUVIxkODhkjFRUjGQ4AAAEBif/EAqsDNQAHAAABFSMRIxEzEQKr0FJSAc5F/jsDcf6ZAAEBOP/EAm4DNAALAAABMxEjESMRIxEzETMCIE5Omk5OmgM0/JABy/5WA0H+rAAAAAEBbf/EAooDNAALAAABIxUzFSMRIxEzETMCisvLy1JSywHssET+zANw/vwAAgE5/8QCbAM1AAsADwAAATMRIxEjESMRMxUzBzM1IwIdT0+XTU2Xl5eXAzX8jwFF/twDQ+jzrwABASv/xAJPAzQABwAAATMRIxEjNTMB/FNT0dEDNPyQAcpFAAACAOr/xAKOAzUAAwALAAABMxEjAxEzESMRIzUCQE5Osk1NpAM1/I8CEQFS/LwBrkQAAAAAAQEs/8QCUQM0AAsAAAEzESMRIzUzNSM1MwH/UlLT09PTAzT8kAFMRKhEAAACAOb/xAKMAzUAAwAPAAABMxEjAzUzESMRIzUzNSM1Aj1PT69NTaiopwM1/I8CguL8vAExRKlEAAEAOACgA18CWgAHAAAlIRUhNSERMwH0AWv82QFpU+NDQwF3AAIAPP/EA2cDNQAHABcAAAEVIxEjETMRJRE+ATcXDgMjJzI2NxEDZ4ZSUv6cPHQ2B0SRjoY6CzZ6QAHNRP47A3H+mFX+zgMIBzwLDQgCRQECATYAAAIAQv/EAy8DNQALABsAAAEzESMRIxEjETMRMyURPgE3Fw4DIycyNjcRAuFOTmVOTmX+cDBeKgU1eHhwLQoqYjYDNfyPAcj+WQNE/qZW/t0CCAU8CQwGA0UBAgEmAAAAAAIAZf/EAxUDNAADABMAAAEzESMBET4BNxcOAyMnMjY3EQLDUlL+5TxyNgZEkY2GOQw2ekIDNPyQAlb+4wMICD0LDgcCRQECASEAAAABAD4AlQNlAmQACwAAJTMVITUzETMRMxEzApbP/NnRUOZR2UREAYv+dQGLAAEAPQCaA2QCXgAHAAABFSERIxEhNQNk/pVS/pYCXkT+gAGARAAAAAACAE//xAM0AzQABwAXAAABMxEjESM1MycXDgEHESMRDgEjJzI+AgLhU1PU1EYGRYxGUjxvMwtBkpiZAzT8kAEEQb48CgwE/pcBZgICRAIFCgAAAAADAEn/xANDAzUAAwALABsAAAEzESMDETMRIzUjNTcXDgEHESMRDgEjJzI+AgL0T0+pTk6icQYuZDROM18oCTB2fXoDNfyPAUcCFfy87kG4OAgLA/6SAWkDA0EDBgkAAAACAGD/xAMwAzUAAwASAAABMxEjAxcGBxEjEQ4BIycyPgIC3lJSLgZ+g1JCfTkLQpOZmgM1/I8B/T0QCP6dAV8CAkUCBQkAAAABADgAmQNfAl8ACwAAARUjESMRIxEjESM1A1/ZUtVS1QJfQ/59AYP+fQGDQwAAAAABADgBWgNfAZ4AAwAAEyEVITgDJ/zZAZ5EAAAAAgBP/8MDHwM1AAMADwAAATMRIwEnMj4CNxcOAwLMU1P9jwxBkZaXRwZJl5SNAzX8jgEmRAEGCgk8Cw0IAgAAAAEBqP/DAfoDNQADAAABMxEjAahSUgM1/I4AAAABAccBPAJGAb0ACwAAATQ2MzIWFRQGIyImAcclGhwkJBwaJAF9GCgoGBkoKAAAAAACAT//wQJrAzcAAwAPAAABMxEjAzQ2MzIWFRQGIyImAhlSUtokGxslJRsbJAM3/IoBwhknJxkZJycAAAADACD/tQPIA0MADQAbACEAABcHLgE1NDY3Fw4BBxQWBSc+ATU0Jic3HgEVFAYBIREjESHKLUM6OkMtPy8BMALALT4xMD8tQzo6/VsB90/+WD0OZtuGhdxmDmHfeXvdbw5h5XN532EOZtyFhtsCPP4eAaEAAAMAIP+1A8gDQwANABsAIQAAExcOAQcUFhcHLgE1NDYlNx4BFRQGByc+ATU0JgURIRUhEZ0tPy8BMD8tQzo6AsQtQzo6Qy0+MTD+CAGa/hcDQw5h33l73WEOZtuGhdxYDmbchYbbZg5h5XN531r+ZkEB2wAAAwAg/7UDyANDAA0AGwAjAAATFw4BBxQWFwcuATU0NiU3HgEVFAYHJz4BNTQmBREhFSERIRWdLT8vATA/LUM6OgLELUM6OkMtPjEw/fsBm/4WAd8DQw5h33l73WEOZtuGhdxYDmbchYbbZg5h5XN536L+pkEB3EEAAwAg/7UDyANDAA0AGwAnAAATFw4BBxQWFwcuATU0NiU3HgEVFAYHJz4BNTQmARUhFSERITUhNSERnS0/LwEwPy1DOjoCxC1DOjpDLT4xMP3xAab+DwGV/mkB4QNDDmHfeXvdYQ5m24aF3FgOZtyFhttmDmHlc3nf/o2lQgEloT3+5AAABAAg/7UDyANDAA0AGwAfACMAABcHLgE1NDY3Fw4BBxQWBSc+ATU0Jic3HgEVFAYBIREhASERIcotQzo6Qy0/LwEwAsAtPjEwPy1DOjr9ewHg/iABkv69AUM9DmbbhoXcZg5h33l73W8OYeVzed9hDmbchYbbAkT+OAGH/roAAAAEACD/tQPIA0MADQAbACMAJwAAFwcuATU0NjcXDgEHFBYFJz4BNTQmJzceARUUBgEzFSE1MxEhExUhNcotQzo6Qy0/LwEwAsAtPjEwPy1DOjr9eE4BR07+HU4BRz0OZtuGhdxmDmHfeXvdbw5h5XN532EOZtyFhtsCYbKy/gcBAbu7AAADACD/tQPIA0MADQAbADAAABMXDgEHFBYXBy4BNTQ2JTceARUUBgcnPgE1NCYFFRQeAhcHLgEnDgEHJz4DPQGdLT8vATA/LUM6OgLELUM6OkMtPjEw/sUjQFs3J1V9ICB+VSg4W0EjA0MOYd95e91hDmbbhoXcWA5m3IWG22YOYeVzed9MjDJeTz0RQBxuS0tvHEARPU9eM4wAAAAEACD/tQPIA0MADQAbAC8AQwAAFwcuATU0NjcXDgEHFBYFJz4BNTQmJzceARUUBgEyHgIVFA4CIyIuAjU0PgIXIg4CFRQeAjMyPgI1NC4Cyi1DOjpDLT8vATACwC0+MTA/LUM6Ov5pN15EJydEXjc3XUUnJ0VdNyhEMRwcMUQoKEQyHBwyRD0OZtuGhdxmDmHfeXvdbw5h5XN532EOZtyFhtsCTSI+VTMzVj4iIj5WMzNVPiJAGS0+JCQ+LRkZLT4kJD4tGQAAAAMAIP+1A8gDQwANABsANAAAExcOAQcUFhcHLgE1NDYlNx4BFRQGByc+ATU0JgUVFB4CFwcuAScOAQcnPgM9ASM1IRWdLT8vATA/LUM6OgLELUM6OkMtPjEw/r8lQ103JViBIiGBVSU3W0Ik2AH6A0MOYd95e91hDmbbhoXcWA5m3IWG22YOYeVzed+2NDBXSDcPPRpnSEhoGT0PN0lXLzRBQQAAAwAg/7UDyANDAA0AGwA4AAATFw4BBxQWFwcuATU0NiU3HgEVFAYHJz4BNTQmBRUUHgIXBy4BJw4BByc+Az0BIzUzNTMVMxWdLT8vATA/LUM6OgLELUM6OkMtPjEw/sMhPVY0JFV5Hh56WCM2Vz0i19dP1ANDDmHfeXvdYQ5m24aF3FgOZtyFhttmDmHlc3nf+SopSz4vDTwXXkJCXxc9DS4/SykqQoSEQgAAAAMAIP+1A8gDQwANABsAJQAAExcOAQcUFhcHLgE1NDYlNx4BFRQGByc+ATU0JgU1IREjNQUnJTWdLT8vATA/LUM6OgLELUM6OkMtPjEw/aUB5k/+WQoBsQNDDmHfeXvdYQ5m24aF3FgOZtyFhttmDmHlc3nfrUH+GN0aRhOLAAAAAwAg/7UDyANDAA0AGwAnAAATFw4BBxQWFwcuATU0NiU3HgEVFAYHJz4BNTQmARUhFSERIRUhFSEVnS0/LwEwPy1DOjoCxC1DOjpDLT4xMP33AaH+FQHc/m4BkQNDDmHfeXvdYQ5m24aF3FgOZtyFhttmDmHlc3nf/ouKQQHTQYZBAAAABAAg/7UDyANDAA0AGwAnACsAABMXDgEHFBYXBy4BNTQ2JTceARUUBgcnPgE1NCYHETMVITUzESM1IRUhETMRnS0/LwEwPy1DOjoCxC1DOjpDLT4xML13/cKGbgIQ/q2jA0MOYd95e91hDmbbhoXcWA5m3IWG22YOYeVzed/A/t1BQQEjQED+3QEjAAAFACD/tQPIA0MADQAbACMANwBJAAATFw4BBxQWFwcuATU0NiU3HgEVFAYHJz4BNTQmBRUzFSE1MzUXMh4CFRQOAiMiLgI1ND4CEzI+AjU0LgIjIgYVFB4CnS0/LwEwPy1DOjoCxC1DOjpDLT4xMP697v3Y7CgtTTcgIDdNLS1MOCAgOEwtHTEkFBQkMR06SxQjMQNDDmHfeXvdYQ5m24aF3FgOZtyFhttmDmHlc3nfLXhDQ3j5GjBCJydCLxsbL0InJ0IwGv7bER8qGBkqHxFAMxgqHxEAAAAEACD/tQPIA0MADQAbACMALwAAExcOAQcUFhcHLgE1NDYlNx4BFRQGByc+ATU0JhMjESMRMxEzJSEUDgIHJz4BNyGdKT8vATA/KUM6OgLIKUM6OkMpPjEwCoVSUoX9WwFQJUx3UjOIiQz/AANDDmHfeXvdYQ5m24aF3FgOZtyFhttmDmHlc3nf/qn+ZAMx/q/vVqGTgTY5WN6OAAAEACD/tQPIA0MADQAbACMALgAAExcOAQcUFhcHLgE1NDYlNx4BFRQGByc+ATU0JhMjESMRMxEzJRE+ATcXDgErARGdKT8vATA/KUM6OgLIKUM6OkMpPjEwD4RTU4T9nU+mXglnrVg/A0MOYd95e91hDmbbhoXcWA5m3IWG22YOYeVzed/+sP5dAzH+tvj+OgEOFEcVDwIOAAQAIP+1A8gDQwANABsAIwA0AAATFw4BBxQWFwcuATU0NiU3HgEVFAYHJz4BNTQmEyMRIxEzETMlETI+AjcXDgMrAREhFZ0pPy8BMD8pQzo6AsgpQzo6Qyk+MTAPe1JSe/2lL1ROTikJLVNVWjQ+AWIDQw5h33l73WEOZtuGhdxYDmbchYbbZg5h5XN53/6w/l4DMf61sf5sAgYKCEgJCwUCAiJFAAAAAAQAIP+1A8gDQwANABsAIwA2AAATFw4BBxQWFwcuATU0NiU3HgEVFAYHJz4BNTQmEyMRIxEzETMFFTI2NxcOAysBETM1IzUhEZ0pPy8BMD8pQzo6AsgpQzo6Qyk+MTADdVNTdf23WZVPByxRU1gyO/P1AUYDQw5h33l73WEOZtuGhdxYDmbchYbbZg5h5XN53/6v/l4DMf61L7AKEEcICgYCATmhQv7bAAUAIP+1A8gDQwANABsAIwAnACsAABMXDgEHFBYXBy4BNTQ2JTceARUUBgcnPgE1NCYTIxEjETMRMwERIREBETMRnSk/LwEwPylDOjoCyClDOjpDKT4xMAqEUlKE/VEBUP8ArwNDDmHfeXvdYQ5m24aF3FgOZtyFhttmDmHlc3nf/qz+YQMx/rL+6wIJ/fcBxP6AAYAAAAAABQAg/7UDyANDAA0AGwAjACsALwAAExcOAQcUFhcHLgE1NDYlNx4BFRQGByc+ATU0JhMjESMRMxEzJTUzESERMxUTNSMVnSk/LwEwPylDOjoCyClDOjpDKT4xMAt8UlJ8/nBO/qRPv78DQw5h33l73WEOZtuGhdxYDmbchYbbZg5h5XN53/6t/mADMf6zOsj90QIvyP7g2dkAAAAABAAg/7UDyANDAA0AGwAjADgAABMXDgEHFBYXBy4BNTQ2JTceARUUBgcnPgE1NCYTIxEjETMRMwEVFB4CFwcuAScOAQcnPgM9AZ0pPy8BMD8pQzo6AsgpQzo6Qyk+MTAFfVJSff47GDBILzVDWhcXWUM1L0cwGANDDmHfeXvdYQ5m24aF3FgOZtyFhttmDmHlc3nf/q/+XgMx/rUBApY8cGFMGD0mflVVfiY9GExhcDyWAAAABQAg/7UDyANDAA0AGwAjADcAQwAAExcOAQcUFhcHLgE1NDYlNx4BFRQGByc+ATU0JhMjESMRMxEzATIeAhUUDgIjIi4CNTQ+AhMyNjU0JiMiBhUUFp0pPy8BMD8pQzo6AsgpQzo6Qyk+MTAIeFJSeP3/LEYxGxsxRiwrRjIaGjJGKzM9PTMzPT0DQw5h33l73WEOZtuGhdxYDmbchYbbZg5h5XN53/6p/mQDMf6vAQEnSGY/P2ZIJiZIZj8/Zkgn/iBuXl5vb15ebgAABAAg/7UDyANDAA0AGwAjADwAABMXDgEHFBYXBy4BNTQ2JTceARUUBgcnPgE1NCYTIxEjETMRMyUVFB4CFwcuAScOAQcnPgM9ASM1IRWdKT8vATA/KUM6OgLIKUM6OkMpPjEwCntTU3v+PRYsRC40QlMVFFRCMy5DLBaSAXkDQw5h33l73WEOZtuGhdxYDmbchYbbZg5h5XN53/6s/mEDMf6ysUk7c2RRGTsohVVVhSg7GVBlcztJRUUAAAAEACD/tQPIA0MADQAbACMAQAAAExcOAQcUFhcHLgE1NDYlNx4BFRQGByc+ATU0JhMjESMRMxEzJRUUHgIXBy4BJw4BByc+Az0BIzUzNTMVMxWdKT8vATA/KUM6OgLIKUM6OkMpPjEwCntSUnv+OBkxRy0vQ10YF11DLy1HMRmlpFKlA0MOYd95e91hDmbbhoXcWA5m3IWG22YOYeVzed/+o/5qAzH+qVghM19RQRQ9IG9JSW8gPRRBUV8zIUSKikQAAAAABAAg/7UDyANDAA0AGwAjADUAABMXDgEHFBYXBy4BNTQ2JTceARUUBgcnPgE1NCYTIxEjETMRMyUhFA4CByc+ATcHJyU+ATcjnSk/LwEwPylDOjoCyClDOjpDKT4xMAR9UlJ9/W0BTh5HclQ2W28f4g0BBAgJAv4DQw5h33l73WEOZtuGhdxYDmbchYbbZg5h5XN53/6o/mUDMf6u81Wkloc5NzyKURZFEh4+IAAAAAAEACD/tQPIA0MADQAbACMAOAAAExcOAQcUFhcHLgE1NDYlNx4BFRQGByc+ATU0JhMjESMRMxEzBRUyPgI3Fw4DKwERIRUhFTMVnSk/LwEwPylDOjoCyClDOjpDKT4xMA9/U1N//aguUU1MKAgsU1RYMzwBYf7x/gNDDmHfeXvdYQ5m24aF3FgOZtyFhttmDmHlc3nf/qj+ZQMx/q4trQIFCQhHCAoFAgIaRZtFAAAAAAUAIP+1A8gDQwANABsAIwA3AD0AABMXDgEHFBYXBy4BNTQ2JTceARUUBgcnPgE1NCYTIxEjETMRMyURPgE3Fw4DIyczMjcRIzUhFSERPgE3EZ0pPy8BMD8pQzo6AsgpQzo6Qyk+MTAPc1JSc/6cHDUZBDl+fnUwCUoNDk4Bp/70HTwdA0MOYd95e91hDmbbhoXcWA5m3IWG22YOYeVzed/+qf5kAzH+r67+egIFAzwJCwcCRAEBkERE/nEBAQIBiwAAAAAGACD/tQPIA0MADQAbACMAKwA/AEsAABMXDgEHFBYXBy4BNTQ2JTceARUUBgcnPgE1NCYTIxEjETMRMwEVMxUhNTM1EzIeAhUUDgIjIi4CNTQ+AhMyNjU0JiMiBhUUFp0pPy8BMD8pQzo6AsgpQzo6Qyk+MTAKclJScv45uv44uygqRjQdHTRGKilHMx0dM0cpM0NDMzNDQwNDDmHfeXvdYQ5m24aF3FgOZtyFhttmDmHlc3nf/qv+YgMx/q8BM39ERH/+/BowQignQjAbGzBCJyhCMBr+2EEzM0FBMzNBAAQAIP+1A8gDQwANABsANgA+AAATFw4BBxQWFwcuATU0NiU3HgEVFAYHJz4BNTQmASc+AzcjNSEVIx4DFwcuAycOAwUhESMRITUhnSk/LwEwPylDOjoCyClDOjpDKT4xMP1xITVkTzMD6wIr6gMzUGQ0IS9aTj4TEz1OWgJS/s9S/s4CtQNDDmHfeXvdYQ5m24aF3FgOZtyFhttmDmHlc3nf/rxACCY2QiRFRSRCNiUIQQggLTohITotIIn+zwExRQAAAAADACL/qgPGA04AEwAnAC0AAAEUDgIjIi4CNTQ+AjMyHgIBIg4CFRQeAjMyPgI1NC4CBSERIxEhA8ZJf6pgYKp/SUl/qmBgqn9J/i5annZERHaeWlqedkREdp7+sgHHT/6IAXxgqn9JSX+qYGCqf0lJf6oBUkR2nlpannZERHaeWlqedkT1/koBdQAAAAMAIv+qA8YDTgATACcALQAAATIeAhUUDgIjIi4CNTQ+AhMyPgI1NC4CIyIOAhUUHgIDESEVIREB9GCqf0lJf6pgYKp/SUl/qmBannZERHaeWlqedkREdp4aAWz+RQNOSX+qYGCqf0lJf6pgYKp/Sfx8RHaeWlqedkREdp5aWp52RAKW/phBAakAAAAAAwAi/6oDxgNOABMAJwAvAAABMh4CFRQOAiMiLgI1ND4CEzI+AjU0LgIjIg4CFRQeAgMRIRUhESEVAfRgqn9JSX+qYGCqf0lJf6pgWp52RER2nlpannZERHaeMAFs/kQBsgNOSX+qYGCqf0lJf6pgYKp/Sfx8RHaeWlqedkREdp5aWp52RAI//tBBAbJBAAAAAwAi/6oDxgNOABMAJwAzAAABMh4CFRQOAiMiLgI1ND4CEzI+AjU0LgIjIg4CFRQeAgMVIRUhESE1ITUhEQH0YKp/SUl/qmBgqn9JSX+qYFqedkREdp5aWp52RER2njUBf/42AWr+lAG3A05Jf6pgYKp/SUl/qmBgqn9J/HxEdp5aWp52RER2nlpannZEAZSOQgEOkDr++AAEACL/qgPGA04AEwAnACsALwAAARQOAiMiLgI1ND4CMzIeAgEiDgIVFB4CMzI+AjU0LgIFIREhASERIQPGSX+qYGCqf0lJf6pgYKp/Sf4uWp52RER2nlpannZERHae/ssBs/5NAWX+6QEXAXxgqn9JSX+qYGCqf0lJf6oBUkR2nlpannZERHaeWlqedkT5/mUBW/7lAAAAAAQAIv+qA8YDTgATACcALwAzAAABFA4CIyIuAjU0PgIzMh4CASIOAhUUHgIzMj4CNTQuAgUzFSE1MxEhNxUhNQPGSX+qYGCqf0lJf6pgYKp/Sf4uWp52RER2nlpannZERHae/shOARpO/kpOARoBfGCqf0lJf6pgYKp/SUl/qgFSRHaeWlqedkREdp5aWp52RN2iov426aurAAAAAAMAIv+qA8YDTgATACcAPAAAATIeAhUUDgIjIi4CNTQ+AhMyPgI1NC4CIyIOAhUUHgITFRQeAhcHLgEnDgEHJz4DPQEB9GCqf0lJf6pgYKp/SUl/qmBannZERHaeWlqedkREdp56Ij1WNCdOdSAec04oNVQ8IANOSX+qYGCqf0lJf6pgYKp/Sfx8RHaeWlqedkREdp5aWp52RAKWfylQRjcQPBpkQkJlGjwQOEZRKH8ABAAi/6oDxgNOABMAJwA7AE8AAAEUDgIjIi4CNTQ+AjMyHgIBIg4CFRQeAjMyPgI1NC4CBzIeAhUUDgIjIi4CNTQ+AhciDgIVFB4CMzI+AjU0LgIDxkl/qmBgqn9JSX+qYGCqf0n+LlqedkREdp5aWp52RER2nlsyVT4jIz5VMjJVPiMjPlUyJD0sGRksPSQkPSwZGSw9AXxgqn9JSX+qYGCqf0lJf6oBUkR2nlpannZERHaeWlqedkTwHzhNLi5OOB8fOE4uLk04HzoXKTchITgoFxcoOCEhNykXAAMAIv+qA8YDTgATACcAQAAAATIeAhUUDgIjIi4CNTQ+AhMyPgI1NC4CIyIOAhUUHgITFRQeAhcHLgEnDgEHJz4DPQEjNSEVAfRgqn9JSX+qYGCqf0lJf6pgWp52RER2nlpannZERHaeeiA7UzQkTnMeHnNPJDRUOyDDAckDTkl/qmBgqn9JSX+qYGCqf0n8fER2nlpannZERHaeWlqedkQCLR0oSz8wDTsXWTw8WRc7DTA/SygdQUEAAAAAAwAi/6oDxgNOABMAJwBEAAABMh4CFRQOAiMiLgI1ND4CEzI+AjU0LgIjIg4CFRQeAhMVFB4CFwcuAScOAQcnPgM9ASM1MzUzFTMVAfRgqn9JSX+qYGCqf0lJf6pgWp52RER2nlpannZERHaegh03TzIjTm0cHG1OIzJONx2/v0vBA05Jf6pgYKp/SUl/qmBgqn9J/HxEdp5aWp52RER2nlpannZEAfQPI0E3Kgw8FVM5OVMVPAwqN0EjD0F6ekEAAwAi/6oDxgNOABMAJwAxAAABMh4CFRQOAiMiLgI1ND4CEzI+AjU0LgIjIg4CFRQeAgM1IREjNQUnJTUB9GCqf0lJf6pgYKp/SUl/qmBannZERHaeWlqedkREdp6FAblJ/ogMAYQDTkl/qmBgqn9JSX+qYGCqf0n8fER2nlpannZERHaeWlqedkQCNT7+RcgZRRJ3AAMAIv+qA8YDTgATACcAMwAAATIeAhUUDgIjIi4CNTQ+AhMyPgI1NC4CIyIOAhUUHgIDFSEVIREhFSEVIRUB9GCqf0lJf6pgYKp/SUl/qmBannZERHaeWlqedkREdp41AXL+PwG4/pcBZQNOSX+qYGCqf0lJf6pgYKp/Sfx8RHaeWlqedkREdp5aWp52RAGAcUEBp0FzQQAABAAi/6oDxgNOABMAJwAzADcAAAEyHgIVFA4CIyIuAjU0PgITMj4CNTQuAiMiDgIVFB4CExUzFSE1MzUjNSEVIRUzNQH0YKp/SUl/qmBgqn9JSX+qYFqedkREdp5aWp52RER2nvJr/fZtVwHe/sOfA05Jf6pgYKp/SUl/qmBgqn9J/HxEdp5aWp52RER2nlpannZEAiH8QUH8QUH8/AAAAAUAIv+qA8YDTgATACcALwBDAE8AAAEyHgIVFA4CIyIuAjU0PgITMj4CNTQuAiMiDgIVFB4CExUzFSE1MzUXMh4CFRQOAiMiLgI1ND4CEzI2NTQmIyIGFRQWAfRgqn9JSX+qYGCqf0lJf6pgWp52RER2nlpannZERHaef9n+ANonKEQyHBwyRCgnRDIdHTJEJzNCQjMzQUEDTkl/qmBgqn9JSX+qYGCqf0n8fER2nlpannZERHaeWlqedkQCrmc/P2fYGCw7JCQ7LBgYLDskJDssGP70PC0tPDwtLTwAAAAABAAi/6oDxgNOABMAJwAvADkAAAEyHgIVFA4CIyIuAjU0PgITMj4CNTQuAiMiDgIVFB4CATMVIxEjETMFIRQGByc+ATcjAfRgqn9JSX+qYGCqf0lJf6pgWp52RER2nlpannZERHaeAS9+flFR/gMBLo+ZMXaGDN0DTkl/qmBgqn9JSX+qYGCqf0n8fER2nlpannZERHaeWlqedkQB90T+nQLLYKP3WzlGvHYAAAQAIv+qA8YDTgATACcALwA6AAABMh4CFRQOAiMiLgI1ND4CEzI+AjU0LgIjIg4CFRQeAgEzFSMRIxEzBRE+ATcXDgErAREB9GCqf0lJf6pgYKp/SUl/qmBannZERHaeWlqedkREdp4BOXl5UVH+NkiXVQlho047A05Jf6pgYKp/SUl/qmBgqn9J/HxEdp5aWp52RER2nlpannZEAfdE/p0Cy2f+fQENEkcUDQHLAAAABAAi/6oDxgNOABMAJwAvAD4AAAEyHgIVFA4CIyIuAjU0PgITMj4CNTQuAiMiDgIVFB4CATMVIxEjETMFETI2NxcOAysBESEVAfRgqn9JSX+qYGCqf0lJf6pgWp52RER2nlpannZERHaeATZ3d1JS/j1Uj0sJKk5QVDA7AU4DTkl/qmBgqn9JSX+qYGCqf0n8fER2nlpannZERHaeWlqedkQB5UX+sALLpP6+CBBHCAoGAgHPRAAAAAQAIv+qA8YDTgATACcALwBEAAABMh4CFRQOAiMiLgI1ND4CEzI+AjU0LgIjIg4CFRQeAgEzFSMRIxEzARUyPgI3Fw4DKwERMzUjNSERAfRgqn9JSX+qYGCqf0lJf6pgWp52RER2nlpannZERHaeATN6elFR/joqSkhIJggqTk9ULznt7wFAA05Jf6pgYKp/SUl/qmBgqn9J/HxEdp5aWp52RER2nlpannZEAfdE/p0Cy/6klgIFCghGCAoFAgEcgkH+/QAFACL/qgPGA04AEwAnAC8AMwA3AAABMh4CFRQOAiMiLgI1ND4CEzI+AjU0LgIjIg4CFRQeAgEzFSMRIxEzAREhEQMRMxEB9GCqf0lJf6pgYKp/SUl/qmBannZERHaeWlqedkREdp4BM319UVH97wFE9qgDTkl/qmBgqn9JSX+qYGCqf0n8fER2nlpannZERHaeWlqedkQB90T+nQLL/dsBzv4yAYz+tQFLAAAABQAi/6oDxgNOABMAJwAvADcAOwAAATIeAhUUDgIjIi4CNTQ+AhMyPgI1NC4CIyIOAhUUHgIBMxUjESMRMwU1MxEhETMVEzUjFQH0YKp/SUl/qmBgqn9JSX+qYFqedkREdp5aWp52RER2ngE2d3dSUv7pTP65TK+vA05Jf6pgYKp/SUl/qmBgqn9J/HxEdp5aWp52RER2nlpannZEAfdE/p0Cy/Or/g0B86v+/7q6AAAEACL/qgPGA04AEwAnAC8ARAAAATIeAhUUDgIjIi4CNTQ+AhMyPgI1NC4CIyIOAhUUHgIBMxUjESMRMwUVFB4CFwcuAScOAQcnPgM9AQH0YKp/SUl/qmBgqn9JSX+qYFqedkREdp5aWp52RER2ngEvfn5RUf69Fy1FLjRCUxYXU0I1L0UuFgNOSX+qYGCqf0lJf6pgYKp/Sfx8RHaeWlqedkREdp5aWp52RAH3RP6dAss4TztwYE4ZPCV9UVF9JTwZTWBwPE8AAAUAIv+qA8YDTgATACcALwA/AEsAAAEyHgIVFA4CIyIuAjU0PgITMj4CNTQuAiMiDgIVFB4CATMVIxEjETMFMhYVFA4CIyIuAjU0NhMyNjU0JiMiBhUUFgH0YKp/SUl/qmBgqn9JSX+qYFqedkREdp5aWp52RER2ngEqfX1SUv6VUV4YLkApKEEtGV5RMDQ0MDAzMwNOSX+qYGCqf0lJf6pgYKp/Sfx8RHaeWlqedkREdp5aWp52RAH7RP6ZAstGhnY6XUIjI0JdOnaG/k5hVVVhYVVVYQAAAAQAIv+qA8YDTgATACcALwBIAAABMh4CFRQOAiMiLgI1ND4CEzI+AjU0LgIjIg4CFRQeAgEzFSMRIxEzBRUUHgIXBy4BJw4BByc+Az0BIzUhFQH0YKp/SUl/qmBgqn9JSX+qYFqedkREdp5aWp52RER2ngEye3tRUf7LFitBKyw/VBUWVD8sK0ErFo8BbgNOSX+qYGCqf0lJf6pgYKp/Sfx8RHaeWlqedkREdp5aWp52RAH3RP6dAsufPSpTSTsSOh1kQEBkHTsSOklTKj1ERAAEACL/qgPGA04AEwAnAC8ATAAAATIeAhUUDgIjIi4CNTQ+AhMyPgI1NC4CIyIOAhUUHgIBMxUjESMRMwUVFB4CFwcuAScOAQcnPgM9ASM1MzUzFTMVAfRgqn9JSX+qYGCqf0lJf6pgWp52RER2nlpannZERHaeATR6elJS/sYWLEAqLD9UFhZUPywqQSwWkpFSigNOSX+qYGCqf0lJf6pgYKp/Sfx8RHaeWlqedkREdp5aWp52RAH3RP6dAsvmICZKQTQQPhpcOjpcGj4QNEFKJiBFbm5FAAAEACL/qgPGA04AEwAnAC8AQQAAATIeAhUUDgIjIi4CNTQ+AhMyPgI1NC4CIyIOAhUUHgIBMxUjESMRMwUhFA4CByc+ATcHJyU+ATcjAfRgqn9JSX+qYGCqf0lJf6pgWp52RER2nlpannZERHaeATN7e1FR/gQBOyBIdFM1WG0g3g0BBQgKAuoDTkl/qmBgqn9JSX+qYGCqf0n8fER2nlpannZERHaeWlqedkQB50T+rQLLXlGSg3AuNS1tQhZFEho3HQAABAAi/6oDxgNOABMAJwAvAEIAAAEyHgIVFA4CIyIuAjU0PgITMj4CNTQuAiMiDgIVFB4CATMVIxEjETMBFTI2NxcOAysBESEVIxUzFQH0YKp/SUl/qmBgqn9JSX+qYFqedkREdp5aWp52RER2ngEzenpRUf46Vo5OCCtQUFUxOgFQ/+gDTkl/qmBgqn9JSX+qYGCqf0n8fER2nlpannZERHaeWlqedkQB90T+nQLL/qqPCQ5HCAkFAgHiRYNDAAAABQAi/6oDxgNOABMAJwAvAEIARgAAATIeAhUUDgIjIi4CNTQ+AhMyPgI1NC4CIyIOAhUUHgIBMxUjESMRMwcRNjcXDgMjJzMyNxEjNSEVIxE3EQH0YKp/SUl/qmBgqn9JSX+qYFqedkREdp5aWp52RER2ngE8dXVSUus3LgQ1eHhwLAlLDQ5KAY77aQNOSX+qYGCqf0lJf6pgYKp/Sfx8RHaeWlqedkREdp5aWp52RAH3RP6dAsuk/r8DBjsJCwYCRAEBSkRE/rcDAUYABgAi/6oDxgNOABMAJwAvADcASwBXAAABMh4CFRQOAiMiLgI1ND4CEzI+AjU0LgIjIg4CFRQeAgEzFSMRIxEzBRUzFSE1MzUXMh4CFRQOAiMiLgI1ND4CFzI2NTQmIyIGFRQWAfRgqn9JSX+qYGCqf0lJf6pgWp52RER2nlpannZERHaeATl2dlFR/sWo/lqsJyU/LhoaLj8lJT8vGhovPyUtNzctLTg4A05Jf6pgYKp/SUl/qmBgqn9J/HxEdp5aWp52RER2nlpannZEAfdE/p0CyyxqRERq4hcpOiMiOioXFyo6IiM6KRf8NSoqNjYqKjUAAAMAIv+qA8YDTgAYACUAPgAAEzU0PgIzMh4CFyMuAyMiDgIHMxUXETMVMzczBxMjAwcVFyIuAiczHgMzMj4CNyM1IRUUDgIiSX+qYFede1EMIAxMcpFRWJx1RgOoT1UC2l2txVqeWWZYnHtRDSAMTHKSUVebdUcD8AERSn+pAWsRYKp/ST1qkVROhWE4QnGYViLsAgb19cn+wwEEX6XVPWqSVE6GYThBcZlXIRFhqn5JAAAAAAMAOf/zA80CLQAbAD0ASQAAFyImNTQ2NzQuAiMiBgcnPgEzMhYVESMnIw4BJREzFzM+ATMyFhc+ATMyFhURIxE0IyIGBxEjETQmIyIHESUyNjc1DgMVFBbGP06MkwoYJRsmQR4kJF43VVhLCAMgTQErQAcEDi0mICUHDS8jKzBPKxUcDEMUFSYa/ncfOx04TC4ULg1LS1tgFBsyJhchFj4aKnNk/qpDJSsNAiBDJCsuKCYwSkj+ZgGMUiYl/m0BjCcrS/5tPSUgmgkZIisbMCUAAAAABAAy//QDxgLrACAANABAAEwAAAUiLgI1ND4CMzIWFwcuASMiDgIVFB4CMzI2NxcGISIuAjU0PgIzMh4CFRQOAicyNjU0JiMiBhUUFgUiJjU0NjMyFhUUBgEXL1Q+JCU/VC8xRxg3ESgdHTUoGBcoNx8dLRY2QAEQJUExHBwxQSUkQTEcHDFBJCY2NiYoNTMBMRgjIxgXIyMMLV2PYWKPXi4wIDoaHyNIcE5PcUkjISA4WiNHakdIa0cjI0drSEdqRyNMY2xtZWVtbWJMJSAfJycfICUAAAAAAwBF/y0DzQIsABQANgBDAAAXETMXMz4BMzIWFRQOAiMiJicXFSURMxczPgEzMhYXPgEzMhYVESMRNCMiBgcRIxE0JiMiBxElMjY1NCYjIgYHER4BRUsJAxpAJlVVHjNEJho4GwMBekAHBA4tJiAlBw0vIyswTysVHAxDFBUmGv6OLkEtNhcyGhgt0wLzPyIpjIhIbkomGyBeotMCIEMkKy4oJjBKSP5mAYxSJiX+bQGMJytL/m1AbWpeayMo/t8gFAAAAAIAO/+2A3cDNwAHABMAAAEVIxEjETMRASEUDgIHJz4BNyEDd5BSUv1+AZouYpptLbC1Dv63ActE/i8Dgf6UAQxgtKKLNkBY+KMAAAADADP/tgNyAzgABwATABkAAAEVIxUjETMVJSEUDgIHJz4BNyETNSERIxEDcoVSUv1vAZ06bJxiIqe7DP67SgJHUgJUROcCD+SqVZF0VxtBLahz/gNC/rYBCAAAAAMAN//KA3IDNgAHABUAGwAAATMVIxEjETMFIRQOAgcnPgM3IRMVIRUhEQLthYVSUv1uAaI7bZxhIU+BXzkG/ra1AgT9qgImRP7FAo9FV5Z7XR5BGUdaajv+PN1DASAAAAMANf/CA3IDOAAHABMAGwAAATMVIxUjETMFIRQOAgcnPgE3IRMVIRUhESEVAu2FhVJS/W8BnTlsnWMfp7oM/rqvAff9uAI4AltE3QH+OlWSdlcbQi2qc/4LwkIBR0MAAAMANv+/A3IDNwAHABMAHwAAATMVIxUjETMFIRQOAgcnPgE3IRMVIRUhNSE1ITUhFQLthYVSUv1wAZ87bZ1iH6q4Cv67qQII/agB5v4XAjoCbkS8AcksVItuThdEJZxq/aBoQedfQd4ABAA3/7oDcgM2AAcAEwAoAC4AAAEVIxUjETMVJSEUDgIHJz4BNyETFTI+AjcXDgMrATUzNSM1IRU3NSERIxEDcoVSUv1zAZw6bZ1jHqy1Cv6+gS5JPzkeCSE+R1Q2NtPVASQmARRRAmlEzgHfzZ9VjG5QGEMnnW39mV8BBQcGPgcIBQHaVj/QjkL+jAEyAAAABQA2/74DcgM2AAcAEwAoACwAMAAAARUjFSMRMxUlIRQOAgcnPgE3IRMVMj4CNxcOAysBNTM1IzUhFRcRIREDFTM1A3KFUlL9cQGeOm6cYx+rtgr+vXQjOjQxGwgfOT1GKy/LzQEdNgEa0ooCaUXLAd3Nn1SMbU4XRCWcav2cXwEEBgVABgcDAd1TPs6jAXH+jwE09vYAAAAFADb/wgNyAzcABwATABsAMAA0AAABFSMVIxEzFSUhFA4CByc+ATchATUzESERMxUFFTI+AjcXDgMrATUzNSM1IRUFNSMVA3KFUlL9cgGdOm6cYx+rtgr+vgJDS/7iSv65Izo0MRsGHjg9RSwuycsBGwEGiQJtRNAB3sqgVIxtThdDJpxq/fd0/o0Bc3RhXwEEBgU9BgcDAdZTP8tdgIAABAA0/8MDcgM4AAcAEwAXABsAAAEVIxUjETMVJSEUDgIHJz4BNyETESERARUhNQNyhVJS/W8BnjpsnWMgqLoM/rpcAjX+HAGTAlxE3gH+3KJVknRXG0EtqXP9CAFN/rMBC8nJAAQANv/CA3IDNwAHABMAGwAfAAABFSMVIxEzFSUhFA4CByc+ATchATUzESERMxUFNSEVA3KFUlL9cgGcOmydYx+qtgv+vgI8Uv3JUQGU/mwCY0TNAeXUnlWNb1EYQyifbf36cf6ZAWdxtHR0AAUAN/+6A3IDNwAHABMAKAAwADQAAAEzFSMVIxEzBSEUDgIHJz4BNyEBFRQeAhcHLgEnDgEHJz4DPQEHNTMRIREzFRc1IxUC7YWFUlL9cgGbOWycYx+ptgv+vgJbEyY6Jyw5SRQUSTksJzonE+1M/s1NmpoCaETVAeg2VY1wURhDKp5t/mxIIUU/NRE9GlU2NlUaPRI1PkMgS3Rs/qEBX2y0dXUAAwA3/7sDcQM4AAcAEwAsAAABMxUjESMRMwUhFA4CByc+ATchARUUHgIXBy4DJw4DByc+Az0BAwRtbVJS/VwBnTpsnGIio78M/rsBqDBSazwhMV1QPxQUQFBdMiI8bVIxAj5F/uwCU0dWlXlcHkIxs3b+eCcwVUMvC0EKJDNAJydCMyQKQQovRFYxJwADADb/twNyAzkABwATADkAAAEzFSMVIxEzBSEUDgIHJz4BNyEBFRQeAhcHLgEnDgEHLgEnDgEHJz4DPQEzFRQWFz4DPQEC7YWFUlL9cQGdOmydYx+mugz+vAJJGC5DKylCWhcUUj9CUBQYWj8pKkMuGU89PyAvIA8CV0TSAfg7VpJ2VxtELalz/mI/I0U8MA88GFo6OWEaGl05N1oXPA8yPUQhPz89dSYUNTo7Gj8AAAQAN/+3A3IDNwAHABMAJwAzAAABMxUjFSMRMwUhFA4CByc+ATchATIeAhUUDgIjIi4CNTQ+AhMyNjU0JiMiBhUUFgLthYVSUv1wAZ46bJtiIaC/DP67AXdCbE0pKU1sQkJsTSkpTWxCYXJyYWFycgJPROwCGENVlHhaHUIwr3X+YRgtQCkoQS0YGC1BKClALRj+5TozNDo6NDM6AAMAN/+3A3IDOQAHABMALgAAATMVIxUjETMFIRQOAgcnPgE3IQEjHgMXBy4DJw4DByc+AzcjNSEC7YWFUlL9cQGdOWydYx+rtgv+uwKe+QIwTmU3IClXT0MVEzxOWzEeOGVOLwL7AkoCU0XYAgM7VZBzVRpDK6Zw/g0lRDcoCUAHHS09JiI6LyAIPwknN0QmQgAAAAADADj/uANyAzgABwATADAAAAEzFSMVIxEzBSEUDgIHJz4BNyEBIR4DFwcuAycOAQcnPgM3ITUhNTMVIQLthYVSUv1yAZw5bJxjH6y0Cv69AqH+/wMwTmY5IDBbTj4TKJ5jIDllTjAD/v8BAlIBAgJmRNkB7ztVjXBRGEMoo2r+BCRCNSYIPQgfKzghQlkQPQgmNkEkQWtrAAMAOP/CA3IDNwAHABMAHwAAATMVIxUjETMFIRQOAgcnPgE3IRMVIRUhESEVIRUhFQLthYVSUv1wAaE5bZxjIa60Cf66rQH8/bICOv4YAd0CZ0TLAd8/VIxsThdCJZ5q/aZcPgFtPVk9AAAAAAQANv/GA3IDNwAHABUAIQAlAAABMxUjFSMRMwUhFA4CByc+AzchARUzFSE1MzUjNSEVIRUzNQLthYVSUv1zAZ09b51fH1CBXjgG/r0CKYf9mYR8AlT+eboCYUTZAfM6VY9xUhlFFD5QYDb+HM5CQs5CQs7OAAAAAAUAOP+3A3IDNwAHABEAGQAlADEAAAEzFSMVIxEzBSEUBgcnPgE3IQEVIRUhNSE1FzIWFRQGIyImNTQ2FzI2NTQmIyIGFRQWAu2FhVJS/W8Bn9vKHq6xCv67AacBD/2QAQ8pdoODdnaDg3ZRW1tRUVtbAm9EzQHZNKveMUQnn23+yWo/P2rTQj0/QUE/PULDIyEgJCQgISMAAgA1/7YDLgM3AAsAGQAAATMRIxEjESMRMxEzJSEUDgIHJz4DNyEC309Pek1Nev14AV4hToFgME5uSCYF/vMDN/x/AdX+WAM8/q/1V6WWhTY7LGd1gUYAAAMAOv+2AyoDNgALABQAGgAAATMRIzUjFSMRMxUzJSEQBSc+ATchEzUhESMRAttPT3ZOTnb9ggFe/qcojZUL/vZyAltSAzb98evnAfvRn/67kjw5sHD+B0P+ugEDAAAAAAMAO//PA0UDNgALABQAGgAAAREjETMRMxEzESMRJSEUBgcnJDchEyEVIREzAmVOTnZPT/2EAVuorikBFBj++NECFf2ZUgHh/tYCb/7+ARL9YwFI/qXuSzx46P11QwEcAAMAPf/CAzkDNgALABMAGwAAARUjETMVMzUzESM1JSEQBSckNyETIRUhESEVIQJlTk52T0/9hAFd/qsqARMY/vfQAgr9pQJR/gACE90B8dHg/fnk4f67kD1x5f1SQgE5QgAAAAADAD3/wgNMAzYACwAUACAAAAEVIxEzFTM1MxEjNSUhEAUnPgE3IRMhFSE1ITUhNSEVIQJlTk52T0/9hQFZ/qsni5IM/vrNAh/9kAH9/gECUP4DAiq5AbS5yv41v9b+yXo8MJxn/UZC5VpB2QAEAD3/xAMqAzYACwATABcAGwAAATMRIzUjFSMRMxUzJSEQBSckNyETESERJRUhNQLbT092Tk52/YQBXf6rKgETF/74fgJN/gMBrAM2/f7i3AHszZv+u5A9cOb9EgFB/r//vb0ABAA9/8QDKgM3AAsAEwAbAB8AAAEzESM1IxUjETMVMyUhEAUnJDchATUzESERMxUFNSEVAttPT3ZOTnb9hQFb/qspARIY/vkCeVH9tFIBqf5XAzf+GcvFAdDInf7BjD1q4f4EbP6cAWRstnV1AAAAAAMAO/+5A1oDNwALABUALgAAARUjETMVMzUzESMRJSEUBgcnPgE3IQEVFB4CFwcuAycOAwcnPgM9AQJlTk52T0/9hwFbprAskZEL/voBxzNVbjshMl9SQRUUQVJfMiA7bVQzAgfIAefc7f22ARreovZMPDy0df5zJy1QQS0JQQkjMUAmJkAxIwlBCS1BUC0nAAMAO/+yA2wDNgALABUAOwAAARUjETMVMzUzESM1JSEUBgcnPgE3IQEVFB4CFwcuAScOAQcuAScOAQcnPgM9ATMVFBYXPgM9AQJlTk52T0/9hAFcq6sqi5UL/vkCWRgvQyooQ1sXFFI/Qk8UGVpAKSpELhlPPT8gMCAPAhHYAe3S4v3/3OOk5kg9N6tw/mE6I0Q8MA88F1o5N2AbGlw5NlkYPBAyPEMhOjo9dCUUNTk6GjoAAAQAOf+5AzIDNgALABQAKAA0AAABFSMRMxUzNTMRIzUlIRAFJz4BNyEBMh4CFRQOAiMiLgI1ND4CEzI2NTQmIyIGFRQWAmVOTnZPT/2GAVv+qCuNlgv++gGiRnBPKipPcEZGcVAqKlBxRmd2dmdqdXUCCNkB99vr/dr45f61jzw5sHP+XBcrPicoPisWFis+KCc+Kxf+8jYxMDc3MDE2AAACADv/tgN1AzcACwAXAAABIxUzFSMRIxEzFTMlIRQOAgcnPgE3IQN1jo6OUlKO/PABmi5imm0tsLUO/rcCAslE/sEDgfGRXrSjjDZAWPijAAMAM/+2A3IDOAALABcAHQAAASMVMxUjFSMRMxUzJSEUDgIHJz4BNyETNSERIxEDcoWFhVJShfzqAZ06bJxiIqe7DP67SgJHUgJsf0KCAg+KUFWRdFcbQS2oc/4DQv62AQgAAAADADf/ygNyAzYACwAZAB8AAAEjFTMVIxUjETMVMyUhFA4CByc+AzchExUhFSERA3KFhYVSUoX86QGiO22cYSFPgV85Bv62tQIE/aoCSplExgKPqGNWlnteHkEZR1pqO/483UMBIAAAAAMANv+/A3IDNwALABcAIwAAASMVMxUjFSMRMxUzJSEUDgIHJz4BNyETFSEVITUhNSE1IRUDcoWFhVJShfzrAZ87bZ1iH6q4Cv67qQII/agB5v4XAjoChW9CZgHJcERUjG1OF0MlnWr9oGhB519B3gADADf/uQNyAzcACwAXADAAAAEjFTMVIxUjETMVMyUhFA4CByc+ATchARUUHgIXBy4DJw4DByc+Az0BA3KFhYVSUoX87gGdOmycYiKlvQz+uwGoMFJrPCIxXU8/FBRAUF0yIjxtUjECWZREngJUmlRXlXlcHkIxsXn+digwVUMvCz8KIzJBJydCMyQKQQovRFUxKAAABAA3/7cDcQM3AAsAFwArADcAAAEjFTMVIxUjETMVMyUhFA4CByc+ATchATIeAhUUDgIjIi4CNTQ+AhMyNjU0JiMiBhUUFgNxhISEUlKE/OwBnjpsm2IhoL8M/rsBd0JsTSkpTWxCQmxNKSlNbEJhcnJhYXJyAmaBQ4MCGI5LVZR5WhxCMK91/mEYLUApKEEtGBgtQSgpQC0Y/uU6MzQ6OjQzOgADADX/tgMuAzcACwAZAB0AAAEzESMRIxEjETMVMyUhFA4CByc+AzchATM1IwLfT096TU16/XgBXiFOgWAwTm5IJgX+8wIOenoDN/x/AVf+1QM90nZWpZeFNjssZ3WBRv7QugAABAA7/88DRQM2AAsAFAAYAB4AAAEVIxEzFTM1MxEjNQEhFAYHJyQ3IQUjFTMBIRUhETMCZU5Odk9P/YQBW6iuKQEUGP74Anx2dv5VAhX9mVIBbbcCcJys/WPUAXKl70s9eOhWl/5iQwEbAAAABAA9/7wDTAM2AAsAFAAYACQAAAEVIxEzFTM1MxEjNQEhEAUnPgE3IQUjFTMBIRUhNSE1ITUhFSECZU5Odk9P/YUBWf6rJ4yRDP76Ant2dv5SAh/9kAH9/gECUP4DAdRjAbVqev41aQEt/sl+PTGbakNo/epC5F5B3AAAAAUAPf/EAyoDNgALABMAFwAfACMAAAEzESM1IxUjETMVMyUhEAUnJDchBTM1IxM1MxEhETMVBTUhFQLbT092Tk52/YUBW/6rKQESGP75AgV2dnRR/bRSAan+VwM2/hpzbQHPbUP+wIo8bN+zcf5GbP6cAWRstnV1AAIANP+2AxcDNgAHABMAAAEzESMRIzUzASEUDgIHJz4BNyECxVJS0tL9lwGZKmCacC21rgz+uQM2/IAB1kMBB2CzoIs3QFn9nQAAAAADAEH/uQMYAzcABwATABkAAAEzESM1IzUzJSEUDgIHJz4BNyETNSERIxECxVNTwMD9qgGTOmyaYCGjug3+xFECWFMDN/3y30OzVZF1VxtALqlz/gRC/rgBBgAAAAMAQ//KAy8DNgAHABUAGwAAATMRMxEjESMBIRQOAgcnPgM3IRMhFSERMwIDwlNTwv5tAZc7bZpfI02AXjoH/sHDAfz9slICIgEU/WoBPwESVph9YB9CGUlbbDz9X0MBGQAAAAADAD//wgMqAzcABwATABsAAAE1IzUzNTMRASEUDgIHJz4BNyETIRUhESEVIQLFw8NT/VQBlDlsmmIgpLoN/sK7AgP9qwJF/g0BOcxE7v4CAcVVkXZYHEItq3P9SUIBRUIAAAAAAwBC/78DNgM3AAcAEwAfAAABNSM1MzUzEQEhFA4CByc+ATchEyEVITUhNSE1IRUhAsXDw1P9WgGKOGuZYB6kswv+zrcCDf2iAe7+EAJC/hEBa7JC2P40AaBUim1PGEEnm239N0HnXUHcAAAABQBC/8IDGAM3AAcAEwAoACwAMAAAATMRIzUjNTMlIRQOAgcnPgE3IRMVMj4CNxcOAysBNTM1IzUhFRcRIREDFTM1AsVTU8LC/aoBkTlsmmEeprUL/seDJDw2MxsIHzo+Ry0w0dMBIjcBHtaOAzf+Jr5Dq1SLbU8YQCedbf2dYQEEBgVABgcDAd9VP9GiAXP+jQE2+PgAAAAEAD//wwMXAzcABwATABcAGwAAATMRIzUjNTMlIRQOAgcnPgE3IRMRIREBFSE1AsVSUsPD/acBlTpsmmAipLoN/sJoAkP+DgGiAzf+ANZDrlWRdVcbQC6pc/0IAU7+sgENy8sABABA/8IDFwM3AAcAEwAbAB8AAAEzESM1IzUzJSEUDgIHJz4BNyEBNTMRIREzFQU1IRUCxVJSwsL9qQGUOGubYyGotwv+xAJYUf28UgGh/l8DN/4dvkSpVI5wUxlAKqFw/ftw/psBZXCzc3MAAwBE/7kDSAM2AAcAEwAsAAAlESM1MzUzEQEhFA4CByc+ATchARUUHgIXBy4DJw4DByc+Az0BAsXBwVP9VwGSOGmYYCSjtgz+xgGwMFJsOyExXVA/FBRAUF4yITxtUjHYAR9D/P2iAhhXlHhdH0Ezr3n+eSkwVUMvC0AKJDNAJydCMyQKQQovRFUxKQADAD//uANnAzcABwATADkAAAE1IzUzNTMRASEUDgIHJz4BNyEBFRQeAhcHLgEnDgEHLgEnDgEHJz4DPQEzFRQWFz4DPQECxcHBU/1ZAZA6bJpgIp+/DP7IAkIYLkMrKUJbFxVSP0JQFRhaPyorQy8YTz4/IDAgEAE41UTm/gEBxlWRdVcbQC6qcv5kQSJFPDAOPhlYOTdgGhlcOTZYGT4PMjxDIUFBPHYlFDQ6OxpBAAQAQP+6AxwDNgAHABMAJwAzAAABNSM1MzUzEQEhFA4CByc+ATchATIeAhUUDgIjIi4CNTQ+AhMyNjU0JiMiBhUUFgLFwMBT/VcBlDpsm2EhpLoM/sUBhURtTSoqTW1ERG5OKipObkRkc3NkZHV1ASDXQ/z96gHTVpN2WR1BMKx2/mQYLEApKEEtGBgtQSgpQCwY/uY6MzM6OjMzOgAAAAADAEP/uANDAzcABwATAC4AAAEzNTMRIzUjJSEUDgIHJz4BNyEBIx4DFwcuAycOAwcnPgM3IzUhAgTBU1PB/msBoDxvn2Mfqr4M/rgCtP4BL05nOR8xW049ExM9TlsxHjlnTi4B+gJOAkrt/f/R91WRc1UZQiqlc/4LJUM3Jwk/CB8tOSEhOS0fCD8IJzdEJUIAAAAAAwBB/8MDLAM3AAcAEQAdAAABNSM1MzUzEQEhFAYHJz4BNyETIRUhESEVIRUhFSECxb6+U/1VAZXbxiCqtQv+wr8CAP2uAkH+EQHi/h4BVL1E4v4dAa2p4jRCKqFw/UI+AWw+WD0AAAAEAEH/xAMqAzcABwAVACEAJQAAATM1MxEjNSMlIRQOAgcnPgM3IQEzFSE1MzUjNSEVIyEVMzUCAcRTU8T+bQGTOm2aYB9PgF03Bv7EAjCM/ZGIgAJcgf72uQJN6v4KyPRUj3NVGkEVQFJjN/1MQkLNQkLNzQAAAAAFAEH/uAMqAzcABwARABkAJQAxAAABNSM1MzUzEQEhFAYHJz4BNyEBIRUhNSE1MwcyFhUUBiMiJjU0NhcyNjU0JiMiBhUUFgLFxMRT/VgBitfFHaiwC/7MAasBD/2PARBSKnaDg3Z2g4N2TlZWTk5WVgFbxUPU/iQBp6ndNEIqn23+XD8/adFCPD1BQT08QsIjISAjIyAhIwAAAAACADb/tgMvAzcAAwAXAAABMxEjAxEzESMRIw4BByc+ATchNSEUBgcC4U5Ou05OuCqAXjCSkgv+9wFaFBcDN/x/AhIBV/zEAaNOiDk7WOmPQ0J/PAADADr/ygNKAzYAAwAVABsAAAERIxEDIwYHJz4BNyE1IRQHMxEzESMHIRUhETMDKk+yuFe2Ko+VC/76AVoolE1N9AIV/ZlSAzb9XwKh/p6CUDw8sXNDdFYBDf2LokMBHwADAD//wgNMAzYAAwAWACIAAAERIxEDIwYHJz4BNyE1IRQGBzM1MxEjAyEVITUhNSE1IRUhAypPsqtSxCmOkgv+/AFZEA6ITU38Ah/9kAH8/gICUP4DAzb+NQHL/uODSj0wnGpCLVMmyP5M/pVC41lB2AAAAAQAQP/EAyoDNgADABQAGAAcAAABMxEjJyMGByckNyE1IRQHMzUzESMBESERARUhNQLbT0+yq1W/KgETGP76AVohi01N/rUCTP4EAasDNv38y41RPXLjQ2FT4/4Z/ogBQ/69AQG/vwAABAA+/8MDKgM2AAMAFQAdACEAAAEzESMnIwYHJz4BNyE1IRQHMzUzESMXNTMRIREzFQU1IRUC209Psq5WvyiPkAv+/gFXIIxNTbBR/bRSAan+VwM2/hO7iUk8NqVtQlpX3P4tmGz+nwFhbLNycgAAAAMAPP+6A1gDNwADABQALQAAAREjEQMjBgcnJDchNSEUBzM1MxEjBxUUHgIXBy4DJw4DByc+Az0BAypPsqtWwSsBFRj++QFaH4xNTQMzVW87IDNfUkIVFUFTXzMgO29VMwM3/asCVf61llU8eO1DaU71/gwZKC1QQSwJQQkiMkAmJkAxIwlBCSxBUC0oAAAAAAMAPf+yA2wDNgADABQAOgAAAREjEQMjBgcnJDchNSEUBzM1MxEjFxUUHgIXBy4BJw4BBy4BJw4BByc+Az0BMxUUFhc+Az0BAypPsrBYuSsBFhj++QFbJI5NTY8YL0MqKENbFxRSP0JPFBlaQCkqRC4ZTz0/IDAfEAM2/fsCBf7Ah1A9buhCZlbr/hwtOiNEPDAPPBdaOTdhGhpcOTZZGDwPMj1DITo6PXQlFDQ6Oho6AAAAAAQAO/+5AzQDNgADABYAKgA2AAABESMRAyMGByc+ATchNSEUBgczNTMRIwcyHgIVFA4CIyIuAjU0PgITMjY1NCYjIgYVFBYDKk+yrVXCKo2XC/74AV0REItNTSVHcE8qKk9wR0ZxTyoqT3FGZ3d3Z2d3dwM2/doCJv6/j1M8ObBzQjFaKuv+DCkXKj4nKD4rFhYrPignPioX/vI3MTA3NzAxNwAAAQA1/7cDFwM4ABYAAAEzESMRIzUzNSMOAQcnPgE3ITUhFAczAsVSUvj46ya3nSuyswz+tgGcDtsDOPx/AVdDrn3VTkJY/J9CSksAAAIAQv+4AxgDNwAYAB4AAAEzESM1IzUzNSMOAQcnPgM3ITUhFAczATUhESM1AsVTU+jo2y3GlCFRhF44Bv6+AZoMxv37AlhTAzf96XZDe2qVKkIWQlRmOUM0MP4fQv7A/gAAAAADAEL/tgMYAzcAGAAeACQAAAEzESM1IzUzNSMOAQcnPgM3ITUhFAczATUhESMRMzUhESMRAsVTU+rq3C3FkyJRgl84Bv6+AZoLxv3lASVSfAEfUwM3/fdrQ31tlChCFkFUZTlDKTr+JUP+swEKQ/6zAQoAAAIARP/KAy4DNgAYAB4AAAEjDgEHJz4DNyE1IRQHMzUzESM1IzUzASEVIREzAsXgMMCNJE6BXzoH/r8BmQ/JU1Ps7P5uAfv9s1ICO22bLUMZSVtsPEI8Nrj9ZdZD/llDARIAAAACAEH/wgMqAzcAFgAeAAABIw4BByc+ATchNSEUBzM1MxEjNSM1MwEhFSERIRUhAsXdLcSVIaK+DP6/AZkKylNT6ur+YgID/asCRf4NAmBtmSpCLalzQzcllf4CaEP+IEIBRUIAAgBD/78DNgM3ABYAIgAAASMOAQcnPgE3ITUhFAczNTMRIzUjNTMBIRUhNSE1ITUhFSECxd0qxZgeqLQL/sgBkQnLU1Pq6v5kAg39ogHu/hACQv4RAnVqjyNDJpltQywqgv42XUD99kHnXELcAAAAAAUAQ/+2A0cDNwAXAB8ANABIAFQAAAEjDgEHJz4BNyE1IRQGBzM1MxEjNSM1MwMzFSE1MzUzBRUyPgI3Fw4DKwE1MzUjNSEVNzIeAhUUDgIjIi4CNTQ+AhcyNjU0JiMiBhUUFgLF3yrFlx2ntQv+yAGPBATMU1Ps7A6Q/pKOUP41Jj44NBwJHzxASi4xyswBHNgiOSoYGCo5IiI6KhgYKjoiJjAwJiYwMAJ3aokiQySVbUIXKhWA/jZfQP78Pj5U9WUCBAYFQAYHAwHhVD7OQBEfLRwbLR8RER8tGxwtHxG4Ih0dIiIdHSIAAAAAAwBA/8MDFwM3ABYAGgAeAAABMxEjNSM1MzUjDgEHJz4BNyE1IRQHMwERIREBFSE1AsVSUurq3y3DlSGkuw3+wAGXCcv+DwJD/g4BogM3/f9yQ3VtmCpALapzQy4t/SABTf6zAQzKygADAED/wgMXAzcAFwAfACMAAAEzESM1IzUzNSMOAQcnPgE3ITUhFAYHMxM1MxEhETMVBTUhFQLFUlLo6N0qxJgiqbcL/sMBlQQEygFR/bxSAaH+XwM3/h5bQ3RtkyZBKqBwQxcqFP4NcP6bAWVws3NzAAAAAAIARP+5A0gDNgAWAC8AAAEjDgEHJz4BNyE1IRQHMzUzESM1IzUzBxUUHgIXBy4DJw4DByc+Az0BAsXhKsCSJKO3DP7FAZMKzVNT6uqmMFJsOyExXVA/FBRAUF4yITxtUjECS3CaMEAzsHlDOSmo/aC3Q6wnMFVDLwpBCiQyQScnQjMkCkEKL0RVMScAAgBA/7cDZwM3ABgAPgAAASMOAQcnPgM3ITUhFAczNTMRIzUjNTMHFRQeAhcHLgEnDgEHLgEnDgEHJz4DPQEzFRQWFz4DPQECxd8tw5UhUIFeNwb+xQGTCstSUurqEhguQyspQlsXFVI/QlAVGFo/KitDLxhPPj8gMCAQAl5tlipAFkJUZTlDOCWW/gBtQ8hBI0Q8MA89GVg5N2AbGlw5NlgZPRAyPEMhQUE9dSUUNDo7GkEAAwBB/7oDHAM2ABYAKgA2AAABIwYFJz4BNyE1IRQGBzM1MxEjNSM1MwcyHgIVFA4CIyIuAjU0PgITMjY1NCYjIgYVFBYCxeBb/tgho7sM/sQBlQUFy1NT6+vSRG5NKipNbkREbk0qKk1uRGR0dGRkdHQCT9tWQTCsdkIZMRek/eh2Q8MYLEApKEEsGBgsQSgpQCwY/uY6MzM5OTMzOgAAAAIAQP/DAywDNwAWACIAAAEjBgUnPgE3ITUhFAYHMzUzESM1IzUzASEVIREhFSEVIRUhAsXdVP7NIau1DP7BAZYEBMpSUunp/mcCAP2uAkH+EQHi/h4Ca9pPQSqicEIXKhWM/hxoQP4GPgFsPlg9AAACADT/twMvAzcAAwAaAAABMxEjAzUzESMRIzUzNSMOAQcnPgE3ITUhFAcC4U5OtE5OoqKUIJSBMJORC/75AVgMAzf8gAKG4vzFATZDnnPETDpY6Y9DREQAAwA5/8oDSAM2AAMAGAAeAAABESMRAyMGByckNyE1IRQHMzUzESM1IzUzAyEVIREzAypPrJFK8ikBGBf++wFaDH5NTaOj/AIV/ZlSAzb9ZQKb/vfGaj147EM6OLX9jbdD/mJDASIAAAADAD//vwNMAzYAAwAaACYAAAERIxEHIw4BByc+ATchNSEUBzM1MxEjNSM1MwEhFSE1ITUhNSEVIQMqT6yIIp2AKY2RC/7+AVgHeE1Nk5P+/gIf/ZAB/P4CAlD+AwM2/jIBzshkjTA8MZtqQjMgdf5KW0D9+EHkW0HZAAAABAA9/8QDKgM2AAMAGgAiACYAAAEzESMDIwYHJz4BNyE1IRQGBzM1MxEjNSM1MxM1MxEhETMVBTUhFQLbT0+sikL9KY+QDP7+AVYEBHtNTZCQqlH9tFIBqf5XAzb+EQEXyGM9NKJwQhcsF4X+K2VA/sVr/qEBX2uycXEAAAMAO/+7A1gDNwADABoAMwAAAREjEQcjDgEHJyQ3ITUhFAYHMzUzESM1IzUzBxUUHgIXBy4DJw4DByc+Az0BAypPsoUgnYAsARUY/voBWgMEdE1NjY0DM1VuPB8yYFNCFRVCUmAzHztvVTMDN/2iAl7uaqY5PnjsQxcsF5j+AnFDyyQrUD8tCT8IIjE/JSY/MSEIPwksQE8sJAAAAAIANgA0A2EC3QANABUAAAE1ITUhFRQOAgcnPgEDIRUhNSERMwKu/d0CdQEGDg1SGgjrAZ781QE7UgKEFkNZKlllc0QJgMb+Q0NDAUEAAAAAAwA3/7YDXwMGAAsAEwAZAAABNSE1IRUUBgcnPgEDIRUhNSE1MwE1IREjNQKo/e4CYwURUhEG1AGL/NgBS1L+uQJrUgLCAkJEM3hMCExw/v1CQrb+YEL+0uwAAAADADb/ygNfAwIACgASABgAAAEnPgE1ITUhFRQGBSEVITUhNTMDFSEVIREC4VITBv3tAmQG/uEBi/zXAUxS5gIh/Y0BtQpUeTNDPzSClUNDuf6pzUMBEAAAAwA2/8MDXwMOAAsAEwAbAAABNSE1IRUUBgcnPgEHIRUhNSE1MwMVIRUhESEVAqj97QJkBhJREgbUAYv81wFMUugCGf2VAl4CwgpCTDZyRQlFa+1CQqj+cbRDATpDAAAAAwA3/8EDXwMTAAoAEgAeAAABJz4BNSE1IRUUBgUhFSE1ITUzAxUhFSE1ITUhNSEVAuhRDAX97gJjBP7fAYv82AFLUusCKv2FAhP96gJoAgQIP1wqQjoraHVBQZz9+WRB4VpB1wAAAAAFADf/wANeAw4ACgASACYAKgAuAAABJz4BNSE1IRUUBgUhFSE1ITUzAxUyPgI3Fw4CKwE1MzUjNSEVFxEhEQMVMzUC5VAOBf3uAmMF/uABivzZAUtS+Cc9NTEaBx43PiSDztEBIDoBIduUAe0JRWcqQjgtc3lCQqL9/2ABAwcFPgYHA9lUPcyeAWr+lgEt7+8AAAAABAA3/7sDXgMSAAsAEwAoAD0AAAE1ITUhFRQGByc+AQchFSE1ITUzExUUHgIXBy4BJw4BByc+Az0BBRUyPgI3Fw4DKwE1MzUjNSEVAqj97gJjBQ5RDgXUAYr82QFLUtETJzsnLTlJFBRIOS0nOycT/oQkOjMvGgYdNjtGLS7O0QEgAswEQkYxakAJP2PcQkKj/thXI0ZANRE6GlY2NlYaOhI1QEYiV9xhAQMGBT4FBgMB2VQ+zAAAAAYAN/+2A18DGAAKABIAGgAuADoARgAAASc+ATUhNSEVFAYFIRUhNSE1MxMVMxUhNTM1BRUyPgI3Fw4CKwE1MzUjNSEVNzIWFRQGIyImNTQ2FzI2NTQmIyIGFRQWAuVQDgX97gJjBf7gAYv82AFLUs+W/oiT/oMpQDcyGwkfOT8lhsfKARfcQlZWQkJUVEIlLCwlJCwsAfoJRWQqQjctcnpCQqL+5lI9PVLsYgEDBgU9BgcD3FQ9zTw/NjY/PzY2P7EgHB0fHx0cIAAAAAQAN//CA18DDwALABMAFwAbAAABNSE1IRUUBgcnPgEHIRUhNSE1MwERIRElFSE1Aqj97gJjBhJREgbUAYv82AFLUv7EAmP97gHCAsMKQkw2cUUKRWnrQ0Os/XIBPP7E+7m5AAAEADb/wgNgAxMACgASABoAHgAAASc+ATUhNSEVFAYFIRUhNSE1MxM1MxEhETMVBTUhFQLhURIG/e0CZAb+4QGM/NYBTFLQUv2oUgG0/kwB5whIaTBDQTFyeUNDn/5lbv6aAWZutnd3AAMAN/+6A18DDAAKABIAKQAAASc+ATUhNSEVFAYFIRUhNSE1MxMVFB4CFwcuAycOAQcnPgM9AQLiUBEF/e4CYwb+4QGL/NgBS1IdMFNuPR8zYFFAFCumaR8+blMwAdEJTHMxQj8ze4xCQrT+wygsTTwqCUAJIC48JElcEkAJKjxNLCgAAAQAN/+3A14DCQALABMAJwAzAAABNSE1IRUUBgcnPgEHIRUhNSE1MwMyHgIVFA4CIyIuAjU0PgITMjY1NCYjIgYVFBYCqP3uAmMGE1ASBtQBivzZAUtSDUhzUiwsUnNISHNRLCxRc0hqfX1qaX19Ar0KQkw2ckUJRWv0Q0Os/r8WKz0nJj0qFxcqPSYnPSsW/vc0MDA2NjAvNQAAAAMAN/+5A18DEgALABMALgAAATUhNSEVFAYHJz4BByEVITUhNTMBIR4DFwcuAycOAwcnPgM3ITUhAqj97gJjBhJREgbUAYv82AFLUgEu/vUFNFJpOh40YFNBFBRBU2AzHjppUjQF/vUCbQLJBkNJNG9DCUNn60JCpP50KEQ0Iwg/CB4tOyQkOy0eCD8IIzREKEIAAAADACz/tgN0AzcABwASACIAAAEVIxEjETMRByc+ATUhNSEVFAYnET4BNxcOAyMnMjY3EQN0j1JS3FITCP6LAcUG4UuRRQVGkpCIPAkrYDMBwEX+OwOB/omACHCkNkMxNq4V/u4DCQk8Cw0IAkQBAgEUAAAAAAQAL/+7A28DNwAHABIAIwApAAABFSMVIxEzFQcnPgE1ITUhFRQGHwEOAyMnMzI2NzUzFT4BBTUhESM1A2+AUlLkUA8I/pQBvAZFBUWUkok7CFsYMRpRS5P+hQJOUgI9RO0CK/ptCUlrKkMwKnuIPQwOCAJEAQG4tgML9UL+3OIABAAv/8oDcAM3AAcAEgAiACgAAAEzFSMRIxEzAyc+ATUhNSEVFAYfAQ4DIycyNjc1MxU+AQUVIRUhEQLvgYFSUuNREAj+kgG+BkQGRpOSiTwIK2AzUUuT/u4CAv2sAhNE/sQCpP6BCU50K0MvLYKRPAwOCAJDAQHCvwMLp8RDAQcAAAAABAAw/78DbwM3AAcAEgAjAC8AAAEzFSMVIxEzAyc+ATUhNSEVFAYfAQ4DIyczMjY3NTMVPgEBFSEVITUhNSE1IRUC74CAUlLjUA4I/pQBvAVFBkaTkYo8CFoXMRpRS5T+3AIY/ZYB9/4HAksCYkTKAeP+vghCYSRCLCV0eDsLDQcCQQEBo6EDCv6eXz/aVj7QAAAAAAYAMP/AA28DNwAHABIAIwA3ADsAPwAAARUjFSMRMxUHJz4BNSE1IRUUBh8BDgMjJzMyNjc1MxU+AQEVMj4CNxcOAisBNTM1IzUhFRcRIREDFTM1A2+AUlLjUA4I/pQBvAVFBkeUkYg8CFoXMRpRS5T+uSU8NTAYBh02PCOBzM4BHTMBG9OLAlxE0gHx22cIQmEkQismdXQ7DA4GAkIBAaCeAwr+lVoCBAYFPgYHA9FOPcWXAVz+pAEe4OAABQAv/8QDbwM3AAcAEgAjACcAKwAAARUjFSMRMxUHJz4BNSE1IRUUBh8BDgMjJzMyNjc1MxU+AQERIRElFSE1A2+AUlLkUA8I/pQBvAZFBkeUkYg7CVsYMRpRS5P+lQI+/hIBngJNROkCF+pnB0VlJkItKHaEPQwOBwJDAQGopgML/h8BL/7R7qysAAAFAC//wgNvAzcABwASACMAKwAvAAABFSMVIxEzFQcnPgE1ITUhFRQGHwEOAyMnMzI2NzUzFT4BEzUzESERMxUFNSEVA2+AUlLjUA4I/pMBvQVGBkeTkYo9CFsXMRpRS5WBUf3CUQGc/mQCWUTVAffeaghCYiVDLCZ0fTsLDQgCQwEBoJ4DCv7/Zv6mAVpmsXFxAAAABAAv/7oDbwM4AAcAEgAjADwAAAEzFSMRIxEzAyc+ATUhNSEVFAYfAQ4DIyczMjY3NTMVPgEHFRQeAhcHLgMnDgMHJz4DPQEC74CAUlLmUBEI/pQBvAZGBUaTkYo8CFsYMRpRS5QWMFFtPR8zX1E/FBRAUV4zID1tUTACKUT+7wJk/qAISGwoQi0qepE8DA4HAkMBAbWyAwqUIytKOikJQAgfLTskJDstHwhACSk6SisjAAAABAAv/7oDbwM3AAcAEgAiAEoAAAEzFSMVIxEzAyc+ATUhNSEVFAYfAQ4DIyczMjc1MxU+ARcVFB4CFwcuAScOAQcuAScOAQcnPgM9ATMVFB4CFz4DPQEC74CAUlLkUA8I/pQBvAZFBkaUkIk8CYwYGlFLk4IYLkMrKUJZGBRQQkBRFBhaQCkrQy4YTw8fLyAcLiETAk1E6AIW/q8HRWUmQi0odoc8DA4GAkQBqaYCCqgdI0M7Lg49F1Y3N10aGV03NlYXPQ4vOkQiHSAcPDgxEhAuNz4gIAAABQAv/7gDbwM4AAcAEgAjADcAQwAAATMVIxUjETMDJz4BNSE1IRUUBh8BDgMjJzMyNjc1MxU+AQcyHgIVFA4CIyIuAjU0PgITMjY1NCYjIgYVFBYC74CAUlLkUBAH/pQBvAZFBkaTkIo8CVsYMRpRS5NORW5OKSlObkVFbk4pKU5uRWRzc2Rkc3MCQkT2AjD+owdIaSpCMCt4iTwLDQgCRAEBsa8DCp4WKTwmJz0pFhYpPScmPCkW/v0yMC4zMy4wMgAAAAMAKv+2Ay0DNwALABYAJgAAATMRIxEjESMRMxEzBSc+ATUhNSEVFAYnET4BNxcOAyMnMzI3EQLfTk5sTk5s/tpMEAX+0QF6Bbs9eDQFNnp4cC0MbhQVAzf8fwHD/mwDPv6ZbwZqmDlCPTqfHP8AAgkHPQoMBgJFAQEDAAAEACz/ygNCAzYACwAWACYALAAAAREjETMRMxEzESMRBSc+ATUhNSEVFAYfAQ4DIycyNjc1MxU+AQMhFSERMwJwTU1qT0/+5E0OBv7YAXUFKwY3enhxLgoiTS1MPHWmAiP9ilMB1v7SAn7+8wEd/VgBSBoIS3ItQjowe4s8CQsHAkMBAbm2Agn+k0MBCwAAAAAEACz/wANJAzcACwAWACcAMwAAARUjETMVMzUzESM1BSc+ATUhNSEVFAYfAQ4DIyczMjY3NTMVPgEDIRUhNSE1ITUhFSECcE1Nak9P/uZMCwb+2AF1BCoFNnl5cS0LSRQpFkw8dasCL/2BAg797wJi/fECF8YB1czd/hTMIwZAYCdCNCpseToJCwcCQgEBoZ8CCP5GP9ZRPswAAAAGACz/wAMpAzcACwAWACYAOwA/AEMAAAEzESM1IxUjETMVMwUnPgE1ITUhFRQGHwEOAyMnMjY3NTMVPgEDFTI+AjcXDgMrATUzNSM1IRUXESERAxUzNQLaT09qTU1q/uZMCwb+2AF1BCoFNnl5cS0LIk0tTDx13CU9ODUdCCE9QUgsMd3fAS43AS3hlgM3/hnLxQHQyGsHQGAnQjQqbHQ6CQwGA0IBAZ+cAgj+nF0BBAYFPAYHAwHUUj3JmgFj/p0BJebmAAAAAAUAK//CAykDNwALABYAJgAuADIAAAEzESM1IxUjETMVMwUnPgE1ITUhFRQGHwEOAyMnMjY3NTMVPgEFNTMRIREzFQU1IRUC2k9Pak1Nav7kTA4F/tgBdQUrBTZ5eXEuCyNNLUw8dQETUf2hUQG9/kMDN/4F0coB4tVsBkVmKkI3LXCAOQkMBgNCAQGppgII9WT+rAFUZK1sbAAAAAQALP+5A2kDNwALABYAJwBNAAABFSMRMxUzNTMRIzUFJz4BNSE1IRUUBh8BDgMjJzMyNjc1MxU+ARcVFB4CFwcuAScOAQcuAScOAQcnPgM9ATMVFBYXPgM9AQJwTU1qT0/+5UsMBf7YAXUFKwY3e3lwLAtJFCkWTDx18BguQysoQ1oXFFM/QFIUF1pCKStDLxhPPj8gMB8QAgDaAgDj9P3o4SkIRWoqQjgtc4U5Cw0GAkIBAa2rAgmYHiNFPDAOPBhWOTlcGhpbOTlVGDwPMDxEIx4eOnYmEzI5PBweAAAABQAs/7YDKQM2AAsAFgAnADMAPwAAATMRIxEjFSMRMxUzBSc+ATUhNSEVFAYfAQ4DIyczMjY3NTMVPgEXMhYVFAYjIiY1NDYXMjY1NCYjIgYVFBYC2k9Pak1Nav7mTQ0F/tgBdQQpBjd7eXAsCkkUKRZMPHQvlaGhlZCkpJBtdXVtbXNzAzb9yQEA5AIL5HcGSGwtQTkudoE5Cw0GAkIBAaupAwigUEtLUVFLS1D3Ly0tLy8tLS8AAAMAOP+0AxUDNwADAA4AHwAAATMRIwMnPgE1ITUhFRQGIxE+ATcXDgMjJzMyNjcRAsNSUqRREQn+igHHBuJOn0sGS5uXjz8MYRk0GgM3/H0BkAptnTRDLTOr/vsDCgo9DA4GAkQBAQEHAAAAAAQAN/+2AxUDNwADAA4AHwAlAAABMxEjLwE+ATUhNSEVFAYfAQ4DIyczMjY3NTMVPgEFNSERIzUCw1JSq1EQCP6ZAbcGVQVJmJSNPgxhGTQbUEya/oACX1IDN/3UxAhLaypDMCp8kDwMDgcCRAEBtbICCu5C/tjmAAQANf/KAy8DNwADAA4AHQAjAAABESMRAyc+ATUhNSEVFAYfAQ4DIycyNzUzFT4BASEVIREzAxZSqFARB/6RAb8GTwZJl5SOPw1ibFBMlv7wAgr9pFIDN/1YAqj+gwpOcS1DNy2Akj0LDgcDRQO9uwMK/plDAQAAAAQANv/AAzkDNwADAA4AHQApAAABESMRAyc+ATUhNSEVFAYfAQ4DIycyNzUzFT4BASEVITUhNSE1IRUhAxZSrk8OCP6bAbUGVgZKmJSNPgxgbE9MmP7fAiX9iwIB/fwCVf3+Azf+FwHp/r0HQmMkQiwmdHc7Cw4HA0IDpaMDCv5AP9VTPcsAAAAFADf/wgMVAzcAAwAOAB8AIwAnAAABMxEjLwE+ATUhNSEVFAYfAQ4DIyczMjY3NTMVPgEBESERJRUhNQLDUlKpUQ4H/psBtQVUBkuZlIs+C2EZNBtQTJn+kwJN/gMBrQM3/ebEBkZoKEIxKnWEOwwPBwNCAQGlogML/iIBLf7T66mpAAAFADf/wgMVAzUAAwAOAB4AJgAqAAABMxEjLwE+ATUhNSEVFAYfAQ4DIycyNjc1MxU+ARc1MxEhETMVBTUhFQLDUlKpTw8G/pkBtgVTBkmXlI4/CzBlNlBMl49R/a9SAa7+UgM1/gmqB0VkKkE2LXB+OwsNCAJCAQGgnQMK+Wb+rAFUZqxrawAABAA3/70DQgM3AAMADgAdADQAAAERIxEDJz4BNSE1IRUUBh8BDgMjJzI3NTMVPgEHFRQeAhcHLgEnDgMHJz4DPQEDFVKpUA8F/psBtQVUBkmXlI4/C19qUE6XHjBSbTwgZ6MqFkZTWiwgPGxTMAM3/Y0Cc/6eCkVmMEM/MHGDPAsOBwNEA6qnAwmOHixNPCoJQBJbSyg/LR0HQAkqPE0sHgAAAAAFADf/twMaAzgAAwAOAB8AMwA/AAABESMRAyc+ATUhNSEVFAYfAQ4DIyczMjY3NTMVPgEHMh4CFRQOAiMiLgI1ND4CEzI2NTQmIyIGFRQWAxVSqk8PBv6aAbUFVAZKmZSMPgthGTQbUEyZSUZwTioqTnBGRnBOKipOcEZncnJnZ3NzAzj9ywI1/pgKSG0uQj0wd387DA4GAkIBAamnAgqXFik8Jic8KRYWKTwnJjwpFv79MjAuMzMuMDIAAAIANQA0A2AC3QANABkAAAE1ITUhFRQOAgcnPgEDIRUhNTMRMxEzETMCr/3aAngBBg0MURMMhAE1/NXHUY1RAnogQ2MrWGFsPwpluv5jQ0MBKf7XASkAAAADADb/ygNfAwMACwAXAB0AAAE1ITUhFRQGByc+AQMhFSE1MzUzFTM1MwEVIRUhEQKu/eQCbQUQURAFeAEp/NfOUZBR/rgCIf2NAr0DQ0Y3f1EIT3r+6kNDubm5/q3LQgENAAAAAwA3/8EDXwMXAAoAFgAiAAABJz4BNSE1IRUUBgchFSE1MzUzFTM1MwEVIRUhNSE1ITUhFQLuUAwE/eUCbATHASv82M5RjVH+tQIq/YUCE/3qAmgCBQk9XytCPS1od0NDoaGh/fdkQeFaQdcABAA3/8IDXwMSAAoAFgAaAB4AAAEnPgE1ITUhFRQGByEVITUzNTMVMzUzAREhESUVITUC6lAPBf3lAmwFxAEp/NjNUZBR/mICY/3uAcIB3whLbjBCQDF3jkJCqqqq/XwBPP7E+7m5AAAEADb/wgNgAxQACgAWAB4AIgAAASc+ATUhNSEVFAYHIRUhNTM1MxUzNTMTNTMRIREzFQU1IRUC51AQBv3kAm0GxwEv/NbPUYpRc1L9qFIBtP5MAeUKSGowQz8xdIJDQ6ampv5lbv6bAWVutnd3AAAAAwA2/7oDYAMPAAsAFwAwAAABNSE1IRUUBgcnPgEHIRUhNTM1MxUzNTMDFRQeAhcHLgMnDgMHJz4DPQECsv3iAm8FEVAQBX8BLfzW0FGLUUIwU249IDNfUUAUF0dUXCwfPm5TMALBDEJOOXFICUVu/kNDubm5/sQpLE08KQlACSAuPCQpPi0cB0AJKTxNLCkABAA3/7cDXwMMAAoAFgAqADYAAAEnPgE1ITUhFRQGByEVITUzNTMVMzUzAzIeAhUUDgIjIi4CNTQ+AhMyNjU0JiMiBhUUFgLqURAF/eUCbAXEASn82M1RkFFvSHRSLCxSdEhIc1EsLFFzSG17e21pfX0B1ghLcTBCQTF4kUJCr6+v/sAWKz0nJj0qFxcqPSYnPSsW/vc0MDA2NjAvNQAAAAEANv+1A2EC/QATAAABFSERIxEhNSE+AT0BITUhFRQGBwNh/pJT/pYCUxUH/fYCWgYTAXtD/n0Bg0NhlD8MQk4/lGEAAQA1/7cDYwMMABgAAAEhFSERIzUhNSE1ITUhPgE1ITUhFRQGBzMDY/6RAQtS/d4BF/6TAlwSBv30Al0FEX8BiaT+0uxCpENRejNCQTN7UQACADT/ygNjAwcAEwAZAAABMxUhFSM1ITUhPgE9ASE1IRUUBgEVIRUhEQLkf/6VUv6OAl0SBv3zAl4F/fgCH/2PAatC2NhCWIQ5BUJHOYT+39VDARgAAAAAAQA0/8IDYwMMABoAAAEhFSEVIRUhFSERITUhNSE+ATUhNSEVFAYHMwNj/pEBC/3rAhz9kgEK/pICXhEG/fMCXgUQfgGPlEK1QgE5lEJPdjNDQTN5TgAAAAEANf/BA2MDEwAeAAABIRUhFSEVIRUhNSE1ITUhNSE1IT4BNSE1IRUUBgczA2P+kQEJ/ewCKv2FAhP96gEM/pQCYA4G/fQCXQQOewGydNljQd9dQXRCSGktQTgtckgAAAMANf+6A2IDFAASACcALQAAATMVIRUjNSE1IT4BNSE1IRUUBgEVMj4CNxcOAysBNTM1IzUhFTc1IREjEQLne/6QUf6UAl8PBv3zAl4F/egxTkI7HwghQElYOTfY2gEpMAEdUQHvQ4ODQ0ltLUI4LnT+H1oCBQgHPgcJBQLWUT/NikP+lAEpAAACADX/wANhAxQAKgAuAAABIRUhESERIxUjFTI+AjcXDgIrATUzNSM1ITUhNSE+ATUhNSEVFAYHMwUVMzUDYf6RARP+3zrOJz01MRoHHjc+JIPO0QEX/pQCXhAG/fMCXgUPe/7JlAGqgP6WAWTFYQEDBgU9BgcD2lM9gEJLbi1COS51TP/v7wAABQA1/7YDYgMWABIAGgAuADoARgAAATMVIRUjNSE1IT4BNSE1IRUUBgcVMxUhNTM1BRUyPgI3Fw4CKwE1MzUjNSEVNzIWFRQGIyImNTQ2FzI2NTQmIyIGFRQWAuZ8/o5S/pcCXw8G/fMCXQVRl/6Hk/6DKUA3MhsJHzk/JYbHygEX3ENVVUNCVFRCJSwsJSQsLAHwQoKCQktsLUI3LXboUj09UvVdAQMGBT0GBwPWUz3LSEA5OT8/OTlAuSIeHiMjHh4iAAIANP/DA2MDDwAWABoAAAEhFSERIREhNSE1IT4BNSE1IRUUBgczAzUhFQNj/pEBCf2cAQj+kwJdEQb98gJfBRGAt/49AZCW/skBN5ZDUXcxQ0EzeU/+MrS0AAAAAwA0/8MDYwMSABIAGgAeAAABMxUhFSM1ITUhPgE1ITUhFRQGAzUzESERMxUFNSEVAuR//o9S/pQCXhEF/fICXwVOUv2lUQG4/kgB2UOdnUNOdTNDQTF5/pRz/pUBa3O3dnYAAAIANf+6A2MDEgASACsAAAEzFSEVIzUhNSE+ATUhNSEVFAYBFRQeAhcHLgMnDgMHJz4DPQEC44D+kFL+lAJcEQf99AJcBf8AMFJtPBs0YVJAExRBUmEzHDxtUzAB1UOLi0NReTBDOzF8/rcfJ0M1Iwc/BxwpNyIhNiodBz8HJDVDJh8AAAIANf+3A2IDEQAdACkAAAEhFR4BFRQGIyImNTQ2NzUhNSE+ATUhNSEVFAYHMwM0JiMiBhUUFjMyNgNi/pKBi6WQlqKLg/6UAlsTBv30Al0GEX+0eWpteXltankBjo0GU0tQVlVRS1MGjUJRejNDQTN8Uf6NMDMzMDA0NAABADX/ugNjAw8ALQAAASEVIRUhHgMXBy4DJw4DByc+AzchNSE1ITUhPgE1ITUhFRQGBzMDY/6RAQ7+9QQ0Umo6HjNhU0EUFEBTYDQeOmpSNAT+9QEN/pMCXhAG/fQCXAUQfwGYjkIoRjYkBz8HHy07JCQ7LR8HPwckNkYoQo5DTnYtQzgwe1EAAgAt/7YDFwM2AAcAIgAAATMRIxEjNTMnFw4BBxEjEQ4BIyc+ATc+ATUhNSEVFAYHPgECxVJSy8tGBkOLRVI/cjYMW8ZqEAf+rAGlBREeOgM2/IABCEGuOwoLBP6OAW4CAkMBAwZbgjBDMjCIYQIGAAMALf+4AxgDNwAHACIAKAAAATMRIzUjNTMFNQ4BIyc+ATc+ATUhNSEVFAYHPgE3Fw4BBxUHNSERIzUCxlJSxcX+Vz9wNgtYzmoOB/6yAZ0EDhozGQZCh0O5AmJSAzf9wk0+irsCAkMBAwZDZCVCKyVwSQIEAjoKCgS/aEL+5NoAAwAu/8oDLQM2AAcAIgAoAAABMxEzESM1Iwc1DgEjJz4BNz4BNyE1IRUUBgc+ATcXDgEHFQchFSERMwICw1JSw9dCejYLWMxqDgcB/q4BogUOGjMYBj2AQHkCKf2GUQFOAej9W3xCywMCQwEDCEttJkIiJnxVAgUEOwsOBM++QwERAAAAAwAw/8ADOgM3AAcAIgAuAAABMxEzESM1Iwc1DgEjJzI2Nz4BNyE1IRUUBgc+ATcXDgEHFQMhFSE1ITUhNSEVIQIBxVJSxeU9cjMKWMpqCwgC/rcBmAQOGzUaBUKIRV0CKf2HAgb9+AJZ/fkBrgGJ/gM6OZkDAkEDCDxYIEIYHW9MAwYEOgsNBJ3+wj3OTj3GAAAAAAMALf+/A2EDNwAHACIARgAAATMRMxEjNSMHNQ4BIycyNjc+ATchNSEVFAYHPgE3Fw4BBxUFFRQeAhcHLgEnDgEHLgEnDgEHJz4BPQEzFRQWFz4DPQECAcVSUsXkP3I0C1jNbQwGAf6yAZ0EDBkzGAZCh0MBQxctQSooQFgXFEw/P00UF1g/KFVaTzo9Hy0eDgGZAZ7940E/qgICRAMIP1wjQyojaUUDBgQ8Cw4EryIcIkI6Lg49F1U3NlsaGlk2NlQXPR54RBwcOXEmEzI3ORscAAAABAAw/7cDIAM3AAcAIgAuADoAAAEzETMRIzUjBzUOASMnPgE3PgE1ITUhFRQGBz4BNxcOAQcVFzIWFRQGIyImNTQ2FzI2NTQmIyIGFRQWAgHEUlLE5T9wMwpYzGoOB/6zAZwFDho1GQVCh0WFjp+fjo6hoo1qcHBqanJyAYUBsv3FTEKuAwJCAQMIQ2QmQi0mbUgDBQQ6DA4EshFTTExTUk1MU/8zLS4xMS4tMwAAAAADACr/twMtAzcAAwALACYAAAEzESMDETMRIzUjNTcXDgEHESMRDgEjJzI2Nz4BNSE1IRUUBgc+AQLeT0+pTU2mbwYwZjRPM14nCT+hVQ8I/uMBawUQFScDN/yAAUoCIfzG2EGuOwkMA/6nAVUCAkMDBk93KkMrKoFYAgUABAAs/7gDRAM3AAMACwAmAD8AAAERIxEBMxEzESM1Iwc1DgEjJzI2Nz4BNyE1IRUUBgc+ATcXDgEHFTcVFB4CFwcuAycOAwcnPgM9AQMoT/63ok5Oop00YCgLP6BVDQcB/uwBYQUOFyoUBzBmNNcwUm09HzNeUUAUE0BSYDQdPm1SMAM3/XgCiP5AAa79smNs1QICQwMFQmIjQycjb0sCBQM7CQwD2RIWKUc3JQc/Bx0qOCIhOCsdBz8HJTdHKRYABAAs/7oDaAM4AAMACwAmAEwAAAERIxEBMxEzESM1Iwc1DgEjJzI2Nz4BNyE1IRUUBgc+ATcXDgEHFQUVFB4CFwcuAScOAQcuAScOAQcnPgM9ATMVFB4CFz4BPQEDKE/+t6JOTqKdNF8qCj+gVQ0HAf7sAWEFDhcqFAcwZjQBcxgvQyomRVoXFFM/P1IUGFtDJipELhlODyAvID8/Azj91QIr/lUBmv3sPT2jAgJCAwU/XiJCJSJsSAIFAzkJDASnKBciQTktDT0XVTc2XBgYWzY2VRc9DS45QSEXFxs6NjASJXE3FwAAAAIAMP+2AxsDNwADAB4AAAEzESMDFw4BBxEjEQ4BIyc+ATc+ATchNSEVFAYHPgECyVJSQAdFikVSP3Y5DFvFZxIJAf6rAaUGEyA/Azf8fwHuPQoLBP6bAWICA0UBAwVhjC5CJC2XcAMFAAAAAAIAL/+zAxADNwADACQAAAEzESMlFSERIzUhNTM1DgEjJzI2Nz4BNSE1IRUUBgc+ATcXDgECvlJS/sABklL99HpCeTYMWMlqEAb+tQGbBQ4cOBoGQIEDN/3tdqb+v/9CogQCRAMIS28tQzgtdEsDBwQ8Cw4AAwAz/8oDKwM3AAMAHgAkAAABESMRATUOASMnMjY3PgE3ITUhFRQGBz4BNxcOAQcVByEVIREzAxBS/oVIgjoMWMxtDQcB/q0BpAUOGjIaBjp4PI4CJP2LUQM3/V8Cof2ExQQCRAMIT3UqQiElhl4DBgQ8Cg0Eyq5DAQ8AAAIANv/AAzIDNgADACoAAAERIxEBIRUhNSE1ITUzNQ4BByc+ATc+ATchNSEVFAYHPgE3Fw4BBxUhFSEDEFL+VgIe/ZAB/P4Caj90NgtYx2oLCAH+tQGbBA4bNRoHP4ZCAZX+BAM2/iwB1PzKQOBbP4ACAgFDAQMFQ2YjQiAidlECBQI6CQsDhNcAAAAAAwAw/8IDEAM3AAMAIQAlAAABMxEjJRUhESERMzUOASMnPgE3PgE1ITUhFRQGBzY3Fw4BEzUhFQK+UlL+wQGR/blkQnk2DFjLag4F/rYBmgQLNzMGP4H+/loDN/34ZJf+xgE6kgMCQwEDCEtwLkM8LnJJBQc7Cw/+bre3AAQAMP/CAxADNwADAB0AJQApAAABMxEjBTUOASMnMjY3PgE1ITUhFRQGBz4BNxcGBxUFNTMRIREzFQU1IRUCvlJS/mxAeDYMW8lqDgf+sgGfBA4aNBoGfoUBQlH9sVEBrf5TAzf+BCOZAwJEAwZGZypCNCpuSAIFAzsSBp1oY/6vAVFjrGxsAAADADb/uQNSAzYAAwAhADoAAAERIxEBNQ4BIycyNjc+ATUhNSEVFAYHNzY/ATY3Fw4BBxU3FRQeAhcHLgMnDgMHJz4DPQEDD1P+Zj1xMwtVyWoOB/62AZoEDTQKCQ0JCgdCh0O4L1FrOx8xXFA/FBRAUV4zID1tUjADNv2GAnr9mr4CAkQDCEtyLUM2K3lOBgIBAQIBPQsNBMIzJixLOygJQQkgLjokJDstIAlBCSg7SywmAAADADb/twMVAzYAAwAuADoAAAERIxEBFTYzMh4CFRQOAiMiJjU0NzUOASMnMjY3PgE1ITUhFRQGBz4BNxcOARMyNjU0JiMiBhUUFgMPU/64NT5GcE4qKk5wRo6faD1xMwtVyWoOB/62AZoEDho1GQdChzBnc3NnZ3JyAzb9yAI4/laVCRYqPScnPioWVk9bKagCAkQDB05zLUM2LXdRAwYEPQsN/mg0MDA0NDAwNAAAAAEANv+3A2AC/gAWAAABFSMRIxEjESMRIzUhPgE1ITUhFRQGBwNg1lHhUtACThUH/fwCVQcUAXZD/oQBfP6EAXxDa508REM9nGwAAAACADX/ygNjAwcAFwAdAAABMxUjFSM1IxUjNSE1IT4BPQEhNSEVFAYBFSEVIREC5X7iUJ5Q/vICXhEF/fICXwX99AIp/YYBtkPY2NjYQ1WBNwFDRDeB/tjWQwEZAAIANf/BA2MDFAAeACIAAAEjFTMVIRUhFSE1ITUhNTM1IzUhPgE1ITUhFRQGBzMFNSMVA2Pbdf3sAir9hQIT/ep62gJgDgb99AJdBA57/tPVAbN12WNB311BdUJIaitCOS1xSLd1dQAAAwA0/8MDYwMPABYAGgAeAAABIxUzESERMzUjNSE+ATUhNSEVFAYHMwU1IxUFNSEVA2Pbdf2cdtsCXREG/fICXwUQf/7T1QFL/j0Bkpj+yQE3mENPdzFDQTF6TtuYmPW0tAAAAAIANgA5A2EC2AAPABMAAAE1ITUhFTMVFA4CByc+AQEhFSECo/3qAkEmAQcODVIbCf2TAyv81QJ+F0MBWStca3pJCYnQ/lJEAAIANf+zA2MDDAAOABQAAAEzFSE1IT4BNSE1IRUUBgE1IREjNQLjgPzSAlwRB/30Al0G/ZgCdFIBvUJCWIEzQz00g/6aQ/6+/wAAAAACADT/ywNjAwIADwAVAAABMxUhNSE+AT0BITUhFRQGARUhFSERAuOA/NECXBMG/fMCXgb9/QIj/YwBmkJCXYo7A0NGOor+++VDASgAAgA0/8IDYgMJAA4AFgAAATMVITUhPgE1ITUhFRQGARUhFSERIRUC4oD80gJcEgb99AJdBv33Ahz9kgJnAcJDQ1R6NkNCNn3+q7tCAT9CAAACADX/wQNjAxEADgAaAAABMxUhNSE+ATUhNSEVFAYBFSEVITUhNSE1IRUC5n380gJfDwb99AJdBf30Air9hQIT/eoCaAHpQkJLbi1COS51/jZpQehjQeIAAwA1/7oDYgMPAA4AIwApAAABMxUhNSE+ATUhNSEVFAYBFTI+AjcXDgMrATUzNSM1IRU3NSERIxEC43/80wJcEQf98wJeBv3pMU5COx8JIkBJWDk32NoBKTABHVEB1kNDUXUwQz0zeP43XwIFCQc+CAkFAdpWPtGPQv6LATMAAAAEADX/wANiAw8ADgAiACYAKgAAATMVITUhPgE1ITUhFRQGARUyPgI3Fw4CKwE1MzUjNSEVFxEhEQMVMzUC5H780wJdEQb98wJeBv3oJz01MRoHHjc+JIPO0QEgOgEh25QB2UNDTnUwQz0zdf46ZgEDBgU9BgcD31c9z6QBc/6NATb4+AAFADX/tgNiAw8ADgAWACoANgBCAAABMxUhNSE+ATUhNSEVFAYHFTMVITUzNQUVMj4CNxcOAisBNTM1IzUhFTcyFhUUBiMiJjU0NhcyNjU0JiMiBhUUFgLkfvzTAl0RBv3zAl4GUZb+iJP+gylANzIbCR85PyWGx8oBF9xDVVVDQlRUQiUsLCUkLCwB2UNDTnUwQz0zddVOPT1O8GUBAwYFPQYHA95YPdBAPzk3QEE2OT+2IR0dIiIdHSEAAAMANP/CA2MDBwAOABIAFgAAATMVITUhPgE1ITUhFRQGAREhESUVITUC4oH80QJbEwf98wJeBv2lAmT97AHDAb1CQlV9NkJCNn39sAE//sH9u7sAAAMANP/CA2MDDgAOABYAGgAAATMVITUhPgE1ITUhFRQGAzUzESERMxUFNSEVAuKB/NECXBMG/fMCXgZMUf2lUQG5/kcByUNDVHszQ0E0e/6hdv6NAXN2u3t7AAAAAgA2/7oDXwMIAA4AJQAAATMVITUhPgE1ITUhFRQGBxUUHgIXBy4BJw4DByc+Az0BAt2C/NcCVRQH/fMCXQb/MFNtPR9qoyoUQFFgMyA+bVMwAaZDQ16LN0I/N4z4KS1OPSsJPxJdSyU9LyAJPwkrPU4tKQADADX/uANjAwcADgAeACoAAAEzFSE1IT4BNSE1IRUUBgEyHgIVFA4CIyImNTQ2EzI2NTQmIyIGFRQWAuGC/NICWRQH/fQCXQb+1khzUCsrUHNIkaamkW13d21teHgBt0NDV4E2QkI2g/79Fiw+KSg/KxZXUVFY/vE2MDE2NjEwNgAAAAAEADX/twNjAxEADgAWACIALAAAATMVITUhPgE1ITUhFRQGBRUhFSE1ITUXMhYVFAYjIiY1NDYXMjU0IyIGFRQWAuZ9/NICXw8G/fMCXgX+/wEh/WsBIimFiIiFhoiIhri4W15eAelCQktuLUI5LnXFVj8/VsA/PT8+Pj89P75CQSEgISEAAAAAAwA4/7YDDAM4AAMADgAaAAABMxEjAyE1IRUUBgcnPgEBJzI+AjcXDgMCulJS1f6RAcAHFVEVB/5dCj+QmZpJBEqalo0DOPx+AtNDRD+gbQtpm/5JRQEGDAs+DA8HAwAAAgBB/7YDFQM3AAMADwAAATMRIwEhFA4CByc+ATchAsNSUv2nAaQuZZ5wLLW4Df6vAzf8fwMgYbWhizdDVv6gAAMAQP+1AxUDNwADAA8AFQAAATMRIwEhFA4CByc+ATchEzUhESMRAsNSUv2uAZo7b51jIaXCDP6+TAJYUgM3/fIB1VaSdVcbQS2qdP4BQ/62AQcAAAMARP/KAysDNgADABEAFwAAAREjEQUhFA4CByc+AzchEyEVIREzAxRS/bEBnTxvnmMgUIRgOgb+u64CCv2jUwM2/XUCi0NXl31eHkIZR1prPP1eQwEVAAADAD//wgMqAzcAAwAPABcAAAERIxEFIRQOAgcnPgE3IRMhFSERIRUhAxhS/aYBmjltnWMhqLwM/r28AgL9rAJE/g4DN/4AAgA5VZF1VxtBLahz/UpCAUdDAAAAAAMARP+/AzMDNwADAA8AGwAAAREjEQUhFA4CByc+ATchEyEVITUhNSE1IRUhAxVS/a4BmDptnWMerLYK/sGzAg/9nwHx/g0CRf4PAzf+NgHKLFWMbE0WQiWZbf04QeZcQdoAAAAFAET/wAMVAzcAAwAPACQAKAAsAAABMxEjASEUDgIHJz4BNyETFTI+AjcXDgMrATUzNSM1IRUXESERAxUzNQLCU1P9rgGZOm2cYx+quAv+v4YkOzUyGwcfOT5GKy/Q0gEgNAEb1I0DN/4lAaxUjG1OF0Mlm239m2EBBAYFPwYHAwHdVD/PoQFw/pABMvPzAAAEAD//wwMVAzcAAwARABUAGQAAATMRIwEhFA4CByc+AzchExEhEQEVITUCw1JS/asBnTxvnmIhUoRgOAb+u2MCRP4MAaMDN/4FAcJVknRWGkEVQVRkOf0IAU7+sgENy8sAAAAABABC/8IDFAM3AAMADQAVABkAAAEzESMBIRQGByc+ATchATUzESERMxUFNSEVAsJSUv2uAZrW0x+xtQr+vgJTUf29UQGh/l8DN/4YAbOu2zBBKJ5w/fhx/pkBZ3G0dHQAAwBF/7kDRgM2AAMADwAmAAABESMRBSEUDgIHJz4BNyEBFRQeAhcHLgEnDgMHJz4DPQEDE1L9sAGcO22dYyClvw3+uwGrMFJsPCFnoioUQFFeMyE8bVMxAzb9pwJZRVeWelweQTGzef5tJDBUQi4KQBRlUShCMiQKQAotQlQxJAADAD//uQNlAzgAAwAPADUAAAERIxEBJz4BNyE1IRQOAgUVFB4CFwcuAScOAQcuAScOAQcnPgM9ATMVFBYXPgM9AQMVUv2cIKi/Df67AZw7b54B7hgvQysqQlsXFFM/QlAUGFpAKitDLxhPPj8gMCAQAzj+AQH//ftBK6lzQ1WSdFYtPyRFPDAOPRhZOTdhGhleOTdYGT0PMj1EIT8/PXYlFDQ6Oxs/AAAEAD7/twMYAzYAAwARACUAMQAAAREjEQUhFA4CByc+AzchATIeAhUUDgIjIi4CNTQ+AhMyNjU0JiMiBhUUFgMSUv2vAZw9cJ1gI0+EYTsG/rwBe0VwTyoqT3BFRW9PKipPb0VndXVnZ3R0Azb95QIbQlaUeFocQBdEV2k7/mEXLUEpKEEtGBgtQSgpQS0X/uY5MzM6OjMzOQAAAAADAEL/uQNDAzcAAwAPACkAAAERIxEFIRQOAgcnPgE3IQEHFB4CFwcuAycOAQcnPgM9ASM1IQMTU/2uAZ47b55jH6q7DP67ArH9Lk9pOx4xXE8+EyigYx06aE4u+wJMAzf+BwH5OlaQc1QaQyqlc/4NASVFNycIPgcfLDcgQlcQPggnN0UlAUIABABG/8QDLQM3AAMADwAbAB8AAAERIxEFIRQOAgcnPgE3IQEzFSE1MzUjNSEVIyEVMzUDFFL9sAGfPG+eYiCqvgz+uAI1hv2VhHsCV3v+78ADN/4UAew9VY9wUhhAKqFw/U9CQtJCQtLSAAAAAwAy/7YDewM3AAcAEwAhAAABFSMRIxEzEQEzFA4CByc+ATcjJTMUDgIHJz4DNyMDe4VSUv1Z8xMwUD1AZFcHpQER1w8qTT5CNUUpEwOKAcVE/jUDgf6OARFRn5ePQC5p8olEUauqo0ktPIOLj0gAAAQAOv+0A3IDNgAHABMAHQAjAAABFSMVIxEzFQEnPgE3IzUzFA4CATMUBgcnPgE3IxM1IREjEQNyhVJS/oU7W1EIiNYULkz+p+1gcTRWVwmeVAJHUgJHROICFe/+6TBHpWhDRH1yZgGZhcdNNDqIYP4CQ/67AQIAAAUAOv+1A3IDNwAHABMAHwAlACsAAAEVIxUjETMVASc+ATcjNTMUDgIBMxQOAgcnPgE3IxM3IREjETM1IREjEQNyhVJS/oU7WVMIiNYUL0z+qO0XMk84NVZXCZ43AQEgUXwBGFECVETeAgXj/ucwRaNmQ0R8cGQBlENzY1YnNDmHX/4HQ/6yAQtD/rIBCwAAAAQAOf/KA3IDNwAHABMAHQAjAAABMxUjESMRMwEnPgE3IzUzFA4CATMUBgcnPgE3IxMVIRUhEQLthYVSUv5+N1xTCInXEzBP/qrtXXM1WFcJoLsCBf2oAhpE/tECkP3NNE21bUNGhHpwAbSI21k0Qpto/jTOQwERAAQAOf/CA3IDNwAHABEAHQApAAABMxUjFSMRMwEnPgE3IzUzFAYBMxQOAgcnPgE3IxMVIRUhNSE1ITUhFQLuhIRSUv6DOVVUCYvZW/5w7hozTDM2TFsMn7cCDf2iAer+FAI9AnNEwgHK/jAwPI5hQ4TKAU5Ca1pMIzQwd1j9pWRB411B3AAAAAAGADr/vwNyAzcABwATAB8AMwA3ADsAAAEVIxUjETMVASc+ATcjNTMUDgIBMxQGByc+AzcjExUyPgI3Fw4CKwE1MzUjNSEVFxEhEQMVMzUDcoVSUv6EOVZSCozaFS9M/qXvZ2U2Jj4uHAWghiM6NDEbCB85PSJ9y84BHTcBGNGJAm9DzwHayP7uMD6TYkJCdmhcAXyBsEY0GTU9SS39nmABBAYFPwYHA9xTP8+fAW7+kgEw8vIAAAAABQA6/8IDcgM3AAcAEwAdACEAJQAAARUjFSMRMxUBJz4BNyM1MxQOAgEzFAYHJz4BNyMTESERARUhNQNyhVJS/oU8WlIIidcULkz+p+5gcDVWVwmfaQIz/h0BkgJbROcCB9z+2i9Gp2hDRX1xZgGZhsdONDmKYf0JAUP+vQECwMAAAAAABQA6/8EDcgM2AAcAEwAfACcAKwAAARUjFSMRMxUBJz4BNyM1MxQOAgEzFA4CByc+ATcjATUzESERMxUFNSEVA3KFUlL+hztXUgiJ1xQuS/6m7hcxTzg2VlYKnwJLUf3LUQGT/m0CakTWAebM/tgwRJ9nQ0R6b2MBkEJyYlUmMziEX/36bv6dAWNusnFxAAAABAA7/7sDcgM3AAcAEwAfADgAAAEzFSMRIxEzASc+ATcjNTMUDgIBMxQOAgcnPgE3IwEVFB4CFwcuAycOAwcnPgM9AQLthYVSUv6FPFpSCInXFC5M/qbtFjBOODZVVgmfAbcwU2w8ITJdUD8UFEBRXTIhPG1SMQI9RP7nAlf97zBGqmhCRH5yaAGcQ3NlWSg0Ooth/l8YMFNALApBCSMxQCYmQDEjCUEKLEBTMBgAAAAEAD3/swNyAzcABwATAB8AQwAAATMVIxUjETMBJz4BNyM1MxQOAgUnPgE3IzUzFA4CBRUUHgIXBy4BJw4BBy4BJw4BByc+Az0BMxUUFhc+AT0BAu2FhVJS/oc7WVIIiNcUL0z+xjVWVwmf7RYyTwH9GC5DKylCWxcUUT9CURQYWj8qK0MuGE8+P0A/AltF3gH//f4wRaZoQkR8cWYCNDqJYEJDc2RYeDYjRTwwDzwZWTk5XxsaXTk3WBk8EDM8QyE2Nj10Jip3NjYAAAAFADr/uANyAzcABwATAB0AMQA9AAABMxUjFSMRMwEnPgE3IzUzFA4CATMUBgcnPgE3IwEyHgIVFA4CIyIuAjU0PgITMjY1NCYjIgYVFBYC7YWFUlL+hTtZUgiI1hQuTP6o7WBwNVdVCp4BfkRtTSkpTW1ERG5NKSlNbkRkcXFkZHJyAldE7gIS/gIwRKRoQ0V8cGUBlobHTjQ5imH+ThYrPigoPysWFis/KCg+Kxb+8jYxMDY2MDE2AAAAAAQAOf/CA3IDNgAHABEAHQApAAABMxUjFSMRMwEnPgE3IzUzFAYBMxQOAgcnPgE3IxMVIRUhESEVIRUhFQLthYVSUv6EOVVUCYrYW/5x7RozTDM2TFsMnr4B+v21Ajj+GQHcAmhE0QHj/i0wPI5gQ4TJAU1Ba1pNIzQwd1j9mlg9AWE9UzwAAAADADf/twM6AzgACwAZACcAAAEzESMRIxEjETMRMyUzFA4CByc+AzcjNzMUDgIHJz4DNyMC609PbE5ObP1fyQwjPDBBKTciEQOD6LMJHz00Qy05IA0CbAM4/H8B0/5YA0H+qv5Hk5GMQCczb3V5PUNGoaWiSCU8g4eIQAAABAA2/7YDMAM2AAsAFwAjACkAAAEzESM1IxUjETMVMwEnPgE3IzUzFA4CATMUDgIHJz4BNyMTNSERIxEC4U9Pak5Oav5oQU5BBm26DiQ+/tLLDyY/MD1KRQZ/fgJmUgM2/fHr5QH60v7WKkytaEJBfHRrAZxAb2RbKy8+jF7+BEL+ugEEAAAAAAQAN//KA0sDNgALABkAJQArAAABESMRMxUzETMRIxEFJz4DNyM1MxQOAgEzFA4CByc+ATcjEyEVIREzAndOTmpPT/5rQSc1IxEDbrkNIz3+z80PJUAwPUtEBoHeAiL9jFIB5f7VAm3/AQ79ZwFIzyooU1phNUJDfXZuAaRBcmdeLS5Bk2H9YkMBGgAABAA5/8IDPwM3AAsAGQAnAC8AAAEVIxEzFTM1MxEjNQUnPgM3IzUzFA4CATMUDgIHJz4DNyMTIRUhESEVIQJ3Tk5qT0/+bkImNCERA2y5DSI8/svODyU+Lz0kNCQTA4LRAiX9igJu/eMCEdYB7NPj/f7c2iomTlVdNEJCenBpAZVAbmJYKi8fP0VPL/1JQgE+QwAAAAQAOv/CA1EDNgALABcAJQAxAAABFSMRMxUzNTMRIzUFJz4BNyM1MxQOAgEzFA4CByc+AzcjEyEVITUhNSE1IRUhAndOTmpPT/5nPkpDBm+7DiQ//tTLECU/LzokNCIUBIDnAh79jwH9/gECUv4DAie8Abu8zP4vwswtQpZfQ0ByaGABej1oW1EnMRs4Pkgr/URB4FlA1gAABQA5/8MDMAM3AAsAFwAjACcAKwAAATMRIzUjFSMRMxUzASc+ATcjNTMUDgIBMxQOAgcnPgE3IxMRIREBFSE1AuFPT2pOTmr+bkNMPgZsuQ0iPP7Lzg8lPi89SEQGgpcCUP4AAa8DN/393dcB7dP+4itKqWdCQnpxaQGWQG5iWSowPIhd/QgBRv66AQXDwwAABQA6/8EDLwM2AAsAGQAnAC8AMwAAATMRIzUjFSMRMxUzASc+AzcjNTMUDgIBMxQOAgcnPgM3IwE1MxEhETMVBTUhFQLhTk5qTU1q/nNBJTIgEQNstwwhOv7KzQ8mPy88JDUjFASCApJR/bJRAaz+VAM2/hjNxwHRx/7qKyVMUloyQkF2bWcBi0BtYVcpLh4+RU4v/flr/psBZWu3dnYAAAQAO/+6A2ADNwALABkAJwBAAAABFSMRMxUzNTMRIxEFJz4DNyM1MxQOAgEzFA4CByc+AzcjARUUHgIXBy4DJw4DByc+Az0BAndOTmpPT/5sQic1IxEDb7oNIj3+zswOJD0wPSU0IxIDgQHlM1RuOyEyXlJBFRRBUl8yIDttVDMCDdIB69bn/bgBHvIpKFRbYTZCQn92bwGmQHJnXS0uIURKUzH+YyctUEEtCUAJIzFAJiZAMSMJQAktQVAtJwAAAAQAO/+4A3IDNgALABkAJwBNAAABFSMRMxUzNTMRIzUFJz4DNyM1MxQOAgUnPgM3IzUzFA4CBRUUHgIXBy4BJw4BBy4BJw4BByc+Az0BMxUUFhc+Az0BAndNTWpPT/5tQCY0IREDbbgNIjz++TskNCMTA4LODyU+AhkYLkMqKEJbFxRRP0JQFBlaQCkqRC4ZTz0/IDAfEAIR2QHu0uL9++DYKyVMU1ozQ0F3b2cCLh8+RU4vQ0BtYleFLyNFOzAOPhlZOTlfGhldOTZZGT4PMT1DIS8vPXUkFDQ6OhovAAAABQA6/7cDOgM2AAsAFwAjADcAQwAAARUjETMVMzUzESM1BSc+ATcjNTMUDgIBMxQOAgcnPgE3IwEyHgIVFA4CIyIuAjU0PgITMjY1NCYjIgYVFBYCeE1NaU9P/mtBTEAGbbgNIzz+zs4PJT4vPUhEBoIBv0dwUCoqUHBHR3JPKytPckdnd3dnanZ2AgXSAfPe7v3d8tsrSqdmQkJ5cGgBk0BuYlkqLj6IXf5XFyo+Jyc+KxYWKz4nJz4qF/70NTEwNjYwMTUAAAADADL/tgN7AzcACwAXACUAAAEjFTMVIxEjETMVMyUzFA4CByc+ATcjJTMUDgIHJz4DNyMDe4WFhVJShfzU8xMwUD1AZFcHpQER1w8qTT5CNEUqEwOKAgLIRP7AA4Hwj1GemI5BLmnyiURRq6qjSS08hIuPRwAAAAAEADr/tANwAzYACwAXACEAJwAAASMVMxUjFSMRMxUzASc+ATcjNTMUDgIBMxQGByc+ATcjEzUhESMRA3CDg4NSUoP+AjtaUgiI1hQuTP6n7WBxNFZXCZ5UAkdSAmx5Q48CFYb+gDBGp2dDRH1yZgGZhcdNNDqIYP4CQ/67AQIAAAUAMP+0A24DNgALABUAHwAlACsAAAEjFTMVIxUjETMVMwEnPgE3IzUzFAYBMxQGByc+ATcjEzUhESMRMzUhESMRA256enpRUXr+CENTUAiH2lP+Z/BeazxTVgmdOAErUn0BIVICa4FFfAINhv6DMUegakaJ4wFshsVPNTmHX/4QRP6rARFE/qsBEQAABAA5/8IDbwM3AAsAFQAhAC0AAAEjFTMVIxUjETMVMwEnPgE3IzUzFAYBMxQOAgcnPgE3IxMVIRUhNSE1ITUhFQNvgYGBUlKB/gI5VVQJi9lb/nDuGjNMMzZMWwyftwIN/aIB6v4UAj0Ch2RBdQHKbv6fMDyOYEOEyAFMQWtaTSM0MHdY/aVkQeNdQdwAAAAABQA0/7YDbgM2AAsAFQAhADYAPAAAASMVMxUjFSMRMxUzASc+ATcjNTMUBgEzFA4CByc+ATcjExUyPgI3Fw4DKwE1MzUjNSEVNzUhESMRA256enpRUXr+E0ROUgmJ3Fb+ZvEbM0wxO0xbDJ6OKkhBPyIHJUZKUTE22dsBLSgBHFQCfmxDbgHVdP6oLz2JYUWFxgFLQWtaTCI1MHJY/Z5jAQUHBkAHCAQB4FdB1JFD/oQBOQAAAgAy/7cDFAM3ABUAIQAAATMRIxEjDgEHJz4DNyM1MxQGBzMlMxQOAgcnPgE3IwLCUlKuFUxCQjRFKhMDitcIC6D9jfMTMFA9QGRXB6UDN/yAAd5bp04tO4SLj0dEPX9C/lGemI5BL2nyiAAAAwA4/7cDFAM2ABMAHwAlAAABMxEjNSMOAQcnPgE3IzUzFAYHMyUzFA4CByc+ATcjEzUhESM1AsJSUrQXTTw6WVIIitcICZ/9juwWMk84NVdVCp5rAllSAzb96+g/bDExRqpoQy5VKq1DdGVZKDQ7imH+AEP+vv8ABAA4/7cDFAM3ABMAHwAlACsAAAEzESM1Iw4BByc+ATcjNTMUBgczJTMUDgIHJz4BNyMTNSERIxEzNSERIxECwlJSthdNOjlYUgiL2AkKof2O7BYyTjg2VlcJnlIBJVF+ASBRAzf98+A8ZjAwRqJpQzFYJq9Dc2RXJzM6iGD+BkP+tQEIQ/61AQgAAAADAD7/ygMrAzUAEwAfACUAAAEnPgE3IzUzFAYHMxEzESMRIw4BATMUDgIHJz4BNyMTIRUhETMBbzldUAeJ1woLn1JSsxdN/qjtFTBOOTZZUwifzwIJ/aVSAQkzTLVsQzRhMAEO/W8BQTxtAbBDem1hKzRBmmT9ZEMBDgAAAwA9/70DMAM3ABEAHwArAAABJz4BNyM1MxQHMzUzESM1IwYBMxQOAgcnPgM3IxMhFSE1ITUhNSEVIQFzOlVTCIzZE59SUrYu/nXrGjNMMjYmPS0cBpzMAhH9ngH0/goCSP4LAWkwPY9hQmBF1P4yuGYBTUFqWUwiMxk0PEct/ThB5VtB2QAAAAQAOP/DAxQDNwATAB0AIQAlAAABMxEjNSMOAQcnPgE3IzUzFAYHMyUzFAYHJz4BNyMTESERARUhNQLCUlK1Fkw6O1hRCIrXCAmf/Y3tXnE1VlYJnnwCSf4HAakDN/4D0zxqMTFFpWdDLVQqq4XFTjQ6h2D9CwFN/rMBDMrKAAAABAA7/8IDFAM2ABIAHgAmACoAAAEzESM1Iw4BByc+ATcjNTMUBzMlMxQOAgcnPgE3IwE1MxEhETMVBTUhFQLCUlKyF0o5O1ZQCInXEp39kusXMk44NVZVCpwCcFD9vVEBov5eAzb+H745ZjAxRKFlQltQq0NxYVYnNDiFX/36cP6ZAWdwtXV1AAMAOv+5A0UDNgATACEAOgAAASc+ATcjNTMUBgczETMRIxEjDgEBMxQOAgcnPgM3IwEVFB4CFwcuAycOAwcnPgM9AQFzO1lQCInXCgugUlK2F0v+qesWMk45NSxALBkFnQHIMFJsPCIxXU9AFBQ/UV4yITxtUjEBJjFJpmlCM1stAQD9mwEiOWQBm0J0ZVkoNB4/RlIx/m8jMFRCLwpBCiMyQScnQTMkCkEKL0NVMCMAAwA4/7cDZAM3ABMAHwBFAAABJz4BNyM1MxQGBzM1MxEjNSMOAQUnPgE3IzUzFA4CBRUUHgIXBy4BJw4BBy4BJw4BByc+Az0BMxUUFhc+Az0BAXE6V1EIitcJCqJSUrgXSv7DNVZXCZ7sFzFPAgsYLkMrKUJbFxRSP0JQFBhbPyoqRC4ZTz0/IDAgEAE8MUShZ0MxWSjt/f3UOWMINDmIYENDc2RXdTgiRTwwDj4ZWTk3YBwaXTk3WBk+DzI8QyE4ODx1JhU1OToaOAAABAA4/7cDGQM3ABEAGwAvADsAAAEnPgE3IzUzFAczNTMRIzUjBgEzFAYHJz4BNyMBMh4CFRQOAiMiLgI1ND4CEzI2NTQmIyIGFRQWAW86WVEIitcVo1JSui7+duxfcTRWVwmeAZ5Fbk4qKk5uRUVvTioqTm9FZHV1ZGd0dAE3MUSkaENiV/X93upwAWyFx00zOohh/lYXLD8pKEAtFxctQCgpPywX/uk5MzM4ODMzOQADADr/uQNIAzYAEgAgAD8AAAEnPgE3IzUzFAczNTMRIzUjDgEBMxQOAgcnPgM3IwEhHgMXBy4DJw4DByc+AzchNSE1MxUhAXM6VVEIidYToVJStxdK/qXtFzFONzUrPysZBZ4C2v75AzNRaDcbM15RPxQUQVJgMxs5aVI0A/75AQdUAQcBVTBAmGRCYkjd/f/iNl8BgUJvX1IlNBs5Qk0u/ewfOzEkBz4HHSo1Hx81Kh0HPgYjMT0fPl5eAAMAM/+/Ay0DNgARAB8AKwAAASc+ATcjNTMUBzM1MxEjNSMGATMUDgIHJz4DNyMTIRUhESEVIRUhFSEBcUFNUQiJ3BCoUlK/K/5w6hgxSjI5JjssGwaaxQIh/Y0CYv3wAgX9+wFkMT6NYkRaQcv+K8ZpAUhAalpOJDUZNDxHLf08PwFxPlw8AAADADf/twMyAzcAAwAZACcAAAEzESMDETMRIxEjDgEHJz4DNyM1MxQGByUzFA4CByc+AzcjAuROTqZNTX0QPTZALjgfDAFhqAQI/n/HDCE9MEAqNyIPAoEDN/yAAiABSfzEAbBVo0slPIWKiT9DOXpC9UiVlI9BJDZyeHs/AAAAAAQAPP+2Ay8DNgADABcAJQArAAABMxEjJSc+ATcjNTMUBgczNTMRIzUjDgEBMxQOAgcnPgM3IxM1IREjEQLgT0/+ZUFNQAVoswUIaU5OdxE9/tXKDyU9LjwjNCMTA396AmhSAzb97wgpTK1nQi1SKNL+CeI9cAGXP29jWisuIEBGUDD+AkL+vAECAAAABAA5/9IDRgM2AAMAGQAlACsAAAERIxEBJz4DNyM1MxQGBzM1MxEjESMOAQEzFA4CByc+ATcjEyEVIREzAy5O/mRBKTUiEANnsgYIa05OexE9/tjKDiQ+MD5KQwZ/3QIc/ZJSAzb9ZwKZ/dorKVVcYjVCMV0t8P2NAUE8bwGoQXNnXy0tQpRi/WlDAQ8AAAAABQA7/8MDLwM3AAMAGQAnACsALwAAATMRIyUnPgM3IzUzFAYHMzUzESM1Iw4BATMUDgIHJz4DNyMTESERARUhNQLgT0/+ZD8mNSIRA2iyBgdrTU18ET3+2ckPJD0vPCQ1IhMDf5MCT/4BAa4DN/36AyomT1ZdNEMwVyrX/hfPOWkBlkBvY1orLiA/RlEw/QkBRv66AQXDwwAEADr/vgNeAzYAAwAXACUAPgAAAREjEQEnPgE3IzUzFAYHMzUzESM1Iw4BATMUDgIHJz4DNyMBFRQeAhcHLgMnDgMHJz4DPQEDL0/+ZkFNPgVmsQUIak1NdxE8/tTKDyQ+Lz0lNCMTA38B4DNVbjsgM2BTQRQUQlJgMiA7blQzAzb9qgJW/ekqTrFpQi1VKtz+DdU/cQGeQHFlXCstIUJJUjD+YSEtUEEtCT8JIzJAJydAMiMJPwktQVAtIQAAAAAFADv/twM2AzYAAwAZACcAMwA/AAABESMRASc+AzcjNTMUBgczNTMRIzUjDgEBMxQOAgcnPgM3IwEyFhUUBiMiJjU0NhMyNjU0JiMiBhUUFgMvT/5nQSY0IhEDZ7IFCGpNTXoRPP7YyA8lPS49JDUiEwN9AauUqKiUlKiolG17e21te3sDNv3eAiL99CsnUFZeNEMuVyrb/hDSPGsBmUFvY1krLiA/RlEw/kxUUU9VVU9RVP73NDAwNTUwMDQAAAADAC3/tgMUAzcAFAAgACYAAAEzESMRIw4BByc+AzcjNTMUBzMlMxQOAgcnPgE3IwEzNSMOAQLCUlLcFjsoQzNEKxUDidYGl/2K9BUxUTxAY1oIpgGyxJ4GEwM3/H8BXDZnMC07hIyPRkNHS5JPnpeOQC9n8of+w6wtVAAAAwA+/8oDKwM1ABcAIwApAAABJz4BNyM1MxQGBzM1MxEjNSM1MzUjDgEBMxQOAgcnPgE3IxMhFSERMwFtOltPB4XSAgOWUlKxsZ8SU/6V7BQwTTk3WFMIns8CCf2lUgEJM020bEMaMxmv/WzLQ5RYnQGeQ3ptYSs0QZll/WRDAQwAAAAAAwA9/70DMAM3ABcAIwAvAAABJz4BNyM1MxQGBzM1MxEjNSM1MzUjDgEBMxQGByc+AzcjEyEVITUhNSE1IRUhAXI6VFEJitcCApNSUqionRJV/pXrZGc2Jj0tHAaczAIR/Z4B9P4KAkj+CwFqMTyOYUIWKBSB/jJhQGxOggFifLBFNBgzPEct/ThB5VtB2QAAAwA6/7kDRQM2ABYAIgA7AAABJz4BNyM1MxQHMzUzESM1IzUzNSMOAQEzFA4CByc+ATcjARUUHgIXBy4DJw4DByc+Az0BAXE7WFAIh9QGlVJSrKyfElT+lusWMk45NVhUCp0ByDBSbDwhMl1QPxQUP1FeMiE8bVMwASUwR6ppQjMyqv2Zt0OBVZABjEN0ZVgoNDqLYf5jHDBSQi0KQAkjMUAmJ0AyIwlACi1CVDAcAAADADj/twNkAzcAFwAjAEkAAAEnPgE3IzUzFAYHMzUzESM1IzUzNSMOAQUnPgE3IzUzFA4CBRUUHgIXBy4BJw4BBy4BJw4BByc+Az0BMxUUFhc+Az0BAXA7V1AIhtMCA5dSUquroRJU/rE1VlcJnuwWMk8CCxguQyspQlsXFFI/QlAUGFs/KipELhlPPT8gMCAQATwxQ6JnQxgtF5f9/GpDflWNGTQ5iWBDQ3NkWHQ4I0Q8MA89GFo5N2AcGl05N1kYPQ8yPUMhODg8dSYUNTo7GTgAAAQAOP+3AxkDNwAXACEANQBBAAABJz4BNyM1MxQGBzM1MxEjNSM1MzUjDgEBMxQGByc+ATcjATIeAhUUDgIjIi4CNTQ+AhMyNjU0JiMiBhUUFgFvO1lSCIrXAwKTUlKsrJ4SVf6T7F9xNFZXCZ4BnkVuTioqTm5FRW9OKipOb0VkdXVkZ3R0ATcxRKRoQxkwF5z93olDd1WNAYWFx00zOolg/lYXLD8pKEAtFxctQCgpPywX/uk5MzM4ODMzOQAAAAMAO//CAygDNgAXACMALwAAASc+ATcjNTMUBgczNTMRIzUjNTM1Iw4BATMUDgIHJz4BNyMTIRUhESEVIRUhFSEBZjpYUgiAzQIDnFJSrKylE1b+nuwWMk44NVZTCpzSAgT9qgJF/g0B5v4aAUkwQ59mQhcsFoz+GWRCdFWMAXtCcWJVJjQ4hF79Pz4BYz5UPQAAAAAEADf/twMyAzcAAwAYACYALAAAATMRIwM1MxEjESMOAQcnPgM3IzUzFAclMxQOAgcnPgM3IwEzNSMOAQLkTk6lTU2dETMgQC44HwwBYagD/nbHDCI8MEAqNyIPAoEBaotwBAwDN/yAAove/MQBNTdjLiU8hYmJQENASopIlZOPQiQ1cnh8P/7ToypPAAMANQA5A18C2wAKABcAHwAAASc+ATUjNSEVFAYFJz4BNyM1IRUUDgIXIRUhNSERMwLgUhsK4AEwCf5WUicVAccBFwILGJ8BWvzWAX9RAQ8LgrxBQj1Cw40Ohb48Qh8bT2uI40NDASIABAA3/7oDXwMQAAoAFQAdACMAAAEnPgE3IzUhFRQGBSc+ATcjNSEVFAYXIRUhNSE1MwE1IREjNQLqTxAIAd4BLgb+ZVAYDwLAARALgwFb/NgBfFH+igJsUgHZCU5zKkMnK4dfC1FyJ0MgJo6wQkK1/mZD/tDtAAAABAA2/8oDXgMJAAoAFwAfACUAAAEnPgE3IzUhFRQGBSc+ATcjNSEVFA4CFyEVITUhNTMBFSEVIREC6lARCAHeAS4G/mRQGg8BwAEQAQgRkgFa/NgBfVH+7wIY/ZYBxAlVeStDKi2NYw1VeCpDIhU6Sll7Q0Oz/rPTQwEWAAcAN/+3A18DEgAKABUAHQAlADAARABQAAABJz4BNyM1IRUUBgUnPgE3IzUhFRQGFyEVITUhNTMTFTMVITUzNQUVPgE3Fw4BKwERBTIeAhUUDgIjIi4CNTQ+AhcyNjU0JiMiBhUUFgLqTw8JAd4BLgb+ZVAZDgLAARALgwFb/NgBfFGGof5tov6qKGA2C0h1MCsBzSI5KhgYKjkiIjkqGBgqOSImMTEmJjExAe0IS2omQiQmg1kNS2clQiImg5RCQp7++U49PU5A+QILDkMSCgE9ahEeKxsbKx4QEB4rGxsrHhGwIBscICAcGyAABAA2/8MDXgMQAAoAFQAdACUAAAEnPgE3IzUhFRQGBSc+ATcjNSEVFAYXIRUhNSE1MwEVIRUhESEVAupPEAgB3gEuBv5lUBgPAsEBEQuDAVr82AF9Uf7oAhj9lgJdAd4KTm8oQyYqhF0MTHAmQx8mi6ZDQ6/+YaRDASpDAAQANv/AA18DGgAKABUAHQApAAABJz4BNyM1IRUUBgUnPgE3IzUhFRQGFyEVITUhNTMBFSEVITUhNSE1IRUC61APCQHeAS4G/mVQGA8CwQERC4IBXPzXAXxR/uwCKP2HAgn99QJbAgMJRWQjQiIle1cNRWIjQiEkf4tCQpr9/mJB4VZB1QAAAAAFADb/wgNfAxEACgAVAB0AIQAlAAABJz4BNyM1IRUUBgUnPgE3IzUhFRQGFyEVITUhNTMBESERJRUhNQLpTxEIAd4BLgf+ZlAYDwLBARELgwFb/NcBfVH+lgJg/fEBvwHcCk5zKEInKoZeDU5yJkIfJY2kQ0Oq/XwBNf7L9LKyAAUANv/CA18DEwAKABUAHQAlACkAAAEnPgE3IzUhFRQGBSc+ATcjNSEVFAYXIRUhNSE1MxM1MxEhETMVBTUhFQLpTxEIAd4BLgf+ZlAYDwLAARALgwFb/NcBfVGgUf2sUQGy/k4B4wlObyhCJiqFXQxOcCZCHyWNmkJCof5waP6hAV9otXR0AAAEADf/ugNeAwoACgAVAB0ANAAAASc+ATcjNSEVFAYFJz4BNyM1IRUUBhchFSE1ITUzAxUUHgIXBy4DJw4BByc+Az0BAulPEQgB3gEtBv5mUBgPAsABEAuDAVr82QF8URAwU24+HyxcVEYXKqloHz5uUzEB0QlRcypCJyuJXgxPdChCHyaQpUNDq/7UKy1OPCoJQAcdLT4pSlwSQAkqPE4tKwAAAAUAN/+3A18DEAAKABUAHQAvADsAAAEnPgE3IzUhFRQGBSc+ATcjNSEVFAYXIRUhNSE1MwMyHgIVFA4CIyIuAjU0NhMyNjU0JiMiBhUUFgLpTxEIAd4BLgf+ZlAYDwLAARALgwFb/NgBfFE7SHNRKytRc0hIc1ArpZFtdnZtanh4AdsJTnIqQicqhl8NTnMmQiAljalDQ63+xBYrPikoPisWFis+KFFX/vE3MDE3NzEwNwAAAAQAN/+6A14DEQAKABUAHQA4AAABJz4BNyM1IRUUBgUnPgE3IzUhFRQGFyEVITUhNTMTIR4DFwcuAycOAwcnPgM3ITUhAulPEQgB3gEuB/5mUBgPAsABEAuDAVr82QF8Ufz++wo3T2M2HzNgUkEUFEBTYDMfNmNQNwr++wJpAd4KTnEoQiYqhV4NTnAmQh8ljqFDQ6r+cyZAMiIIPwggLz4lJT0vIAhAByIyQCVCAAAABAA3/7oDXgMVAAoAFQAdADwAAAEnPgE3IzUhFRQGBSc+ATcjNSEVFAYXIRUhNSE1MxMhHgMXBy4DJw4DByc+AzchNSE1MxUhAupPDwkB3gEuBv5lURoOAsABEAuDAVr82QF8UfH/AAQzT2c3HjFdUD8UFD9QXTIeOGZQMwT+/wECVAEBAe4KS2omQiUmhFgMS2klQiIng5JCQpr+ZiM/MiMHPwceKzchITcrHgc/ByMzPyJCWloAAAQANv/CA14DGgAKABUAHQApAAABJz4BNyM1IRUUBgUnPgE3IzUhFRQGFyEVITUhNTMBFSEVIREhFSEVIRUC61APCQHeAS4G/mVQGA8CwQERC4IBW/zYAXxR/ukCGf2VAmT97gH8AgIJRWQkQiIlfFgNRmMjQiElfZRCQpr9+1g+AWU+VTwAAAAEAC7/tgNzAzYABwASAB8ALwAAARUjESMRMxEHJz4BNSM1MxUUBgUnPgE1IzUzFRQOAjcRPgE3Fw4DIycyNjcRA3OHUlLKSxAGo+8G/rVMIA6D0AEJE4Q8dDcERpWRijwJOoRGAb9E/jsDgP6JcgpqlTdDOTmheRBrljhDOB1GVGNH/v4ECQg+DA4HAkQCAwEFAAAABQAv/7sDaQM3AAcAEgAdAC0AMwAAARUjFSMRMxUHJz4BNSM1MxUUBgUnPgE3IzUzFRQGBRcOAyMnMjY3NTMVPgEFNSERIzUDaXtTU9xOEgmX5Qf+zE0WDQF8yQkBUwRFkpCJPAk5gEVLPHP+cgJVUwI5ReoCLf5zCE5wK0MyLYBXCk5zKEMkJ4qUPAsNCAJEAgKtqgMI60L+2+MABQAv/8ADaQM3AAcAEgAdAC0AOQAAATMVIxUjETMDJz4BNSM1MxUUBgUnPgE3IzUzFRQGBRcOAyMnMjY3NTMVPgEBFSEVITUhNSE1IRUC7nt7U1PZThAIl+UG/sxNFA0CfMkJAVcFRpSSij0HOYBFSzx3/soCGP2WAfn+BQJNAl5EygHn/rgKQmIlQi0ndU4KRWMjQiAjf3w6Cw0IAkICApmWAwj+nVw/2FM+zgAAAAAFAC//uQNpAzcABwASAB0ALQBRAAABMxUjFSMRMwMnPgE1IzUzFRQGBSc+ATcjNTMVFAYFFw4DIycyNjc1MxU+ARcVFB4CFwcuAScOAQcuAScOAQcnPgM9ATMVFBYXPgE9AQLue3tTU9tNEQiX5Qb+y00XDAF8yQkBUwVHk5CIPAg5gEVLPHN3Fis/KSg/VRYUUz8/UhUWVD8oKUArFk8+QD9AAkpF5wIZ/pMKTHIqQjItfVkMTnEoQiMnipI6DA4GAkIBAqunAwiWIiFCOi8OPRdVNjZaGhlZNjZTFz0PLzpBISIiOXMkJXI5IgAAAAAGAC//ugNpAzYABwASAB0ALQA5AEUAAAEzFSMVIxEzAyc+ATUjNTMVFAYFJz4BNyM1MxUUBgUXDgMjJzI2NzUzFT4BBzIWFRQGIyImNTQ2FzI2NTQmIyIGFRQWAu57e1NT3E4SCZflB/7MTRcMAXzJCQFTBUeUkIc7CTmARUs8c1qKn5+Kip6eimdwcGdncHACQ0T7AjL+lwpLcCpCMS1+WAxOcChCIyeJjj0MDwcDRAEDq6gECp5STExSUkxMUv0yLS0yMi0tMgAAAAAEACz/twMvAzgACwAWACEAMQAAATMRIxEjESMRMxEzBSc+ATUjNTMVFAYFJz4BNyM1MxUUBhcVPgE3Fw4DIycyNjc1AuBPT2BNTWD+/EcOBYbOBf7lSBgMAWy0CWEzYC0FOn9+dS8LLnA9Azj8fwHI/mQDQf6eXgtbizdDQzmRXwxhjDBDKjCgGOcCCAc7Cw0GAkMBAusAAAUALv+2Ay4DNwALABYAIQAxADcAAAEzESM1IxUjETMVMwUnPgE1IzUzFRQGBSc+ATcjNTMVFAYFFw4DIycyNjc1MxU+AQU1IREjNQLgTk5dTU1d/vxFDQaK0AX+6UUUDQJusggBHQY4fn11MAswcDxGMV/+6wJjUgM3/dfw6wIS5G8GS20qQjEte1MQSWwlQh8miZs7CQwGA0MCArGuAwfrQ/7Q7QAAAAUALv+rA24DNwALABYAIQAxAFkAAAEVIxEzFTM1MxEjNQUnPgE1IzUzFRQGBSc+ATcjNTMVFAYFFw4DIycyNjc1MxU+ARcVFB4CFwcuAScOAQcuAScOAQcnPgM9ATMVFB4CFz4DPQECg01NXU5O/vxFDQaK0AX+6UUUDQJusggBHQY4fn11MAswcDxGMV/cGC1DKihCWRcUUUI/UhQXWkApK0IuGE8QHy8fIDAgEAH+5wIO5Pb91fIsBkttKkIxLXtTEElsJUIfJomaOwkMBgNDAgKwrQMHpCEjQzotDT4XVTc3WhkZWjY2VRc+Di46QiIhIRw7NzESEjE4OhwhAAAGAC7/twM0AzcACwAWACEAMQA9AEkAAAEVIxEzFTM1MxEjNQUnPgE1IzUzFRQGBSc+ATcjNTMVFAYFFw4DIycyNjc1MxU+ARcyFhUUBiMiJjU0NhMyNjU0JiMiBhUUFgKDTU1dTk7+/EUNBorQBf7pRRQNAm6yCAEeBTl/fXQvCzBvPUYxXh+RpaWRkaWlkW11dW1tdXUB/doCAuX3/c74KgZLbSpCMS17UhBJayVCHyWJlzwLDQgCRAICsKwDCJZUT05UVE5PVP76MzAwNDQwMDMAAAQAN/+2AxIDNgADAA4AGwArAAABMxEjAyc+ATUjNTMVFAYFJz4BNSM1MxUUDgI3ET4BNxcOAyMnMjY3EQLAUlKISxEGqPMG/q5NHQ6F0QEIEYo/ezwFS5qXj0AKPYlIAzb8gAGUC2qXN0M6OaN3DmyaNkMwG0ZXaEj++gQKCD0MDggCRAEDAQkAAAAABQA4/8oDMAM2AAMADgAZACkALwAAAREjEQMnPgE1IzUzFRQGBSc+ATcjNTMVFAYFFw4DIycyNjc1MxU+AQEhFSERMwMVUodMEQmr9wb+tEsXDgGDzgoBZAVJmZaQQQg/hkhMP3j+0QIX/ZdSAzb9ZwKZ/oAJTm8rQzItgFcLTnIoQyQqipU9Cw4IA0QCA7GuAwr+mEMBAgAFADT/wAM0AzcAAwAOABkAKQA1AAABESMRAyc+ATUjNTMVFAYFJz4BNyM1MxUUBgUXDgMjJzI2NzUzFT4BASEVITUhNSE1IRUhAxVSh0sQCKr1Bv64TBUMAoPOCQFkBkual48/Cz2KSEw/ef7HAib9iQIG/fcCW/35Azf+FgHq/rgKQmMmQi0odFALRWMkQiEjgHw6DA4IAkICAp+cBAn+QkDUUz7NAAAGADj/wgMVAzYAAwAOABkAKQAtADEAAAEzESMvAT4BNSM1MxUUBgUnPgE3IzUzFRQGBRcOAyMnMjY3NTMVPgEBESERJRUhNQLDUlKISxEJq/cH/rdLFg0Bg84JAWUESZmXkUAIP4ZITD96/n0CTv4DAawDNv3oswlIaSpCLyt7UgtJayZCIiWFjTwLDggDQwMCq6cCCv4sAS3+0+upqQAABgA4/8IDFQM2AAMADgAZACkAMQA1AAABMxEjLwE+ATUjNTMVFAYFJz4BNyM1MxUUBgUXDgMjJzI2NzUzFT4BFzUzESERMxUFNSEVAsNSUohLEQmr9wf+t0sWDQGDzgkBZQRJmZiRQAc9iEhMP3p5Uv2uUgGu/lIDNv3+owlIaSpCLyt7UgtJayZCIiWFhjwLDgkDRAIDp6QDCvJk/q0BU2Stbm4AAAAABgA4/7cDGQM2AAMADgAZACkANQBBAAABESMRAyc+ATUjNTMVFAYFJz4BNyM1MxUUBgUXDgMjJzI2NzUzFT4BBzIWFRQGIyImNTQ2EzI2NTQmIyIGFRQWAxVSiEsRCav3B/63SxYNAYPOCQFlBEiamJFABz2ISEw/el2MoKCMjp+fjmdzc2dndHQDNv3VAiv+mApJaihCMCp7UgpLaiZCIiWFjT0MDwcDRAIDq6gDC5ZVTk5WVk5OVf75NDAwNDQwMDQAAAMANQA4A18C2wAKABkAJQAAASc+ATUjNSEVFAYFJz4DNSM1IRUUDgIFMxUhNSERMxEzETMC41EaCvoBSwr+LU8WGg0EtAEEAgwbASX3/NYBI1BxTwENC4O7QkM9QsOJFkBtXEseQyofUGZ+4kREARX+6wEVAAAAAAEANP+2A18C+QAdAAABFSERIxEhNTM+ATcjNSEVFAYHIT4BNyM1IRUUBgcDX/6UUv6T5xwQAdIBIgoeASEWCwHZASoIGQGDQ/52AYpDapYzQx4qroBqljNDKDCleQAAAAEANf+4A2MDDgAjAAABIRUhESM1ITUhNSE1Mz4BNyM1IRUUBgchPgE3IzUhFRQGBzMDY/6QAQVS/esBEP6U+BYOAs8BHwkcARMUCwHLARsIF4EBiqD+zvBCoENYfCtCGiaUbVh8K0IjKo1nAAIANP/KA2IDAAAdACMAAAEzFSEVIzUhNTM+ATcjNSEVFAYHIT4BNyM1IRUUBgEVIRUhEQLhgf6aUf6J9xcPAtABIAocARIVDAHLARsI/foCFf2ZAaxD2dlDXoYtQxsnn3Nehi1DJC2W/svXQwEaAAABADX/wANjAxcAKQAAASEVIRUhFSEVITUhNSE1ITUhNTM+ATcjNSEVFAYHIT4BNyM1IRUUBgczA2P+kAEH/fACLP2CAhH97QEL/pT8FAwCzwEfCBcBDxILAcsBGwcVfgG1buBmQeVhQW5DSW4mQh8jgltJbiZCISR/WwAABQAz/7cDYQMWAB0AJQA6AEoAVgAAATMVIRUjNSE1Mz4BNyM1IRUUBgchPgE3IzUhFRQGBxUzFSE1MzUFFTI+AjcXDgMrATUzNSM1IRU3MhYVFA4CIyIuAjU0NhcyNjU0JiMiBhUUFgLlfP6PUv6V/RUMAtABIAgYARESCgHLARsHVJX+iJP+gCpDODQbCR86QU0yMs7QAR7aQlUXKDchITcoF1VCJSwsJSQsLAH0QoODQktvJkIfJIRbS28mQiEkgv5SPT1S810BAwYFPQYHAwHXVD3MRT83GyweEREeLBs3P7MgHR0gIB0dIAACADT/wwNjAwwAIQAlAAABIRUhESERITUhNTM+ATcjNSEVFAYHIT4BNyM1IRUUBgczAzUhFQNj/pABB/2gAQf+k/sWDQLRASAIGQESEgoBywEbBxV+uf5BAZWX/sUBO5dCUXgqQholj2dSdypCIyqHYf4ut7cAAAADADT/wgNjAxEAHQAlACkAAAEzFSEVIzUhNTM+ATcjNSEVFAYHIT4BNyM1IRUUBgM1MxEhETMVBTUhFQLmff6PUv6U+xUOAtEBIAgZARIRCwHLARsHVFL9pFIBuP5IAeJEo6NET3YoQhkjjGdPdCpCISeG/ndy/pYBanK2dnYAAAIANf+5A2IDCgAdADYAAAEzFSEVIzUhNTM+ATcjNSEVFAYHIT4BNyM1IRUUBgEVFB4CFwcuAycOAwcnPgM9AQLjf/6QUf6U+RYOAtABHwkaARIUCgHLARsH/vowU249HjRgU0AUE0FTYTQdPW5TMQHNQoqKQlV8KkIaJpNqVXsrQiMqjP6rICZBMyIHQAcbKTUhIDYpHAZAByMzQSUgAAACADX/uwNjAwgAKgA2AAABIRUeARUUBiMiLgI1NDY3NSE1Mz4BNyM1IRUUBgchPgE3IzUhFRQGBzMDNCYjIgYVFBYzMjYDY/6QgIulj0hzUCuLgv6U+hUOAtABHwkZAREUCgHLARsHFn+3eGptdnZtangBjIAHVktRWBYsPyhLVgeAQlV5KkIaJZRnVXkqQiMqiWT+ljE3NzEzNTUAAAAAAQA1/7wDYgMMADgAAAEhFSEVIR4DFwcuAycOAwcnPgM3ITUhNSE1Mz4BNyM1IRUUBgchPgE3IzUhFRQGBzMDYv6SAQz++wk2T2Q3ITNfUUAUFEBSYDMgN2RQNgn++gEM/pL7FA4C0AEfCBkBERMKAcoBGgcVfQGSjUInQjQjCD8IIC8+JSU9LyAIQAgjM0EnQo1CVXcqQholkmdVdypCIyqHZAACACj/tgMXAzYABwAvAAABMxEjESM1MycXDgEHESMRDgEjJzI2Nz4BNSM1MxUUBgc+ATc+ATUjNTMVFAYHPgECxVJSzs4+BUKFQ1JDfzoMKFQtGAuT4QcXLlswFQmM2gYUFysDNvyAAQZBrj4JCwX+hwF2AgNFAQFehzBDMTCPZwIDA1uAMUM3MIdbAgUAAAADAC7/vgM1AzcABwAtADMAAAEzETMRIzUjBzUGIyczMjc+ATUjNTMVFAYHPgE3PgE1IzUzFRQGBz4BNxcGBxUHIRUhETMCAsxPT8zidnAMgBUWFAuS4AcVMF8wDweQ4AUPESERBYWKcgIz/XlUAUEB9v1Se0rEA0cBUXMrRS4tgFgBAwNLcC1ENCp4UQECAj8PBse4RAENAAMAMP/AAzQDNwAHAC8AOwAAATMRMxEjNSMHNQ4BIycyNjc+ATcjNTMVFAYHPgE3PgE3IzUzFRQGBz4BNxcOAQcVAyEVITUhNSE1IRUhAgDBUlLB5DxyMwsnUi0QCgKJ2AYTK1UtDgoBhdMFEBQoFAZCiEVgAib9iAIG/fgCWf37AbABh/4KNDOUAgNCAQE9WiBCIB5uSwEEAjlWH0IiH2ZDAgMCOgkLBJf+vD7RUT3JAAAAAAMAMP+5A2kDNwAHAC8AVwAAATMRMxEjNSMHNQ4BIycyNjc+ATcjNTMVFAYHPgE3PgE3IzUzFRQGBz4BNxcOAQcVBRUUHgIXBy4BJw4BBy4BJw4BByc+Az0BMxUUHgIXPgM9AQIBwVJSweU9cTMLJlEtEgsBidgHFC1TLRAJAYTTBhEVKRQGQ4dFAUYYL0MrKEJcFxRUQD9RFBdbQikrRC4ZTw8fLx8gMCAPAYsBrP3VQjuiAwJCAQFFYyRCISN4UQIEBD9fI0IkIm1JAwQDOgwNBaUhGCNEOy4NPRdWOTdcGhlaOTdXFz0OLztDIhgYHDw4MRISMjg7HBgAAAQAMP+3AxgDNgAHAC4AOgBGAAABMxEzESM1Iwc1DgEjJzI2Nz4BNyM1MxUUBgc2Nz4BNyM1MxUUBgc+ATcXDgEHFRcyFhUUBiMiJjU0NhcyNjU0JiMiBhUUFgIAwVJSweQ9cTMLJlIrEwsBidgHFVVYEQoBhdMGEhUpFAZCh0V7kp2dko6fn45qcnJqZ3NzAYcBr/3HTEOuAgNCAQFFZyRCISN7UgMGQmEjQiQib0sCBAM6Cw0FsRJQTk5RUU5MUv4yLi0zMy0uMgAAAAMAIv+2Ay0DNwADAAsAMwAAATMRIwMRMxEjNSM1NxcOAQcRIxEOASMnMzI3PgE3IzUzFRQGBz4BNz4BNSM1MxUUBgc+AQLeT0+nTU2kegczazZONmUrClcPEBcKAXC5BxcjSSMUCW22BhMUJgM3/H8BUQIb/MXfQag6CQsF/qIBWQMCQwFYei1DLCuKXgIDAlJ2LUMyK4BVAgUAAAQAK/+4AygDNgADAAsAMwA5AAABMxEjJTMRMxEjNSMHNQ4BIyczMjc+ATcjNTMVFAYHPgE3PgE1IzUzFRQGBz4BNxcOAQcVBzUhESM1AtpOTv7BnU1NnZ85ZSoJWhAREQkBbrQGEiVLJQ8HcLYEDhEgDwYwZjSaAnhSAzb9yoMBpP3bRUKpAwFBAUJiI0IjInROAQQDPFwlQjImYj8CBAI5CgsErW5C/t/fAAAEACv/ygNEAzYAAwALADMAOQAAAREjEQEzETMRIzUjBzUOASMnMzI3PgE3IzUzFRQGBz4BNz4BNSM1MxUUBgc+ATcXDgEHFQchFSERMwMoTv7BnU1NnZ45ZSsJWQ8REQsBbrQGFCRLJhAIb7UFDxEhEAYwZjM4AjH9fVIDNv1ZAqf+IwHO/Xt6K6ICAkIBSGkmQh4jflgBBAJFYyZCLiZtSAIEAjkKCwSn5EMBAgAAAAQAK//AA0QDNgADAAsAMwA/AAABESMRATMRMxEjNSMHNQ4BIyczMjc+ATcjNTMVFAYHPgE3PgE1IzUzFRQGBz4BNxcOAQcVAyEVITUhNSE1IRUhAyhO/sGdTU2dnzllKglbEBEPCgFutAYRJUslDgdwtgQOESAPBjBmNDcCMf1+Ahb96AJo/esDNv4GAfr+fAF1/hwzOpcDAkIBOVYgQiAea0YBBAI2UCBCLiBbOQIDAjgJCgSc/sI+0E49xwAAAAUAK//CAygDNwADAAsAMwA3ADsAAAEzESMlMxEzESM1Iwc1DgEjJzMyNz4BNyM1MxUUBgc+ATc+ATUjNTMVFAYHPgE3Fw4BBxUDESERJRUhNQLaTk7+wZ1NTZ2fOWUqCVoPEREKAW60BhIlSyUOCHC3BA4RHw8GMGY0jQJr/eYBygM3/dV7AaD97TY8pQICQgFCYyNCIiN2TgEDAz9eI0IuJWZCAgMCOAoLBKn+tAEm/trlo6MAAAAFACv/wgMoAzYAAwALADMAOwA/AAABMxEjJTMRMxEjNSMHNQ4BIyczMjc+ATcjNTMVFAYHPgE3PgE1IzUzFRQGBz4BNxcOAQcVBTUzESERMxUFNSEVAtpOTv7BnU1NnZ45ZioJWhAREAoBbrQGESVKJQ8HcLcEDhAgDwYwZjQBjVH9llEByP44Azb963oBi/3+Oj2aAgJCAUBgI0MjIXRMAQMDPFokQzMmYD0CAwI5CQsEn3xZ/sQBPFmhYmIAAAAEACv/twNrAzcAAwALADMAVwAAAREjEQEzETMRIzUjBzUOASMnMzI3PgE3IzUzFRQGBz4BNz4BNSM1MxUUBgc+ATcXDgEHFQUVFB4CFwcuAScOAQcuAScOAQcnPgM9ATMVFBYXPgE9AQMoTv7BnU1NnZ85ZSoJWg8REQoBbrQGEiVLJQ4IcLcEDhEfDwYwZjQBbBgvQysnRVoXFFM/QFIUF1xCKCtELxlPPT82RwM3/dUCK/5QAaD97Dc9pgICQgFCYyNCIiN2TgEDAz9eI0IuJWZCAgMCOAoLBKogGiJCOS0NPhdUOTdcGBhbNzZWFz4NLjlCIRoaOXIkIWxCGgAAAgAt/7YDGgM3AAMAKgAAATMRIwMXDgEHESMRBiMnMjY3PgE1IzUzFRQGBz4BNz4BNSM1MxUUBgc+AQLIUlI8BkCEQlGIewsoVi0ZC5TjCBguXC4XCYzcBxUWKgM3/H8B8D0KCwT+lAFpBkUBAWGKMUMxMZVnAgMDXYMzQzcziF4CBQAAAwAz/8oDMgM2AAMAKwAxAAABESMRATUOASMnMzI3PgE3IzUzFRQGBz4BNz4BNSM1MxUUBgc+ATcXDgEHFQchFSERMwMXUv55RYE5DHwVFxYLAYzaBxctVy0UCovaBxMWKxUGP4A/kgI1/XpRAzb9YAKg/Ym2AwJDAVV5K0ImKopeAgQDUXIqQiwqfFUCBQM7Cw0Fu7JDARYAAAAAAgA0/8IDOwM2AAMANwAAAREjEQEhFSE1ITUhNTM1DgEjJzMyNz4BNyM1MxUUBgc+ATc+ATcjNTMVFAYHPgE3Fw4BBxUhFSEDF1L+TAIq/YUCBf34e0J9OQx/FRcRCwGM3AYULVQtEQkBiNcFERUoFAU/gUABjf36Azb+LwHR/Ms/41o/dgICQgFFZSRDIyN5UQEEAkJgJEMmI29LAgMCOQkLBHnWAAAAAwA0/8UDFwM3AAMALwAzAAABMxEjJRUhESERMzUOASMnMzI3PgE3IzUzFRQGBz4BNz4BNyM1MxUUBgc+ATcXDgETNSEVAsVSUv7FAY39qHlDfDkMfhUXFAoBjNsHFC1WLREJAYvaBhEWKhQFP4L6/koDN/3pdp7+zQEzmgQCRAFMcChCJSaBWAIEBEhqJkIrJnROAgUDOwsN/mywsAAAAAQANP/CAxcDNwADACsAMwA3AAABMxEjBTUOASMnMzI3PgE3IzUzFRQGBz4BNz4BNyM1MxUUBgc+ATcXDgEHFQU1MxEhETMVBTUhFQLFUlL+eUV/Ogx+FRcTCwGM2wcULVUtEgkBi9oGERYqFAU/fz8BNlH9oFEBvv5CAzf+BzmZAgJEAUltJ0MlJn5VAQMDRmgmQyomdUwCAwI8CAsEnVdq/qoBVmqqamoAAAABADT/tgNfAvkAIQAAARUjESMRIxEjESM1Mz4BNyM1IRUUBgchPgE3IzUhFRQGBwNfz1PnUtDnHBAB0gEiCh4BIRYLAdoBKwgZAYZE/nQBjP50AYxEZ5gxQx4rq39nljNDKDCjeAAAAAIALf++A1oDEwApAC0AAAEjFTMVIRUhFSE1ITUhNTM1IzUzPgE3IzUhFRQGByE+ATcjNSEVFAYHMwU1IxUDWtl3/ewCK/2CAhP96nvc+BEKAcoBHwYTARENCAHLASEFEHX+09EBqHXSYEPgU0J1QkxyKEMhI4deS3QnQxokh2S3dXUAAAIALv+4A1kDEwAhAEcAAAEzFSMVIzUjFSM1IzUzPgE1IzUhFRQGByE+ATUjNSEVFAYDFRQeAhcHLgEnDgEHLgEnDgEHJz4DPQEzFRQWFz4DPQEC6HHYUtZS2fgVCsgBHQcVARMQCckBHwZuGC9DKihCXBcUTzw/TxQZXD8nKkMwGU86PB4tHw8ByUKOjo6OQlh/MEMxLYthW38tQyktjf6jFx46MykMOxRMMzFUFxdRMzBOFDoNKjQ6HBcXM2QfESwxMhYXAAAAAwA0ADwDXwLTAAwAGQAdAAABIzUhFRQOAgcnPgEBJz4BNSM1IRUUDgIFIRUhArPYASgBCBAPUR4L/qtSKBbWAScCCxn+vwMr/NUCkENEJFdqfksKjs7+mQ2S0j9DIx1Vc5G6RAAAAAACADX/uANjAwgAGQAfAAABMxUhNTM+ATcjNSEVFAYHIT4BNyM1IRUUBgE1IREjEQLfhPzS9xcOAtIBIgkcAQ8VCwHOAR4I/ZYCcVIBvUNDW4EtQhsmmnBbgS1CJC2Q/phC/rcBBwAAAAIANP/QA2MC/AAZAB8AAAEzFSE1Mz4BNyM1IRUUBgchPgE3IzUhFRQGARUhFSERAt2G/NHzGhAC0wEjCh4BEBYNAc8BHgj9+gIh/Y0Bl0NDZI8wQhYqpn9hkTBDHSuk/uXiQwElAAAABQA1/7YDYgMNABkAIQAsADgARAAAATMVITUzPgE3IzUhFRQGByE+ATcjNSEVFAYHFTMVITUzNQURPgE3Fw4BKwERBTIWFRQGIyImNTQ2FzI2NTQmIyIGFRQWAuGB/NP6Fg0B0gEiCBkBDhQKAc8BHgdsoP5spP6pJ2E2Ckh0MCsBzkVYWEVFWFhFJzAwJyYwMAHOQ0NYeitCISeQZ1V7LUIlLYnWTj09TkT++QILDkITCgFLbkE5OUFBOTlBuiMdHiIiHh0jAAACADX/wwNjAxUAGQAlAAABMxUhNTM+ATcjNSEVFAYHIT4BNyM1IRUUBgEVIRUhNSE1ITUhFQLgg/zS+RQNAtMBIwgYAQwTCwHPAR8H/fUCLP2CAhH97QJkAe5DQ0xxJ0MgJIVeTHEnQyEmgv4kbEHqYEHeAAQANf/CA2MDEQAZAC0AMQA1AAABMxUhNTM+ATcjNSEVFAYHIT4BNyM1IRUUBgEVMj4CNxcOAisBNTM1IzUhFRcRIREDFTM1At+E/NL3Fw4B0wEjCRsBDhUMAdEBIAf94yc+NjIaBx43PiSD0NMBIDoBIduUAdNCQlV8KkMhJpBnVXwqQyIqi/4sZgEDBgU9BgcD4FU+z6QBc/6NATX39wAFADT/twNiAxQAGQAhADYARABQAAABMxUhNTM+ATcjNSEVFAYHIT4BNyM1IRUUBgcVMxUhNTM1BRUyPgI3Fw4DKwE1MzUjNSEVNzIWFRQGIyImNTQ+AhcyNjU0JiMiBhUUFgLigPzS/BcOAdUBJAkZAQ0UCwHPAR4HUpX+iJP+gCpDODQbCR86QU0yMs7QAR7aQlZWQkFWFyg3ISYsLCYkLS0B3ENDVXcqQiAmjmRVdypCISqJ2FY9PVb/ZwEDBgU+BgcDAeJdPtZHQzk6Q0M6HS0hEb8kHx8jIx8fJAAAAAMANP/FA2MDDwAZAB0AIQAAATMVITUzPgE3IzUhFRQGByE+ATcjNSEVFAYBESERARUhNQLgg/zR+BcOAtMBIwkbAQ8UCwHPAR8I/aMCZP3sAcMByENDWH8tQxsnmG1Yfy1DJC2P/ZYBQf6/AQC+vgADADT/wgNjAxQAGQAhACUAAAEzFSE1Mz4BNyM1IRUUBgchPgE3IzUhFRQGAzUzESERMxUFNSEVAuGC/NH6Fg0C0wEjCRoBDxQKAc4BHgdQUv2lUQG4/kgB10JCVXsqQxwmkWpVeitDJSqK/ot6/oIBfnrBgIAAAAACADX/uQNjAwoAGQAyAAABMxUhNTM+ATcjNSEVFAYHIT4BNyM1IRUUBgEVFB4CFwcuAycOAwcnPgM9AQLfhPzS9BgQAdEBIgodAREUDQHOAR0H/v0wU24+HzRgUUAUFUFRXzQfPm5TMAGwQkJejC5CFSeifF6MLkIdKp3+6SstTj0qCUAJIC48JSU8LiAJQAkqPU4tKwAAAAMANf+2A2MDCgAZAC0AOQAAATMVITUzPgE3IzUhFRQGByE+ATcjNSEVFAYBMh4CFRQOAiMiLgI1ND4CEzI2NTQmIyIGFRQWAt+E/NL2Fw8C0gEiChwBEBULAc4BHgj+00hzUSsrUXNIR3NRKytRc0dqeXlqanl5AbtDQ1uELUMcJp1wW4QtQyUtk/7wGC1BKSlCLRgYLUIpKUEtGP7kOTQzOjozNDkAAAIANP/CA2MDFAAZACUAAAEzFSE1Mz4BNyM1IRUUBgchPgE3IzUhFRQGARUhFSERIRUhFSEVAuCD/NH5Fg4C0wEjCRoBDhQLAc4BHgf99QIa/ZQCZf3tAf0B3UJCUnkqQhkjlGdSeSpCJiqG/iViPwF6Pl49AAAAAAMANf+2AxUDNwADAA8AHQAAATMRIwEzFA4CByc+ATcjJTMUDgIHJz4DNyMCwlNT/ZP1FTJRPEFjWwimARLcECtMPEQzRCsVA48DN/x/AyBQnpiOQDBn8YhEUKuqo0ktPISLj0YAAAAABAA//7cDFAM2AAMADwAbACEAAAEzESMlJz4BNyM1MxQOAgEzFAYHJz4DNyMTNSERIzUCwlJS/sI6Vk4IkN4TLEr+nO1ecDcsQCwZBZ5kAllSAzb96xIwRqNoQ0R8cGYBloXGTjQePkVQMf4CQ/6+/wAAAAAEAEP/ygMuAzUAAwAPABsAIQAAAREjEQEnPgE3IzUzFA4CATMUDgIHJz4BNyMTIRUhETMDFFL+vztbUQaR3xEtTP6a7hQwTTk3WFMIoMYCEv2cUgM1/XYCiv3TM0u0bUNGgnlvAbBDem1hKzNCmGb9ZkMBEQAAAAAEAD7/wgM4AzcAAwAPABsAJwAAAREjEQEnPgE3IzUzFA4CATMUDgIHJz4BNyMTIRUhNSE1ITUhFSEDFFL+vDpVUwiP3hQvS/6f7xs0TTM2TlsMn8sCGf2XAfX+CAJI/gsDN/42Acr+MDA8jmFDQnRmWgF2QmtaTSM1MHVa/UFB411B2wAFAD//wgMUAzcAAwAPABkAHQAhAAABMxEjJSc+ATcjNTMUDgIBMxQGByc+ATcjExEhEQEVITUCwlJS/r87V1IIkt8ULUv+nu1ecTVWVgmedQJJ/gcBqAM3/fkJL0ajaENEe3BmAZWEyU00Oolg/QkBQ/69AQLAwAAFAEL/wQMUAzYAAwAPABsAIwAnAAABMxEjBSc+ATcjNTMUDgIBMxQOAgcnPgE3IwE1MxEhETMVBTUhFQLCUlL+wTxYUAiO3RQtS/6f7RcyTzg0VVgJnwJqUf27UQGj/l0DNv4dETFEoWdCRHtvZAGSQ3JjVic1OIZg/fhv/psBZW+zcnIAAAAABABA/7cDUAM2AAMADwAbADQAAAERIxEBJz4BNyM1MxQOAgEzFA4CByc+ATcjARUUHgIXBy4DJw4DByc+Az0BAxNS/sE6V08Ij90TLUv+n+wXMU84NVZWCp4ByzBTbT0gM19RQBQTQVJgMiA8blIxAzb9oAJg/fEwRqloQkV8cmcBmkNzZVgoMzyJYf5eHy9RPywKQQkiMkAmJkAyIglBCiw/US8fAAAABQBB/7UDGwM3AAMADwAZAC0AOQAAAREjEQEnPgE3IzUzFA4CATMUBgcnPgE3IwEyHgIVFA4CIyIuAjU0PgITMjY1NCYjIgYVFBYDFFL+wTxYUQiQ3RMtSv6d7WBwNFZXCZ8BkkdwUCoqUHBHR3JPKytPckdneHhnand3Azf96QIX/gEwRqJpQ0R8cGYBlobGTjQ6iWD+UBcsPygoPywXFyw/KCg/LBf+7TYzMzY2MzM2AAAAAgBZ/7YDdwM3AAcAEgAAARUjESMRMxEBETI2NxcOASsBEQN3kFJS/cNhyW0Kc9FnRwHRRP4pA4H+mgEP/f4SFkQXEgJHAAAAAwBh/7UDcgM3AAcAEgAYAAABFSMVIxEzFQcXDgErAREzET4BATUhESMRA3KFUlKtCnPJZ0ZRYcD+1wJDUgJZROECA956QxcRAY/+tgEQ/vVC/rQBCgAAAAQAYf+2A3IDNwAHABIAGAAeAAABFSMVIxEzFQcXDgErAREzET4BATUhESMRMzUhESMRA3KFUlKwC3PKZEZRXsD+xgEXUn0BFVECX0TaAfbYckQXEQGD/sIBEP73Qv6mARhC/qYBGAAAAwBh/8oDcgM2AAcAEgAYAAABMxUjESMRMwMXDgErAREzET4BBxUhFSERAu2FhVJSrAlzyWdGUWHBwAH5/bUCLEX+xwKI/oZEFxEBpf6gARC54EMBIwAAAAMAYf/DA3IDNwAHABIAGgAAATMVIxUjETMDFw4BKwERMxE+AQMVIRUhESEVAu2FhVJSrwtzyWZGUWG+xwHx/b0COQJmRN8B9P60RBYRAYf+vgEQ/vXGQgFLQwAAAwBh/8IDcgM3AAcAEgAeAAABMxUjFSMRMwMXDgErAREzET4BAxUhFSE1ITUhNSEVAu2FhVJSrwtzyWZGUWG+ygIH/agB5v4XAjoCfUTGAcT+00UXEAFy/tIBEf53Z0LoXELdAAQAYf+6A3IDNgAHABIAJwAtAAABFSMVIxEzFQcXDgErAREzET4BAxUyPgI3Fw4DKwE1MzUjNSEVNzUhESMRA3KFUlKvC3PLZEZRXsHxL0k/OB4JIT5GVDc109UBJCYBFFECcETJAdPGb0MXEQF5/swBEP51XwEFBwY+BwgFAdtWPtCPQf6JATYAAAAABQBh/8IDcgM2AAcAEgAnACsALwAAARUjFSMRMxUHFw4BKwERMxE+AQMVMj4CNxcOAysBNTM1IzUhFRcRIREDFTM1A3KFUlKvC3PJZkZRXsH9Izo0MRsIHzg9RSwvyswBGzcBGNGJAnFDywHTxW5EFxEBeP7OARD+d2MBBAYFPwYHAwHeVz/RowF0/owBNvj4AAAAAAQAYf/DA3IDNwAHABIAFgAaAAABFSMVIxEzFQcXDgErAREzET4BAREhEQEVITUDcoVSUq0Kc8lnRlFhwP7lAjX+GwGVAmlE6QH7zn5DFxEBiv67ARD97QFI/rgBBsTEAAQAYf/CA3MDNgAHABIAGgAeAAABFSMVIxEzFQcXDgErAREzET4BEzUzESERMxUFNSEVA3OFU1OuCnPJZ0ZRYcDJUf3KUQGU/mwCbkTGAdLIdUMXEQF//sYBEP7Zd/6OAXJ3uXd3AAAAAwBh/7sDcgM3AAcAEgArAAABMxUjESMRMwMXDgErAREzET4BFxUUHgIXBy4DJw4DByc+Az0BAu2FhVJSrQtzymdGUWHANDBSazwgMl1PPxQUP1FeMiE8bVIxAkJE/usCTv6cQxcRAZH+tAEQnicwU0IuCj8JIzFAJydBMiMJPwouQlQxJwAAAAMAWv+2A3IDNgAHABIAOAAAATMVIxUjETMDFw4BKwERMxE+ARcVFB4CFwcuAScOAQcuAScOAQcnPgM9ATMVFBYXPgM9AQLthYVSUq0Lc8pnRlFhwNQYLkMrKUJaFxRSP0JQFBhaPykqQy4ZTz0/IC8gDwJjRd0B9f6vQxcRAYX+wAEQtEAjRTwwDj0YWjk3YRoZXDk2WBk9DzI9QyFAQD11JhU1OTobQAAAAAAEAGH/tgNyAzcABwASACYAMgAAATMVIxUjETMDFw4BKwERMxE+AQcyHgIVFA4CIyIuAjU0PgITMjY1NCYjIgYVFBYC7YWFUlKtCnPJZ0ZRYcAEQ21OKipObUNDbU4qKk5tQ2RycmRkc3MCV0TyAhb+pUMXEQGO/rcBELIYLkApKUEuGBguQSkpQC4Y/uM7MzM7OzMzOwAAAAMAYf+6A3IDOAAHABIALQAAATMVIxUjETMDFw4BKwERMxE+AQEjHgMXBy4DJw4DByc+AzcjNSEC7YWFUlKtC3PKZ0ZRYcABKfkBME5mNyApV09DFRM9TVoxIDlmTi4C+wJKAlxE3QH9/rVEFxEBhf7AARD+9SVEOCkJPwcdLTwmIjouIAg/CSc4RCZCAAAAAAMAYf+6A3IDNwAHABIALwAAATMVIxUjETMDFw4BKwERMxE+AQEhHgMXBy4DJw4BByc+AzchNSE1MxUhAu6EhFNTsAtzyWZGUV7BAS/+/wMxTmY4HjFcTj4TKJ9kHjhlTjED/v8BAlIBAgJpRNoB7P7MQxcRAXL+0wEQ/tEkQTUlCD4IHys4IUJYET4IJTVBJEFkZAADAGH/wwNyAzgABwASAB4AAAEzFSMVIxEzAxcOASsBETMRPgEDFSEVIREhFSEVIRUC7YWFUlKvC3PJZkZRYb7GAfv9sgI6/hkB3AJtRM4B3f7ERhYRAXr+zAEQ/ndcPgFsPVg9AAAAAAUAYf+3A3IDNwAHABIAGgAmADIAAAEzFSMVIxEzAxcOASsBETMRPgEXFSEVITUhNRcyFhUUBiMiJjU0NhcyNjU0JiMiBhUUFgLthYVSUq8Lc8tkRlFewTIBD/2QAQ8pdoSEdnaFhXZOV1dOTlhYAn9E1AHQ/uFEFxABYv7iARGAWj8/WsFEQj9GRj9CRM4mIiMmJiMiJgAAAgBh/7cDLgM3AAsAFgAAATMRIxEjESMRMxEzARE+ATcXDgErAREC309Pf01Nf/3UQo1RCFudSTkDN/yAAc/+XgM//qcBAP4cAQsQRxELAisAAAAAAwBh/7YDKgM3AAsAFgAcAAABMxEjNSMVIxEzFTMFFw4BKwERMxE+AQM1IREjEQLbT096Tk56/vgIWJhROVJIirUCWlIDN/3y6eMB99F7QxILAX/+xQEL/vFC/rkBBQAAAwBh/9IDRAM2AAsAFgAcAAABESMRMxUzETMRIxEFFw4BKwERMxE+AQMhFSERMwJhTk56T0/++AhYmFE5UkaLUwIT/ZtSAe7+ywJt9QEF/WYBUjtDEQsBlv6uAQv+cUMBJgAAAAMAYf/AAzgDNgALABYAHgAAARUjETMVMzUzESM1BRcOASsBETMRPgEDIRUhESEVIQJnTU12T0/+9glSmFk4Uk6HaAIY/ZQCZf3vAgznAgHX5/3r6zlGEgsBhf7AAQz+Q0UBPEQAAAAAAwBi/8IDTAM2AAsAFgAiAAABFSMRMxUzNTMRIzUFFw4BKwERMxE+AQMhFSE1ITUhNSEVIQJgTU17T0/+9whal084UUWJVAIf/ZAB/P4CAlD+AwIvwQG4tcX+NMU1QxEKAWf+3QEK/hlC41tB2QAAAAQAYf/CAyoDNwALABYAGgAeAAABMxEjNSMVIxEzFTMFFw4BKwERMxE+AQMRIREBFSE1AttPT3tOTnv++AhamE85UkWKpwJP/gEBrgM3/gHZ0wHo0n1EEQkBhP6/AQr9+wFL/rUBCcfHAAAAAAQAYv/CAyoDNgALABYAHgAiAAABMxEjNSMVIxEzFTMFFw4BKwERMxE+AQE1MxEhETMVBTUhFQLbT097TU17/vkIWphPOVFFiwFWUf2zUgGq/lYDNv4YzMQB0Ml3QxEKAXP+0QEK/uJt/pwBZG20c3MAAAAAAwBh/7kDWgM2AAsAFgAvAAABFSMRMxUzNTMRIxEFFw4BKwERMxE+ARcVFB4CFwcuAycOAwcnPgM9AQJgTU17T0/+9AtRmFg4UkuJojNVbjshMl9SQRUUQVJfMiA7bVQzAgbPAe/d7f21ARtHQRUPAYz+tQEPnSEtUEAtCUEJIjI/JiY/MiIJQQktQFAtIQAAAwBi/7YDcAM2AAsAFgA8AAABFSMRMxUzNTMRIzUFFw4BKwERMxE+AQUVFB4CFwcuAScOAQcuAScOAQcnPgM9ATMVFBYXPgM9AQJfTU18T0/+9whYmU45UUaKATkYL0MqKENbFxRRP0JRFBhbPygqQy4ZTz0/IC8gDwIU1wHozt/9/eFFRBELAYH+xAELqTsjRDwwDj0YWTk3YBsaWzk2WBg9DzI8QyE7Oz10JRQ1OTsZOwAABABi/7cDLgM2AAsAFgAqADYAAAEVIxEzFTM1MxEjNQUXDgErAREzET4BFzIeAhUUDgIjIi4CNTQ+AhMyNjU0JiMiBhUUFgJfTU18T0/++QlamU85UUaKf0VvTioqTm9FRW5OKipObkVndHRnZ3NzAgrTAe/Z6f3h80FEEgsBh/6+AQuwFys/KCg/KxcXKz8oKD8rF/7vNzEzNjYzMTcAAAIAWf+2A3MDOAALABYAAAEjFTMVIxEjETMVMyURMjY3Fw4BKwERA3OMjIxSUoz9N2HJbQpz0WdHAhHGRP6vA4Lji/3+EhdHFxECSAADAGH/tQNxAzcACwAWABwAAAEjFTMVIxUjETMVMwUXDgErAREzET4BATUhESMRA3GEhIRSUoT+zwpzyWdGUWHA/tcCQ1ICc3tDgQIDgNhDFxEBj/62ARD+9UL+tAEKAAADAGH/ygNwAzYACwAWABwAAAEjFTMVIxUjETMVMwUXDgErAREzET4BBxUhFSERA3CDg4NSUoP+0QlzyWdGUWHBwAH5/bUCUplExwKIodlEFxEBpf6gARC44UMBJAAAAAADAFn/wANuAzYACwAWAB4AAAEjFTMVIxUjETMVMwUXDgErAREzET4BAxUhFSERIRUDboWFhVRUhf7OCm3Kb0dSasDUAfn9tAJDAmuBRXwCDYXCRhYSAYX+wQER/uG2RAE9QwAAAwBh/8IDcgM3AAsAFgAiAAABIxUzFSMVIxEzFTMFFw4BKwERMxE+AQMVIRUhNSE1ITUhFQNyhYWFUlKF/swLc8lmRlFhvsoCB/2oAeb+FwI6AohlQm4BxG3ARRcQAXL+0gER/ndnQuhcQt0ABABh/8MDcQM2AAsAFgAaAB4AAAEjFTMVIxUjETMVMwUXDgErAREzET4BAREhEQEVITUDcYSEhFJShP7PCnPJZ0ZRYcD+5QI1/hsBlQJ1d0R+Afp+zUMXEQGK/rsBEP3tAUj+uAEGxMQAAAAABABa/74DbgM2AAsAFgAeACIAAAEjFTMVIxUjETMVMwUXDgErAREzETI2EzUzESERMxUFNSEVA26FhYVUVIX+zAx20V5HUVvEy1T9xVQBk/5tAnZxRXIB6HvARBcRAX/+xxH+zmz+ngFibLJxcQAAAAMAYf+7A3EDNwALABYALwAAASMVMxUjFSMRMxUzBRcOASsBETMRPgEXFRQeAhcHLgMnDgMHJz4DPQEDcYSEhFJShP7PC3PKZ0ZRYcA0MFJrPCAyXU8/FBQ/UV4yITxtUjECZYVDtAJOjtZDFxEBkv6zARCeJzBTQi4KPwkjMUAnJ0EyIwk/Ci5CVDEnAAAAAAQAYf+2A3EDNwALABYAKgA2AAABIxUzFSMVIxEzFTMFFw4BKwERMxE+AQcyHgIVFA4CIyIuAjU0PgITMjY1NCYjIgYVFBYDcYSEhFJShP7PC3PKZ0ZRYcAEQ21OKipObUNDbU4qKk5tQ2RycmRkc3MCbHtEiwIVh9NDFxIBj/62ARCyGC5AKSlBLhgYLkEpKUAuGP7jOzMzOzszMzsAAAADAF7/swMuAzcACwAYABwAAAEzESMRIxEjETMVMyURPgE3Fw4DKwERATM1IwLgTk57TU17/dFRiUsHKU1OUi86Agd7ewM3/HwBU/7dA0HOdf4bAQoPSgkLBQICMP6BwwACAGb/tAMYAzcABwASAAABMxEjESE1ISURPgE3Fw4BKwERAsZSUv7tARP98mS7ZAtrxGtGAzf8fQIXRMT9/wEQFEYUEAJGAAADAGn/tgMYAzcABwAUABoAAAEzESMRIzUzBxcOAysBETMRMjYBNSERIxECxVNT/v6JCjRjY2c4RFJnuf7lAlhTAzf96wEiRL5GCg4IAwGf/qcP/wBD/r0BAAAAAAQAaf+0A2MDNwAHABQAJwAtAAABESM1MzUzEScXDgErAREzETI+AhcVFB4CFwcuAScOAQcnPgE9AQU1IREjEQLF/PxS3Apnwm9EUjVgXV28FCc7Jyk8TRQVTjwqSlf+JAEqUQFAARRDoP4JmkYUEAGW/rAECA6zRSRFPDAPPxdSNjZTFz4deVBFUUL+qgEUAAMAaf/KAy8DNgAHABYAHAAAJREjNTM1MxEnFw4DKwERMxEyPgIDIRUhETMCxf39U90LNGNjZzhEUjVgXV3fAgT9qlKtAYNDw/13/EYKDggDAbP+kgQIDv5uQwEZAAAAAAMAXf/AAyEDNwAHABIAGgAAAREhNSE1MxEnFw4BKwERMxEyNgMhFSERIRUhAr3/AAEAVOcKbL9oRFJjtK8CCv2iAlj9/AEsARdEsP31kUASDQGk/pwN/llEAT1DAAAAAAMAaf/CAzgDNwAHABQAIAAAATUjNTM1MxEnFw4DKwERMxEyNgMhFSE1ITUhNSEVIQLF/v5T3As1Y2NmOEVSZ7ixAg/9oAHu/hACQv4RAWf4Qpb+MI1ECg4IAwF//sYO/iRC4ldC2AAABQBp/70DFwM4AAcAFAAoACwAMAAAATMRIxEjNTMHFw4DKwERMxEyNgMVMj4CNxcOAisBNTM1IzUhFRcRIREDFTM1AsVSUv39igw1Y2NmOEVSZ7joJDs2MxsIHzo+I4DQ0wEiNgEf148DOP4fAQNCtEUKDQgDAYn+uw/+i2ABBAYFPwYHA9xTP8+iAXH+jwEz9vYAAAUAaf/AAxgDNwAHABQAHAAwADQAAAEzESMRIzUzBxcOAysBETMRMjYTNTMRIREzFQUVMj4CNxcOAisBNTM1IzUhFQU1IxUCxVNT/f2KDDVjY2Y4RVJnuPNL/uBL/q8kOzYzGwgfOj4jgNDTASIBC4oDN/4kAQRCtEQKDggDAYT+wQ/+6Hb+iAF4dmJhAQQGBT8GBwPcVD7OYIODAAQAaf/CAxgDNwAHABQAGAAcAAABMxEjESM1MwcXDgMrAREzETI2AREhEQEVITUCxVNT/v6JCjRjY2c4RFJnuf77AkL+DgGiAzf9+wEZRLpGCw4IAwGW/rAQ/gEBRP68AQPBwQAEAGn/wgMYAzcABwAUABwAIAAAATMRIxEjNTMHFw4DKwERMxEyNhM1MxEhETMVBTUhFQLFU1P+/okKNGNjZzhEUme57FH9vFEBov5eAzf+HAECQ7NGCw4IAwGN/rkQ/uZz/pgBaHOycnIAAAADAGn/uQNKAzcABwAUAC0AACURIzUzNTMRJxcOAysBETMRMjYXFRQeAhcHLgMnDgMHJz4DPQECxf//U9wKNGNjZzhEUme5RDBTbDwhMl5QPxQUQVFeMiE8bVQx0gFkQ779m+pGCg4IAwGp/pwQkiYvUkAsCj8JIjA/JiY/MSIJQAosQFEwJgAAAwBn/7kDawM3AAcAEgA4AAABESM1MzUzEScXDgErAREzET4BFxUUHgIXBy4BJw4BBy4BJw4BByc+Az0BMxUUFhc+Az0BAsX//1LcCmbEbkRSZ7jdGC5DKylCWxcUUj9CUBQYWz8qKkQuGU89PyAwHxABMAEYQ6z9+aJGFA8Blf6wAQ+iPCNFPTAOPBhZOTdgGxpdOTdZGDwPMj1EITw8PXUlFDU6Oxk8AAAAAAQAaf+2AxsDNwAHABQAKAA0AAABESM1MzUzEScXDgMrAREzETI2FzIeAhUUDgIjIi4CNTQ+AhMyNjU0JiMiBhUUFgLF/v5T3Ao0Y2NnOERSZ7kVRW9NKipNb0VFb00qKk1vRWdycmdncnIBEwEyQ6/93LtGCg4IAwGS/rQPrRcsQCkoQCwXFyxAKClALBf+6jczMzg4MzM3AAAAAAQAXf/AAyYDNwAHABIAHgAiAAABESE1ITUzEScXDgErAREzETI2EzMVITUzNSM1IRUjIRUzNQK//v4BAlLnCmy/aERRY7XXif2Mhn4CYn/+7MMBLAEXRLD99ZFAEg0BpP6cDf5XQkLEQkLExAAAAAAFAGj/twMsAzcABwASABoAJgAyAAABESE1ITUzEScXDgErAREzETI2FyEVITUhNTMHMhYVFAYjIiY1NDYXMjY1NCYjIgYVFBYCxf8AAQBT3ApnxG5FU2e4PwET/YcBFFIpdoSEdnaEhHZPWlpPUVhYAVgBFEKJ/iGzRBQPAWj+3Q7RQEBZv0U/QEVFQD9FzSYjIyUlIyMmAAMAYf+2Ay8DOAADAAsAFgAAATMRIwMRMxEjESM1JxE+ATcXDgErAREC4U5Ov05OyKhIjE4LWJxROQM4/H4CVAEX/MIB40TN/gkBCxBFEgwCPgAAAAQAZf+2Ay0DNgADAAsAFgAcAAABMxEjJxEjNTM1MxEnFw4BKwERMxE+AQc1IREjEQLfTk60v79OoQlamVA5UUiJtgJcUgM2/fMKAQlDpP4Qj0MRCwGU/q8BC/lD/roBAwAAAAAEAGX/ygNLAzYAAwALABYAHAAAAREjEQMRIzUzNTMRJxcOASsBETMRPgEDIRUhETMDLU60v79Oogtbmk85UUWLSwIQ/Z5SAzb9awKV/YMBa0K+/ZXlQhEKAaj+mwEK/n5DASQABABh/8ADOAM2AAMACwAYACAAAAERIxEDESM1MzUzEScXDgMrAREzET4BAyEVIREhFSEDK06sxMROqggqTU5RLjhST4hpAhf9lAJn/e4DNv3xAg/99AERRKX+BptFCAoGAgGV/rABCv5ORAE8RAAAAAQAZf/CA1ADNwADAAsAFgAiAAABESMRAzUjNTM1MxEnFw4BKwERMxE+AQMhFSE1ITUhNSEVIQMtTrS/v06gCVuZTzpRRoxXAh/9jwH9/gECUP4EAzf+LwHR/jfqQor+SoFCEQsBdP7QAQv+ID/iWkDXAAAABQBl/8IDLQM2AAMACwAWABoAHgAAATMRIycRIzUzNTMRJxcOASsBETMRPgEDESERARUhNQLfTk60v79OowlamE85UUWKogJK/gYBqgM2/gEJAQVDm/4dkEQRCQGL/rgBC/4BAUr+tgEJx8cABQBl/8IDLQM2AAMACwAWAB4AIgAAATMRIyc1IzUzNTMRJxcOASsBETMRPgEBNTMRIREzFQU1IRUC305OtL+/TqEKWZlROlFGjQFTUf24UQGm/loDNv4UBv5ClP4sgkMSCwGL/rkBC/72bP6eAWJss3JyAAAEAGX/uQNZAzcAAwALABYALwAAAREjEQMRIzUzNTMRJxcOASsBETMRPgEXFRQeAhcHLgMnDgMHJz4DPQEDLU60v79Oowhal085UUWMojNUbjsfMl9SQhUVQVJfMh47bVQyAzf9oQJf/fEBAEK6/gSBQxMMAZ/+pQEMkyArTj8rCUAJIjA+JSU+MCIJQAkrP04rIAAABABl/7oDcAM2AAMACwAWADwAAAERIxEDESM1MzUzEScXDgErAREzET4BBRUUHgIXBy4BJw4BBy4BJw4BByc+Az0BMxUUFhc+Az0BAy1OtL+/TqMJWZhQOVFGiwE1GC9DKihDWxcUUT9CURQYWkAoKkMuGU89PyAwIA8DNv3zAg3+AQEDQqj+E45DEQsBlf6vAQumMCNFPDAOPRhZOTdgGhlbOTZYGD0PMj1DITAwPXUlFDQ6OxowAAUAZf+6AzEDNgADAAsAFgAqADYAAAERIxEDNSM1MzUzEScXDgErAREzET4BFzIeAhUUDgIjIi4CNTQ+AhMyNjU0JiMiBhUUFgMtTrS/v06iCFqYTzlRRop/RW9OKipOb0VFb04qKk5vRWR2dmRnc3MDNv3fAiH9/vtDsv4QgUMRCgGa/qoBCp0XKz4nKD4rFxcrPignPisX/vE3MTA3NzAxNwAAAgBm/7UDGAM3AAsAGgAAATMRIxEhNSE1ITUhJREyPgI3Fw4DKwERAsZSUv70AQz+9AEM/fI2YFtZLgkxXWBnOkQDN/x+AaJDiUNu/fYDCAwJRAoNBwMCTwAAAAADAGn/tQMXAzcACwAaACAAAAEzESM1IzUzNSM1MwMXDgMrAREzETI+AgU1IREjNQLFUlL8/Pz8mwswXF5mOUNSNV5ZVv7CAlhSAzf94c8/ZED+3UQKDQcDAb/+hgMIDPRD/sj1AAAAAAMAaf/KAy8DNgALABYAHAAAJREjNTM1IzUzNTMRJxcOASsBETMRPgEDIRUhETMCxf39/f1T5wlsvmNEUl6yoAIE/apSngE3QWpCdP1o6kQUDQHT/nIBDf6XQwENAAAAAAMAXf/AAyMDNgALABgAIAAAATUhNSE1ITUhNTMRJxcOAysBETMRMjYDIRUhESEVIQK+/v8BAf7/AQFU8Qk0YV9hNUNSYrCqAgz9oAJZ/fsBLMU/YD9n/faGPwkLBwIBq/6VDP5iRAE9QwAAAAMAaf/CAzYDNwALABoAJgAAATUjNTM1IzUzNTMRJxcOAysBETMRMj4CAyEVITUhNSE1IRUhAsX8/Pz8U+sKLlpeaD1DUjlhWVTZAg39ogHu/hACQf4SAVytP1Y/Wv4leEMJDAYDAZz+qAMHC/43QdxTQdEABABr/8IDGAM3AAsAGAAcACAAAAEzESM1IzUzNSM1MwMXDgMrAREzETI2AxEhESUVITUCxVNT/Pz8/JwLMVxfYzhCUWir+AJB/g8BoAM3/fHMQF5A/uBCCQwIAwG6/okN/iIBPf7D/Lq6AAAABABr/8IDGAM3AAsAGgAiACYAAAEzESM1IzUzNSM1MwMXDgMrAREzETI+AhM1MxEhETMVBTUhFQLFU1P8/Pz8lggwXF9lOkJRNmBZVsVS/cJRAZv+ZQM3/hS1QFk//uxDCQwHAwGu/pYDBgz+/Wn+oQFfabRzcwAAAwBn/7oDawM3AAsAGgBAAAABNSM1MzUjNTM1MxEnFw4DKwERMxEyPgIXFRQeAhcHLgEnDgEHLgEnDgEHJz4DPQEzFRQWFz4DPQECxfz8/PxS7AkxXV5jOEJRNF1ZV7kYL0MrKUJcFxRRP0JQFBlaPyoqRC4ZTz0/IDAfEAEn0EBaQGb98IpCCQwHAwGz/pADBgyYLyRFPDAOPRhaOTlfGhleOTdaGD0PMj1EIS8vPXYlFDU6OxovAAQAa/+2AxsDNwALABoALgA6AAABNSM1MzUjNTM1MxEnFw4DKwERMxEyPgIHMh4CFRQOAiMiLgI1ND4CEzI2NTQmIyIGFRQWAsX8/Pz8U+IKMFxgaTxEUTliW1cZRW9NKipNb0VFb00qKk1vRWdycmdncnIBEN9AXkBq/dmiQwoNBwMBs/6RAwgMoRYsPikoPysXFys/KCk+LBb+7zcxMzY2MzE3AAAAAAMAa/+3AxgDNwALABoAJAAAATMRIzUjNTM1IzUzAxcOAysBETMRMj4CBTUhESM1BSclNQLFU1P8/Pz8nQsvWV1mO0JRN19XU/7CAlpT/e4KAhwDN/36xUBdQP7kQwkMCAMBrv6VAwgM6UH+sYEZQRRRAAAAAwBh/7YDLwM3AAMADwAaAAABMxEjAzUzESMRIzUzNSM1JxE+ATcXDgErAREC4U5Ov05Oubm5t0iKTgpYmVE5Azf8fwKxuvzCAYFDfUNr/goBCw9FEgsCPQAAAAAEAGX/ygNLAzYAAwAPABwAIgAAAREjEQMRIzUzNSM1MzUzEScXDgMrAREzET4BAyEVIREzAy1OtLW1tbVOpgoqTkxPLDlRS4dNAhD9nlIDNv1lApv9fQEVQV1Bff2Pz0MICgYCAcL+gQEK/ppDARIABQBl/7YDMQM2AAMADwAcACgANAAAAREjEQM1IzUzNSM1MzUzEScXDgMrAREzET4BFzIWFRQGIyImNTQ2EzI2NTQmIyIGFRQWAy1OtLW1tbVOpgoqTkxPLDlRTIZ9jKCejo6eoIxnc3NnZ3NzAzb91AIs/fK7QVlBZv4Ed0MICgYDAbT+kAEKlVVOTlRUTk5V/vozMDA0NDAwMwAAAQA0ACoDYwLqAA0AACUhFSE1ITUhETMRIRUhAfQBb/zRAW7+9lICHP7ubUND8AGN/rVCAAIANf+2A2EDIwANABMAAAEhFSE1ITUhETMVIRUhATUhESM1AfQBbfzUAW3/AFICEf7v/qACaFIBfkJCegEr6EP+pkP+1egAAAIANv/KA2EDFQANABMAAAEhFSE1ITUhETMVIRUhARUhFSERAfQBbfzVAW3/AFECEP7w/voCHf2RAWJDQ4EBMvBC/vPJQwEMAAIANf/CA2IDKgANABkAAAEhFSE1ITUhETMVIRUhARUhFSE1ITUhNSEVAfQBbvzTAW7+/1ECEP7x/vkCLP2CAg798AJiAcBDQ2EBCcdC/kJhQN1TQM8AAAADAC3/twNbAyYADQAiACgAAAEhFSE1ITUhETMVIRUhARUyPgI3Fw4DKwE1MzUjNSEVNzUhESMRAe4BbfzSAW3/AFQCD/7x/u0sSkNAIggmR0tUMzjh4wE3JwEiUgG1QUFeARPQQ/5IYgIECAZABgcFAd1WQNKQQv6KATQABAA1/8EDYQMlAA0AIQAlACkAAAEhFSE1ITUhETMVIRUhARUyPgI3Fw4CKwE1MzUjNSEVFxEhEQMVMzUB9QFs/NQBbv7/UgIO/vP+5Sc+NjIaBx43PiSE0NIBHzkBIdqTAa1CQmYBEtBC/khcAQMGBT0GBwPVUT3JmgFj/p0BJunpAAAAAwA2/8IDYQMnAA0AEQAVAAABIRUhNSE1IxEzFSEVIQERIRElFSE1AfUBbPzVAWz/UgIP/vH+qAJe/fIBvgGKQkJ2ASflQv3CAS7+0u2rqwADADb/wgNhAycADQAVABkAAAEhFSE1ITUjETMVIRUhEzUzESERMxUFNSEVAfUBbPzVAWz/UgIO/vKwUf2tUQGx/k8BnEJCawEg3kL+rmT+qQFXZLBwcAAAAgA2/7kDYAMjAA0AJgAAASEVITUhNSERMxUhFSEdARQeAhcHLgMnDgMHJz4DPQEB9QFr/NYBbf8AUgIK/vYwU209HzNgUUAUFEBSXzMgPW5SMQGBQkJ6ASjmQvocLU4+KglACSAvPSUlPC8gCUAJKj1OLRwAAAAAAwA2/7cDYQMkAA0AGQAlAAABIRUhNSE1IxEzFSEVIQcyFhUUBiMiJjU0NhMyNjU0JiMiBhUUFgH1AWz81QFs/1ICD/7xKo+jo4+QpKSQanV1am10dAGEQkJ3ASnnQv1WTk5VVU5PVf75MzAwNDQwMDMAAAACAC3/vgNcAyYADQAZAAABIRUhNSE1IREzFSEVIQEVIRUhESEVIRUhFQHuAW780QFt/wBUAhD+8P72AiH9jAJr/egCAwG1QUFeARPQQ/5BVz8BYz5TPAAAAwA2/8IDYQMjAA0AGQAdAAABIRUhNSE1IxEzFSEVIRMVMxUhNTM1IzUhFSEVMzUB9AFt/NUBbP9SAhD+74qR/XiRiQJ4/mLEAZ5CQnIBE9FC/rG9QkK9QkK9vQAEADX/twNhAyoADQAVACEALQAAASEVITUhNSMRMxUhFSEHFSEVITUhNRcyFhUUBiMiJjU0NhcyNjU0JiMiBhUUFgH1AWz81AFu/1ICD/7wAgEi/WsBISmGiIiGhYiIhVhhYVhYYGABykJCWgEGxUG/Uj8/Urs+PDw9PTw8PrkfICAfHyAgHwAAAgAp/7YDcwM3AAcAHQAAARUjESMRMxEFFT4BNxcOAyMnMjY3NSMRMxEhFQNzi1JS/pI6czYFR5KPiD0MOoBFvVIBdgG+RP48A4H+hznEAggHOwsNBgJDAgLHAVr+6UMAAwAv/8oDcAM2AAcAHQAjAAABMxUjESMRMwMXDgMjJzI2NzUjETMVIRUjFT4BBRUhFSE1Au+BgVJSiwZHlpKJOgk2fUKvUgFktTx5/t8CAv2sAhJE/sICpv49Ow4QBwJDAQOEASDdQ4EEC6S5Q/wAAAMAMf/AA3ADNwAHAB4AKgAAATMVIxUjETMDFw4DIyczMjY3NSM1MxUhFSMVPgEBFSEVITUhNSE1IRUC8ICAUlKKBUeUkYo9B3IePSCqUgFiuD97/s8CF/2YAfb+BwJLAmNEzAHk/pY6DA0HAUIBAWnzsUJmAwn+mF1A2VM/zgAAAwAy/7kDcAM2AAcAHQBDAAABMxUjFSMRMwMXDgMjJzI2NzUjETMVIRUjFT4BFxUUHgIXBy4BJw4BBy4BJw4BByc+Az0BMxUUHgIXPgE9AQLvgYFSUokFR5WRiDsJNnhCr1IBaLk/enEYLkMrKUJZGBRQQkBRFBhYQikrQy4YTw8fLyBAPgJEROUCG/5nOw0PCAJCAgJxAQzKQm0DC5keI0M7Lg48F1U3N10aGlw3NlUXPA4vO0MiHiEcOzgxEiZ0OCEAAAMAK/+yAzIDNgALABMAIwAAATMRIxEjESMRMxEzJRUhNTMRMxEXFT4BNxcOAyMnMjY3NQLjT09sTk5s/vH+iwFRjTNeLQc3enpzLwsqZTYDNvx8Ac/+YgNA/qYMRUUBC/71a6ECBwU+CQwGA0cCAqQAAAAAAwAr/7kDaQM3AAsAIQBFAAABFSMRMxUzNTMRIzUHFw4DIycyNjc1IxEzFSEVIxU+ARcVFB4CFwcuAScOAQcuAScOAQcnPgM9ATMVFBYXPgE9AQJwTU1qT0/iBjd8eXAsCypqOZBRARWHMFfmGC9DKydDWxcUUz9AUhQXW0IoK0MvGE8+P0I9AfvgAgrn+f3c6GI5Cw0GAkIBAm4BDstDagIIoRkjQzouDjwXVjc3WxoaWjc3VRc8Di86QyIZGTpzJCZyORkAAAACADn/tgMSAzcAAwAZAAABMxEjARU+ATcXDgMjJzI2NzUjETMRIRUCwFJS/sw/fjwGS5mVjkALPIBFu1IBfgM3/H8BzsEDCQg9DA4HAkUCAsQBWv7pQwAAAwA3/8oDKgM3AAMAGQAfAAABESMRAxcOAyMnMjY3NSMRMxUhFSMVPgEBIRUhETMDFFNGBUeWlI4/CzyAQ7BSAWa2P3r+3AIN/aFSAzf9aAKY/j49Cw0IAkQCAoMBGtdDgAQI/qBDAQgAAAAAAwA2/8ADMQM2AAMAGQAlAAABESMRAxcOAyMnMjY3NSM1MxUhFSMVPgEBIRUhNSE1ITUhFSEDElJEBUiXlI5ACjyBRbJSAWe1P3n+1QIa/ZQB+/4CAlD+BQM2/igB2P6cOwsNCAJCAgJm8a9CYgMI/jdB3VNA0AAABAA2/8IDFAM2AAMAGAAcACAAAAEzESMnFw4DIycyNjc1IxEzFSEVIxU2AREhESUVITUCwVNTRQZKmZWMPQs5gkWxUgFot33+xAJL/gUBqwM2/eOKPQ0PCAJDAgJ0ARDOQnAG/jEBLf7T7KqqAAAAAAQANf/CAxQDNgADABkAIQAlAAABMxEjJxcOAyMnMjY3NSMRMxUhFSMVPgEXNTMRIREzFQU1IRUCwVNTRwVIl5SOPwo8gEWxUgFotz95g1D9uVEBpv5aAzb+CXE8Cw4IA0MDAnABCMZCbAIK+WX+rgFSZatrawAAAAMANv+5Az8DNgADABkAMAAAAREjEQMXDgMjJzI2NzUjETMVIRUjFT4BBxUUHgIXBy4BJw4DByc+Az0BAxRTRwVIlpOOPws8gUOyUwFntj95LDBSbTwfZ6QqE0BRXzIfPWxRMAM2/YwCdP5VPQsNCAJEAgJ/AQ/NQnwECIofK0o6KAlBEFtIIzsuHwhBCSg6SisfAAAEADb/twMYAzcAAwAZACUAMQAAAREjEQMXDgMjJzI2NzUjETMVIRUjFT4BBzIWFRQGIyImNTQ2FzI2NTQmIyIGFRQWAxNSRQZImJWOPgs6gUWxUgFotz95Vo2hoY2Pn5+PZ3NzZ2dzcwM3/ccCOf5iPAwPCANDAwJ3ARDOQnMDC6BRTExRUUxMUfsxLS0xMS0tMQAAAgA1AC4DYwLlAA0AEQAAJTMVITUzNSMRMxEhFSMhFTM1AoPg/NLigVICHoP+5shyRETnAYz+t0Pn5wAAAwA1/7ADYQMjAA0AEQAXAAABMxUhNTM1IxEzFSEVIyEVMzUBNSERIzUCgOH81N90UgIRg/7myP5mAmhSAXxDQ30BKudDfX3+pEP+0O0AAAADADb/ygNhAxUADQARABcAAAEzFSE1MzUjETMVIRUjIRUzNQEVIRUhEQKA4fzV4HNRAhCE/ujG/sACHP2SAWBDQ4UBMO5ChYX+88tDAQ4AAAMANf/AA2IDKgANABEAHQAAATMVITUzNSMRMxUhFSMhFTM1ARUhFSE1ITUhNSEVAoDi/NPgc1ECEIP+58f+vwIs/YICDv3wAmIBvENDZAEKx0NkZP5BYUDdVD/PAAAAAAQALf/AA1wDHQANABEAFQAZAAABMxUhNTM1IxEzFSEVIyEVMzUBESERJRUhNQKA3PzR53pUAhB+/ubI/mMCZv3uAb0BgkFBeAEj4EN4eP3GASz+1OysrAAEADb/wgNhAycADQARABkAHQAAATMVITUzNSMRMxUhFSMhFTM1EzUzESERMxUFNSEVAoDh/NXecVICDoP+5sh3Uf2tUQGx/k8BmkJCbwEe3EJvb/6rZP6qAVZksHBwAAADADb/uQNhAyQADQARACoAAAEzFSE1MzUjETMVIRUjIRUzNQcVFB4CFwcuAycOAwcnPgM9AQKA4fzV33JSAguA/ufHOTBTbT0eM2BSQBQUQFJfMyA9blIxAYBDQ34BJuRCfn7/HC1OPSoJPwggLz0lJTwvIAlACSo8Ti0cAAAAAAQANv+4A2EDJQANABEAHQApAAABMxUhNTM1IxEzFSEVIyEVMzUHMhYVFAYjIiY1NDYTMjY1NCYjIgYVFBYCgOH81d5xUgIPhP7myWWRoqKRkaKikWp2dmpqdnYBhEJCeQEo5kJ5ef5VT09UVE9PVf75MzAwMzMwMDMAAAACADT/tgNjAwkABQANAAABFSERMxUFFSERIxEhNQMF/ZhTAnP+j1L+lAIKQwFC/8pD/rkBR0MAAAIANf+tA2EDIwAFABMAAAEVIREzFQUhFSERIzUhNSE1ITUhAwX9nVICbf6TAQhS/eoBDv6TAywCOkIBK+nle/7T6kN7QwAAAAMANf/KA2ADFQAFAA0AEwAAARUhETMVByEVIRUjNSEXFSEVIREDBP2gUcADK/6aUv6NuQIc/ZICJkEBMO+rQri4acNDAQYAAAIANv/CA2EDJAAFABUAAAEVIREzFQUhFSEVIRUhFSERITUhNSEDBP2fUwJr/pMBCv3qAh39kgEM/pMDKwJAQgEm5OFxQ6ZDASxxQgACADX/wANiAyoABQAZAAABFSERMxUFIRUhFSEVIRUhNSE1ITUhNSE1IQMD/Z9RAm/+kQEI/fICLP2CAg798AEI/pQDLQJhQgELydNez2FA3VQ/XkMAAAAAAgAt/7cDWwMqAAUAKAAAARUhETMVBSEVIREjESM1IxUjFTI+AjcXDgMrATUzNSM1ITUhNSEC/f2dVAJt/pMBFVTUJ9krSEI+IggmRklSMzfa3AEV/pMDLgJZQwEU0dpf/pcBKDS+XAEFBwY/BgcFAddQP19CAAAAAwA1/8MDYQMnAAUAEQAVAAABFSERMxUFIRUhESERITUhNSEDNSEVAwT9n1ICbP6RAQn9ogEE/pQDLLb+QgJCQgEn5eNu/tIBLm5D/mOrqwAEADb/wgNhAycABQANABUAGQAAARUhETMVByEVIRUjNSEFNTMRIREzFQU1IRUDA/2gUr8DK/6TUv6UAm9R/a1RAbH+TwJJQgEg3p5ChYW4av6nAVlqrWxsAAAAAAMANf+5A2MDJAAFAA0AJgAAARUhETMVByEVIRUjNSEFFRQeAhcHLgMnDgMHJz4DPQEDBf2fUsEDLv6QUv6UAb8xUm49HDRhUkEUFEFTYTQdPW5TMQJKQgEc2ptDamqNJCZBMyIHPwYcKTYgIDYpHAY/ByMzQSUkAAMANv+3A2EDJAAFABgAJAAAARUhETMVBSEVHgEVFAYjIiY1NDY3NSE1IQM0JiMiBhUUFjMyNgME/Z9SAmz+k4CJo4+QpImC/pQDK7d1am10dG1qdQI9QgEp595iBlRJTlVVTklUBmJC/rkwNDQwMDMzAAAAAgAt/74DXAMqAAUAGQAAARUhETMVBSEVIRUhFSEVIRUhFSERITUhNSEC/v2cVAJu/pIBDv3oAgP9/QIh/YwBCf6TAy8CWUMBFNHaXz1UPFc+AWJfQgAAAAMALf+1AxMDNgAHAA0AHQAAATMRIzUjNTMDFSERMxUFFw4BBxEjEQ4BIycyPgICwVJSy8uF/kZSAaUFP4FCUkB5OQtDk5eXAzb8f+RBAUVCASrooD0ICgT+pQFYAgJFAQUIAAAEADD/uQNpAzcABwANAB0AQQAAATMRMxEjNSMTFSE1MxUTNQ4BIycyPgI3Fw4BBxUFFRQeAhcHLgEnDgEHLgEnDgEHJz4DPQEzFRQWFz4BPQECCblSUrko/lpTQT9yNAo9jpaZRwdAhUIBQxgvQysnQl0XFFM/QFIUF1tDJipDLxhPPkA/PwF7Abz9zjoBNEHtrP6YlAMCQgIGDAo7Cw0EmCQUIkE5LQ08F1M3NloZGVo2NlQXPA4uOUAhFBQ4cSQlcTcUAAAAAAQAKv+3Ay0DNwADAAsAEQAhAAABMxEjAxEzESM1IzUTFSERMxUFFw4BBxEjEQ4BIycyPgIC3k9PqU5OqEv+kVIBQAcuZjRPM14nCTB2fHsDN/yAAUQCJ/zD1kABLUIBC8mSPAgMA/68AT4CA0QDBgoAAAAAAwAx/7UDFwM2AAMACQAZAAABMxEjAxUhETMVBRcOAQcRIxEOASMnMj4CAsVSUov+TlIBqwRAg0JSQnw5CkKUmZsDNvx/AmNDASbjqD0KDAP+twFFAgJEAQYKAAAEADb/ygMqAzcAAwAJABkAHwAAAREjEQMVIREzFRM1DgEjJzI+AjcXDgEHFQchFSERMwMPUoz+W1JkRYI6C0GQlpdIBjp4PIsCIf2NUgM3/VkCp/77QgENy/58ngMCRQEFCQg+BwoEoqFDAQUAAAAAAwA3/8ADLgM2AAMACQAlAAABESMRBxUhNTMVEyEVITUhNSE1MzUOASMnMj4CNxcOAQcVIRUhAw9Sjv5cUjYCG/2TAfz+AndCeTkLQZGWl0gFPH8/AYb+BAM2/hsB5dBB87L9mkDYUUBuAgNDAgQJBzsICgNyzgAABAA2/8MDDwM3AAMACQAdACEAAAEzESMDFSERMxUXFSERIREzNQ4BIycyPgI3Fw4BEzUhFQK9UlKM/lpSqwGG/bVzQnw3Cz+Ql5lIBj999/5VAzf93gEwQgEHxdqC/toBJn4DAkMBBgwKOwsN/pajowAAAAAFADj/wgMPAzcAAwAJABkAIQAlAAABMxEjAxUhNTMVEzUOASMnMj4CNxcOAQcVBTUzESERMxUFNSEVAr1SUoz+WlJlRYE5Cz+Pl5hIBjx3PAEqUf2xUQGt/lMDN/38ASZC+Lb+l5EDA0IBBgwKOgoMBJZLZP65AUdkoWJiAAAAAAIANf+2A2ADCQAFABEAAAEVIREzEQUVIxEjESMRIxEjNQMA/ZxSAnLSUuRR0gIIQgFD/v/DRP61AUv+tQFLRAADADb/rgNhAyAABQATABcAAAEVIREzFQUjFTMRIzUhNTM1IzUhBTUjFQME/Z9SAmzbd1L934XZAyv+1NQCPUIBJePjh/7b4kOHQ8qHhwAAAAMALf/AA1wDHgAFABUAGQAAARUhETMVBSMVMxUhFSEVIREzNSM1IQU1IxUC/v2cVAJu4IH95QIi/Yp+3wMv/szJAj5DASPg429BqEMBLG9BsG9vAAMANP/AA2IDKgAFABkAHQAAARUhETMVBSMVMxUhFSEVITUhNSE1MzUjNSEFNSMVAwP9n1ICbtpz/fICLP2CAg798HbbAy7+1NUCYUIBC8nOY89hQN1UP2NDpmNjAAAAAAQANf/DA2EDIgAFABEAFQAZAAABFSERMxUFIxUzESERMzUjNSEFNSMVBTUhFQME/Z9SAmzad/2cdtsDLP7U0wFL/j0CTUIBF9XleP7TAS14Qrp4eOupqQAEADX/vgNhAyQABQARABkAHQAAARUhETMVByEVIxUjNSMVIzUjBTUzESERMxUFNSEVAwX9n1LBAyzxUadS8QJxVf2hVAG2/koCTkIBGNaaQoWFhYXQaP60AUxooWFhAAAEADb/twNhAyQABQAYACAALAAAARUhETMVBSMVHgEVFAYjIiY1NDY3NSM1IQU1IxU+ATMyAzI2NTQmIyIGFRQWAwT9n1ICbMoxNaKRj6Q1MccDK/7l+Bo/I0lJanZ2amp2dgI+QgEo5t6DFEItTlVVTi1CFYJCrmxsBQX++TMwMDQ0MDAzAAAAAgA0ADEDYgLoAAUACQAAARUhETMRAyEVIQMF/ZNStgMu/NIBoUMBiv65/tREAAAAAwA1/7ADYQMiAAUACQAPAAABFSERMxUHIRUhFzUhESM1AwX9nVTBAyz81FkCb1ECPUIBJ+WoQbhC/tLsAAAAAAMANP/MA2EDFgAFAAkADwAAARUhETMVByEVIRcVIRUhEQME/Z5SwAMt/NO6Ahv9kwIpQwEw7btCWsNDAQYAAAADAC7/wANaAx0ABQAJABEAAAEVIREzFQchFSEXFSEVIREhFQL9/Z1UwAMs/NS0AiL9igJuAj1DASPgrEKgrEMBMEEAAAMANP/CA2IDKgAFAAkAFQAAARUhETMVByEVIRMVIRUhNSE1ITUhFQMD/Z9RvwMu/NK5Aiz9ggIO/fACYgJhQgELyZpD/t1fQNxWP9IAAAAABAA1/74DYQMoAAUACQAeACQAAAEVIREzFQchFSETFTI+AjcXDgMrATUzNSM1IRU3NSERIxEDA/2gUb8DLPzUqDFOQjsfCSJASVg5N9jaASkwAR1RAllDARLPl0P+4mACBQgHPggJBQHbUz/Oi0P+jwEuAAAFADX/wgNhAykABQAJAB0AIQAlAAABFSERMxUHIRUhExUyPgI3Fw4CKwE1MzUjNSEVFxEhEQMVMzUDA/2gUsADLPzUqSc9NjEaCB44PiSC0NIBHjsBIdqTAltDARHOmUT+4mABAwYFPQYHA9lUPcyeAWr+lgEt7+8AAAAABAA1/8MDYQMnAAUACQANABEAAAEVIREzFQchFSETESERJRUhNQME/Z9SwAMs/NRoAl798gG+AkJCASflpEP+aAEu/tLtq6sABAA2/8IDYQMnAAUACQARABUAAAEVIREzFQchFSEFNTMRIREzFQU1IRUDA/2gUr8DK/zVAm9R/a1RAbH+TwJJQwEh3qNCsGT+qgFWZLBwcAADADb/vwNhAyMABQAJACIAAAEVIREzFQchFSEFFRQeAhcHLgMnDgMHJz4DPQEDAP2jUr8DK/zVAcAwU209HzNgUUAUFEFSXzMgPm5TMAI9QgEo5qxCSR0tTj0qCT8JIC88JSU8LyAJQAkqPE4tHQAABAA2/7kDYQMkAAUACQAVACEAAAEVIREzFQchFSEFMhYVFAYjIiY1NDYTMjY1NCYjIgYVFBYDBP2fUr8DK/zVAZSPpKSPj6Skj2p2dmpqdnYCPUIBKeeqQ1BWTk5VVU5OVv75MzAwNDQwMDMAAwA2/7sDYQMgAAUACQAkAAABFSERMxUHIRUhBSEeAxcHLgMnDgMHJz4DNyE1IQME/aFTwgMr/NUCy/73BjVRaDkfM2BTQRQUQFNgMx85aFE1Bv72AmwCQUMBIt+fQ58nQjMjBz8IHi06JCQ6LR4IPwcjM0InQQAAAwA2/7oDYQMnAAUACQAoAAABFSERMxUHIRUhBSMeAxcHLgMnDgMHJz4DNyM1ITUzFSEDBP2fUr8DK/zVAr/+CDZPYzYbMl9SQBQTQFNfMxw4ZE80B/8BA1IBAgJIQwEi35tCyB86LiAGPAYcKTYgIDYpHAY8Bh8tOiFAVlYAAAAEADb/wgNhAyEABQAJABUAGQAAARUhETMVByEVIQUVMxUhNTM1IzUhFSEVMzUDA/2hUsADK/zVAkiQ/XmRiQJ4/mLEAkxCARfVokKiwkJCwkJCwsIAAAAAAwA4/7cDFAM3AAMACQAVAAABMxEjAxUhETMRAycyPgI3Fw4DAsJSUn/+PVKPC0KTmJlIBUqZlo8DN/yAAilDAUz+9/6qRQIFCwk9DA4HAgAEADb/ygMtAzYAAwAJABUAGwAAAREjEQMVIREzFQUXDgMjJzI+AgEhFSERMwMVUoX+SlIBoQVIlZSOQAtCkpaV/u0CC/2jUgM2/W0Ck/7zQwEe26E9Cw0IAkQCBQv+jkMBCQAABAA3/8IDMQM2AAMACQAVACEAAAERIxEHFSE1MxUFFw4DIycyPgIBIRUhNSE1ITUhFSEDElKG/k1SAaQESJaUjkAKQZKWl/7fAhv9lAH8/gECUP4EAzb+JQHb2EHzsoQ7Cw0IAkIDBgr+M0PcU0DQAAUAOv/AAw0DNgADAAkAFQAZAB0AAAEzESMDFSERMxUFFw4DIycyPgIBESERJRUhNQK7UlKE/kZTAaYIRpSTjT8LQY6TlP6KAlP+AgGpAzb91wEdQwEY1Y8+CQwGA0gCBAj+KwEk/tzjoqIAAAUANv+3AxkDNwADAAkAFQAhAC0AAAERIxEDFSERMxUFFw4DIycyPgIHMhYVFAYjIiY1NDYXMjY1NCYjIgYVFBYDFVKF/kpSAaEFSJeVjT4LP5GXmEmOn5+Oj5+fj2dycmdnc3MDN/3GAjr++UIBGdeSPAwPCQNEAgcMo1FMTFFRTExR+zEtLTExLS0xAAAAAAIAbf+3AxQDNwADAA4AAAEzESMBETI2NxcOASsBEQLCUlL9/WfQcAl21W1KAzf8gAMp/gQTF0YYEgJCAAMAbP+0AxUDNgADAA4AFAAAATMRIycXDgErAREzETI2ATUhESMRAsNSUmIMeNRsSVJnzP7MAlhSAzb9+rRDFxIBjP64Ev7xQ/6yAQsAAAAAAwBs/8oDMAM2AAMAEAAWAAABESMRAxcOAysBETMRMjYDIRUhETMDFVJhCzdqanA9SVN0yd8CE/2bUgM2/XUCi/6MRAsPCgQBnv6nEf5hQwEiAAAAAwBi/8ADHwM2AAMADgAWAAABESMRAxcOASsBETMRPgEDIRUhESEVIQMNVHMLc85nR1JhxL4CBP2oAlH+AwM2/fYCCv63RBcRAYX+wQER/itEAT1DAAAAAAMAbP/CAzMDNwADABAAHAAAAREjEQMXDgMrAREzETI2AyEVITUhNSE1IRUhAxVSYgw3amtwPUhSdMnXAg/9nwHx/g0CRf4PAzf+QAHA/tRCCw8KBAFr/tgR/g5B519A3AAAAAAFAGz/wAMVAzcAAwAQACQAKAAsAAABMxEjJxcOAysBETMRMjYBFTI+AjcXDgIrATUzNSM1IRUXESERAxUzNQLDUlJhCjdpam8+SVNzyP7+Izo1MhsHHzo9In3O0QEgNAEb1I0DN/4soEILDwoEAXL+0RH+eWcBBAYFPgYHA+BXPtCmAXb+igE6/f0AAAQAbP/DAxQDOAADAA4AEgAWAAABMxEjJxcOASsBETMRMjYBESERARUhNQLCUlJhC3DTdElScMn+2QJE/gwBpAM4/gOxRBYTAYT+wRL97QFN/rMBDMrKAAAEAGz/wgMVAzYAAwAOABYAGgAAATMRIycXDgErAREzETI2EzUzESERMxUFNSEVAsNSUmMMcNN1SFJwyM5R/b9RAZ/+YQM2/iiZRBYTAYD+xRL+23j+jgFyeLd3dwAAAAADAGz/ugNKAzgAAwAQACkAAAERIxEDFw4DKwERMxEyNhcVFB4CFwcuAycOAwcnPgM9AQMVUmELN2prcD1IUnTIIjFSbj0hNF9RPxQUQFFgMyE9blMxAzj9oQJf/ppDCw8KBAGS/rISmiUxVUQvCkEKJTNCKChCMyUKQQovQ1YxJQAAAAAEAGz/twMXAzcAAwAQACQAMAAAAREjEQMXDgMrAREzETI2BzIeAhUUDgIjIi4CNTQ+AhMyNjU0JiMiBhUUFgMTUl8KN2lqbz5JUnTJEUVwTioqTnBFRXBPKipPcEVndHRnZ3V1Azf96AIY/qFECw8KBAGP/rYRqhguQSopQi0YGC1CKSpBLhj+4To0Njk5NjQ6AAAABABs/8IDJAM2AAMADgAaAB4AAAERIxEDFw4BKwERMxEyNhMzFSE1MzUjNSEVIyEVMzUDFFJfDHDUdUpScMumhf2XhHwCV3v+8b4DNv4cAeT+ukMXEwF//sYS/ipCQtdBQdfXAAIAW/+0A3sDNwAHABgAAAEVIxEjETMRJREyPgI3Fw4DKwERIRUDe5RSUv3GPGlhXjAJM2Jmbj9HAaEB1UT+IwOD/p7I/j0DBgwJRAoNBwICTUQAAAMAXv+1A3IDNwAHABgAHgAAARUjFSMRMxUHFw4DKwERIRUhETI+AgE1IREjNQNyhVJSsQkuWWJxR0YBjf7FQmxdVf6WAkdSAlVE6gIQ4olCCg0HAgGNQv75AwYM/vBD/r/+AAAEAF7/tgNyAzcABwAYAB4AJAAAARUjFSMRMxUHFw4DKwERIRUhETI+AgE1IREjETM1IREjEQNyhVJSsQkuWWJxR0YBi/7HQmxdVf6CARxRewEVUQJURNwCA+ODQwkMBwMBikL+/AMGDP7/Qv6tARFC/q0BEQAAAAADAF7/ygNyAzcABwAYAB4AAAEzFSMRIxEzAxcOAysBESEVIREyPgIHFSEVIREC7YWFUlKxCS5ZYnFHRgGN/sVCbF1V/wIE/aoCLUT+xQKJ/ndCCQwHAwGcQv7pAwYMtuJDASUAAwBe/8IDcgM4AAcAGAAgAAABMxUjFSMRMwMXDgMrAREhFSERMj4CARUhFSERIRUC7YWFUlKxCS5ZYnFHRgGL/sdCbF1V/v8B9/23AjkCZETiAfr+nEMJDAcDAYtC/vsDBgz+/sVCAUlCAAAAAwBd/8IDcgM3AAcAGAAkAAABMxUjFSMRMwMXDgMrAREhFSEVMj4CARUhFSE1ITUhNSEVAu2FhVJSsQovW2NyRUUBjP7FQWteV/73Agj9qAHm/hcCOgJ6Q8MBw/6/QQoNBwIBbkLqAwcM/nxlQuVeQd0AAAAEAF3/vQNyAzgABwAYAC0AMwAAARUjFSMRMxUHFw4DKwERIRUhFTI+AgEVMj4CNxcOAysBNTM1IzUhFTc1IREjEQNyhVJSsQowW2NxRUUBjP7FQWteV/7SLkk/OR4JIT5HVDY209UBJCYBFFECZUPMAeLTgUIKDQcCAX1C+AMHDP6EXgEFBwY+BwgEAdlUP8+NQv6PAS8AAAUAXf/CA3IDOAAHABgAKgAuADIAAAEVIxUjETMVBxcOAysBESEVIRUyPgIBFTI2NxcOAisBNTM1IzUhFRcRIREDFTM1A3KFUlKxCi9bY3JFRQGM/sVBa19W/sRBZTgHITs9IXrLzgEdNwEY0YkCaUTOAeHPhUEKDQcDAX1C+AMHDP6FXgUKPwYHA9pSP82eAWv+lQEt7+8ABQBd/8IDcgM4AAcAGAAgADUAOQAAARUjFSMRMxUHFw4DKwERIRUhFTI+AhM1MxEhETMVBRUyPgI3Fw4DKwE1MzUjNSEVBTUjFQNyhVJSsQowW2NxRUUBjP7FQWteV5NL/uJK/rkjOjQxGwYeOD1FLC7JywEbAQaJAm1E0AHfy4lBCg0HAgF8QvgDBwz+5nT+jQFzdGFfAQQGBT0GBwMB1lM/y12AgAAABgBd/7cDcgM3AAcAGAAgADUASQBVAAABMxUjFSMRMwMXDgMrAREhFSEVMj4CFxUzFSE1MzUFFTI+AjcXDgMrATUzNSM1IRU3Mh4CFRQOAiMiLgI1ND4CFzI2NTQmIyIGFRQWAu2FhVJSsQowW2NxRUUBjP7FQWteV4iV/oqR/ogkPDYyGwgfOT5GLTDKzAEa1SE4KRcXKTghITgpFxcpOCEmLS0mJi0tAnVEuAG+/rNCCg0HAgF5QvQDBwyDUj09UvxgAgQGBT4GBwQB2lU9zUoRIC0dHC0gEREgLRwdLSARvCMeHiMjHh4jAAAEAF7/wwNyAzgABwAYABwAIAAAARUjFSMRMxUHFw4DKwERIRUhETI+AgERIREBFSE1A3KFUlKxCS5ZYnFHRgGL/sdCbF1V/qoCM/4dAZICXETdAf3cjUIJDAgDAY5C/vgDBgz9/QFI/rgBB8XFAAAABABe/8UDcgM4AAcAGAAgACQAAAEVIxUjETMVBxcOAysBESEVIRUyPgITNTMRIREzFQU1IRUDcoVSUrEJLllicUdGAYv+x0JsXVWMUf3LUQGT/m0CZUTIAd/TjEIKDQcCAYVC/wMGDP7pcP6cAWRwsXBwAAADAF3/ugNyAzcABwAYAC8AAAEzFSMRIxEzAxcOAysBESEVIREyPgIHFRQeAhcHLgEnDgMHJz4DPQEC7YWFUlKwCS5ZY3JHRgGM/sVDbF5WCjBTbDwhZ6EqFEBQXjIhPG1SMQI8RP7vAlD+gkIJDAgDAZpC/uwDBgyaIjBTQC0KQBJiTiZAMSIJQAotQFMwIgADAFr/uQNyAzgABwAYAD4AAAEzFSMVIxEzAxcOAysBESEVIREyPgIXFRQeAhcHLgEnDgEHLgEnDgEHJz4DPQEzFRQWFz4DPQEC7YWFUlKxCTBdY29CRgGL/sc/aV9YmBguQyspQloXFFI/QlAUGFo/KSpDLhlPPT8gLyAPAl5E4QH//plDCQwHAwGNQv75AwYMsjYiRTwxDzwYWzk5XxwaXTk3WRg8EDM8QyE2Nj10JhU1OToaNgAABABd/7cDcgM3AAcAGAAsADgAAAEzFSMVIxEzAxcOAysBESEVIREyPgIHMh4CFRQOAiMiLgI1ND4CEzI2NTQmIyIGFRQWAu6EhFNTsQkuWWNyR0YBjP7FQ2xeVkFEbU0pKU1tRERuTSkpTW5EZHJyZGRzcwJOROkCFv6UQwkMBwMBiUL+/AMHDLMXLT8pKEAtFxctQCgpPy0X/uo3MzM3NzMzNwADAF7/uANyAzgABwAYADMAAAEzFSMVIxEzAxcOAysBESEVIREyPgITIx4DFwcuAycOAwcnPgM3IzUhAu2FhVJSsQkwXGNvQ0YBi/7HP2peWO36AzBOZDcfMVtMPRMVQ09XKh84ZE4wA/sCSgJUQ94CBf6eQwkMBwMBh0L+/wMGDP74JEM3Jwk/CCAuOyInPCwcBz8JJjZDJUIAAAADAF3/uQNyAzcABwAYADcAAAEzFSMVIxEzAxcOAysBESEVIRUyPgITIx4DFwcuAycOAwcnPgM3ITUhNTMVIQLthYVSUrEKL1tjcUVGAYz+xUFrXlfx/wUyTmM2HTFdTz0TEz5OXDEeNmNOMgb/AAECUgECAmlD6AH5/rpDCg0HAgF1QfEDCAz+zyI+MyQIPwgfLTghITgtHwg/CCQzPiJAYmIAAAMAVf/AA24DNgAHABgAJAAAATMVIxUjETMDFw4DKwERIRUhFTI+AgEVIRUhESEVIRUhFQLphYVUVLEKM2BlbkBHAY/+wzxpYFz++gH8/bICPP4WAeICcUXNAdf+wUQJDAcDAXBC6AIHC/5tXT4BcT5cPAAABQBd/7UDcgM2AAcAGAAgACwAOAAAATMVIxUjETMDFw4DKwERIRUhFTI+AgcVIRUhNSE1FzIWFRQGIyImNTQ2FzI2NTQmIyIGFRQWAu2FhVJSsQowW2NxRUUBjP7FQWteVwwBD/2PARApdoODdnaEhHZOVlZOTldXAnNE0gHZ/stCCg0HAgFoQ+IDBwyAVz8/V75EPz9DQz8/RMkkIiMkJCMiJAACAFX/tgMvAzcACwAaAAABMxEjESMRIxEzETMlETI2NxcOAysBESEVAuBPT39NTX/9xlmNSQcoTFBWMjsBTgM3/H8B1v5XA0D+rLj+UAsQRAkLBQICN0MAAwBd/7UDKgM2AAsAGgAgAAABMxEjNSMVIxEzFTMHFw4DKwERIRUhETI2BzUhESM1AttPT3hOTnj/CChOUFYxOgFU/v1XjcICWlIDNv3r7ukCANSTQwgKBgMBkUL+9Av8Q/6//gAAAAADAF3/ygNEAzYACwAcACIAAAERIxEzFTMRMxEjEQcXDgMrAREhFSERMj4CAyEVIREzAmNOTnhPT/8IKU1PVjI6AVT+/SxOSEeEAhH9nVIB8/7GAm3wAQD9ZwFWU0MICgYCAZ5D/ugCBgr+dUMBIgAAAwBd/8IDTAM2AAsAGAAkAAABFSMRMxUzNTMRIzUHFw4BKwERIRUhFTI2AyEVITUhNSE1IRUhAmNOTnhPT/0IU6dVOgFU/v1WjmUCH/2QAf3+AQJQ/gMCK8EBurfJ/izJPkESCQFuQuoK/idC4VdB1gAAAAAEAF3/wwMqAzYACwAaAB4AIgAAATMRIzUjFSMRMxUzBxcOAysBESEVIREyNgMRIREBFSE1AttPT3hOTnj+CClOT1YyOgFV/vxYjboCUf3/AbADNv37594B7MyRQgkLBQIBikP+/Ar+CgFD/r0BA8LCAAAAAAQAXf/DAyoDNgALABoAIgAmAAABMxEjNSMVIxEzFTMHFw4DKwERIRUhETI2ATUzESERMxUFNSEVAttPT3hOTnj+CClOT1YyOgFV/vxYjgFFUf2zUgGq/lYDNv4W08oB0cWUQwkLBQIBh0P+/wv++2v+oAFga7JycgAAAAADAF3/ugNYAzcACwAcADUAAAEVIxEzFTM1MxEjEQcXDgMrAREhFSERMj4CFxUUHgIXBy4DJw4DByc+Az0BAmNOTnhPT/4IKU5QVjE6AVX+/CxNSUdxM1RuOyIxX1JBFBVBUV0yIzttVDMCCdUB8trr/a8BI1RCCQsFAgGRQ/71AgYKniMtUEAtCT8JIjI/JiY/MiIJPwktQFAtIwADAF3/sQNwAzYACwAaAEAAAAEVIxEzFTM1MxEjNQcXDgMrAREhFSERMjYFFRQeAhcHLgEnDgEHLgEnDgEHJz4DPQEzFRQWFz4DPQECY05OeE9P/ggpTlBWMToBVf78WI4BKBgvQyooQ1sXFVE/QlEUGFs/KStDLxhPPj8gLyAPAhXdAe7O3v375FFDCQsFAgGNQv74C6Q5I0Q7MA89F1k5N18bGls5NlkXPQ8yPEMhOTk9dCUUNDk6GzkAAAQAXf+3Ay4DNgALABoAKAA0AAABFSMRMxUzNTMRIzUHFw4DKwERIRUhETI2FzIWFRQGIyImNTQ+AhMyNjU0JiMiBhUUFgJjTk55Tk7/CClOUFYxOgFR/wBYjW+MoKCMi6ApTm9FZ3R0Z2dzcwIH3AH73Oz92PlNQgkLBQIBkUP+9QqmV09QV1dQJz4rFv70NjAwNTUwMDYAAgBb/7QDcwM3AAsAHAAAASMVMxUjESMRMxUzJREyPgI3Fw4DKwERIRUDc4yMjFJSjP06PGlhXjAJM2Jmbj9HAaECE8VE/qoDg99F/j0DBgwJRAkMBwMCTEQAAAADAFX/zANuAzYACwAcACIAAAEjFTMVIxUjETMVMwUXDgMrAREhFSERMj4CBRUhFSERA26FhYVUVIX+yAsyYWVuQEYBj/7DPGhgW/79Agr9ogJSmUXMAo6f50MKDQcDAaJD/uYDBwzC1UQBGQACAGL/tAMYAzcABwAYAAABMxEjESE1ISURMj4CNxcOAysBESEVAsZSUv7/AQH97jxlXFctCjFcYGtARQGYAzf8fQH6RKz+OQIHCwlECQwGAwJQRAADAGb/tQMXAzcABwAYAB4AAAEzESM1IzUzBxcOAysBESEVIREyPgIFNSERIzUCxVJS+/uVCS1WXmtDRAGY/rk+ZllS/rsCVlIDN/3n7kOmQgkMBgMBsEP+1gIHC/ND/sX4AAAABABm/7YDGAM4AAcAGAAeACQAAAEzESM1IzUzBxcOAysBESEVIREyPgIFNSERIxEzNSERIxECxVNT+/uSCTBaYGk/RAGd/rQ7ZFtV/poBKlJ6ASVSAzj9+uFDoUIJCwcCAaZD/uADBgvqQ/6wAQ1D/rABDQADAGj/xAMvAzYABwAYAB4AAAEzNTMRIxEjHwEOAysBESEVIREyPgIDIRUhETMByfxTU/xsCTBaYGk/RAGb/rc7ZFpV3QIE/apSAj74/XIBVHBDCQsHAgHBQ/7FAgcL/oRDARQAAwBo/8IDKgM3AAcAGAAgAAABMzUzESM1Ix8BDgMrAREhFSERMj4CAyEVIREhFSEByvtSUvtlCy5XXmpBRAGZ/rk9Y1lR4gII/aYCS/4HAlzb/f3mXUIJCwcCAaNC/uICBgv+UEIBQ0IAAAAAAwBm/8IDOQM3AAcAGAAkAAABMzUzESM1Ix8BDgMrAREhFSERMj4CAyEVITUhNSE1IRUhAcn8UlL8aAguV15rQkMBmP65PmVZUt0CEf2eAe/+DwJC/hECcMf+J9NXQAkLBwIBhEH+/gMGC/4xQdxTQdEAAAAFAGf/wAMXAzcABwAYACwAMAA0AAABMxEjNSM1MwcXDgMrAREhFSERMj4CARUyPgI3Fw4CKwE1MzUjNSEVFxEhEQMVMzUCxVJS/f2RCi5XX2xCRQGa/rk+ZllS/ukkOzYzGwgfOj4jgNDTASI2AR/XjwM3/h3OP5RBCQsGAgGPQf7zAgYL/p1fAQMGBT8GBwPaUj/MoQFt/pMBL/LyAAAABQBo/8IDFwM3AAcAGAAgADUAOQAAATMRIzUjNTMHFw4DKwERIRUhETI+Ahc1MxEhETMVBRUyPgI3Fw4DKwE1MzUjNSEVBTUjFQLFUlL9/ZAJLldfbEJEAZn+uT5lWlPCSv7hS/6vJDs2MxsIIDo9Ry0w0dMBIgELigM3/iXGP5ZACQsGAgGQQf7yAwYK/nX+iQF3dWJhAQMGBT4GBwMB3VM+zWCDgwAABABm/8MDGAM4AAcAGAAcACAAAAEzESM1IzUzBxcOAysBESEVIREyPgIBESERJRUhNQLFU1P7+5UJLVdea0JEAZj+uT5lWVL+zAJH/gkBpwM4/ffrQqBDCQsHAgGiQ/7kAgcL/hABP/7B/ry8AAAAAAQAZv/CAxcDNwAHABgAIAAkAAABMxEjNSM1MwcXDgMrAREhFSERMj4CEzUzESERMxUFNSEVAsVSUvv7lgkuVl5qQkQBmP65PWVZUsNQ/b1RAaL+XgM3/hjQQ5lDCQsHAgGXQ/7vAgcL/vhv/psBZW+zc3MAAwBm/7oDTgM4AAcAGAAxAAABMzUzESMRIx8BDgMrAREhFSERMj4CFxUUHgIXBy4DJw4DByc+Az0BAcn8U1P8ZwktVl5rQ0QBl/66PmZZUhsxU208IDNfUUAUFEFRXjIhPG1TMQJO6v2ZATpdQgkMBgMBrkL+1wIHC5EiLlJBLQpACSMyQCcmQTIjCUAKLkFRLiIAAAQAZv+2AxsDNwAHABgALAA4AAABMzUzESM1Ix8BDgMrAREhFSERMj4CBzIeAhUUDgIjIi4CNTQ+AhMyNjU0JiMiBhUUFgHK+1NT+2YJL1pfaT5EAZj+uTtjWlUURW9NKipNb0VFb00qKk1vRWdycmdncnICVOP93P5hQgkMBgMBqEL+3QIHC58WLD4pKD8rFxcrPygpPiwW/u42MzM2NjMzNgAAAwBm/7kDRwM3AAcAGAA3AAABMzUzESM1Ix8BDgMrAREhFSERMj4CASEeAxcHLgMnDgMHJz4DNyE1ITUzFSEBzPpSUvpjCS5XXmpCQwGY/rk9ZVlSAST++QIxUWk5GzNeUUAUFEBSXzMbOWpSMwL++QEHUwEIAmzL/gD2VUEICwYDAYxB/vYDBgv+4B88MiQHPwcdKjUfHzUqHQc/BiMyPSBAXl4AAAAABABo/8IDKgM3AAcAGAAkACgAAAEzNTMRIzUjHwEOAysBESEVIREyPgITMxUhNTM1IzUhFSMhFTM1Acr7U1P7aAktV15rQkQBm/63PWVZUpeM/ZKHfwJbgf72uQJh1v4N215DCQsHAgGgQ/7mAgcL/kxCQsxCQszMAAAAAAMAVv+2Ay4DNwADAAsAHAAAATMRIwMRMxEjESM1JxEyPgI3Fw4DKwERIRUC4E5OtE1NwcQvUEhEIggmSU9YNjoBUQM3/H8CKwFA/MIBukSm/ksCBQoIQwgKBgICO0IAAAQAYP+0Ay0DNgADAAsAHAAiAAABMxEjATM1MxEjNSMfAQ4DKwERIRUhETI+Agc1IREjNQLeT0/+nrZNTbZhCSdKTlg1OgFU/v0vT0dD6AJcUgM2/eEBNtb9++xhQQgJBQIBoUL+4wIFCflD/sj1AAAEAGD/ygNHAzcAAwALABoAIAAAAREjEQUzNTMRIxEjHwEOAysBESEVIRE+AQMhFSERMwMtT/6etE5OtGEJK09QUy86AVT+/VOMWwIS/ZxSAzf9aAKY+uf9kwFEaEIICgYCAbBC/tMBCv6LRAEgAAAABABg/8IDTgM2AAMACwAcACgAAAERIxEFMzUzESM1Ix8BDgMrAREhFSEVMj4CAyEVITUhNSE1IRUhAy1P/p+1Tk61YQcpS05WMzoBVP7+LU1IRYwCIf2OAgD9/gJT/gADNv4kAdzGtP4+zlFCCAkFAQF9QvkCBQn+K0HcU0HSAAAFAGD/wgMtAzYAAwALABwAIAAkAAABMxEjATM1MxEjNSMfAQ4DKwERIRUhETI+AgMRIREBFSE1At5PT/6hs01Ns18HJ0pOVzU6AVT+/S9PR0TYAkv+BQGqAzb9+QEtx/4U4mBCCAkFAQGZQv7rAgUJ/hABQ/69AQLAwAAABQBg/8EDLQM3AAMACwAcACQAKAAAATMRIwEzNTMRIzUjHwEOAysBESEVIREyPgIBNTMRIREzFQU1IRUC3k9P/p62TU22YgcnSk5XNToBVP79L09HRAEiUf21UQGp/lcDN/4RAR2+/ivUW0EICQUCAY9C/vUCBQn++Gr+nwFharV1dQAABABg/7oDXAM2AAMACwAaADMAAAERIxEFMzUzESM1Ix8BDgMrAREhFSERMjYXFRQeAhcHLgMnDgMHJz4DPQEDLU/+nrZNTbZiBytPT1MvOgFT/v9TjJszVG47HzJgUkIUFUFSXzMfO21UMwM2/aYCWubU/gbjZ0IICQUBAaRC/uAJjyMrTj8rCUAJITE+JSU+MCIJQAksPk4rIwAABABg/7YDcAM2AAMACwAcAEIAAAERIxEFMzUzESM1Ix8BDgMrAREhFSERMj4CBRUUHgIXBy4BJw4BBy4BJw4BByc+Az0BMxUUFhc+Az0BAy1P/qGzTU2zXwcqT1BTLzoBVP79KkxISAEFGC9DKihDWxcUUT9CURQYWz8oKkMuGU89PyAwHxADNv3xAg/iz/4Q3mRCCAkFAQGeQv7mAgUJmjAjRDwwDzwXWjk3YBsaWzk2WRc8EDI8QyEwMD10JRQ1OTsZMAAAAAAFAGD/twMxAzYAAwALABwAMAA8AAABESMRBTM1MxEjNSMfAQ4DKwERIRUhETI+AhcyHgIVFA4CIyIuAjU0PgITMjY1NCYjIgYVFBYDLU/+n7VNTbVhCShKT1c1OgFX/vouT0hESkVwTioqTnBFRm9OKipOb0ZndHRnZ3V1Azb94AIg5tP+FNdjQQgKBgIBn0L+5QIFCqAWKz4nJz4rFhYrPicnPisW/vU1MDA2NjAwNQAAAAACAGX/tQMYAzgACwAcAAABMxEjESM1MzUjNTMlETI+AjcXDgMrAREhFQLGUlL6+vr6/fE8ZVxXLQoxXGFrP0UBmwM4/H0BiEWFRFn+JAIHCwlECQsHAgJiQgAAAAMAZ//KAy8DNgALABwAIgAAATM1MxEjNSM1MzUjHwEOAysBESEVIREyPgIDIRUhNTMB2utTU+vr60QJLlZaZDxCAYf+zDddVVHKAgX9qlEChbH9afhBbNtBCQsGAgHiQ/6jAwYK/qxD/QAAAAMAZv/AAzcDNwALABwAKAAAATM1MxEjNSM1MzUjHwEOAysBESEVIREyPgIDIRUhNSE1ITUhFSEB3udSUufn5zkIK1NZZD5AAYX+zDldU07GAg/9oAHv/g8CQv4RAq2K/h+AP1ilQQgKBgIBmUH+6QIGCv5BQdtVQNIAAAADAGb/uQNrAzcACwAcAEIAAAEzNTMRIzUjNTM1Ix8BDgMrAREhFSERMj4CFxUUHgIXBy4BJw4BBy4BJw4BByc+Az0BMxUUFhc+Az0BAeDlUlLl5eU3CS1WWWM7QAGG/ss2XFRQyhguQyspQlsXFFI/QlAUGFpAKSpDLhlPPT8gMB8QApif/e6PQWK0QgkLBgIBtUP+0AMGC48sI0U8MA49GFk5N2AbGlw5NlgZPQ8yPUMhLCw9dSYVNTk7GiwAAAAEAGj/tgMbAzcACwAcADAAPAAAATM1MxEjNSM1MzUjHwEOAysBESEVIREyPgIVMh4CFRQOAiMiLgI1ND4CEzI2NTQmIyIGFRQWAeHkUlLk5OQ4CS1VWWM7QQGG/sw2XFRPRW9OKipOb0VFbk0qKk1uRWdzc2dncXEClKP90KhBY7VBCQsHAgG6Q/7LAwYLkBYsPikoPisWFis+KCk+LBb+7zcxMzY2MzE3AAAAAwBW/7cDLgM4AAMADwAgAAABMxEjAzUzESMRIzUzNSM1JxEyPgI3Fw4DKwERIRUC4E5OtE1Nubm5zC9PR0IiCSZJTlc1OgFTAzj8fwKC6fzCAVdCekJS/kUCBQoIRAgKBgICQ0MAAAAEAGD/ygNHAzYAAwAPAB4AJAAAAREjEQUzNTMRIzUjNTM1Ix8BDgMrAREhFSMRMjYDIRUhETMDLU/+raVOTqWlpT8IKUxMTiw3AT7tTINLAhL9nFIDNv1nApm6qP2R5UFgx0IICgUCAc9C/rUL/qhEAQgAAAEANAAnA2MC7wAPAAAlIRUhNSE1IREhFSERIRUhAfQBb/zRAW3++wJg/fICF/7va0RE5gGeQ/7nQgAAAAIANf+vA2EDEwAPABUAAAEhFSE1ITUhESEVIRUhFSEBNSERIzUB9AFt/NQBbf75AmH98QIX/vD+mwJvUwF4QkJrATBCrEL+uUP+0O0AAAAAAgA1/8oDYQMJAA8AFQAAASEVITUhNSERIRUhFSEVIQEVIRUhEQH0AW381AFt/vkCYf3xAhf+8P77Ahz9kgFfQkJ1ATVCsEP++L9DAQIAAAACADX/wgNhAxMADwAXAAABIRUhNSE1IREhFSEVIRUhARUhFSERIRUB9AFt/NQBbf78Alv99wIT/vH++AIc/ZICZQGGQ0NnASZDoEP+uqNCASdCAAACADT/wQNgAxUADwAbAAABIRUhNSE1IREhFSEVIRUhARUhFSE1ITUhNSEVAfQBbPzUAW7+/wJW/fwCDf70/vUCKv2GAg797wJiAbFCQlUBD0KLQv5UWj/VTz/KAAQANf/AA2ADEAAPACMAJwArAAABIRUhNSE1IREhFSEVIRUhARUyPgI3Fw4CKwE1MzUjNSEVFxEhEQMVMzUB9QFr/NUBbf77Alz99QIT/vT+5Sc+NjIaBx43PiSE0NIBHzkBINqUAa9CQlgBCUGHQf5TWwEDBwU/BgcD1VE9yZoBY/6dASjr6wADADX/wANgAxAADwAkADkAAAEhFSE1ITUhESEVIRUhFSEXFRQeAhcHLgEnDgEHJz4DPQEFFTI+AjcXDgMrATUzNSM1IRUB9QFr/NUBbf77Al399AIT/vSyEyU6Jy43SBQUSTcvJzonFP6DJjs0MBkHHjY8Ri4vz9EBHwGsQkJZAQtBiELTRCNIQTcSORpaNzdaGjkTN0FHI0TXXAEDBgU9BQYDAdNRPcgAAAAAAwA1/8IDYQMUAA8AEwAXAAABIRUhNSE1IREhFSEVIRUhAREhESUVITUB8wFu/NQBbP76AmH98QIX/u/+pgJl/esBxQGHQ0NmASdDokL91QEp/tfopqYAAAMANf/CA2EDFwAPABcAGwAAASEVITUhNSERIRUhFSEVIRM1MxEhETMVBTUhFQHzAW781AFs/voCYf3xAhf+77RS/aVRAbj+SAGSQkJnAR5DmUL+vGL+qwFVYrFwcAAAAAIANf+6A2EDEQAPACgAAAEhFSE1ITUhESEVIRUhFSEXFRQeAhcHLgMnDgMHJz4DPQEB9QFs/NQBbv74AmL98AIZ/u8BMFJuPSAzX1FAFBRBUWAzHz5tUzABdkNDbAEvQ6pC5RwtTTwoCUAJIC48JCQ8LiAJQAkoPE0tHAADADX/tgNhAw4ADwAbACcAAAEhFSE1ITUhESEVIRUhFSEHMhYVFAYjIiY1NDYTMjY1NCYjIgYVFBYB9AFt/NQBbf75AmH98QIV/vIpj6Ojj5CkpJBqdXVqbXR0AXxCQmgBKkKmQupUTk5UVE5OVP78MjAwMjIwMDIAAAAAAgA2/7oDYgMRAA8ALgAAASEVITUhNSERIRUhFSEVIQEjHgMXBy4DJw4DByc+AzchNSE1MxUhAfUBbfzUAWz+/QJb/fYCEf70AQD+BzVPZDYcMl5RPxQUQFFfNBs4ZE40B/8AAQNSAQIBpkJCXwEMQohC/qMhOi8hBzwHHSo1ICE2KRwHPAcgLjsiQVVVAAAAAgA1/8ADYQMTAA8AGwAAASEVITUhNSERIRUhFSEVIQEVIRUhESEVIRUhFQH0AW381AFt/vsCYf3xAhf+7v74Ah/9jwJn/esCAAGkQkJgAQ9Ci0L+TFM9AVc9TjwAAAAAAgAr/7YDdQM3AAcAHwAAARUjESMRMxEFFT4BNxcOAyMnMjY3NSMRIRUhFSEVA3WOUlL+iT13OQZHk4+IOww3ekK2Abv+lwFwAcRF/jcDgf6NUrIDCQg8DA4HAkUBArUBakLlQwAAAAADADD/ygNwAzcABwAfACUAAAEzFSMRIxEzAxcOAyMnMjY3NSMRIRUhFSEVIxU+AQUVIRUhNQLshIRSUowGR5SQhzoKNndCrQGh/rMBU6c8ef7fAgH9rQIHRP7NAqf+OzwNDwgCRAECcwEwQqtDbwQKp7VD+AAAAAADADH/wANwAzcABwAfACsAAAEzFSMVIxEzAxcOAyMnMjY3NSMRIRUhFSEVIxU+AQEVIRUhNSE1ITUhFQLwgIBSUooERZORij4INnk/qAGg/rEBVqw/e/7MAhj9mAH3/gYCSwJdRM0B6/6HOQsNCAJAAgJbAQZBhEFYAwn+oVdA1FE/zQACACr/tgMrAzcACwAjAAABMxEjESMRIxEzETMFFT4BNxcOAyMnMjY3NSMRIRUhFSEVAtxPT2xNTWz+ZzFdKgU3enpyLgsrZjmcAXz+1QEzAzf8fwHJ/mYDPv6fULADBwU8CQwGA0UBArMBaULlQgAAAwAw/7cDaQM4AAsAIwBHAAABFSMRMxUzNTMRIzUHFw4DIycyNjc1IxEhFSEVIRUjFT4BFxUUHgIXBy4BJw4BBy4BJw4BByc+Az0BMxUUFhc+AT0BAm9OTmtOTuQGNnl4biwLKmk5lQFw/uABJZMtWeYYL0MqJkVaFxRTP0BSFBdbQicqQy8YTz4/QD8B+eUCEur8/dbrdDoKDAYCQgECbAEhQpxDaAIHlxciQTksDD4XVDY2WhkZWTY2Uxc+DS04QSEXFzlwJCVxNxcAAgA7/7QDEAM4AAMAGwAAATMRIwEVPgE3Fw4DIycyNjc1IxEhFSEVIRUCvlJS/shCfzwHSpiVjkAKOn1CtwHG/osBeQM4/HwBva8DCAg8Cw0IAkUBArIBckTrQwADADn/ygMxAzcAAwAbACEAAAERIxEDFw4DIycyNjc1IxEhFSEVIRUjFT4BASEVITUzAxNSSAZHlZOMPww8f0KtAav+pwFfsj94/uICEP2eUgM3/WECn/4uOwoNBwNDAgJ/AS5DqUJ8Awj+r0P6AAAAAwA6/8ADNAM2AAMAGwAnAAABESMRAxcOAyMnMjY3NSMRIRUhFSEVIxU+AQEhFSE1ITUhNSEVIQMVUkUFR5aUjj8LPH9CrAGl/q8BW7E/ev7WAhz9kwH9/gECUP4DAzb+HwHh/o86Cg0HA0ECAl0BBUCFQFoDCP5EQdhTQNAAAAAEADv/wgMVAzYAAwAbAB8AIwAAATMRIycXDgMjJzI2NzUjESEVIRUhFSMVPgEBESERJRUhNQLDUlJHBkmYlIs9Cjl+Ra4Bsf6hAWW3P3j+igJL/gUBrAM2/eCDOwwOBwJCAQJqARtDlkJnBAr+MQEn/tnmpKQAAAAEADj/wgMVAzYAAwAbACMAJwAAATMRIycXDgMjJzI2NzUjESEVIRUhFSMVPgEXNTMRIREzFQU1IRUCw1JSSQVJmJOLPAw5f0WsAab+qwFesT94hlH9tFIBqf5XAzb9/HY7DA8HA0IBA2ABHEOWQ10ECvNe/rgBSF6oaGgAAwA5/7kDPwM2AAMAGwA0AAABESMRAxcOAyMnMjY3NSMRIRUhFSEVIxU+AQcVFB4CFwcuAycOAwcnPgM9AQMVUkgFR5eVjD0LOYFFrwGr/qYBYLA/eC0wUmw9HjNeUUAUFD9RXzMePWxRMAM2/YYCev5TPAwPBwNDAgNvASRDn0JrAwqOHypIOScJQAgeLTkjIzktHghACSc5SCofAAAAAAQAOf+3AxwDNwADABsAJwAzAAABESMRAxcOAyMnMjY3NSMRIRUhFSEVIxU+AQcyFhUUBiMiJjU0NhcyNjU0JiMiBhUUFgMVUkgFR5eUjT0LOYFFrwGr/qYBYbE/eFKSm5uSkpubkmdycmdncnIDN/3DAj3+VzsMDwgDQwIDagEkQ59CZgMKoExLS01NS0tM8S0tKy8vKy0tAAAAAAIANAAvA2MC6wAPABMAACUzFSE1MzUjESEVIREhFSMhFTM1AoLh/NHogAJg/fICF4P+7MNzRETXAaFE/uVC19cAAAAAAgA1/7oDYgMCAAcADwAAARUhESEVIRUFFSERIxEhNQL8/agCTf4HAmr+kFL+lQHpQgFbQ9a3Q/7LATVDAAAAAAIANf+0A2EDFAAHABUAAAEVIREhFSEVBSEVIREjNSE1ITUhNSEDBP2XAmH98QJ0/pMBClP95AET/pMDLAIsQgEqQqbjd/7i3EJ3QgADADX/ygNgAwoABwAPABUAAAEVIREhFSEVByEVIRUjNSEXFSEVITUDA/2YAmH98bgDK/6eUv6JuQIc/ZICD0MBPkO4okOxsWK7Q/4AAgAu/8ADXAMaAAcAFwAAARUhESEVIRUFIRUhFSEVIRUhESE1ITUhAvr9mgJe/fYCdP6SAQ795gIj/YkBDP6UAy4CNkMBJ0Ki3W1BqUIBLG1BAAAAAgA0/8EDYAMVAAcAGwAAARUhESEVIRUFIRUhFSEVIRUhNSE1ITUhNSE1IQMA/aECVv38Am3+lAEE/fECKv2GAg797wEM/pIDLAJIQgEPQovMWclaP9VPPllCAAADAC7/ugNcAyIABwAnACsAAAEVIREhFSEVBSEVIREhESMVIxUyPgI3Fw4CKwE1MzUjNSE1ITUhBRUzNQL6/ZoCYP30AnT+kQEa/tk60iQ9NjQcByA8QCSB0tMBGv6UAy7+zZUCS0IBGUKVzFn+lAFTt14BBAYFPgYHA9ZWQFlC2PLyAAADADb/wwNhAxQABwATABcAAAEVIREhFSEVBSEVIREhESE1ITUhAzUhFQME/ZcCYf3xAnT+kwEK/ZsBCf6UAyuz/jsCL0IBJ0Oi2mn+1wEpaUP+baWlAAAABAA1/8IDYQMXAAcADwAXABsAAAEVIREhFSEVByEVIRUjNSEFNTMRIREzFQU1IRUDBP2XAmH98bgDLP6TUv6TAnJS/aVRAbj+SAI7QgEeQ5mXQ4GBsWj+qgFWaKxsbAAAAwA0/7kDYwMVAAcADwAoAAABFSERIRUhFQchFSEVIzUhBRUUHgIXBy4DJw4DByc+Az0BAwT9mAJg/fK6Ay/+kFP+lAHAMVJuPRs0YVNBFBVBVGE0Gz5uUjECMkIBJUKhmUJgYIUcJUExIQY/BhonNCEhNCcaBj8GIDJAJhwAAAADADX/twNhAw4ABwAaACYAAAEVIREhFSEVBSEVHgEVFAYjIiY1NDY3NSE1IQM0JiMiBhUUFjMyNgMC/ZkCYf3xAnT+k4CJo4+QpImC/pMDLLd1am10dG1qdQIoQgEoQqTYVgZTSE9TU09IUwZWQ/7GMDIyMDAzMwADAC//tQMXAzYABwAPAB8AAAEzESM1IzUzAxUhESEVIRUFFw4BBxEjEQ4BIycyPgICxVJSy8uJ/kUBsP6hAa4GQoZDUT93OQxElJmYAzb8f9xBATtEAT1Dtpc9CAsD/q4BTgICRQIECQAAAAAEADD/uQNoAzcABwAPAB8AQwAAATMRMxEjNSMTFSERIRUhFRM1DgEjJzI+AjcXDgEHFQUVFB4CFwcuAScOAQcuAScOAQcnPgM9ATMVFBYXPgE9AQIJuVJSuRf+agGT/r9DPXQ0Cj6OlZdHBT+CQgFDGC9DKihCWxcUUz9AUhQXW0ImKkIvGE8+P0I9AW8ByP3INgEkQAEGQIb+ro4CAUABBgoJOQoNA5IlESBBOS0NPRdVNjZbGBhZNjZTFz0NLTlBIBERN3AkJW83EQAEACn/tgMtAzcAAwALABMAIgAAATMRIwMRMxEjNSM1ExUhESEVIRUFFw4BBxEjEQYjJzI+AgLeT0+pTU2nQ/6VAWn+5gFGBi5lNE5mUgswd316Azf8fwE0Ajn8wMdAAR9DAShDoog8CAsD/tABKwZFAgYJAAYAOP++AzEDNwADAAsAEwAiACoALgAAATMRIyUzETMRIzUjEwchNSEVIRUTNQYjJzI+AjcXDgEHFQU1MxEhETMVBTUhFQLjTk7+vp9NTZ85Af6WAWX+7TtmVAoyeH16NAYuZDYBklT9lVQBw/49Azf91WoBsf3mMAEnQOpBaf6vjAZDAwUJBjoHCwORd1H+0QEvUZ1fXwAABgAw/7cDMwM3AAMACwATACMALwA7AAABESMRATMRMxEjNSMTFSE1IRUhFRM1DgEjJzI+AjcXDgEHFRcyFhUUBiMiJjU0NhcyNjU0JiMiBhUUFgMoTv7Ank1NnkP+mgFl/uozNl8qCi91fX03BjBgM7GZoaGZlaSimHB0dXBwdHUDN/2uAlL+NwG5/dwxAR4+9j95/qaXAwJBAQYKCToIDAOcFEtLS0xMS0lN7y4rKi4uKisuAAAAAAMAMP+1AxUDNgADAAsAGwAAATMRIwMVIREhFSEVBRcOAQcRIxEOASMnMj4CAsNSUoL+RAGx/qEBrgRAgUJSQn06C0OUmZsDNvx/Ak5CAURDv509CgsD/sABPAICRQIFCQAAAAAEADf/ygMpAzcAAwALABsAIQAAAREjEQMVIREhFSEVEzUOASMnMj4CNxcOAQcVByEVIREzAw9Shf5XAaL+sFlCfTkLQZCWmEgFPHw/hgIj/YtSAzf9VwKp/uRDASxDpv6RkwICRAEFCQg9CAoEl6BCAQEAAAMAOf/AAzADNwADAAsAJwAAAREjEQcVIREhFSEVEyEVITUhNSE1MzUOASMnMj4CNxcOAQcVIRUhAw9Sjv5jAZj+ui4CHv2RAf3+AXRAeTcKQJCXmEgFP4FAAYr+AwM3/hgB6OBAAQhAiP2pQNhVPmcCAkABBgoJOQoMA2vPAAAABQA4/8IDDwM4AAMACwAbACMAJwAAATMRIwMVIREhFSEVEzUOASMnMj4CNxcOAQcVBTUzESERMxUFNSEVAr1SUov+XwGc/rZVQno5C0KRlpZIBT1+PwE0Uf2uUQGw/lADOP3yARlCARdDkv63ewICQwEECAc7CAkDf1Ze/sABQF6hYmIABAA5/7kDUwM3AAMACwAaADMAAAERIxEDFSERIRUhFRM1BiMnMj4CNxcOAQcVNxUUHgIXBy4DJw4DByc+Az0BAw9Shv5YAab+rEV4agtBkJaXSAVCiEKwMFJsPSAyXlE/FBQ/UV8zHj1sUTADN/15Aof+/UIBGUOU/oqaA0MBBQgHOwkKBJ07JypIOScIPggeKzkjIzksHgg/CCc5SConAAQAOf+4AxUDNwADAAsAKQA1AAABESMRAxUhESEVIRUXFT4BMzIeAhUUBiMiJjU0NzUOASMnMj4CNxcGAzI2NTQmIyIGFRQWAw9Siv5eAZ3+taAXMx1Fb04poIuLoHM/eDcLQZGWl0gFfxxncnJnZ3JyAzf9xgI6/vtCARtCl9FxBAMVKTsmTVNTTVwogQICRQEFCAc9D/6QMy4tMzMtLjMAAAAAAgA1/7UDYQMHAAcAEwAAARUhESEVIRUFFSMRIxEjESMRIzUC/P2oAkz+CAJp0lLkUdMB70IBWkPVu0P+xAE8/sQBPEMAAAAAAwA1/8oDYAMKAAcAEwAZAAABFSERIRUhFQchFSMVIzUjFSM1IRcVIRUhNQMD/ZgCYf3xuAMrz1GfUf7luAIg/Y4CEkIBOkO1oEO3t7a2b7ND9gAAAwA0/8EDYAMXAAcAGwAfAAABFSERIRUhFQUjFTMVIRUhFSE1ITUhNTM1IzUhBTUjFQMA/aECVv38Am3Xb/3xAir9hgIO/e983gMs/tfUAkxCAQ1Cic1cyVo/1U8+XEKeXFwAAAQANv/DA2EDFAAHABMAFwAbAAABFSERIRUhFQUjFTMRIREzNSM1IQU1IxUFNSEVAwT9lwJh/fECdNt4/Zt73gMr/tTQAUn+OwIyQgEkQqDabP7XASlsQq5sbOelpQAAAAQANv+3A2EDEAAHABoAIQAtAAABFSERIRUhFQUjFR4BFRQGIyImNTQ2NzUjNSEFNSMVNjMyFzQmIyIGFRQWMzI2AwH9mgJh/fECdM4zN6SPj6Q4NM0DK/7h7TVARZt2amp2dmpqdgItQgElQqHddRRBLU9TU08tQhR0Q6JfXgmiMDIyMDAzMwACADQALwNiAuUABwALAAABFSERIRUhEQMhFSEDBP2YAl/98rkDLvzSAYlDAZ9E/uj+6kQAAwA1/7EDYQMVAAcACwARAAABFSERIRUhFQchFSEXNSERIzUDBP2XAmH98bgDLPzUWgJvUwIoQgEvQqumQq5C/t3hAAADADX/ywNgAxEABwALABEAAAEVIREhFSEVByEVIRcVIRUhEQMD/ZgCYP3yuAMr/NW6Ahz9kgIXQgE8Q7elQl/DQwEGAAMANf/DA2ADGgAHAAsAEwAAARUhESEVIRUHIRUhFxUhFSERIRUDAv2cAlv997sDK/zVtwIb/ZMCZAI0QwEpQqSjQ6OmQgEqQgAAAAADADX/wQNhAxkABwALABcAAAEVIREhFSEVByEVIRMVIRUhNSE1ITUhFQMA/aECVv38vgMs/NS0Air9hgIO/e8CYgJLQgEQQoyKQ/7fXEDZVkDTAAAFADb/wANgAx0ABwALAB4AIgAmAAABFSERIRUhFQchFSETFTI+AjcXDgErATUzNSM1IRUXESERAxUzNQMB/ZwCXP32uQMq/NakJz42MhoHLVM3hNDSAR85ASDalAJGQgEZQpWPQv7nXQEDBgU/CQbWVT3MnAFo/pgBLO/vAAAAAAQANv/FA2EDGgAHAAsADwATAAABFSERIRUhFQchFSETESERJRUhNQME/ZcCYf3xtwMr/NVjAmX96wHFAjFCAStDpp1D/nQBKf7X56WlAAAABAA1/8QDYQMaAAcACwATABcAAAEVIREhFSEVByEVIQU1MxEhETMVBTUhFQME/ZcCYf3xuAMs/NQCclL9pVEBuP5IAj5CAR5CmpxDqGL+qwFVYrFwcAAAAAMANf+6A2EDFwAHAAsAIgAAARUhESEVIRUHIRUhBRUUHgIXBy4DJw4BByc+Az0BAwb9lQJi/fC4Ayz81AHBMFJuPSAzX1FAFCukah8+bVMwAiRCATVCsZ5DRB0sTTwpCUEJIC48JUtbEkEJKTxNLB0AAAAABAA1/7cDYQMTAAcACwAXACMAAAEVIREhFSEVByEVIQUyFhUUBiMiJjU0NhMyNjU0JiMiBhUUFgMC/ZkCYf3xuAMs/NQBlY+kpI+PpKSPanZ2amp2dgIkQgExQq2YRE1UTk5UVE5OVP78MjAwMjIwMDIAAAADADj/tQMQAzcAAwALABcAAAEzESMDFSERIRUhFQMnMj4CNxcOAwK+UlJ6/jwBuP6ajwtCk5iZSAVKmJaPAzf8fgIKQwFlQ9/+zEQCBQoIPAsNBwIAAAAAAgBv/7QDEwM3AAMAFAAAATMRIwERMj4CNxcOAysBESEVAsFSUv3/QW5jXjIJNGJockRIAagDN/x9Aun+PAMGDAlFCQwHAwJPRQAAAAMAa/+1AxUDNgADABQAGgAAATMRIycXDgMrAREhFSERMj4CATUhESM1AsNSUlgHMV9peUtKAab+rEh1ZVz+ggJYUgM2/eucQgkMBwMBkkL+8wMGDP75Q/7F+AAAAwBr/8oDMAM2AAMAFAAaAAABESMRAxcOAysBESEVIREyPgIBIRUhETMDFFJvCTFgZXFDRwGf/rJAbGFb/vkCE/2bUgM2/XUCi/5tQwkMBwMBrkP+2AMHDP5zQwEXAAAAAwBr/8MDLQM3AAMAFAAcAAABESMRAxcOAysBESEVIREyPgIBIRUhESEVIQMVUloIMWBpeEpKAab+rEdzZV3+6gIK/aQCSv4IAzf9/wIB/p5DCg0HAgGGQv7/AgcN/jtDAUVDAAMAa/+9AzMDNgADABQAIAAAAREjEQMXDgMrAREhFSEVMj4CASEVITUhNSE1IRUhAxRSWgkyYGl4SUoBp/6rRnNlXf7qAhH9nwHx/gwCRf4OAzb+OQHH/sZACg0HAwFnQeUCBw3+DEHlX0DcAAQAa//DAxUDNwADABQAGAAcAAABMxEjJxcOAysBESEVIRUyPgIBESERJRUhNQLDUlJaCDFgaXhKSgGm/qxHc2Vd/pgCRP4MAaQDN/37pEMJDAgDAYND/QIHDf33AUH+v/+9vQAEAGv/wgMVAzgAAwAUABwAIAAAATMRIycXDgMrAREhFSEVMj4CEzUzESERMxUFNSEVAsNSUloIMWBpeEpKAab+rEdzZV2LUf2+UQGg/mADOP4djEMJDAgDAYBC+wIHDf7hcf6ZAWdxs3JyAAADAGv/uQNGAzcAAwAUAC0AAAERIxEDFw4DKwERIRUhETI+AgcVFB4CFwcuAycOAwcnPgM9AQMVUlsIM2FpdkhKAaX+rUVyZV4bMFJsPCEyXlA/FBRAUV4zITxtUzEDN/2iAl7+hEIKDQcDAZRD/vICBw2WIDFUQy8LQAolM0MoKEM0JApACi9DVTEgAAMAYf+4A2YDNwADABQAOgAAAREjEQMXDgMrAREhFSERMj4CFxUUHgIXBy4BJw4BBy4BJw4BByc+Az0BMxUUFhc+Az0BAxVSWQgzYmp2SEoBqf6pRHNmX3gZLkMrKUJcFxRSP0JRFBhbPykqQy8YTz4/IDAgEAM3/fYCCv6bQwoNBwMBiUP+/QMHDbE6I0Q7Lw89F1o5N2AbGls5NlkXPQ8yPEMgOjo8dCUUNDk6GjoABABr/7YDGAM3AAMAFAAoADQAAAERIxEDFw4DKwERIRUhETI+AgcyHgIVFA4CIyIuAjU0PgITMjY1NCYjIgYVFBYDFVJaCDFgaXhKSgGm/qxHc2VdTkVwTioqTnBFRXBOKipOcEVndHRnZ3V1Azf92AIo/pNDCg0HAgGJQv78AgcNshcsQCkpQCwXFyxAKSlALBf+6TgzMzg4MzM4AAAAAAMAa/+5A0IDNgADABQALwAAAREjEQMXDgMrAREhFSEVMj4CEyMeAxcHLgMnDgMHJz4DNyM1IQMVUloINGJpdkdKAan+qURyZl/n/AQxTmU3HjFcTz4TEz1OXDEeOGNNMQX5AkwDNv36Agb+o0MKDAcDAYJD+wIHDP7yJEI1Jgg/CCAtOSIiOS0gCD8JJjRBJUMAAAAEAF//wAMiAzYAAwASAB4AIgAAAREjEQMXDgMrAREhFSERMjYTMxUhNTM1IzUhFSMhFTM1Aw1SeQw2ZWdrPEYBkv7Ab768iP2Tg3sCXH/+8L4DNv3/AgH+mkQJDAgDAYhD/wAN/kRCQsRCQsTEAAAAAwBQ/7YDdwM4AAcAFAAjAAABFSMRIxEzESURPgE3Fw4BKwERMxUzET4BNxcOAysBETMVA3eCUlL9rCFMLQk/Yyoo4oM0Vy0JHTU3OiMs7gHXRf4kA4L+n7/+UAEICUQOBQI4Q/5PAQkLRAcIBQECOEMAAAAEAFb/tQNyAzcABwAWACMAKQAAARUjFSMRMxUHFw4DKwERMxUjET4BJRcOASsBETMVIxE+AQc1IREjNQNydFJSiQkdNjc7IyvsnjZW/wAIP2cqJ9+RIlFqAlFSAkdF5QIa8I1EBwgDAQGMQ/77AQcLRA4FAYxD/vsBB/1C/sH9AAQAVv/KA3MDNwAHABYAIwApAAABMxUjESMRMwMXDgMrAREzFSMRPgElFw4BKwERMxUjET4BBxUhFSERAv51dVJSiQkdNjc7IyvsnjZW/wAIP2cqJ9+RIlEFAg/9nwIrRP7CAo7+ZEQHCAMBAZ5C/ugBBwhEDgQBoEL+5QIHrdRDARcAAAQASv/AA24DNgAHABQAIQApAAABMxUjFSMRMwMXDgErAREzFSMRPgEnFw4BKwERMxUjET4BBxUhFSERIRUC9Hp6UFCGCkBwQCvtnTNb/wo6Yzco45oqUg8CBf2oAlACUUXjAg3+jEAOBwGMRP75AQgMQQ0GAYpE/vwBBv+1RAE8QwAAAAQAVv/CA3MDOAAHABYAIwAvAAABMxUjFSMRMwMXDgMrAREzFSMVPgElFw4BKwERMxUjFT4BAxUhFSE1ITUhNSEVAv51dVJSiAgeNTc7IyvsnjZX/v8IP2cqJ+KUIlEQAhj9lwH3/gcCSgJzQ8kB0f65QgcHBAEBYkLeAQcJQw4EAWRC4AEH/oFiQeBcQNkAAAUAVv/CA3IDNgAHABYAIwAnACsAAAEVIxUjETMVBxcOAysBETMVIxE+ASUXDgErAREzFSMRPgEDESERJRUhNQNydFJSiQkdNjc7IyvsnjZW/wAIP2cqJ9+RIlFcAkP+DQGjAllE5AIF3ZhEBwgDAQGLQv77AQcLRA4FAYtC/vsCB/4LAUD+wP+9vQAABQBW/8IDcgM3AAcAFAAhACkALQAAARUjFSMRMxUHFw4BKwERMxUjFT4BJxcOASsBETMVIxU+AQE1MxEhETMVBTUhFQNydVJShgg6akUr7J42WP4JQmcrKN+RI1QBkVH9vFEBov5eAmdE0gHm0JhEDgUBgkL8AQcJRA4GAYVC/wIH/vdx/pgBaHG0cnIAAAAABABW/7kDcwM3AAcAFgAjADwAAAEzFSMRIxEzAxcOAysBETMVIxE+ASUXDgErAREzFSMRPgEXFRQeAhcHLgMnDgMHJz4DPQEC/nV1UlKJCR02NzsjK+yeNlb/AAg/Zyon35EiUfcxU208IDNfUUAUFUFRXjMiPG5TMgI7Rf7fAmL+d0QHCAQBAZNC/vMBCAlEDgYBlUL+8gEHjR0xVEItCkAJIzRBJydBNCMJQAotQlQxHQAABABW/7oDcgM2AAcAFgAjAEkAAAEzFSMVIxEzAxcOAysBETMVIxE+ASUXDgErAREzFSMRPgEFFRQeAhcHLgEnDgEHLgEnDgEHJz4DPQEzFRQWFz4DPQEC/nR0UlKJCR02NzsjK+yeNlb+/wk/Zyon35EiUQGYGC5CKylCWhcUUj9CURQYWT8pKkIvGE89PyAwHxACVkTeAgL+i0QHCAMBAYtC/vsBBwpFDgUBjUL++gEHnzUjRTwwDz0ZWTk3YBsaXDk2WRk9EDI9QyE1NT11JhU1OTsaNQAABQBW/7cDcgM2AAcAFgAjADMAPwAAATMVIxUjETMDFw4DKwERMxUjET4BJRcOASsBETMVIxE+ARcyHgIVFA4CIyImNTQ2EzI2NTQmIyIGFRQWAv50dFJSiQkdNjc7IyvsnjZW/wAIP2cqJ9+RIlHERW5NKipNbkWPnJ6NZ3FxZ2dycgJLROwCG/6FRAcIAwEBi0P+/AEHCUUOBQGOQ/76AQeiFys/KSlAKxdZUlFZ/us4MzM3NzMzOAAAAAAGAFb/tQNyAzcABwAWACMAKwA3AEMAAAEzFSMVIxEzAxcOAysBETMVIxU+ASUXDgErAREzFSMVPgEXFSEVITUhNRcyFhUUBiMiJjU0NhcyNjU0JiMiBhUUFgL+dHRSUogIHjU3OyMr7J42V/7+CUBmKiffkSJR8AES/YcBFSh2hIR2doWFdk9ZWU9PW1sCd0TPAdP+zEIHBwQBAVNC0AEICEIOBQFWQtICB3hXPz9Xw0Q/P0REPz9EyiUiIiUlIiIlAAAAAwBQ/7cDOgM3AAsAGAAlAAABMxEjESMRIxEzETMlET4BNxcOASsBETMVMxE+ATcXDgErAREzFQLsTk5pTExp/a8ZPiMIOVQcJMBxH0gnBzlbJyXGAzf8gAHP/l0DQP6muv5iAQcIRA0EAiZD/mECBwtEDgYCJkMABABR/7gDNgM2AAsAGAAlACsAAAEzESM1IxUjETMVMwcXDgErAREzFSMRPgEnFw4BKwERMxUjET4BBzUhESM1AulNTWVMTGXfCTlYJSTDeB1Dzwg3VR0ju3AaPC4CclIDNv3o7+cB/9WlQw0EAZdC/u8BBwdCDQQBl0L+7wEG80L+x/cABABR/8oDTwM2AAsAGAAlACsAAAERIxEzFTMRMxEjEQcXDgErAREzFSMRPgEnFw4BKwERMxUjET4BEyEVIREzAoRMTGVNTd8JOVglJMN4HUPPCDdVHSO7cBo8PAIh/Y1SAe/+ywJr8wEE/WcBUlhDDQQBnUL+6QEHB0INBAGdQv7pAQb+f0MBHwAAAAAEAFH/wgNYAzYACwAYACUAMQAAARUjETMVMzUzESM1BxcOASsBETMVIxU+AScXDgErAREzFSMVPgETIRUhNSE1ITUhFSEChExMZU1N3wk5WCUkw3gdQ88IN1YdIrtwGj05Aiz9gwIL/fMCXf32Aiu9Abe3yP4xxElCDQQBckHvAQcIQQ0EAXJB7wEH/ipB31lA1gAABQBR/8MDNgM2AAsAGAAlACkALQAAATMRIzUjFSMRMxUzBxcOASsBETMVIxE+AScXDgErAREzFSMRPgEDESERARUhNQLpTU1lTExl3wk5WCUkw3gdQ88IN1UdI7twGjwYAlz99AG8Azb9+uTfAfDPk0MOBAGHQv7/AQcIQw0EAYdC/v8BB/4JAUL+vgEBv78ABQBR/8IDNgM2AAsAGAAlAC0AMQAAATMRIzUjFSMRMxUzBxcOASsBETMVIxU+AScXDgErAREzFSMVPgEBNTMRIREzFQU1IRUC6U1NZUxMZd8JOVglJMN4HUPPCDdVHSO7cBo8AfNR/adSAbb+SgM2/hfUzwHTwZZDDQUBgEL6AQcIQwwFAYBC+gEH/vNs/p4BYmy0dHQAAAAEAFH/ugNcAzYACwAYACUAPgAAARUjETMVMzUzESMRBxcOASsBETMVIxE+AScXDgErAREzFSMRPgEFFRQeAhcHLgMnDgMHJz4DPQEChExMZU1N3wk5WCUkw3gdQ88IN1UdI7twGjwBOjNUbjseM19TQRUVQlNfMh87blQzAgPhAgPf8P2hASxZQw4EAZZD/vEBBwhDDQQBlkP+8QEHmiIrTj8rCT8IITA9JSU9MCEIPwkrP04rIgAABABR/7gDdQM2AAsAGAAlAEsAAAEVIxEzFTM1MxEjNQcXDgErAREzFSMRPgEnFw4BKwERMxUjET4BBRUUHgIXBy4BJw4BBy4BJw4BByc+Az0BMxUUFhc+Az0BAoRMTGVNTd8JOVglJMN4HUPPCDdVHSO7cBo8AdAYLkMqKEJbFxVRP0JRFBhbPygqQy8YTz4/IDAfEAIU3AHtzt/9+eVbQw0FAY5C/vgBBwhCDQUBjkL++AEHoy8jRTswDj4YWDk3XxoZWzk2WBg+DzI8QyEvLz11JRQ0OjsaLwAAAAUAUf+3AzsDNgALABgAJQA1AEEAAAEVIxEzFTM1MxEjNQcXDgErAREzFSMRPgEnFw4BKwERMxUjET4BBTIWFRQGIyIuAjU0PgITMjY1NCYjIgYVFBYChExMZU1N3wk5WCUkw3kdRMsJOVgdI790GkABDJKnp5JIc1ErK1FzSG15eW1qenoCCNkB9tnq/d70TkMNBQGIQv79AgcGQw0EAYpC/vwBB6dXUVFYFiw/KCk+Kxb+7zYzMTY2MTM2AAAAAAMAUP+3AyEDNgAHABQAIQAAATMRIxEjNTMlET4BNxcOASsBETMVMxE+ATcXDgErAREzFQLPUlKrq/3SIEkoCTleLSfdgjZdMwg8cEYt8wM2/IEB9UOr/kcCBwlEDQUCP0L+RwEIDEQOBwI/QgAAAAAEAE3/tQMhAzYABwAWACMAKQAAATMRIzUjNTMHFw4DKwERMxUjET4BJRcOASsBETMVIxE+AQc1IREjNQLOU1Ojo1UIHjg6PyUu+ag5Xf7xCD9hKijikSFNUQJmUgM2/ejwQ6NDBwgEAQGbQv7qAQcLRA0FAZtC/usBCPND/sH8AAQATf/KAzcDNgAHABYAIwApAAABMzUzESMRIx8BDgMrAREzFSMRPgElFw4BKwERMxUjET4BEyEVIREzAi2hU1OhTAgeODo/JS75qDld/vQHPWQrKOKRIU4OAhz9klICQPb9cwFUbEMHCAQBAbJC/tMBBwtDDgUBskL+0wIH/odDARYAAAQATf/CA0EDNgAHABQAIQAtAAABMzUzESM1Ix8BDgErAREzFSMVPgElFw4BKwERMxUjFT4BEyEVITUhNSE1IRUhAimlU1OlUQc7cEot+ag6Xf7yBz9iKijgjyBODwIm/YkCBf34Alr9+gJyxP4xzFFADgcBdUHzAQgKQQ4FAXVB8gEH/ixB31lB1wAABgBN/8IDIQM2AAcAFgAjADcAOwA/AAABMxEjNSM1MwcXDgMrAREzFSMVPgElFw4BKwERMxUjFT4BAxUyPgI3Fw4CKwE1MzUjNSEVFxEhEQMVMzUCzlNTpaVUBx44Oz8lLfmoOl3+8gc/Yioo4I8hTRMkPDYzGwkgOj4jgdHTASI4AR/YkAM2/i7NP5JABwgEAQF3QfUBBwpBDQUBd0H1Agb+lGUBAwYFPwYHA+JVPtClAXX+iwE4+voAAAAGAE3/wgMhAzYABwAUACEAKQA9AEEAAAEzESM1IzUzBxcOASsBETMVIxU+ASUXDgErAREzFSMVPgEBNTMRIREzFQUVMj4CNxcOAisBNTM1IzUhFQU1IxUCzlNTpaVUBzxvSi35qDpd/vIHP2IqKOCPIU0Bykv+4Ev+rSQ8NTMbCSA6PiOA0dQBIwEMigM2/i7NP5FBDAgBd0H1AQgKQQ4FAXdB9AEH/vB1/okBd3ViYQEEBgU/BgcD3VI/zl+DgwAFAE3/wwMhAzYABwAWACMAJwArAAABMxEjNSM1MwcXDgMrAREzFSMRPgElFw4BKwERMxUjET4BAxEhEQEVITUCzlNTo6NVCB44Oj8lLvmoOV3+8wc/Yioo4I8gTj8CU/39AbMDNv3+4kKfQgcIBAEBlEL+8QEHCEMOBQGXQv7vAQf+FwFD/r0BAb+/AAUATf/CAyEDNwAHABYAIwArAC8AAAEzESM1IzUzBxcOAysBETMVIxE+ASUXDgErAREzFSMRPgEBNTMRIREzFQU1IRUCzlNTo6NVCB44Oj8lLvmoOV3+8Qg/YSoo4pEgTAHGUf2uUQGw/lADN/4a0EOeQgcIBAEBj0L+9gEHCEQNBQGSQv70AQj+/3D+mQFncLRzcwAEAE3/uQNKAzYABwAWACMAPAAAATM1MxEjESMfAQ4DKwERMxUjET4BJRcOASsBETMVIxE+AQUVFB4CFwcuAycOAwcnPgM9AQIro1NTo04IHjg6PyUu+ag5Xf7zBz9iKijikSFNAQ8xVG48HzNgUkEUFEFSYDMgPG5UMgJN6f2ZATtgQwcIBAEBoEL+5QEHC0MOBQGgQv7mAQeLJy5RPywKQAkiMkAmJkAyIglACi1AUC0nAAAEAE3/uQNmAzYABwAWACMASQAAATM1MxEjNSMfAQ4DKwERMxUjET4BJRcOASsBETMVIxE+AQUVFB4CFwcuAScOAQcuAScOAQcnPgM9ATMVFBYXPgM9AQIro1NTo04IHjg6PyUu+ag5Xf7zBz9iKijikSFNAacYLkIrKENaFxRSP0JQFBhaPyoqQy4ZTz0/IDAgEAJU4v3+3V9CBwgEAQGaQ/7sAQcIQw4FAZ1D/uoBB5ksI0U8MA88GFk5N2AbGlw5NlkYPBAyPUMhLCw9dSYVNTk7GiwAAAAFAE3/twMlAzYABwAWACMAMwA/AAABMzUzESM1Ix8BDgMrAREzFSMRPgElFw4BKwERMxUjET4BFzIeAhUUDgIjIiY1NDYTMjY1NCYjIgYVFBYCK6NSUqNOCB44Oj8lLvmoOV3+8wg/Yyoo4ZAhTepGcE8qKk9wRo2hn49ndXVnZ3V1AlTi/d79XkMGCAQCAZlC/uwBCAhEDQUBm0L+6wEHohYrPignPisWV09RVv7zNjAwNjYwMDYABgBN/7YDMAM2AAcAFgAjACsANwBDAAABMzUzESM1Ix8BDgMrAREzFSMVPgElFw4BKwERMxUjFT4BBSEVITUhNTMHMhYVFAYjIiY1NDYXMjY1NCYjIgYVFBYCLqBSUqBLBx44Oj8mLPinOV3+8wc/Yioo4I8hTQEOARb9gQEXUip5hIR5eYSEeU9ZWU9RV1cCfLr+JONOQAcIBQEBcUHvAQgKQQ4FAXFB7gEHxD8/Vb5CPz9BQT8/QsYkISMkJCMhJAAAAAQAUP+3AzoDNwADAAsAGAAlAAABMxEjAxEzESMRIzUlET4BNxcOASsBETMVMxE+ATcXDgErAREzFQLsTk6lS0uD/tcYPSEHNlQbI7Z0IUsqCDlgKiXMAzf8gAIvATz8wwG+Q5/+YAEGCEQNBAIoQv5hAggLRA8GAiVCAAAFAFH/tgM2AzYAAwALABgAJQArAAABMxEjATM1MxEjNSMfAQ4BKwERMxUjET4BJxcOASsBETMVIxE+AQc1IREjNQLpTU3+5XpMTHpGCT1gKibJfiFL2gc2UBsitWoXOiQCbVIDNv3kATvQ/fvyZkIOBgGeQ/7oAQcIQwwEAZ5D/ukBBvFC/sT6AAAAAAUAUf/KA1EDNwADAAsAGAAlACsAAAERIxEFMzUzESMRIx8BDgErAREzFSMRPgEnFw4BKwERMxUjET4BEyEVIREzAzZN/uZ5TEx5RQk9YComyX4hS9oHNlAbIrVqFzpCAiL9jFIDN/1gAqD96f2NAUdqQg4GAa5D/tgBBwhCDQQBrkP+2QEG/otDARwABQBR/8ADVAM2AAMACwAYACUAMQAAAREjEQUzNTMRIzUjHwEOASsBETMVIxU+AScXDgErAREzFSMVPgETIRUhNSE1ITUhFSEDNk7+6XhLS3g/CjxhKibOgyFM2gc2UBohtWoXOEACKf2GAgv98wJe/fUDNv4mAdrItf5CyVJCDgUBd0H0AQcIQg0DAXdB8wEG/jBB3ldA1AAGAFH/wwM2AzYAAwALABgAJQApAC0AAAEzESMBMzUzESM1Ix8BDgErAREzFSMRPgEnFw4BKwERMxUjET4BAxEhEQEVITUC6U1N/uV6TEx6Rgk9YComyX4hS9oHNlAbIrVqFzoTAlz99AG8Azb99wEqzP4W3FtCDgYBlUL+8AIHB0INBAGVQv7xAQb+FAFB/r8BAL6+AAAAAAYAUf/CAzYDNgADAAsAGAAlAC0AMQAAATMRIwEzNTMRIzUjHwEOASsBETMVIxE+AScXDgErAREzFSMRPgEBNTMRIREzFQU1IRUC6U1N/uZ5TEx5RQk9YComyX4hS9oHNlAbIrVqFzoB+FH9p1IBtv5KAzb+EwEcvv4t0lhCDgYBi0P++wIHB0INBAGLQ/78AQb++Wv+nwFha7NzcwAAAAAFAFH/ugNcAzYAAwALABgAJQA+AAABESMRBTM1MxEjNSMfAQ4BKwERMxUjET4BJxcOASsBETMVIxE+AQUVFB4CFwcuAycOAwcnPgM9AQM2Tf7lekxMekUKPGEqJsl+IEvZBzZQGyK1ahc6AT8zVG47HjNfU0EVFUJSXzMfO25UMwM2/aICXunW/gjfZEMOBwGfQv7mAggGQw0EAaBC/uYCBpAjK04/KwlACSEwPiUlPjAhCUAJKz9OKyMAAAUAUf+3A3UDNgADAAsAGAAlAEsAAAERIxEFMzUzESM1Ix8BDgErAREzFSMRPgEnFw4BKwERMxUjET4BBRUUHgIXBy4BJw4BBy4BJw4BByc+Az0BMxUUFhc+Az0BAzZN/uV6TEx6Rgk9YComyX4hS9oHNlAbIrVqFzoB1RguQyooQlsXFVE/QlEUGFs/KCpDLxhPPj8gMB8QAzb9+QIH4M3+GNhjQg4GAZtC/uoBBwhCDQQBm0L+6wEGmS8jRDswDz0YWDk3XxsaWzk2WBg9EDI8QiEvLz10JRQ0OTobLwAABgBR/7cDOwM2AAMACwAYACUANQBBAAABESMRBTM1MxEjNSMfAQ4BKwERMxUjET4BJxcOASsBETMVIxE+AQUyFhUUBiMiLgI1ND4CEzI2NTQmIyIGFRQWAzZN/uV6TEx6Rgk9YComyX8hTNcINlMcIrVqGDwBE5KmppJIdFErK1F0SG14eG1teHgDNv3UAizk0f4I5GBDDgYBm0L+6gIHB0MNAwGbQv7rAQahVlBPVhYqPicoPioW/vU1MDE1NTEwNQAAAAMAUv+2AyADNgALABgAJQAAATMRIxEjNTM1IzUzJRE+ATcXDgErAREzFTMRPgE3Fw4BKwERMxUCzlJSpKSkpP3VHkgqCTxhJifegDZbMwg9b0Us9AM2/IABikOGQ1D+OQEHCUQNBQJPQ/44AQgLQw4IAlBDAAAAAAQATf+6A2YDNgALABoAJwBNAAABMzUzESM1IzUzNSMfAQ4DKwERMxUjET4BJRcOASsBETMVIxE+AQUVFB4CFwcuAScOAQcuAScOAQcnPgM9ATMVFBYXPgM9AQI7k1NTk5OTNwgeOTo/JS31pDpc/vEIPGImJ9yLH0kBrRguQisoQ1oXFFI/QlAUGFo/KipDLhlPPT8gMCAQApOj/fSXQVCrQwcIBAEBpEL+4QEHC0QNBQGkQv7iAQePLCRFPDAOPRhZOTdgGhldOTZZGT0PMj1EISwsPXYlFDQ6OxssAAAAAwA1ACkDYwLjAAcAFAAcAAABFSERIRUjEScXDgErAREhFSMRPgETIRUhNSE1MwMk/r0BOOaACEt+RTEBLdw5cH0BcPzSAWxSAZhDAY5C/vcZQxEIAY1D/voBCf7JQ0O9AAAAAAMANP+wA2ADEwAMABwAIgAAARcOASsBESEVIxU+ARchFSE1ITUzESEVIxUzFSEBNSERIzUBvApLhEUxATDfOXJ3AWz81AFvQgEt3eL+3f6ZAmxSAkVCEAgBKEKlAQrGQ0OAASJCpEL+oEL+49sAAAADADT/ygNfAw4ADAAcACIAAAEXDgErAREhFSMVPgEXIRUhNSE1MxEhFSMVMxUhARUhFSERAbwKTINFMQEw3zlxeAFr/NUBb0IBLNzh/t7+/gIV/ZkCPUIPCQErQqcBCclDQ4QBJEKmQ/7xx0MBCgAAAwA0/8EDYAMXAAwAHAAoAAABFw4BKwERIRUjFT4BFyEVITUhNTM1IRUjFTMVIQEVIRUhNSE1ITUhFQG8CkyDRTEBMN85cnYBbfzUAW5DAS3d4v7c/vYCKv2GAg797wJiAmxCEAkBBkGDAQqvQkJs/EGDQv5JWj/VTz7JAAQALv+/A1wDGAAPABwAIAAkAAABIRUhNSE1MxEhFSMVMxUhJxcOASsBESEVIxU+AQMRIRElFSE1Ae4BbvzSAWw/ATPh6v7ZPAhRgj0xAS7aM3DfAmf97AHBAXtCQngBJUShRFREDgcBLUSmAQn9iAEt/tPtra0AAAQALv+9A1wDHQAPABwAJAAoAAABIRUhNSE1MxEhFSMVMxUhJxcOASsBESEVIxU+AQE1MxEhETMVBTUhFQHuAW780gFsPwEz4er+2TwJUYM9MQEt2TNwAS9V/aJTAbb+SgGOQkJ4ARdEk0NUQw8HAR5ElwEJ/mZk/qgBWGSycnIAAwAu/7kDXAMYAA8AHAA1AAABIRUhNSE1MxEhFSMVMxUhJxcOASsBESEVIxU+ARMVFB4CFwcuAycOAwcnPgM9AQHuAW780gFsPwEz4er+2TwIUYI9MQEu2jNwfTBTbj0gM19RQBQUQVFfMx89bVIwAXtCQngBJUShRFREDgcBLUSmAQn+xRstTTwpCUAJIC48JCQ8LiAJQAkpPE0tGwAAAAQANf+2A2MDDgAMABwAKAA0AAABFw4BKwERIRUjFT4BFyEVITUhNTMRIRUjFTMVIQcyFhUUBiMiJjU0NhMyNjU0JiMiBhUUFgG9CkyDRjEBMN85c3UBcPzSAW1DAS3d4v7cKI+jo4+QpKSQanV1am10dAJBQxAIAShCpQELuENDcwEgQqND8VNNTVJSTU1T/wAyLi4yMi4uMgAAAAQAK/+3A3QDNgAHAA8AHAArAAABFSMRIxEzEScVIxEzFSMVJxcOASsBETMVIxU+ARcVPgE3Fw4DIycyNzUDdH9SUp306pl4BzxeLifjkiJKZT97PAVJlpOMPwp2hQHCRf46A3/+jAVDAVlC1BFCDQUBWULVAQdwpQMICDwMDQcBRAOoAAQAMv+1A3EDNgAHAB8ALAAyAAABFSMVIxEzFQcXDgMjJz4BNzUzETMVIxUzFSMVPgEnFw4BKwERMxUjFT4BAzUhESM1A3F9T0+GBkWTko0/DDl+QjztnqrhP3fwCj9hMCfimSVRfgJbVAI7RuMCJPumPgkNCQVHAQMCcgEbQ5hCbAMJskIMBQEdRJYBBv5fQ/7a4wADADH/zANxAzcABwA0ADoAAAEzFSMRIxEzAxcOAyMnMjY3NQ4BKwERMxUjFT4BNxciFSMUIwciBzMRMxUjFTMVIxU+AQUVIRUhNQL0fX1PT4cHRZOSjj8MOX9CMFMqJ+OZJVItCQIGAgcBCjXtnqrhP3b+zAIL/aECCEX+0QKj/i0/CQ0JBEcDA4cIAwEwRKoBBwtDAQECAgEmRKtDeAIJmbZD+QAAAAAEACv/wANtAzcABwAUACwAOAAAATMVIxUjETMFFw4BKwE1MxUjFT4BBRcOAyMnMjY3NTM1MxUjFTMVIxU+AQEVIRUhNSE1ITUhFQLwfX1SUv5LCTlfMCbciyNKAVEFR5SSiz8IN3lAQ+OTnN5Aff7IAiH9jQH+/gACUgJlRMoB4Ns+Dwb8P3wBBow5Cw0IAkECAmXxP31AVwMI/qBdQNlXP9IAAAcAK/+3A3EDNgAHAA8AHAAsADQAPABEAAABMxUjFSMRMwcVIxEzFSMVJxcOASsBETMVIxU+AQUXDgMjJzI2NzUzFT4BBxUhFSE1ITUXMhUUIyI1NBcyNTQjIhUUAvR9fVJSquzjk3MJOV8wJtyLI0oBUAdIl5SKOwg2eEJRP30lARb9gQEXKf39/v2srKsCYUbjAf74PgEHP4oUPw4FAQc/iQEIjTkOEAcCQQECX1sECm1OPz9OtWxsbGygNDQ0NAAAAAAEACz/tgM6AzcACwATACAAMAAAATMRIxEjESMRMxEzBxUjETMVIxUnFw4BKwERMxUjFT4BFxU+ATcXDgMjJzI2NzUC7U1NZ01NZ+jNxnttCTlbFiK+cxk/VDNkLgQ6f352MAotajkDN/x/AdP+WQNB/qkBQQFSQs8RQg4FAVVC0QIIapECBwY7CgwHAkUBApQAAAAAAwA0/6kDbgM2AAsAMQBXAAABFSMRMxUzNTMRIzUlFwczETMVIxUzFSMVPgE3Fw4DIycyNjc1DgErAREzFSMVPgEBFRQeAhcHLgEnDgEHLgEnDgEHJz4DPQEzFRQWFz4DPQECgktLaExM/isKITTAeIGuMWArBjl+e3IuCSpnOSRKJCXCeBpEAcoYLkQrLEJZFxZUPTpOFBlcPysrRTAaTjg8HzAgEQH65gIV6/j92Ow3QgYBEkKYQmQDCAc7DA0HAUMBAnIHAwEaQpYCBv7KISRGPjIPPBlaOTdeGxpZOTZXGDwQMj1EISMiPHInFDQ5OxsgAAQAOP+2Ax8DNgADAAsAGAAoAAABMxEjAxUjETMVIxUnFw4BKwERMxUjFT4BFxU+ATcXDgMjJzI2NzUCzVJSWfXunnQHPWMxKeeWJk5nQoA/Bk6fmZFBCz+ESAM2/IACDkIBW0LXE0IOBQFbQtcBB2amAwoIPA0OBgFEAQKoAAAABAA1/8QDMgM1AAMAEAAoAC4AAAERIxEBFw4BKwERMxUjFT4BBRcOAyMnMjY3NTMRMxUjFTMVIxU+AQEhFSERMwMYUv6ICTxiKiffjiBLAWEGS5qWj0AMP4RIMuybo9Q/eP7SAhf9l1IDNf1pApf+7kIOBgEoQqMBCK47DA4GAkMBAoABIUKjQ3UDCP6kQwEFAAAAAAMANP+1A2IDAgAHABQAHAAAARUhESEVIxUnFw4BKwERIRUjFT4BBRUhESMRITUDIf7FATPhewZLgkUxATHgOXEB5/6QUv6UAeRDAWFC3BhDDwkBYELbAQq1RP6/AUFEAAMANP+1A2ADFgAHABQAIgAAARUhESEVIxUnFw4BKwERIRUjFT4BBSEVIREjNSE1ITUhNSEDF/7OAS3afQhLgUUwAS/cOW4B5P6UAQVS/eYBFf6SAywCKEIBMEOrGEEQCQEwQ6sBCeF3/tviQ3dCAAAEADT/ygNfAwwABwAUABwAIgAAARUhESEVIxUnFw4BKwERIRUjFT4BBSEVIRUjNSEXFSEVIREDGv7LAS3cegdLgUUwAS/eOnD+twMr/ptS/oy4Ahr9lAIRQgE9QrkZQhAJAT1CuQEKp0Ozs2DFQwEIAAAAAAMANP/BA2ADFwAHABQAKAAAARUhESEVIxUnFw4BKwERIRUjFT4BBSEVIRUhFSEVITUhNSE1ITUhNSEDGv7LAS3cdwlLhEYxAS/eOnMB4P6UAQT98QIq/YYCDv3vAQz+kgMsAkhBARBBjhpCEAkBEEGOAQvWWspaP9VPP1pCAAAABAAu/7oDXAMkAAcAFAA5AD0AAAEVIREhFSMVJxcOASsBESEVIxU+AQUhFTMVMzUzESERIxUjFTI+AjcXDgMrATUzNSM1ITUhNSEBFTM1AxX+wwE04XkHUYE9MQEt2TNwAez+kTqZS/7QNdMqQDUvGAkcNT5NMzDT1QEZ/pQDLv7LmQJOQgEYRJISRA4HARxElQEJ1Vx2dv6bAUSvWwEEBwU9BgcEAdJVP19C/q91dQAGADX/twNgAxcABwAUADAAOABEAFAAAAEVIREhFSMVJxcOASsBESEVIxU+AQUhFSEVIxUjFTI+AjcXDgIrATUzNSM1ITUhBRUzFSE1MzUXMhYVFAYjIiY1NDYXMjY1NCYjIgYVFBYDGf7MASzbdwlLhEYxAS/eOnP+tQMr/pJOzipDODQbCR86QSaLzs8BGf6VAnGW/oeTKUJUVEJDVVVDIy0tIyQtLQJPQQEJQYcZQREIAQlBhwEKjENsxVoBAwcFPgYHA9NRPWhETj09TqY8OTY/PzY5PLEgHB0gIB0cIAAAAAAEADb/wwNhAxUABwAUACAAJAAAARUhESEVIxUnFw4BKwERIRUjFT4BBSEVIREhESE1ITUhAzUhFQMa/ssBLdx3CEuDRjEBMN86cwHh/pMBCv2bAQn+lAMrs/47Ai1CASpCphlCEQgBKkKnAQviav7XASlqQ/5spqYAAAAABAA0/7YDYAMOAAcAFAAnADMAAAEVIREhFSMVJxcOASsBESEVIxU+AQUhFR4BFRQGIyImNTQ2NzUhNSEDNCYjIgYVFBYzMjYDGv7LAS3cdwlLhEYxATDfOnMB4P6UgYijj5CkiYL+kgMstnZqanZ2amp2AitCASVCoRlCEQgBJUKhAQrcZAZRSE5TU05IUQZkQf68LjIyLjAxMQAABQAo/7cDNwM2AAMACwATACAAMAAAATMRIwMRMxEjNSM1ExUjETMVIxUnFw4BKwERMxUjFT4BBRcOAQcRIxEOASMnMj4CAupNTaNMTKtkzMV9ZQczVCUkwnkdQAEjBjNtN042ZSsKM3yDgwM2/IEBMQI7/MPBQQEVQgEyQ60RQQ0FATJDrgIHhzsKDAP+1QEmAgJDAgYKAAAEAC7/tgMdAzYAAwALABgAKAAAATMRIwMVIxEzFSMVJxcOASsBETMVIxU+AQUXDgEHESMRDgEjJzI+AgLLUlJa8+ybdgc9YjAp55YlTgFpBUOGQlJFgjwMRZeeoAM2/IACQEMBQkO8EkIOBQFCQ70CB588CwsE/soBMgIBRQEECgAAAAAFADX/ygM2AzcAAwALABgAKAAuAAABESMRAxUjETMVIxUnFw4BKwERMxUjFT4BEzUOASMnMj4CNxcOAQcVByEVIREzAx5SWvPol3QHPGEtJ+CPIkohSIk/C0OVnJ5LBDx7PZ8CM/17UgM3/VgCqP7fQQEpQacUQw0FASlBpwIH/oiXAgJEAgUJCD0ICwSbmkMBAwAABAA5/8ADPgM3AAMACwAYADQAAAERIxEHFSMRMxUjFScXDgErAREzFSMVPgEDIRUhNSE1ITUzNQ4BKwEnMzI2NxcOAQcVIRUhAx5SW/TqmnMHPGMrJ+CQIksgAjH9fgIR/e2NI0MgfQuPcOxwBkCBQAGF/e8DN/4lAdvlQAEAQX8TQQ0FAQBBfwIH/aQ/21c+XQEBQgcMOggLA2DRAAAAAAUAOv/CAx4DNQADAAsAGAAqAC4AAAEzESMDFSMRMxUjFScXDgErAREzFSMVPgEXFSERIREzNQ4BIycyJDcXDgETNSEVAsxSUlv06pl0BzxhLSfgjyJKawGG/aWDRYE8CpkBJpkGP4H1/kYDNf3iARhCARdBlBNCDgUBF0GUAgfRg/7eASJ/AgJDBg47Bwr+mp+fAAAGADn/wgMeAzYAAwALABgAKAAwADQAAAEzESMDFSMRMxUjFScXDgErAREzFSMVPgETNQ4BIycyPgI3Fw4BBxUFNTMRIREzFQU1IRUCzFJSWPftnXEHPWItJ+CQI0wdRoM/C0WWmppKBj99PwEvUf2mUQG4/kgDNv39AQ5CAQdCgxBBDgUBCUKGAQj+rIIDAkQBBAgHPAcKA4VHY/6zAU1jqGhoAAUAOv+3AyMDNgADAAsAGAA3AEMAAAERIxEDFSMRMxUjFScXDgErAREzFSMVPgEXFTYzMh4CFRQGIyImNTQ2NzUOASMnMj4CNxcOARMyNjU0JiMiBhUUFgMeUlv06pl0BzxhLSfgjyJKaywxRnBOKqKMjaFCPUODPApFlZqbSgU/gR1ndXVnanJyAzb9yQI3/vNCARhClBNCDgUBGEKUAgfRcQYVKTsmTFRTTTBFE34CAkMBBAgHOggK/pMyLi0yMi0uMgADADUAMANiAtkABwAUABgAAAEVIREhFSMRJxcOASsBESEVIxE+AQEhFSEDIf69ATroewdJf0UxAS/dOW3+vwMt/NMBf0IBnEP+6RlCEQgBmkL+6wEJ/upEAAAAAAQANP+2A2ADFAAHABQAGAAeAAABFSERIRUjFScXDgErAREhFSMVPgEFIRUhFzUhESM1Axf+zgEt2n0IS4FFMAEv3Dlu/rgDLPzUWQJsUgIjQwE0Q64YQhAJATRDrwEKp0KnQv7X5wAABAA0/8oDYAMKAAcAFAAYAB4AAAEVIREhFSMVJxcOASsBESEVIxU+AQUhFSEXFSEVIREDF/7OAS3afQhLgUUwAS/cOW7+uAMs/NS7Ahn9lQIMQgFAQrwZQhAJAUBCvAEKrUNUxkMBCQAEADX/wgNgAxQABwAUABgAIAAAARUhESEVIxUnFw4BKwERIRUjFT4BBSEVIRcVIRUhESEVAxf+zgEt2n0IS4FFMAEv3Dlu/rkDK/zVtQIb/ZQCYwImQgEwQqwYQRAJATBCrAEKoUOmo0IBKEMAAAAABAA0/8EDYAMUAAcAFAAYACQAAAEVIREhFSMVJxcOASsBESEVIxU+AQUhFSETFSEVITUhNSE1IRUDGv7LAS3cdwlLhEYxAS/eOnP+tAMs/NS1Air9hgIO/e8CYgJFQQEQQY4ZQRAJARBBjgEKl0L+41o/1U8/ygAABgAu/7oDXAMiAAcAFAAYACAANQA5AAABByERIRUjFScXDgErAREhFSMVPgEFIRUhBTUzESERMxUFFTI+AjcXDgMrATUzNSM1IRUFNSMVAxUB/sQBNOF4B1GCPTEBLtozcf69Ay780gKRS/7RTP6pJT43NBwJIDw/SC0w19oBJwEYmAJMQgEYRJIRQw4HARxElQEIlELJfv6MAXR+W14BAwcGPwYHAwHXXT/WW3d3AAAFADX/wgNgAxEABwAUABgAHAAgAAABFSERIRUjFScXDgErAREhFSMVPgEFIRUhExEhESUVITUDGv7LAS3cdwhLg0YxATDfOnP+tQMr/NVkAmX96wHFAihCAStCpxlCEQgBK0KnAQqjQv50ASn+1+elpQAAAAUANf/CA2EDFQAHABQAGAAgACQAAAEVIREhFSMVJxcOASsBESEVIxU+AQUhFSEFNTMRIREzFQU1IRUDGv7LAS3cdwhLg0YxATDfOnP+tQMs/NQCclL9pVEBuP5IAi1CASpCphlCEQgBKkKmAQqbQ6Rk/qgBWGSxcHAAAAAEADT/ugNgAwwABwAUABgAMQAAARUhESEVIxUnFw4BKwERIRUjFT4BBSEVIQUVFB4CFwcuAycOAwcnPgM9AQMa/ssBLdx3CEuDRjEBMN86c/60Ayz81AHCMFJuPSAzX1FAFBVAUV80Hz5tUzACHkIBMEKsGUIRCAEwQqwBCqBERxwtTTwpCUAIIC89JCQ8LyEIQAkpPE0tHAAAAAAFAC//tgNbAxgABwAUABgAJAAwAAABFSERIRUjFScXDgErAREhFSMVPgEFIRUhBTIWFRQGIyImNTQ2EzI2NTQmIyIGFRQWAxT+xAEz4HkHUYE9MQEt2TNw/r8DLPzUAZSUp6eUkqenkm15eW1td3cCM0QBKUShEEQOBwEtRKYBCaxCTVVOTlVVTk5V/v0yLi4xMS4uMgAAAAQANf+7A2EDFQAHABQAGAAzAAABFSERIRUjFScXDgErAREhFSMVPgEFIRUhBSEeAxcHLgMnDgMHJz4DNyE1IQMa/ssBLdx3CEuDRjEBMN86c/61Ayz81ALN/vgJN1FmOBw1YlRCFRRCVWI0HDhmUTcJ/vcCbgItQgEqQqYZQhEIASpCpwELpkKrIzosHQY+BhsqNyIiNyobBj4GHSw6I0IAAAAABAA4/7cDHAM2AAMACwAYACQAAAEzESMDFSMRMxUjFScXDgErAREzFSMVPgEDJzI+AjcXDgMCyVNTWPbunXUHPWMxKeeWJU/nCkOVm51LBk6dmZEDNvyBAgRDAWFD2xNDDgUBYUPbAgf+yEUBBAsKPA0OBwEAAAAABQA0/8oDNAM1AAMACwAYACQAKgAAAREjEQMVIxEzFSMVJxcOASsBETMVIxU+AQUXDgMjJzI+AgEhFSERMwMbUl3y6pl0CDxgLSfgjyJLAV8FTJyXkUEMQ5WanP7eAhT9mlIDNf1nApn+1EIBKkKmE0EOBgEqQqUBB5Q8DA4GAkQBBgr+mEMBAgAAAAAFADb/wAM6AzcAAwALABgAIgAuAAABESMRBxUjETMVIxUnFw4BKwERMxUjFT4BBRcGBCMnMj4CASEVITUhNSE1IRUhAxpSVvbsm3QIPWMtKOSTI04BYQWY/suGC0WVmpv+xAIx/X4CEf3tAmT97wM3/icB2elBAQZBhBRCDQYBBkGDAQeCOBIJQQEEB/4wP9xXPtEABgA5/8IDGgM1AAMACwAYACQAKAAsAAABMxEjAxUjETMVIxUnFw4BKwERMxUjFT4BBRcOAyMnMj4CAREhESUVITUCx1NTU/XrmnEHP2MtKOSTI08BXQVLnJiRQAtClJuc/nkCW/32AboDNf3hARJCASFCnRJADgYBIUKdAQeIOwsNCAJCAgUL/iMBKf7X56WlAAAAAAYAOf/CAxoDNgADAAsAGAAkACwAMAAAATMRIycVIxEzFSMVJxcOASsBETMVIxU+AQUXDgMjJzI+AhM1MxEhETMVBTUhFQLIUlJU9euacQc/Yy0o5JMjTwFcBUubmJBBC0KUmpuEUv2nUQG2/koDNv4G+EEBGUKWE0EOBQEZQpUBB4A7Cw0IAkEBBgv+/mT+rQFTZKxrawAAAwBb/7cDIAM2AAMAEAAdAAABMxEjARE+ATcXDgErAREzFTMRPgE3Fw4BKwERMxUCzlJS/d4kVjEIQmwtKfKEN180CT5yRy39Azb8gQLh/ksCCAtEDwYCPEP+SwEJC0MQBgI8QwAAAAAEAFf/ygNAAzcAAwAQAB0AIwAAAREjEQMXDgErAREzFSMRPgElFw4BKwERMxUjET4BEyEVIREzAyBTOwdAb0Is96YzXv70CUJsLSnzoiRWCgIU/ZpSAzf9dgKK/mpBDgYBmUL+6wEHDEIOBgGZQv7rAgf+dkMBHAAEAFf/wgNAAzYAAwASAB8AKwAAAREjEQMXDgMrAREzFSMVPgElFw4BKwERMxUjFT4BAyEVITUhNSE1IRUhAyBSOggcNTlBKSz6qT5a/u4HQmstKfOiI1cIAib9iQIH/fcCWf36Azb+PQHD/r9BBgcEAQFcQdoBBg5CDgYBXEHaAgj+FkHlXkHdAAAAAAUAV//CAyEDNgADABAAHQAhACUAAAEzESMnFw4BKwERMxUjFT4BJRcOASsBETMVIxU+AQMRIREBFSE1As5TUzsHQG9CLfinM13+9QhCai0q86IkVlMCUv3+AbEDNv4GlkMMCAF4QvMBCApCDgYBeELzAgf9+wFG/roBBMLCAAAABQBX/8IDIQM2AAMAEAAdACUAKQAAATMRIycXDgErAREzFSMVPgElFw4BKwERMxUjFT4BATUzESERMxUFNSEVAs5TUzsHQG9CLfinM13+/QhFbi4q86ImWQGnUf2wUgGt/lMDNv4lgUEOBgFxQu0BBwpCDgcBdELwAgj+63T+kwFtdLZ1dQAAAAQAV/+6A0oDNgADABAAHQA2AAABESMRAxcOASsBETMVIxE+ASUXDgErAREzFSMRPgEXFRQeAhcHLgMnDgMHJz4DPQEDIVM7B0BvQi34pzNd/vUJQ2stKfOiJFb5MVRuPB8zYFJBFBRBU2AzHzxuVDIDNv2mAlr+hEEOBgGNQv72AQgJQg4GAZBC/vQCB5MrLlFALAlBCSIyQCYmQDEjCUEKLUBQLSsAAAUAV/+2AyUDNgADABAAHQAxAD0AAAERIxEDFw4BKwERMxUjFT4BJRcOASsBETMVIxE+ARcyHgIVFA4CIyIuAjU0PgITMjY1NCYjIgYVFBYDIVM7B0BvQi34qTRe/vUIQmotKvOkJFfXRm9OKipOb0ZGcE4qKk5wRmd0dGdndXUDNv3kAhz+iUMOBgGDQv4BCAhDDgYBhkL+/wIHphcrPykpQCsXFytAKSk/Kxf+6zgzMzc3MzM4AAACAFf/tQN7AzgABwAcAAABFSMRIxEzEQUVMj4CNxcOAysBESE1ITUhEQN7k1JS/cI9a2NgMgk1ZGdvQEcBQv67AZYB00X+JwOD/psx0AIHDQpECQwIAwFXvEP+vgAAAAADAFr/twNyAzYABwAcACIAAAEVIxUjETMVBxcOAysBESE1ITUhFSEVMj4CBTUhESM1A3KFUlKoCDVkZm0+RwFB/r0BlP6/O2hiYP6UAkdSAlFE+AIh5atDCQwGAwEDd0P5gQMGDPlC/tHtAAADAFr/ygNyAzcABwAcACIAAAEzFSMRIxEzAxcOAysBESE1ITUhESEVMj4CBxUhFSERAu2FhVJSqAg1ZGZtPkcBQf69AZT+vztoYmD7Af/9rwIjRP7DApX+V0QJCwcCAQ5/Qv8AjAMGDLDIQwELAAAAAwBS/74DbgM2AAcAHAAkAAABMxUjFSMRMwMXDgMrAREhNSE1IRUhFTI+AgUVIRUhESEVAumFhVRUqwozYWZwQkcBP/6+AZX+wD9qYVz+9QH1/bcCQgJMRe0CHP5yQwkLBwIBA3VD94ACBgvwrkMBM0IAAAADAFr/wANyAzcABwAcACgAAAEzFSMVIxEzAxcOAysBNSE1ITUhFSEVMj4CARUhFSE1ITUhNSEVAu2FhVJSpwc1ZGZtP0YBQf69AZT+vztoYmH+9gII/agB4/4bAjYCckTOAdf+p0EICgYD6WJA32wDBgv+jGJA31g/1AAABABa/8IDcgM2AAcAHAAgACQAAAEVIxUjETMVBxcOAysBESE1ITUhFSEVMj4CAREhESUVITUDcoVSUqgINWRmbT5HAUH+vQGU/r87aGJg/qYCNf4bAZUCUUTtAhblokMJCwcCAQFzQ/V/AgcL/hwBMv7O8a+vAAAABABa/8IDcgM2AAcAHAAkACgAAAEVIxUjETMVBxcOAysBNSE1ITUhFSEVMj4CEzUzESERMxUFNSEVA3KFUlKoCDVkZm0+RwFB/r0BlP6/O2hiYIpR/cxRAZL+bgJfRdMB79ehRAkLBwL8b0LwegMGDP79bv6iAV5urW1tAAMAWv+5A3IDNwAHABwANQAAATMVIxEjETMFITUhNSEVIRUyPgI3Fw4DKwEFFRQeAhcHLgMnDgMHJz4DPQEC7YWFUlL9bwFB/r0BlP6/O2hiYDMINWRmbT5HAaswU2w8IDJdUT8UFEBRXjIgPG1TMAJCRv7gAlv4fEP+gwIHCwlDCQsHAjQaL1A/KwpACSEwPiYmPjAhCUAKKz9QLxoAAAADAFj/uQNyAzYABwAcAEIAAAEzFSMVIxEzBTUhNSEVIRUyPgI3Fw4DKwE1ARUUHgIXBy4BJw4BBy4BJw4BByc+Az0BMxUUFhc+Az0BAu2FhVJS/rD+vQGU/r9CbWBaLwgxXWVyRUcCSxguQyspQlsXFFE/QlEUGFo/KitDLhhPPj8gMCAPAlpE7AIM4nJD9HoDBgwJRAkLBwL8/rMnI0U8MA88GFo5OV8bGl05N1oXPBAzPEMhJyc9dSUUNTk7GicAAAAABABa/7cDcgM2AAcAHAAsADgAAAEzFSMVIxEzAxcOAysBNSE1ITUhFSEVMj4CBzIeAhUUDgIjIiY1NDYTMjY1NCYjIgYVFBYC7YWFUlKoCDVkZm0+RwFB/r0BlP6/O2hiYENEbU0pKU1tRImenolnb29nZ3BwAlZE+AIc/ndDCQsHAv5xQ/N8AgcLphYqPScnPSkWVU5OVv74NDAwNDQwMDQAAAADAFr/uQNyAzYABwAcADcAAAEzFSMVIxEzBSE1ITUhFSEVMj4CNxcOAysBBSMeAxcHLgMnDgMHJz4DNyM1IQLthYVSUv1vAUP+uwGW/r07aGJgMwg1ZGZtPkcCoPoFMk5jNh8xW049ExM9TlsyHjZkTTIF+gJKAllE5wII4m9D8ngCBwsJQwkLBwKfIkAzJQg/CB8tOCEhOCwfCD4IJDQ/I0IAAAQAWv/CA3IDNgAHABwAKAAsAAABMxUjFSMRMwMXDgMrATUhNSE1IRUhFTI+AhcVMxUhNTM1IzUhFSEVMzUC7YWFUlKoCDVkZm0+RwFB/r0BlP6/O2hiYHiG/ZqCegJT/ni8AlxF4wIC/oBDCQsHAvxxQ/N6AgcL7b1BQb1BQb29AAAAAAUAWv+2A3IDNgAHABwAJAAwADoAAAEzFSMVIxEzBSE1ITUhFSEVMj4CNxcOAysBBRUhFSE1ITUXMhYVFAYjIiY1NDYXMjY1NCYjIhUUAu2FhVJS/W8BQP6+AZT+wTtoYl8zBzVkZm0/RgGnAQ/9jwEQKXaDg3Z5gYF5UlhYUqsCa0TfAe7GYUDeawMGCghACQsGAh1VQEBVwD48PD4+PDw+uiEfICBAQAAAAAACAFD/twMvAzcACwAcAAABMxEjESMRIxEzETMFFT4BNxcOASsBETM1ITUhEQLgT09/TU1//cJNk1YGXaBTO/7+/wFRAzf8gAHb/lIDP/6yO8kBCQ9EEAkBULVD/sUAAAADAFz/tQMqAzYACwAeACQAAAEzESM1IxUjETMVMwcXDgMrAREhNSE1IRUhFTI2BzUhESM1AttPT3hOTnj6CStQUVUwOwEA/v4BUf8AVpHFAltSAzb90P/3AhjftkIICgYCAQR6QvqFC+tD/tzhAAAAAwBc/8oDRAM2AAsAIAAmAAABESMRMxUzETMRIxEHFw4DKwERITUhNSEVIRUyPgIDIRUhETMCY05OeE9P+QgqUFFWMDsBAP7+AVH/ACxOSkqIAhH9nVIB5/7OAnH8AQz9ZQFMakIICgYDAQh/Qv+HAgYK/phDAQ0AAwBa/74DOAM2AAsAHAAkAAABFSMRMxUzNTMRIzUHFw4BKwERITUhNSEVIRU+AQMhFSERIRUhAmdNTXZOTvkHXKFXOwEE/voBWf78TpJvAhj9lAJl/e8CA+gCC9/v/d/ubEISCwEGdUP5gwEM/npDATVCAAADAFz/wANKAzYACwAgACwAAAEVIxEzFTM1MxEjNQcXDgMrATUhNSE1IRUhFTI+AgMhFSE1ITUhNSEVIQJjTk54T0/5CCpPUVYxOwEA/v4BUf8ALE9KSY4CHf2SAf3+AQJQ/gMCKscBw7rK/iPRVEAICgUC6F9B3WoCBQn+MkDcVT/RAAAEAFz/wgMqAzcACwAeACIAJgAAATMRIzUjFSMRMxUzBxcOAysBNSE1ITUhFSEVMjYDESERJRUhNQLbT094Tk54+QgrT1FWMDsBAP7+AVH/AFaRtwJN/gMBrQM3/ejx5QH707BCCAoGAv90QvR/Cv4vATL+zvGvrwAEAFz/wgMqAzYACwAeACYAKgAAATMRIzUjFSMRMxUzBxcOAysBNSE1ITUhFSEVMjYFNTMRIREzFQU1IRUC209PeE5OePkIKlBRVjA7AQD+/gFR/wBWkQFFUf2zUgGq/lYDNv4Q2tEB18ShQggKBgP0aEHndAv7Z/6lAVtnsXFxAAMAXP+5A1gDNgALAB4ANwAAARUjETMVMzUzESMRBxcOAysBESE1ITUhFSEVMjYXFRQeAhcHLgMnDgMHJz4DPQECY05OeE9P+gkrT1FWMDsBAP7+AVH/AFeQlDNUbjshMV9SQhQVQlFeMiE7bVQzAgroAgTa6v2eATZ+QQkLBgIBBXpC+oULfxcrTj8sCUAJIjA/JSU/MCIJQAksP04rFwADAFz/uQNwAzYACwAeAEQAAAEVIxEzFTM1MxEjNSUhNSE1IRUhFTI2NxcOAysBBRUUHgIXBy4BJw4BBy4BJw4BByc+Az0BMxUUFhc+Az0BAmNOTnhPT/2DAQD+/gFR/wBWkU4IK1BRVTA7Al4YL0MqKENbFxVRP0BSFBhaQCkqQy8YTz4/IC8fEAIN5QH+1+f97Os3c0HyewoQQggKBgJIJiNDOi8OPRhXOTZfGxpZOTZWGD0PMTtCICYmPHIkEzM5OhkmAAAAAAQAXP+3Ay4DNgALAB4AMgA+AAABFSMRMxUzNTMRIzUHFw4DKwE1ITUhNSEVIRUyNhcyHgIVFA4CIyIuAjU0PgITMjY1NCYjIgYVFBYCY05OeE9P+QgrT1FWMDsBAP7+AVH/AFaRbkVvTioqTm9FRW9OKSlOb0VndHRnZ3NzAgXYAfne7v3X+GdCCAoGAv1zQfJ9CpIWKjwmJzwqFhYqPCcmPCoW/vszMDAyMjAwMwAABABa/78DPQM2AAsAHAAoACwAAAEVIxEzFTM1MxEjNQcXDgErAREhNSE1IRUhFT4BATMVITUzNSM1IRUjIRUzNQJnTU12Tk74B1yiVzsBBP76AVn+/E6TAR6P/X6SigJ0if7xvQID6AIL3+/93+5sQhILAQd0Q/mDAQz+ekJCr0FBr68AAgBX/7UDdQM4AAsAIAAAASMVMxUjESMRMxUzBRUyPgI3Fw4DKwERITUhNSERA3WNjY1SUo39NT1rY2AyCTVkZ29ARwFC/rsBlgIMw0T+sAOD6K7QAgcNCkQJDAgDAVe8Q/6+AAMAWv+3A3IDNgALACAAJgAAASMVMxUjFSMRMxUzARcOAysBESE1ITUhFSEVMj4CBTUhESM1A3KFhYVSUoX+0wg1ZGZtPkcBQf69AZT+vztoYmD+lAJHUgJkeESTAiGO/v5DCQwGAwEDd0P5gQMGDPlC/tHtAAAAAAMAWv/KA3IDNwALACAAJgAAASMVMxUjFSMRMxUzARcOAysBESE1ITUhESEVMj4CBxUhFSERA3KFhYVSUoX+0wg1ZGZtPkcBQf69AZT+vztoYmD7Af/9rwJKj0TVApWp/v5DCQsHAgEOgEL+/4wCBwuuyEMBCwAAAAMAWv+6A3IDNwALACAAOQAAASMVMxUjFSMRMxUzBSE1ITUhFSEVMj4CNxcOAysBBRUUHgIXBy4DJw4DByc+Az0BA3KFhYVSUoX86gFB/r0BlP6/O2hiYDMINWRmbT5HAaswU2w8IDJdUT8UFEBRXjIgPG1TMAJUfES4AlufWXxD/oMCBwsJQwkLBwIzGi9QPysKQAkhMD4mJj4wIQlACis/UC8aAAAAAAQAWv+3A3IDNgALACAAMAA8AAABIxUzFSMVIxEzFTMFFw4DKwE1ITUhNSEVIRUyPgIHMh4CFRQOAiMiJjU0NhMyNjU0JiMiBhUUFgNyhYWFUlKF/tMINWRmbT5HAUH+vQGU/r87aGJgQ0RtTSkpTW1EiZ6eiWdvb2dncHACZ3lEkgIei/5DCQsHAv5xQ/N8AgcLphYqPScnPSkWVU5OVv74NDAwNDQwMDQAAAAEAFr/0QNEAzYACwAcACAAJgAAARUjETMVMzUzESM1JxcOASsBESE1ITUhESEVPgElIxUzASEVIREzAmZNTXhNTfoIYaNROwEE/voBWf78SJUBUnh4/kECJf2HVAF0vgJwkqL9YN4KQhEKARB6Q/8AigEK4Jb+W0MBBwAAAgBU/7UDFwM4AAcAHAAAATMRIxEjNTMFFTI+AjcXDgMrAREhNSE1IRECxVJSq6v94jllXVwwCDNfY2k9RQE//r8BkQM4/H0B5kM02QIHCwlECQsHAgFftUP+xgADAFj/tgMYAzYABwAcACIAAAEzESMRIzUzBxcOAysBESE1ITUhFSEVMj4CBTUhESM1AsVTU6amlgc0YWJmOkQBO/7CAY7+xTZiXV3+wgJZUwM2/dwBCkPCQwgKBgIBBXlC+oMCBgr4Q/7W5wADAFj/ygMzAzYABwAcACIAACURIzUzNTMRJxcOAysBESE1ITUhESEVMj4CAyEVIREzAsWnp1PqCC9aYG1CRAE6/sQBjv7FP2dbVdoCDP2iUqUBYkbp/W/WQwgKBQIBEoVC/vqQAgUK/ppDAQwAAAAABgBP/7EDTAM2AAcAHAAkAC8APwBLAAABNSM1MzUzEQEhNSE1IRUhFTI+AjcXDgMrAQUzFSE1MzUzBRU+ATcXDgErAREFMh4CFRQOAiMiJjU0NhcyNjU0JiMiBhUUFgK9qKhS/UIBOv7EAY7+xjZgW1sxBjRfYGU5RAJHtP5Cu0/+TipmMA5DfTMsAdckPSwZGSw9JEleXkkqMzMqKjQ0ATrZRd7+BAEZdkH1fAIFCQdBCAkFAng9PUw45QINEUMVDQEqdQ4bJRgYJhsONzAwNpYZFxcZGRcXGQAAAAMAT/++AyMDNgAHABwAJAAAATUjNTM1MxEnFw4DKwERITUhNSEVIRUyPgIDIRUhESEVIQK9qalU8AkzX2BnO0UBOP7GAY3+yDdhW1raAgz9oAJZ/fsBIeNG7P3rhEMICgYDAQV1Q/eCAgYK/mRDATNCAAAAAwBY/8ADOwM2AAcAHAAoAAABNSM1MzUzEScXDgMrATUhNSE1IRUhFTI+AgMhFSE1ITUhNSEVIQLFp6dT6Ac0YWFnO0QBOv7DAY7+xjhiXVzcAhj9lwH1/gkCR/4MAWDfQrX+KntBCAoFAuhjQOBrAgYK/i5B21k/1AAAAAQAWP/CAxgDNgAHABwAIAAkAAABMxEjESM1MwcXDgMrAREhNSE1IRUhFTI+AgERIRElFSE1AsVTU6amlgc0YWJmOkQBO/7CAY7+xTZiXV3+0AJL/gUBqgM2/fEBBEPFQwgKBgIBA3hC+YECBgr+IQE1/svzsbEAAAQAWP/CAxgDNgAHABwAJAAoAAABMxEjNSM1MwcXDgMrATUhNSE1IRUhFTI+AhM1MxEhETMVBTUhFQLFU1OmppYHNGFiZjpEATv+wgGO/sU2Yl1dylH9t1IBpv5aAzb+E/FCvkMICgUC+3JD9HkCBQr+/mv+owFda69ubgADAFj/ugNOAzYABwAcADUAACURIzUzNTMRASE1ITUhFSEVMj4CNxcOAysBBRUUHgIXBy4DJw4DByc+Az0BAsWmplP9QwE7/sIBjv7FN2JdXDEIM2BiZztEAcQxU249HzNfUkEUFEFSXzMfPG5UMc0BVUPR/ZcBcn1D/4UDBgwJQwkMBgMwHS5RPisJQAkhMD4lJT4wIQlACSo/UC8dAAAAAwBY/7kDaAM2AAcAHABCAAABESM1MzUzEQEhNSE1IRUhFTI+AjcXDgMrAQUVFB4CFwcuAScOAQcuAScOAQcnPgM9ATMVFBYXPgM9AQLFpqZT/UMBO/7CAY7+xTZiXV0yBzRhYmY6RAJYGS5DKypCWxcUUj9CURQYWkAoKkIvGE8+PyAwIBABJgEJQsX98AEtdkP3gAIFCghDCAoFAkooI0U8MA88GFo5OWAaGV45N1kYPBAyPUMhKCg9dSUUNDo7GigAAAQAWP+2AxsDNgAHABwALAA4AAABESM1MzUzEScXDgMrAREhNSE1IRUhFTI+AgcyHgIVFA4CIyImNTQ2EzI2NTQmIyIGFRQWAsWmplPpBzRhYmY6RAE7/sIBjv7FNmJdXQxFbk4pKU5uRY+cnI9ncnJnZ3JyAQwBGELQ/daTQwgKBgIBBnlC+YUCBgqWFio+Jyg+KhZVUU9W/vU1MTA2NjAxNQAABQBY/7cDKwM2AAcAHAAkADAAOgAAATUjNTM1MxEnFw4DKwE1ITUhNSEVIRUyPgIXIRUhNSE1MwcyFhUUBiMiJjU0NhcyNTQjIgYVFBYCxaenU+kHM19iaDxEATr+xAGO/sU4Y11bHgEP/Y8BEFIqeYKCeXaDg3asrFJYWAFK+kOv/hSWQAkLBgLnY0DgagMGC8A/P1S5Pz8/Pz8/Pz/BQ0MjICAjAAAAAwBQ/7YDLwM3AAMACwAcAAABMxEjAxEzESMRIzUFFTI2NxcOASsBETM1IzUhEQLgT0+1TU1v/uZOlFgHXqFWO/DzAUIDN/x/Aj8BLPzEAcxEWMYJD0MQCgFMs0P+yQAABABc/7UDKgM2AAMACwAgACYAAAEzESMnESM1MzUzEScXDgMrAREzNSM1IRUjFTI+Agc1IREjNQLbT0+wbm5OmwkqUFBVMDrt7wE+7StNSkjlAlhSAzb90gYBAEPV/eiAQQgLBgIBBXpC+oUDBQrtQv7a5AAEAFz/ygNEAzYAAwALABwAIgAAAREjEQMRIzUzNTMRJxcOASsBETM1IzUhESMVMjYDIRUhETMDKk+wbm5OmwlTnV867O4BPuxWjl8CEf2dUgM2/V8Cof12AU9D6P2Gz0EQCwELg0D+/4sK/qJDAQ4ABABc/8ADSgM2AAMACwAgACwAAAERIxEDNSM1MzUzEScXDgMrATUzNSM1IRUjFTI+AgMhFSE1ITUhNSEVIQMqT7Bubk6cCSpOUFUxOu3vAT7tLE1JSIoCHf2SAf3+AQJQ/gMDNv4mAdr+LttCpv49b0AICgYC62JB4G0CBgr+NEDbWD/UAAAAAAUAXP/CAyoDNwADAAsAHgAiACYAAAEzESMnESM1MzUzEScXDgMrATUzNSM1IRUjFTI2AxEhESUVITUC209PsG5uTpoIK1BQVDA67e8BPu1WjrQCTf4DAa0DN/3jBwEAQ8L9+4NCCAkFAvl1QvR7Cf4uAS3+0+yqqgAAAAAFAFz/wgMqAzcAAwALAB4AJgAqAAABMxEjJzUjNTM1MxEnFw4DKwE1MzUjNSEVIxUyNgU1MxEhETMVBTUhFQLbT0+wbm5OngkrT1BTLzrt7wE+7VSNAUtR/bRSAan+VwM3/goH4kO2/iVpQQgKBQL1bkLudQvvZv6nAVlmsHBwAAQAXP+5A1gDNgADAAsAIAA5AAABESMRAzUjNTM1MxEnFw4DKwERMzUjNSEVIxUyPgIXFRQeAhcHLgMnDgMHJz4DPQEDKk+wbm5OmwgqT1BVMDrt7wE+7StNSkhxM1RuOyAyX1NBFBRBUl8yITttVDMDNv2bAmX95PND0/33cUEICgYDAQV8QfuFAwYKiRcrTj4rCUAJIjA+JSU+MCIJQAkrPk4rFwAAAAQAW/+sA20DNgADAAsAHABDAAABESMRAzUjNTM1MxEBMzUjNSEVIxU+ATcXDgErAQUVFB4CFwcuAScOAQcnLgEnDgEHJz4DPQEzFRQeAhc+AT0BAytOqHJyTv3a+PoBSflLj1QIWp1UOQJbGC5EKyxCWRcWVD0BOU0UGVxAKyxEMBlPDhwsHj9BAzb94QIf/eb3Q9D99gEtd0L5hQEJD0IRCjsxJEY+Mg87GFs5OVwbAhlZNzdZGDwPMj5EITUwHDw4MhMqdzYvAAAAAAUAXP+3Ay4DNgADAAsAIAAwADwAAAERIxEDNSM1MzUzEScXDgMrAREzNSM1IRUjFTI+AhcyHgIVFA4CIyImNTQ2EzI2NTQmIyIGFRQWAypPsG5uTpwKKk5QVjE67e8BPu0sTUpHS0VvTioqTm9Fj5ycj2d0dGdnc3MDNv3SAi798PJDyP4DbkEJCwcCAQR5QfiEAwYLlBUpPCYmPCkWU05OUv7+MjAuMzMuMDIAAAAAAgBU/7UDFwM4AAsAHgAAATMRIxEjNTM1IzUzBRUyNjcXDgMrAREhNSE1IRECxVJSt7exsf3iYrJkBzVhYGE1RAE1/skBiAM4/H0BfUOzQ8bbCxBECAoGAwFivEL+vwAAAwBY/7UDFwM2AAsAIAAmAAABMxEjNSM1MzUjNTMDFw4DKwERITUhNSEVIRUyPgIFNSERIzUCxVJSr6+vr7YIKU9YaUNAATD+zQGD/tA+YlNK/tcCWFIDNv3ZpkJ4Q/7eQgcJBAIBCnxD/ogCBQjuQ/7W5wADAFj/zgMzAzYACwAgACYAACU1IzUzNSM1MzUzESUXDgMrAREhNSE1IREhFTI+AgMhFSERMwLFrq6urlP++AgrUVlnQUEBL/7PAYP+0DxgVE3DAg79oFKj8UOGQpf9bdJDCAkFAQEWhEL++pMCBQn+okIBBQAAAAADAE//vgMjAzYACwAgACgAAAE1IzUzNSM1MzUzEScXDgMrAREhNSE1IRUhFTI+AgMhFSERIRUhAr65ubm5UvwJMl1eYzlDATn+xQGO/sc0XVlYzwIM/aACWf37ARSgQXlBh/3ejUMICgYDAQd2RPqCAgUK/mhDATNCAAAAAwBY/70DOwM2AAsAIAAsAAABNSM1MzUjNTM1MxElFw4DKwE1ITUhNSEVIRUyPgIDIRUhNSE1ITUhFSECxa+vr69T/vcGMltbXTVAATD+zQGD/tAxWFZWvQIY/ZcB9f4JAkf+DAFghkNeQm3+KnQ/CAkFAepkQOFtAgQJ/jBA3lk/1AAABABY/8MDGAM2AAsAIAAkACgAAAEzESM1IzUzNSM1MwMXDgMrAREhNSE1IRUhFTI+AgERIRElFSE1AsVTU6+vr6+1BylOWGlEQAEw/s0Bg/7QP2JTSv7kAkv+BQGqAzb98ZpCdEP+50MHCAQBAQV2QvaEAgQI/igBNP7M87GxAAAEAFj/wgMYAzYACwAgACgALAAAATMRIzUjNTM1IzUzAxcOAysBNSE1ITUhFSEVMj4CFzUzESERMxUFNSEVAsVTU6+vr6+1BypPWWhCQAEw/s0Bg/7QPmFTS99R/bpRAaT+XAM2/gqSQmxD/vJDBwgFAf1yQvN7AQUI+Wj+pQFbaLBvbwADAFj/tANMAzYACwAgADkAACU1IzUzNSM1MzUzESUXDgMrAREhNSE1IREhFTI+AhcVFB4CFwcuAycOAwcnPgM9AQLGsLCwsFL+9wgpT1hpQ0ABMP7NAYP+0D5hU0s3MFNtPSEyXlFAFBRBUl8zHzxuVDHE50F6Qo79jsFCBwkEAgEPgUP+/Y0CBQiLES5QPisJPwkhLz0lJj0vIAk/CSo/UC4RAAMAWP+tA2gDNgALACAARgAAATUjNTM1IzUzNTMRASE1ITUhFSEVMj4CNxcOAysBBRUUHgIXBy4BJw4BBy4BJw4BByc+Az0BMxUUFhc+Az0BAsWurq6uU/1DATD+zQGD/tA9YVNMJwgqUFhoQkACWBkuQysqQlsXFFE/QlIUGFpAKCpCLxhPPz8gMB8QAR6eQ3hDfP3oAS56Q/yDAQUIB0IICQQBQTIjRTwwDzwXWjk3YRoaXTk3WRg8EDI9QyEyMj11JRQ0OjsaMgAAAAQAWP+xAxsDNgALACAAMgA+AAABNSM1MzUjNTM1MxElFw4DKwERITUhNSEVIRUyPgIXMh4CFRQOAiMiJjU0PgITMjY1NCYjIgYVFBYCxq+vr69R/vgIKU9YaUNAAS/+zgGD/tE+YVNKCUVuTikpTm5Fi6ApTm9FZ3FxZ2dzcwEMpUJ0Q4z91otEBwkEAgEKe0L8iAIFCZQWKj4nKD4qFlZQJz4qFv70NjEwNjYwMTYAAwBQ/7YDLwM3AAMADwAgAAABMxEjAzUzESMRIzUzNSM1BRU+ATcXDgErAREzNSM1IREC4E9Psk1NdXV1/ulIjFEHW5hPOeXoATcDN/x/ApfZ/L0BSEOcQ7HJAQkORBAIAU+0Q/7HAAAEAFz/0gNEAzYAAwAPACIAKAAAAREjEQM1IzUzNSM1MzUzEScXDgMrAREzNSM1IREjFT4BAyEVIREzAypPqHp6enpOtwgqTUtOLDjg4gEx4EyGTAIR/Z1SAzb9XgKi/XXvQ3ZDkP2Fy0IHCQYCAQ6DQv79jgEJ/q1DAQgABQBc/8IDKgM3AAMADwAiACoALgAAATMRIyc1IzUzNSM1MzUzEScXDgMrATUzNSM1IRUjFTI2BTUzESERMxUFNSEVAttPT6h6enp6TrcIKUxMTyw44OIBMeBOhgFYUf20UgGp/lcDN/4HBYdCZkNw/h5nQQgJBQL7cUHwfAroZv6oAVhmr25uAAQAXP+5A1kDNgADAA8AJAA9AAABESMRAzUjNTM1IzUzNTMRJxcOAysBETM1IzUhFSMVMj4CFxUUHgIXBy4DJw4DByc+Az0BAypPqHp6enpOuAgoTExPLDjg4gEx4CdGREWFM1RuPCIyXlJBFRVBUl4yIjxuVDIDNv2RAm/94JZCbkKG/fJoQQgJBQEBDIBB/4wCBAmAFytMPSsJPwghMD0kJD0wIQg/CSs9TCsXAAAAAQA0ACUDYwL1ABMAACUhFSE1ITUhESE1ITUhESEVIRUhAfQBb/zRAW3++QIU/eoCZv3tAij+4WhDQ6kBFYxD/u+RQgACADT/vgNiAyAAEwAZAAABIRUhNSE1ITUhNSE1IRUhFSEVIQE1IREjNQH1AW380gFu/vsCDP3yAl/99AIf/uj+mgJwUgFKQ0Ne211A2l5A/tdD/vzBAAAAAgA0/78DYgMaABMAGQAAASEVITUhNSE1ITUhNSEVIRUhFSEFFSEVITUB9QFt/NIBbv77Agz98gJf/fQCH/7o/vwCHP2SATdDQ2LfYkDfYkDitUP4AAAAAAIALv/AA1oDGgATABsAAAEhFSE1ITUhNSE1ITUhFSEVIRUhARUhFSERIRUB7gFs/NQBbP77Agf99wJe/fkCFf7v/vQCIv2KAm4BWUJCWdJWQNNWP/7jk0IBFUAAAgA0/8ADYgMeABMAHwAAASEVITUhNSE1ITUhNSEVIRUhFSEBFSEVITUhNSE1IRUB9QFt/NIBbv77Agz98gJf/fQCHP7r/vQCMP1/AhT96gJnAZE+PknBSTq7Tjv+dVM8yEs7vwAAAAADADT/wgNiAyIAEwAXABsAAAEhFSE1ITUhNSE1ITUhFSEVIRUhAREhESUVITUB9QFt/NIBbv77Agz98gJf/fQCH/7o/q0CWf33AbgBYUJCVdVXQNNZQP4MARH+79COjgADADT/wgNiAyQAEwAbAB8AAAEhFSE1ITUhNSE1ITUhFSEVIRUhEzUzESERMxUFNSEVAfUBbfzSAW7++wIM/fICX/30Ah/+6LVR/aZRAbj+SAFrQUFX0VI/zlRA/uNY/sUBO1iiY2MAAAIANP+5A2IDGwATACgAAAEhFSE1ITUhNSE1ITUhFSEVIRUhFxUUHgIXBy4BJw4BByc+Az0BAfUBbfzSAW7++wIM/fICX/30Ah/+6AEvUm0+HWqlKiumahw+bVIwAVNCQlrWWEDVWUDMECtIOCUIQA5ZRUVZDkAIJThIKxAAAAAAAwA0/7cDYgMcABMAHwArAAABIRUhNSE1ITUhNSE1IRUhFSEVIQcyFhUUBiMiJjU0NhcyNjU0JiMiBhUUFgH1AW380gFu/vsCDP3yAl/99AIf/ugqlp+flpifn5htdXVtcHR0AVlCQlTXWT/VWkDUSUhISUlISEnlLCgqKioqKCwAAAAAAgAr/7YDcwM4AAcAIwAAARUjESMRMxEFFT4BNxcOAyMnMjY3NSM1ITUhNSEVIRUhFQNzi1JS/og/dzkGR5OQiDsNN3pCtgFo/pYBu/6YAXwBu0T+PwOC/oN3lQMJCDwMDgcCRQECmPFuQe1yQQAAAAMAMv+0A3EDNgAHACMAKQAAATMVIxUjETMDFw4DIycyNjc1IzUhNSE1IRUhFSEVIxU+AQU1IREjNQLug4NTU4oFRJCPij4MOXw/qQFR/q0Bp/6uAV2yPHb+cgJQVQIsRucCN/48PgkNBwRHAgJXy08/ylA/UwII3kT+4toAAAAAAwAw/84DcAM2AAcAIwApAAABMxUjESMRMwMXDgMjJzI2NzUjNSE1ITUhFSEVIRUjFT4BBRUhFSE1AuyEhFJSigZGk5CJPAo2ekCsAU3+sQGg/rIBX7E/eP7eAgT9qgINRP69ArD+GDsLDgcDQgICXtdXQNRaQFoDCZmcQ98AAAAEADH/twNwAzcABwAjAC8AOwAAATMVIxEjETMDFw4DIycyNjc1IzUhNSE1IRUhFSEVIxU+AQcyFhUUBiMiJjU0NhcyNjU0JiMiBhUUFgLshIRSUooGR5OQiDwJNnlArAFN/rEBoP6yAV+xPXpekJmZkI+amo9ncHBnZ3BwAjFE/v8CS/43OgwOBwJCAgJU0lJAz1VAUQMJi0pISEpKSEhK5y0oKC0tKCgtAAAAAgAs/7MDMgM3AAsAJwAAATMRIxEjESMRMxEzBRU+ATcXDgMjJzI2NzUjNSE1ITUhFSEVIRUC409PaU5Oaf5fNmMuBDh9fHUwCy1kN5IBHf7gAXH+4wEtAzf8fAHL/mcDPv6jiX8CBwU/CQsHAkgBAoL1b0PzckIAAwAs/7oDaQM3AAsAJwBLAAABFSMRMxUzNTMRIzUHFw4DIycyNjc1IzUhNSE1IRUhFSEVIxU+ARcVFB4CFwcuAScOAQcuAScOAQcnPgM9ATMVFBYXPgE9AQJvTU1rTk7hBjh6eHAuCytqOZUBHP7iAW3+5AEsli5Z4xkuRComRVoXFFM/QFIUF1xCJipDLxhPPkA/PwH56QIW6vv9zfWDOQoMBgFBAQJUyE08w1E9UQIHihQiQTgsDT0XVDc2WxgYWTY2Uxc9DS04QSEUFDdwJCVvNxQAAAAAAgA7/7QDEAM4AAMAHwAAATMRIwEVPgE3Fw4DIycyNjc1IzUhNSE1IRUhFSEVAr5SUv7KQn09BkqYlY5ACjp/QrkBbv6PAcL+kQGIAzj8fAGQlQMICDwLDQgCRQECmPFuQe1yQQAAAAADADj/ygMwAzcAAwAfACUAAAERIxEDFw4DIycyNjc1IzUhNSE1IRUhFSEVIxU+AQEhFSE1MwMVUkkGSpeTiz0MOX5CqgFU/qoBp/6rAWW5P3z+4AIS/ZxSAzf9WQKn/hs6Cw0HAkIBAljXV0DUWUFVAgn+w0PwAAADADr/wAM2AzcAAwAfACsAAAERIxEDFw4DIycyNjc1IzUhNSE1IRUhFSEVIxU+AQEhFSE1ITUhNSEVIQMVUkUFSZiUiz4LOX1CpAFM/rIBn/60AV+5P37+1gIe/ZEB/f4BAlD+AwM3/ggB+P53NgsNBwI9AQJKvUY4tE06RwMJ/lc90Ew9xAAABAA5/8IDFQM2AAMAHwAjACcAAAEzESMnFw4DIycyNjc1IzUhNSE1IRUhFSEVIxU+AQERIRElFSE1AsNSUkYFR5aUjj8LOX1CqwFW/qgBqf6qAWe7QH7+iQJL/gUBrAM2/dRsOgsNCAJBAgJZyVA9yFA+VQMI/lQBG/7l2piYAAAEADn/wgMVAzcAAwAfACcAKwAAATMRIycXDgMjJzI2NzUjNSE1ITUhFSEVIRUjFT4BFzUzESERMxUFNSEVAsNSUkYFSJaUjT8LOX1CqwFW/qgBqf6qAWe7QH6EUP23UQGo/lgDN/3ocToLDQgCQQICTsZJPcBOPkoDCOVa/sUBO1qgYWEAAAAAAwA5/7kDPwM3AAMAHwA4AAABESMRAxcOAyMnMjY3NSM1ITUhNSEVIRUhFSMVPgEHFRQeAhcHLgMnDgMHJz4DPQEDFVJGBUiWlI0/Czl9QqsBVv6oAan+qgFnu0B+LTBSbD0eM19RPxQTQFFfMx49bFEwAzf9fgKC/jo7Cw4JA0ICA1zIUD3ITz5ZBAqAGipHOCUIQAceLDkiIjksHgdACCU4RyoaAAAABAA5/7YDGAM2AAMAHwArADcAAAERIxEDFw4DIycyNjc1IzUhNSE1IRUhFSEVIxU+AQcyFhUUBiMiJjU0NhcyNjU0JiMiBhUUFgMVUkYFSpeTjD4LOX1CqwFW/qgBqf6qAWe7P39UkpmZkpKYmJJqb29qam5uAzb9tAJM/j07Cw0HAkIBAljJUD3IUD5VAwmLTElJTExJSUzrLCoqLCwqKiwAAAACADQAJQNjAvUAEwAXAAAlMxUhNTM1IxEhNSE1IREhFSEVIyEVMzUCh9z80eR+AhT96gJm/e0CKIz+4s1oQ0OqARWLQ/7wkEOqqgAAAwA0/8oDYgMaABMAFwAdAAABMxUhNTM1IzUhNSE1IRUhFSEVIyEVMzUFFSEVITUCgOL80uZ9Agz98gJf/fQCH43+68T+wgIc/ZIBNkNDZd5hQN5iP2Vl46tD7gADADT/wANiAx4AEwAXACMAAAEzFSE1MzUjNSE1ITUhFSEVIRUjIRUzNQEVIRUhNSE1ITUhFQKA4vzS5n0CDP3yAl/99AIciv7rxP66AjD9fwIU/eoCZwGPPj5Nv0k6uk07TU3+c1M8yEs7vwAEADT/wgNiAyQAEwAXAB8AIwAAATMVITUzNSM1ITUhNSEVIRUhFSMhFTM1EzUzESERMxUFNSEVAoDi/NLmfQIM/fICX/30Ah+N/uvEe1H9plEBuP5IAWtCQlnRUD/MVEBZWf7hWP7FATtYomNjAAAAAwA0/7kDYgMbABMAFwAuAAABMxUhNTM1IzUhNSE1IRUhFSEVIyEVMzUHFRQeAhcHLgEnDgMHJz4DPQECgOL80uZ9Agz98gJf/fQCH43+68Q5L1JtPh1qpSoYSFRbLBw+bVIwAU9CQl7YVkDTW0BeXs4QKkg4Jgg+DldFJzoqGQY+CCY4SCoQAAQANP+3A2IDHAATABcAIwAvAAABMxUhNTM1IzUhNSE1IRUhFSEVIyEVMzUHMhYVFAYjIiY1NDYXMjY1NCYjIgYVFBYCgOL80uZ9Agz98gJf/fQCH43+68Rll5+fl5ienphtdnZtcHNzAVRBQVnXWT/VWkBZWdVJSEZKSkZISeQsJygrKygnLAACADT/tQNiAxMACwATAAABNSE1IRUhFSEVITUBFSERIxEhNQKt/egCa/3qAir9hALK/pFS/pMCaGpB6nND9f6vQ/7hAR9DAAACADT/tgNiAyAACwAZAAABNSE1IRUhFSEVITUBIRUhESM1ITUhNSE1IQKp/fICX/30Ah/9kALF/pMBClL94gET/pIDLgKDXUDaXkDb/pZg/v3BQmBCAAAAAwA1/8oDYQMaAAsAEwAZAAABNSE1IRUhFSEVITUDIRUhFSM1IRcVIRUhNQKp/fICX/30Ah/9kGgDLP6aUv6MuwIe/ZACeGJA32JA3/7OQpycS6xD7wAAAAIANP/AA2IDHgALAB8AAAE1ITUhFSEVIRUhNQEhFSEVIRUhFSE1ITUhNSE1ITUhAqn98gJf/fQCHP2TAsX+kwEI/ewCMP1/AhT96QEN/pIDLgKbSTq7TjvB/sJPv1M8yEs7Tz0AAAAAAwA1/8IDYgMiAAsAFwAbAAABNSE1IRUhFSEVITUBIRUhESERITUhNSEDNSEVAqn98gJf/fQCH/2QAsX+kwEG/acBAP6TAy24/kgCi1dA01lA1f6iXP7xAQ9cQv6VjIwABAA0/8IDYgMkAAsAEwAbAB8AAAE1ITUhFSEVIRUhNQMhFSEVIzUhBTUzESERMxUFNSEVAqn98gJf/fQCH/2QaQMu/pJS/pICdVH9plIBt/5JApNSP85UP9D+6EJvb5xj/sIBPmObXV0AAAAAAwA0/7oDYgMcAAsAEwAsAAABNSE1IRUhFSEVITUDIRUhFSM1IQUVFB4CFwcuAycOAwcnPgM9AQKp/fICX/30Ah/9kGkDLv6SUv6SAcEwU24+GTViVEEUFEJUYzUZPm5TMQKFWD/UWT/V/vBCVFRyHCM8LR4FPAUXJDEfHzEkFwU8BR4tPCMcAAMANf+3A2IDHAALAB4AKgAAATUhNSEVIRUhFSE1ASEVHgEVFAYjIiY1NDY3NSE1IQM0JiMiBhUUFjMyNgKp/fICX/30Ah/9kALF/pODiJ+WmJ+Jhf6TAy21dW1wdHRwbXUChFk/1VpA1/6kTwVJQ0hJSUhDSQVPQv7eKioqKigsLAAAAAMAMv+1AxcDNgAHABMAIwAAATMRIzUjNTMDNSE1IRUhFSEVITUBFw4BBxEjEQ4BIycyPgICxVJSy8vd/pIBwf6UAX3+MAIHBUKFRVI/dDkMRJSYmAM2/H/JQAGxVj/RWkDW/uU+CAsD/tIBKgIBRQIECQAABAAy/7kDaAM3AAcAEwAjAEUAAAEzETMRIzUjAzUhNSEVIRUhFSE1EzUOASMnMj4CNxcOAQcVBRUUFhcHLgEnDgEHLgEnDgEHJz4DPQEzFRQWFz4BPQECCbxSUrwy/q4Bpf6wAV3+UJ8/dTYKP5CWmEcGQoBCATtgVSVDXhcVUz8/UxQYXEMkKkMuGVA+Pz9AAVQB4/21LgGIRTm0Rzm2/lJ/AgI9AQULCjYKDQODKApAbRg9FVAzM1UXFlQzM08UPQwpNTwfCgo0aiAhaTQKAAQAJf+2Ay0DNwADAAsAFwAnAAABMxEjAxEzESM1IzUDNSE1IRUhFSEVITUBFw4BBxEjEQ4BIycyPgIC3k9PqU5Oohb+4gFw/uUBKP6FAaEHMWc0TjZfKgsxeX9+Azf8fwEkAkj8wrc/AZlNPcZSP83++D0ICgP+5AEYAgFFAQQIAAAAAAUAOP/QA00DNgADAAsAFwAnAC0AAAERIxEBMxEzESM1IwM1ITUhFSEVIRUhNRM1DgEjJzI+AjcXDgEHFQchFSE1MwMxTv7Cm05OmyL+6AFq/uoBI/6MljZiKwkxeH57MwUtYDM3AjL9elQDNv1PArH98AIB/W5VAZ9DPLNLPbz+R34DAkMCBAgGOwYJBIK9Q9AAAAADADD/tQMVAzYAAwAPAB8AAAEzESMDNSE1IRUhFSEVITUBFw4BBxEjEQ4BIycyPgICw1JS4f6bAbj+nQF2/jgCBQQ/gkBSQ385C0KTmpwDNvx/Aq9cQNleQNv+4z0KCgT+4AEcAgFEAgUJAAADADH/uAMSAzcAAwAPACQAAAEzESMDNSE1IRUhFSEVITUTFSERIzUhNTM1DgEjJzI+AjcXBgLAUlLi/qYBq/6oAWj+SP0BjlL98oBCezkLQZKanEoGggM3/b8BjlI9yVM9yv6wbf7xzUJpAgJEAQULCjwTAAQAMv/KAywDNwADAA8AHwAlAAABESMRBzUhNSEVIRUhFSE1EzUOASMnMj4CNxcOAQcVByEVITUzAxJS4v6mAav+qAFo/ki3RYA8C0KTmZpKBz99P4kCJf2JUgM3/VICrr5VPcxVPcz+G4oDAUMBBgoJOwoNA46HQ+4AAAADADb/wAMzAzYAAwAPACsAAAERIxEHNSE1IRUhFSEVITUTIRUhNSE1ITUzNQ4BIyczMj4BNxcOAQcVIRUhAxJS4f6oAaj+qwFk/kuCAij9iAIH/fdzP3c2CopJmJtKBEKIQgGV/fgDNv4IAfiXRzi0STm3/V49y009VgIBPgQICDYICwNZxAAABAAx/8IDEgM3AAMADwAiACYAAAEzESMDNSE1IRUhFSEVITUTFSERIREzNQ4BKwEnMiQ3Fw4BEzUhFQLAUlLi/qYBq/6oAWj+SP0Bjv2xbyA/H3cMlwEllwVCgfz+UQM3/dIBg0s8wFA9xv67af7kARxmAQFBBA45CAr+upmZAAAEADH/uQNWAzgAAwAPAB4ANwAAAREjEQc1ITUhFSEVIRUhNRM1BiMnMj4CNxcOAQcVNxUUHgIXBy4DJw4DByc+Az0BAxJS4v6mAav+qAFo/kiaeWwLQpOam0kHRY5FuDBSbD0dM19RQBQUQFFfMx09bFEwAzj9aQKXrk09xFM+y/4fiwNCAQYKCTsLDAOPPh4oRjcmBz4HHSs3IiI3Kx0HPgcmN0YoHgAEADH/twMVAzcAAwAPACwAOAAAAREjEQc1ITUhFSEVIRUhNRMVNjMyFhUUBiMiJjU0Njc1DgEjJzI+AjcXDgETMjY1NCYjIgYVFBYDElLi/qYBq/6oAWj+SP0vN5GampGRmjw3Qns5C0KTmptKBkKDJGpvb2pqbm4DN/2wAlCtSzzBUD3H/rNlBkxISEtLSC09EnMCAkIBBgoJOgoN/rQsKiosLCoqLAACADT/tQNiAxQACwAXAAABNSE1IRUhFSEVITUBFSMRIxEjESMRIzUCrf3oAmv96gIq/YQCytRS4lLUAmtnQuduQu7+tUL+1wEp/tcBKUIAAAMANP+2A2IDIAALABkAHQAAATUhNSEVIRUhFSE1ASMVMxUjNSE1MzUjNSEFNSMVAqn98gJf/fQCH/2QAsXbeFL94oDbAy7+09QChFxA2F5A2v6XZv+8Q2ZDqWZmAAAAAAMANf/KA2ADGgALABcAHQAAATUhNSEVIRUhFSE1AyEVIxUjNSMVIzUhFxUhFSE1Aqn98gJf/fQCH/2QaAMr1FKbUf7nuAIi/Y0CeWFA3mI/3v7RQpeXl5dSqUPsAAAAAAMANP/AA2IDHgALAB8AIwAAATUhNSEVIRUhFSE1ASMVMxUhFSEVITUhNSE1MzUjNSEFNSMVAqn98gJf/fQCHP2TAsXbdv3sAjD9fwIU/el73AMu/tPTAptJOrtMPMD+xVK/UzzISztSPY9SUgAAAAAEADX/wgNiAyIACwAXABsAHwAAATUhNSEVIRUhFSE1ASMVMxEhETM1IzUhBTUjFQU1IRUCqf3yAl/99AIf/ZACxdpz/adv3AMt/tTTAUf+SAKMVkDTWEDV/qNf/vIBDl9CoV9fzYyMAAQANP/CA2IDJAALABcAHwAjAAABNSE1IRUhFSEVITUDIRUjFSM1IxUjNSMFNTMRIREzFQU1IRUCqf3yAl/99AIf/ZBpAy7wUK1Q8QJ1Uf2mUgG3/kkClFM9y1Q+zf7tQm9vb2+jYf7FATthmlxcAAADADT/uANiAxwACwAXADAAAAE1ITUhFSEVIRUhNQMhFSMVIzUhFSM1IwUVFB4CFwcuAycOAwcnPgM9AQKp/fICX/30Ah/9kGkDLrNS/txSswHBL1JtPh0zYFFBFBRBUmAzHj5uUjAChVg/1Fk/1f7kQoyMjIxDEStKOSYIPwgdLDkjIzksHQhACCU5SSwRAAAEADX/twNiAxwACwAeACYAMgAAATUhNSEVIRUhFSE1ASMVHgEVFAYjIiY1NDY3NSM1IQU1IxU+ATMyFzQmIyIGFRQWMzI2Aqf99AJd/fYCH/2QAsXLMzafl5efNzTKAy3+5PYcPCJFnnZtbXZ2bW12AoVYP9RaQNf+pm4SOSpISUlIKjoSbUGcW1oEBJEoKysoKCwsAAAAAAIANAAnA2MC8gALAA8AAAE1ITUhESEVIRUhEQMhFSECrv3qAmb97QIo/YdmAy/80QIli0L+8ZJDARf+RkQAAAADADT/tgNiAx4ACwAPABUAAAE1ITUhFSEVIRUhNQMhFSEXNSERIzUCqf3yAl/99AIf/ZBpAy780lsCcFICglxA2V5A2/7TQpRC/vXJAAAAAAMANP/KA2IDGQALAA8AFQAAATUhNSEVIRUhFSE1AyEVIRcVIRUhNQKp/fICX/30Ah/9kGkDLvzSvQIc/ZICd2JA32JA3/7PQ0WxQ/QAAAAAAwA1/8IDYgMdAAsADwAbAAABNSE1IRUhFSEVITUDIRUhExUhFSE1ITUhNSEVAqn98gJf/fQCHP2TaAMt/NO0AjD9fwIU/eoCZwKaSTq7TTvA/vw+/vhTO8dLO78AAAAABAA1/8IDYgMgAAsADwATABcAAAE1ITUhFSEVIRUhNQMhFSETESERJRUhNQKp/fICX/30Ah/9kGgDLfzTbQJZ/fcBuAKKVz/TWEDV/t5C/pwBEf7v0I6OAAQANP/DA2IDIgALAA8AFwAbAAABNSE1IRUhFSEVITUDIRUhBTUzESERMxUFNSEVAqn98gJf/fQCH/2QaQMu/NICdlH9plEBuP5IApFSP85UQNH+6UGTWP7FATtYo2RkAAMANP+6A2IDGgALAA8AKAAAATUhNSEVIRUhFSE1AyEVIQUVFB4CFwcuAycOAwcnPgM9AQKp/fICX/30Ah/9kGkDLvzSAcIwUm09HDNgU0AUFUFSYDQcPm1TMAKBWUDWWkDX/uBCPhIqSDcmBz8HHis5IiI5Kx4HPwcmN0gqEgAABAA1/7cDYgMaAAsADwAbACcAAAE1ITUhFSEVIRUhNQMhFSEFMhYVFAYjIiY1NDYXMjY1NCYjIgYVFBYCqf3yAl/99AIf/ZBoAy380wGVl5+fl5efn5dtdnZtbXZ2AoJZP9VbQNj+3EJFSkZGSkpGRkrjKygoKysoKCsAAAMANP+4A2IDIAALAA8AKgAAATUhNSEVIRUhFSE1AyEVIQUhHgMXBy4DJw4DByc+AzchNSECqf3yAl799QIe/ZFpAy780gLQ/vQHN1JpOhs0Y1VDFRVDVGM1GztoUTYI/vQCcQKKVkDTWEDV/uJCjCM5KxsFPwYZJzQgIDQnGQY/BRsrOSM/AAADADT/wANiAx0ACwAPABsAAAE1ITUhFSEVIRUhNQMhFSETFSEVIREhFSEVIRUCqf3yAl/99AIc/ZNpAy780rgCIf2NAmT97gIAAplKOrxOO8H++D7++lA9AU08TDgAAAAEADT/xQNiAx0ACwAPABsAHwAAATUhNSEVIRUhFSE1AyEVIQUVMxUhNTM1IzUhFSEVMzUCqf3yAl/99AIf/ZBpAy780gJLkP14kIgCeP5hxgKNUT/NVUDS/uNAi59BQZ9AQJ+fAAAAAAIAZv+1AxUDOAADABYAAAEzESMBFTI2NxcOAysBESE1ITUhEQLDUlL9+G7RdQg9cW5uOkoBSv6zAaADOPx9Ae7RDhJDCg0HAwFYu0P+vwAAAwBh/7YDFQM2AAMAGAAeAAABMxEjJxcOAysBESE1ITUhFSEVMj4CBTUhESM1AsNSUm0JN2dpbj5IAUT+uQGY/rs8amRj/p0CV1IDNv3ckkIJCwcCAQN3Q/mBAgYL/EP+1OkAAAMAYf/KAy0DNgADABgAHgAAAREjEQMXDgMrAREhNSE1IREhFTI+AgEhFSERMwMUUmsINmVocEBIAUT+uQGY/rs+a2Ri/voCEP2eUgM2/WwClP5MQwkMBgMBEYNC/v2QAwYM/pRDAQsAAwBg/8ADMwM2AAMAGAAkAAABESMRAxcOAysBNSE1ITUhFSEVMj4CAyEVITUhNSE1IRUhAxVSbQg1Y2hxQ0gBSP62AZv+uD9tY2H+Ag79nwHw/g4CRf4QAzb+KgHW/qdACQsFAuliQN9sAgUL/ixA4Fc/0wAEAGH/wgMVAzYAAwAYABwAIAAAATMRIycXDgMrATUhNSE1IRUhFTI+AgERIRElFSE1AsNSUm0JN2dpbj5IAUT+uQGY/rs8amRj/rACRP4MAaQDNv3tikIJCwcC/nJD9HwCBgv+HgEv/tHurKwAAAAABABh/8IDFQM2AAMAGAAgACQAAAEzESMnFw4DKwE1ITUhNSEVIRUyPgITNTMRIREzFQU1IRUCw1JSbQk3Z2luPkgBRP65AZj+uzxqZGOjUf27UQGj/l0DNv4UckIJCwcC+3FC8nkCBgv/AGr+pQFbaq5ubgADAGH/uQNJAzcAAwAYADEAAAERIxEFITUhNSEVIRUyPgI3Fw4DKwEFFRQeAhcHLgMnDgMHJz4DPQEDFFL9ogFE/rkBmP67PmtlYTQINmRocEFIAbgxUm48HzNfUkAUFEBSXzMgPG1UMQM3/aECX/h8Q/6DAgcLCUIJDAYDNRovUT8rCT8JIjE/Jic/MCIJPwkrP1EvGgAAAAQAYf+3AxoDNwADABgAJgAyAAABESMRAxcOAysBESE1ITUhFSEVMj4CBzIeAhUUBiMiJjU0NhMyNjU0JiMiBhUUFgMVUm0JN2dpbj5IAUT+uQGY/rs8amRjNUZwTiqijIygno5qcnJqZ3NzAzf92AIo/m5CCQsHAgEAdkP4fgIGC6AWKTwnTlVVTk5U/vwyMC4zMy4wMgAAAwBZ/7YDewM2AAcACwAPAAABFSMRIxEzEQERIREBETMRA3uUUlL9cgGb/rX7AdFF/ioDgP6b/skCQ/29AgH+QQG/AAAEAFr/tQNyAzYABwALAA8AFQAAARUjFSMRMxUnESERAREjEQc1IREjNQNyhVJS9/5kAUz8BAJHUgJOROcCE+im/nMBjf61AQr+9vhD/sH8AAQAWv/KA3IDOAAHAAsADwAVAAABMxUjESMRMwcRIREBESMRFxUhFSERAu2FhVJS9/5kAUz8ZwIE/aoCJkX+xgKRUf5hAZ/+ogEc/uSl10MBGgAAAAcAWv+3A3IDNwAHAAsADwAXACIAMgA+AAABMxUjFSMRMwcRIREBNSMVBRUzFSE1MzUFET4BNxcOASsBEQUyHgIVFAYjIiY1ND4CFzI2NTQmIyIGFRQWAu2FhVJS9/5kAUz8AeO5/j26/qYnXTANQHguKwHSJD0sGV1JSV0ZLD0kKjMzKiozMwJuRbsByTr+kQFv/tLs7G5PPT1PRv72Ag0PQRUMAU5nEiEuHTxDQzwdLiESwyUgHyQkHyAlAAAAAAQAWv/CA3IDNwAHAAsADwAXAAABMxUjFSMRMwcRIREBESMRFxUhFSERIRUC7YWFUlL3/mQBTPxlAfb9uAI4AlxE4gIBPv58AYT+vgEB/v/2vUIBQUIAAAAEAFr/wgNyAzYABwALAA8AGwAAATMVIxUjETMHESERATUjFRMVIRUhNSE1ITUhFQLthYVSUvf+ZAFM/FwCCP2oAeb+FwI6AnZExAHIMv6ZAWf+2uXl/opkQuNeQdwAAAAFAFr/vQNyAzYABwALAA8AJAAqAAABFSMVIxEzFScRIREBNSMVExUyPgI3Fw4DKwE1MzUjNSEVNzUhESMRA3KFUlL3/mQBTPw3Lkk/OR4JIT5HVDY209UBJCYBFFECb0PPAdnHlP6RAW/+0uzs/oteAQUHBj4HCAUB2VU+zo1B/o8BMAAGAFr/wgNyAzYABwALAA8AIwAnACsAAAEVIxUjETMVJxEhEQE1IxUTFTI+AjcXDgIrATUzNSM1IRUXESERAxUzNQNyhVJS9/5kAUz8KSM6NDEbCB85PSJ9y84BHTcBGNGJAm9DzwHZx5L+kQFv/tPs7P6NYAEEBgU/BgcD21Q+zp8Bbf6TATDy8gAAAAUAWv/CA3IDNgAHAAsADwATABcAAAEVIxUjETMVJxEhEQE1IxUTESERARUhNQNyhVJS9/5kAUz8EAIz/h0BkgJbROcCBtud/n4Bgv7A/v7+CgFD/r0BAsDAAAAABQBa/8EDcgM3AAcACwAPABcAGwAAARUjFSMRMxUnESERATUjFQE1MxEhETMVBTUhFQNyhVJS9/5kAUz8AfJR/ctRAZP+bQJqRNYB582R/oQBfP7F+fn+9m7+nQFjbrJxcQAAAAQAWv+6A3IDNwAHAAsADwAoAAABMxUjESMRMwcRIREBESMRBRUUHgIXBy4DJw4DByc+Az0BAu2FhVJS//5sAUPzAV0wU2w8IS1aUUMXFEBRXTIhPG1SMQJCRP7lAlRF/nMBjf61AQr+9pgcMFJALQpACB8wQSolQDEjCUAKLUBSMBwAAAQAVf+kA20DNwAHAAsADwAzAAABMxUjFSMRMwcRIREBESMRBRUUHgIXBy4BJw4BBy4BJw4BByc+Az0BMxUUFhc+AT0BAuiFhVJS8/5gAU78AfoYLkMrKz9aFxROPz9PFBhZPysrQy8YTzo/PDwCUUXjAg45/ngBiP65AQX++6c+JEU8MA88F1Y3OV4bGlw5NlQXPA8wPEUkPj4/diYndz0+AAAABQBa/7YDcgM2AAcACwAPACMALwAAATMVIxUjETMHESERATUjFQUyHgIVFA4CIyIuAjU0PgITMjY1NCYjIgYVFBYC7YWFUlL3/mQBTPwBJURuTSkpTW5ERG1NKSlNbURkcnJkZHFxAldE7gIRQ/5+AYL+wP7+rRYrPikoPisXFys+KCk+Kxb+8TcwMTY2MTA3AAAAAAQAWv+4A3IDNwAHAAsADwAqAAABMxUjFSMRMwcRIREBNSMVBSMeAxcHLgMnDgMHJz4DNyM1IQLthYVSUvf+ZAFM/AJS+gQxTWQ3HzBbTT0TEz1OWzIeOGRNMAT6AkoCYETlAgA9/oABgP7C/f38I0E1Jwk/CCAtOiIiOi0fCD8IJjVBJEIAAAAEAFX/ugNtAzYABwALAA8ALgAAATMVIxUjETMHESERATUjFQEjHgMXBy4DJw4DByc+AzchNSE1MxUhAuaHh1JS8f5gAU/9Al3/BTNPZDcdMl1QPxMUP09dMh03ZE8zBf8AAQNSAQICZ0PyAgQ0/pIBbv7S7u7+1h87LiEGPgccKTUfHzUrHQc+ByEvOyBBY2MAAAAABABa/8IDcgM2AAcACwAPABsAAAEzFSMVIxEzBxEhEQE1IxUTFSEVIREhFSEVIRUC7YWFUlL3/mQBTPxiAfr9tQI4/hkB3AJoRNEB4z3+iwF1/s3x8f6RWD0BYT1TPAAABgBa/7YDcgM2AAcACwAPABcAIwAvAAABMxUjFSMRMwcRIREBNSMVBRUhFSE1ITUXMhYVFAYjIiY1NDYXMjY1NCYjIgYVFBYC7YWFUlL3/mQBTPwBWQEP/Y8BECl2g4N2doODdk5aWk5OWloCdUTRAdY0/qoBVv7r1NRzU0BAU7tGPz9FRT8/RswkIyMlJSMjJAAAAAMAVf+3Ay8DNwALAA8AEwAAATMRIxEjESMRMxEzAREhEQERMxEC4U5OeU1Nef10AVX++LwDN/yAAdr+UgNA/rH+0wIo/dgB5/5aAaYAAAAABABd/7UDKgM2AAsADwATABkAAAEzESM1IxUjETMVMyURIREBESMRFzUhESM1AttPT3JOTnL+3P6mAQ7BJQJbUgM2/evs5wIA1pn+fAGE/rwBBP78+UL+x/cAAAAEAF3/ygNEAzYACwAPABMAGQAAAREjETMVMxEzESMRJREhEQERIxETIRUhETMCaU5Ock9P/tz+pgEOwYkCEf2dUgHr/s8CbPgBCP1kAVHy/moBlv6qARb+6v6GQwEiAAAEAF//wAM4AzYACwAPABMAGwAAARUjETMVMzUzESM1JREhEQERIxETIRUhESEVIQJnTU12T0/+4f6hARLEcwIY/ZQCZf3vAgznAgHX5/3r6+T+fAGE/rwBA/79/lhEATxEAAAABABc/8IDTAM3AAsADwATAB8AAAEVIxEzFTM1MxEjNSURIREBNSMVEyEVITUhNSE1IRUhAmlOTnJPT/7b/qYBDsGEAh/9kAH8/gICUP4DAi3DAbu2yP4ry9D+mgFm/trn5/4tQt5YQdYAAAAABQBd/8IDKgM2AAsADwATABcAGwAAATMRIzUjFSMRMxUzJREhEQERIxETESERJRUhNQLbT09yTk5y/tz+pgEOwTMCTf4DAa0DNv375tkB58uc/nwBhP66AQf++f4SAUD+wP+9vQAAAAAFAF3/wgMqAzYACwAPABMAGwAfAAABMxEjNSMVIxEzFTMlESERATUjFQE1MxEhETMVBTUhFQLbT09yTk5y/tz+pgEOwQIvUf2zUgGq/lYDNv4Y19EB0byP/oYBev7G+fn+/Gz+nAFkbLV0dAAEAF3/uQNYAzYACwAPABMALAAAARUjETMVMzUzESMRJREhEQERIxEFFRQeAhcHLgMnDgMHJz4DPQECaU5Ock9P/tz+pgEOwQF+M1RuOx8yYFJCFBVBUl4zHzttVDICEN4B8tHj/aQBNtf+eAGI/rYBCv72lx4rTz8sCUEJIjE/JSU/MSIJQQksP08rHgAAAAAEAF3/uQNwAzYACwAPABMAOQAAARUjETMVMzUzESM1JREhEQERIxEFFRQeAhcHLgEnDgEHLgEnDgEHJz4DPQEzFRQWFz4DPQECaU5Ock9P/tz+pgEOwQISGC9DKihDWxcVUj9AUhQYWz8pK0MvGE8+PyAvIA8CFNwB7c7f/frk2f6AAYD+wAEA/wCjKyNEPDAPPBdZOTdfGxpbOTZZFzwPMj1DISsrPXQlFDQ5OhsrAAUAXf+3Ay4DNgALAA8AEwAnADMAAAEVIxEzFTM1MxEjNSURIREBESMRBTIeAhUUDgIjIi4CNTQ+AhMyNjU0JiMiBhUUFgJpTk5yT0/+3P6mAQ7BAVhFb04qKk5vRUVvTSoqTW9FZ3R0Z2dzcwIH0wHx2+z94PHh/n8Bgf6+AQL+/qcWKj0nJz0qFhYqPScnPSoW/vg0MDA0NDAwNAAAAAAEAF3/uQNXAzYACwAPABMALgAAARUjETMVMzUzESM1JREhEQERIxEFIR4DFwcuAycOAwcnPgM3ITUhAmlOTnJPT/7c/qYBDsECiv79AjJRaDkdMl9RPxMTP1FfMxw6aVAxAv78Al0CEtwB79Dh/fri4P58AYT+uwEG/vruJUM0JQg9Bx0sOSMjOSwdBz0IJDRCJ0IAAwBZ/7YDdgM2AAsADwATAAABIxUzFSMRIxEzFTMBESERAREzEQN2j4+PUlKP/OMBm/61+wIRx0T+sAOA4f5FAkP9vQIB/kEBvwAAAAQAWv+1A3ADNgALAA8AEwAZAAABIxUzFSMVIxEzFTMlESERAREjEQc1IREjNQNwg4ODUlKD/ob+ZAFM/AQCR1ICanxDiQIUiEb+cwGN/rUBCv7290P+wP0AAAAABABT/8IDdwM2AAsADwATABkAAAEjFTMVIxUjETMVMyURIREBESMRFxUhFSERA3eGhoZVVYb+gP5cAVH+XwIP/ZwCUJxFzwKWoVX+WgGm/p0BIP7gqddFARwAAAAEAFr/wgNxAzcACwAPABMAHwAAASMVMxUjFSMRMxUzJREhEQE1IxUTFSEVITUhNSE1IRUDcYSEhFJShP6F/mQBTPxcAgj9qAHm/hcCOgKIZUJzAcltOv6ZAWf+2uXl/opkQuNeQdwAAAUAWv+2A28DNgALAA8AEwAnADMAAAEjFTMVIxUjETMVMyURIREBNSMVBTIeAhUUDgIjIi4CNTQ+AhMyNjU0JiMiBhUUFgNvgoKCUlKC/of+ZAFM/AElRG5NKSlNbkREbU0pKU1tRGRycmRkcXECa3pEiAIRiEX+fgGC/sD+/q0WKz4pKD4rFxcrPigpPisW/vE3MDE2NjEwNwAAAAIAWf+0AxgDNwALAA8AAAEzESMRIxEhESEVMwERIxECxlJS1f5oAZjV/tr3Azf8fQH5/uwCRu/+6gHE/jwAAAADAF7/tQMYAzYACwAPABUAAAEzESM1IxUhESEVMwURIxEXNSERIzUCxVNTzv5nAZnO/uL4EQJYUwM2/fDtsAGRnrIBDv7y8kL+wf0AAwBe/8oDMQM2AAsADwAVAAABFSERIRUzNTMRIxEFESMREyEVIREzAff+ZwGZzlNT/uL4fgIE/alTAfqyAaCr+f1yAVJwAR3+4/6DQwEaAAADAF//wgM5AzYACwAPABsAAAEVIREhFTM1MxEjNQU1IxUTIRUhNSE1ITUhFSEB/f5iAZ7IUlL+6P55AhH9ngHv/g8CQv4RAjOaAW6RwP41yFjr6/4oQeFZQdgAAAUAX//CAxcDNgALAA8AIwAnACsAAAEzESM1IxUhESEVMwU1IxUTFTI+AjcXDgIrATUzNSM1IRUXESERAxUzNQLFUlLI/mIBnsj+6P5DJDs2MxsIHzo+I4DQ0wEiNgEf148DNv4vyJkBcZaa7+/+kmUBAwYFPwYHA+FWPtClAXX+iwE4+voAAAAEAF7/wgMYAzYACwAPABMAFwAAATMRIzUjFSERIRUzBREjERMRIREBFSE1AsVTU87+ZwGZzv7i+CICR/4JAacDNv395KwBjZ6tAQn+9/4VAUP+vQECwMAABABg/8MDFwM3AAsADwAXABsAAAEzESM1IxUhESEVMwU1IxUBNTMRIREzFQU1IRUCxVJSzv5pAZfO/uL2AhVR/cJRAZz+ZAM3/h7QogF6laP29v7zcv6ZAWdys3NzAAAAAwBe/7oDTgM2AAsADwAoAAABFSERIRUzNTMRIxEFESMRBRUUHgIXBy4DJw4DByc+Az0BAff+ZwGZz1JS/uH4AXIxU208IDNfUUAUFEBSXzIgO21TMgISrQGOnuH9nQE/bAEL/vWRIi9SQS0KQAkjMkAnJkAzIwlACi5CUi0iAAAEAF7/twMaAzYACwAPACEALQAAARUhESEVMzUzESM1BREjEQUyHgIVFAYjIi4CNTQ+AhMyNjU0JiMiBhUUFgH3/mcBmc5TU/7i+AFARW9OKaCLRW5OKSlObkVnc3NnZ3FxAhKsAY2e4f3u7msBCv72nhcrPyhRWBYsPygoPysX/u42MzM2NjMzNgAAAAMAXv+6A0UDNwALAA8AKgAAARUhESEVMzUzESM1BREjEQUjHgMXBy4DJw4DByc+AzcjNSEB9/5nAZnOU1P+4vgCdf0CME9mNx8xW049ExM9TVsxHzhmTi8C+gJNAhmsAY2e2/3+5GoBCf737CRDNicIPQgfLDkhIjgsHwg9CCY2QyVCAAUAX/+3AysDNgALAA8AFwAjAC8AAAEVIREhFTM1MxEjNQU1IxUFIRUhNSE1MwcyFhUUBiMiJjU0NhcyNjU0JiMiBhUUFgH9/mIBnshSUv7o/gFqARL9iQETUil2hIR2doSEdlFYWFFRWFgCOpgBZ426/ibeWOfnvj8/U7dFQEBEREBARc0mIiMmJiMiJgAAAAMAVf+3Ay8DNwADAA8AEwAAATMRIwMRMxEjESMVIREhFQcRIxEC4U5Osk5Ohf6rAVVMvAM3/IACLgE+/MABvvoCKOr9Aab+WgAAAAAEAF3/tQMqAzYAAwAPABMAGQAAATMRIyUVIREhFTM1MxEjNQcRIxEXNSERIzUC209P/tz+pgFaek1NxsElAltSAzb96OynAY2j2P4D4mcBDf7z8UL+wf0ABABd/8oDRAM2AAMADwATABkAAAERIxEBFSERIRUzNTMRIxEHESMREyEVIREzAypP/tz+pgFaek1NxsGJAhH9nVIDNv1iAp7+wbABmqfr/Y0BRXABGv7m/oZDASEAAAAABABc/8IDTAM2AAMADwATAB8AAAERIxEBFSERIRUzNTMRIzUHNSMVEyEVITUhNSE1IRUhAypP/tv+pgFafE5OyMGEAh/9kAH8/gICUP4DAzb+LwHR/veVAWWNs/5Hw1bn5/4tQuFYQdcAAAAABQBd/8IDKgM2AAMADwATABcAGwAAATMRIyUVIREhFTM1MxEjNQcRIxETESERJRUhNQLcTk7+2/6mAVp6TU3GwTMCTf4DAa0DNv356aYBhJvJ/hXfaAEH/vn+EgFA/sD/vb0AAAUAXf/CAyoDNgADAA8AEwAbAB8AAAEzESMlFSERIRUzNTMRIzUHNSMVATUzESERMxUFNSEVAttPT/7c/qYBWnpNTcbBAi9R/bNSAar+VgM2/hPRnAF6m8b+Lslc+fn+/Gz+nAFkbLV0dAAAAAQAXf+5A1gDNgADAA8AEwAsAAABESMRARUhESEVMzUzESM1BxEjEQUVFB4CFwcuAycOAwcnPgM9AQMqTv7b/qYBWnpNTcbBAX4zVG47HzJfUkIVFUFSXjMfO21UMgM2/aQCXP7UqgGIm9b+DNtrAQr+9pkeK08/LAlBCSIxPyUlPzEiCUEJLD9PKx4ABABd/7kDcAM2AAMADwATADkAAAERIxEBFSERIRUzNTMRIzUHESMRBRUUHgIXBy4BJw4BBy4BJw4BByc+Az0BMxUUFhc+Az0BAypP/tz+pgFaek1NxsECEhgvQyooQ1sXFVE/QlEUGFs/KStDLxhPPj8gMB8QAzb+AAIA/t+oAYCVzP4b1mgBAP8AoysjRDwwDzwXWTk3XxsaWzk2WRc8DzI9QyErKz10JRQ0OTobKwAFAF3/twMuAzYAAwAPABMAJwAzAAABESMRARUhESEVMzUzESM1BxEjEQUyHgIVFA4CIyIuAjU0PgITMjY1NCYjIgYVFBYDKk7+2/6mAVp6TU3GwQFYRW9OKipOb0VFb00qKk1vRWd0dGdnc3MDNv3ZAif+06IBgZvX/gvaYwEC/v6nFio9Jyc9KhYWKj0nJz0qFv74NDAwNDQwMDQAAAAAAwBZ/7QDGAM3AAsADwATAAABMxEjESMVIREhFTMBESMRJTM1IwLGUlLV/mgBmNX+2vcBSNXVAzf8fQFyjQJGf/56AcT+PI+0AAAAAAQAXv+1AxgDNgALAA8AEwAZAAABMxEjNSMVIREhFTMBESMRJTM1IwE1IREjNQLFU1PO/mcBmc7+4vgBSM7O/skCWFMDNv3wiFIBmE3+9wEU/uxTc/5OQv7B/QAABABe/8oDLQM2AAsADwATABkAAAEVIREhFTM1MxEjNQURIxElIxUzASEVIREzAff+ZwGZzlNT/uL4AhbOzv5kAgT9qlIBllABok+d/XLuDwEg/uDPff40QwEYAAAEAF//wgM5AzYACwAPABMAHwAAARUhESEVMzUzESM1BTUjFSUjFTMBIRUhNSE1ITUhFSEB/f5iAZ7IUlL+6P4CFsjI/mMCEf2eAe/+DwJC/hEB3kUBbkd2/jVzA+vrpWH95EHhWUHYAAQAXv+6A04DNgALAA8AEwAsAAABFSERIRUzNTMRIzUFESMRJSMVMwcVFB4CFwcuAycOAwcnPgM9AQH3/mcBmc9SUv7h+AIXz8+lMVNtPCAzX1FAFBRAUl8yIDttUzIBrksBkUiK/Z3bCgEO/vLEdt0iL1JBLQpACSMyQCcmQDMjCUAKLkJSLSIAAAAABABe/7kDawM3AAsADwATADkAAAEVIREhFTM1MxEjNQURIxElIxUzBxUUHgIXBy4BJw4BBy4BJw4BByc+Az0BMxUUFhc+Az0BAff+ZwGZzlNT/uL4AhbOzg8ZLkMrKUJcFxVRP0JRFBhZQCkqQy8YTz4/IDAfEAG1TAGQR4X9+4MKAQ3+88R34TcjRTwwDzwYWDk2YRoZXTk2WRg8EDI9QyE3Nz11JRQ0OjsaNwAAAAAFAF7/twMaAzYACwAPABMAJQAxAAABFSERIRUzNTMRIzUFESMRJSMVMwcyFhUUDgIjIi4CNTQ+AhMyNjU0JiMiBhUUFgH3/mcBmc5TU/7i+AIWzs7Wi6ApTm9FRW5OKSlObkVnc3NnZ3FxAbJNAY5Okf3ujgwBC/71vW/rWFEoPysXFys/KCk+LBb+7jYzMzY2MzM2AAAAAAQAX/+6A0wDNgALAA8AEwAyAAABFSERIRUzNTMRIzUFNSMVJSMVMxMhFB4CFwcuAycOAwcnPgM1ITUhNTMVIQH9/mIBnshSUv7o/gIWyMhn/vkxUWs6HDNeUT8TFEFSYDMbOmxSMv76AQdTAQcBzkwBfkh+/fycC/z8tWr+qyA/NSYHPgceKjYfIDYqHQc+ByU0QCE+VlYABABV/7cDLwM3AAMADwATABcAAAEzESMDNTMRIxEjFSERIRUDESMRJTM1IwLhTk6yTk6F/qsBVUy8AQiFhQM3/IACn838wAE/ewIoef6SAab+Wn2uAAAAAAIANQApA2IC7AALAA8AACUhFSE1ITUhESERIQERIREB9AFu/NMBbP70Amr+9f7wActtRETaAaX+WwFk/t0BIwADADT/tQNgAxIACwAPABUAAAEhFSE1ITUhESERISUVITUBNSERIzUB9AFs/NQBbv77Alv+/P75Abr96AJtUgFwQkJyATD+0O+urv2+Qv7k2gAAAAAEADT/rwNgAxcACwAPACQAKgAAASEVITUhNSERIREhJRUhNQMVFB4CFwcuAScOAQcnPgM9AQU1IREjNQH0AWz81AFt/vwCW/78/vkBugYTJzooLzlIFBVJOS4nOicU/jABJ1EBg0JCZgEu/tLtrKz+LTsiQjovDz0XTTMxTxc9Dy87QiE7VkP+x/YAAAMANP/KA2ADDAALAA8AFQAAASEVITUhNSERIREhJRUhNQEVIRUhEQH0AWz81AFu/vsCW/78/vkBuv5IAhf9lwFaQ0N1AT3+w/y6uv4Bv0MBAgAAAAMANP/AA2ADGQALAA8AGwAAASEVITUhNSERIREhJRUhNQEVIRUhNSE1ITUhFQHzAW381AFt/v0CWf78/vsBuP5DAir9hgIO/e8CYgGvQkJZARH+79CPj/2BWUDVUD7KAAQALf+3A1sDJAALAA8AJAAqAAABIRUhNSE1IREhESElFSE1ARUyPgI3Fw4DKwE1MzUjNSEVNzUhESMRAe4BbfzSAW3+/AJc/vz++AG8/jYwTkM+IAckQkpXODfj5gE3JwEiUgGwQkJYARz+5NqXl/15YQIECAY/BwgEAdxWPtCOQv6MATIAAAAFADT/wANgAxUACwAPACMAJwArAAABIRUhNSE1IREhESElFSE1ARUyPgI3Fw4CKwE1MzUjNSEVFxEhEQMVMzUB8wFt/NQBbf79Aln+/P77Abj+NCc+NjIaBx43PiSE0NIBHzkBINqUAatCQlgBEv7u0ZCQ/YVbAQMGBT0GBwPTUj3JmQFi/p4BJunpAAQANP/CA2ADFwALAA8AEwAXAAABIRUhNSE1IREhESElFSE1AREhESUVITUB9AFs/NQBbv77Alv+/P75Abr98gJk/ewBxAGDQkJmAS7+0uyqqvztASf+2eakpAAABAA0/8IDYAMZAAsADwAXABsAAAEhFSE1ITUhESERISUVITURNTMRIREzFQU1IRUB9AFs/NQBbv77Alv+/P75AbpS/aJRAbv+RQGMQkJiASv+1eqpqf3bYv6tAVNir3BwAAAAAAMANP+8A2ADEgALAA8AJgAAASEVITUhNSERIREhJRUhNQMVFB4CFwcuAScOAwcnPgM9AQH0AWz81AFu/vsCW/78/vkBurIwUm09H2qjKhRBUWAzHz1uUjEBe0JCaAEv/tHurKz+LhstTTwpCUASXEkkPC4gCUAJKTxNLRsAAAAABAA0/7YDYAMSAAsADwAbACcAAAEhFSE1ITUhESERISUVITUDMhYVFAYjIiY1NDYXMjY1NCYjIgYVFBYB9AFs/NQBbv77Alv+/P75Abrck5+jj5CkpJBqdXVqbXR0AX9DQ2UBLv7S7aur/iRRTk1TU01MU/8wMC4yMi4wMAAAAAADACv/twN1AzcABwAbAB8AAAEVIxEjETMRBRU+ATcXDgMjJzI2NzUjESERARUhNQN1jlJS/oY/dzkHR5OQhzsMNnpAtQG8/pQBHAHCRf46A4D+i1CzAgkIPAwOBwJFAQK3AW7+kgEt6+sAAAAEADT/ygNwAzcABwAbAB8AJQAAATMVIxEjETMDFw4DIycyNjc1IxEhESMVPgEBFSE1AxUhFSE1AuyEhFJSiwVFkY6IPAo2dz+uAaysPXn+mwEKxgIF/akCCkT+xwKq/jU9Cw0IAkMCAnQBNv7KcAMJAVmzs/4GtkP5AAAABAA0/7oDcAM2AAcAGwAfAEUAAAEzFSMVIxEzAxcOAyMnMjY3NSMRIREjFT4BARUhNRMVFB4CFwcuAScOAQcuAScOAQcnPgM9ATMVFBYXPgM9AQLshIRSUosGRpOQhzsINnc/rgGsrD15/psBCtEYLkMrKkJZFxRRQj9SFBdZQikrQy4YTj9AIC8gDwI+ROYCIv5iPQwOBwJDAQJlASL+3mECCwE1n5/+LhciQjsvDz0YVzc3XBoZWzc2Vxc9Dy87QiIXFzp0JBIxODscFwAAAAUANP+3A3ADNgAHABsAHwArADcAAAEzFSMVIxEzAxcOAyMnMjY3NSMRIREjFT4BARUhNQMyFhUUBiMiJjU0NhcyNjU0JiMiBhUUFgLshIRSUooFRZKQiDsJNnc/rgGsrD16/poBCgOKnp6Kip6eimdvb2dnb28COUT5Ajr+WjwMDwcDRAICZwEj/t1jAwoBN5+f/jRSTExSUkxMUvwxLS0xMS0tMQAAAAMAJv+yAzIDNgALAB8AIwAAATMRIxEjESMRMxEzBRU+ATcXDgMjJzI2NzUjESERARUzNQLjT09pTk5p/lo0Yy0GN319dTALLWU5jQFn/ufLAzb8fAHL/mYDQP6jW6cCBgU+CAsGA0cBAqoBcf6PAS3q6gAABAA2/6YDbgM2AAsAHwAjAEcAAAEVIxEzFTM1MxEjNQcXDgMjJzI2NzUjESERIxU+AQEVMzUBFRQeAhcHLgEnDgEHLgEnDgEHJz4DPQEzFRQWFz4BPQECdk1NbE9P5QY1eHhxLgkoYDSGAWKNM1/+6cIBPRgtQysrP1kYFE4/P08UGFk/KitDLhhOPDw/PAH44AIQ7Pr93OZmPQkMBwNHAQJbAR7+4lgDBwErnJz+OyIjRTwwDj0YVTY5XBoaWjk2VBc9DjA8RSMiIjx3JiZ3PCIAAAADADv/tQMQAzcAAwAXABsAAAEzESMBFT4BNxcOAyMnMjY3NSMRIREBFSE1Ar5SUv7HQH8/B0yblow8Cjd8RbkBxf6NASEDN/x+AbywAwsKPQ4QBwJFAQK0AW/+kQEt6+sAAAAABAA5/8oDMAM3AAMAFwAbACEAAAERIxEDFw4DIycyNjc1IxEhESMVPgEBFSE1AyEVITUzAxNSRwVIlZOMPgw5fkKrAauuP3v+mgEKxgIU/ZpSAzf9YQKf/jE9Cg0IA0QCAnUBOf7HcQMIAV21tf1QQ/oAAAAEADr/wAM0AzYAAwAXABsAJwAAAREjEQMXDgMjJzI2NzUjESERIxU+AQEVITUDIRUhNSE1ITUhFSEDE1JHBkeVk40/Czl9QqsBq64/e/6aAQrMAh79kgH9/gACUP4DAzb+HgHi/pA6Cw0HAkACAlkBD/7xVQMIARmOjv0qQdlSQNAAAAAFADr/wgMTAzYAAwAXABsAIwAnAAABMxEjJxcOAyMnMjY3NSMRIREjFT4BARUhNRM1MxEhETMVBTUhFQLBUlJGBkiVk4w/DDl9QqsBq64/fP6ZAQrhUP21UQGq/lYDNv37cj0LDQgCRAICYwEc/uRfAwgBL5mZ/eFb/rwBRFunZ2cAAAAEADv/uQM9AzYAAwAXABsANAAAAREjEQMXDgMjJzI2NzUjESERIxU+AQEVITUTFRQeAhcHLgMnDgMHJz4DPQEDE1JGBkmZlIo7Czd9Q6sBq64/fP6ZAQowMFJsPR4zXlFAFBRAUV4zHjxtUTADNv2AAoD+VDwNDwgCQwEDbgEl/ttrBAsBQKKi/jQfKkk5KAlACB8tOiMjOi0fCEAJKDlJKh8AAAUAO/+4AxgDNgADABcAGwAnADMAAAERIxEDFw4DIycyNjc1IxEhESMVPgEBFSE1EzIWFRQGIyImNTQ2FzI2NTQmIyIGFRQWAxRSRwZIl5SLPQs3fUKsAamrP33+lwEIEI+bm4+PmpqPZ3FxZ2dwcAM2/cECP/5VPAwPCANDAgNtASb+2mkDCwE/oqL+Kk9LS09PS0tP9C0tLS0tLS0tAAADADUAKANiAu4ACwAPABMAACUzFSE1MzUjESERIwERIREBFTM1AoXd/NPcfAJqev5fAcv+tNBsRETdAaX+WwFk/t0BI/6c3d0AAAAABAA0/8oDYAMOAAsADwATABkAAAEzFSE1MzUjESERIyUVITUFFTM1ARUhFSERAn/h/NTheAJbef5uAbr+wMf+wQIX/ZcBV0JCegE9/sP8urr8enr++r5DAQEAAAAEADT/wANgAxsACwAPABMAHwAAATMVITUzNSMRIREjJRUhNQUVMzUBFSEVITUhNSE1IRUCf+H81OF3All4/m8BuP7Bx/67Air9hgIO/e8CYgGuQkJdARD+8NCQkNBdXf5NWEDVTz/LAAUANP/CA2ADGwALAA8AEwAbAB8AAAEzFSE1MzUjESERIyUVITUFFTM1EzUzESERMxUFNSEVAn/h/NTheAJbef5uAbr+wMd5Uv2iUQG7/kUBi0JCZQEr/tXqqanqZWX+w2L+rQFTYq9wcAAAAAQANP+5A2ADFAALAA8AEwAoAAABMxUhNTM1IxEhESMlFSE1BRUzNQcVFB4CFwcuAScOAQcnPgM9AQJ/4fzU4XgCW3n+bgG6/sDHOTBSbT0faqMqK6RqHz1uUjEBdUNDcAEv/tHurKzucHDoHSxNPCkJQBJcSUlcEkAJKTxNLB0AAwA0/7cDYgMFAAMABwAPAAABESERATUhFQUVIREjESE1Avr9ogIN/kMCdv6QUv6UAwX+owFd/uTa2rtD/swBNEMAAAADADT/rgNgAxMAAwAHABUAAAERIREFNSEVBSEVIREjNSE1ITUhNSEC+P2lAgr+RgJz/pMBCVL95QES/pMDLAMT/s8BMe+urt5y/trkQnJCAAUANP+2A18DFwADAAcADwAVABsAAAERIREFNSEVByEVIRUjNSEXNSERIzUzNSERIzUC+P2lAgr+RrkDK/6TUf6TSgEvUH0BJlEDF/7TAS3rqqqVQnNztkL+1elC/tXpAAQAM//KA2IDDQADAAcADwAVAAABESERBTUhFQchFSEVIzUhFxUhFSERAvj9pQIK/ka6Ay/+mFL+i7oCGv2UAw3+xQE7+be3qEK1tWC9QwEAAAAAAAMANP/CA2ADFQADAAcAFwAAAREhEQU1IRUFIRUhFSEVIRUhESE1ITUhAvj9pQIK/kYCc/6TAQz96wId/ZEBCf6TAywDFf7UASzrqanaa0KfQgEja0IAAAADADT/wANgAxkAAwAHABsAAAERIREFNSEVBSEVIRUhFSEVITUhNSE1ITUhNSEC9/2nAgj+SAJy/pMBBf3xAir9hgIO/e8BC/6TAywDGf7vARHQj4/OWMpZQNVQPlhCAAADADT/tgNgAxkAAwAHACoAAAERIREFNSEVBSEVIREjESM1IxUjFTI+AjcXDgMrATUzNSM1ITUhNSEC9/2nAgj+SAJy/pIBEFHMMNgxTkI8HwchQElYOTfY2gEV/pMDLAMZ/u4BEtGQkMlk/psBIju/VgIECQc9CAkFAc5PPmRCAAQANf/AA18DFQADAAcAJwArAAABESERBTUhFQUhFSERIREjFSMVMj4CNxcOAisBNTM1IzUhNSE1IQUVMzUC9/2nAgj+SAJx/pMBEf7gONEnPzYyGgYeNz4khNHTARb+lAMq/sqUAxX+7wER0I+Pxl3+ngFYv1sBAwYFPQYHA9NRPl1C3OjoAAAEADX/wwNgAxcAAwAHABMAFwAAAREhEQU1IRUFIRUhESERITUhNSEDNSEVAvj9pQIK/kYCc/6UAQn9nAEJ/pMDK7P+PAMX/tIBLuyqqtlp/toBJmlD/nCjowAAAAUANP/CA2ADGQADAAcADwAXABsAAAERIREFNSEVByEVIRUjNSEFNTMRIREzFQU1IRUC+P2lAgr+RrkDLP6TUv6TAnJR/aVSAbj+SAMZ/tYBKuinp5NCc3Ouaf6rAVVpq2trAAAEADT/uQNjAxcAAwAHAA8AKAAAAREhEQU1IRUHIRUhFSM1IQUVFB4CFwcuAycOAwcnPgM9AQL4/aUCCv5GuQMv/o9R/pMBwDFSbj0bNGJTQRMUQlRhNBs9blMxAxf+1wEp56amk0NkZIwcJT8wIAY/BhonNCAfNCcbBj8GITE+JBwAAAAEADX/twNgAxIAAwAHABoAJgAAAREhEQU1IRUFIRUeARUUBiMiJjU0Njc1ITUhAzQmIyIGFRQWMzI2Avj9pQIK/kYCc/6TgoiikY+kiYH+lAMrtnZqanZ2amp2AxL+0gEu7Kur1VwGUEhOUlNNSFAGXEL+xC4yMi4wMDAAAwA0/8ADYAMZAAMABwAbAAABESERBTUhFQUhFSEVIRUhFSEVIRUhESE1ITUhAvf9pwII/kgCcv6TAQ796wH//gECHv2QAQf+kwMsAxn+6wEV1JOTz189TjxSPgFXX0IABgA1/7cDXwMZAAMABwAPABcAIwAtAAABESERBTUhFQchFSEVIzUhBRUhFSE1ITUXMhYVFAYjIiY1NDYXMjY1NCYjIhUUAvf9pwII/km6Ayr+lVL+kwG/ASH9awEiKYWIiIWGiIiGXmFhXsEDGf79AQPGiYl/P0dHX0A9PUCgNzk3ODg3OTeoHBwdHDk4AAAABAAy/7UDFgM2AAcACwAPAB8AAAEzESM1IzUzAxEhEQU1IRUFFw4BBxEjEQ4BIycyPgICxFJSy8uR/k0BYv7uAbAFQoZCUj92NwtDk5iYAzb8f9w/AjT+vgFC/76+kj0JCwT+swFKAgJFAQUJAAAAAAUAMP/KAyoDNgAHAAsADwAfACUAAAEzETMRIzUjExEhEQU1IRUTNQ4BIycyPgI3Fw4BBxUHIRUhETMCC7ZSUrYc/mABUP8AXUJ+OQtCkJWVRgc8ej2EAij9hlIBJQIR/VZcAiL+5gEa2ZmZ/nuwAgNEAgQIBjwHCQSzn0MBBQAABQAy/8ADMgM3AAcACwAPAB4AKgAAATMRMxEjNSMTFSE1BTUhFRM1BiMnMj4CNxcOAQcVAyEVITUhNSE1IRUhAg+yUlKyGP5gAVD/AE98bgpBkZaYSAVCg0JrAiX9igIH/fcCWf36AY4Bqf3wMAHE8PC0eXn+voUDPgEFCQg2CQsEif7XPMJJO7wAAAAGADD/wgMTAzcABwALAA8AHwAnACsAAAEzESM1IzUzAxUhNQU1IRUTNQ4BIycyPgI3Fw4BBxUFNTMRIREzFQU1IRUCwVJSsrKa/mABUP8AVUB4OQtBkZaXRwU/fj8BQ1H9qlEBtP5MAzf93is8AZz397p9ff6nmAMCQAIGCwk6CQwEnGlX/s8BMVebXV0AAAAFADD/uQNLAzcABwALAA8AHgA3AAABMxEzESM1IxMRIREFNSEVEzUGIycyPgI3Fw4BBxU3FRQeAhcHLgMnDgMHJz4DPQECBrtSUrsh/mABUP8AR3lqC0GRlphIBUOHQ64wU209HTRgUUAUFEBSYDQdPm1SMAFXAeD9d20B+f79AQPFh4f+ebkDRAEECAg7CgoEvBkXKUY3JQg+Bx0rOCIiOCsdBz4IJTdGKRcABgAu/7cDGgM2AAcACwAPAB4AKgA2AAABMxEzESM1IxMRIREFNSMVEzUGIycyPgI3Fw4BBxUXMhYVFAYjIiY1NDYXMjY1NCYjIgYVFBYB+cZSUsYn/l8BTvtHdWoMQpCVlEYHQoVDgJKcnJKSnJySanBwampwcAFkAdL9ujgB6P75AQfHh4f+sYoDRQEFBwY8CAoDjhRNS0tMTEtLTe8tKistLSsqLQAABQAp/7YDLQM2AAMACwAPABMAIwAAATMRIwMRMxEjNSM1ExEhEQU1IxUFFw4BBxEjEQ4BIycyPgIC3k9PqU1Np0X+jQEl1wFOBi5mNE4zXSgLMHZ9ewM2/IABNAI5/MLGPwID/t0BI+SmpoU7CAwD/swBLwMCRQIFCQAAAAQAMv+1AxUDNwADAAcACwAbAAABMxEjAxEhEQU1IRUFFw4BBxEjEQ4BIycyPgICw1JSjv5OAWH+7wGwBj+CQFJCfDoMRJSZmAM3/H4DSP7BAT/9vLyTPggLA/65AUMCAkYBBAkAAAAABQAz/7QDDwM2AAMABwALACEAJwAAATMRIwMRIREFNSMVFxUzESM1IzUzNQ4BIycyPgI3Fw4BFzUhESM1Ar1SUpT+XQFP/KtAUtSUQHo5DEKQlZZHBz1+LQEfUgM2/dQCAv7uARLRkJDPh/7P8EGEAwJGAgQIBj0ICcxB/s/wAAAFADf/ygMqAzcAAwAHAAsAGwAhAAABESMRBxEhEQU1IRUTNQ4BIycyPgI3Fw4BBxUHIRUhETMDD1KQ/mABUP8AZUWBOgtAkJaYSAY6eTyLAiH9jVIDN/1WAqoz/tgBKOalpf6NmAMCQwIFCwk8CQwDnZ5DAQAAAAAEADn/wAMwAzcAAwAHAAsAJwAAAREjEQcRIREFNSMVEyEVITUhNSE1MzUOASMnMj4CNxcOAQcVIRUhAw9SmP5pAUf2MwIe/ZEB/f4BdEB6Ngo/kJeZSAZAgUABiv4DAzf+GgHmIf77AQXGh4f9sEDWUz9kAgFBAQQKCTgKDARozwAAAAADADT/sANiAwYAAwAHABMAAAERIREBNSEVBRUjESMRIxEjESM1Avr9ogIN/kMCds5S7VLPAwb+owFd/uXa2rtD/sMBPf7DAT1DAAAABAA2/8oDYQMRAAMABwATABkAAAERIREFNSEVByEVIxUjNSMVIzUhFxUhFSE1Avj9pQIK/ka3AyvPUp5S/ua0AiD9jgMR/sUBO/m3t6VCt7e3t2y4Q/sAAAQANP/AA2ADGQADAAcAGwAfAAABESERBTUhFQUjFTMVIRUhFSE1ITUhNTM1IzUhBTUjFQL3/acCCP5IAnLXb/3xAir9hgIO/e983gMs/tfUAxn+7wER0I+PzFrKWUDVUD5aQpxaWgAABQA1/8MDYAMaAAMABwATABcAGwAAAREhEQU1IRUFIxUzESERMzUjNSEFNSMVBTUhFQL4/aUCCv5GAnPXdP2ced0DK/7X1AFK/jwDGv7TAS3rqanba/7aASZrQ65ra+SjowAAAAQANP+6A2ADFwADAAcAEwAsAAABESERBTUhFQchFSMVIzUhFSM1IwUVFB4CFwcuAycOAwcnPgM9AQL4/aUCCv5GuQMstFL+4lK2AcEwUm49HjNfUkEUFEFSYDMePm1TMAMX/tQBLOqpqaFDo6Ojo04dLkw6KAk/CB8tOyQkOy0fCD8JKDpMLh0AAAAABQAv/7UDWwMaAAMABwAZACAALAAAAREhEQU1IRUFIxUeARUUBiMiJjU0NzUjNSEFNSMVNjMyFzQmIyIGFRQWMzI2AvP9owIK/kkCcts8QaGYmaKA2gMs/tHQMDg4q3ZtbXd3bW12Axr+0AEw7qys0oEUQjBOUFBOXimAQrFvbwaeLS8vLS0vLwAAAAADADUALQNiAugAAwAHAAsAABMhESEBIREhASEVIZUCav2WAhr+NQHL/YYDLfzTAuj+VwFo/tn+8UQAAAAEAC7/rANcAxoAAwAHAAsAEQAAEyERISUhFSEFIRUhFyERIzUhlgJd/aMCCv5KAbb9jgMu/NJXAnNU/eEDGv7O8K6fQmf+yvMAAAAABAA0/8oDYAMKAAMABwALABEAAAERIREFNSEVByEVIRcVIRUhEQL4/aUCCv5GuQMs/NS7Ahf9lwMK/sMBPfu6uqZCWMJDAQUABAA0/8ADYAMZAAMABwALABcAAAERIREFNSEVByEVIRMVIRUhNSE1ITUhFQL3/acCCP5IugMs/NS1Air9hgIO/e8CYgMZ/u8BEdCPj5FC/uNZQNVQP8sAAAUANP/CA2ADFwADAAcACwAPABMAABMhESElIRUhBSEVIRchESElIRUhnQJb/aUCCv5GAbr9jQMs/NRlAmT9nAIU/jwBxAMX/tLsqp1CY/7Z5qQAAAQANP+5A2ADEAADAAcACwAgAAABESERBTUhFQchFSEFFRQeAhcHLgEnDgEHJz4DPQEC+P2lAgr+RrkDLPzUAcEwUm09H2qjKiukah89blIxAxD+0gEu7Kqqn0NEHSxNPCkJQRJbS0tbEkEJKTxNLB0AAAAABQAu/7YDXAMaAAMABwALABcAIwAAEyERISUhFSEFIRUhBTIWFRQGIyImNTQ2FyIGFRQWMzI2NTQmlgJd/aMCCv5KAbb9jgMu/NIBlZijo5iYo6OYbXh4bW14eAMa/s7wrp9CTVRPUVJSUU9UQzAwMDExMDAwAAAABAAq/7IDEQM3AAMABwALABUAAAEzESMBIREhASEVIQEnMj4CNxcGBAK9VFT9wQG0/kwBYf7yAQ7+VgtFl5ubSgeV/tQDN/x7AzH+lwEl4v6+SgIFCQhBFgsAAAADAGn/tAMTAzcAAwAHAAsAAAEzESMBIREhASMRMwLBUlL9qAGc/mQBTPz8Azf8fQMr/bkCBf48AAQAZP+1AxUDNwADAAcACwARAAABMxEjASERIQEhESEHIREjNSECw1JS/aEBo/5dAVP+/QED+QJXUv37Azf96gHZ/nABTv7zu/7F+QAEAGT/1AMwAzYAAwAHAAsAEQAAAREjEQcRIREBESEREyEVIREzAxVSvP5dAVP+/XICCv2kUgM2/XwChE3+XwGh/qEBHf7j/oxCARsABABk/8IDLQM3AAMABwALABMAAAERIxEHESERAREhERMhFSERIRUhAxVSvP5dAVP+/W8CCv2kAkr+CAM3/f4CAjn+egGG/rsBBP78/ktCAUBCAAAABABk/8ADMwM2AAMABwALABcAAAERIxEHESERATUhFRMhFSE1ITUhNSEVIQMUUrv+XQFT/v1uAhH9nwHx/gwCRf4OAzb+MwHNMf6SAW7+0+zs/ilB4VtA2AAAAAAGAGT/wAMUAzYAAwAHAAsAHwAjACcAAAEzESMDESERATUhFRMVMj4CNxcOAisBNTM1IzUhFRcRIREDFTM1AsJSUrv+XQFT/v1DIzo1MhsHHzk9I33P0QEgMwEb1I4DNv4pAaP+kgFu/tPs7P6RZwEEBgU+BgcD4Fc+0KYBdv6KATr9/QAFAGT/wgMVAzcAAwAHAAsADwATAAABMxEjASERIQEhESEHIREhASEVIQLDUlL9oQGj/l0BU/79AQPmAkT9vAH0/lwBpAM3/f4Byv55AUX+/bb+vgEAvgAABQBk/8IDFQM2AAMABwALABMAFwAAATMRIwEhESEBIRUhBzMVITUzESE3FSE1AsNSUv2hAaP+XQFT/v0BA+RRAaBR/b5RAaADNv4fAa3+gwE8+51ubv6ZuXd3AAAEAGT/ugNGAzYAAwAHAAsAIgAAAREjEQcRIREBESERBRUUHgIXBy4BJw4DByc+Az0BAxVSvP5dAVP+/QFoMFJsPCFnoioUQFFeMiE8bFMxAzb9qAJYTf52AYr+twEI/viLHS5UQy8KQBRlUShCMiQKQAouQlQwHQAEAGH/uANlAzcAAwAHAAsAMQAAAREjEQcRIREBESERBRUUHgIXBy4BJw4BBy4BJw4BByc+Az0BMxUUFhc+Az0BAxVSvP5dAVP+/QH9GC5DKylCWxcVUj9AUxQYWj8pKkMvGE89PyAxIBADN/39AgM6/nkBh/67AQP+/aE6I0Q7Lw4+GFg5N18bGls5NlgYPg8xPEIhOjo8dCUUNDk6GjoABQBk/7cDGQM2AAMABwALAB8AKwAAATMRIwEhESEBIREhFzIeAhUUDgIjIi4CNTQ+AhciBhUUFjMyNjU0JgLDUlL9oQGj/l0BU/79AQM2RW9OKipOb0VGcE4qKk5wRmd1dWdnc3MDNv3oAdf+eQFF/v2hFyxAKSlALBcXLEApKUAsF0E4MzM4ODMzOAAEAGT/uQNJAzcAAwAHAAsAKgAAAREjEQcRIREBNSEVASEUHgIXBy4DJw4DByc+AzUhNSE1MxUhAxRSu/5dAVP+/QJ1/vkxUmo6HDNeUD8UFEFSXzMbOWtTMv76AQdTAQcDN/39AgM6/pEBb/7T7Oz+6B8/NSYHPwceKjYfIDYqHQc/ByUzPyI/V1cAAAQAZP/CAywDNgADAAcACwAXAAABESMRBxEhEQE1IRUTIRUhESEVIRUhFSEDFFK7/l0BU/79bwIJ/aUCSf4JAez+FAM2/jAB0Dj+kgFu/tTr6/4wQAFtQFY9AAAAAwBZ/7cDewM2AAcADwATAAABFSMRIxEzESU1MxEhETMVATUhFQN7lFJS/sNQ/l9RAQD/AAHWRf4mA3/+oCjt/aMCXe3+0+zsAAAAAAQAWv+1A3IDNgAHAA8AEwAZAAABFSMVIxEzFScRIREzFTM1ETUjFQc1IREjNQNyhVJS9P5hUf7+BQJHUgJORPECHeiw/lgBqIyM/pqamvFC/szyAAUAWv+3A3IDNwAHAA8AEwAZAB8AAAEVIxUjETMVJxEhETMVMzURNSMVBzUhESMRMzUhESMRA3KFUlL0/mFR/v4ZARxRewEVUQJWRegCDuGr/mEBn4eH/qOVlepC/rsBA0L+uwEDAAAABQBa/7QDcgM2AAcADwATACgALgAAATMVIxUjETMHESERMxUzNRE1IxUFFRQeAhcHLgEnDgEHJz4DPQEFNSERIxEC7YWFUlL0/mFR/v4B+hUoPScrPE4UFU88Kic9KBX+NQEiUQJaReICAzX+ZgGahYX+qJKSnTsiQjoxED4YUTY0VBc+EDE7QiE7TEL+tgEIAAAAAAQAWv/KA3IDNgAHAA8AEwAZAAABMxUjESMRMwcRIREzFTM1ETUjFRcVIRUhEQLthYVSUvT+YVH+/mYCBP2qAidF/sICkkD+RAG8lpb+hqSkmdZDARkAAAAEAFr/wwNyAzYABwAPABMAGwAAATMVIxUjETMHESERMxUzNRE1IxUXFSEVIREhFQLthYVSUvT+YVH+/mQB9v24AjgCX0TxAgwx/l4BoomJ/qCWlu6yQgE2QgAAAAQAWv/AA3IDNgAHAA8AEwAfAAABMxUjFSMRMwcRIREzFTM1ETUjFRMVIRUhNSE1ITUhFQLthYVSUvT+YVH+/lsCCP2oAeb+FwI6AnZEywHPJP54AYiBgf66hob+l2JB4FxB2gAFAFr/ugNyAzYABwAPABMAKAAuAAABFSMVIxEzFScRIREzFTM1ETUjFRMVMj4CNxcOAysBNTM1IzUhFTc1IREjEQNyhVJS9P5hUf7+Ni5JPzkeCSE/RlQ3NdPVASQmARRRAnFE1AHdxZz+dQGLhIT+toeH/pdcAgQIBj4HCAQB1VQ+zYtC/pMBKwAAAAYAWv/CA3IDNgAHAA8AEwAnACsALwAAARUjFSMRMxUnESERMxUzNRE1IxUTFTI+AjcXDgIrATUzNSM1IRUXESERAxUzNQNyhVJS9P5hUf7+KCM6NDIbBx85PSJ9y84BHTcBGNGJAnVE1QHawZn+eAGIgYH+uoWF/phgAQQGBT4GBwPZVD7NngFr/pUBLe/vAAYAWv/CA3IDNgAHAA8AEwAbAC8AMwAAARUjFSMRMxUnESERMxUzNRE1IxUBNTMRIREzFQUVMj4CNxcOAisBNTM1IzUhFQU1IxUDcoVSUvT+YVH+/gH4Sv7kS/63Ijk0MRsIHzk8InzHygEaAQiHAnlE0AHRvZb+fAGEf3/+vYSE/vV0/o0Bc3RhYAEEBgU+BgcD2VQ+zV6CggAAAAUAWv/CA3IDNgAHAA8AEwAXABsAAAEVIxUjETMVJxEhETMVMzURNSMVExEhESUVITUDcoVSUvT+YVH+/g8CM/4dAZICYkXqAgPUpv5iAZ6Hh/6klZX+FgE//sH+vLwAAAUAWv/CA3IDNwAHAA8AEwAbAB8AAAEVIxUjETMVJxEhETMVMzURNSMVBTUzESERMxUFNSEVA3KFUlL0/mFR/v4B8VH9y1EBk/5tAmlF2gHtzqH+aAGYhYX+qZKS/Wr+ogFearJxcQAABABa/7gDcgM3AAcADwATACwAAAEzFSMRIxEzBxEhETMVMzURNSMVBRUUHgIXBy4DJw4DByc+Az0BAu2FhVJS9P5hUf7+AVwwU2w8IS1aUUMXFkRSWy0hPG1SMQJARP7jAlg7/lkBp4+P/puWlpEVMFJALQpACB8wQSoqQS8fCUAKLUBSMBUAAAUAWv+2A3IDNwAHAA8AEwAjAC8AAAEzFSMVIxEzBxEhETMVMzURNSMVBTIeAhUUDgIjIiY1NDYTMjY1NCYjIgYVFBYC7YWFUlL0/mFR/v4BJURtTSkpTW1EiZ+fiWRxcWRnb28CVUT2Ahw5/mMBnYeH/qWUlJ8WKz4oKD4rFldQUFf+8zYwMDU1MDA2AAAAAAQAWv/CA3IDNwAHAA8AEwAfAAABMxUjFSMRMwcRIREzFTM1ETUjFRMVIRUhESEVIRUhFQLthYVSUvT+YVH+/mEB+v21Ajj+GQHcAm1E2AHmLv5yAY6Fhf6ziIj+mVY9AWA9VDwAAAAAAwBV/7YDLwM3AAsAEwAXAAABMxEjESMRIxEzETMlNTMRIREzFRM1IxUC4U5OeU1Nef5+Tf6pTry8Azf8fwHb/lEDQf6xM9v9tQJL2/7S7e0AAAAABABd/7YDKgM2AAsAEwAXAB0AAAEzESM1IxUjETMVMyURIREzFTM1ETUjFRc1IREjNQLbT09yTk5y/t7+pE7BwSQCW1IDNv3n7ekCBdmw/l8BoY2N/qGRkfpC/tDuAAAABABd/8oDRAM2AAsAEwAXAB0AAAERIxEzFTMRMxEjEQERIREzFTM1ETUjFRMhFSERMwJpTk5yT0/+3v6kTsHBiAIR/Z1SAez+zQJt9wEH/WIBVAEC/lIBrpOT/pSYmP6LQwEhAAQAXf/CAzgDNgALABMAFwAfAAABFSMRMxUzNTMRIzUlESERMxUzNRE1IxUTIRUhESEVIQJnTU12T0/+4f6fUr+/bwIa/ZQCZf3tAgznAgHX5/3s6vH+aQGXf3/+rJOT/ltCATlCAAAABABd/8ADSgM2AAsAEwAXACMAAAEVIxEzFTM1MxEjNSURIREzFTM1ETUjFRMhFSE1ITUhNSEVIQJpTk5yT0/+3v6kTsHBggId/ZIB/P4CAlD+AwIrwAG5tsj+Lcjc/ocBeXZ2/seEhP4zQeFZQNYAAAUAXf/CAyoDNgALABMAFwAbAB8AAAEzESM1IxUjETMVMyURIREzFTM1ETUjFRMRIRElFSE1AttPT3JOTnL+3v6kTsHBMgJN/gMBrQM2/fjl2QHqzqn+ZAGcior+ppCQ/h0BPf7D/Lq6AAAAAAUAXf/CAyoDNgALABMAFwAfACMAAAEzESM1IxUjETMVMyURIREzFTM1ETUjFQU1MxEhETMVBTUhFQLbT09yTk5y/t7+pE7BwQIuUf2zUgGq/lYDNv4R2dMB2MGg/moBloeH/qyNjfho/qIBXmi0dHQAAAAABABd/7kDWwM2AAsAEwAXADAAAAEVIxEzFTM1MxEjESURIREzFTM1ETUjFQUVFB4CFwcuAycOAwcnPgM9AQJpTk5zTk7+3f6kTsHBAX0zVm48HzNgVEIUFUNSYDMfPG5VMwIL5wIB1+j9nwE27v5fAaGMjP6hkpKjHSpLOykJPwggLj0kJD0uIAg/CSk7SyodAAAAAAQAXf+6A3ADNgALABMAFwA9AAABFSMRMxUzNTMRIzUlESERMxUzNRE1IxUFFRQeAhcHLgEnDgEHLgEnDgEHJz4DPQEzFRQWFz4DPQECaU5Ock9P/t7+pE7BwQIRGC9DKihDWxcVUj9AUhQYWz8pK0MvGE8+PyAvIA8CFNsB7M7f/frk6/5mAZqJif6nj4+fJyREOzAPPRhYOTdfGhlbOTZYGD0PMj1DIScnPXUlFDQ6OxonAAUAXf+3Ay4DNgALABMAFwArADcAAAEVIxEzFTM1MxEjNSURIREzFTM1ETUjFQUyHgIVFA4CIyIuAjU0PgITMjY1NCYjIgYVFBYCaU5Ock9P/t7+pE7BwQFXRW9OKipOb0VFb00qKk1vRWd0dGdnc3MCBdgB+N3u/dv07v5jAZ2Kiv6lkZGcFik8Jyc9KRYWKT0nJzwpFv77MzAwMjIwMDMAAAAABABd/8IDQQM3AAsAEwAXACMAAAEVIxEzFTM1MxEjNSURIREzFTM1ETUjFRMhFSERIRUhFSEVIQJpTk5yT0/+2/6nTr6+iAIO/aECTf4EAfH+DwIpzQHJusz+HNbc/n4Bgnx8/sCFhf46PQFgPlI7AAMAWf+3A3YDNwALABMAFwAAASMVMxUjESMRMxUzBTUzESERMxUBNSEVA3aPj49SUo/+NFD+X1EBAP8AAhLHRP6wA4DhWO39owJd7f7T7OwABABa/7YDcAM2AAsAEwAXAB0AAAEjFTMVIxUjETMVMyURIREzFTM1ETUjFQc1IREjNQNwg4ODUlKD/on+YVH+/gUCR1ICantDkQIbiFD+WAGojIz+mpqa7kL+yvQAAAAABABa/8oDcQM2AAsAEwAXAB0AAAEjFTMVIxUjETMVMyURIREzFTM1ETUjFRcVIRUhEQNxhISEUlKE/oj+YVH+/mYCBP2qAkmVRMsCkapq/kQBvJaW/oakpJnWQwEZAAAABQBZ/8ADbgM2AAsAEwAXABsAHwAAASMVMxUjFSMRMxUzJREhETMVMzURNSMVExEhEQEVITUDboaGhlRUhv6G/mVS9/cCAjz+FwGVAmuBRnsCDYVS/mYBmomJ/qiMjP4VAUn+twEIxsYAAAAABQBa/8IDcAM2AAsAEwAXAB8AIwAAASMVMxUjFSMRMxUzJREhETMVMzURNSMVBTUzESERMxUFNSEVA3CDg4NSUoP+if5hUf7+AfFR/ctRAZP+bQJ8cER+Aex2Sv5oAZiFhf6pkpL9av6iAV5qsnFxAAUAWf+4A24DNgALABMAFwAlADEAAAEjFTMVIxUjETMVMyURIREzFTM1ETUjFQUyFhUUDgIjIiY1NDYTMjY1NCYjIgYVFBYDboWFhVRUhf6G/mVS9/cBHIyiKk5wRo2ioo1ncXFnZ3NzAmuBRYkCGoZT/mYBmomJ/qiMjJdbVClBLBdbUlRb/uU5MzQ5OTQzOQAAAAACAFn/tAMYAzcADwATAAABMxEjESMRIREzFTM1MxEzATUjFQLGUlLS/mVR+lDS/t76Azf8fQH0/u8CWenp/vr+8OzsAAMAYv+1AxgDNgAPABMAGQAAATMRIzUjFSERMxUzNTMVMwU1IxUXNSERIzUCxVNTz/5sUfJRz/7g8g0CWFMDNv3r6bYBrZOUtbeXl+hD/sT5AAAAAAMAYv/KAy0DNwAPABMAGQAAARUhETMVMzUzFTM1MxEjEQU1IxUTIRUhETMB9v5sUfJRz1NT/uDydgIE/apSAfe/AcOensH9/WgBWH2iov6TQwEWAAMAYv/CAykDNwAPABMAGwAAARUhETMVMzUzFTM1MxEjNQU1IxUTIRUhESEVIQH2/mxR8lHPU1P+4PJuAgj9pwJK/gcCD7EBqJGSteX99eNvlZX+ZEIBNkMAAAAAAwBi/8IDOQM2AA8AEwAfAAABFSERMxUzNTMVMzUzESM1BTUjFRMhFSE1ITUhNSEVIQH2/mxR8lHPUlL+4PJ1AhH9ngHv/g8CQv4RAiykAYWAgJ/I/i7IY4WF/jpB3lhA1QAAAAUAYv/CAxcDNwAPABMAJwArAC8AAAE3ESM1IxUhETMVMzUzFTMFNSMVExUyPgI3Fw4CKwE1MzUjNSEVFxEhEQMVMzUCxVJSz/5sUfJRz/7g8j8kOzYzGwgfOj4jgNDTASI2AR/XjwM2Af4mzqgBiIGBnqiFhf6hZQEDBgU+BgcD4FQ/z6QBc/6NATX39wAAAAQAYv/CAxgDNwAPABMAFwAbAAABNxEjNSMVIREzFTM1MxUzBTUjFRMRIRElFSE1AsVTU8/+bFHyUc/+4PIeAkf+CQGnAzYB/fjisAGjjo+xsZKS/h8BP/7B/ry8AAAAAAQAYv/DAxgDNgAPABMAGwAfAAABMxEjNSMVIREzFTM1MxUzBTUjFQU1MxEhETMVBTUhFQLFU1PP/mxR8lHP/uDyAhNR/cJRAZz+ZAM2/hbLqQGaiYmuqY6O/Gz+ogFebLBwcAADAGL/uQNOAzYADwATACwAAAEVIREzFTM1MxUzNTMRIxEFNSMVBRUUHgIXBy4DJw4DByc+Az0BAfb+bFHyUc9TU/7g8gFuMVJuPB8zYFFAFBRBUV8zHzxtUzECBKwBqZGRuu/9lQE5aZSUkxouUUAsCkAJIjI/JyZAMiIJQAotQFEtGgAEAGL/twMaAzcADwATACMALwAAARUhETMVMzUzFTM1MxEjNQU1IxUFMhYVFAYjIi4CNTQ+AhMyNjU0JiMiBhUUFgH2/mxR8lHPU1P+4PIBPIugoItFbk4pKU5uRWdzc2dncXECD7UBpY+QruX94Phzk5OXV1BQVxYrPigoPisW/vI2MTE3NzExNgAAAAMAYv+5A0UDNwAPABMALgAAARUhETMVMzUzFTM1MxEjNQU1IxUFIx4DFwcuAycOAwcnPgM3IzUhAfb+bFHyUc9TU/7g8gJx/AQxTmQ2HjFcTj0TEz1OWzEeOGNNMAT5Ak0CDqwBn4yNseb99eJqkZHoI0E0JQg+CB8sOSEiOCwfCD4IJTRAJEEAAAAAAwBV/7YDLwM3AAMAEwAXAAABMxEjAxEzESMRIxEhETMVMzUzFQM1IxUC4U5Osk5Ogv6oTr1NTb0DN/x/AiwBQfy/Ab3++AJH2tr8/vjo6AAEAF3/tQMqAzYAAwATABcAHQAAATMRIyUVIREzFTM1MxUzNTMRIzUHNSMVFzUhESM1AttPT/7e/qROwU1zTU3AwSQCW1IDNv3h8LQBqpGStNv9++dzmJjtQ/7L8gAAAAAEAF3/ygNEAzYAAwATABcAHQAAAREjEQEVIREzFTM1MxUzNTMRIxEHNSMVEyEVIREzAypP/t7+pE7BTXhNTcXBiAIR/Z1SAzb9WQKn/rq4AbeXl7zy/YQBR3adnf6TQwEfAAAABABd/8IDOQM2AAMAEwAXAB8AAAERIxEBFSERMxUzNTMVMzUzESM1BzUjFRMhFSERIRUhAypP/t7+pE7BTXNNTcDBhAIK/aUCUf4AAzb99wIJ/tqwAaKMjbDS/hHabpOT/mJCATxCAAAEAF3/wANMAzYAAwATABcAIwAAAREjEQEVIREzFTM1MxUzNTMRIzUHNSMVEyEVITUhNSE1IRUhAypP/t7+pE7BTXNNTcDBggIf/ZAB/P4CAlD+AwM2/ikB1/7zoAF5dnaWuP5BxGCEhP44Qd5UQdIABQBd/8IDKgM2AAMAEwAXABsAHwAAATMRIyUVIREzFTM1MxUzNTMRIzUHNSMVExEhESUVITUC209P/t7+pE7BTXNNTcDBMgJN/gMBrQM2/fnisAGijI2w0f4T2W6Tk/4fATr+xvm3twAFAF3/wgMqAzYAAwATABcAHwAjAAABMxEjJRUhETMVMzUzFTM1MxEjNQc1IxUFNTMRIREzFQU1IRUC209P/t7+pE7BTXNNTcDBAi5R/bNSAar+VgM2/hDSqwGWhoaoyv4pymqPj/do/qMBXWizc3MABABd/7kDWwM2AAMAEwAXADAAAAERIxEBFSERMxUzNTMVMzUzESM1BzUjFQUVFB4CFwcuAycOAwcnPgM9AQMqTv7d/qROwU14TU3FwQF9M1ZuPB8zYFJDFRVDUmAzHzxuVTMDNv2fAmH+0rABoY2Or9j+BeBukpKjHSpLOykJPwggLj0kJD0uIAg/CSk7SyodAAAAAAQAXf+5A3EDNgADABMAFwA9AAABESMRARUhETMVMzUzFTM1MxEjNQc1IxUFFRQeAhcHLgEnDgEHLgEnDgEHJz4DPQEzFRQWFz4DPQEDKk/+3v6kTsFNc01NwMECERkuQyspQ1sXFFI/QlEUGFs/KStDLxhPPj8gMB8QAzb9+wIF/tqxAaKMja/S/hTXb5SUmigjRDswDz0YWTk3YBsaWzk2WBg9DzI8QyEoKDx1JRQ0OTsaKAAAAAAFAF3/twMuAzcAAwATABcAKwA3AAABESMRARUhETMVMzUzFTM1MxEjNQc1IxUFMh4CFRQOAiMiLgI1ND4CEzI2NTQmIyIGFRQWAypP/t7+pE7BTXNNTcDBAVdFb04qKk5vRUVvTSoqTW9FZ3R0Z2dzcwM3/dkCJ/7VtwGijIyo1v4I33aVlZ0WKTwmJjwpFhYpPCYmPCkW/v0yMDAyMjAwMgAAAAMAWf+0AxgDNwAPABMAFwAAATMRIxEjFSERMxUzNTMVMwczNSMDNSMVAsZSUtL+ZVH6UNLS0tJQ+gM3/H0BbYoCWenpmfOw/sbs7AAEAGL/tQMYAzYADwATABcAHQAAATMRIzUjFSERMxUzNTMVMwczNSMHNSMVFzUhESM1AsVTU8/+bFHyUc/Pz89R8g0CWFMDNv3rjVoBrZOTWrZzzpeX6EP+xPkAAAQAYv/KAy0DNgAPABMAFwAdAAABFSERMxUzNTMVMzUzESM9ASMVMwU1IxUTIRUhETMB9v5sUfJRz1NTz8/+4PJ2AgT9qlIBjlYBw56eaaT9ae/Cf1eiov6TQwEWAAAAAAQAYv/CAzkDNgAPABMAFwAjAAABFSERMxUzNTMVMzUzESM9ASMVMwU1IxUTIRUhNSE1ITUhFSEB9v5sUfJRz1JSz8/+4PJ1AhH9ngHv/g8CQv4RAdROAYeAf1V//ixyo2NMhYX+O0HeVkHVAAUAYv/CAxgDNgAPABMAFwAbAB8AAAEzESM1IxUhETMVMzUzFTMHMzUjBzUjFRMRIRElFSE1AsVTU8/+bFHyUc/Pz89R8h4CR/4JAacDNv35fUwBo46OW7p4xJOT/iABP/7B/ry8AAAABQBi/8MDGAM2AA8AEwAXAB8AIwAAATMRIzUjFSERMxUzNTMVMwczNSMHNSMVBTUzESERMxUFNSEVAsVTU8/+bFHyUc/Pz89R8gITUf3CUQGc/mQDNv4Wd1YBm4mJWKtovo+P+mz+ogFebLBwcAAAAAQAYv+5A04DNgAPABMAFwAwAAABFSERMxUzNTMVMzUzESM9ASMVMwU1IxUFFRQeAhcHLgMnDgMHJz4DPQEB9v5sUfJRz1NTz8/+4PIBbjFSbjwfM2BRQBQUQVFfMx88bVMxAadVAa+UlGCV/ZXct3RWmJiMGi5RQCwKQAkiMj8nJkAyIglACi1AUS0aAAAAAAQAYv+5A2sDNgAPABMAFwA9AAABFSERMxUzNTMVMzUzESM9ASMVMwU1IxUFFRQeAhcHLgEnDgEHLgEnDgEHJz4DPQEzFRQWFz4DPQEB9v5sUfJRz1NTz8/+4PICBBguQyspQlsXFVI/QlEUGFlAKSpDLxhPPj8gMCAPAbZXAamRkVqI/fiItXNWlJSSMCNEPDAPPRlYOTdgGxpcOTZYGT0QMjxDITAwPHYlFDU5OxowAAAAAAUAYv+3AxoDNgAPABMAFwAnADMAAAEVIREzFTM1MxUzNTMRIz0BIxUzBTUjFQUyFhUUBiMiLgI1ND4CEzI2NTQmIyIGFRQWAfb+bFHyUc9TU8/P/uDyATyLoKCLRW5OKSlObkVnc3NnZ3FxAapQAaWPj1uS/eGTuHVRk5OXV1BQVxYrPigoPisW/vI2MTE3NzExNgAEAGL/wgMsAzcADwATABcAIwAAARUhETMVMzUzFTM1MxEjPQEjFTMFNSMVEyEVIREhFSEVIRUhAfb+bFHyUc9SUs/P/uDyeQIA/a4CQf4RAeL+HgHOUwGQhYVVgf4bfKdmUoqK/kM+AWM9VD0AAAAABABV/7YDLwM3AAMAEwAXABsAAAEzESMDNTMRIxEjFSERMxUzNTMdATM1IwM1IxUC4U5Osk5Ogv6oTr1NgoJNvQM3/H8Cm9L8vwFCjQJH2tqN6qf+zOjoAAUAXf/KA0QDNgADABMAFwAbACEAAAERIxEBFSERMxUzNTMVMzUzESM9ASMVMwc1IxUTIRUhETMDKk/+3v6kTsFNeE1NeHjFwYgCEf2dUgM2/VkCp/5gXgG8mppjlP2E7bh2Xp+f/pNDAR8AAAIANQApA2IC9wAPABMAACUhFSE1ITUhETMVITUzESElFSE1AfQBbvzTAWz+9FEBylD+9P7yAcpsQ0PBAcqgoP4256WlAAAAAAMANP+2A2ADIgAPABMAGQAAASEVITUhNSERMxUhNTMRISUVITUBNSERIzUB9AFs/NQBbv7+UQG0Uf7+/v0BtP3qAm1SAWhDQ2sBT2Zm/rGpaGj+EEL+6NYAAAAABAA0/7cDYAMlAA8AEwAZAB8AAAEhFSE1ITUhETMVITUzESElFSE1ATUhESM1MzUhESM1AfQBbPzUAW7+/lEBtFH+/v79AbT94QErUXwBJFEBd0JCYAFOZmb+sqlnZ/4iQv7T60L+0+sAAAAAAwA0/8oDYAMTAA8AEwAZAAABIRUhNSE1IREzFSE1MxEhJRUhNQEVIRUhNQH0AWz81AFu/v5RAbRR/v7+/QG0/koCF/2XAU1DQ2ABZnFx/pq1c3P+YLVD+AAAAAADAC3/wANaAyMADwATABsAAAEhFSE1ITUhETMVITUzESElFSE1ARUhFSERIRUB7gFs/NMBbf79VAGxU/7//v0Bsf5IAh/9jQJrAXpDQ2QBRV9f/rulY2P+IKBDASVCAAADADT/wANgAykADwATAB8AAAEhFSE1ITUhETMVITUzESElFSE1ARUhFSE1ITUhNSEVAfMBbfzUAW3+/1EBtFH+/f7+AbT+RAIq/YYCDv3vAmIBq0JCVgEoVVX+2JVWVv3AVz/STj7IAAUALf+6A1wDLgAPABMAGwAtADEAAAEhFSE1ITUhETMVITUzESElFSE1EzUzESERMxUFFTI2NxcOAisBNTM1IzUhFQU1IxUB7gFu/NEBbf7+UwGxVP7+/v0BsSNL/tFM/q1AaT4HJEBBIXnT1gEnARiYAaxBQVIBMFZW/tCcXFz+Enf+mQFnd1pZBQo+BgcD0lVAz1ZxcQAABAA0/8IDYAMkAA8AEwAXABsAAAEhFSE1ITUhETMVITUzESElFSE1AREhESUVITUB9AFs/NQBbv7+UQG0Uf7+/v0BtP30AmT97AHEAXdDQ2MBSmRk/ranZmb9QQEg/uDenJwAAAQANP/CA2ADKAAPABMAGwAfAAABIRUhNSE1IREzFSE1MxEhJRUhNRM1MxEhETMVBTUhFQH0AWz81AFu/v5RAbRR/v7+/QG0AlL9olEBu/5FAYVCQl8BRGBg/rylY2P+I1v+uwFFW6hoaAAAAAMANP+5A2ADHwAPABMALAAAASEVITUhNSERMxUhNTMRISUVITUDFRQeAhcHLgMnDgMHJz4DPQEB9AFs/NQBbv7+UQG0Uf7+/v0BtLAwUm09HzNfUUAUFEFSXzMePW1TMAFxQ0NkAUpkZP62p2Zm/ncYK0s7KAhBCB8uOyQkOy4fCEEIKDtLKxgAAAAABAA0/7cDYAMfAA8AEwAfACsAAAEhFSE1ITUhETMVITUzESElFSE1AzIWFRQGIyImNTQ2FzI2NTQmIyIGFRQWAfQBbPzUAW7+/lEBtFH+/v79AbTaj6Ojj5CkpJBqdXVqbXR0AXZDQ18BSmRk/ranZmb+dFJLS1FRS0xR+jAtLTExLS0wAAAAAAMAK/+3A3UDNwAHAB8AIwAAARUjESMRMxEFFT4BNxcOAyMnMjY3NSMRMxUhNTMRJRUhNQN1jlJS/oY/dzkHR5OPiDsMN3lAtVEBG1L+kwEbAb9F/j0DgP6IZqADCQg8DA4HAkUBAqMBk4aG/m3MiooAAAAABAA0/8oDcAM2AAcAHwAjACkAAAEzFSMRIxEzAxcOAyMnMjY3NSMRMxUhNTMRIxU+AQEVITUDFSEVITUC7ISEUlKLBUaSj4c6CjZ3P61RAQhSrD15/pwBCMUCBf2pAgRE/sYCsP4zPAwOBwJEAQJpAU5mZv6yZgMKAQFnZ/5es0P2AAAABAA0/7kDcAM3AAcAHwAjAEcAAAEzFSMVIxEzAxcOAyMnMjY3NSMRMxUhNTMRIxU+ASUVITUTFRQeAhcHLgEnDgEHLgEnDgEHJz4DPQEzFRQWFz4BPQEC7ISEUlKLBkWTkIg7CDZ3P65RAQpSrT15/psBCtEYLkMrKUJaFxRSQEBSFBdZQikrQy4YTj9APz8CO0ToAij+TzkMDwcDQQICZgE+Xl7+wmIDCvZgYP53FiFCOS4OPBdWNjdbGRlaNjZUFzwOLjlCIRYWOXEkJXA5FgAAAAAFADL/tQNxAzcABwAfACMALwA7AAABMxUjFSMRMwMXDgMjJz4BNzUjETMVMzUzESMVPgElFTM1AzIWFRQGIyImNTQ2EzI2NTQmIyIGFRQWAu6Dg1NTiwVBj5CMPws5fD+mUfpRojx2/qX6AZScnJSTnZ2TanFxampwcAI5Ru8CM/5ZPwgMCQVHAQMCWgE5XFz+x1YDCOpeXv6BUk5OU1NOTlL/ADIuLTExLS4yAAAAAAMAKv+3AycDNwALACMAJwAAATMRIxEjESMRMxEzBRU+ATcXDgMjJzI2NzUjETMVMzUzESUVMzUC2U5ObE1NbP5kMWAqBjh7eXAsDCpkN5FN1k3+3dYDN/yAAcj+ZwM9/p9qmAMIBzwLDQYCRAECmwGOgID+cs2LiwAAAAAEADD/ugNpAzcACwAjACcASwAAARUjETMVMzUzESM1BxcOAyMnMjY3NSMRMxUzNTMRIxU+ASUVMzUBFRQeAhcHLgEnDgEHLgEnDgEHJz4DPQEzFRQWFz4BPQECb05Oa05O5AY2eXdvLAsqYzaNTs1NjTBb/ujNATMZLkQqJkVaGBRSP0BSFBdbQicqQy8YTz4/Pz8B9+sCHe/9/c7yfzkKDAYCQQECYAFFYGD+u10DB/pnZ/56FCFBOC0NPRdVNjZbGBhaNjZUFz0NLTlBIBQUN3AkJXA2FAADADv/tQMQAzgAAwAaAB4AAAEzESMBFT4BNxcOAyMnMjc1IxEzFSE1MxElFSE1Ar5SUv7FQn8/B0qalY4+CnSCuFIBIlH+jQEiAzj8fQGkogMKCDwMDggCRQOlAZSBgf5s0pCQAAAAAAQAO/+1AxMDNgADABsAHwAlAAABMxEjJxcOAyMnMjY3NSMRMxUhNTMRIxU+ASUVITUBNSERIzUCwVJSRgZIlpOMPgs5fkKwUQESULE/ev6WARL+1AJYUgM2/ceIPAwPBwNDAgNhAUNgYP69XQMK82Fh/h9C/uTaAAQAOf/KAzADNwADABsAHwAlAAABESMRAxcOAyMnMjY3NSMRMxUhNTMRIxU+AQEVITUDIRUhNTMDE1JIBkmWk4s9DDl/Q7BRARJQsT94/pgBEssCFP2aUgM3/UYCuv4mPAwNBwFDAQJnAVpsbP6mZAMJAQdubv2xQ/MAAAAEADr/wAMzAzcAAwAbAB8AKwAAAREjEQMXDgMjJzI2NzUjETMVITUzESMVPgElFSE1AyEVITUhNSE1IRUhAxRSRgZIlZOOPws6fkKwUQESULE/e/6VARLPAhv9lAH9/gECT/4EAzf+FwHp/og6Cw0HAkACAlABJ1VV/tlMAwjVVFT9dEDWT0DMAAAAAAUAO//CAxMDNgADABsAHwAjACcAAAEzESMnFw4DIycyNjc1IxEzFSE1MxEjFT4BJRUhNQERIRElFSE1AsFSUkYGR5aTjT4LOX5CsFEBElCxP3r+lgES/uICSv4GAaoDNv3Wfz0LDQgCQwIDXwE5W1v+x1wDCe5dXf1RARz+5NuZmQAAAAUAO//CAxMDNgADABsAHwAnACsAAAEzESMnFw4DIycyNjc1IxEzFSE1MxEjFT4BJRUhNRM1MxEhETMVBTUhFQLBUlJGBkmXk4s+Cjl+QrBRARJQsT96/pYBEtxQ/bVRAar+VgM2/fFyOwwOBgJCAQJdATVZWf7LWgQJ6lxc/ixY/sMBPVijY2MAAAAAAwA1ACgDYgL5AA8AEwAXAAAlMxUhNTM1IxEzFSE1MxEjJRUhNQUVMzUChtz809x7UQHJUXv+YQHJ/rPSa0NDxQHJoKD+N+elpefFxQAAAAAEADT/ygNgAxUADwATABcAHQAAATMVITUzNSMRMxUhNTMRIyUVITUFFTM1BRUhFSE1AoHf/NThdVEBtFF1/nABtP7CyP7AAhf9lwFKQkJlAWZwcP6atnNztmVl8LJD9QAFAC7/wANaAyMADwATABcAGwAfAAABMxUhNTM1IxEzFSE1MxEjJRUhNQUVMzUBESERJRUhNQJ64PzU33VTAbFTdf5xAbH+xMb+awJm/e0BvwF4QUFmAUVgYP67pmRkpmZm/eIBIv7e4qKiAAADADT/tQNiAxMABwALABMAAAERIREzFSE1ETUhFQUVIREjESE1Avv9oFEBvf5DAnb+kFL+lAMT/nwBhHt7/r+EhK9C/tQBLEIAAAAAAwA0/7UDYAMiAAcACwAZAAABESERMxUhNRE1IRUFIRUhESM1ITUhNSE1IQL2/apRAbT+TAJv/pMBCVL95QES/pMDLAMi/rEBT2Zm/vJoaNdp/uHdQmlDAAQAM//KA2IDGgAHAAsAEwAZAAABESERMxUhNRE1IRUHIRUhFSM1IRcVIRUhNQL2/apRAbT+TL4DL/6YUv6LuQIb/ZQDGv6aAWZycv7bdHSYQq6uXbFD9AADADT/xANgAyYABwALABsAAAERIREzFSE1ETUhFQUhFSEVIRUhFSERITUhNSEC9v2qUQG0/kwCb/6TAQz96wId/ZEBCf6TAywDJv61AUtkZP72Z2fXakKTQgEXakMAAAADADT/wANgAykABwALAB8AAAERIREzFSE1FTUhFQUhFSEVIRUhFSE1ITUhNSE1ITUhAvb9qlEBtP5MAm/+kwEF/fECKv2GAg797wEL/pMDLAMp/tgBKFVV6VZWyljIVz/STj5YQgAAAAMANP+2A2ADKAAHAAsALgAAAREhETMVITUVNSEVBSEVIREjESM1IxUjFTI+AjcXDgMrATUzNSM1ITUhNSEC9v2qUQG0/kwCb/6SARBRzDDYMk5COx8HIUBJWDk32NoBFf6TAywDKP7RAS9YWPBaWsdd/qIBGz27VgIFCQc9CAkFAcxMPF1BAAAEADX/wANfAyoABwALACsALwAAAREhETMVITUVNSEVBSEVIREhESMVIxUyPgI3Fw4CKwE1MzUjNSE1ITUhBRUzNQL2/apRAbT+TAJu/pMBEf7gONEnPzYyGgYeOD4kg9HTARb+lAMq/sqUAyr+0QEvWFjwWlrHWv6nAVK9WAEDBgU8BgcDz009WkLZ398AAAAEADX/wgNgAyUABwALABcAGwAAAREhETMVITURNSEVBSEVIREhESE1ITUhAzUhFQL2/apRAbT+TAJv/pQBCf2cAQj+lAMrs/48AyX+tgFKZGT+92Zm1mT+4AEgZEP+e5ycAAAABQA0/8IDYAMpAAcACwATABsAHwAAAREhETMVITURNSEVByEVIRUjNSEFNTMRIREzFQU1IRUC9v2qUQG0/ky9Ayz+lFP+kwJzUv2iUQG7/kUDKf68AURgYP79ZGSSQnZ2q2T+twFJZKNkZAAABAA0/7oDYwMrAAcACwATACwAAAERIREzFSE1ETUhFQchFSEVIzUhBRUUHgIXBy4DJw4DByc+Az0BAvb9qlEBtP5MvQMv/o9R/pMBwDFSbj0bNGJTQRQYSldcKho9blMxAyv+uwFFYGD+/GRklkJkZIgYJD4vIAY+BhomMx8lNiQUBT4GIDA9JBgAAAAEADX/twNgAyAABwALAB4AKgAAAREhETMVITURNSEVBSEVHgEVFAYjIiY1NDY3NSE1IQM0JiMiBhUUFjMyNgL2/apRAbT+TAJv/pSAiaOPkKSJgf6UAyu2dWptdHRtanUDIP62AUpjY/73ZmbTVQZQRkxQUExGUAZVQv7NLTExLS0xMQADADT/wANgAyYABwALAB8AAAERIREzFSE1FTUhFQUhFSEVIRUhFSEVIRUhESE1ITUhAvb9qlEBtP5MAm/+kwEO/esB//4BAh79kAEH/pMDLAMm/tQBLFdX7VhYzlw9SjxPPQFPXEIAAAQANP/CA2ADJgAHAAsAHwAjAAABESERMxUhNRE1IRUFIRUhFSMVMxUhNTM1IzUhNSE1IQE1IxUC9v2qUQG0/kwCb/6UAROIkP14kIgBEv6TAyz+zsYDJv62AUpjY/74ZWXXYUKgQkKgQmFC/nugoAAEADH/tgMWAzYABwAPABMAIwAAATMRIzUjNTMDESERMxUhNRE1IRUFFw4BBxEjEQ4BIycyPgICxFJSy8uS/k5RARD+8AGvBUKGQlI/dzcLQ5SYmAM2/IDWPwJJ/qEBX21t/uNwcIw9CAsE/rsBQgICRgEFCAAAAAAFADH/yAMnAzYABwAPABMAIwApAAABMxEzESM1IxMRIREzFSE1ETUhFRM1DgEjJzI+AjcXDgEHFQchFSERMwINslJSshz+WlMBAP8AUT90Ng1Bj5WURgc/fz93AiT9iFQBLAIK/V1dAhz+vwFBXFz+/2ho/q+OAgJGAgQJBz0ICwSSsEIBBQAABQAy/8ADMgM2AAcADwATACIALgAAATMRMxEjNSMTESERMxUzNRU1IxUTNQYjJzI+AjcXDgEHFQMhFSE1ITUhNSEVIQIPslJSshj+YVH+/k18bgpBkZaYSAVCg0JrAiX9igIH/fcCWf36AYMBs/3qLAHW/vQBDEtL0UxM/s9/Az4BBQkINgkLBIP+3DzBRDu3AAAAAAUAM/+5A2UDNwAHAA8AEwAiAEYAAAEzETMRIzUjExEhETMVMzUVNSMVEzUGIycyPgI3Fw4BBxUFFRQeAhcHLgEnDgEHLgEnDgEHJz4DPQEzFRQWFz4BPQECD7JSUrIY/mFR/v5NfmsKP46Vl0cHP4NAATgZLkMrJ0JdFxRUP0BSFBhcQiUqQy4ZUD0/QEABaQHO/ckxAez+7AEUTk7ZUFD+u4oDQAEECAg3CAwDjiAQIUA3LA09FlM2NlgZGFg2NlIWPQ0tN0AgEBA5bCQkbzYQAAAABQAt/7UDEgM2AAcADwATACMALQAAATMRMxEjNSMTESERMxUzNRU1IxUTNQ4BIycyPgI3Fw4BBxUHIREjNQUnJTUhAgS7UlK7Iv5bU///Sz1zNgxCkJWWRgY/g0LMAmxU/d4MAi796AFVAeH9wCUB/f7jAR1RUd9SUv67iAICRQIECAY9CAoDix7+32MaQBNFAAAAAAUAKf+3Ay0DNgADAAsAEwAXACcAAAEzESMDETMRIzUjNRMRIREzFTM1ETUjFQUXDgEHESMRDgEjJzI+AgLeT0+pTU2nQv6QTdfXAU8GMGI2TjNdKAswdn17Azb8gQErAkD8xLxAAhj+vQFDXl7+/WdnfTsIDAP+1wEkAwJFAgUJAAAAAAcAMv+0AzEDNgADAAsAEwAXACcAPABCAAABMxEjJTMRMxEjNSMTESERMxUzNRU1IxUTNQ4BIycyPgI3Fw4BBxUHFTI+AjcXDgMrATUzNSM1IRU3NSERIxEC405O/r6fTk6fL/6eUr+/PTZhKgoyeX98NQYuZjRTME1FQSMGJkZMVzc37O4BPycBJlQDNv3rYQGm/f0mAdD+8QEPTU3TTU3+4HADAkMDBQkGOwcKBHXjTwIFCAY5CAkFAcFNPMCCPv6vARMAAAAABAAy/7UDFQM2AAMACwAPACAAAAEzESMDESERMxUhNRE1IRUFFw4BBxEjEQ4BKwEnMzI+AQLDUlKN/k1RARH+7wGvBkCCQFIhQB93DIpJmZsDNvx/A1z+mwFlbW3+3Hd3iz0KCwP+xQE3AQFEBQkAAAQANP+2Aw8DNwADAAsADwAlAAABMxEjAxEhETMVITUVNSEVFxUhESM1ITUzNQ4BIycyPgI3Fw4BAr1SUon+UFEBDv7yrgGMUv33fUJ5NwtBkpeYSAY/ggM3/coCDv7FATtdXflcXM54/ubXQ3QDAkMCBQoIOgkMAAUANv/KAysDNwADAAsADwAfACUAAAERIxEHESERMxUhNRU1IRUTNQ4BIycyPgI3Fw4BBxUHIRUhNTMDD1KJ/lBRAQ7+8mtFfzoMQZGWl0gGPHk8jAIl/YlSAzf9UwKtLf6/AUFhYf9eXv6bjwMCRQEECQg9CAoDk5hE/QAEADn/wAMwAzcAAwALAA8AKwAAAREjEQcRIREzFSE1FTUhFRMhFSE1ITUhNTM1DgEjJzI+AjcXDgEHFSEVIQMPUon+UFEBDv7yPQIe/ZEB/f4BdEB6NgpAkJaZSAQ/gT8Biv4DAzf+DgHyH/7pARdRUdtQUP3CP9FOP10CAUABBAkIOAkLBGDJAAAAAAUAOf+3AxUDNwADAAsADwAtADkAAAERIxEHESERMxUhNRU1IRUXFT4BMzIWFRQGIyImNTQ2NzUOASMnMj4CNxcOARMyNjU0JiMiBhUUFgMPUon+UFEBDv7yrhczHY+cnI+PnDw3P3k3CkGQlphIBT+DJ2dycmdncXEDN/28AkQl/s4BMllZ8VlZ0GsEA1BLS1BQSy1AFHoCAUMBBAkIOwgL/qAwLS0vLy0tMAADADT/tgNiAxQABwALABcAAAERIREzFSE1ETUhFQUVIxEjESMRIxEjNQL7/aBRAb3+QwJ2zlLvUs0DFP6CAX54eP7EgoKtQ/7OATL+zgEyQwAAAAAEADP/ygNiAxoABwALABcAHQAAAREhETMVITURNSEVByEVIxUjNSMVIzUhFxUhFSE1Avb9qlEBtP5MvgMv0FKeUv7jtwIj/YsDGv6aAWZycv7bdHSZQqurq6tas0P2AAAEADT/wANgAyoABwALAB8AIwAAAREhETMVITUVNSEVBSMVMxUhFSEVITUhNSE1MzUjNSEFNSMVAvb9qlEBtP5MAm/Xb/3xAir9hgIO/e983gMs/tfUAyr+2AEoVVXpVlbKWchXP9JOPllBmllZAAAABQA1/8IDYAMmAAcACwAXABsAHwAAAREhETMVITURNSEVBSMVMxEhETM1IzUhBTUjFQU1IRUC9v2qUQG0/kwCb9d0/Zx53QMr/tfUAUr+PAMm/rYBSmRk/vdmZtVm/uABIGZCqGZm3pycAAAABAA0/7oDYAMiAAcACwAXADAAAAERIREzFSE1ETUhFQchFSMVIzUhFSM1IwUVFB4CFwcuAycOAwcnPgM9AQL2/apRAbT+TL0DLLNS/uBRtgHBMFNuPR0zYFJCFBVBU2AzHT5uUzADIv62AUpjY/73ZmaWQqCgoKBSGytKOCYIPwgdKzkjIzgsHQg/CCY4SisbAAAAAAUANf+3A2ADIQAHAAsAHgAlADEAAAERIREzFSE1ETUhFQUjFR4BFRQGIyImNTQ2NzUjNSEFNSMVNjMyFzQmIyIGFRQWMzI2Avb9qlEBtP5MAm/NMzekj4+kNjPLAyv+4vE2Q0Kec21qdnZqbXMDIf62AUpjY/73ZmbRdRRAK0tRUUsrQBR1QqJgYAmdLTExLS0wMAADADUALQNiAvYABwALAA8AABMzFSE1MxEhNxUhNQEhFSGVUQHKUP2VUQHK/YUDLfzTAvakpP4t7aqq/mFEAAAABAA0/7UDYAMfAAcACwAPABUAABMzFSE1MxEhNxUhNQEhFSEXIREjNSGgUQG0Uf2qUQG0/Y8DLPzUWwJtUv3lAx9mZv6xqmho/vlDXP7h3QAEADT/ygNgAxEABwALAA8AFQAAAREhETMVITURNSEVByEVIRcVIRUhNQL2/apRAbT+TL0DLPzUuwIX/ZcDEf6aAWZxcf7cc3OYQlC2Q/kAAAQANP/AA2ADJwAHAAsADwAbAAABESERMxUhNRU1IRUHIRUhExUhFSE1ITUhNSEVAvb9qlEBtP5MvQMs/NS1Air9hgIO/e8CYgMn/tgBKFVV6VZWi0H+5lk/008+yAAAAAUANP/CA2ADIQAHAAsADwATABcAABMzFSE1MxEhNxUhNQEhFSEXIREhJSEVIaBRAbRR/apRAbT9jwMs/NRlAmT9nAIU/jwBxAMhY2P+tqdlZf7/Q1j+4N6cAAAABQA0/8IDYAMlAAcACwAPABcAGwAAEzMVITUzESE3FSE1BSEVIRczFSE1MxEhNxUhNaBRAbRR/apRAbT9jwMs/NRnUQG7Uv2iUQG7AyVfX/69pGJi+UJDXFz+uqpoaAAABAA0/7oDYAMcAAcACwAPACgAAAERIREzFSE1ETUhFQchFSEFFRQeAhcHLgMnDgMHJz4DPQEC9v2qUQG0/ky9Ayz81AHBMFJtPR8zX1FAFBdHVFssHj1tUzADHP62AUpkZP73ZmaZQkQYK0w7KAhACB8uOyMoPSscB0AIKDxLKxgAAAAABQAt/7QDXAMjAAcACwAPABsAJwAAEzMVITUzESE3FSE1ASEVIQUyFhUUBiMiJjU0NhciBhUUFjMyNjU0JphTAbFU/ahTAbH9kQMv/NEBl5iiopiYoaGYcHV1cHB1dQMjX1/+u6ZkZP78Q0JSUVFTU1FRUkQxLi4yMi4uMQAAAAAEACr/tQMRAzYAAwALAA8AGwAAATMRIwEzFSE1MxEhNxUhNQEnMj4CNxcOAwK+U1P9w1MBBVP+VVMBBf5bCkSWm5xKCEydmpQDNvx/Azx/f/5+woCA/klKAgYLCUELDgkDAAAAAwBo/7UDEwM3AAMACwAPAAABMxEjATMVITUzESETFSE1AsFSUv2nUQEEUf5aUQEEAzf8fgM27e39owEv7OwAAAQAZP+2AxUDNgADAAsADwAVAAABMxEjATMVITUzESE3FSE1AyERIzUhAsNSUv2hUQECUf5cUQEC+QJXUv37Azb94gHojIz+WNyamv6z/s/uAAAAAAQAZP/KAyoDNgADAAsADwAVAAABESMRBxEhETMVITURNSEVEyEVIREzAxVSu/5cUQEC/v5rAgr9pFIDNv1qApY//kQBvJWV/oakpP6QQwEYAAAAAAQAYv/AAx4DNgADAAsADwAXAAABESMRBxEhETMVMzURNSMVEyEVIREhFSEDDlW5/mJS+vpnAgP9qQJR/gMDNv32Agoz/mUBm4qK/qmKiv5YRAE9QwAAAAAEAGT/wAMzAzYAAwALAA8AGwAAAREjEQcRIREzFSE1ETUhFRMhFSE1ITUhNSEVIQMUUrr+XFEBAv7+bgIQ/Z8B8v4MAkX+DgM2/iwB1CP+dwGJgoL+uYaG/jRA3FhA1AAGAGT/vwMUAzYAAwALAA8AJAAoACwAAAEzESMDESERMxUhNRE1IRUTFTI+AjcXDgMrATUzNSM1IRUXESERAxUzNQLCUlK6/lxRAQL+/kIjOjUyGwcgOT1FLC7P0QEgMwEb1I4DNv4hAbb+dgGKgoL+uIaG/pxjAQQGBT4FBgQB21U9zKIBbv6SATH09AAAAAAFAGT/wwMVAzYAAwALAA8AEwAXAAABMxEjATMVITUzESE3FSE1AyERISUhFSECw1JS/aFRAQJR/lxRAQLmAkT9vAH0/lwBpAM2/fcB24mJ/mHVk5P+vv7H97UAAAUAZP/CAxUDNgADAAsADwAXABsAAAEzESMBMxUhNTMRITcVITUDMxUhNTMRITcVITUCw1JS/aFRAQJR/lxRAQLkUQGgUf2+UQGgAzb+FwG/hYX+aNKQkP7camr+oLZzcwAAAAAEAGT/uQNJAzYAAwALAA8AKAAAAREjEQcRIREzFSE1ETUhFQUVFB4CFwcuAycOAwcnPgM9AQMVUrv+XFEBAv7+AWcxUm48IDNfUUAUFEBRXjMgPG1SMQM2/Z8CYTf+VAGsj4/+lpqajhYwUkAsCkAJIzJAJydAMiMJQAosQFIwFgAAAAAFAGT/twMYAzYAAwALAA8AIwAvAAABMxEjATMVITUzESE3FSE1EzIeAhUUDgIjIi4CNTQ+AhciBhUUFjMyNjU0JgLDUlL9oVEBAlH+XFEBAjRGb04qKk5vRkZvTioqTm9GZ3V1Z2d0dAM2/eEB6IqK/mDWlJT+0BYrPigoPisWFis+KCg+KxZANjEwNzcwMTYAAAAABABk/7kDQgM2AAMACwAPACoAAAERIxEHESERMxUhNRE1IRUFIx4DFwcuAycOAwcnPgM3IzUhAxVSu/5cUQEC/v4Cav0EMU5lOB4xXE8+ExM9TlsxHjhkTTAE+AJLAzb9+AIIMf5jAZ2IiP6lk5PrJEE1Jgg+CB8tOSIiOS0fCD4IJjVBJEIAAAQAZP+2A0kDNgADAAsADwAsAAABESMRBxEhETMVITURNSEVASEeAxcHLgEnDgMHJz4DNyE1ITUzFSEDFFK6/lxRAQL+/gJ0/voCMVFpOR1noisUQFFfMxw5alIyAv76AQdSAQgDNv35Agcl/m8BkYmJ/rGGhv7tHz0zJQc9DlY/IDYqHQc+BiQzPiBAV1cAAAUARv+2A3cDNwAHAA8AFwAbAB8AAAEVIxEjETMRJTUzESMRMxUhNTMRIxEzFQM1IxUhNSMVA3d4UVH9+0T4RgGRRfRFuW4BkWoB2UX+IgOB/qIk5v2sAlTm5v2sAlTm/tXp6enpAAAABgBN/7UDcwM3AAcADwAXABsAHwAlAAABFSMVIxEzFScRIxEzFTM1IxEjETMVMzUBNSMVIzUjFRc1IREjNQNzb1BQn/BFZeLwRWcBJmXBZwwCZlICUUTsAhbmr/5UAayTk/5UAayTk/6Wl5eXl+ZD/sL7AAAGAE3/ygNzAzYABwAPABcAGwAfACUAAAEzFSMRIxEzBxEjETMVMzUjESMRMxUzNQE1IxUjNSMVFxUhFSERAwRvb1BQn/BFZeLwRWcBJmXBZ3wCHf2RAitE/sACj0H+PQHDn5/+PQHDn5/+f6GhoaGS1UMBGAAAAAAGAED/wgNuAzcABwAPABcAGwAfACcAAAEzFSMVIxEzBxEjETMVMzUjESMRMxUzNRE1IxUFNSMVBxUhFSERIRUC9Hp6UFCe8EJs4/FCbW0BkmyqAgf9qAJQAlFF4wIOMv5gAaCLi/5gAaCLi/6jkJACkZHttEMBOkMAAAAABgBN/8ADcwM2AAcADwAXABsAHwArAAABMxUjFSMRMwcRIxEzFTM1IxEjETMVMzUBNSMVIzUjFRMVIRUhNSE1ITUhFQMEb29QUJ/wRWXi8EVnASZlwWd8Ahf9mAH2/ggCSQJyRNEB2Sr+gQF/fX3+gQF/fX3+woKCgoL+lGFB31ZA0wAACABN/8ADcwM3AAcADwAXABsAHwAzADcAOwAAARUjFSMRMxUnESMRMxUzNSMRIxEzFTM1ATUjFSM1IxUTFTI+AjcXDgIrATUzNSM1IRUXESERAxUzNQNzb1BQn/BFZeLwRWcBJmXBZ1UjOjUyGwgfOj0jfs7QAR81ARvTiwJuRNwB6cmX/n0Bg39//n0Bg39//r6EhISE/phdAQQGBT4GBwPXUD7KmwFl/psBJ+npAAAHAE3/wgNzAzYABwAPABcAGwAfACMAJwAAARUjFSMRMxUnESMRMxUzNSMRIxEzFTM1ATUjFSM1IxUTESERJRUhNQNzb1BQn/BFZeLwRWcBJmXBZygCSv4HAakCWETpAgveo/5kAZyLi/5kAZyLi/6njY2Njf4gAT/+wf68vAAAAAcATf/CA3IDNgAHAA8AFwAbAB8AJwArAAABFSMVIxEzFScRIxEzFTM1IxEjETMVMzUBNSMVIzUjFQU1MxEhETMVBTUhFQNyblBQn/BFZeLwRWcBJmXBZwIhUf23UQGn/lkCZUTTAejRoP5pAZeDg/5pAZeEhP6ujIyMjP1v/p0BY2+ycnIAAAAGAE3/ugNzAzcABwAPABcAGwAfADgAAAEzFSMRIxEzBxEjETMVMzUjESMRMxUzNQE1IxUjNSMVBRUUHgIXBy4DJw4DByc+Az0BAwRvb1BQn/BFZeLwRWcBJmXBZwGCMlNtPCAzX1FBFBVBUl8zIDxuUzICOUT+1wJrO/5VAauSkv5VAauSkv6XlpaWlowXMFE/LApACSIyQCYmQDIiCUAKLD9RMBcAAAAGAE3/uQNzAzYABwAPABcAGwAfAEUAAAEzFSMVIxEzBxEjETMVMzUjESMRMxUzNQE1IxUjNSMVBRUUHgIXBy4BJw4BBy4BJw4BByc+Az0BMxUUFhc+Az0BAwRvb1BQn/BFZeLwRWcBJmXBZwIZGC5DKylCWxcVUT9CUBQYW0ApK0MvGE89PyAwIBACV0TsAg89/mQBnIuL/mQBnIuL/qeNjY2NmycjRDwvDj0XWTk3YBoaXDk2WRg9DzE8QyEnJzx0JRM0OTsaJwAAAAAHAE3/twNzAzYABwAPABcAGwAfACsANwAAATMVIxUjETMHESMRMxUzNSMRIxEzFTM1ATUjFSM1IxUFMhYVFAYjIiY1NDYTMjY1NCYjIgYVFBYDBG9vUFCf8EVl4vBFZwEmZcFnAU2MoKCMjp+fjmdzc2dndHQCUET7AiVB/mQBnIuL/mQBnIuL/qaPj4+Pm1ZOT1ZWT05W/vc1MDA0NDAwNQAAAAgATf+xA3MDNgAHAA8AFwAbAB8AJwAzAD8AAAEzFSMVIxEzBxEjETMVMzUjESMRMxUzNQE1IxUjNSMVBRUhFSE1ITUXMhYVFAYjIiY1NDYXMjY1NCYjIgYVFBYDBG9vUFCf8EVl4vBFZwEmZcFnAXoBE/2EARcodoWFdnmEhHlRWFhRUVpaAnBD1gHfKf6HAXl5ef6HAXl5ef7If39/f2pVQEBVxD88PD8/PDw/uyEfHyEhHx8hAAAFAEb/tgNDAzcACwATABsAHwAjAAABMxEjESMRIxEzETMlNTMRIxEzFSE1MxEjETMVAzUjFSE1IxUC+klJT0hIT/3hP9Q/AV8+1D6xVgFfWAM3/H8B0/5aA0H+qDHa/cECP9ra/cECP9r+3uHh4eEABgBH/7UDQQM3AAsAEwAbAB8AIwApAAABFxEjNSMVIxEzFTMnESMRMxUzNSMRIxEzFTM1ATUjFSM1IxUXNSERIzUC+kdHV0dHV97RPlTE0j9UAQNUr1Q8An9SAzcB/ers6AIC2Kr+XwGhj4/+XwGhj4/+oY+Pj4/mQv7A/gAAAAAGAEf/ygNcAzYACwATABsAHwAjACkAAAERIxEzFTMRMxEjEQMRIxEzFTM1IxEjETMVMzUBNSMVIzUjFRMhFSERMwKjR0dXR0fe0T5UxNI/VAEDVK9UoQI1/XlSAen+ywJy+wEL/WQBTwEA/lABsJaW/lABsJaW/pKXl5eX/pJDARsAAAAGAEf/wANcAzcACwATABsAHwAjAC8AAAEVIxEzFTM1MxEjNScRIxEzFTM1IxEjETMVMzUBNSMVIzUjFRMhFSE1ITUhNSEVIQKjR0dXR0fe0T5UxNI/VAEDVK9UoAI2/XkCHP3iAm795QIpzgHLu8z+H9Pb/oMBfYCA/oMBfYCA/sR8fHx8/jlB3FVA0gAAAAAHAEf/wgNBAzYACwATABsAHwAjACcAKwAAATMRIzUjFSMRMxUzJxEjETMVMzUjESMRMxUzNQE1IxUjNSMVExEhESUVITUC+kdHV0dHV97RPlTE0j9UAQNUr1ROAm394wHNAzb99eLdAfbXr/5eAaKRkf5eAaKRkf6gjo6Ojv4kAT7+wv27uwAABwBH/8IDQQM2AAsAEwAbAB8AIwArAC8AAAEzESM1IxUjETMVMycRIxEzFTM1IxEjETMVMzUBNSMVIzUjFQU1MxEhETMVBTUhFQL6R0dXR0dX3tE+VMTSP1QBA1SvVAJqUf2SUQHM/jQDNv4U1tAB18Si/m8BkYaG/m8BkYaG/rGIiIiI/mn+oQFfabNzcwAABgBH/7oDbQM2AAsAEwAbAB8AIwA8AAABFSMRMxUzNTMRIxEnESMRMxUzNSMRIxEzFTM1ATUjFSM1IxUFFRQeAhcHLgMnDgMHJz4DPQECo0dHV0dH3tE+VMTSP1QBA1SvVAGqNVlyPR41ZFZFFRVFV2Q1Hj1yWTUCCPACDtzs/Z0BNen+XgGijIz+XgGijIz+oJSUlJSWGCxOPioIPwggMD8mJj4xIAg/CCo+TiwYAAAGAEf/tQN5AzYACwATABsAHwAjAEkAAAEVIxEzFTM1MxEjNScRIxEzFTM1IxEjETMVMzUBNSMVIzUjFQUVFB4CFwcuAScOAQcuAScOAQcnPgM9ATMVFBYXPgM9AQKjR0dXR0fe0T5UxNI/VAEDVK9UAj8YL0MqKENbGBRRP0JQFBlaPyorQy8YTz0/IDAgEAIN3AH11ub99OPv/l4BopGR/l4BopGR/qCOjo6Oli4jQzsvDj0YWDk3XxsaWjk2Vxg9DzI8Qh8uLjxzJBQ0ODoZLgAAAAcAR/+3A0cDNgALABMAGwAfACMANwBDAAABFSMRMxUzNTMRIzUnESMRMxUzNSMRIxEzFTM1ATUjFSM1IxUFMh4CFRQOAiMiLgI1ND4CEzI2NTQmIyIGFRQWAqNHR1dHR97RPlTE0j9UAQNUr1QBhEp1UiwsUnVKSXZSLCxSdkhtfHttbXt6AgnoAgXb6/3X/O7+XgGikZH+XgGikZH+n4+Pj4+aFSo8Jyc9KhUVKj0nJzwqFf77MzAwMzMwMDMAAAUARv+2A3YDNwALABMAGwAfACMAAAEjFTMVIxEjETMVMwU1MxEjETMVITUzESMRMxUDNSMVITUjFQN2d3d3UVF3/YRE+EYBkUX0RbluAZFqAhDFRP6vA4HjV+b9rAJU5ub9rAJU5v7V6enp6QAAAAAGAE3/tQNyAzcACwATABsAHwAjACkAAAEjFTMVIxUjETMVMyURIxEzFTM1IxEjETMVMzUBNSMVIzUjFRc1IREjNQNybm5uUFBu/vPwRWXi8EVnASZlwWcMAmZSAm+BRIkCFoVO/lQBrJOT/lQBrJOT/paXl5eX5kP+wvsABgBA/8wDbgM2AAsAEwAbAB8AIwApAAABIxUzFSMVIxEzFTMlESMRMxUzNSMRIxEzFTM1ETUjFSE1IxUHFSEVIREDbnp6elBQev7p8EFu5fFCbW0BlG6mAhb9lwJSmEbPApGfYf5FAbuamv5FAbuamv6HnZ2cnJzTRAEXAAcATf/CA3IDNwALABMAGwAfACMAJwArAAABIxUzFSMVIxEzFTMlESMRMxUzNSMRIxEzFTM1ATUjFSM1IxUTESERJRUhNQNybm5uUFBu/vPwRWXi8EVnASZlwWcoAkr+BwGpAnN+Q4cCDIFF/mQBnIuL/mQBnIuL/qeNjY2N/iABP/7B/ry8AAAEAEr/tgMoAzYADwAXABsAHwAAATMRIxEjESMRMxUzNTMRMyU1MxEjETMVEzUjFSE1IxUC2k5ObvNFakRu/h5F80VpaQGZagM2/IAB6f7xAlTm5v7+HOb9rAJU5v7U6urq6gAABQBN/7YDKAM3AA8AFwAbAB8AJQAAATcRIzUjFSMRMxUzNTMVMyURIxEzFTM1ETUjFSE1IxUFNSERIzUC11FRb+9FZUVv/mr0RWtrAZFl/vYCc1IDNgH95fK7Aa+VlrKx/lEBr5WV/pSWlpaW6EP+xfgAAAAFAE3/ygNAAzcADwAXABsAHwAlAAABFSMRMxUzNTMVMzUzESMRJREjETMVMzUBNSMVIzUjFRMhFSERMwJo70VlRW9QUP5q9EVrASZlwWuIAib9h1MB974BvJycu/39ZQFb/v5EAbycnP6Gnp6env6SQwEZAAUATf/CAz4DNwAPABcAGwAfACcAAAEVIxEzFTM1MxUzNTMRIzUlESMRMxUzNQE1IxUjNSMVEyEVIREhFSECaO9FZUVvUFD+avRFawEmZcFrhwIl/YkCZv3sAhC3AaSQkavk/e/q7f5cAaSQkP6ek5OTk/5pQgE4QgAAAAAFAE3/wANDAzYADwAXABsAHwArAAABFSMRMxUzNTMVMzUzESM1JREjETMVMzUBNSMVIzUjFRMhFSE1ITUhNSEVIQJo70VlRW9QUP5q9EVrASZlwWuIAin9hwIM/fECYP3zAi+lAX9/f5jF/ijR2v6BAX9/f/7Cf39/f/41QNxZP9UAAAAGAE3/wgMnAzcADwAXABsAHwAjACcAAAE3ESM1IxUjETMVMzUzFTMlESMRMxUzNRE1IxUhNSMVAxEhESUVITUC11BQb+9FZUVv/mr0RWtrAZFl9gJf/fEBvgM2Af335bQBoY6Pq6r+XwGhjo7+oZGRkZH+IQE//sH+vLwABQBM/7kDVwM2AA8AFwAbAB8AOAAAARUjETMVMzUzFTM1MxEjESURIxEzFTM1ATUjFSM1IxUFFRQeAhcHLgMnDgMHJz4DPQECZ+9FZUVwUFD+aPNFaQEoZcNpAZQyVG89HzRhU0EUFUFTYDUfPW9VMgINvAGrk5Os5v2OAUnv/lUBq5OT/peVlZWVkxUuUT8sCT8JIjA/JyY/MSIJPwksQVAtFQAFAE3/tQNqAzcADwAXABsAHwBFAAABFSMRMxUzNTMVMzUzESM1JREjETMVMzUBNSMVIzUjFQUVFB4CFwcuAScOAQcuAScOAQcnPgM9ATMVFBYXPgM9AQJo70VlRW9QUP5q9EVrASZlwWsCJBgvQyooQ1sXFVE/QFMUGFs/KCpDLxhPPT8gMCAQAhGzAaGOj6zj/fLo7v5fAaGOjv6hkJCQkJgvI0Q7MA49GFc5N14aGFs5NlcYPQ8yPEMgLy88dCUUNDk6Gi8AAAYATf+3AywDNgAPABcAGwAfACsANwAAARUjETMVMzUzFTM1MxEjESURIxEzFTM1ATUjFSM1IxUFMhYVFAYjIiY1NDYTMjY1NCYjIgYVFBYCaO9FZUVvUFD+avRFawEmZcFrAWORpqaRkaamkW11dW1tdXUCCLcBpZCQq+v90gEA7v5bAaWQkP6dk5OTk5tTTk1TU01OU/7/Mi4uMjIuLjIAAAAABQBG/7YDQwM3AAMAEwAbAB8AIwAAATMRIwMRMxEjESMRIxEzFTM1MxUlNTMRIxEzFRM1IxUhNSMVAvpJSZBISErUP1c+/rs/1D9WVgFdVwM3/H8CJgFH/MABtv78AkTd3f0g3f28AkTd/tzj4+PjAAcAR/+3A0cDNgADABMAGwAfACMANwBDAAABESMRAxUjETMVMzUzFTM1MxEjNSURIxEzFTM1ATUjFSM1IxUFMh4CFRQOAiMiLgI1ND4CEzI2NTQmIyIGFRQWA0FH3tE+VD9QR0f+rdI/VAEDVK9UAYRKdVIsLFJ1Skl2UiwsUnZIbXx7bW17egM2/dICLv7NrwGikZGw3/4B3fP+XgGikZH+oI6Ojo6aFSo8Jyc9KhUVKj0nJzwqFf77MzAwMzMwMDMAAAAFAEr/tgMoAzYADwAXABsAHwAjAAABMxEjESMVIxEzFTM1MxUzBTUzESMRMxUFMzUjATUjFSE1IxUC2k5ObvNFakRu/h5F80UB3W5u/oxpAZlqAzb8gAFwlgJU5ueRVub9rAJU5pWo/sHq6urqAAAABgBN/7YDKAM3AA8AFwAbAB8AIwApAAABNxEjNSMVIxEzFTM1MxUzJREjETMVMzUBMzUjBTUjFSE1IxUFNSERIzUC11FRb+9FZUVv/mr0RWsBa29v/pVrAZFl/vYCc1IDNgH95pReAa+VlWJi/lEBr5WV/vJqyJaWlpboQ/7F+AAHAE3/wgMnAzYADwAXABsAHwAjACcAKwAAATMRIzUjFSMRMxUzNTMVMyURIxEzFTM1ATM1IwU1IxUhNSMVAxEhESUVITUC11BQb+9FZUVv/mr0RWsBa29v/pVrAZFl9gJf/fEBvgM2/fiMWwGhjo5bW/5fAaGOjv79ZsKRkZGR/iEBP/7B/ry8AAAAAAcATf/CAycDNgAPABcAGwAfACMAKwAvAAABMxEjNSMVIxEzFTM1MxUzJREjETMVMzUBMzUjBTUjFSE1IxUFNTMRIREzFQU1IRUC11BQb+9FZUVv/mr0RWsBa29v/pVrAZFlARhR/aJSAbv+RQM2/guCWQGcjIxeXv5kAZyMjP7/YLqPj4+P+Gj+pwFZaK5tbQAAAAAGAEz/uQNXAzYADwAXABsAHwAjADwAAAEVIxEzFTM1MxUzNTMRIzUBESMRMxUzNQUjFTMHNSMVIzUjFQUVFB4CFwcuAycOAwcnPgM9AQJn70VlRXBQUP5o80VpAd1wcLVlw2kBlDJUbz0eNGFUQRQVQVNgNR48b1UyAaxbAauTkl2Y/Y/nAVD+VQGrk5OhbVuVlZWVkxUuUT8sCT8JIjA/JyY/MSIJPwksQVAtFQAAAAYATf+5A2oDNgAPABcAGwAfACMASQAAARUjETMVMzUzFTM1MxEjNQERIxEzFTM1BSMVMwc1IxUjNSMVBRUUHgIXBy4BJw4BBy4BJw4BByc+Az0BMxUUFhc+Az0BAmjvRWVFb1BQ/mr0RWsB2m9vtGXBawIkGC5DKylCWxcVUT9CURQYWz8pK0MvGE89PyAwIBABuFoBoY6OWZD9848BR/5fAaGOjpxoW5CQkJCYKyNEOy8OPRhXOTdfGhlbOTZXGD0PMjxDHysrPHQlFDQ5OhorAAAABwBN/7cDLAM3AA8AFwAbAB8AIwAvADsAAAEVIxEzFTM1MxUzNTMRIzUBESMRMxUzNQUjFTMHNSMVIzUjFQUyFhUUBiMiJjU0NhMyNjU0JiMiBhUUFgJo70VlRW9QUP5q9EVrAdpvb7RlwWsBY5GmppGRpqaRbXV1bW11dQGtXAGlkJBbnP3RpQFJ/lsBpZCQnWldk5OTk5pTTk5TU05OU/7+MTAwMDAwMDEAAAUANQApA2IC8gAHAA8AEwAXAB8AAAERIREzFTM1IREhETMVMzUBNSMVIzUjFQEhFSE1ITUzAyP+zk+S/tL+zlGRAX6S7JEBMQFu/NMBbFMC8v5GAbqXl/5GAbqXl/6Jnp6env7xQ0PBAAAAAAQANf+1A2MDIgAXABsAHwAlAAABIRUhNSE1IREzFTM1MxEzETMVMzUzESE3FTM1BTUjFQM1IREjNQH0AW/80gFt/t5OjU5ETo1O/t5Hjf6TjUMCblIBbkNDaQFLYmL+uwFFYmL+tahmZmZmZv55Qv7h3QAABAA0/8oDYgMaABcAGwAfACUAAAEhFSE1ITUhETMVMzUzETMRMxUzNTMRITcVMzUFNSMVExUhFSE1AfQBbvzSAW3+306NTkROjU7+3keN/pONHwIc/ZIBSUNDdQFcamr+qAFYamr+pLFvb29vb/7CtUP4AAAEADX/wANgAykAFwAbAB8AKwAAASEVITUhNSERMxUzNTMRMxEzFTM1MxEhNxUzNQU1IxUTFSEVITUhNSE1IRUB8gFu/NUBa/7hToxOQ06MTv7eSIz+lYwaAir9hgIO/e8CYgGkQkJZASxVVf7eASJVVf7UmlpaWlpa/hhWP9BNPsYAAAAFADX/wgNgAyQAFwAbAB8AIwAnAAABIRUhNSE1IREzFTM1MxEzETMVMzUzESE3FTM1BTUjFQMRIRElFSE1AfQBbPzVAW3+3k6NTkROjU7+3keN/pONNgJk/e0BwwFwQkJlAU9lZf67AUVlZf6xqmdnZ2dn/aoBGv7m2JaWAAAAAAUANf/CA2ADKAAXABsAHwAnACsAAAEhFSE1ITUhETMVMzUzETMRMxUzNTMRITcVMzUFNSMVATUzESERMxUFNSEVAfQBbPzVAW3+4E6KTkZNi07+4EeL/pSKAddS/aJRAbv+RQGCQkJjAUNhYf7GATphYf69pGJiYmJi/oNZ/r8BQVmmZmYAAAAEAC7/twNaAyIAFwAbAB8AOAAAASEVITUhNSERMxUzNTMRMxEzFTM1MxEhNxUzNQU1IxUBFRQeAhcHLgMnDgMHJz4DPQEB7AFu/NQBbP7gTpBOOk6ST/7dQpL+mJABJTBUcD8nLFpTRxgVQVFfMyM/cFMxAXJDQ28BQV9f/sMBPV9f/sClaGhoaGj+1xoqSjsoCUUHGys8JyM6LR4IQwkpPEsqGQAAAAAFADX/twNgAx4AFwAbAB8AKwA3AAABIRUhNSE1IREzFTM1MxEzETMVMzUzESE3FTM1BTUjFRMyFhUUBiMiJjU0NhcyNjU0JiMiBhUUFgH0AWz81QFt/t5OjU5ETo1O/t5Hjf6Tjf2Po6OPkKSkkGp1dWptdHQBcUJCXwFOYmL+uwFFYmL+sqxpaWlpaf7aUEtKUVFKS1D3Ly0tLy8tLS8ABgA1/7QDKQM3AAMACwATABcAGwApAAABMxEjAxEjETMVMzUjESMRMxUzNQE1IxUjNSMVFxU+ATcXBgQjJzI2NzUC1lNTXfNEaujzRWoBLGrCavFFikMGof7Kjww/hEUDN/x9Azn+fAGEe3v+fAGEe3v+v4WFhYVmlAMJCDwXDEUCApYAAwA1ACkDYgLzABsAHwAjAAAlMxUhNTM1IxEzFTM1MxEjFTM1IxEzFTM1MxEjJRUzNTMVMzUCkdH809CTUZFQTulOT5JRkv4ykeySbENDxgHBmpr+P8bGAcGZmf4/5qSkpKQAAAYALv+vA1oDIgAHAA8AEwAXACMAKQAAAREhETMVMzUhESERMxUzNQE1IxUjNSMVBTMVITUzNTMVMzUzASchESM1Aw/+0U6S/ub+1E6QAWiS1pABu9f81NhT11P+AgECdFQDIv7AAUBfX/6/AUFfX/79aGhoaKxCQmpqav69RP7R6wAAAAUANf+3A2ADHgAbAB8AIwAvADsAAAEzFSE1MzUjETMVMzUzESMVMzUjETMVMzUzESMlFTM1MxUzNQMyFhUUBiMiJjU0NhcyNjU0JiMiBhUUFgKN0/zV1IlOjU5P4k9OjU6J/kGN4I39j6OhkZKiopJqdXVqbXR0AWlCQmABVWZm/qtgYAFVZmb+q69tbW1t/m5OSktMTEtLTfIvKy0tLS0rLwAABQA1/7UDYQMRAAcADwATABcAHwAAAREhETMVMzUhESERMxUzNQE1IxUjNSMVBRUhESMRITUDGv7UT43+3f7UUI0Bco3ljQKW/pFS/pUDEf57AYV8fP57AYV8fP69hYWFhadE/tIBLkQAAAAABQA1/7YDYAMiAAcADwATABcAJQAAAREhETMVMzUhESERMxUzNQE1IxUjNSMVBSEVIREjNSE1ITUhNSEDFv7XTo3+4f7XTo0BbY3gjQKS/pMBCVL95QES/pQDKwMi/q0BU2Zm/q0BU2Zm/u9qampq2mr+6dVCakMABgAz/8QDYQMaAAcADwATABcAHwAlAAABESERMxUzNSERIREzFTM1ATUjFSM1IxUHIRUhFSM1IRcVIRUhNQMW/tdOjf7h/tdOjQFtjeCNmwMu/plT/oy5Ahv9lAMa/pgBaHBw/pgBaHBw/tt1dXV1m0Kvr2GwQ/MABQA1/8ADYAMpAAcADwATABcAKwAAAREhETMVMzUhESERMxUzNQU1IxUjNSMVBSEVIRUhFSEVITUhNSE1ITUhNSEDFP7YTI7+4/7YTowBa47djAKR/pIBBv3xAir9hgIO/e8BCv6VAysDKf7PATFYWP7PATFYWPNeXl5eyFPGVj/QTT5TQgAAAAUALv+3A1wDKwAHAA8AEwAXADoAAAERIREzFTM1IREhETMVMzUFNSMVBzUjFQUhFSERIxEjNSMVIxUyPgI3Fw4DKwE1MzUjNSE1ITUhAxD+0U6S/uX+1E6QAWmS15AClP6SARVU1CfYJ0RCQiQHKEpKTy032dsBFf6UAy4DK/7UASxZWf7TAS1ZWfFdXQFeXsBZ/pcBKC23XAEEBwY/BgcEAddQQFhCAAYANf/CA2ADJAAHAA8AEwAXACMAJwAAAREhETMVMzUhESERMxUzNQE1IxUjNSMVBSEVIREhESE1ITUhAzUhFQMW/tdOjf7h/tdOjQFtjeCNApL+kwEJ/ZwBCf6UAyu0/j0DJP6sAVRnZ/6sAVRnZ/7vampqatRj/uYBGmNC/oOWlgAAAAcALv/CA1wDJAAHAA8AEwAXAB8AJwArAAABESERMxUzNSERIREzFTM1BTUjFSM1IxUHIRUhFSM1IQU1MxEhETMVBTUhFQMP/tJOkv7l/tROkAFpkteQmgMu/pJU/pQCdFH9o1ABvP5EAyT+ygE2W1v+ywE1W1v6ZGRkZIRCd3e5Yf62AUphqGpqAAAABgA1/7oDYwMgAAcADwATABcAHwA4AAABESERMxUzNSERIREzFTM1ATUjFSM1IxUHIRUhFSM1IQUVFB4CFwcuAycOAwcnPgM9AQMW/tdOjf7h/tdOjQFtjeCNmQMu/o9R/pQBvzFSbj0aNWJTQRQUQVNiNRk8blMxAyD+sgFOY2P+sgFOY2P+9GhoaGiLQmNjgRckPjAfBj4GGSczIB8zJxoGPgYgMD0kFwAAAAYANf+3A2ADHgAHAA8AEwAXACoANgAAAREhETMVMzUhESERMxUzNQE1IxUjNSMVBSEVHgEVFAYjIiY1NDY3NSE1IQM0JiMiBhUUFjMyNgMW/tdOjf7h/tdOjQFtjeCNApL+lIGIo4+SoomC/pMDK7Z1am10dG1qdQMe/q0BU2Rk/q0BU2Rk/vBsbGxs0lMGTkVKT05LRU4GU0P+0S0vLy0tLy8ABgAq/7MDFQM2AAMACwATABcAGwAoAAABMxEjAxEjETMVMzUjESMRMxUzNRE1IxUhNSMVHwEGBxEjEQ4BByc2JALCU1Nd9kB13/ZAdnYBlXXUBn6KU0B9PAuVATADNvx9A1P+oQFfbW3+oQFfbW3+5Wxsa2uOQQ0I/scBNAMDAUoCCwAABQA1/7YDYQMTAAcADwATABcAIwAAAREhETMVMzUhESERMxUzNQE1IxUjNSMVBRUjESMRIxEjESM1Axr+1E+N/t3+1FCNAXKN5Y0Cls1S71LMAxP+fgGCe3v+fgGCe3v+wYODg4OnQ/7MATT+zAE0QwAAAAAHADX/twNgAx4ABwAPABMAFwAqADEAPQAAAREhETMVMzUhESERMxUzNQE1IxUjNSMVBSMVHgEVFAYjIiY1NDY3NSM1IQU1IxU2MzIXNCYjIgYVFBYzMjYDFv7XTo3+4f7XTo0BbY3gjQKSzTM3pI+PpDYzywMr/uLxNkNCnnNtanZ2am1zAx7+rQFTZGT+rQFTZGT+8GxsbGzQbhQ/K0tQUEsrPxRuQ51aWgmbLS8vLS0wMAAFADUAKwNiAuwABwAPABMAFwAbAAATMxUzNTMRIQEzFTM1MxEhJRUzNTMVMzUBIRUhclGRUP7OAX9PklH+zv7SkeyS/WMDLfzTAuycnP46AcacnP466KWlpaX+YEMAAAAGADP/ygNhAxUABwAPABMAFwAbACEAAAERIREzFTM1IREhETMVMzUBNSMVIzUjFQchFSEXFSEVIREDFv7XTo3+4f7XTo0BbY3gjZsDLvzSugIc/ZIDFf6YAWhwcP6YAWhwcP7bdXV1dZVCTr5DAQEABgA0/8ADYAMmAAcADwATABcAGwAnAAABESERMxUzNSERIREzFTM1BTUjFSM1IxUHIRUhExUhFSE1ITUhNSEVAxT+2EyO/uP+2E6MAWuO3YybAyz81LUCKv2GAg797wJiAyb+zQEzWVn+zQEzWVn1X19fX4dC/u5XP9FNPsYAAAAHADX/wgNgAyIABwAPABMAFwAbAB8AIwAAEzMVMzUzESEBMxUzNTMRISUVMzUzFTM1ASEVIRchESElIRUhgE6NTv7XAW1OjU7+1/7hjeCN/W0DK/zVYwJk/ZwCFP49AcMDImho/qoBVmho/qqubGxsbP7+Q1n+5tiWAAAABwA0/8IDYAMkAAcADwATABcAGwAjACcAABMzFTM1MxEhATMVMzUzESElFTM1MxUzNQUhFSEXMxUhNTMRITcVITWATo1O/tcBbU6NTv7X/uGN4I39bAMs/NRnUQG7Uv2iUQG7AyRpaf6oAVhpaf6or21tbW35QzxZWf6/qGZmAAAHAC7/tANaAyIABwAPABMAFwAbACcAMwAAEzMVMzUzESEBMxUzNTMRISUVMzUzFTM1ASEVIQUyFhUUBiMiJjU0NhciBhUUFjMyNjU0JnpOkE7+1AFnTpJP/tH+55DXkv1tAyz81AGWmKKimJihoZhwdXVwcHV1AyJfX/6/AUFfX/7BpGhoaGj++UNCUlFRU1NRUVJEMS4uMjIuLjEAAAAABQBR/7YDKAM2AAMACwATABcAGwAAATMRIwEzFTM1MxEjATMVMzUzESMDFTM1MxUzNQLaTk79d0ZpRfQBOkVnRPD0adBnAzb8gAMs5eX9rgJS5eX9rgEr6enp6QAGAFj/tQMkAzYAAwALABMAFwAbACEAAAEzESMBMxUzNTMRIwEzFTM1MxEjJxUzNTMVMzUBIREjNSEC01FR/YVFaUXzATNFZUXv7mnKZf56AnRS/d4DNv3qAd+Pj/5YAaiPj/5Y2JeXl5f+wf7F+QAABgBY/8oDOgM2AAMACwATABcAGwAhAAABESMRBxEjETMVMzUjESMRMxUzNQE1IxUjNSMVEyEVIREzAyRRWu5FZevyRWkBL2XKaX4CH/2PUgM2/W8CkUD+QwG9np7+QwG9np7+hZycnJz+kkMBGQAAAAYAWP/AAz8DNgADAAsAEwAXABsAJwAAAREjEQcRIxEzFTM1IxEjETMVMzUBNSMVIzUjFRMhFSE1ITUhNSEVIQMkUVnvRWXq80VpAS9lyml7Aif9iAIM/fICX/30Azb+LAHUKv5+AYKAgP5+AYKAgP7AgICAgP40QOBXP9MAAAAABwBY/8IDIwM2AAMACwATABcAGwAfACMAAAEzESMBMxUzNTMRIwEzFTM1MxEjJxUzNTMVMzUBIREhJSEVIQLTUFD9hUVpRfMBM0VlRe/uacpl/pQCWv2mAgn+RwG5Azb99gHYj4/+XQGjj4/+XdSSkpKS/sr+w/y6AAAAAAcAWP/CAyMDNgADAAsAEwAXABsAIwAnAAABMxEjATMVMzUzESMBMxUzNTMRIycVMzUzFTM1ATMVITUzESE3FSE1AtNQUP2FRWlF8wEzRWVF7+5pymX+lFEBuFH9plEBuAM2/hcBvIuL/mQBnIuL/mTRj4+Pj/7nb2/+nbRycgAABgBY/7kDUwM3AAMACwATABcAGwA0AAABESMRBxEjETMVMzUjESMRMxUzNQE1IxUjNSMVBRUUHgIXBy4DJw4DByc+Az0BAyNQWe9FZerzRWkBL2XKaQGEMlRvPR40YVRBFBVBU2A1HjxvVTIDN/2NAnM6/lcBqZGR/lcBqZGR/pmVlZWVlhUuUT8sCT8JIjA/JyY/MSIJPwksQVAtFQAAAAcAWP+3AygDNwADAAsAEwAXABsAJwAzAAABMxEjATMVMzUzESMBMxUzNTMRIycVMzUzFTM1AzIWFRQGIyImNTQ2FyIGFRQWMzI2NTQmAtNQUP2FRWlF8wEzRWVF7+5pymVDkKamkZGmp5BtdXVtbXV1Azf90AH0kpL+VgGqkpL+VtiWlpaW/s9TTk1TU01OU0EyLi4yMi4uMgAAAAIAKv+2A3sDNgAHABwAAAEVIxEjETMRARUUHgIXBy4BJw4BByc+Az0BA3uUUlL+eyQ+Uy8zSHMeHXZMMTBVPiQBy0T+LwOA/pUBHqE7dWZSGEEmk15kmypCGVZrej2hAAMAM/+1A3IDNgAHABwAIgAAARUjFSMRMxUPAS4BJw4BByc+Az0BMxUUHgIFNSERIzUDcoVSUrApS3EdHXFRKTNSOh9SIDlR/pgCSFICSkTvAh/suUEcakZOcx1CEj1PXTJdYy1WSTn6Qv7L8wAAAAAEADP/tQNyAzcABwAcADEANwAAATMVIxUjETMDBy4BJw4BByc+Az0BMxUUHgIXFRQeAhcHLgEnDgEHJz4DPQEFNyERIxEC7YWFUlKwKktvHhxyUSkzUjofUiA5UZgVKD0nKzxOFBZPOSwnPSgV/jUBASFRAlZE6QIO/mFBG2hFTnEeQhI8TVwyXmItVEg4ojghQTowDz4XUzMzUxc+DzA6QSE4TUL+vgEAAAAAAwAx/8oDcgM4AAcAHAAiAAABMxUjESMRMwMHLgEnDgEHJz4DPQEzFRQeAgcVIRUhEQLthYVSUq0pTHEeHHNRKzNTOx9SIDpS/AIB/a0CJET+wQKX/jxBHGpIUXUeQRI+UGA0b3EuV0o7ptNDARYAAAMAMf/CA3IDNwAHABwAJAAAATMVIxUjETMDBy4BJw4BByc+Az0BMxUUHgIHFSEVIREhFQLthYVSUq8rS24eHHRRKjNTOiBSIDpQ/gH2/bgCOAJYROYCCf5rQBpoRU52HUESPE5dMlpYLVZJOPi2QgE7QwAAAwAw/8ADcgM2AAcAHAAoAAABMxUjFSMRMwMHLgEnDgEHJz4DPQEzFRQeAgEVIRUhNSE1ITUhFQLthYVSUrAqS28eHHZRKDNSOyBSIDlR/voCCP2oAeb+FwI6AnNEzQHU/pFAGmRDTnEdQRE7TFwxRkUuU0U2/oxiQeBZQdcAAAAEAC//uANyAzYABwAcADEANwAAARUjFSMRMxUPAS4BJw4BByc+Az0BMxUUHgIBFTI+AjcXDgMrATUzNSM1IRU3NSERIxEDcoVSUrEsS20dHXZRKDNUOiBSHzlR/tYuST85HgkhP0ZUNzXT1QEkJgEUUQJuRNMB38i7PxpnRk5xHUISO01cM0hGMFdKOP6XXgIECAY+BwgEAddUPs2MQf6RAS4AAAUAL/+9A3IDNgAHABwALwAzADcAAAEVIxUjETMVDwEuAScOAQcnPgM9ATMVFB4CARUyPgI3Fw4BKwE1MzUjNSEVFxEhEQMVMzUDcoVSUrArS24eHHVSKTNTOyBSHzpR/scjOjQxGwgwUzR9y84BHTcBGNGJAnJE1QHdxLZAGmNFTnUdQhI7TVwzSkguVUY2/pFgAQMGBT4JB9tTP86gAW7+kgEw8vIAAAQAMv/CA3IDNgAHABwAIAAkAAABFSMVIxEzFQ8BLgEnDgEHJz4DPQEzFRQeAgERIRElFSE1A3KFUlKvLEttHhxyUSszUjogUiA6UP6tAjP+HQGSAldE6QIM38FAHGlGT3YfQRI+UF4zW1kuV0s6/hsBP/7B/ry8AAQAMv/CA3IDNgAHABwAJAAoAAABFSMVIxEzFQ8BLgEnDgEHJz4DPQEzFRQeAhM1MxEhETMVBTUhFQNyhVJSrytLbh4cclErM1I6IFIgOlGOUf3LUQGT/m0CZ0TYAevPxD8aaUZOdB5BEjtOXTNWVS1VSjr/AGz+ogFebK9vbwAAAwAy/7oDcgM4AAcAHAA1AAABMxUjESMRMwMHLgEnDgEHJz4DPQEzFRQeAgcVFB4CFwcuAycOAwcnPgM9AQLthYVSUrArS24eHHFRKzNSOx9SIDpQBjBTbTwhMV5QQBQUQVFeMiA8bVMxAj5E/uMCW/5WPxxoRlF1HkESPlFgNFtiLVZJOZUbL1E/LApACSIxPiUmPjAiCUAKLD9RLxsAAAMAMP+5A3IDNwAHABwAQgAAATMVIxUjETMDBy4BJw4BByc+Az0BMxUUHgIXFRQeAhcHLgEnDgEHLgEnDgEHJz4DPQEzFRQWFz4DPQEC7YWFUlKxK0luHhx1USozUzsfUiA6UJsYLkMrKUJaFxRSQEBRFBhaPykqQy4ZTj4/IC8gDwJaQ+MCA/5lPxpnRU51HUASPU5dMltbLFVJOZ8tIkU8MQ88GFs5OWAbGl05N1kYPBAyPUMhLS09dCYUNTo7GS0AAAAEADH/twNyAzYABwAcAC4AOgAAATMVIxUjETMDBy4BJw4BByc+Az0BMxUUHgIHMh4CFRQOAiMiJjU0PgITMjY1NCYjIgYVFBYC7YWFUlKyK0lvHhxzTyszUjsfUiA5UDtEbU0pKU1tRImfKU1tRWRxcWRkcnICT0T0Ah/+W0AbakVPdh5BEj9RXzNcYy1WSTmjFio9Jyc9KRZVTic9Khb++TMwMDQ0MDAzAAAAAwAx/8IDcgM3AAcAHAAoAAABMxUjFSMRMwMHLgEnDgEHJz4DPQEzFRQeAgEVIRUhESEVIRUhFQLthYVSUrAqS24eHHRRKjNTOiBSIDpQ/v8B+v21Ajj+GQHcAmpE1QHm/ntAGmVDTHEdQBI7TFoxVlUsU0c3/pVXPgFjPlM9AAACACv/tgMvAzcACwAgAAABMxEjESMRIxEzETMBFRQeAhcHLgEnDgEHJz4DPQEC4U5Od05Od/5gGTBGLTFAWxgYYEI0LkozHAM3/H8B1f5YA0D+qwEVqDdtYE8ZQSaCUViOKj4bVGdzOqsAAAADADb/tgMqAzYACwAgACYAAAEzESM1IxUjETMVMw8BLgEnDgEHJz4DPQEzFRQeAgc1IREjNQLbT09yTk5y5Sw/WhgYXUIsLEUwGk8ZLkT8AltSAzb94vLsAgnavz4aXTpAax0/FD1KUCZ5eSZLQzb6Qv7P7wAAAAADADf/ygNEAzYACwAgACYAAAERIxEzFTMRMxEjEQ8BLgEnDgEHJz4DPQEzFRQeAgMhFSERMwJpTk5yT0/mLT9YGBhaQi4sRTAZTxgvQ5cCEf2dUgHn/soCdfwBDP1cAVV3PhtgPENvID4VQU5VKYGBKE5FOf6KQwEdAAAAAwA0/8ADOAM2AAsAIAAoAAABFSMRMxUzNTMRIzUPAS4BJw4BByc+Az0BMxUUHgIDIRUhESEVIQJnTU11T0/mLD9YGRlcQi8tRzAaUBgvQ6wCGP2UAmX97wIM5wIB1+f96e14QRpaOUJoHUETPUtUKm11JkpBNf5fRAE8RAAAAAADADb/wANMAzcACwAgACwAAAEVIxEzFTM1MxEjNQ8BLgEnDgEHJz4DPQEzFRQeAgMhFSE1ITUhNSEVIQJpTk5yT0/mLEBZGBddQiwsRTAaTxgvQ50CH/2QAf3+AQJQ/gMCKcgBxrzM/iHRbjwaWzxCah08Ez1JUSddYSVKQTX+NkHbVEHSAAAABAA2/8IDKgM2AAsAIAAkACgAAAEzESM1IxUjETMVMw8BLgEnDgEHJz4DPQEzFRQeAgMRIRElFSE1AttPT3JOTnLkLT9aGBhdQiwsRTAaTxgvRO4CTf4DAa0DNv3z6t0B8NC/PRlbOT9qHT8TPElQJXZ2JUpBNf4aATr+xvm3twAEADb/wgMqAzYACwAgACgALAAAATMRIzUjFSMRMxUzDwEuAScOAQcnPgM9ATMVFB4CBTUzESERMxUFNSEVAttPT3JOTnLkLD9bGBleQiorRTEaTxkvRAENUf2zUgGq/lYDNv4O3tgB3cLBPhhaOT9mHD4TO0VMJXd3JEc/NP1o/qMBXWizcnIAAwA2/7oDXAM2AAsAIAA5AAABFSMRMxUzNTMRIxEPAS4BJw4BByc+Az0BMxUUHgIXFRQeAhcHLgMnDgMHJz4DPQECaU5Ock9P5Ss/WhkYXUIsLEUwGk8ZLkRhM1RuOyAzX1JBFBVCUV4zIDtuVDICDOQB/dbn/Z8BN3c/Glo5QGwdQBM9SVAmeXklSUE0phgrTz8sCUAJIjA/JSU/MCIJQAksP08rGAAAAwA2/7oDcAM3AAsAIABGAAABFSMRMxUzNTMRIzUPAS4BJw4BByc+Az0BMxUUHgIXFRQeAhcHLgEnDgEHLgEnDgEHJz4DPQEzFRQWFz4DPQECaU5Ock9P5Sw/WhgYXkIrLEUwGk8ZLkTxGC9DKihDWxcVUj9AUhQYWz8pK0MvGE8+PyAvIA8CEdwB8NHj/fHpej4aWzk/ah1AEzxITyZ2diVKQTWhJyREOzAPPRhYOTdfGhlcOTZZGD0PMj1DIScnPXUlFDQ6OxonAAAABAA2/7cDLgM2AAsAIAA0AEAAAAEVIxEzFTM1MxEjNQ8BLgEnDgEHJz4DPQEzFRQeAhcyHgIVFA4CIyIuAjU0PgITMjY1NCYjIgYVFBYCaU5Ock9P5Sw/WhgYXUIsLEUwGk8ZLkQ3RW9OKipOb0VFb00qKk1vRWd0dGdnc3MCA9kB+9/w/df2cT8aWzk/ax1AEzxJTyV5eSVJQTWpFik8JiY8KRYWKTwmJjwpFv79MjAwMTEwMDIAAAIAKf+3A3YDNwALACAAAAEjFTMVIxEjETMVMyUVFB4CFwcuAScOAQcnPgM9AQN2j4+PUlKP/ewkPVMwMklyHx51SzMxVD8kAhDFRP6wA4DjlqE8dmdQF0Imk15knSpCGVZtez2hAAAAAwAz/7UDcAM2AAsAIAAmAAABIxUzFSMVIxEzFTMBBy4BJw4BByc+Az0BMxUUHgIFNSERIzUDcIODg1JSg/7NK0tvHR1yTyozUjofUiA5Uf6YAkhSAmd8RJACH4z+50EcakZOdB5CEj1QXTNdYy1WSTn6Qv7L8wAAAwAx/8oDcQM3AAsAIAAmAAABIxUzFSMVIxEzFTMBBy4BJw4BByc+Az0BMxUUHgIHFSEVIREDcYSEhFJShP7PKUxxHhxzUSszUzsfUiA6UvwCAf2tAk2VQ9QClqb+40EbbEZPdh5BEj5QYDRucS5XSzql00MBFgAAAwAw/8ADcQM2AAsAIAAsAAABIxUzFSMVIxEzFTMFBy4BJw4BByc+Az0BMxUUHgIBFSEVITUhNSE1IRUDcYSEhFJShP7MKktvHhx2USgzUjsgUiA5Uf76Agj9qAHm/hcCOgKDZEJ6AdNx/UEaZENOcR1CETpMWzJHRi1TRjb+jGJB4FlB1wAAAAQAMv/CA3ADNwALACAAJAAoAAABIxUzFSMVIxEzFTMBBy4BJw4BByc+Az0BMxUUHgIBESERJRUhNQNwg4ODUlKD/s4sS20eHHJRKzNSOiBSIDpQ/q0CM/4dAZICcnREkAINgv7iQRxqRlF1H0ESPlBfM1pYLldLOv4aAT/+wf68vAAAAAQAMv/CA3ADNgALACAAKAAsAAABIxUzFSMVIxEzFTMBBy4BJw4BByc+Az0BMxUUHgITNTMRIREzFQU1IRUDcIODg1JSg/7OK0tuHhxyUSszUjogUiA6UY5R/ctRAZP+bQJ7cER8Aet4/uU/G2lFTnQeQRI8TVwzV1YtVUk6/wBs/qIBXmyvb28AAAAAAwAy/7kDcAM4AAsAIAA5AAABIxUzFSMVIxEzFTMBBy4BJw4BByc+Az0BMxUUHgIHFRQeAhcHLgMnDgMHJz4DPQEDcIODg1JSg/7NK0tuHhxxUSszUjsfUiA6UAYwU208ITJdUT8UFEBSXjIgPG1TMQJZhEO2Alyc/vI/G2hGT3YeQRI+UV80XGItVko5lBsvUT8sCkEJIjA/JiY/MCIJQQosP1EvGwAABAAx/7cDbwM2AAsAIAAyAD4AAAEjFTMVIxUjETMVMwEHLgEnDgEHJz4DPQEzFRQeAgcyHgIVFA4CIyImNTQ+AhMyNjU0JiMiBhUUFgNvgoKCUlKC/swrSW8eHHNPKzNSOx9SIDlQO0RtTSkpTW1EiZ8pTW1FZHFxZGRycgJpekSUAh+J/uRAG2pFT3YeQRI/UV8zXGMtVkk5oxYqPScnPSkWVU4nPSoW/vkzMDA0NDAwMwAABAAr/8ADbgM2AAsAIAAsADAAAAEjFTMVIxUjETMVMwEHLgEnDgEHJz4DPQEzFRQeAhcVMxUhNTM1IzUhFSEVMzUDboWFhVRUhf7NKktxHh1yTy40UzsfUiA6UniF/ZKFfAJc/nLAAmuBRXwCDYb+8T8aZ0VOcx1BEjxPXzRQWS1VSDfsw0JCw0NDw8MAAAAAAwAr/7YDLwM3AAsAIAAkAAABMxEjESMRIxEzFTMlFRQeAhcHLgEnDgEHJz4DPQEBMzUjAuFOTndOTnf+YBkwRi0xQFsYGGBCNC5KMxwBeHd3Azf8fwFb/tEDQdycpzdtYU8ZQSaCUViOKj4bVGdzOqv+cbAAAAAABAA0/7QDKwM3AAsAIAAkACoAAAEzESM1IxUjETMVMwMHLgEnDgEHJz4DPQEzFRQeAjczNSMBNSERIzUC3U5Od01Nd+csP1gZGVxCLy1HMBpQGC9Dmnd3/lwCaVMDN/3whX4B+HH+30EaWjlCaB5CEz1LVCptdSZKQTVMf/5DRP69/wAABAA3/8oDRAM2AAsAIAAkACoAAAEVIxEzFTM1MxEjNScHLgEnDgEHJz4DPQEzFRQeAiUjFTMBIRUhETMCaU5Ock9P5i0/WBgYWkIuLEUwGU8YL0MBEXJy/lgCEf2dUgFuvQJ1nKz9XNwCPhtgPEVtID4VQU5VKYCAKE5FOcWY/l1DAR0ABAA1/8ADTAM2AAsAIAAkADAAAAEVIxEzFTM1MxEjNQ8BLgEnDgEHJz4DPQEzFRQeAiUjFTMBIRUhNSE1ITUhFSECaU5Ock9P5ixAWRgXXUItLEYwGk8YL0MBEXJy/lICH/2QAf3+AQJQ/gMB0G8Bxmp5/iJ4FTwaWjxCaR08Ez1JUCdeYSVKQTWybf3xQdtUQdIAAAUANv/CAyoDNgALACAAJAAoACwAAAEzESM1IxUjETMVMwMHLgEnDgEHJz4DPQEzFRQeAjczNSMBESERJRUhNQLbT09yTk5y5C0/WhgYXUIsLEUwGk8YL0SecnL+dAJN/gMBrQM2/fOOgQHxeP7oPRlbOT9qHT8TPElQJnZ2JkpBNVF0/VUBOv7G+be3AAAAAAUANf+3Ay4DNgALACAAJAA4AEQAAAEVIxEzFTM1MxEjNQ8BLgEnDgEHJz4DPQEzFRQeAiUjFTMHMh4CFRQOAiMiLgI1ND4CEzI2NTQmIyIGFRQWAmlOTnJPT+UsP1oYGF1CLSxGMBpPGS5EARByctlFb04qKk5vRUVvTSoqTW9FZ3R0Z2dzcwGofgH7gJH915sWPxpbOT9rHUATPUhPJXl5JUlBNcF48hYpPCYmPCkWFik8JiY8KRb+/TIwMDExMDAyAAACADX/tQMYAzcABwAcAAABMxEjESM1MyUVFB4CFwcuAScOAQcnPgM9AQLGUlLQ0P6pJD9UMTBLdx8edUwyMVQ/JAM3/H4CD0PjoT13aFEXQSaYXmSgKEEYVmx8PqEAAAADADb/tQMYAzYABwAcACIAAAEzESMRIzUzDwEuAScOAQcnPgM9ATMVFB4CBTUhESM1AsVTU8PDhCxLbh0dck8rM1I6H1IgOlD+rwJZUwM2/e8BE0PvQR1qSE90IEISPlBfM19iLVhLO+xC/sL8AAAABAA1/7YDFwM3AAcAHAAiACgAAAEzESMRIzUzDwEuAScOAQcnPgM9ATMVFB4CBTchESMRMzUhESMRAsVSUsPDhipLbx0ccVErM1I7H1EgOlD+mgEBJVJ8AR5SAzf99gESQ+1BHGpGTnMfQhI+T14yXWItVko56kL+uAEGQv64AQYAAAAABAA1/7MDZAM2AAcAHAAxADcAAAERIzUzNTMRJwcuAScOAQcnPgM9ATMVFB4CFxUUHgIXBy4BJw4BByc+Az0BBTchESMRAsXDw1PWLEtwHR1xUSozUjsfUSA7UbUUJzwnKzxMFBROOS4oPCkU/iQBASlRATcBDEOw/gFnQBtoRU5wHkESPE5cMl1iLVVIOJVCJEU9MA8/GFE2NFMYPg8xPUUkQlFD/qwBEQAAAAMANv/KAy0DNgAHABwAIgAAJREjNTM1MxEnBy4BJw4BByc+Az0BMxUUHgIDIRUhETMCxcTEU9crS24dHXNPKzJTOyBSIDlQ6AIE/apSmAGIRNL9YtQ/HW9JUXkgQRJAU2Ezb3IvWU08/o9DARgAAAADADX/wQMtAzYABwAcACQAAAERIzUzNTMRJwcuAScOAQcnPgM9ATMVFB4CAyEVIREhFSECxcPDUtcrS24eHHFRKzNSOx9RIDpQ5gIE/aoCRf4NAS4BFkOv/fhvPxppRU5yHUASPU9dMV5iLVVIOf5VQgE6QgAAAAADADT/wgM6AzYABwAcACgAAAE1IzUzNTMRJwcuAScOAQcnPgM9ATMVFB4CAyEVITUhNSE1IRUhAsXDw1PXKktwHR10TyszUjsgUSA7UegCEf2eAe/+DwJC/hEBZ+pDov4xU0AaZkVMcR1BETpMWjBTUyxTRzf+OUHfWEHXAAAAAAUANf/CAxgDNgAHABwAMAA0ADgAAAEzESM1IzUzDwEuAScOAQcnPgM9ATMVFB4CARUyPgI3Fw4CKwE1MzUjNSEVFxEhEQMVMzUCxVNTw8OEK0lxHR1xUSsyUjsgUSE6Uf7hJDw2MxsIHzo+I4HR0wEiNgEf144DNv4u6kPYQRtnRUxyHUEROk1aMVNTLFRHOP6eZQEDBgU/BgcD4VY+0KUBdf6LATj6+gAAAAAFADX/wgMYAzYABwAcACQAOQA9AAABMxEjNSM1Mw8BLgEnDgEHJz4DPQEzFRQeAhM1MxEhETMVBRUyPgI3Fw4DKwE1MzUjNSEVBTUjFQLFU1PDw4QrSXEdHXJPLDJSOyBRITpRvEv+4Ev+ryQ7NjMbCB86PkctL9DTASIBC4oDNv4u6kPZQRtpRU5xHkESO01bMlJSLFVJOf78df6JAXd1YmABAwYFPgYHAwHdUj/OX4ODAAAEADX/wgMYAzYABwAcACAAJAAAATMRIxEjNTMPAS4BJw4BByc+Az0BMxUUHgIBESERARUhNQLFU1PDw4QrS28eHHJRKjNSOx9RIDpR/sECR/4JAacDNv38ARFD50EbZ0VOcB1BEjtNWzFfYi1TSDf+EwFC/r4BAL6+AAAABAA1/8IDFwM2AAcAHAAkACgAAAEzESM1IzUzDwEuAScOAQcnPgM9ATMVFB4CEzUzESERMxUFNSEVAsVSUsPDhSpLcR0dc08pMlI7IFEgOlG2Uf3CUQGc/mQDNv4V/UPnQBpoRUtzHUISPE1aMF5jLVNHN/8AbP6iAV5ssHBwAAADADb/uQNQAzYABwAcADUAACURIzUzNTMRJwcuAScOAQcnPgM9ATMVFB4CFxUUHgIXBy4DJw4DByc+Az0BAsbExFLYLEttHhxyTyszUjofUSA6UBIxVG48ITNfUkAUFUFRXzMgPG1UMsgBdEO3/ZLEPxtqRk51HkETP1BfM15jLldLOpcZLlA/LApBCSIyPyYlPzIjCUEKLEBQLRkAAAAAAwA1/7kDawM2AAcAHABCAAABESM1MzUzEScHLgEnDgEHJz4DPQEzFRQeAhcVFB4CFwcuAScOAQcuAScOAQcnPgM9ATMVFBYXPgM9AQLFw8NT1ytLbx4dcVEqM1I7H1EgOlGnGC5DKylCWxcVUj9CURQYWj8qK0MvGE8+PyAwHxABMwEUQ6z9/W1AGmdFS3IdQRI7TVsxXWErVEg4oy0iRTwxDzwYWTk3YBsaXDk2WRg8EDI9QyEtLT11JRQ0OjsaLQAAAAQANP+3AxoDNgAHABwAMAA8AAABESM1MzUzEScHLgEnDgEHJz4DPQEzFRQeAgcyHgIVFA4CIyIuAjU0PgITMjY1NCYjIgYVFBYCxcPDU9UsS20dHXVRKzRUOyBSHzlRIkVuTikpTm5FRW9NKipNb0VncnJnZ3JyASQBEUO+/e5qQBxnRlF0H0MSPlBfM1xZMFhKOpYWLD4pKD8rFxcrPygpPiwW/u83MTM2NjMxNwAABAA1/8QDKgM2AAcAHAAoACwAAAERIzUzNTMRJwcuAScOAQcnPgM9ATMVFB4CEzMVITUzNSM1IRUjIRUzNQLFxMRS1ixLbh4cc08rM1I7H1EgOlGOjP2RiIACXIH+9rkBPgENRKf+CGxAG2ZFTm8dQBI7TVsyV1srVEg4/kxCQsdCQsfHAAAAAAMAK/+2Ay8DNwADAAsAIAAAATMRIwMRMxEjESM1JxUUHgIXBy4BJw4BByc+Az0BAuFOTrZNTZRYGS9FLC9AWRgYX0MzLkkzGwM3/H8CPwEu/L8Bz0TtqDZsYlEbQCeHUluPKj4bVGdzOqsAAAQAN/+2AyoDNwADAAsAIAAmAAABMxEjJxEjNTM1MxEnBy4BJw4BByc+Az0BMxUUHgIHNSERIzUC209Pr4yMTYotPVcXGFxALCtEMBlPGC1C9gJbUgM3/eIJAQZDuv39aT4bXTxCax4+FD5LUSd6eidLQzf4Qv7P7wAAAAAEADf/ygNEAzcAAwALACAAJgAAAREjEQMRIzUzNTMRJwcuAScOAQcnPgM9ATMVFB4CAyEVIREzAypPr4yMTYstPVYXGFs/LixELxlPFy1CkQIR/Z1SAzf9XwKh/XkBYkPQ/Yu9Px1gPEJuID8VQU1UJ4SEKE5FOf6NQwEeAAAAAAQANP/AAzgDNgADAAsAIAAoAAABESMRAxEjNTM1MxEnBy4BJw4BByc+Az0BMxUUHgIDIRUhESEVIQMrTq+Ojk6NLT9WFxhbQC8sRTAZUBgtQqUCGP2UAmX97wM2/ewCFP3zAQdDs/4DYkAaXTxCaB1AEz5LVClxeyZLQzb+aUUBK0MAAAQANv/AA0wDNgADAAsAIAAsAAABESMRAzUjNTM1MxEnBy4BJw4BByc+Az0BMxUUHgIDIRUhNSE1ITUhFSEDKk+viYlNiyw/VRcXW0ItK0UwGVAXLUGXAh/9kAH9/gECUP4DAzb+IgHe/ivqQ5f+PFg+Gl46QmwePRQ+S1MoXGAmS0I1/jdB3FNB0QAABQA2/8IDKgM2AAMACwAgACQAKAAAATMRIyc1IzUzNTMRJwcuAScOAQcnPgM9ATMVFB4CAxEhESUVITUC209Pr4yMTYotPVcXGFtCLCxEMBlPGC1C6AJN/gMBrQM2/fMN9kSz/hNfPhtdOj9pHT8TPUlQJXNzJktCN/4bATr+xvm3twAABQA2/8IDKgM2AAMACwAgACgALAAAATMRIyc1IzUzNTMRJwcuAScOAQcnPgM9ATMVFB4CBTUzESERMxUFNSEVAttPT6+MjE2KLD9WGBdbQiwsRDAZTxgtQgEUUf2zUgGq/lYDNv4OBu5Eq/4jWT8aXjo/aR0/EzxITyVubSVLQjb9aP6jAV1os3JyAAAEADb/ugNdAzcAAwALACAAOQAAAREjEQMRIzUzNTMRJwcuAScOAQcnPgM9ATMVFB4CFxUUHgIXBy4DJw4DByc+Az0BAypPr4yMTYotP1YXGFpCLCxEMBlPGC1CZzNUbjwfM2BTQRQVQVNfMx88blQyAzf9nQJj/fABAEO5/gRmPhtePD9qHT8TPUlQJnV1J0tEN6AcK009KwlACCEwPiUlPjAhCEAJKz1NKxwABAA2/7kDcAM2AAMACwAgAEYAAAERIxEDNSM1MzUzEScHLgEnDgEHJz4DPQEzFRQeAhcVFB4CFwcuAScOAQcuAScOAQcnPgM9ATMVFBYXPgM9AQMqT6+MjE2KLD9WFxhbQiwsRDAZTxgtQvcYL0MqKENbFxVRP0JRFBhbPykrQy8YTz4/IDAfEAM2/fECD/36/kO1/gpkPxtcPEBqHT8UPUhPJ3V1JktDNp8nI0Q8MA88F1k5N2AaGls5NlkXPA8yPUMhJyc9dCUUNDk6GycAAAUANv+3Ay4DNwADAAsAIAA0AEAAAAERIxEDNSM1MzUzEScHLgEnDgEHJz4DPQEzFRQeAhcyHgIVFA4CIyIuAjU0PgITMjY1NCYjIgYVFBYDKk+vjIxNii0/VRgXXEAtLEQwGU8YLUI9RW9OKipOb0VFb00qKk1vRWd0dGdnc3MDN/3WAir98/9Duv4EZD8bXjxAah5AFD1JUCdzcydLRDeoFik7Jic8KRUVKTwnJjspFv7+MjAuMzMuMDIAAgA1/7QDGAM3AAsAIAAAATMRIxEjNTM1IzUzJRUUHgIXBy4BJw4BByc+Az0BAsVTU8LCwsL+qiQ/VDExTHYeHnVMMjFUPyQDN/x9AZxEnER1oD14aVIXQiaZYGebKkEZVmx7P6AAAAADADf/tgMYAzYACwAgACYAAAEzESM1IzUzNSM1MwMHLgEnDgEHJz4DPQEzFRQeAgU1IREjNQLFU1OxsbGxhS1Jbh0ccU4tM1I5H1IgOVD+sAJZUwM2/ea6Q2xD/rtBHm9IUXYfQRM/UmE0Y2MwW0497kP+zPEAAAADADb/ygMtAzcACwAgACYAACURIzUzNSM1MzUzEScHLgEnDgEHJz4DPQEzFRQeAgMhFSERMwLFtbW1tVLXLUluHRxyTywyUzsgUh85UOcCBP2qUpkBHkN2QoX9YsdBH3RLUXwgQRNCVGM1c3MxXlE//ppDARMAAAADADX/wgM6AzYACwAgACwAAAE1IzUzNSM1MzUzEScHLgEnDgEHJz4DPQEzFRQeAgMhFSE1ITUhNSEVIQLFsLCwsFPXKktxHR10TioyUjsgUSA7UegCEf2eAe/+DwJC/hEBYJlBYEFb/ipPQBxrRk5zHT4SPU5aL15eLVVIOf5DQNxXP9MAAAAABAA1/8IDGAM2AAsAIAAkACgAAAEzESM1IzUzNSM1MwMHLgEnDgEHJz4DPQEzFRQeAgERIRElFSE1AsVTU7CwsLCGK0tuHR1xUSozUjsfUSA5Uf7CAkf+CQGnAzb98a5DbEL+ykEdakhOch1AEjxOXTJpaS5XSzv+IQE4/sj3tbUAAAAABAA1/8IDFwM3AAsAIAAoACwAAAEzESM1IzUzNSM1MwMHLgEnDgEHJz4DPQEzFRQeAhc1MxEhETMVBTUhFQLFUlKxsbGxhS1Lbh0dck8qMlI7IFEgOVG3Uf3CUQGc/mQDN/4KoENlQ/7HPxxsSE5yHkISPU9cMWhoL1hMO/Vp/qkBV2mra2sAAAMAOP+6A1ADNgALACAAOQAAJREjNTM1IzUzNTMRJwcuAScOAQcnPgM9ATMVFB4CFxUUHgIXBy4DJw4DByc+Az0BAsaxsbGxUtotS2sdHG5OLjNROR9RHzlQFDFUbjwgM19SQRQVQVFfMyA8bVQyxAEEQ3BDeP2OuEAeb0tRdyBBFEFUYzZfXzFeUUCNFy1QPywJQAkiMT8mJj8xIglACiw/Ty0XAAAAAAMANv+5A2sDNwALACAARgAAATUjNTM1IzUzNTMRJwcuAScOAQcnPgM9ATMVFB4CFxUUHgIXBy4BJw4BBy4BJw4BByc+Az0BMxUUFhc+Az0BAsWxsbGxU9ouSG0dHXBOLTNSOh9RIDlQqRguQyspQlsXFVI/QlEUGFs/KStDLxhPPj8gMCAPASmvQ25Da/3yYkAdb0tRdiBCE0BTYjVdXTFdTz+VKSNEPDAPPRlYOTdgGxpcOTZYGT0QMjxDISkpPHYlFDU5OxopAAAAAAQANv+3AxoDNgALACAAMAA8AAABNSM1MzUjNTM1MxEnBy4BJw4BByc+Az0BMxUUHgIHMhYVFAYjIi4CNTQ+AhMyNjU0JiMiBhUUFgLFsbGxsVLVLEttHRxzTy00UzsfUh85UCGLn5+LRW9OKSlOb0VncnJnZ3JyARO5Q2tCev3dbEEdbklReSBDE0FUYzVdXTJdTj2RVk5PVhYqPicnPSoW/vc1MDA0NDAwNQADACn/tgMvAzcAAwAPACQAAAEzESMDNTMRIxEjNTM1IzUnFRQeAhcHLgEnDgEHJz4DPQEC4U5Otk1NhYWFahkvRSwwQFoXF19CMy5JMhsDN/x/Aq6//L8BdkOGQ3+yNm1iUhs+KIZVW44qPBtUZ3Q6sgAAAAQANP+2AyoDNgADAA8AJAAqAAABMxEjJzUjNTM1IzUzNTMRJwcuAScOAQcnPgM9ATMVFB4CBzUhESM1AttPT6+IiIeHTYotP1YXGFtALyxFMBlQGC1C9gJbUgM2/eMIw0NXQmX9/GdAGl08QmkdQBQ+S1UrcX4nS0I29EL+z+8ABAA4/8oDRAM2AAMADwAkACoAAAERIxEDESM1MzUjNTM1MxEnBy4BJw4BByc+Az0BMxUUHgIDIRUhETMDKk+vgoKCgk2MLj9UFxdZPy4rRC4ZTxctQpACEf2dUgM2/V4Cov14AQpDaEKA/YmtPh1jP0JuID8VQU5VKY2NKVFIPP6eQwEbAAAAAAQANv/AA0wDNwADAA8AJAAwAAABESMRAzUjNTM1IzUzNTMRJwcuAScOAQcnPgM9ATMVFB4CAyEVITUhNSE1IRUhAypPr4CAgIBNjipAVhYXW0AtLEQvGU8XLUCUAh/9kAH9/gECUP4DAzf+HgHi/iaeQFE/Wv44Tj8bYT9Cax89FD9LUyhiZydNRTf+REDaUkHQAAAFADT/wgMqAzYAAwAPACQAKAAsAAABMxEjJzUjNTM1IzUzNTMRJwcuAScOAQcnPgM9ATMVFB4CAxEhESUVITUC209PrYqKiopNjC0/VhcYW0AvLEUwGVAYLULoAk3+AwGtAzb98w2uQ1dCY/4TUkAaXTxCaR1AFD5LVStxfidLQjb+KQE6/sb5t7cAAAUAN/+/AysDNgADAA8AJAAsADAAAAEzESMnNSM1MzUjNTM1MxEnBy4BJw4BByc+Az0BMxUUHgIFNTMRIREzFQU1IRUC3U5OrYaGhoZNkSs/VRYYWj8vLEQvGFEXLEABFlP9rVQBrP5UAzb+FQOVQVVCbP4nSD4aXjpCaB5AFD9NVCptfSVLQzbwav6eAWJqtHNzAAAFADf/twMuAzYAAwAPACQANgBCAAABESMRAzUjNTM1IzUzNTMRJwcuAScOAQcnPgM9ATMVFB4CFzIeAhUUDgIjIiY1ND4CEzI2NTQmIyIGFRQWAypPr4ODg4NNjS0/VBcXWj8uLEQvGE8XLEJARW9OKipOb0WLoClOb0VndHRnZ3NzAzb91QIr/fKzQVtCbf4CVT8dYj9Dbx8+FkFNVCl2dihQRzuZFik7JiY8KRVTTSY7KRb+/zMuLjIyLi4zAAACADUAKwNjAvsAGAAgAAABBy4DJw4DByc+Az0BMxUUHgIBIRUhNSE1MwM7IzNmWUgWFkhZZTQiO3VdOlY6XnX+8QFy/NIBalIBgUQLLUBSMDBSQC0LRAo5U2c4RUU4Z1M5/uNDQ9oAAAMANf+1A2MDKQAYACAAJgAAAQcuAycOAwcnPgM9ATMVFB4CBSEVITUhNTMBNSERIzUDLx8zY1ZFFRVEVmMzHzxxWDVUNVlx/wABcPzSAWxS/pwCbVICEEIJIzFBJydBMSMJQggsQFAtKCgtUEAso0NDiP6bQ/7a4wAAAAAEADX/twNiAygAGAAgACYALAAAAQcuAycOAwcnPgM9ATMVFB4CByEVITUhNTMBJyERIzUzNSERIzUDLh8zY1VFFRVEVmMzHzxxWDVUNVhx/wFv/NMBbFL+lAEBK1F8ASRRAhJBCSIxQCYmQDIiCEEIKz9QLCgoLFA/K51DQ4X+oEL+0+tC/tPrAAAAAAMANP/KA2MDHwAYACAAJgAAAQcuAycOAwcnPgM9ATMVFB4CByEVITUhNTMBFSEVIREDKiAzYVRDFRVDVGEzITxwVzRUNVdw/QFw/NEBbVL+/AIY/ZYB9EEKJjVEKChFNiUJQQkwRVYvKCgvVkUwqEJCmP7dvUMBAAAAAAADAC7/wgNaAycAGAAgACgAAAEHLgMnDgMHJz4DPQEzFRQeAgchFSE1ITUzARUhFSERIRUDLCQ0Y1VDFRVDVWM1JEJ1VjJUMld0/gFt/NQBa1T+8gIl/YkCcQIZQQkgLj4nJz8wIAlECSo/VDQUGDJTPymnQ0N3/rKgQgElQwAAAAMANP/AA2ADMAAYACAALAAAAQcuAycOAwcnPgM9ATMVFB4CBSEVITUhNTMBFSEVITUhNSE1IRUDMhw1ZVhFFRVFV2Y1HD5zWDVUNVhz/v8BbfzUAW1S/vYCKv2GAg797wJiAjVABx4tOyQkOy0eB0AHJTlKKyEhK0o5JYxCQnP+NFdA01M+zQAFADX/wANfAy8AGAAgADQAOAA8AAABBy4DJw4DByc+Az0BMxUUHgIFIRUhNSE1MwEVMj4CNxcOAisBNTM1IzUhFRcRIREDFTM1AzEdNGVXRRUVRVdlNRw+clg1VDVYc/7/AWz81gFsUv7nJz42MhoHHjc+JITQ0gEfOQEg2pQCMD8HHi08JSU8LR4HPwcnOUsrIiIrSzknjEJCc/47WwEDBgU9BgcD01I9yZkBYv6eASbp6QAEADX/wgNgAy0AGAAgACQAKAAAAQcuAycOAwcnPgM9ATMVFB4CBSEVITUhNTMBESERJRUhNQMvHzNjVkUVFURWYzMfPHFYNVQ1WXH/AAFt/NUBbFL+pgJk/ewBxAIUQQkjMUEnJ0ExIwlBCCxAUC0oKC1QQCyaQkKB/b8BJP7c4qCgAAAEADT/wgNgAy4AGAAgACgALAAAAQcuAycOAwcnPgM9ATMVFB4CBSEVITUhNTMTNTMRIREzFQU1IRUDMB40ZFZEFRVGV2Q0HTxyWTVUNlhy/wABbPzUAW5Ss1L9olEBu/5FAiA/CCAwPiUlPjAgCD8IKTxNKykpK009KZpCQoL+pGL+rQFTYq9wcAAAAAMANf+7A2ADLgAYACAAOQAAAQcuAycOAwcnPgM9ATMVFB4CBSEVITUhNTMTFRQeAhcHLgMnDgMHJz4DPQEDLx8zY1ZFFRVEVmMzHzxxWDVUNlhx/wABbfzVAWxSATBTbT0fM2BRQBQUQFFgMx89bVMwAhVCCSMxQScnQTEjCUIILEBQLSgoLVBALKJCQof++hssTTwpCT8IIC88JCQ8LyAIPwkpPE0sGwAAAAAEADX/twNgAykAGAAgACwAOAAAAQcuAycOAwcnPgM9ATMVFB4CBSEVITUhNTMDMhYVFAYjIiY1NDYXMjY1NCYjIgYVFBYDLx8zY1ZFFRVEVmMzHzxxWDVUNVlx/wABbfzVAWxSKZGiopGRoqKRbXNzbW1zcwIQQQkjMUAnJ0AxIwlBCCxAUC0oKC1QQCyeQkKE/u9QS0tQUEtLUPcvLS0vLy0tLwAAAAADADT/wANgAy0AGAAgACwAAAEHLgMnDgMHJz4DPQEzFRQeAgUhFSE1ITUzARUhFSERIRUhFSEVAzEeNGRXRRUVRVdkNR0+clg1VDVYc/7/AW381AFtUv75Ah79kAJn/esCAAIsPwcfLTwlJTwuHgc/Byc7SysiIitLOyePQkJ2/jVRPgFWPU48AAAAAAMAK/+2A3UDOAAHABwALQAAARUjESMRMxEPAS4BJw4BByc+Az0BMxUUHgIHFT4BNxcOAyMnMzI2NzUDdY5SUpcpTnQeHXNRKjNSOyBUIDtTrz13OQdIlZCGOgtzHz8hAcVF/jYDgv6NE0AZZUVLbBxAEThJVzA/Py1TRTVFvAIKCDwNDgcBRQEBwAAABAA0/7UDcAM3AAcAGgAqADAAAAEVIxUjETMVDwEuAScOAQcnPgM9ATMVFBYfAQ4DIycyNjc1MxU+AQU1IREjNQNwhFJSoiNOcx0ccU4lME84H1N0ewVFko+HOwo2dkBSPXn+fAJIUgI+RP4CO/kkQBFLOTxYFT8MLDlFJTo6TmWkPAwPBwNDAgJ8eAQK8kL+5NoAAAQAM//KA3ADNwAHABoAKgAwAAABMxUjESMRMwMHLgEnDgEHJz4DPQEzFRQWHwEOAyMnMjY3NTMVPgEFFSEVITUC7ISEUlKjJE5xHRxvTicwTzgfU3N8BUWRjog8CzZ4P1I9ef7fAgX9qQIMRP7GAqn+0T8TTzo/Whc/DS89SCc6OlFssD0LDQgCQwICgn4DCaG5Q/wAAAAABAA0/8ADcAM2AAcAGgAqADYAAAEzFSMVIxEzAwcuAScOAQcnPgM9ATMVFBYfAQ4DIycyNjc1MxU+AQEVIRUhNSE1ITUhFQLshIRSUqIlT3EcHXFOJDBPOB9TdHsFRpKPhjsKNnc/Uj15/tMCFP2bAfL+DAJFAmZE3gHy/v4/Ek06OlUVQAwrOEMlJCRRZ406DA4HAkEBAm1pAwr+oFU/0Uw+xwAFADT/twNwAzcABwAaACoANgBCAAABMxUjFSMRMwMHLgEnDgEHJz4DPQEzFRQWHwEOAyMnMjY3NTMVPgEHMhYVFAYjIiY1NDYXMjY1NCYjIgYVFBYC7ISEUlKiIk50HRxyTyQxTzgfU3V6BkWSkIg7CTZ2QFI9eV6Knp6Kip6eimdvb2dnb28COUT5Ajv+7T8RSDc8VRRACyo3QyQ6OkthqToMDwcDQgICf3sDCpNSTExSUkxMUvwxLS0xMS0tMQADACr/tgMnAzcACwAgADAAAAEzESMRIxEjETMRMw8BLgEnDgEHJz4DPQEzFRQeAgcVPgE3Fw4DIycyNjc1AtlOTmxNTWzeKkJaGRhiRiksRzEbUhkvRI4wXisEOHt5cC0MKmc5Azf8fwHL/mQDPv6hDj8ZWTpCYxxAEDVDTilOTiVHPjJGtQIIBz0LDAYCRAECuQAABAAw/8oDQQM2AAsAHgAuADQAAAERIxEzETMRMxEjEScHLgEnDgEHJz4BPQEzFRQeAh8BDgMjJzI2NzUzFT4BAyEVIREzAm9OTmtOTuQnP1kXF2BGKFhhVRgtQCgGN3l3biwLKmY5Ty5YqgId/ZFSAc7+2wJ8/uwBJf1YAUA/PhVRMzxbGT4eeUgxMR89NSqjPAsMBgJEAQJ8eQMH/p1DAQQAAAAEAC3/wANJAzcACwAeAC4AOgAAARUjETMVMzUzESM1JwcuAScOAQcnPgM9ATMVFBYfAQ4DIycyNjc1MxU+AQMhFSE1ITUhNSEVIQJwTU1qTk7mJUJaFxdgRiYrRDAZVF5UBzd7eHAsCyplOU8wWasCJ/2IAgX9+AJa/foCF84B3s3d/gvVHj4UTDM8WBc+DSw5QiMfH0JnmTgLDAYCQQECcG0DB/5RPdBOPcUABQAw/8IDKAM2AAsAIAAwADQAOAAAATMRIzUjFSMRMxUzDwEuAScOAQcnPgM9ATMVFB4CHwEOAyMnMjY3NTMVPgEBESERJRUhNQLaTk5rTk5r5CdAWhcXYUYmK0QwGlUZLUAoBjd5d24sCypmOU8uWP79Al398wG9Azb92vHrAhLkKD8WUTQ6Whc/DSw4QSExMR88MymWOQsNBgJCAQJ3cwII/jYBIf7f4J6eAAQAMP+5A0kDNwALAB4ALgBHAAABFSMRMxUzNTMRIxEnBy4BJw4BByc+Az0BMxUUFh8BDgMjJzI2NzUzFT4BFxUUHgIXBy4DJw4DByc+Az0BAm9OTmtOTuQmP1oXF2JGJStEMBlVXFEGOHp3bSsLKmY5Ty5YTjBTbT0fM19RQBQUQFFfMx89bVIwAfXoAhrv//2GATgoPRRLMzpYFz0NLDhAIjAwPGiqOgwNBwFCAQJ7dwMIjR4rSjooCUAIHy07IyM7LR8IQAkoOkorHgAAAAAEADD/uANpAzcACwAgADAAVAAAARUjETMVMzUzESM1JwcuAScOAQcnPgM9ATMVFB4CHwEOAyMnMjY3NTMVPgEXFRQeAhcHLgEnDgEHLgEnDgEHJz4DPQEzFRQWFz4BPQECb05Oa05O5SZAWRcXYEglK0QwGVYYLUAoBjZ6eG4rCypmOU8uWeYYL0MqJkVaFxRTP0BSFBdcQicrQy8YTz4/QD8B/+kCEub1/dfxGz4VUTM8WRc/DSw4QiIxMR87NCmbOQsNBgJCAQJ8eAIInRciQTksDD4XVTY2WxgYWjY2VBc+DS04QSEXFzlwJCVxNxcAAAAAAwA6/7QDEAM3AAMAGAAoAAABMxEjAwcuAScOAQcnPgM9ATMVFB4CBxU+ATcXDgMjJzI2NzUCvlJSVihPdx8deVEqM1U8IVQiPFSzQoA/B0yblow8CzZ9QwM3/H0B+UAZY0hObh1BEDhLWjFAPy5URTVDuQQKCz0OEAcCRQECvAAEADn/ygMwAzYAAwAYACgALgAAAREjEQMHLgEnDgEHJz4DPQEzFRQeAh8BDgMjJzI2NzUzFT4BASEVITUzAxNSZyRObh0ccU8mMU84HlQfN09QBUeWk4w+DDl9Q1I/e/7eAhT9mlIDNv1gAqD+0z8UVDpAYBdADjA9SSczMyVDOCusPAsOCANDAgOTkAMK/qxD+QAABAA7/8ADNAM2AAMAGAAoADQAAAERIxEPAS4BJw4BByc+Az0BMxUUHgIfAQ4DIycyNjc1MxU+AQEhFSE1ITUhNSEVIQMTUmYiTnIdHHFRJTJPOR5UHzhPUQZJmJSLPQo5fEJSP33+1gIe/ZIB/f4AAlD+AwM2/hwB5PA+Ek45P1YUPgwqN0QmHB0kPzMmiDoMDgcCQQECeHUDCv5BQNhRQM4AAAAFADv/wgMUAzYAAwAYACgALAAwAAABMxEjAwcuAScOAQcnPgM9ATMVFB4CHwEOAyMnMjY3NTMVPgEBESERJRUhNQLCUlJnJE5vHRxwUSUxTzgeVB84T08GSJaTjD4KOXxCUj97/osCS/4GAaoDNv3XARZAFFM5P1wXQA0uO0clKiokQTYpnToLDgkDQgIDhIEDCv44AR/+4d6cnAAFADv/wgMUAzYAAwAYACgAMAA0AAABMxEjJwcuAScOAQcnPgM9ATMVFB4CHwEOAyMnMjY3NTMVPgEXNTMRIREzFQU1IRUCwlJSZyNOcR0ccVEkMU84H1QfOE9PBkmYk4s8Cjd9Q1I/e4VR/bVRAan+VwM2/fv9PxRPOTxYFUAMKzhDJCkpIkA1KJA7DQ8HAkIBAnx4BAr1Xv65AUdep2dnAAAAAAQAOv+5Az0DNgADABgAKABBAAABESMRAwcuAScOAQcnPgM9ATMVFB4CHwEOAyMnMjY3NTMVPgEHFRQeAhcHLgMnDgMHJz4DPQEDFFJnJE5vHRxxUSUyTzgeVB84T08GS5mTiTsLNn1FUj97LDBSbTweM15RQBQUQFFeMx89bFIwAzb9gAKA/upAFFM5P10WPw0tPEcmKiokQTYpozoOEAcCQgECioYECoofKkk5KAlACB8tOiMjOi0fCEAJKDlJKh8AAAAFADT/twMUAzcAAwAWACUAMQA9AAABESMRAwcuAScOAQcnPgM9ATMVFBYfAQ4DByc2NzUzFT4BBzIWFRQGIyImNTQ2FzI2NTQmIyIGFRQWAw1SYilLbx0abU4vMk83HlhyfgdEkpSPQQx3glQ/elKSmpqSkpqakmptbWpqbW0DN/3MAjT+8T8TTjlAWxdADC09SigjJUttrz4IDAkFAUcCBHl1AwiVUU5OUlJOTlH7Ly0tLy8tLS8AAgA0ACkDYwL9ABgAJAAAAQcuAycOAwcnPgM9ATMVFB4CAzMVITUzNTMVMzUzAz4iNGdaSRYWSFpnNSI8dl47Vjtednzd/NHeUdFSAY5ECis+UC4uUD4rCkQKN09jN0VFN2NPN/7UQ0PLy8sAAwA0/7UDYwMrABgAJAAqAAABBy4DJw4DByc+Az0BMxUUHgIHMxUhNTM1MxUzNTMBNSERIzUDMB8zY1dFFRVFV2QzHjxyWTVUNVlyc+L80eBSyVL+DgJtUgIZQAghMT8lJT8xIQhACCo+TispKStOPiqxQ0N3d3f+rUP+3t8AAAADADT/ygNjAyEAGAAkACoAAAEHLgMnDgMHJz4DPQEzFRQeAgczFSE1MzUzFTM1MwEVIRUhNQMsIDNhVUQVFURUYjMgPHBXNVQ1V3Bv4vzR4FLJUv5uAhf9lwH+QQklNEInJ0I1JAlBCS5DUy4oKC5TQy61QkJ6enr+/LtD/gAAAAMANP/AA2ADLwAYACQAMAAAAQcuAycOAwcnPgM9ATMVFB4CBzMVITUzNTMVMzUzARUhFSE1ITUhNSEVAzQcNWVYRhYVRllmNRs+dFk1VDVZdHXf/NTgUslS/mgCKv2GAg797wJiAkA/BxwqOCMjOCocBz8GIzVGKSIiKUY1I5pBQWhoaP5DV0DTUD7KAAAAAAQANf/CA2ADLgAYACQAKAAsAAABBy4DJw4DByc+Az0BMxUUHgIHMxUhNTM1MxUzNTMBESERJRUhNQMwHjNkV0UVFUVWYzQePHJYNVQ1WXJz3/zV31LJUv4YAmT97AHEAh1ACCExPyUmPzAhCEAIKj5OKygoK04+KqlCQnBwcP3WASD+4N6cnAAEADT/wgNgAy0AGAAkACwAMAAAAQcuAycOAwcnPgM9ATMVFB4CBzMVITUzNTMVMzUzEzUzESERMxUFNSEVAzIdNGRXRhYVRlhlNBw8c1k2VDZZcnTf/NTgUslSJlL9olEBu/5FAio/Bx8tPCQkPC0fBz8HJzpJKigoKkk6J61CQnBwcP69Xv6zAU1erW1tAAADADT/ugNgAy4AGAAkAD0AAAEHLgMnDgMHJz4DPQEzFRQeAgczFSE1MzUzFTM1MwcVFB4CFwcuAycOAwcnPgM9AQMwHjNjV0YVFUZXZDMePXJZNVQ2WHJz3/zU4FLJUo0wUm09HTNgUkAUFEFSYDMdPW1TMAIgQQghMD8lJj8wIAhBByo9TSsoKCtOPSm0QkJ2dnbyGixLOygJQAggLjwkJDwuIAhACSg7SywaAAAAAAQANf+3A2ADKQAYACQAMAA8AAABBy4DJw4DByc+Az0BMxUUHgIHMxUhNTM1MxUzNTMDMhYVFAYjIiY1NDYXMjY1NCYjIgYVFBYDMB4zY1dGFRVFV2QzHjxyWTVUNlhyc9/81d9SyVK3kqGelZWeoZJtc3NtbXNzAhpACCEwPiUmPjAgCEAIKT1NLCgoK049Kq5DQ3R0dP8ATUtLTU1LS03yLystLS0tKy8AAAAEAC7/wwNaAygAGAAkADAANAAAAQcuAycOAwcnPgM9ATMVFB4CBzMVITUzNTMVMzUzAxUzFSE1MzUjNSEVIRUzNQMrIzRjVUMVFUNVZDUjQnRXMlQyV3Nw4PzU31TFVAWT/XeUjAJ4/ma+AhlACR8vPicoPy8gCUMJKkBUNBQYMlM/Kq9CQoSEg/6zpz8/pz8/p6cAAgA2/7UDYQMXABgAIAAAAQcuAycOAwcnPgM9ATMVFB4CHwEhESMRITUDOSI0ZVdGFhVGV2U0IT5zWjZWN1t0ZAH+kVL+lgHhQgklNkUpKUU2JQlCCS9FVzAyMi9WRjCsRP67AUVEAAACADX/tQNgAysAGAAmAAABBy4DJw4DByc+Az0BMxUUHgIXIRUhESM1ITUhNSE1IQMxHjRjV0UVFUVWZDQfPHJZNlQ2WXJq/pMBCVL95QES/pQDKwIWQQgjM0ElJ0AxIwlBCCw/TysoKCtPPyzScv7b40JyQgAAAAADADP/ygNhAyAAGAAgACYAAAEHLgMnDgMHJz4DPQEzFRQeAgUhFSEVIzUhFxUhFSERAy8fM2JWRRUVRFZjNCA8cVk2VDZZcf0+Ay7+mVP+jLoCG/2TAfxACSQ0QicoQzQkCUAJL0JTLSwsLFJCL5dCtbVgv0MBAgACADT/wgNgAywAGAAoAAABBy4DJw4DByc+Az0BMxUUHgIXIRUhFSEVIRUhESE1ITUhAzEeM2RXRRUVRVdkNR48c1k2VDZZcmr+kwEM/esCHv2QAQn+kwMsAhpACCMxQCUlQDIiCEAIKz9OKycnKk4/LM9sQqFCASVsQgAAAgA0/8ADYAMzABgALAAAAQcuAycOAwcnPgM9ATMVFB4CFyEVIRUhFSEVITUhNSE1ITUhNSEDNBw1ZlhGFRVFWGY2HD5zWjZUNllzaf6TAQX98QIq/YYCDv3vAQv+kwMsAjo+Bx4tOyQkOy0eBz4HJjlIKSIiKUg5JsJZzVlA1VI/WUIAAwA1/8IDYAMtABgAJAAoAAABBy4DJw4DByc+Az0BMxUUHgIXIRUhESERITUhNSEDNSEVAzIeM2RXRhUVRVdkNB48c1g2VDZZcmr+lAEJ/ZwBCf6TAyuz/jwCHkEIITI/JiY/MiEIQQgqPU4rJygqTT4rzm7+2QEnbkP+aqSkAAAEADT/wgNgAy8AGAAgACgALAAAAQcuAycOAwcnPgM9ATMVFB4CBSEVIRUjNSEFNTMRIREzFQU1IRUDMx41ZFdFFRVFV2U1HjxzWjZUN1ly/T0DLP6TUv6TAnFR/aVRAbn+RwIkQQghMD8lJT8wIQhBByo8TCooKClMPSqGQnh4s2z+pgFabK1ubgAAAAMANf+5A2MDLAAYACAAOQAAAQcuAycOAwcnPgM9ATMVFB4CBSEVIRUjNSEFFRQeAhcHLgMnDgMHJz4DPQEDMx40ZFdGFRVFV2Q1HjxyWjZUN1ly/T4DLv6PUf6UAb8xUm49GjViU0ETFEJUYTQaPG5TMQIgQAchMT8kJT8wIQdAByo8TCopKSlMPSqJQmVljhwlPzAgBj8GGic0IB80JxsGPwYhMT4kHAAAAAADADX/twNgAykAGAArADcAAAEHLgMnDgMHJz4DPQEzFRQeAhchFR4BFRQGIyImNTQ2NzUhNSEDNCYjIgYVFBYzMjYDMh40ZFdFFRVFV2Q0HjxzWDZUNllyav6TgoiikY+kiYH+lAMrtnZqanZ2amp2AhpCCCIxQCUlQDEiCEIIKj1NKygoKk0+K85eBlFITlFTTEhRBl5D/sAwMDAwLjIyAAAAAAMANv+5A2EDKwAYACAAPwAAAQcuAycOAwcnPgM9ATMVFB4CBSEVIRUjNSEFIx4DFwcuAycOAwcnPgM3IzUhNTMVIQM1GzZmWEYVFUdZZjUbPnNaNlQ2WnP9PgMr/pNS/pQCwP8HNVFnOBozYlNCFBRBVGI0GThnUTUH/wECUgECAjw+Bh0sOiIjOisdBj4GJDZGKCEhKEY2JHpCUVH2HzQnGgU+BRgkMB4eMCQYBT4FGic0Hz9LSwACADT/wANgAy8AGAAsAAABBy4DJw4DByc+Az0BMxUUHgIXIRUhFSEVIRUhFSEVIREhNSE1IQM0HDRmWEcVFUVYZjYcPnNaNlQ2WXNp/pMBDv3rAgD+AAIe/ZABB/6TAywCNj4HHi07JCQ7LR4HPgcmOUgpIiIpSDkmw2E9Tj1TPgFZYUIAAAAAAwA0/8QDYAMtABgALAAwAAABBy4DJw4DByc+Az0BMxUUHgIXIRUhFSMVMxUhNTM1IzUhNSE1IQE1IxUDMh4zZFdGFRVFV2Q1HjxzWTZUNllyav6UAROIkP14kIgBEv6TAyz+zsYCHUAIITI/JiY/MiEIQAgqPk4rJygqTT4rz2ZCqEJCqEJmQv5uqKgAAAAAAwAx/7UDFgM3AAcAHAAsAAABMxEjNSM1MwMHLgEnDgEHJz4DPQEzFRQeAh8BDgEHESMRDgEjJzI+AgLEUlLKymklUXMdHXNRJzJROiBUIDpSVQZChkJSQHc2Cz+RmZwDN/x+3EABLj8UVj1AXhc/DS49SSc2NiVFOSuPPQsPA/6vAUwCAkUBBgwAAAAEADD/uQNoAzcABwAcACwAUAAAATMRMxEjNSMTBy4BJw4BByc+Az0BMxUUHgIBNQ4BIycyPgI3Fw4BBxUFFRQeAhcHLgEnDgEHLgEnDgEHJz4DPQEzFRQWFz4BPQECCblSUrlNI05yHRxyUSMwTzkfVCA5T/74P3A2Cj6OlZdIBD+CQgFDGC9DKihCWxcUUz9AUhQXW0InKkMvGE8+P0A/AXABx/3INwEYPxJONjxTFD4LKDVAIh0dITsxJf6ukAICQAIFCwk5Cg0DlCQRIEE5LQ09F1U2NlsYGFk2NlMXPQ0tOUEgERE3cCQlcDYRAAAEACn/tgMtAzYAAwALABwALAAAATMRIwMRMxEjNSM1EwcuAScOAQcnPgE9ATMVFBYfAQ4BBxEjEQ4BIycyPgIC3k9PqU1Np14nP1cYF11DKFdgT11gBjBkM04zXyYLLnR9fQM2/IABPwIu/MPPQAEEPRRNMzlXFz0cekgxMUVuhz0KDAP+ywExAgJGAgUJAAAFADD/tQMoAzcAAwALABsAKgAwAAABMxEjJTMRMxEjNSMTByYnDgEHJz4BPQEzFRQWAzUGIycyPgI3Fw4BBxUHNSERIzUC2k5O/sKcTU2cVSOALxdeRSRYXk9crGdVCjB4fn01BjBkNooCblIDN/2tfQHF/cQ7ARg8I2A0TRQ9FmdCIyY/Wv6emgZEAgYKBzsICwSfcUP+9scAAAAFADD/ygNFAzYAAwALACAAMAA2AAABESMRATMRMxEjNSMTBy4BJw4BByc+Az0BMxUUHgIDNQ4BIycyPgI3Fw4BBxUHIRUhNTMDKE7+wZ1NTZ1XIz9ZFxdeRSQqRC4ZTxgtQNE2YCoKL3Z+fTcGLmQzJgIj/YtSAzb9VAKs/gcB6f12ZAElPRNIMDZSFjwMKTU9Hy4uHTcvJf6xjQICQgIFCgg6CQwDktND8wAABQAw/8ADRwM3AAMACwAcACwAOAAAAREjEQEzETMRIzUjEwcuAScOAQcnPgE9ATMVFBYDNQ4BIycyPgI3Fw4BBxUDIRUhNSE1ITUhFSEDKE/+wp1NTZ1UIT9ZFxZeRSJSYFBdrTZeKAovdX5/NwUwZTQoAiv9hQIL/fICX/30Azf98wIN/lsBlf4JKQEKOw8+KzFKEjsTXTwhIjZQ/rqDAgI+AQYKCTYKDAOI/tA9xEo7vQAABgAw/8IDKAM3AAMACwAcACwAMAA0AAABMxEjJTMRMxEjNSMTBy4BJw4BByc+AT0BMxUUFgM1DgEjJzI+AjcXDgEHFQMRIRElFSE1AtpOTv67o01No1wiP1kXF11FJlheT1yrNl8oCi51fn84BzBnM3kCXP30AbwDN/28dQG//dQwASI7EEEtNE0UOxVlQiAhPFf+nZMCAkEBBgoJOgkMA5j+xwEK/vbJiIgAAAYAMP+3AzIDNwADAAsAIAAwADwASAAAAREjEQEzETMRIzUjEwcuAScOAQcnPgM9ATMVFB4CAzUOASMnMj4CNxcOAQcVFzIWFRQGIyImNTQ2FzI2NTQmIyIGFRQWAyhO/rujTU2jXCQ/VxcXYkUjKkQxGk8YLT7VNl0oCi51fn84BzBnNLOZoqKZmaKimXB2dnBwdnYDN/2mAlr+LwHB/dQuARs8E0YwNFEUPQsnMjoeICAbNi4k/p+eAgJBAQYKCToJDAOjFkhIRkpKRkhI4ykqKCsrKCopAAMAMv+1AxUDNgADABgAKAAAATMRIwMHLgEnDgEHJz4DPQEzFRQeAh8BDgEHESMRDgEjJzI+AgLDUlJhJk90Hx14USgzVDshVCA6UlQGP4JAUkN8OQw/kpqcAzb8fwJGQBVVPUNiF0AOMEBMKTg4J0Y6K5M8Cw8E/rgBRAMCRQEGDAAAAAMAN/+2Aw8DNgADABgALgAAATMRIwMHLgEnDgEHJz4DPQEzFRQeAgcVIREjNSE1MzUOASMnMj4CNxcOAQK9UlJZJU5xHRtzUSQxTzkfVR85T6kBhFL9+IRDfDkKP5CYm0kFP34DNv3KASI/FFE5P1oWPw0sOUUmLi4jQDYoz43+5dlCiQMBRAEECwo7Cw0AAAQANv/KAyoDNwADABgAKAAuAAABESMRAwcuAScOAQcnPgM9ATMVFB4CAzUOASMnMj4CNxcOAQcVByEVIREzAw9SWyVMcB0bcU8mME83H1UfOE/vRYM6DD+Ql5lIBjx2PIsCIP2OUgM3/VcCqf7dPxRVPEJeF0ANLj1HJyoqJEM3K/6MlwQCRAEFCwo8CQwEm59DAQEAAAAAAwA3/8ADMAM3AAMAGAA0AAABESMRDwEuAScOAQcnPgM9ATMVFB4CASEVITUhNSE1MzUOASMnMj4CNxcOAQcVIRUhAw9SWSJOdB0bdVEkMVA5IFUgOU/+3QIe/ZEB/f4BekJ9OQpAkJiaSQQ/fT8BhP4DAzf+GgHm7z4STzc8VRQ9DCg1QCMfHyE8MiX9rkDWUz9jAwFBAQYKCToKDANnzwAAAAAEADf/wgMPAzYAAwAYACwAMAAAATMRIwMHLgEnDgEHJz4DPQEzFRQeAgcVIREhETM1DgEjJzI+AjcXDgETNSEVAr1SUlgkTnMdHHRPJTFQOR9VHzlQqgGE/bR2Q3w5Cj+QmJtJBT9+9f5UAzb94wEQPhRROT9YFD8MKjhDJC4uIz80KMyA/toBJnwDAUQBBAsKPAoN/pmjowAAAAAFADf/wgMPAzYAAwAYACgAMAA0AAABMxEjJwcuAScOAQcnPgM9ATMVFB4CAzUOASMnMj4CNxcOAQcVBTUzESERMxUFNSEVAr1SUlckTnQdHHRRJDFQOSBVIDlQ9EWCOgo/kJeaSgY8ej0BKlH9s1IBqv5WAzb9/f8/Ek45PFYUPwspNkEkLS0iPjMl/rGBAwFEAQQLCjwKDAOGRmD+uwFFYKNjYwAAAAAEADn/uQNTAzcAAwAYACgAPwAAAREjEQMHLgEnDgEHJz4DPQEzFRQeAgE1DgEjJzI+AjcXDgEHFTcVFB4CFwcuAScOAwcnPgM9AQMPUlgkTnMdHHNRJDFQOR9VHzlQ/vE9cjMLPpCXmUgFQohCsDBSbD0fZ6QqFEBRXjMePWxRMAM3/XcCif7uPxRQOT1YFUALKjhEJC0tIz80KP6MmgMCRAEGDAs8Cw4EnjokKkg5Jwg/EFZIIzorHgg/CCc5SCokAAAABAA3/7cDFQM3AAMAGAA0AEAAAAERIxEDBy4BJw4BByc+Az0BMxUUHgIHFTYzMhYVFAYjIiY1NDc1DgEjJzI+AjcXDgETMjY1NCYjIgYVFBYDD1JYJE5zHRxzUSQxUDkfVR85UKosM5Cbm5CQm3pDfDkKP5CYm0kFP34gZ3JyZ2dxcQM3/bcCSf7tPhRQOT1ZFUAMKjhDJC4uIz80KNB4BlBLS1BQS14mhQMBQwEECwo7Cg3+lC8tLS8vLS0vAAAAAgA1/68DYgMXABgAJAAAAQcuAycOAwcnPgM9ATMVFB4CFxUjESMRIxEjESM1AzcgNGVYRhUVRVdmNSA+c1o2Vjdbc2fOUu1SzgHeQwkmN0YpKUY3JglDCTBGVzAzMzBXRjCxQ/68AUT+vAFEQwAAAAMANf+1A2ADKwAYACYAKgAAAQcuAycOAwcnPgM9ATMVFB4CFyMVMxEjNSE1MzUjNSEFNSMVAzEeNGRWRRUVRVZkNB88clk2VDZZcmrYdFL95XrUAyv+1twCF0AIIjJAJiZAMiIIQAkrP04rKCgrTj8r0Hr+399CekK8enoAAAAAAwAu/9EDWgMbABgAJAAqAAABBy4DJw4DByc+Az0BMxUUHgIFIRUjFSM1IxUjNSEXFSEVIREDLCQ1YlRDFhVDVWM2IUN0VTFUMlZ0/UQDLNRTpFP+8rQCJ/2HAf9DCR8uPCYnPS4gCUQJKT9VNCQnMlM/KaBDq6ukpE/BQwEEAAADADT/wANgAzIAGAAsADAAAAEHLgMnDgMHJz4DPQEzFRQeAhcjFTMVIRUhFSE1ITUhNTM1IzUhBTUjFQM1HDZmWEUVFUZZZzUbPnNaNlQ2WXRo1m798QIq/YYCDv3vdNYDLP7Y3AI+PgcdLDokJDosHQc+BiU4RygiIihHOCXAXsxaQNZSPl5CoF5eAAQANf/CA2ADLgAYACQAKAAsAAABBy4DJw4DByc+Az0BMxUUHgIXIxUzESERMzUjNSEFNSMVBTUhFQMzHzNkV0YVFUVXZDUePHJaNlQ3WXJp0G39nG3RAyv+3+gBVv48AiFAByExPyUlPzEhB0AHKj1NKigpKE09K8x1/tsBJXVCt3V146KiAAADADT/uQNgAysAGAAkADsAAAEHLgMnDgMHJz4DPQEzFRQeAgUhFSMVIzUhFSM1IwUVFB4CFwcuAycOAQcnPgM9AQMxHjRkVkUVFURXZDUdPHFZNlQ2WXH9PwMstFL+4lK2AcEvUm4+HzNfUkAUKqhoHj5uUjACF0AIIjNAJiZBMiIIQAgrP08sJycqT0Asj0KmpqamUx0tTDsoCUAJHyw6JUhbEEAJKDpMLh0ABAA1/7YDYAMqABgAKwAyAD4AAAEHLgMnDgMHJz4DPQEzFRQeAhcjFR4BFRQGIyImNTQ2NzUjNSEFNSMVNjMyFzQmIyIGFRQWMzI2AzIeNGRXRRUVRVdlNR08clo2VDdZcmnMMzafk5KiODPNAyv+4/A2Qk+QdWptdHRtanUCHUEHIjE/JSVAMSEHQQcqPUwqKSkoTT0ry4QUPy1OUVFOLUAUg0Kxb24Jny4yMi4uMjIAAAAAAgA1AC4DYgL4ABgAHAAAAQcuAycOAwcnPgM9ATMVFB4CASEVIQM6JTNlWUcVFUdZZTIlO3RdOlY6XXX9NgMt/NMBdEQML0JVMTFUQy8MRAw7VWk6RUU5alU8/vNEAAAAAwA1/7UDYwMmABgAHAAiAAABBy4DJw4DByc+Az0BMxUUHgIFIRUhFzUhESM1Ay4gM2JVRRUVRFViMyA8cFg1VDVYcf1DAy780loCbVICCUAJIzJBJydBMiMJQAktQVEtKCguUUAtl0KjQv7d4QAAAAMANP/KA2ADHgAYABwAIgAAAQcuAycOAwcnPgM9ATMVFB4CBSEVIRcVIRUhEQMuIDNiVUQVFURVYzMhPHFYNlQ2WXD9QAMs/NS7Ahj9lgHzQQklNkQoKEQ2JQlBCTBEVC4sLC1URTCYQle+QwEBAAADADT/wANgAzEAGAAcACgAAAEHLgMnDgMHJz4DPQEzFRQeAgUhFSETFSEVITUhNSE1IRUDMxw2ZVdFFRVGWGY1HD1zWjZUNlly/T4DLPzUtQIq/YYCDv3vAmICNT4HHy08JCQ8LR8HPgcnOkkpIiIpSTonfkL+31tA11Q+zgAAAAQANf+2A18DLgAYABwAMQA3AAABBy4DJw4DByc+Az0BMxUUHgIFIRUhExUyPgI3Fw4DKwE1MzUjNSEVNzUhESMRAzIdNGVXRRUVRldlNRw8c1k2VDZYc/0/Ayr81qgxTkI8HwgiQElYOTfY2gEpMAEdUQIvPwgfLj0lJT0uHwg/Byg7SiohISpKOyiDQv7oWwIECQc9CAkFAdRSPcqHQ/6TASoABAA1/8IDYAMtABgAHAAgACQAAAEHLgMnDgMHJz4DPQEzFRQeAgUhFSETESERJRUhNQMxHjNkV0UVFUVWZDQfPHNYNlQ2WXL9PwMr/NVkAmT97AHEAhlACCIyQCYmQDIiCEAIKz9PKygoK04/LJJC/nUBJ/7Z5qSkAAAAAAQANP/CA2ADLQAYABwAJAAoAAABBy4DJw4DByc+Az0BMxUUHgIFIRUhBTUzESERMxUFNSEVAzIeNGRXRRUVRVdkNR48c1k2VDZZcv0+Ayz81AJxUf2lUQG5/kcCH0IIIjFAJSVAMSIIQgcqPU0rKCgpTT4riEKnaf6kAVxpsXJyAAAAAAMANf+5A2ADKAAYABwAMwAAAQcuAycOAwcnPgM9ATMVFB4CBSEVIQUVFB4CFwcuAycOAQcnPgM9AQMwHzNjVkUVFURWZDQfPHFZNlQ2WXH9QAMr/NUBwDBSbj0gM19RQBQqpGogPm1TMAIOQAgjM0ImJ0EzIwhACC1AUSwoKCtRQS2SQkQdLE08KQlBCSAuPCVLWxJBCSk8TSwdAAQANf+2A2ADKAAYABwAKAA0AAABBy4DJw4DByc+Az0BMxUUHgIFIRUhBTIWFRQGIyImNTQ2FzI2NTQmIyIGFRQWAzEfNGNWRRUVRFdjNR48clg2VDZZcf1AAyv81QGWk5+jj5CkpJBqdXVqbXR0AhJACCMyQSYmQTMiCEAJKz9PLCgoK04/LZBDU1FOTVNTTUxT/zAwLjIyLjAwAAIAMf+0AxMDNwADABgAAAEzESMBFRQeAhcHLgEnDgEHJz4DPQECwVJS/rImQVgxMU55IB96TzIxWEImAzf8fQM1oT15aFEWQiaVYWecKkMYVGx9QKEAAAADAD3/tQMVAzYAAwAYAB4AAAEzESMnBy4BJw4BByc+Az0BMxUUHgIFNSERIzUCw1JScSlOdB4ddk8qM1M7IVIhO1P+nQJYUgM2/eV2QRxuS1F2HkESQFFgMVhYMFtNO/dC/sj2AAAAAAMAPv/KAzADNwADABgAHgAAAREjEQMHLgEnDgEHJz4DPQEzFRQeAgMhFSERMwMVUnIrTnEeHXRPKzNTOyBSITtT+gIK/aRSAzf9bgKS/kFBHXNOUn0hQxNCVWQ0W1szXlE+/oNDARgAAwA7/8IDLQM3AAMAGAAgAAABESMRAwcuAScOAQcnPgM9ATMVFB4CAyEVIREhFSEDFVJwKE51Hx12USozVDwhUiE8U/4CCv2kAkr+CAM3/fsCBf5mQBxsSU53HUASPk9eMldXMFlLOf5WQgE9QgAAAAMAO//AAzMDNgADABgAJAAAAREjEQMHLgEnDgEHJz4DPQEzFRQeAgEhFSE1ITUhNSEVIQMUUm4pTnUfHXZRKjNUPCFSIjxU/wACEP2fAfL+DAJF/g4DNv4wAdD+ikAba0hOdB1AEjxOXDFERC5XSjn+MUHfWUHYAAQAMP+3Aw0DNgADABgALQAzAAABMxEjJwcuAScOAQcnPgM9ATMVFB4CARUyPgI3Fw4DKwE1MzUjNSEVNzUhESMRArlUVHYrS3EfHXFRLjRUOyBTIDtR/uUmREFCJAYoSUlOLTXW2QEsIwEdVAM2/jRMQhpnQ05vHUIRO05dM0lQK1NHOP6YYwEDBwZABgcEAeFXQdWSQ/6EATkAAAYAO/+3A1IDNgADABgAIAA1AEEATQAAAREjEQMHLgEnDgEHJz4DPQEzFRQeAhczFSE1MzUzBRUyPgI3Fw4DKwE1MzUjNSEVNzIWFRQGIyImNTQ2FzI2NTQmIyIGFRQWAxRSbSdPdiAdeFEoMlQ8IlIiPVSYlv6Jkk/+OiU9NjMbBx85P0gtL8jKARjWQlZWQkNXV0MmLCwmJi4uAzb+PgHC/pNAGmdITnIdQRE7TVkwREQtVEc3yj09UfxjAgQGBT4GBwQB3Vc9z0hBOTlCQjk5QbsjHh4jIx4eIwAEADv/wgMVAzYAAwAYABwAIAAAATMRIycHLgEnDgEHJz4DPQEzFRQeAgERIREBFSE1AsNSUm8pTnUfHXZRKjNUPCFSIjxU/q4CRP4MAaQDNv4CaUEbbUlOdx1AEj5PXTFXVzBZSjj+EQFD/r0BAsDAAAAAAAQAOv/CAxUDNgADABgAIAAkAAABMxEjJwcuAScOAQcnPgM9ATMVFB4CEzUzESERMxUFNSEVAsNSUm8oTnYfHXdRKjNUPSFSIjxUoVH9vlEBoP5gAzb+H1pAGmtITnQdQRI8TlswVFQuVko4/vxt/poBZm23d3cAAAMAPP+5A0kDNgADABgAMQAAAREjEQMHLgEnDgEHJz4DPQEzFRQeAgcVFB4CFwcuAycOAwcnPgM9AQMVUnApTnQfHXVPLDNTPCFSITxTBTFSbjwhM15RQBQUQFJgMx88bVMyAzb9pgJa/ltAHWtLUXogQhNAUmEzWFgwWkw7lxwvUkAsCkAJIzJAJydAMiMJQAosQFEwHAAABAA9/7gDGQM2AAMAGAAoADQAAAERIxEDBy4BJw4BByc+Az0BMxUUHgIHMh4CFRQOAiMiJjU0NhMyNjU0JiMiBhUUFgMVUnApTnQfHXRRKjNTOyFSITxTNEVvTioqTm9Fjp+fjmdzc2dndXUDNv3pAhf+YUEcbUlReh5BE0BSXzNYWDBZTDqeFiw+KSg/KxdYUVFY/u83MTM2NjMxNwAAAAMAOP+5A0kDNgADABgANwAAAREjEQMHLgEnDgEHJz4DPQEzFRQeAgEhFB4CFwcuAycOAwcnPgM1ITUhNTMVIQMUUncqS3EfHXRRLDRUOyBTIDtRAQ/++TFSajocM15QPxQUQVNfMhw6a1My/vkBCFMBBwM2/f4CAv6SQhtmQ05wHUISO05dMzg/K1NHOP7gHz81Jgc/Bx4qNh8gNiodBz8HJTM/Ij9WVgAAAAAEADr/wgMkAzYAAwAYACQAKAAAAREjEQMHLgEnDgEHJz4DPQEzFRQeAhMzFSE1MzUjNSEVIyEVMzUDFVJwJ052Hx13USozVD0hUiE8U36F/ZeEfAJXe/7xvgM2/g4B8v5yQRtrSE50HUESPE5bMFhYLldJOP5MQkLIQkLIyAAAAAIAKP+3A3cDNwAHAC8AAAEVIxEjETMRAxUUHgIXBy4BJw4BBy4BJw4BByc+Az0BMxUUHgIXPgM9AQN3f1JS/QwgNSkzMTwRDzs0MzwOETswNSg1IA1OBxMhGxsiEgcB10T+JAOA/qABEcotY15UHjwkcEBCdCYmdkI/cCU6HlVgYivKyiJRVFEiIVBTUiTKAAMALv+2A3EDNwAHAC8ANQAAARUjFSMRMxUPAS4BJw4BBy4BJw4BByc+Az0BMxUUHgIXPgM9ATMVFB4CBTUhESMRA3FxUlJ4LjM/EQ86MzM7DxE/My0mNSEOTwcSIRoaIRIHTg4hNf5GAllSAlFE6QIT5r47Hl02OWEgIGc5N2EfOxdES00hXFwaQEJBGxtAQkAbXFwlT0pA8UL+vAECAAAEAC7/tQNxAzYABwAvAEQASgAAATMVIxUjETMDBy4BJw4BBy4BJw4BByc+Az0BMxUUHgIXPgM9ATMVFB4CFxUUHgIXBy4BJw4BByc+Az0BBTUhESMRAwBxcVJSdy8zPxIOOjMzOw8RPzMtJjUhDk8HEiEaGiESB04OITZLFSo/KSg/UhYWUz0qKj4qFf4pASZRAlxE2gH4/mE7HV03OWEgIGc5OWAeOxdES04hWFgaQENBGxpAQkIbWFglT0tAk0UiQzwwD0AYVDY2VBc/DzA8QyJFVEP+rgEPAAAAAwAu/8oDcQM2AAcALwA1AAABMxUjESMRMwMHLgEnDgEHLgEnDgEHJz4DPQEzFRQeAhc+Az0BMxUUHgIFFSEVIREDAHFxUlJ4LjM/EQ86MzM7DxE/My0mNSEOTwcSIRoZIRMHTg4hNf6uAhX9mQIoRP7CApD+NjodXTc5YiAgaDk5YB46F0RLTiF1dRpAQ0EbGz9CQRx1dSVQSkCd2EMBGwAAAAADAC7/wANxAzcABwAvADcAAAEzFSMVIxEzAwcuAScOAQcuAScOAQcnPgM9ATMVFB4CFz4DPQEzFRQeAgUVIRUhESEVAwBxcVJSeC4zPxEPOjMzOw8RPzMtJjUhDk8HEiEaGSETB04OITX+sgIB/a0CRwJWReoCEP5eOx5dNzliICBoOTlgHzsXREtOIllZGkFDQRsbQEJBHFlZJVBKQfeyQgE3QwAAAAADAC7/wANzAzYABwAvADsAAAEzFSMVIxEzAwcuAScOAQcuAScOAQcnPgM9ATMVFB4CFz4DPQEzFRQeAgEVIRUhNSE1ITUhFQMAc3NSUngsM0ESDjszMzoPEUEzKyY0IQ9PBxMhGRkgEwhODyE1/qQCHP2TAfv+AwJNAnNEywHS/pE6G1o2NmEeIGM3Nl0dOhZASUsgPz8ZPkA/Ghk+QD8aPz8kTUg9/oxmQeRZQdcAAAQALv/CA3EDNgAHAC8AMwA3AAABFSMVIxEzFQ8BLgEnDgEHLgEnDgEHJz4DPQEzFRQeAhc+Az0BMxUUHgIBESERJRUhNQNxcVJSeC4zPxEPOjMzOw8RPzMtJjUhDk8HEiEaGSETB04OITX+XAJD/g4BogJaRekCCtzAOh1dNjlhICBnOTdhHjoXREtOIVdXGkBDQRsbP0JBHFdXJU9KQf4SAT3+w/y6ugAAAAAEAC7/wwNxAzYABwAvADcAOwAAARUjFSMRMxUPAS4BJw4BBy4BJw4BByc+Az0BMxUUHgIXPgM9ATMVFB4CEzUzESERMxUFNSEVA3FxUlJ4LjM/Eg46MzM7DxE/My0mNSEOTwcSIRoZIRMHTg4hNU5R/btRAaP+XQJmRNkB7dC/PB5dNzlhICBnOTlgHzwXREtNIVJSGkBCQRsaQEJBG1JSJU9KQP74bf6hAV9tr25uAAMALv+5A3EDNgAHAC8AVwAAATMVIxUjETMDBy4BJw4BBy4BJw4BByc+Az0BMxUUHgIXPgM9ATMVFB4CFxUUHgIXBy4BJw4BBy4BJw4BByc+Az0BMxUUHgIXPgM9AQMAcXFSUnguMz8SDjozMzsPET8zLSY1IQ5PBxIhGhohEgdODiE1TRkuQysqQloXFFE/P1IUF1tAKSpDLhlPDx8vHx8vHxACXkTmAgL+ZTsdXTc5YSAgZzk5YB47F0RLTiFWVhpAQ0EbGkBCQhtWViVPSkGlLCJEPTEPPBhbOTlfHBtfOTdbGTwQMz1DICwsGzo5NRQVNTk6GiwABAAu/7cDcQM2AAcALwBBAE0AAAEzFSMVIxEzAwcuAScOAQcuAScOAQcnPgM9ATMVFB4CFz4DPQEzFRQeAgcyHgIVFA4CIyIuAjU0NhMyNjU0JiMiBhUUFgMAcXFSUnguMz8RDzozMzsPET8zLSY1IQ5PBxIhGhkhEwdODiE1hEVvTSoqTW9FRW9OKaCLZ3JyZ2dycgJNRPcCJP5fOh1eNjliICBoOTdiHjoXRExNIVhYGUBDQhsbQEJAHFhYJU9KQaMWKz4pKD8rFxcrPyhRV/7wNzExNjYxMTcAAAUALv+3A3MDNgAHADIAOgBGAFIAAAEzFSMVIxEzATUuAScOAQcnPgM9ATMVFB4CFz4DPQEzNTMVFB4CFwcuAScOARcVIRUhNSE1FzIWFRQGIyImNTQ2FzI2NTQmIyIGFRQWAwBzc1JS/lszOw8RQTMrJjQhD08HEyEZGSETCBA9DyE1JiwzQREPOoQBE/2GARQqf4aGf4CGhoBYXFxYWF5eAnVE1wHc/lEBIGM3Nl4dOhZBSUsgPDwZPkFAGhk+QT8aPAE8JE1IPRU6HFk2NmEoWD8/WMJDPz9DQz8/Q8gkIiIkJCIiJAACACP/tgM7AzYACwAzAAABMxEjESMRIxEzETMBFRQeAhcHLgEnDgEHLgEnDgEHJz4DPQEzFRQeAhc+Az0BAu1OTmNMTGP+zQoaLyUwKjMPDTItLTENDzMqMCYvGglJBA8cGBccDwQDNvyAAdD+XANB/qYBFLMoW1lQHTsgXzY5YyIjZjk2YSA6HlJZWiWzsxtITk8iIEtNSiCzAAADACb/tQM6AzcACwAzADkAAAEzESM1IxUjETMVMw8BLgEnDgEHLgEnDgEHJz4DPQEzFRQeAhc+Az0BMxUUHgIFNSERIzUC7E5OZUxMZcEpLTMPDTEtKzIMDzQtKSMtGwpJBA8bFxUbDwVJChst/rkCeVIDN/3p8OwCA9TROhxWMDNaHyBdMzFYHToYRkxLHmdnFTxDRB0bQUE/GWdnIExLROlC/sL8AAADACb/0gNNAzcACwAzADkAAAERIxEzETMRMxEjEQ8BLgEnDgEHLgEnDgEHJz4DPQEzFRQeAhc+Az0BMxUUHgIDIRUhETMCh0xMZU5OwSktMw8NMS0rMgwQMy0pIy0bCkkFDxsWFRsPBUkKGy3fAiT9iVMB4v7UAnH+/gES/WYBRXM7HFYwM1seIF0zM1YdOxhFTEseb28VPENFHR0/QT4bb28fTUtE/o9DARMAAwAm/8IDWQM3AAsAMwA/AAABFSMRMxUzNTMRIzUPAS4BJw4BBy4BJw4BByc+Az0BMxUUHgIXPgM9ATMVFB4CAyEVITUhNSE1IRUhAodMTGVOTsEpLTMPDTEtKzINDjQtKSMtGwpJBA8bFxUbDwVJChst5gI3/XgCGP3mAmv96AIvzAHEtcX+JdOCOhxWMDNbHh9fMzNWHTgYRk1MHU1NFT1CRB0bQEI+Gk1NIExLRP4+Qd1YQNUAAAQAJv/CAzoDNwALADMANwA7AAABMxEjNSMVIxEzFTMPAS4BJw4BBy4BJw4BByc+Az0BMxUUHgIXPgM9ATMVFB4CAREhESUVITUC7E5OZUxMZcEpLTMPDTEtKzIMDzQtKSMtGwpJBA8bFxUbDwVJChst/soCaP3oAcgDN/3y5+IB+dPGOhxWMTNcHh9eMzNWHToYRU1LHmNjFT1CRB0bQEI+GmNjIExLRP4cATv+xfq4uAAAAAQAJv/CAzoDNgALADMAOwA/AAABMxEjNSMVIxEzFTMPAS4BJw4BBy4BJw4BByc+Az0BMxUUHgIXPgM9ATMVFB4CFzUzESERMxUFNSEVAuxOTmVMTGXBKS0zDw0xLSsyDBAzLSkjLRsKSQQPGxcVGw8FSQobLeFR/Z1RAcH+PwM2/hbSzQHWxsQ6HFYwM1seH10zMVcdOhhFTEseXl4VPENEHRtBQj4ZXl4gTEtD/2v+oQFfa7JxcQADACb/sQNzAzcACwAzAFsAAAEVIxEzFTM1MxEjNQ8BLgEnDgEHLgEnDgEHJz4DPQEzFRQeAhc+Az0BMxUUHgIXFRQeAhcHLgEnDgEHLgEnDgEHJz4DPQEzFRQeAhc+Az0BAodMTGVOTsEpLTMPDTEtKzIMEDMtKSMtGwpJBA8bFxUbDwVJChsttRkvQysrQloXFFM/P1MUF1lCKSpDLxhPEB8wHyAvIA8CEOAB99Pj/fPmfjkcVjAzXB0fXTMzVhw5GEVNSx5gYBU8Q0QdG0FBPxlgYCBMS0SfNCFDPDIPPBhaOTlfHBthNzdbGDwPMjxDITQ0Gzo5NBQUNTk7GTQABAAm/7cDPgM3AAsAMwBBAE0AAAEVIxEzFTM1MxEjEQ8BLgEnDgEHLgEnDgEHJz4DPQEzFRQeAhc+Az0BMxUUHgIHMhYVFAYjIi4CNTQ2EzI2NTQmIyIGFRQWAodMTGVOTsEpLTMPDTEtKzIMDzQtKSMtGwpJBA8bFxUbDwVJChstApKmppJIdFArppFteXltanp6Ag/nAf/U5P3TAQWKOxxWMTNbHyBdMzFYHTsYRUxLHmNjFTxDRB0bQEI+GmNjH01LRJ5UT05WFio9J09U/vk0MDA0NDAwNAAAAAQALv+3A3MDNgALADMARwBTAAABIxUzFSMVIxEzFTMDBy4BJw4BBy4BJw4BByc+Az0BMxUUHgIXPgM9ATMVFB4CBzIeAhUUDgIjIi4CNTQ+AhMyNjU0JiMiBhUUFgNzc3NzUlJz6y4zPxEPOjMzOw8RPzMtJjUhDk8HEiEaGSETB04OITWERW9NKipNb0VFb04pKU5vRWdycmdncnICZX9DkQIkjv7uOx1eNjliICBnOTdhHjsXREtNIVdXGkBDQRsbP0JBHFdXJU9KQKQXKz8oKD4rFxcrPigoPysX/vA3MDE2NjEwNwACACj/twMlAzcABwAvAAABMxEjESM1MycVFB4CFwcuAScOAQcuAScOAQcnPgM9ATMVFB4CFz4DPQEC0lNTnJzYDR82KTQxPBEPOzMzPA4ROzA1KTUgDE4HEiIbGyISBwM3/IAB9kb1yi1jXlQePCVvQkN1JiZ2Qj9wJToeVWBiK8rKIlFUUSIhUFNSJMoAAAADAC7/tgMkAzYABwAvADUAAAEzESMRIzUzDwEuAScOAQcuAScOAQcnPgM9ATMVFB4CFz4DPQEzFRQeAgU1IREjEQLSUlKMjEouMz8SDjozMzsPET8zLSY1IQ5PBxIhGhkhEwdODiE1/loCaVIDNv3vAQZD4TseXTc5YiAgZzk3YR87F0RLTiFgYBpAQ0EbGz9CQRxgYCVQSkDrQ/67AQIAAwAu/8oDPAM2AAcALwA1AAAlESM1MzUzEScHLgEnDgEHLgEnDgEHJz4DPQEzFRQeAhc+Az0BMxUUHgIBIRUhETMC0ouLUpwuMz8RDzozMzsPET8zLSY1IQ5PBxIhGhkhEwdODiE1/sICGf2WUagBd0PU/XLEOh1dNzdkICBoOTlgHjoYREtNInV1GUFDQhsbQEJBHHV1JVBKQf6LQwEaAAMALv/EAzwDNgAHAC8AOwAAATUjNTM1MxEnBy4BJw4BBy4BJw4BByc+Az0BMxUUHgIXPgM9ATMVFB4CASEVITUhNSE1IRUhAtKKilKcLDNBEg46MzM7DxFBMysmNCEPTwcTIRkZIBMITg8hNf65AiH9jQIK/fQCXf33AWjpQqP+Ml86G1o2NmAfIGQ3Nl4dOhZASUsgPz8ZPkA/Gho9QD4bPz8kTUg9/ipB4VhA1QAABQAu/8ADJAM3AAcALwBEAEgATAAAATMRIzUjNTMPAS4BJw4BBy4BJw4BByc+Az0BMxUUHgIXPgM9ATMVFB4CARUyPgI3Fw4DKwE1MzUjNSEVFxEhEQMVMzUC0lJSiopKLDNBEg46MzM7DhJBMysmNCEPTwcTIRkZIBMITg8hNf6PJDw3NRwHITw/Ry0x1dcBKDkBJtySAzf+HfBCyjkbWjY2YR4gZDk3Xx05FkFJSyA/Pxk+QD8aGT5APxo/PyRNSD3+j2ABAwYFPwUGBAHbVD/OoAFu/pIBL/DwAAQALv/DAyQDNgAHAC8AMwA3AAABMxEjESM1Mw8BLgEnDgEHLgEnDgEHJz4DPQEzFRQeAhc+Az0BMxUUHgIBESERJRUhNQLSUlKJiUouMz8SDjozMzsPET8zLSY1IQ5PBxMgGRohEwdODiE1/mwCV/35AbYDNv31AQlD3jsdXTc5YiAhZjk3YR47F0RLTSFXVxpAQ0EbGkBCQhtXVyVPSkD+FAE9/sP8uroAAAAEAC7/wgMkAzYABwAvADcAOwAAATMRIzUjNTMPAS4BJw4BBy4BJw4BByc+Az0BMxUUHgIXPgM9ATMVFB4CEzUzESERMxUFNSEVAtJSUoqKSi4zPxIOOjMzOw8RPzMtJjUhDk8HEiEaGSETB04OITVzUP2vUQGw/lADNv4c6kLXOx1dNzlhICBnOTlgHjsXREtNIVJSGkBCQRsaQEJBG1JSJU9KQP76b/6cAWRvs3JyAAMALv+3A2gDNgAHAC8AVQAAAREjNTM1MxEnBy4BJw4BBy4BJw4BByc+Az0BMxUUHgIXPgM9ATMVFB4CFxUUHgIXBy4BJw4BBy4BJw4BByc+Az0BMxUUFhc+Az0BAtKLi1KbLzM/Eg46MzM7DxE/My0mNSEOTwcSIRoaIRIHTg4hNlMYLkIrKEJbFxVSP0JQFRhaPyorQy8YTz4/IDAgEAErAQhDwP31cDsdXTc5YSAgZzk5YB47F0RLTiFWVhpAQ0EbGkBCQhtWViVPS0CgMyNEPDAPPRlYOTdgGxpcOTZYGT0QMjxDITMzPXUlFDQ6OxozAAAEAC7/twMpAzcABwAvAEMATwAAAREjNTM1MxEnBy4BJw4BBy4BJw4BByc+Az0BMxUUHgIXPgM9ATMVFB4CBzIeAhUUDgIjIi4CNTQ+AhMyNjU0JiMiBhUUFgLSiopSnC4zPxEPOjMzOw8RPzMtJjUhDk8HEiEaGSETB04OITVtR3JRKytRckdHclErK1FyR2p3d2pqd3cBDAEfQ8n91YQ7Hl02OWIgIWc5N2EfOxdETE0hV1caQENBGxs/QkEcV1clT0pBnhcrPigoPysXFys/KCg+Kxf+8DcxMDc3MDE3AAMAI/+2Az8DNgADAAsAMwAAATMRIwMRMxEjESM1JxUUHgIXBy4BJw4BBy4BJw4BByc+Az0BMxUUHgIXPgM9AQLxTk6jTExkMAoaLyUwKjMPDTItLTENDzMqMCYvGglJBA8cGBccDwQDNvyAAksBIvzAAdlF3LMnW1lRHTsgXzY5YyIjZjk2YCE6HlJZWiWzsxtITk8iIExNSh+zAAQAJv/KA1MDNgADAAsAMwA5AAABESMRAxEjNTM1MxEnBy4BJw4BBy4BJw4BByc+Az0BMxUUHgIXPgM9ATMVFB4CAyEVIREzAz1NoGZmTXIpLTMPDTEtKzIMEDMtKSMtGwpJBQ8bFhUbDwVJChst3gIp/YNUAzb9YQKf/XwBY0XN/Yu8OhxVMTNcHR9eMzNWHToYRUxLHm9vFTxDRB0bQUE/GW9vH01LRP6JRAEYAAAABAAm/8IDXAM3AAMACwAzAD8AAAERIxEDNSM1MzUzEScHLgEnDgEHLgEnDgEHJz4DPQEzFRQeAhc+Az0BMxUUHgIDIRUhNSE1ITUhFSEDPU2gZmZNciktMw8NMS0rMg0ONC0pIy0bCkkFDxsWFRsPBUkKGy3hAjX9eQIW/ecCa/3qAzf+JAHc/inxRJD+O1M6HVYwM1wdH14zM1cdOhhGTEseSUkVPENEHRtBQj4ZSUkfTEtF/jhB3lVA0gAFACb/wQM3AzcAAwALADMANwA7AAABMxEjJzUjNTM1MxEnBy4BJw4BBy4BJw4BByc+Az0BMxUUHgIXPgM9ATMVFB4CAREhEQEVITUC6U5OnGJiTW8pLTMPDTEtKzIMEDMtKSMtGwpJBQ8bFhUbDwVJChst/tQCW/31AboDN/35BvRDuP4RVDsdVjAzWx4fXjMzVx07GEVNSx5jYxU9Q0QdG0FCPxljYyBMS0T+HwFD/r0BAb+/AAAAAgAo/7cDJQM2AAsAMwAAATMRIxEjNTM1IzUzJxUUHgIXBy4BJw4BBy4BJw4BByc+Az0BMxUUHgIXPgM9AQLSU1OPj5CQ2A0fNik0MTwRDzszMzwOETswNSk1IAxOBxIiGxsiEgcDNvyBAZVEkESEyi1jXlQePCVvQkN1JiZ2Qj9wJToeVWBiK8rKIlFUUSIhUFNSJMoAAAADACj/1gM8AzcACwAzADkAACURIzUzNSM1MzUzEScHLgEnDgEHLgEnDgEHJz4DPQEzFRQeAhc+Az0BMxUUHgIBIRUhETMC0pGRj49Smy4zQhMOOjMzOQ4TQTMvJzciEE4HEyAZGCASB08QIzb+wgIY/ZZSqgEtQVxBgv1zzjwdXTY3Yh8gYzY2XR07FkBJTSNraxk+QkAbGj9BPxtrayROSj7+jEMBFAAEACj/vAMoAzYACwAzAEcAUwAAATUjNTM1IzUzNTMRJwcuAScOAQcuAScOAQcnPgM9ATMVFB4CFz4DPQEzFRQeAgcyHgIVFA4CIyIuAjU0PgITMjY1NCYjIgYVFBYC0o+Pj49SnC40QhMOOTMzOA4TQTMvJzciEE4HEiAZGR8SB08QIjdySHRRLCxRdEhIdFErK1F0SGp4eGpqd3cBFsxDWUN1/eB/OxxaOTdiHyBkNzZcHToVQUpNIltbGT9CQBsaP0FAG1tbJk9JPqEWKz4oJz4rFhYrPicoPisW/vM2MDE2NjEwNgAAAwAf/7cDPwM2AAMADwA3AAABMxEjAzUzESMRIzUzNSM1JxUUHgIXBy4BJw4BBy4BJw4BByc+Az0BMxUUHgIXPgM9AQLxTk6kTExqamo7DBwwJTEqMxALMCoqLwwQMyoxJTAdC0kDDBkWFRgMAwM2/IECuLT8wAF/RYNFZbgoWldNHDofWjQ2YSIjZDY2WyA6HE9YWSa4uBlFS00iIElLRx24AAAEACX/ygNNAzYAAwAPADcAPQAAAREjEQMRIzUzNSM1MzUzEScHLgEnDgEHLgEnDgEHJz4DPQEzFRQeAhc+Az0BMxUUHgIDIRUhETMDPU2fZmZmZkxsKC04EQwxKyswDBA4LSojMB4NSQQNGhYUGQ0ESg0dL+QCI/2JVAM2/WECn/18AR5CVkJ9/YuuPBtUMTFaHR9dMzFXHToWQkpLH4KCFDlBQh0bQUA+GISEJE5KQP6ZRAEUAAAAAgA1ACkDYgLyACcALwAAAQcuAScOAQcuAScOAQcnPgM9ATMVFB4CFz4DPQEzFRQeAgEhFSE1ITUzA1krQlsXFldCQ1gXF1lCLCtDLxhSESMzIiIyIhFSGC5E/sYBbvzTAWxTAYs9G2I/PGQbHGY8P2QcPRI5RUskaGgbQD85FRU4PUAeaGgnTEQ3/tFERL8AAwA1/7UDYwMkACcALwA1AAABBy4BJw4BBy4BJw4BByc+Az0BMxUUHgIXPgM9ATMVFB4CBSEVITUhNTMBNSERIzUDSyhCVxYWU0BCVBYVVkIoKj8sFlIRITIgIDAhEVEWLEH+0wFv/NIBbVL+mgJsUgIZPBdTNDBSFhZVMDNXFzwPLzc7G0BAFTIxLBAQKzAyF0BAHj02La9DQ1/+wUP+2+IAAAADADT/ygNiAxkAJwAvADUAAAEHLgEnDgEHLgEnDgEHJz4DPQEzFRQeAhc+Az0BMxUUHgIFIRUhNSE1MwUVIRUhNQNKJ0JXFhZTQEJUFhVYQCkqQCwWUhEiMSAgMCERURYsQP7UAW780gFtU/75Ah39kQIDPhdTNjBTFxdUMTNWGT4OLzc7G0xMFTExLRAQKzAyF0xMHjw3LLlDQ2j4ukP9AAAAAAMANP/CA2IDJgAnAC8ANwAAAQcuAScOAQcuAScOAQcnPgM9ATMVFB4CFz4DPQEzFRQeAgUhFSE1ITUzARUhFSERIRUDSidCVxYWU0BCVRUWV0ApKkAsFlIRIjEgIDAhEVEWLED+1AFu/NIBblL+9gId/ZECZgIcPRdSNjBSFxdUMDNWGD0PLzY7G0BAFTEwLRAQKzAyFkBAHD03LatDQ1r+zaFCASVCAAMANf/AA2EDLQAnAC8AOwAAAQcuAScOAQcuAScOAQcnPgM9ATMVFB4CFz4DPQEzFRQeAgUhFSE1ITUzARUhFSE1ITUhNSEVA0gnQlUVFlJCQlUWFFc/KCk+LBZSESIxICAwIRFRFitA/tYBbPzUAW1T/vQCKv2GAg797wJiAjo8FlAzME8UFVEwMVQXPA4tNDkZMjIULy4qEA8pLjAVMjIcOjQqmEFBSv5iW0DXUj/NAAAAAAUANv/AA2ADLAAnAC8AQwBHAEsAAAEHLgEnDgEHLgEnDgEHJz4DPQEzFRQeAhc+Az0BMxUUHgIFIRUhNSE1MwEVMj4CNxcOAisBNTM1IzUhFRcRIREDFTM1A0cmQlUVFlNCQlQVFVZAJyk+KxZSESExICAxIRFRFis//tcBa/zWAWxT/uUnPjYyGgceNz4khNDSAR85ASDalAI2PBVRMzBPFhdRMDNSFzwOLTQ5GTU1FS8uKg8PKS4vFjU1HTozKp1BQU/+ZFsBAwYFPQYHA9NSPcmZAWL+ngEm6ekAAAAABAA1/8MDYwMlACcALwAzADcAAAEHLgEnDgEHLgEnDgEHJz4DPQEzFRQeAhc+Az0BMxUUHgIFIRUhNSE1MwERIRElFSE1A0soQlcWFlNAQlUVFlZAKSpAKxZSESIxICAwIRFRFixB/tMBb/zSAW1S/qUCZP3sAcQCHj0WUzYxURcXVDAzVhg9Di83Oxs9PRUxMS0QECswMhc9PR48NyyoQ0NW/eoBJv7a5aOjAAQANP/CA2MDJwAlAC0ANQA5AAABBy4BJw4BBy4BJw4BByc+Az0BMxUUHgIXPgE9ATMVFB4CBSEVITUhNTMTNTMRIREzFQU1IRUDSyhCVxYWU0BCVBYVVkIpKkAsFlIRIjEgP0NRFixB/tMBb/zRAW5Ss1L9olEBu/5FAiQ9F1M2MFEWF1IxM1gYPQ4vNzwbODgWMTAsECBjMDg4Hj03LKFDQ1P+0GH+rgFSYbBwcAAABAA1/7YDYwMkACcALwA7AEcAAAEHLgEnDgEHLgEnDgEHJz4DPQEzFRQeAhc+Az0BMxUUHgIFIRUhNSE1MwcyFhUUBiMiJjU0NhcyNjU0JiMiBhUUFgNKJ0JXFhZTQEJUFhVWQigqPywWUhEhMiAgMCERURYsQP7UAW/80gFtUimTn5+TkqKikmp1dWptdHQCGz0XUjYwUxYXVDAzVRk9Dy83Ohs/PxUxMC0RECsxMhY/Pxw9Ny2tQ0Nc41FOTlFRTkxT/zIuLjIyLi4yAAAAAAMAJv+3A3UDOAAHAC8APwAAARUjESMRMxEBFRQeAhcHLgEnDgEHLgEnDgEHJz4DPQEzFRQeAhc+Az0BAxU+ATcXDgMjJzI2NzUDdX9SUv79DyE1Jyw2QBEPOjAzOQ4SQTQsJjUiD04HEyAZGCASCCk9eTwHS5iViz0LOYJFAcVE/jYDgf6NAS9XJEtGPBU8HV03M1wdHl4zNmAePBZAR0ofV1cXOj08GRg6PTsZV/5clAMKCT0NDwcBRQEClwAAAAQAMf+2A28DNwAHACsAOwBBAAABFSMVIxEzFQ8BLgEnDgEHLgEnDgEHJz4DPQEzFRQWFz4BPQEzFRQeAh8BDgMjJzI2NzUzFT4BBTUhESM1A29zUlKHJzM8Dw83MDA4DhE+MygjMiAOTiMsLCNODR4wKgZLmpaOPgo6gUVSP37+WQJjUgI9RPQCMvosPBdLLSpHFhdHKi1MFzwPLzc6Gzk5KWAkJGApOTkaOjYwjzwNDwcCQwECWlYDC/ZD/uDdAAQAMf/NA28DNwAHACsAOwBBAAABMxUjESMRMwMHLgEnDgEHLgEnDgEHJz4DPQEzFRQWFz4BPQEzFRQeAh8BDgMjJzI2NzUzFT4BBRUhFSE1Avxzc1JShyczPBAONzAwNw8RPjMoIzIgDk4jLCwjTg0eMCoGS5qWjj4KOoFFUj9+/sYCGf2VAgtE/sgCqP68OxZLLSpHFxdJKi1NFzwPLzc6G01NKWAkJGApTU0aOjYwljsNDwcCQwECYFwDCqG0QvYAAAAEADH/vgNwAzcABwAvAD8ASwAAATMVIxUjETMPAS4BJw4BBy4BJw4BByc+Az0BMxUUHgIXPgM9ATMVFB4CHwEOAyMnMjY3NTMVPgEBFSEVITUhNSE1IRUC/HR0UlKHJjM8EA83MDA3DxFAMyYjMSAPTggTHhYWHhMITg4eMCkGS5uWjT4KOoFFUj9+/sMCGP2XAfn+BQJMAlxE0gHx/zwWSSonRxUWRSotSRc9Diw0OBojIxMsLCoRESosLBMjIxk3NCyDOg0PBwJBAQJOSgML/ptZP9NOPscAAAAABAAx/7kDbwM2AAcALwA/AGUAAAEzFSMVIxEzAwcuAScOAQcuAScOAQcnPgM9ATMVFB4CFz4DPQEzFRQeAh8BDgMjJzI2NzUzFT4BFxUUHgIXBy4BJw4BBy4BJw4BByc+Az0BMxUUHgIXPgE9AQL8c3NSUocnMzwPDzcwMDgOET4zKCMyHw9OCBMeFhYeEwhODR4wKgZLm5aNPgo6gUVSP35lGC5CKylCWRcVUkA/URQYWkAqK0MuGE8QHy8fQD8CS0XoAhj+4jsXSy0qSBYXSCotTBc7Dy83Oxs2NhQuLiwSEiwuLhQ2Nho6NzCNOw0PBwJCAQJYVAMLlSMiRDovDjwXVjc2XBoaWjY2VRc8Dy87QiIjIxw8NzESJnM5IwAAAwAj/7YDNwM3AAsAMwBDAAABMxEjESMRIxEzETMBFRQeAhcHLgEnDgEHLgEnDgEHJz4DPQEzFRQeAhc+Az0BAxU+ATcXDgMjJzI2NzUC6E9PZU1NZf7DCxsuIyktNRAMLyoqLwwPNS0pIy0bC0kEDRoVFRkNBRk0Zi0HPIF/djALLWo6Azf8fwHL/mEDQv6hASlWHUZFPhY7G1EwLU4aG08tMFIcOxY/RkYbVlYSMzk7Ghg5OTUUVv5skwMHBzwLDQYCRQEClgAEAC3/uQNpAzYACwAzAEMAaQAAARUjETMVMzUzESM1JwcuAScOAQcuAScOAQcnPgM9ATMVFB4CFz4DPQEzFRQeAh8BDgMjJzI2NzUzFT4BFxUUHgIXBy4BJw4BBy4BJw4BByc+Az0BMxUUFhc+Az0BAoNNTV1OTsUpKjMNDS8qKC4NDjEqKSApGgpJBQ4ZExQZDwVKChoqEQU6f3x0MAstaDlOM2PVGC9DKydCXBgUUUBAUhQYW0IoK0MvGU8+PyAwHxAB/+wCEuP0/djxDDgWRSclQhQUQSUnRBY4EDE4Ohk1NRMsLSwSEiwtLRI1NRk6ODGROQsNBgJCAQJYVQMHmRYiQTktDT0XVDY2WhkZWTY2Uxc9Di05QSEWFjlwJBIwNzkbFgAAAAMAM/+2AxwDNgADACsAOwAAATMRIwMHLgEnDgEHLgEnDgEHJz4DPQEzFRQeAhc+Az0BMxUUHgIHFT4BNxcOAyMnMjY3NQLKUlI1KzZBEg86MzM7DxJBNiwmNiMQTQgUIRkZIRMIThAiNuJChEAHTp+akUALOoRGAzb8gAHhPB1cOTRcHR1fNDZiHTwVP0hKIFZWGDs9OxgYOjw8GVZWJEtHPFyXAwsKPg0PCAJFAQKbAAAAAAQAMv/KAy8DNQADACcANwA9AAABESMRAwcuAScOAQcuAScOAQcnPgM9ATMVFBYXPgE9ATMVFB4CHwEOAyMnMjY3NTMVPgEBIRUhNTMDFlJBKDM7Dw82MDA4DxA/MygjMh8PTiMtLCJPDR4wKARMnJiPQAw/h0hSP3z+ygIY/ZZSAzX9YgKe/r07F0otKkcWFkkqLU0XPBAvNjobTk4qXiUkYShOTho6NjCVOwwOCAJDAQNdWgMK/qhD+wAABAAy/8ADNQM3AAMAKwA7AEcAAAERIxEPAS4BJw4BBy4BJw4BByc+Az0BMxUUHgIXPgM9ATMVFB4CHwEOAyMnMjY3NTMVPgEBIRUhNSE1ITUhFSEDFlJBJjM8EA43MDE4DhE/MycjMSAPTggTHxYWHhIITw4eLygETZ2Xjz8MP4dIUj98/soCHv2QAf/9/wJT/gEDN/4TAe37PBZJKypHFhZHKi1JFjwOLTQ4GSIiEy0tKhAQKi0tEyIiGDczLYc5DQ4HAUEBAlJPAwr+Qz/SUT7LAAAFADL/wgMWAzYAAwApADkAPQBBAAABMxEjAwcuAScOAQcuAScOAQcnPgM9ATMVFBYXPgM9ATMVFB4CHwEOAyMnMjY3NTMVPgEBESERJRUhNQLEUlJBKDM6EA82MDA4DhE/MygjMh8PTiMtFh4SCE8NHjAoBEydmI8/DD+HSFI/fP55AlD+AQGvAzb92QEAPBdKLShIFhZHKi1OFzwPLzc7Gz08KF8lEisuLRQ8PRs5Ni6MOg0PBwFCAQJUUAMK/jcBJf7b5KKiAAUAMv/HAxYDNgADACkAOQBBAEUAAAEzESMnBy4BJw4BBy4BJw4BByc+Az0BMxUUFhc+Az0BMxUUHgIfAQ4DIycyNjc1MxU+ARc1MxEhETMVBTUhFQLEUlJBKDM6EA82MDA4DhE/MygjMh8PTiMtFh4SCE8NHjAoBE6cmI4/DD2JSFI/fHdS/axRAbH+TwM2/f/rPBdLLSpHFxdIKi5NFzsPLzc7GzAuKWAlEiwuLhQuMBo5Ni+GOg0PBwFCAQJQTQMK72H+tAFMYalqagAAAAACADUAKQNiAvIAJwAzAAABBy4BJw4BBy4BJw4BByc+Az0BMxUUHgIXPgM9ATMVFB4CAzMVITUzNTMVMzUzA1gqQloXFlZFRVcVGFpALCtDLxhSESIzIiIzIhFSGC5DpNn809hT11IBiz0aYD88ZxscaD09Yxw9EjlFSyRobhxAPjkVFTc+QB5uaCdNRDb+0URE1dXVAAAAAAQANP+6A2EDJgAlADEAPQBJAAABBy4BJw4BBy4BJw4BByc+Az0BMxUUHgIXPgE9ATMVFB4CBzMVITUzNTMVMzUzAzIWFRQGIyImNTQ2FzI2NTQmIyIGFRQWA0knQlYVFlNCQlQWFVZCJylAKxdRESIxIEJBUhYrP5/h/NPfUslStpifn5iYoKCYand3am11dQIaPBZTNjFSFxdVMDNXFzwPLzc7G0FBFTExLRAgZDBBQR49NyyyQ0OFhYX+9U9LTE9PTEtP9i8tLS4uLS0vAAACADX/tQNfAxQAJwAvAAABBy4BJw4BBy4BJw4BByc+Az0BMxUUHgIXPgM9ATMVFB4CFxUhESMRITUDSCdAVhUWVUBCVhUWVT8pKj8rFlIRITEhIDAhEVEWKz9B/pVT/pQB3jwYVTY3XRoaYDc2Vho8EDM8QBxbWxg6OTMTEzI4OhpbWyBBOzCuQ/65AUdDAAACADX/tQNjAyQAJwA1AAABBy4BJw4BBy4BJw4BByc+Az0BMxUUHgIXPgM9ATMVFB4CFyEVIREjNSE1ITUhNSEDSilAVhUWU0JDVhQWVj8oKUArFlIRITEhIDAhEVEWK0FD/pEBBlL95gET/pQDLgIQPhhUNjZcGRpfNjRYGT0PMjo+HD8/GDg3MhMSMTc5GT8/H0A5L819/uHdQn1CAAAAAwA0/8oDYgMbACcALwA1AAABBy4BJw4BBy4BJw4BByc+Az0BMxUUHgIXPgM9ATMVFB4CBSEVIRUjNSEXFSEVITUDSCdCVBUWVEJCVRUWVT8qKkArFlIRITEgIDEhEVEWKz/9FgMu/pZS/o65Ah39kQHxPRhUNjZdGRpfNjRXGTwQMjs/HFJSGTk3MhMSMjc6GVJSIEA6L5RCqqphvEP/AAIANP/AA2ADLwAnADsAAAEHLgEnDgEHLgEnDgEHJz4DPQEzFRQeAhc+Az0BMxUUHgIXIRUhFSEVIRUhNSE1ITUhNSE1IQNIJz9XFRVUQkJWFRZVPygpPysWUhEhMiAgMCERURYrQEH+lAEE/fECKv2GAg797wEM/pIDLAI3PBZQMzRYFxhaMzFTFzwPLjY6GjExFzQzLxERLTM1GDExHTw1LMNYz1pA11Q+WEIAAAAAAwA1/8IDYwMoACcAMwA3AAABBy4BJw4BBy4BJw4BByc+Az0BMxUUHgIXPgM9ATMVFB4CFyEVIREhESE1ITUhAzUhFQNKKUBWFRZTQkNWFBZVPykqPysWUhEhMSEgMCERURYrQUP+kQEJ/ZwBCf6TAy62/jwCGD0XVTY2XRkaXzY0WBk9DzI6Pxw6Ohk4NzITEjE3ORo6OiBAOS/Obv7YAShuQv5qpaUABAA0/8IDYwMrACcALwA3ADsAAAEHLgEnDgEHLgEnDgEHJz4DPQEzFRQeAhc+Az0BMxUUHgIFIRUhFSM1IQU1MxEhETMVBTUhFQNKKUBWFRZTQkNVFRZVQCgpQCsWUhEhMSEgMCERURYrQf0UAy/+kVL+kgJ0Uf2lUQG5/kcCHT0XVTY2XRgaXzY2Vhk8DzI6Pxw4OBg4NzITEjE3ORk4OB9AOi+KQ3x8sWj+rQFTaKlpaQAAAwA1/7YDYwMjACcAOgBGAAABBy4BJw4BBy4BJw4BByc+Az0BMxUUHgIXPgM9ATMVFB4CFyEVHgEVFAYjIiY1NDY3NSE1IQM0JiMiBhUUFjMyNgNJJ0JVFRZTQkNWFBZWQCcpQCsWUhEhMSEgMCERURYrQET+kYGKpJCWoIqD/pMDLrd3am11dW1qdwITPRdVNjZdGRpfNjZWGT0PMTs/HDo6GTg3MhMSMTc5Gjo6H0E5L81kBlBGTVFQTkhOBmRC/r4tMTEtLjExAAAAAwAv/7UDGQM3AAcALQA9AAABMxEjNSM1MwMHLgEnDgEHLgEnDgEHJz4DPQEzFRQeAhc+AT0BMxUUHgIfAQ4BBxEjEQ4BIycyPgICx1JSzc04KTNBEg47NjM8DhJBMykjNCEQTgkVIBgtKk8QITQiBkOGRVJDfjkLQpadnwM3/H7bQQEdOhdLLTBRGRlRMC5MFjkQLzc7HFFRFzMyLxMhZzZRUBw7Ny9/PAsPA/6sAU8CAkQBBgwAAAUAMP/BAxMDOAAHAC8APwBDAEcAAAEzESM1IzUzJwcuAScOAQcuAScOAQcnPgM9ATMVFB4CFz4DPQEzFRQeAgE1DgEjJzI+AjcXDgEHFQMRIRElFSE1AsFSUrm5TSUzQBIONjEwNg4RPzMoIzIgEE0IEh0WFx4RB08PIDL+1T94NgpBkpeZSAZChELJAmP98QG6Azj9ujg60DwVRiooSBYWRioqRhQ7DSozNhkwMBItLSkQECosLBMwMBk2Miv+uI0CAkUCBAkHPAgMA5H+yAEQ/vDRkpIAAAQAMP+6A2ADOAAHAC8APwBlAAABMxEzESM1IxMHLgEnDgEHLgEnDgEHJz4DPQEzFRQeAhc+Az0BMxUUHgIBNQ4BIycyPgI3Fw4BBxUFFRQeAhcHLgEnDgEHLgEnDgEHJz4DPQEzFRQeAhc+AT0BAge5UlK5dCYzPxEOODMzNw4RPzMnIzEgD04IFB8XFh8TCE4QIDH+zkB3NgpBkpueSwdFi0UBMR8zQiInQl4XFFM/P1MUF11CJipELhlPEB8vHz9AAWoBzv3DNAEOOxZGKipNFxhKKipKFzwOLDM1Fy4uESosKxISKywqES4uFTMyK/64hwICQgEGCgk6CwwDiyURJ0M1Jgo9FlI2NlgXF1c2NlEWPQ0sNz8gEREbODUuESNtNxEAAAAABAAo/7YDLwM2AAMACwAzAEMAAAEzESMDETMRIzUjNTcHLgEnDgEHLgEnDgEHJz4DPQEzFRQeAhc+Az0BMxUUHgIfAQ4BBxEjEQ4BIycyPgIC4E9Ppk1NnYMqKjEODS8tKzENDjEqKiArGgpJBg8aFRUaDwZJCxkrDwYxaDRPNmUrCjJ5gYEDNvyAATUCN/zCx0D3ORZEJipJGBlMKidHFzgSNTk3FUVFDywxNBcVMDIuEkVFGDk4MXE8CQwD/s4BLgMCRQIFCQAGACz/wQM3AzYAAwALADMAQwBHAEsAAAERIxEBMxEzESM1IxMHLgEnDgEHLgEnDgEHJz4DPQEzFRQeAhc+Az0BMxUUHgIBNQ4BIycyPgI3Fw4BBxUHIREhJTUhFQM2Tf63p0xMp4MnKzYQCy4qKi4LEDUqKiAtHA1JBA0ZFBMXDQRJDRwt/vczYCoLM3qAfjYGMGo3iQJ4/YgCJf4vAzb9xAI8/h8Bz/3aHgEKOhZDJydJGBhJJyhCFDcPLTY6HCEhDSkvMxcULzAsECEhGTg2MP7HfgIDRQIGCgc9CAsEgyz+8EKMjAAAAwAv/7UDFwM2AAMAKwA7AAABMxEjAwcuAScOAQcuAScOAQcnPgM9ATMVFB4CFz4DPQEzFRQeAh8BDgEHESMRDgEjJzI+AgLFUlI8KjA/EQ88NDM8DxE/MSojMiAPTwkUIRgYIRUJTg8gMioGQ4hCUkV9PApDlp2fAzb8fwI5OxdKLS5SGRlQMC1LFzoPLzc7HFJSFzMyLxMTLzIzF1JRGzs3L44+Cw0E/rwBQQMBRQEFCwAABAAx/8oDLwM1AAMAKwA7AEEAAAERIxEDBy4BJw4BBy4BJw4BByc+Az0BMxUUHgIXPgM9ATMVFB4CATUOASMnMj4CNxcOAQcVByEVIREzAxZSNyYzPxEOODMxOQ8QPTMoIjEfD04IFB8XFyATCE8PHzH+6UuNPwxClJyfSwY8dTyeAif9h1IDNf1cAqT+yjwXSyoqTxgYTSorTBc8Dy81NxhKShItLi0SEi0uLRJKShc2NC7+lpoEAUUBBQsLPQoMBJ+XQwEGAAAEADX/twNjAyQAJwA6AEEATQAAAQcuAScOAQcuAScOAQcnPgM9ATMVFB4CFz4DPQEzFRQeAhcjFR4BFRQGIyImNTQ2NzUjNSEFNSMVNjMyFzQmIyIGFRQWMzI2A0ooQlUVFlRCQlUVFlZAJylAKxZSESExICAxIRFRFitBQ80zNqSRlaA4NMwDLv7h8TZBRJ54am10dG1qeAIVPRdVNjZdGBpfNjZXGT0PMjo/HDk5GDg3MhMSMTc5GTk5H0A6L8uFFD8rTVFQTi0/E4RCsW9vCZ0tMTEtLjExAAAAAgA1AC0DYgLuACcAKwAAAQcuAScOAQcuAScOAQcnPgM9ATMVFB4CFz4DPQEzFRQeAgEhFSEDWC1CVxcWVkVFVxUXWUAsK0MuGFESIjMiIjIhEVMXLUT9CQMt/NMBbD8daEBCbh8gckJAax8/Ez5KUCVych9HRT8YFz5FRyFycilRSDv+8kQAAAMANf+2A2MDIgAnACsAMQAAAQcuAScOAQcuAScOAQcnPgM9ATMVFB4CFz4DPQEzFRQeAgUhFSEXNSERIzUDSilAVhUWVEJCVRUWVUAoKUArFlIRITEgIDEhEVEWK0H9FQMu/NJZAmxSAgw8F1Q2NlwZGl82NFcZOxAyOj8cPz8ZODYyExIxNjkaPz8gQDkvlUOkQ/7U6QAAAwA0/8oDYgMZACcAKwAxAAABBy4BJw4BBy4BJw4BByc+Az0BMxUUHgIXPgM9ATMVFB4CBSEVIRcVIRUhEQNIJ0JUFRZUQkJVFRZVPyoqQCsWUhEhMSAgMSERURYrP/0WAy780rkCHf2RAe48GFQ2Nl0ZGl82NFcZOxAzOz8cUlIZOTcyExIyNzoZUlIfQDoxlkNRxkMBCQADADT/wANgAywAJwArADcAAAEHLgEnDgEHLgEnDgEHJz4DPQEzFRQeAhc+Az0BMxUUHgIFIRUhExUhFSE1ITUhNSEVA0gnP1cVFVVCQlUVFlU/KCk/KxZSESExICAxIRFRFitA/RUDLPzUtQIq/YYCDv3vAmICNT0WUDM0WBcZWTMxUxc9Di42OhoxMRc1My4RES0zNRgxMR47NSuHQv7lXkDaVj/RAAAFADX/wANfAykAJwArAD8AQwBHAAABBy4BJw4BBy4BJw4BByc+Az0BMxUUHgIXPgM9ATMVFB4CBSEVIRMVMj4CNxcOAisBNTM1IzUhFRcRIREDFTM1A0cmQlQVFlRCQlUVFlU/Jyk+KxZSESExIBovJBZRFis//RcDKvzWpSc+NjIaBx43PiSE0NIBHzkBINqUAi89FlAzM1gXF1szMVQXPQ4uNjoaNDQXNDMuEQ4nMTgfNDQcPDUsiUH+6V0BAwYFPQYHA9RTPcmbAWT+nAEo6+sAAAYANf+3A18DKwAnACsAMwBIAFQAYAAAAQcuAScOAQcuAScOAQcnPgM9ATMVFB4CFz4DPQEzFRQeAgUhFSEFFTMVITUzNQUVMj4CNxcOAysBNTM1IzUhFTcyFhUUBiMiJjU0NhcyNjU0JiMiBhUUFgNHJkJUFRVVQkJWFBZVPygpPysWUhEhMSAgMSERURYrP/0XAyr81gJxlf6Ik/6AKkM4NBsJHzpBTTIyztABHtpCVlZCQVZVQiYsLCYkLS0CNjwWUDM0WBcYWTMxUhc8Di42ORkxMRY0Mi4REC0yNBgxMRw7NSuFQSNOPT1O82UBAwYFPgYHAwHgWT7SRUI5OUFCODlCvSQeHiQkHh4kAAAABAA1/8IDYwMlACcAKwAvADMAAAEHLgEnDgEHLgEnDgEHJz4DPQEzFRQeAhc+Az0BMxUUHgIFIRUhExEhESUVITUDSilAVhUVVUJCVhQWVT8pKj8rFlIRITEgIDEhEVEWK0H9FQMu/NJkAmT97AHEAhU9GFQ2NlwaGl83NFgZPBAxOz4dOTkZODcyExIxNzkaOTkgQDkvlUP+dgEu/tLtq6sAAAAEADT/wgNjAyoAJwArADMANwAAAQcuAScOAQcuAScOAQcnPgM9ATMVFB4CFz4DPQEzFRQeAgUhFSEFNTMRIREzFQU1IRUDSilAVhUWVEJCVhQWVj8oKUArFlIRITEgIDEhEVEWK0H9FAMv/NECdFH9pVEBuf5HAh0+GFQ2NlwZGl42M1gZPQ8yOj4cODgYODcyExIxNzkZODgfQDkvjUKtZ/6sAVRnq2trAAAAAwA1/7sDYgMhACcAKwBEAAABBy4BJw4BBy4BJw4BByc+Az0BMxUUHgIXPgM9ATMVFB4CBSEVIQUVFB4CFwcuAycOAwcnPgM9AQNJKEJUFRZUQkJVFRZVQCgpQCsWUhEhMSAgMSERURYrQP0WAy380wG/MFNuPyMzX1FAFBRBUmAzIj9vVDACCTwXVDY2XBkaXzY0Vxk7EDI6PxxBQRk4NzITEjE3ORpBQSBAOS+VQz8bLk49KQlACSAuPCQkPC4gCUAJKj1OLRsAAAAAAwAz/7YDHAM2AAMAKwA3AAABMxEjAwcuAScOAQcuAScOAQcnPgM9ATMVFB4CFz4DPQEzFRQeAgEnMj4CNxcOAwLKUlI1KzRCEw48MzM7DhNCNCwmNiMQTQgUIRkZIRMIThAiNv3TC0GUnJ9MB06fm5EDNvyAAdE9HVw2NmEfIGQ2NmAdPRU/SEogXF4YPT8+Ghk8Pz4aXlwkTEY8/tpFAQYNDD4OEAcCAAAAAAQAMv/EAy8DNgADACcAMwA5AAABESMRAwcuAScOAQcuAScOAQcnPgM9ATMVFBYXPgE9ATMVFB4CHwEOAyMnMj4CASEVIREzAxZSQSgwOxEONjMxNw4RPjMoIzIfD04iLSolTw0eMCgETJyYkD8MQZSbnf7YAhj9llIDNv1hAp/+sToWSCstTRgYTy0tSRc7EC83OhtSVC1lJiJiNFRSGjo2MHw7DQ8HAkMBBgz+lkMBCAAAAAQAMv/AAzUDNgADACsANQBBAAABESMRAwcuAScOAQcuAScOAQcnPgM9ATMVFB4CFz4DPQEzFRQeAh8BBgQjJzI+AgEhFSE1ITUhNSEVIQMWUkEmMTwRDjgxMTcOEj4zJyMxIA9OCBMeFhYeEwhPDh4vKQaU/teVDEKVmp3+1wIe/ZAB//3/AlP+AQM2/hMB7f7/PBVGKitNFxdMLSpJFTwOLTQ4GCMjFS8vLBISLC8vFSMjGTYzLHg5FwxBAQUL/j5A01A+yQAABQAy/8IDFwM1AAMAJwAzADcAOwAAAREjEQMHLgEnDgEHLgEnDgEHJz4DPQEzFRQWFz4BPQEzFRQeAh8BDgMjJzI+AgUhESElNSEVAxZSQSgwOxEOODExOA4RPTMoIzIfD04iLSolTw0eMCgETJ2Yjz8MQpObnP6IAlH9rwH//lMDNf3cAiT+1zsWRy0tTRgYTi0tShc7EC83Ohs9PS1lJiJiND09Gjk2L4A5DQ8HAUEBBguq/tpCo6MAAAACACn/tgMfAzYAAwArAAABMxEjAxUUHgIXBy4BJw4BBy4BJw4BByc+Az0BMxUUHgIXPgM9AQLNUlLMDSA2KTIzPREPPDQzPw4RPDA1KTYgDU0IEyMbGyITCAM2/IADMcktZF9UHTskcUJFdSYmeUNCcSQ5HlVgYyvJySJSVFEiIU9UUyTJAAAAAwAu/7YDHgM2AAMAKwAxAAABMxEjJwcuAScOAQcuAScOAQcnPgM9ATMVFB4CFz4DPQEzFRQeAgU1IREjEQLMUlI/LTNAEg87MzQ7DxFAMy4nNSEPTwgTIRkaIRMHTg8hNf5UAmRSAzb982c7Hlw5OWMgIWc5N2IfOxdDTE4hXV0aQENBGxpAQkIbXV0lUEpA70L+vQEBAAADAC7/ygMxAzcAAwArADEAAAERIxEDBy4BJw4BBy4BJw4BByc+Az0BMxUUHgIXPgM9ATMVFB4CASEVIREzAx5SPy0zQBIPOzM0Ow4SQDMuJzUhD08HFCEaGiESB04PITX+swIY/ZdRAzf9bwKR/jc7HV05OWMgIGg5OWAfOxdDTE4hdXUaQUNBGxpAQ0EcdXUlUEpA/olDARoAAAADAC7/vQM4AzYAAwArADcAAAERIxEDBy4BJw4BBy4BJw4BByc+Az0BMxUUHgIXPgM9ATMVFB4CASEVITUhNSE1IRUhAx5SOis0QhIPPDQ0PA8SQTQsJzYiD04IFCEZGiEUCE4PIjb+sQIb/ZQCAv38AlT9/wM2/i4B0v6ROhxcNjdjHiBkOTZgHToWQUhLID8/Gj5APxoaPUA/Gz8/JE1HPf4iQeZaQdgAAAAABAAu/8IDHgM4AAMAKwAvADMAAAEzESMnBy4BJw4BBy4BJw4BByc+Az0BMxUUHgIXPgM9ATMVFB4CAREhESUVITUCzFJSPy0zQBIPOzM0Ow8RQDMuJzUhD08IEyEZGiETB04PITX+ZgJS/f4BsgM4/fZtOx1cOTljICFnOTdhHzsXQ0tOIVhYGkBDQRsaQEJCG1hYJFBLQP4SAT7+wvy5uQAAAAAEAC7/wgMeAzcAAwArADMANwAAATMRIycHLgEnDgEHLgEnDgEHJz4DPQEzFRQeAhc+Az0BMxUUHgITNTMRIREzFQU1IRUCzFJSPy0zQBIPOzM0Ow4SQDMuJzUhD08IEyEZGSETCE4PITVoUP2xUgGt/lMDN/4VWzsdXDk5YiAgaDk5YB87F0NMTiFRURtAQ0EbGkBDQRxRUSVQSkD++W3+nwFhbbFwcAADAC7/uQNSAzYAAwArAEQAAAERIxEDBy4BJw4BBy4BJw4BByc+Az0BMxUUHgIXPgM9ATMVFB4CBxUUHgIXBy4DJw4DByc+Az0BAx5SPy0zQBIPOzM0Ow8RQDMuJzUhD08IEyEZGSETCE4PITU/MFNsPCAyX1I/ExRAUl8yITxuUjEDNv2YAmj+WTsdXDk5YyAhZzk5Xx87F0NLTiFdXRtAQ0EbG0BCQRxdXSRQS0CbGDBSQCwKQAkjMUAnJ0AxIwlACixAUjAYAAQALv+3AyMDNgADACsAPwBLAAABESMRAwcuAScOAQcuAScOAQcnPgM9ATMVFB4CFz4DPQEzFRQeAgcyHgIVFA4CIyIuAjU0PgITMjY1NCYjIgYVFBYDHlI/LTNAEg87MzQ7DxFAMy4nNSEPTwgTIRkZIRMITg8hNXdHclArK1ByR0hyUSsrUXJIanZ2amp4eAM2/dwCJP5fOh1bOTliICBoOTlfHzoXQ0xOIVdXG0BDQRsaQENBHFdXJVBKQKMWKz4pKD8sFhYsPygpPisW/vA3MTE2NjExNwAAAAADACr/qgNCAzcAAwArAEoAAAERIxEDBy4BJw4BBy4BJw4BByc+Az0BMxUUHgIXPgM9ATMVFB4CEyEeAxcHLgMnDgMHJz4DNyE1ITUzFSEDHlJCLjNDEw45MzM5DhJCMy4mNyMQTgcSIBkYHxMHTxAjNsv+6gc1UGY4HDNgUkEUFEFSYDMcOGZQNQf+6AEbUgEZAzf9/AIE/oo7HFo2Nl4eH2I2NlsdOxU+SEohREQYPEA+Gho9Pj0aREQlTUc8/s0hPTAiBz4HHSs3ISE4Kx8HPwciMT0iQ2FhAAAAAwBC/7YDewM2AAcAGwAvAAABFSMRIxEzEQEyHgIVFA4CIyIuAjU0PgITMj4CNTQuAiMiDgIVFB4CA3uUUlL+PTJSPCEhPFIyMlM8ISE8UzIgNicWFic2ICE2JxYWJzYB0UX+KgOA/psBISxSc0hIc1IsLFJzSEhzUiz91yI/WDc2WT4iIj5ZNjdYPyIAAAAABABG/7YDcgM2AAcAGwAvADUAAAEVIxUjETMVBxQOAiMiLgI1ND4CMzIeAgUUHgIzMj4CNTQuAiMiDgITNSERIxEDcoVSUtMjP1UzM1Y+IyM+VjMzVT8j/nwXKTgiITkpFxcpOSEiOCkXEAJHUgJQROUCD+YiME44Hx84TjAvTjcfHzdOLyA1JhUVJjUgIDQlFRUlNP5oQ/69AQAABABG/8oDcgM3AAcAGwAvADUAAAEzFSMRIxEzAxQOAiMiLgI1ND4CMzIeAgUUHgIzMj4CNTQuAiMiDgITFSEVIREC7YWFUlLTIz9WMjJWPyMjP1YyMlY/I/58Fyo4ISE4KhcXKjghITgqF3sCBP2qAiZE/sEClP7kMVE7ICA7UTExUTsgIDtRMSE3KBYWKDchITcoFhYoN/6q2UMBHAAAAAQARv+6A3IDNwAHABsALwBRAAABMxUjFSMRMwMUDgIjIi4CNTQ+AjMyHgIFFB4CMzI+AjU0LgIjIg4CARUUHgIXBy4BJw4BBycOASsBETMVPgE3Fz4BPQEjNSEVAu2FhVJS2CM9VTIyVT4jIz5VMjJVPSP+gRcpNyEgNykXFyk3ICE3KRcB7hYqPyonP1QWF1Q/JzNrMCtQKl0jF0hKkgFvAmNEywHj/v4uTTceHjdNLi1MNx8fN0wtHzMlFRUlMx8eMyUVFSUz/pASIkM5Lg49FlA2NlAWPBQNATz4AhEUPyBxPxJBQQAHAEb/twNyAzcABwAbAC8ANwBCAFIAXgAAATMVIxUjETMDFA4CIyIuAjU0PgIzMh4CBRQeAjMyPgI1NC4CIyIOAgUVMxUhNTM1BRE+ATcXDgErAREFMh4CFRQGIyImNTQ+AhcyNjU0JiMiBhUUFgLthYVSUtgjPVUyMlU+IyM+VTIyVT0j/oEXKTchIDcpFxcpNyAhNykXAfe5/j26/qYnXTANQHguKwHSJD0sGV1JSV0ZLD0kKjMzKiozMwJuRLIBv/7+Lkw3Hh43TC4uTDceHjdMLh8zJRUVJTMfHzMlFRUlM/JRPT1RS/76Ag0PQRUMAUpjEiEuHTxDQzwdLiESwyYfHyUlHx8mAAAABABG/8ADbgM2AAcAGwAvADcAAAEzFSMVIxEzAxQOAiMiLgI1ND4CMzIeAgUUHgIzMj4CNTQuAiMiDgITFSEVIREhFQLphYVUVNsiPVMyMVQ9IiI9VDEyUz0i/okWKDYfIDYnFhYnNiAfNigWagH2/bcCQgJRReMCDf79Lk43Hx83Ti4vTTcfHzdNLx80JRUVJTQfIDMmFBQmM/5ntUUBPUMAAAAEAEb/wgNyAzcABwAbAC8AOwAAATMVIxUjETMHFA4CIyIuAjU0PgIzMh4CBRQeAjMyPgI1NC4CIyIOAhMVIRUhNSE1ITUhFQLthYVSUtgjPVUzMlU9IyM9VTIzVT0j/oEXKDchITgoFxcoOCEhNygXcAII/agB5v4XAjoCdkTEAcnnLUo1HR01Si0sSTUdHTVJLB4xIxQUIzEeHTEjFBQjMf37ZELjXkHcAAAABQBG/70DcgM2AAcAGwAvAEQASgAAARUjFSMRMxUHFA4CIyIuAjU0PgIzMh4CBRQeAjMyPgI1NC4CIyIOAhMVMj4CNxcOAysBNTM1IzUhFTc1IREjEQNyhVJS2CM+VTIyVT0jIz1VMjJVPiP+gRcoNyEhOCgXFyg4ISE3KBdLLkk/OR4JIT5HVDY209UBJCYBFFECb0PPAdnHLi1LNh4eNkstLUs2Hh42Sy0eMiQUFCQyHh4yJRQUJTL+AF0BBQcGPgcIBQHZVT7PjkH+jwEwAAYARv/CA3IDNgAHABsALwBCAEYASgAAARUjFSMRMxUHFA4CIyIuAjU0PgIzMh4CBRQeAjMyPgI1NC4CIyIOAhMVMj4CNxcOASsBNTM1IzUhFRcRIREDFTM1A3KFUlLYIz1VMjNVPSMjPVUzMlU9I/6BFyg4ISE3KBcXKDchITgoFz0jOjQxGwgwUzR9y84BHTcBGNGJAm9DzwHZxystSzUeHjVLLS1LNh0dNkstHjIkFBQkMh4eMiQUFCQy/f9gAQMGBT4JB9tUPs6fAW3+kwEw8/MABwBG/7YDcgM2AAcAGwAvADcATABgAGwAAAEzFSMVIxEzBxQOAiMiLgI1ND4CMzIeAgUUHgIzMj4CNTQuAiMiDgIBFTMVITUzNQUVMj4CNxcOAysBNTM1IzUhFTcyHgIVFA4CIyIuAjU0PgIXMjY1NCYjIgYVFBYC7YWFUlLYIz1VMjNVPSMjPVUzMlU9I/6BFyg4ISE3KBcXKDchITgoFwIBlf6Kkf6IJDw2MhsIHzk+Ri0wyswBGtUhOCkXFyk4ISE4KRcXKTghJi0tJiYtLQJ1RLcBvPAtSzUeHjVLLS1LNR4eNUstHjIkFBQkMh4eMiQUFCQy/vpSPT1S/GICBAYFPQYHBAHbVD3MSREgLR0cLSARESAtHB0tIBG6Ih0eIiIeHSIAAAAFAEb/wgNyAzYABwAbAC8AMwA3AAABFSMVIxEzFQcUDgIjIi4CNTQ+AjMyHgIFFB4CMzI+AjU0LgIjIg4CExEhEQEVITUDcoVSUtMjP1YzM1U+IyM+VTMzVj8j/nwXKDkhIjkpFxcpOSIhOSgXJAIz/h0BkgJbROcCBtstL043Hx83Ti8vTjcfHzdOLx80JhUVJjQfIDQmFRUmNP10AUP+vQECwMAAAAAFAEf/wgNyAzYABwAbAC0ANQA5AAABFSMVIxEzFQcUDgIjIi4CNTQ+AjMyHgIFFB4CMzI+AjU0JiMiDgIBNTMRIREzFQU1IRUDcoVSUtQjPlYzM1U9IyM9VTMzVj4j/n0XKDkhIjgpF1VFITkoFwIGUf3LUQGT/m0CakTVAeXMLy5NNx4eN00uLkw2Hh42TC4fMyUVFSUzH0BKFCQz/l1v/pwBZG+ycnIAAAAABABG/7sDcgM3AAcAGwAvAEYAAAEzFSMRIxEzAxQOAiMiLgI1ND4CMzIeAgUUHgIzMj4CNTQuAiMiDgIBFRQeAhcHLgEnDgMHJz4DPQEC7YWFUlLTIz9VMzNWPiMjPlYzM1U/I/58Fyk4IiE5KRcXKTkhIjgpFwFxMFNsPCFnoSoUQFBeMiE8bVIxAkJE/uUCVP7sL044Hx84Ti8wTjkfHzlOMB81JRUVJTUfIDYmFRUmNv7MGzBTQCwKQBJiTiZAMSIJQAosQFMwGwAABABG/7kDcgM3AAcAGwAvAFUAAAEzFSMVIxEzASIuAjU0PgIzMh4CFRQOAgMiDgIVFB4CMzI+AjU0LgIBFRQeAhcHLgEnDgEHLgEnDgEHJz4DPQEzFRQWFz4DPQEC7YWFUlL+QzNWPiMjPlYzM1U/IyM/VTMiOCkXFyk4IiE5KRcXKTkBVhguQyspQlsXFFI/QlAUGFo/KitDLhhPPT8gMCAQAmBE5AH//iUfN04vL043Hx83Ti8vTjcfAWEVJTQgHzUlFRUlNR8gNCUV/lIvI0U8MA88GVk5OV8bGl05N1kYPBAzPEMhLy89dSUUNDo7Gi8AAAUARv+3A3IDNgAHABsALwBDAE8AAAEzFSMVIxEzAxQOAiMiLgI1ND4CMzIeAgUUHgIzMj4CNTQuAiMiDgIBMh4CFRQOAiMiLgI1ND4CEzI2NTQmIyIGFRQWAu2FhVJS0yM/VTMzVj4jIz5WMzNVPyP+fBcpOCIhOSkXFyk5ISI4KRcBOkRtTSkpTW1ERG5NKSlNbkRkcXFkZHJyAldF7wIT/vgvTjcfHzdOLy9ONx8fN04vHzUlFRUlNR8gNCYVFSY0/rkWKz4pKD4rFxcrPigpPisW/vE3MDE2NjEwNwAABABG/7UDbgM2AAcAGwAvADkAAAEVIxUjETMVBxQOAiMiLgI1ND4CMzIeAgUUHgIzMj4CNTQuAiMiDgIDNSERIzUFJyU1A26FVFTbIj1TMjFUPSIiPVQxMlM9Iv6JFic2ICA2JxYWJzYgIDYnFgMCVVT99wsCFAJRReMCDeUeLk43Hx83Ti4vTTcfHzdNLx80JRUVJTQfIDMmFBQmM/5qQ/61dhlCFVQABABH/8IDcgM2AAcAGwAvADsAAAEzFSMVIxEzBxQOAiMiLgI1ND4CMzIeAgUUHgIzMj4CNTQuAiMiDgITFSEVIREhFSEVIRUC7YWFUlLUIz5WMzNVPSMjPVUzM1Y+I/59Fyg5ISI4KRcXKTgiITkoF3YB+v21Ajj+GQHcAmpE0QHh9i5LNh0dNksuLUs2Hh42Sy0eMiQUFCQyHh4yJRQUJTL9+lk9AWM9VTsAAAUARv/EA3IDNgAHABsALwA7AD8AAAEzFSMVIxEzAxQOAiMiLgI1ND4CMzIeAgUUHgIzMj4CNTQuAiMiDgIBFTMVITUzNSM1IRUhFTM1Au2FhVJS0yM+VzMzVT4jIz5VMzNXPiP+fBcoOSEiOSkXFyk5IiE5KBcB84f9moN7AlP+eboCXETdAfv++y9NOB4eOE0vL003Hx83TS8fNSUVFSU1Hx80JhUVJjT+eMJCQsJCQsLCAAMAQP+2Ay8DNwALAB8AKwAAATMRIxEjESMRMxEzATIeAhUUDgIjIi4CNTQ+AhMyNjU0JiMiBhUUFgLhTk55TU15/h4sRzIbGzJHLCtHMhsbMkcrNj4+NjY+PgM3/H8B2/5RA0H+sQEYLFFzSEh0USwsUXRISHNRLP3bfXBtf39tcH0AAAQAPv+1AyoDNwALAB8ALwA1AAABMxEjNSMVIxEzFTMFFA4CIyIuAjU0PgIzMh4CBRQeAjMyNjU0JiMiDgITNSERIzUC209Pck1Ncv77HzZLLCxLNh8fNkssLEs2H/6yFCIwHDlISDkcMCIURwJbUgM3/ers5wIA1iUvTjcfHzdOLy9OOB8fOE4vHzUmFVA/P1AVJjT+YUL+x/cAAAQAPv/KA0QDNgALAB8AMQA3AAABESMRMxUzETMRIxElFA4CIyIuAjU0PgIzMh4CBRQeAjMyPgI1NCYjIg4CEyEVIREzAmlNTXJPT/77HzZLLCxLNh8fNkssLEs2H/6yFCIwHBwvIxNIOR8xIRGrAhH9nVIB7f7HAnL1AQX9XgFZKTBQOSAgOVAwMFE5ICA5UTAgNicWFic2IEJSGCk2/dpDASIABAA+/8IDTAM2AAsAHwAvADsAAAEVIxEzFTM1MxEjNSUUDgIjIi4CNTQ+AjMyHgIFFBYzMjY1NC4CIyIOAhMhFSE1ITUhNSEVIQJpTk5yT0/++x82SywtSzYeHjZLLSxLNh/+skk5OUgTIy8cHDAjE6UCH/2QAfz+AgJQ/gMCLcMBu7bH/ivMGyxJNB0dNEksLEg0HR00SCw6S0k8HTAjFBQjMP2fQuBWQdUAAAUAPv/CAyoDNgALAB8ALwAzADcAAAEzESM1IxUjETMVMwUUDgIjIi4CNTQ+AjMyHgIFFBYzMjY1NC4CIyIOAhMRIRElFSE1AttPT3JOTnL++x82SywtSzYeHjZLLSxLNh/+skk5OUgTIy8cHDAiFFUCTf4DAa0DNv375tkB5soqLk03Hh43TS4vTDceHjdMLz9OTj8eNCUVFSU0/XQBQP7A/729AAAAAAUAPv/CAyoDNgALAB8ALQA1ADkAAAEzESM1IxUjETMVMwUUDgIjIi4CNTQ+AjMyHgIFFB4CMzI2NTQmIyIGATUzESERMxUFNSEVAttPT3JOTnL++x82SywtSzYeHjZLLSxLNh/+shQiMBw5SEg5OUkCUVH9s1IBqv5WAzb+F9jRAdG8Li1LNh4eNkstLUo2HR02Si0eMiUUTTw8TEz+Q2z+nAFkbLV0dAAAAAAEAD7/ugNYAzYACwAfADMATAAAARUjETMVMzUzESMRJRQOAiMiLgI1ND4CMzIeAgUUHgIzMj4CNTQuAiMiDgIBFRQeAhcHLgMnDgMHJz4DPQECaU5Ock9P/vsfNkssLEs2Hx82SywsSzYf/rIUIjAcHC8jExMjLxwcMCIUAaAzVG47HzJgUkIUFUJRXzMeOm1UMwIS2wHu0OH9uAEkEi9POR8fOU8vL084Hx84Ty8gNScVFSc1ICA1JxUVJzX+wh4rTz8sCUAJIjA/JSU/MCIJQAksP08rHgAEAD7/uQNwAzYACwAfADEAVwAAARUjETMVMzUzESM1BSIuAjU0PgIzMh4CFRQOAgMiDgIVFB4CMzI2NTQuAgEVFB4CFwcuAScOAQcuAScOAQcnPgM9ATMVFBYXPgM9AQJpTk5yT0/+Ly1LNh4eNkstLEs2Hx82SywcMCIUFCIwHDlIEyMvAZYYL0MqKENbFxVRP0JRFBhbPykrQy8YTz4/IC8gDwIU2wHrzd/9++O1HjdNLi9MNx4eN0wvLk03HgFdFSY0Hh8zJRVNPx40JhX+TisjRDswDz0YWDk3XxsaWzk2WBg9DzI8QyErKzx1JRQ0OTobKwAAAAUAPv+3Ay4DNgALAB8ALQA9AEkAAAEVIxEzFTM1MxEjNSUUDgIjIi4CNTQ+AjMyHgIFFBYzMjY1NCYjIg4CATIWFRQGIyIuAjU0PgITMjY1NCYjIgYVFBYCaU5Ock9P/vsfNkssLEs2Hx82SywsSzYf/rJJOTlISDkcMCIUAXqMoKCMRW9OKSlOb0VndHRnZ3NzAgfTAfHb7P3g8RsuTjgfHzhOLi9NOB8fOE0vP09PPz9QFSY0/r1WTk5WFio9Jyc9Khb++DQwMDQ0MDA0AAADAEL/tgN2AzYACwAfADMAAAEjFTMVIxEjETMVMyUyHgIVFA4CIyIuAjU0PgITMj4CNTQuAiMiDgIVFB4CA3aPj49SUo/9rjJSPCEhPFIyMlM8ISE8UzIgNicWFic2ICE2JxYWJzYCEcdE/rADgOGdLFF0R0h0UiwsUnRIR3RRLP3XIj9ZNzZYPiIiPlg2N1k/IgAABABG/7YDcAM2AAsAHwAzADkAAAEjFTMVIxUjETMVMwUUDgIjIi4CNTQ+AjMyHgIFFB4CMzI+AjU0LgIjIg4CEzUhESM1A3CDg4NSUoP+qiM/VTMzVj4jIz5WMzNVPyP+fBcpOCIhOSkXFyk5ISI4KRcQAkdSAmp8Q4kCFIiBL044Hx84Ti8vTjgfHzhOLx81JhUVJjUfIDUlFRUlNf5oQ/6+/wAEAEb/ygNxAzcACwAfADMAOQAAASMVMxUjFSMRMxUzBRQOAiMiLgI1ND4CMzIeAgUUHgIzMj4CNTQuAiMiDgITFSEVIREDcYSEhFJShP6pIz9WMjJWPyMjP1YyMlY/I/58Fyo4ISE4KhcXKjghITgqF3sCBP2qAlGYRNIClKN5MVE7ICA7UTExUTsgIDtRMSE3KBYWKDchITcoFhYoN/6q2UMBHAAAAAAEAEb/wgNxAzcACwAfADMAPwAAASMVMxUjFSMRMxUzBRQOAiMiLgI1ND4CMzIeAgUUHgIzMj4CNTQuAiMiDgITFSEVITUhNSE1IRUDcYSEhFJShP6kIz1VMzJVPSMjPVUyM1U9I/6BFyg3ISE4KBcXKDghITcoF3ACCP2oAeb+FwI6AohlQnMByW16LEo1Hh41SiwsSTUdHTVJLB0xJBQUJDEdHTEjFBQjMf37ZELjXkHcAAAGAEb/wgNxAzYACwAfADMAOwBPAFMAAAEjFTMVIxUjETMVMwUUDgIjIi4CNTQ+AjMyHgIFFB4CMzI+AjU0LgIjIg4CATUzESERMxUFFTI+AjcXDgIrATUzNSM1IRUFNSMVA3GEhIRSUoT+pCM9VTIzVT0jIz1VMzJVPSP+gRcoOCEhNygXFyg3ISE4KBcCDUr+5Ev+tyI5NDEbCB85PCJ8x8oBGgEIhwKHZ0J+AdZugy1LNh0dNkstLUs1Hh41Sy0eMiQUFCQyHh4yJBQUJDL+XnX+jAF0dWFgAQQGBT4GBwPZVD7NXoKCAAAAAAUARv/CA3ADNgALAB8AMwA3ADsAAAEjFTMVIxUjETMVMwUUDgIjIi4CNTQ+AjMyHgIFFB4CMzI+AjU0LgIjIg4CExEhEQEVITUDcIODg1JSg/6qIz9WMzNVPiMjPlUzM1Y/I/58Fyg5ISI5KRcXKTkiITkoFyQCM/4dAZICc4BEfwIGf4kuTjgfHzhOLi9ONx8fN04vHzQmFRUmNB8gNSUVFSU1/XQBQ/69AQLAwAAABQBH/8IDcAM2AAsAHwAxADkAPQAAASMVMxUjFSMRMxUzBRQOAiMiLgI1ND4CMzIeAgUUHgIzMj4CNTQmIyIOAgE1MxEhETMVBTUhFQNwg4ODUlKD/qkjPlYzM1U9IyM9VTMzVj4j/n0XKDkhIjgpF1VFITkoFwIGUf3LUQGT/m0CgXREeAHlcYsuTDceHjdMLi5MNx4eN0wuHjMlFRUlMx4/TBQlM/5eb/6cAWRvsnJyAAAABABG/7oDcQM3AAsAHwAzAEwAAAEjFTMVIxUjETMVMwUUDgIjIi4CNTQ+AjMyHgIFFB4CMzI+AjU0LgIjIg4CARUUHgIXBy4DJw4DByc+Az0BA3GEhIRSUoT+qSM/VTMzVj4jIz5WMzNVPyP+fBcpOCIhOSkXFyk5ISI4KRcBcTBTbDwhMl1QPxQUQFBeMiE8bVIxAmSSQ6wCVI+EL084Hx84Ty8vTjkfHzlOLyA1JRUVJTUgIDUmFRUmNf7KGzBSQCwKQQkiMj8mJj8yIglBCixAUjAbAAAABQBG/7cDcAM2AAsAHwAzAEcAUwAAASMVMxUjFSMRMxUzBRQOAiMiLgI1ND4CMzIeAgUUHgIzMj4CNTQuAiMiDgIBMh4CFRQOAiMiLgI1ND4CEzI2NTQmIyIGFRQWA3CDg4NSUoP+qiM/VTMzVj4jIz5WMzNVPyP+fBcpOCIhOSkXFyk5ISI4KRcBOkRtTSkpTW1ERG5NKSlNbkRkcXFkZHJyAm58RIsCE4WCL044Hx84Ti8vTTcfHzdNLx81JhUVJjUfIDQlFRUlNP64Fis+KSg+KxcXKz4oKT4rFv7xNzAxNjYxMDcAAAQAR//CA3ADNgALAB8AMwA/AAABIxUzFSMVIxEzFTMFFA4CIyIuAjU0PgIzMh4CBRQeAjMyPgI1NC4CIyIOAhMVIRUhESEVIRUhFQNwg4ODUlKD/qkjPlYzM1U9IyM9VTMzVj4j/n0XKDkhIjgpFxcpOCIhOSgXdgH6/bUCOP4ZAdwCgXBCegHhc4QtSzYdHTZLLS5LNh4eNksuHjIjFBQjMh4eMyUUFCUz/ftZPQFjPVU7AAYARv+0A3ADNgALAB8AMwA7AEcAUwAAASMVMxUjFSMRMxUzBRQOAiMiLgI1ND4CMzIeAgUUHgIzMj4CNTQuAiMiDgIFFSEVITUhNRcyFhUUBiMiJjU0NhcyNjU0JiMiBhUUFgNwg4ODUlKD/qUjPVUyM1U9IyM9VTMyVT0j/oEXKDghITcoFxcoNyEhOCgXAW0BD/2PARApdoODdnaDg3ZRV1dRT1lZAoJsQnYB2HJyLEk0HR00SSwsSDQdHTRILB0xIxQUIzEdHTAjFBQjMPhVQEBVvkM/QENDQD9DySQjIiUlIiMkAAAEAED/tgMvAzcACwAfACsALwAAATMRIxEjESMRMxUzJTIeAhUUDgIjIi4CNTQ+AhMyNjU0JiMiBhUUFiUzNSMC4U5OeU1Nef4eLEcyGxsyRywrRzIbGzJHKzY+PjY2Pj4Bn3l5Azf8fwFR/tsDQc2WLFFzSEh0USwsUXRISHNRLP3bfXBwfHxwcH2FxQAAAAAFAD7/ygNEAzcACwAfADEANQA7AAABFSMRMxUzNTMRIzUlFA4CIyIuAjU0PgIzMh4CBRQeAjMyPgI1NCYjIg4CJSMVMwEhFSERMwJpTU1yT0/++x82SywsSzYfHzZLLCxLNh/+shQiMBwcLyMTSDkfMSERAlNycv5YAhH9nVIBecUCcoqb/V3lnTBQOSAgOVAwMFE5ICA5UTAgNicWFic2IEJSGCk2JZv+UEMBIgAAAAUAPv/CA0wDNgALAB8ALwAzAD8AAAEVIxEzFTM1MxEjNSUUDgIjIi4CNTQ+AjMyHgIFFBYzMjY1NC4CIyIOAiUjFTMBIRUhNSE1ITUhFSECaU5Ock9P/vsfNkssLUs2Hh42Sy0sSzYf/rJJOTlIEyMvHBwwIxMCU3Jy/lICH/2QAfz+AgJQ/gMB2G4Bu2R1/it3cCxJNB0dNEksLEg0HR00SCw6S0k8HTAjFBQjMBpl/epC4FZB1QAGAD7/wgMqAzYACwAfAC0AMQA5AD0AAAEzESM1IxUjETMVMwUUDgIjIi4CNTQ+AjMyHgIFFB4CMzI2NTQmIyIGBTM1IxM1MxEhETMVBTUhFQLbT09yTk5y/vsfNkssLUs2Hh42Sy0sSzYf/rIUIjAcOUhIOTxGAeFycnBR/bNSAar+VgM2/hh0bQHQa38tSzYeHjZLLS1KNh0dNkotHjIlFE08PExOcHL+Q2z+nAFkbLV0dAAFAD//rQNxAzYACwAfACsALwBTAAABFSMRMxUzNTMRIzUFIi4CNTQ+AjMyHgIVFA4CAyIGFRQWMzI2NTQmBSMVMwcVFB4CFwcuAScOAQcuAScOAQcnPgM9ATMVFBYXPgE9AQJmTU13Tk7+LyxLNx8fN0ssLUs2Hx82Sy03R0c3OEdGAZh3dyYZMEUsKkJcGRRPPz9OFBlaQissRS8ZTzo/PTwBrHsB9G5//faASR42TC4uSzYeHjZLLi5MNh4BVUs8PEtLPDxLRYLjNCNFPTAOPBdVOTpeGxpeOTdVFzwOMD1FIzQyP3YnJ3g9MgAAAAAGAD//twM1AzcACwAfACsALwA7AEcAAAEVIxEzFTM1MxEjNSUUDgIjIi4CNTQ+AjMyHgIFFBYzMjY1NCYjIgYlIxUzBzIWFRQGIyImNTQ2EzI2NTQmIyIGFRQWAmZNTXdOTv78HzZLLSxLNx8fN0ssLUs2H/61Rzc4R0Y5N0cCT3d35JikpJiYpaeWbXp6bXB4eAGxfAHxcoP935uALkw2Hh42TC4uSzYeHjZLLjxLSzw8S0sDeuZXVVVYWFVVV/7qNzMzNjYzMzcAAAACAEX/tAMYAzcAGgAuAAABMxEjESMOAyMiLgI1ND4CMzIeAhczATI+AjU0LgIjIg4CFRQeAgLGUlLDAyM6Ty8xUjwhITxSMS1NOyQFw/5fIDUnFRUnNSAgNicVFSc2Azf8fQHqQmpKKCxSc0hIc1IsJkdlP/7oIj9YNzZZPiIiPlk2N1g/IgAAAwBD/7UDGAM2ABoALgA0AAABMxEjNSMOAyMiLgI1ND4CMzIeAhczBTI+AjU0LgIjIg4CFRQeAgc1IREjNQLFU1O3BiY8Ti4yVT0jIz1VMi1OPCYGuP5lITgpFxcpOCEhOCkXFyk4SQJYUwM2/fDnKUQwGyA5UDAvTzkgGjBCKbUWJzYgIDUmFhYmNSAgNicW6UL+wf0AAAADAEP/ygMxAzcAGgAuADQAAAEjDgMjIi4CNTQ+AjMyHgIXMzUzESMBFB4CMzI+AjU0LgIjIg4CEyEVIREzAsW3Bic8Ti0xVT4jIz5VMS1PPCcGtlNT/cwXKTghITgpFxcpOCEhOCkXnAIE/alTAfspRTEbITpSMDFSPCEcM0Yr+f1rAXwhNycWFic3ISE4KRYWKTj9zkMBGgAAAAAEAEP/uQNDAzYAGgAsAEUAVAAAASMOAyMiLgI1ND4CMzIeAhczNTMRIyUUHgIzMj4CNTQmIyIOAgEVFB4CFwcuAScOAQcnPgM9ASM1IRUFFw4DKwERMxU+AwLFtwYmPE4vMlQ+IiI+VDIuTjwmBrhTU/3MFyg4ISA3KhhURSE4KBcCChYqPyknP1MWFlM/Jyk+KxaUAXj+bRobQEI9GC1QFDExLgIUJ0EuGR43TC4vTDceGS0/J97+GOYfMyUUEiQ0IT9NFSUz/osPIUE5Lw89F1E0NFEXPQ8vOUEhD0JCmj8QFQwEATr2AQYMEQAAAAADAEP/wgMrAzYAGgAuADYAAAEjDgMjIi4CNTQ+AjMyHgIXMzUzESMBFB4CMzI+AjU0LgIjIg4CEyEVIREhFSECxbgGJjxOLTJVPSMjPVUyLU47Jwa4U1P9zBcpOCEhOCkXFyk4ISE4KReUAgb9qQJJ/ggCEShDMBofOU8wL005HxovQSjh/f0BACA1JxUVJzUgHzQmFRUmNP2yQgE/QgAAAwBD/8IDOQM2ABoALgA6AAABIw4DIyIuAjU0PgIzMh4CFzM1MxEjJRQeAjMyPgI1NC4CIyIOAhMhFSE1ITUhNSEVIQLFtgYoPE4tMlU9IyM9VTItTjwnBrdSUv3MFyk4ISE4KRcXKTghITgpF5cCEf2eAe/+DwJC/hECLSc/LRkeNkstLUs1HhgtPibH/jjfHjIlFBQlMh4eMiQUFCQy/ZhB4FpB2AAABABD/7MDGAM3ABoALgBDAEkAAAEzESM1Iw4DIyIuAjU0PgIzMh4CFzMFMj4CNTQuAiMiDgIVFB4CAxUyPgI3Fw4DKwE1MzUjNSEVNzUhESMRAsVTU7cGJjxOLjJVPSMjPVUyLU08Jwa4/mUhNykXFyk3ISE4KRcXKTgVL0xCPSAJJEJKVTY32dsBKisBH1IDN/4gzidBLhkeN0wuLkw3HxkuPyevFSU0Hh40JRUVJTQeHjQlFf6kYgIECAY+BwgEAd1YPtORQv6DATsABQBD/7wDGAM3ABoALgBDAEcASwAAATMRIzUjDgMjIi4CNTQ+AjMyHgIXMwUyPgI1NC4CIyIOAhUUHgIDFTI+AjcXDgMrATUzNSM1IRUXESERAxUzNQLFU1O3Bic8Ti0yVT0jIz1VMi1OOycGuP5lITgpFxcpOCEhOCkXFyk4FyQ8NjMbCCA6PUctMNHTASI2AR/XjgM3/irIJ0AuGR43TC0tSzYeGC0/JqwUJTMeHjIkFRUkMh4eMyUU/qRlAQMGBT8FBgMB4VU/0acBeP6IATr9/QAEAEP/wgMYAzYAGgAuADIANgAAATMRIzUjDgMjIi4CNTQ+AjMyHgIXMwUyPgI1NC4CIyIOAhUUHgIDESERARUhNQLFU1O3BiY8Ti4yVT0jIz1VMi1NPCcGuP5lITgoFxcoOCEhOSgXFyg5OAJH/gkBpwM2/f3eKUMvGh84TjAvTTcfGS5AJ7QVJjUgHzQlFRUlNB8gNSYV/iEBQ/69AQLAwAAAAAQAQ//CAxgDNgAYACwANAA4AAABMxEjNSMOASMiLgI1ND4CMzIeAhczBTI+AjU0LgIjIg4CFRQeAgU1MxEhETMVBTUhFQLFU1O2DHteMlU9IyM9VTItTjwnBrf+ZSE5KBcXKDkhITkoFxcoOQG9Uv3CUQGb/mUDNv4fyVFfHjdNLi5MNx4ZLT8nrxUlMx8fMyUUFCUzHx8zJRX6cf6ZAWdxtHR0AAAAAAUAQ/+6A3MDNgAaAC4AQwBLAE8AAAEjDgMjIi4CNTQ+AjMyHgIXMzUzESMlMj4CNTQuAiMiDgIVFB4CBRUUHgIXBy4BJw4BByc+Az0BBzUzESERMxUXNSMVAsW3BiY7Ti8yVT0jIz1VMi1OPCcGt1NT/mUhOSgXFyg5ISE5KBcXKDkBxxUpPSgpPVEUFk88Kig9KRX6TP7JTZ6eAiEnQS4ZHjdMLi5MNh4YLT8n0v4mWhUlMx4eMyUUFCUzHh4zJRWHTCRGPjMQPhpWOTdYGj4RND5GIkx3cf6ZAWdxtnl5AAAAAAMAQ/+6A04DNwAaAC4ARwAAASMOAyMiLgI1ND4CMzIeAhczNTMRIwEUHgIzMj4CNTQuAiMiDgIBFRQeAhcHLgMnDgMHJz4DPQECxbcGJzxOLTJVPSMjPVUyLU88Jwa2U1P9zBcpOCEhNykXFyk3ISE4KRcBkDFTbTwgM19RQBQUQVFfMiE8bVMyAf4pQzAaIDlQLzBROSAbMEQq9v2ZAVAfNicWFic2HyE2KBYWKDb+1SMuUkEtCkEJIzNAJyZBMyMJQQovQVEtIwAAAAMARP+5A2sDNgAaAC4AVAAAASMOAyMiLgI1ND4CMzIeAhczNTMRIwEiDgIVFB4CMzI+AjU0LgIBFRQeAhcHLgEnDgEHLgEnDgEHJz4DPQEzFRQWFz4DPQECxbgGJjxOLjFUPiIiPlQxLU47Jwa5U1P+ZCA3KBcXKDcgITgoFxcoOAFsGC9DKylCXBcVUT9CURQYWj8pKkMvGE8+PyAwIA8CEyhCLxofN04vLk03HxkuQCfg/gIBiBUlNB8fNSYVFSY1Hx80JRX+VTUjRDwwDz0ZWDk3YBsaXDk2WBk9EDI8QyE1NTx2JRQ1OTsaNQAAAAQAQ/+3AxsDNgAaAC4AQgBOAAABIw4DIyIuAjU0PgIzMh4CFzM1MxEjARQeAjMyPgI1NC4CIyIOAgEyHgIVFA4CIyIuAjU0PgITMjY1NCYjIgYVFBYCxbYGJzxOLjJVPSMjPVUyLU48Jwa3U1P9zBcpOCEhOCkXFyk4ISE4KRcBX0VvTSoqTW9FRW9NKipNb0Vnc3NnZ3NzAg8oQzAaHzhPLy9NNx8ZLkEn5P3vAQogNSYVFSY1ICAzJhQUJjP+wBcsQCkpQCwXFyxAKSlALBf+6TgzMzk5MzM4AAADAEP/uQNFAzYAGgAuAEkAAAEjDgMjIi4CNTQ+AjMyHgIXMzUzESMlFB4CMzI+AjU0LgIjIg4CASMeAxcHLgMnDgMHJz4DNyM1IQLFtwYmO04vMlU9IyM9VTItTjwmBrhTU/3MFyg5ISE5KBcXKDkhITkoFwKT/QIwTmY4HjFcTj0TEz1OWzIdOGZOLwL6Ak0CEydBLhkeN0wuLkw3HhktPyfg/f/+HzMlFBQlMx8fMyUUFCUz/nElQjYmCT4IHyw5ISE5LB8IPggmNkMlQgAAAwBD/7UDGAM2ABoALgA4AAABMxEjNSMOAyMiLgI1ND4CMzIeAhczBTI+AjU0LgIjIg4CFRQeAgc1IREjNQUnJTUCxVNTtwYmO04vMlU9IyM9VTItTjwmBrj+ZSE4KRcXKTghITkoFxcoOUsCWlL96wgCHQM2/gLdKEEvGh83Ti4vTTgeGS5AKLAUJjQfIDQlFRUlNCAfNCYU20P+pYkaQRZSAAAEAEP/xAMqAzYAGgAuADoAPgAAASMOAyMiLgI1ND4CMzIeAhczNTMRIyUUHgIzMj4CNTQuAiMiDgIBMxUhNTM1IzUhFSMhFTM1AsW3BSY8Ty8yVD4iIj5UMilMPSsHuFNT/cwXKDghITkoFxcoOSEhOCgXAg2M/ZGIfwJbgf72uQIWKEIvGh43TS4vTDceFSpAK93+CPUfNCUUFCU0Hx8zJRUVJTP9tEJCzEJCzMwAAAMAQP+2Ay8DNwADAB4ALAAAATMRIwMRMxEjESMOAyMiLgI1ND4CMzIeAhcDMjY1NC4CIyIGFRQWAuFOTrJOTnEDHTFEKSxHMhsbMkcsKUIxHgS+Nj4RHisaNj8/Azf8fwIkAUn8vwG1QmlKJyxRdElIc1ErJkdmP/7tfnA2Vz0hfm1wfgAAAAAEAD7/tQMqAzcAAwAeADIAOAAAATMRIycjDgMjIi4CNTQ+AjMyHgIXMzUzESMBFB4CMzI+AjU0LgIjIg4CEzUhESM1AttPT6leBiI1RCksSzYfHzZLLChFNiIFXk1N/lUUIjEcHDAiFBQiMBwcMSIUSAJbUgM3/efpKEIvGh84Ty8wTjkfGjBCKdv+AAEEHzUmFhYmNR8gNScVFSc1/mlC/sH9AAQAPv/KA0QDNgADAB4ALgA0AAABESMRAyMOAyMiLgI1ND4CMzIeAhczNTMRIwEUHgIzMj4CNTQmIyIGEyEVIREzAypPqV4FIjVFKSxLNh8fNkssKUU1IgVeTU3+VRQjMBwcMCIUSTk5SqwCEf2dUgM2/WICnv6+KUQwGiA5UTAwUDogGzFFKe79jQFlIDcnFhYnNyBCUVH9tEMBJAAAAAAEAD7/wgNMAzYAAwAcACoANgAAAREjEQMjDgMjIi4CNTQ+AjMyFhczNTMRIyUUFjMyNjU0LgIjIgYTIRUhNSE1ITUhFSEDKk+pXgUiNUUpLUs2Hh42Sy1ObwxfTU3+VUo5OUkUIjAcOUqmAh/9kAH8/gICUP4DAzb+LgHS/vIlPisYHTVJLCxIMx1UT7r+Rt88Sko8HTAiFEr9gkLgV0HWAAAAAAUAPv/CAyoDNgADAB4AMgA2ADoAAAEzESMnIw4DIyIuAjU0PgIzMh4CFzM1MxEjJRQeAjMyPgI1NC4CIyIOAhMRIRElFSE1AttPT6leBSI1RSktSzYeHjZLLSlFNSIFXk1N/lUUIjEcHzAhEhQiMBwcMSIUVgJN/gMBrQM2/frfKEAuGR43TS8uTDceGS5AJ9L+FfgfNCYVFic0HR4zJRUVJTP9cwFA/sD/vb0AAAAABQA+/8IDKgM2AAMAHAAqADIANgAAATMRIycjDgMjIi4CNTQ+AjMyFhczNTMRIyUUFjMyPgI1NCYjIgYBNTMRIREzFQU1IRUC209PqV4FITVGKS1LNh4eNkstUG0MX01N/lVKORwwIhRGPDlKAlJR/bNSAar+VgM2/hLVJ0AuGR42Sy0tSjYdWkvD/i3rPE0UJTIeOk5M/kNs/pwBZGy1dHQAAAAEAD7/ugNYAzYAAwAeAC4ARwAAAREjEQMjDgMjIi4CNTQ+AjMyHgIXMzUzESMlFBYzMjY1NC4CIyIOAgEVFB4CFwcuAycOAwcnPgM9AQMqTqpeBiI1RCksSzYfHzZLLChFNiIFXk1N/lVKOTlJFCIwHBwxIhQBoTNUbjsfMl9SQhUVQlFfMx46bVQzAzb9pAJc/ssoQi8aHzlOLzBOOR8aMEIp3/4M9EBQUEAgNScWFic1/sMeK08/LAlACSIxPiUlPzAiCUAJLD9PKx4AAAAABQA+/7cDLgM2AAMAHAAqAD4ASgAAAREjEQMjDgMjIi4CNTQ+AjMyFhczNTMRIyUUFjMyNjU0LgIjIgYBMh4CFRQOAiMiLgI1ND4CEzI2NTQmIyIGFRQWAypOql4GIjVEKSxLNh8fNkssUW0MXk1N/lVKOTlJFCIwHDlKAXtFb04qKk5vRUVvTSoqTW9FZ3R0Z2dzcwM2/dkCJ/7KJ0IuGh84Ti4vTTgfYFHg/gvzP09PPyA0JhVQ/p4WKj0nJz0qFhYqPScnPSoW/vg0MDA0NDAwNAADAEX/tAMYAzcAFgAqADIAAAEzESMRIw4BIyIuAjU0PgIzMhYXMwEyPgI1NC4CIyIOAhUUHgI3MzUjHgEVFALGUlLgHGNCMVI8ISE8UjE/Xx3m/l8gNScWFic1ICA2JxUVJzb1zM8GBwM3/H0BXEVLLFJzSEhzUixFP/5bIj9YNzZZPiIiPlk2N1g/IorYGjkfPwAABABD/7UDGAM3ABYAKgAxADcAAAE3ESM1Iw4BIyIuAjU0PgIzMhYXMwEyPgI1NC4CIyIOAhUUHgI3MzUjFhUUATUhESM1AsVTU+MgXTwxVT0jIz1VMTxeIOL+ZCE4KRcXKTghITcpFxcpN/6/vwr+sAJYUwM2Af3vgSYsIDpPMC9POSAsJv7oFic2ICA1JhYWJjUgIDYnFk+HGygp/q1D/sD9AAAFAEP/tgMYAzcAFgAqADEANwA9AAABMxEjNSMOASMiLgI1ND4CMzIWFzMBMj4CNTQuAiMiDgIVFB4CNzM1IxYVFAE1IREjETM1IREjEQLFU1PjH186MlU9IyM9VTI5YB/j/mQhOSgXFyg5ISE3KRcXKTf9wMAL/poBJVJ8AR9TAzf99IEmKyA5Ty4vTzkgKyb+6RYmNh8gNScVFSc1IB82JhZOhiYdHf6rQv61AQlC/rUBCQAEAEP/ygMxAzYAFgAqADEANwAAASMOASMiLgI1ND4CMzIWFzM1MxEjARQeAjMyPgI1NC4CIyIOAiUjFhUUBzMBIRUhETMCxeMgXjoxVT4jIz5VMTpdIORTU/3MFyk4ISE3KRcXKTchITgpFwI0wQwMwf5oAgT9qVMBkSgtITxTMTJSPCEtJ4z9agF9ITkoFxcoOSEhOSgXFyg5KiIpJyP+OkMBGgAAAAAEAEP/wgM5AzcAFgAqADEAPQAAASMOASMiLgI1ND4CMzIWFzM1MxEjJRQeAjMyPgI1NC4CIyIOAiUjFhUUBzMBIRUhNSE1ITUhFSECxd8gXjkuVUInIz1VMjxeH+JSUv3MFyg5ISE4KBcXKDghITkoFwI0vgkIvf5jAhH9ngHv/g8CQv4RAdEmKhozTDItSzYeKSRs/jThHjIlFBQlMh4eMyQUFCQzIBwiGCL98UHhWUHYAAAGAEP/wgMYAzcAFgAqADEARgBKAE4AAAEzESM1Iw4BIyIuAjU0PgIzMhYXMwEyPgI1NC4CIyIOAhUUHgI3MzUjFhUUARUyPgI3Fw4DKwE1MzUjNSEVFxEhEQMVMzUCxVNT4h9ePDJVPSMjPVUyPGAe4f5kITkoFxcoOSEhNykXFyk3/r++Cf7iJDw2MxsIIDo+Ri0w0dMBIjYBH9eOAzf+KmgkKh43Sy0uSzYeKiX++RQlMh4eMyQVFSQzHh4yJRRLexwhJ/5GZgEDBgU/BQYDAeFWPtClAXX+iwE4+voAAAYAQ//CAxgDNgAWACoAMQA5AE4AUgAAASMOASMiLgI1ND4CMzIWFzM1MxEjJRQeAjMyPgI1NC4CIyIOAiUjFhUUBzMXMxEhETMVMwUVMj4CNxcOAysBNTM1IzUhFQU1IxUCxeIfXDkuVkEnIj5UMjxfIOFSUv3MFyk3ISE5KBcXKDkhITcpFwI0vgkKvwhL/uBLiv4lJDw2MxsHIDk+Ri0w0dMBIgEKigHMJSgaM0wzLUs2Hiklbf4x5B4yJRQUJTIeHjIlFBQlMh8cIScXzv6DAX14YmQBAwYFPwUGAwHfVj7QY4iIAAAFAEP/wgMYAzcAFgAqADEANQA5AAABNxEjNSMOASMiLgI1ND4CMzIWFzMBMj4CNTQuAiMiDgIVFB4CNzM1IxYVFAERIREBFSE1AsVTU+QgXjkyVT0jIz1VMjleH+X+ZSE4KBcXKDghITgpFxcpOPzAwAv+wQJH/gkBpwM2Af38eCUqHzlOLy5NOB8pI/7qFSc1Hx80JRUVJTQfHzUnFUyHJh0e/a8BQ/69AQLAwAAAAAUAQ//CAxgDNgAWACoAMQA5AD0AAAEzESM1Iw4BIyIuAjU0PgIzMhYXMwEyPgI1NC4CIyIOAhUUHgI3MzUjFhUUEzUzESERMxUFNSEVAsVTU+gfWzkyVT0jIz1VMjlcH+f+ZSE4KBcXKDghITgpFxcpOPzAwAu2Uv3CUQGb/mUDNv4fYSMmHjdNLi9MOB4nI/7tFSU0Hh80JRUVJTQfHjQlFUiIJh4e/plx/pkBZ3G0dHQAAAYAQ/+6A3MDNgAWACoAMQBGAE4AUgAAASMOASMiLgI1ND4CMzIWFzM1MxEjJTI+AjU0LgIjIg4CFRQeAiUjFhUUBzMXFRQeAhcHLgEnDgEHJz4DPQEHNTMRIREzFRc1IxUCxeUfXjoyVD4iIj5UMjldH+dTU/5kITkoFxcoOSEhNykXFyk3Ab3ACwvACxUpPSgpPVEUFlA8Kig9KhX6TP7JTZ6eAb4jKR43TC4uTDceJiNv/h1jFSUzHh4zJRUVJTMeHjMlFc8mHR4k0UskRz8yDz8aVjk3WBo/ETQ+RiJLd3H+mQFncbZ5eQAABABD/7sDTgM2ABYAKgAxAEoAAAEjDgEjIi4CNTQ+AjMyFhczNTMRIwEUHgIzMj4CNTQuAiMiDgIlIxYVFAczBxUUHgIXBy4DJw4DByc+Az0BAsXkH108MVU9IyM9VTE6XyDjU1P9zBcpNyEhOCkXFyk4ISE3KRcCNMALC8CkMVNtPCAzX1FAFBRBUV4zITxtUzIBlyYrIDpQMDBQOiAsJo79mAFSIDcnFhYnNyAgNycWFic3JicfICfDIi9SQS0KQAkjMkAnJkEyIwlACi5BUi4iAAAEAET/uQNrAzYAFgAqADEAVwAAASMOASMiLgI1ND4CMzIWFzM1MxEjASIOAhUUHgIzMj4CNTQuAgUjFhUUBzMHFRQeAhcHLgEnDgEHLgEnDgEHJz4DPQEzFRQWFz4DPQECxeQgXjoxVD4iIj5UMTldH+dTU/5kITcoFxcoNyEhOCgXFyg4AXvBCwrADxkuQyspQlwXFVE/QlEUGFo/KSpDLxhPPj8gMCAPAa4lKh85Ti4vTTgfKSN8/gIBiRUmNB8fNSYVFSY1Hx80JhVKJh4oGtY7I0U8MA89GVg5N2AaGVw5NlgZPRAyPUMhOzs9diUUNTk7GzsAAAUAQ/+3AxsDNwAWACoAMQBFAFEAAAEjDgEjIi4CNTQ+AjMyFhczNTMRIwEUHgIzMj4CNTQuAiMiDgIlIxYVFAczBzIeAhUUDgIjIi4CNTQ+AhMyNjU0JiMiBhUUFgLF5h9dOTJVPSMjPVUyOV0f5lNT/cwXKTghITgoFxcoOCEhOCkXAjTACwzB1kVvTioqTm9FRW5OKSlObkVndHRnZ3JyAaQkKR85Ty8vTjgfKCOB/e0BCR81JxUVJzUfIDQmFRUmNCYmICUh2BcsQCkpQCwXFyxAKSlALBf+6TgzMzk5MzM4AAQAOv/AAyoDNgAXACkAMAA8AAABNQ4BIyIuAjU0PgIzMhYXMzUzESM1JRQeAjMyPgI1NCYjIg4CJSMWFRQHMwEhFSERIRUhFSEVIQHOH1k2MlU9IiI9VTI/Yh7fU1P9zhYoNiAgNycWUkIgNigWAjK+BhPL/lUCF/2WAlj9+wH7/gUBtRAfIh42Si0tSjYdLSdx/i5Rmh0xIxMTIzEdPEgTIzAVGBsyJf4GPgFxPls9AAAAAAUAQ//EAyoDNgAWACoAMQA9AEEAAAEjDgEjIi4CNTQ+AjMyFhczNTMRIyUUHgIzMj4CNTQuAiMiDgIlIxYVFAczAzMVITUzNSM1IRUjIRUzNQLF5x9dOTJUPiIiPlQyOV0e6FNT/cwXKDghITkoFxcoOSEhOCgXAjTBDAzBJ4z9kYh/AluB/va5AawjJh43TS4vTDceJiJ7/gj1HzMlFRUlMx8fMyUVFSUzJx8nJSD+GEJCzEJCzMwAAAAABgBD/7cDKwM2ABYAKgAxADkARQBRAAABIw4BIyIuAjU0PgIzMhYXMzUzESMlFB4CMzI+AjU0LgIjIg4CJSMWFRQHMwchFSE1ITUzBzIWFRQGIyImNTQ2FzI2NTQmIyIGFRQWAsXiH188MlQ+IiI+VDI6XiDkUlL9zBcpNyEhOSgXFyg5ISE3KRcCNL8KCb6sARL9iQETUil2hIR2doSEdk9aWk9RWFgB0iMpHTVKLS1KNR0nI2j+JvMdMSQUFCQxHR4xJBQUJDEgFyYgHe9AQFa8REA/REQ/QETLJSIjJSUjIiUABABA/7YDLwM3AAMAGgAmAC8AAAEzESMDNTMRIxEjDgEjIi4CNTQ+AjMyFhcDMjY1NCYjIgYVFBY3MzUjHgEVFAYC4U5OsE5OixhTPCtHMhsbMkcrPFQXpzY/PzY2Pz/uenoEBAQDN/x/AqjF/L8BJ0VJLFF0SEhzUSxJRf5pfXBtf39tcH2GzhgyHR0yAAAABQA+/8oDRAM2AAMAGgAuADUAOwAAAREjEQMjDgEjIi4CNTQ+AjMyFhczNTMRIwEUHgIzMj4CNTQuAiMiDgIlIxYVFAczASEVIREzAypPp4scUDMsSzYfHzZLLDFQHI1NTf5TFCMwHBwvIxQUIy8cHDAjFAGtagwLaf7/AhH9nVIDNv1iAp7+UyQoIDlRMDBQOiAnI379jQFlITYnFhYnNiEgNicWFic2LiQqIin+QUMBJQAABQA8/8ADOAM3AAMAGgAmAC0ANQAAAREjEQMjDgEjIi4CNTQ+AjMyFhczNTMRIwEUFjMyNjU0JiMiBiUjFhUUBzMBIRUhESEVIQMsUKGSHFEzLEs3Hx83SywzUxyQTk7+UEY4N0dHNzhGAbBuCQpv/uUCGP2VAmX97gM3/fUCC/5zIiYeN0wuLkw3HicjcP4GAQU8TEw8PExMBh4kKRv+F0QBPEQAAAAABQA+/8IDTAM2AAMAGgAuADUAQQAAAREjEQMjDgEjIi4CNTQ+AjMyFhczNTMRIyUUHgIzMj4CNTQuAiMiDgIlIxYVFAczASEVITUhNSE1IRUhAypPp4sbUjMtSjYeHjZKLTNSHIpNTf5TFCIwHBwwIhQUIjAcHDAiFAGtaQkJaf75Ah/9kAH8/gICUP4DAzb+LwHR/pMhJh00SSwsSTQdJiFd/kbeHTEjFBQjMR0dMSMUFCMxIRwiIR39+kLgV0HWAAAAAAYAPv/CAyoDNgADABoAKgAxADUAOQAAATMRIycjDgEjIi4CNTQ+AjMyFhczNTMRIyUUFjMyNjU0LgIjIg4CJSMWFRQHMwERIRElFSE1AttPT6ePG1AxLEs2Hh42SywxUBuPTU3+U0k5OUkUIjAcHDAiFAGtawsLa/6pAk3+AwGtAzb9+XYgJR43TS4vTDceJSFq/hX3P05OPx40JRUVJTQpJyAiJ/3bAUD+wP+9vQAABgA+/8IDKgM2AAMAGgAqADEAOQA9AAABMxEjJyMOASMiLgI1ND4CMzIWFzM1MxEjJRQeAjMyPgI1NCYjIgYlIxYVFAczEzUzESERMxUFNSEVAttPT6ePG1AxLUo2Hh42Si0xUBuPTU3+UxQiMBwcMCIURjw8RgGtagoLa6VR/bNSAar+VgM2/hJqICMeNkstLUo2HSMgYf4t6x4yJRQUJTIeOk5OChsqHyb+xWz+nAFkbLV0dAAAAAUAPv+5A1gDNgADABoAKgAxAEoAAAERIxEDIw4BIyIuAjU0PgIzMhYXMzUzESMlFBYzMjY1NC4CIyIOAiUjFhUUBzMHFRQeAhcHLgMnDgMHJz4DPQEDKk6ojBxOMC9NNh4eNkssM1QciE1N/lNJOTlJFCIwHBwwIhQBrWkJCmoMM1RuOx8yX1JCFRVCUV8zHjptVDMDNv2jAl3+ZCQoHzlOLy9POR8qJnr+C/VAUFBAIDUnFhYnNSQfJSke1x4rTz8sCUAJIjE+JSU/MCIJQAksP08rHgAAAAUAPv+5A3ADNgADABoAKgAxAFcAAAERIxEDIw4BIyIuAjU0PgIzMhYXMzUzESMBIg4CFRQWMzI2NTQuAgUjFhUUBzMXFRQeAhcHLgEnDgEHLgEnDgEHJz4DPQEzFRQWFz4DPQEDKk+nixxQMy1LNh4eNkstMVEcjE1N/tYcMSIUSjk5SRQiMAEOaQsLaYgYL0MqKENbFxVRP0JRFBhbQCgrQy8YTz4/IDAfEAM2/f4CAv5xIiUeN00uL0w3HiYha/4ZAX8VJTQeP05OPx40JRVFJyAgJuArI0Q7MA89GFg5N18bGls5NlgYPQ8yPEMhKys8dSUUNDk6GysAAAYAPP+3AzUDNwADABoAJgAtADkARQAAAREjEQMjDgEjIi4CNTQ+AjMyFhczNTMRIyUUFjMyNjU0JiMiBiUjFhUUBzMHMhYVFAYjIiY1NDYTMjY1NCYjIgYVFBYDLFChkxtRMyxLNx8fN0ssM1MckE5O/lBGODdHRzc4RgGwbgkKb0OWp6WYlKiolHB4eHBwd3cDN/3iAh7+cyImHjdMLi5MNx4nI3D+DP88TEw8PExMBh4kKRvdV1VVWFpTU1n+6jczMzY2MzM3AAAAAAIANAApA2MC/AAaAC4AACUhFSE1ITUuAzU0PgIzMh4CFRQOAgclFB4CMzI+AjU0LgIjIg4CAfQBb/zRAW0/aEwqMVd4R0d3VzAqS2g//t8lQls2NlpCJSVCWjY2W0IlbUREuwQlPVIxNlY+ISE+VjYxUj0lBOknPi0YGC0+Jyc+LRgYLT4AAAADADX/tQNfAyIAFgAiACgAAAEhFSE1ITUuATU0PgIzMh4CFRQGByUUFjMyNjU0JiMiBgM1IREjNQH0AWv81gFtg5AsUnVJSHVRLJGA/u97bWp8fGpte1QCbVIBb0JCWQdYTilALBgYLEApTlgHrTY3NzYzOTn97EP+3t8ABAAv/7EDWQMoABoALgA0ADoAAAEhFSE1ITUuAzU0PgIzMh4CFRQOAgclFB4CMzI+AjU0LgIjIg4CAzUhESM1MzUhESM1Ae4Ba/zWAWs+ZUgnLVN1R0d0Uy0nR2U+/vMhPFMyM1M8ISE8UzMyUzwhYwEwUXgBIVIBe0JCVAQbLDwlKEAtGBgtQCglPCwbBKwYKBsPDxsoGBgoGw8PGyj+EEL+zPJC/szyAAAAAAMANf/KA18DHAAaACYALAAAASEVITUhNS4DNTQ+AjMyHgIVFA4CByUUFjMyNjU0JiMiBhMVIRUhEQH0AWv81gFtP2ZIJixTdUhIdFIsJkdlP/7ve21pfX1pbXsMAhf9lwFaQ0NeAxstPycqQi8YGC9CKiY/LhsDsTY6OzU1PDv+LsBDAQMAAAADAC//wgNZAygAGgAuADYAAAEhFSE1ITUuAzU0PgIzMh4CFRQOAgclFB4CMzI+AjU0LgIjIg4CAxUhFSERIRUB7gFr/NYBaz5lSCctU3VHR3RTLSdHZT7+9CE8UzIyUzshITtTMjJTPCECAiT9igJtAXtCQlQEGyw8JShALRgYLUAoJTwsGwSsGCgbDw8bKBgYKBsPDxso/hKhQgEmQwAAAwA1/8ADXwMtABIAHgAqAAABIRUhNSE1LgE1NDYzMhYVFAYHJRQWMzI2NTQmIyIGExUhFSE1ITUhNSEVAfMBbPzWAWyGjKeUmKONhf7wd3Bwd3dwcHcGAir9hgIO/e8CYgGyQkJEBVBGTFBQTEhOBZstMTEtLTEx/ZxaQNdQPssAAAAABAA1/7sDXwMtABIAHgAzADkAAAEhFSE1ITUuATU0NjMyFhUUBgclFBYzMjY1NCYjIgYDFTI+AjcXDgMrATUzNSM1IRU3NSERIxEB8wFs/NYBbIaMp5SYo42F/vB3cHB3d3BwdwYrSEI/IQglRUpSMjbW2AEoLwEjUQGmQkJJBlFITFNRTklRBZ8wMjIwLjMz/ZpYAgQJBz0ICQUB0E49xYJD/qABHQAABQA1/8ADXwMtABIAHgAyADYAOgAAASEVITUhNS4BNTQ2MzIWFRQGByUUFjMyNjU0JiMiBgMVMj4CNxcOAisBNTM1IzUhFRcRIREDFTM1AfMBbPzWAWyGjKeUmKONhf7wd3Bwd3dwcHcJJz42MhoHHjc+JITQ0gEfOQEg2pQBrEJCRQZPSExTUU5IUAWdLjIyLi4zM/2eXAEDBgU9BgcD1FI9yZoBY/6dASfq6gAAAAAEADb/vwNgAy0AEgAeADMASAAAASEVITUhNS4BNTQ2MzIWFRQGByUUFjMyNjU0JiMiBgEVFB4CFwcuAScOAQcnPgM9AQUVMj4CNxcOAysBNTM1IzUhFQHzAW381gFrhoynlJijjYX+8HdwcHd3cHB3AcQTJTonLjdIFBRJNy8nOicU/oMmOzQwGQceNjxGLi/P0QEfAapBQUUGUUhMU1FOSFEGnzAxMTAuMjL+dkUkSEE3EjgaWTc3WRo4EzdBSCNF2VwBAwYFPQUGAwHTUj3JAAAAAAYANf+3A18DLQASAB4AJgA7AE8AWwAAASEVITUhNS4BNTQ2MzIWFRQGByUUFjMyNjU0JiMiBgEVMxUhNTM1BRUyPgI3Fw4DKwE1MzUjNSEVNzIeAhUUDgIjIi4CNTQ+AhcyNjU0JiMiBhUUFgHzAWz81gFshoynlJijjYX+8HdwcHd3cHB3AcOV/oiT/oAqQzg0GwkfOkFNMjLO0AEe2iA3KRcXKTcgIDcpFxcpNyAlLCwlJC0tAbJBQUUFT0ZMUE5ORk8Fmi0wMC0tMTH+gkk9PUnlXAEDBwU+BgcDAdZPPsg/EB4qGhoqHRAQHSoaGioeEKwfGxwfHxwbHwAAAAAEADX/wgNfAycAFgAiACYAKgAAASEVITUhNS4BNTQ+AjMyHgIVFAYHJRQWMzI2NTQmIyIGAxEhESUVITUB8wFs/NYBbIOPLFJ0SUl0UiyTf/7wem1tenptbXpKAmT97AHEAX9CQlcHVksoPysXFys/KEtXBqgzNjYzMzY2/REBJ/7Z5qSkAAAABAA1/8IDXwMqABYAIgAqAC4AAAEhFSE1ITUuATU0PgIzMh4CFRQGByUUFjMyNjU0JiMiBgE1MxEhETMVBTUhFQHzAWz81gFshI4sUXVJSXVRLI+D/vB6bW16em1tegHEUv2iUQG7/kUBj0NDUwZVSSc9KhYWKj0nSVUGpDA1NTAwNTX9/mL+rAFUYrBxcQAAAwA1/7kDXwMkABYAIgA7AAABIRUhNSE1LgE1ND4CMzIeAhUUBgclFBYzMjY1NCYjIgYBFRQeAhcHLgMnDgMHJz4DPQEB8wFs/NYBbIOPLFJ0SUl0UiyTf/7wem1tenptbXoBEjBRbj0hM15RQBQUQFBfMyE+bVMwAXtCQlgHVksoPysXFys/KEtXBqgzNjYzMzY2/k4bLU08KQlACSAuPCQkPC4gCUAJKTxNLRsAAAAEADX/twNfAyUAFgAiAC4AOgAAASEVITUhNS4BNTQ+AjMyHgIVFAYHJRQWMzI2NTQmIyIGEzIWFRQGIyImNTQ2EzI2NTQmIyIGFRQWAfMBbPzWAWyDjyxSdElJdFIsk3/+8HptbXp6bW1655GiopGPpKSPanZ2amp2dgF+QkJVB1ZLKD8sFxcsPyhJWQaoMzY2MzM2Nv5JUk5OUlNNTVP+/zEwLjMzLjAxAAAAAwA3/7kDYQMqABIAHgA9AAABIRUhNSE1LgE1NDYzMhYVFAYHJRQWMzI2NTQmIyIGASMeAxcHLgMnDgMHJz4DNyE1ITUzFSEB8wFu/NYBaoaMo5iZooyG/vB3cHB3d3BwdwIS/wc1T2Q2HDFeUUAUFD9RXzQbOGRQMwb/AAEDUgECAaZCQk8FTkhLT09LSE4Fmy0wMC0tLy/96yE6MCEHPAcdKjYfITYpHAc8ByEuOyJBVlYAAwAr/7YDdQM4AAcAKgA6AAABFSMRIxEzEQUVPgE3Fw4DIycyNjc1LgM1ND4CMzIeAhUUDgInFBYzMjY1NC4CIyIOAgN1jlJS/oM/eToHR5SPiDsLNng/K0k0HSM/WDQzVz8kHTRI8lhGRVgXKjkjIzoqFwHFRf42A4L+jWuYAwkIPAwOBwJFAQKbBSM2SCovTjcfHzdOLypHNiPKQE1NQCA0JRUVJTQABAA0/7UDcAM2AAcAKgA2ADwAAAEVIxUjETMVBxcOAyMnMjY3NS4DNTQ+AjMyHgIVFA4CBxU+ASUUFjMyNjU0JiMiBgM1IREjNQNwhFJSiQVGk5CGOgszdT8oQi8aIDpRMTFSOiEaMEIpP3v+jVBAQk9PQkBQEAJIUgI7RPcCNvuuPA0PBwJDAQJZBB0sOyImPy0YGC0/JiI7LB0FVAML8TM7OzMxPDz97EL+4d0AAAAEADT/ywNwAzYABwAmADIAOAAAATMVIxEjETMDFw4DIycyNjc1LgE1ND4CMzIeAhUUBgcVPgElFBYzMjY1NCYjIgYTFSEVITUC7ISEUlKKBkaTkIc5CzR2P1JjIDtRMTFROyBiUT96/oxPQj9RUT9CT1MCBf2pAgdE/sUCrv44PA0PBwJDAgJaCl1IJ0EvGRkvQSdIXApYBAr4ND4+NDM/P/4ytEP3AAAEADT/wANwAzcABwAnADMAPwAAATMVIxUjETMDFw4DIyczMjY3NS4BNTQ+AjMyHgIVFAYHFT4BJRQWMzI2NTQmIyIGExUhFSE1ITUhNSEVAuyEhFJSiwVHk4+GOglwHT0gVWEgOlIxMVE7IGFRP3n+jU5CQk5OQkJOSwIQ/Z8B5/4WAjsCX0PWAfH+gzkNDwcBQQEBSghSQiQ7KRcXKTskQFIKRgMK1S00NC0tNTX9o1c/0U8+yAAABQA0/8IDcAM2AAcAJgAyADYAOgAAARUjFSMRMxUHFw4DIycyNjc1LgE1ND4CMzIeAhUUBgcVPgElFBYzMjY1NCYjIgYDESERJRUhNQNwhFJSiQVGk5CGOgs0dj9SYyA6UjExUTsgYlE/e/6LT0JAUFBAQk8DAjv+FQGbAkFE8AIp9ac7DA8HA0IBAlMJV0MmPCsXFys8JkJWClADC+QwODgwMDc3/R0BIP7g352dAAAFADT/wgNwAzcABwAmADIAOgA+AAABFSMVIxEzFQcXDgMjJzI2NzUuATU0PgIzMh4CFRQGBxU+ASUUFjMyNjU0JiMiBgE1MxEhETMVBTUhFQNwg1JSigZHk5CGOgs0dj9SYyA6UjExUTsgYlE/e/6LT0JAUFBAQk8B51H9xVEBmf5nAlJE3wII5aw6DQ8HAkIBAk4JV0IlPCsXFys8JUJVCksCC98wNzcwMDY2/f5e/roBRl6kZGQABAA0/7kDcAM3AAcAJgAyAEsAAAEzFSMRIxEzAxcOAyMnMjY3NS4BNTQ+AjMyHgIVFAYHFT4BJRQWMzI2NTQmIyIGARUUHgIXBy4DJw4DByc+Az0BAuyEhFJSiQVGk5CGOgs0dj9SYyA7UTExUTogYVE/e/6MTkI/UFA/Qk4BSjBRbT0eM19RPxQUQFFeMx4+bFEvAidE/tYCfv5SOg0PBwJBAgJTCllFJz4tGBgtPidFWApRBArqMDs7MDE8PP5aHytKOScIQAgeLTkjIzosHghACCc5SisfAAAAAAQANP+5A3ADNgAHACgANABYAAABMxUjFSMRMwMXDgMjJzI2NzUuATU0PgIzMh4CFRQOAgcVPgElFBYzMjY1NCYjIgYBFRQeAhcHLgEnDgEHLgEnDgEHJz4DPQEzFRQWFz4BPQEC7ISEUlKJBUaTkIY6CzR2P1JjIDpSMTFROyAZL0IpP3v+i09CQFBQQEJPAe0YLkMrKUJaFxRSP0BSFBdZQicqQy0YTz4/QD4CRUTsAiH+YzoNDwcCQgECUglYQiU9KxgYKz0lHzgrHARPAwrkMDg4MDA4OP5IFiJCOS4OPBZVNzZbGRlaNjZUFzwOLzpBIRYWOnAkJHE5FgAAAAAFADT/twNwAzYABwAmADIAQgBOAAABMxUjFSMRMwMXDgMjJzI2NzUuATU0PgIzMh4CFRQGBxU+ASUUFjMyNjU0JiMiBgEyHgIVFA4CIyImNTQ2FzI2NTQmIyIGFRQWAuyEhFJSiQZHk5CGOgs0dj9SYyA6UjExUTsgYlE/e/6LT0JAUFBAQk8BGURtTCkpTG1Ei5ubi2RwcGRkcXECPET+Ajz+XzoNDwcCQgECUwlXQyU8KxgYKzwlQlYKUAMK5TA4ODAwNzf+TxUoOiUlOikVUktLUfkwLS0wMC0tMAAAAAQAMv+2A3EDNgAHACYAMgA8AAABFSMVIxEzFQcXDgMjJzI2NzUuATU0PgIzMh4CFRQGBxU+ASUUFjMyNjU0JiMiBgM1IREjNQUnJTUDcYNTU4wFQpCQij4LOXlCVWIgO1IyMlE6IGBRPHX+k05CQE5OQEJOLAJcU/3tDAIfAjlG4wIm/a89CQ0JBEYDAlYJWUYnPi0YGC0+J0VYClMDCO8wOTkwMDg4/gBC/tFmF0AUSgAAAAMAKv+3AycDNwALACwAOAAAATMRIxEjESMRMxEzBRU+ATcXDgMjJzI2NzUuATU0PgIzMh4CFRQOAicUFjMyNjU0JiMiBgLZTk5sTU1s/l4zYC0HN3p6cS0LKmA2S1oeNkssLUs2HxgsPcxHOTlJSTk5RwM3/IAByP5nAz3+n1uUAgcGOwoMBwJFAQKXC2ROKkYyHBwyRiomQTEguDlERDk3REQABAAw/7cDKAM2AAsAKgA2ADwAAAEzESM1IxUjETMVMwcXDgMjJzI2NzUuATU0PgIzMh4CFRQGBxU+ASUUFjMyNjU0JiMiBhM1IREjNQLaTk5rTk5r5AY3eXduLAsnYDZGVh0zSCosSDQdVkgzX/7OQzY3REQ3NkMiAmxSAzb91u7pAhfrrjoLDAYCQQECTQpWQCQ8KxgYKzwkQFYKSgMI3y44OC4uODj+C0H+1ukAAAAEADD/ygNBAzcACwAqADYAPAAAAREjETMRMxEzESMRBxcOAyMnMjY3NS4BNTQ+AjMyHgIVFAYHFT4BJRQWMzI2NTQmIyIGEyEVIREzAm9OTmtOTuQGN3l3biwLJ2A2RVcdM0gqK0g1HVZIM1/+zkM3NkRENjdDigId/ZFSAdH+3AJ5/u4BI/1aAUBWOgsMBgJCAQJPCllCJj4tGBgtPiZCWQpMAgjnMDo6MDA8PP2CQwEHAAAFADD/wgMoAzYACwAqADYAOgA+AAABMxEjNSMVIxEzFTMHFw4DIycyNjc1LgE1ND4CMzIeAhUUBgcVPgElFBYzMjY1NCYjIgYTESERJRUhNQLaTk5rTk5r5AY3eXduLAsnYDZGVh0zSCosSDQdVkgzX/7OQzY3REQ3NkMxAl398wG9Azb93O/pAhDksDkLDQYCQgECUAlWPyQ7KxcXKzskP1cITQII4S03Ny0tODj9JwEk/tzjoaEABQA1/70DMQM2AAsAKgA2AD4AQgAAATMRIzUjFSMRMxUzBxcOAyMnMjY3NS4BNTQ+AjMyHgIVFAYHFT4BJRQWMzI2NTQmIyIGATUzESERMxUFNSEVAuJPT2tOTmvkBTV4eHAuCypkN0hbHTRHKypIMx1SQjBc/s9BNjZAQDY2QQI5VP2ZVQG+/kIDNv3619QB9NytPAkLBwJFAQJGCFVCJDsqFxcqOyQ/UwtFAgfZKzQ0Kyo1Nf4GZf62AUplpGRkAAAAAAQAMP+5A0kDNgALAC4AOgBTAAABFSMRMxUzETMRIxEHFw4DIycyNjc1LgM1ND4CMzIeAhUUDgIHFT4BJRQWMzI2NTQmIyIGARUUHgIXBy4DJw4DByc+Az0BAm9OTmtOTuQGOHp3bSsLJmE2IjopFx0zSCorSDUdFyk6JDNf/s5DNjdERDc2QwGCMFNtPR8zX1FAFBRAUV8zHz1tUjAB8OMCGvQBA/2PAStlOgwNBwFCAQJRBBwqNh8kPCsYGCs8JB82KhwETgMI4i44OC4uODj+ZB4rSjooCUAIHy07IyM7LR8IQAkoOkorHgAABAA1/6cDbgM2AAsAKgA2AFoAAAEVIxEzFTM1MxEjNQcXDgMjJzI2NzUuATU0PgIzMh4CFRQGBxU+ASUUFjMyNjU0JiMiBgEVFB4CFwcuAScOAQcuAScOAQcnPgM9ATMVFBYXPgE9AQJ3Tk5rT0/lBjV4eHEtCyplN0taHTRIKytHNB1RQjBZ/s9CNjZAQDY2QgIZGC1DKys/WRcUUD8/ThQYWT8qK0MuGE45Pz88AfrqAhfo9/3Z63g9CQsHAkYBAlQIVkMmPCsXFys8Jj9UDFMDBuktNTUtLTY2/mAhI0U9MA49GFY2OVwaGVs5NlUXPQ4wPUUjISE/diQmdzwhAAUAMP+9Ay0DNwALACsANwBDAE8AAAEVIxEzFTM1MxEjEQcXDgMjJzMyNjc1LgE1ND4CMzIeAhUUBgcVPgElFBYzMjY1NCYjIgYBMhYVFAYjIiY1NDYXMjY1NCYjIgYVFBYCb05Oa05O5AY3eXduLAtYGDMaRlYdM0gqLEg0HVZIM1/+zkM2N0RENzZDAWCRoqKRj6Skj2p2dmpqdnYB+uACD+z6/cIBAXA6CwwGAkIBAVIKVUAkOysXFys7JEBVCk4CCOMtODgtLTg4/mFQS0tRUUtLUPcvLS0vLy0tLwAAAwA7/7QDEAM4AAMAJgA6AAABMxEjARU+ATcXDgMjJzI2NzUuAzU0PgIzMh4CFRQOAicUHgIzMj4CNTQuAiMiDgICvlJS/sJCgj8HTJuVjD0KNntCK0k1HSRAVzQ1WEAkHTVJ9RgqOyIjOysYGCs7IyI7KhgDOPx8AaaYBAsKPQ4QBwJFAQKbBiM2SCovTTgeHjhNLypINyPMHzUlFRUlNR8gMyUUFCUzAAAAAAQAOf+1AxMDNgADACIALgA0AAABMxEjJxcOAyMnMjY3NS4BNTQ+AjMyHgIVFAYHFT4BJRQWMzI2NTQmIyIGAzUhESM1AsFSUkcFSZiTijwMN3tCVWMhO1MyMlM7IWNVQH/+hFJCQlJSQkJSCAJZUgM2/cqNPA0PBwJDAQJXCltGJz8tGBgtPydFXApTAwvwMzo6MzM7O/3rQv7h3QAAAAAEADn/ygMwAzcAAwAmADIAOAAAAREjEQMXDgMjJzI2NzUuAzU0PgIzMh4CFRQOAgcVPgElFBYzMjY1NCYjIgYTIRUhNTMDE1JHBUeWk4w+DDl5QilEMBshPFMxMlI8IRswRClCff6EUkJCUlJCQlJaAhT9mlIDN/1hAp/+NDwLDQgCRAICVQUdLz4lKUMwGhowQyklPi8dBVIDCPs2QUE2NkBA/XlD/QAEADn/wAM0AzYAAwAgACwAOAAAAREjEQMXDgMjJzI2NzUuATU0NjMyHgIVFAYHFT4BJRQWMzI2NTQmIyIGEyEVITUhNSE1IRUhAxNSSQZIl5OLPQs3e0JYYnppM1Q8IGJYQH3+hVBFRVBQRUVQVQIe/ZIB/f4AAlD+AwM2/h4B4v6WOgwOCAJBAgJJCE4/RlEVJzgjP04IRgMLzSsxMSsrMTH9REDXVEDRAAAABQA5/8IDEwM2AAMAIgAuADIANgAAATMRIycXDgMjJzI2NzUuATU0PgIzMh4CFRQGBxU+ASUUFjMyNjU0JiMiBhMRIRElFSE1AsFSUkcFSZiTijwMN3tCVWMhO1MyMlM7IWNVQH/+hFJCQlJSQkJSBwJK/gYBqgM2/duJPA0PBwJDAQJVCVhFJj4sGBgsPiZFWAlRAwvpMDo6MDE6Ov0XAST+3OOhoQAABQA6/8IDEwM2AAMAIgAuADYAOgAAATMRIycXDgMjJzI2NzUuATU0PgIzMh4CFRQGBxU+ASUUFjMyNjU0JiMiBgE1MxEhETMVBTUhFQLBUlJGBkiWlIw9DDd6QlRkITtTMjJTOyFkVEJ+/oNSQkJSUkJCUgIBUP21UQGq/lYDNv37dTsLDgkDQgIDTgpWQiY9KxgYKz0mQlYKSwML3y45OS4wOTn9/lv+vAFEW6dnZwAEADv/uQM9AzYAAwAiAC4ARwAAAREjEQMXDgMjJzI2NzUuATU0PgIzMh4CFRQGBxU+ASUUFjMyNjU0JiMiBgEVFB4CFwcuAycOAwcnPgM9AQMTUkYGSZmUijsLNnpCVWMhO1MyMlM7IWNVQH/+hFJCQlJSQkJSAVAwUmw9HjNeUUAUFEBRXjIfPG1RMAM2/XoChv5YPA4QBwJEAQJbCldFJj4rGBgrPiZFVwpXBArvMDo6MDA6Ov5SHypJOSgJQAgfLTojIzotHwhACSg5SSofAAAAAAUAO/+4AxgDNgADACIALgA6AEYAAAERIxEDFw4DIycyNjc1LgE1ND4CMzIeAhUUBgcVPgElFBYzMjY1NCYjIgYBMhYVFAYjIiY1NDYXMjY1NCYjIgYVFBYDFFJHBkmZlIo7CzZ6QlVjITtTMjJTOyFjVUJ9/oRSQkJSUkJCUgEtip+fio+bm49ncHBnZ3FxAzb9wQI//lk8DhAHAkMCAloKV0UmPiwYGCw+JkVXClYDC+4wOjowMDs7/klPS0lRT0tLT/UuLS0uLi0tLgAAAAADADQAKQNjAv4AFgAqADEAACUzFSE1MzUuATU0PgIzMh4CFRQGBwMiDgIVFB4CMzI+AjU0LgIDFTM1BiMiAprJ/NHIOT8wV3hHSHdXMD050DZbQSUlQVs2NltCJSVCW7L6Qzs/bURE8h1fPTRVPCEhPFU0PV4dAV4YKz0mJT4rGBgrPiUmPSsY/oLT0w4AAAAEADT/tQNgAyQAFQAhACoAMAAAATMVITUzNSY1ND4CMzIeAhUUBgclFBYzMjY1NCYjIgYXFTM1DgEjIiYDNSERIzUCmMj81MluLFJ0SUl0Uiw5NP5Lem1tenptbXpr+R0+IiE+3AJtUgFuQkKAL1wpPywXFyw/KTBEFoozODgzMzc302trBQYG/sBD/t7fAAAEADT/ygNgAx4AFQAhACoAMAAAATMVITUzNSY1ND4CMzIeAhUUBgclFBYzMjY1NCYjIgYXFTM1DgEjIiYHFSEVITUCmMj81MluLFN0SEh1Uiw5NP5Lem1tenptbXpr+R0+IiE+fAIX/ZcBV0NDhy9gKkEuGBguQSowSBePNjk5NjY6OtxwcAUGBvm8Q/8AAAAEADT/wANgAy4AEgAeACUAMQAAATMVITUzNSY1ND4CMzIWFRQHJRQWMzI2NTQmIyIGFxUzNQYjIgMVIRUhNSE1ITUhFQKYyPzUyW5GZGwlmKNt/kt3cHB3d3Bwd2v5N0ZEnQIq/YYCDv3vAmIBrkFBayZUNj0gCE1LVyV8LS8vLSsvL7tYWAn+XFlA1VI+zAAFADX/wgNgAykAFQAhACoALgAyAAABMxUhNTM1JjU0PgIzMh4CFRQGByUUFjMyNjU0JiMiBhcVMzUOASMiJgMRIRElFSE1ApjI/NXIbixSdElJdVEsOTT+S3ptbXp6bW16a/kaPyQiPtECZP3sAcQBfkNDfixbJz4rFhYrPicuRBWHMTY2MTA2Ns1oaAUFBf3hASf+2eakpAAAAAAFADT/wgNgAywAFQAhACoAMgA2AAABMxUhNTM1JjU0PgIzMh4CFRQGByUUFjMyNjU0JiMiBhcVMzUOASMiJgE1MxEhETMVBTUhFQKYyPzUyW4sUXVJSXVRLDk0/kt6bW16em1temv5Gj8kIj4BPVL9olEBu/5FAY1CQnksWCc8KRYWKTwnLUIVhDA0NDAwNDTJZGQFBQX+yGL+rAFUYrBxcQAAAAQANP+6A2ADJgAVACEAKgA/AAABMxUhNTM1JjU0PgIzMh4CFRQGByUUFjMyNjU0JiMiBhcVMzUOASMiJhcVFB4CFwcuAScOAQcnPgM9AQKYyPzUyW4sUnVJSXRRLDk0/kt7bW15eW1te2v5Gj8jJD+NMFJtPR9qoyorpGofPW5SMQF5QkKALFsnPisWFis+Jy5EFYcwNzcwMDc3zGtrBQUF4RwtTTwpCUASXElJXBJACSk8TS0cAAAFADT/twNgAycAFQAhACoANgBCAAABMxUhNTM1JjU0PgIzMh4CFRQGByUUFjMyNjU0JiMiBhcVMzUOASMiJhcyFhUUBiMiJjU0NhMyNjU0JiMiBhUUFgKYyPzUyW4sUnRJSXVRLDk0/kt6bW16em1temv5Gj8kIj5gkqGhkpGiopFqdnZqanZ2AXtCQn4sWyc+KxcXKz4nLUQVhjA3NzAxNjbNaWkFBQXpUk5OUVFOTlL/ADIuLjIyLi4yAAMANf+1A2EDEwATACcALwAAASIuAjU0PgIzMh4CFRQOAgMiDgIVFB4CMzI+AjU0LgIBFSERIxEhNQHJRnNTLS1Tc0ZGdFIuLlJ0RjNUPSEhPVQzM1U9ISE9VQFl/pFS/pUBihwzSS0tSDMcHDNILS1JMxwBRxIiMB4eMCMSEiMwHh4wIhL+ZET+xAE8RAAAAAMANf+1A2ADIgATAB8ALQAAASIuAjU0PgIzMh4CFRQOAgMiBhUUFjMyNjU0JgEhFSERIzUhNSE1ITUhAcpIdVIsLFJ1SEl0UiwsUnRJbXp6bW16egEp/pMBCVL95QES/pQDKwHKFyxAKSk/LRcXLT8pKUAsFwEXODM0ODg0Mzj+X2r+399CakMAAAAABAA0/8oDYQMgABMAIwArADEAAAEiLgI1ND4CMzIeAhUUDgIDIg4CFRQeAjMyNjU0JgEhFSEVIzUhFxUhFSERAcpHdFItLVJ0R0d0Ui0tUnRHM1Q8ISE8VDNofHr+AAMt/ppT/oy6Ahr9lAG4GS9CKipCLxkZL0IqKkIvGQEmEB0qGxoqHRA9NDY8/pJDtbVdwkQBBgAAAAADAC//vwNZAygAEwAnADcAAAEiLgI1ND4CMzIeAhUUDgIDIg4CFRQeAjMyPgI1NC4CASEVIRUhFSEVIREhNSE1IQHESHRTLS1TdEhHdVMtLVN1RzNTPCEhPFMzMlM8ISE8UwFj/pUBDf3kAiX9igEM/pUDKgHTGCxAJyc/LBgYLD8nJ0AsGAESDhsmGBgnGw4OGycYGCYbDv5qY0KoQwEtY0IAAAMANf/AA18DLQALABcAKwAAASImNTQ2MzIWFRQGJyIGFRQWMzI2NTQmASEVIRUhFSEVITUhNSE1ITUhNSEBypSnp5SYo6OYcHd3cHB3dwEl/pQBBf3xAir9hgIO/fABCv6UAyoB9k9MTFBQTExP+TEtLTExLS0x/opUyltA11A+VEIAAAMANf+2A18DLQALABcAOgAAASImNTQ2MzIWFRQGJyIGFRQWMzI2NTQmASEVIREjESM1IxUjFTI+AjcXDgMrATUzNSM1ITUhNSEBypSnp5SYo6OYcHd3cHB3dwEl/pMBEFHMMNgxTkI8HwchQElYOTfY2gEV/pQDKgH1T01MUFBMTk76MS0tMTEtLTH+jGH+nAEhPsFWAgQJBz0ICQUBzk89YUIABAA1/8ADXwMtAAsAFwA3ADsAAAEiJjU0NjMyFhUUBiciBhUUFjMyNjU0JgEhFSERIREjFSMVMj4CNxcOAisBNTM1IzUhNSE1IQUVMzUBypijo5iYo6OYcHd3cHB3dwEl/pMBEf7gONEnPzYyGgYeNz4khNHTARb+lAMq/sqUAfpOS0tPT0tLTvUvLS0vLy0tL/6PXP6eAVi/WwEDBgU9BgcD01E+XELb6OgAAAQANf/CA2ADJgATAB8AKwAvAAABIi4CNTQ+AjMyHgIVFA4CAyIGFRQWMzI2NTQmASEVIREhESE1ITUhAzUhFQHLSXVSLCxSdUlIdVEsLFF1SG17e21qfHwBK/6UAQn9nAEJ/pMDK7P+PAHWFis+KCg/KxcXKz8oKD4rFgEQNjMxNzcxMzb+aWb+2QEnZkL+c6SkAAAFADT/xgNgAyoAEwAfACcALwAzAAABIi4CNTQ+AjMyHgIVFA4CAyIGFRQWMzI2NTQmASEVIRUjNSEFNTMRIREzFQU1IRUBykl1USwsUXVJSXVRLCxRdUltenptbXp6/f0DLP6TUv6TAnJR/aVSAbj+SAHhFio+Jyc9KhYWKj0nJz4qFgEKNTAwNTUwMDX+skNvb6do/qsBVWira2sAAAAABAA1/7kDYgMqABMAHwAnAEAAAAEiLgI1ND4CMzIeAhUUDgIDIgYVFBYzMjY1NCYBIRUhFSM1IQUVFB4CFwcuAycOAwcnPgM9AQHKSXVRLCxRdUlJdVEsLFF1SW16em1tenr9/gMt/pBR/pQBvzBTbj0bNGJTQRMUQlRhNBs9blMxAeEWKj4nJz0qFhYqPScnPioWAQo1MDA1NTAwNf6yQ2NjjBwlPzAgBj8GGic0IB80JxsGPwYhMT4kHAAEADX/twNgAyUAEwAfADIAPgAAASIuAjU0PgIzMh4CFRQOAgMiBhUUFjMyNjU0JgEhFR4BFRQGIyImNTQ2NzUhNSEDNCYjIgYVFBYzMjYBy0l1UiwsUnVJSHVRLCxRdUhte3ttanx8ASv+lIGIo4+QpImB/pQDK7Z1am10dG1qdQHSFys/KCg/LBcXLD8oKD8rFwESNjMzNjYzMzb+aFYGUUhNU1NNSFEGVkL+yS4zMy4wMTEAAAAABAAv/6MDWQMtABMAHwAnAEYAAAEiLgI1ND4CMzIeAhUUDgInIgYVFBYzMjY1NCYBIRUhFSM1IQUhHgMXBy4DJw4DByc+AzchNSE1MxUhAcRJdlEsLFF2SUp1USwsUXVKanh4amp3d/4BAyr+lFL+lALT/u8INVBlNx0zX1JBFBRBUl8zHjhlUDUI/u8BFVIBFQH2FSg6JSU5KBUVKDklJTooFfQuKiovLyoqLv7SQk9P4yE7MCIHPQcdKzchITgrHgc+ByEwPCJBOjoABAAy/7UDFgM2AAcAGwAnADcAAAEzESM1IzUzJSIuAjU0PgIzMh4CFRQOAgMiBhUUFjMyNjU0JhMXDgEHESMRDgEjJzI+AgLEUlLLy/6SMlM7ISE7UzIyUzshITtTMkJSUkJCUlLoBUKGQlJAdzYKP5KZmwM2/H/dQNcZL0EoJ0EvGRkvQScoQS8ZASI+MzQ+PjQzPv6xPgsNBP6vAU0CAkUBBQwAAAAABQAw/7UDEwM3AAcAGwAnADcAPQAAATMRIzUjNTMlIi4CNTQ+AjMyHgIVFA4CJyIGFRQWMzI2NTQmAzUOASMnMj4CNxcOAQcVBzUhESM1AsFSUru7/pMxUjogIDpSMTJROiAgOlEyQk5OQkJOTnQ/czYKPo6WmEgGP4NCwwJiUgM3/a47PJ0VJjchIjYnFRUnNiIhNyYV6zAoJzAwJygw/g6TAwJCAgULCToKDQOXckL+88sABQAw/8oDKgM3AAcAGwAnADcAPQAAATMRMxEjNSMnIi4CNTQ+AjMyHgIVFA4CJyIGFRQWMzI2NTQmAzUOASMnMj4CNxcOAQcVByEVIREzAgu2UlK2tzFROyAgO1ExMVE7ICA7UTFAT09AQE9PYEN9OQs+j5aYRwc8ej2EAij9hlIBJQIS/VVc8hYpOiQjOikWFik6IyQ6KRb8NCstMzMtKzT91q0DAkQBBgoJOwkNBLGfQwEFAAAAAAUAMv/AAzIDNgAHABsAJwA2AEIAAAEzETMRIzUjJyIuAjU0PgIzMh4CFRQOAiciBhUUFjMyNjU0JgM1BiMnMj4CNxcOAQcVAyEVITUhNSE1IRUhAg+yUlKyuzFSOiAgOlIxMlE6ICA6UTJCTk5CQk5OcHxuCkGRlphIBUKDQmsCJf2KAgf99wJZ/foBjAGq/fEvwxIjMR8gMiITEyIyIB8xIxLTKiQjKiojJCr+OIYDPgEFCQg2CQsEiv7YPMNIO7sAAAAGADD/wwMUAzYABwAbACcANwA7AD8AAAEzETMRIzUjJyIuAjU0PgIzMh4CFRQOAiciBhUUFjMyNjU0JgM1DgEjJzI+AjcXDgEHFQchESElNSEVAga7UlK7sjFSOiAgOlIxMlE6ICA6UTJCTk5CQk5OdD9zNgo+jpaYSAY/g0KuAk79sgH9/lQBbQHJ/b890hQlNCEhNCYUFCY0ISE0JRThLSYmLCwmJi3+FZMCAkIBBgoJOgoNA5cm/u9DjIwAAAAGADD/wgMTAzYABwAbACcANwA/AEMAAAEzESM1IzUzJSIuAjU0PgIzMh4CFRQOAiciBhUUFjMyNjU0JgM1DgEjJzI+AjcXDgEHFQU1MxEhETMVBTUhFQLBUlK7u/6TMVI6ICA6UjEyUTogIDpRMkJOTkJCTk50P3M2Cj2PlplHBj+DQgFPUP2zUQGs/lQDNv3YKTucFCQ0HyAzJBQUJDMgHzQkFNorJCQsLCQkK/4PnQMCQgEGDAs7Cw0EoVxU/tMBLVSZWloAAAUALv+6A0sDNgAHABMAHwAvAEgAAAEzETMRIzUjJyImNTQ2MzIWFRQGJyIGFRQWMzI2NTQmAzUOASMnMj4CNxcOAQcVNxUUHgIXBy4DJw4DByc+Az0BAgS7UlK7smd0dGdnc3NnQklJQkJISHk9cjMLPY6WmUcHQoVCrTBScD8dNGJTQRQUQVNhNB0+b1MwAVYB4P19aNtOSEhOTkhITu0tKiguLigqLf3iuQMCQgIGDAo6Cw4EvSEWKkg4Jgg+Bx4rOSIiOSseBz4IJzlIKBYAAAAABQAw/7kDZQM2AAcAGwAnADcAWwAAATMRMxEjNSMnIi4CNTQ+AjMyHgIVFA4CJyIGFRQWMzI2NTQmAzUOASMnMj4CNxcOAQcVBRUUHgIXBy4BJw4BBy4BJw4BByc+Az0BMxUUFhc+AT0BAgy1UlK1uDFSOiAgOlIxMlE6ICA6UTJCTk5CQk5OcEB2Ngo9j5aZRwY/gUABOBkuQysnQl0XFFNAQFIUGFxCJSpDLhlQPT9AQAFxAcX9yDfUEyQ0ISA0JBQUJDQgITQkE9wqJiYrKyYmKv4ekAMCQgIGDAo6Cw0ElSQRIUA3LA09FlM2NlgYF1g2NlIWPQ0tN0AgERE3bSQkbTcRAAAABgAw/7cDGwM2AAcAGwAnADcAQwBPAAABMxEzESM1IyciLgI1ND4CMzIeAhUUDgInIgYVFBYzMjY1NCYDNQ4BIycyPgI3Fw4BBxUXMhYVFAYjIiY1NDYXMjY1NCYjIgYVFBYCBrtSUruyMVI6ICA6UjEyUTogIDpRMkJOTkJCTk50P3M2Cj6PlphHBj+DQnmUmpqUlZmZlWpwcGpqcHABawHL/bJH1BUlNSAhNCYUFCY0ISA1JRXiLSYmLS0mJi3+GY8DAkIBBgwKOwoNBJMiSkhIS0tISEroLCoqKysqKiwAAAAABQAp/7YDLQM2AAMACwAfACsAOwAAATMRIwMRMxEjNSM1JyIuAjU0PgIzMh4CFRQOAgMiBhUUFjMyNjU0JhMXDgEHESMRDgEjJzI+AgLeT0+pTU2odipINB0dNEgqKkc1HR01Ryo2REQ2NkNDrwYwZTNOM18nCi51fX0DNvyAATQCN/zDxkDJGCw9JCU9KxgYKz0lJD0sGAEMOS4uOTkuLjn+xjwKCwP+zQEuAgFFAQUJAAAABgAw/7UDKAM3AAMACwAfACsAOwBBAAABMxEjJTMRMxEjNSMnIi4CNTQ+AjMyHgIVFA4CJyIGFRQWMzI2NTQmAzUOASMnMj4CNxcOAQcVBzUhESM1AtpOTv7BnU1NnXorSDMcHDNIKytIMx0dM0grNkJCNjdCQlw3YSoKLnV+fzcHLmMzkAJuUgM3/a55Acn9xTbWFCQzHyA0JBQUJDQgHzMkFNorJSMsLCMlK/4flAICQQEFCgk5CQwDmXVD/vbHAAAAAAYAL//KA0QDNgADAAsAHwArADoAQAAAAREjEQEzETMRIzUjJyIuAjU0PgIzMh4CFRQOAiciBhUUFjMyNjU0JgM1DgEjJzI+AjcXBgcVByEVITUzAyhO/sGdTU2deitIMxwcM0grLEc0HBw0Ryw2QkI2N0JCXDZjKgovdn5+NwZbaCgCIv2MUgM2/UgCuP4EAe39cGbpFSU2ISE2JhUVJjYhITYlFeYuJyctLScnLv4SkAICQQEGCgk6EgaV0UPrAAYAL//AA0gDNwADAAsAFwAjADMAPwAAAREjEQEzETMRIzUjJyImNTQ2MzIWFRQGJyIGFRQWMzI2NTQmAzUOASMnMj4CNxcOAQcVAyEVITUhNSE1IRUhAyhO/sGdTU2delhqalhYa2tYNkJCNjdCQlw2YyoKL3V+fzgFMGAzLQIr/YQCDP3yAl799QM3/fMCDf5aAZf+CCnCRTw8RUU8PEXJJyEhJychISf+SIMDAT0BBgoJNgkMBIf+0T3ESju9AAcAL//CAygDNwADAAsAGQAlADQAOAA8AAABMxEjJTMRMxEjNSMnIi4CNTQ2MzIWFRQGJyIGFRQWMzI2NTQmAzUOASMnMj4CNxcGBxUDESERJRUhNQLaTk7+wZ1NTZ16K0gzHGtXWGtrWDdBQTc3QkJcN2IqCi51fn84B11nfgJc/fQBvAM3/bx1Ab/91DHVEyQzH0BKSkA/StcqJCMqKiMkKv4jkgMBQQEFCgk5EwaW/scBCv72yYiIAAAABwAv/8IDKAM2AAMACwAXACMAMwA7AD8AAAEzESMlMxEzESM1IyciJjU0NjMyFhUUBiciBhUUFjMyNjU0JgM1DgEjJzI+AjcXDgEHFQU1MxEhETMVBTUhFQLaTk7+wZ1NTZ16V2tqWFhra1g3QUE3N0JCXDZjKgovdX5/OAYuYzMBjlD9pVEBuv5GAzb91m8BrP3nMs1IPj9GRj8/R9EoIyMoKCMjKP4wkQMBQAEGCgk5CQwElXdU/tcBKVSUVVUABgA3/7UDWQM2AAMACwAXACMAMwBKAAABESMRATMRMxEjNSMnIiY1NDYzMhYVFAYnIgYVFBYzMjY1NCYDNQ4BIycyPgI3Fw4BBxU3FRQeAhcHLgMnDgEHJz4DPQEDMU/+vqFOTqF6W2xsW1tsbFs5QUE5OUFBXjZgKgoweH18NQctZDPTL1NyQiQ0YFJBFS2qaiJCc1UwAzb9ewKF/ikByP3LM81OSEhOTkhITuotJyctLScnLf3quAMCQwIFCQc6CAsDvSQbKEg5JgdEBxwpNiFCUw5CByc4RygeAAcAMP+3AzIDNwADAAsAGQAlADUAQQBNAAABESMRATMRMxEjNSMnIi4CNTQ2MzIWFRQGJyIGFRQWMzI2NTQmAzUOASMnMj4CNxcOAQcVFzIWFRQGIyImNTQ2FzI2NTQmIyIGFRQWAyhO/sGdTU2deitIMxxrV1hra1g3QUE3N0JCXDdhKgoudX5/NwcuYzOtmKOjmJijo5hwdnZwcHZ2Azf9rQJT/jIBvv3cKtUTJDIfP0lJPz9J1SojIyoqIyMq/h6YAwFBAQUKCTkKDAOcFExJS0pKS0lM7S4qKi0tKiouAAAAAAQAM/+1AxUDNgADABcAIwAyAAABMxEjASIuAjU0PgIzMh4CFRQOAgMiBhUUFjMyNjU0JhMXBgcRIxEOASMnMj4CAsNSUv6YMlQ9IiI9VDIyVDwiIjxUMkJUVEJCU1PlB4CBUkN8OQs/kZmcAzb8fwHnGzBEKSlEMRsbMUQpKUQwGwEtQTQ0QT82Nj/+pz0XB/69AT4DAkUCBg0AAAQAN/+2Aw8DNgADABcAIwA5AAABMxEjJSIuAjU0PgIzMh4CFRQOAgMiBhUUFjMyNjU0JgMVIREjNSE1MzUOASMnMj4CNxcOAQK9UlL+nTFSOyEhO1IxMlI6ISE6UjJAT09AQFBQDwGEUv35g0N+Nwo+kJibSQU/fQM2/cTbFys8JSU8KxgYKzwlJTwrFwEJOC4uODguLjj+eIX+5dlCgQMCQwEGDAs8Cw0AAAAFADf/ygMpAzcAAwAXACMAMwA5AAABESMRASIuAjU0PgIzMh4CFRQOAgMiBhUUFjMyNjU0JgM1DgEjJzI+AjcXDgEHFQchFSERMwMPUv6gMlM7ISE7UzIyUzshITtTMkJRUUJDUFBeRYI5Cz+Pl5lIBjx3PI4CI/2LUgM3/VYCqv6PFyw9JSY9LBcXLD0mJT0sFwENODAwNzcwMDj92JgEAkQBBgsKPAkNBJyeQwEAAAQAOf/AAzADNwADABcAIwA/AAABESMRASIuAjU0PgIzMh4CFRQOAiciBhUUFjMyNjU0JgMhFSE1ITUhNTM1DgEjJzMyPgE3Fw4BBxUhFSEDD1L+lzFSOiAgOlIxMVE7ICA7UTFCTk5CQFBQggIe/ZEB/f4BdEB6NgqISJaYSAY/gUABiv4DAzf+GgHm/sUVJzciITcnFRUnNyEiNycV7DAnKDExKCcw/RhA1lM/YAIBQQUJCTgKDARjzwAABQA5/8IDDwM2AAMAFwAjADcAOwAAATMRIyUiLgI1ND4CMzIeAhUUDgIDIgYVFBYzMjY1NCYDFSERIREzNQ4BIycyPgI3Fw4BEzUhFQK9UlL+nTFTOiEhOlMxMVI7ISE7UjFAT09AP1BQDgGE/bB6Qnw3Cz6QmJpIBT999f5QAzb92NEXKjskJTsqFxcqOyUkOyoXAQQ3LS02Ni0tN/6Cgf7eASJ9BAJCAQYMCzoLDf6bn58ABgA5/8IDDwM3AAMAFwAjADMAOwA/AAABMxEjJSIuAjU0PgIzMh4CFRQOAiciBhUUFjMyNjU0JgM1DgEjJzI+AjcXDgEHFQU1MxEhETMVBTUhFQK9UlL+nTFSOyEhO1IxMlI6ISE6UjJAT09AQE9PWkV/OQo/kJaZSAY8ezwBLFH9sVEBrf5TAzf99MAWKTkkIzkpFhYpOSMkOSkW+jQqKzQ0Kyo0/gqEAwFCAQUKCToJDASISWL+ugFGYqJjYwAABQA5/7oDUwM3AAMAFwAjADIASQAAAREjEQEiLgI1ND4CMzIeAhUUDgIDIgYVFBYzMjY1NCYDNQ4BIycyPgI3FwYHFTcVFB4CFwcuAScOAwcnPgM9AQMPUv6dMVM6ISE6UzEyUjohITpSMkBPT0BAT090PHMzCz6Ql5lIBYeFsDBSbD0fZ6QqFD9RXzMePWxRMAM3/XgCiP6iFyo7JCU7KhcXKjslJDsqFwEENy0tNjYtLTf94JgDAkQBBgwLPBcGnDwmKkg5Jwg+EFhFIzksHgg/CCc5SComAAAAAAUAOf+3AxUDNgADABcAIwBBAE0AAAERIxEBIi4CNTQ+AjMyHgIVFA4CAyIGFRQWMzI2NTQmAxU+ATMyFhUUBiMiJjU0Njc1DgEjJzI+AjcXDgETMjY1NCYjIgYVFBYDD1L+nDFSOiEhOlIxMlI7ISE7UjI/T08/QFBQGBg0HY+cnI+PnDo2P3Y2Cz6QmJpIBkKCJ2dycmdncXEDNv24Akj+qRcqOyQlOyoXFyo7JSQ7KhcBBDctLTY2LS03/n5/BANOS0tOTkstPhSNAwJCAQYMCzoLDf6QLi0rLy8rLS4AAwA1/7YDYQMTABMAJwAzAAABIi4CNTQ+AjMyHgIVFA4CAyIOAhUUHgIzMj4CNTQuAgEVIxEjESMRIxEjNQHJRnNTLS1Tc0ZGdFIuLlJ0RjNUPSEhPVQzM1U9ISE9VQFl1FPhU9EBjBszSS0tSDMbGzNILS1JMxsBRRIiLx4eMCISEiIwHh4vIhL+Z0P+wQE//sEBP0MAAAAEADX/tQNgAyIAEwAfAC0AMQAAASIuAjU0PgIzMh4CFRQOAgMiBhUUFjMyNjU0JgEjFTMRIzUhNTM1IzUhBTUjFQHKSHVSLCxSdUhJdFIsLFJ0SW16em1tenoBKdZyUv3lfNYDK/7Y2wHLFyxAKCk/LRcXLT8pKEAsFwEWODMzODgzMzj+ZHL+4txCckK0cnIAAAAABAA1/8oDYAMgABMAJwAzADkAAAEiLgI1ND4CMzIeAhUUDgIDIg4CFRQeAjMyPgI1NC4CASEVIxUjNSMVIzUhFxUhFSE1AcpHdFItLVJ0R0d0Ui0tUnRHM1Q8ISE8VDMzVDwhITxU/jgDK85SnlL+5bUCI/2LAboZLkIqKkIuGRkuQioqQi4ZASQQHSoaGiodEBAdKhoaKh0Q/phDurq6um64Q/sAAAAABAA1/8ADXwMtAAsAFwArAC8AAAEiJjU0NjMyFhUUBiciBhUUFjMyNjU0JgEjFTMVIRUhFSE1ITUhNTM1IzUhBTUjFQHKlKenlJijo5hwd3dwcHd3ASXgef3xAir9hgIO/fB63AMq/s/MAfZPTExQUExMT/kxLS0xMS0tMf6PWcpbQNdQPllCm1lZAAAFADX/wgNgAyYAEwAfACsALwAzAAABIi4CNTQ+AjMyHgIVFA4CAyIGFRQWMzI2NTQmASMVMxEhETM1IzUhBTUjFQU1IRUBykl0UiwsUnRJSXVRLCxRdUltenptbXp6ASnffP2ceNwDK/7PzAFK/jwB1xYrPigoPisXFys+KCg+KxYBDzcxMTc3MTE3/m1q/tkBJ2pCrGpq5aSkAAAFADT/wgNgAyoAEwAfACsAMwA3AAABIi4CNTQ+AjMyHgIVFA4CAyIGFRQWMzI2NTQmASEVIxUjNSMVIzUjBTUzESERMxUFNSEVAcpJdVEsLFF1SUl1USwsUXVJbXp6bW16ev39AyzvUalR8gJyUf2lUgG4/kgB4RYqPicnPSoWFio9Jyc+KhYBCjUwMDU1MDA1/rdCdXV1dbFo/qsBVWira2sAAAQANf+5A2ADIwATAB8AKwBEAAABIi4CNTQ+AjMyHgIVFA4CAyIGFRQWMzI2NTQmASEVIxUjNSEVIzUjBRUUHgIXBy4DJw4DByc+Az0BActJdVIsLFJ1SUh1USwsUXVIbXt7bWp8fP4AAyu0Uv7iUrUBwDBSbj0fM19SQBQUQVJgMx4+bVMwAdMWKz4oKD8rFxcrPygoPisWARA2MzE3NzEzNv6pQ6KioqJPHS1MOygJPwgfLTskJDstHwg/CSg7TC0dAAAFADX/tgNgAyUAEwAfADEAOQBFAAABIi4CNTQ+AjMyHgIVFA4CAyIGFRQWMzI2NTQmASMVFhUUBiMiJjU0Njc1IzUhBTUjFTYzMhYXNCYjIgYVFBYzMjYBykl0UiwsUnRJSXVRLCxRdUltenptbXp6ASnKZ6KRkaI3M8wDK/7k8TZBIj2BdmpqdnZqanYB1hYrPigoPisXFys+KCg+KxYBDzUzMTc3MTM1/mx8KFdOUlJOLUATe0KoZmUJBZotMzMtMDAwAAAAAAQANf+6A18DKgALABcAIwBCAAABIiY1NDYzMhYVFAYnIgYVFBYzMjY1NCYBIRUjFSM1IRUjNSMFIx4DFwcuAycOAwcnPgM3ITUhNTMVIQHKmKWlmJilpZhte3ttbXt7/f4DKrtS/u5SuQLA/gc1T2M2HDFeUUAUFD9RXzMcOGRONAf/AAEDUgECAfVPS0tQUEtLT/gxLS0wMC0tMf7TQmpqamrXITovIAc8Bx0qNh8hNikcBzwHIC07IkFXVwAAAAMANAAtA2MC/wATACcAKwAAATIeAhUUDgIjIi4CNTQ+AhciDgIVFB4CMzI+AjU0LgIBIRUhAcpGd1cyMld3RkZ3VzIyV3dGNVtCJiZCWzU1W0ImJkJb/jUDL/zRAv8kQVs4OFxBIyNBXDg4W0EkQxowQikpQy8aGi9DKSlCMBr9tUQAAAQANf+1A18DHgATAB8AIwApAAABMh4CFRQOAiMiLgI1ND4CFyIGFRQWMzI2NTQmASEVIRchESM1IQHKSXRSLCxSdElIdVIsLFJ1SG16em1tenr9/gMq/NZaAm1S/eUDHhgsQCkpQS0XFy1BKSlALBhBOTM2Nzc2Mzn+mUNb/t3hAAAAAAUAL/+xA1kDKAATACcAKwAxADcAAAEyHgIVFA4CIyIuAjU0PgIXIg4CFRQeAjMyPgI1NC4CASEVIQUhESM1IyUhESM1IwHDR3VTLi5TdUdHdFMtLVN0RzJTPCEhPFMyM1M8ISE8U/45Ayr81gGkASNT0P6tAS5R3QMoGC1AKChALRgYLUAoKEAtGEMPGygYGCgbDw8bKBgYKBsP/ptEV/7M8UP+zPEAAAQANP/KA18DGAATAB8AIwApAAABIi4CNTQ+AjMyHgIVFA4CAyIGFRQWMzI2NTQmASEVIRcVIRUhEQHKSHRTLCxTdEhIdFMsLFN0SGp9fWpqfX3+AAMr/NW7Ahf9lwGzGC5CKipCLxgYL0IqKkIuGAEjOzY2Ojo2Njv+iUJPwUMBBAAAAAQANP/AA2ADKAALABcAGwAnAAABIiY1NDYzMhYVFAYnIgYVFBYzMjY1NCYBIRUhExUhFSE1ITUhNSEVAcqUp6eUlKenlHB3d3Bwd3f9+gMs/NS1Air9hgIO/e8CYgHxT0xMUFBMTE/5MS0tMTEtLTH+ykL+6VtA11A+ygAGADT/wgNgAyQACwAXABsAMAA8AEAAAAEiJjU0NjMyFhUUBiciBhUUFjMyNjU0JgEhFSETFTI+AjcXDgMrATUzNSM1IRUlFTMVITUzNSM1IRUjFTM1AcqUp6eUlKenlHB3d3Bwd3f9+gMs/NScKT4zLBcJGjM8SjIuztABHQFCQ/6iQDoBT9FTAelRTUxRUUxNUf0yLS4yMi4tMv7EQv7zWwEDBwY9BgcEAdVNPcaF3UFB3UFB3d0ABQA1/8IDYAMjABMAHwAjACcAKwAAATIeAhUUDgIjIi4CNTQ+AhciBhUUFjMyNjU0JgEhFSEXIREhJSEVIQHKSXRSLCxSdElJdFIsLFJ0SW16em1tenr9/gMr/NVkAmT9nAIU/jwBxAMjFyw/KCg/KxcXKz8oKD8sF0E2MzM2NjMzNv6hQlj+2eakAAAFADT/wgNgAyYAEwAfACMAKwAvAAABMh4CFRQOAiMiLgI1ND4CFyIGFRQWMzI2NTQmASEVIRczFSE1MxEhNxUhNQHKSXVRLCxRdUlJdVEsLFF1SW16em1tenr9/QMs/NRnUQG7Uv2iUQG7AyYWKz0nJz4rFhYrPicnPSsWPzYwMTY2MTA2/qxCO2Ji/qyzcXEAAAAABAA1/7oDXwMfABMAHwAjADwAAAEiLgI1ND4CMzIeAhUUDgIDIgYVFBYzMjY1NCYBIRUhBRUUHgIXBy4DJw4DByc+Az0BActJdVIsLFJ1SUh1USwsUXVIbXt7bWp8fP4AAyr81gHAMFFuPSAzX1BAFBRAUWAzID5tUzAByRcsQCgpPywXFyw/KShALBcBFjgzMzg4MzM4/qFCQBwtTTwpCUAJIC48JCQ8LiAJQAkpPE0tHAAABQA1/7YDXwMgABMAHwAjAC8AOwAAATIeAhUUDgIjIi4CNTQ+AhciBhUUFjMyNjU0JgEhFSEFMhYVFAYjIiY1NDYXIgYVFBYzMjY1NCYBykl0UiwsUnRJSHVSLCxSdUhtenptbXp6/f4DKvzWAZWRoqKRj6Skj2p2dmpqdnYDIBcsPykoPywXFyw/KCk/LBdAODMzNzczMzj+o0JLUk5OUlRMTVM/My4uMjIuLjMAAAAEADX/wANfAyYAEwAfACMAPgAAASIuAjU0PgIzMh4CFRQOAgMiBhUUFjMyNjU0JgEhFSEFIR4DFwcuAycOAwcnPgM3ITUhAcpJdVEsLFF1SUl1USwsUXVJbXp6bW16ev3+Ayr81gLM/vkINlBmNx40YVJBFBhGVFwtHjhlUDYI/vgCbAHbFis+Jyc9KxYWKz0nJz4rFgEMNjAxNjYxMDb+rEKUJT8xIgc/CB4tOyQqPCsaBz8HIjE/JUIAAAQAN/+5A2EDJQALABcAGwA6AAABIiY1NDYzMhYVFAYnIgYVFBYzMjY1NCYBIRUhBSMeAxcHLgMnDgMHJz4DNyE1ITUzFSEBypSnp5SZoqKZcHd3cHB3d/39Ayr81gK+/gc0T2Q2HDFeUUAUFD9RXzMcOGRONAf/AAEDUgECAe1QTExQUExMUPkwLS0wMC0tMP7GQsIhOi8hBz0HHSo2HyE2KRwHPQcgLjsiQVdXAAAABAA1/7IDYAMhABMAHwAjAC0AAAEiLgI1ND4CMzIeAhUUDgIDIgYVFBYzMjY1NCYBIRUhFzUhESM1BSclNQHKSXRSLCxSdElJdVEsLFF1SW16em1tenr9/gMr/NVlAmBS/ekLAiIB0xcrPicoPisWFis+KCc+KxcBDzcxMDc3MDE3/q1ClkL+uXgaQRZQAAAABAA0/8ADXwMlAAsAFwAbACcAAAEiJjU0NjMyFhUUBgMiBhUUFjMyNjU0JgEhFSETFSEVIREhFSEVIRUBypSnp5SUp6eUcHd3cHB3d/36Ayv81bcCHf2SAmT97QIAAeZSTU1TU01NUgEAMy4uMzMuLjP+vkH+71M/AVc9TDwAAAAFADX/wgNfAyEAEwAfACMALwAzAAABIi4CNTQ+AjMyHgIVFA4CAyIGFRQWMzI2NTQmASEVIQUVMxUhNTM1IzUhFSEVMzUBykl0UiwsUnRJSXRSLCxSdEltenptbXp6/f4DKvzWAkqQ/XiQiAJ4/mHGAc8XKz8oKD8rFxcrPygoPysXARI2MzM2NjMzNv6mQpipQkKpQkKpqQAAAAAGADT/twNhAyQACwAXABsAIwAvADsAAAEiJjU0NjMyFhUUBiciBhUUFjMyNjU0JgEhFSEFFSEVITUhNRcyFhUUBiMiJjU0NhcyNjU0JiMiBhUUFgHLmaOjmZiiophweHhwcHZ2/fkDLfzTAcABIf1rASIphoeHhoaIiIZbXl5bW19fAflNSElNTUlITe4vKiouLioqL/7cQiJRQEBRuTw8PDs7PDw8th8fIB8fIB8fAAQAO/+0AxADNwADABcAKwA3AAABMxEjATIeAhUUDgIjIi4CNTQ+AhciDgIVFB4CMzI+AjU0LgIBJzI+AjcXDgMCvlJS/po1WD8kJD9YNTRYQCQkQFg0IzsqGBgqOyMjOyoYGCo7/soKPo6Xm0oHTJuVjAM3/H0DQR83Ti8vTjcfHzdOLy9ONx9GFCYzIB80JRUVJTQfIDMmFP3KRQIGDAs9DhAHAgAAAAUAOf/KAzADNgADABcAIwAvADUAAAERIxEBIi4CNTQ+AjMyHgIVFA4CAyIGFRQWMzI2NTQmExcOAyMnMj4CASEVIREzAxNS/pUyUzshITtTMjJTOyEhO1MyQlJSQkFTUuIFSZeTizwMPo6WmP7pAhT9mlIDNv1iAp7+chovQSgpQi4aGi5CKShBLxoBJj42M0BAMzY+/q48DA4HAkMBBgv+m0MBBAAAAAUAOf/AAzQDNgADAA8AGwAnADMAAAERIxEBIiY1NDYzMhYVFAYnIgYVFBYzMjY1NCYTFw4DIycyPgIBIRUhNSE1ITUhFSEDE1L+lWl6emlpenppRVBQRUVQUN0GSJeTiz0LPo+Vl/7kAh79kgH9/gACUP4DAzb+HgHi/sBQRUVQUEVFUPAxKiowMCoqMf7uOgwOCAJBAQYM/jZA11RA0QAGADr/wgMTAzcAAwAXACMALwAzADcAAAEzESMBMh4CFRQOAiMiLgI1ND4CFyIGFRQWMzI2NTQmAScyPgI3Fw4DFyERISUhFSECwVJS/pUyUzshITtTMjJTOyEhO1MyQlJSQkJSUv6tCz2OlphHBUmYk4pIAkr9tgH6/lYBqgM3/eECAxgsPiYmPisYGCs+JiY+LBg9OzAwOjowMDv+Y0IBBgwKOg0PBwJY/tnlowAAAAYANf+9Aw0DNgADABMAHwArADMANwAAATMRIwEyFhUUBiMiLgI1ND4CFyIGFRQWMzI2NTQmAScyPgI3Fw4DFzMVITUzESE3FSE1ArtSUv6cZ3d3ZzJSOiAgOlIyQkxMQkJNTf6nC0CQlpVFB0aWlI06VQGrVP2sVQGrAzb9+QHuWUxMWRcrPSYmPSsXQjMwLjU1LjAz/nBEAgYKCDwLDQgCSV1d/rupZ2cAAAAFADv/uQM9AzYAAwAXACMALwBIAAABESMRASIuAjU0PgIzMh4CFRQOAgMiBhUUFjMyNjU0JhMXDgMjJzI+AgcVFB4CFwcuAycOAwcnPgM9AQMTUv6VMlM7ISE7UzIyUzshITtTMkJSUkJCUlLjBkqYk4o8Cz2NlpghMFJsPR4zXlFAFBRAUV4yHzxtUTADNv2AAoD+ihgsPiUmPiwYGCw+JiU+LBgBEjswMDo6MDA7/sA8DQ8IAkMCBgySHitJOSgJQAgfLTojIzotHwhACSg5SSseAAYAOv+5AxYDNgADABcAIwAvADsARwAAATMRIwEyHgIVFA4CIyIuAjU0PgIXIgYVFBYzMjY1NCYBJzI+AjcXDgMFMhYVFAYjIiY1NDYXIgYVFBYzMjY1NCYCu1JS/pwyUjogIDpSMjFSOyAgO1IxQkxMQkJNTf6sC0CPlJRFCEeUko0BZZKbm5KSnJySam9vampvbwM2/c0CGhgtPicnPywYGCw/Jyc+LRhCODAwOTkwMDj+XUYCBAkHPgkMBgNCUE5OUVFOTlBCLy0tMDAtLS8AAAAAAwBW/7QDEwM3AAMAFwArAAABMxEjATIeAhUUDgIjIi4CNTQ+AhciDgIVFB4CMzI+AjU0LgICwVJS/nkyVDwiIjxUMjJUPCIiPFQyITcoFhYoNyEhNigWFig2Azf8fQM+LFJzSEhzUiwsUnNISHNSLEoiPlk2N1g/IiI/WDc2WT4iAAAABABK/7UDFQM2AAMAFwArADEAAAEzESMBMh4CFRQOAiMiLgI1ND4CFyIOAhUUHgIzMj4CNTQuAgMhESM1IQLDUlL+cTNVPyMjP1UzM1Y+IyM+VjMiOCkXFyk4IiE5KRcXKTmXAldS/fsDNv3rAeAfOE4vL044Hx84Ti8vTjgfRRUmNCAfNSYVFSY1HyA0JhX+NP7F+QAAAAAEAEr/ygMwAzYAAwAXACsAMQAAAREjEQMUDgIjIi4CNTQ+AjMyHgIFFB4CMzI+AjU0LgIjIg4CEyEVIREzAxVSpSQ/VjIyVT8jIz9VMjJWPyT+fBcpOCEhOSoXFyo5ISE4KReMAgr9pFIDNv1xAo/+5jFROyEhO1ExMFE7ICA7UTAhOCgWFig4ISE2KBYWKDb90EMBIAAAAAQASv/AAx4DNgADABcAIwArAAABESMRAxQOAiMiLgI1ND4CMzIeAgUUFjMyNjU0JiMiBhMhFSERIRUhAw1VnyI9VTMzVj0iIj1WMzNVPSL+g1NDQlNTQkNTfwID/akCUP4EAzb9/AIE/v0wTTceHjdNMDBNNx4eN00wP05OPz9OTv2SRAE8QwAEAEr/wgMzAzcAAwAXACsANwAAAREjEQcUDgIjIi4CNTQ+AjMyHgIFFB4CMzI+AjU0LgIjIg4CEyEVITUhNSE1IRUhAxVSqiM+VTIyVT0jIz1VMjJVPiP+gBcpNyEhOCgXFyg4ISE3KReKAhD9nwHy/gwCRf4OAzf+NAHM6CxJNB0dNEksLUk1HR01SS0cMSMUFCMxHB0xIxQUIzH9l0HhW0HZAAUASv+8AxQDNgADABcAKwBAAEYAAAEzESMnFA4CIyIuAjU0PgIzMh4CBRQeAjMyPgI1NC4CIyIOAhMVMj4CNxcOAysBNTM1IzUhFTc1IREjEQLCUlKpIz5VMjJVPSMjPVUyMlU+I/6AFyk3ISE4KBcXKDghITcpF10rSEE/IggmRUlRMTbX2QEpJgEgUQM2/iXqLUo1HR01Si0tSjUdHTVKLR0xJBQUJDEdHTEkFBQkMf4BYgEFBwY+BwgEAd1VPs+NQv6KATQABgBK/8IDFAM2AAMAFwArAD8AQwBHAAABMxEjATIeAhUUDgIjIi4CNTQ+AhMyPgI1NC4CIyIOAhUUHgIDFTI+AjcXDgIrATUzNSM1IRUXESERAxEzEQLCUlL+bzJVPiMjPlUyMlU9IyM9VTIhOCgXFyg4ISE3KRcXKTcZJDo1MRsHHzk9In7P0QEgMwEb1I4DNv4uAa0dNUktLUk1HR01SS0tSTUd/rMUIzEdHTEjFBQjMR0dMSMU/qVoAQQGBT8GBwPjWT7TpwF6/oYBPv7/AQEAAAAHAEr/twNSAzcAAwAXACsAMwBIAFwAaAAAAREjEQcUDgIjIi4CNTQ+AjMyHgIFFB4CMzI+AjU0LgIjIg4CATMVITUzNTMFFTI+AjcXDgMrATUzNSM1IRU3Mh4CFRQOAiMiLgI1ND4CFzI2NTQmIyIGFRQWAxRSqSM+VTIyVT0jIz1VMjJVPiP+gBcpNyEhOCgXFyg4ISE3KRcCIpf+gZlP/jElPDYyGwceOT5ILS/FyAEW4iE4KhcXKjghITkqGBgqOSEmLi4mJjAwAzf+OwHF6CxJNB0dNEksLUk1HR01SS0cMSMUFCMxHB0xIxQUIzH+pD09U/1kAgQGBT0GBwQB3lk+00kSIC4cHC4gEhIgLhwcLiASvSMeHSQkHR4jAAAFAEr/wgMVAzYAAwAXACsALwAzAAABMxEjATIeAhUUDgIjIi4CNTQ+AhciDgIVFB4CMzI+AjU0LgIDIREhASEVIQLDUlL+cDNWPyMjP1YzM1U+IyM+VTMhOSgXFyg5ISI5KRcXKTmEAkT9vAH0/lwBpAM2/f8B0h44TC8uTTgeHjhNLi9MOB5EFSU0Hx80JRUVJTQfHzQlFf5C/r0BAsAABQBK/8IDFQM2AAMAFwApADEANQAAATMRIwEyHgIVFA4CIyIuAjU0PgIXIg4CFRQeAjMyNjU0LgIDMxUhNTMRITcVITUCw1JS/nAzVj8jIz9WMzNVPiMjPlUzITkoFxcoOSFFVhcpOYJRAaBR/b5RAaADNv4fAbceNkwuLk02Hh42TS4uTDYeRBQlMx4fMyUUTD8eMyUU/mFubv6ZuXd3AAQASv+6A0cDNwADABcAKwBCAAABESMRAxQOAiMiLgI1ND4CMzIeAgUUHgIzMj4CNTQuAiMiDgIBFRQeAhcHLgEnDgMHJz4DPQEDFVKlIz9VMzNWPiMjPlYzM1U/I/58Fyk4IiE5KRcXKTkhIjgpFwGCMFNsPCFnoyoUQFFeMyE8bVMxAzf9pwJZ/vAwTjkfHzlOMDBOOB8fOE4wIDUmFRUmNSAgNSYVFSY1/swdMFNCLgo/FGVPJ0EyJAo/Ci5CUzAdAAAEAEr/ugNlAzYAAwAXACsAUQAAAREjEQEiLgI1ND4CMzIeAhUUDgIDIg4CFRQeAjMyPgI1NC4CARUUHgIXBy4BJw4BBy4BJw4BByc+Az0BMxUUFhc+Az0BAxVS/nAzVT4jIz5VMzNWPyMjP1YzITkoFxcoOSEhOSoXFyo5AV0YLkMrKUJbFxVSP0JRFBhaPykqQy8YTz0/IDEgEAM2/gACAP4qHjhNLi9MOB4eOEwvLk04HgFeFSU0Hx80JRUVJTQfHzQlFf5RMCNEOy8OPhhYOTdfGxpbOTZYGD4PMTxCITAwPHQlFDQ5OhowAAUASv+3AxgDNwADABcAKwA/AEsAAAEzESMBMh4CFRQOAiMiLgI1ND4CFyIOAhUUHgIzMj4CNTQuAhMyHgIVFA4CIyIuAjU0PgIXIgYVFBYzMjY1NCYCw1JS/nAzVj8jIz9WMzNVPiMjPlUzITkoFxcoOSEiOSkXFyk5lkVwTioqTnBFRXBOKipOcEVndXVnZ3R0Azf96gHdHjhMLy9NOB4eOE0vL0w4HkQVJTQfHzUlFRUlNR8fNCUV/lUXLEApKUAsFxcsQCkpQCwXQTgzMzg4MzM4AAAAAAQASv+5A0IDNgADABcAJwBCAAABESMRAxQOAiMiLgI1ND4CMzIeAgUUFjMyNjU0LgIjIg4CASMeAxcHLgMnDgMHJz4DNyM1IQMVUqUjP1UzM1Y+IyM+VjMzVT8j/nxVRUVVFyk4IiI4KRcChf0EMU5lOB4xXE4+ExM+TlsxHjhkTTEE+QJLAzb9/wIB/vwuTDceHjdMLi9MNx4eN0wvP0xMPx8zJRUVJTP+cCRCNiYIPggfLTkiIjktHwg+CCY2QiRFAAAEAEr/tQMNAzYAAwAXACMALQAAATMRIwMUDgIjIi4CNTQ+AjMyHgIFFBYzMjY1NCYjIgYTNSERIzUFJyU1ArhVVZ8iPVUzM1Y9IiI9VjMzVT0i/oNTQ0JTU0JDUxcCWVP97wsCHAM2/fwBATBNNx4eN00wME03Hh43TTA/Tk4/P05O/ktD/rV2GUIVVAAAAAAEAEr/wAMkAzcAAwAXACMALwAAAREjEQcUDgIjIi4CNTQ+AjMyHgIFFBYzMjY1NCYjIgYTIRUhESEVIRUhFSEDDVWfIj1VMzRVPSIiPVU0M1U9Iv6DU0NCU1NCQ1N7Ag39oAJO/gUB8/4NAzf+NQHL6S1LNB0dNEstLUs0HR00Sy08SEg8PEhI/XQ+AXA9Wz0AAAAABQBK/8IDJAM2AAMAFwArADcAOwAAAREjEQMUDgIjIi4CNTQ+AjMyHgIFFB4CMzI+AjU0LgIjIg4CATMVITUzNSM1IRUjIRUzNQMUUqQjP1YzM1U+IyM+VTMzVj8j/nwXKDkhIjkpFxcpOSIhOSgXAgWF/ZiDfAJXe/7xvgM2/g8B8f8ALk03Hh43TS4vTDceHjdMLx8zJRUVJTMfHzMlFRUlM/2vQkLLQkLLywAAAAACACb/tgN7AzYABwAiAAABFSMRIxEzESUVFB4CFwcuAScOAwcnPgM9ASM1IRUDe5RSUv58JD9UMS9LeB4PLzxFJjAwVkAmzQHlAc1F/i4DgP6XynI2bWJPF0ImklsxW009E0EYVGh1OXJERAADADH/tQNyAzYABwAgACYAAAEVIxUjETMVDwEuAScOAQcnPgM9ASM1IRUjFRQeAgU1IREjNQNyhVJSrypLcB0ddE8rM1M7IMkB4cYfOVH+mAJIUgJLRO0CHOvLQBppRUtyHUESO0xaMCRCQiMtVEg56UL+y/MAAAADADL/ygNyAzcABwAgACYAAAEzFSMRIxEzAwcuAScOAQcnPgM9ASM1IRUjFRQeAgcVIRUhEQLthYVSUq8sS24dHXRPKjJTOyDHAd/GHzlR/AIE/aoCJUT+xwKP/jI/HGhFTnMeQhI9TlowKUNDKS1VSDmZ1EMBFwAGAC//tgNyAzcABwAgACgAMwBHAFMAAAEzFSMVIxEzAwcuAScOAQcnPgM9ASM1IRUjFRQeAhcVMxUhNTM1BRE+ATcXDgErAREFMh4CFRQOAiMiLgI1ND4CFzI2NTQmIyIGFRQWAu2FhVJStylJbB0ddk8qMlM7IccB3cQfN06HuP4+uv6mJ10wDUB4LisB0iQ9LBkZLD0kJD0sGRksPSQqMzMqKjMzAm1EtAHC/no/GF4/SW8dQBE5SFQsE0JCEilLQDFnUD09UEL+9wINEEIVDAFNZhIgLh0cLyESEiEvHB0uIBLBJR8fJCQfHyUAAAADADH/wgNyAzcABwAgACgAAAEzFSMVIxEzAwcuAScOAQcnPgM9ASM1IRUjFRQeAgcVIRUhESEVAu2FhVJSsCtLbh0dc1EqM1M6IMgB4MUfOVD9Afb9uAI4AlpE5AIF/lBBG2VFTHEdQRI7TFowH0NDHitUSDjYu0IBP0IAAwAt/78DcgM2AAcAIAAsAAABMxUjFSMRMwMHLgEnDgEHJz4DPQEjNSEVIxUUHgIBFSEVITUhNSE1IRUC7YWFUlKtJU5zHh14UigzVDwhyAHgxSA6Uf73Agj9qAHm/hcCOgJ0RMcBzf6DQRdfP0hqGkAPNkVTKxlDQxgoSz8x/p9oP+RcP9gAAAUAL//AA3IDNwAHACAAMwA3ADsAAAEVIxUjETMVDwEuAScOAQcnPgM9ASM1IRUjFRQeAgEVMj4CNxcOASsBNTM1IzUhFRcRIREDFTM1A3KFUlKtJk5yHh11VSYyUzwhyQHhxSA6Uf7EIzo0MRsIMFM0fcvOAR03ARjRiQJvQ88B2si/QBhfQklsGkAQNkZULhNCQhMqTEEy/qBgAQMGBT4JB9tUPs6fAW3+kwEw8/MABAAx/8IDcgM2AAcAIAAkACgAAAEVIxUjETMVDwEuAScOAQcnPgM9ASM1IRUjFRQeAgERIRElFSE1A3KFUlKwKExwHR1zUSozUzogyAHgxR85UP6uAjP+HQGSAldE7AIP389BGmZFS3IdQhE7TFowIENDHy1TSDf+KgE8/sT7ubkAAAAABAAw/8IDcgM3AAcAIAAoACwAAAEVIxUjETMVDwEuAScOAQcnPgM9ASM1IRUjFRQeAhc1MxEhETMVBTUhFQNyhVJSsCZOcB4ddVEoMlM7IcgB4MUfOVCQUf3LUQGT/m0CaETZAezP00EaZEVLbh1CEDlJVy8eQ0MeK1BFNvBs/qEBX2yxcHAAAAMAMf+6A3IDNwAHACAAOQAAATMVIxEjETMDBy4BJw4BByc+Az0BIzUhFSMVFB4CBxUUHgIXBy4DJw4DByc+Az0BAu2FhVJSryhMcB4dc1EqM1M7IMkB4cYfOVEGMFNsPCEtWlFDFxVAUF4yIDxsUzECPkT+4AJd/klBGmdFTnEdQRI7TFoxIENDICxTRziHFjBSQC0KQAgfMEEqJj8yIglACixBUjAWAAMAMP+6A3IDNgAHACAARgAAATMVIxUjETMBJz4DPQEjNSEVIxUUHgIXBy4BJw4BBRUUHgIXBy4BJw4BBy4BJw4BByc+Az0BMxUUFhc+Az0BAu2FhVJS/W0qM1M7IMgB4MUfOVAxJ05uHh10AfwYLkMrKUJbFxRSP0JQFBhaPyorQy4YTz4/IDAfEAJcRdsB+v3+QRI7S1kxH0NDHitURzgQQRpmRUtyQi4jRTwwDzwYWjk5YBoaXTk3Whc8EDI9QyEuLj11JRQ0OjsaLgAAAAAEADH/twNyAzYABwAgADAAPAAAATMVIxUjETMDBy4BJw4BByc+Az0BIzUhFSMVFB4CBzIeAhUUDgIjIiY1NDYTMjY1NCYjIgYVFBYC7YWFUlKwJ05uHR10USozUzsgyQHhxh45UDtEbU0pKU1tRIqenopkcXFkZ29vAlRF9gId/k9AGWVDTnEdQRI7TFoxI0JCIyxSRjaTFis9Jyc+KxZXT05X/vY1MDA0NDAwNQAAAAMAMf+5A3IDNgAHACAAOwAAATMVIxUjETMDBy4BJw4BByc+Az0BIzUhFSMVFB4CFyMeAxcHLgMnDgMHJz4DNyM1IQLthYVSUrAnTm8eHHRRKTNTOiDIAeDFHzlQ8PoFMk1jNh8xWk09ExM9TlsyHjdjTTEF+gJKAlxF5wIG/llBGmRFS28dQhE5SlgvHUNDHCxSRTbiI0A0JQk/CCAtOiEiOS0fCD8IJTRAI0IAAAAAAgAs/7YDMgM4AAsAIwAAATMRIxEjESMRMxEzJRUUHgIXBy4BJwYHJz4DPQEjNSEVAuNPT3ZNTXb+WxgwSDAwQlwYL4syMEkxGa4BoAM4/H4B0/5ZA0H+qr1GPnJhTRk/JXxRvVQ+G1NpfERGQ0MAAAMAOP+2AyoDNgALACQAKgAAATMRIzUjFSMRMxUzDwEuAScOAQcnPgM9ASM1IRUjFRQeAgc1IREjNQLbT09xTU1x7yk/VBcXXEMrLEQvGKUBkp0XLEDzAltSAzb94u/qAgncyEAaWzlCZx1AEjpJUyssQkIrJ0xCNu5C/s/vAAAAAwA3/8oDRAM2AAsAJAAqAAABESMRMxEzETMRIxEPAS4BJw4BByc+Az0BIzUhFSMVFB4CAyEVIREzAmpNTXFPT+8pP1YXF1xCKyxFLxilAZKeFyxBjwIR/Z1SAeD+1gJw/v4BEv1fAUt8PxlcOkJqHT8TPkpSJz9CQj4nTEI1/phDAR0AAwA4/8IDTAM3AAsAJAAwAAABFSMRMxUzNTMRIzUPAS4BJw4BByc+Az0BIzUhFSMVFB4CAyEVITUhNSE1IRUhAmpNTXFPT+4nP1gYF11DKCtELhmkAZKfGC1BlgIf/ZAB/f4BAlD+AwIqxwHCuMr+JM90PxdVNj9gGkAQNUJLJyFCQiAkRTww/j5B3FRB0gAABAA4/8IDKgM2AAsAJAAoACwAAAEzESM1IxUjETMVMw8BLgEnDgEHJz4DPQEjNSEVIxUUHgIDESERJRUhNQLbT09xTU1x7ys/VBcXWUItLEQuGKQBkp4XLEHlAk3+AwGtAzb9+OfcAezNzD4ZWTlAZh0/EztIUSoqQ0MqKExCNP4mAT3+w/y6ugAAAAAEADj/wgMqAzcACwAkACwAMAAAATMRIzUjFSMRMxUzDwEuAScOAQcnPgM9ASM1IRUjFRQeAgU1MxEhETMVBTUhFQLbT09xTU1x7yo/VRcXWUItLEQuGKQBkp4XLEEBF1H9s1IBqv5WAzf+EdvUAda+yz4YWDxCZh0/EztJUiohQ0MhKE1CNPRq/qABYGqzc3MAAAAAAwA4/7oDWAM2AAsAJAA9AAABFSMRMxUzNTMRIxEPAS4BJw4BByc+Az0BIzUhFSMVFB4CFxUUHgIXBy4DJw4DByc+Az0BAmpNTXFPT+8rP1QXF1lCLSxELhikAZKeFyxBZzJUbjsfMmBSQhQVQVJeMx87bVQyAg/fAfXT5P2xASiOPxpZOUJmHT8TPEhSKi1DQy0oTEI0jRwrTz8sCUAJIjE/JSU/MSIJQAksP08rHAADADj/ugNwAzYACwAkAEoAAAEVIxEzFTM1MxEjNQ8BLgEnDgEHJz4DPQEjNSEVIxUUHgIXFRQeAhcHLgEnDgEHLgEnDgEHJz4DPQEzFRQWFz4DPQECak1NcU9P7ys/VBcXWUItLEQuGKQBkp4XLEH6GC9DKihDWxcVUj9AUhQYWz8pK0MvGE8+PyAvIA8CEtoB7dDh/fXnhT8aWDpAZx0/EztIUiopQkIpKExCNJYnJEQ7MA89GFg5N18aGVw5NlkYPQ8yPUMhJyc9dSUUNTk7GicAAAQAOP+3Ay4DNgALACIANgBCAAABFSMRMxUzNTMRIzUPAS4BJw4BByc+Az0BIzUhFSMVFBYXMh4CFRQOAiMiLgI1ND4CEzI2NTQmIyIGFRQWAmpNTXFPT+8rP1QXF1lCLSxELhikAZKeWWtFb04qKk5vRUVvTSoqTW9FZ3R0Z2dzcwIF1gH23e792/R+PxlaOkJmHT8TO0hTKihCQihTiKsWKTwnJzwqFhYqPCcnPCkW/vszMDAyMjAwMwAAAgAm/7cDdgM2AAsAJgAAASMVMxUjESMRMxUzJRUUHgIXBy4BJw4DByc+Az0BIzUhFQN2j4+PUlKP/e0kP1QxLUx3IA8vOkUlMzBWQCbNAeUCEMpE/rUDf+JDcjVuYk8XQiaRWzBaTD0TQBhTaHU5ckREAAADADH/tQNwAzYACwAkACoAAAEjFTMVIxUjETMVMwEHLgEnDgEHJz4DPQEjNSEVIxUUHgIFNSERIzUDcIODg1JSg/7OKUxwHR10TyszUzsgyQHhxh85Uf6YAkhSAmd8Q44CHIv+1kAaaEVMcR1AEjtMWjEkQkIjLFRIOepC/svzAAMAMv/KA3EDNwALACQAKgAAASMVMxUjFSMRMxUzAQcuAScOAQcnPgM9ASM1IRUjFRQeAgcVIRUhEQNxhISEUlKE/s0sS24dHXRPKjJTOyDHAd/GHzlR/AIE/aoCRZNExwKQrv7fPhtoRU5zHUESPU5bMClDQyktVUk5mNRDARcABgAv/7YDcQM2AAsAJAAsADcASwBXAAABIxUzFSMVIxEzFTMBBy4BJw4BByc+Az0BIzUhFSMVFB4CFxUzFSE1MzUFET4BNxcOASsBEQUyHgIVFA4CIyIuAjU0PgIXMjY1NCYjIgYVFBYDcYSEhFJShP7FKUlsHR12TyoyUzshxwHdxB83Toe4/j66/qYnXTANQHguKwHSJD0sGRksPSQkPSwZGSw9JCozMyoqMzMChmJCbQHBbv7pPxheP0lvHUAROUhULBNCQhIpS0AxZ1A9PVBC/vcCDRBCFQwBTWYSIC4dHC8hEhIhLxwdLiASwSUfHyQkHx8lAAADAC3/vwNxAzcACwAkADAAAAEjFTMVIxUjETMVMwEHLgEnDgEHJz4DPQEjNSEVIxUUHgIBFSEVITUhNSE1IRUDcYSEhFJShP7PJU5zHh14UigzVDwhyAHgxSA6Uf73Agj9qAHm/hcCOgKIZ0J2Ac5t/u9BF18/SGoaQBA1RVIsGUNDGChLPzH+n2g/5Fw/2AAEADH/wgNwAzcACwAkACgALAAAASMVMxUjFSMRMxUzAQcuAScOAQcnPgM9ASM1IRUjFRQeAgERIRElFSE1A3CDg4NSUoP+zShMcB0dc1EqM1M6IMgB4MUfOVD+rgIz/h0BkgJvekOLAhCF/tZBGmZFTHEdQhE7TFowIENDHy1TSDf+KgE8/sT7ubkAAAQAMf+3A28DNgALACQANABAAAABIxUzFSMVIxEzFTMBBy4BJw4BByc+Az0BIzUhFSMVFB4CBzIeAhUUDgIjIiY1NDYTMjY1NCYjIgYVFBYDb4KCglJSgv7OJ05uHR10USozUzsgyQHhxh45UDtEbU0pKU1tRIqenopkcXFkZ29vAmt6RJQCHYj+10AZZUNOcR1BEjtNWTAkQkIkK1JGNpMWKz0nJz4rFldPTlf+9jUwMDQ0MDA1AAADACz/tgMyAzgACwAkACgAAAEzESMRIxEjETMVMyUVFB4CFwcuAScOAQcnPgM9ASM1IRUTMzUjAuNPT3VOTnX+WhkwSDAwQlwYF11GMjBJMRmuAaCNdXUDOPx+AVL+2gNBzjVGPXNiTRk+JXxRXooqPxtTaXxERkND/sHHAAAAAAQAN//KA0QDNgALACQAKAAuAAABFSMRMxUzNTMRIzUPAS4BJw4BByc+Az0BIzUhFSMVFB4CJSMVMwEhFSERMwJqTU1xT0/vKT9WFxdcQissRS8YpQGSnhcsQQEZcXH+WAIR/Z1SAW64AnCgsP1f2Qs/Glo8QmoeQBM9SVIoQEJCPydMQjXPkv5cQwEdAAAAAAQAOP/CA0wDNgALACQAKAA0AAABFSMRMxUzNTMRIzUPAS4BJw4BByc+Az0BIzUhFSMVFB4CJSMVMwEhFSE1ITUhNSEVIQJqTU1xT0/uJz9YGBddQygrRC4ZpAGSnxgtQQEYcXH+UgIf/ZAB/f4BAlD+AwHRbgHCaXr+JHcbQBhUNj9fGkAQNEJMJyFCQiAkRTwwtWf98EHcVEHSAAUAN/++AysDNgALACQAKAAwADQAAAEzESM1IxUjETMVMwMHLgEnDgEHJz4DPQEjNSEVIxUUHgI3MzUjEzUzESERMxUFNSEVAt5NTXhNTXj0J0BXFxdaQC0rQy8YpAGQmxctQKV4eHFU/a5UAar+VgM2/hhvaAHRZf7qQRhXOT9kHT4SOERMJiZDQycjRTwxR3v+O2n+ngFiabV0dAAAAAACAC7/tQMYAzcABwAiAAABMxEjESM1MyUVFB4CFwcuAycOAQcnPgM9ASM1IRUCxlJSwsL+pSVAVTExJUU7Lw8eeU0wMFVBJcsB6QM3/H4B+UOnaDdyZVEXQBM6SVYuZKApQRhUaXc8aENDAAADADj/tQMXAzcABwAgACYAAAEzESM1IzUzDwEuAScOAQcnPgM9ASM1IRUjFRQeAgU1IREjNQLFUlKvr38pS3AeHXVPKzJTPCHIAd/FIDlQ/qsCV1IDN/3n7EPMQBtqRk51HUESPE5aMCRDQyQrVEk550L+yPYAAAADADj/ygMxAzYABwAgACYAAAEzNTMRIxEjFwcuAScOAQcnPgM9ASM1IRUjFRQeAgMhFSERMwIRtFNTtDUpS3AdHXZPKzJTPCHIAd/FIDlQ6AIE/alTAj/3/W8BV5BAG2tFTnQdQBI9TVowLUNDLCtVSTn+kEMBFQADACz/wgMjAzcABwAgACgAAAEzNTMRIzUjFwcuAScOAQcnPgM9ASM1IRUjFRQeAgMhFSERIRUhAge3U1O3MyxLbR0ddE8tNFM7IMUB3cUfOVD0Ag79oAJZ/fkCVuH98uiMQBtlQkttHUEROkxbMh5FRSYrUkY3/m9CATpCAAAAAAMAOP/AAzkDNgAHACAALAAAATM1MxEjNSMXBy4BJw4BByc+Az0BIzUhFSMVFB4CAyEVITUhNSE1IRUhAhSxUlKxLydMcR0ddU8pMVI8IccB4MYfOVDrAhH9ngHv/g8CQv4RAm7I/jHFekAYZEJIcBtAETlIVCsYQkIYKE5DNP5AQeFZQNcAAAAEACz/ugMSAzYABwAgADUAOwAAATM1MxEjNSMXBy4BJw4BByc+Az0BIzUhFSMVFB4CARUyPgI3Fw4DKwE1MzUjNSEVNyERIxEjAgi2U1O2MStLbB0ddE8uM1Q7IMUB3MQfOVD+6idFQkMkBihKSk8tNtrcAS4kASJUzgJ2wP4zx3s/GV9CSWocQRA3SVcwDUNDESpQQzT+nWQBBAcGPwcIAwHhV0HV1f6EATkABQA4/7wDFwM2AAcAIAA0ADgAPAAAATMRIzUjNTMPAS4BJw4BByc+Az0BIzUhFSMVFB4CARUyPgI3Fw4CKwE1MzUjNSEVFxEhEQMVMzUCxVJSsbGCJ0xxHR11TykxUjwhxwHgxiA5T/7fJDs2MxsIHzo+I4DQ0wEiNgEf148DNv4nyEO7QBlkQklwG0AROUlTKxhCQhgoTUM0/qZlAQMGBT4GBwPfVj7PpwF2/ooBOfz8AAAABAA4/8IDGAM3AAcAIAAkACgAAAEzESM1IzUzDwEuAScOAQcnPgM9ASM1IRUjFRQeAgERIRElFSE1AsVTU7GxfylLcB0ddk8rMlM8IcgB38UgOVD+vAJH/gkBpwM3/fPoRM9AG2tFTnQdQBI9TVowIkNDIStVSTn+KgE8/sT7ubkAAAAABAA4/8IDFwM2AAcAIAAoACwAAAEzESM1IzUzDwEuAScOAQcnPgM9ASM1IRUjFRQeAhc1MxEhETMVBTUhFQLFUlKxsX8pS3AeHXVPKzJTPCHIAd/FIDlQsVH9wlEBnP5kAzb+GspDx0EcakVOdB5BEjxNWzAXQ0MXK1NJOfFu/p4BYm6xcXEAAAMAOP+6A04DNwAHACAAOQAAATM1MxEjESMXBy4BJw4BByc+Az0BIzUhFSMVFB4CFxUUHgIXBy4DJw4DByc+Az0BAhOzUlKzMylLcB0ddk8rMlM8IcgB38UgOVAMMVNtPCAzX1FAFBRBUV8yITxtUzICVuH9mwFAjUEcakVPdx1BEj5OXDAkQ0MjK1VJOYUeL1JBLQpACSMyQScnQDMjCUAKLkFSLh4AAAQAOP+2AxoDNgAHACAANABAAAABMzUzESM1IxcHLgEnDgEHJz4DPQEjNSEVIxUUHgIHMh4CFRQOAiMiLgI1ND4CEzI2NTQmIyIGFRQWAhSxU1OxMilLcB0ddk8rMlM8IcgB38UgOVAlRW5OKSlObkVFb00qKk1vRWdycmdncnICTuj96uuJQBtqRU54HkESPk9cMB9CQh8rVEk5jxYrPigoPisWFis+KCg+Kxb+8jYxMTc3MTE2AAADADj/uQNFAzcABwAgADsAAAEzNTMRIzUjFwcuAScOAQcnPgM9ASM1IRUjFRQeAgUjHgMXBy4DJw4DByc+AzcjNSECFLFTU7EyKktvHR12TysyUzwhyAHfxSA5UAEP/QMxTmU3HjFcTj0TEz1OXDEeOGVOMAP6Ak0CWd79/OOKQBxqRU51HUASPU5aMB1DQxwrVUk53SNCNicIPQgfLDkhIjgsHwg9CCY2QiRCAAAAAAMAKv+3Ay8DOAADAAsAJAAAATMRIwMRMxEjESM1JxUUHgIXBy4BJw4BByc+Az0BIzUhFQLgT0+0Tk6UXBkwSC4yQlsXF19DMi9JMhmqAZkDOPx/Aj4BLvzCAc1DllE6c2VSGjwnh1helCo9HFdqeD5RQ0MABAA5/7UDKgM2AAMACwAkACoAAAEzESMBMzUzESM1IxcHLgEnDgEHJz4DPQEjNSEVIxUUHgIHNSERIzUC209P/syHTk6HRik/VhcXW0IrK0QuGaUBjpoXLUH0AltSAzb93AE+0/329JE/G1w8QmkdPxM8SVEoM0NDMiVLQzjmQv7L8wAABAA5/8oDRAM3AAMACwAkACoAAAERIxEFMzUzESMRIxcHLgEnDgEHJz4DPQEjNSEVIxUUHgIDIRUhETMDKk/+zYZOToZGKj9WGBdaQisrRC4ZpQGOmhctQpECEf2dUgM3/V0Co/nl/YkBT4w/Glw8QmgdPxM8SFEpNENDNCZLQjf+jEMBHAAAAAQAOf/CA0wDNgADAAsAJAAwAAABESMRBTM1MxEjNSMXBy4BJw4BByc+Az0BIzUhFSMVFB4CAyEVITUhNSE1IRUhAypP/s6FTk6FRCc/WBgXW0IqK0QuGaUBjpoYLUGXAh/9kAH9/gECUP4DAzb+IgHeyrj+Pcl6PxpbOT9lHT8SOEVNJh1DQx0iSEA1/kNB3FJAzwAFADn/wgMqAzYAAwALACQAKAAsAAABMxEjATM1MxEjNSMXBy4BJw4BByc+Az0BIzUhFSMVFB4CAxEhESUVITUC209P/s2GTk6GRSk/VhgXWkIrK0QuGaUBjpoXLUHmAk3+AwGtAzb97AE4zv4D7I8/Glw8QmgdPxM8SFEpLkNDLiVLRDf+KQE2/sr1s7MAAAAFADn/wgMqAzcAAwALACQALAAwAAABMxEjATM1MxEjNSMXBy4BJw4BByc+Az0BIzUhFSMVFB4CBTUzESERMxUFNSEVAttPT/7Nhk5OhkUpP1YXF1tCKytELhmlAY6aFy1BARZR/bNSAar+VgM3/hIBG8T+KNGHPxpdPEJpHT8TPElRKCNDQyImS0M39Gr+oAFgarNzcwAAAAQAOf+6A1gDNgADAAsAJAA9AAABESMRBTM1MxEjNSMXBy4BJw4BByc+Az0BIzUhFSMVFB4CFxUUHgIXBy4DJw4DByc+Az0BAypP/s2GTk6GRCg/VhcXWkIsLEQuGKUBjpoXLUBmM1RuOx8yYFNBFBVBUl8yHzttVDIDNv2kAlzq2/4F3Y1BGl46QmwePxM9S1MpMkNDMiVLQzeGHixPPywJQAkiMT4lJT4xIglACSw/TyweAAUAOf+3Ay4DNgADAAsAJAA4AEQAAAERIxEFMzUzESM1IxcHLgEnDgEHJz4DPQEjNSEVIxUUHgIXMh4CFRQOAiMiLgI1ND4CEzI2NTQmIyIGFRQWAypP/s2GTk6GRSk/VRgXWkIsLEQuGKUBjpoXLUE/RW9OKipOb0VFb04pKU5vRWd0dGdnc3MDNv3TAi3f0f4E548/Gl05Qm0dPhQ9S1MqLUJCLSVLRDeZFio8Jic8KhYWKjwnJjwqFv77MzAwMjIwMDMAAAAAAgAu/7cDGAM2AAsAJgAAATMRIxEjNTM1IzUzJRUUHgIXBy4BJw4DByc+Az0BIzUhFQLGUlK0tLS0/qUlP1QwMEt1IA4tO0QlNjBVQSXKAeUDNvyBAYFEe0RdaDVwZlQZPyiXXjNdTz8UPhhWa3k8aENDAAADADj/ygMxAzYACwAkACoAAAEzNTMRIzUjNTM1IxcHLgEnDgEHJz4DPQEjNSEVIxUUHgIDIRUhETMCGaxTU6ysrCwqTG4dHXVPKzNTPCDHAd3EHzlQ5wIE/alTAnbA/W/tQ17gQB1rSE5zHUASPU5dMjdDQzcuV0s8/qhDARUAAAMAOP/CAzkDNgALACQAMAAAATM1MxEjNSM1MzUjFwcuAScOAQcnPgM9ASM1IRUjFRQeAgMhFSE1ITUhNSEVIQIgpVJSpaWlIidObh0ddk4pMVI8IccB3sQfOU/qAhH9ngHv/g8CQv4RAqKU/ix2QkazQBpmRUhxGz8ROklUKxZCQhYqT0Q2/kZB3VZB1AAAAAQALP/CAxEDNwALACQAKAAsAAABMxEjNSM1MzUjNTMDBy4BJw4BByc+Az0BIzUhFSMVFB4CAREhESUVITUCvlNTubm5uYUsS2wdHXNPLjRTOyDFAdzDHzhQ/sECR/4KAaYDN/3ykURQQv7uQBxmRUxvHUESO01cMx5FRScsVEg4/jQBOv7G+be3AAAABAA4/8IDFwM2AAsAJAAsADAAAAEzESM1IzUzNSM1MwMHLgEnDgEHJz4DPQEjNSEVIxUUHgIXNTMRIREzFQU1IRUCxVJSpqampn8pTHAdHXVPKzNTOyHIAd7EIDlQsVH9wlEBnP5kAzb+F3dDTkL+90AaaEVLcR1AEjpLWTElQ0MlK1RIOOlu/p8BYW6wcHAAAwA5/7kDawM3AAsAJABKAAABMzUzESM1IzUzNSMXBy4BJw4BByc+Az0BIzUhFSMVFB4CFxUUHgIXBy4BJw4BBy4BJw4BByc+Az0BMxUUFhc+Az0BAiKjU1Ojo6MkKUxvHR1zUSszUzsgxwHexCA5UKEYLkMrKUJbFxVSP0JRFBhaPyorQy8YTz4/IDAgDwKNqv3zjUJS0EAcZ0VOcR1BEjtLWTEuQ0MtLFNIOH4uIkU8MQ88GFk5N2AbGlw5NlkYPBAyPUMhLi49dSUUNTk7Gi4AAAAEADn/twMbAzYACwAkADgARAAAATM1MxEjNSM1MzUjFwcuAScOAQcnPgM9ASM1IRUjFRQeAgcyHgIVFA4CIyIuAjU0PgITMjY1NCYjIgYVFBYCIqNTU6OjoyQoS3AdHXRRKzNTOyDHAd7EIDlQJkVvTikpTm9FRW9OKSlOb0VncnJnZ3JyAoWx/ducQlTIQRpmQ05yHkISO0tZMS1DQywrUkU3ixYqPScnPioWFio+Jyc9Khb+9zUwMDU1MDA1AAADACr/tgMvAzcAAwAPACgAAAEzESMDNTMRIxEjNTM1IzUnFRQeAhcHLgEnDgEHJz4DPQEjNSEVAuBPT7NNTYODg24ZMUcuMkJbFxdfQzIvSTIZqgGZAzf8fwKE6PzCAV9DcERUWzxzZVIbPSiIWF6SKz4cV2t4PVtDQwAAAgA1ACkDYwLlABwAJAAAEyc+Az0BITUhFSEVFB4CFwcuAycOAwUhFSE1ITUzfyM6dF06/tcCp/7XOl51OiEzZlpIFRVIWWUBRAFu/NIBblIBJkMKNk5iNhNDQxM2YU41CUIKKz1OLi9PPivERETZAAMANf+1A2MDEwAaACIAKAAAEyc+AzchNSEVIR4DFwcuAycOAwUhFSE1ITUzATUhESM1gR47bVU0Av7pApj+6QI0VG47HTdnV0MTE0JWZwE6AXD80gFsUv6cAm1SAcpAByM0QiZDQyZCNCMHQAcfLj4lJT4uH1xDQ4f+m0L+3OIAAwA0/8oDYwMLABwAJAAqAAATJz4DPQEhNSEVIRUUHgIXBy4DJw4DBSEVITUhNTMBFSEVITWFHzxuVDL+6QKY/ukyVG48HzZmVkISEkJWZgE4AXD80QFtUv78Ahf9lwGpQggoOkkpAkJCAilJOigIQggjM0EnJ0EzI15DQ5X+37pD/QAAAwA0/8ADYAMZABoAIgAuAAATJz4DNyE1IRUhHgMXBy4DJw4DBSEVITUhNTMBFSEVITUhNSE1IRV6GztsVTYE/uoCmP7qBDZUbDoaOGpZQxISQ1lqAUEBbPzUAW5S/vUCKv2GAg797wJiAew+BR4uOyJBQSI7Lh4FPgYcKzokJDorHERCQm3+O1c/01I+zQAABQA1/8ADXwMVABoAIgA2ADoAPgAAEyc+AzchNSEVIR4DFwcuAycOAwUhFSE1ITUzARUyPgI3Fw4CKwE1MzUjNSEVFxEhEQMVMzV7GzpsVTYE/usClv7rBDZUbDobOGlZQxISQ1lqAUABbPzWAWxS/ucnPjYyGgceNz4khNDSAR85ASHakwHnPwUeLjsiQUEiOy4eBT8GHCw6JCQ6LBxEQkJu/kBZAQMGBT0GBwPRUD3HlwFe/qIBIuXlAAAEADX/wgNgAxYAGgAiACYAKgAAEyc+AzchNSEVIR4DFwcuAycOAwUhFSE1ITUzAREhESUVITWAHjttVDUD/uoCl/7pAzVUbTsdN2hXQxMTQ1dnATwBbfzVAWxS/qYCZP3sAcQB00EGIjJBJUJCJUEyIgZBBh8uPSUlPS4fVkJCff3CASL+3uGfnwAAAAQANP/CA2ADFwAaACIAKgAuAAATJz4DNyE1IRUhHgMXBy4DJw4DBSEVITUhNTMTNTMRIREzFQU1IRV+HTpsVDYE/uoCmP7qBDVUbDodN2hXQxMTQ1doAT4BbPzUAW5SslH9pFEBuv5GAdtBBiAwPyRCQiQ/MCAGQQceLTwlJTwuHlNDQ3r+qmL+rgFSYq5ubgAAAAADADX/ugNgAw8AGgAiADsAABMnPgM3ITUhFSEeAxcHLgMnDgMFIRUhNSE1MxMVFB4CFwcuAycOAwcnPgM9AYAeO2xVNQP+6QKY/ukDNVRtOx03aFdDExNDV2cBPAFt/NUBbFIBMFJuPR8zYFFAFBRAUWAzHz5tUjABy0EGIjJBJUNDJUEyIgZBBx8uPCUlPC4fWEJCg/7+HC1MOykJPwggLjwkJDwuIAg/CSk7TC0cAAQANf+3A2ADDgAaACIALgA6AAATJz4DNyE1IRUhHgMXBy4DJw4DBSEVITUhNTMDMhYVFAYjIiY1NDYXMjY1NCYjIgYVFBaAHjttVDUD/uoCl/7pAzVUbTsdN2hXQxMTQ1dnATwBbfzVAWxSKZGiopGRoqKRanZ2am1zcwHMQQYhMkElQkIlQTIhBkEGHi89JCQ9Lx5aQkKB/vNPS0tQUEtLT/YvLS0uLi0tLwADADX/ugNgAxcAGgAiAD0AABMnPgM3ITUhFSEeAxcHLgMnDgMFIRUhNSE1MwEhHgMXBy4DJw4DByc+AzchNSGAHjttVDUD/ukCmP7pAzVUbTsdN2hXQxMTQ1dnATwBbfzVAWxSAQ7++Ag2UWY3HjRgU0EUFEFTYDMeOGVRNgj+9wJsAdVBBiIyQCVCQiVAMiIGQQYfLj0kJD0uH0lDQ3j+riVAMSIHPwgeLTskJDstHgg/ByIxQCVCAAAAAAMAN/+6A2IDFQAaACIAQQAAEyc+AzchNSEVIR4DFwcuAycOAwUhFSE1ITUzASMeAxcHLgMnDgMHJz4DNyM1ITUzFSF7GzpsVTYE/uoCmP7qBDZVbDobOGpZQxISQ1lpAUABbvzVAWpTAQH+CDZPYzUcMl5RQBQUP1FfMxw3ZE8zB/4BAlIBAgHnPwUeLjsiQUEiOy4eBT8GHCw6JCQ6LBxLQkJ6/oogOi8gBj0HHSo2HyE2KRwHPQYfLjoiQVVVAAUANf+xA2EDGwAaACIAKgA2AEIAABMnPgM3ITUhFSEeAxcHLgMnDgMFIRUhNSE1MxcVIRUhNSE1FzIWFRQGIyImNTQ2FzI2NTQmIyIGFRQWexs7bFQ2BP7rApb+6wQ1VGw7GjlpWUMSEkNZaQE/AW781AFsUgEBIf1rASIohoiIhoaHh4ZbX19bW15eAfY+BR0rOSFAQCE5LBwFPgUbKjkiIjkqGzhCQmrQVD8/VL88PDo7Ozo8PLUfHiAeHiAeHwAAAAADACv/twN1AzgABwAgADAAAAEVIxEjETMRBSc+Az0BIzUhFSMVFB4CFwcuAScOATcVPgE3Fw4DIycyNjc1A3WOUlL9fCoyUzwhxwHhxyA7UTEnTnMdHXe8PXg5B0iVkIY6CzZ5QgHDRf45A4H+i3pAEDZGVC4KQ0MKK09DNA8/GGJFSGsKsgMJCT0NDgYBRAECtQAABAA0/7YDcAM2AAcAIAAwADYAAAEVIxEjETMVBSc+Az0BIzUhFSMVFB4CFwcuAScOAQUXDgMjJzI2NzUzFT4BBTUhESM1A3CEUlL9eSEyUDkfvQHOvx84Ty8hTnEdHXUBqwVFko+HOwo2dT9SP3n+fAJIUgI6RP7/AkH8iT8KJjM+IQtCQgseOS8kCUARSzM5UEI8DA8HA0QCAn15AwryQv7r0wAEADT/wANwAzcABwAeAC4AOgAAATMVIxUjETMBJz4DNyM1IRUjHgMXBy4BJw4BBRcOAyMnMjY3NTMVPgEBFSEVITUhNSE1IRUC7ISEUlL9eiEvTjkhAr0Bz8ACITdNLSFMcx0cdAGqBUaSj4Y7CjR3P1I9ev7UAhT9mwHy/gwCRQJjROAB+P6oPgokMDgeQkIdNS0hCT8RSzM3Tzk6DA4GAkEBAm5rAwr+oVM/z0s+xgAAAAAFADP/wgNwAzYABwAgADAAOAA8AAABFSMVIxEzFQUnPgM9ASM1IRUjFRQeAhcHLgEnDgEFFw4DIycyNjc1MxU+ARc1MxEhETMVBTUhFQNwhFJS/XggMVA5IL4Bz78fOU8vIU5yHR11AasFRZKPhzsLNnY/Uj95c1H9xVEBmf5nAk9F3QIJ54JACiUyPB8DQkIDHjguIwo+EUkzN1E9OgwPBwNCAgJzcAQK9GD+vAFEYKJjYwAEADT/uQNwAzYABwAgADAARwAAATMVIxEjETMBJz4DPQEjNSEVIxUUHgIXBy4BJw4BBRcOAyMnMjY3NTMVPgEHFRQeAhcHLgEnDgMHJz4DPQEC7ISEUlL9eCAyUDkfvQHOvx84Ty8gTnEeHXYBrAVFkpCHOgo0dkBSP3klL1JtPR5npSoUQFFfMx8+bVIvAidE/uYCbf6FPgolMjsfDUJCDRw3LyMJPhFHMzdQSDwMDwgDQwIDgHwDC4gfK0k5JwhAEVdFIjksHghACCc5SSsfAAAAAAUANP+4A3ADNgAHACAAMAA8AEgAAAEzFSMRIxEzASc+Az0BIzUhFSMVFB4CFwcuAScOAQUXDgMjJzI2NzUzFT4BBzIWFRQGIyImNTQ2FzI2NTQmIyIGFRQWAuyEhFJS/XkhMlA5H70Bzr8fOE8vIU5xHR11AasFRZKPhzsKNnU/Uj95XoycnIyMnJyMZ29vZ2dvbwI4Rf78Akf+hj8KJTI8HwlCQgkdNy4jCT8RSDM3UUY8DA8HA0QCAnx4AwqYT0lLTU1LSU/xLisqLy8qKy4AAAAAAwAq/7YDJwM3AAsAJAA0AAABMxEjESMRIxEzETMFJz4DPQEjNSEVIxUUHgIXBy4BJw4BNxU+ATcXDgMjJzI2NzUC2U5ObE1NbP2DKCxHMRunAZeiGS9DKidCWhgYYp8xXioFN3t5cS0LKmY5Azf8fwHI/mcDPv6fbT4PMDxGJCVCQiQhQDgsDj0WUDQ6XAmyAwcHPAsMBgJEAQK1AAAAAAQAOP/QA0sDNwALACIAMQA3AAABESMRMxEzETMRIxEFJz4BPQEjNSEVIxUUHgIXBy4BJw4BBRcOAyMnMjY3NTMVNgMhFSERMwJ3Tk5sTk79gyVVX5oBiZoZLkIoJEJbGBdgAVUHM3Z5dDAJKmI0T2KPAjH9e1QB1P7gAnP+8QEf/WABPSg/FGRCFkJCFhw1LSIJQBFELjZKWT4HCwgESAICdXEE/rVDAQAAAAAEADD/uQNpAzcACwAiADIAWAAAARUjETMVMzUzESM1BSc+AzUjNSEVIxQeAhcHLgEnDgEFFw4DIycyNjc1MxU+ARcVFB4CFwcuAScOAQcuAScOAQcnPgM9ATMVFBYXPgM9AQJvTk5rTk79iCQqQy8anQGJnRkvQCckP1oYF18BTwY2eXhuLAsqZDdPMFjoGS5EKiZFWhcUUz9AUhQXXEInK0MvGE8+PyAwHxAB+uYCFOv6/dLxRD8MKTQ8H0JCHDcwJgs+E0kwNlJGOQsNBgJCAQJvbAMImRQiQTgtDTwXVDY2WhkZWTY2Uxc8Di05QCEUFDlvJBIwNjkbFAAFADD/twMtAzYACwAiADIAPgBKAAABFSMRMxUzNTMRIxEFJz4DNyM1IRUjHgMXBy4BJw4BBRcOAyMnMjY3NTMVPgEXMhYVFAYjIiY1NDYXMjY1NCYjIgYVFBYCb05Oa05O/YQkKUIwGwGdAYmdARouQCcjQFoZF2ABUwY3eXhuLAooZDdNMFwulZ6hkpKhnpVtc3NtbXNzAfXtAiDw/v2vARA8PwwnMjoeQ0MbNC4kCj4TRy42UFI6Cw0HAkIBAnp2AwiVTElITExISUzqKyoqLS0qKisAAAADADr/tQMQAzcAAwAcACwAAAEzESMBJz4DPQEjNSEVIxUUHgIXBy4BJw4BNxU+ATcXDgMjJzI2NzUCvlJS/bIoM1Y+I80B7c4iPVQzKE94Hx55wECBPQdLnJaMPAs3fUUDN/x+AZU/EDVFUy4KQ0MKKk9BMg5CGGFFSWkMsQMLCjwOEAcCRAECtQAAAAQAOf/KAzADNwADABwALAAyAAABESMRASc+Az0BIzUhFSMVFB4CFwcuAScOAQUXDgMjJzI2NzUzFT4BASEVITUzAxNS/bchMlE6H8QB1b4gOU8wIU5zHh10Aa0FSZeTizwMOXxFUz95/t4CFP2aUgM3/VgCqP5mPwsoNkAjEUJCESA7MiUKPhFMNjxUTTwMDggCRAEChoMECf6yQ/UAAAAEADv/wAM0AzYAAwAaACoANgAAAREjEQEnPgM3IzUhFSMeAxcHLgEnDgEFFw4DIycyNjc1MxU+AQEhFSE1ITUhNSEVIQMTUv2xHx9KQi4DwQHWwgMjOU0tHU93HR13AbUGSZeUjD0KOXtCUkB9/tYCHv2SAf3+AAJQ/gMDNv4YAej+tz8FGCg4JUFBGS8nHQc+DkMwNks5OgwOBgJAAQJ0cAMK/kRA1FA/zAAABQA7/8IDEwM2AAMAHAAsADAANAAAATMRIyUnPgM9ASM1IRUjFRQeAhcHLgEnDgEFFw4DIycyNjc1MxU+AQERIRElFSE1AsFSUv21HzFROiDDAdS+IDpQLx9Odh0ddwGvBkeWlIw+Cjl+QlI/e/6JAkr+BgGqAzb90rY+CiUwOx8MQkIMHjUrIQk+D0UzOU5EOwsOCANCAgKAfAMK/j8BG/7l2piYAAAABQA7/8IDEwM2AAMAHAAsADQAOAAAATMRIyUnPgM9ASM1IRUjFRQeAhcHLgEnDgEFFw4DIycyNjc1MxU+ARc1MxEhETMVBTUhFQLBUlL9tB8xUTsgwwHUviE6UC8fTnYeHXgBsAZJmJOLPAo5fUNSP3mFUP21UQGq/lYDNv33oj8JIzA5HwlCQgkcNSsgCD8QRjE3Tz06DQ8HAkIBAndzAwryXf69AUNdpGVlAAQAOv+5Az0DNwADABwALABFAAABESMRASc+Az0BIzUhFSMVFB4CFwcuAScOAQUXDgMjJzI2NzUzFT4BBxUUHgIXBy4DJw4DByc+Az0BAxRS/bQgMVE7IMQB1b4gOlAvH091Hh12Aa8GS5mTiTsLN35FUj95LDBSbTwdM19RQBQUQFFfMx08bVEwAzf9fgKC/oA+CiUxOh8NQ0MNHTYrIQg/D0YzOU9GOg4PCAFCAQKEgQQKhR8qSTonCD8IHi06IyM6LR4IPwgnOkkqHwAAAAAFADv/twMYAzcAAwAcACwAOABEAAABESMRASc+Az0BIzUhFSMVFB4CFwcuAScOAQUXDgMjJzI2NzUzFT4BBzIWFRQGIyImNTQ2FzI2NTQmIyIGFRQWAxRS/bcjMVE5IMIB2MQfOU8vIU5xHh10AbEGSJeUiz0LN31CUz98UZCampCQmZmQZ3FxZ2dwcAM3/bsCRf6DPgomMjwgBkJCBh43LyMJPxFIMzlPQzwMDwkDRAICdnIEC5lNS0tNTUtLTfAtKysuLisrLQAAAAACADQAJgNjAucAHAAoAAATJz4DPQEhNSEVIRUUHgIXBy4DJw4DBTMVITUzNTMVMzUzfiI6dF06/tYCqP7XOl51OiEzZlpIFRZHWWUB1N780d5Sz1IBL0EKNk5iNg5DQw42YU41CUEKKj1OLi5PPivPRETLy8sAAAADADT/swNjAxcAGgAmACwAABMnPgM3ITUhFSEeAxcHLgMnDgMFMxUhNTM1MxUzNTMBNSERIzWAHjpsVDYE/ukCmP7pBDVUbDodN2hXQxITQ1dnAcri/NHgUshT/g4CbVIB00EGIzNBJEJCJEEzIwZBBx8vPiUlPi8fakNDd3d3/qZC/uTaAAAAAwA0/8oDYwMNABoAJgAsAAATJz4DNyE1IRUhHgMXBy4DJw4DBTMVITUzNTMVMzUzARUhFSE1hR87bFQzAv7pApj+6QIzVGw7HzZmVkISEkJWZgHG4vzR4FLIU/5uAhf9lwGyQggnOUcoQkIoRzknCEIIIjNCJydCMyJpQ0N2dnb+/7lD/AAAAAQANf+2A2ADEAAaACYAMgA+AAATJz4DNyE1IRUhHgMXBy4DJw4DBTMVITUzNTMVMzUzBzIWFRQGIyImNTQ2FzI2NTQmIyIGFRQWgB47bVQ1A/7qApf+6QM1VG07HTdoWEMSE0NXZwHK3/zV31LIU7eSoaGSkqGhkm1zc21tc3MBz0EGIjJAJEJCJEAyIgZBBx4uPCUlPC0fYUJCbm5u+E9LS1BQS0tP9i8tLS4uLS0vAAAAAAIANv+2A2EC/wAcACQAABMnPgM9ASE1IRUhFRQeAhcHLgMnDgMFFyERIxEhNYUfO29YNf7lAo/+5zVYcTsgNGRWRBQVRFVjAqYB/pFS/pYBg0EJLUFRLAVCQgUsUUEtCUEJJDVDKChDNSRUQ/7BAT9DAAAAAgA1/7UDYwMTABoAKAAAEyc+AzchNSEVIR4DFwcuAycOAwUhFSERIzUhNSE1ITUhgR47bVU0Av7pApj+6QI0VG47HTdnV0MTE0JWZwKq/pEBCFL95QET/pMDLgHKQAcjNEImQ0MmQjQjB0AHHy4+JSU+Lh+Cd/7d4UJ3QgAAAAADADP/ygNhAwoAHAAkACoAABMnPgM9ASE1IRUhFRQeAhcHLgMnDgMHIRUhFSM1IRcVIRUhNYUfPG5UMv7pApj+6TJUbjseN2ZWQRISQlZmiAMu/plS/ou6Ahr9lAGqQggoOUkpAUJCASlJOicIQggjM0EnJ0EzI0lCtrZfu0P+AAIANP/AA2ADGAAaAC4AABMnPgM3ITUhFSEeAxcHLgMnDgMFIRUhFSEVIRUhNSE1ITUhNSE1IXoaPG1WNgX+5QKY/uUENlZtPBo3aFhFFBRFWGgCrv6UAQT98QIq/YYCDv3vAQv+kwMsAe0+BR4tOiJBQSI6LR4FPgUaKTchITcpGnNZzlk/01U+WUIABAA1/68DXwMUABoAIgA3AD0AABMnPgM3ITUhFSEeAxcHLgMnDgMHIRUhFSM1IRMVMj4CNxcOAysBNTM1IzUhFTc1IREjEXsaO21WNgX+5gKW/uUENlZtPBo3aFhEFBREWWh9Ayr+k1H+lKgyTkI7HwchQElYOTfY2gEpMAEdUQHoPwUdLTsiQUEiOy0dBT8FGik3IiI3KRo6QmNj/ttVAgQJBzwICQUBy0w8wX5D/qIBGwAAAwA1/8ADXwMWABoAOgA+AAATJz4DNyE1IRUhHgMXBy4DJw4DBSEVIREhESMVIxUyPgI3Fw4CKwE1MzUjNSE1ITUhBRUzNXsaO21WNgX+5gKW/uUEN1ZuOho3aFhEFBREWWgCrf6TARH+4DjRJz82MhoGHjg+JIPR0wEW/pQDKv7KlAHqPwUeLToiQUEiOi0eBT8GGik2IiI2KBt2Yf6nAVK9WAEDBgU8BgcDz009YUHf398AAwA1/8IDYAMUABoAJgAqAAATJz4DNyE1IRUhHgMXBy4DJw4DBSEVIREhESE1ITUhAzUhFYAdO21UNAP+6gKX/ukDNFRtOx03Z1dDExJDV2gCqf6UAQn9nAEJ/pMDK7P+PAHPQQciM0ElQkIlQTMiB0EHHy4+JSU+Lh9+cf7bASVxQv5qoqIAAAQANP/CA2ADFwAaACIAKgAuAAATJz4DNyE1IRUhHgMXBy4DJw4DByEVIRUjNSEFNTMRIREzFQU1IRV/HjtsVDUE/uoCmP7qBDVUbDodN2hXQxMSQ1hoggMs/pRT/pMCclH9pFEBuv5GAdpABiExPyRCQiQ/MSEGQAYeLzwkJTwuHj5CfX2uaP6oAVhorm5uAAMANf+6A2MDFAAaACIAOQAAEyc+AzchNSEVIR4DFwcuAycOAwchFSEVIzUhBRUUHgIXBy4DJw4BByc+Az0BgR07bFQ0A/7pApf+6QM1VG07HjdnV0ITEkNXZ4MDLv6PUf6UAb8xUm49GzRiU0EUKqhsGjxuUzEBz0EHIjNBJUJCJUEzIgdBBx8uPSUlPS4fPEJtbZMXJD4wHwY9BhkmMyBCTAo9BiAwPSQXAAADADX/twNgAw4AGgAtADkAABMnPgM3ITUhFSEeAxcHLgMnDgMFIRUeARUUBiMiJjU0Njc1ITUhAzQmIyIGFRQWMzI2gB07bVQ0A/7qApf+6QM0VG07HTdnV0MTEkNXaAKp/pSBiKGRkKSJgf6UAyu2dmpqdnZqanYByUEHIjNBJUJCJUEzIgdBBx8uPiUlPi4ff2AGUEZOUFFNRlAGYEL+wi0xMS0tMjIAAAAAAwAx/7YDFgM2AAcAIAAwAAABMxEjNSM1MyUnPgM9ASM1IRUjFRQeAhcHLgEnDgEFFw4BBxEjEQ4BIycyPgICxFJSysr9rCMyUTsgwQHYxCE6UTAhT3UeHXkBvgZChkJSQHc2Cz+RmZwDNvyA2EDSPwomND4iEEJCEB86MCQKPhFKNjpTPD0LDwP+tgFFAgJEAgYMAAQAMP+5A2UDNwAHAB4ALgBUAAABMxEzESM1IyUnPgM1IzUhFSMUHgIXBy4BJw4BFzUOASMnMj4CNxcOAQcVBRUUHgIXBy4BJw4BBy4BJw4BByc+Az0BMxUUHgIXPgE9AQINtVJStf5hHjFROyHCAdfDITtRLxxRdx4demM/djYLP4+VlkcGP4A/ATgYL0MrJ0JdFxRTQEBSFBhcQiYqRC4ZUBAfLx8/QAFjAdT9wjDKPQcdKDIbQEAZLCQaBjwNPC0zRv+HAgFCAQUJCDkJDASLJBAhQDcsDTwWUTY2VxgYVjY2UBY8DS03QCAQEBs4NS8RJG03EAAABAAp/7YDLQM2AAMACwAgADAAAAEzESMDETMRIzUjNSUnPgE9ASM1IRUjFRQeAhcHJicGBRcOAQcRIxEOASMnMj4CAt5PT6lOTqf+0SZVYp4Bi54ZL0EoJn8xMQEUBjBlM08zXyYLL3V9fQM2/IABOgIz/MLLQLI9GGdCC0JCCxw2LiQKPSNhbkg8CQwD/s4BLQIBRAIFCQADADP/tQMVAzYAAwAcACwAAAEzESMBJz4DPQEjNSEVIxUUHgIXBy4BJw4BBRcOAQcRIxEOASMnMj4CAsNSUv21IDBQOR/BAdjBHzhQMB9RdB0ddgG6Bj+CQFJCfDkMQJKZnAM2/H8B30IMKDU/IxZCQhYiPDAkCkERTTY8VDw9Cw0E/r4BPQICRQEFDAAAAAADADf/tgMPAzYAAwAcADEAAAEzESMlJz4DPQEjNSEVIxUUHgIXBy4BJw4BFxUhESM1ITUzNQ4BIycyPgI3FwYCvVJS/b0gMVE6IMIB2MQgO1IxIFF2Hh14vwGEUv34hEN8OQo/kZiaSQV+Azb9xcw/CSQxOh4JQkIJHTUsIAg+DkQzN06Cif7p1UKGAwFEAQUKCTsTAAAAAAQANv/KAyoDOAADABwALAAyAAABESMRASc+Az0BIzUhFSMVFB4CFwcuAScOARM1DgEjJzI+AjcXDgEHFQchFSE1MwMPUv2+IDFROSDCAdjEIDpSMSBRdh4dd3pGgjwMQJCXmEgGOnY8jQIg/Y5SAzj9VAKs/ns+CiYxOyAOQkIOHjYtIQk/EEYzOU/+4ZcDAkMCBQsJPAoMA5uYQ/4AAAADADf/wAMwAzcAAwAaADYAAAERIxEBJz4DNSM1IRUjFB4CFwcuAScOARMhFSE1ITUhNTM1DgEjJzI+AjcXDgEHFSEVIQMPUv26HTBROiHCAdjEITtRMR1ReR4deEYCHv2RAf3+AXpCfTkKQJGYmUkEP30/AYT+AwM3/hUB6/66PgggKzQcQUEbMCcbBj4NPjAzSf3/P9JSP2QCAUIBBAkIOggLBGjMAAAEADf/wgMPAzYAAwAcADAANAAAATMRIyUnPgM9ASM1IRUjFRQeAhcHLgEnDgEXFSERIREzNQ4BIycyPgI3Fw4BEzUhFQK9UlL9vSAxUTogwgHYxCA7UjEgUXYeHXW8AYT9tHZDfDkKP5CYm0kFP371/lQDNv3evT8JJDE6HwJCQgIeNSsgCD8ORTM3T4F9/t4BInkDAUQBBAsKPAoN/qCfnwAAAAUAN//DAw8DNgADABoAKgAyADYAAAEzESMlJz4DNSM1IRUjFB4CFwcuAScOARM1DgEjJzI+AjcXDgEHFQU1MxEhETMVBTUhFQK9UlL9vCAxUTsgwgHYxCE6UjEeUngeHXV2RYI8CkCQl5pJBjx5PAEoUf2zUgGq/lYDNv35sT0JIy84HkJCHDQqHgdADkQxNkv++oEDAUUBBAoJOwkMBIZGX/6/AUFfoGBgAAAEADb/ugNTAzcAAwAcACwARQAAAREjEQEnPgM9ASM1IRUjFRQeAhcHLgEnDgETNQ4BIycyPgI3Fw4BBxU3FRQeAhcHLgMnDgMHJz4DPQEDD1L9vB8xUTogwgHYxCA7UjEgUXceHXVcP3Q2Cz+RmJpJBkKIQrEvUWs8HjJdUD8UFEBQXTIfPGtRMAM3/WwClP6PPwokMDofA0JCAx01KyAJPw9GMTZQ/tyfAgFEAQUKCToLDQSjPR8qSDgmCD8IHis5IyM5Kx4IPwgmOEgqHwAAAgA2/7YDYAL/ABwAKAAAEyc+Az0BITUhFSEVFB4CFwcuAycOAwUVIxEjESMRIxEjNYQeO29YNf7lApD+5jVYcDsfNGRWRBQVRFZjAqfSUuJS0gGFQQktQVEsA0JCAyxRQS0JQQklNEMoKEM0JVFC/rsBRf67AUVCAAAAAAMANv/NA2ADCgAaACYALAAAEyc+AzchNSEVIR4DFwcuAycOAwchFSMVIzUjFSM1IRcVIRUhNYYfO2xUMwH+6gKX/ukBM1RtOx82ZlZCEhJCVWaGAyrOUp5S/ua0AiD9jgGuQggnOUgoQkIoSDknCEIIIjNBJydBMyJEQre3trZnukL8AAMANP/AA2ADGAAaAC4AMgAAEyc+AzchNSEVIR4DFwcuAycOAwUjFTMVIRUhFSE1ITUhNTM1IzUhBTUjFXoaO25VNwX+5QKY/uQEN1ZuOxo3aFhFFBRFWWgCr911/fECKv2GAg79733fAyz+0cwB7D8FHi06IkFBIjotHgU/BhsoNiIiNigbcFzOWT/TVT5cQp5cXAAEADX/wgNgAxQAGgAmACoALgAAEyc+AzchNSEVIR4DFwcuAycOAwUjFTMRIREzNSM1IQU1IxUFNSEVgB07bFQ1A/7qApf+6QM0VG07HTdoV0MSE0NXZwKp3nv9nHndAyv+0MwBSf48AdBBBiIzQSVCQiVBMyIGQQcfLj0lJT0uH3t1/tsBJXVCt3V146KiAAACADUALQNjAt4AHAAgAAATJz4DPQEhNSEVIRUUHgIXBy4DJw4DByEVIX8jOnRdOv7XAqf+1ztddTohM2ZaSBUVSFllfAMu/NIBDUEKN09iNCdDQyc1YE42CkIKKz5OLi5QPiumRAAAAAMANf+2A2MDDwAaAB4AJAAAEyc+AzchNSEVIR4DFwcuAycOAwchFSEXNSERIzWAHTtuVTQB/ukCmP7pATNVbjwdN2hXQxISQ1hnggMu/NJaAm1SAcJBByQ0QydDQyZENSQGQQcgLj4lJT4vH0JDnkL+zvAAAwA0/8oDYgMHABwAIAAmAAATJz4DPQEhNSEVIRUUHgIXBy4DJw4DByEVIRcVIRUhEYUfPG5UMv7pApj+6TJUbjseNmZWQhISQlZmhwMu/NK7Ahf9lwGkQwgoOkkpAkJCAilJOigIQwkjM0EnJ0EzI0pDUsFDAQQAAwA0/8ADYAMVABoAHgAqAAATJz4DNyE1IRUhHgMXBy4DJw4DByEVIRMVIRUhNSE1ITUhFXoaO29XNgP+5QKY/uQDNlZvPBo4aFhEFBRFWGh+Ayz81LUCKv2GAg797wJiAeY/BR4uPCJBQSI8Lh4FPwYbKDYiIjYoGzNC/uJaP9VSP80ABQAu/8ADWgMfABoAHgAwADQAOAAAEyc+AzchNSEVIR4DFwcuAycOAwchFSETFTI2NxcOAisBNTM1IzUhFRcRIREDFTM1eR4+alI1CP7mApf+5gYzU21AITdlVkQVFURWZIEDLPzUq0RoOAgiPT8jfdLVASc3ASngmAHrRAYbLDsnQUElPCwbBUQGGCY1IyM1Jhk0Qv7gXgUKPQYHA9hZP9ScAXD+kAEz9vYAAAQANf/CA2ADEAAaAB4AIgAmAAATJz4DNyE1IRUhHgMXBy4DJw4DByEVIRMRIRElFSE1gB08blQ0Af7qApf+6QE0VG48HTdoV0MSE0NXZ4IDK/zVZAJk/ewBxAHJQQYjM0MlQkIlQzMjBkEHHy09JSU8Lh89Qv5xAS7+0u2rqwAABAA0/8IDYAMUABoAHgAmACoAABMnPgM3ITUhFSEeAxcHLgMnDgMHIRUhBTUzESERMxUFNSEVfh07bVU1A/7pApj+6QM1VG07HTdoWEMSEkNZaIEDLPzUAnJR/aRRAbr+RgHTQAciMj8kQ0MkPzIiB0AGHi88JCU8Lh5BQqBm/qYBWmayc3MAAAMANf+5A2ADCgAaAB4ANwAAEyc+AzchNSEVIR4DFwcuAycOAwchFSEFFRQeAhcHLgMnDgMHJz4DPQGAHjtuVTQC/ukCmP7pATRVbjwdN2hXQxMTQ1dnggMr/NUBvzBSbj0gM19RQBQUQFFfMyA+bVIwAcNBBiMzQiVDQyVCMyMGQQcfLjwlJTwuH0RCQyMsTDspCUAJIC48JCQ8LiAJQAkpO0wsIwAAAAQANf+3A2ADCQAaAB4AKgA2AAATJz4DNyE1IRUhHgMXBy4DJw4DByEVIQUyFhUUBiMiJjU0NhMyNjU0JiMiBhUUFoAdPG5UMwL+6gKX/ukBNFVuOx03aFdDEhNDV2eCAyv81QGVj6Skj5GiopFqdnZqanZ2AcNBBiMzQiVCQiVCMyMGQQcfLT0lJTwuHz5CTlROT1RUT05U/vwyMDAyMjAwMgAAAwAq/7UDEQM3AAMAHAAoAAABMxEjASc+Az0BIzUhFSMVFB4CFwcuAScOAQcnMj4CNxcOAwK9VFT9vSszUzkfwwHawh85UjMnT3MdHHKXCkOWnJ1JCEydmpQDN/x+AZE+EDZGVC8NREQKLFBBMA1AF11CSGrmSgIGCwlBCw4JAwACADX/tgMTAzYAAwAeAAABMxEjARUUHgIXBy4BJw4DByc+Az0BIzUhFQLBUlL+tCZBWDEuTn0gDzA8RiYwMFdBJtAB9QM2/IAC4XI5cGFMFUIkkV0xWk48E0IXU2d2OnJERAAAAwBB/7YDFQM3AAMAHAAiAAABMxEjJwcuAScOAQcnPgM9ASM1IRUjFRQeAgU1IREjNQLDUlJqKE51Hx11USszVDshzQHsyyE8U/6VAlhSAzf94WlBG2lITnIdQBI8TVkvJEJCJC1USDjqQv7N8QAAAAMAQf/KAzADNgADABwAIgAAAREjEQMHLgEnDgEHJz4DPQEjNSEVIxUUHgIBIRUhETMDFVJqKE51Hx11USszVDshzQHsyyE8U/7+Agr9pFIDNv1wApD+MUEbaUhOch1AEjtNWjAxQkIxLVVIOP6WQwEaAAAAAwBB/8MDLQM3AAMAHAAkAAABESMRAwcuAScOAQcnPgM9ASM1IRUjFRQeAgEhFSERIRUhAxVSaihOdR8ddVErM1Q7Ic0B7MshPFP++wIK/aQCSv4IAzf9+gIG/lhAGmhITHMdQRE7TFkvHEJCHC1URzf+ZkIBO0IAAwBB/8ADMwM2AAMAHAAoAAABESMRAwcuAScOAQcnPgM9ASM1IRUjFRQeAgEhFSE1ITUhNSEVIQMUUmgmT3cfHXhSJzNTPCHNAezLITxT/vsCEP2fAfL+DAJF/g4DNv4vAdH+gUAYZkVLbxxBEDdJVS4KQkIKK1BDNP47QeBaQNcAAAAABQBB/8ADFAM2AAMAHAAwADQAOAAAATMRIycHLgEnDgEHJz4DPQEjNSEVIxUUHgIBFTI+AjcXDgIrATUzNSM1IRUXESERAxUzNQLCUlJoJlF1Hx14UiczUzwhzQHsyyE8U/7PIzo1MhsHHzk9I33P0QEgMwEb1I4DNv4nV0EZZUVLbhxBEDdJVS4IQkIIK1BDNP6iZgEEBgU+BgcD31c+0KUBdf6LATj7+wAAAAQAQf/CAxUDNgADABwAIAAkAAABMxEjJwcuAScOAQcnPgM9ASM1IRUjFRQeAgERIRElFSE1AsNSUmooTnUfHXVRKzNUOyHNAezLITxT/qkCRP4MAaQDNv33XkAaaEhMch1AETtMWS8cQkIcLVRHN/4nATv+xfq4uAAAAAAEAED/wgMVAzcAAwAcACQAKAAAATMRIycHLgEnDgEHJz4DPQEjNSEVIxUUHgIXNTMRIREzFQU1IRUCw1JSaShOdh8dd1EqM1Q8Ic0B7MshPFOcUf2+UQGg/mADN/4aTT8ZZ0ZLbxxBEDlJVi4UQ0MUK1NFNvRt/pwBZG20dHQAAAMAQv+5A0kDNgADABwANQAAAREjEQMHLgEnDgEHJz4DPQEjNSEVIxUUHgIHFRQeAhcHLgMnDgMHJz4DPQEDFVJqKE50Hxx1USwzUzwgzQHsyyE8UwwxUm48IDNfUUAUFEBRXzMfPG1SMQM2/aACYP5QQBpnSFF2HUASPU9cMRpCQhotVEg3jhcvUkAsCkEJIzJAJydAMiMJQQosQFIvFwAEAEL/swMYAzYAAwAcADAAPAAAAREjEQMHLgEnDgEHJz4DPQEjNSEVIxUUHgIHMh4CFRQOAiMiLgI1ND4CEzI2NTQmIyIGFRQWAxVSaihOdB8ddVErM1M7Ic0B7MshPFM9Rm9OKipOb0ZGb04qKk5vRmd0dGdndXUDNv3jAh3+TkEaaUZOdB5BEjxNWzEaQ0MaLVRIN5AXKz8oKD8rFhYrPygoPysX/u81MzM1NTMzNQAAAAADAEH/ugNCAzYAAwAcADcAAAERIxEDBy4BJw4BByc+Az0BIzUhFSMVFB4CFyMeAxcHLgMnDgMHJz4DNyM1IQMVUmooTnUfHXVRKzNUOyHNAezLITxT9/wEMU5lNx4xXE4+ExM+TlsxHjdkTTEE+QJMAzb9+AII/ldAGmlITnEdQBI7S1kwGUJCGS1USDffJEA1JQg+CB8sOSEhOSwfCD4IJTVAJEIAAAADAED/wgMsAzYAAwAcACgAAAERIxEDBy4BJw4BByc+Az0BIzUhFSMVFB4CASEVIREhFSEVIRUhAxRSZyhOdx8deFEpM1Q8Ic0B7MsiPFT++QIJ/aUCSf4JAez+FAM2/isB1f51QRpjRUlsGj8QN0dULRNCQhMrT0M0/kc/AWg+VjsAAAAEAEH/wgMkAzcAAwAcACgALAAAAREjEQMHLgEnDgEHJz4DPQEjNSEVIxUUHgITMxUhNTM1IzUhFSMhFTM1AxRSaSlOdB8ddlEqM1Q7Ic0B7MshPFN3hf2XhHwCV3v+8b4DN/4KAfb+X0EaaEVLcRxAETpLWC8YQkIYLVJGNv5eQkLIQkLIyAAAAgAp/7YDeQM2AAcANwAAARUjESMRMxElFRQeAhcHLgEnDgEHLgEnDgEHJz4DPQEjNTMVIxUUHgIXPgM9ASM1MxUDeX1SUv7/DR82KTQzOhEPOzMzOw8RPDA0KTUgDG7+QgYTIhsbIhIHQ/gB00X+KAOA/p3GbTJtZ1ofOyZ3RUZ8KCp7RkV3JzsfW2htMG1DQ20lWFtYJCRWWlknbUNDAAMALf+1A3EDNgAHADcAPQAAARUjFSMRMxUPAS4BJw4BBy4BJw4BByc+Az0BIzUzFSMVFB4CFz4DPQEjNTMVIxUUHgIFNSERIzUDcXFSUngrNEITDjkzMzgOE0I0KyY2IhBv+z8HEyAZGCASBz75bRAiNv5FAllSAk1F7QIb6cw7G1s2NmEeH2E2NlwcPBU+RkkgLkNDLhg8Pz0aGTw+PRouQ0MuIUpGPeVC/sP7AAAAAwAt/8sDcQM2AAcANwA9AAABMxUjESMRMwMHLgEnDgEHLgEnDgEHJz4DPQEjNTMVIxUUHgIXPgM9ASM1MxUjFRQeAgUVIRUhEQMAcXFSUngrNEISDjozMzgOEkE2KyY2IhBv+z8HEyAZGB8TBz75bRAiNv6tAhX9mQIlRf7HAo/+KzscXTc3Yx8fYzY2Xh07FUBISyE+QkI8GT1APxsaPj8+GzxCQjwiTEg+mNFCARMAAAAABgAt/7cDcQM3AAcANwA/AEoAWgBmAAABMxUjFSMRMwMHLgEnDgEHLgEnDgEHJz4DPQEjNTMVIxUUHgIXPgM9ASM1MxUjFRQeAhcVMxUhNTM1BRE+ATcXDgErAREFMh4CFRQOAiMiJjU0NhcyNjU0JiMiBhUUFgMAcXFSUngnNkITDjo0MzkOEkM2KCY1IxBv+z4HEyAYGB8SCD75bBEiNS65/jy7/qYnXTANQHguKwHSJD0sGRksPSRLXFxLKjMzKio1NQJsRL4Bzf52PBlUMDZeHR1eMzNYGzsTOUJEHTBDQzAWODo5GBc4OzgXMENDMB1APjVuST09ST/+/wIND0EVDAFFZREgLR0cLiARQjk5QrwkHR0kJB0dJAADAC3/wgNxAzYABwA3AD8AAAEzFSMVIxEzAwcuAScOAQcuAScOAQcnPgM9ASM1MxUjFRQeAhc+Az0BIzUzFSMVFB4CBRUhFSERIRUDAHFxUlJ4LDNCEw45MzM5DhJCMywmNiIQb/s+BxIgGRgfEwc++WwQIjb+qwH//bACSQJMReMCEv5ZPBpXNDZfHR9hNjNZHDsUPERIHypCQioYOz89GRk7PjwaKkJCKiNJQznluUIBPUIAAAAAAwAt/8ADcgM2AAcANwBDAAABMxUjFSMRMwMHLgEnDgEHLgEnDgEHJz4DPQEjNTMVIxUUHgIXPgM9ASM1MxUjFRQeAgEVIRUhNSE1ITUhFQMAcnJSUngnNkMTDjkzMzoOEkQ2JyU1IxFv+z8IEx8YGB8UCD/5bREjNf6jAhz9kwH7/gMCTQJvRNAB2/59PBpUMDFaGxxZMzFVGjwSNz1AGzJCQjIUNTg3FhY1NzYWMkJCMhxAPjX+nGFA3ldA1AAABQAt/8ADcgM2AAcANwA/AFMAVwAAARUjFSMRMxUPAS4BJw4BBy4BJw4BByc+Az0BIzUzFSMVFB4CFz4DPQEjNTMVIxUUHgITNTMRIREzFQUVMj4CNxcOAisBNTM1IzUhFQU1IxUDcnJSUngnNkMTDjkzMzoOEkQ2JyU1IxFv+z8IEyAYFyATCD/5bREjNVNK/uNL/rgiODQxGwgfOTwie8bJARkBCYgCeUTRAdK9yzwaUzEzWBwdWjEwVRo8EjY+Pxs0QkI0FTQ4NhYVNTg1FjRCQjQcQD01/wB0/owBdHRiYAEEBgU+BgcD2lM+zV6CggAAAAQALf/CA3EDNgAHADcAOwA/AAABFSMVIxEzFQ8BLgEnDgEHLgEnDgEHJz4DPQEjNTMVIxUUHgIXPgM9ASM1MxUjFRQeAgERIRElFSE1A3FxUlJ4KzRCEg46MzM4DhNCNCsmNiIQb/s/BxMgGRgfEwc++W0QIjb+WwJD/g4BogJZRO4CD93PPB1aNjZgHx9hNjZbHTwVPkZJHypCQioXPD8+GRo8PTwaKkJCKiFJRj3+JAE6/sb5t7cAAAAABAAt/8IDcQM3AAcANwA/AEMAAAEVIxUjETMVDwEuAScOAQcuAScOAQcnPgM9ASM1MxUjFRQeAhc+Az0BIzUzFSMVFB4CFzUzESERMxUFNSEVA3FxUlJ4KzRCEg46MzM4DhNCNCsmNiIQb/s/BxMgGRggEgc++W0QIjZNUf27UQGj/l0CZETbAfLTyTsbXDY2YR8gYDY2Wxw7FT5GSSAeQkIeGDw/PRoZPD49Gh5CQh4hSkc8/Gz+owFdbK9vbwAAAwAt/7oDcQM2AAcANwBQAAABMxUjESMRMwMHLgEnDgEHLgEnDgEHJz4DPQEjNTMVIxUUHgIXPgM9ASM1MxUjFRQeAgcVFB4CFwcuAycOAwcnPgM9AQMAcXFSUngrNEITDjkzMzgOE0I0KyY2IhBv+z4HEyAYGB8TBz75bBAjNVQyVG48IDNgUkEUE0FTYDIgPG1TMgI6Rf7aAmf+SjwcWjY2YB4fYDY2Wh08FT1GSSArQkIrGTs+PRoaPD08GitCQishSkY8jRcwUT8sCkAJIjJAJiZAMiIJQAosP1EwFwADAC3/uQNxAzYABwA3AF0AAAEzFSMVIxEzAwcuAScOAQcuAScOAQcnPgM9ASM1MxUjFRQeAhc+Az0BIzUzFSMVFB4CFxUUHgIXBy4BJw4BBy4BJw4BByc+Az0BMxUUHgIXPgE9AQMAcXFSUngrNEISDjozMzgOE0I0KyY2IhBv+z4HEx8YGSASBz75bBAjNUsZLkMrKkJaFxRRPz9SFBdbQCoqRC4ZTw8fLx8/PgJaROQCBP5XPB1aNjZhHyBgNjZaHTwUPUdJICdCQicYOz89Ghk8Pj0ZJ0JCJyFKRjyVLCJEPTEPPBhbOTlgGxpgOTdbGTwPMz1EICwsGzs5NBQqdzYsAAQALf+3A3EDNgAHADcARwBTAAABMxUjFSMRMwMHLgEnDgEHLgEnDgEHJz4DPQEjNTMVIxUUHgIXPgM9ASM1MxUjFRQeAgcyHgIVFA4CIyImNTQ2EzI2NTQmIyIGFRQWAwBxcVJSeCs0QhIOOjMzOA4TQjQrJjYiEG/7PwgSIBgZIBIHPvltECI2hUVvTikpTm9Fj5ycj2dycmdncnICTUT8Ain+TzwdWzY2YR8fYjY2XB08FT5GSSApQkIpGDs/PhoZPD49GilCQikhSkY9lhYrPicnPisWV09PV/71NTAwNTUwMDUAAAADAC3/swNxAzYABwA3AFIAAAEzFSMVIxEzAwcuAScOAQcuAScOAQcnPgM9ASM1MxUjFRQeAhc+Az0BIzUzFSMVFB4CFwUUHgIXBy4DJw4DByc+AzUhNSEDAHFxUlJ4LDNCEw45MzM5DhJCMywmNiIQb/s+BxIgGBggEwc++WwQIjam/vcuUGs9IDNfUD8TEz9RXjMePGpQL/78AmgCVkXeAgP+WTsaVzM2Xh4gYTYzWhs6FDxESB8qQkIqGDs+PRoZPD48GSpCQiojSUM54wEoRTQkBz8HHSs4IiE4Kx0HPwgkNUQnQgAAAgAj/7YDOwM3AAsAOwAAATMRIxEjESMRMxEzJRUUHgIXBy4BJw4BBy4BJw4BByc+Az0BIzUzFSMVFB4CFz4DPQEjNTMVAu1OTmFMTGH+yQobMCcvLTMPDDAtLTEMDzMtLycwGwpe3DYDDhsYGBsNAzbUAzf8fwHQ/lwDQf6mv14rY2FXHzgjZTw8bCUlbj08aCM4H1hiYyleQ0NeHE1WVyUjU1RQIV5DQwAAAAMAJP+1AzoDNgALADsAQQAAATMRIzUjFSMRMxUzDwEuAScOAQcuAScOAQcnPgM9ASM1MxUjFRQeAhc+Az0BIzUzFSMVFB4CBTUhESM1AuxOTmJMTGK7Ky00DwwyLS0yDA81LSsjLxwLXNw4BQ8bFxcbDwQ41FQLHC/+swJ5UgM2/eD28QIM2Nk3HFUzNl0fIGIzM1cdNxhES0ofJkJCJhU8Q0UdG0FDPxgmQkImIEtLQ+VD/srzAAADACT/ygNTAzcACwA7AEEAAAERIxEzETMRMxEjEQ8BLgEnDgEHLgEnDgEHJz4DPQEjNTMVIxUUHgIXPgM9ASM1MxUjFRQeAgMhFSERMwKKTExiTk67Ky00DwwyLS0yDA81LSsjLxwLXNw4BQ8cFxYbDgU301QLHC/gAiX9iVIB3v7QAnn++gEW/V8BSHk4HVUzNl0fIGEzM1cdOBhESkofLkJCLhU8Q0UdHEFCPhkuQkIuIEtKQ/6RQwEVAAMAJf/CA1kDNgALADsARwAAARUjETMVMzUzESM1DwEuAScOAQcuAScOAQcnPgM9ASM1MxUjFRQeAhc+Az0BIzUzFSMVFB4CAyEVITUhNSE1IRUhAopMTGJOTrsoLTYQDDItLTEMEDgtJyIuHQxc3DkFDxwXFRsPBjnUVAwdLu0CN/14Ahj95gJr/egCJcgByb3N/iPMczgaTS0uVBwdVTAtURo4FDo/PxgoQkIoETI4OhkXNzc0FShCQigZQD85/j1A21Q/0AAABAAk/8IDOgM2AAsAOwA/AEMAAAEzESM1IxUjETMVMw8BLgEnDgEHLgEnDgEHJz4DPQEjNTMVIxUUHgIXPgM9ASM1MxUjFRQeAgERIRElFSE1AuxOTmJMTGK7Ky00DwwyLS0yDA81LSsjLxwLXNw4BQ8cFxYbDgU41FQLHC/+xAJo/egByAM2/e7s5wH+09A4HFYxM14gIGIzM1cdOBhESkoeIENDIBQ8REQdHEFBPhkgQ0MgIEtKQv4nATf+yfa0tAAAAAQAJP/CAzoDNwALADsAQwBHAAABMxEjNSMVIxEzFTMPAS4BJw4BBy4BJw4BByc+Az0BIzUzFSMVFB4CFz4DPQEjNTMVIxUUHgIXNTMRIREzFQU1IRUC7E5OYkxMYrsrLTQPDDItLTIMDzUtKyMvHAtc3DgFDxwXFhsOBTjUVAscL9tR/aJRAbz+RAM3/g7W0QHdyco3HFYxM14fIGEzM1cdNxhES0seFENDFBU8REQdG0FCPxkUQ0MUIEtLQ/do/qYBWmiwb28AAwAk/7kDYAM2AAsAOwBUAAABFSMRMxUzNTMRIxEPAS4BJw4BBy4BJw4BByc+Az0BIzUzFSMVFB4CFz4DPQEjNTMVIxUUHgIXFRQeAhcHLgMnDgMHJz4DPQECikxMYk5OuystNA8MMi0tMwsQNC0rIy8cC1zcOAUPGxcXGw8EONRUCxwvITNVbjsfM19TQRUVQVNfMyA8blUzAgr0Ag/X6P2bATmMOB1WMTReHyBhNDNYHTgYREpKHx9DQx8VPENEHRtBQj8YH0NDHyBLSkORHitOPysJQQkiMT4lJT4xIglBCSw+TiseAAMAJP+/A3QDNgALADsAYwAAARUjETMVMzUzESM1DwEuAScOAQcuAScOAQcnPgM9ASM1MxUjFRQeAhc+Az0BIzUzFSMVFB4CFxUUHgIXBy4BJw4BBy4BJw4BByc+Az0BMxUUHgIXPgM9AQKKTExiTk67Ky00DwwyLS0yDA81LSsjLxwLXNw4BQ8cFhYbDwU41FQLHC+xGS5EKilCWxgUUkA/UhQXW0IoKkMvGU8QHy8fIDAfEAIP3gH11OT97+qLOBxWMTNeHyBhMzNXHTgYREpKHiBDQyAUPENFHR1BQD4ZIENDICBLSkKVJiBBOzEPPRlaNzdgGxpfNzdYGT0PMTtCHyYmGTo4MxMUMzg5GSYABAAk/7cDPgM2AAsAOwBHAFMAAAEVIxEzFTM1MxEjEQ8BLgEnDgEHLgEnDgEHJz4DPQEjNTMVIxUUHgIXPgM9ASM1MxUjFRQeAgcyFhUUBiMiJjU0NhMyNjU0JiMiBhUUFgKKTExiTk67Ky00DwwyLS0yDA81LSsjLxwLXNw4BQ8bFxYbDwU41FQLHC8IkqamkpGmppFteHhtbXd3Ag7pAgHV5f3SAQaSOB1UMzReHyBhMzNXHTgYREpKHiBDQyAVO0NEHh1BQD4ZIENDICBLSkKXVE5PVFRPTlT++zMwMDMzMDAzAAAAAAIAKf+3A3cDNgALADsAAAEjFTMVIxEjETMVMyUVFB4CFwcuAScOAQcuAScOAQcnPgM9ASM1MxUjFRQeAhc+Az0BIzUzFQN3e3t7UlJ7/oQNHzYpNDM6EQ87MzM7DxE8MDQpNSAMbv5CBhMiGxsiEgdD+AIMykT+uQN/5klsMm1nWx87JndFRnwoKntGRXcnOx9caWwwbENDbCVZW1gkJFZaWidsQ0MAAAMALf/KA3EDNgALADsAQQAAASMVMxUjFSMRMxUzAwcuAScOAQcuAScOAQcnPgM9ASM1MxUjFRQeAhc+Az0BIzUzFSMVFB4CBRUhFSERA3FxcXFSUnHpKzRCEg46MzM4DhJBNismNiIQb/s/BxMgGRggEgc++W0QIjb+rQIV/ZkCSpJD0QKSqP7TPB1dNzdjHx9jNjZfHTwVP0lLIT5CQjwZPUA/Gxo+Pz4bPEJCPCJNSD6X0UMBFAAEAC3/twNzAzYACwA7AEsAVwAAASMVMxUjFSMRMxUzAwcuAScOAQcuAScOAQcnPgM9ASM1MxUjFRQeAhc+Az0BIzUzFSMVFB4CBzIeAhUUDgIjIiY1NDYTMjY1NCYjIgYVFBYDc3Nzc1JSc+srNEISDjozMzgOE0I0KyY2IhBv+z4HEyAYGCASBz75bBAiNoZFb04pKU5vRY+cnI9ncnJnZ3JyAmaFRJACKYz+2zwdWjY2YB8fYTY2Wx08FT5GSSApQkIpGTs+PRoZOz48GylCQikhSkY9lhYrPicnPisWV09PV/71NTAwNTUwMDUAAAACAC7/twMlAzYABwA3AAABMxEjESM1MycVFB4CFwcuAScOAQcuAScOAQcnPgM9ASM1IRUjFRQeAhc+Az0BIzUzFQLSU1ORkdEMIDUpNDE7EQ87NDM7DxE7MTQpNiAMbgEARQcSIhsbIhIHRfoDNvyBAfpDqXQxbmhaHjsmdkVGfCcofkZFeSY7H1xobDB0Q0N0JVhbWCUkVlpaJ3RDQwAAAwAt/7UDJAM3AAcANwA9AAABMxEjNSM1Mw8BLgEnDgEHLgEnDgEHJz4DPQEjNTMVIxUUHgIXPgM9ASM1MxUjFRQeAgU1IREjNQLSUlKEhEorNEITDjkzMzgOE0I0KyY2IhBv+z8HEyAZGCASBz74bBAiNv5ZAmlSAzf95/lC0TwdWjY2YB8fYTY2Wx08FT5GSR8uQ0MuFzw/PRkZPD48GS5DQy4hSUY97kL+xfkAAAADAC3/ygM8AzYABwA3AD0AAAEzNTMRIxEjFwcuAScOAQcuAScOAQcnPgM9ASM1MxUjFRQeAhc+Az0BIzUzFSMVFB4CASEVIREzAk6EUlKEOis0QhIOOjMzOA4SQTYrJjYiEG/7PwcTIBkYHxMHPvhsECI2/sICGP2WUgJH7/1nAWikPB1dNzdjHx9jNjZfHTwVQEhLIT9DQz0ZPUA/Gxo+Pz4bPUNDPSJMSD7+l0MBEgAAAAADAC3/wgM8AzYABwA3AEMAAAEzNTMRIzUjFwcuAScOAQcuAScOAQcnPgM9ASM1MxUjFRQeAhc+Az0BIzUzFSMVFB4CASEVITUhNSE1IRUhAk6EUlKEOic2RBIOOTMzOg4SRDYnJDYjEW/7PwgTHxgYHxQIP/hsESM1/rgCIf2NAgr99AJd/fcCdcH+K9KFOxhUMDBZHBxbMTBWGTsSNz1AGzhCQjkUNDg2FhU1NzYVOUJCORw/PjX+QkDeV0DUAAAEAC3/wgMkAzYABwA3ADsAPwAAATMRIzUjNTMPAS4BJw4BBy4BJw4BByc+Az0BIzUzFSMVFB4CFz4DPQEjNTMVIxUUHgIBESERJRUhNQLSUlKEhEorNEITDjkzMzgOE0I0KyY2IhBv+z8HEyAZGCASBz74bBAiNv5rAlf9+QG2Azb98fhD2jsbWzY2YR4fYTY2Wxw7FT5GSSAtQkItGDw/PhkZPD49Gi1CQi0hSkc8/iYBOP7I97W1AAAAAAQALf/CAyQDNgAHADcAPwBDAAABMxEjNSM1Mw8BLgEnDgEHLgEnDgEHJz4DPQEjNTMVIxUUHgIXPgM9ASM1MxUjFRQeAhc1MxEhETMVBTUhFQLSUlKEhEorNEISDjozMzgOE0I0KyY2IhBv+z8HEyAZGB8TBz74bBAiNnJQ/a9RAbD+UAM2/hXdQ9I8HVo2NmEeH2A2NlodPBU9RkkgI0NDIxc8Pz4ZGjw9PBojQ0MjIUlGPfhu/p8BYW6wcHAAAAMALf+6A04DNgAHADcAUAAAATM1MxEjESMXBy4BJw4BBy4BJw4BByc+Az0BIzUzFSMVFB4CFz4DPQEjNTMVIxUUHgIHFRQeAhcHLgMnDgMHJz4DPQECToRSUoQ6KzRCEw45MzM4DhNCNCsmNiIQb/s/BxMgGRggEgc++GwQIjZDMVRuPB8zYFJBFBVBU18zIDxuVDICVuD9kAFNnDsbWzY2YB8gYDY2Wxw7FT5GSSA1Q0M1GDw/PRoZPD49GjVDQzUhSkc8ixIuUUAsCUAJIjFAJic/MSIJQAotQFAtEgAAAwAt/7kDaAM2AAcANwBfAAABMzUzESM1IxcHLgEnDgEHLgEnDgEHJz4DPQEjNTMVIxUUHgIXPgM9ASM1MxUjFRQeAhcVFB4CFwcuAScOAQcuAScOAQcnPgM9ATMVFB4CFz4DPQECT4NSUoM6LDRCEg46MzM4DhNCNCsmNiIQb/s/CBIgGBkgEgc++W0QIzZSGC9CKihCWhcUUz9AUhQXW0ApKkMuGU8PIC8gIC8gDwJc2v3n/JM7HFo2NmEeH2A2NlocOxU+RkkgLkJCLhg7Pz4aGTw+PRouQkIuIUpGPZclH0M9Mg89GVo5N2EcG145N1oZPQ8yPUMfJSUaOjk0FBQ0OToaJQAABAAt/7cDKQM2AAcANwBLAFcAAAEzNTMRIxEjFwcuAScOAQcuAScOAQcnPgM9ASM1MxUjFRQeAhc+Az0BIzUzFSMVFB4CBzIeAhUUDgIjIi4CNTQ+AhMyNjU0JiMiBhUUFgJOhFJShDorNEISDjozMzgOE0I0KyY2IhBv+z8IEiAYGSASBz74bBAiNm5Hc1ArK1BzR0dzUCsrUHNHand3amp3dwJZ3f3MARWWOxtcNjZhHyBgNjZbHDsVPkZJIC9CQi8YOz8+Ghk8Pj0aL0JCLyFKRzyVFio+Jyc9KhYWKj0nJz4qFv74MzAwNDQwMDMAAwAj/7YDPQM3AAMACwA7AAABMxEjAxEzESMRIzUnFRQeAhcHLgEnDgEHLgEnDgEHJz4DPQEjNTMVIxUUHgIXPgM9ASM1MxUC705OpkxMXjUKGzAnLy0zDwwwLS0xDA8zLS8nMBsKXtw2Aw4bGBgbDQM21AM3/H8CRQEo/L8B1USNXitjYVcfOCNlPDxsJSVuPTxoIzgfWGJjKV5DQ14cTVZXJSNTVFAhXkNDAAUAJP+3A0QDNwADAAsAOwBHAFMAAAERIxEFMzUzESM1IxcHLgEnDgEHLgEnDgEHJz4DPQEjNTMVIxUUHgIXPgM9ASM1MxUjFRQeAgcyFhUUBiMiJjU0NhMyNjU0JiMiBhUUFgM9Tf79Y01NY0EoLTcPCzAtLTELEDYtKyMwHg1h3DMEDRoWFRkOBDPUWQwdLwiWq6uWl6elmXB8fHBtfHwDN/3OAjLcyv4D8Jg3GlAwM1keIF0zMFMbNhZARkceMkJCNBM5QEEcGz4/Ohc0QkIyIUpFPZlUT05UVE5PVP76MzAwNDQwMDMAAAAAAgAu/7cDJQM2AAsAOwAAATMRIxEjNTM1IzUzJxUUHgIXBy4BJw4BBy4BJw4BByc+Az0BIzUhFSMVFB4CFz4DPQEjNTMVAtJTU4CAgIDRDCA1KTQxOxEPOzQzOw8ROzE0KTYgDG4BAEUHEiIbGyISB0X6Azb8gQGTQ3dDV3gxbmdaHjsmdkVGfCgqfUZFeSY7H1tobDB4Q0N4JFhbWCUkVlpZJ3hDQwAAAwAt/7gDaAM2AAsAOwBjAAABMzUzESM1IzUzNSMXBy4BJw4BBy4BJw4BByc+Az0BIzUzFSMVFB4CFz4DPQEjNTMVIxUUHgIXFRQeAhcHLgEnDgEHLgEnDgEHJz4DPQEzFRQeAhc+Az0BAlZ8UlJ8fHwwKzNCEg45MzM4DhNCNCsmNiIQb/s+BxMfGBkgEgc++GsPIjVUGC9CKihCWhcUUz9AUhQXW0ApKkMuGU8PIC8gIC8gDwKbm/3nrUJM1TwdWTY2YB4fYDY2Wh08FT5GSSAyQkIyGDw/PRoZPD49GjJCQjIhSkY9lSUgQzwyDzwYWjk5YBsaYTc3Whg8DzI8QyAlJRo6OTQUFDQ5OholAAACADUAKQNiAuoALwA3AAATJz4DPQEjNSEVIxUUHgIXPgM9ASM1IRUjFRQeAhcHLgEnDgEHLgEnDgEFIRUhNSE1M2QpK0MvGJcBXXQRIzMiITMhEXIBXJcZLkMrKUVaFxZXQkVXFRdcAU0BbvzTAWxTATo/EjhCSCI4Q0M4Gz08NxQUNjs+HDhDQzgjSkQ3ET4dZT86YxwcZTo9Z+pERLEAAwA1/7UDYwMXAC8ANwA9AAATJz4DPQEjNSEVIxUUHgIXPgM9ASM1IRUjFRQeAhcHLgEnDgEHLgEnDgEFIRUhNSE1MwE1IREjNXMjJz0rFosBTnESIjEfHzAhEnEBT40XKz4nJEJYFRVTP0BUFhVXAT8Bb/zSAWxT/poCbFIB0z0NKTAzFxRDQw8SLCsnDQ0mKywTD0NDFBk1LycMPRRRMStKFBRNKzBTbkJCWv7CQv7c4gAAAwA0/8oDYgMMAC8ANwA9AAATJz4DPQEjNSEVIxUUHgIXPgM9ASM1IRUjFRQeAhcHLgEnDgEHLgEnDgEFIRUhNSE1MwUVIRUhEXMkJz4rFowBT3ESIjEfHzAhEnEBTowWKz4nI0NXFBZTPz9VFhRYAT8BbvzSAW1T/vkCHf2RAb4+DSkxNBgbQkIWEysrJw4NJistExZCQhsZNTEoDD4WUzEtSRQUTSsxVHJDQ1/yw0MBBgAAAwA1/8ADYgMVAC8ANwA/AAATJz4DPQEjNSEVIxUUHgIXPgM9ASM1IRUjFRQeAhcHLgEnDgEHLgEnDgEFIRUhNSE1MwEVIRUhESEVdCUoPioWiwFOcRIiMR8fMCEScQFOjBYrPigkQ1YVFlM/QFUVFVYBPgFu/NMBbVL+9AIj/YwCbwHUOw0qMDQWE0JCDhMsKiYODSUrLRMOQkITGjUvJww7FE4xLUkUFEstME9sQ0NW/tWmQwEsQwAAAAADADX/wANhAyEAKwAzAD8AABMnPgM9ASM1IRUjFRQWFz4BPQEjNSEVIxUUHgIXBy4BJw4BBy4BJw4BBSEVITUhNTMBFSEVITUhNSE1IRVyIyc+KxaMAU9xRT8/Q3EBT40XKz4nI0JZFBVUP0BUFhVYAUABbfzUAWxT/vUCKv2GAg797wJiAe09CyYvNRoGQkIGKlEYGFEqBkJCBhk2LyYKPhRPMSpGERFFKjBPV0FBTf5gWD/TUj3LAAAAAAQANf/CA2MDGgAvADcAOwA/AAATJz4DPQEjNSEVIxUUHgIXPgM9ASM1IRUjFRQeAhcHLgEnDgEHLgEnDgEFIRUhNSE1MwERIRElFSE1dCQnPSsWiwFOcRIiMR8fMCEScQFPjRcrPickQlcVFVQ/QFQVFVcBPgFv/NIBbFP+pQJk/ewBxAHXPgwpMTQWEkNDDRMrKycODSYrLRMNQ0MSGDQwKAw+FlIwLUoUFEwtMFRsQkJZ/egBJP7c4qCgAAAAAAQANP/CA2MDHAAvADcAPwBDAAATJz4DPQEjNSEVIxUUHgIXPgM9ASM1IRUjFRQeAhcHLgEnDgEHLgEnDgEFIRUhNSE1MxM1MxEhETMVBTUhFXMkJz4qF4wBT3ESIjEfHzAhEnEBT40XKz4nJEJXFRVUP0BUFhVXAT8Bb/zRAW1Ts1L9olEBu/5FAd48DSkwMxcQQkIMEisrJw4OJiosEwxCQhAYNDAoDDwUUjAtShQUTC0wU2ZCQlP+0l/+sQFPX65ubgADADX/ugNiAxcALwA3AFAAABMnPgM9ASM1IRUjFRQeAhc+Az0BIzUhFSMVFB4CFwcuAScOAQcuAScOAQUhFSE1ITUzHQEUHgIXBy4DJw4DByc+Az0BcyMnPSsWiwFOcRIiMR8fMCEScQFOjBcqPicjQlcVFlM/QFQWFVcBPwFu/NMBbFMwUW49HzNfUUATFEBSYDMfPm1SMAHQPQ0pMDMXF0NDEhIsKicODSYrLBMSQ0MXGDQwKAw9FVIwK0sUFE0rMFNsQ0NZ2RstTDspCT8IIC48JCQ8LiAIPwkpO0wtGwAAAAAEADX/tgNjAxMALwA3AEMATwAAEyc+Az0BIzUhFSMVFB4CFz4DPQEjNSEVIxUUHgIXBy4BJw4BBy4BJw4BBSEVITUhNTMHMhYVFAYjIiY1NDYXMjY1NCYjIgYVFBZzIyc9KxaLAU5xEiIxHx8wIRJxAU+NFys+JyRCVxUVVD9AVBUVWAE/AW/80gFsUymTn6OPkqKikmp1dWptdHQB0T0NKTAzFxNCQg4SLConDg0mKywTDkJCExg0MCgMPRVSMCtLFBRNKzBTbEJCWOVQTEtRUUtMUPkwLS0wMC0tMAAAAAMANf+5A2IDFwAvADcAUgAAEyc+Az0BIzUhFSMVFB4CFz4DPQEjNSEVIxUUHgIXBy4BJw4BBy4BJw4BBSEVITUhNTMBIR4DFwcuAycOAwcnPgM3ITUhdCUnPisWiwFOcRIiMR8gMCERcQFOjBYrPigkQ1cVFVM/QFQWFVYBPgFu/NMBbVIBC/74CDdRZjccM2BTQRUYSFZcLB04Z1E3CP73AmgB1zsNKjAzFxFDQw0SKysmDg0mKiwTDUNDERo1LycMOxRQMCtKFBRMLTFRaUNDVf7bJj8wIAc/Bx4rOCInOykZBkAHIDA/JUIAAwA1/7oDYgMgAC8ANwBWAAATJz4DPQEjNSEVIxUUHgIXPgM9ASM1IRUjFRQeAhcHLgEnDgEHLgEnDgEFIRUhNSE1MwEjHgMXBy4DJw4DByc+AzcjNSE1MxUhciInPSsWiwFOcRIiMB8WLiYZcQFOjBcqPiciQ1gVFVQ/P1QWFFgBPwFu/NMBbFMBAP0INU9jNRwyXlE/FBQ/UV8zHDhkTjMH/gECUgEBAeg9DCgwMhYMQ0MIESopJQ0JHicvGQhDQwwYMy4nDD0WUTArSRMTSiswU1xCQk7+uCA5LyEHPQcdKjUgITYpHAc9Bx8uOiJAVFQAAAMAJv+2A3UDNwAHADcARwAAARUjESMRMxElFRQeAhcHLgEnDgEHLgEnDgEHJz4DPQEjNTMVIxUUHgIXPgM9ASM1MxUDFT4BNxcOAyMnMjY3NQN1f1JS/wAQITQlKTZBERA7MTM6EBFBNiglNCEPaPlECRUhGBghFAlD9N4/dzwHS5mUiz0LOYJFAcRE/jYDgf6N2i0hRD81EjsaVDMwURkZUTAzVBo7ETU/RSEtQkItGDc3MhQUMjc3GC1CQv6qkwQKCD0NDgcBRAEClgAAAAAEADH/tgNvAzYABwA3AEcATQAAARUjFSMRMxUFJz4DPQEjNTMVIxUUHgIXPgM9ASM1MxUjFRQeAhcHLgEnDgEHLgEnDgEFFw4DIycyNjc1MxU+AQU1IREjNQNvc1JS/WQkIjIhEGz5PwgRHRUVHREIPvVoECEzIiU2QRINNTAwNA4RQQHmBkualo0+CzqBRVI/fv5ZAmNSAjlE+QI6/XI7DioxNRkLQkILESgpJxAQJykoEQtCQgsZNTEqDjsVSC0nRRQURCYqSVM8DQ8HAkMBA1lWBAr0Qv7o1gAABAAx/8ADbwM3AAcAMwBDAE8AAAEzFSMVIxEzASc+Az0BIzUzFSMVFBYXPgE9ASM1MxUjFRQeAhcHLgEnDgEHLgEnDgEFFw4DIycyNjc1MxU+AQEVIRUhNSE1ITUhFQL8c3NSUv1iIiEyIRFs+T8kKCgkQPVoESEzISI2QxIONTAuNQ4SQwHoBkualo0+CzqBRVI/fv65AiT9jAIC/fsCVgJiRNcB8P63OwwlLTAXAz8/Ax5PHBxPHgM/PwMWLy0lCzsTQygjQBISQCMqQ0Q5DA4GAkABAk5LAwr+oFc/0k4/yQAABAAx/7kDbwM2AAcANwBHAG0AAAEzFSMVIxEzASc+Az0BIzUzFSMVFB4CFz4DPQEjNTMVIxUUHgIXBy4BJw4BBy4BJw4BBRcOAyMnMjY3NTMVPgEXFRQeAhcHLgEnDgEHLgEnDgEHJz4DPQEzFRQWFz4DPQEC/HNzUlL9ZCQiMiEQbPk/BxIdFRUdEgc+9WgQITMiJTZCEQ40MC42DhFBAeYGS5qWjT4LOoFFUj9+XhguQyomQlwXFFM/P1IUF1pCJypDLhhPPT8gMB8QAkBE9gIw/pA8DSoyNhkOQkIODycqKRERKSonDw5CQg4ZNjIqDTwVSi0mRhUVRCYrSlI6DA4IAkIBAldTAwqYFiJBOC0NPRdUNjZaGRlZNjZTFz0OLjhAIRYWOW8kEjA2ORsWAAMAIv+2AzcDNgALADsASwAAATMRIxEjESMRMxEzJRUUHgIXBy4BJw4BBy4BJw4BByc+Az0BIzUzFSMVFB4CFz4DPQEjNTMVAxU+ATcXDgMjJzI2NzUC6E9PZU1NZf7GDR0uIigtNxAMMSoqMAwQOC0oIi8cDVrZOAQOGhYVGg8FOdW4M2UtBjyCf3UwCy1rPAM2/IABy/5hA0H+odsmGj8/OBM5GUwtKkgYGkoqLU8aORQ5Pz4ZJkJCJg8tNTYYFjQzMBImQkL+uJQCCAc9CwwGAkUBApcAAAQAKv+5A2MDNgALADsASwBxAAABFSMRMxUzNTMRIzUFJz4DPQEjNTMVIxUUHgIXPgM9ASM1MxUjFRQeAhcHLgEnDgEHLgEnDgEFFw4DIycyNjc1MxU+ARcVFB4CFwcuAScOAQcuAScOAQcnPgM9ATMVFBYXPgM9AQKDTU1dTk79biQeKBoLVNU7BhAbFBUbEAY71FMLGigeJCsyDg4wKiowDg4yAZQFOn99cy8LK2g5TTNk0RguQysnQlwXFFNAQFIUGFpCKCtDLxhPPz8gMB8QAf/sAhLj9P3Y8TQ5DyswLxISQUESDSQnKBAQKCckDRJBQRISLzArDzkUQiQiPRQTPSIkQVU6Cw0GAkEBAlVSAwiQHyJBOC0NPRZUNzdZGRlYNjZSFz0NLTlBIR8fOXAkEjA3ORsfAAMANP+2AxwDNwADADMAQwAAATMRIwEnPgM9ASM1MxUjFRQeAhc+Az0BIzUzFSMVFB4CFwcuAScOAQcuAScOARcVPgE3Fw4DIycyNjc1AspSUv2TKSQ1IhBp+UMJFCEYGCEUCUP1ZBAiNSQpNkIREDozMzoQEUH4Q4RCB06fmpFACzqCRQM3/H8BljoSOEBEHi5CQi4WNTc0FRU0NzUWLkJCLh5DQTgSOhpZMzBWGhpWMDNZHpQDCwo9Dg8IAUQBApgAAAAEADX/0QMvAzYAAwAzAEMASQAAAREjEQEnPgM9ASM1IRUjFRQeAhc+Az0BIzUzFSMVFB4CFwcuAScOAQcuAScOAQUXDgMjJzI2NzUzFT4BASEVITUzAxZS/aglIzIhEGsBAEcJFCAWFyAVCUf9aBAiMyMlNkQRDzkzMDoOEUMB6gZMnJiQQA0/iUhSP3r+xwIY/ZZSAzb9XgKi/ns8DSkyNxkVQ0MVEioqJw8PJyoqEhVDQxUZNjIqDTwVTC0oRxQURSctSVs7DA4IAkMBA19cAwr+sUPzAAAEADT/wAM1AzcAAwAzAEMATwAAAREjEQEnPgM9ASM1IRUjFRQeAhc+Az0BIzUzFSMVFB4CFwcuAScOAQcuAScOAQUXDgMjJzI2NzUzFT4BASEVITUhNSE1IRUhAxZS/aUhITIiEWwBAEgKFCAWFiEVCkj9ahEjMyEhN0YRDzoxMDkPEUUB6gZMnJiQQQs/ikhSP3j+yQIe/ZAB//3/AlP+AQM3/hEB7/66OgsjKi0VDkBADgwhJCINDSIkIQwOQEAOFCwpJAs5EkQoIkESEj8iKERIOgsNBwJAAQJRTQMJ/ko+0k8+yAAABQA0/8IDFgM1AAMALwA/AEMARwAAATMRIyUnPgM9ASM1IRUjFRQWFz4BPQEjNTMVIxUUHgIXBy4BJw4BBy4BJw4BBRcOAyMnMjY3NTMVPgEBESERJRUhNQLEUlL9pyQiMiERawEARyctLSdH/WgRITQiJTZDERA4MzE6DxFDAekGTJyYkEELP4pJUj93/ngCUP4AAbADNf3YvTwNKTE1GQlCQgkkVx4eVyQJQkIJGTUxKQ08FUstKEYUFEUnLUlOOgwOBwJCAQNRTgMJ/jkBJP7c4qCgAAAABQA0/8IDFgM1AAMALwA9AEUASQAAATMRIyUnPgM9ASM1IRUjFRQWFz4BPQEjNTMVIxUUHgIXBy4BJw4BBy4BJw4BBRcGBCMnMjY3NTMVPgEXNTMRIREzFQU1IRUCxFJS/ackITMhEWsBAEcnLS0nR/1oESIzIiQ2RBEQOjEwOhARQwHpBpb+3JcLP4pJUj93d1H9sVEBrf5TAzX9/qk7DCgwMxgDQkIDIlQeHlQiA0JCAxgzMCgMOxRJKyZEFBNEJitITzoWDEEBA1NQAwnsYP61AUtgqWlpAAAAAAYANP+xA2MDFQAtADkAQQBMAFwAaAAAEyc+Az0BIzUhFSMVFB4CFz4BPQEjNSEVIxUUHgIXBy4BJw4BBy4BJw4BBTMVITUzNTMVMzUzBxUzFSE1MzUFFT4BNxcOASsBEQUyHgIVFA4CIyImNTQ2FzI2NTQmIyIGFRQWdCUnPisWiwFOcRIiMR89RXIBT4wWKz8oJUJXFRVUQEBUFhVVAcvi/NHhUshSBKL+bKP+qyViNgtLeCorAc0hOSoYGCo5IURaWkQmMDAmJjIyAdQ8DSkwMxcTQkIOEisrJg4aWSkOQkITGjUvJww7FE4xLUkUFEstME9tQ0NycnLYSj09SjPZAgoOQxIKAR5yDRojFxcjGQ0zLS00kBkWFxkZFxYZAAQANf+3A2MDFQAvADsARwBTAAATJz4DPQEjNSEVIxUUHgIXPgM9ASM1IRUjFRQeAhcHLgEnDgEHLgEnDgEFMxUhNTM1MxUzNTMHMhYVFAYjIiY1NDYXMjY1NCYjIgYVFBZzIyc9KxaLAU5xEiIwHx8xIRJyAVCNFys+JyRCVxUVVT9AVRUVVgHS3PzS2FPVUr2RoqKRkqGhkmp2dmpqdnYB0z4MKTA0FxFDQwwULS0oDw4nLS4VDENDERo1MCYLPhRQMS1PFBVQLjBSc0NDampq8FFMS1FRS0xR+jAtLTExLS0wAAIANf+3A18DAAAvADcAABMnPgM9ASM1IRUjFRQeAhc+Az0BIzUhFSMVFB4CFwcuAScOAQcuAScOAQUVIREjESE1cCUpQCsWjwFTchEiMSAgMCERcQFSkBYrQCklQlcVFVNCQlYVFVcCrf6VU/6UAYs8Dy83OhssQ0MsFzU1MBIRLzU2GCxDQywePDYtDjwWVDQ0WhgaXDQzV2lE/sIBPkQAAAAAAgA0/7UDYgMPAC8APQAAEyc+Az0BIzUhFSMVFB4CFz4DPQEjNSEVIxUUHgIXBy4BJw4BBy4BJw4BBSEVIREjNSE1ITUhNSFzIyc9KxaLAU5xESIxICAwIRFxAU+NFis+KCRAVhYVU0JCVhUUVQKt/pIBBlL95gET/pMDLgHGPA0rMjYYE0JCExUyMCwQDysxMhYTQkITGzcyKAw8FU0zM1QXF1czMFOTd/7k2kJ3QwADADT/ygNiAwUALwA3AD0AABMnPgM9ASM1IRUjFRQeAhc+Az0BIzUhFSMVFB4CFwcuAScOAQcuAScOAQchFSEVIzUhFxUhFSE1dCUnPisWjAFOcBIhMR8fMSEScgFPjBYrPickQFYUFVVCQlUVFVZ/Ay7+l1L+jbkCHf2RAaw9DSwzNhggQkIgFTIxLBAQKzAyFyBCQiAZNzMqDT0WUjAzVhcXWTMwVFxDp6dfuEP7AAIANf/AA2EDIQApAD0AABMnPgE9ASM1IRUjFRQWFz4BPQEjNSEVIxUUHgIXBy4BJw4BBy4BJw4BBSEVIRUhFSEVITUhNSE1ITUhNSF0JU9XjAFPcURAP0NxAU+NFis+KCU/VhUVVEJCVhUVVgKu/pMBBP3xAir9hgIO/e8BDP6TAywB7jwXYjYGQkIGMF8cHF8wBkJCBhs1LyULPBRJMDBRFBRQMC5Kh1rKWD/RUz1aQQAAAAMANf/CA2MDGgAvADsAPwAAEyc+Az0BIzUhFSMVFB4CFz4DPQEjNSEVIxUUHgIXBy4BJw4BBy4BJw4BBSEVIREhESE1ITUhAzUhFXQkJz4qFosBTnERIjEgIDAhEXEBT40WKz4oJEBXFRRUQkJVFBZWAq/+kQEJ/ZwBCP6UAy62/jwBzjwNKzM1GBVDQxUVMTAsEA8rMDIWFUNDFRs3MSkMPBVNMzNTFhdWMzFSkmz+3AEkbEP+b6CgAAAABAA0/8IDYwMYAC8ANwA/AEMAABMnPgM9ASM1IRUjFRQeAhc+Az0BIzUhFSMVFB4CFwcuAScOAQcuAScOAQchFSEVIzUhBTUzESERMxUFNSEVdSUnPSsWiwFOcREiMSAgMCERcQFPjRYrPigmP1YVFVNCQlYUFlWAAy/+kVL+kgJ0Uf2lUQG5/kcB1DsNKzM1GA9CQg8VMTAsEA8rMDIWD0JCDxs3MSkMPBVOMTNTFhdXMTBQTkJ6erBm/rIBTmamZ2cAAAMANf+2A2MDFgAvAEIATgAAEyc+Az0BIzUhFSMVFB4CFz4DPQEjNSEVIxUUHgIXBy4BJw4BBy4BJw4BBSEVHgEVFAYjIiY1NDY3NSE1IQM0JiMiBhUUFjMyNnMjJz4qFosBTnESITIfIDAhEXEBT40WKz4oJEBXFRRUQkJVFBZVAq7+kYGIo4+SooiC/pQDLrl1am10dG1qdQHGPA0sMzUXGkJCGhUxMCsQDyowMhYaQkIaGzcxKQw8FU8xMVUWF1YzMFOMYgZQRktRUUtGUAZiQ/6/LTExLS0wMAADAC//tgMZAzYABwA3AEYAAAEzESM1IzUzJSc+Az0BIzUhFSMVFB4CFz4DPQEjNTMVIxUUHgIXBy4BJw4BBy4BJw4BBRcGBxEjEQ4BIycyPgICx1JSzc39ligjMiEPbQECSAkVIhgZIhUJSP5nECAzIigzQBEOPTY0PA8RPwH+BoKMUkN+OQtClp2fAzb8gNBBzTwQMTg6GCNCQiMUMTIxFBQxMjEUI0JCIxg5NzAQPBhOLTBVGhpVLi1PPzwWCP6+AT4EAkUCBgwAAAAEADD/uQNgAzgABwA3AEcAawAAATMRMxEjNSMlJz4DPQEjNSEVIxUUHgIXPgM9ASM1MxUjFRQeAhcHLgEnDgEHLgEnDgETNQ4BIycyPgI3Fw4BBxUFFRQeAhcHLgEnDgEHLgEnDgEHJz4BPQEzFRQeAhc+AT0BAgi4UlK4/lEgITIjEWsBAEgJFSAXFyAVCUn9ZxEiMiEfNkUSDjo0NDoOEUaYQHY2C0KUm5xKB0WLRQEyGC9DKyVFXBcUUkBAURQXXkIlVWBPEB8vHz8/AV4B2v25M8Y6CyUrMBURQEARECgnJA0NJCcoEBFAQBEVLyskCjoSQionRRMTRCYoRP78hQMCQwEGCgk7CgwEiCIQID42Kgw8FVA2NFcYF1U2NFEVPBpwQBAQGjc0LRAibDQQAAAAAAUAMP+3AxkDNwAHADMAQwBPAFsAAAEzETMRIzUjJSc+Az0BIzUhFSMVFBYXPgE9ASM1MxUjFRQeAhcHLgEnDgEHLgEnDgETNQ4BIycyPgI3Fw4BBxUXMhYVFAYjIiY1NDYXMjY1NCYjIgYVFBYCCLhSUrj+USAhMiMRawEASCcuLShJ/WcRIjIhHzZFEg46NDQ6DhFGmEB2NgtClJucSgdFi0VxlJublJScnJRqcnJqanJyAVkB3v2sO8c5CyUsLxYRQEARJFEcHFIjEUBAERUvKyQLOhNCKidFExNEJipC/veJAgJCAQYKCTsKDAONGEhIRkpKRkhI4isnKCsrKCcrAAAABQAo/7oDVAM2AAMACwA6AEoAYwAAAREjEQEzETMRIzUjJSc+AzUjNTMVIxQeAhc+AzUjNTMVIxQeAhcHLgEnDgEHFSM1LgEnDgETNQ4BIycyPgI3Fw4BBxU3FRQeAhcHLgMnDgMHJz4DPQEDNkz+uaZLS6b+piEfLR4PX9o0BQ4XEhMYDQUx01sPHi4fIS06EQstKwErLgsQOoQ2XioKMHh/gTkFM2g23zBTbT0dM19RQRUVQVJgNBw+blMwAzb9dgKK/iYByf3IMss5CyUtMBZBQREqLCgQEiwsKA1BQRQvLScMORM+JCdIFwEBFUcmIz3+060CAkIBBQoJOgoMA7EDEihDMyIHPgcbJzQhIDQoGwc+ByIzQygSAAADAC//tQMRAzYAAwAzAEMAAAEzESMBJz4DPQEjNSEVIxUUHgIXPgM9ASM1MxUjFRQeAhcHLgEnDgEHLgEnDgEFFw4BBxEjEQ4BIycyPgICv1JS/Z4oIzIgEG0BAkgJFSIZGSEVCUj/aA8hMiMoM0ARDjw2NjsPET8CAAZDiEJSRX86CkKWnaADNvx/AdU8ETE4ORkkQkIkFDEzMRQUMTMxFCRCQiQYOTcxEDwYTi0wVBoaUzAtUEQ+Cw4D/s0BLwMBRQEFDAAAAAIANv+2A2ADAAAvADsAABMnPgM9ASM1IRUjFRQeAhc+Az0BIzUhFSMVFB4CFwcuAScOAQcuAScOAQUVIxEjESMRIxEjNXAlKUArFo8BU3IRIjEgIDAhEXIBU5AWK0ApJEJXFhVUQkJVFRZWAq7SUuJS0gGLPA8vNzobLENDLBc1NTASES81NhgsQ0MsHjw2LQ48F1M0NFoYGlw0M1ZjQ/65AUf+uQFHQwAAAAACADUALQNiAuYALwAzAAATJz4DPQEjNSEVIxUUHgIXPgM9ASM1IRUjFRQeAhcHLgEnDgEHLgEnDgEHIRUhZysrQy4YlwFddBEiMyIiMyIRdAFdlxgtRCsrQloWFlZFRVYWF1l0Ay380wEXPhM8SE4lRENDRB9GRD0XFj1DRyBEQ0NEJ09IPBM+HWtCQm8eH3FCQmvDRAAAAAQANf/CA2MDFwAvADMANwA7AAATJz4DPQEjNSEVIxUUHgIXPgM9ASM1IRUjFRQeAhcHLgEnDgEHLgEnDgEHIRUhExEhESUVITV0JCc+KhaLAU5xEiExHx8xIRJyAVCNFis+KCRAVxUUVEJCVRQWVn8DLvzSZAJk/ewBxAHKPQ0rMzUYFUNDFRUxMCwQDyswMhYVQ0MVGzcxKQw9FU4zM1MWF1cxMFNWQ/57ASr+1umnpwAAAAMANf+5A2IDEAAvADMATAAAEyc+Az0BIzUhFSMVFB4CFz4DPQEjNSEVIxUUHgIXBy4BJw4BBy4BJw4BByEVIQUVFB4CFwcuAycOAwcnPgM9AXMjJz0rFosBTnESITEfIDAiEXEBTowWKz4nI0JVFRVUQkJVFBVVgAMt/NMBvzBRbj0fNF9RPxQUQFFgMx8+bVIwAcU8DSszNRgVQkIVFTEwLBAPKzAyFhVCQhUbNzEpDDwUTjMzUxcXVjMwU1RCShwsTDspCUAIIC88JCQ8LyAIQAkpO0wsHAAAAAAEADX/tgNjAxEALwAzAD8ASwAAEyc+Az0BIzUhFSMVFB4CFz4DPQEjNSEVIxUUHgIXBy4BJw4BBy4BJw4BByEVIQUyFhUUBiMiJjU0NhcyNjU0JiMiBhUUFnMjJz4qFosBTnESITIfHzAhEnIBUI0WKz4oJEBXFRVUQkJUFBZVgAMu/NIBlZGiopGRoqKRanZ2amp2dgHBPA0rMzUYGkJCGhUxMCsQDyowMhYaQkIaGzcxKQw8FE4zM1MWF1YzMFRUQlJQTEtRUUtMUPkwLS0wMC0tMAAAAAACADD/tgMfAzYAAwAzAAABMxEjAxUUHgIXBy4BJw4BBy4BJw4BByc+Az0BIzUhFSMVFB4CFz4DPQEjNTMVAs1SUr4NHzYpNDM7ERA8NjY8ERE8MTQpNiAMbgECRggVIxwbIxUIRvsDNvyAAuNtMWxnWyA7J3lGSH8oKn9IRnooOyFdZ2svbUNDbSVZXFgkJFdaWidtQ0MAAAMAMP+1Ax4DNgADADMAOQAAATMRIycHLgEnDgEHLgEnDgEHJz4DPQEjNSEVIxUUHgIXPgM9ASM1MxUjFRQeAgU1IREjNQLMUlIyKzZBEw89NDY7DxNBNismNiIQbwEAQwgVIhoaIhUIRP5sECI2/kYCZFIDNv3oYzwcXDc3Yh4fYzc3XR08FT5GSSAuQ0MuGT1APhkZPT8+Gi5DQy4hSkc850L+xfkAAAMAMP/KAzcDNgADADMAOQAAAREjEQMHLgEnDgEHLgEnDgEHJz4DPQEjNSEVIxUUHgIXPgM9ASM1MxUjFRQeAgEhFSERMwMeUjIrNkETDzs2NjsPE0E2KyY2IhBvAQBDCBQjGhoiFQhE/mwQIjb+qgIZ/ZZRAzb9ZgKa/jM7HFw2NmIfIGM2Nl0dOxU+RkkgPUNDPRk9Pz0aGTw/Pho9Q0M9IUpGPf6QQwEPAAADAC//wAMnAzYAAwAzADsAAAERIxEDBy4BJw4BBy4BJw4BByc+Az0BIzUhFSMVFB4CFz4DPQEjNTMVIxUUHgIBIRUhESEVIQMeUj0sNEMTDjsxMzsOEkI0LCY2IxByAQFBBxMhGRgfEwdA/W4QIzb+pwIX/ZcCYf3xAzb98QIP/lY8G1c2Nl8dH2E2NFodOxQ9RUkgJkJCJhg8Pj0ZGDs+PRomQkImJEpEOv5lRAE7QgAAAAADADH/wAM4AzYAAwAzAD8AAAERIxEDBy4BJw4BBy4BJw4BByc+Az0BIzUhFSMVFB4CFz4DPQEjNTMVIxUUHgIBIRUhNSE1ITUhFSEDHlIzJzZEEw88NjQ8EBJENickNiMRcAEAQwkVIhkZIhUJRP5tESM1/qkCG/2UAgL9/AJU/f8DNv4mAdr+fTwaVjEzWhscWjMzVRo8Ejc+PxsxQkIxFTU4NxYVNTg3FjFCQjEbQD42/jtA3lZA0wAAAAQAMP/CAx4DNwADADMANwA7AAABMxEjJwcuAScOAQcuAScOAQcnPgM9ASM1IRUjFRQeAhc+Az0BIzUzFSMVFB4CAREhESUVITUCzFJSMis2QRMPOzY2Ow8TQTYrJjYiEG8BAEMIFCMaGiIVCET+bBAiNv5YAlL9/gGyAzf982Q8HVs2NmIeH2M2Nl0dPBU+RkkgJkNDJhk9Pz0aGDw/PhsmQ0MmIUpGPf4gATf+yfWysgAAAAQAMP/CAx4DNgADADMAOwA/AAABMxEjJwcuAScOAQcuAScOAQcnPgM9ASM1IRUjFRQeAhc+Az0BIzUzFSMVFB4CFzUzESERMxUFNSEVAsxSUjIqNkITDz00ND0PE0I2KiY2IhBvAQBDCBUiGhkiFQlE/mwQIjZaUP2xUgGt/lMDNv4PWTsbWjY2YR0eYTY2Wxw7FDxFRx8kQ0MkGDs9PBkYOj08GiRDQyQgSEQ7/2r+pgFaaq5tbQADAC//qANIAzYAAwAzAEwAAAERIxEDBy4BJw4BBy4BJw4BByc+Az0BIzUhFSMVFB4CFz4DPQEjNTMVIxUUHgIHFRQeAhcHLgMnDgMHJz4DPQEDHlI9LDRDEw45MzM7DhJCNCwmNiMQcgEBQQcTIBkYIBMHQP1uECM2SjBSazwmMVxPPhQUQFFeMyI9bVMxAzb9owJd/lU7G1c2Nl4dH2I2NlscOhU9RkkgKUJCKRg8Pj0ZGTs+PBopQkIpJEtFOpEhMFVELgpBCiQzQSgoQjQkCkILL0RVMR8AAAAABAAw/7cDIwM2AAMAMwA/AEsAAAERIxEDBy4BJw4BBy4BJw4BByc+Az0BIzUhFSMVFB4CFz4DPQEjNTMVIxUUHgIHMhYVFAYjIiY1NDYTMjY1NCYjIgYVFBYDHlIyKzZBEw87NjY7DxNBNismNiIQbwEAQwgUIxoaIhUIRP5sECI2hpClpZCRpKSRand3amp3dwM2/dUCK/5NOxxcNjZiHx9jNjZdHDsVPkZJICZCQiYZPT89Ghk8Pz4aJkJCJiFKRj2bVE5OVVVOTlT+/DIwMDIyMDAyAAAAAwAw/7oDRgM3AAMAMwBOAAABESMRAwcuAScOAQcuAScOAQcnPgM9ASM1IRUjFRQeAhc+Az0BIzUzFSMVFB4CFyMeAxcHLgMnDgMHJz4DNyM1IQMeUjIrNkETDz00NjsPE0E2KyY2IhBvAQBDCBUiGhoiFQhE/mwQIjaw/wUyTmU3HTFdTz4TFD5OWzIdOGNNMQX+AlMDN/31Agv+XTwdWzY2Yh4fYzY2XR08FT1GSSAlQkIlGD0/PhkYPD8+GiVCQiUhSkY87CRANCQIPgceLTkiIjgsHwg+CCU0QCNBAAAFADH/twMyAzYAAwAzADsARwBPAAABESMRAwcuAScOAQcuAScOAQcnPgM9ASM1IRUjFRQeAhc+Az0BIzUzFSMVFB4CByEVITUhNTMHMhYVFAYjIiY1NDYXMjU0IyIVFAMeUjMmNkUSDz02NDwQEkQ2JyQ2IxFwAQBDCRUiGRkiFQlE/m0RIzVUARL9hwEVUimAhYWAgoSEgbe2twM2/gwB9P6AOxlUMTNaHB1ZMzFWGjsSNz4/GzFCQjEVNTg2FhU0ODYXMUJCMRw/PDW4Pz9UvD08PDw8PDw9tz4/Pz4AAAIALf+2A3sDNwAHACQAAAEVIxEjETMRJRUUHgIXBy4BJw4BByc+Az0BIzUzNTMVMxUDe5RSUv56IDlRMC5LbB0dc04uMVM9IsvKUscBxkT+NAOB/o+URjZqXkwXQCSJWF6RJj4YTmJxOkZCi4tCAAADADb/tgNyAzsAHAAkACoAAAEHLgEnDgEHJz4DPQEjNTM1MxUzFSMVFB4CJRUjFSMRMxUBNSERIzUCQShMcR0ddU4pMlI7IMfHUsbGHzlRAWKFUlL9uQJHUgF3QBhhQkhpG0EQNkZULhJCcnJCEipPQjTCRe8CIu7+WkP+0ewAAAMANv/KA3IDNwAHACQAKgAAATMVIxEjETMDBy4BJw4BByc+Az0BIzUzNTMVMxUjFRQeAgcVIRUhEQLthYVSUqwoTHEdHXRPKTJSOyDHx1LGxh85Uf8CBP2qAiBE/sICmf4mQBllQ0trG0AQOElXLhlBdHRBGStRRTWUzEMBDwAABgA0/7YDcgM7ABwAJAAsADcASwBXAAABBy4BJw4BByc+Az0BIzUzNTMVMxUjFRQeAjczFSMVIxEzAxUzFSE1MzUFET4BNxcOASsBEQUyHgIVFA4CIyIuAjU0PgIXMjY1NCYjIgYVFBYCRSJOdSAdeVIkMlM7IcbGUsbGITtS2IWFUlJguf49uv6mJ10wDUB4LisB0iQ9LBkZLD0kJD0sGRksPSQoNDQoKjIyAbg+E1I5Q2AXPw0vPkooEEJgYEIQJEE2KqhEwAHP/h9PPj5PQv76Ag0QQhUMAUprESAtGxwuHxERHy4cGy0gEbkjHR0iIh0dIwAAAAADADL/wANyAzsAHAAkADAAAAEHLgEnDgEHJz4DPQEjNTM1MxUzFSMVFB4CNzMVIxUjETMBFSEVITUhNSE1IRUCRCNOdR8delElMlM8IsfHUsbGIDtR2oWFUlL+GQII/agB5v4XAjoBsz8UVDxCXBc/DS09SSgPQmBgQg8kRDgrsETOAdn9KV9A3FVA0gAAAAAEADX/wgNyAzsAHAAkACgALAAAAQcuAScOAQcnPgM9ASM1MzUzFTMVIxUUHgIlFSMVIxEzFQERIRElFSE1AkInTnAeHXRRKDJSOyHHx1LGxh86UQFhhVJS/c0CM/4dAZIBhj8YX0BIZhpADzVFUi0OQm1tQg4oTUEzv0TsAhPj/W4BOP7I97W1AAAAAAQANP/CA3IDOwAcACQALAAwAAABBy4BJw4BByc+Az0BIzUzNTMVMxUjFRQeAiUVIxUjETMVAzUzESERMxUFNSEVAkImTnEeHXVRKDJTOyHHx1LGxiA5UQFhhVJSUVH9y1EBk/5tAZdAF10/RWYZQA8zQ1ArC0FpaUELKEo/MLxE2gHz1f5PaP6qAVZoq2pqAAMANv+6A3IDOgAcACQAPQAAAQcuAScOAQcnPgM9ASM1MzUzFTMVIxUUHgI3MxUjESMRMwMVFB4CFwcuAycOAwcnPgM9AQJCJk5xHh10TykyUjsgx8dSxsYgOVHchYVSUuYwU2w8IS1aUUMXFEBRXjIgPGxTMQGBQBdfP0hqGkAPNkdULRNCbm5CEyhNQTKvRP7gAl79zhMwUkAtCkAIHzBBKiVAMSMJQAosQVIwEwAAAwA1/7sDcgM7ABwAJABIAAATJz4DPQEjNTM1MxUzFSMVFB4CFwcuAScOAQEzFSMVIxEzAxUUHgIXBy4BJw4BBy4BJw4BByc+Az0BMxUUFhc+AT0BXSgyUjshx8dSxsYgOVExJ05wHh10Aj+FhVJSRhguQyspQloXFFI/QlAUGFs/KCpDLhlPPT8/PwE2QBA1RVEtDkJtbUIOKUxBMg9AGF9ARmgBBETiAgn9yyciQzsuDj0YVjk2XhoZWjk2Vxg9DzA7QiAnJzxyJCpyNicAAAQANv+4A3IDOwAcACQAMAA8AAABBy4BJw4BByc+Az0BIzUzNTMVMxUjFRQeAjczFSMVIxEzATIWFRQGIyImNTQ2EzI2NTQmIyIGFRQWAkInTHIeHXRPKTJSOyDHx1LGxiA5UdyFhVJS/uOJnp6JjJycjGRxcWRnb28Bf0AYXkBIahtBDzZHVC0SQnFxQhIpTEEywUT6Aib9xFROTlNTTk5U/vwyMDAyMjAwMgADADX/uQNyAzsAHAAkAD0AAAEHLgEnDgEHJz4DPQEjNTM1MxUzFSMVFB4CNzMVIxUjETMTIx4DFwcuAycOAQcnPgM3IzUhAkInTnAeHXZPKDJSOyHHx1LGxh86UdyFhVJSD/sGMk1jNh8xW049EyagZB02Y00xBfoCSwGJPxdeP0ZmGkEPNERRLA9CbW1CDyhMQDLCROcCCP2GIz80JQk/CCAtOiFEWxA/CCQ0QCNBAAIALf+2AzIDNwALACgAAAEzESMRIxEjETMRMyUVFB4CFwcuAScOAQcnPgM9ASM1MzUzFTMVAuNPT3ZNTXb+VxsxSC0vQl0ZF11CMS1HMRqpqU+oAzf8fwHT/lkDQf6qgCk2aV5NGT0lgFFYiyc+G1JjbzcpQ4aGQwAAAAADADz/tgMqAzYACwAoAC4AAAEzESM1IxUjETMVMw8BLgEnDgEHJz4DPQEjNTM1MxUzFSMVFB4CBzUhESM1AttPT3FNTXHnJ0JbGBZbQygrQy4YoqJOoKAZL0P6AltSAzb92vTuAhHgzT8aXz1CZxw8EjlGUSsKQmxsQgonTUI17EP+1egAAAAAAwA9/8sDRAM3AAsAJgAsAAABESMRMxEzETMRIxEPAS4BJw4BByc+AzUjNTM1MxUzFSMUHgIDIRUhETMCak1NcU9P6CpAWRgWWEIrK0IuGKKiTqCgGS5DlQIR/Z1SAd3+1AJ1/voBF/1aAUyBPRxmQkVwID4UP05XLUJvb0IqU0k8/p9DARMAAAMAOv/CA0wDNgALACgANAAAARUjETMVMzUzESM1DwEuAScOAQcnPgM9ASM1MzUzFTMVIxUUHgIDIRUhNSE1ITUhFSECak1NcU9P5SVCXhkXXkMmKkMvGqKiTqCgGjBEnwIf/ZAB/f4BAlD+AwIoyQHGusv+IdF5PhdYOT1iGj4QND9HIgZBYWFBBiFCOy/+RD/aVT/RAAAABAA8/8IDKgM2AAsAKAAsADAAAAEzESM1IxUjETMVMw8BLgEnDgEHJz4DPQEjNTM1MxUzFSMVFB4CAxEhESUVITUC209PcU1NcecnQlsYFlxCKCtDLhiiok6goBkvRO0CTf4DAa0DNv3w6N8B+NbMPRphPUNpHT4SOkdRKQNCaWlCAydMQzb+LAE2/sr1s7MABAA6/8IDKgM2AAsAJgAuADIAAAEzESM1IxUjETMVMw8BLgEnDgEHJz4DNSM1MzUzFTMVIxQeAgU1MxEhETMVBTUhFQLbT09xTU1x5idCXBgXXEIpKkMwGaKiTqCgGjBDAQ5R/bNSAar+VgM2/gre1wHfxM0+Gl48QmYcPRI3RE4oQWhoQSVJQTPwZv6nAVlmsG9vAAMAPP+6A1gDNgALACgAQQAAARUjETMVMzUzESMRDwEuAScOAQcnPgM9ASM1MzUzFTMVIxUUHgIXFRQeAhcHLgMnDgMHJz4DPQECak1NcU9P5ydCWhgXW0IpK0MuGKKiTqCgGS9EXzJUbjsfMmBSQhQVQlFeMx87bVQyAg/pAgHV5P2jATaOPxpgPUJrHj8SOkhRKgJCaWlCAiZMQzaUFStPPywJQAkiMD8lJT8wIglACSw/TysVAAADADz/uQNwAzYACwAoAE4AAAEVIxEzFTM1MxEjNQ8BLgEnDgEHJz4DPQEjNTM1MxUzFSMVFB4CFxUUHgIXBy4BJw4BBy4BJw4BByc+Az0BMxUUFhc+Az0BAmpNTXFPT+cnQlsYFlxCKCtDLhiiok6goBkvRPIYL0MqKENbFxVSPz9SFBhaQCkqQy8YTz4/IC8fEAIL4AH71+f97+aLPhphPEJpHD0SOkdRKANCampCAyZMQzaNKCNDOi8OPRdXOTZfGhpZOTZWGD0PMTtCICgoPHIkEzM5OhkoAAAABAA8/7cDLgM2AAsAKAA0AEAAAAEVIxEzFTM1MxEjNQ8BLgEnDgEHJz4DPQEjNTM1MxUzFSMVFB4CFzIWFRQGIyImNTQ2EzI2NTQmIyIGFRQWAmpNTXFPT+cnQlsXF1tCKStDLhiiok6goBkvRDiPnZ2Pi6Cgi2d0dGdnc3MCAtoB/d/w/c/9hj4aYD1Dah09EjtIUikDQmlpQgMnTEI2llJOTlJTTU1T/wAyLi4yMi4uMgAAAgAt/7cDdgM4AAsAKAAAASMVMxUjESMRMxUzJRUUHgIXBy4BJw4BByc+Az0BIzUzNTMVMxUDdo+Pj1JSj/3rIDlRMC5LbB0dc04uMVM9IsvKUscCEs5E/rcDgeIERTdqXUwYPySJWF6SJj8YTmJxOkVCi4tCAAAAAwA2/8oDcQM3AAsAKAAuAAABIxUzFSMVIxEzFTMBBy4BJw4BByc+Az0BIzUzNTMVMxUjFRQeAgcVIRUhEQNxhISEUlKE/tAoTHEdHXRPKTJSOyDHx1LGxh85Uf8CBP2qAkaZRMsCma3+00EaZENLaxtAEDlJVy4ZQXR0QRkrUUU1lctDAQ4AAAYANP+2A3EDOwAcACgAMAA7AE8AWwAAAQcuAScOAQcnPgM9ASM1MzUzFTMVIxUUHgIlIxUzFSMVIxEzFTMDFTMVITUzNQURPgE3Fw4BKwERBTIeAhUUDgIjIi4CNTQ+AhcyNjU0JiMiBhUUFgJFIk51IB15UiQyUzshxsZSxsYhO1IBXISEhFJShOS5/j26/qYnXTANQHguKwHSJD0sGRksPSQkPSwZGSw9JCg0NCgqMjIBuD4TUTlCYBc/DS8+SigQQmBgQhAkQTYqwmhCdAHObf6NTz4+T0L++gINEEIVDAFKaxEgLRscLh8RER8uHBstIBG5Ix0dIiIdHSMAAAADADL/wANxAzsAHAAoADQAAAEHLgEnDgEHJz4DPQEjNTM1MxUzFSMVFB4CJSMVMxUjFSMRMxUzARUhFSE1ITUhNSEVAkQjTnUfHXpRJTJTPCLHx1LGxiA7UQFehISEUlKE/ZUCCP2oAeb+FwI6AbM+FFU6QlwXQA0tPUkoDkJgYEIOJUM5K8lsQn0B2W39ll9A3FVA0gAAAAQANf/CA3ADOwAcACgALAAwAAABBy4BJw4BByc+Az0BIzUzNTMVMxUjFRQeAiUjFTMVIxUjETMVMwERIRElFSE1AkInTnAeHXRRKDJSOyHHx1LGxiA5UQFfg4ODUlKD/UoCM/4dAZIBh0AYX0BGaBpAEDVFUS0OQm1tQg4pTEEy2ntDjgIThP0PATj+yPe1tQAAAAAEADb/uANvAzsAHAAoADQAQAAAAQcuAScOAQcnPgM9ASM1MzUzFTMVIxUUHgIlIxUzFSMVIxEzFTMBMhYVFAYjIiY1NDYTMjY1NCYjIgYVFBYCQidMch4ddE8pMlI7IMfHUsbGIDlRAV6CgoJSUoL+YYmenomMnJyMZHFxZGdvbwF/QBheQEhqG0EPNkdULRJCcXFCEilMQTLbfESYAiWK/k9UTk5TU05OVP78MjAwMjIwMDIAAAAAAgA2/7QDGAM4AAcAJAAAATMRIxEjNTMlFRQeAhcHLgEnDgEHJz4DPQEjNTM1MxUzFQLGUlLCwv6lIz1VMS1OdR4ddE4uMVQ9IsvKUscDOPx8AdhDi0U4bF5KFj8jiFtekyY/GE5icTpFQouLQgAAAAMAN/+2AxgDOwAcACQAKgAAAQcuAScOAQcnPgM9ASM1MzUzFTMVIxUUHgITMxEjNSM1MwE1IREjNQJHJ050Hx10TygyUTsgx8dSxsYhO1OvU1O1tf37AlhTAW5AGWRDSG0bQBA4SVYtFkJxcUIWK1BENQG5/d7XRP5zQ/7Q7QAAAwA3/8oDMQM2AAcAJAAqAAABMxEzESMRIxcHLgEnDgEHJz4DPQEjNTM1MxUzFSMVFB4CAyEVIREzAhC1U1O1NyhOcx8dc08pMlI6IMfHUsbGITtT6QIE/alTAiMBE/1jAUaHQRplRUttHEAROUpXLxxCcnJCHC1SRTX+pUMBCwADADL/wAM5AzsAHAAkADAAAAEHLgEnDgEHJz4DPQEjNTM1MxUzFSMVFB4CJzM1MxEjNSMDIRUhNSE1ITUhFSECTCNReSAdelElMlM8IsfHUsbGIz1UCLJSUrLrAhH9ngHv/g8CQv4RAbA/FFQ8Ql0XQA0uPUknFUJdXUIVJUQ4Kpze/iq1/etA3ldA1AAAAAAEADX/wgMYAzsAHAAkACgALAAAAQcuAScOAQcnPgM9ASM1MzUzFTMVIxUUHgITMxEjNSM1MwERIRElFSE1AkknTnYfHXRRKDJSOyHHx1LGxiE8U65TU7Gx/gwCR/4JAacBhEEXX0JIZxpAEDVFUi0RQm1tQhEqTUExAaX97dVE/YUBM/7N8rCwAAAAAAQANP/CAxcDOwAcACQALAAwAAABBy4BJw4BByc+Az0BIzUzNTMVMxUjFRQeAhMzESM1IzUzEzUzESERMxUFNSEVAkkmTncfHXVRKDJTOyHHx1LGxiE8U65SUrGxAVH9wlEBnP5kAZJBF11ARWYaQA80Q1ErD0JoaEIPKEw/MAGX/hC+Q/5sa/6kAVxrrm1tAAMAN/+6A04DOgAcACQAPQAAAQcuAScOAQcnPgM9ASM1MzUzFTMVIxUUHgI3MzUzESMRIxcVFB4CFwcuAycOAwcnPgM9AQJCKExxHR10TykyUjogx8dSxsYgOVECs1JSsw4xU208IDNfUUAUFUBRXjMhPG1TMgF5QBliQEluG0AQOUlWLhRBbW1BFClPQzWx/v2TASzwEy9SQS0KQAkjMkAnJkAzIwlACi5CUi0TAAAAAwA1/7oDawM7ABwAJABKAAABBy4BJw4BByc+Az0BIzUzNTMVMxUjFRQeAiczNTMRIzUjFxUUHgIXBy4BJw4BBy4BJw4BByc+Az0BMxUUFhc+Az0BAkknTnYfHXZPKDJSOyHHx1LGxiE8Uwa0U1O0pRgvQysoQl0XFFI/QFEUGVs/KCpDLhlPPT8gMB8QAYJBF2BCRmoaQQ81RVIrFUJtbUIVKE1AMqv8/eXb+SUiQzouDT4XWDc2XRoZWjk2Vxg+DjA7Qh8lJTxxJBQ0ODgZJQAAAAAEADf/twMbAzsAHAAkADQAQAAAAQcuAScOAQcnPgM9ASM1MzUzFTMVIxUUHgInMzUzESM1IwcyFhUUBiMiLgI1ND4CEzI2NTQmIyIGFRQWAkgmTnUfHXNRKDFSOiHHx1LGxiE8UwWzU1OzI4ygoIxFbk4pKU5uRWdzc2dncXEBfD8YYEJLbBo/EThIVS0RQnBwQhEqTkIzrf/94N30Vk5PVhYqPicnPSoW/vc1MDA0NDAwNQADAC7/twMvAzcAAwALACgAAAEzESMDETMRIxEjNScVFB4CFwcuAScOAQcnPgM9ASM1MzUzFTMVAuBPT7ROTolpGjJILS9CXRkXXUIwLUcxGaamT6UDN/yAAh4BTfzDAaxEeSs2al9NGD4lglFYiyg9G1NkbzcrRIWFRAAABAA8/7YDKgM2AAMAIAAoAC4AAAEzESMnBy4BJw4BByc+Az0BIzUzNTMVMxUjFRQeAiczNTMRIzUjAzUhESM1AttPT+gmQlsYFlxCKCtDLhiiok6fnxkvQx6DTk6D3AJbUgM2/dhlPRpgPEJoHT4SOUdRKRBCbGxCECdMQzar9v3z1f61Qv7T6wAAAAAEAD3/ygNEAzcAAwALACgALgAAAREjEQEzETMRIxEjFwcuAScOAQcnPgM9ASM1MzUzFTMVIxUUHgIDIRUhETMDKk/+zoVOToVKKkJXGBZYQisrQy0YoqJOn58YL0OVAhH9nVIDN/1ZAqf+5QEH/YUBMYg9HWdARXAgPRU/TlgtCkJvb0IKKlNKPP6pQwERAAAEADr/wANMAzYAAwAgACgANAAAAREjEQMHLgEnDgEHJz4DPQEjNTM1MxUzFSMVFB4CJzM1MxEjNSMDIRUhNSE1ITUhFSEDKk/mJEJeGRdeQyYqQy8aoqJOn58aMEMfgk5Ogn8CH/2QAf3+AQJQ/gMDNv4cAeT+bTwXWzk/Yxs+ETRARyQRQF5eQBEiQzwwntX+Nrb970DZUEDNAAAFADz/wgMqAzYAAwAgACgALAAwAAABMxEjJwcuAScOAQcnPgM9ASM1MzUzFTMVIxUUHgInMzUzESM1IwMRIRElFSE1AttPT+coQloYF1pCKStDLhiiok6fnxkvQx2CTk6CzwJN/gMBrQM2/eVePhtgP0VoHT0SO0lSKgxCaGhCDCdORDet8f380P3OAS7+0u2rqwAABQA7/8IDKgM3AAMAIAAoADAANAAAATMRIycHLgEnDgEHJz4DPQEjNTM1MxUzFSMVFB4CJzM1MxEjNSMBNTMRIREzFQU1IRUC209P6CZCWxgWXEIpK0MvGKKiTp+fGS9DHoNOToMBLlH9s1IBqv5WAzf+BUo8GV88QmcdPhI5RlAoCUJmZkIJJUxCNqfr/hu4/rdk/qwBVGStbW0ABAA8/7kDWAM2AAMAIAAoAEEAAAERIxEDBy4BJw4BByc+Az0BIzUzNTMVMxUjFRQeAiczNTMRIzUjFxUUHgIXBy4DJw4DByc+Az0BAypP6CdCWRkWWkIqK0MuGKKiTp+fGS5EGn9OTn95M1RuOx8yYFJCFBVBUl4zHzttVDIDNv2cAmT+PD0aYT1DbB09EzxKUyoLQmhoQgsnTkQ4sfP9/M70FStPPywJQQkiMT8lJT8xIglBCSw/TysVAAAFADz/twMuAzYAAwALACgANgBCAAABESMRATM1MxEjNSMXBy4BJw4BByc+Az0BIzUzNTMVMxUjFRQeAhcyFhUUBiMiJjU0PgIXMjY1NCYjIgYVFBYDKk/+0INOToNIJ0JaGBZbQikrQy4YoqJOn58ZL0M5jKCdj4ugKU5vRWd0dGdnc3MDNv3KAjb++/f9+8t8PhpgPUJrHT4SO0hSKg1CZ2dCDSdMRDaNU0xOUlNNJjspFf8yLi0zMy0uMgAAAAACADb/tQMXAzgACwAoAAABMxEjESM1MzUjNTMlFRQeAhcHLgEnDgEHJz4DPQEjNTM1MxUzFQLFUlK2tra2/qYjPVUxL0x1Hh10Ti4yUz0iy8pSxwM4/H0BaER3Qz9GN2xeSxc/I4lbXpEmPhhOYnA6RkKLi0IAAAADADf/zwMxAzYACwAoAC4AAAEzNTMRIzUjNTM1IxcHLgEnDgEHJz4DPQEjNTM1MxUzFSMVFB4CAyEVIREzAiShUlKhoaEiKU5yHh1zTioyUjogx8dSxsYgO1LlAgL9qVUCXNr9ZONDWMlAGmhGS28cQBI6S1gvHkJyckIeLVVHN/6zQwEGAAAAAwA2/7EDawM6ABwAKABMAAABBy4BJw4BByc+Az0BIzUzNTMVMxUjFRQeAjczNTMRIzUjNTM1IxMVFB4CFwcuAScOAQcuAScOAQcnPgM9ATMVFBYXPgE9AQJHJ051Hxx1TygyUjohx8dSxsYhO1MOoVNToaGhkhgvQyspQlwXFFI/QlAUGFs/KSpELhlPPT8/QAF4PxhkQ0hqGkAPNkdTLBZCa2tCFipPQzTrxf3kf0NS/tEuIkM7Lw48F1c5Nl4bGls5NlgYPA8xO0IgLi48ciQqcjYuAAAAAwAt/7YDLwM3AAMADwAsAAABMxEjAxEzESMRIzUzNSM1JxUUHgIXBy4BJw4BByc+Az0BIzUzNTMVMxUC4E9PsE5OgICAdhoxSC0vQl0ZF11CMC1HMRqmpk6kAzf8fwJjAQn8wgFFQ2lENiw2a19OGT0lg1FYiig9G1NkbzcsQ4WFQwAABAA5/9IDRAM3AAMADwAsADIAAAERIxEFMzUzESM1IzUzNSMXBy4BJw4BByc+Az0BIzUzNTMVMxUjFRQeAgMhFSERMwMqT/7aeU5OeXl5OipCWBcWWEIrK0MtGKCgTp6eGC9DkQIR/Z1SAzf9WAKo6dX9hNZBT8A9HWdCRm4ePBQ+TlkuDEJtbUIMLFVKPP61QwEOAAUAPP+3Ay4DNgADACAALAA4AEQAAAERIxEDBy4BJw4BByc+Az0BIzUzNTMVMxUjFRQeAiczNTMRIzUjNTM1IxMyFhUUBiMiJjU0NhcyNjU0JiMiBhUUFgMqT+gnQloYF1pCKStDLhiiok6fnxkuRApvTk5vb29DjKCejo+cnI9ndHRnZ3NzAzb9wQI//kM+G2A/Q2odPRM7SFIqDEJoaEIMKE1EN+K8/fGQQET+xFJMS1FRS0xS+zAtLjAwLi0wAAIANQAnA2MDIwAeACYAABMnPgM1ITUhNTMVIRUhFB4CFwcuAycOAwUhFSE1ITUzgiBBdVcz/t8BIVMBIP7gM1d1QSA2ZVVEFRVEVmUBPQFu/NIBbVMBF0EKMUZaNEJ6ekI0WkYxCkEKJTREKSlENCW2RETMAAAAAAMANf+1A2ADPAAeACYALAAAEyc+AzchNSE1MxUhFSEeAxcHLgMnDgMFIRUhNSE1MwE1IREjNX8ZQHBUMgL+6wEZUgEZ/uoCMlRxQBo3ZldDFBREV2YBPgFs/NUBbVL+mwJtUgGjPwYgMEAlQV5eQSVAMCAGPwYaJzYiIjYoGU1CQm/+uEH+8c4AAAAAAwA0/8oDYAM4AB4AJgAsAAATJz4DNyE1ITUzFSEVIR4DFwcuAycOAwUhFSE1ITUzBRUhFSE1gBo/b1QzA/7qARpSARn+6gMzVG8/GzdmVkIUFENWZgE8AWz81AFuUv77Ahf9lwGTPgciMkInQWJiQSdCMiIHPgYbKjgjIzgqG1FCQnT9skP1AAMANv/AA18DPAAeACYAMgAAEyc+AzchNSE1MxUhFSEeAxcHLgMnDgMFIRUhNSE1MwEVIRUhNSE1ITUhFXgYP3BVNQT+6wEaUgEZ/usENFVwQBk4aFhFFRREWGkBQgFs/NcBa1L+9gIq/YYCDv3vAmIBzT0EGik3Ij1VVT0iNykaBD0EFiMxHx8xIxY4Pj5k/ldWPs9LPcMABAA1/8IDYAM9AB4AJgAqAC4AABMnPgM3ITUhNTMVIRUhHgMXBy4DJw4DBSEVITUhNTMBESERJRUhNX0ZP3BVMwP+6wEZUgEZ/uoDM1VwPxk3Z1dEFBVEV2YBPwFs/NUBbVL+pQJk/ewBxAGwPwYdLj0lQVpaQSU9Lh0GPwYZJjQhITQmGUtCQnL95QEV/uvUkpIAAAQANP/CA2ADPAAeACYALgAyAAATJz4DNyE1ITUzFSEVIR4DFwcuAycOAwUhFSE1ITUzEzUzESERMxUFNSEVehhAcFU0A/7qARpSARn+6gMzVXFAGThnV0QVFURYaAFCAWz81AFuUrJR/aRRAbr+RgG9PgUcKzsjQVZWQSM7KxwFPgUXJTIgIDIlF0ZCQm/+wFz+uwFFXKdoaAAAAAMANf+5A2ADPAAeACYAPQAAEyc+AzchNSE1MxUhFSEeAxcHLgMnDgMFIRUhNSE1Mx0BFB4CFwcuAycOAQcnPgM9AX8ZQG9UMgP+6wEZUgEZ/uoDMlRwQBo3ZldDFBREV2YBPgFs/NUBbVIwUm49HjRgUUATKqZqHj5tUjABpj8GHzA/JkFcXEEmPzAfBj8GGig2ISE2KBpJQkJx6BgqSjonCD4IHi07JElZED4IJzlKKxgAAAQANf+3A2ADOgAeACYAMgA+AAATJz4DNyE1ITUzFSEVIR4DFwcuAycOAwUhFSE1ITUzBzIWFRQGIyImNTQ2FzI2NTQmIyIGFRQWfhk/b1Q0A/7rARlSARn+6gMzVXA/GTdnV0QUFUNXZgE+AWz81QFtUiqVnp6VlZ6elWp2dmptc3MBqUAGHy49JUFbW0ElPS8eBkAGGic1ISE1JxpJQkJv9ExJSUxMSUlM7C0qKi4uKiotAAMAK/+2A3UDNwAHACIAMgAAARUjESMRMxEFJz4DNyM1MzUzFTMVIx4DFwcuAScOATcVPgE3Fw4DIycyNjc1A3WOUlL9eicyUjshAczMUtDQASI8UzEmT3cfHXa7PXk5B0iUkIc6CzZ5QgG/Rf48A4H+iIBADzNDUCxCbm5CK01AMQ8/GWFDSGUMsQMKCD0NDgYBRAECtAAABAAz/8QDcAM2AAcAIgAyADgAAAEzFSMRIxEzASc+AzcjNTM1MxUzFSMeAxcHLgEnDgEFFw4DIycyNjc1MxU+AQUVIRUhNQLshIRSUv2FIi5NOCECxcRSw8MBIThNLiFOcR0ccgGhBUWRj4c8CzZ5QlI8dv7fAgX9qQIIRP6/ArP+WkALJzM+IkBcXEAgOjAjCkATSzY6VEI8Cw4HA0QBAnJuAwmetUP4AAAAAAQANP/AA3ADOQAaACIAMgA+AAATJz4DNSM1MzUzFTMVIxQeAhcHLgEnDgElMxUjFSMRMwMXDgMjJzI2NzUzFT4BARUhFSE1ITUhNSEVaRwtTzshxMNSw8MiOk4sG1F1HRx4AjKEhFJSigdGk5CHOwo2ekBSPHf+0QIU/ZwB8f4MAkUB0zwIHikzHT1OTj0bMSccBz0ORDAzSX9E4gH8/ns6DA0HAUABAmJfAwr+qFM+zEo9wgAAAAAFADT/twNwAzYAGgAiADIAPgBKAAATJz4DNyM1MzUzFTMVIx4DFwcuAScOASUzFSMRIxEzAxcOAyMnMjY3NTMVPgEHMhYVFAYjIiY1NDYXMjY1NCYjIgYVFBZvIS9NOCECxMNSw8MCIThNLSBOcR4cdAIuhIRSUooHRpOQiDoKNnhCUjx3X4qenoqKnp6KZ29vZ2dvbwGhQAokMTshQFpaQB83LSEJQBFKNDlRg0T+8wJQ/kY6DA4HAkIBAm9rAwmRTUlITk5ISU3tLSoqLS0qKi0AAAMAK/+3AzEDNwALACMAMwAAATMRIxEjESMRMxEzBSc+AT0BIzUzNTMVMxUjFRQWFwcmJw4BNxU+ATcXDgMjJzI2NzUC405OaU5Oaf2CJlhbo6RSnZ1dVSSFMRdcmTNkLQY4fnx1LwwtZDkDN/yAAcr+ZQM9/qOWPxdoRR1Cb29CHUBeFEAjYTZMC48CBwU/CQsGAkcBApIAAwA6/7UDEAM3AAMAHgAuAAABMxEjASc+AzcjNTM1MxUzFSMeAxcHLgEnDgE3FT4BNxcOAyMnMjY3NQK+UlL9vSYyUjshAczMUs/PASI8UzEmUXUfHXe8P4A8B0uclow8Czl+RQM3/H4BikAPM0NQLEJubkIrTUAxDz8YYkNIZQSjBAoKPQ4QBwJFAQKnAAAABAA5/8oDMAM2AAMAHAAsADIAAAERIxEBJz4BNyM1MzUzFTMVIx4DFwcuAScOAQUXDgMjJzI2NzUzFT4BASEVITUzAxNS/bshXnMEw8NSw8MBIThNLiBOcR4ccwGvBUmXk4s8DDl8QlI/ff7eAhT9mlIDNv1OArL+WkAXaUVAXFxAIDowIwpAEkw2PFJGPAwOCAJEAQJ1cQMK/rdD7gAAAAQAO//AAzQDOQAaAB4ALgA6AAATJz4DNSM1MzUzFTMVIxQeAhcHLgEnDgEBESMRAxcOAyMnMjY3NTMVPgEBIRUhNSE1ITUhFSF7HC1POyHEw1LExCI6Ti0cT3cdHHcCRlJFBkmXk4w+Cjl/Q1M/eP7WAh79kgH9/gACUP4DAdM7CB4qMx09Tk49GzEnHAc8DkMwM0kBVf4PAfH+gTkLDAYCPwECWlcDCP5PPtBNPcUABQA7/8IDEwM3ABoAHgAuADIANgAAEyc+AzcjNTM1MxUzFSMeAxcHLgEnDgEBMxEjJxcOAyMnMjY3NTMVPgEBESERJRUhNXwgLk05IAHCwlLDwwEhOU4uIU5yHRxzAfRSUkcGSJWTjD8KOXtCUkB7/osCSv4GAaoBqj8KJDE7IT9UVD8fNy0gCUAQSDQ5TwF7/ciFOwsOBwNCAgJsaQQJ/kYBE/7t0pGRAAAAAAUAO//CAxMDOAAaAB4ALgA2ADoAABMnPgM3IzUzNTMVMxUjHgMXBy4BJw4BATMRIycXDgMjJzI2NzUzFT4BFzUzESERMxUFNSEVeyAtTTkhAsLCUsPDAyI5TC0fTnQdHHQB9VJSRwZJl5OLPQo5e0JSP3yFUP21UQGq/lYBuj8JIi45H0BOTkAdNCofCT8QRzM5TQFq/et4OwwOCAJCAQJlYQMK7Vj+xwE5WJ9gYAAABAA6/7oDPQM2AAMAHgAuAEcAAAERIxEBJz4DNyM1MzUzFTMVIx4DFwcuAScOAQUXDgMjJzI2NzUzFT4BBxUUHgIXBy4DJw4DByc+Az0BAxRS/bkgL005IAHDw1LDwwEhOU4uIk5xHhxzAa4GS5mTiTsLNn5DUj98LDBSbTwdM19RQBQUQFFeMx89bFIwAzb9eAKI/m9ACSQxOyE/VFQ/HzctIAk/EEkzOVA8Og4PCAFCAQJsaQQKhRkqSDknCD8IHis5IyM5Kx4IPwgnOUgqGQAAAAAFADv/twMYAzYAAwAeAC4AOgBGAAABESMRASc+AzcjNTM1MxUzFSMeAxcHLgEnDgEFFw4DIycyNjc1MxU+AQcyFhUUBiMiJjU0NhcyNjU0JiMiBhUUFgMUUv25IC9NOSABw8NSw8MBITlOLiFOch4ccwGvBUiWlIw9Cjd9QlJAfFGLn5+Li56ei2dxcWdncHADNv21Akv+b0AKJDA7IT9UVD8fNy0gCT8QSDM5Tzg6DA8JA0ICA2xoAgyWTUhITU1ISE3rLCoqLS0qKiwAAAAAAgA0ACYDYwMlAB4AKgAAEyc+AzchNSE1MxUhFSEeAxcHLgMnDgMFMxUhNTM1MxUzNTOAH0FzVzQC/t4BIlMBIP7gATRXdEAfNmVWRBUVRFdmAc3g/NHgUstSASJCCi9DVzJCenpCMVdELwpCCSM0RCkpRDQjwkNDqqqqAAQANf/CA2ADPQAeACoALgAyAAATJz4DNyE1ITUzFSEVIR4DFwcuAycOAwUzFSE1MzUzFTM1MwERIRElFSE1fRk/cFQ0A/7rARlSARn+6gM0VXA/GThnV0QUFURXZgHM3/zV31LIU/4YAmT97AHEAbVABR0tPCRBWFhBJDwtHQVABRgnNCAgNCYZVkNDX19f/f8BEv7u0I6OAAAAAAIANv+1A2EDNgAeACYAABMnPgM1ITUhNTMVIRUhFB4CFwcuAycOAwUVIREjESE1hh49cVc0/uMBHlIBHv7iNFdxPB00YlVEFRVEVWMCp/6TUv6UAV1CCCs+TCpCbm5CKU0+KwhCCCEwPiQkPjAhTEP+3wEhQwAAAAIANf+5A2ADPAAeACwAABMnPgM3ITUhNTMVIRUhHgMXBy4DJw4DBSEVIREjNSE1ITUhNSF/GUBvVDID/usBGVIBGf7qAzJUcEAaN2ZXQxQURFdmAqr+lAEIUv3lARP+kwMrAaY+BiAwPyVBXV1BJT8wIAY+BhonNiIiNigZemf+7tFBZ0IAAAADADP/ygNhAzgAHgAmACwAABMnPgM3ITUhNTMVIRUhHgMXBy4DJw4DByEVIRUjNSEXFSEVITWAGj9vVDMD/uoBGlIBGf7qAzNUbj8bLGBZTBgUQ1ZmhAMu/plS/ou6Ahr9lAGUPwYhM0InQWFhQSdCMyEGPwUXJzsoIzgqGzxDsLBatEP3AAAAAgA2/8ADXwM9AB4AMgAAEyc+AzchNSE1MxUhFSEeAxcHLgMnDgMFIRUhFSEVIRUhNSE1ITUhNSE1IXgYPm9VNgX+6wEaUgEZ/uwFNVVuPxk4aFhEFRVEWWgCrv6VAQT98QIq/YYCDv3vAQv+lQMpAdE+BBknNiE+VVU+ITYnGQQ+BBYjMR8fMSMWa1PEVT7OTD1TPwAAAAADADX/wgNgAz0AHgAqAC4AABMnPgM3ITUhNTMVIRUhHgMXBy4DJw4DBSEVIREhESE1ITUhAzUhFX0ZP3BVMwP+6wEZUgEZ/uoDM1VwPxk3Z1dEFBVEV2YCq/6UAQn9nAEJ/pMDK7P+PAGwPwYdLj0lQVpaQSU9Lh0GPwYZJjQhITQmGX1i/usBFWJD/oiSkgAEADT/wgNgAzwAHgAmAC4AMgAAEyc+AzchNSE1MxUhFSEeAxcHLgMnDgMHIRUhFSM1IQU1MxEhETMVBTUhFXoYQHBVNAP+6gEaUgEZ/uoDM1VxQBk5Z1dDFRVEWGh+Ayz+k1H+kgJyUf2kUQG6/kYBvT4FHCs7I0FWVkEjOyscBT4FFyUyICAyJRc7QnFxn2H+uwFFYaJjYwAAAAADADX/uQNjAz0AHgAmAD8AABMnPgM3ITUhNTMVIRUhHgMXBy4DJw4DByEVIRUjNSEFFRQeAhcHLgMnDgMHJz4DPQF9GT9wVTMD/usBGVIBGf7qAzNVcD8ZN2dXRBUURFdnfwMu/o9R/pQBvzBTbT0YNWJUQRQUQVNiNRk8blMxAbE/BR4uPSRBWlpBJD0uHgU/BhkmNCEhNCYZMkJkZIYTJD0uHgU/BhkmMh8fMiYZBj8FHi89IxMAAwA1/7cDYAM6AB4AMQA9AAATJz4DNyE1ITUzFSEVIR4DFwcuAycOAwUhFR4BFRQGIyImNTQ2NzUhNSEDNCYjIgYVFBYzMjZ+GT5vVDQD/uwBGVIBGf7rAzRUbz8ZN2dXRBQVQ1dmAqr+k4KInpSVn4iD/pMDK7Z2am1zc21qdgGrQAUeLz0kQVtbQSQ9Lx4FQAYaJzUhITUnGndaBUxDSUxMSUNMBVpC/tAqLS0qKi0tAAAAAwAx/7UDFgM2AAcAJAA0AAABMxEjNSM1MyUnPgM9ASM1MzUzFTMVIxUUHgIXBy4BJw4BBRcOAQcRIxEOASMnMj4CAsRSUsrK/bUjL084H8PDU8C/HzhOLyNMcB0ccQG1BkKGQlJAdzYLP5GZnAM2/H/OQL8/DCk2QSQCQWFhQQIiPTMmCj8SUDc8Vy8+Cw4E/sUBNwICRQEGDAAABAAv/7kDZwM6ABoAIgAyAFQAABMnPgM3IzUzNTMVMxUjHgMXBy4BJw4BBTMRMxEjNSMHNQ4BIycyPgI3Fw4BBxUFFRQeAhcHLgEnDgEHLgEnDgEHJz4BPQEzFRQWFz4BPQFtHi9OOiMDwMJSw8IDIzpNLRtReR0degFLtVJStedAdjYLP4+VlkcGP38/ATgZL0QrJkNfFxRTQD9TFBhfQiRVYVA+Pz9AAds9BxwnLxs+UFA+GSwkGQY8DUAwM0eWAeL9rTcuigIBQAIFCQg4CQwEjiYQHjkxJws9FEszMVIWFVExMUsUPRhmPBAQMWQeH2QwEAAAAAAEACf/tgMtAzcAAwAaACIAMQAAATMRIwEnPgE3IzUzNTMVMxUjHgEXBy4BJw4BBREzESM1IzU3FwYHESMRDgEjJzI+AgLeT0/9fCVSZAWkpE6hoQVfUSZAXBkYYQGWTk6jbQZgZ042XyoKL3Z+fgM3/H8B0D8YakVBWVlBP2MWPhRLMTdTwgJJ/MC2QZU7Egb+3QEfAgJDAgUJAAAFADD/swMnAzYAAwAYACAALwA1AAABMxEjJSc+ATcjNTM1MxUzFSMeARcHJicGFzMRMxEjNSMHNQYjJzI+AjcXDgEHFQc1IREjNQLZTk79lSVLWwudoU6emQtZRiSALzGin01Nn59qVgowd359NgUuYjSTAnFSAzb9u9s+D0o2P1NTPzFCDj0fWmeeAdj9zR4ffwZDAgYKCDsIDAOEckP+784AAAUALP/KAz0DNgADABgAIAAvADUAAAERIxEBJz4BNyM1MzUzFTMVIx4BFwcmJwYXMxEzESM1Iwc1BiMnMj4CNxcOAQcVByEVITUzAyhP/ZAjUl8EoaFOnZ0EXE4jgTEvqpVOTpWbcloKMHZ+fjcFLV0wOwIo/YdRAzb9QwK9/n4+EVRCP1NTPzpRDjwdWmWzAgP9ZVskjgZCAgYKCDoICwSTtUPdAAAAAAMAM/+1AxUDNgADACAAMAAAATMRIwEnPgM9ASM1MzUzFTMVIxUUHgIXBy4BJw4BBRcOAQcRIxEOASMnMj4CAsNSUv29IzBQOR/GxVLGxh85TjAhTnEdHXMBtAY/gkBSQn05C0CSmZwDNvx/AchBCyk2QiQCQWRkQQIiPTMnC0ATTjc8VTU9Cw0E/s0BLgICRQEFDAAEADb/ygMqAzcAAwAeAC4ANAAAAREjEQEnPgM3IzUzNTMVMxUjHgMXBy4BJw4BEzUOASMnMj4CNxcOAQcVByEVITUzAw9S/cYiLUw4IgPDwlLEwwMiOEwtIk5wHhxzdEaCPAxAkJeYSAY6djyNAiD9jlIDN/1KArb+ZEEKJDE7IT9cXD8fNy0iCT8RSjY5U/7qkwMCRQEFCgk8CQwEl4xD9AAAAAMAN//AAzADOQAaAB4AOgAAEyc+AzcjNTM1MxUzFSMeAxcHLgEnDgEBESMRASEVITUhNSE1MzUOASMnMj4CNxcOAQcVIRUhexwtTToiAsTDUsTEAiI6TSwcT3YdHXcCQlL+VQIe/ZEB/f4BekJ9OQpAkZiZSQQ/fT8BhP4DAdk7Bx4oMhw9TU09Gi8lHAc9DkQwM0kBUP4OAfL8xz7RTz1YAgFCAQQJCDoICwRcxwAABAA3/8IDDwM3ABoAHgAyADYAABMnPgM3IzUzNTMVMxUjHgMXBy4BJw4BATMRIyUVIREhETM1DgEjJzI+AjcXDgETNSEVgSEtTDgiA8PDUsTDAyI5Sy0hTnEdHXMB61JS/s4BhP20dkJ9OQpAkZiZSQU/fvX+VAGzQAojLjkfP1JSPx00KiAJPxBIMzlPAXH900Z2/ugBGHIDAUQBBQoJPAkM/rCVlQAABQA3/8IDDwM4ABoAHgAuADYAOgAAEyc+AzcjNTM1MxUzFSMeAxcHLgEnDgEBMxEjBTUOASMnMj4CNxcOAQcVBTUzESERMxUFNSEVgCAsSzkjA8PDUsTEBCM5TCwgTnQdHXMB7FJS/odFgjwKQJCYmUkGPHk8AShR/bNSAar+VgHCPwkhLDUeQE5OQBsxKB4IPxBEMzZPAWP98EB3AwFDAQQKCToJDAR7RVz+xQE7XJ1dXQAABAA2/7kDUwM4AAMAHgAuAEUAAAERIxEBJz4DNyM1MzUzFTMVIx4DFwcuAScOARM1DgEjJzI+AjcXDgEHFTcVFB4CFwcuAScOAwcnPgM9AQMPUv3DIC1MOCIDw8NSxMQDIjlMLSFOch0dc1k/dDYLP5GYmkkGQohCsS9RazweZqIqFEBQXTIfPGtRMAM4/WICnv57QAojLjkfP1JSPxw1KyAIPxBIMzlQ/uWeAgFDAQYKCTsLDQOiPRYqSTkmCD4QWEUiOSweCD4IJjlJKhYAAAQAN/+3AxUDNwADAB4AOgBGAAABESMRASc+AzcjNTM1MxUzFSMeAxcHLgEnDgEXFTYzMhYVFAYjIiY1NDc1DgEjJzI+AjcXDgETMjY1NCYjIgYVFBYDD1L9xCEsTDkiA8PDUsTDBS0+Rx8hTnEdHXW7LDOQm5uQkJt6Q3w5Cj+QmJtJBT9+IGdycmdncXEDN/2qAlb+ekAJIy44Hz9SUj8kNygZBj8QSDM5UHxvBkxISEtLSFgmewMBQwEECwo7Cg3+qysqKiwsKiorAAIANv+2A2ADNwAeACoAABMnPgM3ITUhNTMVIRUhHgMXBy4DJw4DBRUjESMRIxEjESM1hR08b1c1Av7iAR9SAR7+4gI1V287HTRiVUQVFURWYwKn0lLiUtIBZEIIKjxLKUJtbUIpSzwqCEIIITE+JCU+MCFORP7cAST+3AEkRAAAAwA2/8oDYAM4AB4AKgAwAAATJz4DNyE1ITUzFSEVIR4DFwcuAycOAwchFSMVIzUjFSM1IRcVIRUhNYEaPm1UNAT+6wEZUgEZ/uoEM1RuPxssYFpMGBRCVmWDAyrOUp5S/ua0AiD9jgGVQAYhMkEnQWFhQSdBMiEGQAUXKDsoIjkqHDhCra2trV62Q/kAAAAAAwA2/8ADXgM9AB4AMgA2AAATJz4DNyE1ITUzFSEVIR4DFwcuAycOAwUjFTMVIRUhFSE1ITUhNTM1IzUhBTUjFXgYPm9VNgX+6wEaUgEZ/uwFNVVuPhg4aFhEFRVEWWgCrddx/fECKv2GAg7973nZAyj+2NYB0T4EGSc2IT5VVT4hNicZBD4EFiMxHx8xIxZmWMNWPs9LPVg+llhYAAAAAAQANf/CA2ADPQAeACoALgAyAAATJz4DNyE1ITUzFSEVIR4DFwcuAycOAwUjFTMRIREzNSM1IQU1IxUFNSEVfRk/cFUzA/7rARlSARn+6gMzVXA/GThnV0MUFURXZgKr2Xb9nHbaAyv+1tYBTf48AbA/Bh0uPSVBWlpBJT0uHQY/BhkmNCEhNCYZdmn+6wEVaUKraWnTkpIABAA1/7cDYAM6AB4AMQA5AEUAABMnPgM3ITUhNTMVIRUhHgMXBy4DJw4DBSMVHgEVFAYjIiY1NDY3NSM1IQU1IxU2MzIWBzI2NTQmIyIGFRQWfRk/b1Q0A/7rARpSARn+6wM0VG8/GTdnV0QUFURXZgKrxjAznZWWnjUxyAMr/un6OEMjQGJqdXVqbXR0AatABR4vPSRBW1tBJD0vHgVABhonNSEhNScadHsSPChJTExJKjwSeUKoZmUJBectKiouLioqLQAAAAACADUAKQNjAyEAHgAiAAATJz4DNSE1ITUzFSEVIRQeAhcHLgMnDgMHIRUhhiBBclcy/t8BIVMBIP7gMldzQCE1Y1RDFRVDVWOHAy780gECQws0S183Qnp6QjdfSzQLQwsnN0grK0g3J6FDAAADADX/tgNgAzoAHgAiACgAABMnPgM3ITUhNTMVIRUhHgMXBy4DJw4DByEVIRc1IREjNX8ZQG9UMgP+6wEZUgEZ/uoDMlRwQBo3ZldDFBREV2aBAyv81VoCbVIBpD4GIDA/JUFdXUElPzAgBj4GGic2IiI2KBk4QqFB/ubZAAAAAAMAM//KA2EDOAAeACIAKAAAEyc+AzchNSE1MxUhFSEeAxcHLgMnDgMHIRUhFxUhFSE1gBo/b1QzA/7qARpSARn+6gMzVG8/GzdmVkIUFENWZoUDLvzSvAIX/ZcBlD8GITNCJ0FhYUEnQjMhBj8GGyo4IyM4KhtDQk66Q/0AAAAAAwA2/8ADXwM7AB4AIgAuAAATJz4DNyE1ITUzFSEVIR4DFwcuAycOAwchFSETFSEVITUhNSE1IRV4GD9vVTUF/usBGlIBGf7sBTVUbz8ZOGhYRBUVRFloewMp/NezAir9hgIO/e8CYgHPPQQaKDYhPlRUPiE2KBoEPQQWIzEfHzEjFjM+/vJWPs9LPcMAAAAABAA1/8IDYAM9AB4AIgAmACoAABMnPgM3ITUhNTMVIRUhHgMXBy4DJw4DByEVIRMRIRElFSE1fRk/cFUzA/7rARlSARn+6gMzVXA/GTdnV0QUFURXZoADK/zVZAJk/ewBxAGxPgYdLj0lQVpaQSU9Lh0GPgUYJzQhITQnGEJC/pABFf7r1JKSAAQANP/CA2ADOwAeACIAKgAuAAATJz4DNyE1ITUzFSEVIR4DFwcuAycOAwchFSEFNTMRIREzFQU1IRV6GEBwVTQD/uoBGlIBGf7qAzNVcUAZOGdXRBUVRVdnfwMs/NQCclH9pFEBuv5GAbs+BRwsOiRBVlZBJDosHAU+BRclMyAgMyUXOUKZXP66AUZcqGhoAAMANf+5A2ADOgAeACIAOwAAEyc+AzchNSE1MxUhFSEeAxcHLgMnDgMHIRUhBRUUHgIXBy4DJw4DByc+Az0BfxlAb1QyA/7rARlSARn+6gMyVHBAGjdmV0MUFERXZoEDK/zVAb8wUm49HjRgUj8TFEBSYDQePm1SMAGlPgYfMD8mQVxcQSY/MB8GPgYaJzYiIjYoGT5CPhgrSjkmCEAIHy06JCQ6LR8IQAgmOUorGAAABAA1/7cDYAM6AB4AIgAuADoAABMnPgM3ITUhNTMVIRUhHgMXBy4DJw4DByEVIQUyFhUUBiMiJjU0NhcyNjU0JiMiBhUUFn4ZP29UNAP+6wEZUgEZ/uoDM1VwPxk3Z1dEFBVDV2aBAyv81QGVlZ6elZWenpVqdnZqbXNzAao/Bh8uPSVBW1tBJT0vHgY/BhknNSEhNScZQUJMTElJTExJSUzsLSoqLi4qKi0AAAIARv+3AxQDOAADACAAAAEzESMBFRQeAhcHLgEnDgEHJz4DPQEjNTM1MxUzFQLBU1P+viQ/VzIuTngfHnhOLjJVPiPQz1PMAzj8fwKjRTlsXUoWQCOJWl6RJj4YTmFxO0VCi4tCAAAAAwBH/7YDFQM7ABwAIAAmAAABBy4BJw4BByc+Az0BIzUzNTMVMxUjFRQeAhMzESMFNSERIzUCXiZPdiAddlEoMlM8IczMUsrLIjxUl1JS/foCWFIBb0AaY0NJbRpAEDhIVi4VQnFxQhUrUUQ1Abn9129C/tXpAAAAAwBI/8oDMAM2AAMAIAAmAAABESMRAwcuAScOAQcnPgM9ASM1MzUzFTMVIxUUHgIBIRUhETMDFVJmJ052Hx11USgyUzshzMxSyssiPFT++gIK/aRSAzb9agKW/idAGWZFS28bQBA5S1guF0Jzc0IXK1NGNv6hQwETAAAAAAMARv/CAy0DPAAcACAAKAAAAQcuAScOAQcnPgM9ASM1MzUzFTMVIxUUHgITESMRASEVIREhFSECXyZPdyAdd1EoMlQ8IczMUsrLIj1U6FL+YAIK/aQCSv4IAYRAGGJDS2oaPxA4R1QtC0JubkILKk9CMwGk/fQCDPzNQgE5QgAAAwBF/8ADMwM+ABoAHgAqAAABBy4BJw4BByc+AzcjNTM1MxUzFSMeAxMRIxEBIRUhNSE1ITUhFSECXyNReCAdelEmMFI9IwLMzFLKzAIkPVPmUv5gAhD9nwHy/gwCRf4OAbA/F11CRmUZQA4wP0wqQmZmQidIPC4Bef4mAdr8ykDcVj/RAAAAAAQARf+6AxQDOQAaAB4AMwA5AAABBy4BJw4BByc+AzcjNTM1MxUzFSMeAxMzESMFFTI+AjcXDgMrATUzNSM1IRU3NSERIxECXyNReR8eeVIlMFI9IwLMzFLKzAIkPVOTUlL+NCtIQT8iCCZFSVExNtfZASkmASBRAa1AF11CRmYYQA4xP0woQmZmQidHPC0BfP4Z8l4CBAgGPwYHBQHXVD7Ni0L+kAEuAAUARf+9AxYDOgAcACAANAA4ADwAAAEHLgEnDgEHJz4DPQEjNTM1MxUzFSMVFB4CEzMRIwUVMj4CNxcOAisBNTM1IzUhFRcRIREDFTM1AmMkUnogHndVJDNUPSHLy1LLzCI+VZRSUv4jJDw3NBwIITw/I37U1wElNQEm3JIBqz8TUDxCWRU/DCs8SSoPPm1tPg8pRTYmAYD+GPJeAQMGBT0GBwPVUkDLnwFq/pYBK+zsAAAAAAQARv/CAxUDPAAcACAAJAAoAAABBy4BJw4BByc+Az0BIzUzNTMVMxUjFRQeAhMzESMBESERJRUhNQJfJk93IB14UScyUzwizMxSyssiPVSWUlL+DgJE/gwBpAGDPxhiQklrGj8QN0hULQtCbm5CCypPQzMBpf3s/p8BM/7N8rCwAAAAAAQARf/CAxUDPQAcACAAKAAsAAABBy4BJw4BByc+Az0BIzUzNTMVMxUjFRQeAhMzESMXNTMRIREzFQU1IRUCXyRRdyAdeFEoM1Q8IczMUsrLIz1UlVJSAVH9vlEBoP5gAZlBF19CSGkaQBA2RVItBEJoaEIEKU1BMQGP/hKSaf6jAV1psnJyAAADAEf/ugNJAzcAHAAgADkAAAEHLgEnDgEHJz4DPQEjNTM1MxUzFSMVFB4CExEjEQMVFB4CFwcuAycOAwcnPgM9AQJfJk93IB12USgyUzwhzMxSyssiPVToUqcxUm48IDNfUUAUE0BRXzMgPG1SMQF+PxdhQktsG0AQOElVLgxCbm5CDCpPQjMBqf2WAmr9yBAvUUArCUAJIjJAJiZAMiIJQAksP1IuEAAEAEf/twMYAzcAHAAgACwAOAAAAQcuAScOAQcnPgM9ASM1MzUzFTMVIxUUHgITESMRAzIWFRQGIyImNTQ2EzI2NTQmIyIGFRQWAl8mT3cgHXZRKDJTPCHMzFLKyyI9VOhS2I6fn46On5+OZ3R0Z2d1dQF/QBhiQktsG0EQN0hVLgtCbm5CCypPQjMBqP3bAiX9yFZOTlVVTk5W/vkzMDA0NDAwMwAAAAADAEb/twNBAzsAHAAgADkAAAEHLgEnDgEHJz4DPQEjNTM1MxUzFSMVFB4CExEjERMhHgMXBy4DJw4BByc+AzcjNSECXyZPdyAddlEpMlQ8IczMUsrKIj1U6VNZ/v0GNFBmNx4zXlE/FCqkZx84Z1A0BfkCVAF+QBdbQkhmGkAPNERRLRRBd3dBFCpLPjABqv3jAh39cSA6LiEHPwYcKTUfP1MOQAcgLjohQwAAAwBF/7QDFgM9ABwAIAAqAAABBy4BJw4BByc+Az0BIzUzNTMVMxUjFRQeAhMzESMFNSERIzUFJyU1Al8kUXcgHXhRKDNUPCHMzFLKyyM9VJZSUv3vAmNS/ecLAiQBmEAXX0JIahpBEDZFUi0EQmhoQgQpTUEyAZD97HlD/shtGkEUTQAAAgA9/7YDdwM3AAcAGAAAARUjESMRMxEBIRQOAgcnPgE3BSclNjchA3eQUlL9hwGVJl2eeC19mSr+0g4BVRcE/r0By0T+LwOB/pQBD2G5qJM8Pz6XWx1IF0tSAAADAED/tQNyAzgABwAXAB0AAAEVIxUjETMVJSEUBgcnPgE3BSclPgE3IRM1IREjNQNyhVJS/YABj8fOIWqRK/7iDgFNCg0C/sc/AkFSAk5E7AIa6rCw9ENBIWE/FUMQGDIb/fRC/sP7AAMAP//KA3IDNgAHABkAHwAAATMVIxEjETMFIRQOAgcnPgE3BSclPgE3IRMVIRUhEQLthYVSUv1/AZAvY5lqIm2RKv7hDwFOCg0C/sakAgT9qgIhRf6+ApxDV5iAZSRCJGY/FkMQGjYd/ivOQwERAAADADr/wQNuAzcABwAWAB4AAAEzFSMVIxEzBSEUBgcnNjcFJyU+ATchExUhFSERIRUC6IaGU1P9fQGSyNAe0lP+4AwBTQsLA/7FmwH3/bcCQgJRROQCDjqy+UVFRn4YRw4ZMxv9/7REATxEAAADAD//wgNyAzcABwAWACIAAAEzFSMVIxEzBSEUBgcnPgE3BSclNjchExUhFSE1ITUhNSEVAu2FhVJS/X8BkMnQH22SK/7fDgFSEQT+xpsCB/2oAeb+FwI6AmpEwwHUJ6riOUEdWDoWQw8pLv2WYkDfWEDVAAQAP//CA3IDNwAHABcAGwAfAAABFSMVIxEzFSUhFAYHJz4BNwUnJT4BNyETESERARUhNQNyhVJS/X8BkMfOIWqRK/7hDgFPCg0C/sVMAjX+HAGTAlZE4wII4auv8EJAIWE8FUMQFzIa/QMBQv6+AQC+vgAABAA//8IDcgM3AAcAFwAfACMAAAEVIxUjETMVJSEUBgcnPgE3BSclPgE3IQE1MxEhETMVBTUhFQNyhVJS/X8BkcfRIHCRKv7dDgFSCAwC/sUCMFH9ylEBlP5sAmBE1AHv16qr7z9CIF48FkMQFS8a/etr/qQBXGuubW0AAAMAQP+6A3IDNwAHABYALwAAATMVIxEjETMFIRQCByc+ATcFJyU2NyEBFRQeAhcHLgMnDgMHJz4DPQEC7YWFUlL9gAGPwNQicI4q/uAOAU4UBP7HAZswUms8ITFdUD8UFEBQXTIiPG1SMQI6RP7pAlhErv7+SEElZkAWQxAyOv5rHTBVQy8LQAkkM0EnJ0IzJApBCi9EVTEdAAAAAAQAQP+3A3IDNwAHABcAKwA3AAABMxUjFSMRMwUhFAYHJz4BNwUnJT4BNyEBMh4CFRQOAiMiLgI1ND4CEzI2NTQmIyIGFRQWAu2FhVJS/YABj8bOI22TKv7fDgFPCQ0C/sYBZ0NsTCkpTGxDQ2xMKSlMbENhcnJhYXJyAklE8AIiQLD1RUIiZD8WQhAYMRv+VBcrPigoPysXFys/KCg+Kxf+8DcxMTc3MTE3AAACADz/tgMuAzcACwAdAAABMxEjESMRIxEzETMlIRQOAgcnPgE3ByclPgE3IQLgTk55TU15/YgBWB5NhGYvan0h/QsBHggMAv74Azf8fwHS/loDP/6r/1ipm4k4OzmLURpHEyBGJQAAAAMAPf+2AyoDNgALAB0AIwAAATMRIzUjFSMRMxUzJSEUDgIHJz4BNwcnJT4BNyETNSERIzUC209Pdk5Odv2MAV0nVIVeJ2F/I/gNASEICgL+9WoCWVIDNv3d9O4CDNqsUpJ+Zyc7KGlAGUQTGDEa/fFC/s/vAAAAAAMAPf/KA0UDNgALABwAIgAAAREjETMRMxEzESMRASEUDgIHJz4BNwcnJTY3IRMhFSERMwJlTk52T0/9jAFcJ1SEXidhfiT4DQEgEAX+9ckCFf2ZUgHe/tQCdP77ARX9XgFKAQxRk39pKD0qaEAaQxQwNf1mQwEbAAMAPf/CA0wDNgALABoAJgAAARUjETMVMzUzESM1JSEUBgcnPgE3ByclNjchEyEVITUhNSE1IRUhAmVOTnZPT/2MAV2ptSVeeyX1DQEgEAX+9cYCH/2QAf3+AQJQ/gMCJsABwL3N/inH3p/nRTwhXDkZQhMrMP1AQN5VQNIAAAAABAA9/8IDKgM3AAsAGwAfACMAAAEzESM1IxUjETMVMyUhFAYHJz4BNwcnJT4BNyETESERJRUhNQLbT092Tk52/YwBXaW4KGF+JPgNASEICgL+9XYCTf4DAawDN/3w6eMB+dOopPdMPSZlPxpEEhcwGv0KATr+xvi2tgAAAAQAPf/CAyoDNwALABkAIQAlAAABMxEjNSMVIxEzFTMlIRQGByc2NwcnJTY3IQE1MxEhETMVBTUhFQLbT092Tk52/YwBXai1J7ZI9A0BIBEE/vUCclH9tFEBqv5WAzf+DtPNAdvLpKHtRjxHcxlDEy8v/fpo/qQBXGiycXEAAAAAAwA9/7kDWgM2AAsAHAA1AAABFSMRMxUzNTMRIxElIRQOAgcnPgE3ByclNjchARUUHgIXBy4DJw4DByc+Az0BAmVOTnZPT/2MAV0nVYVdJ2F9JPcNASARBP71AcIzVW47ITJfUkEVFEFSXzIgO25UMgIE0gH03+/9pgEo61KSfmcnOyhoPxpEEzI0/lwbLVBALQlBCSIyPyYmPzIiCUEJLUBQLRsAAAAAAwA9/7kDcAM3AAsAGwBBAAABFSMRMxUzNTMRIzUlIRQGByc+ATcHJyU+ATchARUUHgIXBy4BJw4BBy4BJw4BByc+Az0BMxUUFhc+Az0BAmVOTnZPT/2MAV2luChhfiT4DQEhCAoC/vUCVRgvQyooQ1sXFVI/QFIUGFs/KStDLxhPPj8gLyAPAgvXAfLY6f3z4fCk90w9JmQ/GkQTFzAa/k8oI0Q7MA89GFg5N18bGls5NlgYPQ8yPEMhKCg8dSUUNDk6GygAAAAEADz/twMyAzYACwAbAC8AOwAAARUjETMVMzUzESM1JSEUBgcnPgE3ByclPgE3IQEyHgIVFA4CIyIuAjU0PgITMjY1NCYjIgYVFBYCZU5Odk9P/YsBXqa4KGF/JPgOASIICgL+9AGdRnBPKipPcEZGcVAqKlBxRmd2dmdneHgCBtkB+d3t/dr266P4TD0mZT8aRBIXMBr+UBYpPScnPSoWFio9Jyc9KRb++DUwMDQ0MDA1AAADAD3/tAMrAzYACwAaACQAAAEzESM1IxUjETMVMyUhFAYHJzY3ByclPgE3IRM1IREjNQUnJTUC3E9PdU1Ndf2LAWGosymzSvcNASEIDAL+81cCbVL93QwCLwM2/ezq5wIA1rGm70w7THwdRhEYMRn9/kP+tXgbQxVTAAAAAgA9/7cDdgM3AAsAHAAAASMVMxUjESMRMxUzJSEUDgIHJz4BNwUnJTY3IQN2j4+PUlKP/PgBlSZdnngtfZkq/tIOAVUXBP69AhLORP63A4DhhGG5p5M8Pz6WWxxIF0tRAAAAAAMAQP+2A3ADOAALABsAIQAAASMVMxUjFSMRMxUzJSEUBgcnPgE3BSclPgE3IRM1IREjNQNwg4ODUlKD/P0Bj8fOIWqRK/7iDgFNCg0C/sc/AkFSAm1/RIwCGodNsPRDQSFhPxVEDxgyG/3yQv7G+AADADr/zANtAzcACwAcACIAAAEjFTMVIxUjETMVMyUhFA4CByc+ATcFJyU2NyETFSEVIREDbYWFhVJShfz4AZAuYptsH3CPKP7gDAFMEwX+x5wCC/2jAlOaRM4CkKBkWJiAZSRDJGU/GEcONDr+LdZDARkAAAQAQP+3A3ADNwALABsALwA7AAABIxUzFSMVIxEzFTMlIRQGByc+ATcFJyU+ATchATIeAhUUDgIjIi4CNTQ+AhMyNjU0JiMiBhUUFgNwg4ODUlKD/P0Bj8bOI22TKv7fDgFPCQ0C/sYBZ0NsTCkpTGxDQ2xMKSlMbENhcnJhYXJyAmp/Q5ICIYlJsPVFQiNjPxZDDxgxG/5VFys/KCg/KxcXKz8oKD8rF/7uNjMxNzcxMzYAAAMAOv+1A20DNgALABsAJQAAASMVMxUjFSMRMxUzJSEUBgcnPgE3BSclPgE3IRM1IREjNQUnJTUDbYWFhVNThfz4AZTF1x9wkCr+3gwBUAgMAv7FMAJTVP34CwITAmyCRXwCDYVWrvpDQyJhPRhJDhcyG/37Q/61dhlCFVQAAAAAAgA1/7YDFwM2AAcAGQAAATMRIxEjNTMBIRQOAgcnPgE3BSclPgE3IQLFUlLPz/2hAZMmXZx3LnyXKv7VDwFTDQ0D/r4DNvyAAdZDAQtiuaeTPEE8l1scRxYmTioAAAAAAwBI/7UDGAM2AAcAFwAdAAABMxEjNSM1MyUhFAYHJz4BNwUnJT4BNyETNSERIzUCxVNTxcX9sAGOw9IhcI8q/uAOAU4JDAL+yE0CVlMDNv3j5EPArPhDQiJhPxZDDxgyG/3wQ/7E+QADAEf/ygMyAzYABwAZAB8AAAEzETMRIxEjASEUDgIHJz4BNwUnJT4BNyETIRUhETMCAcRTU8T+dAGOLmGabCJzkSr+3A8BUQgMAv7HwQH8/bJSAhkBHf1nATkBGVeYf2UkQiRnQhZDDxg0Hf1hQwEVAAAAAAMASP/CAyoDNgAHABcAHwAAATM1MxEjNSMBIRQGByc+ATcFJyU+ATchEyEVIREhFSECAMVTU8X+dQGOxdEfbZEq/uAOAU8IDAL+yLICA/2rAkX+DQI/9/33zgEIrPNAQiBfPRZDEBcxGv1DQgE9QwADAEz/wgM2AzcABwAXACMAAAE1IzUzNTMRASEUBgcnPgE3BSclPgE3IRMhFSE1ITUhNSEVIQLFwcFT/V8Bi8bQHnCRKv7fDAFNCAoC/sqyAg39ogHv/g8CQv4RAWe2Qtj+MAGkqeE3PxxZOhZBDxYsFv05QeFaQdgAAAAABABI/8IDGAM2AAcAFwAbAB8AAAEzESM1IzUzJSEUBgcnPgE3BSclPgE3IRMRIRElFSE1AsVTU8TE/bABjsXRH22RKv7gDgFPCAwC/shfAkT+DQGiAzb9+9VEuav0QEEhXj8WQw8XMRr9AQE//sH+vLwAAAAEAEj/wgMYAzcABwAXAB8AIwAAATMRIzUjNTMlIRQGByc+ATcFJyU+ATchATUzESERMxUFNSEVAsVTU8PD/bABjsbQH22RKv7gDgFPCAwC/sgCUlH9v1EBn/5hAzf+E8FDuavwPkEgXjwWQw8WMBr97mv+pAFca65tbQAAAwBI/7oDSAM2AAcAFwAwAAAlESM1MxEzEQEhFAYHJz4BNwUnJT4BNyEBFRQeAhcHLgMnDgMHJz4DPQECxb+/U/1dAY7B1CFwkCr+3w4BTgkMAv7IAaowUmw7ITFdUD8UFD9RXTIiPG1SMc4BHEMBCf2YAiiu/UdCI2ZAFkMQGTIc/mkeMVRELwtACiQzQScoQjIkCkAKL0RWMR4AAwBI/7IDawM2AAcAFwA/AAABMzUzESM1IwUnPgE3BSclPgE3ITUhFAYFFRQeAhcHLgEnDgEHLgEnDgEHJz4DPQEzFRQeAhc+Az0BAgPCU1PC/mofbZEq/uAOAU8IDAL+yAGOxQF4GC9DKylCXBcUUz9AURQYWz8pKkQuGU8PHy4fIDAgEAJJ7f3n6OFCIF4/FkMPFzEaQqv0Yy4iRDovDj0XVzk2XhoZWzk2WBg9DzE7QiAuLh08NzESFDM5ORouAAAAAAQAR/+3AxwDNwAHABcAKwA3AAABMzUzESM1IwEhFAYHJz4BNwUnJT4BNyEBMh4CFRQOAiMiLgI1ND4CEzI2NTQmIyIGFRQWAgPCU1PC/nIBjsPSInCSKv7eDwFQCAwC/sgBfkRuTSoqTW5ERG5NKipNbkRkdHRkZHR0Ajr9/drlAQSt/ERBJGVAFkMPFzIb/lAXKz4oJz8rFxcrPycoPisX/vE3MDE3NzEwNwACADr/twMvAzgAAwAdAAABMxEjAxEzESMRIw4BByc+ATcHJyU+ATchNSEUBgcC4U5Ouk1NpiaFbS9nfyH8CwEdCgsC/vgBVxATAzj8fwIeAUv8xAGuVJI8OzmJTxlGEyNHJUI/fTwAAAMAPf+2Ay0DNgADABwAIgAAATMRIycjDgEHJz4BNwcnJT4BNyE1IRQHMzUzESMFNSERIzUC305OsaYqi20nYX8j+A0BIQgKAv71AV0eiE1N/qYCWVIDNv3f5Et6LTsoaEIaRBMYMRpDZVfs/fV3Qv7P7wAAAwA8/8oDSwM2AAMAGwAhAAABESMRAyMOAQcnPgE3ByclNjchNSEUBzMRMxEjByEVIREzAy1OsawqiWooZH0k+Q0BIREE/vQBXSGMTU34AhX9mVIDNv1lApv+q0l3LTwqakAZRBIwN0NrXAEA/Y2kQwEbAAADAD3/wgNQAzYAAwAbACcAAAERIxEDIwYHJz4BNwcnJT4BNyE1IRQHMzUzESMDIRUhNSE1ITUhFSEDLU6xp1LPJV58JPUNASEICgL+9QFdHIZNTf0CH/2PAf3+AQJQ/gQDNv4pAdf+4Y1OOyJaORpDEhYtGEJgSs7+Pv6dQd9VQdQAAAAEAD3/wwMtAzcAAwAcACAAJAAAATMRIycjDgEHJz4BNwcnJT4BNyE1IRQHMzUzESMBESERJRUhNQLfTk6xpCqMbShhfiP3DQEhCAoC/vUBXR2HTU3+swJM/gUBqwM3/fbXS3ctPSVlPxpDExcwGkNbWuD+EP6NAT3+w/y6ugAAAAQAPP/DAy0DNwADABwAJAAoAAABMxEjJyMOAQcnPgE3ByclPgE3ITUhFAczNTMRIxc1MxEhETMVBTUhFQLfTk6xpCqQaidhfCX4DQEiCAoC/vQBXhyGTU2uUf20UQGq/lYDN/4KzUt0Kj0kYTwZQxMXLhhCZEvY/h+UZ/6pAVdnr25uAAMAPf+5A1wDNgADABwANQAAAREjEQMjDgEHJz4BNwcnJT4BNyE1IRQHMzUzESMHFRQeAhcHLgMnDgMHJz4DPQEDLU6xoyqObShkfiP5DQEhCAoC/vUBXByHTU0FM1ZuPCEzX1JCFRVBUl8zIDtuVTMDNv2gAmD+uE5/MDwqbEIaQxMZMxtDZ1T3/f8cHC1QQS0JQQkiMkAmJkAxIwlBCS1BUC0cAAAAAAQAPP+3AzYDNgADABwAMAA8AAABESMRAyMOAQcnPgE3ByclNjchNSEUBgczNTMRIwcyHgIVFA4CIyIuAjU0PgITMjY1NCYjIgYVFBYDLU6xqSqLaihhfyP3DgEhEAX+9QFdDxGKTU0nRnBPKipPcEZGcVAqKlBxRmd2dmdneHgDNv3RAi/+ukt2LTwoaEAaRBIxNkM0YC3w/gUpFio9Jyc9KhYWKj0nJz0qFv73NTAwNTUwMDUAAAADAD//tAMrAzcAAwAcACYAAAEzESMnIw4BByc+ATcHJyU+ATchNSEUBzM1MxEjBTUhESM1BSclNQLcT0+rqCqLaidefiP3DAEgCAoC/vUBXx+JTk7+jAJtU/3fDAItAzf98tVJcy07JmU/GkQTGDEZQ2pR4/4GbkP+tXcZQhVTAAEANf+3AxcDOAAfAAABMxEjESM1MzUjDgMHJz4BNwUnJT4BNyE1IRQGBzMCxVJS9PToETxcflMufJcq/tUPAVMNDQP+vgGTBgfZAzj8fwFSQ65AeG1iKkA9l1scSBYmTSpDKk0nAAAAAgBI/8oDLwM2ABwAIgAAASMOAQcnPgE3BSclPgE3ITUhFAczNTMRIzUjNTMBIRUhETMCxdwkt58ic5Aq/t0PAVAJCwL+xwGOCsxTU+jo/m4B/P2yUgJBcKM2QSVnQhZDEBg1G0M/LLL9Z9VD/lhDARQAAAACAEz/wgM2AzcAHQApAAABIw4BByc+ATcFJyU+ATchNSEUBgczNTMRIzUjNTMBIRUhNSE1ITUhFSECxdkkuqIecJEq/t8MAU0ICgL+ygGLAwTKUlLl5f5kAg39ogHv/g8CQf4SAnZtlSo/HVg6FkEQFSsXQRcpFYH+MGFB/fpB4llB1wADAEj/wgMYAzYAHAAgACQAAAEzESM1IzUzNSMOAQcnPgE3BSclPgE3ITUhFAczAREhESUVITUCxVNT5+fcJrieH22RKv7gDgFPCAwC/sgBjgnL/g8CRP4NAaIDNv3xf0N1bZ0wQiBePxdEDxcxGkIzMP0iAT/+wf68vAAAAwBI/8IDGAM3AB0AJQApAAABMxEjNSM1MzUjDgEHJz4BNwUnJT4BNyE1IRQGBzMTNTMRIREzFQU1IRUCxVNT5eXaJbmgH22RKv7gDgFPCAwC/sgBjgQEygJR/bxRAaL+XgM3/hBvQ29wnC5BIF08FkMQFjAaQhgtF/4Haf6nAVlprWxsAAAAAAIASP+6A0gDNgAbADQAAAEjDgEHJz4BNwUnJTY3ITUhFAczNTMRIzUjNTMHFRQeAhcHLgMnDgMHJz4DPQECxdwlt58hcI8q/uAOAU0UBP7IAY4Jy1NT5+emMFJsOyExXVA/FBQ/UV0yIjxtUjECTHCjNEEkZD8WRA8yN0M1Mqf9mLxDsR4xVEQvC0AKJDNBJyhCMiQKQAovRFYxHgAAAAACAEj/sgNrAzYAHABEAAATJz4BNwUnJT4BNyE1IRQHMzUzESM1IzUzNSMOAQUVFB4CFwcuAScOAQcuAScOAQcnPgM9ATMVFB4CFz4DPQFtIHCPKv7gDgFOCQwC/sgBjgnLU1Pm5twltwGpGC9DKylCXBcUUz9AURQYWz8pKkQuGU8PHy4fIDAgEAEfQCJhPxZDDxgxG0IzMJb954lDdW2hTy4iRDovDj0XVzk2XhoZWzk2WBg9DzE7QiAuLh08NzESFDQ4OhkuAAMAR/+3AxwDNwAcADAAPAAAASMOAQcnPgE3BSclPgE3ITUhFAczNTMRIzUjNTMHMh4CFRQOAiMiLgI1ND4CEzI2NTQmIyIGFRQWAsXbJbegInCSKv7eDwFQCAwC/sgBjgnLU1Pl5dJEbk0qKk1uRERuTSoqTW5EZHR0ZGR0dAJTcKY2QCVmQhZEDxczHEM0MKH92olD1hcrPignPysXFys/Jyg+Kxf+8TcwMTc3MTA3AAAAAAIAOv+3Ay8DOAADACEAAAEzESMDNTMRIxEjNTM1Iw4BByc+ATcHJyU+ATchNSEUBgcC4U5Ouk1NmZmAHJWNL2d/IfwLAR0KCwL++AFXBQUDOPx/Aozd/MQBOEOhc81QOzmJTxlGEyNGJkIjRCMAAAACADUAMANgAuAAFAAcAAATJT4BPQEhNSEXFRQOAgcnPgE3BQEhFSE1ITUzfgIuAQH96AI6LwEIDw5RDQ4F/eIBOQGd/NUBPFIB8RcRIhFRQwFUKVlldUUKPGgwHf7IQ0PpAAAAAwA3/7kDXwMZABAAGAAeAAATJTY9ASE1IRUUBgcnPgE3DQEhFSE1ITUzATUhESM1gAIqAf3rAmYGE1EICQP95QFGAY782AFIUv67AnBSAmsRCwtEQ0o8h1gGJkEeGaZDQ3v+o0L+2eUAAAAAAwA2/8QDXwMMABAAGAAeAAATJTY9ASE1IRUUBgcnPgE3DQEhFSE1ITUzAxUhFSERfwIrAf3qAmcGE1EICgL95QFGAY781wFJUuMCIf2NAlYSCwxKQ00+jlwGKEUgGbZCQoL+78VDAQgAAAAAAwAu/8ADWgMRABAAGAAgAAATJTY9ASE1IRUUBgcnPgE3DQEhFSE1ITUzAxUhFSERIRV6AisB/e4CZgYUVAkJA/3lAUIBkvzUAUhS6AIl/YkCbgJoEwsLPERDOo5eCihFHxqpQkKC/puWQgEaQgAAAAMANv/EA18DHAAPABcAIwAAEyU2PQEhNSEVFAYHJzY3DQEhFSE1ITUzAxUhFSE1ITUhNSEVfwIsAf3pAmcFD1ELBP3kAUcBjvzXAUlS6AIq/YYCDv3vAmICgBELCjZAODB6VQY8MBmNQUFr/jtUP89TPs0ABAA2/8IDXwMYAA8AFwAbAB8AABMlNj0BITUhFRQGByc2Nw0BIRUhNSE1MwERIRElFSE1fwIrAf3qAmgGEVINBf3lAUYBjvzXAUlS/sgCYP3wAcACbhELC0FCRTeHWAZGORmjQkJ4/cQBJ/7Z5aOjAAQANv/CA18DGwAQABgAIAAkAAATJTY9ASE1IRUUBgcnPgE3DQEhFSE1ITUzEzUzESERMxUFNSEVfwIrAf3qAmcGEVEHCQL95QFGAY781wFJUtVR/aRRAbr+RgJ0EgsKP0FEOYRYBSVAHRmfQkJ4/qli/q4BUmKubm4AAAADADf/uQNfAxUAEAAYADEAABMlNj0BITUhFRQGByc+ATcNASEVITUhNTMXFRQeAhcHLgMnDgMHJz4DPQGAAioB/esCZwYRUggIAv3lAUYBjvzYAUhSIzBSbj0fM2BRQBQUQFFgMx8+bVIwAmgSCwxCQkU5hlsFJEEdGalCQnn6HC1MOykJPwggLjwkJDwuIAg/CSk7TC0cAAQAN/+3A18DFAAQABgAJAAwAAATJTY9ASE1IRUUBgcnPgE3DQEhFSE1ITUzAzIWFRQGIyImNTQ2FzI2NTQmIyIGFRQWgAIqAf3rAmcGEVIICAL95QFGAY782AFIUgeRoqKRkaKikWp2dmpqdnYCaRELC0JCRTmIWAUkQR0ZqUJCff75UUxMUVFMTFH6MC0tMDAtLTAAAAAAAwAs/7cDdAM3AAcAGQAqAAABFSMRIxEzES0BPgE9ASE1IRUUBgcnPgE3BRcVPgE3Fw4DIyczMjY3NQN0j1JS/WgBgwEB/pIBvgcTUAkJA/6N4UmTRQVHk5CHOwlbGDEaAb1F/j8DgP6GThMQHQ4/Q0xEr3cIM1goG0i/AwsKPQwOCAJFAQHBAAQAL/+4A28DNwAHABkAKgAwAAABFSMVIxEzFS0BPgE9ASE1IRUUBgcnPgE3DQEXDgMjJzMyNjc1MxU+AQU1IREjNQNvgFJS/WcBeQEB/psBtQYRUQcIA/6XAf8FRZOQijwJXhkyGlFJkP6FAk5SAjxF9AI0+x4SCxYKJkI3MYhhBiM9HRmOOwsNBwJCAQF9egIK8EL+5dkABAAv/8oDcAM3AAcAGQAqADAAAAEzFSMRIxEzBSU+AT0BITUhFRQGByc+ATcNARcOAyMnMzI2NzUzFT4BBRUhFSERAu+BgVJS/WcBeQEB/poBtgYSUQgIAv6YAf8GRpOQijwJXhkyGlFJkP7uAgL9rAIQRP6/AqztEg0ZCytCOTSOZAcjPhwZkTsLDQgCQwEBgH0CCqK9QwEAAAAABAAw/8ADbwM3AAcAGQAqADYAAAEzFSMVIxEzBSU+AT0BITUhFRQGByc+ATcNARcOAyMnMzI2NzUzFT4BARUhFSE1ITUhNSEVAu+AgFJS/WcBeQEB/poBtgYRUAYIAv6XAgEFRZOQijwJXhgxGlJJkf7aAhn9lgH4/gYCSwJpRNoB7MoRCxMKIz8xK39VBxw0GBlxOAsNBgJAAQFnZQIK/qVcPtRTPcoABQAv/8IDbwM3AAcAGQAqAC4AMgAAARUjFSMRMxUtAT4BPQEhNSEVFAYHJz4BNw0BFw4DIyczMjY3NTMVPgEBESERJRUhNQNvgFJS/WgBeAEB/psBtQYRUQcIA/6XAf8GRpOQiTwKXhkyGlFJkP6VAj7+EgGeAkNE8gIq9BoSDBYLJ0I3MYleBiE7HBmIOwsNBwJCAQF3dAIK/jgBIf7f4J6eAAAEADL/tgNxAzYABwAZACoAPwAAATMVIxEjETMFJT4BPQEhNSEVFAYHJz4BNw0BFw4DIyczMjY3NTMVPgEHFRQeAhcHLgEnDgEHJz4DPQEC7YSEU1P9YgF/AQH+mwG2BRBSBggD/pECBQdFko+JPAtaFzEZUkuSHjBTb0ApZaQqK6VnI0BvUy8COkb+4wJf1BQLEwokQTIwh2EHIz0bHJI9Cw4HA0YBAYF+AwmJJClJOygIRA5ZQkJXEEQJKDpJKiMAAAAABQAv/74DbwM3AAcAGQAqADYAQgAAATMVIxUjETMFJT4BPQEhNSEVFAYHJz4BNw0BFw4DIyczMjY3NTMVPgEHMhYVFAYjIiY1NDYXMjY1NCYjIgYVFBYC74CAUlL9ZwF5AQH+mwG1BhFRBwgD/pcB/wZGk5CJPApeGTIaUUmQToufn4uLn5+LZ29vZ2dvbwI5Rf0CQNwTCxYLJ0I3M4leBiM8GxmMOwsNCAJCAQF/fAMKk09KS09PS0pP8y0tKi8vKi0tAAMAKv+3Ay0DNwALAB0ALgAAATMRIxEjESMRMxEzLQE+AT0BITUhFRQGByc+ATcFFxU+ATcXDgMjJzMyNjc1At9OTmxOTmz9ZQFAAQH+0gF5BxZLCgoD/tDCPHUzBTZ6eHAtDEoUKRYDN/yAAcL+bQM9/plXFBAcDjVCRD+ncwcwVCUbPMQDBwg8CgwGAkQBAcYAAAAFAC3/uwMpAzYACwAcAC0AOQBFAAABMxEjESMVIxEzFTMtAT4BNSE1IRUUBgcnPgE3DQEXDgMjJzMyNjc1MxU+ARcyFhUUBiMiJjU0NhcyNjU0JiMiBhUUFgLaT09qTU1q/WoBPwEB/tgBdAYSTAcHA/7SAacGN3t5cCwJShQqF0o8ci+Xn5+XlZ+flW11dW1tc3MDNv2/AQ/1AhffChMXJhFBLi2KYQcgOhoZjjkLDQYCQgEBeHYDCJFMS0tLS0tLTO4tKistLSsqLQADADj/tQMVAzcAAwAVACYAAAEzESMBJT4BPQEhNSEVFAYHJz4BNwUXFT4BNxcOAyMnMzI2NzUCw1JS/Z0BjQEB/ocByQYUUQkKA/6C6k6ZSwdLnJePPgxjGjQcAzf8fgJVExEfED9DSkOweQgxVyccQckDCgs9DA8HA0UBAcwAAAQANv/AAzkDNwADABUAJgAyAAABESMRBSU+AT0BITUhFRQGByc+ATcNARcOAyMnMzI2NzUzFT4BASEVITUhNSE1IRUhAxZS/akBeAEB/psBtgYSUAYHA/6XAgYGSpiUjD8MYxk0G1FMl/7gAiT9iwIA/f0CVf3/Azf+EgHuzRALFAokQDErflUIGzIWGWw6Cw0IAkEBAWtoAgr+Sj7STT7GAAAAAgA1ADADYALgABIAHgAAEyU+AT0BITUhFxUUBgcnPgE3BQEhFSE1MzUzFTM1M34CLgEB/egCOi8HFFIKCwL94AGsASv81dJRi1IB8xcRIhBQQwFUUMeICD1pMB7+x0ND5ubmAAMALv/QA1oDBQAQABwAIgAAEyU2PQEhNSEVFAYHJz4BNw0BIRUhNTM1MxUzNTMFFSEVIRF1AjYB/eYCbwYQVAcHAv3dAbIBJPzU11GPUf6yAiH9iwJLEw0MSUVLPIdbCyE9Gxq2RUWHh4f4y0QBDwABADb/tgNhAv8AGQAAARUhESMRITUhPgE3BSclPgE9ASE1IRUUBgcDYf6UUv6TAlILDQP96gsCJgEB/fICXQgYAVRD/qUBW0MwVCYaRRUOHQ5FQ1JGpW4AAQA1/7UDYwMTAB8AAAEhFSERIzUhNSE1ITUhPgE3BSclPgE9ASE1IRUUBgczA2P+kQELUv3eARf+kwJZCAoD/e8LAiABAf30Al0GE4IBYoz+399CjEImRR8YRBINGQwyQ0c8jl4AAAACADT/ygNjAwsAGQAfAAABMxUhFSM1ITUhPgE3BSclPgE9ASE1IRUUBgEVIRUhEQLgg/6VUv6OAlkJCgP97gsCIQEB/fMCXgb9+QIf/Y8BjkPCwkMqRyEXQxIOGQ03Qkg9l/7w0kMBFQAAAAABADf/wgNeAxAAJAAAASEVIRUhFSEVITUhNSE1ITUhNSE+ATcFJyU2PQEhNSEVFAYHMwNe/pYBC/3pAjf9eAIY/eYBDf6VAlwHBwP97QoCIQH99AJdBRB5AY5d0V5A21RAXUIfNxkYQRILCz9BRDN6TwAAAAIANP/CA2MDFQAcACAAAAEhFSERIREhNSE1IT4BNwUnJTY9ASE1IRUUBgczAzUhFQNj/pEBCf2cAQj+kwJbCAkD/e4LAiIB/fMCXgYSgbf+PQFpf/7YASh/QyZDHhdDEg0MSENHOope/lilpQAAAAADADL/wgNhAxcAGAAgACQAAAEzFSEVIzUhNSE+ATcFJyU2PQEhNSEVFAYDNTMRIREzFQU1IRUC437+klL+kQJeCAkD/e4MAiIB/fMCXgZNUv2lUQG4/kgBskKKikIlQh4YRBIMDEdDRzmK/qRo/qkBV2isbGwAAAACADX/ugNjAxIAGAAxAAABMxUhFSM1ITUhPgE3BSclNj0BITUhFRQGARUUHgIXBy4DJw4DByc+Az0BAuKB/o9R/pQCWggKAv3vCwIhAf30Al0G/wAwUm49GzRiU0ATFEFTYTUaPG5SMQGpQmxsQiZEHxhDEg0MSEJGOov+zR0lQTIhBj4GGyg1Hx81KBsGPgciMUAlHQAAAAIANf+3A2MDEAAjAC8AAAEhFR4BFRQGIyImNTQ2NzUhNSE+ATcFJyU2PQEhNSEVFAYHMwM0JiMiBhUUFjMyNgNj/pCBiaSPj6SJgf6UAlkJCQP97wsCIQH99AJdBhOCuXZqanZ2amp2AV9lBlNIT1NTT0hTBmVDKEUgGUQSDQxIQ0c7jV/+tzAxMTAwMjIAAAIALf+1AxcDNgAHACcAAAEzESM1IzUzJxcOAQcRIxEOASMnPgE3NjcFJyU+ATUhNSEVFAYHPgECxVJSy8tFBkWKRVI/cjYMWM9qEQT+oAwBcgIC/p0BswcWHTcDNvx/80GnPAsOBP6vAU0CAkMBAwdOPR1GFB8yFUMoMJ9zAwUAAwAu/7MDEwM2AAcAKAAuAAABMxEzESM1Iwc1BiMnPgE3PgE3BSclPgE9ASE1IRUUBgc+ATcXDgEHFQchESM1IQH4x1JSx992agtezmoFBQL+nw0BcwEB/qQBrQQNFysWB0KFQ8ACZ1X97gFgAdb9wDAxkwNDAQMFGy8XHEMVCxYLJ0EyK3pVAgMCPQgJA5ch/t/fAAMAMP/KAyoDNgAHACgALgAAATMRMxEjNSMHNQ4BIyc+ATc2NwUnJT4BPQEhNSEVFAYHPgE3Fw4BBxUHIRUhNTMCC7ZSUrbXQn05DFvKahAF/qINAXEBAf6gAa8GFBovGAc8ej2EAij9hlIBHwIX/VBdPq8DAkMBAwdIOxpFEQ4bDS9CPjaMYQIFAjwIDAOzmEP+AAADADL/wAMyAzcABwAnADMAAAEzETMRIzUjBzUOASMnMjY3NjcFJyU+AT0BITUhFRQGBz4BNxcGBxUDIRUhNSE1ITUhFSECD7JSUrLpP3Q2C1vJagwD/qkMAWgBAf6wAZ8FDxo1GgWChWsCJf2KAgf99wJZ/foBjgGp/fAwM4oCAj0DBjYtFz0RCxQKIz4yKnZOAgUDNRAIjf7ZPcVGO7kABAAt/78DEgM2AAcAKAAsADAAAAEzETMRIzUjBzUGIyc+ATc+ATcFJyU+AT0BITUhFRQGBz4BNxcOAQcVByERISU1IRUB+MdSUsffdmoMXs9qBQUC/p8OAXQBAf6jAa4EDRcrFgdChUO9AmP9nQIO/kcBYAHW/cAwMZMDQwEDBRsvFxxDFQsWCydBMit6VQIDAj0ICQOXG/7lQZmZAAAAAAQAMv+3AxsDNgAHACgANABAAAABMxEzESM1Iwc1DgEjJzI2Nz4BNwUnJT4BPQEhNSEVFAYHNjcXDgEHFRcyFhUUBiMiJjU0NhcyNjU0JiMiBhUUFgH3ylJSyt08bzMKWM5qCAgD/qIOAXEBAf6gAbAGEjIuBkKHRYCUm5uUlJmZlGpxcWpqcHABXwHX/adHMZICAkIECB83GhpEEQsWCydCNi5+WAUHOwsOBJYUTEhITExISEzqLCoqLCwqKiwAAAMAKv+3Ay0DNgADAAsALAAAATMRIwMRMxEjNSM1NxcGBxEjEQ4BIycyNjc+ATcFJyU+AT0BITUhFRQGBz4BAt5PT6lNTadwBmBtTjNcJwlAplUICQP+4A0BMwEB/uUBZwYTFCUDNvyBAT8CLPzGzkCgPRIG/r4BPQMCRgUGIjwcF0ITDRkLLEI7NIhbAgUAAAQAN//QA00DNwADAAsALQAzAAABESMRATMRMxEjNSMHNQ4BIycyNjc+ATcFJyU+AT0BITUhFRQGBz4BNxcOAQcVByEVITUzAzFO/sWYTk6YozZiKwtDqlUDBQL+1A4BPgEB/t8BbgQLEyIRBi1hMy0CKP2FUwM3/VUCq/4YAdj9fW9RtAMCRQQFGjEXHEgSDRcLKEY4Ln1VAgMCPAgKA7ivQ9oABAA4/78DTAM2AAMACwAsADgAAAERIxEBMxEzESM1Iwc1DgEjJzI2Nz4BNwUnJTY9ASE1IRUUBgc+ATcXDgEHFQMhFSE1ITUhNSEVIQMxTv6+n05On6QzXioKRbFYAwUC/tgLATcB/t4BbwMLDhwNCDBkNCUCJv2GAgz98QJj/fQDNv3sAhT+TwGj/f0rKYQDAkIEBhoxFhtAEwoKND40KnBLAgMCOQgLBIj+1T3FRj28AAAABQAs/7cDLQM4AAMACwAqADYAQgAAAREjEQEzETMRIzUjBzUOASMnPgE3PgE3BSclNjUhNSEVFAYHPgE3FwYHFRcyFhUUBiMiJjU0NhcyNjU0JiMiBhUUFgMoT/63ok5OoqAzXygKQqlYBQcD/uUMASwD/uIBaQUPEyQRBWBsupeenpeXnp6XbXV1bW10dAM4/aMCXf46AbT92jhGogIDQAEFBhouFRhBECofQSwndlECBAI4EAinHEhIRklJRkhI4iooKikpKigqAAAAAgAw/7YDGwM3AAMAJAAAATMRIwMXDgEHESMRDgEjJz4BNz4BNwUnJT4BNSE1IRUUBgc+AQLJUlJAB0WKRVI/djkMXstqCAsD/qAMAXICAv6cAbQHFx45Azf8fwHUPQoLA/60AUgCAkQBAwYoSCAdRhQgNBZCJzCkeQIGAAIAL/+1AxADNwADACkAAAEzESMlFSERIzUhNTM1BiMnPgE3PgE3BSclPgE1ITUhFRQGBz4BNxcOAQK+UlL+wAGSUv30e4JwDFvKaggKAv6qDAFnAgH+qAGoBhMbNBoGP4EDN/3QZ5X+3OJCkAZDAQQHITsbGkURGy8VQzcxiF4CBQQ6Cw0AAAADADP/ygMqAzgAAwAjACkAAAERIxEBNQYjJz4BNz4BNwUnJT4BPQEhNSEVFAYHNjcXDgEHFQchFSERMwMPUv6FingNW8tqCAoD/qQMAW4BAf6iAa4GFDMyBzp4PI0CI/2LUgM4/VsCpf15ogZGAQMFJUIdGUQSDRkMK0M4M49hAwY/CAoDpqRDAQ0AAAIANv/DAzIDNwADAC8AAAERIxEBIRUhNSE1ITUzNQ4BIycyNjc+ATcFJyU2NSE1IRUUBgc+ATcXDgEHFSEVIQMQUv5VAh/9kAH9/gFqP3Q2C1vKagYHAv6rDgFoA/6vAaEFEBkyGQY/hUIBlf4DAzf+KQHX/Ms/31g+bwICQgMFHTMXFzwRLyE9LCh9VQIFAjkJCwNy0gAAAwAw/8IDEAM3AAMAKAAsAAABMxEjJRUhESERMzUOASMnPgE3PgE3BSclPgE1ITUhFRQGBz4BNxcOAQE1IRUCvlJS/sEBkf25ZEJ4NwxYzWoHCgL+qwwBZgIB/qkBpwYTHDQaBT+CAQD+WgM3/d9cif7ZASeEAgJDAQMHIjwbGkQTGi8UQzgxiF4CBQQ7Cw7+j6OjAAQAN//CAw8DNgADACUALQAxAAABMxEjBTUOASMnMjY3PgE3BSclPgE9ASE1IRUUBgc+ATcXDgEHFQU1MxEhETMVBTUhFQK9UlL+hUWCOgpYxmoICAP+qw0BaAEB/qkBpwYSHDgbBjx6PQEqUf2zUgGq/lYDNv39R4cDAUMCBiI8HBlEEg0ZCypDODGIXgIGBDsLDAOLRWD+uwFFYKNjYwADADn/ugNTAzcAAwAkAD0AAAERIxEBNQ4BIycyNjc+ATcFJyU+ATUhNSEVFAYHPgE3Fw4BBxU3FRQeAhcHLgMnDgMHJz4DPQEDD1L+aTxyNAtYxmcICgL+qw0BZwIB/qkBpwYTHDgbBEKIQrAwUmw9HzNeUT8UFEBRXjMePWxRMAM3/XoChv2HqAICRAMGIjwbGUQSGi4VQzcziV4CBgQ8Cg0DrD0pKkg5Jgg/CB4rOSMjOSseCD8IJjlIKikAAAADADn/twMVAzcAAwAyAD4AAAERIxEBFT4BMzIWFRQGIyImNTQ2NzUOASMnMjY3PgE3BSclPgE1ITUhFRQGBz4BNxcOARMyNjU0JiMiBhUUFgMPUv7GFzMcjp6ckIufPDc/eDcLWMRnCAsD/qsNAWcCAf6oAagHFB04HAQ/giZnc3NnZ3BwAzf9vgJC/it7BANRS0tQUUotQRSLAgJDAwUiPx0ZRREbMBZDNzONZAIFAzwIC/6RLy0tLy8tLS8AAAABADb/tgNhAwEAHQAAARUjESMRIxEjESM1IT4BNwUnJT4BPQEhNSEVFAYHA2HWUuBT0AJRDA0D/eoMAicBAf3xAl4IGAFZQ/6gAWD+oAFgQzBRJhpFFQ4dDkVDUkajbQACADX/ygNjAwsAHQAjAAABMxUjFSM1IxUjNSE1IT4BNwUnJT4BPQEhNSEVFAYBFSEVIREC4IPhUZ1R/vICWAkKA/3vCwIgAQH99AJdBv31Ain9hgGRQsXFxcVCKkUgGEMSDhoNN0JIPpP+6c5DAREAAgA3/8IDXgMRACQAKAAAASMVMxUhFSEVITUhNSE1MzUjNSE+ATcFJyU2PQEhNSEVFAYHMwU1IxUDXtd4/ekCN/14Ahj95nnXAlwGCAP97QoCIQH99AJdBRB5/tfVAZBf0V5A21RAX0IfNxoZQRILCz5BQzN7TqFfXwAAAAMANP/CA2MDFQAcACAAJAAAASMVMxEhETM1IzUhPgE3BSclNj0BITUhFRQGBzMFNSMVBTUhFQNj5oD9nHXaAlsICQP97gsCIgH98wJeBhKB/sjLAUz+PQFpgv7bASWCQyZDHhdDEg0MSENHOopexYKC46KiAAAAAAIANgAzA2EC3AATABcAABMlPgE9ASE1IRUUDgIHJz4BNwUDIRUhfwIsAQH96QJnAQcQD1AOEAT941UDK/zVAcsYESQRcENuMWJpdUUIQm80Hv7vQwAAAAACADX/tgNjAw8AFQAbAAABMxUhNSE+ATcFJyU+AT0BITUhFRQGATUhESM1AuGC/NICWQgKA/3vCwIgAQH99AJdBv2XAnRSAZRCQihHIBhEEg4ZDTdDSj2T/rBC/s/vAAACADT/ygNjAwcAFQAbAAABMxUhNSE+ATcFJyU+AT0BITUhFRQGARUhFSERAuGC/NECWgkKA/3tCwIhAQH98wJeBv35Ah/9jwF9Q0MrTCMYQxIOGw07Qk1AmP8A1UMBGAAFAC7/rgNaAwwAFAAcACcAMwA/AAABMxUhNSE+ATcFJyU2PQEhNSEVFAYHFTMVITUzNQUVPgE3Fw4BKwERBTIWFRQGIyImNTQ2FzI2NTQmIyIGFRQWAuJ4/NQCYQcHAv3pDgIpAf3wAmIFbrj+Prr+mSpmMQ5CfTMsAd1IXV1ISV1dSSozMyoqNDQBqkFBI0EdGT4UDQ1PP0k5hdJMPT1MNPMCDRFCFgwBN4M3MDA3NzAwN5gaFxcaGhcXGgAAAAACADf/wgNfAwwAFAAgAAABMxUhNSE+ATcFJyU2PQEhNSEVFAYBFSEVITUhNSE1IRUC5Xr82AJbBwgD/e0KAiEB/fQCXQX98wI3/XgCGP3mAmoByEJCIDgaGEERCwtBQUQ2ef5HXkDbVEDRAAADADT/wgNjAxEAFQAZAB0AAAEzFSE1IT4BNwUnJT4BPQEhNSEVFAYBESERJRUhNQLhgvzRAloJCQP97gsCIQEB/fMCXgb9pQJk/ewBwwGcQkInRCAYQxIOGQ02Q0k9j/3GATD+0O+trQAAAAADADL/wgNhAxMAFAAcACAAAAEzFSE1IT4BNwUnJTY9ASE1IRUUBgM1MxEhETMVBTUhFQLif/zRAl4ICQL97wwCIgH98wJeBk1S/aVRAbj+SAGnQ0MmQh8XQhINDUxCSDyL/rRn/qMBXWezcnIAAAAAAwA1/7cDYwMLABUAIQAtAAABMxUhNSE+ATcFJyU+AT0BITUhFRQGBTIWFRQGIyImNTQ2EzI2NTQmIyIGFRQWAuGC/NICWQkJA/3vCwIgAQH99AJdBv7Wj6Skj4+kpI9qdnZqanZ2AZVDQydFIBhDEg4ZDTdCST2Q9VZPTlZWTk9W/vc0MDA0NDAwNAACAC7/tgNaAwgAEgAcAAABMxUhNSE2NwUnJTY1ITUhFRQGATUhESM1BSclNQLjd/zUAl8LBP3sDgInA/3wAmQF/Z0CbFX94AsCKwGeQ0NFPRpDEz8rQiswn/6/Q/6mehpFEmAAAgBH/7YDFQM3AAMAFQAAATMRIwEhFA4CByc+ATcFJyU+ATchAsNSUv21AZonX6B5LH+aKv7ODgFaDQ0D/rcDN/x/AyRiuaiTPEE8mFsdSBcmTSoAAwBI/7UDFQM3AAMAEwAZAAABMxEjASEUBgcnPgE3BSclPgE3IRM1IREjNQLDUlL9sgGYx9cgc5Qq/tcPAVgJDAL+vlgCSFIDN/3kAeOv+EFDIWE/FkQPGDIb/exD/srzAAAAAAMASP/EAzADNgADABQAGgAAAREjEQUhFA4CByc+ATcFJyU2NyETIRUhETMDFVL9sgGYL2WdbiBzlCr+1w4BVxQE/r6xAgr9pFIDNv10AoxDWJl/ZSRCJGZAFkMQMzr9V0MBFQADAEn/wAMzAzYAAwASAB4AAAERIxEFIRAFJz4BNwUnJT4BNyETIRUhNSE1ITUhFSEDFFL9tAGY/l4ecJYq/tkOAVgIDAL+v6wCEf2fAfH+DAJF/g4DNv4sAdQm/qZsQxtZORdDDxUtF/0yQN9WQNMABABI/8IDFQM2AAMAEwAXABsAAAEzESMBIRQGByc+ATcFJyU+ATchExEhESUVITUCw1JS/bIBmcrWH3OUKv7WDgFZCQwC/r1hAj/+EQGfAzb9+gHTrfQ/QiBePxZDDxgxGv0BAT3+w/y6ugAABABI/8IDFQM2AAMAEwAbAB8AAAEzESMBIRQGByc+ATcFJyU+ATchATUzESERMxUFNSEVAsNSUv2yAZrO1R5wlyr+1w4BWQoLAv69Ak9R/b5RAaD+YAM2/hIBw6zsOUEdWzoWRA8XMBf972r+oQFfarNzcwADAEj/ugNFAzYAAwAVAC4AAAERIxEFIRQOAgcnPgE3BSclPgE3IQEVFB4CFwcuAycOAwcnPgM9AQMTUv20AZgwZJ1tIXOTKv7ZDwFWCg0C/r4BpzBSazwiMl1PPxQUQFJfMyE9blMxAzb9ogJePVeYfmMjQiNkPxZCDxo2Hf5mIDFUQi4LQQokM0EoKEI0JAlACi9DVTEgAAQASP+3AxkDNwADABMAJwAzAAABESMRBSEUBgcnPgE3BSclPgE3IQEyHgIVFA4CIyIuAjU0PgITMjY1NCYjIgYVFBYDFVL9sgGZydcfc5Qq/tYOAVkKCwL+vQF4RW9OKipOb0VGcE4qKk5wRmdzc2dndXUDN/3kAhw9rfY/QSBhPRZEDxkyGf5WFyw/KSlALBcXLEApKT8sF/7pOTMzODgzMzkAAgBc/7cDewM3AAcAHAAAARUjESMRMxEFFTI+AjcXDgMrAREhFSEVIRUDe5RSUv3HPGdgXjIINGFlbj9GAaL+sAE8Ac9F/i0DgP6YJ9cDBwsIQgkMBgMCWEO5QgADAF7/tQNyAzcABwAcACIAAAEVIxUjETMVBxcOAysBESEVIRUhFSEVMj4CBTUhESM1A3KFUlK7CS5XYG9FRAGa/rgBOP7IQWdbU/6gAkdSAklE7QIf7qZBCAoGAgGyQnRBeQIFCvNC/svzAAADAF7/ygNyAzcABwAcACIAAAEzFSMRIxEzAxcOAysBESEVIRUhFSEVMj4CBxUhFSERAu2FhVJSuwkuV2BvRUQBmv64ATj+yEFoW1P2AgT9qgIgRP7CApn+TEEJCgYBAcdCfUGGAgYKoc1DARAAAAAAAwBY/74DbQM2AAcAHAAkAAABMxUjFSMRMwMXDgMrAREhFSEVIRUhFTI+AgcVIRUhESEVAuiFhVNTuQozYWJqPEUBmP66ATn+xzlkXVv+Afb9uAJBAkxF6QIY/nFECAoGAgG2Q3Q/ewIFCvCtRAEzQgAAAAADAF7/wANyAzYABwAcACgAAAEzFSMVIxEzAxcOAysBESEVIRUhFSEVMj4CARUhFSE1ITUhNSEVAu2FhVJSuQkuWGBvRkQBmv64ATj+yEJoW1P+/gII/agB5v4XAjoCc0POAdT+pEEICQUBAYhBYD9nAgUJ/pFkQOFWQNMABABe/7oDcgM2AAcAHAAxADcAAAEVIxUjETMVBxcOAysBESEVIRUhFSEVMj4CARUyPgI3Fw4DKwE1MzUjNSEVNzUhESMRA3KFUlK5CS5YYHBFRAGa/rgBOP7IQWlbU/7ZLkk/OR4JIT9GVDc109UBJCYBFFECcETTAd3GnEEICQUBAYpBYj9nAgUJ/o1cAgQIBj4HCAQB1VQ+zYtC/pMBKwAAAAAEAF7/wgNyAzYABwAcACAAJAAAARUjFSMRMxUHFw4DKwERIRUhFSEVIRUyPgIBESERJRUhNQNyhVJSuwkuV2BvRUQBmv64ATj+yEFoW1P+swIz/h0BkgJYRO0CD96qQQgKBgIBrEJwQXcCBQr+HAE2/sr1s7MAAAAEAF7/wgNyAzYABwAcACQAKAAAARUjFSMRMxUHFw4DKwERIRUhFSEVIRUyPgITNTMRIREzFQU1IRUDcoVSUrsJLldgb0VEAZr+uAE4/shBZ1tTllH9y1EBk/5tAmVF2wHx0aZCCAoGAgGiQmxBcAIFCv79av6kAVxqr29vAAAAAAMAXv+6A3IDNwAHABwANQAAATMVIxEjETMDFw4DKwERIRUhFSEVIRUyPgIHFRQeAhcHLgMnDgMHJz4DPQEC7YWFUlK6CS5YYG9FRAGb/rcBOP7IQWhbVAExU2w8IDJeUT8UFEBSXjIgPG1TMQI8Rf7dAmP+bkEICgYCAaxCcUF2AgUKmhUvUT8rCkAJIjA/JiY/MCIJQAorP1EvFQAAAAADAFr/ugNyAzYABwAcAEIAAAEzFSMVIxEzAxcOAysBESEVIRUhFSEVMj4CFxUUHgIXBy4BJw4BBy4BJw4BByc+Az0BMxUUFhc+Az0BAu2FhVJSuggtWGBvRUQBmv64ATj+yEFoW1SfGC5DKylCWhcUUj9CUBQYWz8oKkMuGU89PyAvHxACVETiAgj+eEEICgYCAaxCcEF3AgUKpSciQzovDjwXVzk2XxoZWjk2Vxc8DzE7Qh8nJzxyIxQzODkZJwAEAF7/twNyAzYABwAcACgANAAAATMVIxUjETMDFw4DKwERIRUhFSEVIRUyPgIHMhYVFAYjIiY1NDYTMjY1NCYjIgYVFBYC7YWFUlK7CS5XYG9FRAGa/rgBOP7IQWdbUzWJnp6JiZ6eiWRycmRkcnICT0T8Aif+ckIICgYCAaxCcUF2AgYKp1VMTlNTTkxV/v0yMC4zMy4wMgAAAAACAFj/tgMvAzcACwAgAAABMxEjESMRIxEzETMFFTI+AjcXDgMrAREhFSEVIRUC4U5Od05Od/3GMVFJRCQIJ0pPWTY7AWL+7QEFAzf8fwHW/lYDQf6sLcoCBQkHRAgJBQECPEOqQQAAAAMAXP+2AyoDNgALACAAJgAAATMRIzUjFSMRMxUzBRcOAysBESEVIRUhFSEVMj4CBzUhESM1AttPT3hOTnj+/ggnSU5YNjkBWv71AQH+/zBQSEPnAltSAzb94fPtAgnZrEIICgUCAa9CcT96AgYJ9EL+zvAAAwBc/8oDRAM2AAsAIAAmAAABESMRMxUzETMRIxEFFw4DKwERIRUhFSEVIRUyPgIDIRUhETMCY05OeE9P/v8HJklOWTY5AVr+9QEC/v4wUEhEhAIR/Z1SAev+xAJ3+AEI/V8BVmFDCAkFAgG6Q3Y/fwIGCf6KQwEeAAAAAAMAXP/AA0oDNgALACAALAAAARUjETMVMzUzESM1BRcOAysBESEVIRUhFSEVMj4CAyEVITUhNSE1IRUhAmJNTXlPT/7/ByZJTlk2OQFa/vUBAv7+MFBIRIoCHf2SAf3+AQJQ/gMCKs0By7vJ/h/VVkAICgUCAYlBXT9rAgYJ/jNA11ZA0wAAAAAEAFz/wgMqAzcACwAgACQAKAAAATMRIzUjFSMRMxUzBRcOAysBESEVIRUhFSEVMj4CAxEhESUVITUC209PeE5OeP7/ByZJTlk2OQFa/vUBAv7+MFBIRNoCTf4DAa0DN/3t698B9dOkQwgJBQIBq0NuP3gCBgn+GwE2/sr1s7MAAAQAXP/CAyoDNgALACAAKAAsAAABMxEjNSMVIxEzFTMFFw4DKwERIRUhFSEVIRUyPgIBNTMRIREzFQU1IRUC209PeE5OeP7/ByZJTlk2OQFa/vUBAv7+MFBIRAEiUf2zUgGq/lYDNv4E4NoB5cefQwgJBQIBnUNoP3ACBgn++mT+rAFUZK1tbQADAFz/uQNbAzYACwAgADkAAAEVIxEzFTM1MxEjEQUXDgMrAREhFSEVIRUhFTI+AhcVFB4CFwcuAycOAwcnPgM9AQJjTk54T0/+/ggnSU5YNjkBWv71AQH+/zBQSENyM1VvPB8zYFRCFBVCU2AzHzxuVTMCCu0CCNjp/ZcBPW5DCAkFAgGsQm9AeAIGCaQaKko6KAhACB8uPCQkPC4fCEAIKDpKKhoAAAADAFz/uANwAzcACwAgAEYAAAEVIxEzFTM1MxEjNQUXDgMrAREhFSEVIRUhFTI+AgUVFB4CFwcuAScOAQcuAScOAQcnPgM9ATMVFBYXPgM9AQJqTU1xT0/+/wcmSU5ZNjkBWv71AQH+/zBQSEQBBRgvQyooQ1sXFVI/P1IUGFpAKSpDLxhPPj8gLx8QAgvgAfvX6P3t52FCCAkFAgGqQm5AdwIFCaMnI0M6Lw48F1c5Nl8aGFs5NlcXPA8xO0IgJyc8cSUTMzk6GScAAAAEAFz/twMvAzYACwAgACwAOAAAARUjETMVMzUzESM1BRcOAysBESEVIRUhFSEVMj4CFzIWFRQGIyImNTQ2EzI2NTQmIyIGFRQWAmpNTXFPT/7/ByZJTlk2OQFa/vUBAv7+MFBIREyQnKCMjKCckGdzc2dndHQCAtoB/d/w/c/9XUMICQUCAapDbj93AgYJp1FOTlNTTk5R/wAxMC0zMy0wMQAAAAIAXP+3A3YDNwALACAAAAEjFTMVIxEjETMVMwUVMj4CNxcOAysBESEVIRUhFQN2j4+PUlKP/Tg7aGFeMQg0YWVuP0YBov6wATwCEcxE/rYDgOKt1wIHCwlCCQwGAwJYQ7lCAAAEAF7/twNvAzYACwAgACwAOAAAASMVMxUjFSMRMxUzARcOAysBESEVIRUhFSEVMj4CBzIWFRQGIyImNTQ2EzI2NTQmIyIGFRQWA2+CgoJSUoL+wwkuV2BvRUQBmv64ATj+yEFnW1M1iZ6eiYmenolkcnJkZHJyAmp8RKECLYj++kIICgYCAaxCcUF2AgYKp1VMTlNTTkxV/v0yMC4zMy4wMgAAAAIAXv+1AxgDOAAHABwAAAEzESMRIzUzBRUyPgI3Fw4DKwERIRUhFSEVAsZSUrm5/eo9ZlxXLgkxXGFsQEUBn/6zASYDOPx9AexEPtcDBgsIQwkLBgICWUS5QgAAAwBi/7YDFwM4AAcAHAAiAAABMxEjNSM1MwcXDgMrAREhFSEVIRUhFTI+AgU1IREjNQLFUlKsrKIHLFRcaEFDAZL+wAEo/tg9YlZQ/scCV1IDOP3T/kKzQggKBQIBwEN3QYICBQnzQv7X5wAAAwBi/8oDLwM2AAcAHAAiAAAlESM1MzUzEScXDgMrAREhFSEVIRUhFTI+AgMhFSERMwLFrKxT9QcsVFxoQUMBkv7AASj+2D1iVlDOAgT9qlKdAVtD+/1n6EIICgUCAcdDe0KEAgYJ/o9DAQsAAwBi/8ADOQM3AAcAHAAoAAABNSM1MzUzEScXDgMrAREhFSEVIRUhFTI+AgMhFSE1ITUhNSEVIQLFqKhS8QYtVFxpQUMBlP6+ASv+1T1iV1HTAhH9ngHv/g8CQv4RAVPUQs7+HHtBCAkFAQGJQWA+aAIECf45QNdTQNAAAAUAYv/AAxcDOAAHABwAMAA0ADgAAAEzESM1IzUzBxcOAysBESEVIRUhFSEVMj4CARUyPgI3Fw4CKwE1MzUjNSEVFxEhEQMVMzUCxVJSqamgBy1UXGlBQwGU/r4BK/7VPWNXUP73JDs2MxsIHzo+I4DQ0wEiNgEf148DOP4Q1kKbQgcJBAIBj0FkPmoCBAn+nFwBAwYFPQYHA9VQPsmaAWP+nQEm6OgAAAUAVv+6AxIDNgAHABwAJAA1ADkAAAEzESM1IzUzBxcOAysBESEVIRUhFSEVMj4CEzUzESERMxUFFTI2NxcOASsBNTM1IzUhFQU1IxUCvlRUrKyfCC1WXWtCRAGV/r4BL/7RPWVYUtJL/tdL/q43bEIJPGIwcNDSASIBFZMDNv4qy0abQwgKBQIBkUFhP2wCBQn+5nf+jwFxd1pjBgo+CQbaVkDQX3t7AAQAYv/CAxgDNgAHABwAIAAkAAABMxEjNSM1MwcXDgMrAREhFSEVIRUhFTI+AgERIRElFSE1AsVTU6ysogcsVFxoQUMBkf7BASf+2T1iVlD+2AJH/gkBpwM2/e7vQ6tCCAoFAgGyQ3BBewIGCf4eATP+zfKwsAAAAAQAYv/CAxcDNgAHABwAJAAoAAABMxEjNSM1MwcXDgMrAREhFSEVIRUhFTI+AhM1MxEhETMVBTUhFQLFUlKsrKIHLFRcaEFDAZL+wAEo/tg9YlZQzVH9wlEBnP5kAzb+C9xDp0MICQUCAalCbkF1AgUJ/v9p/qkBV2mra2sAAAAAAwBi/7kDTgM2AAcAHAA1AAAlESM1MzUzEScXDgMrAREhFSEVIRUhFTI+AhcVFB4CFwcuAycOAwcnPgM9AQLGra1S9QgtVFxoQUMBkv7AASf+2T1iVlAoMVNtPCAzX1FAFBRBUV4zIDxtUzHDAURD7P2N2kMICQUCAbdDdUF7AgUJkxEuUkAtCkEJIzJAJyZBMiMJQQotQVEuEQAAAwBi/7kDawM3AAcAHABCAAABNSM1MzUzEScXDgMrAREhFSEVIRUhFTI+AhcVFB4CFwcuAScOAQcuAScOAQcnPgM9ATMVFBYXPgM9AQLFrKxS9AcsVFxoQUMBkf7BASf+2T1iVlC9GC9DKyhCXRcUUj9AURQZWkAnKkIuGU89PyAwHxABHPdD4f3lj0IICgUCAbJDcEF7AgYJpyUiQzouDT4XVzk2XhoZWzc2Vhg+DjA7Qh8lJTxxJBM0ODkZJQAABABi/7cDGgM2AAcAHAAqADYAAAE1IzUzNTMRJxcOAysBESEVIRUhFSEVMj4CBzIWFRQGIyIuAjU0NhMyNjU0JiMiBhUUFgLFrKxT9QcsVFxoQUMBkf7BASf+2T1iVlAJi5+fi0VvTimgimdzcmdncnEBE/RE6/3djUIICgUCAbRDcUF8AgYJmlVOT1YWKj4nTlX++DUwMDQ0MDA1AAAAAAMAVv+3Ay4DOAADAAsAIAAAATMRIwMRMxEjESM1BRUyPgI3Fw4DKwERIRUjFTMVAuBOTrRNTYL++y9PR0MjByZITVc1OgFO/9UDOPx/AiwBPvzDAbxDS8cCBQkHQwgJBQECPkOwQQAABABe/7YDKgM2AAMACwAgACYAAAEzESMnNSM1MzUzEScXDgMrAREhFSEVMxUjFTI+Agc1IREjNQLbT0+td3dOogcnSE5XNjkBU/784eEwT0hD6QJcUgM2/dUI9UPY/fCIQQgJBQIBtUJ0QH0CBQn1Qv7V6QAEAF7/ygNEAzYAAwALACAAJgAAAREjEQMRIzUzNTMRJxcOAysBESEVIRUzFSMVMj4CAyEVIREzAypPrXd3TqMIJ0hOVzY5AVP+/ODgL1BHQ4ECD/2fUgM2/WACoP13AUlD6/2J2EIICQUCAcFCe0CCAgYJ/o9DARYAAAAABABe/8ADTAM2AAMACwAgACwAAAERIxEDNSM1MzUzEScXDgMrAREhFSEVMxUjFTI+AgMhFSE1ITUhNSEVIQMqT613d06iByhNT1UxOQFT/vvi4itNSUeHAh/9kAH9/gECUP4DAzb+HAHk/iXQQrn+NXQ/CAkFAgGJQWA/aQIFCf44QNdSQM8AAAUAXv/CAyoDNwADAAsAIAAkACgAAAEzESMnNSM1MzUzEScXDgMrAREhFSEVMxUjFTI+AgMRIRElFSE1AttPT613d06iByZJTlg1OQFT/vzh4TBPSEPaAk3+AwGtAzf95AnvQtP9/IdCCAkFAgGsQm9AeQIGCf4eAS7+0u2rqwAABQBe/8IDKgM2AAMACwAgACgALAAAATMRIyc1IzUzNTMRJxcOAysBESEVIRUzFSMVMj4CATUzESERMxUFNSEVAttPT6t5eU2jByZJTlg1OQFT/vzh4TBPSEMBIlH9s1IBqv5WAzb+BgnYQsX+IXZBCAkFAgGeQmhAcwIGCf7+ZP6sAVRkrW1tAAQAXv+5A1gDNgADAAsAIAA5AAABESMRAzUjNTM1MxEnFw4DKwERIRUhFTMVIxUyPgIXFRQeAhcHLgMnDgMHJz4DPQEDKk+td3dOogcnSE5XNjkBU/784OAwT0hDcTNUbjsfMmBSQhQVQlFeMx86bVQzAzb9mwJl/ezpQtr9+3ZCCAkFAgG1QnRAfQIGCZQVLE8/LAlACSIwPyUlPzAiCUAJLD9PLBUAAAUAXv+3Ay4DNgADAAsAIAAuADoAAAERIxEDNSM1MzUzEScXDgMrAREhFSEVMxUjFTI+AhcyFhUUBiMiJjU0PgIXMjY1NCYjIgYVFBYDKk+td3dOogcmSU5YNTkBU/784eEwT0hDS4ygnY+LoClOb0VndHRnZ3NzAzb9ygI2/e3nQ9v9+39CCAkFAgGrQm9AeAIGCaVTTE5SU00mOykV/zIuLTMzLS4yAAIAXv+1AxgDOAALACAAAAEzESMRIzUzNSM1MwUVMj4CNxcOAysBESEVIRUhFQLGUlK1tba2/eo7Y1lULQkvWV9pP0QBmP66ASQDOPx9AYdCnEK11wMGCghCCQsGAgJZQ7tBAAADAGL/ygMvAzYACwAgACYAACU1IzUzNSM1MzUzESUXDgMrAREhFSEVIRUhFTI+AgMhFSERMwLFtbW1tVP+9wcqUVdkPkABiv7IARj+6DldUUy8AgT9qlKZ+0J0Q6n9Y9tDCAkFAgHSQ31BjgIGCf6gQwEIAAMAYv+4A2sDOAALACAARgAAATUjNTM1IzUzNTMRJRcOAysBESEVIRUhFSEVMj4CFxUUHgIXBy4BJw4BBy4BJw4BByc+Az0BMxUUFhc+Az0BAsW3t7e3U/7/CStSWmY/QgGJ/skBIP7gO15UTcgYL0MrKEJdFxRRP0JQFBlaQCcqQi4ZTz0/HzAgEAEck0NuQ5X95IBDCAkFAgG7QnZBfwIGCZgnIkI5Lg49F1Y5Nl4aGlo3NlUYPQ8wO0AfJyc6ciQUMzc5GScAAwBW/7cDLgM3AAMADwAkAAABMxEjAzUzESMRIzUzNSM1BRUyPgI3Fw4DKwERIRUjFTMVAuBOTrFNTYqKiv8ALUtEQSIHJUZLVDM4AUb30gM3/IACktn8wwFLQ5NDsccCBQkHQwgJBQECPkOwQQAAAAQAXv/KA0QDNgADAA8AJAAqAAABESMRAzUjNTM1IzUzNTMRJxcOAysBESEVIxUzFSMVMj4CAyEVIREzAypPrXx8fHxOsgklR0tUMzcBR/jY2C1LREB0Ag/9n1IDNv1XAqn9b/pCakOW/YHVQggJBQIB0UODQIkCBgn+mkMBDQAAAQA0ACUDYwLuABMAACUhFSE1ITUhESEVIRUhFSEVIRUhAfQBb/zRAW7++wJg/fMB+f4HAhb+7mlERLkBzEN+QYdDAAACADT/tQNgAx8AEwAZAAABIRUhNSE1IREhFSEVIRUhFSEVIQE1IREjNQHzAW381AFt/v4CXf31AfP+DQIQ/vL+nAJoUgFTQkJfAW1AVT5aQP7NQv70ygAAAgA0/8oDYAMWABMAGQAAASEVITUhNSERIRUhFSEVIRUhFSEFFSEVITUB8wFt/NQBbf7+Al399QHz/g0CEP7y/vwCHP2SATtCQl8BfEBePmBA365D8QAAAAIALv/AA1oDFgATABsAAAEhFSE1ITUhESEVIRUhFSEVIRUhARUhFSERIRUB7gFs/NQBbP77Al39+AHy/g4CDf73/vQCI/2JAm4BYEJCUQFlP1Q9VUD+4pJBARI/AAAAAAIANv/AA18DJQATAB8AAAEhFSE1ITUhESEVIRUhFSEVIRUhARUhFSE1ITUhNSEVAfMBbPzXAWv+/gJd/fUB8/4NAhD+8v72Air9hgIO/e8CYgGSPj5PAUQ7RzlNPP5xVT3MTTzDAAAAAwA0/8IDYAMiABMAFwAbAAABIRUhNSE1IREhFSEVIRUhFSEVIQERIRElFSE1AfMBbfzUAW3+/gJd/fUB8/4NAhD+8v6mAmT97AHEAV9CQloBaUBTPlhA/gkBDv7yzIuLAAAAAAMANP/CA2ADJQATABsAHwAAASEVITUhNSERIRUhFSEVIRUhFSETNTMRIREzFQU1IRUB8wFt/NQBbf7+Al399QHz/g0CEP7ys1H9pFEBuv5GAW1BQVgBYEBPPVU//t9X/scBOVegYWEAAgA0/7kDYAMeABMALAAAASEVITUhNSERIRUhFSEVIRUhFSEXFRQeAhcHLgMnDgMHJz4DPQEB8wFt/NQBbf7+Al399QHz/g0CEP7yATBSbj0eNGBRQBQUQFJgMx4+bVIwAVpCQlsBaUBSPllAyhcrSTkmCEAIHi06JCQ6LR4IQAgmOUkrFwAAAAMANP+3A2ADHQATAB8AKwAAASEVITUhNSERIRUhFSEVIRUhFSEHMhYVFAYjIiY1NDYXMjY1NCYjIgYVFBYB8wFt/NQBbf7+Al399QHz/g0CEP7yKZadnZaWnZ2WbXR0bW10dAFcQkJYAWlAUz5YQN5JRkhISEhGSeEoKigqKigqKAAAAAMANP/CA2ADIgATAB8AIwAAASEVITUhNSERIRUhFSEVIRUhFSETFTMVITUzNSM1IRUhFTM1AfMBbfzUAW3+/gJd/fUB8/4NAhD+8ouQ/XmRiQJ4/mLEAWJCQlsBZUBRPlZA/taQQUGQQUGQkAAAAAACACv/tgN1AzcABwAjAAABFSMRIxEzEQUVPgE3Fw4DIycyNjc1IxEhFSEVIRUhFSEVA3WOUlL+jDx0OQdIlJCHOgs2fUO5AcH+kQFi/p4BeAG+Rf49A4H+h3aXAwkIPA0OBgFEAQKaAZ9CbEFuQgAAAwA0/8oDcAM2AAcAIwApAAABMxUjESMRMwMXDgMjJzI2NzUjESEVIRUhFSEVIRUjFT4BBRUhFSE1AuyEhFJSiwVGko+HOgo2dz+pAaT+rgFB/r8BVqw9eP7fAgX9qQIERP66Arz+ID0MDgYCQwECYAFkPlU9Vj5cAwqcpUPoAAACACr/tgMnAzcACwAnAAABMxEjESMRIxEzETMFFT4BNxcOAyMnMjY3NSMRIRUhFSEVIRUhFQLZTk5sTU1s/mswWSoHOHt5cC0LKmk5mgF//tABIP7gATUDN/x/Acn+ZgM+/qBwiAIIBjwLDAYCRAECjAGNQ2FBZkIAAAAAAgA7/7QDEAM4AAMAHwAAATMRIwEVPgE3Fw4DIycyNjc1IxEhFSEVIRUhFSEVAr5SUv7LP388B0uclow8Cjl+RbkBz/6DAWr+lgGBAzj8fAGSkQQLCj0OEAcCRAEClQGgQmtBcEIAAAADADn/ygMwAzYAAwAfACUAAAERIxEDFw4DIycyNjc1IxEhFSEVIRUhFSEVIxU+AQEhFSE1MwMTUkcFSZaTiz0MOX5CrAGs/qYBSv62AWC0P3v+3gIU/ZpSAzb9SgK2/h88DA4GAkQBAl8BYz5TPVc+XAMJ/sBD6AADADX/wQMgAzYAAwAfACcAAAERIxEDFw4DBycyNjc1IxEhFSEVIRUhFSEVIxU+AQEhFSERIRUhAw5TSAhGlJOOQAs8fECuAbX+nwFS/q4BaLo/ev7ZAg39ngJb/foDNv3RAi/+RT4JDAgFAUgCAlEBVD5MO1A/TQMI/o5CARxBAAMAOv+5Az4DNgADAB8AOAAAAREjEQMXDgMjJzI2NzUjESEVIRUhFSEVIRUjFT4BBxUUHgIXBy4DJw4DByc+Az0BAxRSSAZKmZOKOws3gEWuAaz+pgFK/rYBX7I9eiwwUm09HTNfUkAUE0FSYDIdPG1SMAM2/W0Ck/45Ow4PCAFCAQJfAVo+Tz1SPlsDC4AaKUY3JQg/Bx4rOCEhOCseBz8IJTdGKRoAAAQAOf+3AxcDNgADAB8AKwA3AAABESMRAxcOAyMnMjY3NSMRIRUhFSEVIRUhFSMVPgEHMhYVFAYjIiY1NDYXMjY1NCYjIgYVFBYDFFJFBkmYlIw+CzmBQ64BrP6mAUr+tgFgsz97VZKZmZKTmJiTam9vampubgM2/bICTv48OwwOBgJCAQJYAVo+Tz1SPlUDCotMSEhMTEhITOkrKiosLCoqKwAAAgA0ACUDYgLwABMAFwAAJTMVITUzNSMRIRUhFSEVIRUhFSMhFTM1AonZ/NLjegJf/fQB+P4IAhV8/uDOaUREvAHLQn5BiEK8vAAAAAIANP+2A2IDDQALABMAAAEVIREhFSEVIRUhFQUVIREjESE1Awj9mQJc/fUB9v4KAnD+klL+kgG2QgGZQmg/bp5D/uEBH0MAAAIANP+1A2ADGQALABkAAAEVIREhFSEVIRUhFQUhFSERIzUhNSE1ITUhAwH9ngJd/fcB8f4PAm3+lAEKU/3kARL+kwMsAe9BAWtBVD9W0WL++cZBYkIAAAADADT/ygNhAxYACwATABkAAAEVIREhFSEVIRUhFQchFSEVIzUhFxUhFSE1AwD9nwJc/fYB8v4OvQMt/plT/o25Ahr9lAHaQQF9QV0/X49Co6NQrEPvAAAAAgA2/8ADXwMlAAsAHwAAARUhESEVIRUhFSEVBSEVIRUhFSEVITUhNSE1ITUhNSEDAf2eAl399QHz/g0Cbv6UAQX98QIq/YYCDv3vAQv+lQMpAh08AUQ7RzlNu03DVT3MTTxNPgAAAAADAC7/tANaAyAACwAoACwAAAEVIREhFSEVIRUhFQUhFSERIREjFSMVMjY3Fw4BKwE1MzUjNSE1ITUhBRUzNQL3/Z4CXf34AfL+DgJw/pQBHf7YOdI3akIITn5CL9PUARX+lAMs/tGYAh07AT48RjdKv03+owE+p1YFCjsLBMhRPk0+x+TkAAAAAwA1/8IDYAMiAAsAFwAbAAABFSERIRUhFSEVIRUFIRUhESERITUhNSEDNSEVAwH9ngJd/fUB8/4NAm/+lAEJ/ZwBCf6TAyuz/jwB+UABaUBTPljQWf7yAQ5ZQf6Zi4sABAA0/8IDYAMlAAsAEwAbAB8AAAEVIREhFSEVIRUhFQchFSEVIzUhBTUzESERMxUFNSEVAwH9ngJd/fUB8/4NvQMs/pRT/pMCclH9pFEBuv5GAgU/AV9ATj1VjUJmZpdc/scBOVycXV0AAAAAAwAz/7oDYgMiAAsAEwAsAAABFSERIRUhFSEVIRUHIRUhFSM1IQUVFB4CFwcuAycOAwcnPgM9AQMB/Z4CXf31AfP+Db4DL/6SUv6RAcIwU24+GTViVEEUFEJUYzUZPm9TMAH6QAFoQFI+WIZCVlZxHCM8LR0FPQUYJDEeHjEkGAU9BR0tPCMcAAMANP+3A2ADHQALAB4AKgAAARUhESEVIRUhFSEVBSEVHgEVFAYjIiY1NDY3NSE1IQM0JiMiBhUUFjMyNgMB/Z4CXf31AfP+DQJv/pODh56VlZ6Hg/6TAyy1dG1tdHRtbXQB9EABaUBTPljNUQVIQkZKSkZCSAVRQf7fKCoqKCooKAAAAAMAMv+1AxcDNgAHABMAIwAAATMRIzUjNTMDFSERIRUhFSEVIRUFFw4BBxEjEQ4BIycyPgICxVJSy8uB/jkBwf6QAVv+pQG1BEKGQ1I/djcMQ5OYmQM2/H/IQAEbQQFsQVY/VYQ9CgsE/tQBKQIBRQEFCQAABAAw/7kDZwM3AAcAEwAjAEUAAAEzETMRIzUjExUhESEVIRUhFSEVEzUOASMnMj4CNxcOAQcVBRUUHgIXBy4BJw4BBy4BJw4BByc+AT0BMxUUFhc+AT0BAg21UlK1Lf5LAa7+owFM/rRQQHc2CT+PlZZHBj9/QAE4GS9EKyZDXxcUU0A/UxQYXkMkVWFQPj8/QAFVAeL9ty4BCjoBMzlCNkj+zIICAT0BBQgHNQgLBIUrEB45MScLPRRLMzFSFhVRMTFLFD0YZjwQEDFkHh9kMBAAAAAEACb/tgMtAzcAAwALABcAJwAAATMRIwMRMxEjNSM1ExUhESEVIRUhFSEVBRcOAQcRIxEOASMnMj4CAt5PT6lNTaFK/oYBdf7bARP+7QFNBjBnM042XyoKMHd+fgM3/H8BJAJI/MK3PwEKPwFZP009UXc9CQoE/uQBGAIBRAEFCQAAAAAFADT/ugNdAzcAAwALABcAJwA+AAABESMRATMRMxEjNSMTFSERIRUhFSEVIRUTNQ4BIycyPgI3Fw4BBxU3FRQeAhcHLgMnDgEHJz4DPQEDMU7+uZ9OTp9D/o8BbP7lAQn+9zYzXCgKMXd8eTMELWUz4DBUc0MbNmRVRBUtsHAbRHRWMAM3/WICnv4NAd/9uC4BHTwBKTs+M0H+m6wCAj8BBQcGNwcJBK8KGyY+Lh4GQAUWJDEfP0YKQAYeLj4mGwADADD/tQMVAzYAAwAPAB8AAAEzESMDFSERIRUhFSEVIRUFFw4BBxEjEQ4BIycyPgICw1JSfP47Ab/+kwFZ/qcBsQQ/gkBSQ385C0KTmpwDNvx/AhpBAXFBWD1ahD0KDAP+3QEfAwFFAQUKAAADADH/tQMSAzcAAwAPACUAAAEzESMDFSERIRUhFSEVIRUXFSERIzUhNTM1DgEjJzI+AjcXDgECwFJSgf5LAa/+owFK/raoAY5S/fN/Qns5C0KTmZtJB0KCAzf9vwEEPQFSPUs8UcRy/vHOQW4CAkQBBgoJPAoNAAAEADL/ygMsAzcAAwAPAB8AJQAAAREjEQMVIREhFSEVIRUhFRM1DgEjJzI+AjcXDgEHFQchFSE1MwMSUoH+SwGv/qMBS/61YkWAPAtCk5mbSgY/fT+JAiX9iVIDN/1SAq7+uD0BVz1PO1P+p4oDAUUBBQoJPAkNBI6JQ/AAAwA2/8ADMwM3AAMADwArAAABESMRAxUhESEVIRUhFSEVEyEVITUhNSE1MzUOASMnMj4CNxcOAQcVIRUhAxNSgv5LAa7+pAFK/rYvAij9iAIH/fdzP3c2CkGSmJtKBEKIQgGV/fgDN/4IAfj+8joBMDpAOET91T7NSz5ZAgE/AQMIBzYICwNcxAAAAAAEADH/wgMSAzcAAwAPACIAJgAAATMRIycVIREhFSEVIRUhFRcVIREhETM1DgErAScyJDcXDgETNSEVAsBSUoH+SwGv/qMBSv62qAGO/bFvID8fdwyJATWVBUKB/P5RAzf90vs9AUw9STtOvWn+5AEcZgEBQgQOOggK/rqZmQAAAAUAMf/CAxIDNwADAA8AHwAnACsAAAEzESMnFSERIRUhFSEVIRUTNQ4BIyczMj4BNxcOAQcVBTUzESERMxUFNSEVAsBSUoH+SwGv/qMBSv62bEiFPwuOSZmaSQU8dzwBJ1H9tFEBqv5WAzf95fU9AUU9RztJ/s5uAgFCAwgHOgcKA3FDVf7RAS9VmFlZAAAAAAQAMf+3AxUDNwADAA8ALAA4AAABESMRAxUhESEVIRUhFSEVFxU2MzIWFRQGIyImNTQ2NzUOASMnMj4CNxcOARMyNjU0JiMiBhUUFgMSUoH+SwGv/qMBSv62qC83kpmZkpKZPDdCezkLQ5SZmkoGQoMkam9vampubgM3/bACUP7HPQFMPUk7TsJiBkxISUxMSS09EnECAkMBBAkIOwgL/rUtKiosLCoqLQAAAAACADT/twNhAw0ACwAXAAABFSERIRUhFSEVIRUFFSMRIxEjESMRIzUDB/2aAlv99gH1/gsCb9NS4lLUAbhCAZdCZkBtnkP+4AEg/uABIEMAAAMANP/KA2EDEwALABcAHQAAARUhESEVIRUhFSEVByEVIxUjNSMVIzUhFxUhFSE1AwD9nwJc/fgB8P4QvwMt1VKbUf7muQIi/Y0B3UABdkBbPl2LQpubm5tVrkPxAAAAAAMANv/AA18DJQALAB8AIwAAARUhESEVIRUhFSEVBSMVMxUhFSEVITUhNSE1MzUjNSEFNSMVAwH9ngJd/fUB8/4NAm7Ycf3xAir9hgIO/e942AMp/tbVAh08AUQ7RzlNuk7DVT3MTTxOPoxOTgAAAAAEADX/wgNgAyIACwAXABsAHwAAARUhESEVIRUhFSEVBSMVMxEhETM1IzUhBTUjFQU1IRUDAf2eAl399QHz/g0Cb9l2/Zx12QMr/tXUAUz+PAH8QAFmQFE+V81f/vIBDl9CoV9fzYuLAAQANf+3A2ADHQALAB0AJgAyAAABFSERIRUhFSEVIRUFIxUeARUUBiMiJjU0NzUjNSEFNSMVPgEzMhYXNCYjIgYVFBYzMjYDAf2eAl399QHz/g0Cb8gxNJyXlp1oygMr/ub1GzwiIz6AdG1tdHRtbXQB9UABaEBTPlfLcxE5KEZISEZQI3JCoV9fBAQEiigpKSgoKSkAAAAAAgA0ACoDYgLpAAsADwAAARUhESEVIRUhFSEVByEVIQMF/ZgCX/30Afj+CLwDLvzSAVNCAdhChUGO5kMAAwA0/7UDYAMfAAsADwAVAAABFSERIRUhFSEVIRUHIRUhFzUhESM1AwH9ngJd/fUB8/4NvQMs/NRbAmhSAfJAAW1AVT5alUKYQf7xzgAAAAADADT/ygNfAxYACwAPABUAAAEVIREhFSEVIRUhFQchFSEXFSEVITUDAP2fAlz99gHy/g69Ayv81bsCHP2SAdpAAXxAXj5glEJBtkP5AAAAAAMANP/CA18DEgALAA8AFwAAARUhESEVIRUhFSEVByEVIRcVIRUhESEVAwD9nwJd/fcB8f4PvwMr/NW2Ah39kQJmAew+AWQ+VT1WikKTikEBDEEAAAMANv/AA18DIAALAA8AGwAAARUhESEVIRUhFSEVByEVIRMVIRUhNSE1ITUhFQMB/Z4CXf31AfP+DbsDKfzXswIq/YYCDv3vAmICFzsBRDxGOk1/Pv73VD3MTTzEAAAAAAUAN//AA14DGgALAA8AIwAnACsAAAEVIREhFSEVIRUhFQchFSETFTI+AjcXDgIrATUzNSM1IRUXESERAxUzNQMA/Z8CXP32AfL+DroDJ/zZoyc+NjIaBx44PiSD0NIBHzkBINqUAhA8AUY7STlNfT/+/lYBAwYFOwYHA8pMPMCSAVL+rgEV2NgAAAAABAA1/8IDYAMfAAsADwATABcAAAEVIREhFSEVIRUhFQchFSETESERJRUhNQMB/Z4CXf31AfP+DbwDK/zVZAJk/ewBxAH2PwFoQFI+WZBC/p4BEP7wz42NAAQANP/CA2ADHwALAA8AFwAbAAABFSERIRUhFSEVIRUHIRUhBTUzESERMxUFNSEVAwH9ngJd/fUB8/4NvQMs/NQCclH9pFEBuv5GAf4/AWA/Tz5ViEKQV/7HATlXoGFhAAMANP+6A2ADGAALAA8AKAAAARUhESEVIRUhFSEVByEVIQUVFB4CFwcuAycOAwcnPgM9AQMB/Z4CXf31AfP+Db0DLPzUAcAwUm49HjRgUUAUFEBSYDMePW1TMAHxQAFnQFI+V49CNRcrSTkmCD8IHiw6JCQ6LB4IPwgmOUkrFwAAAwA7/7UDEAM4AAMADwAbAAABMxEjAxUhESEVIRUhFSEVAycyPgI3Fw4DAr5SUm3+LQHP/oQBaf6XjAo9j5ibSQdLm5aMAzj8fQHKQgGpQnBCc/7wRQIGDAs9DhAHAgAABAA5/8oDMgM2AAMADwAbACEAAAERIxEDFSERIRUhFSEVIRUFFw4DIycyPgIBIRUhNTMDFVKL/k4BrP6mAUv+tQGlBkmYlIw9DECQlpf+6AIU/ZpSAzb9TwKx/qI+AWY+VT1YezwMDgYCQwIFC/65Q+wAAAAEADP/wAM2AzcAAwAPABsAJwAAAREjEQMVIREhFSEVIRUhFQUXDgMjJzI+AgEhFSE1ITUhNSEVIQMVUoT+SwGv/qIBS/61AasES5uXkEAKQpKZm/7TAij9hwIH/fcCWv35Azf+BwH5/uQ6ATQ6QjZIbzUKCwYBPgEDCP5YPcxMPcMAAAAFADH/wgMVAzcAAwAPABsAHwAjAAABMxEjJxUhESEVIRUhFSEVBRcOAyMnMj4CAREhESUVITUCw1JShP5LAa/+owFK/rYBqQRLmpiQQAtCk5qb/ooCUP4AAbADN/3S8j0BUD1MO092OQsNBgJBAQQK/kYBHP7k25mZAAAABQAx/8IDFQM3AAMADwAbACMAJwAAATMRIycHIREhFSEVIRUhFQUXDgMjJzI+Ahc1MxEhETMVBTUhFQLDUlKDAf5LAa/+owFK/rYBqQRLm5eQQAtDk5mbiVH9s1EBq/5VAzf95eo9AUo9SDxMdDkLDAYBQAEFCe1U/tEBL1SZWVkAAAAAAgBu/7cDFQM3AAMAGAAAATMRIwEVMj4CNxcOAysBESEVIRUhFQLDUlL9/D1rY2AyCDRkaG9ARwGz/p4BQQM3/IAB8dcDBgwJQwkMBgMCWEO5QgAAAwBo/7YDFQM3AAMAGAAeAAABMxEjJxcOAysBESEVIRUhFSEVMj4CBTUhESM1AsNSUmcJMV5mdklJAaz+pgFB/r9GcWJa/pACWFIDN/3ejkEICgYCAbJCdEF5AgUK9EL+zfEAAAMAaP/KAzADNgADABgAHgAAAREjEQMXDgMrAREhFSEVIRUhFTI+AgEhFSERMwMVUmcJMV5mdklJAaz+pgFB/r9GcWJa/vkCCv2kUgM2/WYCmv5VQggKBgIBwUJ7QYECBgr+ikMBDAAAAwBo/8ADMwM2AAMAGAAkAAABESMRAxcOAysBESEVIRUhFSEVMj4CASEVITUhNSE1IRUhAxVSZggxXmZ1SkkBrP6mAUH+v0ZxYlr+9gIQ/Z8B8v4MAkX+DgM2/ikB1/6mQQgJBQIBh0FgP2YCBQn+LEDeVz/SAAAABABo/8IDFQM2AAMAGAAcACAAAAEzESMnFw4DKwERIRUhFSEVIRUyPgIBESERJRUhNQLDUlJnCTFeZnZJSQGs/qYBQf6/RnFiWv6kAkT+DAGkAzb96ZJBCAoGAgGqQm9BdgIFCv4ZATH+z++trQAAAAQAaP/CAxUDNgADABgAIAAkAAABMxEjJxcOAysBESEVIRUhFSEVMj4CEzUzESERMxUFNSEVAsNSUmcJMV5mdklJAaz+pgFB/r9GcWJal1H9vlEBoP5gAzb+DXpCCAoFAgGkQ2xBcwIGCv7+Zf6qAVZlrm1tAAAAAAMAaP+5A0kDNgADABgAMQAAAREjEQMXDgMrAREhFSEVIRUhFTI+AgcVFB4CFwcuAycOAwcnPgM9AQMVUmcJMV5mdklJAaz+pgFB/r9GcWJaETFSbjwgM19RQBQTQFJfMyA8blIxAzb9lAJs/mdBCAoGAgGxQnNBeQIFCpcRLlFAKwlBCSIyQCYmQDIiCUEJK0BRLhEAAAAABABo/7cDGAM2AAMAGAAkADAAAAERIxEDFw4DKwERIRUhFSEVIRUyPgIHMhYVFAYjIiY1NDYTMjY1NCYjIgYVFBYDFVJnCTFeZnZJSQGs/qYBQf6/RnFiWkKOn5+OjKCgjGd1dWdndHQDNv3VAiv+cEEICgYCAapCcEF1AgUKoFZOTlVVTk5W/vkzMDA0NDAwMwAAAAMAKv+2A3sDNgAHABsAIQAAARUjESMRMxElET4BNxcOAyMnMzI3ESM1IRUhET4BNxEDe5RSUv7tI0UhBkaUkYk7ClgPEGAB8/69JEolAdBE/ioDgP6axP5RAgYFPQsNBwJFAQG6QkL+RwECAgG0AAAEADj/tQNyAzYABwAbACEAJwAAARUjFSMRMxUHFw4DIyczMjcRIzUhFSMRPgEBET4BNxEDNSERIzUDcoVSUpMGQ4+NhjoJVA4PWAHfWSJB/r8jSCTiAkdSAkZE6wIf8Js8Cw0HAkUBARdDQ/7zAwYBBP7qAQICARH9/EP+y/IAAAUAOP+2A3IDNgAHABsAIQAnAC0AAAEVIxUjETMVBxcOAyMnMzI3ESM1IRUjET4BARE+ATcRAzUhESMRMzUhESMRA3KFUlKRBkOPjoc6CVQOD1gB31kjQv69I0gk9gEcUXsBFVECU0TqAhHjoDwLDQcCRQEBE0ND/vgCBgEA/u4BAgIBDf4JQv68AQJC/rwBAgAAAAAEADj/ygNyAzcABwAaACAAJgAAATMVIxEjETMDFw4DIyczMjcRIzUhFSMRNgERPgE3EQMVIRUhEQLthYVSUpMGQ4+NhjoJVA4PWAHfWUT+3iNIJHcCBP2qAiZE/sAClf5OPQsNBgJEAQE0QkL+2AMBJf7OAQICAS3+P9NDARYAAAQAM//BA24DNQAHABoAIAAoAAABMxUjFSMRMwMXDgMjJzI2MxEjNSEVIxU2JRE+ATcRAxUhFSERIRUC6YWFUlKUBUOPjIY6CRo5HlgB31lF/t0jSCSDAfn9tQJCAlFE4AII/og9Cw0HAkUBAQpDQ/4F+f74AQICAQP+DbpBATxBAAAAAAQAOP/AA3IDNwAHABkAHwArAAABMxUjFSMRMwMXDgMjJzM1IzUhFSMVPgElFT4BNzUDFSEVITUhNSE1IRUC7YWFUlKTBUOPjYY6CHFYAd9ZIkH+vyNIJIICCP2oAeb+FwI6AnJEyQHS/qc7CwwGAkTyQUHnAgXg8AEBAuz9qWJB4FpA1wAAAAAGADj/wgNyAzYABwAZAB8AMwA3ADsAAAEVIxUjETMVBxcOAyMnMzUjNSEVIxU+ASUVPgE3NQMVMj4CNxcOAisBNTM1IzUhFRcRIREDFTM1A3KFUlKSBEOPjYY6CHFYAd9ZIkL+viNIJLUjOjQyGwcfOT0ifcvOAR03ARjRiQJ1RNUB2sGhOwsMBgFD90FB7AIF5fUBAQLx/atgAQQGBT4GBwPZVD7NngFr/pUBLe/vAAUAOP/CA3IDNgAHABoAIAAkACgAAAEVIxUjETMVBxcOAyMnMzI3ESM1IRUjETYlET4BNxEDESERJRUhNQNyhVJSkwZDkI6FOQlUDg9YAd9ZQ/7fI0gkzgIz/h0BkgJgRO0CB9anPAsNBwJFAQEOQ0P+/QX+/vMBAgIBCP0SAT3+w/y6ugAAAAAFADj/wgNyAzYABwAaACAAKAAsAAABFSMVIxEzFQcXDgMjJzMyNxEjNSEVIxU2JRE+ATcRATUzESERMxUFNSEVA3KFUlKTBkOQjoU5CVQOD1gB31lF/t0jSCQBFFH9y1EBk/5tAmdE3QHwz6I8Cw0HAkUBAQdDQ/wF9/76AQICAQH+AGr+owFdarBwcAAAAAAEADj/ugNyAzcABwAaAB8AOAAAATMVIxEjETMDFw4DIyczMjcRIzUhFSMRNgERNjcRExUUHgIXBy4DJw4DByc+Az0BAu2FhVJSkwZEkY2EOQlUDg9YAd9ZRf7dR0h/MFNsPCEtWlFDFxZEUlstITxtUjECPkT+4wJa/ng+DA4HAkUBARJDQ/76BgEA/u8CBAEL/mIVMFJALQpACB8wQSoqQS8fCUAKLUBSMBUABAA4/7kDcgM2AAcAGwAhAEcAAAEzFSMVIxEzAxcOAyMnMzI3ESM1IRUjET4BJRE+ATcRARUUHgIXBy4BJw4BBy4BJw4BByc+Az0BMxUUFhc+Az0BAu2FhVJSkwZDkI6FOQlUDg9YAd9ZIkH+vyNIJAEfGC5DKylCWxcUUT9CURQYWj8qK0MuGE8+PyAwIA8CWUXfAgH+gz0LDQYCRAEBD0ND/vwCBvz+8gECAgEJ/l4uI0U8MA88GVk5OV8bGl05N1kYPBAzPEMhLi49dSUUNTk7Gi4AAAAABQA4/7cDcgM2AAcAGwAgADAAPAAAATMVIxUjETMDFw4DIyczMjcRIzUhFSMRPgElETY3ERMyHgIVFA4CIyImNTQ2EzI2NTQmIyIGFRQWAu2FhVJSkwZEkI2FOQlUDg9YAd9ZIkH+v0dIR0RtTSkpTW1EiZ6eiWdvb2dkcnICT0T6AiX+ej0MDgYCRAEBEUJC/vsCB/z+8AIEAQr+VxYpPScnPSoWVk5OVf76MzAwMjIwMDMABAAy/7MDbQM1AAcAGgAgACoAAAEVIxUjETMVBxcOAyMnMzI3ESM1IRUjFTYlET4BNxEDNSERIzUFJyU1A22FUlKUBkOPjYY6CVQPD1kB4FlC/t8jSCTsAlJS/fYMAhYCUUTgAgjklT0LDQcCRgEBCkND/wT7/vcBAgIBBP4OQ/6zeRpDFFQAAAQAOP/CA3IDNgAHABkAHwArAAABMxUjFSMRMwMXDgMjJzM1IzUhFSMVPgElFT4BNzUDFSEVIREhFSEVIRUC7YWFUlKTBUOPjYY6CHFYAd9ZIkH+vyNIJHwB+v21Ajj+GQHcAmpD3AHr/po7CwwGAkT6QUHvAgXo+AEBAvT9oVY9AVw9UTsAAAADACz/tgMvAzYACwAeACQAAAEzESMRIxEjETMRMyURNjcXDgMjJzMyNxEjNSEVIRE+ATcRAuFOTnVNTXX+rzIrBjV4dm8sCUUMDU0Bn/75GzkcAzb8gAHV/lgDQP6rtv5gAwY8CgwGAkQBAaxCQv5WAQICAaUAAAAEADH/tQMqAzYACwAcACIAKAAAATMRIzUjFSMRMxUzBxcOAyMnMxEjNSEVIxE2AxE+ATcRAzUhESM1AtxOTnBNTXDoBTV4d28sCVxNAaJMMvAcOh2DAmJSAzb94fHsAgvbqzwJCwYCRAEYQ0P+8wMBCv7qAQECARL+AkL+zPIAAAQAMf/KA0QDNgALABwAIgAoAAABESMRMxEzETMRIxEHFw4DIyczESM1IRUjETYDET4BNxEDIRUhETMCbE1Nb09P5wU1eHdvLAlcTQGiTDLwHDodGwIU/ZpSAeP+zAJ3/wABEP1aAVNePQkLBgJFASpDQ/7hAwEc/tgBAQIBJP1yQwEZAAQAM//BAzgDNgALAB8AKAAwAAABFSMRMxUzNTMRIzUHFw4DIyczMjcRIzUhFSMRPgElETc2MzcyNxEDIRUhESEVIQJnTU11T0/sBDR1dW4sCUELDUgBmUoZLv78OgsLDgwKKwIZ/ZQCZf3uAhPlAfjQ4P3z6lw9CQsGAkUBAQtCQv7/AgT7/vYCAQEBAQX9U0EBO0EAAAAABAAx/8ADSwM3AAsAHAAiAC4AAAEVIxEzFTM1MxEjNQcXDgMjJzM1IzUhFSMVNicVPgE3NQMhFSE1ITUhNSEVIQJsTU1wTk7pBjV4d28sCVxNAaJMMvAcOh0eAh79kgH9/gACUP4DAiTIAcrA0f4hzE88CQsGAkT4QkLtA+r2AQEC8v1HQNtUQNEAAAAFADH/wgMqAzYACwAdACMAJwArAAABMxEjNSMVIxEzFTMHFw4DIyczESM1IRUjET4BJRE+ATcRAxEhESUVITUC3E5OcE1NcOgFNXh3bywJXE0BokwZL/76HDodbgJN/gMBrQM2/fTo3QHy0qU8CQsGAkQBD0ND/vwCBP7+8wEBAgEJ/RcBOf7H+La2AAUAMf/CAyoDNgALABwAIgAqAC4AAAEzESM1IxUjETMVMwcXDgMjJzMRIzUhFSMVNicRPgE3EQE1MxEhETMVBTUhFQLcTk5wTU1w6AU1eHdvLAlcTQGiTDLwHDodAY9Q/bRRAav+VQM2/gze2QHhxKQ8CQsGAkQBBkJC+wP4/vwBAQIBAP4EZ/6lAVtnsXFxAAQAMf+6A1sDNwALAB8AJQA+AAABFSMRMxUzNTMRIxEHFw4DIyczMjcRIzUhFSMRPgEBET4BNxETFRQeAhcHLgMnDgMHJz4DPQECbE1NcE5O6AU2eXZuLAlDDA1NAaJMGS7++xw6Hd0zVm48HjNhU0IVFEJTYDMfO29VMwIL5wIB1+n9nwE1aDwLDAYCRQEBFEND/vcCBQEC/u0BAgIBDv5WHSpLOykIQAggLjwkJDwuIAhACCk7SyodAAAABAAx/7kDcAM2AAsAHAAiAEgAAAEVIxEzFTM1MxEjNQcXDgMjJzMRIzUhFSMRNgMRPgE3EQEVFB4CFwcuAScOAQcuAScOAQcnPgM9ATMVFBYXPgM9AQJsTU1vT0/nBTV4d28sCVxNAaJMMvAcOh0BcRgvQyooQ1sXFVE/QFIUGFpAKSpDLxhPPj8gLx8QAhLhAfTP4P3z6WU9CQsGAkUBEUJC/voDAQP+8QEBAgEL/lgoIkM6Lw88F1c5Nl8aGlk5NlcXPA8xO0IgKCg8cSQUMzg5GSgAAAAABQAx/7cDLgM3AAsAHAAiADYAQgAAARUjETMVMzUzESM1BxcOAyMnMxEjNSEVIxE2AxE+ATcREzIeAhUUDgIjIi4CNTQ+AhMyNjU0JiMiBhUUFgJsTU1vT0/nBTV4d28sCVxNAaJMMvAcOh22Rm9OKipOb0ZFbk4pKU5uRWd1dWdncnICBdgB+N3v/dr0YD0JCwYCRQERQ0P++gMBA/7xAQECAQv+WRYqPCYnPCkWFik8JyY8Khb+/DIwMDIyMDAyAAAAAAMAKv+2A3YDNgALAB8AJQAAASMVMxUjESMRMxUzJRE+ATcXDgMjJzMyNxEjNSEVIRE+ATcRA3aPj49SUo/+XiNFIQZGlJGJOwpYDxBgAfP+vSRKJQIYzET+rgOA2jj+UQIGBT0LDQcCRQEBukJC/kcBAgIBtAAAAAQAOP+1A3ADNgALAB4AJAAqAAABIxUzFSMVIxEzFTMFFw4DIyczMjcRIzUhFSMRNgERPgE3EQM1IREjNQNwg4ODUlKD/uoGQ4+NhjoJVA4PWAHfWUX+3SNIJOICR1ICYnpEjQIfkPs8Cw0HAkUBARdDQ/70BQEH/uoBAgIBEf38Q/7L8gAAAAADAC7/tgMYAzYABwAbACAAAAEzESMRIzUzJxE+ATcXDgMjJzMyNxEjNSEVIRE2NxECxlJSq6vxIT8gBUSQjoY7CVcPEFoB7/67R0oDNvyAAetEsf5PAgUEPQoNBwJFAQG9Q0P+RAEFAbYAAAAEADj/tgMYAzYABwAbACEAJwAAATMRIzUjNTMHFw4DIyczMjcRIzUhFSMRPgEBET4BNxEDNSERIzUCxVNToKB0BUKNi4M4CVQOD1kB2lkhP/7HIkQjwQJYUwM2/d72Q6g8CwwGAkUBASFDQ/7pAgUBEP7gAQECARz99UL+zvAAAAQAOP/KAy8DNgAHABsAHwAlAAABMzUzESMRIx8BDgMjJzMyNxEjNSEVIxE+AQERNxEDIRUhETMCJaBTU6ArBkONioM4CVQOD1kB2lkgQP7HiVYCBP2qUgI6/P1pAVhnPAwOBgJFAQEtQkL+3gIGARr+1AUBJ/1oQwEQAAAEADj/wAM6AzcABwAbAB8AKwAAATM1MxEjNSMfAQ4DIyczMjc1IzUhFSMVNzYlFTc1AyEVITUhNSE1IRUhAiafU1OfKgVBjIqEOQlUDw5ZAdpZQCD+x4lYAhH9ngHv/g8CQv4RAmvM/iTPVjsJDAYDQwH+QUHzBALt/QX4/UNA3FVA0gAFADj/wgMYAzcABwAaAB4AIgAmAAABMxEjNSM1MwcXDgMjJzMyNxEjNSEVIxE2ARE3EQMRIRElFSE1AsVTU6CgdAVCjYuDOAlUDg9ZAdpZQP7nibACR/4JAacDN/3z6UKhPAsNBwJFAQEaQ0P+8QUBCv7nBQEU/QsBOP7I97W1AAUAOP/CAxcDNwAHABsAIQApAC0AAAEzESM1IzUzBxcOAyMnMzI3ESM1IRUjET4BARE+ATcRATUzESERMxUFNSEVAsVSUqCgdAVCjYuDOAlUDg9ZAdpZIT/+xyJEIwFFUf3DUQGb/mUDN/4Uz0OdPAsMBgJFAQERQ0P++QIFAQD+8AEBAgEM/fds/qMBXWyvb28AAAAEADj/ugNOAzYABwAbACEAOgAAATM1MxEjESMfAQ4DIyczMjcRIzUhFSMRPgEBET4BNxETFRQeAhcHLgMnDgMHJz4DPQECJaBSUqAsBUKNi4M4CVQOD1kB2lkhP/7HIkQjoDFTbTwgM19RQBQUQFJfMiE8bVQxAkTy/ZYBNls8CwwGAkUBAR5DQ/7sAgUBDf7jAQECARn+XBouUkEtCkAJIzJAJiZAMiMJQAouQVEuGgAAAAAEADj/uQNrAzcABwAbACEARwAAATM1MxEjNSMfAQ4DIyczMjcRIzUhFSMRPgEBET4BNxEBFRQeAhcHLgEnDgEHLgEnDgEHJz4DPQEzFRQWFz4DPQECJaBSUqAsBUKNi4M4CVQOD1kB2lkhP/7HIkQjATYYLkMrKUJbFxRTP0JQFBhYQigqQy4ZTz0/IDAfEAJS5f3r7WA8CwwGAkUBARtDQ/7vAgUBCv7mAQECARb+Uy4iQzsvDjwXWDk2YBoaWzk2WRc8DzE7QiAuLjxyJBQ0ODkZLgAAAAAFADj/twMaAzYABwAbAB8AMQA9AAABMzUzESM1Ix8BDgMjJzMyNxEjNSEVIxE+AQERNxETMh4CFRQOAiMiLgI1NDYTMjY1NCYjIgYVFBYCJaBSUqAsBUKNi4M4CVQOD1kB2lkhP/7HiW9Fbk4pKU5uRUVvTimgi2dycmdncnICS+v94fJiPAsMBgJEAQEeQ0P+7QIFAQz+4wUBGP5UFio+KCc+KxYWKz4nUFb+9DYwMDY2MDA2AAAABAAs/7YDMwM2AAMACwAfACUAAAEzESMDETMRIxEjNScRPgE3Fw4DIyczMjcRIzUhFSERPgE3EQLkT0+tTU16MBgwFgU0d3duLAhCDA1KAZr++xw3HQM2/IACKwFA/MQBtEii/mACBQM8CgwGAkQBAatCQv5XAQECAaUAAAUAMf+2Ay0DNgADAAsAHAAiACgAAAEzESMBMzUzESM1Ix8BDgMjJzMRIzUhFSMRNgMRPgE3EQM1IREjNQLeT0/+5nRNTXQyBTZ4d28tCVxNAaJNNvMcOR2AAmNTAzb94AEw4P306Wc8CQsGAkUBIUJC/ukDART+4QEBAgEb/f1C/s3xAAUAMf/KA0YDNgADAAsAHAAiACgAAAERIxEBMzUzESMRIx8BDgMjJzMRIzUhFSMRNgMRPgE3EQMhFSERMwMtT/7mdE1NdDIFNnh3by0JXE0Bok008Rw5HRMCD/2fUgM2/WECn/788v2JAUJnPQkLBQJFASlDQ/7hAwEc/tgBAQIBJP1vQwEbAAAFADH/wANNAzcAAwALAB0AIwAvAAABESMRBTM1MxEjNSMfAQ4DIyczESM1IRUjFT4BJRU+ATc1AyEVITUhNSE1IRUhAy1P/uZ0TU10MgU2eHdvLQlcTQGiTRow/vkcOR0aAh39kgH9/gECUP4DAzf+IQHfy7n+N85bOgkLBgJDAQFCQvcCBPH/AQEC+/1DQNpTQNAABgAx/8IDLQM2AAMACwAdACMAJwArAAABMxEjATM1MxEjNSMfAQ4DIyczESM1IRUjET4BARE+ATcRAxEhESUVITUC3k9P/uZ0TU10MgU2eHdvLQlcTQGiTRow/vkcOR1qAk3+AwGtAzb97QEr2P4G32E8CQsGAkUBGUND/vECBAEJ/ugBAQIBFP0SATf+yfa0tAAAAAYAMf/CAy0DNgADAAsAHAAiACoALgAAATMRIwEzNTMRIzUjHwEOAyMnMxEjNSEVIxE2AxE+ATcRATUzESERMxUFNSEVAt5PT/7mdE1NdDIFNnh3by0JXE0Bok028xw5HQGSUf2zUQGr/lUDNv4FAR3L/iLQYTwJCwYCRQEUQ0P+9gMBB/7uAQECAQ79/WT+rAFUZK1tbQAABQAx/7kDXQM2AAMACwAcACIAOwAAAREjEQUzNTMRIzUjHwEOAyMnMxEjNSEVIxE2AxE+ATcRExUUHgIXBy4DJw4DByc+Az0BAy1P/uZ0TU10MgU2eHdvLQlcTQGiTTbzHDkd4DNWbjweM2FTQhUVQlNgMh87b1UzAzb9mQJn+OX9/9ldPQkLBQJFARxCQv7uAwEP/uUBAQIBF/5QHSpLOykIQAggLjwkJDwuIAhACCk7SyodAAAAAAYAMf+5AzADNgADAAsAHAAiADIAPgAAAREjEQUzNTMRIzUjHwEOAyMnMxEjNSEVIxE2AxE+ATcREzIeAhUUBiMiJjU0PgIXMjY1NCYjIgYVFBYDLU/+5nRNTXQyBTZ4d28tCVxNAaJNNvMcOR27RW9OKaCLi6ApTm9FZ3NzZ2dzcwM2/dQCLPLi/gPZYzwJCwYCRQEaQ0P+8AMBDf7oAQECART+UhUpOyZNU1NNJjspFf8yLi0zMy0uMgAAAwAu/7YDGAM2AAsAHwAlAAABMxEjESM1MzUjNTMnET4BNxcOAyMnMzI3ESM1IRUhET4BNxECxlJSoKCgoPQgPx0GRI+NhDkJVg8QWgHq/sAjSCQDNvyAAYNDkUNI/kcCBQQ8Cw0GAkUBAcRDQ/49AQICAb4AAAAABAAv/7QDEQM3AAsAHwAkACoAAAEzESM1IzUzNSM1MwMXDgMjJzMyNxEjNSEVIxE+AQERNjcRAzUhESMRAr9SUqGhoaGOBT6HhX42CVEODlQBzVQdOf7RR0bFAmFSAzf975hCZUP/ADwJCwcCQwEBJEND/uYCBgES/t0CBAEd/gFC/roBBAAAAAQAOP/KAy8DNgALAB8AJQArAAAlESM1MzUjNTM1MxEnFw4DIyczMjcRIzUhFSMRPgEBET4BNxEDIRUhETMCxZaWlpZT1AVAioiANglUDg9ZAdhZHjv+0CFEIlQCBP2qUpwBAkNpQqr9ZuI9CgwGAkQBAURCQv7HAgUBMv69AQICAT79YUMBCAAEADj/wAM6AzcACwAdACMALwAAATUjNTM1IzUzNTMRJxcOAyMnMxEjNSEVIxU+ASURPgE3NQMhFSE1ITUhNSEVIQLFkpKSklPUBUCJiIA3CXFZAdhZHjv+0CFEIlYCEf2eAe/+DwJB/hIBV4ZCVEKC/iB1OwoLBgFEAQNCQvkCBfL+/gEBAv79REDbU0DQAAAFADj/wgMYAzcACwAfACUAKQAtAAABMxEjNSM1MzUjNTMHFw4DIyczMjcRIzUhFSMRPgEBET4BNxEDESERJRUhNQLFU1OUlJSUgQVBioeANglUDg9ZAdhZHjv+0CFEIq4CRv4KAacDN/3nnUJhQ/49CwwGAUQBAS5CQv7dAgUBHP7TAQICASj9BwEu/tLtq6sAAAAABQA4/8IDGAM2AAsAHwAlAC0AMQAAATMRIzUjNTM1IzUzBxcOAyMnMzI3ESM1IRUjET4BARE+ATcRATUzESERMxUFNSEVAsVTU5SUlJSBBUCKiIA2CVQOD1kB2FkeO/7QIUQiAUdR/cNRAZv+ZQM2/g+FQlpC+j4KDAYCRQEBJ0ND/uQCBQEV/toBAgIBIf3yaP6pAVdorGtrAAAABAA4/7oDawM3AAsAHwAlAEsAAAE1IzUzNSM1MzUzEScXDgMjJzMyNxEjNSEVIxE+AQERPgE3EQEVFB4CFwcuAScOAQcuAScOAQcnPgM9ATMVFBYXPgM9AQLFlJSUlFPUBUGKh4A2CVQOD1kB2FkeO/7QIUQiATcYL0MrKEJdFxRRP0JQFBlaQCcqQi4ZTz0/IDAfEAEYqkJZQ5f94Yo9CgwGAkUBAS5CQv7dAgQBHf7TAQICASj+RigiQjouDj0XVjk2XhoaWDk2Vhc9DzA6QSAoKDxxJBQzODkZKAAAAAAFADj/twMaAzYACwAfACUAMQA9AAABNSM1MzUjNTM1MxEnFw4DIyczMjcRIzUhFSMRPgEBET4BNxETMhYVFAYjIiY1NDYTMjY1NCYjIgYVFBYCxZSUlJRT1AVBioeANglUDg9ZAdhZHjv+0CFEInGLn5+Lj5ycj2dycmdncnIBDqVDXkOf/diQPQoMBgJEAQEpQkL+4QIGARf+2AECAgEj/kpTTk5VVU5OU/78MzAuNDQuMDMAAAAABAAs/7YDMwM2AAMADwAjACkAAAEzESMDNTMRIxEjNTM1IzUnET4BNxcOAyMnMzI3ESM1IRUhET4BNxEC5E9PrE1NdXV1NRguFgUzdnZvLQhDDA1LAZv++xw3HQM2/IACgun8xAFRQ3xDTP5cAgQDPAkLBgJEAQGuQkL+UwECAgGoAAAABQAx/8ADTQM2AAMADwAgACYAMgAAAREjEQUzNTMRIzUjNTM1Ix8BDgMjJzMRIzUhFSMRNicRPgE3EQMhFSE1ITUhNSEVIQMtT/7za0xMa2trHgU0dXVvLQldTgGfTDLuHDodGgId/ZIB/f4BAlD+AwM2/h8B4ZB+/jWFP0qiPAgKBgNEAQxCQv7+A//+9gEBAgEG/UJA2lNA0AAABgAx/8IDLQM2AAMADwAjACkAMQA1AAABMxEjATM1MxEjNSM1MzUjHwEOAyMnMzI3ESM1IRUjET4BARE+ATcRATUzESERMxUFNSEVAt5PT/7za0xMa2trHgU0dXZuLQlEDA1NAZ5MGS7+/Rw6HQGSUf2zUQGr/lUDNv4CAWeE/h+KP1WtPAkLBQJEAQESQkL++AEEAQP+7wEBAgEN/f1h/rEBT2GramoABQAx/7oDXQM2AAMADwAhACcAQAAAAREjEQUzNTMRIzUjNTM1Ix8BDgMjJzMRIzUhFSMRPgEBETI2NxETFRQeAhcHLgMnDgMHJz4DPQEDLU/+82tMTGtrax4FNXZ2bSwJXU0BnkwYL/79HDod4DNWbjweM2FSQxUVQlNfMx87b1UzAzb9kwJtrJn995U/XLs9CgsGAUUBKUND/uICBAEY/tkCAgEj/lEaK0s8KAg/CCAtPCQkPC4fCD8IKDtMKxoAAgA1ACYDYgLhABMAFwAAJSEVITUhNSE1MxEjNSEVIxEzFSEDETMRAfMBb/zTAWv+34mLApmLif7fmd9pQ0POQgEmQkL+2kIBaP7aASYAAAADADX/tgNgAxcAEwAXAB0AAAEhFSE1ITUhNTM1IzUhFSMVMxUhAxUzNQE1IREjNQH0AWz81QFt/uGFhwKSiIT+5Zrf/lYCbVIBYkJCbEPDQ0PDQwEGw8P9sEP+784AAAADADT/ygNfAw4AEwAXAB0AAAEhFSE1ITUhNTM1IzUhFSMVMxUhAxUzNQEVIRUhNQH0AWv81QFu/uGFiAKSh4T+5Zrf/rYCF/2XAVFCQm1CzEJCzEIBDszM/fSzQ/YAAAADADT/wANfAx8AEwAXACMAAAEhFSE1ITUhNTM1IzUhFSMVMxUhJxUzNQEVIRUhNSE1ITUhFQHzAWz81QFt/uKFiAKSh4T+5Jnf/rACKv2GAg797wJiAaBCQlY/qz8/qz/qq6v9dlg+0Eo9wQAEADX/wgNgAxoAEwAXABsAHwAAASEVITUhNSE1MzUjNSEVIxUzFSEnFTM1AREhESUVITUB8wFt/NUBbP7jhIcCkoiE/uSZ3/5gAmT97AHEAXNCQmdCvEJCvEL+vLz86gEa/ubZl5cAAAQANP/CA2ADHgATABcAHwAjAAABIRUhNSE1ITUzNSM1IRUjFTMVIScVMzUTNTMRIREzFQU1IRUB8wFt/NQBbf7ihYgCk4iE/uSZ325S/aJRAbv+RQGAQkJkQrVDQ7VC97W1/c1X/sMBPVekZGQAAAADADX/uQNfAxYAEwAXADAAAAEhFSE1ITUhNTM1IzUhFSMVMxUhJxUzNQMVFB4CFwcuAycOAwcnPgM9AQHzAWz81gFs/uKFhwKRh4T+5JnfRDBRbj0fM19SQBQUQFJfMx49bVMwAWtCQmpDu0NDu0P+u7v+HhcrSzooCEEIHy07JCQ7LR8IQQgoOksrFwAAAAAEADX/twNgAxYAEwAXACMALwAAASEVITUhNSE1MzUjNSEVIxUzFSEnFTM1AzIWFRQGIyImNTQ2FzI2NTQmIyIGFRQWAfMBbfzVAWz+44SHApKIhP7kmd9vkKOikZKhoZJqdnZqanZ2AXFCQmNDvENDvEP/vLz+Fk5LS05OS0tO9C4tLS4uLS0uAAAAAAMAK/+3A3QDNgAHACMAJwAAARUjESMRMxEFFT4BNxcOAyMnMjY3NSM1MzUjNSEVIxUzFQEVMzUDdItSUv6GP3c6BkiUkIc7DDZ6QsxbYAH8X1v+uJ0BwET+OwN//opkpAMKCT0MDggCRAECqEL6QkL6QgE8+voAAAQAM/+1A3ADNwAHACMAJwAtAAABFSMVIxEzEQcXDgMjJzI2NzUjNTM1IzUhFSMVMxUjFT4BARUzNQM1IREjNQNwglJSiwZFkpCJPAo2ekLHWVsB31pZwzx3/tyM9QJRUgIsQ98CLf71pD0LDggDRQICX0GrQUGrQVsDCQE7q6v93kL+2uQAAAAFADT/twNwAzcABwAjACcAMwA/AAABMxUjESMRMwMXDgMjJzI2NzUjNTM1IzUhFSMVMxUjFT4BARUzNRMyFhUUBiMiJjU0NhcyNjU0JiMiBhUUFgLvgYFSUokGRpORiTwJNnpCx1daAeJaVsI9eP7ZjjmPmZmPj5mZj2dvb2dnb28CMkT+/wJK/kU7Cw0IAkIBAmdBsEFBsEFkBAkBSLCw/iRNSEhMTEhITekqKiosLCoqKgADADv/twMQAzYAAwAfACMAAAEzESMBFT4BNxcOAyMnMjY3NSM1MzUjNSEVIxUzFQEVMzUCvlJS/sw/fzwHS5qWjT0LOX9F2GZqAgprZ/60lQM2/IEBpaMDCgk9DA8HA0QCAqdC+kJC+kIBPPr6AAAABAA5/8oDMAM1AAMAHwAjACkAAAERIxEDFw4DIycyNjc1IzUzNSM1IRUjFTMVIxU+AQEVMzUDIRUhNTMDE1JGBkmYlIs8DDd8QsZXWwHpYFzJQH/+z4+BAhT9mlIDNf1gAqD+MDwMDggCQwECaUG+QUG+QWUDCgFXvr79WkPyAAADADQAIwNiAuQAEwAXABsAACUzFSE1MzUjNTMRIzUhFSMRMxUjAREzEQMVMzUCfeX80uKXiYsCmYuKmP7d39HDZkND1UIBJUJC/ttCAWf+2wEl/pnV1QAABAA0/8oDXwMQABMAFwAbACEAAAEzFSE1MzUjNTM1IzUhFSMVMxUjARUzNQMVMzUBFSEVITUCfuH81eGShYgCkoeEkf7c39LF/sMCF/2XAUtCQndCykJCykIBDMrK/vR3d/76r0PyAAAEADT/wANfAyEAEwAXABsAJwAAATMVITUzNSM1MzUjNSEVIxUzFSMlFTM1BxUzNQEVIRUhNSE1ITUhFQJ+4fzV4ZKFiAKSh4SR/tzf0sX+vQIq/YYCDv3vAmIBnkFBXUCnPz+nQOenp+ddXf5bWD7QSj3BAAUANP/CA2ADIAATABcAGwAjACcAAAEzFSE1MzUjNTM1IzUhFSMVMxUjJRUzNQcVMzUTNTMRIREzFQU1IRUCfuL81OGShYgCk4iEkf7c39LFe1L9olEBu/5FAX1CQmtCs0NDs0L1s7P1a2v+wFf+wwE9V6RkZAAAAAQANP+5A18DGAATABcAGwA0AAABMxUhNTM1IzUzNSM1IRUjFTMVIyUVMzUHFTM1BxUUHgIXBy4DJw4DByc+Az0BAn7h/NXhkoWHApGHhJH+3N/SxTcwUW49HzNfUUAUFEFSXzMePW1TMAFpQkJxQrlDQ7lC+7m5+3Fx6RcrSzooCUAIHy07JCQ7LR8IQAkoOksrFwADADT/tgNhAwUACwAPABcAAAE1IzUhFSMVMxUhNSE1IxUFFSERIxEhNQEJhwKRh4T9dQG13wIG/pNT/pMBzvRDQ/RDQ/T0q0P+1gEqQwAAAAMANf+2A2ADFwALAA8AHQAAATUjNSEVIxUzFSE1ITUjFQUhFSERIzUhNSE1ITUhAQiHApKIhP10AbbfAgb+kwEJUv3lARP+kwMrAhHDQ0PDQ0PDw95s/u/OQ2xDAAAAAAQAM//KA2EDDQALAA8AFwAdAAABNSM1IRUjFTMVITUhNSMVBSEVIRUjNSEXFSEVITUBCIgCkoeE/XQBtt/+2QMu/plS/ou6Ahr9lAH70EJC0EJC0NCeQ6urVrdD+gAAAAMANP/CA18DGwALAA8AHwAAATUjNSEVIxUzFSE1ITUjFQUhFSEVIRUhFSERITUhNSEBCIgCkoeE/XQBtt8CBf6VAQr97AId/ZEBCv6SAysCGr5DQ75CQr6+3mdCj0IBE2dCAAADADT/wANfAx8ACwAPACMAAAE1IzUhFSMVMxUhNSE1IxUFIRUhFSEVIRUhNSE1ITUhNSE1IQEIiAKSh4T9dAG23wIF/pQBBf3xAir9hgIO/e8BC/6TAysCOKg/P6g/P6iozFXFVD7NTT1VQgAEADX/wANfAxsACwAPAC8AMwAAATUjNSEVIxUzFSE1ITUjFQUhFSERIREjFSMVMj4CNxcOAisBNTM1IzUhNSE1IQUVMzUBCIcCkYeE/XQBtt8CBf6TARL+3zjRJz82MhoGHjg+JIPR0wEW/pQDKv7LkwI2pj8/pj8/pqbKWv6uAU27VgEDBgU7BgcDy0s8WkLZ2NgABAA1/8IDYAMaAAsADwAbAB8AAAE1IzUhFSMVMxUhNSE1IxUFIRUhESERITUhNSEDNSEVAQiHApKIhP11AbXfAgb+lAEJ/ZwBCf6TAyuz/jwCHLxCQrxCQry82Wn+6AEYaUL+f5WVAAAFADT/wgNgAx4ACwAPABcAHwAjAAABNSM1IRUjFTMVITUhNSMVBSEVIRUjNSEFNTMRIREzFQU1IRUBCIgCk4iE/XQBtt/+2gMs/pRT/pMCc1L9olEBu/5FAie0Q0O0QkK0tJZDdXWqY/67AUVjoGFhAAAAAAQANf+5A2IDHgALAA8AFwAwAAABNSM1IRUjFTMVITUhNSMVBSEVIRUjNSEFFRQeAhcHLgMnDgMHJz4DPQEBCIcCkYeE/XQBtt/+2wMt/pBR/pQBvzBTbT0ZKVxXSxgUQVRiNBo9blMxAiK5Q0O5QkK5uZdDYmKFGCQ9Lx4FPwQVJDUlHzImGgY/Bh8vPCMYAAQANf+3A2ADFgALAA8AIgAuAAABNSM1IRUjFTMVITUhNSMVBSEVHgEVFAYjIiY1NDY3NSE1IQM0JiMiBhUUFjMyNgEIhwKSiIT9dQG13wIG/pSBiKOPlZ+Jgv6TAyu2dWptdHRtanUCF7xDQ7xCQry82FcGTUVKT05LRk0FV0P+zi0uLi0tLi4AAAAABAAy/7UDFwM3AAcAEwAXACcAAAEzESM1IzUzATUjNSEVIxUzFSE1ITUjFQUXDgEHESMRDgEjJzI+AgLFUlLLy/37YQH8Yl3+DQFHmgFzBEKHQlI/dzcLQ5OYmQM3/H7LPwEi2kJC2kJC2tqFPQoLBP7MATECAUUBBQkAAAYAMP+3AxwDNwAHABMAFwAnADMAPQAAATMRMxEjNSMBNSM1IRUjFTMVITUhNSMVEzUOASMnMj4CNxcOAQcVFzIWFRQGIyImNTQ2FzI1NCYjIgYVFAH4yVJSyf7KWwHjWlb+JQE1jw4/cDYKP4+Wl0cGQoNCe5eZmZeVmpqW229tbW4BSgHt/Z46ASKjPz+jPz+jo/6zhwICQwEFCgk7CQwEixFGSEhGRkhIRt5QJyoqJ1AAAAQAM/+1AxUDNgADAA8AEwAkAAABMxEjATUjNSEVIxUzFSE1ITUjFQUXDgEHESMRDgErASczMj4BAsNSUv39YQH8Yl3+DQFHmgFzBkCCQFIhQB93C4pImZsDNvx/AifaQ0PaQkLa2pA8CgsE/tsBIQEBRAUJAAAAAAUAMf/KAywDOAADAA8AEwAjACkAAAERIxEBNSM1IRUjFTMVITUhNSMVEzUOASMnMj4CNxcOAQcVByEVITUzAxJS/gpaAedgXf4fATSNKkaFPAxClJmbSQc9ej+OAiX9iVIDOP1TAq3+ybxBQbxBQby8/paPAwJDAQULCjwJDQOTikPyAAQANv/AAzMDNgADAA8AEwAvAAABESMRATUjNSEVIxUzFSE1ITUjFQMhFSE1ITUhNTM1DgEjJzI+AjcXDgEHFSEVIQMTUv4MWwHjWlf+JAE1jhICKP2IAgf993M/djYLQZKZm0kFQohDAZX9+AM2/gsB9f7/mz4+mz4+m5v9yT7NTT1YAgFCAQMIBzkICwRaxAAAAAAFADH/wgMSAzcAAwAPABMAJwArAAABMxEjATUjNSEVIxUzFSE1ITUjFRcVIREhETM1DgEjJzI+AjcXDgETNSEVAsBSUv4KWgHnYF3+HwE0jWoBjv2xb0J6OQxDk5maSgVAg/z+UQM3/dQBDrFBQbFBQbGx0Gr+4wEdZgIBQwEECAg7CAv+uJqaAAAAAAUAMf+5A1UDNwADAA8AEwAjADwAAAERIxEBNSM1IRUjFTMVITUhNSMVEzUOASMnMj4CNxcOAQcVNxUUHgIXBy4DJw4DByc+Az0BAxJS/gpaAedgXf4fATSNED94NgxAk5qcSgZCiUOyL1FrPB4yXlA/ExRAUF0yHjxrUS8DN/1jAp3+3K9BQa9CQq+v/paVAgJCAQUMCzoLDgSZPhoqRzglCD4IHSs4IyM4Kx0IPgglOEcqGgAAAAADADT/tgNhAwUACwAPABsAAAE1IzUhFSMVMxUhNSE1IxUFFSMRIxEjESMRIzUBCYcCkYeE/XUBtd8CBtFS5FLUAdHxQ0PxQ0Px8apD/tIBLv7SAS5DAAAABAAz/8oDYQMPAAsADwAbACEAAAE1IzUhFSMVMxUhNSE1IxUFIRUjFSM1IxUjNSEXFSEVITUBCIgCkoeE/XQBtt/+2QMuz1KeUv7jtwIj/YsB/85CQs5CQs7OnkOtra2tYLFD9AAAAAAEADT/wANgAyEACwAPACMAJwAAATUjNSEVIxUzFSE1ITUjFQUjFTMVIRUhFSE1ITUhNTM1IzUhBTUjFQEIiAKSh4T9dAG23wIG2XH98QIq/YYCDv3vetwDLP7V1AI8pj8/pj8/pqbLWsRVPs5MPVpBm1paAAUANf/CA2ADHAALAA8AGwAfACMAAAE1IzUhFSMVMxUhNSE1IxUFIxUzESERMzUjNSEFNSMVBTUhFQEIhwKSiIT9dQG13wIG23j9nHjcAyv+09ABSv48AiG5QkK5QkK5udlv/ukBF29CsW9v1pWVAAAEADX/uwNgAxYACwAPABsANAAAATUjNSEVIxUzFSE1ITUjFQUhFSMVIzUhFSM1IwUVFB4CFwcuAycOAwcnPgM9AQEIhwKRh4T9dAG23/7bAyuzUv7gUbUBwDBSbj4dM2BSQhQUQlJhMx0+blIxAhe9QkK9QkK9vZdDnJycnE0bLEk5JQg/CB0rOSMjOSsdCD8HJTlKLBsAAAUANf+3A2ADGAALAA8AIAAnADMAAAE1IzUhFSMVMxUhNSE1IxUFIxUWFRQGIyImNTQ3NSM1IQU1IxU2MzIXNCYjIgYVFBYzMjYBCIcCkoiE/XUBtd8CBspnopGSoWjKAyv+5fQ2Q0ScdmpqdnZqanYCG7pDQ7pCQrq62XclVktOTktVJndCpGJiCZkrLy8rLS4uAAADADUAKQNiAt0ACwAPABMAAAERIzUhFSMRMxUhNSERIxEFIRUhAQiLApmLif1rAbrf/tsDLfzTAWMBOEJC/shDQwE4/sj2RAAEADT/ygNfAwkACwAPABMAGQAAATUjNSEVIxUzFSE1ITUjFQUhFSEXFSEVITUBCIgCkoeE/XQBtt/+2gMr/NW7Ahf9lwH7zEJCzEJCzMyjQlO2Q/kAAAAABAA0/8ADYAMbAAsADwATAB8AAAE1IzUhFSMVMxUhNSE1IxUFIRUhExUhFSE1ITUhNSEVAQiIApKHhP10Abbf/toDLPzUtQIq/YYCDv3vAmICMas/P6s/P6urikH+7FQ+zU09xQAAAAAFADX/wgNgAxcACwAPABMAFwAbAAABNSM1IRUjFTMVITUhNSMVBSEVIRMRIRElFSE1AQiHApKIhP11AbXf/tsDK/zVZAJk/ewBxAIWv0JCv0JCv7+cQv6KARr+5tmXlwAFADT/wgNgAxkACwAPABMAGwAfAAABNSM1IRUjFTMVITUhNSMVBSEVIQU1MxEhETMVBTUhFQEIiAKTiIT9dAG23/7aAyz81AJzUv2iUQG7/kUCILdCQrdDQ7e3m0KaWv6/AUFapWZmAAQANf+6A18DEgALAA8AEwAsAAABNSM1IRUjFTMVITUhNSMVBSEVIQUVFB4CFwcuAycOAwcnPgM9AQEIhwKRh4T9dAG23/7bAyr81gHAMFFuPSAzXlFAFBRAUl8zHz1tUzACD8BDQ8BCQsDAmkM+GCtMOygIQAgfLjskJDsuHwhACCg7TCsYAAADADX/tgMVAzYAAwAXAB0AAAEzESMDET4BNxcOAyMnMzI3ESM1IRUhET4BNxECw1JS4CZJIwVIl5SMPQlbDxBkAfz+tyVLJgM2/IAC3v5RAgYFPAwOBgJFAQG6QkL+RwECAgG0AAAAAAQARf+1AxUDNgADABQAGgAgAAABMxEjJxcOAyMnMxEjNSEVIxE2ARE+ATcRAzUhESM1AsNSUlkFRJCOhjoIcFgB4VhE/tskSSXaAlhSAzb94ZM9CwwGAkUBGEND/vMFAQj+6gECAgER/fxD/svyAAAEAEX/ygMqAzcAAwAUABoAIAAAAREjEQMXDgMjJzMRIzUhFSMRNgERPgE3EQMhFSERMwMVUlkFRJCOhjoIcFgB4VhE/tskSSV3Agr9pFIDN/1pApf+TDwLDAYCRAE1QkL+1gUBJf7NAQICAS79bEMBEwAAAAQARf/AAzgDNwADABcAHAAoAAABESMRAxcOAyMnMzI3NSM1IRUjFT4BJRU2NzUDIRUhNSE1ITUhFSEDFlJaBEOPjYc7CFQODlgB4VgiQv67SEp3Ahj9lwH2/gcCSv4KAzf+LgHS/qs8Cg0IA0QB8UFB5QIH3O8BBen9R0HgWkDXAAAAAAUARf/CAxUDNgADABQAGgAeACIAAAEzESMnFw4DIyczESM1IRUjETYlET4BNxEDESERJRUhNQLDUlJZBUSQjoY6CHBYAeFYRP7bJEklxgJE/gwBpAM2/fmJPAsNBgJFAQ9DQ/78Bf/+8wECAgEI/RIBPf7D/Lq6AAUARf/CAxUDNgADABQAGgAiACYAAAEzESMnFw4DIyczESM1IRUjFTYlET4BNxEBNTMRIREzFQU1IRUCw1JSWQVEkI6GOghwWAHhWET+2yRJJQEtUf2+UQGg/mADNv4Qfj0LDAYCRQEIQ0P9Bfj++gECAgEB/gNn/qMBXWezc3MABABF/7oDSAM2AAMAFwAdADQAAAERIxEDFw4DIyczMjcRIzUhFSMRPgEBET4BNxETFRQeAhcHLgEnDgMHJz4DPQEDFVJZBUSRjoY5CFMOD1gB4VgiQv67I0olhTBTbTwhZ6QqFEBRXjIhPG1SMQM2/acCWf50PAwOBgJFAQEUQ0P+9wIGAQH+7QECAgEO/mIRMFNCLgpAFGVPJ0EyJApACi5CUzARAAAABQBF/7cDGgM2AAMAFwAdADEAPQAAAREjEQMXDgMjJzMyNxEjNSEVIxE+ASURPgE3ERMyHgIVFA4CIyIuAjU0PgITMjY1NCYjIgYVFBYDFVJZBUSRjoY5CFMOD1gB4VgiQv67I0olVkZvTioqTm9GRm9OKipOb0ZndHRnZ3R0Azb92wIl/nk8DA4GAkQBARFCQv76Awb9/vABAwIBCv5XFio9Jyc8KhYWKjwnJz0qFv75MzAwNDQwMDMAAAAEADD/tgN7AzYABwAPACMANwAAARUjESMRMxEBFTMVITUzNRMyHgIVFA4CIyIuAjU0PgITMj4CNTQuAiMiDgIVFB4CA3uTUlL+fN397+IqMFA7ICA7UDAvUDogIDpQLx80JRUVJTQfHjQlFRUlNAHGRf41A4D+kAFmhUJChf7vHzdMLS5MNh4eNkwuLUw3H/6nFSQzHh4zJRUVJTMeHjMkFQAAAAUAOP+1A3IDPAAHAA8AIwAvADUAAAEVITUzNTMVBRUjFSMRMxUHFA4CIyIuAjU0PgIzMh4CBRQWMzI2NTQmIyIGAzUhESM1Akn9799SAgmFUlLWHzlPMDBOOR8fOU4wME85H/6hST8/Sko/P0kRAkZSAthCQmRkmUT1AjD3eiU7KhcXKjwlJTwqFxcrPCUtNTYtLTU2/qBD/uDdAAUAOP/KA3IDNgAHAA8AIwAvADUAAAEVITUzNTMVBTMVIxEjETMDFA4CIyIuAjU0PgIzMh4CBRQWMzI2NTQmIyIGExUhFSERAkn9799SAYSFhVJS1h85TzAwTjkfHzlOMDBPOR/+oUk/PUxMPT9JWQIE/aoCyUJCbW26Rf7MAqD+eSY+KxgYKz4mJj0rGBgrPSYwNzcwMDY2/uy+QwEBAAAFADj/wANyA0AABwAPAB8AKwA3AAABFSE1MzUzFQUzFSMVIxEzAxQGIyIuAjU0PgIzMhYFFBYzMjY1NCYjIgYTFSEVITUhNSE1IRUCSf3v31IBhIWFUlLWc2QwTzgfHzhPMGRz/qFJPz9KSj8/SU4CCP2oAeb+FwI6AuU/P1tbg0TUAfD+sUVOFCY3IiM2JhRORSosLCoqLCz+QFY/0U49xwAAAAYAOP/AA3IDQQAHAA8AIwAvAEMATwAAARchNTM1MxUFMxUjFSMRMwEiLgI1ND4CMzIeAhUUDgInIgYVFBYzMjY1NCYDFTI+AjcXDgIrATUzNSM1IRUXFTMVIREhFSMVMxUCSAH9799SAYSFhVJS/lMwTzgfHzhPMDFPOB8fOE8xP0lJPz9KSq0jOjY0HAghOz4iftHTASKC3v7SASPTyQLlPz9cXI9E0wH7/hQVJzgiIzcnFRUnNyMiOCcV7y8qKi8vKiov/hlZAQMGBTwGBwPQSz3CA1Y9AVg+TToAAAAABgA4/8IDcgM/AAcADwAjAC8AMwA3AAABFSE1MzUzFQUVIxUjETMVBxQOAiMiLgI1ND4CMzIeAgUUFjMyNjU0JiMiBhMRIRElFSE1Akn9799SAgmFUlLWHzlPMDBPOB8fOE8wME85H/6hST8/Sko/P0kCAjP+HQGSAthCQmdnkETpAhvufyQ7KhYWKjskJTsqFhYqOyUtNTUtLTU1/cwBJv7a5aOjAAAABgA4/8IDcgNAAAcADwAjAC8ANwA7AAABFSE1MzUzFQUVIxUjETMVBxQOAiMiLgI1ND4CMzIeAgUUFjMyNjU0JiMiBgE1MxEhETMVBTUhFQJJ/e/fUgIJhVJS1h85TzAwTzgfHzhPMDBPOR/+oUk/P0pKPz9JAeRR/cxRAZL+bgLbQkJlZYhF4AIJ5IEkOikWFik6JCQ5KRYWKTkkLTIyLS0yMv6oX/68AURfo2NjAAAFADj/ugNyAz0ABwAPACMALwBIAAABFSE1MzUzFQUzFSMRIxEzASIuAjU0PgIzMh4CFRQOAgMiBhUUFjMyNjU0JhMVFB4CFwcuAycOAwcnPgM9AQJJ/e/fUgGEhYVSUv5TME45Hx85TjAwTzkfHzlPMD9JST8/SkqIMVJtPB8yXlFAFBRBUV4xIDttUzEC0kJCa2ufRP7UAnT96BcqOyUlPCoXFyo8JSU7KhcBBDUuLTU1LS41/tIPLk4+Kgk/CSEuPSUlPS8gCT8JKj5OLg8ABgA4/7cDcgM/AAcADwAjAC8APwBLAAABFSE1MzUzFQUzFSMRIxEzAxQOAiMiLgI1ND4CMzIeAgUUFjMyNjU0JiMiBgEyHgIVFA4CIyImNTQ2FzI2NTQmIyIGFRQWAkn9799SAYSFhVJS1h85TzAwTzgfHzhPMDBPOR/+oUs9P0pKPz1LARxEbEspKUtsRIicnIhkb29kZG9vAtJCQm1tlET+/AJB/o4kOyoWFio7JCQ6KhYWKjokLTQ0LS0zM/77FSc6JSU5KBVRSkpR9y8tLS8vLS0vAAAABQA4/7QDcgM7AAcADwAjAC8AOQAAARUhNTM1MxUFFSMVIxEzEQEiLgI1ND4CMzIeAhUUDgIDIgYVFBYzMjY1NCYDNSERIzUFJyU1Akn9799SAgmEU1P+UjBOOR8fOU4wME85Hx85TzA/SUk/P0pK5AJTUv31CgIVAtBCQmtrnkTfAif+/P7vFyo7JSU8KhcXKjwlJTsqFwEFNi4tNjYtLjb+gEP+y2sZQRNMAAcAOP+2A3IDPgAHAA8AIwAvADcAQwBNAAABFSE1MzUzFQUzFSMVIxEzAxQOAiMiLgI1ND4CMzIeAgUUFjMyNjU0JiMiBgUVIRUhNSE1FzIWFRQGIyImNTQ2FzI1NCMiBhUUFgJI/fDfUgGEhYVSUtYfOFAwME84Hx84TzAwUDgf/qFJPz9KSj8/SQE5ASH9jwEQKHmBgXl5gIB5q6tSWFgC4z8/W1uCROUB/v69HzMkExMkMx8gMiQTEyQyICQrKyQkKyvGUz8/U7c6OTk4ODk5Oq06Ox4dHR0AAAAEADT/twMtAzgACwATACcANQAAATMRIxEjESMRMxEzARUzFSE1MzUXMh4CFRQOAiMiLgI1ND4CEzI2NTQuAiMiBhUUFgLeT09zTU1z/l22/kO2KSpGMx0dM0YqKkYzHR0zRio0QxIfLBo2QUMDOPx/AcP+aANB/poBYH9DQ3/+HjZLLS5LNh4eNksuLUs2Hv6rTTwdMiQUSzw8TQAFADD/tQMqAzcACwATACcAMwA5AAABMxEjNSMVIxEzFTMnFSE1MzUzFRMUDgIjIi4CNTQ+AjMyHgIFFBYzMjY1NCYjIgYTNSERIzUC209PcE1NcOP+OLxRlxwyRyoqRzMcHDNHKipHMhz+y0A2NkBANjZAMAJbUgM3/dLw6gIY65JBQWVl/vMkOikXFyk6JCQ6KRcXKTokLTQ0LS0zM/6jQv7i3AAAAAAFADD/ygNEAzYACwATACcAMwA5AAABESMRMxEzETMRIxEnFSE1MzUzFRMUDgIjIi4CNTQ+AjMyHgIFFBYzMjY1NCYjIgYTIRUhETMCak1NcU9P4/44vFGXHDNGKipHMxwcM0cqKkYzHP7LQDY2QEA2NkCUAhH9nVIB0P7XAn/+7QEj/V8BO/hBQWdn/uwlPCsXFys8JSU8KxgYKzwlLTc3LS43N/4rQwEHAAAABQAw/78DOAM2AAsAEwAnADMAOwAAARUjETMVMzUzESM1JxUhNTM1MxUTFA4CIyIuAjU0PgIzMh4CBRQWMzI2NTQmIyIGEyEVIREhFSECak1NcU9P4/44vFGXHDJHKipHMxwcM0cqKkcyHP7LQDY2QEA2NkCAAhn9lAJl/e4B+t8CDOr5/d/lzUFBaGj++SQ6KhYWKjokIzopFxcpOiMtNDQtLTMz/hRCATRDAAUAMP/AA0oDOQAHABMAJwAzAD8AAAEVITUzNTMVBRUjETMVMzUzESM1BRQOAiMiLgI1ND4CMzIeAgUUFjMyNjU0JiMiBhMhFSE1ITUhNSEVIQH4/ji8UQEtTU1xT0/++RwyRyoqRzMcHDNHKipHMhz+y0A2NkBANjZAjgId/ZIB/f4BAlD+AwLfPz9aWsfHAdfN2/4Tzy4hNiYVFSY2ISE2JhUVJjYhKC8vKCguLv3tP9FNPcYAAAAGADD/wgMqAzYACwATACcAMwA3ADsAAAEzESM1IxUjETMVMycVITUzNTMVExQOAiMiLgI1ND4CMzIeAgUUFjMyNjU0JiMiBhMRIRElFSE1AttPT3FNTXHj/ji8UZccMkcqKkczHBwzRyoqRzIc/stANjZAQDY2QD4CTf4DAawDNv3c7OUCD+aOQUFiYv74IjkoFhYoOSIjOSgWFig5IyoyMioqMzP90AEg/uDenJwAAAYAMP/CAyoDNgALABMAJwAzADsAPwAAATMRIzUjFSMRMxUzJxUhNTM1MxUXFA4CIyIuAjU0PgIzMh4CBRQWMzI2NTQmIyIGATUzESERMxUFNSEVAttPT3FNTXHj/ji8UZccMkcqKkczHBwzRyoqRzIc/stANjZAQDY2QAI5Uv2xUQGs/lQDNv335d4B9dN6QUFjY/4iNycVFSc3IiI3JxUVJzciKi4uKigwMP6tX/68AURfo2NjAAAFADD/ugNcAzYACwATACcAMwBMAAABFSMRMxUzNTMRIxEnFSE1MzUzFRMUDgIjIi4CNTQ+AjMyHgIFFBYzMjY1NCYjIgYFFRQeAhcHLgMnDgMHJz4DPQECak1NcU9P4/44vFGXHDJHKipHMxwcM0cqKkcyHP7LQDY2QEA2NkABijNVbzwdNGFUQhUVQlRhMx48b1UzAfjsAhvs+/2NATXPQUFoaP7xJDopFxcpOiQkOikXFyk6JCs1My0tNDT+FihJOScHPwceLTojIzotHgc/Byc5SSgWAAAFADD/uQNwAzYACwATACcAMwBZAAABFSMRMxUzNTMRIzUnFSE1MzUzFQMiLgI1ND4CMzIeAhUUDgInIgYVFBYzMjY1NCYBFRQeAhcHLgEnDgEHLgEnDgEHJz4DPQEzFRQWFz4DPQECak1NcU9P4/44vFEoKkczHBwzRyoqRzIcHDJHKjZAQDY2QEABcRgvQyomRVsXFFE/QlAUGVpCJipDLhlPPT8gLx8QAf3kAg/o9v3V8tNBQWJi/l8WKDkiIzkoFhYoOSMiOSgW9jMqKjIyKioz/swfIUA5LQ09F1U3NlsaGFk3NlMXPQ4vOT8fHx85biMTMTY3GR8AAAAGADD/twMvAzcACwATACcAMwA/AEsAAAEVIxEzFTM1MxEjEScVITUzNTMVExQOAiMiLgI1ND4CMzIeAgUUFjMyNjU0JiMiBgUyFhUUBiMiJjU0NhcyNjU0JiMiBhUUFgJpTk5yT0/j/ji8UZccMkcqKkczHBwzRyoqRzIc/stANjZAQDY2QAFkjKCgjIygoIxnc3NnZ3R0AgDhAgbi9P3IAQHMQUFkZP73IzkoFhYoOSMjOCgWFig4IyozMyoqMjL9UktLUVFLS1L6MC0tMTEtLTAAAAcAMP+pAzUDNgALABMAJwAzADsARwBTAAABFSMRMxUzNTMRIzUnFSE1MzUzFRcUDgIjIi4CNTQ+AjMyHgIFFBYzMjY1NCYjIgYBIRUhNSE1MwcyFhUUBiMiJjU0NhcyNjU0JiMiBhUUFgJsT09vT0/j/ji8UZccMkcqK0YzHBwzRisqRzIc/stANjZAQDY2QAGAARb9gAEYUil5hIR5eYaGeU9ZWU9RWFgCK8kBxLbG/gXwtD8/V1fsHzMkExMkMx8gMiQTEyQyICMsLCMkLCz+6kBAT7Q+PDw9PTw8ProgICAhISAgIAAEADD/tgN2AzYACwATACcAOwAAASMVMxUjESMRMxUzJRUzFSE1MzUTMh4CFRQOAiMiLgI1ND4CEzI+AjU0LgIjIg4CFRQeAgN2jo6OUlKO/e7d/e/iKjBQOyAgO1AwL1A6ICA6UC8fNCUVFSU0Hx40JRUVJTQCDctF/rkDgOTahUJChf7vHjdMLS5MNx4eN0wuLUw3Hv6nFSUzHh4zJBUVJDMeHjMlFQAFADj/zgNxAzcACwATACcAMwA5AAABIxUzFSMVIxEzFTMlFSE1MzUzFRMUDgIjIi4CNTQ+AjMyHgIFFBYzMjY1NCYjIgYTFSEVITUDcYWFhVJShf7Y/e/fUq4fOU8wME45Hx85TjAwTzkf/qFLPT1MTD09S1MCCv2kAkCcRcQCnLI/QkJvb/7iJj4sGBgsPiYmPywYGCw/JjA4ODAwOjr+5apD7QAAAAAFADj/vANyAzsABwATACcAMwBMAAABFSE1MzUzFQUjFTMVIxUjETMVMwEiLgI1ND4CMzIeAhUUDgIDIgYVFBYzMjY1NCYTFRQeAhcHLgMnDgMHJz4DPQECSP3w31ICCYWFhVJShf3OME45Hx85TjAwTzkfHzlPMD9JST8/SkqHMFFtPR4zX1FAFBRAUl8yHj1sUTACz0JCbGx1nESmAmOZ/nsXKzwlJTwqFxcqPCUlPCsXAQc2Li03Ny0uNv7THCtJOCYIQQgeKzkjIzkrHghBCCY5SSocAAAGADj/twNwAz8ABwATACcAMwBDAE8AAAEVITUzNTMVBSMVMxUjFSMRMxUzBRQOAiMiLgI1ND4CMzIeAgUUFjMyNjU0JiMiBgEyHgIVFA4CIyImNTQ2FzI2NTQmIyIGFRQWAkn9799SAgeDg4NSUoP+px85TzAwTzgfHzhPMDBPOR/+oUk/P0pKPz9JARxEbEspKUtsRIicnIhkb29kZG9vAtJCQm1teXxEowJBm9ckOyoWFio7JCQ6KhYWKjokLTQ0LS0zM/77FSc6JSU5KBVRSkpR9y8tLS8vLS0vAAAAAAQANP+2AxgDNgAHAA8AIwA3AAABMxEjESM1MycVITUzNTMVBzIeAhUUDgIjIi4CNTQ+AhMyPgI1NC4CIyIOAhUUHgICxlJSk5OA/e7hUiktTTggIDhNLS5NOCAgOE0uHDEkFRUkMRwcMiQVFSQyAzb8gAHGQ+hDQ4WFjB82TC0uTDceHjdMLi1MNh/+qBQlMx4eMiQUFCQyHh4zJRQAAAAFADb/tgMYAz8ABwAPACMALwA1AAABFSE1MzUzFSUzESM1IzUzBxQOAiMiLgI1ND4CMzIeAgUUFjMyNjU0JiMiBhM1IREjNQI+/fjbUgFiU1OYmLwfN0wtLkw3Hx83TC4tTDcf/q9JOTlJSTk5SQgCWFMC20JCZGRb/czXQ1klPCsYGCs8JSU9KxgYKz0lLTg4LS05Of6dQv7n1wAFADb/ygMtAzcABwAPACMALwA1AAABFSE1MzUzFRczETMRIxEjBxQOAiMiLgI1ND4CMzIeAgUUFjMyNjU0JiMiBhMhFSERMwI+/fjbUsqYU1OYJB83TC0tTTcfHzdNLS1MNx/+r0k5OUlJOTlJcQIE/apSAslCQm5uxwE0/VwBLA8lPiwYGCw+JSU9LBgYLD0lMDc3MC44OP4wQwECAAAABQA2/8ADMQNBAAcADwAjAC8AOwAAARUhNTM1MxUXMzUzESM1IwcUDgIjIi4CNTQ+AjMyHgIFFBYzMjY1NCYjIgYTIRUhNSE1ITUhFSECPv3421LImlJSmiIfN0wtLkw3Hx83TC4tTDcf/q9IOjlJSTk6SHACCf2mAe/+DwJC/hEC5z8/Wlqi8f4RvRohNycVFSc3ISE2JxYWJzYhJzAwJycwMP3tPtFNPcYAAAcANv/AAxcDQgAHAA8AIwAvAEMARwBLAAABFSE1MzUzFSUzESM1IzUzJTIeAhUUDgIjIi4CNTQ+AhcyNjU0JiMiBhUUFgMVMj4CNxcOAisBNTM1IzUhFRcRIREDFTM1Aj39+dtSAWJSUpub/nUtTDcfHzdMLS5MNx8fN0wuOUlJOTlJSQ8kOzYzGwggOj4jf9DTASI2AR/XjwLkPz9eXlL+CMFBOBUnNyIiNycVFSc3IiI3JxXtMScnMTEnJzH+y1kBBAYFPQYHA9FMPcSWAVr+pgEc3t4AAAgANv+sAz4DPgAHAA8AIwAvADcATABYAGQAAAEXITUzNTMVFzM1MxEjNSMHIi4CNTQ+AjMyHgIVFA4CJyIGFRQWMzI2NTQmATMVITUzNTMFFTI+AjcXDgMrATUzNSM1IRU3MhYVFAYjIiY1NDYXMjY1NCYjIgYVFBYCPQH9+NtSx5xSUpzwLkw3Hx83TC4tTDcfHzdMLTlJSTk5SUkBN5T+jY9Q/jUmPTYzHAgfOj9ILjDS1AEi0EJXV0JDV1dDJi0tJiYuLgLdPz9hYaX+/hCwsRYoOCIjOCgWFig4IyI4KBb1MyoqMjIqKjP+rT09UO9QAgQGBT4GBwMByU09xUE7NDM7OzM0O6YdGhoeHhoaHQAAAAYANv/CAxgDQAAHAA8AIwAvADMANwAAARUhNTM1MxUlMxEjNSM1MwcUDgIjIi4CNTQ+AjMyHgIFFBYzMjY1NCYjIgYTESERJRUhNQI+/fjbUgFiU1OVlbwfN0wtLkw3Hx83TC4tTDcf/q9JOTlJSTk5SRkCR/4JAacC2UJCZ2dd/eLLQ10kOykXFyk7JCQ7KhcXKjskLTU1LS01Nf3MASb+2uWjowAAAAYANv/CAxgDQAAHAA8AIwAvADcAOwAAARUhNTM1MxUlMxEjNSM1MwcUDgIjIi4CNTQ+AjMyHgIFFBYzMjY1NCYjIgYBNTMRIREzFQU1IRUCPv3421IBYlNTlZW8HzdMLS5MNx8fN0wuLUw3H/6uSTo5SUk5OkkCEFH9u1EBo/5dAt1CQmNjWf33t0NVIzopFxcpOiMjOikWFik6Iys1NSsrNDT+qWD+vAFEYKJiYgAABQA2/7kDTgM+AAcADwAjAC8ASAAAARUhNTM1MxUXMxEzESMRIwcUDgIjIi4CNTQ+AjMyHgIFFBYzMjY1NCYjIgYFFRQeAhcHLgMnDgMHJz4DPQECPv3421LNlVNTlScfN0wtLkw3Hx83TC4tTDcf/q9JOTlJSTk5SQFpMVJuPB8zYFFAFBdGU1stIDxtUzIC1UJCaWm/ASD9igETFCU+LRgYLT4lJj0sGBgsPSYwOjowLTw79wouUD8sCUEJIjE/JilBMB8IQQosP1AtCgAAAAYANv+3AxwDPwAHAA8AIwAvAD0ASQAAARUhNTM1MxUXMxEzESM1IwcUDgIjIi4CNTQ+AjMyHgIFFBYzMjY1NCYjIgYFMhYVFAYjIi4CNTQ2FzI2NTQmIyIGFRQWAj79+NtSzZVTU5UnHzdMLS5MNx8fN0wuLUw3H/6vSTk5SUk5OUkBOoufn4tFb04poItkcXFkZHJyAtJBQW1tuAEd/cXbFyQ8KhgYKjwkJDwrGBgrPCQtNzctLTg4/VJLSlIVKDolS1L6MC0tMDAtLTAAAAAFADb/tQMYAzwABwAPACMALwA5AAABFSE1MzUzFSUzESM1IzUzBxQOAiMiLgI1ND4CMzIeAgUUFjMyNjU0JiMiBgM1IREjNQUnJTUCPv3421IBY1JSlpa9HzdMLS5MNx8fN0wuLUw3H/6vSTk5SUk5OUkEAmRS/eYLAiUC00JCaWlj/dnNQ1wkPCsYGCs8JCU9KxgYKz0lLTg4LS06Ov63Qv7MbBpBFEsAAAAABQA2/78DMQM+AAcADwAjAC8AOwAAARUhNTM1MxUXMzUzESM1IwcUDgIjIi4CNTQ+AjMyHgIFFBYzMjY1NCYjIgYTIRUhESEVIRUhFSECPf3521LHnFJSnCEfN0wtLkw3Hx83TC4tTDcf/q9IOjlJSTk6SGMCFv2YAlj9+gH7/gUC3j8/YGCj+/4RshoiNygWFig3IiI4JxYWJzgiKjExKioxMf30PgFdPVI8AAcANv+2AysDPQAHAA8AIwAvADcAQwBLAAABFSE1MzUzFRczNTMRIzUjBxQOAiMiLgI1ND4CMzIeAgUUFjMyNjU0JiMiBgEhFSE1ITUzBzIWFRQGIyImNTQ2FzI1NCMiFRQCPv3421LHm1NTmyEeN0wtLk03Hx83TS4tTDce/q9HPDlISDk8RwFkAQ/9jwEQUil5gYF5eYGBeaurqwLmPz9XV6X1/gPGDiA1JRUVJTUgIDUlFBQlNSAmLi4mJi4u/ug/P1S3Ojk5Ojo5OTquOzs7OwAABQA0/7YDLwM3AAMACwATACcAMwAAATMRIwMRMxEjESM1NxUhNTM1MxUHMh4CFRQOAiMiLgI1ND4CEzI2NTQmIyIGFRQWAuFOTqlOTmMY/kezUSgpRDIcHDJEKSlFMhwcMkUpM0BAMzNBQQM3/H8CJgFH/MABtUTBQkKDg38eNkwtLUw2Hh42TC0tTDYe/qtMPDxMTDs8TQAGADD/tQMqAzYAAwALABMAJwAzADkAAAEzESMDFSE1MzUzFRczNTMRIzUjBxQOAiMiLgI1ND4CMzIeAgUUFjMyNjU0JiMiBhM1IREjNQLbT0/u/kO2UZ1jTk5jDBsyQykpRDIbGzJEKSlDMhv+1T8zMz4+MzM/MgJbUgM2/dEBx0FBZWWc+f3j4C4kOioXFyo6JCQ6KRcXKTokLTQ0LS0zM/6kQv7i3AAGADD/ygNEAzYAAwALABMAJwAzADkAAAERIxEPASE1MzUzFRczETMRIxEjBxQOAiMiLgI1ND4CMzIeAgUUFjMyNjU0JiMiBhMhFSERMwMqT+4B/kS2UZ9hTk5hDhsyQykpRDIbGzJEKSlDMhv+1T8zMz4+MzM/lgIR/Z1SAzb9VQKrbkFBZ2erAQr9dwE8JyU8KxgYKzwlJT0rGBgrPSUuNzcuLjc3/ixDAQAABgAw/8ADSgM5AAcACwATACcAMwA/AAABFSE1MzUzFSURIxEFMzUzESM1IwcUDgIjIi4CNTQ+AjMyHgIFFBYzMjY1NCYjIgYTIRUhNSE1ITUhFSEB7P5EtlEB80/++2NOTmMOGzFEKSlFMRsbMUUpKUQxG/7VPzMzPj4zMz+QAh39kgH9/gECUP4DAt8/P1paV/4LAfXr3f4fwiIhNycVFSc3ISI3JxUVJzciKi8vKiovL/3tPs5OPcYAAAAHADD/wgMqAzYAAwALABMAJwAzADcAOwAAATMRIwMHITUzNTMVFzM1MxEjNSMHFA4CIyIuAjU0PgIzMh4CBRQWMzI2NTQmIyIGExEhESUVITUC209P7gH+RLZRnWNOTmMMGzJDKSlEMhsbMkQpKUMyG/7VPzMzPj4zMz9BAkz+BAGrAzb93QG7QUFjY5v4/e3XLCQ7KRcXKTskJDopFxcpOiQtNDQtKzU1/dQBHf7j3JqaAAAHADD/wgMqAzYAAwALABMAJwAzADsAPwAAATMRIwMVITUzNTMVFzM1MxEjNSMHFA4CIyIuAjU0PgIzMh4CBRQWMzI2NTQmIyIGATUzESERMxUFNSEVAttPT+7+Q7ZRo11OTl0SGzJDKSlEMhsbMkQpKUMyG/7VPzMzPj4zMz8CPFH9s1IBqv5WAzb99QGmQUFgYJfy/gjDJCI4JxYWJzgiIjgnFhYnOCIqMTEqKjAw/qle/r4BQl6jY2MAAAYAMP+5A1sDNgADAAsAEwAnADMATAAAAREjEQcVITUzNTMVFzMRMxEjNSMHFA4CIyIuAjU0PgIzMh4CBRQWMzI2NTQmIyIGBRUUHgIXBy4DJw4DByc+Az0BAypP7v5DtlGeYk5OYg0bMkMpKUQyGxsyRCkpQzIb/tU/MzM+PjMzPwGLM1ZuPBw0YVRCFRVCVGE0HTxvVTMDNv2LAnVvQUFoaKUBB/3d2CglPCsXFys8JSQ8KxcXKzwkLTc2Li02NvwWKEk5JwdABx4tOyMjOy0eB0AHJzlJKBYAAAAHADD/twMvAzcAAwALABMAJwAzAD8ASwAAAREjEQcVITUzNTMVFzM1MxEjNSMHFA4CIyIuAjU0PgIzMh4CBRQWMzI2NTQmIyIGBTIWFRQGIyImNTQ2FzI2NTQmIyIGFRQWAypP7v5DtlGdY05OYwwbMkMpKUQyGxsyRCkpQzIb/tU/MzM+PjMzPwFmjKCgjIygoIxnc3NnanBwAzf9xQI7a0FBZWWd+/3u1CwkOikXFyk6JCM6KRcXKTojLTQ0LS0zM/9RS0pRUUpLUfkwLS0wMC0tMAAAAAAIADD/qQM1AzgABwALABMAJwAzADsARwBTAAABFSE1MzUzFSURIxEFMzUzESM1IwcUDgIjIi4CNTQ+AjMyHgIFFBYzMjY1NCYjIgYBIRUhNSE1MwcyFhUUBiMiJjU0NhcyNjU0JiMiBhUUFgHt/kO2UQHzT/78VE5OVA8bMUQpKUUxGxsxRSkpRDEb/tU/MzM+PjMzPwGCARb9gAEYUip5hYV5eYWFeVFYWFFRV1cC4z8/VVVU/foCBt/P/ji4JSA1JRQUJTUgIDQmFBQmNCAmLCwmJS0t/uc/P1C1PTw6PT06PD24IB8gICAgHyAAAAAEADT/tgMYAzYACwATACcAOwAAATMRIxEjNTM1IzUzJxUhNTM1MxUHMh4CFRQOAiMiLgI1ND4CEzI+AjU0LgIjIg4CFRQeAgLGUlKTk5WVhP3y4VIpLU04Hx84TS0tTTgfHzhNLR0xJBQUJDEdHTEkFBQkMQM2/IABNUObRJpCQoaGjB43TC0tTDcfHzdMLS1MNx7+qBQlMx4eMiQUFCQyHh4zJRQAAAAFADf/tgMYAz8ABwATACcAMwA5AAABFSE1MzUzFSUzESM1IzUzNSM1MwcUDgIjIi4CNTQ+AjMyHgIFFBYzMjY1NCYjIgYTNSERIzUCLf4K1lIBZlNTmZmYmMUeNkssLEs2Hh42SywsSzYe/rdFOTlFRTk5RQoCV1MC20JCZGRb/cdzQmZDmyU+LRgYLT4lJj0tGBgtPSYwODgwMDg4/phC/uzSAAUAN//KAy0DNwAHABMAJwAzADkAAAEVITUzNTMVFzM1MxEjNSM1MzUjBxQOAiMiLgI1ND4CMzIeAgUUFjMyNjU0JiMiBhMhFSE1MwIt/grWUs6YU1OYmJgtHjZKLS1KNh4eNkotLUo2Hv64RDk5REQ5OURxAgT9qlICyUJCbm6B7v1VvkN5Wic/LRkZLT8nJj8tGBgtPyYwPDwwMDo6/jJD+wAABQA3/8ADMQNBAAcAEwAnADMAPwAAARUhNTM1MxUBNSM1MzUzESM1IzUnFA4CIyIuAjU0PgIzMh4CBRQWMzI2NTQmIyIGEyEVITUhNSE1IRUhAi3+CtZSAWaXl1JSmC0eNUstLUs1Hh41Sy0tSzUe/rhEOTlERDk5RHACCf2mAe/+DwJC/hEC5z8/Wlr+615Bxf4NTkETIjknFhYnOSIjOSgVFSg5IyoyMioqMjL97z7PSz3DAAAAAAYAN//CAxgDQAAHABMAJwAzADcAOwAAARUhNTM1MxUlMxEjNSM1MzUjNTMHFA4CIyIuAjU0PgIzMh4CBRQWMzI2NTQmIyIGExEhESUVITUCLf4K1lIBZlNTmJiXl8UeNkotLUs1Hh41Sy0tSjYe/rdFOTlFRTk5RRoCR/4JAacC2UJCZ2dd/d1dQ2lCmSU9KxcXKz0lJjwrFxcrPCYwNzcwMDY2/c0BIP7g352dAAAABgA3/8IDGANAAAcAEwAnADMAOwA/AAABFSE1MzUzFSUzESM1IzUzNSM1MwcUDgIjIi4CNTQ+AjMyHgIFFBYzMjY1NCYjIgYBNTMRIREzFQU1IRUCLf4K1lIBZlNTmJiXl8UeNkotLUs1Hh41Sy0tSjYe/rdFOTlFRTk5RQIQUf27UQGj/l0C3UJCY2NZ/e9PQ2xCmCQ8KhcXKjwkJDwqFxcqPCQtNjYtLTY2/qdc/sUBO1yeX18AAAUAN/+5A1EDPgAHABMAJwAzAEwAAAEVITUzNTMVATUjNTM1MxEjNSM1JxQOAiMiLgI1ND4CMzIeAgUUFjMyNjU0JiMiBgEVFB4CFwcuAycOAwcnPgM9AQIt/grWUgFml5dTU5gtHjZLLC1KNh4eNkotLEs2Hv64RDk5REQ5OUQBaTFUbj0fM2BTQRQUQVNgMx48bVQyAtVCQmlp/s5vQ+H9fa5CGCdALRgYLUAnJz8tGBgtPycwPT0wMTs7/wALLU08KQlACSEvPSUlPTAhCEAJKjxNLAsAAAUAN/+6A2oDQAAHABMAJwAzAFkAAAEVITUzNTMVATUjNTM1MxEjNSM1JTQ+AjMyHgIVFA4CIyIuAiU0JiMiBhUUFjMyNgUVFB4CFwcuAScOAQcuAScOAQcnPgM9ATMVFBYXPgM9AQIt/grWUgFnmJhSUpn+PR41Si0tSzYeHjZLLS1KNR4BSUY5OUREOTlGAQQYLkIrJ0JcFxRSP0JQFBhbQCcqQi8ZTzw/IC8gEALZQkJnZ/7ZakPX/clxQhMmPSsYGCs9JiU9KxcXKz0lMDg4MC44OKscIEA5LA09F1Y2NlsZGFk2NFUXPQ4uOT8eHBw5bSITMTU3GBwAAAYAN/+3AxwDPwAHABMAJwAzAD8ASwAAARUhNTM1MxUBNSM1MzUzESM1IzUnFA4CIyIuAjU0PgIzMh4CBRQWMzI2NTQmIyIGATIWFRQGIyImNTQ2FzI2NTQmIyIGFRQWAi3+CtZSAWaXl1NTmC0eNkotLUs1Hh41Sy0tSjYe/rdFOTlFRTk5RQE7i5+fi4+cnI9kcXFkZHJyAtRCQmtr/t1sQtj9vXpDDSY+KxgYKz4mJj0rGBgrPSYwODgwMDc3/vtPSklQUElLTvMvKy0tLS0rLwAABAA0/7YDLwM3AAMAIwArADcAAAEzESMDETMRIxEjDgEjIi4CNTQ+AjMyHgIdARQHMzUjNTcVITUzNTMVAzI2NTQmIyIGFRQWAuFOTqZOTn8UXDwpRTIcHDJFKSlEMhwBcXwv/kazUSgzQEAzM0FBAzf8fwJRARz8vwEWOUAeN0wuL0w3Hh43TC8KCQGLQpZCQoOD/ihNPD1NTT08TQAAAAUAMP/KA0QDNgADAAsAKwA3AD0AAAERIxEHFSE1MzUzFQEjDgEjIi4CNTQ+AjMyHgIdARQHMzUjNTM1MxEjARQWMzI2NTQmIyIGEyEVITUzAypP7v5DtlEBAYgXUTQnRjQeGzFFKSlEMRsBcXl5Tk7+ZT40Mz4+MzQ+lgIR/Z1SAzb9TwKxbkFBZ2f+jCYpFSs/Kic+LRgYLT4nCwoCZkPn/XEBFjA5OTAwOTn+L0P4AAAAAAUAMP/AA0oDOQAHAAsAKwA3AEMAAAEVITUzNTMVJREjEQMjDgEHIi4CNTQ+AjMyHgIVFAYHMzUjNTM1MxEjJRQWMzI2NTQmIyIGEyEVITUhNSE1IRUhAe3+Q7ZRAfNPo4oYUTYqRDEbGzFEKilEMRsBAXJ6ek5O/mQ/NDM/PzM0P5ECHf2SAf3+AQJQ/gMC4UBAWFhV/gYB+v5ZICQBFig5IiI4JxYWJzgiBQwFXz7D/hWhKjIyKioxMf3xPsxKPcEAAAAGADD/wgMqAzYAAwALACsANwA/AEMAAAEzESMDFSE1MzUzFQEjDgEjIi4CNTQ+AjMyHgIdARQHMzUjNTM1MxEjJRQWMzI2NTQmIyIGATUzESERMxUFNSEVAttPT+7+Q7ZRAQGJF1M2KkQxGxsxRCopRDEbAXF8fE5O/mQ/NDM/PzM0PwI9Uf2zUgGq/lYDNv3yAapBQWBg/qghJRYoOSMjOSkWFik5IwoJAVxA1v4EniozMyorMzP+qlv+xAE8W59fXwAAAwA1AB8DYgMpAAcAHgAqAAABFSE1ITUzFREhFSE1ITUuATU0PgIzMh4CFRQGBycUFjMyNjU0JiMiBgM1/SgBRVIBbvzTAW15hSlNbURDbEwphXb9cGRhcHBhZHACtENDdXX9rkNDfgdYSyk/KxcXKz8pS1cIqjM4ODMzNzcAAAAEADX/tgNfA0QABwAaACYALAAAARUhNSE1MxURIRUhNSE1LgE1NDYzMhYVFAYHJxQWMzI2NTQmIyIGAzUhFSM1AzH9LgFDUgFr/NYBbXmAk4+NlIJ292pkZGhoZGRqcQJpUgLpPz9bW/5QQUFJBUE8QENDQDxBBYIjJSUjIyUl/klA+roAAAAABAA1/8oDXwNBAAcAGgAmACwAAAEVITUhNTMVESEVITUhNS4BNTQ2MzIWFRQGBycUFjMyNjU0JiMiBgMVIRUhNQMw/S8BQ1IBa/zWAW15gJSOjJWCdvhrZGRqamRkaw0CF/2XAuQ/P11d/kFBQUgFRD9CRkZCP0QFiCUnJyUlJyf+j55B3wAAAAQANf/AA18DRwAHABcAHwArAAABFSE1ITUzFREhFSE1ITUmNTQhIBUUBgcnFDMyNTQjIgMVIRUhNSE1ITUhFQMx/S0BRFIBa/zWAW35ASIBIX959s3Ly80TAij9hgIM/fECYgL4PT1PT/57PT09CGx0dDc5BHQ9PT395Eg9vkM7twAAAAUANf/AA18DRQAHABcAIQA2AEIAAAEVITUhNTMVESEVITUhNSY1NCEgFRQGBycUMzI2NTQmIyIDFTI+AjcXDgMrATUzNSM1IRUXFTMVIREhFSMVMxUDMP0vAUNSAWv81gFt+QEiASF/efbNZGdnZM0hJTw1MhsHIDk9Ri0uy80BGo/X/toBHc7DAvQ9PVFR/ng9PTwIbHZ2NjoEdD0fHh4g/exMAQMFBTkFBgMBvEQ4sgJJOwE4OUQ3AAAABQA1/8IDXwNDAAcAGgAmACoALgAAARUhNSE1MxURIRUhNSE1LgE1NDYzMhYVFAYHJxQWMzI2NTQmIyIGAzUhFSUVITUDMf0uAUNSAWv81gFteYCTj46Tf3n1aGRhaWlhZGhmAmT97AHEAu1AQFZW/ltBQUQFQDo/QEA/OkAFfyIkJCIhJCT9lv//wYODAAAABQA1/8IDXwNEAAcAGgAkACwAMAAAARUhNSE1MxURIRUhNSE1LgE1NDYzMhYVFAYHJxQWMzI1NCMiBgE1MxEhETMVBTUhFQMx/S0BRFIBa/zWAW15gJKQj5J/efRnZMrKZGcBp1L9olEBu/5FAu8/P1VV/mRBQUQFPDo9Pz89OT0FeyEiQ0Ii/mNQ/t0BI1CVWFgAAAQANf+5A18DQgAHABoAJgA/AAABFSE1ITUzFREhFSE1ITUuATU0NjMyFhUUBgcnFBYzMjY1NCYjIgYTFRQeAhcHLgMnDgMHJz4DPQEDMP0vAUNSAWv81gFteYCTj46Tf3n1aGRhaWlhZGj1MFNvPho0YVRBFRVCVGE0Gz5vUzEC6T8/WVn+VkFBQQVAPEJBQUI8QAWBIiUlIiMlJf6rHCc/Lx8GQAYaJjIfHzImGgY/Bh8wQCYcAAAFADX/twNfA0MABwAaACYAMgA+AAABFSE1ITUzFREhFSE1ITUuATU0NjMyFhUUBgcnFBYzMjY1NCYjIgYTMhYVFAYjIiY1NDYXMjY1NCYjIgYVFBYDMf0uAUNSAWv81gFteYCTj46Tf3n1aGRhaWlhZGjMlZ2dlZednZdtcXFtbXNzAutAQFhY/ldBQUYFQDpAQUFAOkAFfyIkJCIiJCT+oEVFQ0VFQ0VF1SYlJicnJiUmAAAEADX/vwNfA0YABwAXACEALQAAARUhNSE1MxURIRUhNSE1JjU0ISAVFAYHJxQzMjY1NCYjIgMVIRUhESEVIRUhFQMw/S4BRFIBa/zWAW35ASIBIX959s1kZ2dkzRICHv2QAmb97AH/AvU9PVFR/nc+PjsIb3d3OToEdz8fIB8g/eRHOwE2OkQ2AAAAAAQAK/+2A3QDNwAHAA8ALgA6AAABFSMRIxEzEQMVITUzNTMVERU+ATcXDgMjJzI2NzUuATU0PgIzMh4CFRQGJxQWMzI2NTQmIyIGA3SMUlKW/ejkUj16OgVIlZCIOws2e0JOXR84Ti8vTjgfXf1KPDxKSjw8SgG6Rf5BA4H+gwEQQUFsbP5AXwMKCT0NDwcBRQECYgpXQyY9LBcXLD0mQ1eaMDY2MDA3NwAAAAAFADH/tgNwAz0ABwAPACoANgA8AAABFSE1MzUzFQUVIxEjETMRBxcOAyMnMjY3NS4BNTQ2MzIWFRQGBxU+ASUUFjMyNjU0JiMiBgM1IRUjNQJK/f3ZUgH+hFJShwZIlZGIOwk2d0JOW3FhXnNaTj94/pxHPTxHRzw9RycCTlIC5T4+WFi+RP76Aln+8dI7DQ4HAUIBAkEIQzk/RkY/N0UIPgMKtSMqKiMjKSn+S0H6uQAAAAAFADH/ygNwAzoABwAPAC4AOgBAAAABFSE1MzUzFQUzFSMRIxEzAxcOAyMnMjY3NS4BNTQ+AjMyHgIVFAYHFT4BJRQWMzI2NTQmIyIGExUhFSE1Akr9/dlSAXqEhFJShwZHlZKIOwk2d0JOWx43Ti8vTTceWk4/ev6aRz08R0c8PUdCAgX9qQLfPT1bW+FE/r8Cvv4LOw0QCAJCAgJECEc6IDMjExMjMyA6RwhAAwu7JioqJiQrK/6QmkPdAAUAMf/AA3ADQAAHAA8AKgA2AEIAAAEVITUzNTMVBTMVIxUjETMDFw4DIycyNjc1LgE1NDYzMhYVFAYHFT4BJRQWMzI2NTQmIyIGExUhFSE1ITUhNSEVAkr9/dlSAXqEhFJShwVIlJGIOwk2d0JOW3FhYXBaTj96/ppHPTxHRzw9RzUCFP2cAfH+DAJFAvM7O01NoUXoAhL+WzUNDgcBPQECNwY8Mzk9PTkzOwc0AwqcHiMjHh4iIv4DTDu+Rjq3AAYAMf/CA28DPAAHAA8AKgA2AD4AQgAAARUhNTM1MxUFFSMVIxEzFQcXDgMjJzI2NzUuATU0NjMyFhUUBgcVPgElFBYzMjY1NCYjIgYBNTMRIREzFQU1IRUCSv392VIB/X9TU4sFR5SRiDwJNnlATltxYV5zWk4/ev6aRz08R0c8PUcB2VL9wVIBm/5lAvQ7O0hIrEToAhvvwzgMDQcBPgECQAY9MzlAQDkzPAc9AwqmHyIiHx8jI/5eWf7JATdZnFxcAAAFADH/uQNwAz0ABwAPACwAOABRAAABFSE1MzUzFQUzFSMRIxEzAxcOAyMnMjY3NS4BNTQ2MzIeAhUUBgcVPgElFBYzMjY1NCYjIgYBFRQeAhcHLgMnDgMHJz4DPQECSv392VIBeoSEUlKIB0iVkYg7CTZ3Qk5bcmAvTTceWk4/ev6aRz08R0c8PUcBOi9RbT4bM2BRQRQUQVFfMxw+bFEvAug9PVVVy0X+ywKT/iA6DQ8IAkIBAkgIQjY9RhIiMR42QghEAwu2IicnIiIoKP6qCylFNSMHPgcbKDYhITYoGwc+ByQ1RSgLAAAAAAUAMf+mA3EDOwAHAA8AKgA2AFYAAAEVITUzNTMVBTMVIxUjETMDFw4DIycyNjc1LgE1NDYzMhYVFAYHFT4BJRQWMzI2NTQmIyIGARUUFhcHLgEnDgEHLgEnDgEHJz4BPQEzFRQWFz4BPQECSv392VIBfYKCU1OKBkeVkYk7CTZ5QE5bcWFec1pOP3r+mkc9PEdHPD1HAd9cWChCWhgVUD8/UhQZWkAoVV9OPj89QALiPT1ZWcxE3gJD/iQ7DQ8HAUIBAj0IQjk/RkY/N0QIOgQKryMpKSMjKSn+pxVCbhk+FE4zM1QXF1IzM0wUPhpuQRUVNmogIWk2FQAAAAYAMf+3A3ADPgAHAA8AKgA2AEIATgAAARUhNTM1MxUFMxUjESMRMwMXDgMjJzI2NzUuATU0NjMyFhUUBgcVPgElFBYzMjY1NCYjIgYBMhYVFAYjIiY1NDYXMjY1NCYjIgYVFBYCSv392VIBeoSEUlKHBUiUkYg7CTZ3Qk5bcWFec1pOP3r+mkc9PEdHPD1HAQiPl5ePj5eXj2dsbGdnbGwC6T09VVXBRP7yAmD+JjkNDwcBQAICRwdANjxEQz02PwhEBAqzISYmISEnJ/6jR0NDR0dDQ0fXKCUmJycmJSgABAAs/7YDJwM3AAsAEwAyAD4AAAEzESMRIxEjETMRMwMVITUzNTMVERU+ATcXDgMjJzI2NzUuATU0PgIzMh4CFRQGJxQWMzI2NTQmIyIGAtlOTmtOTmvj/j+6TzFeKwU3e3hwLQoqYjdFUx0zRyoqRzMcVONBNjZBQTY2QQM3/H8Bw/5tAz3+mQEIQkJjY/5dawMHBzwLDQYCRQECbgtSPyQ7KRcXKTskP1OSKzU1Ky00NAAABQAw/7YDKAM2AAsAEwAwADwAQgAAATMRIxEjFSMRMxEzJxUhNTM1MxUTFw4DIycyNjc1LgE1ND4CMzIWFRQGBxU+ASUUFjMyNjU0JiMiBhM1IRUjNQLaTk5oTU1o5v5PsU+5BTd7eHAsCypjN0JOGzBEKFVjTkIwX/7cOjMzPDwzMzoOAmxSAzb9qwEB+gJA/v26PT1UVP53OAsMBgJAAQJBCUE2HTAhEkQ8NkIIPgMHtCInJyIgJyf+UUH/vgAABQAw/8oDQQM2AAsAEwAzAD8ARQAAAREjETMRMxEzESMRAxUhNTM1MxUTFw4DIyczMjY3NS4BNTQ+AjMyHgIVFAYHFT4BJRQWMzI2NTQmIyIGEyEVITUzAnJNTWhOTub+T7FPuQU3e3hwLAtbGTQcQk4bMEQoKUQwG05CMF/+3DozMzw8MzM6dgId/ZFSAcD+2gKN/twBM/1LAT8BGT4+V1f+bjcLDAYCQAEBQQhENh4xIhMTIjEeNkQIPQIItSIoKCIiKCj99UPrAAAABQAw/7kDTQM2AAsAEwAwADwAUwAAARUjETMRMxEzESMRJxUhNTM1MxUTFw4DIycyNjc1LgE1ND4CMzIWFRQGBxU+ASUUFjMyNjU0JiMiBgEVFB4CFwcuAycOAQcnPgM9AQJyTU1oTk7m/k+xT7kFN3t5bywLKmM3Qk4bMEQoVWNOQjBf/tw6MzM8PDMzOgFwMFNuPhopXFdLGCupahs+blMwAeL7AkL+/AER/XABPPk+PlVV/nA4Cw0GAkABAkMIQzYeLyISRTw2QwhAAwi2IicnIiImJv6yHSU/MB8GPwQVJDUkP0sMPwYfMD8lHQAABgAw/7cDLQM3AAsAEwAwADwASABUAAABFSMRMxUzETMRIxEnFSE1MzUzFRMXDgMjJzI2NzUuATU0PgIzMhYVFAYHFT4BJRQWMzI2NTQmIyIGATIWFRQGIyImNTQ2FzI2NTQmIyIGFRQWAnJNTWhOTub+T7FPuQU3e3hwLAsqYzdCThswRChVY05CMF/+3DozMzw8MzM6AUyWnZ2WlZ6elW1zc21tc3MB7O8CK/kBCP2oAQ32PT1SUv59NwsMBgI/AQJCCEEzHS8hEUI8M0EIPwMHsSAlJSAgJib+qEhFRUhIRUVI3CkmJykpJyYpAAAABAA6/7YDEAM2AAcACwAqADYAAAEVITUzNTMVJTMRIwEVPgE3Fw4DIycyNjc1LgE1ND4CMzIeAhUUBiUUFjMyNjU0JiMiBgJu/d/oUgE3UlL+yUB/PwZLmpWNPgw5f0NRXh85UDAwTzkfXf78Sz89TEw9P0sCyUJCbW1t/IABVF4DCgg9DA4IAkUCAmAKVkUmPSwXFyw9JkNXmjA2NjAwNzcAAAAFADn/tgMTAzwABwALACoANgA8AAABFSE1MzUzFSUzESMnFw4DIycyNjc1LgE1ND4CMzIeAhUUBgcVPgElFBYzMjY1NCYjIgYDNSEVIzUCZP3z3VIBO1JSRwVJl5OLPAw5f0NPXB83TjAwTzgfXFE/ef6YSj0/SUk/PUocAllSAuU+PldXUP2peToMDgcCQQECPghGNh8xIxMSIzEgN0UIOgMKsSMpKSMjKSn+UEH+vQAAAAAFADn/ygMwAzwABwALACoANgA8AAABFSE1MzUzFSURIxEDFw4DIycyNjc1LgE1ND4CMzIeAhUUBgcVPgElFBYzMjY1NCYjIgYTIRUhNTMCZP3z3VIBjVJHBUmXk4s8DDl/Q09cHzdOMDBPOB9eTz95/phKPT9JST89SkYCFP2aUgLfPj5dXVb9QgK+/gg6DA4HAkEBAkYIRzkgMyQTEyQzIDlHCEIDCr0lKiolJSsr/fZD2wAFADn/wAMtA0AABwALACUAMQA9AAABFSE1MzUzFSURIxEDFw4DIycyNjc1LgE1NDYzMhYVFAYHFTYlFBYzMjY1NCYjIgYTIRUhNSE1ITUhFSECZP303FIBjFJFBUmXlIs9Czl/Q1Fac2FkclxRff7TSD8/SUk/P0hCAhX9mQH6/gQCTv4GAvI7O05ORP3lAhv+TTQMDQcBPQECPgc8MzlAQDkzPQY7BawfIiIfICIi/bg6ukQ4sQAABgA5/8IDEwM+AAcACwAoADQAPABAAAABFSE1MzUzFSUzESMnFw4DIycyNjc1LgE1NDYzMh4CFRQGBxU+ASUUFjMyNjU0JiMiBgE1MxEhETMVBTUhFQJk/fPdUgE7UlJHBUmXk4s8DDl/Q09cdGAwTzgfXFE/ef6YSj0/SUk/PUoB7VD9tVEBqv5WAu8+Pk9PS/3TZDgMDgcCQAECPAhBNDtFESEwHjRCBzkDCqkgJiYgISYm/l5R/uABIFGSVlYABQA5/7kDPQM8AAcACwAqADYATQAAARUhNTM1MxUlESMRAxcOAyMnMjY3NS4BNTQ+AjMyHgIVFAYHFT4BJRQWMzI2NTQmIyIGARUUHgIXBy4DJw4BByc+Az0BAmT9891SAY1SRwVJl5OLPAw5f0NPXB83TjAwTzgfXFE/ef6YSj0/SUk/PUoBPDBRbT0dM19RQBQqpGocPmxRLwLnPj5VVU/9bgKS/h45DA4HAkEBAkYIQzYeMCISEiIwHjZDCEMDCrciKCgiIicn/qoLKEQ1JAc/BxwpNyFDUw4/ByQ1RCgLAAAABgA5/7cDGAM/AAcACwAoADQAQABMAAABFSE1MzUzFSURIxEDFw4DIycyNjc1LgE1ND4CMzIWFRQGBxU+ASUUFjMyNjU0JiMiBgEyFhUUBiMiJjU0NhcyNjU0JiMiBhUUFgJk/fTcUgGNUkcESZeTijwMOX1FT1wfN04wYXVcUT95/phKPT9JST89SgEZkZiYkZKYmJJqbW5qam1uAuo9PVVVS/2lAlv+KzkMDgcCPwECRQhBNh4xIRJFPTZCB0EDC7IhJychIicn/qBGRUVFRUVFRtgnJiYoKCYmJwAAAAAEADUAHQNiAykABwAdACkAMAAAARUhNSE1MxUTMxUhNTM1JjU0PgIzMh4CFRQGByciBhUUFjMyNjU0JgMVMzUGIyIDNf0oAUVSldn809ZnKU1tRENsTCk1Mb5kcHBkYXBw0NwwPT0Cs0NDdnb9rUNDpitcKT4rFhYrPikuRBXvNzEwNzcwMTf++o+PCQAAAAAFADT/ygNgA0EABwAYACQAKwAxAAABFSE1ITUzFRMzFSE1MzUmNTQ2MzIWFRQHJRQWMzI2NTQmIyIGFxUzNQYjIgcVIRUhNQMx/S4BQ1KQ3PzU3mmUjo2UaP54a2RkampkZGtn0DA4OaMCGP2WAuU/P1xc/j1BQWQhUEJFRUJOI3ElJyclJCgoplNTBsaeQd8AAAAABQA0/8ADYANHAAcAFwAfACgANAAAARUhNSE1MxUTMxUhNTM1Jj0BNCEgFRQHJRQzMjU0IyIXFTM1DgEjIiYDFSEVITUhNSE1IRUDMf0tAURSkNz81N5pASIBIWj+es3Ly81l0Bc0HR00jwIo/YYCDP3xAmIC+T09Tk7+eT09Ux1DAXNzRB1hPT08q0VFAgMD/pFJPb9CO7YAAAAABgA1/8IDYANFAAcAGQAjACoAMgA2AAABFSE1ITUzFRMzFSE1MzUuATU0NjMyFhUUByUUMzI2NTQmIyIXFTM1BiMiATUzESERMxUFNSEVAzH9LQFEUpDc/NXdMzaSj4+TaP58ymRnZ2TKY9AwODkBFVL9olEBu/5FAu9AQFZW/mFAQFwONCQ9Pz89RiBmQSEgICO4TU0G/v1Q/t4BIlCUWFgAAAAFADX/ugNgA0MABwAZACUALABFAAABFSE1ITUzFRMzFSE1MzUuATU0NjMyFhUUByUUFjMyNjU0JiMiBhcVMzUGIyIXFRQeAhcHLgMnDgMHJz4DPQEDMf0uAUNSkNz81d0zNpOPjpNo/ntoZGFpaWFkaGTQMDg5YjBTbz4aNGFTQhUVQlNhNBs+b1MwAupAQFlZ/lRBQVkRNSZAQkJASSNsIyQkIyMkJJ9JSQayHSY/Lx8GPwYZJjIfHzImGQY+Bh8wPyYdAAAAAAYANf+3A2ADQwAHABkAJQAsADgARAAAARUhNSE1MxUTMxUhNTM1LgE1NDYzMhYVFAclFBYzMjY1NCYjIgYXFTM1BiMiFzIWFRQGIyImNTQ2FzI2NTQmIyIGFRQWAzH9LgFDUpDc/NXdMzaSj4+TaP57Z2RkZ2dkZGdk0DA4OTmVnZ2Vl52dl21xcW1tc3MC7EBAV1f+VUFBXg82JT9AQD9KIGoiJCQiIiMjnE5OBsBFRUNFRUNFRdUmJSYnJyYlJgAAAAAEADX/tQNiAzwABwATAB8AJwAAARUhNSE1MxUBNDYzMhYVFAYjIiYlNCYjIgYVFBYzMjYXFSEVIzUhNQMw/S8BQlP+s5eNiZmZiY2XAfFpZGRra2Rkacr+klP+lALQQkJsbP71SE5OSEhNTUgqLS0qKi0tqkP5+UMAAAAABAA1/7YDXwNEAAcAEwAfAC0AAAEVITUhNTMVBTQ2MzIWFRQGIyImJTQmIyIGFRQWMzI2FyEVIRUjNSE1ITUhNSEDMf0uAUNS/rWTj42UlI2PkwHuaGRkampkZGjI/pUBAVL96QEW/pMDKgLpPz9bW+dCQUFCQEJCQCMlJSMjJCTUW/q6QFtBAAUANP/KA18DQQAHABMAHwAnAC0AAAEVITUhNTMVBTQ2MzIWFRQGIyImJTQmIyIGFRQWMzI2BSEVIRUjNSEXFSEVITUDMP0vAUNS/rWUjoyVlYyOlAHwamRka2tkZGr9mwMr/ptS/oy5Ahr9lALkQEBdXe9CRkZCQ0ZGQyUnJyUlJyebQYaGS55B3wAABAA1/8ADXwNGAAcAEQAZAC0AAAEVITUhNTMVBTQ2MzIWFRQhICU0IyIVFDMyFyEVIRUhFSEVITUhNSE1ITUhNSEDMf0tAURS/rWQkpGQ/t/+3gHty83Ny8n+lQEE/fMCKP2GAgz98gEL/pMDKgL3PT1PT9Q8OTk8dHQ9PT2mRLdIPb5DO0Q9AAQANf/AA18DRgAHAA8AGQBCAAABFSE1ITUzFQU0ISAVFCEgJTQjIgYVFBYzMhchFSEVIxUzFSMVMxUhESMVIxUyPgI3Fw4DKwE1MzUjNSE1ITUhAzD9LwFDUv61ASEBIv7e/t8B7cxkaGhkzMn+lQERzsPD1/7aQMslPDUyGwcgOT1GLS7LzQEU/pMDKgL1PT1RUdl2dnV1PiAeHh+iRjpDN0g7ATCrSwEDBQU5BQYDAbpEOUY9AAAFADX/wgNgA0MABwATAB8AKwAvAAABFSE1ITUzFQU0NjMyFhUUBiMiJiU0JiMiBhUUFjMyNhchFSEVITUhNSE1IQM1IRUDMf0uAUNS/rWTj46Tk46PkwHsaWFkaGhkYWnL/pQBCf2cAQn+kwMrs/48AuxAQFdX40BBQUA/QUE/IyQkIyIkJNNT//9TQf6rg4MAAAAABgA0/8IDYANCAAcAEwAdACUALQAxAAABFSE1ITUzFQU0NjMyFhUUBiMiJiU0JiMiFRQzMjYFIRUhFSM1IQU1MxEhETMVBTUhFQMx/S0BRFL+tZKPj5OTj4+SAexnZMrKZGf9nwMs/pRS/pICc1L9olEBu/5FAvA/P1JS4D8/Pz8/Pz8/ISNERSONQWBgjlT+3AEkVJJWVgAFADX/uQNfA0QABwATAB0AJQA+AAABFSE1ITUzFQU0NjMyFhUUBiMiJiU0IyIGFRQWMzIFIRUhFSM1IQUVFB4CFwcuAycOAwcnPgM9AQMw/S8BQ1L+tZKQj5KSj5CSAezKZGdnZMr9oAMq/pVS/pMBwDJVcD8ZNWRWQxUVQ1dkNhg/cFYyAvBAQFRU4D8+Pj8/Pj4/QyIhISNvQVdXcwojOiwbBT0EFiMvHh4vIxYEPQUbLDojCgAABQA1/7cDYANEAAcAEwAfADIAPgAAARUhNSE1MxUFNDYzMhYVFAYjIiYlNCYjIgYVFBYzMjYXIRUeARUUBiMiJjU0Njc1ITUhAzQmIyIGFRQWMzI2AzH9LgFDUv61k4+Ok5OOj5MB7GlhZGhoZGFpy/6Ug4adlZedh4T+kwMrt3FtbXNzbW1xAuo/P1pa40BBQUA/QUE/IiQkIiIkJNNGBUY/RUZGRT9GBUZB/u8mJycmJigoAAAAAAUAMf+2AxYDPgAHAA8AIwAvAD8AAAEVITUzNTMVJTMRIzUjNTMBND4CMzIeAhUUDgIjIi4CJTQmIyIGFRQWMzI2HwEOAQcRIxEOASMnMj4CAmH9799SAUNSUsvL/cIeOE0vL004Hh44TS8vTTgeAVdJPDxJSTw8SaMEQoVCUj94NgtBkpiaAt9AQF9fV/yApkABRiI2JhQUJjYiITYmFRUmNiEnLi4nJi4ujTsKDAX+7gEPAgJEAQUKAAAABgAv/8QDLQM8AAcADwAbACcANwA9AAABFSE1MzUzFRMzETMRIzUjATQ2MzIWFRQGIyImJTQmIyIGFRQWMzI2AzUOASMnMj4CNxcOAQcVByEVITUzAl/9799Sg79SUr/+gnFhYXJyYWFxAVhHPz1HRz0/R6hDfjkLP5GYmkgFPXw/ggIp/YVSAuU9PVdX/gkCSP03RwFRP0REPz1ERD0jJycjIScn/rGBBAJCAQYMCjkLDQSFj0LvAAYAMP/AAzQDQgAHAA8AGwAnADcAQwAAARUhNTM1MxUTMxEzESM1IwE0NjMyFhUUBiMiJiU0JiMiBhUUFjMyNgM1DgEjJzI+AjcXDgEHFQMhFSE1ITUhNSEVIQJf/e/gUoO+UlK+/oJvZGRtbWRkbwFYRj9CRUVCP0a0Qng2CT+QmJpIBUCBQm4CJ/2IAgf99wJZ/foC+Dg4Skr+ZAHa/dAiARQ0Nzc0NDc3NBsdHRsaHh7+4m0CAjoBBgsKMgsMBXH+9TmwPzirAAAAAAcAL//AAxMDPwAHAA8AGwAnADcAOwA/AAABFSE1MzUzFSUzESM1IzUzJTQ2MzIWFRQGIyImJTQmIyIGFRQWMzI2AzUOASMnMj4CNxcOAQcVAzUhFSUVITUCX/3v31IBQlJSvLz9w29kZG5uZGRvAVhGPz9GRj8/RrVCdTYLPpCYm0kFQoFCswJN/gMBrQLxOztOTkb9nSg38jk8PDk5Ojo5HiAgHh0hIf7KewMBPQEFDAs2Cw4Df/7u9PS3enoAAAcAMP+2AxsDPwAHAA8AGwAnADcAQwBPAAABFSE1MzUzFRMzETMRIzUjATQ2MzIWFRQGIyImJTQmIyIGFRQWMzI2AzUOASMnMj4CNxcOAQcVFzIWFRQGIyImNTQ2FzI2NTQmIyIGFRQWAl/97+BShrtSUrv+f3FhYXJyYWFxAVdGPz9GRj8/Rrc/dTYLP5CYmkgFQoNCdpWZmZWVmZmVam9vampvbwLxOztOTv48Agn9izUBLjk8Pjc5Ozs5HiEhHh0iIv7IewIBPQEFCwo1Cw0EfxJCQkJBQUJCQsskIyQlJSQjJAAAAAAGACb/twMtAzYAAwALABMAJwAzAEMAAAEzESMDFSE1MzUzFRMRMxEjNSM1ATQ+AjMyHgIVFA4CIyIuAiU0JiMiBhUUFjMyNh8BDgEHESMRDgEjJzI+AgLeT0/n/ka2TvROTqT+yxwyRyoqRjIcHDJGKipHMhwBND82Nj8/NjY/bgcwZDNONmAqCjB4fnwDNvyBAxdAQFxc/ecCbvzBlD0BMR4yIxMTIzIeHzIjExMjMh8jKCgjIykpfzwJCwT+9QEHAwJFAgUJAAcAKf+2AygDNwAHAAsAEwAfACsAOwBBAAABFSE1MzUzFSUzESMlMxEzESM1IwE0NjMyFhUUBiMiJiU0JiMiBhUUFjMyNgM1DgEjJzI+AjcXDgEHFQc1IRUjNQH9/kW2TwGST0/+xJpNTZr+xmhVVWhoVVVoATE+NjY+PjY2Ppg5ZisJMHh/fzcFLWEzlQJzUgLmPT1RUVD9iWoB/v2fKgErNjs7NjY6OjYcHx8cGyAg/sZ+AwI9AgYKCDYICwSDaT3kpwAHACn/ygNDAzYAAwALABMAHwArADsAQQAAAREjEQcVITUzNTMVEzMRMxEjNSMBNDYzMhYVFAYjIiYlNCYjIgYVFBYzMjYDNQ4BIycyPgI3Fw4BBxUHIRUhNTMDKE/c/kW2T1eaTU2a/sVoVVRpaVRVaAEwPTY2Pj42Nj2XOWYrCS93gIA3BjBfMy8CKP2GUgM2/TQCzFo9PVVV/iICKP1STAFDOT8/OTk/PzkeIyMeHiIi/sxxAwI+AgUKCDYIDAN2qEPPAAAAAAcALP/AA0cDPgAHAAsAEwAfACsAOwBHAAABFSE1MzUzFSURIxEBMxEzESM1IwE0NjMyFhUUBiMiJiU0JiMiBhUUFjMyNgM1DgEjJzI+AjcXDgEHFQMhFSE1ITUhNSEVIQIA/kW1TwHfT/7DnE1NnP7KZVhYZWVYWGUBMT42Nj4+NjY+mzdlKwkwd39/OAUuYzMuAiv9hQIL/fICX/30Avc5OUdHP/3GAjr+JwHM/dkmARUxNjYxMzY2MxgdHRgaHBz+4HECAjkBBgoJMgkLBHb+9jmuPDipAAgAKf+3AzADOQAHAAsAEwAfACsAOwBHAFMAAAEVITUzNTMVJREjEQEzETMRIzUjATQ2MzIWFRQGIyImJTQmIyIGFRQWMzI2AzUOASMnMj4CNxcOAQcVFzIWFRQGIyImNTQ2FzI2NTQmIyIGFRQWAf3+RbZPAeFP/sKcTU2c/shoVVVoaFVVaAExPjY2Pj42Nj6bN2UqCjB4f383Bi5jM66bn5+bm5+fm3B1dXBwdXUC6z09Tk5M/YMCff4AAfL9rigBJTQ5OTQzOTkzGx4eGxoeHv7DhAIDPgIGCgg2CAwEiRdAP0BAQEA/QMQiIyIiIiIjIgAFADX/tQMVAz4ABwALAB8AKwA7AAABFSE1MzUzFSUzESMBND4CMzIeAhUUDgIjIi4CJTQmIyIGFRQWMzI2HwEOAQcRIzUOASMnMj4CAmb98N5SAT1SUv3IHzdOLi9ONx8fN04vLk43HwFXSTw8SUk8PEmjBUCCQlNCeTkKQZKZmwLWQEBoaGD8fwIkIjcmFRUmNyIiNiYVFSY2IigvLygnLy+QPQkMBP7//QIBRAEFCgAAAAAFADH/tgMPAz4ABwALABcAIwA4AAABFSE1MzUzFSUzESMBNDYzMhYVFAYjIiYlNCYjIgYVFBYzMjYHFSEVIzUhNTM1DgEjJzI+AjcXBgJj/fPdUgE4UlL9zXFhYXJyYWByAVhHPz1HRz0/R14Bi1L9935CfTcLP5KanUoGggLmPj5YWFD9rQEnPENDPDxDQzwgJCQgICUlzG37ukFpAwJCAgYMCzoWAAAGADD/ygMrAz0ABwALABcAIwAyADgAAAEVITUzNTMVJREjEQE0NjMyFhUUBiMiJiU0JiMiBhUUFjMyNgM1DgEjJzI+AjcXBgcVByEVITUzAmP9891SAYpS/c1xYWFycmFfcwFYRz88SEg8P0eiSIA8DEGTmpxKBnt9jAIl/YlSAuQ9PVlZU/1DAr3+xT9GRj89R0c9IycnIyEoKP6qgwQCQgEGDAo6EwiHeULeAAAAAAUAOf/AAy0DQgAHAAsAFwAjAD8AAAEVITUzNTMVJREjEQE0NjMyFhUUBiMiJiU0JiMiBhUUFjMyNgMhFSE1ITUhNTM1DgEjJzI+AjcXDgEHFSEVIQJj/fnaUgGHUv3QcmBhcnJhYHIBWEc/PUdHPT9H0wIb/ZQB/f4BeEJ7Nwo/kJaYSAU/fD8Bhv4DAvI7O1BQRP3tAhP+6zlAQDk5QEA5HyMjHx8jI/35O71GOkkDAT0BBAoJNQkMBEy3AAAAAAYAMf/CAw8DQAAHAAsAFwAjADcAOwAAARUhNTM1MxUlMxEjATQ2MzIWFRQGIyImJTQmIyIGFRQWMzI2BxUhESERMzUOASMnMj4CNxcOARM1IRUCY/3z3VIBOFJS/c1xYWFycmFhcQFYRz89R0c9P0dZAYb9tHRFfDkMQJKZnEsGP4L3/lQC6z09VVVL/b0BHjxBQTw8QUE8ICMjICAjI8dl/v0BA2EDAUABBQwLOQsN/tKHhwAAAAAHADH/wgMPA0EABwALABcAIwAzADsAPwAAARUhNTM1MxUlMxEjATQ2MzIWFRQGIyImJTQmIyIGFRQWMzI2AzUOASMnMj4CNxcOAQcVBTUzESERMxUFNSEVAmP9891SAThSUv3NcmBhcnJhYXEBWEc/PUdHPT9Hp0WAOQxBk5qbSQY/fj8BMVH9s1IBqv5WAu09PVRUSf3TAQ85QEA5OT8/OR0jIx0dIiL+1WMCAkABBQsKOQoMA2hAU/7fASFTkVVVAAAABgAx/7kDTwM/AAcACwAXACMAMwBMAAABFSE1MzUzFSURIxEBNDYzMhYVFAYjIiYlNCYjIgYVFBYzMjYDNQ4BIycyPgI3Fw4BBxU3FRQeAhcHLgMnDgMHJz4DPQECY/3z3VIBilL9zXFhYXJyYWByAVhHPz1HRz0/R7xAczYMP5GanUsGRYlDsC9QbDwcMl5RPxQUQFFgMxw+bFEvAug+PldXTv1gAqD+1DxERDw8REM9ICYmICAlJf60egIBQQEGDAs5DA8Efi4QJ0IyIgc/BxsoNCAgNCgbBz8HIjJCJxAAAAAABgAx/7cDFQM+AAcACwAXACMAPgBKAAABFSE1MzUzFSURIxEBNDYzMhYVFAYjIiYlNCYjIgYVFBYzMjYHFTYzMhYVFAYjIiY1NDc1DgEjJzI+AjcXBgMyNjU0JiMiBhUUFgJj/fPdUgGKUv3NcWFhcnJhYXEBWEc/PUdHPT9HXS82kpmZkpKZdEJ8OQtAkpqcSwWBHmpvb2pqbm4C6T09VVVN/aICXv7YPEFBPDxBQTwgIyMgICQky1sGRkVFR0dFUyNmAwFAAQUMCzkW/sspJiYpKSYmKQAABAA1/7UDYgM8AAcAEwAfACsAAAEVITUhNTMVATQ2MzIWFRQGIyImJTQmIyIGFRQWMzI2FxUjESMRIxEjESM1AzD9LwFCU/6zl42JmZmJjZcB8WlkZGtrZGRpytRS4lLTAtRCQmho/vdITExISE1NSCosLCoqLCyoQv7+AQL+/gECQgAABQA1/7YDYANEAAcAEwAfAC0AMQAAARUhNSE1MxUFNDYzMhYVFAYjIiYlNCYjIgYVFBYzMjYXIxUzFSM1ITUzNSM1IQU1IxUDMf0uAUNS/rWTj42UlI2PkwHuaGRkampkZGjJ2W5S/emC2QMr/tXVAupAQFpa5UJBQUJCQUFCIyUlIyMlJdRg+LhAYEGhYGAABQA0/8oDXwNCAAcAEwAfACsAMQAAARUhNSE1MxUFNDYzMhYVFAYjIiYlNCYjIgYVFBYzMjYFIRUjFSM1IxUjNSEXFSEVITUDMP0vAUNS/rWUjoyVlYyOlAHwamRka2tkZGr9mwMr1VKdUv7ruQIa/ZQC5UBAXV3vQkZGQkNGRkMlJyclJScnmEGRkZGRUJ1B3gAAAAUANP/AA2ADRwAHABEAGQAtADEAAAEVITUhNTMVBTQhIBUUBiMiJiU0IyIVFDMyFyMVMxUhFSEVITUhNSE1MzUjNSEFNSMVAzH9LQFEUv61ASIBIZCRkZEB7cvNzcvK2XH98wIo/YYCDP3xd9kDLP7V1gL4PT1PT9N0dDw5OTw9PT2lR7dIPb5DO0c9hEdHAAYANf/CA2ADRAAHABMAHwArAC8AMwAAARUhNSE1MxUFNDYzMhYVFAYjIiYlNCYjIgYVFBYzMjYXIxUzFSE1MzUjNSEFNSMVBTUhFQMx/S4BQ1L+tZKPj5OTj4+SAexnZGRnZ2RkZ8vZdv2cddkDK/7V1QFN/jwC7kBAVlbiQEFBQD9BQT8iJCQiIiQk01b//1ZCmFZWwYODAAAAAAUANf+5A2EDQwAHABMAHwArAEQAAAEVITUhNTMVBTQ2MzIWFRQGIyImJTQmIyIGFRQWMzI2BSEVIxUjNSEVIzUjBRUUHgIXBy4DJw4DByc+Az0BAzD9LwFDUv61k4+Ok5OOj5MB7GlhZGhoZGFp/aADLLhS/uhSuAG/MFNvPho0YVNCFRVCVGE0Gz5vUzEC6kBAWVnnQEJCQEBCQkAjJCQjIyQkk0KGhoaGPR0mPy8fBj8GGSYyHx8yJhkGPgYfMD8mHQAGADX/twNgA0QABwATAB0AMAA5AEUAAAEVITUhNTMVBTQ2MzIWFRQGIyImJTQmIyIVFDMyNhcjFR4BFRQGIyImNTQ2NzUjNSEFNSMVPgEzMhYXNCYjIgYVFBYzMjYDMf0uAUNS/rWSj4+Tk4+PkgHsZ2TKymRny8wzNp2Wlp02M8sDK/7j8Rs8ISI8gXJtbXJybW1yAuw/P1hY4T9BQT8/QUE/IiRGRiTUYxE5JkVGRkUnOBFjQZJRUQQEBIYmJycmJigoAAAAAAQANQAjA2IDJgAHABsAJwArAAABFSE1ITUzFQE0PgIzMh4CFRQOAiMiLgIlNCYjIgYVFBYzMjYFIRUhAzX9KAFFUv6wKU1tRENsTCkpTGxDRG1NKQH4cGFkcHBkYXD9mQMt/NMCrUJCeXn+0ipBLRgYLUEqKkIuGBguQio0Ojo0Njk540MAAAAFADX/tgNgA0QABwATAB8AIwApAAABFSE1ITUzFQU0NjMyFhUUBiMiJiU0JiMiBhUUFjMyNgUhFSEXNSEVIzUDMf0uAUNS/rWTj42UlI2PkwHuaGRkampkZGj9ngMr/NVXAmlSAug/P1xc6UJEREJCQ0NCJCYmJCMmJpxBj0D6ugAAAAAFADT/ygNfA0EABwATAB8AIwApAAABFSE1ITUzFQU0NjMyFhUUBiMiJiU0JiMiBhUUFjMyNgUhFSEXFSEVITUDMP0vAUNS/rWUjoyVlYyOlAHwamRka2tkZGr9mwMr/NW7Ahf9lwLjPz9eXvJFRUVFRUVFRSUpKSUmKCifQj+gQeEAAAAIADX/twNgA0YABwAPABcAGwAjAC4AOgBGAAABFSE1ITUzFQU0ISAVFCEgJTQjIhUUMzIFIRUhBRUzFSE1MzUFFT4BNxcOASsBEQUyFhUUBiMiJjU0NhcyNjU0JiMiBhUUFgMx/S4BQ1L+tQEhASL+3v7fAe3MzMzM/Z8DK/zVAkyh/myk/qwtWjEMQG85KgHKRllZRkZZWUYoMTEoKDExAvM9PVNT2Xd3d3c+Pj9pPhlBPDxBMuACCQw+EQcBH2U2MTE1NTExNpwdGBocHBoYHQAAAAUANP/CA18DRQAHABMAHwAjACsAAAEVITUhNTMVBTQ2MzIWFRQGIyImJTQmIyIGFRQWMzI2BSEVIRcVIRUhNSEVAzD9LgFEUv61k4+Ok5OOj5MB7GlhZGhoZGFp/Z8DK/zVtgId/ZECZgLqQEBbW+RAQUFAQEFBQCIkJCIjJCScQYWBPv0+AAAFADT/wANgA0YABwARABsAHwArAAABFSE1ITUzFQU0ISAVFAYjIiYlNCYjIhUUMzI2BSEVIRcVIRUhNSE1ITUhFQMx/S0BRFL+tQEiASGRkJKQAe1nZM3NZGf9ngMs/NS3Aij9hgIM/fECYgL1PT1RUdV2djw5OTwfID8+H4o99Uk8vkM7twAABgA1/7YDXwNHAAcADwAZAB0AMgA4AAABFSE1ITUzFQU0ISAVFCEgJTQmIyIVFDMyNgUhFSEXFTI+AjcXDgMrATUzNSM1IRU3NSERIxEDMP0vAUNS/rUBIgEh/t/+3gHtZ2TNzWRn/Z8DKvzWqDBNQz0fCCJDSVc3N9bYAScyAR1RAvc9PVBQ1nZ2dnYfHz4+H4Y981ACBAkHOwgKBAHERjq4ez3+sgERAAAAAAYANf+/A2ADQgAHABEAGQAdADEAPQAAARUhNSE1MxUFNDYzMhYVFCEgJTQjIhUUMzIFIRUhFxUyPgI3Fw4CKwE1MzUjNSEVFxUzFSERIRUjFTMVAzD9LwFDUv61kJKRkP7f/t4B7cvNzcv9nwMr/NWmJjw1MhsIIDk9I4HO0QEfjtf+2gEdzsQC9j09TEzWPDk5PHV1PT0+cD3wSwEDBgU6BgcDvEQ4sgNJOgE4OkM4AAAAAAYANf/CA2ADQwAHABMAHwAjACcAKwAAARUhNSE1MxUFNDYzMhYVFAYjIiYlNCYjIgYVFBYzMjYFIRUhEzUhFSUVITUDMf0uAUNS/rWSj4+Tk4+PkgHsZ2RkZ2dkZGf9oAMr/NVkAmT97AHEAus/P1hY4z9CQj9AQUFAIyMjIyMkJJlB/rf//8GDgwAABgA0/8IDYANEAAcAEwAdACEAKQAtAAABFSE1ITUzFQU0NjMyFhUUBiMiJiU0JiMiFRQzMjYFIRUhBTUzESERMxUFNSEVAzH9LQFEUv61ko+Pk5OPj5IB7GdkyspkZ/2fAyz81AJzUv2iUQG7/kUC7j8/VlbfPz4+Pz8/Pz8hI0REI5VBg1D+3QEjUJVYWAAABQA1/7oDXwNEAAcAEwAfACMAPAAAARUhNSE1MxUFNDYzMhYVFAYjIiYlNCYjIgYVFBYzMjYFIRUhBRUUHgIXBy4DJw4DByc+Az0BAzD9LwFDUv61k4+Ok5OOj5MB7GlhZGhoZGFp/aADKvzWAb8wU28+GjRhU0IVFUJTYTUbP29TMALnPz9dXepCQ0NCQkNDQiMmJiMjJiaWQTQcJz8vHwY/BhklMh8fMiUZBj8GHzA/JhwABgA1/7cDYANEAAcAEwAfACMALwA7AAABFSE1ITUzFQU0NjMyFhUUBiMiJiU0JiMiBhUUFjMyNgUhFSEFMhYVFAYjIiY1NDYXMjY1NCYjIgYVFBYDMf0uAUNS/rWSj4+Tk4+PkgHsZ2RkZ2dkZGf9oAMr/NUBlZadnZaWnZ2WbXJybW1ycgLqQEBaWuZAQkJAQEJCQCMlJSMjJCSYQTxHQ0VGRkVDR9goJiYnJyYmKAAFADT/wANfA0YABwAPABkAHQApAAABFSE1ITUzFQU0ISAVFCEgJTQmIyIVFDMyNgUhFSEXFSEVIREhFSEVIRUDMP0uAURS/rUBIgEh/t/+3gHtZ2TNzWRn/Z4DK/zVuAIe/ZACZv3sAf8C8z09U1PZeXl5eSAhQUAgiz3wRzsBNzpENwAFADr/tgMQAzYAAwALAB8AKwA3AAABMxEjAxUhNTM1MxUDND4CMzIeAhUUDgIjIi4CJTQmIyIGFRQWMzI2AScyPgI3Fw4DAr5SUlD93+hS/x85Ty8vTzkfHzlPLy9POR8BX0w9PExMPD1M/l8MQJGXmkkGS5qVjQM2/IADCEJCb2/+5CY+LBgYLD4mJj4sGBgsPiYwODgwMDk5/vRFAQULCj0NDgcBAAAGADn/ygMvAzkABwALABkAJQAxADcAAAEVITUzNTMVJREjEQE0PgIzMhYVFAYjIiYlNCYjIgYVFBYzMjYfAQ4DIycyPgIBIRUhNTMCZP3z3VIBjVL9yB44TjBkcnJkYHQBXUo/P0hIPz9KlAVJl5OLPAw+j5aX/ukCE/2bUgLcPj5dXVn9RwK5/rcgNCQUSkJCSUtAJisrJiYrK4I6DA4GAkABBgv+00PhAAAABgA5/8ADLQNAAAcACwAXACMALwA7AAABFSE1MzUzFSURIxEBNDYzMhYVFAYjIiYlNCYjIgYVFBYzMjYfAQ4DIycyPgIBIRUhNSE1ITUhFSECZP303FIBjFL9yXNhZHJyZGFzAVxJPz9ISD8/SZYFSZiTiz0LP4+Wl/7jAhb9mQH7/gMCTv4FAu87O1FRSP3nAhn+5zlAQDk5QEA5HyMjHx8jI3Q1DA4GAj0BBgr+eDq9RTizAAAAAAcAOf/CAxQDPQAHAAsAFwAjAC8AMwA3AAABFSE1MzUzFSURIxEBNDYzMhYVFAYjIiYlNCYjIgYVFBYzMjYfAQ4DIycyPgIFIREhJTUhFQJk/fTcUgGNUv3Ic2FkcnJkYXMBXEhAP0hIP0BIlQVJl5OLPAw+j5aX/pMCTv2yAf3+UwLkPT1ZWVL9ugJG/sw/RUU/P0ZGPyMoKCMjKSl7OAwOBwJAAgULlf78PoiIAAAABwA5/8IDEwM8AAcACwAbACcAMwA7AD8AAAEVITUzNTMVJTMRIwE0NjMyFhUUDgIjIi4CJTQmIyIGFRQWMzI2HwEOAyMnMj4CFzUzESERMxUFNSEVAmT9891SATtSUv3IdV9hdR84TzAwTjcfAVxJPz1KSj0/SZUFSZeTizwMPo+Wl5BQ/bVRAar+VgLtPT1PT0390wECPENDPB4vIRISIS8eICcnICEmJnc5DA4HAkABBgvcUf7gASBRklZWAAAABwA5/7cDGAM/AAcACwAdACkANQBBAE0AAAEVITUzNTMVJREjEQE0PgIzMh4CFRQGIyIuAiU0JiMiBhUUFjMyNh8BDgMjJzI+AgcyFhUUBiMiJjU0NhcyNjU0JiMiBhUUFgJk/fTcUgGNUv3IHzdOMDBPOB91YTBONx8BXEk/PUpKPT9JlQRJl5OKPAw+jpaYRJGYmJGSmJiSam1wZ2pubgLoPj5XV039pQJb/tIeMCISEiIwHj1GEiIxHiInJyIiKCiBOQwOBwJAAQYLjkZFQ0dHQ0VG2CglJigoJiUoAAAEAEn/tgMTAzcAAwALAB8AMwAAATMRIwEVMxUhNTM1EzIeAhUUDgIjIi4CNTQ+AhMyPgI1NC4CIyIOAhUUHgICwVJS/r7k/ebkKjFROyEhO1ExMFE7ISE7UTAfNSYWFiY1Hx81JhUVJjUDN/x/A3eHQ0OH/u4eN0wtLkw3Hh43TC4tTDce/qcVJTMeHjMkFRUkMx4eMyUVAAUAQv+1AxUDPgAHAAsAHwArADEAAAEVITUzNTMVJTMRIycUDgIjIi4CNTQ+AjMyHgIFFBYzMjY1NCYjIgYDNSERIzUCY/3f6FIBR1JSlSA6UDExUTkgIDlRMTFQOiD+mE1AP05OP0BNCQJYUgLZQkJlZV390L8lOyoXFyo7JSU8KxcXKzwlLTY2LS03N/6gQv7h3QAFAEL/ygMwAzgABwALAB8AKwAxAAABFSE1MzUzFSURIxEDFA4CIyIuAjU0PgIzMh4CBRQWMzI2NTQmIyIGEyEVIREzAmP93+hSAZlSlSA6UTAxUTkgIDlRMTBROiD+mE1AP05OP0BNYAIK/aRSAshCQnBwbv1eAqL+eSY+KxgYKz4mJj0rGBgrPSYwNzcwMDY2/i5DAQIAAAUAQv/AAzMDQQAHAAsAGwAnADMAAAEVITUzNTMVJREjEQMUDgIjIiY1NDYzMh4CBRQWMzI2NTQmIyIGEyEVITUhNSE1IRUhAmP93+hSAZhSlB86UDJndHRnMlA6H/6ZSkI/TU0/QkpbAhH9nwHx/gwCRf4OAuU/P1xcVf4QAfD+sCI3JhRORUVOFCY2IyguLigqLCz96z/RTz3HAAYAQv/CAxUDPwAHAAsAHwArAC8AMwAAARUhNTM1MxUlMxEjJxQOAiMiLgI1ND4CMzIeAgUUFjMyNjU0JiMiBhMRIRElFSE1AmP93+hSAUdSUpUgOVExMVE5ICA5UTExUTkg/phLQkBNTUBCSwsCRP4MAaQC10JCaGhg/eGxJTspFhYpOyUlOyoWFio7JS01NS0tNTX9zAEm/trlo6MAAAAGAEL/wgMVAz8ABwALAB8AKwAzADcAAAEVITUzNTMVJTMRIycUDgIjIi4CNTQ+AjMyHgIFFBYzMjY1NCYjIgYBNTMRIREzFQU1IRUCY/3f6FIBR1JSlR86UDIxUTofHzpRMTJQOh/+mEtCQE1NQEJLAf5R/b5RAaD+YALWQkJpaWD9+qEkOSkVFSk5JCM5KBUVKDkjLTAwLSoyMv6rYP68AURgomNjAAAFAEL/ugNEAz0ABwALAB8AKwBCAAABFSE1MzUzFSURIxEBIi4CNTQ+AjMyHgIVFA4CAyIGFRQWMzI2NTQmExUUHgIXBy4DJw4BByc+Az0BAmP93+hSAZlS/pAxUTkgIDlRMTFQOiAgOlAxQE1NQD9OToovUGw9IDJeTz8UKqFnIDxsUS8C0UJCbGxm/YwCdP3oFyo7JSU8KhcXKjwlJTsqFwEENS4tNjYtLjX+0Q8tTj0qCUAJIC88JUlfEUAJKj1OLQ8ABgBC/7YDGQM9AAcACwAfACsANwBDAAABFSE1MzUzFSURIxEDFA4CIyIuAjU0PgIzMh4CBRQWMzI2NTQmIyIGATIWFRQGIyImNTQ2FzI2NTQmIyIGFRQWAmP93+hSAZlSlSA5UTExUTkgIDlRMTFROSD+mEtCQE1NQEJLASqLnp6LkJubkGdxcWdncnIC0EJCbW1m/b8CQf6OJTsqFhYqOyUlOykWFik7JS01NS0tNDT+909KSk9OS0tO8y0tLS0tLS0tAAcAQv+3AyMDPgAHAAsAFwAjACsANwBDAAABFSE1MzUzFSURIxEDFAYjIiY1NDYzMhYFFBYzMjY1NCYjIgYBIRUhNSE1MwcyFhUUBiMiJjU0NhcyNjU0JiMiBhUUFgJj/d/oUgGYUpR3ZGR3d2Rkd/6YS0JCS0tCQksBTwEO/Y8BEVIoeYKCeXmDg3lRWVlRUlhYAus+PlNTS/4GAfr+xj9JST9ASEhAIysrIyQrK/7kPj5PsT05OTw8OTk9sh8dHh4eHh0fAAAAAQAn//QBvQLUABkAABMBPgEzMhcWFRQHCQEWFRQGIyImJwEmNTQ2MwFGCxMCDgsLEP7WAS4LFBACEQz+ugwBAX8BSAsCCw4KEBD+1P7OCw4PFwIMAUgMDQEPAAABAE3/9AHkAtUAGQAACQEOASMiJjU0NjcJASY1NDYzMhYXARYVFAYB2P65CxMCDhYCDgEs/tIKFRACEQwBQwwBAUr+twsCFg0CEA4BLgEyCgwPGQIM/rkMDQEQAAIA7P/XAwQC/QAcACMAACUXBgcVIzUuAzU0PgI3NTMVHgEXByYnET4BBxEOARUUFgLaKlp7OTtiRicpSGE4OUViJC9CWjRWw1FfW9w7UAZ0dgYrR2M+PmNIKwZ9egItIzo/Av5fAiUjAZkOblJRbQABAOkAAAMLAt0AKgAAJSEVITU2NTQnIzU3My4BNTQ+AjMyFhcHLgEjIgYVFBYXIRUjHgEVFAYHAXEBmv3ehQt6ShkNFiVDYDpObSQ0HlA3VVoVDAEK9QQFKyVOTjdGgR0nOwMhQSEyUTkeNi00JiVRPyFAID4RIRI6TCYAAQB2AMcDXQINAAUAABMhESM1IXYC50r9YwIN/rr/AAABALoAAAMtAtEAIQAAITUjNTM1IzUzAzMXHgMXMz4DPwEzAzMVIxUzFSMVAcbGxsas8mt3DRUUFAwFDRUUFAx2avGrxcXFqTVINgF1yhglIyQVFSQjJhfK/os2SDWpAAAEAFsAAAOOAtEAGAAeACQAKgAAARUjAyMDIwMjAyM1NzMDMxMzEzMTMxMzAyEzLwEjBxc3Ix8BMyU3Ix8BMwOOdUtYTWZMU096Ux1MVUF6PVc/fD9PSP6pUgYhBSDsFmgZGwX+xhlnFxcEAYcv/qgBWP6oAVgqBQFK/rYBHf7jAUr+thu9vb1zc5GRc3ORAAAAAAAAAAAcAAAAHAAAAEQAAAB4AAAA2AAAAbwAAAJcAAADKAAAA0gAAAOAAAADtAAAA/AAAAQYAAAENAAABFAAAARoAAAEiAAABPwAAAUsAAAFnAAABjgAAAZ4AAAG5AAAB2wAAAeYAAAISAAACMQAAAjoAAAJEAAACTgAAAlgAAAJjAAACgAAAAr0AAALPAAAC6wAAAwUAAAMVAAADIQAAAysAAANIAAADVAAAA1oAAANqAAADeAAAA4AAAAOaAAADrAAAA8kAAAPcAAAD/AAABBAAAAQ1AAAEPgAABFIAAARgAAAEfQAABJQAAASjAAAErgAABLcAAAS/AAAEyAAABNEAAATXAAAE3gAABP4AAAUbAAAFNQAABVIAAAVvAAAFgAAABb0AAAXOAAAF2AAABeoAAAX3AAAF/QAABhYAAAYnAAAGRAAABmEAAAZ+AAAGkAAABrQAAAbIAAAG2QAABucAAAcEAAAHGwAAByoAAAc1AAAHWAAAB18AAAeFAAAHmQAAB6MAAAfHAAAH3QAACBYAAAgpAAAIOgAACFIAAAhiAAAIdwAACJYAAAidAAAIrgAACLUAAAjEAAAIzgAACOAAAAj5AAAJGQAACUYAAAljAAAJdAAACYsAAAmVAAAJogAACa8AAAm8AAAJ0wAACeoAAAn3AAAKCQAAChIAAAoeAAAKcQAACnkAAAqGAAAKkAAACpsAAArOAAAK7QAACxwAAAs8AAALdQAAC4gAAAueAAALwAAAC8cAAAvRAAAL3QAAC+8AAAv+AAAMEAAADCUAAAw8AAAMVgAADG0AAAx8AAAMlgAADLoAAAzUAAAM4wAADP4AAA0jAAANUgAADXQAAA2KAAANnQAADbAAAA3DAAAN1gAADfUAAA4UAAAOKwAADkIAAA5ZAAAOcAAADogAAA6yAAAOwQAADusAAA74AAAPBwAADx4AAA81AAAPPwAAD00AAA9aAAAPhgAAD7kAAA/DAAAPzgAAD9oAAA/uAAAQAwAAEB0AABBNAAAQfgAAEJoAABC2AAAQyQAAEPgAABESAAARJQAAETIAABFBAAARTwAAEWIAABF2AAARigAAEZ4AABG2AAARzQAAEfMAABH8AAASCgAAEi4AABJeAAASlwAAEsMAABL3AAATMwAAE1oAABOiAAAT3AAAFBIAABQ8AAAUcwAAFLIAABTlAAAVHwAAFUAAABVsAAAVpAAAFcsAABX9AAAWMwAAFlUAABabAAAW0gAAFwsAABcxAAAXYQAAF54AABfMAAAYBAAAGDgAABhpAAAYmAAAGMkAABj7AAAZIQAAGXAAABmWAAAZugAAGeYAABoIAAAaKwAAGloAABqAAAAasgAAGuUAABsXAAAbPQAAG3YAABufAAAbxQAAG+kAABwcAAAcSAAAHHUAAByVAAAcygAAHP0AAB0uAAAdYgAAHZgAAB3FAAAeFQAAHkAAAB5pAAAemQAAHr8AAB7nAAAfGwAAH0YAAB94AAAfqwAAH94AACAHAAAgPwAAIGoAACCVAAAguQAAIOYAACEOAAAhPQAAIWEAACGEAAAhiwAAIZYAACGlAAAhugAAIc8AACICAAAiJQAAIksAACLTAAAi2gAAIuUAACLsAAAi9wAAIv4AACMJAAAjEAAAIxsAACMjAAAjMAAAI0IAACNgAAAjlwAAI6cAACPAAAAj2QAAI+oAACQOAAAkSgAAJMAAACVyAAAmJwAAJkwAACZwAAAmoQAAJuAAACciAAAnhAAAJ6QAACgZAAAoagAAKHsAACibAAAovgAAKNcAACjXAAAo4gAAKP4AACkKAAApFAAAKR4AACktAAApPAAAKUQAAClMAAApWQAAKWUAAClzAAApgQAAKYwAACmWAAApoAAAKagAACm1AAApzAAAKdQAACnxAAAqFwAAKiEAACo0AAAqQAAAKlQAACpqAAAqggAAKp8AACq2AAAq0AAAKvkAACsEAAArEAAAKyQAACs/AAArUQAAK3AAACuNAAArogAAK8MAACvZAAAr5AAAK/AAACv+AAAsIQAALCoAACw2AAAsQQAALE8AACxYAAAsZQAALHAAACx+AAAshwAALJwAACy0AAAsxwAALNIAACzcAAAs8QAALQkAAC0bAAAtJwAALS4AAC0+AAAtRQAALVEAAC1gAAAtfQAALZoAAC24AAAt2QAALfkAAC4aAAAuQQAALnMAAC6cAAAuxwAALucAAC8IAAAvKwAAL2EAAC+IAAAvrgAAL9gAADACAAAwKAAAME8AADB8AAAwrwAAMN4AADEPAAAxOwAAMWcAADGYAAAx0AAAMgEAADIkAAAyRwAAMmsAADKRAAAytwAAMt4AADMKAAAzQQAAM3AAADOgAAAzxQAAM+sAADQTAAA0SwAANHYAADSiAAA00AAANQEAADUsAAA1WAAANYoAADXAAAA19AAANioAADZbAAA2iwAANr4AADb7AAA3KAAAN10AADeTAAA3xAAAN9cAADfuAAA4BgAAOB4AADg4AAA4XAAAOIIAADiqAAA4wwAAON4AADkHAAA5KgAAOVYAADl9AAA5ogAAOcgAADnjAAA6AQAAOicAADo9AAA6VQAAOm0AADqGAAA6oQAAOroAADrWAAA6+gAAOycAADtPAAA7YwAAO3wAADuWAAA7sgAAO9cAADwAAAA8GQAAPDQAADxTAAA8cQAAPIQAADybAAA8tAAAPM0AADzoAAA9DgAAPScAAD1CAAA9ZQAAPZEAAD25AAA93gAAPfgAAD4WAAA+PQAAPlIAAD5qAAA+hwAAPqEAAD69AAA+4QAAPw4AAD83AAA/SgAAP2MAAD+AAAA/mQAAP7IAAD/OAABACQAAQCMAAEBAAABAYwAAQJAAAEC4AABA1AAAQOoAAEEEAABBIwAAQUIAAEFpAABBfQAAQZQAAEGqAABBwgAAQdwAAEIBAABCLwAAQmIAAEJ7AABClQAAQrYAAELdAABDAgAAQx8AAEM/AABDYAAAQ4UAAEO0AABD1wAAQ/wAAEQpAABEXwAARJAAAESvAABE0wAARPoAAEUsAABFUwAARYsAAEW5AABF1AAARfIAAEYQAABGMgAARlMAAEZ1AABGngAARs0AAEbjAABG/AAARxcAAEcxAABHTQAAR3EAAEeZAABHqgAAR74AAEfUAABH6gAASAIAAEgkAABIRgAASHcAAEiOAABIpwAASMgAAEjnAABJCQAASSUAAElFAABJZgAASYsAAEnAAABJ7AAASgsAAEo7AABKdQAASpAAAEqtAABKzAAASu8AAEsOAABLMAAAS10AAEuJAABLnAAAS7MAAEvNAABL5gAAS/gAAEwLAABMHgAATDIAAExIAABMaAAATIkAAEy4AABMzQAATOQAAE0BAABNIgAATUQAAE1cAABNbAAATYEAAE2XAABNrgAATccAAE3rAABOBAAAThwAAE48AABOZgAATo0AAE6vAABOygAATuYAAE8EAABPKAAAT0YAAE9oAABPlgAAT7cAAE/bAABQBwAAUDoAAFBpAABQiwAAUKoAAFDMAABQ7wAAURQAAFE6AABRXgAAUYYAAFG2AABR7gAAUiAAAFI+AABSXgAAUoEAAFKlAABS0gAAUu0AAFMLAABTLgAAU00AAFNvAABTjwAAU7EAAFPdAABUEAAAVDwAAFRrAABUjQAAVK0AAFTQAABU9AAAVRoAAFVKAABVegAAVZkAAFW6AABV3gAAVgoAAFY/AABWbwAAVpQAAFa3AABW0QAAVu8AAFcOAABXSQAAV2gAAFeKAABXqgAAV8wAAFf1AABYIgAAWE4AAFh8AABYngAAWMMAAFjqAABZFgAAWVIAAFmFAABZqwAAWdUAAFoVAABaSgAAWm0AAFqTAABavQAAWuUAAFsPAABbQAAAW14AAFt2AABbkQAAW60AAFvMAABcBwAAXCUAAFxFAABcbQAAXJUAAFy+AABc4gAAXQgAAF01AABddAAAXacAAF3OAABd+QAAXiUAAF5VAABegwAAXrMAAF7zAABfFAAAXzsAAF9lAABfjQAAX7gAAF/SAABf8wAAYCUAAGA/AABgWQAAYHMAAGClAABgwgAAYOoAAGEiAABhPgAAYVwAAGGCAABhrAAAYcoAAGHkAABiAQAAYh8AAGJAAABiXgAAYoAAAGKqAABi1wAAYukAAGL/AABjGQAAYy8AAGNGAABjXwAAY4IAAGOnAABjvwAAY9kAAGP7AABkJgAAZEwAAGRwAABklQAAZK8AAGTVAABk6gAAZQIAAGUbAABlNQAAZVEAAGVsAABliQAAZa0AAGXaAABmAgAAZhUAAGYtAABmRQAAZl4AAGZ5AABmlAAAZrAAAGbUAABm/AAAZxQAAGcmAABnPQAAZ2EAAGd5AABnkQAAZ6sAAGfQAABn9wAAaBAAAGgrAABoTQAAaHgAAGifAABouwAAaOEAAGj2AABpDwAAaSgAAGlEAABpYQAAaXwAAGmZAABpvgAAaewAAGoVAABqLAAAakYAAGpeAABqeQAAapYAAGqxAABqzwAAav0AAGsnAABrRAAAa1sAAGt3AABrngAAa6sAAGu9AABrzwAAa+UAAGwEAABsJQAAbDkAAGxPAABsbQAAbIoAAGygAABstwAAbNkAAGzxAABtDQAAbS0AAG1eAABtewAAba0AAG3DAABt3gAAbfwAAG4YAABuNgAAblsAAG6AAABujwAAbqMAAG63AABuzwAAbuUAAG79AABvHQAAbzwAAG9KAABvXAAAb24AAG+BAABvlwAAb7UAAG/JAABv4AAAb/4AAHAbAABwMQAAcEoAAHB8AABwmQAAcLAAAHDMAABw6gAAcQcAAHEnAABxNwAAcUsAAHFgAABxeAAAcY4AAHGmAABxyAAAcdQAAHHkAABx9AAAcgUAAHIZAAByNgAAclUAAHJnAAByewAAcpcAAHKyAABy0AAAcvAAAHMGAABzGgAAczMAAHNPAABzagAAc44AAHOdAABzsQAAc8YAAHPcAABz9QAAdBgAAHQuAAB0RgAAdGcAAHSMAAB0pQAAdLoAAHTTAAB08QAAdQoAAHUlAAB1QgAAdWgAAHWOAAB1uAAAdfMAAHYPAAB2LAAAdlAAAHZ+AAB2pwAAds4AAHb3AAB3FAAAdz0AAHdTAAB3bQAAd4kAAHemAAB3wwAAd+IAAHgJAAB4OAAAeF4AAHh1AAB4kAAAeKUAAHi+AAB42wAAePQAAHkPAAB5LAAAeVQAAHl+AAB5mgAAebcAAHncAAB6BQAAei8AAHpOAAB6ZgAAeoIAAHqeAAB6vgAAet0AAHr+AAB7JQAAe1cAAHuEAAB7mwAAe7YAAHvVAAB8BQAAfDAAAHxKAAB8ZwAAfHYAAHyKAAB8ngAAfLMAAHzKAAB87AAAfRcAAH0tAAB9RQAAfWQAAH2DAAB9pwAAfb8AAH3ZAAB99wAAfhgAAH40AAB+ZwAAfn4AAH6aAAB+ugAAftgAAH73AAB/HwAAf0YAAH9XAAB/ZwAAf3oAAH+NAAB/ogAAf7kAAH/aAAB/8AAAgAgAAIAoAACARgAAgGEAAICUAACAsQAAgNcAAIEFAACBHgAAgTsAAIFbAACBfAAAgaQAAIHNAACB3wAAgfQAAIINAACCJQAAgkcAAIJUAACCZQAAgnYAAIKJAACCngAAgr4AAILSAACC6AAAgwUAAIMiAACDOAAAg0sAAINiAACDegAAg5MAAIOuAACDxwAAg+IAAIQFAACEMQAAhFkAAIR+AACEmgAAhLcAAITXAACE+AAAhRkAAIU9AACFYAAAhYQAAIWxAACF5wAAhhYAAIZHAACGZQAAhoYAAIapAACGzgAAhvIAAIcYAACHRgAAh30AAIetAACHyQAAh+kAAIgKAACILQAAiFwAAIiMAACIrwAAiNQAAIkBAACJNwAAiWUAAImWAACJtQAAidgAAIn7AACKIQAAikcAAIpvAACKngAAitYAAIsHAACLJQAAi10AAIt2AACLkgAAi64AAIvNAACL6wAAjAsAAIwzAACMWgAAjHsAAIygAACMygAAjPMAAI0kAACNSQAAjYYAAI2mAACNywAAjeMAAI3/AACOHAAAjjwAAI5oAACOoQAAjsAAAI7nAACPDQAAjy4AAI9TAACPewAAj6AAAI/JAACP+gAAkBEAAJArAACQRQAAkGEAAJB/AACQqwAAkMgAAJDnAACRDgAAkTQAAJFdAACRewAAkZ4AAJHDAACR6AAAkg4AAJIoAACSRgAAkmkAAJKJAACSqwAAktUAAJMDAACTGwAAkzYAAJNSAACTbwAAk44AAJOsAACTywAAk/MAAJQkAACUTQAAlHYAAJSXAACUwgAAlNoAAJT2AACVFAAAlTEAAJVSAACVcAAAlZAAAJW4AACV6gAAlhYAAJY3AACWUAAAlm4AAJaMAACWtgAAluEAAJcAAACXFwAAlzIAAJdOAACXhQAAl6IAAJfBAACX3wAAl/4AAJgmAACYVwAAmIAAAJiqAACYwgAAmN8AAJj7AACZHQAAmTwAAJlcAACZhgAAmbkAAJnlAACZ/QAAmhoAAJo4AACaVwAAmngAAJqYAACauQAAmuIAAJsVAACbQQAAm1sAAJt6AACbnAAAm8gAAJvZAACb7wAAnAUAAJwcAACcNgAAnE4AAJxoAACciAAAnKkAAJzFAACc5QAAnQUAAJ0wAACdTgAAnYQAAJ2eAACdvAAAnd4AAJ3+AACeIAAAnkoAAJ5zAACehgAAnp0AAJ64AACe1AAAnvYAAJ8YAACfKgAAn0AAAJ9WAACfcAAAn4gAAJ+jAACfxQAAn+YAAKADAACgNwAAoFgAAKB9AACgmAAAoLUAAKDUAACg9gAAoRYAAKFAAAChagAAoX4AAKGWAAChrgAAocoAAKHkAACiAAAAoiQAAKJKAACiWgAAom4AAKKCAACimgAAorAAAKLIAACi6AAAowcAAKMpAACjQQAAo1sAAKNvAACjiAAAo6IAAKO/AACj2wAAo/gAAKQeAACkRAAApFUAAKRpAACkfgAApK4AAKTEAACk3AAApP0AAKUgAAClNwAApVAAAKVxAAClmgAApb8AAKXhAACmBgAAph4AAKZDAACmVwAApm4AAKaGAACmnwAAproAAKbUAACm7wAApxMAAKc/AACnZwAAp4wAAKefAACntgAAp80AAKfnAACoDgAAqB4AAKgxAACoRQAAqFwAAKh+AAColAAAqKwAAKjMAACo7wAAqRAAAKk0AACpRwAAqV0AAKl1AACpkAAAqakAAKnEAACp5wAAqhMAAKo7AACqTgAAqmUAAKp8AACqlgAAqrkAAKrlAACrCwAAqzEAAKtHAACrVwAAq2wAAKuPAACrpAAAq7wAAKveAACsAQAArBgAAKwxAACsUQAArHEAAKyMAACsqwAArN8AAK0JAACtJgAArVsAAK10AACtkQAArbIAAK3TAACt/AAAriQAAK43AACuTgAArmgAAK6DAACuowAArrQAAK7IAACu4AAArvUAAK8LAACvIwAAr0MAAK9lAACvfAAAr5UAAK+2AACv1QAAr+0AALARAACwLQAAsE0AALBwAACwlAAAsL8AALDpAACxCAAAsSIAALFCAACxYAAAsYEAALGUAACxqgAAscQAALHdAACyAAAAsiMAALIyAACyRQAAslcAALJtAACyggAAsp8AALK9AACy1AAAsuIAALL1AACzCAAAsx0AALM0AACzVQAAs2sAALOCAACzoAAAs8gAALPrAAC0DgAAtCUAALQ4AAC0TQAAtGcAALSMAAC0ogAAtLkAALTSAAC09QAAtRkAALVAAAC1WAAAtXIAALWUAAC1uAAAtdIAALXnAAC1/wAAthgAALYyAAC2TgAAtmkAALaGAAC2qwAAttgAALcBAAC3HQAAtzEAALdJAAC3YQAAt3wAALeYAAC3vQAAt84AALfjAAC3+AAAuA8AALgoAAC4TAAAuGQAALh9AAC4ngAAuMEAALjkAAC4+AAAuRAAALkpAAC5QwAAuV8AALl5AAC5lQAAuboAALnoAAC6EQAAuiQAALo7AAC6UwAAum4AALqIAAC6pAAAusgAALr1AAC7GgAAuzYAALtMAAC7ZwAAu3kAALuQAAC7qwAAu8IAALvaAAC79AAAvBoAALwzAAC8TgAAvHEAALyTAAC8sAAAvNEAAL0GAAC9MgAAvVEAAL2HAAC9oQAAvb8AAL3eAAC+AQAAviIAAL5FAAC+WQAAvnEAAL6MAAC+nwAAvrUAAL7LAAC+4wAAvv0AAL8fAAC/QwAAv1wAAL93AAC/mgAAv7sAAL/VAAC/8QAAwA8AAMAxAADAVgAAwIsAAMCwAADA0QAAwQMAAMEfAADBPQAAwVwAAMF/AADBqgAAwb8AAMHXAADB8wAAwg4AAMIzAADCWAAAwmgAAMJ8AADCkAAAwqgAAMK/AADC1wAAwvgAAMMYAADDMQAAw0EAAMNWAADDawAAw4EAAMOZAADDvQAAw9QAAMPtAADEDgAAxDMAAMRVAADEeQAAxJMAAMSwAADEzgAAxO0AAMUOAADFOgAAxVoAAMV8AADFpgAAxdkAAMYCAADGMAAAxkwAAMZsAADGjQAAxrEAAMbTAADG9wAAxyMAAMdYAADHiAAAx6QAAMfDAADH4gAAyAQAAMgdAADIOgAAyFcAAMh2AADIlwAAyLYAAMjfAADJEQAAyToAAMlWAADJhwAAyaMAAMnDAADJ5gAAygsAAMo3AADKbAAAypcAAMqyAADKzwAAyuwAAMsNAADLLQAAy08AAMt5AADLoQAAy8IAAMvbAADL/AAAzCUAAMxAAADMXgAAzHwAAMyeAADMyAAAzOkAAM0MAADNNwAAzWAAAM2BAADNngAAzcsAAM3jAADN/wAAzh8AAM4+AADOXgAAzoYAAM6dAADOuQAAztUAAM71AADPFAAAzzQAAM9cAADPgwAAz5sAAM+3AADP4gAAz/4AANAbAADQOwAA0GQAANCOAADQrAAA0MwAAND0AADRJQAA0VAAANFwAADRiwAA0akAANHIAADR6AAA0goAANIqAADSTAAA0nYAANKpAADS1wAA0vEAANMPAADTLQAA008AANNwAADTkwAA070AANPqAADUDgAA1CwAANRNAADUbgAA1JMAANS3AADU6AAA1QAAANUcAADVPQAA1WgAANWEAADVogAA1cIAANXtAADWGgAA1jkAANZZAADWgQAA1rIAANbeAADXAAAA1xsAANc6AADXWgAA13sAANeeAADXvwAA1+IAANgNAADYQQAA2HAAANiKAADYqAAA2MYAANjoAADZCQAA2SsAANlVAADZiAAA2bMAANnQAADZ8AAA2hIAANo3AADaWgAA2n8AANqvAADayQAA2ugAANsLAADbKgAA20oAANtsAADbmQAA27oAANvdAADcCAAA3DIAANxVAADceAAA3J0AANzDAADc7AAA3RwAAN1BAADdagAA3ZUAAN3AAADd9AAA3jEAAN5RAADedgAA3p8AAN7GAADe7wAA3yAAAN9OAADfaQAA34kAAN+pAADfzQAA3+8AAOATAADgPwAA4GoAAOCPAADgqQAA4McAAODlAADhBAAA4SUAAOFFAADhaAAA4ZMAAOG8AADh6gAA4gwAAOIwAADiUwAA4o8AAOKzAADi2gAA4wUAAOMyAADjXQAA45MAAOO0AADj2AAA4/4AAOQnAADkTgAA5HgAAOSpAADk2QAA5PUAAOUVAADlNQAA5VgAAOV6AADlpQAA5dIAAOXqAADmBgAA5iIAAOZCAADmawAA5ooAAOarAADm0gAA5vkAAOcPAADnKQAA50MAAOdfAADnfQAA56QAAOfbAADn+AAA6BYAAOg8AADoZAAA6I8AAOivAADo0wAA6PsAAOkyAADpWwAA6YUAAOmxAADp3AAA6ggAAOpGAADqfQAA6rcAAOreAADrCAAA6zMAAOthAADrjgAA67wAAOv8AADsMwAA7G0AAOyRAADsuQAA7OEAAO0NAADtRAAA7W8AAO2bAADt2AAA7hAAAO43AADuYwAA7pIAAO7AAADu5gAA7xAAAO9KAADvcwAA76EAAO/FAADv7gAA8BcAAPBBAADwbgAA8KYAAPDRAADw/QAA8TEAAPFhAADxkQAA8cIAAPH5AADyQQAA8nMAAPK9AADy6gAA8xkAAPNOAADzgAAA87QAAPPaAAD0DgAA9DIAAPRaAAD0ggAA9K4AAPTYAAD1BQAA9TgAAPVmAAD1nAAA9eYAAPYYAAD2UgAA9n8AAPaxAAD26AAA9woAAPcwAAD3VgAA94AAAPe1AAD3+QAA+CIAAPhNAAD4gAAA+KsAAPjYAAD5CgAA+TkAAPlbAAD5gQAA+agAAPnTAAD5/AAA+iYAAPpYAAD6jwAA+sYAAPrqAAD7EQAA+zkAAPtzAAD7tgAA+98AAPwKAAD8PgAA/HMAAPy9AAD85wAA/RIAAP1FAAD9ggAA/boAAP3kAAD+DwAA/jwAAP5dAAD+hAAA/q0AAP7YAAD/AgAA/y0AAP9jAAD/oQAA/9UAAP/6AAEAIwABAE0AAQB6AAEAtQABAOEAAQEOAAEBRAABAX4AAQGrAAEB5QABAgkAAQI1AAECYwABApAAAQLMAAEC/wABAyEAAQNHAAEDbgABA6oAAQPSAAED/AABBC8AAQRkAAEEjQABBLcAAQTwAAEFIwABBV8AAQWWAAEFygABBfMAAQYfAAEGQQABBmoAAQaSAAEGuwABBucAAQcQAAEHRAABB3kAAQeeAAEHxwABB/QAAQgeAAEISwABCIMAAQi9AAEI6QABCRYAAQlRAAEJhgABCcQAAQn9AAEKKgABClkAAQqSAAEKtgABCuMAAQsNAAELPgABC2oAAQuYAAELzgABDA0AAQxAAAEMYgABDIEAAQysAAEMzgABDPYAAQ0XAAENQQABDW0AAQ2iAAEN4gABDgQAAQ4oAAEOVAABDn8AAQ6sAAEO1gABDwIAAQ8sAAEPWgABD4YAAQ+0AAEP6wABECsAARBjAAEQkAABELkAARDlAAEREgABEUAAARFxAAERrAABEewAARIkAAESTwABEncAARKhAAESzAABEvYAARMiAAETVwABE4sAAROvAAET0wABE/cAARQbAAEUQgABFGsAARSZAAEUyAABFOwAARUPAAEVNQABFV4AARV/AAEVqAABFdMAARX4AAEWIAABFk8AARZ9AAEWsAABFtoAARcHAAEXNQABF2YAAReWAAEXyAABF/0AARg/AAEYeAABGKUAARjWAAEZBgABGTYAARllAAEZlQABGcwAARoFAAEaLAABGlcAARqDAAEasgABGt8AARsPAAEbRgABG34AARukAAEbyQABG/MAARwWAAEcPQABHGYAARyXAAEcyQABHPkAAR0aAAEdOwABHWUAAR2GAAEdpQABHdMAAR32AAEeGwABHkgAAR50AAEeowABHs8AAR7zAAEfEwABHzoAAR9mAAEfkAABH7oAAR/iAAEgDgABIDkAASBuAAEgowABIMQAASDqAAEhEAABITIAASFbAAEhjQABIcIAASIKAAEiMgABIloAASKLAAEixgABIvwAASMtAAEjUQABI3YAASOiAAEjvQABI9sAASP5AAEkNQABJFQAASR2AAEkogABJMMAASTlAAElDwABJUMAASVvAAElmwABJbcAASXXAAEl+AABJhwAASY/AAEmZAABJpAAASbFAAEm9AABJxEAAScxAAEnUQABJ48AASezAAEn1gABKAQAASgkAAEoSAABKG8AASiXAAEosgABKNAAASjuAAEpDgABKTAAASlbAAEpiAABKakAASnLAAEp9QABKiMAASpPAAEqbAABKo0AASqvAAEq1AABKvgAASseAAErSwABK30AASuaAAErugABK94AASwBAAEsJQABLFoAASyKAAEsqQABLMUAASzlAAEtBgABLSoAAS1ZAAEtfAABLaEAAS3NAAEt+AABLicAAS5XAAEuiAABLq0AAS7WAAEvAwABLzAAAS9lAAEvmgABL8IAAS/tAAEwLAABMGIAATCFAAEwrQABMNgAATECAAExLQABMWEAATGUAAExsgABMdQAATH2AAEyIwABMkAAATJgAAEygAABMqMAATLQAAEy/QABMx8AATNDAAEzbgABM5kAATO+AAEz/AABNCIAATRGAAE0bAABNJQAATS+AAE05wABNRIAATVGAAE1ZQABNYYAATWrAAE1zwABNekAATYGAAE2JAABNkUAATZwAAE2kAABNrIAATbcAAE3BQABNyUAATc+AAE3WgABN3cAATeVAAE3tgABN+EAATgAAAE4IAABOEgAATh1AAE4nwABOMAAATjiAAE5CgABOTYAATljAAE5qgABOdgAAToIAAE6RQABOnQAATqkAAE63AABOx0AATtXAAE7kQABO7wAATvqAAE8GQABPEsAATx8AAE8rgABPOgAAT0sAAE9ZgABPZAAAT2+AAE9+gABPiIAAT5OAAE+ewABPqsAAT7aAAE/CgABP0IAAT+EAAE/wAABP+sAAUAmAAFAUAABQJQAAUC8AAFA6QABQRYAAUFFAAFBdAABQaQAAUHVAAFCDgABQkYAAUKBAAFCvgABQvIAAUMpAAFDYgABQ64AAUPkAAFEMgABRGMAAUSZAAFE0wABRQkAAUVAAAFFiAABRcEAAUXqAAFGFgABRkIAAUZvAAFGngABRs8AAUcGAAFHOQABR4YAAUfHAAFIDgABSEAAAUhrAAFIkQABSL4AAUj1AAFJKwABSVEAAUl7AAFJpgABSdMAAUoCAAFKLwABSl0AAUqUAAFKygABSwIAAUs6AAFLVgABS3YAAUuWAAFL1AABS/gAAUwbAAFMPwABTGsAAUyfAAFMygABTPYAAU0VAAFNNwABTVkAAU1/AAFNowABTcgAAU32AAFOLQABTloAAU54AAFOmgABTtoAAU8AAAFPJQABT1MAAU9vAAFPjwABT68AAU/TAAFP9gABUBoAAVBGAAFQewABUKgAAVDHAAFQ6gABUQ4AAVE1AAFRWgABUYEAAVGwAAFR4AABUf4AAVIgAAFSVgABUncAAVKcAAFSzAABUuoAAVMNAAFTLwABU1UAAVN6AAFToQABU84AAVP7AAFUIQABVEwAAVR6AAFUrwABVNUAAVT5AAFVIQABVU0AAVV4AAFVpAABVdkAAVYNAAFWLAABVlMAAVZxAAFWkwABVrUAAVbbAAFW/wABVyYAAVdUAAFXgQABV6gAAVfmAAFYDQABWDYAAVhgAAFYhQABWK4AAVjaAAFZBAABWTEAAVllAAFZmAABWbgAAVncAAFaBAABWioAAVpcAAFadwABWpcAAVq3AAFa2wABWv0AAVshAAFbTQABW3gAAVuSAAFbsAABW88AAVvvAAFcEQABXDsAAVxoAAFciQABXKsAAVzVAAFc/wABXSoAAV1LAAFdYgABXXwAAV2YAAFdswABXdAAAV3tAAFeDAABXjMAAV5eAAFeeAABXpYAAV60AAFe1AABXvMAAV8TAAFfPQABX28AAV+cAAFfuwABX9QAAV/wAAFgDQABYDoAAWBaAAFgcgABYIwAAWCpAAFgxQABYOQAAWEBAAFhIAABYUcAAWF4AAFhowABYb0AAWHaAAFh9wABYhgAAWI4AAFiWQABYoMAAWKxAAFi0QABYusAAWMIAAFjKQABY0gAAWNqAAFjkgABY8QAAWPxAAFkDQABZCYAAWRBAAFkXAABZHgAAWSVAAFksQABZNAAAWT2AAFlHAABZT4AAWVkAAFliwABZbUAAWXeAAFmDwABZkAAAWZlAAFmmAABZrgAAWbhAAFm+gABZxYAAWcsAAFnRgABZ2EAAWd+AAFnmgABZ7gAAWfeAAFoAgABaCIAAWhHAAFobAABaJQAAWi8AAFo7AABaRAAAWk5AAFpZgABaZkAAWm4AAFp2gABaf0AAWojAAFqSAABanAAAWqgAAFq0AABaugAAWsEAAFrIwABa0EAAWtXAAFrbwABa4cAAWu3AAFr0gABa+0AAWwJAAFsLAABbEUAAWxaAAFscwABbIwAAWyoAAFswwABbOAAAW0GAAFtLwABbUYAAW1hAAFtfQABbZoAAW25AAFt4gABbgAAAW4gAAFuSAABbngAAW6fAAFuuQABbtYAAW71AAFvFwABbzcAAW9ZAAFvgwABb7YAAW/fAAFv+AABcCEAAXA4AAFwUwABcG4AAXCNAAFwtwABcOEAAXD/AAFxHwABcUYAAXF2AAFxngABcbgAAXHVAAFx9AABchYAAXI2AAFyWAABcoIAAXKsAAFyxQABcuIAAXMUAAFzMAABc1AAAXNhAAFzdwABc40AAXOlAAFzvwABc9gAAXPyAAF0FAABdDUAAXRRAAF0bQABdI0AAXSsAAF0xgABdOQAAXUEAAF1LgABdVcAAXVqAAF1fAABdZIAAXWoAAF1wgABdeQAAXX8AAF2FwABdjkAAXZaAAF2dwABdqwAAXbNAAF2/QABdxgAAXc2AAF3VQABd3gAAXeYAAF3vAABd+cAAXf7AAF4EwABeC8AAXhJAAF4bwABeH4AAXiSAAF4pgABeLsAAXjTAAF49gABeQwAAXkkAAF5RAABeVwAAXl5AAF5mgABebkAAXnaAAF57wABeggAAXoiAAF6QAABelwAAXp6AAF6oAABesUAAXrhAAF7AQABeyYAAXtGAAF7ZwABe4kAAXu1AAF71wABe/sAAXwmAAF8XAABfIkAAXyrAAF8zQABfOsAAX0LAAF9LAABfVIAAX11AAF9mAABfbwAAX3rAAF+IQABflIAAX5wAAF+kgABfq0AAX7NAAF+7AABfw0AAX8tAAF/UgABf38AAX+1AAF/4wABgAIAAYAjAAGARQABgGoAAYCPAAGAtQABgOMAAYESAAGBMAABgVIAAYF0AAGBmAABgb0AAYHkAAGCHAABgkoAAYJrAAGCkgABgrwAAYLsAAGDAAABgxgAAYMwAAGDSwABg2UAAYOBAAGDpQABg8gAAYPmAAGECAABhDUAAYRRAAGEcQABhIcAAYShAAGEvgABhNwAAYUBAAGFFQABhS0AAYVFAAGFXgABhXkAAYWeAAGFuAABhdUAAYX5AAGGHAABhjsAAYZoAAGGhgABhqcAAYbMAAGG7wABhx0AAYczAAGHTQABh2oAAYeGAAGHrAABh9EAAYfjAAGH+QABiBMAAYgrAAGIRQABiGcAAYiBAAGInQABiLoAAYjbAAGI+QABiRkAAYlDAAGJcgABiZsAAYnCAAGJ6gABihMAAYpLAAGKdQABiqEAAYrVAAGLCwABizYAAYttAAGLlAABi74AAYvpAAGMFAABjEIAAYxuAAGMnAABjNIAAY0RAAGNRgABjYAAAY2qAAGN1AABjgoAAY5CAAGOagABjpEAAY65AAGO5AABjxoAAY9fAAGPiQABj7UAAY/pAAGQHQABkEgAAZBzAAGQqAABkM4AAZD4AAGRIwABkVIAAZF/AAGRrgABkeUAAZIbAAGSVwABkoEAAZKqAAGS0wABkwEAAZMtAAGTWwABk5EAAZPQAAGUBQABlC0AAZRaAAGUiwABlLwAAZTcAAGU/gABlSAAAZVBAAGVcAABlZQAAZW5AAGV5wABlhQAAZY3AAGWYgABlo8AAZa+AAGW7gABlx8AAZdaAAGXmQABl9EAAZf+AAGYLgABmGEAAZidAAGY2QABmQIAAZkvAAGZXAABmYoAAZm6AAGZ8wABmisAAZpPAAGadAABmpsAAZrEAAGa9gABmycAAZtGAAGbaAABm4sAAZutAAGb2wABnAAAAZwmAAGcVAABnIIAAZyxAAGc3wABnRIAAZ1CAAGdfAABna4AAZ3fAAGeEQABnkcAAZ6EAAGesQABntsAAZ8HAAGfNwABn2UAAZ+WAAGfzwABoAUAAaAmAAGgSgABoG8AAaCTAAGgugABoOsAAaEdAAGhPwABoWAAAaGBAAGhtgABodgAAaH6AAGiJQABolIAAaJ1AAGimQABosYAAaLyAAGjEwABoz0AAaNoAAGjlgABo8IAAaPyAAGkKgABpFAAAaR1AAGkmwABpMIAAaTqAAGlFAABpUUAAaV2AAGlqAABpb8AAaXWAAGl8gABphEAAaYZAAGmMQABplUAAAAHwF6AAEAAAAAAAAANAAAAAEAAAAAAAEAEgA0AAEAAAAAAAIABABGAAEAAAAAAAMANQBKAAEAAAAAAAQAGgB/AAEAAAAAAAUADQCZAAEAAAAAAAYAFwCmAAEAAAAAAAcAGgC9AAEAAAAAAAgAJQDXAAEAAAAAAAkBUgD8AAEAAAAAAAoFCQJOAAEAAAAAAAsAHQdXAAEAAAAAAAwAHQd0AAEAAAAAAA0BSweRAAEAAAAAAA4AGgjcAAMAAQQJAAAAaAj2AAMAAQQJAAEAJAleAAMAAQQJAAIACAmCAAMAAQQJAAMAagmKAAMAAQQJAAQANAn0AAMAAQQJAAUAGgooAAMAAQQJAAYALgpCAAMAAQQJAAcANApwAAMAAQQJAAgASgqkAAMAAQQJAAkC4AruAAMAAQQJAAoKEg3OAAMAAQQJAAsAOhfgAAMAAQQJAAwAOhgaAAMAAQQJAA0ClhhUAAMAAQQJAA4ANBrqAAMAAQQJABEADhseQ29weXJpZ2h0IDIwMjAgU3BvcWEgKGh0dHA6Ly93d3cuc3BvcWEtaGFuLXNhbnMuY29tKVNwb3FhIEhhbiBTYW5zIE5lb0JvbGRWZXJzaW9uIDEuMTAwO0dPT0c7U3BvcWFIYW5TYW5zTmVvLVJlZ3VsYXI7MjAyMTtGTDcxNFNwb3FhIEhhbiBTYW5zIE5lbyBSZWd1bGFyVmVyc2lvbiAxLjEwMFNwb3FhSGFuU2Fuc05lby1SZWd1bGFyU3BvcWEgSGFuIFNhbnMgTmVvIFJlZ3VsYXJTcG9xYSAoaHR0cDovL3d3dy5zcG9xYS1oYW4tc2Fucy5jb20pW1Nwb3FhIEhhbiBTYW5zIE5lb10gRG9uZy1odXVpIEtpbSAgWW91bmdod2EgS2FuZyAgWXVqaW4gTGVlICBbTm90byBTYW5zXSBSeW9rbyBOSVNISVpVS0EgIChrYW5hICYgaWRlb2dyYXBocyk7IFBhdWwgRC4gSHVudCAoTGF0aW4sIEdyZWVrICYgQ3lyaWxsaWMpOyBXZW5sb25nIFpIQU5HICAoYm9wb21vZm8pOyBTYW5kb2xsIENvbW11bmljYXRpb24gLCBTb28teW91bmcgSkFORyAgJiBKb28teWVvbiBLQU5HICAoaGFuZ3VsIGVsZW1lbnRzLCBsZXR0ZXJzICYgc3lsbGFibGVzKSBbTGF0b10gTHVrYXN6IER6aWVkemljIHdpdGggQWRhbSBUZHdhcmRvY2ggYW5kIEJvdGlvIE5pa29sdGNoZXZbTm90byBTYW5zXQpEci4gS2VuIEx1bmRlIChwcm9qZWN0IGFyY2hpdGVjdCwgZ2x5cGggc2V0IGRlZmluaXRpb24gJiBvdmVyYWxsIHByb2R1Y3Rpb24pOyBNYXNhdGFrYSBIQVRUT1JJICAocHJvZHVjdGlvbiAmIGlkZW9ncmFwaCBlbGVtZW50cykKCltMYXRvXQpMYXRvIGlzIGEgc2Fuc2VyaWYgdHlwZWZhY2UgZmFtaWx5IGRlc2lnbmVkIGluIHRoZSBTdW1tZXIgMjAxMCBhbmQgZXh0ZW5kZWQgaW4gdGhlIFN1bW1lciAyMDEzIGJ5IFdhcnNhdy1iYXNlZCBkZXNpZ25lciBMdWthc3ogRHppZWR6aWMgKCJMYXRvIiBtZWFucyAiU3VtbWVyIiBpbiBQb2xpc2gpLiBJdCB0cmllcyB0byBjYXJlZnVsbHkgYmFsYW5jZSBzb21lIHBvdGVudGlhbGx5IGNvbmZsaWN0aW5nIHByaW9yaXRpZXM6IGl0IHNob3VsZCBzZWVtIHF1aXRlICJ0cmFuc3BhcmVudCIgd2hlbiB1c2VkIGluIGJvZHkgdGV4dCBidXQgd291bGQgZGlzcGxheSBzb21lIG9yaWdpbmFsIHRyYWl0cyB3aGVuIHVzZWQgaW4gbGFyZ2VyIHNpemVzLiBUaGUgY2xhc3NpY2FsIHByb3BvcnRpb25zLCBwYXJ0aWN1bGFybHkgdmlzaWJsZSBpbiB0aGUgdXBwZXJjYXNlLCBnaXZlIHRoZSBsZXR0ZXJmb3JtcyBmYW1pbGlhciBoYXJtb255IGFuZCBlbGVnYW5jZS4gQXQgdGhlIHNhbWUgdGltZSwgaXRzIHNsZWVrIHNhbnNlcmlmIGxvb2sgbWFrZXMgZXZpZGVudCB0aGUgZmFjdCB0aGF0IExhdG8gd2FzIGRlc2lnbmVkIGluIHRoZSAyMDEwcywgZXZlbiB0aG91Z2ggaXQgZG9lcyBub3QgZm9sbG93IGFueSBjdXJyZW50IHRyZW5kLiBUaGUgc2VtaS1yb3VuZGVkIGRldGFpbHMgb2YgdGhlIGxldHRlcnMgZ2l2ZSBMYXRvIGEgZmVlbGluZyBvZiB3YXJtdGgsIHdoaWxlIHRoZSBzdHJvbmcgc3RydWN0dXJlIHByb3ZpZGVzIHN0YWJpbGl0eSBhbmQgc2VyaW91c25lc3MuIEluIDIwMTMtMjAxNCwgdGhlIGZhbWlseSB3YXMgZ3JlYXRseSBleHRlbmRlZCAod2l0aCB0aGUgaGVscCBvZiBBZGFtIFR3YXJkb2NoIGFuZCBCb3RpbyBOaWtvbHRjaGV2KSB0byBjb3ZlciAzMDAwKyBnbHlwaHMgb3ZlciBuaW5lIHdlaWdodHMgd2l0aCBpdGFsaWNzLiBJdCBub3cgc3VwcG9ydHMgMTAwKyBMYXRpbi1iYXNlZCBsYW5ndWFnZXMsIDUwKyBDeXJpbGxpYy1iYXNlZCBsYW5ndWFnZXMgYXMgd2VsbCBhcyBHcmVlayBhbmQgSVBBIHBob25ldGljcy4gVGhlIExhdG8gZm9udHMgYXJlIGF2YWlsYWJsZSBmcmVlIG9mIGNoYXJnZSB1bmRlciB0aGUgU0lMIE9wZW4gRm9udCBMaWNlbnNlIGZyb20gaHR0cDovL3d3dy5sYXRvZm9udHMuY29tL2h0dHA6Ly93d3cuc3BvcWEtaGFuLXNhbnMuY29taHR0cDovL3d3dy5zcG9xYS1oYW4tc2Fucy5jb21UaGlzIEZvbnQgU29mdHdhcmUgaXMgbGljZW5zZWQgdW5kZXIgdGhlIFNJTCBPcGVuIEZvbnQgTGljZW5zZSwgVmVyc2lvbiAxLjEuIFRoaXMgRm9udCBTb2Z0d2FyZSBpcyBkaXN0cmlidXRlZCBvbiBhbiAiQVMgSVMiIEJBU0lTLCBXSVRIT1VUIFdBUlJBTlRJRVMgT1IgQ09ORElUSU9OUyBPRiBBTlkgS0lORCwgZWl0aGVyIGV4cHJlc3Mgb3IgaW1wbGllZC4gU2VlIHRoZSBTSUwgT3BlbiBGb250IExpY2Vuc2UgZm9yIHRoZSBzcGVjaWZpYyBsYW5ndWFnZSwgcGVybWlzc2lvbnMgYW5kIGxpbWl0YXRpb25zIGdvdmVybmluZyB5b3VyIHVzZSBvZiB0aGlzIEZvbnQgU29mdHdhcmUuaHR0cDovL3NjcmlwdHMuc2lsLm9yZy9PRkwAQwBvAHAAeQByAGkAZwBoAHQAIAAyADAAMgAwACAAUwBwAG8AcQBhACAAKABoAHQAdABwADoALwAvAHcAdwB3AC4AcwBwAG8AcQBhAC0AaABhAG4ALQBzAGEAbgBzAC4AYwBvAG0AKQBTAHAAbwBxAGEAIABIAGEAbgAgAFMAYQBuAHMAIABOAGUAbwBCAG8AbABkAFYAZQByAHMAaQBvAG4AIAAxAC4AMQAwADAAOwBHAE8ATwBHADsAUwBwAG8AcQBhAEgAYQBuAFMAYQBuAHMATgBlAG8ALQBSAGUAZwB1AGwAYQByADsAMgAwADIAMQA7AEYATAA3ADEANABTAHAAbwBxAGEAIABIAGEAbgAgAFMAYQBuAHMAIABOAGUAbwAgAFIAZQBnAHUAbABhAHIAVgBlAHIAcwBpAG8AbgAgADEALgAxADAAMABTAHAAbwBxAGEASABhAG4AUwBhAG4AcwBOAGUAbwAtAFIAZQBnAHUAbABhAHIAUwBwAG8AcQBhACAASABhAG4AIABTAGEAbgBzACAATgBlAG8AIABSAGUAZwB1AGwAYQByAFMAcABvAHEAYQAgACgAaAB0AHQAcAA6AC8ALwB3AHcAdwAuAHMAcABvAHEAYQAtAGgAYQBuAC0AcwBhAG4AcwAuAGMAbwBtACkAWwBTAHAAbwBxAGEAIABIAGEAbgAgAFMAYQBuAHMAIABOAGUAbwBdACAARABvAG4AZwAtAGgAdQB1AGkAIABLAGkAbQAgrkCz2dcYACAAWQBvAHUAbgBnAGgAdwBhACAASwBhAG4AZwAgrBXGAdZUACAAWQB1AGoAaQBuACAATABlAGUAIMd0xyDJxAAgAFsATgBvAHQAbwAgAFMAYQBuAHMAXQAgAFIAeQBvAGsAbwAgAE4ASQBTAEgASQBaAFUASwBBACCJf1habbxbUAAgACgAawBhAG4AYQAgACYAIABpAGQAZQBvAGcAcgBhAHAAaABzACkAOwAgAFAAYQB1AGwAIABEAC4AIABIAHUAbgB0ACAAKABMAGEAdABpAG4ALAAgAEcAcgBlAGUAawAgACYAIABDAHkAcgBpAGwAbABpAGMAKQA7ACAAVwBlAG4AbABvAG4AZwAgAFoASABBAE4ARwAgXyBlh5+ZACAAKABiAG8AcABvAG0AbwBmAG8AKQA7ACAAUwBhAG4AZABvAGwAbAAgAEMAbwBtAG0AdQBuAGkAYwBhAHQAaQBvAG4AIMCws8zO5LukssjPAMd0wVgALAAgAFMAbwBvAC0AeQBvAHUAbgBnACAASgBBAE4ARwAgx6XCGMYBACAAJgAgAEoAbwBvAC0AeQBlAG8AbgAgAEsAQQBOAEcAIKwVyPzF8AAgACgAaABhAG4AZwB1AGwAIABlAGwAZQBtAGUAbgB0AHMALAAgAGwAZQB0AHQAZQByAHMAIAAmACAAcwB5AGwAbABhAGIAbABlAHMAKQAgAFsATABhAHQAbwBdACAATAB1AGsAYQBzAHoAIABEAHoAaQBlAGQAegBpAGMAIAB3AGkAdABoACAAQQBkAGEAbQAgAFQAZAB3AGEAcgBkAG8AYwBoACAAYQBuAGQAIABCAG8AdABpAG8AIABOAGkAawBvAGwAdABjAGgAZQB2AFsATgBvAHQAbwAgAFMAYQBuAHMAXQAKAEQAcgAuACAASwBlAG4AIABMAHUAbgBkAGUAIAAoAHAAcgBvAGoAZQBjAHQAIABhAHIAYwBoAGkAdABlAGMAdAAsACAAZwBsAHkAcABoACAAcwBlAHQAIABkAGUAZgBpAG4AaQB0AGkAbwBuACAAJgAgAG8AdgBlAHIAYQBsAGwAIABwAHIAbwBkAHUAYwB0AGkAbwBuACkAOwAgAE0AYQBzAGEAdABhAGsAYQAgAEgAQQBUAFQATwBSAEkAIAAgACgAcAByAG8AZAB1AGMAdABpAG8AbgAgACYAIABpAGQAZQBvAGcAcgBhAHAAaAAgAGUAbABlAG0AZQBuAHQAcwApAAoACgBbAEwAYQB0AG8AXQAKAEwAYQB0AG8AIABpAHMAIABhACAAcwBhAG4AcwBlAHIAaQBmACAAdAB5AHAAZQBmAGEAYwBlACAAZgBhAG0AaQBsAHkAIABkAGUAcwBpAGcAbgBlAGQAIABpAG4AIAB0AGgAZQAgAFMAdQBtAG0AZQByACAAMgAwADEAMAAgAGEAbgBkACAAZQB4AHQAZQBuAGQAZQBkACAAaQBuACAAdABoAGUAIABTAHUAbQBtAGUAcgAgADIAMAAxADMAIABiAHkAIABXAGEAcgBzAGEAdwAtAGIAYQBzAGUAZAAgAGQAZQBzAGkAZwBuAGUAcgAgAEwAdQBrAGEAcwB6ACAARAB6AGkAZQBkAHoAaQBjACAAKAAiAEwAYQB0AG8AIgAgAG0AZQBhAG4AcwAgACIAUwB1AG0AbQBlAHIAIgAgAGkAbgAgAFAAbwBsAGkAcwBoACkALgAgAEkAdAAgAHQAcgBpAGUAcwAgAHQAbwAgAGMAYQByAGUAZgB1AGwAbAB5ACAAYgBhAGwAYQBuAGMAZQAgAHMAbwBtAGUAIABwAG8AdABlAG4AdABpAGEAbABsAHkAIABjAG8AbgBmAGwAaQBjAHQAaQBuAGcAIABwAHIAaQBvAHIAaQB0AGkAZQBzADoAIABpAHQAIABzAGgAbwB1AGwAZAAgAHMAZQBlAG0AIABxAHUAaQB0AGUAIAAiAHQAcgBhAG4AcwBwAGEAcgBlAG4AdAAiACAAdwBoAGUAbgAgAHUAcwBlAGQAIABpAG4AIABiAG8AZAB5ACAAdABlAHgAdAAgAGIAdQB0ACAAdwBvAHUAbABkACAAZABpAHMAcABsAGEAeQAgAHMAbwBtAGUAIABvAHIAaQBnAGkAbgBhAGwAIAB0AHIAYQBpAHQAcwAgAHcAaABlAG4AIAB1AHMAZQBkACAAaQBuACAAbABhAHIAZwBlAHIAIABzAGkAegBlAHMALgAgAFQAaABlACAAYwBsAGEAcwBzAGkAYwBhAGwAIABwAHIAbwBwAG8AcgB0AGkAbwBuAHMALAAgAHAAYQByAHQAaQBjAHUAbABhAHIAbAB5ACAAdgBpAHMAaQBiAGwAZQAgAGkAbgAgAHQAaABlACAAdQBwAHAAZQByAGMAYQBzAGUALAAgAGcAaQB2AGUAIAB0AGgAZQAgAGwAZQB0AHQAZQByAGYAbwByAG0AcwAgAGYAYQBtAGkAbABpAGEAcgAgAGgAYQByAG0AbwBuAHkAIABhAG4AZAAgAGUAbABlAGcAYQBuAGMAZQAuACAAQQB0ACAAdABoAGUAIABzAGEAbQBlACAAdABpAG0AZQAsACAAaQB0AHMAIABzAGwAZQBlAGsAIABzAGEAbgBzAGUAcgBpAGYAIABsAG8AbwBrACAAbQBhAGsAZQBzACAAZQB2AGkAZABlAG4AdAAgAHQAaABlACAAZgBhAGMAdAAgAHQAaABhAHQAIABMAGEAdABvACAAdwBhAHMAIABkAGUAcwBpAGcAbgBlAGQAIABpAG4AIAB0AGgAZQAgADIAMAAxADAAcwAsACAAZQB2AGUAbgAgAHQAaABvAHUAZwBoACAAaQB0ACAAZABvAGUAcwAgAG4AbwB0ACAAZgBvAGwAbABvAHcAIABhAG4AeQAgAGMAdQByAHIAZQBuAHQAIAB0AHIAZQBuAGQALgAgAFQAaABlACAAcwBlAG0AaQAtAHIAbwB1AG4AZABlAGQAIABkAGUAdABhAGkAbABzACAAbwBmACAAdABoAGUAIABsAGUAdAB0AGUAcgBzACAAZwBpAHYAZQAgAEwAYQB0AG8AIABhACAAZgBlAGUAbABpAG4AZwAgAG8AZgAgAHcAYQByAG0AdABoACwAIAB3AGgAaQBsAGUAIAB0AGgAZQAgAHMAdAByAG8AbgBnACAAcwB0AHIAdQBjAHQAdQByAGUAIABwAHIAbwB2AGkAZABlAHMAIABzAHQAYQBiAGkAbABpAHQAeQAgAGEAbgBkACAAcwBlAHIAaQBvAHUAcwBuAGUAcwBzAC4AIABJAG4AIAAyADAAMQAzAC0AMgAwADEANAAsACAAdABoAGUAIABmAGEAbQBpAGwAeQAgAHcAYQBzACAAZwByAGUAYQB0AGwAeQAgAGUAeAB0AGUAbgBkAGUAZAAgACgAdwBpAHQAaAAgAHQAaABlACAAaABlAGwAcAAgAG8AZgAgAEEAZABhAG0AIABUAHcAYQByAGQAbwBjAGgAIABhAG4AZAAgAEIAbwB0AGkAbwAgAE4AaQBrAG8AbAB0AGMAaABlAHYAKQAgAHQAbwAgAGMAbwB2AGUAcgAgADMAMAAwADAAKwAgAGcAbAB5AHAAaABzACAAbwB2AGUAcgAgAG4AaQBuAGUAIAB3AGUAaQBnAGgAdABzACAAdwBpAHQAaAAgAGkAdABhAGwAaQBjAHMALgAgAEkAdAAgAG4AbwB3ACAAcwB1AHAAcABvAHIAdABzACAAMQAwADAAKwAgAEwAYQB0AGkAbgAtAGIAYQBzAGUAZAAgAGwAYQBuAGcAdQBhAGcAZQBzACwAIAA1ADAAKwAgAEMAeQByAGkAbABsAGkAYwAtAGIAYQBzAGUAZAAgAGwAYQBuAGcAdQBhAGcAZQBzACAAYQBzACAAdwBlAGwAbAAgAGEAcwAgAEcAcgBlAGUAawAgAGEAbgBkACAASQBQAEEAIABwAGgAbwBuAGUAdABpAGMAcwAuACAAVABoAGUAIABMAGEAdABvACAAZgBvAG4AdABzACAAYQByAGUAIABhAHYAYQBpAGwAYQBiAGwAZQAgAGYAcgBlAGUAIABvAGYAIABjAGgAYQByAGcAZQAgAHUAbgBkAGUAcgAgAHQAaABlACAAUwBJAEwAIABPAHAAZQBuACAARgBvAG4AdAAgAEwAaQBjAGUAbgBzAGUAIABmAHIAbwBtACAAaAB0AHQAcAA6AC8ALwB3AHcAdwAuAGwAYQB0AG8AZgBvAG4AdABzAC4AYwBvAG0ALwBoAHQAdABwADoALwAvAHcAdwB3AC4AcwBwAG8AcQBhAC0AaABhAG4ALQBzAGEAbgBzAC4AYwBvAG0AaAB0AHQAcAA6AC8ALwB3AHcAdwAuAHMAcABvAHEAYQAtAGgAYQBuAC0AcwBhAG4AcwAuAGMAbwBtAFQAaABpAHMAIABGAG8AbgB0ACAAUwBvAGYAdAB3AGEAcgBlACAAaQBzACAAbABpAGMAZQBuAHMAZQBkACAAdQBuAGQAZQByACAAdABoAGUAIABTAEkATAAgAE8AcABlAG4AIABGAG8AbgB0ACAATABpAGMAZQBuAHMAZQAsACAAVgBlAHIAcwBpAG8AbgAgADEALgAxAC4AIABUAGgAaQBzACAARgBvAG4AdAAgAFMAbwBmAHQAdwBhAHIAZQAgAGkAcwAgAGQAaQBzAHQAcgBpAGIAdQB0AGUAZAAgAG8AbgAgAGEAbgAgACIAQQBTACAASQBTACIAIABCAEEAUwBJAFMALAAgAFcASQBUAEgATwBVAFQAIABXAEEAUgBSAEEATgBUAEkARQBTACAATwBSACAAQwBPAE4ARABJAFQASQBPAE4AUwAgAE8ARgAgAEEATgBZACAASwBJAE4ARAAsACAAZQBpAHQAaABlAHIAIABlAHgAcAByAGUAcwBzACAAbwByACAAaQBtAHAAbABpAGUAZAAuACAAUwBlAGUAIAB0AGgAZQAgAFMASQBMACAATwBwAGUAbgAgAEYAbwBuAHQAIABMAGkAYwBlAG4AcwBlACAAZgBvAHIAIAB0AGgAZQAgAHMAcABlAGMAaQBmAGkAYwAgAGwAYQBuAGcAdQBhAGcAZQAsACAAcABlAHIAbQBpAHMAcwBpAG8AbgBzACAAYQBuAGQAIABsAGkAbQBpAHQAYQB0AGkAbwBuAHMAIABnAG8AdgBlAHIAbgBpAG4AZwAgAHkAbwB1AHIAIAB1AHMAZQAgAG8AZgAgAHQAaABpAHMAIABGAG8AbgB0ACAAUwBvAGYAdAB3AGEAcgBlAC4AaAB0AHQAcAA6AC8ALwBzAGMAcgBpAHAAdABzAC4AcwBpAGwALgBvAHIAZwAvAE8ARgBMAFIAZQBnAHUAbABhAHIAAAACAAAAAAAA/4MAMgAAAAAAAAAAAAAAAAAAAAAAAAAAC+kAAAADAAQABQAGAAcACAAJAAoACwAMAA0ADgAPABAAEQASABMAFAAVABYAFwAYABkAGgAbABwAHQAeAB8AIAAhACIAIwAkACUAJgAnACgAKQAqACsALAAtAC4ALwAwADEAMgAzADQANQA2ADcAOAA5ADoAOwA8AD0APgA/AEAAQQBCAEMARABFAEYARwBIAEkASgBLAEwATQBOAE8AUABRAFIAUwBUAFUAVgBXAFgAWQBaAFsAXABdAF4AXwBgAGEAowC9AJYAhgCOAKkAgwCTAPIA8wCNAIgAwwDeAPEAqgD1APQA9gCiAPAAuADhANwAtgC3ALQAtQCCAMIBAgCrAMYBAwEEAL4AvwEFAQYBBwEIAQkBCgCMAQsBDAENAQ4BDwEQAREBEgETARQBFQEWARcBGAEZARoBGwEcAR0BHgEfASABIQEiASMBJAElASYBJwEoASkBKgErASwAmAEtAS4BLwEwAJoAmQClATEAkgEyATMBNAE1ATYAnAE3ATgBOQE6ATsBPAE9AI8BPgCUAJUBPwFAAUEBQgFDAUQBRQFGAUcBSAFJAUoBSwFMAU0BTgFPAVABUQFSAVMBVAFVAVYBVwFYAVkBWgFbAVwBXQFeAV8BYAFhAWIBYwFkAWUBZgFnAWgBaQFqAWsBbAFtAW4BbwFwAXEBcgFzAXQBdQF2AXcBeAF5AXoBewF8AX0BfgF/AYABgQGCAYMBhAGFAYYBhwGIAYkBigGLAYwBjQGOAY8BkAGRAZIBkwGUAZUBlgGXAZgBmQGaAZsBnAGdAZ4BnwGgAaEBogGjAaQBpQGmAacBqAGpAaoBqwGsAa0BrgGvAbABsQGyAbMBtAG1AbYBtwG4AbkBugG7AbwBvQG+Ab8BwAHBAcIBwwHEAcUBxgHHAcgByQHKAcsBzAHNAc4BzwHQAdEB0gHTAdQB1QHWAdcB2AHZAdoB2wHcAd0B3gHfAeAB4QHiAeMB5AHlAeYB5wHoAekB6gHrAewB7QHuAe8B8AHxAfIB8wH0AfUB9gH3AfgB+QH6AfsB/AH9Af4B/wIAAgECAgIDAgQCBQIGAgcCCAIJAgoCCwIMAg0CDgIPAhACEQISAhMCFAIVAhYCFwIYAhkCGgIbAhwCHQIeAh8CIAIhAiICIwIkAiUCJgInAigCKQIqAisCLAItAi4CLwIwAjECMgIzAjQCNQI2AjcCOAI5AjoCOwI8Aj0CPgI/AkACQQJCAkMCRAJFAkYCRwJIAkkCSgJLAkwCTQJOAk8CUAJRAlICUwJUAlUCVgJXAlgCWQJaAlsCXAJdAl4CXwJgAmECYgJjAmQCZQJmAmcCaAJpAmoCawJsAm0CbgJvAnACcQJyAnMCdAJ1AnYCdwJ4AnkCegJ7AnwCfQJ+An8CgAKBAoICgwKEAoUChgKHAogCiQKKAosCjAKNAo4CjwKQApECkgKTApQClQKWApcCmAKZApoCmwKcAp0CngKfAqACoQKiAqMCpAKlAqYCpwKoAqkCqgKrAqwCrQKuAq8CsAKxArICswK0ArUCtgK3ArgCuQK6ArsCvAK9Ar4CvwLAAsECwgLDAsQCxQLGAscCyALJAsoCywLMAs0CzgLPAtAC0QLSAtMC1ALVAtYC1wLYAtkC2gLbAtwC3QLeAt8C4ALhAuIC4wLkAuUC5gLnAugC6QLqAusC7ALtAu4C7wLwAvEC8gLzAvQC9QL2AvcC+AL5AvoC+wL8Av0C/gL/AwADAQMCAwMDBAMFAwYDBwMIAwkDCgMLAwwDDQMOAw8DEAMRAxIDEwMUAxUDFgMXAxgDGQMaAxsDHAMdAx4DHwMgAyEDIgMjAyQDJQMmAycDKAMpAyoDKwMsAy0DLgMvAzADMQMyAzMDNAM1AzYDNwM4AzkDOgM7AzwDPQM+Az8DQANBA0IDQwNEA0UDRgNHA0gDSQNKA0sDTANNA04DTwNQA1EDUgNTA1QDVQNWA1cDWANZA1oDWwNcA10DXgNfA2ADYQNiA2MDZANlA2YDZwNoA2kDagNrA2wDbQNuA28DcANxA3IDcwN0A3UDdgN3A3gDeQN6A3sDfAN9A34DfwOAA4EDggODA4QDhQOGA4cDiAOJA4oDiwOMA40DjgOPA5ADkQOSA5MDlAOVA5YDlwOYA5kDmgObA5wDnQOeA58DoAOhA6IDowOkA6UDpgOnA6gDqQOqA6sDrAOtA64DrwOwA7EDsgOzA7QDtQO2A7cDuAO5A7oDuwO8A70DvgO/A8ADwQPCA8MDxAPFA8YDxwPIA8kDygPLA8wDzQPOA88D0APRA9ID0wPUA9UD1gPXA9gD2QPaA9sD3APdA94D3wPgA+ED4gPjA+QD5QPmA+cD6APpA+oD6wPsA+0D7gPvA/AD8QPyA/MD9AP1A/YD9wP4A/kD+gP7A/wD/QP+A/8EAAQBBAIEAwQEBAUEBgQHBAgECQQKBAsEDAQNBA4EDwQQBBEEEgQTBBQEFQQWBBcEGAQZBBoEGwQcBB0EHgQfBCAEIQQiBCMEJAQlBCYEJwQoBCkEKgQrBCwELQQuBC8EMAQxBDIEMwQ0BDUENgQ3BDgEOQQ6BDsEPAQ9BD4EPwRABEEEQgRDBEQERQRGBEcESARJBEoESwRMBE0ETgRPBFAEUQRSBFMEVARVBFYEVwRYBFkEWgRbBFwEXQReBF8EYARhBGIEYwRkBGUEZgRnBGgEaQRqBGsEbARtBG4EbwRwBHEEcgRzBHQEdQR2BHcEeAR5BHoEewR8BH0EfgR/BIAEgQSCBIMEhASFBIYEhwSIBIkEigSLBIwEjQSOBI8EkASRBJIEkwSUBJUElgSXBJgEmQSaBJsEnASdBJ4EnwSgBKEEogSjBKQEpQSmBKcEqASpBKoEqwSsBK0ErgSvBLAEsQSyBLMEtAS1BLYEtwS4BLkEugS7BLwEvQS+BL8EwATBBMIEwwTEBMUExgTHBMgEyQTKBMsEzATNBM4EzwTQBNEE0gTTBNQE1QTWBNcE2ATZBNoE2wTcBN0E3gTfBOAE4QTiBOME5ATlBOYE5wToBOkE6gTrBOwE7QTuBO8E8ATxBPIE8wT0BPUE9gT3BPgE+QT6BPsE/AT9BP4E/wUABQEFAgUDBQQFBQUGBQcFCAUJBQoFCwUMBQ0FDgUPBRAFEQUSBRMFFAUVBRYFFwUYBRkFGgUbBRwFHQUeBR8FIAUhBSIFIwUkBSUFJgUnBSgFKQUqBSsFLAUtBS4FLwUwBTEFMgUzBTQFNQU2BTcFOAU5BToFOwU8BT0FPgU/BUAFQQVCBUMFRAVFBUYFRwVIBUkFSgVLBUwFTQVOBU8FUAVRBVIFUwVUBVUFVgVXBVgFWQVaBVsFXAVdBV4FXwVgBWEFYgVjBWQFZQVmBWcFaAVpBWoFawVsBW0FbgVvBXAFcQVyBXMFdAV1BXYFdwV4BXkFegV7BXwFfQV+BX8FgAWBBYIFgwWEBYUFhgWHBYgFiQWKBYsFjAWNBY4FjwWQBZEFkgWTBZQFlQWWBZcFmAWZBZoFmwWcBZ0FngWfBaAFoQWiBaMFpAWlBaYFpwWoBakFqgWrBawFrQWuBa8FsAWxBbIFswW0BbUFtgW3BbgFuQW6BbsFvAW9Bb4FvwXABcEFwgXDBcQFxQXGBccFyAXJBcoFywXMBc0FzgXPBdAF0QXSBdMF1AXVBdYF1wXYBdkF2gXbBdwF3QXeBd8F4AXhBeIF4wXkBeUF5gXnBegF6QXqBesF7AXtBe4F7wXwBfEF8gXzBfQF9QX2BfcF+AX5BfoF+wX8Bf0F/gX/BgAGAQYCBgMGBAYFBgYGBwYIBgkGCgYLBgwGDQYOBg8GEAYRBhIGEwYUBhUGFgYXBhgGGQYaBhsGHAYdBh4GHwYgBiEGIgYjBiQGJQYmBicGKAYpBioGKwYsBi0GLgYvBjAGMQYyBjMGNAY1BjYGNwY4BjkGOgY7BjwGPQY+Bj8GQAZBBkIGQwZEBkUGRgZHBkgGSQZKBksGTAZNBk4GTwZQBlEGUgZTBlQGVQZWBlcGWAZZBloGWwZcBl0GXgZfBmAGYQZiBmMGZAZlBmYGZwZoBmkGagZrBmwGbQZuBm8GcAZxBnIGcwZ0BnUGdgZ3BngGeQZ6BnsGfAZ9Bn4GfwaABoEGggaDBoQGhQaGBocGiAaJBooGiwaMBo0GjgaPBpAGkQaSBpMGlAaVBpYGlwaYBpkGmgabBpwGnQaeBp8GoAahBqIGowakBqUGpganBqgGqQaqBqsGrAatBq4GrwawBrEGsgazBrQGtQa2BrcGuAa5BroGuwa8Br0Gvga/BsAGwQbCBsMGxAbFBsYGxwbIBskGygbLBswGzQbOBs8G0AbRBtIG0wbUBtUG1gbXBtgG2QbaBtsG3AbdBt4G3wbgBuEG4gbjBuQG5QbmBucG6AbpBuoG6wbsBu0G7gbvBvAG8QbyBvMG9Ab1BvYG9wb4BvkG+gb7BvwG/Qb+Bv8HAAcBBwIHAwcEBwUHBgcHBwgHCQcKBwsHDAcNBw4HDwcQBxEHEgcTBxQHFQcWBxcHGAcZBxoHGwccBx0HHgcfByAHIQciByMHJAclByYHJwcoBykHKgcrBywHLQcuBy8HMAcxBzIHMwc0BzUHNgc3BzgHOQc6BzsHPAc9Bz4HPwdAB0EHQgdDB0QHRQdGB0cHSAdJB0oHSwdMB00HTgdPB1AHUQdSB1MHVAdVB1YHVwdYB1kHWgdbB1wHXQdeB18HYAdhB2IHYwdkB2UHZgdnB2gHaQdqB2sHbAdtB24HbwdwB3EHcgdzB3QHdQd2B3cHeAd5B3oHewd8B30Hfgd/B4AHgQeCB4MHhAeFB4YHhweIB4kHigeLB4wHjQeOB48HkAeRB5IHkweUB5UHlgeXB5gHmQeaB5sHnAedB54HnwegB6EHogejB6QHpQemB6cHqAepB6oHqwesB60HrgevB7AHsQeyB7MHtAe1B7YHtwe4B7kHuge7B7wHvQe+B78HwAfBB8IHwwfEB8UHxgfHB8gHyQfKB8sHzAfNB84HzwfQB9EH0gfTB9QH1QfWB9cH2AfZB9oH2wfcB90H3gffB+AH4QfiB+MH5AflB+YH5wfoB+kH6gfrB+wH7QfuB+8H8AfxB/IH8wf0B/UH9gf3B/gH+Qf6B/sH/Af9B/4H/wgACAEIAggDCAQIBQgGCAcICAgJCAoICwgMCA0IDggPCBAIEQgSCBMIFAgVCBYIFwgYCBkIGggbCBwIHQgeCB8IIAghCCIIIwgkCCUIJggnCCgIKQgqCCsILAgtCC4ILwgwCDEIMggzCDQINQg2CDcIOAg5CDoIOwg8CD0IPgg/CEAIQQhCCEMIRAhFCEYIRwhICEkISghLCEwITQhOCE8IUAhRCFIIUwhUCFUIVghXCFgIWQhaCFsIXAhdCF4IXwhgCGEIYghjCGQIZQhmCGcIaAhpCGoIawhsCG0IbghvCHAIcQhyCHMIdAh1CHYIdwh4CHkIegh7CHwIfQh+CH8IgAiBCIIIgwiECIUIhgiHCIgIiQiKCIsIjAiNCI4IjwiQCJEIkgiTCJQIlQiWCJcImAiZCJoImwicCJ0IngifCKAIoQiiCKMIpAilCKYIpwioCKkIqgirCKwIrQiuCK8IsAixCLIIswi0CLUItgi3CLgIuQi6CLsIvAi9CL4IvwjACMEIwgjDCMQIxQjGCMcIyAjJCMoIywjMCM0IzgjPCNAI0QjSCNMI1AjVCNYI1wjYCNkI2gjbCNwI3QjeCN8I4AjhCOII4wjkCOUI5gjnCOgI6QjqCOsI7AjtCO4I7wjwCPEI8gjzCPQI9Qj2CPcI+Aj5CPoI+wj8CP0I/gj/CQAJAQkCCQMJBAkFCQYJBwkICQkJCgkLCQwJDQkOCQ8JEAkRCRIJEwkUCRUJFgkXCRgJGQkaCRsJHAkdCR4JHwkgCSEJIgkjCSQJJQkmCScJKAkpCSoJKwksCS0JLgkvCTAJMQkyCTMJNAk1CTYJNwk4CTkJOgk7CTwJPQk+CT8JQAlBCUIJQwlECUUJRglHCUgJSQlKCUsJTAlNCU4JTwlQCVEJUglTCVQJVQlWCVcJWAlZCVoJWwlcCV0JXglfCWAJYQliCWMJZAllCWYJZwloCWkJaglrCWwJbQluCW8JcAlxCXIJcwl0CXUJdgl3CXgJeQl6CXsJfAl9CX4JfwmACYEJggmDCYQJhQmGCYcJiAmJCYoJiwmMCY0JjgmPCZAJkQmSCZMJlAmVCZYJlwmYCZkJmgmbCZwJnQmeCZ8JoAmhCaIJowmkCaUJpgmnCagJqQmqCasJrAmtCa4JrwmwCbEJsgmzCbQJtQm2CbcJuAm5CboJuwm8Cb0Jvgm/CcAJwQnCCcMJxAnFCcYJxwnICckJygnLCcwJzQnOCc8J0AnRCdIJ0wnUCdUJ1gnXCdgJ2QnaCdsJ3AndCd4J3wngCeEJ4gnjCeQJ5QnmCecJ6AnpCeoJ6wnsCe0J7gnvCfAJ8QnyCfMJ9An1CfYJ9wn4CfkJ+gn7CfwJ/Qn+Cf8KAAoBCgIKAwoECgUKBgoHCggKCQoKCgsKDAoNCg4KDwoQChEKEgoTChQKFQoWChcKGAoZChoKGwocCh0KHgofCiAKIQoiCiMKJAolCiYKJwooCikKKgorCiwKLQouCi8KMAoxCjIKMwo0CjUKNgo3CjgKOQo6CjsKPAo9Cj4KPwpACkEKQgpDCkQKRQpGCkcKSApJCkoKSwpMCk0KTgpPClAKUQpSClMKVApVClYKVwpYClkKWgpbClwKXQpeCl8KYAphCmIKYwpkCmUKZgpnCmgKaQpqCmsKbAptCm4KbwpwCnEKcgpzCnQKdQp2CncKeAp5CnoKewp8Cn0Kfgp/CoAKgQqCCoMKhAqFCoYKhwqICokKigqLCowKjQqOCo8KkAqRCpIKkwqUCpUKlgqXCpgKmQqaCpsKnAqdCp4KnwqgCqEKogqjCqQKpQqmCqcKqAqpCqoKqwqsCq0KrgqvCrAKsQqyCrMKtAq1CrYKtwq4CrkKugq7CrwKvQq+Cr8KwArBCsIKwwrECsUKxgrHCsgKyQrKCssKzArNCs4KzwrQCtEK0grTCtQK1QrWCtcK2ArZCtoK2wrcCt0K3grfCuAK4QriCuMK5ArlCuYK5wroCukK6grrCuwK7QruCu8K8ArxCvIK8wr0CvUK9gr3CvgK+Qr6CvsK/Ar9Cv4K/wsACwELAgsDCwQLBQsGCwcLCAsJCwoLCwsMCw0LDgsPCxALEQsSCxMLFAsVCxYLFwsYCxkLGgsbCxwLHQseCx8LIAshCyILIwskCyULJgsnCygLKQsqCysLLAstCy4LLwswCzELMgszCzQLNQs2CzcLOAs5CzoLOws8Cz0LPgs/C0ALQQtCC0MLRAtFC0YLRwtIC0kLSgtLC0wLTQtOC08LUAtRC1ILUwtUC1ULVgtXC1gLWQtaC1sLXAtdC14LXwtgC2ELYgtjC2QLZQtmC2cLaAtpC2oLawtsC20LbgtvC3ALcQtyC3MLdAt1C3YLdwt4C3kLegt7C3wLfQt+C38LgAuBC4ILgwuEC4ULhguHC4gLiQuKC4sLjAuNC44LjwuQC5ELkguTC5QLlQuWC5cLmAuZC5oLmwucC50LngufC6ALoQuiC6MLpAulC6YLpwuoC6kLqgurC6wLrQuuC68LsAuxC7ILswu0C7ULtgu3C7gLuQu6C7sLvAu9C74LvwvAC8ELwgvDC8QLxQvGC8cLyAvJC8oLywvMC80LzgvPC9AL0QvSC9ML1AvVC9YL1wvYC9kL2gvbC9wL3QveC98L4AvhC+IL4wvkC+UL5gvnC+gL6QvqC+sL7AvtC+4L7wvwC/EL8gvzC/QL9Qv2C/cL+Av5C/oL+wv8C/0L/gv/DAAMAQwCDAMMBAwFDAYMBwwIDAkMCgwLDAwMDQwODA8MEAwRDBIMEwwUDBUMFgwXDBgMGQwaDBsMHAwdDB4MHwwgDCEMIgwjDCQMJQwmDCcMKAwpDCoMKwwsDC0MLgwvDDAMMQwyDDMMNAw1DDYMNww4DDkMOgw7DDwMPQw+DD8MQAxBDEIMQwxEDEUMRgxHDEgMSQxKDEsMTAxNDE4MTwxQDFEMUgxTDFQMVQxWDFcMWAxZDFoMWwxcDF0MXg50d29kb3RlbmxlYWRlcgZtaW51dGUGc2Vjb25kB3VuaTIwM0IHdW5pMjBBOQd1bmkyMTAzB3VuaTIxMDkHdW5pMjExNgd1bmkyMTIxB3VuaTIxMkIHdW5pMjE2MAd1bmkyMTYxB3VuaTIxNjIHdW5pMjE2Mwd1bmkyMTY0B3VuaTIxNjUHdW5pMjE2Ngd1bmkyMTY3B3VuaTIxNjgHdW5pMjE2OQd1bmkyMTcwB3VuaTIxNzEHdW5pMjE3Mgd1bmkyMTczB3VuaTIxNzQHdW5pMjE3NQd1bmkyMTc2B3VuaTIxNzcHdW5pMjE3OAd1bmkyMTc5CWFycm93bGVmdAdhcnJvd3VwCmFycm93cmlnaHQJYXJyb3dkb3duCWFycm93Ym90aAlhcnJvd3VwZG4HdW5pMjE5Ngd1bmkyMTk3B3VuaTIxOTgHdW5pMjE5OQ1hcnJvd2RibHJpZ2h0DGFycm93ZGJsYm90aAl1bml2ZXJzYWwLZXhpc3RlbnRpYWwIZ3JhZGllbnQHZWxlbWVudAhzdWNodGhhdAxwcm9wb3J0aW9uYWwFYW5nbGUKbG9naWNhbGFuZAlsb2dpY2Fsb3IMaW50ZXJzZWN0aW9uBXVuaW9uB3VuaTIyMkMHdW5pMjIyRQl0aGVyZWZvcmUHdW5pMjIzNQd1bmkyMjM2B3VuaTIyM0QHdW5pMjI1MgtlcXVpdmFsZW5jZQd1bmkyMjZBB3VuaTIyNkIMcHJvcGVyc3Vic2V0DnByb3BlcnN1cGVyc2V0DHJlZmxleHN1YnNldA5yZWZsZXhzdXBlcnNldAd1bmkyMjk5B3VuaTIyQTUHdW5pMjMxMgd1bmkyNDYwB3VuaTI0NjEHdW5pMjQ2Mgd1bmkyNDYzB3VuaTI0NjQHdW5pMjQ2NQd1bmkyNDY2B3VuaTI0NjcHdW5pMjQ2OAd1bmkyNDY5B3VuaTI0NkEHdW5pMjQ2Qgd1bmkyNDZDB3VuaTI0NkQHdW5pMjQ2RQd1bmkyNDc0B3VuaTI0NzUHdW5pMjQ3Ngd1bmkyNDc3B3VuaTI0NzgHdW5pMjQ3OQd1bmkyNDdBB3VuaTI0N0IHdW5pMjQ3Qwd1bmkyNDdEB3VuaTI0N0UHdW5pMjQ3Rgd1bmkyNDgwB3VuaTI0ODEHdW5pMjQ4Mgd1bmkyNDlDB3VuaTI0OUQHdW5pMjQ5RQd1bmkyNDlGB3VuaTI0QTAHdW5pMjRBMQd1bmkyNEEyB3VuaTI0QTMHdW5pMjRBNAd1bmkyNEE1B3VuaTI0QTYHdW5pMjRBNwd1bmkyNEE4B3VuaTI0QTkHdW5pMjRBQQd1bmkyNEFCB3VuaTI0QUMHdW5pMjRBRAd1bmkyNEFFB3VuaTI0QUYHdW5pMjRCMAd1bmkyNEIxB3VuaTI0QjIHdW5pMjRCMwd1bmkyNEI0B3VuaTI0QjUHdW5pMjREMAd1bmkyNEQxB3VuaTI0RDIHdW5pMjREMwd1bmkyNEQ0B3VuaTI0RDUHdW5pMjRENgd1bmkyNEQ3B3VuaTI0RDgHdW5pMjREOQd1bmkyNERBB3VuaTI0REIHdW5pMjREQwd1bmkyNEREB3VuaTI0REUHdW5pMjRERgd1bmkyNEUwB3VuaTI0RTEHdW5pMjRFMgd1bmkyNEUzB3VuaTI0RTQHdW5pMjRFNQd1bmkyNEU2B3VuaTI0RTcHdW5pMjRFOAd1bmkyNEU5BXNoYWRlCWZpbGxlZGJveAd1bmkyNUExB3VuaTI1QTMHdW5pMjVBNAd1bmkyNUE1B3VuaTI1QTYHdW5pMjVBNwd1bmkyNUE4B3VuaTI1QTkHdHJpYWd1cAd1bmkyNUIzB3VuaTI1QjYHdW5pMjVCNwd0cmlhZ2RuB3VuaTI1QkQHdW5pMjVDMAd1bmkyNUMxB3VuaTI1QzYHdW5pMjVDNwd1bmkyNUM4BmNpcmNsZQd1bmkyNUNFB3VuaTI1Q0YHdW5pMjVEMAd1bmkyNUQxB3VuaTI2MDUHdW5pMjYwNgd1bmkyNjBFB3VuaTI2MEYHdW5pMjYxQwd1bmkyNjFFBmZlbWFsZQRtYWxlBXNwYWRlB3VuaTI2NjEEY2x1Ygd1bmkyNjY0BWhlYXJ0B3VuaTI2NjcHdW5pMjY2OAd1bmkyNjY5C211c2ljYWxub3RlB3VuaTI2NkMHdW5pMjY2RAd1bmkzMDAwB3VuaTMwMDEHdW5pMzAwMgd1bmkzMDAzB3VuaTMwMDgHdW5pMzAwOQd1bmkzMDBBB3VuaTMwMEIHdW5pMzAwQwd1bmkzMDBEB3VuaTMwMEUHdW5pMzAwRgd1bmkzMDEwB3VuaTMwMTEHdW5pMzAxMwd1bmkzMDE0B3VuaTMwMTUHdW5pMzEzMQd1bmkzMTMyB3VuaTMxMzMHdW5pMzEzNAd1bmkzMTM1B3VuaTMxMzYHdW5pMzEzNwd1bmkzMTM4B3VuaTMxMzkHdW5pMzEzQQd1bmkzMTNCB3VuaTMxM0MHdW5pMzEzRAd1bmkzMTNFB3VuaTMxM0YHdW5pMzE0MAd1bmkzMTQxB3VuaTMxNDIHdW5pMzE0Mwd1bmkzMTQ0B3VuaTMxNDUHdW5pMzE0Ngd1bmkzMTQ3B3VuaTMxNDgHdW5pMzE0OQd1bmkzMTRBB3VuaTMxNEIHdW5pMzE0Qwd1bmkzMTREB3VuaTMxNEUHdW5pMzE0Rgd1bmkzMTUwB3VuaTMxNTEHdW5pMzE1Mgd1bmkzMTUzB3VuaTMxNTQHdW5pMzE1NQd1bmkzMTU2B3VuaTMxNTcHdW5pMzE1OAd1bmkzMTU5B3VuaTMxNUEHdW5pMzE1Qgd1bmkzMTVDB3VuaTMxNUQHdW5pMzE1RQd1bmkzMTVGB3VuaTMxNjAHdW5pMzE2MQd1bmkzMTYyB3VuaTMxNjMHdW5pMzE4RAd1bmkzMThFB3VuaTMyMDAHdW5pMzIwMQd1bmkzMjAyB3VuaTMyMDMHdW5pMzIwNAd1bmkzMjA1B3VuaTMyMDYHdW5pMzIwNwd1bmkzMjA4B3VuaTMyMDkHdW5pMzIwQQd1bmkzMjBCB3VuaTMyMEMHdW5pMzIwRAd1bmkzMjBFB3VuaTMyMEYHdW5pMzIxMAd1bmkzMjExB3VuaTMyMTIHdW5pMzIxMwd1bmkzMjE0B3VuaTMyMTUHdW5pMzIxNgd1bmkzMjE3B3VuaTMyMTgHdW5pMzIxOQd1bmkzMjFBB3VuaTMyMUIHdW5pMzIxQwd1bmkzMjYwB3VuaTMyNjEHdW5pMzI2Mgd1bmkzMjYzB3VuaTMyNjQHdW5pMzI2NQd1bmkzMjY2B3VuaTMyNjcHdW5pMzI2OAd1bmkzMjY5B3VuaTMyNkEHdW5pMzI2Qgd1bmkzMjZDB3VuaTMyNkQHdW5pMzI2RQd1bmkzMjZGB3VuaTMyNzAHdW5pMzI3MQd1bmkzMjcyB3VuaTMyNzMHdW5pMzI3NAd1bmkzMjc1B3VuaTMyNzYHdW5pMzI3Nwd1bmkzMjc4B3VuaTMyNzkHdW5pMzI3QQd1bmkzMjdCB3VuaTMyN0YHdW5pMzNDMgd1bmkzM0M3B3VuaTMzRDgHdW5pQUMwMAd1bmlBQzAxB3VuaUFDMDQHdW5pQUMwNwd1bmlBQzA4B3VuaUFDMDkHdW5pQUMwQQd1bmlBQzBCB3VuaUFDMTAHdW5pQUMxMQd1bmlBQzEyB3VuaUFDMTMHdW5pQUMxNAd1bmlBQzE1B3VuaUFDMTYHdW5pQUMxNwd1bmlBQzE5B3VuaUFDMUEHdW5pQUMxQgd1bmlBQzFDB3VuaUFDMUQHdW5pQUMyMAd1bmlBQzIzB3VuaUFDMjQHdW5pQUMyQwd1bmlBQzJEB3VuaUFDMkYHdW5pQUMzMAd1bmlBQzMxB3VuaUFDMzgHdW5pQUMzOQd1bmlBQzNDB3VuaUFDNDAHdW5pQUM0Qgd1bmlBQzREB3VuaUFDNTQHdW5pQUM1OAd1bmlBQzVDB3VuaUFDNjUHdW5pQUM3MAd1bmlBQzcxB3VuaUFDNzQHdW5pQUM3Nwd1bmlBQzc4B3VuaUFDN0EHdW5pQUM4MAd1bmlBQzgxB3VuaUFDODMHdW5pQUM4NAd1bmlBQzg1B3VuaUFDODYHdW5pQUM4OQd1bmlBQzhBB3VuaUFDOEIHdW5pQUM4Qwd1bmlBQzkwB3VuaUFDOTQHdW5pQUM5Qwd1bmlBQzlEB3VuaUFDOUYHdW5pQUNBMAd1bmlBQ0ExB3VuaUFDQTgHdW5pQUNBOQd1bmlBQ0FBB3VuaUFDQUMHdW5pQUNBRgd1bmlBQ0IwB3VuaUFDQjcHdW5pQUNCOAd1bmlBQ0I5B3VuaUFDQkIHdW5pQUNCQwd1bmlBQ0JEB3VuaUFDQzEHdW5pQUNDNAd1bmlBQ0M4B3VuaUFDQ0MHdW5pQUNENQd1bmlBQ0Q3B3VuaUFDRTAHdW5pQUNFMQd1bmlBQ0U0B3VuaUFDRTcHdW5pQUNFOAd1bmlBQ0VBB3VuaUFDRUMHdW5pQUNFRgd1bmlBQ0YwB3VuaUFDRjEHdW5pQUNGMwd1bmlBQ0Y1B3VuaUFDRjYHdW5pQUNGQwd1bmlBQ0ZEB3VuaUFEMDAHdW5pQUQwNAd1bmlBRDA2B3VuaUFEMEMHdW5pQUQwRAd1bmlBRDBGB3VuaUFEMTAHdW5pQUQxMQd1bmlBRDE4B3VuaUFEMUMHdW5pQUQyMAd1bmlBRDIyB3VuaUFEMjkHdW5pQUQyQwd1bmlBRDJEB3VuaUFEMzQHdW5pQUQzNQd1bmlBRDM4B3VuaUFEM0MHdW5pQUQ0NAd1bmlBRDQ1B3VuaUFENDcHdW5pQUQ0OQd1bmlBRDUwB3VuaUFENTQHdW5pQUQ1OAd1bmlBRDYwB3VuaUFENjEHdW5pQUQ2Mwd1bmlBRDY1B3VuaUFENkMHdW5pQUQ2RAd1bmlBRDcwB3VuaUFENzMHdW5pQUQ3NAd1bmlBRDc1B3VuaUFENzYHdW5pQUQ3Qgd1bmlBRDdDB3VuaUFEN0QHdW5pQUQ3Rgd1bmlBRDgxB3VuaUFEODIHdW5pQUQ4OAd1bmlBRDg5B3VuaUFEOEMHdW5pQUQ5MAd1bmlBRDlDB3VuaUFEOUQHdW5pQURBNAd1bmlBREI3B3VuaUFEQjgHdW5pQURDMAd1bmlBREMxB3VuaUFEQzQHdW5pQURDOAd1bmlBREQwB3VuaUFERDEHdW5pQUREMwd1bmlBREQ1B3VuaUFEREMHdW5pQURFMAd1bmlBREU0B3VuaUFERUMHdW5pQURGOAd1bmlBREY5B3VuaUFERkMHdW5pQURGRgd1bmlBRTAwB3VuaUFFMDEHdW5pQUUwMgd1bmlBRTA3B3VuaUFFMDgHdW5pQUUwOQd1bmlBRTBCB3VuaUFFMEQHdW5pQUUxMwd1bmlBRTE0B3VuaUFFMzAHdW5pQUUzMQd1bmlBRTM0B3VuaUFFMzcHdW5pQUUzOAd1bmlBRTNBB3VuaUFFNDAHdW5pQUU0MQd1bmlBRTQzB3VuaUFFNDQHdW5pQUU0NQd1bmlBRTQ2B3VuaUFFNEEHdW5pQUU0Qwd1bmlBRTREB3VuaUFFNEUHdW5pQUU1MAd1bmlBRTU0B3VuaUFFNTYHdW5pQUU1Qwd1bmlBRTVEB3VuaUFFNUYHdW5pQUU2MAd1bmlBRTYxB3VuaUFFNjUHdW5pQUU2OAd1bmlBRTY5B3VuaUFFNkMHdW5pQUU2Rgd1bmlBRTcwB3VuaUFFNzgHdW5pQUU3OQd1bmlBRTdCB3VuaUFFN0MHdW5pQUU3RAd1bmlBRTg0B3VuaUFFODUHdW5pQUU4Ngd1bmlBRThDB3VuaUFFOEQHdW5pQUVCQwd1bmlBRUJEB3VuaUFFQkUHdW5pQUVDMAd1bmlBRUM0B3VuaUFFQ0MHdW5pQUVDRAd1bmlBRUNGB3VuaUFFRDAHdW5pQUVEMQd1bmlBRUQzB3VuaUFFRDUHdW5pQUVEOAd1bmlBRUQ5B3VuaUFFREMHdW5pQUVFOAd1bmlBRUVCB3VuaUFFRUQHdW5pQUVGNAd1bmlBRUY4B3VuaUFFRkMHdW5pQUYwNwd1bmlBRjA4B3VuaUFGMDkHdW5pQUYwRAd1bmlBRjEwB3VuaUFGMkMHdW5pQUYyRAd1bmlBRjMwB3VuaUFGMzIHdW5pQUYzMwd1bmlBRjM0B3VuaUFGM0MHdW5pQUYzRAd1bmlBRjNGB3VuaUFGNDEHdW5pQUY0Mgd1bmlBRjQzB3VuaUFGNDUHdW5pQUY0OAd1bmlBRjQ5B3VuaUFGNTAHdW5pQUY1Qwd1bmlBRjVEB3VuaUFGNjQHdW5pQUY2NQd1bmlBRjc4B3VuaUFGNzkHdW5pQUY4MAd1bmlBRjg0B3VuaUFGODgHdW5pQUY5MAd1bmlBRjkxB3VuaUFGOTUHdW5pQUY5Qwd1bmlBRkI4B3VuaUFGQjkHdW5pQUZCQwd1bmlBRkMwB3VuaUFGQzcHdW5pQUZDOAd1bmlBRkM5B3VuaUFGQ0IHdW5pQUZDRAd1bmlBRkNFB3VuaUFGRDQHdW5pQUZEOAd1bmlBRkRDB3VuaUFGRTgHdW5pQUZFOQd1bmlBRkYwB3VuaUFGRjEHdW5pQUZGNAd1bmlBRkY4B3VuaUIwMDAHdW5pQjAwMQd1bmlCMDA0B3VuaUIwMEMHdW5pQjAxMAd1bmlCMDE0B3VuaUIwMUMHdW5pQjAxRAd1bmlCMDI4B3VuaUIwMzAHdW5pQjAzQwd1bmlCMDQ0B3VuaUIwNDUHdW5pQjA0OAd1bmlCMDRBB3VuaUIwNEMHdW5pQjA0RQd1bmlCMDUzB3VuaUIwNTQHdW5pQjA1NQd1bmlCMDU3B3VuaUIwNTkHdW5pQjA1RAd1bmlCMDdDB3VuaUIwN0QHdW5pQjA4MAd1bmlCMDg0B3VuaUIwOEMHdW5pQjA4RAd1bmlCMDhGB3VuaUIwOTEHdW5pQjA5OAd1bmlCMDk5B3VuaUIwOUEHdW5pQjA5Qwd1bmlCMDlGB3VuaUIwQTAHdW5pQjBBMQd1bmlCMEEyB3VuaUIwQTgHdW5pQjBBOQd1bmlCMEFCB3VuaUIwQUMHdW5pQjBBRAd1bmlCMEFFB3VuaUIwQUYHdW5pQjBCMQd1bmlCMEIzB3VuaUIwQjQHdW5pQjBCNQd1bmlCMEI4B3VuaUIwQkIHdW5pQjBCQwd1bmlCMEM0B3VuaUIwQzUHdW5pQjBDNwd1bmlCMEM4B3VuaUIwQzkHdW5pQjBEMAd1bmlCMEQxB3VuaUIwRDQHdW5pQjBENwd1bmlCMEQ4B3VuaUIwRTAHdW5pQjBFMQd1bmlCMEUzB3VuaUIwRTUHdW5pQjBFQwd1bmlCMTA4B3VuaUIxMDkHdW5pQjEwQgd1bmlCMTBDB3VuaUIxMEYHdW5pQjExMAd1bmlCMTEyB3VuaUIxMTMHdW5pQjExOAd1bmlCMTE5B3VuaUIxMUIHdW5pQjExQwd1bmlCMTFEB3VuaUIxMjIHdW5pQjEyMwd1bmlCMTI0B3VuaUIxMjUHdW5pQjEyOAd1bmlCMTJCB3VuaUIxMkMHdW5pQjEzNAd1bmlCMTM1B3VuaUIxMzcHdW5pQjEzOAd1bmlCMTM5B3VuaUIxNDAHdW5pQjE0MQd1bmlCMTQ0B3VuaUIxNDcHdW5pQjE0OAd1bmlCMTUwB3VuaUIxNTEHdW5pQjE1NAd1bmlCMTU1B3VuaUIxNTgHdW5pQjE1Qwd1bmlCMTYwB3VuaUIxNzEHdW5pQjE3OAd1bmlCMTc5B3VuaUIxN0MHdW5pQjE4MAd1bmlCMTgxB3VuaUIxODIHdW5pQjE4OAd1bmlCMTg5B3VuaUIxOEIHdW5pQjE4RAd1bmlCMTkxB3VuaUIxOTIHdW5pQjE5Mwd1bmlCMTk0B3VuaUIxOTgHdW5pQjE5Qwd1bmlCMUE4B3VuaUIxQjAHdW5pQjFDNAd1bmlCMUNDB3VuaUIxRDAHdW5pQjFENAd1bmlCMURDB3VuaUIxREQHdW5pQjFERgd1bmlCMUUxB3VuaUIxRTgHdW5pQjFFOQd1bmlCMUVDB3VuaUIxRjAHdW5pQjFGOAd1bmlCMUY5B3VuaUIxRkIHdW5pQjFGRAd1bmlCMjA0B3VuaUIyMDUHdW5pQjIwOAd1bmlCMjBCB3VuaUIyMEMHdW5pQjIwRAd1bmlCMjE0B3VuaUIyMTUHdW5pQjIxNwd1bmlCMjE5B3VuaUIyMUQHdW5pQjIyMAd1bmlCMjM0B3VuaUIyM0MHdW5pQjI1OAd1bmlCMjVDB3VuaUIyNjAHdW5pQjI2OAd1bmlCMjY5B3VuaUIyNzQHdW5pQjI3NQd1bmlCMjdCB3VuaUIyN0MHdW5pQjI4NAd1bmlCMjg1B3VuaUIyODkHdW5pQjI5MAd1bmlCMjkxB3VuaUIyOTQHdW5pQjI5Nwd1bmlCMjk4B3VuaUIyOTkHdW5pQjI5QQd1bmlCMkEwB3VuaUIyQTEHdW5pQjJBMwd1bmlCMkE1B3VuaUIyQTYHdW5pQjJBNwd1bmlCMkFBB3VuaUIyQUMHdW5pQjJCMAd1bmlCMkI0B3VuaUIyQkMHdW5pQjJDMQd1bmlCMkM4B3VuaUIyQzkHdW5pQjJDQwd1bmlCMkNGB3VuaUIyRDAHdW5pQjJEMgd1bmlCMkQ4B3VuaUIyRDkHdW5pQjJEQgd1bmlCMkREB3VuaUIyRTIHdW5pQjJFNAd1bmlCMkU1B3VuaUIyRTYHdW5pQjJFOAd1bmlCMkVCB3VuaUIyRUMHdW5pQjJFRAd1bmlCMkVFB3VuaUIyRUYHdW5pQjJGMwd1bmlCMkY0B3VuaUIyRjUHdW5pQjJGNwd1bmlCMkY4B3VuaUIyRjkHdW5pQjJGQQd1bmlCMkZCB3VuaUIyRkQHdW5pQjJGRgd1bmlCMzAwB3VuaUIzMDEHdW5pQjMwNAd1bmlCMzA4B3VuaUIzMTAHdW5pQjMxMQd1bmlCMzEzB3VuaUIzMTQHdW5pQjMxNQd1bmlCMzFDB3VuaUIzMjAHdW5pQjM1NAd1bmlCMzU1B3VuaUIzNTYHdW5pQjM1OAd1bmlCMzVCB3VuaUIzNUMHdW5pQjM1RQd1bmlCMzVGB3VuaUIzNjQHdW5pQjM2NQd1bmlCMzY3B3VuaUIzNjkHdW5pQjM2Qgd1bmlCMzZFB3VuaUIzNzAHdW5pQjM3MQd1bmlCMzc0B3VuaUIzNzgHdW5pQjM4MAd1bmlCMzgxB3VuaUIzODMHdW5pQjM4NAd1bmlCMzg1B3VuaUIzOEMHdW5pQjM5MAd1bmlCMzk0B3VuaUIzQTAHdW5pQjNBMQd1bmlCM0E4B3VuaUIzQUMHdW5pQjNDNAd1bmlCM0M1B3VuaUIzQzgHdW5pQjNDQgd1bmlCM0NDB3VuaUIzQ0UHdW5pQjNEMAd1bmlCM0Q0B3VuaUIzRDUHdW5pQjNENwd1bmlCM0Q5B3VuaUIzREIHdW5pQjNERAd1bmlCM0UwB3VuaUIzRTQHdW5pQjNFOAd1bmlCM0ZDB3VuaUI0MTAHdW5pQjQxOAd1bmlCNDFDB3VuaUI0MjAHdW5pQjQyOAd1bmlCNDI5B3VuaUI0MkIHdW5pQjQyRAd1bmlCNDM0B3VuaUI0NTAHdW5pQjQ1MQd1bmlCNDU0B3VuaUI0NTcHdW5pQjQ1OAd1bmlCNDVBB3VuaUI0NjAHdW5pQjQ2MQd1bmlCNDYzB3VuaUI0NjUHdW5pQjQ2Qwd1bmlCNDgwB3VuaUI0ODgHdW5pQjQ5OQd1bmlCNDlEB3VuaUI0QTQHdW5pQjRBOAd1bmlCNEFDB3VuaUI0QjUHdW5pQjRCNwd1bmlCNEI5B3VuaUI0QzAHdW5pQjRDNAd1bmlCNEM4B3VuaUI0RDAHdW5pQjRENQd1bmlCNERDB3VuaUI0REQHdW5pQjRFMAd1bmlCNEUzB3VuaUI0RTQHdW5pQjRFNgd1bmlCNEVDB3VuaUI0RUQHdW5pQjRFRgd1bmlCNEYxB3VuaUI0RjgHdW5pQjUxNAd1bmlCNTE1B3VuaUI1MTgHdW5pQjUxQgd1bmlCNTFDB3VuaUI1MjQHdW5pQjUyNQd1bmlCNTI3B3VuaUI1MjgHdW5pQjUyOQd1bmlCNTJBB3VuaUI1MkUHdW5pQjUzMAd1bmlCNTMxB3VuaUI1MzQHdW5pQjUzNwd1bmlCNTM4B3VuaUI1NDAHdW5pQjU0MQd1bmlCNTQzB3VuaUI1NDQHdW5pQjU0NQd1bmlCNTRCB3VuaUI1NEMHdW5pQjU0RAd1bmlCNTUwB3VuaUI1NTQHdW5pQjU1Qwd1bmlCNTVEB3VuaUI1NUYHdW5pQjU2MAd1bmlCNTYxB3VuaUI1QTAHdW5pQjVBMQd1bmlCNUE0B3VuaUI1QTgHdW5pQjVBQQd1bmlCNUFCB3VuaUI1QjAHdW5pQjVCMQd1bmlCNUIzB3VuaUI1QjQHdW5pQjVCNQd1bmlCNUJCB3VuaUI1QkMHdW5pQjVCRAd1bmlCNUMwB3VuaUI1QzQHdW5pQjVDQwd1bmlCNUNEB3VuaUI1Q0YHdW5pQjVEMAd1bmlCNUQxB3VuaUI1RDgHdW5pQjVFQwd1bmlCNjEwB3VuaUI2MTEHdW5pQjYxNAd1bmlCNjE4B3VuaUI2MjAHdW5pQjYyMQd1bmlCNjIzB3VuaUI2MjUHdW5pQjYyQwd1bmlCNjJEB3VuaUI2MzAHdW5pQjYzNAd1bmlCNjQ3B3VuaUI2NDgHdW5pQjY1Qwd1bmlCNjY0B3VuaUI2NjgHdW5pQjY5Qwd1bmlCNjlEB3VuaUI2QTAHdW5pQjZBNAd1bmlCNkE3B3VuaUI2QUIHdW5pQjZBQwd1bmlCNkIxB3VuaUI2RDQHdW5pQjZGMAd1bmlCNkY0B3VuaUI2RjgHdW5pQjcwMAd1bmlCNzAxB3VuaUI3MDUHdW5pQjcyOAd1bmlCNzI5B3VuaUI3MkMHdW5pQjcyRgd1bmlCNzMwB3VuaUI3MzMHdW5pQjczOAd1bmlCNzM5B3VuaUI3M0IHdW5pQjczRAd1bmlCNzNFB3VuaUI3NDQHdW5pQjc0OAd1bmlCNzRDB3VuaUI3NTQHdW5pQjc1NQd1bmlCNzYwB3VuaUI3NjQHdW5pQjc2OAd1bmlCNzcwB3VuaUI3NzEHdW5pQjc3Mwd1bmlCNzc1B3VuaUI3N0MHdW5pQjc3RAd1bmlCNzgwB3VuaUI3ODMHdW5pQjc4NAd1bmlCNzhDB3VuaUI3OEQHdW5pQjc4Rgd1bmlCNzkwB3VuaUI3OTEHdW5pQjc5Mgd1bmlCNzk2B3VuaUI3OTcHdW5pQjc5OAd1bmlCNzk5B3VuaUI3OUMHdW5pQjc5Rgd1bmlCN0EwB3VuaUI3QTgHdW5pQjdBOQd1bmlCN0FCB3VuaUI3QUMHdW5pQjdBRAd1bmlCN0IyB3VuaUI3QjQHdW5pQjdCNQd1bmlCN0I4B3VuaUI3QzcHdW5pQjdDOQd1bmlCN0Q0B3VuaUI3RUMHdW5pQjdFRAd1bmlCN0YwB3VuaUI3RjIHdW5pQjdGMwd1bmlCN0Y0B3VuaUI3RkMHdW5pQjdGRAd1bmlCN0ZGB3VuaUI4MDAHdW5pQjgwMQd1bmlCODA3B3VuaUI4MDgHdW5pQjgwOQd1bmlCODBDB3VuaUI4MTAHdW5pQjgxOAd1bmlCODE5B3VuaUI4MUIHdW5pQjgxQwd1bmlCODFEB3VuaUI4MjQHdW5pQjgyNQd1bmlCODI4B3VuaUI4MkIHdW5pQjgyQwd1bmlCODM0B3VuaUI4MzUHdW5pQjgzNwd1bmlCODM4B3VuaUI4MzkHdW5pQjg0MAd1bmlCODQ0B3VuaUI4NTEHdW5pQjg1Mwd1bmlCODVDB3VuaUI4NUQHdW5pQjg2MAd1bmlCODYzB3VuaUI4NjQHdW5pQjg2Qwd1bmlCODZEB3VuaUI4NkYHdW5pQjg3MQd1bmlCODc4B3VuaUI4NzkHdW5pQjg3Qwd1bmlCODhEB3VuaUI4OTQHdW5pQjhBOAd1bmlCOEIwB3VuaUI4QjQHdW5pQjhCOAd1bmlCOEMwB3VuaUI4QzEHdW5pQjhDMwd1bmlCOEM1B3VuaUI4Q0MHdW5pQjhEMAd1bmlCOEQ0B3VuaUI4REQHdW5pQjhERgd1bmlCOEUxB3VuaUI4RTgHdW5pQjhFOQd1bmlCOEVDB3VuaUI4RjAHdW5pQjhGOAd1bmlCOEY5B3VuaUI4RkIHdW5pQjhGRAd1bmlCOTA0B3VuaUI5MTgHdW5pQjkyMAd1bmlCOTI0B3VuaUI5M0MHdW5pQjkzRAd1bmlCOTQwB3VuaUI5NDQHdW5pQjk0Qwd1bmlCOTRGB3VuaUI5NTEHdW5pQjk1OAd1bmlCOTU5B3VuaUI5NUMHdW5pQjk2MAd1bmlCOTY4B3VuaUI5NjkHdW5pQjk2Qgd1bmlCOTZEB3VuaUI5NzQHdW5pQjk3NQd1bmlCOTc4B3VuaUI5N0MHdW5pQjk4NAd1bmlCOTg1B3VuaUI5ODcHdW5pQjk4OQd1bmlCOThBB3VuaUI5OEQHdW5pQjk4RQd1bmlCOUFDB3VuaUI5QUQHdW5pQjlCMAd1bmlCOUI0B3VuaUI5QkMHdW5pQjlCRAd1bmlCOUJGB3VuaUI5QzEHdW5pQjlDOAd1bmlCOUM5B3VuaUI5Q0MHdW5pQjlDRQd1bmlCOUNGB3VuaUI5RDAHdW5pQjlEMQd1bmlCOUQyB3VuaUI5RDgHdW5pQjlEOQd1bmlCOURCB3VuaUI5REMHdW5pQjlERAd1bmlCOURFB3VuaUI5REYHdW5pQjlFMQd1bmlCOUUzB3VuaUI5RTQHdW5pQjlFNQd1bmlCOUU4B3VuaUI5RUIHdW5pQjlFQwd1bmlCOUY0B3VuaUI5RjUHdW5pQjlGNwd1bmlCOUY4B3VuaUI5RjkHdW5pQjlGQQd1bmlCQTAwB3VuaUJBMDEHdW5pQkEwNAd1bmlCQTA4B3VuaUJBMTUHdW5pQkEzOAd1bmlCQTM5B3VuaUJBM0MHdW5pQkE0MAd1bmlCQTQyB3VuaUJBNDgHdW5pQkE0OQd1bmlCQTRCB3VuaUJBNEQHdW5pQkE0RQd1bmlCQTUzB3VuaUJBNTQHdW5pQkE1NQd1bmlCQTU4B3VuaUJBNUMHdW5pQkE2NAd1bmlCQTY1B3VuaUJBNjcHdW5pQkE2OAd1bmlCQTY5B3VuaUJBNzAHdW5pQkE3MQd1bmlCQTc0B3VuaUJBNzgHdW5pQkE4Mwd1bmlCQTg0B3VuaUJBODUHdW5pQkE4Nwd1bmlCQThDB3VuaUJBQTgHdW5pQkFBOQd1bmlCQUFCB3VuaUJBQUMHdW5pQkFCMAd1bmlCQUIxB3VuaUJBQjIHdW5pQkFCOAd1bmlCQUI5B3VuaUJBQkIHdW5pQkFCRAd1bmlCQUM0B3VuaUJBQzgHdW5pQkFEOAd1bmlCQUQ5B3VuaUJBRTAHdW5pQkFGNAd1bmlCQUZDB3VuaUJCMDAHdW5pQkIwNAd1bmlCQjBEB3VuaUJCMEYHdW5pQkIxMQd1bmlCQjE4B3VuaUJCMUMHdW5pQkIyMAd1bmlCQjI5B3VuaUJCMkIHdW5pQkIzNAd1bmlCQjM1B3VuaUJCMzYHdW5pQkIzOAd1bmlCQjNCB3VuaUJCM0MHdW5pQkIzRAd1bmlCQjNFB3VuaUJCNDQHdW5pQkI0NQd1bmlCQjQ3B3VuaUJCNDkHdW5pQkI0RAd1bmlCQjRGB3VuaUJCNTAHdW5pQkI1NAd1bmlCQjU4B3VuaUJCNjEHdW5pQkI2Mwd1bmlCQjY1B3VuaUJCNkMHdW5pQkI4OAd1bmlCQjhBB3VuaUJCOEMHdW5pQkI5MAd1bmlCQkE0B3VuaUJCQTgHdW5pQkJBQwd1bmlCQkI0B3VuaUJCQjcHdW5pQkJCOQd1bmlCQkMwB3VuaUJCQzEHdW5pQkJDNAd1bmlCQkM4B3VuaUJCRDAHdW5pQkJEMwd1bmlCQkQ1B3VuaUJCREMHdW5pQkJGOAd1bmlCQkY5B3VuaUJCRkMHdW5pQkJGRgd1bmlCQzAwB3VuaUJDMDIHdW5pQkMwOAd1bmlCQzA5B3VuaUJDMEIHdW5pQkMwQwd1bmlCQzBEB3VuaUJDMEYHdW5pQkMxMQd1bmlCQzE0B3VuaUJDMTUHdW5pQkMxNgd1bmlCQzE3B3VuaUJDMTgHdW5pQkMxQgd1bmlCQzFDB3VuaUJDMUQHdW5pQkMxRQd1bmlCQzFGB3VuaUJDMjQHdW5pQkMyNQd1bmlCQzI3B3VuaUJDMjkHdW5pQkMyRAd1bmlCQzMwB3VuaUJDMzEHdW5pQkMzNAd1bmlCQzM3B3VuaUJDMzgHdW5pQkM0MAd1bmlCQzQxB3VuaUJDNDMHdW5pQkM0NAd1bmlCQzQ1B3VuaUJDNDkHdW5pQkM0Qwd1bmlCQzREB3VuaUJDNTAHdW5pQkM1Qwd1bmlCQzVEB3VuaUJDNjEHdW5pQkM4NAd1bmlCQzg1B3VuaUJDODgHdW5pQkM4Qgd1bmlCQzhDB3VuaUJDOEUHdW5pQkM5NAd1bmlCQzk1B3VuaUJDOTcHdW5pQkM5OQd1bmlCQzlBB3VuaUJDQTAHdW5pQkNBMQd1bmlCQ0E0B3VuaUJDQTcHdW5pQkNBOAd1bmlCQ0IwB3VuaUJDQjEHdW5pQkNCMwd1bmlCQ0I0B3VuaUJDQjUHdW5pQkNCQwd1bmlCQ0JEB3VuaUJDQzAHdW5pQkNDNAd1bmlCQ0NDB3VuaUJDQ0QHdW5pQkNDRgd1bmlCQ0QwB3VuaUJDRDEHdW5pQkNENQd1bmlCQ0Q4B3VuaUJDREMHdW5pQkNGNAd1bmlCQ0Y1B3VuaUJDRjYHdW5pQkNGOAd1bmlCQ0ZCB3VuaUJDRkMHdW5pQkNGRgd1bmlCRDA0B3VuaUJEMDUHdW5pQkQwNwd1bmlCRDA5B3VuaUJEMTAHdW5pQkQxNAd1bmlCRDI0B3VuaUJEMjUHdW5pQkQyQwd1bmlCRDQwB3VuaUJENDgHdW5pQkQ0OQd1bmlCRDRDB3VuaUJENTAHdW5pQkQ1OAd1bmlCRDU5B3VuaUJENjQHdW5pQkQ2OAd1bmlCRDc0B3VuaUJEODAHdW5pQkQ4MQd1bmlCRDg0B3VuaUJEODcHdW5pQkQ4OAd1bmlCRDg5B3VuaUJEOEEHdW5pQkQ5MAd1bmlCRDkxB3VuaUJEOTMHdW5pQkQ5NQd1bmlCRDk5B3VuaUJEOUEHdW5pQkQ5Qwd1bmlCREEwB3VuaUJEQTQHdW5pQkRCMAd1bmlCREI0B3VuaUJEQjgHdW5pQkRDMQd1bmlCREQ0B3VuaUJERDUHdW5pQkREOAd1bmlCRERDB3VuaUJERTkHdW5pQkRGMAd1bmlCREY0B3VuaUJERjgHdW5pQkUwMAd1bmlCRTAzB3VuaUJFMDUHdW5pQkUwQwd1bmlCRTBEB3VuaUJFMTAHdW5pQkUxNAd1bmlCRTFDB3VuaUJFMUQHdW5pQkUxRgd1bmlCRTIxB3VuaUJFMjgHdW5pQkU0NAd1bmlCRTQ1B3VuaUJFNDgHdW5pQkU0Qgd1bmlCRTRDB3VuaUJFNEUHdW5pQkU1NAd1bmlCRTU1B3VuaUJFNTcHdW5pQkU1OQd1bmlCRTVBB3VuaUJFNUIHdW5pQkU2MAd1bmlCRTYxB3VuaUJFNjQHdW5pQkU2Nwd1bmlCRTY4B3VuaUJFNkEHdW5pQkU3MAd1bmlCRTcxB3VuaUJFNzMHdW5pQkU3NAd1bmlCRTc1B3VuaUJFN0IHdW5pQkU3Qwd1bmlCRTdEB3VuaUJFODAHdW5pQkU4NAd1bmlCRThDB3VuaUJFOEQHdW5pQkU4Rgd1bmlCRTkwB3VuaUJFOTEHdW5pQkU5OAd1bmlCRTk5B3VuaUJFOUMHdW5pQkVBOAd1bmlCRUQwB3VuaUJFRDEHdW5pQkVENAd1bmlCRUQ3B3VuaUJFRDgHdW5pQkVFMAd1bmlCRUUzB3VuaUJFRTQHdW5pQkVFNQd1bmlCRUVDB3VuaUJGMDEHdW5pQkYwOAd1bmlCRjA5B3VuaUJGMTgHdW5pQkYxOQd1bmlCRjFCB3VuaUJGMUMHdW5pQkYxRAd1bmlCRjQwB3VuaUJGNDEHdW5pQkY0NAd1bmlCRjQ4B3VuaUJGNTAHdW5pQkY1MQd1bmlCRjUzB3VuaUJGNTUHdW5pQkY5NAd1bmlCRkIwB3VuaUJGQjEHdW5pQkZDNQd1bmlCRkNDB3VuaUJGQ0QHdW5pQkZEMAd1bmlCRkQ0B3VuaUJGRDUHdW5pQkZEQwd1bmlCRkREB3VuaUJGREYHdW5pQkZFMQd1bmlDMDIwB3VuaUMwM0MHdW5pQzA1MQd1bmlDMDU4B3VuaUMwNUMHdW5pQzA2MAd1bmlDMDY4B3VuaUMwNjkHdW5pQzA2RAd1bmlDMDkwB3VuaUMwOTEHdW5pQzA5NAd1bmlDMDk4B3VuaUMwQTAHdW5pQzBBMQd1bmlDMEEzB3VuaUMwQTUHdW5pQzBBQwd1bmlDMEFEB3VuaUMwQUYHdW5pQzBCMAd1bmlDMEIzB3VuaUMwQjQHdW5pQzBCNQd1bmlDMEI2B3VuaUMwQkMHdW5pQzBCRAd1bmlDMEJGB3VuaUMwQzAHdW5pQzBDMQd1bmlDMEM1B3VuaUMwQzgHdW5pQzBDOQd1bmlDMENDB3VuaUMwQ0YHdW5pQzBEMAd1bmlDMEQ4B3VuaUMwRDkHdW5pQzBEQgd1bmlDMERDB3VuaUMwREQHdW5pQzBFNAd1bmlDMEU1B3VuaUMwRTgHdW5pQzBFQwd1bmlDMEY0B3VuaUMwRjUHdW5pQzBGNwd1bmlDMEY5B3VuaUMwRkUHdW5pQzEwMAd1bmlDMTAxB3VuaUMxMDQHdW5pQzEwOAd1bmlDMTEwB3VuaUMxMTUHdW5pQzExQwd1bmlDMTFEB3VuaUMxMUUHdW5pQzExRgd1bmlDMTIwB3VuaUMxMjMHdW5pQzEyNAd1bmlDMTI2B3VuaUMxMjcHdW5pQzEyQwd1bmlDMTJEB3VuaUMxMkYHdW5pQzEzMAd1bmlDMTMxB3VuaUMxMzYHdW5pQzEzOAd1bmlDMTM5B3VuaUMxM0MHdW5pQzEzRgd1bmlDMTQwB3VuaUMxNDgHdW5pQzE0OQd1bmlDMTRCB3VuaUMxNEMHdW5pQzE0RAd1bmlDMTU0B3VuaUMxNTUHdW5pQzE1OAd1bmlDMTVDB3VuaUMxNjQHdW5pQzE2NQd1bmlDMTY3B3VuaUMxNjgHdW5pQzE2OQd1bmlDMTcwB3VuaUMxNzEHdW5pQzE3NAd1bmlDMTc4B3VuaUMxODAHdW5pQzE4MQd1bmlDMTg1B3VuaUMxOEMHdW5pQzE4RAd1bmlDMThFB3VuaUMxOTAHdW5pQzE5Mwd1bmlDMTk0B3VuaUMxOTYHdW5pQzE5Qwd1bmlDMTlEB3VuaUMxOUYHdW5pQzFBMQd1bmlDMUE1B3VuaUMxQTgHdW5pQzFBOQd1bmlDMUFDB3VuaUMxQjAHdW5pQzFCRAd1bmlDMUM0B3VuaUMxQzgHdW5pQzFDQwd1bmlDMUQ0B3VuaUMxRDcHdW5pQzFEOAd1bmlDMUUwB3VuaUMxRTQHdW5pQzFFOAd1bmlDMUYwB3VuaUMxRjEHdW5pQzFGMwd1bmlDMUY1B3VuaUMxRkMHdW5pQzFGRAd1bmlDMjAwB3VuaUMyMDQHdW5pQzIwQwd1bmlDMjBEB3VuaUMyMEYHdW5pQzIxMQd1bmlDMjE2B3VuaUMyMTgHdW5pQzIxOQd1bmlDMjFDB3VuaUMyMUYHdW5pQzIyMAd1bmlDMjI4B3VuaUMyMjkHdW5pQzIyQgd1bmlDMjJEB3VuaUMyMkYHdW5pQzIzMQd1bmlDMjMyB3VuaUMyMzQHdW5pQzI0OAd1bmlDMjUwB3VuaUMyNTEHdW5pQzI1NAd1bmlDMjU4B3VuaUMyNjAHdW5pQzI2NQd1bmlDMjZDB3VuaUMyNkQHdW5pQzI3MAd1bmlDMjc0B3VuaUMyN0MHdW5pQzI3RAd1bmlDMjdGB3VuaUMyODEHdW5pQzI4OAd1bmlDMjg5B3VuaUMyOEMHdW5pQzI5MAd1bmlDMjk4B3VuaUMyOUIHdW5pQzI5RAd1bmlDMkE0B3VuaUMyQTUHdW5pQzJBOAd1bmlDMkFDB3VuaUMyQUQHdW5pQzJCNAd1bmlDMkI1B3VuaUMyQjcHdW5pQzJCOQd1bmlDMkRDB3VuaUMyREQHdW5pQzJFMAd1bmlDMkUzB3VuaUMyRTQHdW5pQzJFNQd1bmlDMkVCB3VuaUMyRUMHdW5pQzJFRAd1bmlDMkVGB3VuaUMyRjEHdW5pQzJGMwd1bmlDMkY2B3VuaUMyRjgHdW5pQzJGOQd1bmlDMkZCB3VuaUMyRkMHdW5pQzJGRgd1bmlDMzAwB3VuaUMzMDgHdW5pQzMwOQd1bmlDMzBDB3VuaUMzMEQHdW5pQzMxMwd1bmlDMzE0B3VuaUMzMTUHdW5pQzMxOAd1bmlDMzFDB3VuaUMzMjQHdW5pQzMyNQd1bmlDMzI4B3VuaUMzMjkHdW5pQzM0NQd1bmlDMzY4B3VuaUMzNjkHdW5pQzM2Qwd1bmlDMzcwB3VuaUMzNzIHdW5pQzM3OAd1bmlDMzc5B3VuaUMzN0MHdW5pQzM3RAd1bmlDMzg0B3VuaUMzODgHdW5pQzM4Qwd1bmlDMzk0B3VuaUMzQTAHdW5pQzNBNAd1bmlDM0I1B3VuaUMzQkMHdW5pQzNDMAd1bmlDM0Q4B3VuaUMzRDkHdW5pQzNEQwd1bmlDM0RGB3VuaUMzRTAHdW5pQzNFMgd1bmlDM0U4B3VuaUMzRTkHdW5pQzNFRAd1bmlDM0Y0B3VuaUMzRjUHdW5pQzNGOAd1bmlDM0ZDB3VuaUM0MDgHdW5pQzQxMAd1bmlDNDI0B3VuaUM0MkMHdW5pQzQzMAd1bmlDNDM0B3VuaUM0M0MHdW5pQzQzRAd1bmlDNDQ4B3VuaUM0NUQHdW5pQzQ2NAd1bmlDNDY1B3VuaUM0NjgHdW5pQzQ2Qwd1bmlDNDc0B3VuaUM0NzUHdW5pQzQ3OQd1bmlDNDgwB3VuaUM0OTAHdW5pQzQ5NAd1bmlDNDlDB3VuaUM0QUMHdW5pQzRCOAd1bmlDNEJDB3VuaUM0RTkHdW5pQzRGMAd1bmlDNEYxB3VuaUM0RjQHdW5pQzRGOAd1bmlDNEZBB3VuaUM0RkYHdW5pQzUwMAd1bmlDNTAxB3VuaUM1MDMHdW5pQzUwQwd1bmlDNTEwB3VuaUM1MTQHdW5pQzUxQwd1bmlDNTI4B3VuaUM1MjkHdW5pQzUyQwd1bmlDNTMwB3VuaUM1MzgHdW5pQzUzOQd1bmlDNTNCB3VuaUM1M0QHdW5pQzUzRgd1bmlDNTQ0B3VuaUM1NDUHdW5pQzU0OAd1bmlDNTQ5B3VuaUM1NEEHdW5pQzU0Qgd1bmlDNTRDB3VuaUM1NEQHdW5pQzU0RQd1bmlDNTUzB3VuaUM1NTQHdW5pQzU1NQd1bmlDNTU3B3VuaUM1NTgHdW5pQzU1OQd1bmlDNTVDB3VuaUM1NUQHdW5pQzU1RQd1bmlDNTYwB3VuaUM1NjEHdW5pQzU2NAd1bmlDNTY4B3VuaUM1NzAHdW5pQzU3MQd1bmlDNTczB3VuaUM1NzQHdW5pQzU3NQd1bmlDNTdDB3VuaUM1N0QHdW5pQzU4MAd1bmlDNTg0B3VuaUM1ODcHdW5pQzU4Qwd1bmlDNThEB3VuaUM1OEYHdW5pQzU5MQd1bmlDNTk1B3VuaUM1OTcHdW5pQzU5OAd1bmlDNTlDB3VuaUM1QTAHdW5pQzVBOQd1bmlDNUFDB3VuaUM1QUQHdW5pQzVCNAd1bmlDNUI1B3VuaUM1QjgHdW5pQzVCOQd1bmlDNUJCB3VuaUM1QkMHdW5pQzVCRAd1bmlDNUJFB3VuaUM1QzQHdW5pQzVDNQd1bmlDNUM2B3VuaUM1QzcHdW5pQzVDOAd1bmlDNUM5B3VuaUM1Q0EHdW5pQzVDQwd1bmlDNUNFB3VuaUM1RDAHdW5pQzVEMQd1bmlDNUQ0B3VuaUM1RDgHdW5pQzVFMAd1bmlDNUUxB3VuaUM1RTMHdW5pQzVFNQd1bmlDNUVDB3VuaUM1RUQHdW5pQzVFRQd1bmlDNUYwB3VuaUM1RjQHdW5pQzVGNgd1bmlDNUY3B3VuaUM1RkMHdW5pQzVGRAd1bmlDNUZFB3VuaUM1RkYHdW5pQzYwMAd1bmlDNjAxB3VuaUM2MDUHdW5pQzYwNgd1bmlDNjA3B3VuaUM2MDgHdW5pQzYwQwd1bmlDNjBGB3VuaUM2MTAHdW5pQzYxOAd1bmlDNjE5B3VuaUM2MUIHdW5pQzYxQwd1bmlDNjFEB3VuaUM2MjQHdW5pQzYyNQd1bmlDNjI2B3VuaUM2MjgHdW5pQzYyQgd1bmlDNjJDB3VuaUM2MkQHdW5pQzYyRQd1bmlDNjMwB3VuaUM2MzMHdW5pQzYzNAd1bmlDNjM1B3VuaUM2MzcHdW5pQzYzOQd1bmlDNjNCB3VuaUM2NDAHdW5pQzY0MQd1bmlDNjQ0B3VuaUM2NDgHdW5pQzY1MAd1bmlDNjUxB3VuaUM2NTMHdW5pQzY1NAd1bmlDNjU1B3VuaUM2NTgHdW5pQzY1Qwd1bmlDNjVEB3VuaUM2NjAHdW5pQzY2Qwd1bmlDNjZEB3VuaUM2NkYHdW5pQzY3MAd1bmlDNjcxB3VuaUM2NzgHdW5pQzY3OQd1bmlDNjdDB3VuaUM2ODAHdW5pQzY4OAd1bmlDNjg5B3VuaUM2OEIHdW5pQzY4RAd1bmlDNjk0B3VuaUM2OTUHdW5pQzY5OAd1bmlDNjlDB3VuaUM2QTQHdW5pQzZBNQd1bmlDNkE3B3VuaUM2QTkHdW5pQzZCMAd1bmlDNkIxB3VuaUM2QjQHdW5pQzZCNwd1bmlDNkI4B3VuaUM2QjkHdW5pQzZCQQd1bmlDNkMwB3VuaUM2QzEHdW5pQzZDMwd1bmlDNkM1B3VuaUM2QzcHdW5pQzZDQwd1bmlDNkNEB3VuaUM2RDAHdW5pQzZENAd1bmlDNkRDB3VuaUM2REQHdW5pQzZERgd1bmlDNkUwB3VuaUM2RTEHdW5pQzZFOAd1bmlDNkU5B3VuaUM2RUMHdW5pQzZGMAd1bmlDNkY4B3VuaUM2RjkHdW5pQzZGQgd1bmlDNkZEB3VuaUM3MDQHdW5pQzcwNQd1bmlDNzA4B3VuaUM3MEMHdW5pQzcxNAd1bmlDNzE1B3VuaUM3MTcHdW5pQzcxOQd1bmlDNzIwB3VuaUM3MjEHdW5pQzcyNAd1bmlDNzI4B3VuaUM3MzAHdW5pQzczMQd1bmlDNzMzB3VuaUM3MzUHdW5pQzczNwd1bmlDNzNDB3VuaUM3M0QHdW5pQzczRQd1bmlDNzQwB3VuaUM3NDQHdW5pQzc0QQd1bmlDNzRDB3VuaUM3NEQHdW5pQzc0Rgd1bmlDNzUxB3VuaUM3NTIHdW5pQzc1Mwd1bmlDNzU0B3VuaUM3NTUHdW5pQzc1Ngd1bmlDNzU3B3VuaUM3NTgHdW5pQzc1Qwd1bmlDNzYwB3VuaUM3NjgHdW5pQzc2OQd1bmlDNzZCB3VuaUM3NkQHdW5pQzc3NAd1bmlDNzc1B3VuaUM3NzgHdW5pQzc3Qgd1bmlDNzdDB3VuaUM3N0QHdW5pQzc3RQd1bmlDNzgzB3VuaUM3ODQHdW5pQzc4NQd1bmlDNzg3B3VuaUM3ODgHdW5pQzc4OQd1bmlDNzhBB3VuaUM3OEMHdW5pQzc4RAd1bmlDNzhFB3VuaUM3OTAHdW5pQzc5MQd1bmlDNzk0B3VuaUM3OTYHdW5pQzc5Nwd1bmlDNzk4B3VuaUM3OUEHdW5pQzdBMAd1bmlDN0ExB3VuaUM3QTMHdW5pQzdBNAd1bmlDN0E1B3VuaUM3QTYHdW5pQzdBQwd1bmlDN0FEB3VuaUM3QjAHdW5pQzdCNAd1bmlDN0JDB3VuaUM3QkQHdW5pQzdCRgd1bmlDN0MwB3VuaUM3QzEHdW5pQzdDOAd1bmlDN0M5B3VuaUM3Q0MHdW5pQzdDRQd1bmlDN0QwB3VuaUM3RDgHdW5pQzdERAd1bmlDN0U0B3VuaUM3RTgHdW5pQzdFQwd1bmlDN0Y1B3VuaUM4MDAHdW5pQzgwMQd1bmlDODA0B3VuaUM4MDcHdW5pQzgwOAd1bmlDODA5B3VuaUM4MEEHdW5pQzgxMAd1bmlDODExB3VuaUM4MTMHdW5pQzgxNQd1bmlDODE2B3VuaUM4MUMHdW5pQzgxRAd1bmlDODIwB3VuaUM4MjQHdW5pQzgyQwd1bmlDODJEB3VuaUM4MkYHdW5pQzgzMQd1bmlDODM4B3VuaUM4M0MHdW5pQzg0MAd1bmlDODQ4B3VuaUM4NDkHdW5pQzg0Qwd1bmlDODREB3VuaUM4NTQHdW5pQzg3MAd1bmlDODcxB3VuaUM4NzQHdW5pQzg3OAd1bmlDODdBB3VuaUM4ODAHdW5pQzg4MQd1bmlDODgzB3VuaUM4ODUHdW5pQzg4Ngd1bmlDODg3B3VuaUM4OEIHdW5pQzg4Qwd1bmlDODhEB3VuaUM4OTQHdW5pQzg5RAd1bmlDODlGB3VuaUM4QTEHdW5pQzhBOAd1bmlDOEFDB3VuaUM4QkMHdW5pQzhCRAd1bmlDOEM0B3VuaUM4QzgHdW5pQzhDQwd1bmlDOEQ0B3VuaUM4RDUHdW5pQzhENwd1bmlDOEQ5B3VuaUM4RTAHdW5pQzhFMQd1bmlDOEU0B3VuaUM4RjUHdW5pQzhGQwd1bmlDOEZEB3VuaUM5MDAHdW5pQzkwNAd1bmlDOTA1B3VuaUM5MDYHdW5pQzkwQwd1bmlDOTBEB3VuaUM5MEYHdW5pQzkxMQd1bmlDOTE4B3VuaUM5MkMHdW5pQzkzNAd1bmlDOTUwB3VuaUM5NTEHdW5pQzk1NAd1bmlDOTU4B3VuaUM5NjAHdW5pQzk2MQd1bmlDOTYzB3VuaUM5NkMHdW5pQzk3MAd1bmlDOTc0B3VuaUM5N0MHdW5pQzk4OAd1bmlDOTg5B3VuaUM5OEMHdW5pQzk5MAd1bmlDOTkyB3VuaUM5OTgHdW5pQzk5OQd1bmlDOTlCB3VuaUM5OUQHdW5pQzlBNAd1bmlDOUMwB3VuaUM5QzEHdW5pQzlDNAd1bmlDOUM3B3VuaUM5QzgHdW5pQzlDQQd1bmlDOUQwB3VuaUM5RDEHdW5pQzlEMwd1bmlDOUQ1B3VuaUM5RDYHdW5pQzlEOQd1bmlDOURBB3VuaUM5REMHdW5pQzlERAd1bmlDOUUwB3VuaUM5RTIHdW5pQzlFMwd1bmlDOUU0B3VuaUM5RTcHdW5pQzlFQwd1bmlDOUVEB3VuaUM5RUYHdW5pQzlGMAd1bmlDOUYxB3VuaUM5RjIHdW5pQzlGOAd1bmlDOUY5B3VuaUM5RkMHdW5pQ0EwMAd1bmlDQTA4B3VuaUNBMDkHdW5pQ0EwQgd1bmlDQTBDB3VuaUNBMEQHdW5pQ0ExNAd1bmlDQTE4B3VuaUNBMjkHdW5pQ0E0Qwd1bmlDQTREB3VuaUNBNTAHdW5pQ0E1NAd1bmlDQTVDB3VuaUNBNUQHdW5pQ0E1Rgd1bmlDQTYwB3VuaUNBNjEHdW5pQ0E2OAd1bmlDQTdEB3VuaUNBODQHdW5pQ0E5OAd1bmlDQUJDB3VuaUNBQkQHdW5pQ0FDMAd1bmlDQUMzB3VuaUNBQzQHdW5pQ0FDQwd1bmlDQUNEB3VuaUNBQ0YHdW5pQ0FEMQd1bmlDQUQyB3VuaUNBRDMHdW5pQ0FEOAd1bmlDQUQ5B3VuaUNBRTAHdW5pQ0FFQwd1bmlDQUY0B3VuaUNCMDgHdW5pQ0IxMAd1bmlDQjE0B3VuaUNCMTgHdW5pQ0IyMAd1bmlDQjIxB3VuaUNCMzIHdW5pQ0I0MQd1bmlDQjQ4B3VuaUNCNDkHdW5pQ0I0Qwd1bmlDQjUwB3VuaUNCNTgHdW5pQ0I1OQd1bmlDQjVEB3VuaUNCNjQHdW5pQ0I3OAd1bmlDQjc5B3VuaUNCOTMHdW5pQ0I5Qwd1bmlDQkI4B3VuaUNCRDQHdW5pQ0JFNAd1bmlDQkU3B3VuaUNCRTkHdW5pQ0MwQwd1bmlDQzBEB3VuaUNDMTAHdW5pQ0MxMwd1bmlDQzE0B3VuaUNDMUMHdW5pQ0MxRAd1bmlDQzFGB3VuaUNDMjEHdW5pQ0MyMgd1bmlDQzI3B3VuaUNDMjgHdW5pQ0MyOQd1bmlDQzJDB3VuaUNDMkUHdW5pQ0MzMAd1bmlDQzM4B3VuaUNDMzkHdW5pQ0MzQgd1bmlDQzNDB3VuaUNDM0QHdW5pQ0MzRQd1bmlDQzQ0B3VuaUNDNDUHdW5pQ0M0OAd1bmlDQzRDB3VuaUNDNTQHdW5pQ0M1NQd1bmlDQzU3B3VuaUNDNTgHdW5pQ0M1OQd1bmlDQzYwB3VuaUNDNjQHdW5pQ0M2Ngd1bmlDQzY4B3VuaUNDNzAHdW5pQ0M3NQd1bmlDQzk4B3VuaUNDOTkHdW5pQ0M5Qwd1bmlDQ0EwB3VuaUNDQTgHdW5pQ0NBOQd1bmlDQ0FCB3VuaUNDQUMHdW5pQ0NBRAd1bmlDQ0I0B3VuaUNDQjUHdW5pQ0NCOAd1bmlDQ0JDB3VuaUNDQzQHdW5pQ0NDNQd1bmlDQ0M3B3VuaUNDQzkHdW5pQ0NEMAd1bmlDQ0Q0B3VuaUNDRTQHdW5pQ0NFQwd1bmlDQ0YwB3VuaUNEMDEHdW5pQ0QwOAd1bmlDRDA5B3VuaUNEMEMHdW5pQ0QxMAd1bmlDRDE4B3VuaUNEMTkHdW5pQ0QxQgd1bmlDRDFEB3VuaUNEMjQHdW5pQ0QyOAd1bmlDRDJDB3VuaUNEMzkHdW5pQ0Q0MAd1bmlDRDVDB3VuaUNENjAHdW5pQ0Q2NAd1bmlDRDZDB3VuaUNENkQHdW5pQ0Q2Rgd1bmlDRDcxB3VuaUNENzgHdW5pQ0Q4OAd1bmlDRDk0B3VuaUNEOTUHdW5pQ0Q5OAd1bmlDRDlDB3VuaUNEQTQHdW5pQ0RBNQd1bmlDREE3B3VuaUNEQTkHdW5pQ0RCMAd1bmlDREM0B3VuaUNEQ0MHdW5pQ0RDRAd1bmlDREQwB3VuaUNERTgHdW5pQ0RFQwd1bmlDREYwB3VuaUNERjgHdW5pQ0RGOQd1bmlDREZCB3VuaUNERkQHdW5pQ0UwNAd1bmlDRTA4B3VuaUNFMEMHdW5pQ0UxNAd1bmlDRTE5B3VuaUNFMjAHdW5pQ0UyMQd1bmlDRTI0B3VuaUNFMjgHdW5pQ0UzMAd1bmlDRTMxB3VuaUNFMzMHdW5pQ0UzNQd1bmlDRTU4B3VuaUNFNTkHdW5pQ0U1Qwd1bmlDRTVGB3VuaUNFNjAHdW5pQ0U2MQd1bmlDRTYyB3VuaUNFNjgHdW5pQ0U2OQd1bmlDRTZCB3VuaUNFNkQHdW5pQ0U2RQd1bmlDRTcwB3VuaUNFNzQHdW5pQ0U3NQd1bmlDRTc4B3VuaUNFN0IHdW5pQ0U3Qwd1bmlDRTg0B3VuaUNFODUHdW5pQ0U4Nwd1bmlDRTg5B3VuaUNFOTAHdW5pQ0U5MQd1bmlDRTk0B3VuaUNFOTgHdW5pQ0VBMAd1bmlDRUExB3VuaUNFQTMHdW5pQ0VBNAd1bmlDRUE1B3VuaUNFQTgHdW5pQ0VBQwd1bmlDRUFEB3VuaUNFQjAHdW5pQ0VDMQd1bmlDRUM0B3VuaUNFRTQHdW5pQ0VFNQd1bmlDRUU4B3VuaUNFRUIHdW5pQ0VFQwd1bmlDRUY0B3VuaUNFRjUHdW5pQ0VGNwd1bmlDRUY4B3VuaUNFRjkHdW5pQ0YwMAd1bmlDRjAxB3VuaUNGMDQHdW5pQ0YwOAd1bmlDRjEwB3VuaUNGMTEHdW5pQ0YxMwd1bmlDRjE1B3VuaUNGMTgHdW5pQ0YxQwd1bmlDRjIwB3VuaUNGMjQHdW5pQ0YyQwd1bmlDRjJEB3VuaUNGMkYHdW5pQ0YzMAd1bmlDRjMxB3VuaUNGMzgHdW5pQ0Y1NAd1bmlDRjU1B3VuaUNGNTgHdW5pQ0Y1Qgd1bmlDRjVDB3VuaUNGNjQHdW5pQ0Y2NQd1bmlDRjY3B3VuaUNGNjkHdW5pQ0Y3MAd1bmlDRjcxB3VuaUNGNzQHdW5pQ0Y3OAd1bmlDRjgwB3VuaUNGODMHdW5pQ0Y4NQd1bmlDRjhDB3VuaUNGQTEHdW5pQ0ZBOAd1bmlDRkIwB3VuaUNGQzQHdW5pQ0ZDOAd1bmlDRkUwB3VuaUNGRTEHdW5pQ0ZFNAd1bmlDRkU4B3VuaUNGRjAHdW5pQ0ZGMQd1bmlDRkYzB3VuaUNGRjUHdW5pQ0ZGQwd1bmlDRkZEB3VuaUQwMDAHdW5pRDAwNAd1bmlEMDBDB3VuaUQwMTEHdW5pRDAxOAd1bmlEMDFDB3VuaUQwMjAHdW5pRDAyRAd1bmlEMDM0B3VuaUQwMzUHdW5pRDAzOAd1bmlEMDNDB3VuaUQwNDQHdW5pRDA0NQd1bmlEMDQ3B3VuaUQwNDkHdW5pRDA1MAd1bmlEMDU0B3VuaUQwNTgHdW5pRDA2MAd1bmlEMDZDB3VuaUQwNkQHdW5pRDA3MAd1bmlEMDcyB3VuaUQwNzQHdW5pRDA3Qwd1bmlEMDdEB3VuaUQwODEHdW5pRDA4NAd1bmlEMEE0B3VuaUQwQTUHdW5pRDBBOAd1bmlEMEFDB3VuaUQwQjQHdW5pRDBCNQd1bmlEMEI3B3VuaUQwQjkHdW5pRDBDMAd1bmlEMEMxB3VuaUQwQzQHdW5pRDBDNwd1bmlEMEM4B3VuaUQwQzkHdW5pRDBEMAd1bmlEMEQxB3VuaUQwRDMHdW5pRDBENAd1bmlEMEQ1B3VuaUQwREMHdW5pRDBERAd1bmlEMEUwB3VuaUQwRTQHdW5pRDBFQwd1bmlEMEVEB3VuaUQwRUYHdW5pRDBGMAd1bmlEMEYxB3VuaUQwRjgHdW5pRDEwRAd1bmlEMTMwB3VuaUQxMzEHdW5pRDEzNAd1bmlEMTM4B3VuaUQxM0EHdW5pRDEzQgd1bmlEMTQwB3VuaUQxNDEHdW5pRDE0Mwd1bmlEMTQ0B3VuaUQxNDUHdW5pRDE0Qwd1bmlEMTREB3VuaUQxNTAHdW5pRDE1NAd1bmlEMTVDB3VuaUQxNUQHdW5pRDE1Rgd1bmlEMTYxB3VuaUQxNjgHdW5pRDE2Qwd1bmlEMTdDB3VuaUQxODQHdW5pRDE4OAd1bmlEMUEwB3VuaUQxQTEHdW5pRDFBNAd1bmlEMUE3B3VuaUQxQTgHdW5pRDFCMAd1bmlEMUIxB3VuaUQxQjMHdW5pRDFCNQd1bmlEMUJBB3VuaUQxQkMHdW5pRDFDMAd1bmlEMUQ4B3VuaUQxRjQHdW5pRDFGOAd1bmlEMUZCB3VuaUQyMDcHdW5pRDIwOQd1bmlEMjEwB3VuaUQyMkMHdW5pRDIyRAd1bmlEMjMwB3VuaUQyMzQHdW5pRDIzNgd1bmlEMjNDB3VuaUQyM0QHdW5pRDIzRgd1bmlEMjQxB3VuaUQyNDgHdW5pRDI1Qwd1bmlEMjY0B3VuaUQyNzcHdW5pRDI4MAd1bmlEMjgxB3VuaUQyODQHdW5pRDI4OAd1bmlEMjkwB3VuaUQyOTEHdW5pRDI5NQd1bmlEMjlDB3VuaUQyQTAHdW5pRDJBNAd1bmlEMkFDB3VuaUQyQjEHdW5pRDJCOAd1bmlEMkI5B3VuaUQyQkMHdW5pRDJCRgd1bmlEMkMwB3VuaUQyQzIHdW5pRDJDOAd1bmlEMkM5B3VuaUQyQ0IHdW5pRDJENAd1bmlEMkQ4B3VuaUQyREMHdW5pRDJFNAd1bmlEMkU1B3VuaUQyRjAHdW5pRDJGMQd1bmlEMkY0B3VuaUQyRjgHdW5pRDMwMAd1bmlEMzAxB3VuaUQzMDMHdW5pRDMwNQd1bmlEMzBDB3VuaUQzMEQHdW5pRDMwRQd1bmlEMzEwB3VuaUQzMTMHdW5pRDMxNAd1bmlEMzE2B3VuaUQzMUMHdW5pRDMxRAd1bmlEMzFGB3VuaUQzMjAHdW5pRDMyMQd1bmlEMzI0B3VuaUQzMjUHdW5pRDMyOAd1bmlEMzI5B3VuaUQzMkMHdW5pRDMyRgd1bmlEMzMwB3VuaUQzMzgHdW5pRDMzOQd1bmlEMzNCB3VuaUQzM0MHdW5pRDMzRAd1bmlEMzQ0B3VuaUQzNDUHdW5pRDM3Qwd1bmlEMzdEB3VuaUQzODAHdW5pRDM4NAd1bmlEMzhDB3VuaUQzOEQHdW5pRDM4Rgd1bmlEMzkwB3VuaUQzOTEHdW5pRDM5OAd1bmlEMzk5B3VuaUQzOUMHdW5pRDNBMAd1bmlEM0E4B3VuaUQzQTkHdW5pRDNBQgd1bmlEM0FEB3VuaUQzQjQHdW5pRDNCNQd1bmlEM0I4B3VuaUQzQkMHdW5pRDNDNAd1bmlEM0M1B3VuaUQzQzgHdW5pRDNDOQd1bmlEM0QwB3VuaUQzRDgHdW5pRDNFMQd1bmlEM0UzB3VuaUQzRUMHdW5pRDNFRAd1bmlEM0YwB3VuaUQzRjQHdW5pRDNGQwd1bmlEM0ZEB3VuaUQzRkYHdW5pRDQwMQd1bmlENDA4B3VuaUQ0MDkHdW5pRDQxRAd1bmlENDQwB3VuaUQ0NDQHdW5pRDQ1Qwd1bmlENDYwB3VuaUQ0NjQHdW5pRDQ2RAd1bmlENDZGB3VuaUQ0NzgHdW5pRDQ3OQd1bmlENDdDB3VuaUQ0N0YHdW5pRDQ4MAd1bmlENDgyB3VuaUQ0ODgHdW5pRDQ4OQd1bmlENDhCB3VuaUQ0OEQHdW5pRDQ5NAd1bmlENEE5B3VuaUQ0Q0MHdW5pRDREMAd1bmlENEQ0B3VuaUQ0REMHdW5pRDRERgd1bmlENEU4B3VuaUQ0RUMHdW5pRDRGMAd1bmlENEY4B3VuaUQ0RkIHdW5pRDRGRAd1bmlENTA0B3VuaUQ1MDgHdW5pRDUwQwd1bmlENTE0B3VuaUQ1MTUHdW5pRDUxNwd1bmlENTNDB3VuaUQ1M0QHdW5pRDU0MAd1bmlENTQ0B3VuaUQ1NEMHdW5pRDU0RAd1bmlENTRGB3VuaUQ1NTEHdW5pRDU1OAd1bmlENTU5B3VuaUQ1NUMHdW5pRDU2MAd1bmlENTY1B3VuaUQ1NjgHdW5pRDU2OQd1bmlENTZCB3VuaUQ1NkQHdW5pRDU3MAd1bmlENTczB3VuaUQ1NzQHdW5pRDU3NQd1bmlENTc4B3VuaUQ1N0IHdW5pRDU3Qwd1bmlENTg0B3VuaUQ1ODUHdW5pRDU4Nwd1bmlENTg4B3VuaUQ1ODkHdW5pRDU4Rgd1bmlENTkwB3VuaUQ1OTQHdW5pRDVBMwd1bmlENUE1B3VuaUQ1QzgHdW5pRDVDOQd1bmlENUNDB3VuaUQ1RDAHdW5pRDVEMgd1bmlENUQ3B3VuaUQ1RDgHdW5pRDVEOQd1bmlENURCB3VuaUQ1REQHdW5pRDVFMAd1bmlENUUxB3VuaUQ1RTMHdW5pRDVFNAd1bmlENUU1B3VuaUQ1RTgHdW5pRDVFQwd1bmlENUY0B3VuaUQ1RjUHdW5pRDVGNwd1bmlENUY5B3VuaUQ1RkYHdW5pRDYwMAd1bmlENjAxB3VuaUQ2MDQHdW5pRDYwOAd1bmlENjEwB3VuaUQ2MTEHdW5pRDYxMwd1bmlENjE0B3VuaUQ2MTUHdW5pRDYxQwd1bmlENjIwB3VuaUQ2MjQHdW5pRDYyRAd1bmlENjM4B3VuaUQ2MzkHdW5pRDYzQwd1bmlENjQwB3VuaUQ2NDUHdW5pRDY0OAd1bmlENjQ5B3VuaUQ2NEIHdW5pRDY0RAd1bmlENjUxB3VuaUQ2NTQHdW5pRDY1NQd1bmlENjU4B3VuaUQ2NUMHdW5pRDY2NQd1bmlENjY3B3VuaUQ2NjgHdW5pRDY2OQd1bmlENjcwB3VuaUQ2NzEHdW5pRDY3NAd1bmlENjgzB3VuaUQ2ODUHdW5pRDY4Qwd1bmlENjhEB3VuaUQ2OTAHdW5pRDY5NAd1bmlENjlEB3VuaUQ2OUYHdW5pRDZBMQd1bmlENkE4B3VuaUQ2QUMHdW5pRDZCMAd1bmlENkI5B3VuaUQ2QkIHdW5pRDZCRAd1bmlENkM0B3VuaUQ2QzUHdW5pRDZDOAd1bmlENkNDB3VuaUQ2RDEHdW5pRDZENAd1bmlENkQ1B3VuaUQ2RDcHdW5pRDZEOQd1bmlENkUwB3VuaUQ2RTQHdW5pRDZFOAd1bmlENkYwB3VuaUQ2RjUHdW5pRDZGQwd1bmlENkZEB3VuaUQ3MDAHdW5pRDcwNAd1bmlENzExB3VuaUQ3MTgHdW5pRDcxOQd1bmlENzFDB3VuaUQ3MjAHdW5pRDcyOAd1bmlENzI5B3VuaUQ3MkIHdW5pRDcyRAd1bmlENzM0B3VuaUQ3MzUHdW5pRDczOAd1bmlENzNDB3VuaUQ3NDQHdW5pRDc0Nwd1bmlENzQ5B3VuaUQ3NTAHdW5pRDc1MQd1bmlENzU0B3VuaUQ3NTYHdW5pRDc1Nwd1bmlENzU4B3VuaUQ3NTkHdW5pRDc1RAd1bmlENzYwB3VuaUQ3NjEHdW5pRDc2Mwd1bmlENzY1B3VuaUQ3NjkHdW5pRDc2Qwd1bmlENzcwB3VuaUQ3NzQHdW5pRDc3Qwd1bmlENzdEB3VuaUQ3ODEHdW5pRDc4OAd1bmlENzg5B3VuaUQ3OEMHdW5pRDc5MAd1bmlENzk4B3VuaUQ3OTkHdW5pRDc5Qgd1bmlENzlEB3VuaUQ3QTMHdW5pRTAwMAd1bmlFMDAxB3VuaUZGRTAHdW5pRkZFMQd1bmlGRkUyB3VuaUZGRTUHdW5pRkZFNgABAAAAAAAAAAAAAAAAAAEAAAAA"""
\ No newline at end of file
@@ -12,13 +12,18 @@
 3. 카카오 비즈니스 채널 연동
 4. 알림톡 템플릿 등록 및 검수 승인 (1~2일 소요)
 """
+import asyncio
 import os
 import hmac
 import hashlib
+import random
+import threading
 import time
 import uuid
-import requests
 from dotenv import load_dotenv
+from services.async_http import AsyncHttpPool, HttpError, HttpConnectError, HttpTimeout
+from services.async_runtime import run_sync
+from services.metrics import stage, registry, register_collector, register_stats
 
 load_dotenv()
 
@@ -30,13 +35,173 @@ SOLAPI_TEMPLATE_ID_PROPOSAL = os.getenv("SOLAPI_TEMPLATE_ID_PROPOSAL", "")  # 
 SOLAPI_TEMPLATE_ID_ESTIMATE = os.getenv("SOLAPI_TEMPLATE_ID_ESTIMATE", "")  # 견적서 템플릿
 SOLAPI_SENDER_PHONE = os.getenv("SOLAPI_SENDER_PHONE", "")  # 발신번호 (대체발송용)
 
-# 솔라피 API 엔드포인트
-SOLAPI_API_URL = "https://api.solapi.com/messages/v4/send"
+# 솔라피 API 엔드포인트 (로컬 테스트 서버로 바꿀 수 있도록 환경변수 지원)
+SOLAPI_API_BASE = os.getenv("SOLAPI_API_BASE", "https://api.solapi.com").rstrip("/")
+SOLAPI_API_URL = f"{SOLAPI_API_BASE}/messages/v4/send"
+SOLAPI_SEND_MANY_URL = f"{SOLAPI_API_BASE}/messages/v4/send-many/detail"
+
+# send-many 요청당 최대 메시지 수
+SOLAPI_BULK_CHUNK_SIZE = int(os.getenv("SOLAPI_BULK_CHUNK_SIZE", "10000"))
+
+# HTTP 연결/재시도 설정
+SOLAPI_CONNECT_TIMEOUT = float(os.getenv("SOLAPI_CONNECT_TIMEOUT", "3"))
+SOLAPI_READ_TIMEOUT = float(os.getenv("SOLAPI_READ_TIMEOUT", "10"))
+SOLAPI_MAX_RETRIES = int(os.getenv("SOLAPI_MAX_RETRIES", "2"))
+SOLAPI_BACKOFF_BASE = float(os.getenv("SOLAPI_BACKOFF_BASE", "0.3"))
+SOLAPI_POOL_SIZE = int(os.getenv("SOLAPI_POOL_SIZE", "10"))
+SOLAPI_BREAKER_THRESHOLD = int(os.getenv("SOLAPI_BREAKER_THRESHOLD", "5"))
+SOLAPI_BREAKER_COOLDOWN = float(os.getenv("SOLAPI_BREAKER_COOLDOWN", "30"))
+
+# 재시도할 HTTP 상태 코드 (서버/게이트웨이 오류)
+RETRY_STATUS_CODES = {500, 502, 503, 504}
 
 # 서비스 URL (Vercel 도메인으로 변경)
 SERVICE_URL = os.getenv("SERVICE_URL", "http://localhost:5000")
 
 
+class SolapiUnavailable(HttpError):
+    """서킷 브레이커가 열려 있어 호출하지 않음"""
+
+
+class CircuitBreaker:
+    """
+    연속 실패 시 일정 시간 호출을 차단하는 서킷 브레이커
+
+    - closed: 정상 호출
+    - open: 연속 실패가 threshold에 도달하면 cooldown 동안 즉시 실패
+    - half-open: cooldown 이후 한 건만 시험 호출, 성공하면 closed로 복귀
+    """
+
+    def __init__(self, threshold=SOLAPI_BREAKER_THRESHOLD, cooldown=SOLAPI_BREAKER_COOLDOWN):
+        self.threshold = threshold
+        self.cooldown = cooldown
+        self._failures = 0
+        self._opened_at = None
+        self._trial_in_flight = False
+        self._lock = threading.Lock()
+
+    @property
+    def state(self):
+        with self._lock:
+            if self._opened_at is None:
+                return "closed"
+            if time.monotonic() - self._opened_at >= self.cooldown:
+                return "half-open"
+            return "open"
+
+    def allow(self):
+        """호출 가능 여부"""
+        with self._lock:
+            if self._opened_at is None:
+                return True
+            if time.monotonic() - self._opened_at < self.cooldown:
+                return False
+            if self._trial_in_flight:
+                return False
+            self._trial_in_flight = True
+            return True
+
+    def release_trial(self):
+        """시험 호출이 성공/실패 기록 없이 끝난 경우(취소, 예상 밖 예외) 다음 시험 호출 허용"""
+        with self._lock:
+            self._trial_in_flight = False
+
+    def record_success(self):
+        with self._lock:
+            self._failures = 0
+            self._opened_at = None
+            self._trial_in_flight = False
+
+    def record_failure(self):
+        with self._lock:
+            self._failures += 1
+            self._trial_in_flight = False
+            if self._opened_at is not None or self._failures >= self.threshold:
+                self._opened_at = time.monotonic()
+
+
+# 모듈 전역 HTTP 연결 풀/서킷 브레이커 (요청 간 공유, 동시 요청 수는 SOLAPI_POOL_SIZE까지)
+_http = AsyncHttpPool(
+    max_connections=SOLAPI_POOL_SIZE,
+    connect_timeout=SOLAPI_CONNECT_TIMEOUT,
+    read_timeout=SOLAPI_READ_TIMEOUT
+)
+solapi_breaker = CircuitBreaker()
+
+
+def _collect_breaker_state():
+    """/metrics용 서킷 브레이커 상태 (현재 상태만 1)"""
+    current = solapi_breaker.state
+    return [(
+        "solapi_circuit_state", "gauge", "솔라피 서킷 브레이커 상태",
+        {(("state", state),): int(state == current) for state in ("closed", "open", "half-open")}
+    )]
+
+
+register_collector(_collect_breaker_state)
+register_stats("solapi_http_pool", "솔라피 HTTP 연결 풀 상태", _http.stats)
+
+
+def _backoff_delay(attempt):
+    """지수 백오프 + 지터 (full jitter)"""
+    return random.uniform(0, SOLAPI_BACKOFF_BASE * (2 ** attempt))
+
+
+async def solapi_post_async(url, payload):
+    """
+    솔라피 API POST (연결 재사용, 재시도, 서킷 브레이커 적용)
+
+    재시도 대상: 연결 실패, 연결 타임아웃, 요청 전송 실패, 5xx 응답
+    요청을 다 보낸 뒤의 실패(응답 대기 타임아웃, 응답 없이 연결 끊김)는
+    이미 접수되었을 수 있어 중복 발송을 피하려고 재시도하지 않음
+
+    Returns:
+        httpx.Response
+
+    Raises:
+        SolapiUnavailable: 서킷이 열려 있어 호출하지 않은 경우
+        HttpError: 재시도 후에도 실패한 경우 (응답 시간 초과는 HttpTimeout)
+    """
+    if not solapi_breaker.allow():
+        raise SolapiUnavailable("솔라피 API 장애로 잠시 발송을 중단했습니다. 잠시 후 다시 시도해주세요.")
+
+    endpoint = url.rsplit("/messages/v4/", 1)[-1]
+    try:
+        attempt = 0
+        while True:
+            try:
+                # 인증 헤더는 시도마다 새로 생성 (date/salt 재사용 방지)
+                headers = {"Authorization": get_auth_header()}
+                with stage("solapi_request", endpoint=endpoint):
+                    response = await _http.post_json(url, payload, headers=headers)
+            except HttpConnectError:
+                if attempt >= SOLAPI_MAX_RETRIES:
+                    solapi_breaker.record_failure()
+                    raise
+            except HttpError:
+                solapi_breaker.record_failure()
+                raise
+            else:
+                if response.status_code not in RETRY_STATUS_CODES:
+                    solapi_breaker.record_success()
+                    return response
+                if attempt >= SOLAPI_MAX_RETRIES:
+                    solapi_breaker.record_failure()
+                    return response
+
+            registry.inc("solapi_retries_total", endpoint=endpoint)
+            await asyncio.sleep(_backoff_delay(attempt))
+            attempt += 1
+    finally:
+        # 취소(CancelledError)나 HttpError가 아닌 예외로 끝나도 half-open 시험 호출 표시가 남지 않도록
+        solapi_breaker.release_trial()
+
+
+def solapi_post(url, payload):
+    """솔라피 API POST (기존 동기 호출용 래퍼)"""
+    return run_sync(solapi_post_async(url, payload))
+
+
 def get_auth_header():
     """
     솔라피 API 인증 헤더 생성 (HMAC-SHA256)
@@ -53,9 +218,56 @@ def get_auth_header():
     return f"HMAC-SHA256 apiKey={SOLAPI_API_KEY}, date={date}, salt={salt}, signature={signature}"
 
 
-def send_kakao_alimtalk(phone, customer_name, doc_type, download_url=None):
+def _check_config():
+    """솔라피 기본 설정 확인 (문제가 있으면 오류 메시지 반환)"""
+    if not SOLAPI_API_KEY or not SOLAPI_API_SECRET:
+        return "솔라피 API 키가 설정되지 않았습니다. 환경변수를 확인해주세요."
+    if not SOLAPI_PF_ID:
+        return "솔라피 카카오 채널 설정이 완료되지 않았습니다."
+    return None
+
+
+def _select_template(doc_type):
+    """
+    문서 유형에 따라 템플릿 선택
+
+    Returns:
+        tuple: (template_id, 템플릿 문서 유형)
+    """
+    # 견적서가 포함된 경우 새 견적서 템플릿 사용 (URL이 버튼에만 있는 버전)
+    if "견적서" in doc_type:
+        return SOLAPI_TEMPLATE_ID_ESTIMATE, "견적서"
+    return SOLAPI_TEMPLATE_ID_PROPOSAL, "제안서"
+
+
+def normalize_phone(phone):
+    """전화번호 정제 (하이픈/공백 제거, 국제번호 → 국내 형식)"""
+    phone = phone.replace("-", "").replace(" ", "")
+    if phone.startswith("82"):
+        phone = "0" + phone[2:]
+    return phone
+
+
+def build_alimtalk_message(phone, customer_name, template_id, download_url=None):
+    """솔라피 알림톡 메시지 객체 생성 (단건/대량 발송 공용)"""
+    return {
+        "to": normalize_phone(phone),
+        "from": SOLAPI_SENDER_PHONE,
+        "kakaoOptions": {
+            "pfId": SOLAPI_PF_ID,
+            "templateId": template_id,
+            "variables": {
+                "#{고객명}": customer_name,
+                "#{URL}": (download_url or SERVICE_URL).replace("https://", "")
+            },
+            "disableSms": True
+        }
+    }
+
+
+async def send_kakao_alimtalk_async(phone, customer_name, doc_type, download_url=None):
     """
-    카카오톡 알림톡 발송 (솔라피 API)
+    카카오톡 알림톡 발송 (솔라피 API, 발송 이벤트 루프에서 실행)
 
     Args:
         phone: 수신자 전화번호 (예: 010-1234-5678 또는 01012345678)
@@ -66,72 +278,24 @@ def send_kakao_alimtalk(phone, customer_name, doc_type, download_url=None):
     Returns:
         dict: {"success": bool, "error": str or None}
     """
-    if not SOLAPI_API_KEY or not SOLAPI_API_SECRET:
-        return {
-            "success": False,
-            "error": "솔라피 API 키가 설정되지 않았습니다. 환경변수를 확인해주세요."
-        }
-
-    if not SOLAPI_PF_ID:
-        return {
-            "success": False,
-            "error": "솔라피 카카오 채널 설정이 완료되지 않았습니다."
-        }
-
-    # 문서 유형에 따라 템플릿 선택
-    # 견적서가 포함된 경우 새 견적서 템플릿 사용 (URL이 버튼에만 있는 버전)
-    if "견적서" in doc_type:
-        template_id = SOLAPI_TEMPLATE_ID_ESTIMATE
-        template_doc_type = "견적서"
-    else:
-        template_id = SOLAPI_TEMPLATE_ID_PROPOSAL
-        template_doc_type = "제안서"
+    config_error = _check_config()
+    if config_error:
+        return {"success": False, "error": config_error}
 
+    template_id, template_doc_type = _select_template(doc_type)
     if not template_id:
         return {
             "success": False,
             "error": f"{template_doc_type} 템플릿 설정이 완료되지 않았습니다."
         }
 
-    # 전화번호 정제 (하이픈, 공백 제거)
-    phone = phone.replace("-", "").replace(" ", "")
-
-    # 국제번호 형식이면 국내 형식으로 변환
-    if phone.startswith("82"):
-        phone = "0" + phone[2:]
-
     try:
-        # 템플릿 메시지 생성 (변수 치환된 최종 메시지)
-        template_text = get_template_message(customer_name, template_doc_type, download_url or SERVICE_URL)
-
         # 솔라피 API 요청 데이터 (단건 발송)
         payload = {
-            "message": {
-                "to": phone,
-                "from": SOLAPI_SENDER_PHONE,
-                "kakaoOptions": {
-                    "pfId": SOLAPI_PF_ID,
-                    "templateId": template_id,
-                    "variables": {
-                        "#{고객명}": customer_name,
-                        "#{URL}": (download_url or SERVICE_URL).replace("https://", "")
-                    },
-                    "disableSms": True
-                }
-            }
-        }
-
-        headers = {
-            "Content-Type": "application/json",
-            "Authorization": get_auth_header()
+            "message": build_alimtalk_message(phone, customer_name, template_id, download_url)
         }
 
-        response = requests.post(
-            SOLAPI_API_URL,
-            headers=headers,
-            json=payload,
-            timeout=30
-        )
+        response = await solapi_post_async(SOLAPI_API_URL, payload)
 
         result = response.json()
 
@@ -154,14 +318,167 @@ def send_kakao_alimtalk(phone, customer_name, doc_type, download_url=None):
             error_msg = result.get("errorMessage", result.get("message", "API 오류"))
             return {"success": False, "error": f"API 오류 ({response.status_code}): {error_msg}"}
 
-    except requests.Timeout:
+    except SolapiUnavailable as e:
+        return {"success": False, "error": str(e)}
+    except HttpTimeout:
         return {"success": False, "error": "API 요청 시간 초과"}
-    except requests.RequestException as e:
+    except HttpError as e:
         return {"success": False, "error": f"API 호출 실패: {str(e)}"}
     except Exception as e:
         return {"success": False, "error": f"발송 실패: {str(e)}"}
 
 
+def send_kakao_alimtalk(phone, customer_name, doc_type, download_url=None):
+    """카카오톡 알림톡 발송 (기존 동기 호출용 래퍼, 결과 형식은 send_kakao_alimtalk_async와 같음)"""
+    return run_sync(send_kakao_alimtalk_async(phone, customer_name, doc_type, download_url))
+
+
+async def send_kakao_alimtalk_bulk_async(recipients):
+    """
+    카카오톡 알림톡 대량 발송 (솔라피 send-many API)
+
+    여러 메시지를 한 번의 요청으로 보내고, 요청당 최대 건수(SOLAPI_BULK_CHUNK_SIZE)를
+    넘으면 나눠서 보냅니다.
+
+    Args:
+        recipients: [{"phone", "customer_name", "doc_type", "download_url"}, ...]
+
+    Returns:
+        list: 수신자 순서대로 {"success", "error", "groupId", "messageId"}
+    """
+    results = [None] * len(recipients)
+
+    config_error = _check_config()
+    if config_error:
+        return [{"success": False, "error": config_error} for _ in recipients]
+
+    # 메시지 생성 (템플릿 설정이 없는 수신자는 바로 실패 처리)
+    prepared = []
+    for index, recipient in enumerate(recipients):
+        template_id, template_doc_type = _select_template(recipient.get("doc_type", ""))
+        if not template_id:
+            results[index] = {
+                "success": False,
+                "error": f"{template_doc_type} 템플릿 설정이 완료되지 않았습니다."
+            }
+            continue
+        message = build_alimtalk_message(
+            recipient["phone"],
+            recipient.get("customer_name", "고객"),
+            template_id,
+            recipient.get("download_url")
+        )
+        prepared.append((index, message))
+
+    for start in range(0, len(prepared), SOLAPI_BULK_CHUNK_SIZE):
+        chunk = prepared[start:start + SOLAPI_BULK_CHUNK_SIZE]
+        chunk_results = await _send_many_chunk([m for _, m in chunk])
+        for index, result in zip((i for i, _ in chunk), chunk_results):
+            results[index] = result
+
+    return results
+
+
+def send_kakao_alimtalk_bulk(recipients):
+    """카카오톡 알림톡 대량 발송 (기존 동기 호출용 래퍼)"""
+    return run_sync(send_kakao_alimtalk_bulk_async(recipients))
+
+
+async def _send_many_chunk(messages):
+    """send-many 요청 한 번 보내고 메시지 순서대로 결과 반환"""
+    try:
+        response = await solapi_post_async(SOLAPI_SEND_MANY_URL, {"messages": messages})
+        result = response.json()
+    except SolapiUnavailable as e:
+        return [{"success": False, "error": str(e)} for _ in messages]
+    except HttpTimeout:
+        return [{"success": False, "error": "API 요청 시간 초과"} for _ in messages]
+    except HttpError as e:
+        return [{"success": False, "error": f"API 호출 실패: {str(e)}"} for _ in messages]
+    except Exception as e:
+        return [{"success": False, "error": f"발송 실패: {str(e)}"} for _ in messages]
+
+    if response.status_code != 200:
+        error_msg = result.get("errorMessage", result.get("message", "API 오류"))
+        return [
+            {"success": False, "error": f"API 오류 ({response.status_code}): {error_msg}"}
+            for _ in messages
+        ]
+
+    group_id = result.get("groupInfo", {}).get("groupId") or result.get("groupId")
+
+    # 응답의 수신번호별 결과를 요청 순서에 맞춰 배정 (같은 번호가 여러 번이면 앞에서부터)
+    accepted = {}
+    for item in result.get("messageList", []):
+        accepted.setdefault(item.get("to"), []).append(item)
+    failed = {}
+    for item in result.get("failedMessageList", []):
+        failed.setdefault(item.get("to"), []).append(item)
+
+    results = []
+    for message in messages:
+        to = message["to"]
+        if failed.get(to):
+            item = failed[to].pop(0)
+            results.append({
+                "success": False,
+                "error": f"발송 실패 ({item.get('statusCode')}): {item.get('statusMessage', '')}",
+                "groupId": group_id,
+                "messageId": item.get("messageId")
+            })
+        elif accepted.get(to):
+            item = accepted[to].pop(0)
+            results.append({
+                "success": True,
+                "error": None,
+                "groupId": group_id,
+                "messageId": item.get("messageId")
+            })
+        else:
+            results.append({
+                "success": bool(group_id),
+                "error": None if group_id else f"발송 실패: {result}",
+                "groupId": group_id,
+                "messageId": None
+            })
+    return results
+
+
+class AlimtalkBatch:
+    """
+    여러 발송 작업의 알림톡을 모아 한 번에 보내는 묶음
+
+    add()로 수신자를 등록한 뒤 각 작업에서 result_async(index)를 기다리면,
+    처음 호출한 작업이 send_kakao_alimtalk_bulk_async를 실행하고 나머지는 결과를 기다립니다.
+    """
+
+    def __init__(self):
+        self._recipients = []
+        self._sending = None  # 일괄 발송 asyncio.Task (발송 이벤트 루프에서 생성)
+
+    def add(self, phone, customer_name, doc_type, download_url=None):
+        """수신자 등록 후 인덱스 반환"""
+        self._recipients.append({
+            "phone": phone,
+            "customer_name": customer_name,
+            "doc_type": doc_type,
+            "download_url": download_url
+        })
+        return len(self._recipients) - 1
+
+    async def result_async(self, index):
+        """등록한 수신자의 발송 결과 (최초 호출 시 일괄 발송)"""
+        if self._sending is None:
+            self._sending = asyncio.ensure_future(send_kakao_alimtalk_bulk_async(self._recipients))
+        # 기다리던 작업 하나가 취소되어도 일괄 발송은 계속되도록 shield
+        results = await asyncio.shield(self._sending)
+        return results[index]
+
+    def result(self, index):
+        """등록한 수신자의 발송 결과 (기존 동기 호출용 래퍼)"""
+        return run_sync(self.result_async(index))
+
+
 def get_template_message(customer_name, doc_type, download_url):
     """
     알림톡 템플릿 메시지 생성
@@ -0,0 +1,221 @@
+# -*- coding: utf-8 -*-
+"""
+요청 단계별 시간 측정 및 Prometheus 텍스트 지표
+
+- stage("이름"): 코드 블록 시간을 focus_stage_duration_seconds 히스토그램에 기록
+  (예외가 나면 focus_stage_errors_total 증가)
+- 요청 안에서 측정한 단계는 Server-Timing 헤더로도 내보낼 수 있음 (METRICS_SERVER_TIMING=true)
+- 캐시/연결 풀 통계처럼 조회 시점 값은 register_collector로 등록해 /metrics 요청 때 수집
+- 외부 패키지 없이 텍스트 형식(0.0.4)만 직접 출력
+"""
+import contextvars
+import os
+import threading
+import time
+from contextlib import contextmanager
+
+METRICS_ENABLED = os.getenv("METRICS_ENABLED", "true").lower() == "true"
+METRICS_SERVER_TIMING = os.getenv("METRICS_SERVER_TIMING", "false").lower() == "true"
+METRICS_TOKEN = os.getenv("METRICS_TOKEN", "")
+
+# 지연 시간 히스토그램 구간 (초)
+DEFAULT_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30)
+
+PREFIX = "focus_"
+
+# 현재 요청에서 측정한 단계 [(이름, 초), ...] (요청 밖이면 None)
+_request_timings = contextvars.ContextVar("request_timings", default=None)
+
+
+class Registry:
+    """카운터/히스토그램 저장소 (스레드 안전)"""
+
+    def __init__(self, buckets=DEFAULT_BUCKETS):
+        self.buckets = tuple(buckets)
+        self._lock = threading.Lock()
+        self._help = {}
+        self._counters = {}    # (이름, 라벨) → 값
+        self._histograms = {}  # (이름, 라벨) → [구간별 개수..., 합계, 개수]
+        self._collectors = []
+
+    def describe(self, name, kind, text):
+        self._help[name] = (kind, text)
+
+    def inc(self, name, amount=1, **labels):
+        key = (name, tuple(sorted(labels.items())))
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0) + amount
+
+    def observe(self, name, value, **labels):
+        key = (name, tuple(sorted(labels.items())))
+        with self._lock:
+            data = self._histograms.get(key)
+            if data is None:
+                data = self._histograms[key] = [0] * (len(self.buckets) + 2)
+            for i, bound in enumerate(self.buckets):
+                if value <= bound:
+                    data[i] += 1
+            data[-2] += value
+            data[-1] += 1
+
+    def register_collector(self, collector):
+        """
+        조회 시점 지표 등록
+
+        Args:
+            collector: 인자 없는 함수, [(이름, "gauge"|"counter", 설명, {라벨 tuple: 값}), ...] 반환
+        """
+        self._collectors.append(collector)
+
+    def reset(self):
+        with self._lock:
+            self._counters.clear()
+            self._histograms.clear()
+
+    def render(self):
+        """Prometheus 텍스트 형식 출력"""
+        with self._lock:
+            counters = dict(self._counters)
+            histograms = {key: list(value) for key, value in self._histograms.items()}
+
+        lines = []
+        for name in sorted({key[0] for key in counters}):
+            self._header(lines, name, "counter")
+            for (metric, labels), value in sorted(counters.items()):
+                if metric == name:
+                    lines.append(f"{PREFIX}{name}{_labels(labels)} {_number(value)}")
+
+        for name in sorted({key[0] for key in histograms}):
+            self._header(lines, name, "histogram")
+            for (metric, labels), data in sorted(histograms.items()):
+                if metric != name:
+                    continue
+                for bound, count in zip(self.buckets, data):
+                    lines.append(f"{PREFIX}{name}_bucket{_labels(labels + (('le', _number(bound)),))} {count}")
+                lines.append(f"{PREFIX}{name}_bucket{_labels(labels + (('le', '+Inf'),))} {data[-1]}")
+                lines.append(f"{PREFIX}{name}_sum{_labels(labels)} {_number(data[-2])}")
+                lines.append(f"{PREFIX}{name}_count{_labels(labels)} {data[-1]}")
+
+        for collector in self._collectors:
+            try:
+                families = collector()
+            except Exception as e:
+                print(f"[Metrics] Collector failed: {e}")
+                continue
+            for name, kind, text, samples in families:
+                lines.append(f"# HELP {PREFIX}{name} {text}")
+                lines.append(f"# TYPE {PREFIX}{name} {kind}")
+                for labels, value in samples.items():
+                    lines.append(f"{PREFIX}{name}{_labels(labels)} {_number(value)}")
+
+        return "\n".join(lines) + "\n"
+
+    def _header(self, lines, name, default_kind):
+        kind, text = self._help.get(name, (default_kind, name))
+        lines.append(f"# HELP {PREFIX}{name} {text}")
+        lines.append(f"# TYPE {PREFIX}{name} {kind}")
+
+
+def _escape(value):
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _labels(labels):
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{key}="{_escape(value)}"' for key, value in labels) + "}"
+
+
+def _number(value):
+    if isinstance(value, bool):
+        return "1" if value else "0"
+    if isinstance(value, float):
+        return repr(value)
+    return str(value)
+
+
+# 프로세스 전역 저장소
+registry = Registry()
+registry.describe("stage_duration_seconds", "histogram", "처리 단계별 소요 시간")
+registry.describe("stage_errors_total", "counter", "예외로 끝난 처리 단계 수")
+registry.describe("http_requests_total", "counter", "HTTP 요청 수")
+registry.describe("http_request_duration_seconds", "histogram", "HTTP 요청 처리 시간")
+
+
+# ===== 단계 측정 =====
+
+@contextmanager
+def stage(name, **labels):
+    """
+    코드 블록 시간 측정
+
+    with stage("pdf_build", doc_type="estimate"):
+        ...
+    """
+    if not METRICS_ENABLED:
+        yield
+        return
+    start = time.perf_counter()
+    try:
+        yield
+    except BaseException:
+        registry.inc("stage_errors_total", stage=name, **labels)
+        raise
+    finally:
+        elapsed = time.perf_counter() - start
+        registry.observe("stage_duration_seconds", elapsed, stage=name, **labels)
+        timings = _request_timings.get()
+        if timings is not None:
+            timings.append((name, elapsed))
+
+
+def begin_request():
+    """요청 시작 (이 컨텍스트에서 측정한 단계를 모음)"""
+    _request_timings.set([])
+    return time.perf_counter()
+
+
+def end_request(started_at, endpoint, method, status):
+    """
+    요청 종료 기록
+
+    Returns:
+        str: Server-Timing 헤더 값
+    """
+    elapsed = time.perf_counter() - started_at
+    timings = _request_timings.get() or []
+    _request_timings.set(None)
+
+    if METRICS_ENABLED:
+        registry.inc("http_requests_total", endpoint=endpoint, method=method, status=str(status))
+        registry.observe("http_request_duration_seconds", elapsed, endpoint=endpoint)
+
+    # 같은 단계가 여러 번 나오면 합산
+    totals = {}
+    for name, seconds in timings:
+        totals[name] = totals.get(name, 0) + seconds
+    parts = [f"{name};dur={seconds * 1000:.1f}" for name, seconds in totals.items()]
+    parts.append(f"total;dur={elapsed * 1000:.1f}")
+    return ", ".join(parts)
+
+
+def register_collector(collector):
+    registry.register_collector(collector)
+
+
+def register_stats(name, text, stats):
+    """
+    stats() 결과(dict)의 숫자 값을 gauge로 등록 (키는 field 라벨)
+
+    Args:
+        stats: 인자 없는 함수 (예: pdf_cache.stats)
+    """
+    def collect():
+        values = {
+            (("field", key),): value
+            for key, value in stats().items()
+            if isinstance(value, (int, float))
+        }
+        return [(name, "gauge", text, values)]
+
+    registry.register_collector(collect)
@@ -0,0 +1,235 @@
+# -*- coding: utf-8 -*-
+"""
+발송 아웃박스 (SQLite)
+
+/send 요청을 바로 처리하지 않고 로컬 DB에 작업으로 저장한 뒤,
+백그라운드 워커가 발송/재시도/상태 기록을 담당합니다.
+- 작업 상태: queued → running → done / failed
+- 채널(email/kakao)별 결과를 저장하고, 재시도 시 실패한 채널만 다시 발송
+- 프로세스가 발송 도중 종료되면 OUTBOX_LEASE_SECONDS가 지난 running 작업을 다시 가져감
+  (해당 작업은 중복 발송될 수 있음: 최소 1회 전달)
+"""
+import json
+import os
+import sqlite3
+import threading
+import time
+import uuid
+
+# Vercel 같은 서버리스 환경은 응답 후 백그라운드 스레드가 멈추므로 기본 비활성
+OUTBOX_ENABLED = os.getenv("OUTBOX_ENABLED", "false" if os.environ.get("VERCEL") else "true").lower() == "true"
+OUTBOX_DB_PATH = os.getenv(
+    "OUTBOX_DB_PATH",
+    "/tmp/outbox.db" if os.environ.get("VERCEL") else os.path.join("output", "outbox.db")
+)
+OUTBOX_WORKERS = int(os.getenv("OUTBOX_WORKERS", "2"))
+OUTBOX_MAX_ATTEMPTS = int(os.getenv("OUTBOX_MAX_ATTEMPTS", "3"))
+OUTBOX_RETRY_DELAY = float(os.getenv("OUTBOX_RETRY_DELAY", "30"))
+OUTBOX_POLL_INTERVAL = float(os.getenv("OUTBOX_POLL_INTERVAL", "1"))
+OUTBOX_LEASE_SECONDS = float(os.getenv("OUTBOX_LEASE_SECONDS", "600"))
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    id TEXT PRIMARY KEY,
+    payload TEXT NOT NULL,
+    status TEXT NOT NULL,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    result TEXT,
+    error TEXT,
+    created_at REAL NOT NULL,
+    updated_at REAL NOT NULL,
+    next_attempt_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_jobs_queue ON jobs (status, next_attempt_at);
+"""
+
+
+class Outbox:
+    """SQLite 기반 발송 작업 큐"""
+
+    def __init__(self, db_path=OUTBOX_DB_PATH, workers=OUTBOX_WORKERS,
+                 max_attempts=OUTBOX_MAX_ATTEMPTS, retry_delay=OUTBOX_RETRY_DELAY,
+                 poll_interval=OUTBOX_POLL_INTERVAL, lease_seconds=OUTBOX_LEASE_SECONDS):
+        self.db_path = db_path
+        self.workers = workers
+        self.max_attempts = max_attempts
+        self.retry_delay = retry_delay
+        self.poll_interval = poll_interval
+        self.lease_seconds = lease_seconds
+
+        self._handler = None
+        self._threads = []
+        self._wakeup = threading.Event()
+        self._stopping = threading.Event()
+        self._start_lock = threading.Lock()
+        self._initialized = False
+
+    # ===== DB =====
+
+    def _connect(self):
+        conn = sqlite3.connect(self.db_path, timeout=30, isolation_level=None)
+        conn.row_factory = sqlite3.Row
+        return conn
+
+    def _init_db(self):
+        if self._initialized:
+            return
+        directory = os.path.dirname(self.db_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        conn = self._connect()
+        try:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript(SCHEMA)
+        finally:
+            conn.close()
+        self._initialized = True
+
+    # ===== 큐 =====
+
+    def enqueue(self, payload):
+        """작업 저장 후 작업 ID 반환"""
+        self._init_db()
+        job_id = uuid.uuid4().hex
+        now = time.time()
+        conn = self._connect()
+        try:
+            conn.execute(
+                "INSERT INTO jobs (id, payload, status, created_at, updated_at, next_attempt_at) "
+                "VALUES (?, ?, 'queued', ?, ?, ?)",
+                (job_id, json.dumps(payload, ensure_ascii=False), now, now, now)
+            )
+        finally:
+            conn.close()
+        self._wakeup.set()
+        return job_id
+
+    def get(self, job_id):
+        """작업 상태 조회 (없으면 None)"""
+        self._init_db()
+        conn = self._connect()
+        try:
+            row = conn.execute("SELECT * FROM jobs WHERE id = ?", (job_id,)).fetchone()
+        finally:
+            conn.close()
+        if row is None:
+            return None
+        return {
+            "job_id": row["id"],
+            "status": row["status"],
+            "attempts": row["attempts"],
+            "result": json.loads(row["result"]) if row["result"] else None,
+            "error": row["error"],
+            "created_at": row["created_at"],
+            "updated_at": row["updated_at"],
+        }
+
+    def _claim(self):
+        """
+        발송할 작업 하나를 running으로 바꾸고 반환 (없으면 None)
+
+        running 상태로 lease_seconds 넘게 갱신이 없는 작업은 발송 도중 종료된 것으로 보고 다시 가져감
+        """
+        now = time.time()
+        conn = self._connect()
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+            row = conn.execute(
+                "SELECT * FROM jobs "
+                "WHERE (status = 'queued' AND next_attempt_at <= ?) "
+                "OR (status = 'running' AND updated_at <= ?) "
+                "ORDER BY created_at LIMIT 1",
+                (now, now - self.lease_seconds)
+            ).fetchone()
+            if row is None:
+                conn.execute("COMMIT")
+                return None
+            conn.execute(
+                "UPDATE jobs SET status = 'running', attempts = attempts + 1, updated_at = ? WHERE id = ?",
+                (now, row["id"])
+            )
+            conn.execute("COMMIT")
+            return row
+        except Exception:
+            if conn.in_transaction:
+                conn.execute("ROLLBACK")
+            raise
+        finally:
+            conn.close()
+
+    def _finish(self, job_id, status, result, error=None, next_attempt_at=None):
+        now = time.time()
+        conn = self._connect()
+        try:
+            conn.execute(
+                "UPDATE jobs SET status = ?, result = ?, error = ?, updated_at = ?, "
+                "next_attempt_at = COALESCE(?, next_attempt_at) WHERE id = ?",
+                (status, json.dumps(result, ensure_ascii=False), error, now, next_attempt_at, job_id)
+            )
+        finally:
+            conn.close()
+
+    # ===== 워커 =====
+
+    def start(self, handler):
+        """
+        백그라운드 워커 시작 (여러 번 호출해도 한 번만 시작)
+
+        Args:
+            handler: handler(payload, previous_result) -> (result, all_succeeded)
+                     previous_result는 이전 시도 결과 (첫 시도면 None)
+        """
+        with self._start_lock:
+            self._handler = handler
+            if self._threads:
+                return
+            self._init_db()
+            for n in range(self.workers):
+                thread = threading.Thread(target=self._run, name=f"outbox-{n}", daemon=True)
+                thread.start()
+                self._threads.append(thread)
+
+    def stop(self):
+        self._stopping.set()
+        self._wakeup.set()
+
+    def _run(self):
+        while not self._stopping.is_set():
+            try:
+                row = self._claim()
+            except sqlite3.Error as e:
+                print(f"[Outbox] Claim failed: {e}")
+                row = None
+
+            if row is None:
+                self._wakeup.wait(self.poll_interval)
+                self._wakeup.clear()
+                continue
+
+            self._process(row)
+
+    def _process(self, row):
+        job_id = row["id"]
+        previous = json.loads(row["result"]) if row["result"] else None
+        # _claim에서 증가시킨 값 (row는 증가 전 값)
+        attempts = row["attempts"] + 1
+
+        try:
+            result, succeeded = self._handler(json.loads(row["payload"]), previous)
+            error = None
+        except Exception as e:
+            result, succeeded = previous, False
+            error = f"발송 실패: {str(e)}"
+
+        if succeeded:
+            self._finish(job_id, "done", result)
+        elif attempts < self.max_attempts:
+            # 지수 백오프 후 재시도
+            delay = self.retry_delay * (2 ** (attempts - 1))
+            self._finish(job_id, "queued", result, error, next_attempt_at=time.time() + delay)
+        else:
+            self._finish(job_id, "failed", result, error)
+
+
+# 프로세스 전역 아웃박스
+outbox = Outbox()
@@ -0,0 +1,189 @@
+# -*- coding: utf-8 -*-
+"""
+렌더링된 PDF 캐시
+
+같은 /view/<doc_id> 링크가 여러 번 열려도 ReportLab 빌드는 한 번만 하도록
+문서 데이터 해시를 키로 PDF bytes를 보관합니다.
+- 메모리: 총 바이트 기준 LRU
+- 디스크(선택): 메모리에서 밀려난 항목을 PDF_CACHE_SPILL_DIR에 보관
+"""
+import os
+import threading
+from collections import OrderedDict
+
+# 캐시 설정 (환경변수에서 로드)
+PDF_CACHE_MAX_BYTES = int(os.getenv("PDF_CACHE_MAX_BYTES", str(32 * 1024 * 1024)))
+PDF_CACHE_SPILL_DIR = os.getenv("PDF_CACHE_SPILL_DIR", "")
+PDF_CACHE_SPILL_MAX_BYTES = int(os.getenv("PDF_CACHE_SPILL_MAX_BYTES", str(256 * 1024 * 1024)))
+
+
+class PdfCache:
+    """바이트 크기 기준 LRU PDF 캐시 (스레드 안전)"""
+
+    def __init__(self, max_bytes=PDF_CACHE_MAX_BYTES, spill_dir=PDF_CACHE_SPILL_DIR,
+                 spill_max_bytes=PDF_CACHE_SPILL_MAX_BYTES):
+        self.max_bytes = max_bytes
+        self.spill_dir = spill_dir
+        self.spill_max_bytes = spill_max_bytes
+        self._items = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+        self._rendering = {}  # 키 → 렌더링 완료 Event
+        self.hits = 0
+        self.misses = 0
+        self.spill_hits = 0
+
+        if self.spill_dir:
+            os.makedirs(self.spill_dir, exist_ok=True)
+
+    def get(self, key):
+        """캐시 조회 (없으면 None)"""
+        with self._lock:
+            pdf_bytes = self._items.get(key)
+            if pdf_bytes is not None:
+                self._items.move_to_end(key)
+                self.hits += 1
+                return pdf_bytes
+
+        # 메모리에 없으면 디스크 확인
+        pdf_bytes = self._read_spill(key)
+        with self._lock:
+            if pdf_bytes is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            self.spill_hits += 1
+        # 메모리 한도보다 큰 항목은 디스크에만 두고 다시 쓰지 않음
+        if len(pdf_bytes) <= self.max_bytes:
+            self.put(key, pdf_bytes)
+        return pdf_bytes
+
+    def put(self, key, pdf_bytes):
+        """캐시 저장 (한도를 넘으면 오래된 항목부터 제거)"""
+        if len(pdf_bytes) > self.max_bytes:
+            self._write_spill(key, pdf_bytes)
+            return
+
+        evicted = []
+        with self._lock:
+            old = self._items.pop(key, None)
+            if old is not None:
+                self._size -= len(old)
+            self._items[key] = pdf_bytes
+            self._size += len(pdf_bytes)
+
+            while self._size > self.max_bytes:
+                old_key, old_bytes = self._items.popitem(last=False)
+                self._size -= len(old_bytes)
+                evicted.append((old_key, old_bytes))
+
+        for old_key, old_bytes in evicted:
+            self._write_spill(old_key, old_bytes)
+
+    def contains(self, key):
+        """캐시(메모리 또는 디스크)에 있는지 확인 (적중 통계와 LRU 순서는 바꾸지 않음)"""
+        with self._lock:
+            if key in self._items:
+                return True
+        return bool(self.spill_dir) and os.path.exists(self._spill_path(key))
+
+    def get_or_render(self, key, render):
+        """
+        캐시에 있으면 반환, 없으면 render()로 생성 후 저장
+
+        같은 키를 여러 스레드가 동시에 요청하면 한 번만 렌더링함
+        """
+        while True:
+            pdf_bytes = self.get(key)
+            if pdf_bytes is not None:
+                return pdf_bytes
+
+            with self._lock:
+                waiting = self._rendering.get(key)
+                if waiting is None:
+                    done = self._rendering[key] = threading.Event()
+            if waiting is None:
+                break
+            waiting.wait()
+
+        try:
+            pdf_bytes = render()
+            self.put(key, pdf_bytes)
+            return pdf_bytes
+        finally:
+            with self._lock:
+                self._rendering.pop(key, None)
+            done.set()
+
+    def clear(self):
+        """메모리 캐시 비우기"""
+        with self._lock:
+            self._items.clear()
+            self._size = 0
+
+    def stats(self):
+        """캐시 적중/미적중 통계"""
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "spill_hits": self.spill_hits,
+                "entries": len(self._items),
+                "bytes": self._size,
+                "max_bytes": self.max_bytes,
+            }
+
+    # ===== 디스크 보관 =====
+
+    def _spill_path(self, key):
+        safe_key = "".join(c for c in key if c.isalnum() or c in ('-', '_'))
+        return os.path.join(self.spill_dir, f"{safe_key}.pdf")
+
+    def _read_spill(self, key):
+        if not self.spill_dir:
+            return None
+        try:
+            with open(self._spill_path(key), 'rb') as f:
+                return f.read()
+        except OSError:
+            return None
+
+    def _write_spill(self, key, pdf_bytes):
+        if not self.spill_dir:
+            return
+        path = self._spill_path(key)
+        try:
+            tmp_path = f"{path}.{threading.get_ident()}.tmp"
+            with open(tmp_path, 'wb') as f:
+                f.write(pdf_bytes)
+            os.replace(tmp_path, path)
+            self._trim_spill()
+        except OSError as e:
+            print(f"[PDF Cache] Spill write failed: {e}")
+
+    def _trim_spill(self):
+        """디스크 보관 용량 초과 시 오래된 파일부터 삭제"""
+        entries = []
+        for name in os.listdir(self.spill_dir):
+            if not name.endswith(".pdf"):
+                continue
+            path = os.path.join(self.spill_dir, name)
+            try:
+                st = os.stat(path)
+            except OSError:
+                continue
+            entries.append((st.st_mtime, st.st_size, path))
+
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total <= self.spill_max_bytes:
+                break
+            try:
+                os.remove(path)
+                total -= size
+            except OSError:
+                pass
+
+
+# 프로세스 전역 캐시
+pdf_cache = PdfCache()
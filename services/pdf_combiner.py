@@ -0,0 +1,225 @@
+# -*- coding: utf-8 -*-
+"""
+제안서 + 견적서 합본 PDF
+
+고정 제안서 PDF(약 3.5MB)는 첫 합본 요청 때 한 번만 읽고 파싱해 템플릿으로 보관합니다.
+합본은 제안서 원본 bytes 뒤에 PDF 증분 업데이트(incremental update)를 붙여 만듭니다.
+- 증분 업데이트: 견적서 페이지 객체들 + 페이지 트리(Pages) 새 버전 + xref + trailer(/Prev)
+- 제안서 내용은 다시 파싱하거나 직렬화하지 않고 원본 bytes를 그대로 사용
+- 요청마다 드는 비용은 견적서 렌더링 + 작은 견적서 PDF 파싱/복사뿐
+"""
+import logging
+import os
+import threading
+from contextlib import contextmanager
+from io import BytesIO
+
+from pypdf import PdfReader
+from pypdf.generic import (
+    ArrayObject, DictionaryObject, EncodedStreamObject, IndirectObject, NameObject,
+    NumberObject, StreamObject
+)
+
+
+@contextmanager
+def _quiet_pypdf():
+    """제안서 파싱 중에만 pypdf 경고 숨김 (깨진 xref 항목은 pypdf가 스스로 복구)"""
+    logger = logging.getLogger("pypdf")
+    previous = logger.level
+    logger.setLevel(logging.ERROR)
+    try:
+        yield
+    finally:
+        logger.setLevel(previous)
+
+
+class ProposalTemplate:
+    """파싱된 제안서 PDF (합본용)"""
+
+    def __init__(self, data):
+        """
+        Args:
+            data: 제안서 PDF bytes (xref 테이블 형식, 암호화되지 않은 파일)
+        """
+        self.data = data
+        with _quiet_pypdf():
+            self._parse(data)
+
+    def _parse(self, data):
+        reader = PdfReader(BytesIO(data))
+        trailer = reader.trailer
+        if "/Encrypt" in trailer:
+            raise ValueError("암호화된 제안서 PDF는 합본할 수 없습니다.")
+
+        root = trailer.raw_get("/Root")
+        catalog = root.get_object()
+        pages_ref = catalog.raw_get("/Pages")
+        pages = pages_ref.get_object()
+        info = trailer.raw_get("/Info") if "/Info" in trailer else None
+
+        self.size = int(trailer["/Size"])
+        self.root_ref = (root.idnum, root.generation)
+        self.info_ref = (info.idnum, info.generation) if isinstance(info, IndirectObject) else None
+        self.file_id = trailer.raw_get("/ID") if "/ID" in trailer else None
+        self.pages_ref = (pages_ref.idnum, pages_ref.generation)
+        self.pages_dict = pages
+        self.kids = list(pages.raw_get("/Kids").get_object())
+        self.page_count = int(pages["/Count"])
+        self.startxref = _find_startxref(data)
+
+    @classmethod
+    def load(cls, path):
+        with open(path, "rb") as f:
+            return cls(f.read())
+
+    def append_pages(self, pdf_bytes):
+        """
+        다른 PDF의 모든 페이지를 제안서 뒤에 붙이는 증분 업데이트 생성
+
+        Returns:
+            bytes: 제안서 원본 bytes 뒤에 그대로 이어 붙일 데이터
+        """
+        source = PdfReader(BytesIO(pdf_bytes))
+        pages_id, pages_gen = self.pages_ref
+        copier = _ObjectCopier(self.size)
+
+        # 견적서의 페이지 트리는 복사하지 않고 제안서 페이지 트리로 연결
+        source_pages = source.trailer["/Root"].raw_get("/Pages")
+        copier.mapping[(source_pages.idnum, source_pages.generation)] = (pages_id, pages_gen)
+
+        new_kids = [copier.reference(page.indirect_reference) for page in source.pages]
+        objects = copier.copy_all(source)
+
+        # 페이지 트리 새 버전 (기존 페이지 + 견적서 페이지)
+        pages = DictionaryObject(self.pages_dict)
+        pages[NameObject("/Kids")] = ArrayObject(self.kids + new_kids)
+        pages[NameObject("/Count")] = NumberObject(self.page_count + len(new_kids))
+
+        out = BytesIO()
+        base_offset = len(self.data)
+        out.write(b"\n")
+
+        offsets = {}
+        offsets[pages_id] = (base_offset + out.tell(), pages_gen)
+        _write_object(out, pages_id, pages_gen, pages)
+        for new_id, obj in objects:
+            offsets[new_id] = (base_offset + out.tell(), 0)
+            _write_object(out, new_id, 0, obj)
+
+        xref_offset = base_offset + out.tell()
+        out.write(b"xref\n")
+        for start, entries in _xref_sections(offsets):
+            out.write(f"{start} {len(entries)}\n".encode())
+            for offset, gen in entries:
+                out.write(f"{offset:010d} {gen:05d} n \n".encode())
+
+        trailer = DictionaryObject({
+            NameObject("/Size"): NumberObject(copier.next_id),
+            NameObject("/Root"): IndirectObject(*self.root_ref, None),
+            NameObject("/Prev"): NumberObject(self.startxref),
+        })
+        if self.info_ref:
+            trailer[NameObject("/Info")] = IndirectObject(*self.info_ref, None)
+        if self.file_id is not None:
+            trailer[NameObject("/ID")] = self.file_id
+        out.write(b"trailer\n")
+        trailer.write_to_stream(out)
+        out.write(f"\nstartxref\n{xref_offset}\n%%EOF\n".encode())
+        return out.getvalue()
+
+    def combine(self, pdf_bytes):
+        """제안서 + 다른 PDF 페이지 합본 bytes"""
+        return self.data + self.append_pages(pdf_bytes)
+
+
+class _ObjectCopier:
+    """원본 PDF 객체를 새 객체 번호로 복사"""
+
+    def __init__(self, first_id):
+        self.next_id = first_id
+        self.mapping = {}  # (원본 번호, 세대) → (새 번호, 세대)
+        self._pending = []
+
+    def reference(self, ref):
+        key = (ref.idnum, ref.generation)
+        if key not in self.mapping:
+            self.mapping[key] = (self.next_id, 0)
+            self._pending.append(ref)
+            self.next_id += 1
+        return IndirectObject(*self.mapping[key], None)
+
+    def copy(self, obj):
+        if isinstance(obj, IndirectObject):
+            return self.reference(obj)
+        if isinstance(obj, StreamObject):
+            # 스트림 데이터는 압축된 상태 그대로 복사 (/Length는 쓸 때 다시 계산)
+            stream = EncodedStreamObject()
+            for key, value in obj.items():
+                if key != "/Length":
+                    stream[key] = self.copy(value)
+            stream._data = obj._data
+            return stream
+        if isinstance(obj, DictionaryObject):
+            return DictionaryObject({key: self.copy(value) for key, value in obj.items()})
+        if isinstance(obj, ArrayObject):
+            return ArrayObject(self.copy(value) for value in obj)
+        return obj
+
+    def copy_all(self, source):
+        """참조된 객체를 모두 복사 (Returns: [(새 번호, 객체), ...])"""
+        objects = []
+        while self._pending:
+            ref = self._pending.pop(0)
+            new_id = self.mapping[(ref.idnum, ref.generation)][0]
+            objects.append((new_id, self.copy(source.get_object(ref))))
+        return objects
+
+
+def _write_object(out, idnum, generation, obj):
+    out.write(f"{idnum} {generation} obj\n".encode())
+    obj.write_to_stream(out)
+    out.write(b"\nendobj\n")
+
+
+def _xref_sections(offsets):
+    """연속된 객체 번호끼리 묶은 xref 하위 섹션"""
+    sections = []
+    for idnum in sorted(offsets):
+        if sections and sections[-1][0] + len(sections[-1][1]) == idnum:
+            sections[-1][1].append(offsets[idnum])
+        else:
+            sections.append((idnum, [offsets[idnum]]))
+    return sections
+
+
+def _find_startxref(data):
+    """파일 끝의 startxref 값"""
+    pos = data.rfind(b"startxref", max(0, len(data) - 2048))
+    if pos < 0:
+        raise ValueError("startxref를 찾을 수 없습니다.")
+    return int(data[pos + len(b"startxref"):].split()[0])
+
+
+# ===== 제안서 템플릿 캐시 =====
+
+_template = {"key": None, "template": None}
+_template_lock = threading.Lock()
+
+
+def get_proposal_template(path):
+    """
+    제안서 템플릿 (파일이 바뀔 때만 다시 파싱)
+
+    Returns:
+        ProposalTemplate 또는 None (파일 없음)
+    """
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    key = (path, st.st_mtime_ns, st.st_size)
+    with _template_lock:
+        if _template["key"] != key:
+            _template.update(key=key, template=ProposalTemplate.load(path))
+            print(f"[PDF Combiner] Proposal template loaded: {path}")
+        return _template["template"]
@@ -3,73 +3,121 @@ from reportlab.lib import colors
 from reportlab.lib.pagesizes import A4
 from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
 from reportlab.lib.units import mm
-from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph, Spacer, HRFlowable
+from reportlab.platypus import SimpleDocTemplate, Table, LongTable, TableStyle, Paragraph, Spacer, HRFlowable
 from reportlab.pdfbase import pdfmetrics
 from reportlab.pdfbase.ttfonts import TTFont
 import os
-import base64
-import tempfile
-from datetime import datetime
+import copy
+import threading
+from functools import lru_cache
 from io import BytesIO
+from xml.sax.saxutils import escape
 
-# Base64 인코딩된 폰트 데이터 임포트
-from services.font_data import KOREAN_FONT_BASE64
+from services.metrics import stage
+from services.artifact_store import artifact_store, safe_filename
 
-# 한글 폰트 설정
+# 한글 폰트 설정 (첫 렌더링 시 load_korean_font()가 결정)
 DEFAULT_FONT = 'Helvetica'
 
+# 폰트 파일 경로 (vercel.json의 includeFiles로 배포 번들에 포함)
+SERVICE_DIR = os.path.dirname(os.path.abspath(__file__))
+PROJECT_ROOT = os.path.dirname(SERVICE_DIR)
+PROJECT_FONT_PATH = os.path.join(PROJECT_ROOT, "fonts", "SpoqaHanSansNeo-Regular.ttf")
+MACOS_FONT_PATH = "/System/Library/Fonts/Supplemental/AppleGothic.ttf"
+
+_font_loaded = False
+_font_lock = threading.Lock()
+
+# 견적서/제안서 고정 문구에 쓰이는 글자 (폰트 서브셋 앞쪽에 항상 같은 순서로 배정)
+FIXED_GLYPH_TEXTS = (
+    "0123456789,.-%()/:@ ",
+    "제 안 서 견 적 서 수 신 님 귀하 년 월 일",
+    "안녕하세요, 입니다. 귀사의 무궁한 발전을 기원하며, 아래와 같이 제안 견적드립니다.",
+    "■ 포커스미디어 광고 내역 모니터 대수 대당 단가 월 견적 원 대",
+    "총 월 견적 할인 없음 월 최종 금액 총 계약 금액 개월 ※ 부가세 별도",
+    "■ 안내사항 • 본 제안서 견적서의 유효기간은 발행일로부터 30일입니다.",
+    "세부 사항은 협의 후 조정될 수 있습니다.",
+    "문의사항이 있으시면 아래 담당자에게 연락 부탁드립니다.",
+    "(주)위즈더플래닝 사업자번호: 668-81-00391 주소: 서울시 금천구 디지털로 178 A동 2518호, 19호",
+    "대표전화: 1670-0704 담당자 Tel: Email:",
+)
+
+
+class SubsetCachingTTFont(TTFont):
+    """
+    문서 간에 글리프 서브셋을 재사용하는 TTFont
+
+    - 문서마다 고정 문구 글자를 먼저 배정해 앞쪽 서브셋 구성이 항상 같아지도록 함
+    - 고객명/아파트명처럼 문서마다 다른 글자는 그 다음 서브셋부터 배정
+    - 같은 구성의 서브셋 폰트 바이너리는 한 번만 생성 (makeSubset 결과 캐시)
+    - 글자 순서가 고정되므로 ASCII 128자 전체를 미리 넣지 않음 (쓰인 글리프만 포함)
+    """
+
+    def __init__(self, name, filename, primer_text=""):
+        super().__init__(name, filename, asciiReadable=0)
+        self._primer_text = "".join(dict.fromkeys(primer_text))
+        self.face.makeSubset = _cached_make_subset(self.face.makeSubset)
+
+    def splitString(self, text, doc, encoding='utf-8'):
+        state = self._assignState(doc)
+        if not getattr(state, 'primed', False):
+            state.primed = True
+            self._prime(state, doc)
+        return super().splitString(text, doc, encoding)
+
+    def _prime(self, state, doc):
+        if state.frozen or not self._primer_text:
+            return
+        super().splitString(self._primer_text, doc)
+        # 문서별 글자는 새 서브셋에서 시작 (256 경계로 이동)
+        if state.nextCode & 0xFF:
+            state.nextCode = (state.nextCode | 0xFF) + 1
+
+
+def _cached_make_subset(make_subset):
+    """서브셋 폰트 생성 결과를 글자 구성(tuple) 기준으로 캐시"""
+    @lru_cache(maxsize=64)
+    def cached(subset):
+        return make_subset(list(subset))
+
+    def make_subset_cached(subset):
+        return cached(tuple(subset))
+
+    make_subset_cached.cache_info = cached.cache_info
+    return make_subset_cached
+
+
 def load_korean_font():
-    """한글 폰트 로드 (Base64 데이터에서 임시 파일로)"""
-    global DEFAULT_FONT
-
-    # 1. 먼저 프로젝트 내 폰트 파일 시도
-    SERVICE_DIR = os.path.dirname(os.path.abspath(__file__))
-    PROJECT_ROOT = os.path.dirname(SERVICE_DIR)
-    project_font = os.path.join(PROJECT_ROOT, "fonts", "SpoqaHanSansNeo-Regular.ttf")
-
-    if os.path.exists(project_font):
-        try:
-            pdfmetrics.registerFont(TTFont('KoreanFont', project_font))
-            DEFAULT_FONT = 'KoreanFont'
-            print(f"[PDF Generator] Font loaded from project: {project_font}")
-            return True
-        except Exception as e:
-            print(f"[PDF Generator] Project font failed: {e}")
-
-    # 2. Base64에서 임시 파일로 저장 후 로드 (Vercel 환경용)
-    try:
-        font_bytes = base64.b64decode(KOREAN_FONT_BASE64)
-        temp_font_path = "/tmp/SpoqaHanSansNeo-Regular.ttf"
-
-        with open(temp_font_path, 'wb') as f:
-            f.write(font_bytes)
-
-        pdfmetrics.registerFont(TTFont('KoreanFont', temp_font_path))
-        DEFAULT_FONT = 'KoreanFont'
-        print(f"[PDF Generator] Font loaded from temp file: {temp_font_path}")
-        return True
-    except Exception as e:
-        print(f"[PDF Generator] Temp font failed: {e}")
-
-    # 3. macOS 시스템 폰트 fallback
-    macos_font = "/System/Library/Fonts/Supplemental/AppleGothic.ttf"
-    if os.path.exists(macos_font):
-        try:
-            pdfmetrics.registerFont(TTFont('KoreanFont', macos_font))
-            DEFAULT_FONT = 'KoreanFont'
-            print(f"[PDF Generator] Font loaded from macOS: {macos_font}")
-            return True
-        except Exception as e:
-            print(f"[PDF Generator] macOS font failed: {e}")
-
-    print("[PDF Generator] WARNING: No Korean font available")
-    return False
-
-# 폰트 로드 실행
-load_korean_font()
-
-# 출력 디렉토리 (Vercel에서는 /tmp 사용)
-OUTPUT_DIR = "/tmp" if os.environ.get("VERCEL") else "output"
+    """한글 폰트 로드 (프로세스당 한 번, 첫 렌더링 시점에 실행)"""
+    global DEFAULT_FONT, _font_loaded
+
+    if _font_loaded:
+        return DEFAULT_FONT == 'KoreanFont'
+
+    with _font_lock:
+        if _font_loaded:
+            return DEFAULT_FONT == 'KoreanFont'
+
+        # 1. 프로젝트 내 폰트 파일 → 2. macOS 시스템 폰트 fallback
+        with stage("font_load"):
+            for label, font_path in (("project", PROJECT_FONT_PATH), ("macOS", MACOS_FONT_PATH)):
+                if not os.path.exists(font_path):
+                    continue
+                try:
+                    pdfmetrics.registerFont(SubsetCachingTTFont(
+                        'KoreanFont', font_path, primer_text="".join(FIXED_GLYPH_TEXTS)
+                    ))
+                    DEFAULT_FONT = 'KoreanFont'
+                    print(f"[PDF Generator] Font loaded from {label}: {font_path}")
+                    break
+                except Exception as e:
+                    print(f"[PDF Generator] {label} font failed: {e}")
+            else:
+                print("[PDF Generator] WARNING: No Korean font available")
+
+        _font_loaded = True
+        return DEFAULT_FONT == 'KoreanFont'
+
 
 # 회사 정보 (고정)
 COMPANY_INFO = {
@@ -79,6 +127,16 @@ COMPANY_INFO = {
     "address": "서울시 금천구 디지털로 178 A동 2518호, 19호"
 }
 
+# 아파트가 이 개수를 넘으면 카드 대신 간략 모드 표(LongTable 하나)로 표시
+ESTIMATE_COMPACT_THRESHOLD = int(os.getenv("ESTIMATE_COMPACT_THRESHOLD", "30"))
+
+# 간략 모드 표 (번호, 아파트명, 모니터 대수, 대당 단가, 월 견적)
+COMPACT_HEADER = ("No.", "아파트명", "모니터 대수", "대당 단가", "월 견적")
+COMPACT_COL_WIDTHS = (14*mm, 66*mm, 26*mm, 30*mm, 34*mm)
+COMPACT_FONT_SIZE = 9
+COMPACT_CELL_PADDING = 5
+COMPACT_ROW_PADDING = 3
+
 # 색상
 PRIMARY_COLOR = colors.HexColor('#4a6cf7')
 SECONDARY_COLOR = colors.HexColor('#6366f1')
@@ -86,10 +144,18 @@ TEXT_COLOR = colors.HexColor('#333333')
 GRAY_COLOR = colors.HexColor('#666666')
 LIGHT_GRAY = colors.HexColor('#f5f5f5')
 BORDER_COLOR = colors.HexColor('#dddddd')
+HIGHLIGHT_BG = colors.HexColor('#e8f0ff')
+DISCOUNT_COLOR = colors.HexColor('#e53935')
 
+# 프로세스당 한 번만 만드는 스타일/고정 문구 레지스트리 (폰트 로드 후 생성)
+_STYLES = None
+_TABLE_STYLES = None
+_STATIC_PARAGRAPHS = {}
 
-def get_styles():
+
+def _build_styles():
     """스타일 정의"""
+    load_korean_font()
     styles = getSampleStyleSheet()
 
     styles.add(ParagraphStyle(
@@ -163,9 +229,134 @@ def get_styles():
         textColor=GRAY_COLOR,
     ))
 
+    # 간략 모드 표에서 긴 아파트명 줄바꿈용
+    styles.add(ParagraphStyle(
+        name='CompactCell',
+        fontName=DEFAULT_FONT,
+        fontSize=COMPACT_FONT_SIZE,
+        leading=COMPACT_FONT_SIZE + 3,
+        textColor=TEXT_COLOR,
+    ))
+
     return styles
 
 
+def _build_table_styles():
+    """표 스타일 정의 (문서/아파트마다 다시 만들지 않도록 공유)"""
+    load_korean_font()
+    return {
+        'recipient': TableStyle([
+            ('FONTNAME', (0, 0), (-1, -1), DEFAULT_FONT),
+            ('VALIGN', (0, 0), (-1, -1), 'TOP'),
+            ('LEFTPADDING', (0, 0), (-1, -1), 0),
+            ('RIGHTPADDING', (0, 0), (-1, -1), 0),
+            ('TOPPADDING', (0, 0), (-1, -1), 3),
+            ('BOTTOMPADDING', (0, 0), (-1, -1), 3),
+        ]),
+        'apt_header': TableStyle([
+            ('FONTNAME', (0, 0), (-1, -1), DEFAULT_FONT),
+            ('BACKGROUND', (0, 0), (-1, -1), PRIMARY_COLOR),
+            ('TEXTCOLOR', (0, 0), (-1, -1), colors.white),
+            ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+            ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
+            ('TOPPADDING', (0, 0), (-1, -1), 10),
+            ('BOTTOMPADDING', (0, 0), (-1, -1), 10),
+            ('LEFTPADDING', (0, 0), (-1, -1), 12),
+        ]),
+        'apt_detail': TableStyle([
+            ('FONTNAME', (0, 0), (-1, -1), DEFAULT_FONT),
+            ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
+            ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
+            ('TOPPADDING', (0, 0), (-1, -1), 8),
+            ('BOTTOMPADDING', (0, 0), (-1, -1), 8),
+            ('BACKGROUND', (0, 0), (-1, 0), LIGHT_GRAY),
+            ('BACKGROUND', (2, 1), (2, 1), HIGHLIGHT_BG),
+            ('TEXTCOLOR', (2, 1), (2, 1), PRIMARY_COLOR),
+            ('GRID', (0, 0), (-1, -1), 0.5, BORDER_COLOR),
+        ]),
+        'summary': TableStyle([
+            ('FONTNAME', (0, 0), (-1, -1), DEFAULT_FONT),
+            ('FONTSIZE', (0, 0), (-1, -1), 11),
+            ('ALIGN', (0, 0), (0, -1), 'RIGHT'),
+            ('ALIGN', (1, 0), (1, -1), 'RIGHT'),
+            ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
+            ('TOPPADDING', (0, 0), (-1, -1), 8),
+            ('BOTTOMPADDING', (0, 0), (-1, -1), 8),
+            ('BACKGROUND', (0, 0), (-1, -1), LIGHT_GRAY),
+            ('GRID', (0, 0), (-1, -1), 0.5, BORDER_COLOR),
+            # 마지막 행 (총 계약 금액) 강조
+            ('FONTSIZE', (-1, -1), (-1, -1), 13),
+            ('TEXTCOLOR', (-1, -1), (-1, -1), PRIMARY_COLOR),
+            ('BACKGROUND', (0, -1), (-1, -1), HIGHLIGHT_BG),
+        ]),
+        # 간략 모드 아파트 목록 (첫 행은 머리글, 이후 행은 번갈아 배경색)
+        'apt_compact': TableStyle([
+            ('FONTNAME', (0, 0), (-1, -1), DEFAULT_FONT),
+            ('FONTSIZE', (0, 0), (-1, -1), COMPACT_FONT_SIZE),
+            ('LEADING', (0, 0), (-1, -1), COMPACT_FONT_SIZE + 3),
+            ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
+            ('ALIGN', (0, 0), (0, -1), 'CENTER'),
+            ('ALIGN', (2, 0), (-1, -1), 'RIGHT'),
+            ('ALIGN', (0, 0), (-1, 0), 'CENTER'),
+            ('TOPPADDING', (0, 0), (-1, -1), COMPACT_ROW_PADDING),
+            ('BOTTOMPADDING', (0, 0), (-1, -1), COMPACT_ROW_PADDING),
+            ('LEFTPADDING', (0, 0), (-1, -1), COMPACT_CELL_PADDING),
+            ('RIGHTPADDING', (0, 0), (-1, -1), COMPACT_CELL_PADDING),
+            ('BACKGROUND', (0, 0), (-1, 0), PRIMARY_COLOR),
+            ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
+            ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, LIGHT_GRAY]),
+            ('TEXTCOLOR', (-1, 1), (-1, -1), PRIMARY_COLOR),
+            ('GRID', (0, 0), (-1, -1), 0.5, BORDER_COLOR),
+        ]),
+        # 할인 행이 있으면 빨간색으로 표시
+        'summary_discount': TableStyle([
+            ('TEXTCOLOR', (1, 1), (1, 1), DISCOUNT_COLOR),
+        ]),
+        'sender': TableStyle([
+            ('FONTNAME', (0, 0), (-1, -1), DEFAULT_FONT),
+            ('VALIGN', (0, 0), (-1, -1), 'TOP'),
+            ('LEFTPADDING', (0, 0), (-1, -1), 0),
+            ('RIGHTPADDING', (0, 0), (-1, -1), 0),
+        ]),
+    }
+
+
+def get_styles():
+    """문단 스타일 레지스트리 (프로세스당 한 번 생성)"""
+    global _STYLES
+    if _STYLES is None:
+        _STYLES = _build_styles()
+    return _STYLES
+
+
+def get_table_styles():
+    """표 스타일 레지스트리 (프로세스당 한 번 생성)"""
+    global _TABLE_STYLES
+    if _TABLE_STYLES is None:
+        _TABLE_STYLES = _build_table_styles()
+    return _TABLE_STYLES
+
+
+def _static_paragraph(text, style_name):
+    """고정 문구 Paragraph - 한 번만 파싱하고 얕은 복사본을 반환"""
+    key = (text, style_name)
+    para = _STATIC_PARAGRAPHS.get(key)
+    if para is None:
+        para = Paragraph(text, get_styles()[style_name])
+        _STATIC_PARAGRAPHS[key] = para
+    # wrap/split 결과는 복사본에만 기록되므로 원본은 문서 간에 공유 가능
+    return copy.copy(para)
+
+
+# 발신자(회사) 정보 블록 - 고정 문구
+SENDER_COMPANY_TEXT = f"""
+    <b>{COMPANY_INFO['name']}</b><br/>
+    사업자번호: {COMPANY_INFO['business_number']}<br/>
+    주소: {COMPANY_INFO['address']}<br/>
+    대표전화: {COMPANY_INFO['phone']}
+    """
+
+
 def generate_proposal(data):
     """제안서 PDF 생성"""
     return _generate_document(data, "proposal")
@@ -176,22 +367,101 @@ def generate_estimate(data):
     return _generate_document(data, "estimate")
 
 
+def generate_estimate_bytes(data):
+    """견적서 PDF를 메모리에서 생성 (파일 저장 없이 bytes 반환)"""
+    return render_document_bytes(data, "estimate")
+
+
+def render_document_bytes(data, doc_type):
+    """문서를 BytesIO 버퍼에 렌더링하여 bytes 반환"""
+    buffer = BytesIO()
+    _build_document(data, doc_type, buffer)
+    return buffer.getvalue()
+
+
 def _generate_document(data, doc_type):
-    """공통 문서 생성 로직"""
-    os.makedirs(OUTPUT_DIR, exist_ok=True)
+    """공통 문서 생성 로직 (산출물 저장소에 저장 후 경로 반환, 같은 내용이면 기존 파일 재사용)"""
+    customer = data.get("customer", {})
+    company_safe = safe_filename(customer.get("company", "고객"))
+    doc_name = "제안서" if doc_type == "proposal" else "견적서"
+    filename = f"{doc_name}_{company_safe}.pdf"
+
+    return artifact_store.get_or_create(
+        doc_type, data, filename, lambda: render_document_bytes(data, doc_type)
+    )
+
 
-    # 파일명 생성
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+def _apartment_cards(apartments, styles, table_styles):
+    """아파트별 카드 (헤더 표 + 상세 표 + 간격)"""
+    elements = []
+    for idx, apt in enumerate(apartments, 1):
+        # 아파트명 헤더
+        apt_header_data = [[
+            Paragraph(f"<b>{idx}. {apt.get('apartment_name', '-')}</b>", styles['KoreanNormal'])
+        ]]
+        apt_header_table = Table(apt_header_data, colWidths=[170*mm])
+        apt_header_table.setStyle(table_styles['apt_header'])
+        elements.append(apt_header_table)
+
+        # 아파트 상세 정보 (모니터 대수, 대당 단가, 월 견적)
+        apt_detail_data = [[
+            _static_paragraph("<b>모니터 대수</b>", 'SmallText'),
+            _static_paragraph("<b>대당 단가</b>", 'SmallText'),
+            _static_paragraph("<b>월 견적</b>", 'SmallText')
+        ], [
+            Paragraph(f"{apt.get('monitor_count', 0)}대", styles['KoreanNormal']),
+            Paragraph(f"{apt.get('unit_price', 0):,}원", styles['KoreanNormal']),
+            Paragraph(f"<b>{apt.get('monthly_total', 0):,}원</b>", styles['KoreanNormal'])
+        ]]
+        apt_detail_table = Table(apt_detail_data, colWidths=[56.67*mm, 56.67*mm, 56.66*mm])
+        apt_detail_table.setStyle(table_styles['apt_detail'])
+        elements.append(apt_detail_table)
+        elements.append(Spacer(1, 3*mm))
+    return elements
+
+
+def _apartment_long_table(apartments, styles, table_styles):
+    """
+    아파트 목록 표 (간략 모드)
+
+    LongTable 하나에 아파트당 한 행, 페이지가 넘어가면 머리글 행 반복
+    셀은 문자열로 넣고, 열 너비를 넘는 아파트명만 줄바꿈되는 Paragraph로 만듦
+    """
+    name_width = COMPACT_COL_WIDTHS[1] - 2 * COMPACT_CELL_PADDING
+    name_style = styles['CompactCell']
+
+    # 문자열만 있는 행은 높이가 고정이므로 미리 지정 (페이지 나눌 때마다 셀 크기를 다시 재지 않음)
+    row_height = COMPACT_FONT_SIZE + 3 + 2 * COMPACT_ROW_PADDING
+    rows = [list(COMPACT_HEADER)]
+    row_heights = [row_height]
+    for idx, apt in enumerate(apartments, 1):
+        name = str(apt.get('apartment_name', '-'))
+        if pdfmetrics.stringWidth(name, DEFAULT_FONT, COMPACT_FONT_SIZE) > name_width:
+            name = Paragraph(escape(name), name_style)
+            row_heights.append(None)
+        else:
+            row_heights.append(row_height)
+        rows.append([
+            str(idx),
+            name,
+            f"{apt.get('monitor_count', 0)}대",
+            f"{apt.get('unit_price', 0):,}원",
+            f"{apt.get('monthly_total', 0):,}원",
+        ])
+
+    table = LongTable(rows, colWidths=COMPACT_COL_WIDTHS, rowHeights=row_heights, repeatRows=1)
+    table.setStyle(table_styles['apt_compact'])
+    return table
+
+
+def _build_document(data, doc_type, target):
+    """문서 렌더링 (target: 파일 경로 또는 BytesIO 같은 파일 객체)"""
     customer = data.get("customer", {})
-    company = customer.get("company", "고객")
-    company_safe = "".join(c for c in company if c.isalnum() or c in (' ', '_')).strip()
     doc_name = "제안서" if doc_type == "proposal" else "견적서"
-    filename = f"{doc_name}_{company_safe}_{timestamp}.pdf"
-    filepath = os.path.join(OUTPUT_DIR, filename)
 
     # PDF 생성
     doc = SimpleDocTemplate(
-        filepath,
+        target,
         pagesize=A4,
         rightMargin=20*mm,
         leftMargin=20*mm,
@@ -199,12 +469,14 @@ def _generate_document(data, doc_type):
         bottomMargin=15*mm
     )
 
+    # 스타일 레지스트리 (첫 호출 시 폰트 로드 후 생성)
     styles = get_styles()
+    table_styles = get_table_styles()
     elements = []
 
     # ===== 헤더 =====
     title = "제 안 서" if doc_type == "proposal" else "견 적 서"
-    elements.append(Paragraph(title, styles['KoreanTitle']))
+    elements.append(_static_paragraph(title, 'KoreanTitle'))
     elements.append(Paragraph(data.get("date", ""), styles['KoreanSubtitle']))
 
     # 구분선
@@ -219,7 +491,7 @@ def _generate_document(data, doc_type):
     # ===== 수신자 정보 =====
     recipient_data = [
         [
-            Paragraph("<b>수 신</b>", styles['SmallText']),
+            _static_paragraph("<b>수 신</b>", 'SmallText'),
             Paragraph(f"<b>{customer.get('company', '-')}</b>", styles['CustomerName'])
         ],
         [
@@ -229,14 +501,7 @@ def _generate_document(data, doc_type):
     ]
 
     recipient_table = Table(recipient_data, colWidths=[25*mm, 145*mm])
-    recipient_table.setStyle(TableStyle([
-        ('FONTNAME', (0, 0), (-1, -1), DEFAULT_FONT),
-        ('VALIGN', (0, 0), (-1, -1), 'TOP'),
-        ('LEFTPADDING', (0, 0), (-1, -1), 0),
-        ('RIGHTPADDING', (0, 0), (-1, -1), 0),
-        ('TOPPADDING', (0, 0), (-1, -1), 3),
-        ('BOTTOMPADDING', (0, 0), (-1, -1), 3),
-    ]))
+    recipient_table.setStyle(table_styles['recipient'])
     elements.append(recipient_table)
     elements.append(Spacer(1, 10*mm))
 
@@ -245,57 +510,20 @@ def _generate_document(data, doc_type):
     안녕하세요, <b>{COMPANY_INFO['name']}</b>입니다.<br/>
     귀사의 무궁한 발전을 기원하며, 아래와 같이 {'제안' if doc_type == 'proposal' else '견적'}드립니다.
     """
-    elements.append(Paragraph(greeting_text, styles['Greeting']))
+    elements.append(_static_paragraph(greeting_text, 'Greeting'))
     elements.append(Spacer(1, 8*mm))
 
     # ===== 광고 내역 =====
-    elements.append(Paragraph("■ 포커스미디어 광고 내역", styles['KoreanHeading']))
+    elements.append(_static_paragraph("■ 포커스미디어 광고 내역", 'KoreanHeading'))
 
     apartments = data.get("apartments", [])
 
-    # 각 아파트를 카드 형태로 표시
-    for idx, apt in enumerate(apartments, 1):
-        # 아파트명 헤더
-        apt_header_data = [[
-            Paragraph(f"<b>{idx}. {apt.get('apartment_name', '-')}</b>", styles['KoreanNormal'])
-        ]]
-        apt_header_table = Table(apt_header_data, colWidths=[170*mm])
-        apt_header_table.setStyle(TableStyle([
-            ('FONTNAME', (0, 0), (-1, -1), DEFAULT_FONT),
-            ('BACKGROUND', (0, 0), (-1, -1), PRIMARY_COLOR),
-            ('TEXTCOLOR', (0, 0), (-1, -1), colors.white),
-            ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-            ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-            ('TOPPADDING', (0, 0), (-1, -1), 10),
-            ('BOTTOMPADDING', (0, 0), (-1, -1), 10),
-            ('LEFTPADDING', (0, 0), (-1, -1), 12),
-        ]))
-        elements.append(apt_header_table)
-
-        # 아파트 상세 정보 (모니터 대수, 대당 단가, 월 견적)
-        apt_detail_data = [[
-            Paragraph("<b>모니터 대수</b>", styles['SmallText']),
-            Paragraph("<b>대당 단가</b>", styles['SmallText']),
-            Paragraph("<b>월 견적</b>", styles['SmallText'])
-        ], [
-            Paragraph(f"{apt.get('monitor_count', 0)}대", styles['KoreanNormal']),
-            Paragraph(f"{apt.get('unit_price', 0):,}원", styles['KoreanNormal']),
-            Paragraph(f"<b>{apt.get('monthly_total', 0):,}원</b>", styles['KoreanNormal'])
-        ]]
-        apt_detail_table = Table(apt_detail_data, colWidths=[56.67*mm, 56.67*mm, 56.66*mm])
-        apt_detail_table.setStyle(TableStyle([
-            ('FONTNAME', (0, 0), (-1, -1), DEFAULT_FONT),
-            ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
-            ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-            ('TOPPADDING', (0, 0), (-1, -1), 8),
-            ('BOTTOMPADDING', (0, 0), (-1, -1), 8),
-            ('BACKGROUND', (0, 0), (-1, 0), LIGHT_GRAY),
-            ('BACKGROUND', (2, 1), (2, 1), colors.HexColor('#e8f0ff')),
-            ('TEXTCOLOR', (2, 1), (2, 1), PRIMARY_COLOR),
-            ('GRID', (0, 0), (-1, -1), 0.5, BORDER_COLOR),
-        ]))
-        elements.append(apt_detail_table)
+    # 아파트가 많으면 카드 대신 한 개의 표로 표시 (흐름 객체 수를 아파트 수와 무관하게 유지)
+    if len(apartments) > ESTIMATE_COMPACT_THRESHOLD:
+        elements.append(_apartment_long_table(apartments, styles, table_styles))
         elements.append(Spacer(1, 3*mm))
+    else:
+        elements.extend(_apartment_cards(apartments, styles, table_styles))
 
     elements.append(Spacer(1, 2*mm))
 
@@ -318,37 +546,20 @@ def _generate_document(data, doc_type):
     summary_data.append([f"총 계약 금액 ({months}개월)", f'{final_total:,}원'])
 
     summary_table = Table(summary_data, colWidths=[100*mm, 70*mm])
-
-    summary_styles = [
-        ('FONTNAME', (0, 0), (-1, -1), DEFAULT_FONT),
-        ('FONTSIZE', (0, 0), (-1, -1), 11),
-        ('ALIGN', (0, 0), (0, -1), 'RIGHT'),
-        ('ALIGN', (1, 0), (1, -1), 'RIGHT'),
-        ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-        ('TOPPADDING', (0, 0), (-1, -1), 8),
-        ('BOTTOMPADDING', (0, 0), (-1, -1), 8),
-        ('BACKGROUND', (0, 0), (-1, -1), LIGHT_GRAY),
-        ('GRID', (0, 0), (-1, -1), 0.5, BORDER_COLOR),
-        # 마지막 행 (총 계약 금액) 강조
-        ('FONTSIZE', (-1, -1), (-1, -1), 13),
-        ('TEXTCOLOR', (-1, -1), (-1, -1), PRIMARY_COLOR),
-        ('BACKGROUND', (0, -1), (-1, -1), colors.HexColor('#e8f0ff')),
-    ]
+    summary_table.setStyle(table_styles['summary'])
 
     # 할인 행이 있으면 빨간색으로 표시
     if discount_rate > 0:
-        summary_styles.append(('TEXTCOLOR', (1, 1), (1, 1), colors.HexColor('#e53935')))
-
-    summary_table.setStyle(TableStyle(summary_styles))
+        summary_table.setStyle(table_styles['summary_discount'])
     elements.append(summary_table)
 
     # 부가세 안내
     elements.append(Spacer(1, 2*mm))
-    elements.append(Paragraph("※ 부가세 별도", styles['SmallText']))
+    elements.append(_static_paragraph("※ 부가세 별도", 'SmallText'))
     elements.append(Spacer(1, 10*mm))
 
     # ===== 안내사항 =====
-    elements.append(Paragraph("■ 안내사항", styles['KoreanHeading']))
+    elements.append(_static_paragraph("■ 안내사항", 'KoreanHeading'))
 
     notes = [
         f"본 {doc_name}의 유효기간은 발행일로부터 30일입니다.",
@@ -357,7 +568,7 @@ def _generate_document(data, doc_type):
     ]
 
     for note in notes:
-        elements.append(Paragraph(f"• {note}", styles['KoreanNormal']))
+        elements.append(_static_paragraph(f"• {note}", 'KoreanNormal'))
 
     elements.append(Spacer(1, 15*mm))
 
@@ -373,13 +584,6 @@ def _generate_document(data, doc_type):
     # ===== 발신자 정보 =====
     manager = data.get("manager", {})
 
-    sender_left = f"""
-    <b>{COMPANY_INFO['name']}</b><br/>
-    사업자번호: {COMPANY_INFO['business_number']}<br/>
-    주소: {COMPANY_INFO['address']}<br/>
-    대표전화: {COMPANY_INFO['phone']}
-    """
-
     sender_right = ""
     if manager.get("name"):
         sender_right = f"""
@@ -391,23 +595,17 @@ def _generate_document(data, doc_type):
 
     if sender_right:
         sender_data = [[
-            Paragraph(sender_left, styles['SmallText']),
+            _static_paragraph(SENDER_COMPANY_TEXT, 'SmallText'),
             Paragraph(sender_right, styles['SmallText'])
         ]]
         sender_table = Table(sender_data, colWidths=[100*mm, 70*mm])
     else:
-        sender_data = [[Paragraph(sender_left, styles['SmallText'])]]
+        sender_data = [[_static_paragraph(SENDER_COMPANY_TEXT, 'SmallText')]]
         sender_table = Table(sender_data, colWidths=[170*mm])
 
-    sender_table.setStyle(TableStyle([
-        ('FONTNAME', (0, 0), (-1, -1), DEFAULT_FONT),
-        ('VALIGN', (0, 0), (-1, -1), 'TOP'),
-        ('LEFTPADDING', (0, 0), (-1, -1), 0),
-        ('RIGHTPADDING', (0, 0), (-1, -1), 0),
-    ]))
+    sender_table.setStyle(table_styles['sender'])
     elements.append(sender_table)
 
     # PDF 빌드
-    doc.build(elements)
-
-    return filepath
+    with stage("pdf_build", doc_type=doc_type):
+        doc.build(elements)
@@ -0,0 +1,90 @@
+# -*- coding: utf-8 -*-
+"""
+견적서 PDF 미리 생성
+
+알림톡으로 /view 링크를 보내면 고객이 곧 "견적서 PDF 다운로드"를 누를 가능성이 높으므로
+발송 직후 백그라운드에서 같은 문서를 렌더링해 PDF 캐시에 넣어 둡니다.
+- 대기 + 실행 중인 작업은 PRERENDER_MAX_PENDING개까지 (넘으면 버림, 요청은 기다리지 않음)
+- 같은 문서가 이미 대기 중이면 다시 넣지 않음
+- 작업 스레드는 PRERENDER_WORKERS개 (렌더링도 작업 스레드에서 직접 실행)
+"""
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+# 서버리스(Vercel)는 응답 후 백그라운드 작업이 멈추므로 기본 비활성화
+PRERENDER_ENABLED = os.getenv(
+    "PRERENDER_ENABLED", "false" if os.environ.get("VERCEL") else "true"
+).lower() == "true"
+PRERENDER_MAX_PENDING = int(os.getenv("PRERENDER_MAX_PENDING", "16"))
+PRERENDER_WORKERS = int(os.getenv("PRERENDER_WORKERS", "1"))
+
+
+class Prerenderer:
+    """대기 작업 수가 제한된 백그라운드 렌더링 큐 (스레드 안전)"""
+
+    def __init__(self, max_pending=PRERENDER_MAX_PENDING, workers=PRERENDER_WORKERS, enabled=PRERENDER_ENABLED):
+        self.max_pending = max_pending
+        self.enabled = enabled and max_pending > 0 and workers > 0
+        self._executor = ThreadPoolExecutor(max_workers=max(workers, 1), thread_name_prefix="prerender")
+        self._pending = set()
+        self._lock = threading.Lock()
+        self.scheduled = 0
+        self.duplicates = 0
+        self.dropped = 0
+        self.completed = 0
+        self.failed = 0
+
+    def submit(self, key, job):
+        """
+        작업 등록 (기다리지 않음)
+
+        Args:
+            key: 같은 문서 중복 등록을 막기 위한 키
+            job: 인자 없는 함수
+
+        Returns:
+            bool: 등록 여부 (비활성화, 중복, 대기 한도 초과면 False)
+        """
+        if not self.enabled:
+            return False
+        with self._lock:
+            if key in self._pending:
+                self.duplicates += 1
+                return False
+            if len(self._pending) >= self.max_pending:
+                self.dropped += 1
+                return False
+            self._pending.add(key)
+            self.scheduled += 1
+        self._executor.submit(self._run, key, job)
+        return True
+
+    def _run(self, key, job):
+        try:
+            job()
+            with self._lock:
+                self.completed += 1
+        except Exception as e:
+            print(f"[Prerender] Failed: {e}")
+            with self._lock:
+                self.failed += 1
+        finally:
+            with self._lock:
+                self._pending.discard(key)
+
+    def stats(self):
+        with self._lock:
+            return {
+                "pending": len(self._pending),
+                "max_pending": self.max_pending,
+                "scheduled": self.scheduled,
+                "duplicates": self.duplicates,
+                "dropped": self.dropped,
+                "completed": self.completed,
+                "failed": self.failed,
+            }
+
+
+# 프로세스 전역 큐
+prerenderer = Prerenderer()
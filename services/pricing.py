@@ -0,0 +1,213 @@
+# -*- coding: utf-8 -*-
+"""
+견적 금액 계산
+
+/preview, /generate, /send, /quote/matrix가 같은 계산을 쓰도록 모은 모듈입니다.
+- 아파트 목록은 열 단위(ApartmentTable: 이름 / 모니터 수 / 단가 배열)로 저장
+- 아파트별 월 금액(monthly_total)은 모니터 수 × 단가로 항상 다시 계산
+- 할인 금액은 원 단위 내림 (프론트 Math.floor와 동일)
+- quote_matrix는 월 합계를 한 번만 구한 뒤 할인 × 개월수 조합을 한꺼번에 계산
+- 요청의 아파트 항목은 apartment_id로 인벤토리 값을 참조할 수 있음
+"""
+from array import array
+
+from services.apartment_inventory import apartment_inventory
+
+# 기간 할인율
+DISCOUNT_OPTIONS = {
+    "none": {"label": "할인 없음", "rate": 0},
+    "5": {"label": "5% 할인", "rate": 0.05},
+    "10": {"label": "10% 할인", "rate": 0.10},
+    "15": {"label": "15% 할인", "rate": 0.15},
+}
+DEFAULT_DISCOUNT = "none"
+
+# 계약 개월수 선택지
+CONTRACT_MONTHS = (3, 6, 12)
+DEFAULT_MONTHS = 3
+
+# /quote/matrix에서 직접 지정할 수 있는 개월수 개수/범위
+MATRIX_MAX_MONTHS_OPTIONS = 24
+MAX_MONTHS = 120
+
+# 모니터 수/단가 허용 범위 (곱해도 64비트 배열에 들어가도록 32비트로 제한)
+MAX_INT_VALUE = 2 ** 31 - 1
+
+
+def _to_int(value, default=0):
+    """정수 변환 (실패하거나 범위를 넘으면 기본값, 프론트 parseInt(...) || 0과 같은 처리)"""
+    try:
+        number = int(value)
+    except (TypeError, ValueError):
+        try:
+            number = int(float(value))
+        except (TypeError, ValueError, OverflowError):
+            return default
+    return number if -MAX_INT_VALUE <= number <= MAX_INT_VALUE else default
+
+
+def parse_months(value, default=DEFAULT_MONTHS):
+    """계약 개월수 해석 (잘못된 값이면 기본값)"""
+    months = _to_int(value, default)
+    return months if 0 < months <= MAX_MONTHS else default
+
+
+def get_discount(discount_key):
+    """할인 옵션 (없는 키면 할인 없음)"""
+    return DISCOUNT_OPTIONS.get(discount_key, DISCOUNT_OPTIONS[DEFAULT_DISCOUNT])
+
+
+class ApartmentTable:
+    """아파트 목록 (열 단위 배열)"""
+
+    __slots__ = ("names", "monitor_counts", "unit_prices")
+
+    def __init__(self, names=None, monitor_counts=None, unit_prices=None):
+        self.names = list(names or [])
+        self.monitor_counts = array("q", monitor_counts or [])
+        self.unit_prices = array("q", unit_prices or [])
+
+    @classmethod
+    def from_records(cls, apartments):
+        """[{apartment_name, monitor_count, unit_price}, ...] → 열 단위 테이블"""
+        table = cls()
+        for apt in apartments or []:
+            if not isinstance(apt, dict):
+                continue
+            table.names.append(str(apt.get("apartment_name", "") or ""))
+            table.monitor_counts.append(_to_int(apt.get("monitor_count")))
+            table.unit_prices.append(_to_int(apt.get("unit_price")))
+        return table
+
+    def __len__(self):
+        return len(self.names)
+
+    def monthly_totals(self):
+        """아파트별 월 금액 배열"""
+        return array("q", map(int.__mul__, self.monitor_counts, self.unit_prices))
+
+    def total_monthly(self):
+        """총 월 견적"""
+        return sum(map(int.__mul__, self.monitor_counts, self.unit_prices))
+
+    def to_records(self):
+        """문서/응답용 아파트 목록"""
+        return [
+            {
+                "apartment_name": name,
+                "monitor_count": count,
+                "unit_price": price,
+                "monthly_total": total,
+            }
+            for name, count, price, total in zip(
+                self.names, self.monitor_counts, self.unit_prices, self.monthly_totals()
+            )
+        ]
+
+
+def compute_totals(total_monthly, discount_rate, months):
+    """
+    총 월 견적과 할인율/개월수로 합계 필드 계산
+
+    Returns:
+        dict: total_monthly, discount_amount, monthly_final, final_total
+    """
+    discount_amount = int(total_monthly * discount_rate)
+    monthly_final = total_monthly - discount_amount
+    return {
+        "total_monthly": total_monthly,
+        "discount_amount": discount_amount,
+        "monthly_final": monthly_final,
+        "final_total": monthly_final * months,
+    }
+
+
+def quote(apartments, discount_key=DEFAULT_DISCOUNT, months=DEFAULT_MONTHS):
+    """
+    견적 계산
+
+    Args:
+        apartments: 아파트 목록(dict 리스트) 또는 ApartmentTable
+        discount_key: DISCOUNT_OPTIONS 키
+        months: 계약 개월수
+
+    Returns:
+        dict: 문서 데이터의 금액 필드 (apartments, total_monthly, discount_label, discount_rate,
+              discount_amount, monthly_final, months, final_total)
+    """
+    table = apartments if isinstance(apartments, ApartmentTable) else ApartmentTable.from_records(apartments)
+    months = parse_months(months)
+    discount = get_discount(discount_key)
+    totals = compute_totals(table.total_monthly(), discount["rate"], months)
+    return {
+        "apartments": table.to_records(),
+        "total_monthly": totals["total_monthly"],
+        "discount_label": discount["label"],
+        "discount_rate": discount["rate"],
+        "discount_amount": totals["discount_amount"],
+        "monthly_final": totals["monthly_final"],
+        "months": months,
+        "final_total": totals["final_total"],
+    }
+
+
+def quote_from_request(data):
+    """
+    /preview, /generate, /send 요청 값(apartments, discount, months)으로 견적 계산
+
+    Raises:
+        UnknownApartmentError: 인벤토리에 없는 apartment_id
+    """
+    return quote(
+        apartment_inventory.resolve_apartments(data.get("apartments", [])),
+        data.get("discount", DEFAULT_DISCOUNT),
+        data.get("months", DEFAULT_MONTHS),
+    )
+
+
+def quote_matrix(apartments, discount_keys=None, months_options=None):
+    """
+    할인 × 개월수 모든 조합의 견적 계산
+
+    Args:
+        apartments: 아파트 목록(dict 리스트) 또는 ApartmentTable
+        discount_keys: 비교할 할인 키 목록 (기본: 전체)
+        months_options: 비교할 개월수 목록 (기본: CONTRACT_MONTHS)
+
+    Returns:
+        dict: apartments, total_monthly, discounts, months_options,
+              scenarios([{discount, discount_label, discount_rate, discount_amount,
+                          monthly_final, months, final_total}, ...] 할인 순 → 개월수 순)
+    """
+    table = apartments if isinstance(apartments, ApartmentTable) else ApartmentTable.from_records(apartments)
+    keys = [key for key in (discount_keys or DISCOUNT_OPTIONS) if key in DISCOUNT_OPTIONS]
+    months_list = list(dict.fromkeys(
+        parse_months(m) for m in (months_options or CONTRACT_MONTHS)
+    ))
+
+    total_monthly = table.total_monthly()
+    rates = [DISCOUNT_OPTIONS[key]["rate"] for key in keys]
+    discount_amounts = [int(total_monthly * rate) for rate in rates]
+    monthly_finals = [total_monthly - amount for amount in discount_amounts]
+
+    scenarios = []
+    for key, rate, amount, monthly_final in zip(keys, rates, discount_amounts, monthly_finals):
+        label = DISCOUNT_OPTIONS[key]["label"]
+        for months in months_list:
+            scenarios.append({
+                "discount": key,
+                "discount_label": label,
+                "discount_rate": rate,
+                "discount_amount": amount,
+                "monthly_final": monthly_final,
+                "months": months,
+                "final_total": monthly_final * months,
+            })
+
+    return {
+        "apartments": table.to_records(),
+        "total_monthly": total_monthly,
+        "discounts": keys,
+        "months_options": months_list,
+        "scenarios": scenarios,
+    }
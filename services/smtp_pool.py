@@ -0,0 +1,190 @@
+# -*- coding: utf-8 -*-
+"""
+SMTP 연결 풀 (aiosmtplib)
+
+send_email 호출마다 연결 → STARTTLS → LOGIN → QUIT을 반복하지 않도록
+로그인된 SMTP 연결을 보관했다가 재사용합니다.
+- 발송 이벤트 루프(async_runtime)에서 사용 (동시에 열 수 있는 연결 수 제한)
+- SMTP 프로토콜(EHLO, STARTTLS, AUTH, SMTPUTF8/8BITMIME 협상, Bcc 헤더 제거)은 aiosmtplib가 처리
+- 오래 쉬던 연결은 NOOP으로 살아있는지 확인 후 재사용
+- 최대 유휴 시간을 넘긴 연결은 닫음
+- 재사용한 연결이 MAIL FROM 수락 전에 끊겨 있었던 경우에만 새 연결로 한 번 재시도
+  (그 뒤에 끊기면 서버가 이미 접수했을 수 있으므로 중복 발송을 피하려고 재시도하지 않음)
+- 오류는 aiosmtplib 예외(SMTPAuthenticationError, SMTPResponseException 등)로 알림
+"""
+import asyncio
+import socket
+import time
+from collections import deque
+from contextlib import asynccontextmanager
+
+import aiosmtplib
+
+from services.metrics import stage
+
+
+class PooledSMTP(aiosmtplib.SMTP):
+    """풀에서 관리하는 SMTP 연결 (MAIL FROM 수락 여부를 기록해 재시도 가능 여부 판단)"""
+
+    from_pool = False
+    mail_accepted = False
+
+    async def mail(self, *args, **kwargs):
+        response = await super().mail(*args, **kwargs)
+        self.mail_accepted = True
+        return response
+
+
+class SmtpConnectionPool:
+    """로그인된 SMTP 연결 풀 (발송 이벤트 루프 전용)"""
+
+    def __init__(self, host, port, username="", password="", use_ssl=False, use_starttls=True,
+                 max_size=4, max_idle=60, keepalive_after=10, timeout=30, local_hostname=""):
+        """
+        Args:
+            host, port: SMTP 서버
+            username, password: 로그인 정보 (username이 비어 있으면 로그인 생략)
+            use_ssl: SSL 연결 사용 여부 (포트 465)
+            use_starttls: SSL이 아닐 때 STARTTLS 사용 여부
+            max_size: 동시에 열 수 있는 최대 연결 수
+            max_idle: 이 시간(초) 이상 쉰 연결은 닫고 새로 연결
+            keepalive_after: 이 시간(초) 이상 쉰 연결은 NOOP으로 확인 후 사용
+            timeout: 응답 대기 타임아웃(초)
+            local_hostname: EHLO에 보낼 호스트 이름 (비어 있으면 이 서버의 FQDN)
+        """
+        self.host = host
+        self.port = port
+        self.username = username
+        self.password = password
+        self.use_ssl = use_ssl
+        self.use_starttls = use_starttls
+        self.max_size = max_size
+        self.max_idle = max_idle
+        self.keepalive_after = keepalive_after
+        self.timeout = timeout
+        self.local_hostname = local_hostname
+
+        self._idle = deque()  # (연결, 반납 시각)
+        self._slots = asyncio.Semaphore(max_size)
+        self.created = 0
+        self.reused = 0
+        self.retried = 0
+
+    # ===== 연결 관리 =====
+
+    async def _connect(self):
+        """새 SMTP 연결 생성 및 로그인"""
+        if not self.local_hostname:
+            # FQDN 조회는 DNS를 탈 수 있어 처음 한 번만 스레드에서
+            self.local_hostname = await asyncio.to_thread(socket.getfqdn)
+
+        conn = PooledSMTP(
+            hostname=self.host,
+            port=self.port,
+            use_tls=self.use_ssl,
+            start_tls=self.use_starttls and not self.use_ssl,
+            timeout=self.timeout,
+            local_hostname=self.local_hostname,
+        )
+        with stage("smtp_handshake"):
+            try:
+                await conn.connect()
+                if self.username:
+                    await conn.login(self.username, self.password)
+            except BaseException:
+                conn.close()
+                raise
+        self.created += 1
+        return conn
+
+    async def _take_idle(self):
+        """재사용 가능한 유휴 연결 꺼내기 (없으면 None)"""
+        while self._idle:
+            conn, released_at = self._idle.pop()
+
+            idle_for = time.monotonic() - released_at
+            if idle_for > self.max_idle or not conn.is_connected:
+                await _close_quietly(conn)
+                continue
+            if idle_for > self.keepalive_after and not await _is_alive(conn):
+                await _close_quietly(conn)
+                continue
+
+            self.reused += 1
+            return conn
+        return None
+
+    @asynccontextmanager
+    async def connection(self, fresh=False):
+        """
+        풀에서 연결을 빌려 사용
+
+        블록 안에서 예외가 나면 해당 연결은 풀에 돌려놓지 않고 닫습니다.
+        fresh=True면 유휴 연결을 쓰지 않고 새로 연결합니다.
+        """
+        async with self._slots:
+            conn = None if fresh else await self._take_idle()
+            from_pool = conn is not None
+            if conn is None:
+                conn = await self._connect()
+            conn.from_pool = from_pool
+            conn.mail_accepted = False
+            try:
+                yield conn
+            except BaseException:
+                conn.close()
+                raise
+            self._idle.append((conn, time.monotonic()))
+
+    async def send_message(self, msg):
+        """
+        메시지 발송
+
+        재사용한 연결이 MAIL FROM 수락 전에 끊겨 있었으면(오래된 연결) 새 연결로 한 번 재시도합니다.
+
+        Returns:
+            tuple: (거부된 수신자 {주소: 응답}, 최종 응답 메시지)
+        """
+        conn = None
+        try:
+            async with self.connection() as conn:
+                return await conn.send_message(msg)
+        except (aiosmtplib.SMTPServerDisconnected, ConnectionError):
+            if conn is None or not conn.from_pool or conn.mail_accepted:
+                raise
+        self.retried += 1
+        async with self.connection(fresh=True) as conn:
+            return await conn.send_message(msg)
+
+    async def close_all(self):
+        """유휴 연결 모두 닫기"""
+        idle = list(self._idle)
+        self._idle.clear()
+        for conn, _ in idle:
+            await _close_quietly(conn)
+
+    def stats(self):
+        """풀 상태"""
+        return {
+            "idle": len(self._idle),
+            "created": self.created,
+            "reused": self.reused,
+            "retried": self.retried,
+            "max_size": self.max_size,
+        }
+
+
+async def _is_alive(conn):
+    """NOOP으로 연결 상태 확인"""
+    try:
+        await conn.noop()
+        return True
+    except (aiosmtplib.SMTPException, OSError):
+        return False
+
+
+async def _close_quietly(conn):
+    try:
+        await conn.quit()
+    except (aiosmtplib.SMTPException, OSError):
+        conn.close()
@@ -1,11 +1,3 @@
-// 할인율
-const discountRates = {
-    "none": 0,
-    "5": 0.05,
-    "10": 0.10,
-    "15": 0.15
-};
-
 // 아파트 카운터
 let apartmentCounter = 0;
 
@@ -40,9 +32,12 @@ function addApartment() {
                 ${apartmentCounter > 1 ? `<button type="button" class="btn-remove" onclick="removeApartment(${apartmentCounter})">삭제</button>` : ''}
             </div>
             <div class="form-grid">
-                <div class="form-group">
+                <div class="form-group apt-name-group">
                     <label>아파트명</label>
-                    <input type="text" class="apt-name" data-id="${apartmentCounter}" placeholder="OO아파트" oninput="updateTotalCalculation()">
+                    <input type="text" class="apt-name" data-id="${apartmentCounter}" placeholder="OO아파트 (초성 검색 가능)" autocomplete="off"
+                        oninput="onApartmentNameInput(${apartmentCounter})" onkeydown="onApartmentNameKeydown(event, ${apartmentCounter})"
+                        onblur="hideApartmentSuggestions(${apartmentCounter})">
+                    <div class="apt-suggestions" id="apt-suggestions-${apartmentCounter}"></div>
                 </div>
                 <div class="form-group">
                     <label>모니터 대수</label>
@@ -73,6 +68,107 @@ function removeApartment(id) {
     }
 }
 
+// ===== 아파트 인벤토리 자동완성 =====
+
+// 아파트별 검색 타이머 / 현재 검색 결과
+const apartmentSearchTimers = {};
+const apartmentSuggestions = {};
+
+// 아파트명 입력 (직접 수정하면 인벤토리 연결 해제 후 검색)
+function onApartmentNameInput(id) {
+    const item = document.querySelector(`.apartment-item[data-id="${id}"]`);
+    delete item.dataset.apartmentId;
+    updateTotalCalculation();
+
+    clearTimeout(apartmentSearchTimers[id]);
+    const query = item.querySelector('.apt-name').value.trim();
+    if (!query) {
+        hideApartmentSuggestions(id);
+        return;
+    }
+    apartmentSearchTimers[id] = setTimeout(() => searchApartments(id, query), 150);
+}
+
+async function searchApartments(id, query) {
+    try {
+        const response = await fetch(`/apartments/search?q=${encodeURIComponent(query)}&limit=10`);
+        if (!response.ok) return;
+        const result = await response.json();
+
+        // 응답이 오는 사이 입력이 바뀌었으면 무시
+        const input = document.querySelector(`.apt-name[data-id="${id}"]`);
+        if (!input || input.value.trim() !== query) return;
+        showApartmentSuggestions(id, result.items || []);
+    } catch (error) {
+        // 자동완성 실패는 직접 입력으로 계속 진행
+    }
+}
+
+function showApartmentSuggestions(id, items) {
+    const box = document.getElementById(`apt-suggestions-${id}`);
+    apartmentSuggestions[id] = items;
+    if (items.length === 0) {
+        hideApartmentSuggestions(id);
+        return;
+    }
+
+    box.innerHTML = items.map((apt, index) => `
+        <div class="apt-suggestion${index === 0 ? ' active' : ''}" data-index="${index}"
+            onmousedown="event.preventDefault(); selectApartment(${id}, ${index})">
+            <span class="apt-suggestion-name">${escapeHtml(apt.apartment_name)}</span>
+            <span class="apt-suggestion-meta">모니터 ${apt.monitor_count.toLocaleString()}대 · ${apt.unit_price.toLocaleString()}원</span>
+        </div>
+    `).join('');
+    box.style.display = 'block';
+}
+
+function hideApartmentSuggestions(id) {
+    const box = document.getElementById(`apt-suggestions-${id}`);
+    if (box) box.style.display = 'none';
+}
+
+// 방향키/Enter/Esc로 자동완성 선택
+function onApartmentNameKeydown(event, id) {
+    const box = document.getElementById(`apt-suggestions-${id}`);
+    if (!box || box.style.display !== 'block') return;
+
+    const options = box.querySelectorAll('.apt-suggestion');
+    let active = [...options].findIndex(option => option.classList.contains('active'));
+
+    if (event.key === 'ArrowDown' || event.key === 'ArrowUp') {
+        event.preventDefault();
+        options[active]?.classList.remove('active');
+        active = (active + (event.key === 'ArrowDown' ? 1 : options.length - 1)) % options.length;
+        options[active].classList.add('active');
+    } else if (event.key === 'Enter') {
+        event.preventDefault();
+        selectApartment(id, Math.max(active, 0));
+    } else if (event.key === 'Escape') {
+        hideApartmentSuggestions(id);
+    }
+}
+
+// 인벤토리 값으로 아파트명/모니터 대수/단가 채우기
+function selectApartment(id, index) {
+    const apt = (apartmentSuggestions[id] || [])[index];
+    if (!apt) return;
+
+    const item = document.querySelector(`.apartment-item[data-id="${id}"]`);
+    item.dataset.apartmentId = apt.id;
+    item.querySelector('.apt-name').value = apt.apartment_name;
+    item.querySelector('.apt-monitor').value = apt.monitor_count;
+    item.querySelector('.apt-price').value = apt.unit_price;
+
+    hideApartmentSuggestions(id);
+    updateTotalCalculation();
+}
+
+function escapeHtml(text) {
+    const div = document.createElement('div');
+    div.textContent = text;
+    return div.innerHTML;
+}
+
 // 전체 계산 업데이트
 function updateTotalCalculation() {
     let totalMonthly = 0;
@@ -93,9 +189,8 @@ function updateTotalCalculation() {
     // 총 월 견적 표시
     document.getElementById('total-monthly').textContent = totalMonthly.toLocaleString() + '원';
 
-    // 할인 계산
-    const discountKey = document.querySelector('input[name="discount"]:checked').value;
-    const discountRate = discountRates[discountKey] || 0;
+    // 할인 계산 (입력 중 표시용, 할인율은 서버 DISCOUNT_OPTIONS 값 사용)
+    const discountRate = parseFloat(document.querySelector('input[name="discount"]:checked').dataset.rate) || 0;
     const discountAmount = Math.floor(totalMonthly * discountRate);
     const monthlyFinal = totalMonthly - discountAmount;
 
@@ -131,12 +226,17 @@ function collectApartments() {
         const unitPrice = parseInt(item.querySelector('.apt-price').value) || 0;
 
         if (name || monitorCount > 0) {
-            apartments.push({
+            const apartment = {
                 apartment_name: name,
                 monitor_count: monitorCount,
                 unit_price: unitPrice,
                 monthly_total: monitorCount * unitPrice
-            });
+            };
+            // 인벤토리에서 고른 아파트
+            if (item.dataset.apartmentId) {
+                apartment.apartment_id = item.dataset.apartmentId;
+            }
+            apartments.push(apartment);
         }
     });
     return apartments;
@@ -432,47 +532,32 @@ async function generateAndSend() {
         // Step 2: 발송
         showLoading('발송 중...', '발송 중입니다');
 
-        // 금액 계산 (미리보기 데이터가 없을 수 있으므로 직접 계산)
-        const discountLabels = {
-            "none": "할인 없음",
-            "5": "5% 할인",
-            "10": "10% 할인",
-            "15": "15% 할인"
-        };
-
-        const total_monthly = data.apartments.reduce((sum, apt) => sum + (apt.monthly_total || 0), 0);
-        const discount_rate = discountRates[data.discount] || 0;
-        const discount_label = discountLabels[data.discount] || "할인 없음";
-        const discount_amount = Math.floor(total_monthly * discount_rate);
-        const monthly_final = total_monthly - discount_amount;
-        const months = parseInt(data.months) || 3;
-        const final_total = monthly_final * months;
-
+        // 금액은 서버에서 계산 (할인 키/개월수만 전달)
         const sendResponse = await fetch('/send', {
             method: 'POST',
             headers: { 'Content-Type': 'application/json' },
             body: JSON.stringify({
-                pdf_paths: genResult.pdf_paths,
+                artifact_ids: (genResult.artifacts || []).map(a => a.id),
                 customer: data.customer,
                 send_methods: data.send_methods,
                 doc_types: data.doc_types,
                 apartments: data.apartments,
-                total_monthly: total_monthly,
-                discount_label: discount_label,
-                discount_rate: discount_rate,
-                discount_amount: discount_amount,
-                monthly_final: monthly_final,
-                months: months,
-                final_total: final_total,
+                discount: data.discount,
+                months: data.months,
                 manager: data.manager
             })
         });
 
-        const sendResult = await sendResponse.json();
+        let sendResult = await sendResponse.json();
+
+        // 아웃박스 사용 시 발송 완료까지 상태 확인
+        if (sendResult.job_id) {
+            sendResult = await waitForSendJob(sendResult.status_url);
+        }
 
         // 완료
         hideLoading();
-        showResult(sendResult, genResult.pdf_paths);
+        showResult(sendResult, genResult.artifacts);
 
     } catch (error) {
         hideLoading();
@@ -481,8 +566,33 @@ async function generateAndSend() {
     }
 }
 
+// 발송 작업 상태 확인 (완료/실패 또는 제한 시간까지)
+async function waitForSendJob(statusUrl, timeoutMs = 60000) {
+    const startedAt = Date.now();
+    let job = null;
+
+    while (Date.now() - startedAt < timeoutMs) {
+        const response = await fetch(statusUrl);
+        job = await response.json();
+
+        if (job.status === 'done' || job.status === 'failed') {
+            return job;
+        }
+
+        updateLoadingProgress(job.attempts > 1 ? `재시도 중... (${job.attempts}회)` : '발송 중입니다');
+        await new Promise(resolve => setTimeout(resolve, 1000));
+    }
+
+    // 제한 시간 내 끝나지 않으면 백그라운드에서 계속 발송
+    return {
+        email: job && job.email ? job.email : null,
+        kakao: job && job.kakao ? job.kakao : null,
+        pending: true
+    };
+}
+
 // 결과 표시
-function showResult(result, pdfPaths) {
+function showResult(result, artifacts) {
     let html = '';
 
     if (result.email !== null) {
@@ -501,11 +611,14 @@ function showResult(result, pdfPaths) {
         }
     }
 
+    if (result.pending) {
+        html += `<div class="result-item">⏳ 발송이 진행 중입니다. 잠시 후 결과가 반영됩니다.</div>`;
+    }
+
     html += `<div style="margin-top: 20px;">`;
-    if (pdfPaths && pdfPaths.length > 0) {
-        pdfPaths.forEach((path, idx) => {
-            const fileName = path.split('/').pop();
-            html += `<a href="/download/${path}" class="btn btn-secondary" download style="margin-right: 10px; margin-bottom: 10px;">${fileName}</a>`;
+    if (artifacts && artifacts.length > 0) {
+        artifacts.forEach((artifact) => {
+            html += `<a href="${artifact.download_url}" class="btn btn-secondary" download style="margin-right: 10px; margin-bottom: 10px;">${artifact.filename}</a>`;
         });
     }
     html += `</div>`;